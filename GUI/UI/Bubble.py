@@ -14,12 +14,16 @@ The panel is designed to be reusable for multiple sorting algorithms
 
 import sys
 
-from PyQt5.QtCore import Qt,pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QLineEdit, QPushButton, QRadioButton, QButtonGroup
 )
 
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
+
 class BubbleSortMiddlePanel(QWidget):
     """
     BubbleSortMiddlePanel is a custom QWidget that represents the
@@ -32,9 +36,53 @@ class BubbleSortMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    # (empty until _build_ui has created them)
+    CLEARABLE = ()
+
+    # Card title shown for each sorting algorithm key
+    _TITLES = {
+        "BubbleSort": "Bubble Sort",
+        "SelectionSort": "Selection Sort",
+        "MergeSort": "Merge Sort",
+    }
+
     def __init__(self):
         """
-        Initializes the middle panel UI for sorting algorithms.
+        Initializes the middle panel for sorting algorithms.
+
+        Only the panel itself is created here. The child widgets are
+        built the first time the panel is shown (see _build_ui), so a
+        panel the user never opens costs almost nothing at startup.
+        """
+        super().__init__()
+        self.setObjectName("middlePanel")
+        self.current_sort = "BubbleSort"
+        self._built = False
+        self._running = False
+
+    def showEvent(self, event):
+        """
+        Builds the widget tree the first time the panel becomes visible.
+        """
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """
+        Runs _build_ui exactly once.
+
+        Public methods call this too, so the panel still works if the
+        main window talks to it before it has been shown.
+        """
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.CLEARABLE = ("input_list", "output")
+
+    def _build_ui(self):
+        """
+        Creates the middle panel UI for sorting algorithms.
 
         This method sets up:
         - layout structure
@@ -43,10 +91,6 @@ class BubbleSortMiddlePanel(QWidget):
         - output display
         - consistent styling using Qt Style Sheets (QSS)
         """
-        super().__init__()
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
-        self.current_sort = "BubbleSort"
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -95,7 +139,7 @@ class BubbleSortMiddlePanel(QWidget):
 
         self.run_btn = QPushButton("RUN")
         self.run_btn.setObjectName("runButton")
-        self.run_btn.clicked.connect(self.runClicked.emit)
+        self.run_btn.clicked.connect(self._emit_run)
         self.run_btn.setCursor(Qt.PointingHandCursor)
         self.run_btn.setFixedWidth(90)
 
@@ -118,17 +162,43 @@ class BubbleSortMiddlePanel(QWidget):
         root.addWidget(self.card)
         root.addStretch(1)
 
+    @pyqtSlot()
+    def _emit_run(self):
+        """
+        Emits runClicked, ignoring extra clicks while a run is in progress.
+
+        The button is disabled for the duration of the run and for a short
+        cool-down afterwards, so a double-click does not queue a second
+        (possibly slow) run on the GUI thread.
+        """
+        if self._running:
+            return
+        self._running = True
+        self.run_btn.setEnabled(False)
+        try:
+            self.runClicked.emit()
+        finally:
+            QTimer.singleShot(150, self._release_run)
+
+    def _release_run(self):
+        """
+        Re-enables the run button after the cool-down period.
+        """
+        self._running = False
+        self.run_btn.setEnabled(True)
+
     def get_input(self):
         """
         Returns the list of numbers entered by the user.
 
         This method:
         - Reads the text from the input field
-        - Returns it as a string (e.g. "5, 2, 9, 1")
+        - Returns it as a normal Python string (e.g. "5, 2, 9, 1")
 
+        The sort strategies parse the text (and keep the last parse,
+        so clicking RUN again with the same numbers does not redo it).
         """
-
-        # Get and return input text from QLineEdit
+        self._ensure_built()
         return self.input_list.text()
 
     def get_options(self):
@@ -143,6 +213,7 @@ class BubbleSortMiddlePanel(QWidget):
         - dict with key "order" having value "Ascending" or "Descending"
         """
 
+        self._ensure_built()
         return {
             "order": "Ascending" if self.rb_asc.isChecked() else "Descending"
         }
@@ -160,8 +231,18 @@ class BubbleSortMiddlePanel(QWidget):
         """
 
         # Display the sorted output
+        self._ensure_built()
         self.output.setText(text)
 
+    def display_result(self, output):
+        """
+        Shows the value returned by the algorithm.
+
+        MainUI calls this after every run, so each panel decides
+        how its own results are displayed.
+        """
+        self.set_output(str(output))
+
     #  NEW: called by MainWindow when sidebar button changes
     def set_sort_mode(self, algo_key):
         """
@@ -177,92 +258,18 @@ class BubbleSortMiddlePanel(QWidget):
         - Allows the same UI panel to be reused for multiple sorts
         """
 
-        # Store the selected sorting algorithm
-        self.current_sort = algo_key
-
-        # Update card title based on selected algorithm
-        if algo_key == "BubbleSort":
-            self.card.setTitle("Bubble Sort")
-        elif algo_key == "SelectionSort":
-            self.card.setTitle("Selection Sort")
-        elif algo_key == "MergeSort":
-            self.card.setTitle("Merge Sort")
-        else:
-            # Fallback title if algorithm is unknown
-            self.card.setTitle("Sorting")
-
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
-
-        Styling is kept separate from logic to improve maintainability
-        and readability.
-        """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-
-        QLabel#hint {
-            font-weight: bold;
-        }
+        self._ensure_built()
 
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
+        # Look up the card title ("Sorting" if the algorithm is unknown)
+        title = self._TITLES.get(algo_key, "Sorting")
 
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        QLineEdit#lineEdit {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
+        # Nothing to do if the same sort is selected again
+        if algo_key == self.current_sort and self.card.title() == title:
+            return
 
-        QLineEdit#lineEdit:disabled {
-            background: #eeeeee;
-            color: #777777;
-        }
-
-        QRadioButton {
-            spacing: 8px;
-        }
-
-        QRadioButton::indicator {
-            width: 14px;
-            height: 14px;
-        }
-
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-
-        QPushButton#runButton:hover {
-            background: #255dd0;
-        }
-
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
-        """
+        # Store the selected sorting algorithm and update the title
+        self.current_sort = algo_key
+        self.card.setTitle(title)
 
 
 if __name__ == "__main__":
@@ -270,10 +277,10 @@ if __name__ == "__main__":
     Standalone execution block for testing the middle panel UI
     independently from the rest of the application.
     """
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = BubbleSortMiddlePanel()
     w.setWindowTitle("Middle Panel - Sorting (UI Only)")
     w.resize(700, 520)
@@ -14,9 +14,96 @@ The panel is responsible only for:
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QGroupBox, QTextEdit, QLineEdit, QPushButton
+    QGroupBox, QPlainTextEdit, QLineEdit, QPushButton
 )
-from PyQt5.QtCore import Qt,pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
+# Pastes longer than this are cut off: the substring listing and the text
+# layout both grow with the input, so very long pastes stall the window
+_MAX_PASTE_CHARS = 100000
+
+# Large pastes are inserted this many characters per event-loop tick
+_PASTE_CHUNK_CHARS = 8192
+
+
+class _ChunkedPasteTextEdit(QPlainTextEdit):
+    """
+    QPlainTextEdit that inserts large pastes in slices.
+
+    A normal paste lays out the whole text in one go, which freezes the
+    window for very large clipboards. Here, anything bigger than one
+    chunk is truncated to _MAX_PASTE_CHARS and inserted a chunk at a
+    time, letting Qt repaint between chunks.
+
+    pasteBusy(bool) is emitted when a chunked paste starts and when its
+    last chunk lands (or it is cancelled), and pasteTruncated(kept, total)
+    when part of the clipboard text was dropped.
+    """
+    pasteBusy = pyqtSignal(bool)
+    pasteTruncated = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Bumped on every new paste and on clear(), so chunks scheduled
+        # by an earlier paste can tell they are stale and stop
+        self._paste_gen = 0
+        self._pasting = False
+
+    def is_pasting(self):
+        """
+        True while a chunked paste still has chunks to insert.
+        """
+        return self._pasting
+
+    def insertFromMimeData(self, source):
+        text = source.text() if source.hasText() else ""
+        if len(text) <= _PASTE_CHUNK_CHARS:
+            super().insertFromMimeData(source)
+            return
+
+        self._paste_gen += 1
+        self._set_pasting(True)
+
+        if len(text) > _MAX_PASTE_CHARS:
+            self.pasteTruncated.emit(_MAX_PASTE_CHARS, len(text))
+            text = text[:_MAX_PASTE_CHARS]
+        self._insert_chunk(self._paste_gen, self.textCursor(), text, 0)
+
+    def clear(self):
+        """
+        Clears the text and drops any chunks still waiting to be inserted.
+        """
+        self._paste_gen += 1
+        self._set_pasting(False)
+        super().clear()
+
+    def _set_pasting(self, pasting):
+        if pasting != self._pasting:
+            self._pasting = pasting
+            self.pasteBusy.emit(pasting)
+
+    def _insert_chunk(self, gen, cursor, text, start):
+        """
+        Inserts one slice of text and schedules the next one.
+
+        The caret is only moved once the last chunk is in, so clicks or
+        typing during the paste are not undone on every tick.
+        """
+        if gen != self._paste_gen:
+            return
+
+        cursor.insertText(text[start:start + _PASTE_CHUNK_CHARS])
+
+        start += _PASTE_CHUNK_CHARS
+        if start < len(text):
+            QTimer.singleShot(0, lambda: self._insert_chunk(gen, cursor, text, start))
+        else:
+            self.setTextCursor(cursor)
+            self._set_pasting(False)
+
 
 class PalindromeSubstringMiddlePanel(QWidget):
     """
@@ -33,9 +120,44 @@ class PalindromeSubstringMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    # (empty until _build_ui has created them)
+    CLEARABLE = ()
+
     def __init__(self):
         """
-        Initializes the palindrome substring panel UI.
+        Initializes the palindrome substring panel.
+
+        Only the panel itself is created here. The child widgets are
+        built the first time the panel is shown (see _build_ui).
+        """
+        super().__init__()
+        self.setObjectName("middlePanel")
+        self._built = False
+        self._running = False
+
+    def showEvent(self, event):
+        """
+        Builds the widget tree the first time the panel becomes visible.
+        """
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """
+        Runs _build_ui exactly once.
+
+        Public methods call this too, so the panel still works if the
+        main window talks to it before it has been shown.
+        """
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.CLEARABLE = ("input_text", "found_output", "total_output")
+
+    def _build_ui(self):
+        """
+        Creates the palindrome substring panel UI.
 
         Sets up:
         - input text area
@@ -43,10 +165,6 @@ class PalindromeSubstringMiddlePanel(QWidget):
         - output fields for found substrings and total count
         - consistent styling using Qt Style Sheets (QSS)
         """
-        super().__init__()
-
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -65,17 +183,29 @@ class PalindromeSubstringMiddlePanel(QWidget):
         card_layout.addWidget(in_lbl)
 
         # Multiline input for text (supports sentences)
-        self.input_text = QTextEdit()
+        # QPlainTextEdit skips the rich-text layout QTextEdit would do
+        self.input_text = _ChunkedPasteTextEdit()
         self.input_text.setObjectName("textBox")
+        self.input_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.input_text.setFixedHeight(110)
+        self.input_text.pasteBusy.connect(self._on_paste_busy)
+        self.input_text.pasteTruncated.connect(self._on_paste_truncated)
+        self.input_text.textChanged.connect(self._on_text_changed)
         card_layout.addWidget(self.input_text)
 
+        # Warning shown when a paste was cut to _MAX_PASTE_CHARS
+        self.paste_note = QLabel()
+        self.paste_note.setObjectName("hint")
+        self.paste_note.setWordWrap(True)
+        self.paste_note.hide()
+        card_layout.addWidget(self.paste_note)
+
         # Run button
         btn_row = QHBoxLayout()
 
         self.count_btn = QPushButton("COUNT SUBSTRING")
         self.count_btn.setObjectName("runButton")
-        self.count_btn.clicked.connect(self.runClicked.emit)
+        self.count_btn.clicked.connect(self._emit_run)
         self.count_btn.setCursor(Qt.PointingHandCursor)
         self.count_btn.setFixedWidth(180)
 
@@ -115,6 +245,69 @@ class PalindromeSubstringMiddlePanel(QWidget):
         # Push everything upwards (keeps the UI neat)
         root.addStretch(1)
 
+    @pyqtSlot()
+    def _emit_run(self):
+        """
+        Emits runClicked, ignoring extra clicks while a run is in progress.
+
+        The button is disabled for the duration of the run and for a short
+        cool-down afterwards, so a double-click does not queue a second
+        (possibly slow) run on the GUI thread.
+        """
+        if self._running or self.input_text.is_pasting():
+            return
+        self._running = True
+        self.count_btn.setEnabled(False)
+        try:
+            self.runClicked.emit()
+        finally:
+            QTimer.singleShot(150, self._release_run)
+
+    def _release_run(self):
+        """
+        Re-enables the run button after the cool-down period.
+        """
+        self._running = False
+        self.count_btn.setEnabled(not self.input_text.is_pasting())
+
+    @pyqtSlot(bool)
+    def _on_paste_busy(self, busy):
+        """
+        Keeps COUNT disabled until a chunked paste has fully landed, so a
+        run never sees half of the pasted text.
+        """
+        if busy:
+            self.paste_note.hide()
+        self.count_btn.setEnabled(not busy and not self._running)
+
+    @pyqtSlot()
+    def _on_text_changed(self):
+        """
+        Hides the truncation warning once the input has been emptied
+        (e.g. the user deleted the pasted text).
+        """
+        if self.paste_note.isVisible() and self.input_text.document().isEmpty():
+            self.paste_note.hide()
+
+    def clear(self):
+        """
+        Hides the truncation warning; MainUI calls this when the page is
+        selected, after clearing the widgets in CLEARABLE.
+        """
+        if self._built:
+            self.paste_note.hide()
+
+    @pyqtSlot(int, int)
+    def _on_paste_truncated(self, kept, total):
+        """
+        Tells the user that the end of a long paste was dropped.
+        """
+        self.paste_note.setText(
+            f"Warning: pasted text was truncated to the first {kept:,} "
+            f"of {total:,} characters."
+        )
+        self.paste_note.show()
+
     def get_input(self):
         """
         Returns the user input from the text box.
@@ -127,7 +320,8 @@ class PalindromeSubstringMiddlePanel(QWidget):
         to fetch user input for processing.
         """
 
-        # Get and return all text from the QTextEdit widget
+        # Get and return all text from the QPlainTextEdit widget
+        self._ensure_built()
         return self.input_text.toPlainText()
 
     def get_options(self):
@@ -160,85 +354,27 @@ class PalindromeSubstringMiddlePanel(QWidget):
         """
 
         # Display the list or summary of palindromes
+        self._ensure_built()
         self.found_output.setText(found_text)
 
         # Display total count (convert integer to string)
         self.total_output.setText(str(total_count))
 
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
-
-        Styling is kept separate from logic to improve maintainability
-        and readability.
-        """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-
-        QLabel#hint {
-            font-weight: bold;
-        }
-
-        QLabel#bigLabel {
-            font-weight: bold;
-            font-size: 22px;
-            margin-top: 6px;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        QLineEdit#lineEdit, QTextEdit#textBox {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
-
-        QLineEdit#lineEdit:disabled {
-            background: #eeeeee;
-            color: #777777;
-        }
-
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-
-        QPushButton#runButton:hover {
-            background: #255dd0;
-        }
-
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
+    def display_result(self, output):
+        """
+        Shows the dict returned by the palindrome algorithm.
+
+        Parameters:
+        - output (dict): {"found": preview text, "count": total}
         """
+        self.set_results(output["found"], output["count"])
+
+
 if __name__ == "__main__":
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = PalindromeSubstringMiddlePanel()
     w.setWindowTitle("Middle Panel - Palindrome (UI Only)")
     w.resize(720, 550)
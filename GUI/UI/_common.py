@@ -0,0 +1,20 @@
+"""
+_common.py
+
+Small helpers shared by the AlgoLab GUI modules.
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+
+def _enable_hidpi():
+    """
+    Turns on high-DPI scaling and high-DPI pixmaps.
+
+    Qt only honours these before the QApplication is created, so call
+    this first in every entry point (main.py and the standalone
+    __main__ blocks of the panels).
+    """
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -0,0 +1,237 @@
+"""
+_styles.py
+
+Shared Qt Style Sheet (QSS) for the AlgoLab GUI.
+
+The middle panels all use the same base look (white card, bold hints,
+rounded inputs and a blue RUN button), plus a few panel-specific rules
+(combo box, radio buttons, big labels). The side panel and performance
+panel have their own looks. Instead of every panel parsing its own
+copy of these rules, the stylesheet is kept here as a single
+module-level constant and installed once on the QApplication.
+
+Rules are scoped by object name ("middlePanel", "sidePanel",
+"performancePanel") so each panel's rules do not leak into the others.
+"""
+
+_MIDDLE_QSS = """
+#middlePanel, #middlePanel QWidget {
+    background: #ffffff;
+    font-family: Segoe UI;
+    font-size: 14px;
+}
+
+#middlePanel QLabel#hint {
+    font-weight: bold;
+}
+
+#middlePanel QLabel#opTitle {
+    font-weight: bold;
+    font-size: 18px;
+    margin-top: 8px;
+}
+
+#middlePanel QLabel#bigLabel {
+    font-weight: bold;
+    font-size: 22px;
+    margin-top: 6px;
+}
+
+#middlePanel QGroupBox {
+    font-weight: bold;
+    margin-top: 10px;
+    padding: 10px;
+    border: 1px solid #d0d0d0;
+    border-radius: 6px;
+    background: #ffffff;
+}
+
+#middlePanel QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 3px;
+}
+
+#middlePanel QLineEdit#lineEdit,
+#middlePanel QTextEdit#textBox,
+#middlePanel QPlainTextEdit#textBox {
+    background: #ffffff;
+    border: 1px solid #d0d0d0;
+    border-radius: 6px;
+    padding: 8px;
+}
+
+#middlePanel QLineEdit#lineEdit:disabled {
+    background: #eeeeee;
+    color: #777777;
+}
+
+#middlePanel QComboBox#comboBox {
+    background: #ffffff;
+    border: 1px solid #f7f7f7;
+    border-radius: 6px;
+    padding: 6px 10px;
+}
+
+#middlePanel QComboBox#comboBox::drop-down {
+    border: none;
+    width: 26px;
+}
+
+#middlePanel QRadioButton {
+    spacing: 8px;
+}
+
+#middlePanel QRadioButton::indicator {
+    width: 14px;
+    height: 14px;
+}
+
+#middlePanel QPushButton#runButton {
+    text-align: center;
+    padding: 6px 12px;
+    border: none;
+    border-radius: 6px;
+    background: #2f6fed;
+    color: white;
+    font-weight: bold;
+}
+
+#middlePanel QPushButton#runButton:hover {
+    background: #255dd0;
+}
+
+#middlePanel QPushButton#runButton:pressed {
+    background: #1f4fb3;
+}
+"""
+
+_SIDE_QSS = """
+#sidePanel,
+#sidePanel QWidget {
+    background: #ffffff;
+    font-size: 14px;
+}
+
+#sidePanel #title {
+    color: blue;
+    font-size: 40px;
+    font-weight: bold;
+    padding: 5px 10px;
+}
+
+#sidePanel QLabel#sectionHdr {
+    font-weight: bold;
+    margin-top: 10px;
+    padding: 4px 0;
+    border-bottom: 1px solid #d0d0d0;
+}
+
+#sidePanel QPushButton#algoButton {
+    text-align: left;
+    padding: 2px 5px;
+    border: none;
+    background: transparent;
+}
+
+#sidePanel QPushButton#algoButton:hover {
+    background: #e0e0e0;
+    border-radius: 4px;
+}
+
+#sidePanel QPushButton#algoButton:pressed {
+    background: #c8c8c8;
+}
+
+#sidePanel QPushButton#algoButton1 {
+    text-align: left;
+    padding: 2px 5px;
+    border: 1px;
+    color: blue;
+}
+
+#sidePanel QPushButton#algoButton1:pressed {
+    color: white;
+}
+"""
+
+_PERFORMANCE_QSS = """
+#performancePanel,
+#performancePanel QWidget {
+    font-family: Segoe UI;
+    font-size: 14px;
+    color: #111;
+}
+
+#performancePanel QGroupBox#perfCard {
+    background: #FFFDE1;
+    border: 1px solid #dcdcdc;
+    border-radius: 8px;
+    font-weight: 700;
+}
+
+#performancePanel QGroupBox#perfCard::title {
+    subcontrol-origin: margin;
+    left: 12px;
+    top: 8px;
+    padding: 0 6px;
+    font-size: 12px;
+    letter-spacing: 2px;
+    color: white;
+}
+
+#performancePanel QLabel#perfMeta {
+    font-size: 13px;
+    font-weight: 600;
+}
+
+#performancePanel QFrame#divider {
+    color: #e1e3e8;
+    max-height: 1px;
+}
+
+#performancePanel QLabel#chip {
+    font-size: 12px;
+    font-weight: 600;
+    background: #f5f6f8;
+    border: 1px solid #e1e3e8;
+    border-radius: 999px;
+    padding: 4px 10px;
+}
+
+#performancePanel QLabel#descHeader {
+    font-size: 13px;
+    font-weight: 800;
+    margin-top: 6px;
+}
+
+#performancePanel QLabel#descBody {
+    font-size: 13px;
+    font-weight: 400;
+    color: #333;
+    line-height: 1.25;
+}
+
+#performancePanel QGroupBox {
+    font-weight: bold;
+    margin-top: 10px;
+    padding: 10px;
+    border: 1px solid #d0d0d0;
+    border-radius: 6px;
+    background: #ffffff;
+}
+"""
+
+# Everything is concatenated once at import and installed as one sheet
+_GLOBAL_QSS = _MIDDLE_QSS + _SIDE_QSS + _PERFORMANCE_QSS
+
+
+def install_global_styles(app):
+    """
+    Applies the shared stylesheet to the whole application.
+
+    MainUI calls this once when it is created (standalone panel demos
+    call it themselves), so Qt parses the rules a single time instead
+    of once per panel.
+    """
+    app.setStyleSheet(_GLOBAL_QSS)
@@ -0,0 +1,13005 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x3f\xa2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x9d\x4d\x96\xe3\xba\
+\x91\x85\xa9\xea\x85\xbd\xf2\xc4\xaf\xa7\xcf\x3e\xbd\x9e\xcc\x5c\
+\x8f\x8f\x5f\x4d\xdb\x9e\x54\x79\x61\x9d\xd9\x71\x99\xa4\x92\x92\
+\x28\x89\x3f\x20\x10\x01\x7c\x75\x88\x94\x44\x91\x40\xc4\x17\x24\
+\xe3\x02\x20\x55\xdf\x3a\xfe\x41\x00\x02\x10\x80\x00\x04\x20\xd0\
+\x1c\x01\x04\x40\x73\x21\xc7\x61\x08\x40\x00\x02\x10\x80\x40\xd7\
+\x21\x00\x38\x0a\x20\x00\x01\x08\x40\x00\x02\x0d\x12\x40\x00\x34\
+\x18\x74\x5c\x86\x00\x04\x20\x00\x81\xb6\x09\xc8\x7b\x04\x80\x28\
+\x50\x20\x00\x01\x08\x40\x00\x02\x8d\x11\x40\x00\x34\x16\x70\xdc\
+\x85\x00\x04\x20\x00\x81\xd6\x09\x7c\xfa\x8f\x00\xf8\xe4\xc0\x5f\
+\x08\x40\x00\x02\x10\x80\x40\x53\x04\x10\x00\x4d\x85\x1b\x67\x21\
+\x00\x01\x08\x40\xa0\x75\x02\xa3\xff\x08\x80\x91\x04\xaf\x10\x80\
+\x00\x04\x20\x00\x81\x86\x08\x20\x00\x1a\x0a\x36\xae\x42\x00\x02\
+\x10\x80\x40\xeb\x04\xbe\xfc\x47\x00\x7c\xb1\xe0\x1d\x04\x20\x00\
+\x01\x08\x40\xa0\x19\x02\x08\x80\x66\x42\x8d\xa3\x10\x80\x00\x04\
+\x20\xd0\x3a\x81\xa9\xff\x08\x80\x29\x0d\xde\x43\x00\x02\x10\x80\
+\x00\x04\x1a\x21\x80\x00\x68\x24\xd0\xb8\x09\x01\x08\x40\x00\x02\
+\xad\x13\xb8\xf4\x1f\x01\x70\xc9\x83\x4f\x10\x80\x00\x04\x20\x00\
+\x81\x26\x08\x20\x00\x9a\x08\x33\x4e\x42\x00\x02\x10\x80\x40\xeb\
+\x04\xae\xfd\x47\x00\x5c\x13\xe1\x33\x04\x20\x00\x01\x08\x40\xa0\
+\x01\x02\x08\x80\x06\x82\x8c\x8b\x10\x80\x00\x04\x20\xd0\x3a\x81\
+\x5b\xff\x11\x00\xb7\x4c\x58\x03\x01\x08\x40\x00\x02\x10\xa8\x9e\
+\x00\x02\xa0\xfa\x10\xe3\x20\x04\x20\x00\x01\x08\xb4\x4e\x60\xce\
+\x7f\x04\xc0\x1c\x15\xd6\x41\x00\x02\x10\x80\x00\x04\x2a\x27\x80\
+\x00\xa8\x3c\xc0\xb8\x07\x01\x08\x40\x00\x02\xad\x13\x98\xf7\x1f\
+\x01\x30\xcf\x85\xb5\x10\x80\x00\x04\x20\x00\x81\xaa\x09\x20\x00\
+\xaa\x0e\x2f\xce\x41\x00\x02\x10\x80\x40\xeb\x04\xee\xf9\x8f\x00\
+\xb8\x47\x86\xf5\x10\x80\x00\x04\x20\x00\x81\x8a\x09\x20\x00\x2a\
+\x0e\x2e\xae\x41\x00\x02\x10\x80\x40\xeb\x04\xee\xfb\x8f\x00\xb8\
+\xcf\x86\x6f\x20\x00\x01\x08\x40\x00\x02\xd5\x12\x40\x00\x54\x1b\
+\x5a\x1c\x83\x00\x04\x20\x00\x81\xd6\x09\x3c\xf2\x1f\x01\xf0\x88\
+\x0e\xdf\x41\x00\x02\x10\x80\x00\x04\x2a\x25\x80\x00\xa8\x34\xb0\
+\xb8\x05\x01\x08\x40\x00\x02\xad\x13\x78\xec\x3f\x02\xe0\x31\x1f\
+\xbe\x85\x00\x04\x20\x00\x01\x08\x54\x49\x00\x01\x50\x65\x58\x71\
+\x0a\x02\x10\x80\x00\x04\x5a\x27\xf0\xcc\x7f\x04\xc0\x33\x42\x7c\
+\x0f\x01\x08\x40\x00\x02\x10\xa8\x90\x00\x02\xa0\xc2\xa0\xe2\x12\
+\x04\x20\x00\x01\x08\xb4\x4e\xe0\xb9\xff\x08\x80\xe7\x8c\xd8\x02\
+\x02\x10\x80\x00\x04\x20\x50\x1d\x01\x04\x40\x75\x21\xc5\x21\x08\
+\x40\x00\x02\x10\x68\x9d\xc0\x12\xff\x11\x00\x4b\x28\xb1\x0d\x04\
+\x20\x00\x01\x08\x40\xa0\x32\x02\x08\x80\xca\x02\x8a\x3b\x10\x80\
+\x00\x04\x20\xd0\x3a\x81\x65\xfe\x23\x00\x96\x71\x62\x2b\x08\x40\
+\x00\x02\x10\x80\x40\x55\x04\x10\x00\x55\x85\x13\x67\x20\x00\x01\
+\x08\x40\xa0\x75\x02\x4b\xfd\x47\x00\x2c\x25\xc5\x76\x10\x80\x00\
+\x04\x20\x00\x81\x8a\x08\x20\x00\x2a\x0a\x26\xae\x40\x00\x02\x10\
+\x80\x40\xeb\x04\x96\xfb\x8f\x00\x58\xce\x8a\x2d\x21\x00\x01\x08\
+\x40\x00\x02\xd5\x10\x40\x00\x54\x13\x4a\x1c\x81\x00\x04\x20\x00\
+\x81\xd6\x09\xac\xf1\x1f\x01\xb0\x86\x16\xdb\x42\x00\x02\x10\x80\
+\x00\x04\x2a\x21\x80\x00\xa8\x24\x90\xb8\x01\x01\x08\x40\x00\x02\
+\xad\x13\x58\xe7\x3f\x02\x60\x1d\x2f\xb6\x86\x00\x04\x20\x00\x01\
+\x08\x54\x41\x00\x01\x50\x45\x18\x71\x02\x02\x10\x80\x00\x04\x5a\
+\x27\xb0\xd6\x7f\x04\xc0\x5a\x62\x6c\x0f\x01\x08\x40\x00\x02\x10\
+\xa8\x80\x00\x02\xa0\x82\x20\xe2\x02\x04\x20\x00\x01\x08\xb4\x4e\
+\x60\xbd\xff\x08\x80\xf5\xcc\xd8\x03\x02\x10\x80\x00\x04\x20\x10\
+\x9e\x00\x02\x20\x7c\x08\x71\x00\x02\x10\x80\x00\x04\x5a\x27\xb0\
+\xc5\x7f\x04\xc0\x16\x6a\xec\x03\x01\x27\x04\xfe\xf1\xdf\x3f\xbe\
+\x8f\xe5\x9f\x7f\xfd\xf1\x7a\x5d\xfe\xfc\xfd\xc7\xcf\x35\xe5\x7a\
+\xff\xf1\xf3\xd8\xc6\xf8\xea\xc4\x7d\xcc\x80\x00\x04\x76\x10\x40\
+\x00\xec\x80\xc7\xae\x10\x38\x8a\xc0\x98\x68\xc7\x04\x3c\x4d\xe2\
+\xb6\xee\x63\x2c\xdf\xde\xbb\x9f\x63\x31\x5b\x5e\xae\xcb\xc7\x47\
+\xf7\x7d\x4d\xb9\xde\x7f\xfc\x3c\xb6\x31\xbe\x8e\xed\x5f\xbf\xca\
+\x4e\x5b\x77\x16\x22\xf2\xc3\xea\x60\x81\x00\x04\x0e\x25\xb0\xad\
+\x72\x04\xc0\x36\x6e\xec\x05\x81\xdd\x04\x94\x1c\x55\x94\x30\x95\
+\x38\x55\xec\x7d\x9f\xdc\xc7\x44\x6b\x8d\xbc\xa8\x4c\x93\xb8\x7d\
+\x76\xbb\xc8\x4e\x33\xae\xb7\x59\xaf\xf2\x63\xf4\x69\xf0\xaf\x17\
+\x07\xf2\x5b\xc5\xb6\x61\x81\x00\x04\x0a\x11\x40\x00\x14\x02\x4f\
+\xb3\xed\x10\x50\xa2\x53\xb1\x44\xf8\x3a\x24\xc1\x9b\x24\xaf\xc4\
+\xa9\x52\x33\x95\xc1\xbf\x5e\x1c\x48\x18\xa8\x18\x93\x9e\xc5\xc0\
+\x05\x71\x50\xf3\x01\x80\x6f\x87\x11\xd8\x5a\x31\x02\x60\x2b\x39\
+\xf6\x83\xc0\x0c\x01\x25\x7a\x15\x4b\x6c\xe7\x64\xaf\x44\xa7\x62\
+\x9b\xbf\x0c\x49\xd0\xde\xb2\x4c\x09\x0c\x5c\x6e\xc4\xc1\x28\x0c\
+\xc4\x74\xba\x3d\xef\x21\x00\x81\xfd\x04\x10\x00\xfb\x19\x52\x43\
+\xc3\x04\x94\x98\x48\xf6\xc7\x1d\x00\xa3\x30\x90\x80\x32\xce\x1f\
+\x08\x82\xe3\x58\x53\x73\x54\x02\xdb\xed\x46\x00\x6c\x67\xc7\x9e\
+\x0d\x12\x98\x4b\xf8\x86\x81\x9e\xbd\x41\xc8\xb1\xdc\x13\x04\x26\
+\x0e\x5e\x73\xb4\x4f\x1b\x10\xa8\x89\x00\x02\xa0\xa6\x68\xe2\x4b\
+\x72\x02\x4a\xf8\x2a\x43\xcf\xf3\x43\x3d\x51\x6b\x84\x84\x6f\x10\
+\x3c\x2c\xa3\x20\x30\x5b\x5e\x4c\x04\x9c\x47\x08\xec\x3d\x82\xc0\
+\xa0\xb0\xd4\x4f\x60\x8f\x87\x08\x80\x3d\xf4\xd8\xb7\x4a\x02\xd7\
+\x09\x5f\x49\x7f\x48\x34\x55\xfa\x5b\x93\x53\x43\x9c\xfa\x7b\x09\
+\x4c\x04\x20\x08\x6a\x0a\x2e\xbe\x24\x27\x80\x00\x48\x8e\x94\x0a\
+\x23\x12\xb8\x4e\xfa\x43\x22\x89\xe8\x0a\x36\x4f\x08\x0c\x71\x3c\
+\x0b\x02\x13\x05\xfd\x93\x06\x93\x4d\x78\x0b\x81\xc0\x04\xf6\x99\
+\x8e\x00\xd8\xc7\x8f\xbd\x83\x12\x50\xc2\x57\x99\x0e\xed\x0f\xc9\
+\x22\xa8\x47\x98\xbd\x90\x00\x62\x60\x21\x28\x36\xab\x9f\x00\x02\
+\xa0\xfe\x18\xe3\xe1\x40\x40\x09\x5f\x45\x49\x5f\xc3\xfa\x2a\x24\
+\xfd\x01\x4e\x9b\x2f\x17\x62\x40\xc7\x46\x9b\x18\xf0\x3a\x2a\x81\
+\xbd\x76\x23\x00\xf6\x12\x64\x7f\xf7\x04\x74\x61\x27\xe9\xbb\x0f\
+\x53\x69\x03\x5f\x24\x08\x6d\x8a\x40\x3f\x4c\xf4\xaa\x63\xa6\xb4\
+\x41\xb4\x0f\x81\xa3\x09\x20\x00\x8e\x26\x4c\xfd\x45\x08\xe8\x02\
+\xae\xa4\xaf\x0b\xba\x2e\xec\xf4\xf4\x8b\x84\x21\x6a\xa3\xbd\x18\
+\x18\x8e\x1f\x9e\x26\x88\x1a\xc5\xea\xed\xde\xef\x20\x02\x60\x3f\
+\x43\x6a\x70\x44\x60\x4c\xfc\x24\x7d\x47\x41\x09\x6a\xca\x20\x1a\
+\x2f\x1e\x2f\x0c\xea\x0a\x66\x43\x60\x96\x00\x02\x60\x16\x0b\x2b\
+\x23\x11\x18\x93\x3e\xbd\xfd\x48\x51\x8b\x65\xeb\x54\x0c\xd8\x71\
+\xc6\xa8\x40\xac\xf0\x55\x69\x6d\x0a\xa7\x10\x00\x29\x28\x52\x47\
+\x11\x02\x63\xe2\xa7\xb7\x5f\x04\x7f\xcb\x8d\xf6\xa3\x02\x12\x02\
+\x2a\x2d\x83\xc0\xf7\xd8\x04\x10\x00\xb1\xe3\xd7\x9c\xf5\x4a\xfa\
+\xba\xe8\x5a\xe9\x7f\x95\x6f\xe8\x99\x35\xc7\x01\x87\x5d\x10\xb8\
+\x78\x8a\xc0\x85\x45\x18\xd1\x08\x81\x34\x6e\x22\x00\xd2\x70\xa4\
+\x96\x83\x09\x28\xf1\xeb\xa6\x2c\xf5\xf6\xad\x29\x5d\x78\xed\x85\
+\x05\x02\x6e\x08\x9c\x47\x05\xdc\x58\x84\x21\x10\x78\x42\x00\x01\
+\xf0\x04\x10\x5f\x97\x25\x30\x4d\xfc\xf4\xf6\xcb\xc6\x82\xd6\x17\
+\x11\x40\x08\x2c\xc2\xc4\x46\x7b\x08\xa4\xda\x17\x01\x90\x8a\x24\
+\xf5\x24\x25\x40\xe2\x4f\x8a\x93\xca\xf2\x13\x38\x0b\x01\x9b\xae\
+\xe2\xa6\xc1\xfc\xfc\x69\x71\x01\x01\x04\xc0\x02\x48\x6c\x92\x8f\
+\x00\x89\x3f\x1f\x6b\x5a\xca\x42\x40\xd3\x55\x12\x03\xfc\x1f\x04\
+\x59\x70\xb7\xd0\x48\x3a\x1f\x11\x00\xe9\x58\x52\xd3\x0e\x02\x24\
+\xfe\x1d\xf0\xd8\x35\x02\x81\x51\x08\xf4\xbf\x34\x18\xc1\x60\x6c\
+\xac\x9f\x00\x02\xa0\xfe\x18\xbb\xf6\x90\xc4\xef\x3a\x3c\x18\x77\
+\x0c\x01\x8d\x08\x20\x04\x8e\x61\x5b\x7d\xad\x29\x1d\x44\x00\xa4\
+\xa4\x49\x5d\x8b\x09\x90\xf8\x17\xa3\x62\xc3\x7a\x09\x48\x08\xf0\
+\xff\x0e\xd4\x1b\x5f\xf7\x9e\x21\x00\xdc\x87\xa8\x2e\x03\x49\xfc\
+\x75\xc5\x13\x6f\x76\x13\xe8\xff\xdf\x01\x6e\x14\xdc\xcd\xb1\x91\
+\x0a\xd2\xba\x89\x00\x48\xcb\x93\xda\xee\x10\x20\xf1\xdf\x01\xc3\
+\x6a\x08\x7c\x12\xd0\x68\x00\xd3\x02\x9f\x2c\xf8\x9b\x89\x00\x02\
+\x20\x13\xe8\x96\x9b\x51\xef\x46\x3f\xe0\xc3\x73\xfc\x2d\x1f\x05\
+\xf8\xbe\x90\x00\x42\x60\x21\xa8\x16\x37\x4b\xed\x33\x02\x20\x35\
+\x51\xea\x3b\x13\x18\x7b\xfd\xb6\x42\x77\x40\xdb\x0b\x0b\x04\x20\
+\xb0\x90\x80\x84\x00\x8f\x0e\x2e\x84\xc5\x66\xdb\x08\x20\x00\xb6\
+\x71\x63\xaf\x07\x04\xc6\xc4\x4f\xaf\xff\x01\x24\xbe\x82\xc0\x73\
+\x02\x12\xce\xbd\x10\x78\xbe\x29\x5b\xd4\x4f\x20\xbd\x87\x08\x80\
+\xf4\x4c\x9b\xae\x71\xfc\xbd\x7e\x86\xfb\x9b\x3e\x0c\x70\x3e\x2d\
+\x01\x89\x00\xee\x0f\x48\xcb\x94\xda\x8c\x00\x02\xc0\x20\xb0\xec\
+\x27\xa0\x5e\xbf\xcd\xf5\x7f\x90\xf8\xf7\xb3\xa4\x06\x08\xdc\x21\
+\x80\x10\xb8\x03\xa6\x85\xd5\x47\xf8\x88\x00\x38\x82\x6a\x43\x75\
+\x2a\xf1\x8f\xbd\xfe\x86\xdc\xc6\x55\x08\x94\x24\x20\x21\xc0\xff\
+\x2f\x50\x32\x02\x95\xb4\x8d\x00\xa8\x24\x90\x25\xdc\xb0\x1e\xff\
+\x2b\xf3\xfc\x25\xc8\xd3\x26\x04\x3a\x89\x00\xa6\x05\x9a\x39\x10\
+\x8e\x71\x14\x01\x70\x0c\xd7\xaa\x6b\x1d\x7b\xfd\xe6\xa4\x6e\x52\
+\xb2\x17\x16\x08\x40\xa0\x10\x01\x09\x01\x46\x03\x0a\xc1\x8f\xde\
+\x2c\x02\x20\x7a\x04\x33\xdb\x4f\xaf\x3f\x33\xf0\x05\xcd\x9d\x4e\
+\xdd\xaf\xb1\x74\x5d\xf7\x36\x2d\xef\xdf\xba\xbf\xec\x29\xd3\xba\
+\xc6\xf7\x63\x5b\x7a\xb5\x75\x2c\xe5\x09\x48\x04\x30\x1a\x50\x3e\
+\x0e\x87\x59\x70\x54\xc5\x08\x80\xa3\xc8\x56\x56\x2f\xbd\xfe\x32\
+\x01\x55\x92\x55\xb1\xd6\xdf\xa6\x89\xfc\xef\xff\xfe\xe3\x34\x96\
+\xbf\xfd\xeb\x8f\xbf\x8c\xc5\xd6\xbd\x4e\xcb\xff\xfc\xef\x1f\xbf\
+\xf6\x94\x69\x5d\xe3\xfb\xb1\x2d\xbd\xda\xba\xde\x8e\xd1\x36\xd9\
+\x39\x96\xc1\x6e\xfb\xc8\x92\x89\x80\x84\x00\xa3\x01\x99\x60\xd7\
+\xd0\x0c\x02\xa0\x86\x28\x1e\xec\x03\xbd\xfe\x63\x01\x2b\x51\xaa\
+\x58\x2b\xe7\x24\x3f\x26\x56\x25\x59\x15\xfb\xfc\x3a\x4d\xe4\xb6\
+\xad\xab\x65\xb4\x4d\x76\x8e\x65\xb0\xfb\x2c\x10\xcc\xe0\xf3\xe8\
+\xc4\xe0\xaf\xad\x62\x49\x4c\x40\x22\x80\xd1\x80\xc4\x50\xcb\x56\
+\x77\x5c\xeb\x08\x80\xe3\xd8\x56\x51\xb3\xee\xf0\x37\x47\x98\xeb\
+\x37\x08\x29\x16\x25\x3e\x95\xb1\xc7\x6c\xc9\xf2\xa4\x44\xa9\x62\
+\xef\xcf\x49\x3e\x45\x5b\x9e\xea\x90\x40\x90\x7f\x63\x19\xfc\x3d\
+\x89\x83\xd9\xd9\x0b\x03\x71\xb1\xf7\x2c\x69\x08\x48\x08\x30\x1a\
+\x90\x86\x65\xb5\xb5\x20\x00\xaa\x0d\xed\x3e\xc7\x34\xe4\x6f\x3d\
+\x7f\x9e\xeb\xdf\x87\xb1\x53\x52\x53\x92\x53\xb1\xe4\x77\x4e\xf6\
+\x4a\x88\x2a\x3b\xab\x0f\xbf\xbb\x18\x18\x97\x7e\xda\x62\x4e\x14\
+\x84\x77\xb0\xac\x03\x2f\x12\xf0\x3a\x97\xcb\x9a\x41\xeb\x7b\x08\
+\x1c\xb9\x2f\x02\xe0\x48\xba\x41\xeb\xb6\xc4\xdf\x3f\xde\x17\xd4\
+\xfc\x62\x66\x2b\xd9\xab\x28\xd9\xab\x58\x62\xeb\x13\xbe\x92\x9c\
+\x4a\x31\xc3\x82\x35\x2c\x56\xc6\xae\x17\x05\xf6\xda\x4f\x21\x98\
+\x0b\xfd\x28\x81\xbd\xb2\xac\x20\xa0\x1f\xe6\xd2\xa3\xba\x3a\xa7\
+\x57\xec\xc6\xa6\x8d\x10\x40\x00\x34\x12\xe8\x25\x6e\xaa\xa7\xa0\
+\x1e\x83\x6d\xcb\x90\xbf\x41\x58\xb2\x4c\x13\xbe\x7a\xb0\x2a\x4a\
+\x60\x2a\x4b\xf6\x67\x9b\x65\x04\x4c\x08\x20\x08\x96\xa1\xba\xb7\
+\x15\xa3\x01\xf7\xc8\xb8\x5e\x7f\xac\x71\x08\x80\x63\xf9\x86\xa9\
+\x5d\x3d\x04\xf5\x14\xd4\x63\x08\x63\x74\x01\x43\x95\xf0\x55\xe8\
+\xe1\x17\x80\x3f\x69\x72\x2a\x08\x6c\x35\xa3\x03\x06\xe1\xd9\xa2\
+\x73\x5b\xe7\xb8\xce\xf5\x67\xdb\xf2\x7d\x1b\x04\x10\x00\x6d\xc4\
+\xf9\xa1\x97\xc3\x05\x81\x5e\xff\x1d\x4a\x4a\xf8\xf6\x55\x7f\x87\
+\xbe\x7a\xf8\x2a\xf4\xf0\x8d\x88\x93\x65\x2a\x06\xec\xfd\xc9\xcc\
+\x7a\x1b\x62\x66\x6f\x59\x66\x08\x70\x83\xe0\x0c\x14\x8f\xab\x8e\
+\xb6\x09\x01\x70\x34\x61\xc7\xf5\x33\xe4\x7f\x3f\x38\x4a\x20\xea\
+\xe5\xab\x28\xe1\x5b\x62\xe9\xef\xd0\xbf\xbf\x07\xdf\x78\x21\xa0\
+\x58\x0d\x31\x43\x0c\xdc\x0f\x4a\x3f\x25\x70\xff\x6b\xbe\x69\x81\
+\x00\x02\xa0\x85\x28\xcf\xf8\xa8\xe4\xaf\xe1\x40\x0d\x0b\xce\x7c\
+\xdd\xec\xaa\x31\xf1\x2b\x81\xa8\x97\xaf\xd2\x2c\x8c\x0a\x1c\xbf\
+\x16\x03\x15\xb8\x94\xcc\x05\x9d\xfb\x36\xfa\xf7\xa1\x6b\x41\xb2\
+\x4a\xa9\x28\x21\x81\xe3\xab\x42\x00\x1c\xcf\xd8\x5d\x0b\x76\xd2\
+\x73\x97\xff\x24\x2a\x63\xd2\xb7\x64\x71\xbe\x6b\x7f\xf2\x35\x6f\
+\x2b\x21\x60\xf1\xd5\x8d\x84\xfd\xa8\x80\xb9\xa4\xfb\x06\xec\x85\
+\x45\x1d\x01\x5d\x13\x20\xd1\x1e\x01\x04\x40\x63\x31\x1f\x4e\xf4\
+\xe6\xe7\xfb\x49\xfa\x8d\x1d\xf8\x13\x77\x07\x21\x70\x16\x03\x3a\
+\x16\x26\x5f\xb7\xfa\x96\xfb\x02\x9c\x45\x3e\x87\x39\x08\x80\x1c\
+\x94\x9d\xb4\xc1\x23\x7e\xdd\xf9\x87\x79\xc6\x21\xfe\x8e\x7f\x4d\
+\x13\x90\x18\xd0\xb1\xa0\x7b\x3d\x0c\x44\xeb\xa3\x02\x88\x00\x3b\
+\x08\x5a\x5a\x10\x00\x0d\x44\x5b\x73\x7c\xd6\xf3\x6f\xf6\x57\xfd\
+\x86\x1e\xde\xf9\x2e\x7e\xe6\xf5\x1b\x38\xe8\x57\xba\xa8\x63\x42\
+\x62\xc0\xca\x38\x45\xb0\xb2\x86\x6a\x36\xe7\xe6\x40\x17\xa1\xcc\
+\x63\x04\x02\x20\x0f\xe7\x62\xad\x58\xe2\x6f\x76\xbe\x5f\x89\x5f\
+\x3d\x3b\xf5\xf0\xec\xc2\xce\x5d\xfc\xc5\x8e\xc2\x58\x0d\xeb\x58\
+\xb1\xd2\x0b\x01\x1d\x43\xb1\xac\xdf\x6f\x2d\x37\x07\xee\x67\x18\
+\xa5\x06\x04\x40\x94\x48\x6d\xb0\x53\xc9\xdf\x76\x6b\x6e\xbe\x5f\
+\x17\xed\x31\xf1\xab\x67\x67\x0c\x58\x20\xb0\x9a\x80\x89\x80\x57\
+\x89\x47\xdb\x51\x53\x03\x2a\xf6\xb6\x9d\x85\x9b\x03\xcb\xc5\x3a\
+\x57\xcb\x08\x80\x5c\xa4\x33\xb7\xd3\x62\xf2\x27\xf1\x67\x3e\xc8\
+\x1a\x69\x4e\x42\x60\x28\xfd\xa8\x40\x23\x6e\x8f\x6e\x72\x5f\xc0\
+\x48\xa2\xc2\x57\x04\x40\x85\x41\x6d\x2d\xf9\x93\xf8\x2b\x3c\x88\
+\x9d\xba\xd4\xa8\x10\x40\x04\x64\x3d\x1e\xf3\x35\x86\x00\xc8\xc7\
+\x3a\x4b\x4b\x2d\xdd\xe9\x4f\xe2\xcf\x72\x48\xd1\xc8\x0c\x81\x06\
+\x85\x00\x37\x07\xce\x1c\x07\xd1\x57\x21\x00\xa2\x47\x70\x62\xbf\
+\x92\xbf\x6e\xe0\x99\xac\xaa\xf2\x2d\x89\xbf\xca\xb0\x86\x74\xaa\
+\x25\x21\xa0\x6b\x8b\x8d\x2e\xf2\xcb\x81\x07\x1f\xa9\x39\xab\x47\
+\x00\xe4\xa4\x7d\x50\x5b\xad\x3c\xe6\x47\xe2\x3f\xe8\x00\xa2\xda\
+\xdd\x04\x24\x04\xac\x92\x26\xfe\x13\x22\xdd\x1c\xa8\x6b\x8e\xf9\
+\xcb\x12\x9c\x00\x02\x20\x78\x00\x75\x22\xea\x84\x0c\xee\xc6\x43\
+\xf3\x49\xfc\x0f\xf1\xf0\xa5\x13\x02\x12\x01\x93\xa7\x06\x9c\x58\
+\x75\x8c\x19\xba\xe6\xe8\xda\x73\x4c\xed\x2d\xd7\x9a\xd7\x77\x04\
+\x40\x5e\xde\x49\x5b\xd3\x09\xa8\x13\x31\x69\xa5\xfe\x2a\x7b\xd3\
+\x45\x95\xc7\xf9\xfc\x05\x06\x8b\xe6\x09\x48\x08\x58\xa9\xfe\x89\
+\x01\x5d\x7b\x74\x0d\x9a\xa7\xc0\xda\x08\x04\x10\x00\x11\xa2\x34\
+\x63\xa3\x4e\x3c\x9d\x80\x33\x5f\x55\xb1\x4a\xbd\x7e\x5d\x44\xad\
+\xbc\x56\xe1\x10\x4e\x34\x47\x40\xc7\xae\x95\xaa\x85\x80\xae\x41\
+\xba\x16\x35\x17\xdc\x83\x1c\xce\x5d\x2d\x02\x20\x37\xf1\x04\xed\
+\xe9\x84\xd3\x89\x97\xa0\x2a\x77\x55\x28\xf1\x8f\x3f\xe2\xe3\xce\
+\x38\x0c\x82\xc0\x06\x02\x26\x02\x24\x62\xab\xfd\x21\x21\x5d\x8b\
+\x74\x4d\xda\x80\x86\x5d\x0a\x13\x40\x00\x14\x0e\xc0\xda\xe6\x75\
+\xa2\xe9\x84\x5b\xbb\x5f\x90\xed\x19\xee\x0f\x12\x28\xcc\x5c\x47\
+\x40\x22\xc0\x4a\xb5\xa3\x01\xba\x26\xe9\xda\xb4\x8e\x0a\x5b\x5f\
+\x12\xc8\xff\x09\x01\x90\x9f\xf9\xe6\x16\x75\x82\xe9\x44\xdb\x5c\
+\x81\xd3\x1d\xc7\x5e\xbf\x5d\x20\xd5\x53\x72\x6a\x25\x66\x41\x60\
+\x3f\x01\x1d\xe3\x56\xaa\x14\x02\xba\x36\xe9\x1a\xb5\x9f\x12\x35\
+\xe4\x22\x80\x00\xc8\x45\x7a\x67\x3b\x3a\xb1\x74\x82\xed\xac\xc6\
+\xe3\xee\xf4\xfa\x3d\x46\x05\x9b\x0e\x25\x60\x22\x40\x62\xb7\xba\
+\x69\x01\x5d\xa3\x74\xad\x3a\x14\x5e\xa5\x95\x97\x70\x0b\x01\x50\
+\x82\xfa\xca\x36\x75\x42\xe9\xc4\x5a\xb9\x9b\xeb\xcd\xd5\xeb\xb7\
+\x8b\xe0\xc9\x8a\x2e\x84\xae\x6d\xc5\x38\x08\x1c\x41\x40\xc7\xbe\
+\x95\xea\x46\x03\x74\xad\xd2\x35\xeb\x08\x66\xd4\x99\x96\x00\x02\
+\x20\x2d\xcf\xe4\xb5\xe9\x44\xd2\x09\x95\xbc\xe2\xb2\x15\xf6\xbd\
+\xfe\xb2\x26\xd0\x3a\x04\x7c\x10\x30\x11\x20\x11\x5c\xd5\x68\x80\
+\xae\x59\xba\x76\xf9\x20\x1c\xc1\x8a\x32\x36\x22\x00\xca\x70\x5f\
+\xd4\xaa\x4e\x20\x9d\x48\x8b\x36\x0e\xb0\x91\x7a\xfd\xba\xc3\x7f\
+\xb8\xe0\x05\xb0\x18\x13\x21\x90\x87\x80\xce\x09\x2b\x55\x8d\x06\
+\xe8\xda\xa5\x6b\x58\x1e\x82\xb4\xb2\x85\x00\x02\x60\x0b\xb5\x0c\
+\xfb\xe8\xc4\xd1\x09\x94\xa1\xa9\x5c\x4d\xf4\xbd\x7e\x7e\xd0\x27\
+\x17\x6e\xda\x89\x48\xc0\x44\x40\x55\xa3\x01\xba\x86\xe9\x5a\x16\
+\x31\x16\x39\x6d\x2e\xd5\x16\x02\xa0\x14\xf9\x27\xed\xfe\xd7\x47\
+\xf7\xf2\x64\x93\x10\x5f\xd3\xeb\x0f\x11\x26\x8c\x74\x44\x40\x22\
+\x40\x23\x65\x3a\x77\x1c\x99\xb5\xd9\x14\x44\xc0\x66\x74\x87\xef\
+\x88\x00\x38\x1c\xf1\xfa\x06\x2a\xfa\x5f\xfd\xe8\xf5\xaf\x0f\x3f\
+\x7b\x40\xa0\xd3\x48\x99\x7e\x02\xdb\x50\x54\x71\x6f\x40\x2d\x1d\
+\x1a\x8b\xc7\x01\x4b\xb9\x2a\x11\x00\xe5\xd8\xcf\xb6\x5c\x53\xf2\
+\x57\x4f\x66\xd6\x49\x56\x42\x00\x02\x8b\x08\x0c\xe7\x50\x78\x11\
+\xf0\xf1\xd1\x7d\xd7\xb5\x6d\x91\xd3\x6c\x94\x8d\x00\x02\x20\x1b\
+\xea\xe7\x0d\xfd\xf3\xaf\x3f\x5e\x3f\xec\x44\x79\xbe\xa5\xdf\x2d\
+\x34\x6c\xa9\xe1\xcb\xe1\xc2\xe5\xd7\x50\x2c\x83\x40\x10\x02\x3a\
+\x97\x74\x4e\x05\x31\xf7\xae\x99\xba\xb6\xe9\x1a\x77\x77\x83\x46\
+\xbf\x28\xe9\x36\x02\xa0\x24\xfd\x49\xdb\xc3\x89\x11\x7a\xde\x5f\
+\xc9\x5f\xc3\x96\x1a\xbe\x9c\xb8\xc6\x5b\x08\x40\x60\x27\x01\x9d\
+\x53\x26\x04\x6a\x78\x4a\xe0\x65\xb8\xd6\xed\x24\xc2\xee\x29\x08\
+\x20\x00\x52\x50\xdc\x59\xc7\x70\x42\x84\x4e\xfe\x86\xa0\x9f\xef\
+\xb7\x57\x16\x08\x40\xe0\x20\x02\x26\x02\x6a\x78\x4a\x00\x11\x70\
+\x3e\x3e\xca\xbe\x41\x00\x94\xe5\xdf\x0d\x8f\xc8\x84\x4e\xfe\x1a\
+\x9e\x1c\x2e\x4c\x85\x69\xd2\x3c\x04\xea\x27\x30\x9c\x6b\xd1\xef\
+\x0b\x78\x19\xae\x7d\xf5\x07\xcc\xb1\x87\x08\x80\xc2\xc1\xd1\x23\
+\x32\x85\x4d\xd8\xdc\xbc\x86\xfc\x95\xfc\x35\x3c\xb9\xb9\x12\x76\
+\x84\x00\x04\x56\x13\x90\x08\xd0\xb9\xb7\x7a\x47\x47\x3b\xe8\xda\
+\xd7\xba\x08\x28\x1d\x0e\x04\x40\xc1\x08\x0c\x43\xff\x05\x2d\xd8\
+\xde\xb4\x92\x3f\xf3\xfd\xdb\xf9\xb1\x27\x04\xf6\x12\x90\xf0\x36\
+\x21\x70\x3a\x9d\xba\x5f\x5d\xd0\x7f\x3c\x1e\x58\x36\x70\x08\x80\
+\x42\xfc\x87\xe4\x1f\x75\xe8\x9f\xf9\xfe\x42\xc7\x0d\xcd\x42\xe0\
+\x9a\x80\x84\xb8\xad\x0b\x39\x25\xa0\x27\x03\xda\x7d\x3c\xd0\xa2\
+\x56\x78\x41\x00\x14\x0e\x40\xc0\xe6\xdf\xac\xd7\xa1\x1b\x91\x02\
+\x9a\x8e\xc9\x10\xa8\x93\xc0\x70\x4e\x86\x15\x01\x43\x87\xa8\xce\
+\xe0\x38\xf6\x0a\x01\x50\x20\x38\x83\xe0\xbc\xdc\x00\x00\x10\x00\
+\x49\x44\x41\x54\xc3\xbc\x57\xc4\xde\x3f\xc9\xbf\xc0\xf1\x42\x93\
+\x10\x58\x42\x20\xb2\x08\x30\xff\x9a\x7b\x32\xc0\x7c\x2e\xbe\x20\
+\x00\x0a\x84\xe0\xdb\x7b\xf7\xbd\x0b\xf6\x4f\x37\x1c\x0d\x17\x98\
+\x60\x96\x63\x2e\x04\xda\x21\x30\x9c\xa3\x21\x47\x02\x2c\x4a\x3c\
+\x19\x60\x10\x72\x2e\x08\x80\x9c\xb4\xbf\xda\x0a\xd5\xfb\x57\xf2\
+\xd7\x0d\x47\x5f\xe6\xf3\x0e\x02\x10\xf0\x4a\x20\xb2\x08\xb0\xce\
+\xd1\xcf\x61\x84\xd4\x2b\xde\x44\x76\xf9\xa8\x06\x01\xe0\x23\x0e\
+\x6e\xad\x20\xf9\xbb\x0d\x0d\x86\x41\xe0\x2e\x01\x89\x00\x9d\xbb\
+\x77\x37\x70\xfc\x05\x4f\x06\xe4\x0b\x0e\x02\x20\x1f\xeb\xbe\xa5\
+\x48\x37\xbb\xe8\x02\x42\xcf\xbf\x0f\x1b\x7f\x20\x10\x8e\x80\xce\
+\x5d\x9d\xc3\xd1\x0c\x6f\xe1\xc9\x00\x2f\x31\x41\x00\x78\x89\x84\
+\x33\x3b\x74\xe1\xd0\x05\xc4\x99\x59\x98\x03\x01\x08\xac\x20\xa0\
+\x73\x58\xe7\xf2\x8a\x5d\x5c\x6c\x2a\x11\x10\xa9\xb3\xe4\x02\xda\
+\x06\x23\x10\x00\x1b\xa0\xd5\xbc\x8b\x7e\x54\x44\x17\x0c\x5d\x38\
+\x6a\xf6\x13\xdf\x20\xd0\x0a\x01\x9d\xcb\x3a\xa7\x03\xfa\x5b\xe9\
+\x4d\x81\x7e\x22\x81\x00\xf0\x13\x8b\xe2\x96\x28\xf9\xeb\x47\x45\
+\x74\xc1\x28\x6e\x0c\x06\x40\x00\x02\xc9\x08\xe8\x9c\x8e\x28\x02\
+\xb8\x1f\x20\xd9\x21\x30\x5b\x11\x02\x60\x16\x4b\x7b\x2b\xc7\xe4\
+\xdf\x9e\xe7\x78\x0c\x81\x36\x08\x44\x14\x01\x35\x4e\x05\x78\x3a\
+\xda\x10\x00\x99\xa3\x61\x2a\xdc\xdd\xef\x76\x93\xfc\x33\x1f\x04\
+\x34\x07\x81\x42\x04\x22\x8a\x00\x43\xc5\x54\x80\x41\x38\x62\x41\
+\x00\x1c\x41\x35\x58\x9d\x1a\xf6\x0f\x66\x32\xe6\x42\x00\x02\x1b\
+\x09\x44\x14\x01\xf5\x4c\x05\x6c\x0c\xda\x41\xbb\x21\x00\x0e\x02\
+\x7b\xaf\x5a\x9d\x7c\xf7\xbe\x2b\xb1\xde\x46\x24\xfe\x52\xa2\x5d\
+\xda\x84\x00\x04\xca\x11\xd0\x75\x28\xd2\xb9\xaf\xa9\x00\xfe\xd3\
+\xa0\xf4\xc7\x0b\x02\x20\x3d\xd3\xa7\x35\x6a\xc8\xfd\xe9\x46\x19\
+\x36\xd0\x05\x40\x17\x82\x0c\x4d\xd1\x04\x04\x20\xe0\x8c\x80\xce\
+\x7d\x5d\x03\x9c\x99\x75\xd7\x1c\x89\x80\xe8\xbf\x12\x78\xd7\xb9\
+\x42\x5f\x20\x00\x0a\x80\xff\xbf\x53\xe7\xe1\xb7\xba\xdf\x74\x01\
+\x28\xe0\x3e\x4d\x42\x00\x02\x4e\x08\x0c\xd7\x00\x0f\xd7\xa3\x45\
+\x44\xf8\xa9\xe0\x45\x98\x16\x6f\x84\x00\x58\x8c\x2a\xdd\x86\x3a\
+\xe9\x0a\x8f\x02\xf0\xbf\xfa\xa5\x0b\x27\x35\x41\x20\x34\x01\xfd\
+\x6c\xb0\x39\x10\x46\x04\xc4\xbd\x1f\xc0\x28\x3b\x5b\x10\x00\x85\
+\x02\x52\xf0\xc6\x3b\x92\x7f\xa1\x98\xd3\x2c\x04\xbc\x12\x88\x24\
+\x02\x34\x15\xc0\xaf\x04\xa6\x39\x92\x10\x00\x69\x38\x6e\xaa\xa5\
+\xc0\xfc\x1b\xc9\x7f\x53\xa4\xd8\x09\x02\xf5\x13\x88\x24\x02\x2c\
+\x1a\xe1\x1e\x0d\x34\x9b\xdd\x2d\x08\x80\x82\x21\xd1\x54\x80\x35\
+\x9f\x6b\xe8\x8d\xe4\x6f\xb0\x59\x20\x00\x81\xfb\x04\x24\x02\x0a\
+\x4f\x4f\xde\x37\xee\xea\x1b\xa6\x02\xae\x80\x6c\xf8\x88\x00\xd8\
+\x00\x2d\xe5\x2e\x3a\xe1\xac\xbe\xa3\x45\x00\xc9\xdf\x20\xb3\x40\
+\x00\x02\xcf\x09\x68\x7a\x32\x82\x08\x88\x35\x15\xf0\x9c\x7b\x89\
+\x2d\x10\x00\x25\xa8\x5f\xb5\x79\x94\x08\xd0\x49\xac\x69\x86\xa1\
+\xfe\xab\x56\xf9\x08\x01\x08\x40\x60\x9e\x80\x93\x27\x95\xe6\x8d\
+\xbb\x5c\xcb\x54\xc0\x25\x8f\x55\x9f\x10\x00\xab\x70\x1d\xb7\xb1\
+\x92\xb4\x95\x93\xb5\x90\x6a\x34\xe0\x4d\x4a\x7e\x98\x66\xb0\x6a\
+\x59\x20\x00\x01\x08\x2c\x23\x30\x5c\x37\x52\x5d\x8b\x96\x35\xba\
+\x71\xab\x08\x53\x01\x1b\x5d\x3b\x7c\x37\x04\xc0\xe1\x88\xd7\x35\
+\x60\x22\xe0\xd5\xf6\xd0\x89\xa7\x62\x6f\xd7\x2d\xf4\xfa\xd7\xf1\
+\x62\x6b\x08\x40\x60\x9e\xc0\xe4\x5a\x34\xbf\x81\x93\xb5\x4c\x05\
+\x6c\x0f\x04\x02\x60\x3b\xbb\xc3\xf6\xd4\x89\x37\x94\x7e\x44\x40\
+\x49\xfd\x5e\x63\xfa\x4e\x65\x18\xea\x3f\xd1\xeb\xbf\x47\x8a\xf5\
+\x10\x80\xc0\x5a\x02\xba\x0e\xe9\xfa\xb2\x76\xbf\x02\xdb\xbf\x14\
+\x68\x73\x61\x93\x7e\x37\x43\x00\xf8\x8d\x4d\x6f\x99\x4e\x40\x25\
+\x75\x7b\x3d\xa9\x28\xd1\x8f\x45\x9f\xf5\x9d\xca\x30\x64\xd7\xef\
+\xc3\x1f\x08\x40\x00\x02\xa9\x08\xe8\xfa\x12\x41\x04\xf0\xdb\x00\
+\xeb\x23\x8e\x00\x58\xcf\xac\xe8\x1e\x4a\xf4\x63\x29\x6a\x08\x8d\
+\x43\x00\x02\xcd\x10\x08\x72\x53\xa0\xcb\x1b\x02\x3d\x1f\x24\x08\
+\x00\xcf\xd1\xc1\x36\x08\x40\x00\x02\x0e\x08\xa8\xd3\x61\x66\x6c\
+\xba\x2f\xc9\xf6\xcb\xb6\x70\x43\xe0\x3a\xd4\x08\x80\x75\xbc\xd8\
+\x1a\x02\x10\x80\x40\x93\x04\x6c\xca\xf1\xd5\xfb\x54\x80\x6e\x08\
+\xf4\xf5\x3f\x06\xfa\x3e\x54\x10\x00\xbe\xe3\x83\x75\x10\x80\x00\
+\x04\xdc\x10\x88\x70\x3f\x00\xa3\x00\xcb\x0f\x17\x04\xc0\x72\x56\
+\x6c\x09\x01\x08\x40\xa0\x79\x02\xde\xef\x07\xd0\x28\x80\x97\x1b\
+\x02\xbd\x1f\x2c\x08\x00\xef\x11\xc2\x3e\x08\x40\x00\x02\x8e\x08\
+\x04\xb9\x1f\x80\xc7\x02\x17\x1c\x33\x08\x80\x05\x90\xd8\x04\x02\
+\x10\x80\x00\x04\xbe\x08\x44\xb8\x1f\xe0\xcf\xdf\x7f\xfc\xfc\xb2\
+\xb8\xc4\x3b\xff\x6d\x22\x00\xfc\xc7\x08\x0b\x21\x00\x01\x08\xb8\
+\x23\x10\x61\x2a\x80\x1b\x02\x1f\x1f\x36\x08\x80\xc7\x7c\xf8\x16\
+\x02\x10\x80\x00\x04\x66\x08\x44\x98\x0a\x28\x79\x43\xe0\x0c\x32\
+\x77\xab\x10\x00\xee\x42\x82\x41\x10\x80\x00\x04\x62\x10\xf0\x3e\
+\x15\xa0\x1b\x02\x19\x05\xb8\x7f\x2c\x21\x00\xee\xb3\xe1\x1b\x08\
+\x40\x00\x02\x10\x78\x42\xc0\xfb\x54\x40\x99\x51\x80\x27\xd0\x9c\
+\x7c\x8d\x00\x70\x12\x08\xcc\x80\x00\x04\x20\x10\x91\x80\xf7\xa9\
+\x00\x8d\x02\xf0\x58\xe0\xfc\x91\x85\x00\x98\xe7\xc2\x5a\x08\x40\
+\x00\x02\x10\x58\x48\xc0\xfb\x54\x80\xb9\x91\xf5\xb1\x40\x6b\x2f\
+\xc4\x82\x00\x08\x11\x26\x8c\x84\x00\x04\x20\xe0\x9b\x80\xf7\xa9\
+\x00\x46\x01\x6e\x8f\x1f\x04\xc0\x2d\x13\xd6\x40\x00\x02\x10\x80\
+\xc0\x4a\x02\xde\xa7\x02\x4e\xa7\xee\xb7\x95\x2e\x6d\xdc\x3c\xce\
+\x6e\x08\x80\x38\xb1\xc2\x52\x08\x40\x00\x02\xae\x09\x78\x9e\x0a\
+\xd0\xbd\x00\x3c\x11\x70\x79\xf8\x20\x00\x2e\x79\xf0\x09\x02\x10\
+\x80\x00\x04\x76\x10\xf0\x3c\x15\x90\xe3\x89\x80\x1d\xe8\xb2\xef\
+\x8a\x00\xc8\x8e\x9c\x06\x21\x00\x01\x08\xd4\x4b\x40\x53\x01\x36\
+\xdc\xfe\xcb\xa3\x87\x8c\x02\x5c\x46\x05\x01\x70\xc9\x83\x4f\x10\
+\x80\x00\x04\x20\xb0\x93\x40\xbb\xa3\x00\x3b\xc1\x65\xde\x1d\x01\
+\x90\x19\x38\xcd\x41\x00\x02\x10\xa8\x9d\x80\x46\x01\xcc\xc7\x37\
+\x2b\xee\x16\x46\x01\xbe\x42\x82\x00\xf8\x62\xc1\x3b\x08\x40\x00\
+\x02\x10\x48\x44\xc0\xf3\x0d\x81\x47\xdd\x0b\x90\x08\x5d\xb6\x6a\
+\x10\x00\xd9\x50\xd3\x10\x04\x20\x00\x81\xb6\x08\x78\x9d\x0a\x60\
+\x14\xe0\xf3\x38\x44\x00\x7c\x72\xe0\x2f\x04\x20\x00\x01\x08\x24\
+\x26\xa0\xa9\x00\xaf\x37\x04\xa6\x1f\x05\x48\x0c\x2f\x43\x75\x08\
+\x80\x0c\x90\x69\x02\x02\x10\x80\x40\xab\x04\x18\x05\xf0\x1b\x79\
+\x04\x80\xdf\xd8\x60\x19\x04\x20\x00\x81\xf0\x04\x5a\x19\x05\x88\
+\x18\x28\x04\x40\xc4\xa8\x61\x33\x04\x20\x00\x81\x40\x04\x3c\x8f\
+\x02\x04\xc2\x98\xdc\x54\x04\x40\x72\xa4\x54\x08\x01\x08\x40\x00\
+\x02\x53\x02\x9e\x47\x01\xd2\xfc\x27\x41\x53\x6f\xe3\xbc\x47\x00\
+\xc4\x89\x15\x96\x42\x00\x02\x10\x08\x4b\xc0\xeb\x28\x80\x01\x7d\
+\xb1\xd2\xe4\x82\x00\x68\x32\xec\x38\x0d\x01\x08\x40\x20\x2f\x01\
+\xcf\xa3\x00\x7b\xff\x93\xa0\xbc\x24\xd3\xb5\x86\x00\x48\xc7\x92\
+\x9a\x20\x00\x01\x08\x40\xe0\x01\x01\xaf\xa3\x00\xad\x3e\x12\x88\
+\x00\x78\x70\xb0\xf2\x15\x04\x20\x00\x01\x08\xa4\x23\xe0\x75\x14\
+\x60\xdf\x0f\x03\xa5\xe3\x93\xbb\x26\x04\x40\x6e\xe2\xb4\x07\x01\
+\x08\x40\xa0\x61\x02\x8c\x02\xf8\x09\x3e\x02\xc0\x4f\x2c\xb0\x04\
+\x02\x10\x80\x40\xf5\x04\x3c\x8f\x02\x6c\x81\x1f\x79\x1f\x04\x40\
+\xe4\xe8\x61\x3b\x04\x20\x00\x81\x80\x04\xbc\x8e\x02\xb4\x76\x33\
+\x20\x02\x20\xe0\xc9\x83\xc9\x10\x80\x00\x04\x22\x13\xf0\x3a\x0a\
+\xb0\xfe\x66\xc0\xc8\x51\xe8\xba\x66\x05\x80\x94\x9e\x8a\x7e\x04\
+\xe2\xcf\xdf\x7f\xfc\x54\xd1\x7b\x95\xd8\x21\xc5\x7a\x08\x40\x00\
+\x02\xfe\x09\x78\x1c\x05\xd0\xcd\x80\xfe\xc9\xa5\xb3\xb0\x39\x01\
+\xa0\xa4\xaf\x64\xff\xed\xbd\xfb\xa9\x62\x28\x5f\x14\x74\x15\xbd\
+\x57\x31\x11\xf0\x61\xe5\x55\xdb\xda\x67\x16\x08\x40\x00\x02\x10\
+\x48\x4c\xc0\xeb\x28\xc0\x9a\xeb\x7e\x62\x24\xd9\xab\x6b\x4a\x00\
+\x28\xa9\x2b\xe9\x0f\xc9\xfe\x19\xec\x17\x6d\xab\x7d\x9e\x6d\xc8\
+\xf7\x10\x80\x00\x04\x20\xb0\x9e\x80\xc7\x51\x80\x96\xa6\x01\x9a\
+\x10\x00\x52\x74\xea\xf5\xdb\xe1\xb9\xe5\x27\x1f\x5f\x86\x7d\x6d\
+\x77\x16\x08\x40\x00\x02\x10\x48\x45\x40\xa3\x00\xa9\xea\x4a\x55\
+\xcf\xc2\x0e\x62\xd7\x75\xa9\x5a\x2c\x57\x4f\xf5\x02\x40\xc9\x5f\
+\x3d\xf9\x3d\x41\xd5\xbe\x36\x12\xf0\xa1\xba\xca\x85\x8a\x96\x21\
+\x00\x01\x08\xd4\x47\xe0\x74\xea\x7e\x75\xce\xfe\xb5\x72\xad\xaf\
+\x5e\x00\x28\xf9\xa7\x3a\xb6\x5a\x1a\x1a\x4a\xc5\x8c\x7a\x20\x00\
+\x01\x08\x3c\x22\x10\x75\x1a\xe0\x91\x4f\x51\xbe\xab\x5a\x00\xa4\
+\x1e\xba\xd7\x48\x40\xea\x3a\xa3\x1c\x28\xd8\x09\x01\x08\x40\xe0\
+\x08\x02\x9a\x06\xf0\x36\x0a\xa0\x6b\x7d\x0b\xa3\x00\xd5\x0a\x00\
+\x1b\xb2\x7f\xfd\xf8\xe8\xbe\x77\x89\xff\xa9\x4e\xd5\x9d\xb8\x5a\
+\xaa\x83\x00\x04\x20\xd0\x2c\x01\x8f\xa3\x00\x8f\x83\x51\xc7\xb7\
+\x55\x0a\x80\x21\x41\x6f\xb9\xe1\x6f\x69\x54\x5f\x5a\x50\x87\x4b\
+\x61\xb0\x1d\x04\x20\x00\x81\x3d\x04\x34\x0a\xb0\x67\xff\x23\xf6\
+\x6d\x61\xca\xb7\x4a\x01\x60\x07\xc3\x91\xc9\xdf\xaa\xef\xba\x16\
+\x0e\x8e\xde\x51\xfe\x40\x00\x02\x10\xc8\x40\x20\xd2\x34\x40\x06\
+\x1c\x59\x9a\xa8\x4e\x00\x0c\xbd\xff\xc3\xe1\x31\x15\x70\x38\x62\
+\x1a\x80\x00\x04\x1a\x22\xe0\x71\x1a\xa0\xf6\x8e\x5e\x55\x02\x60\
+\x48\xfe\x87\xf7\xfe\x27\xe7\x24\x53\x01\x13\x18\xbc\x85\x00\x04\
+\x20\xb0\x95\x80\xa6\x01\xbc\x8d\x02\xcc\xfb\x52\xcf\xda\x6a\x04\
+\xc0\x30\x27\x9f\x33\xf9\xf7\x47\x41\xca\xc7\x0c\xfb\x0a\xf9\x03\
+\x01\x08\x40\xa0\x51\x02\xde\x46\x01\x34\xd2\x3b\xe4\x96\x2a\x23\
+\x52\x8d\x00\x28\x99\x88\x79\x34\xb0\xca\x73\x03\xa7\x20\x00\x01\
+\x08\x74\x96\x5b\x2e\x9e\x26\xab\x09\x49\x15\x02\x60\x18\xfa\x2f\
+\x16\x17\xa9\xc4\xd2\x36\x14\x73\x9e\x86\x21\x00\x01\x08\x24\x22\
+\xe0\x71\x1a\xc0\xa6\x25\x7e\x4b\xe4\x9e\xbb\x6a\xc2\x0b\x80\x21\
+\xf1\x66\x1f\xfa\x9f\x89\x24\xf7\x03\xcc\x40\x61\x15\x04\x20\x00\
+\x81\x35\x04\x3c\x4e\x03\x7c\xd9\x5f\xd7\xbb\xf0\x02\xc0\xc2\xe1\
+\x21\xf9\x9b\x19\x3c\x1a\xd8\x43\xe0\x0f\x04\x20\x00\x81\xca\x08\
+\xd4\x7a\x1f\x40\x68\x01\x30\xf4\xfe\xdd\x1c\x6a\x4c\x05\xb8\x09\
+\x05\x86\x40\x00\x02\x41\x09\x78\x9c\x06\x18\xef\x03\x08\x8a\xf4\
+\xae\xd9\x61\x05\xc0\x90\xfc\xdd\xf4\xfe\x27\x84\x99\x0a\x98\xc0\
+\xe0\x2d\x04\x20\x00\x81\xb5\x04\xbc\x4d\x03\xd4\x7a\x1f\x40\x48\
+\x01\x30\x0c\xc7\x78\x4c\xfe\xfd\x71\x5e\xfb\x8f\x47\xf4\x4e\xf2\
+\x07\x02\x10\x80\x40\x23\x04\x34\xba\xdb\x75\xf5\x39\x1b\x52\x00\
+\x78\x4f\xb0\x3a\x58\x78\x34\xb0\xbe\x93\x05\x8f\x20\x00\x81\x3c\
+\x04\x3c\x4e\x03\x0c\x1d\xcf\x3c\x00\x32\xb5\x12\x4e\x00\x68\xe8\
+\x5f\x09\x36\x13\x9f\xcd\xcd\xc8\xc6\x1a\x0f\x98\xcd\x40\xd8\x11\
+\x02\x10\x80\xc0\x0a\x02\x76\x0d\xfd\xcf\x8a\xcd\x0f\xdf\xd4\x7b\
+\xc7\x73\x0b\x80\x50\x02\x40\xc9\xdf\x9c\x74\x3b\xf4\x6f\xb6\x5d\
+\x2c\xdf\xde\xbb\x9f\x88\x80\x0b\x24\x7c\x80\x00\x04\x20\xb0\x88\
+\xc0\xfb\xb7\xee\x57\xc7\xbf\x43\x09\x84\x12\x00\x46\x22\x4c\xf2\
+\x37\x5b\xfb\xa5\x46\xd5\xd8\x3b\xc6\x1f\x08\x40\x00\x02\x07\x12\
+\xd0\x34\xc0\x81\xd5\xaf\xac\xba\xeb\x6c\x44\xa2\xba\x5f\x04\x0c\
+\x23\x00\x86\xde\xff\xea\xa0\x95\xde\x41\x07\x4d\x54\xdb\x4b\xb3\
+\xa3\x7d\x08\x40\xa0\x6d\x02\xa7\x53\xe7\x6a\x14\xa0\xb6\x11\xdd\
+\x10\x02\x60\x48\xa0\x2f\x5d\xdc\x7f\x3c\x1a\x18\x37\x76\x58\x0e\
+\x01\x08\x14\x22\xe0\xe5\x71\xc0\xd1\xfd\xda\x46\x74\x43\x08\x00\
+\x83\x1f\x39\xf9\x9b\xf9\xfc\x4a\x60\x0f\x81\x3f\x10\x80\x00\x04\
+\x20\xe0\x86\x80\x7b\x01\x30\xf4\xfe\xdd\x00\xdb\x6a\x08\x53\x01\
+\x5b\xc9\xb1\x1f\x04\x20\xd0\x2a\x01\xdd\x07\x50\x7e\x1a\xe0\x8b\
+\xbe\xae\xe3\x5f\x9f\xe2\xbf\x73\x2d\x00\x86\xe4\x1f\xbe\xf7\x3f\
+\x39\x4c\x98\x0a\x98\xc0\xe0\x2d\x04\x20\x00\x81\x68\x04\x6a\xba\
+\x0f\xc0\xad\x00\x18\x20\xd7\x94\xfc\xfb\xe3\x5c\x8f\x06\xf6\x6f\
+\xf8\x03\x01\x08\x40\x00\x02\x4f\x09\x94\xbe\x0f\xe0\xda\xc0\x9a\
+\xee\x03\x70\x2b\x00\x6a\x82\x7c\x7d\x00\xf1\x2b\x81\xd7\x44\xf8\
+\x0c\x01\x08\x40\x60\x9e\x80\xa6\x01\xe6\xbf\x61\xed\x5e\x02\x2e\
+\x05\x80\x86\xfe\x6b\x9b\x6b\x99\x06\x4a\xbe\xc9\xc7\xe9\x3a\xde\
+\x43\x00\x02\x10\x80\xc0\x3c\x81\x72\xf7\x01\xdc\xda\xa3\xeb\xf7\
+\xed\xda\x98\x6b\xdc\x09\x80\x21\x31\x56\x37\xf4\x3f\x73\x78\x70\
+\x3f\xc0\x0c\x14\x56\x41\x00\x02\x10\xf0\x4e\x60\x98\xa2\xf6\x6e\
+\xe6\x53\xfb\xdc\x09\x00\xb3\xb8\x85\xe4\x6f\x6e\xf2\x68\x60\x0f\
+\x81\x3f\x10\x80\x00\x04\x9e\x10\x28\x75\x1f\xc0\x13\xb3\xc2\x7f\
+\xed\x4a\x00\x0c\xbd\xff\xf0\x50\x97\x3a\xa0\xa1\xa4\xd6\x7c\x5e\
+\xca\x86\xed\x20\x00\x01\x08\x78\x25\xf0\xed\xbd\xab\xe2\x67\x81\
+\xdd\x08\x80\x21\x11\x36\xd3\xfb\xef\xbe\xfe\x31\x15\xf0\xc5\x82\
+\x77\x10\x80\x00\x04\x6e\x08\x94\xb9\x11\xf0\xc6\x8c\xf3\x8a\xd3\
+\xa9\xfb\xed\xfc\x21\xf0\x1b\x37\x02\xc0\x18\xb6\x98\xfc\xcd\x6d\
+\xa6\x02\x7a\x08\xfc\x81\x00\x04\x20\xf0\x80\x80\x25\x5d\x57\xff\
+\x2f\xc0\x03\x53\xc3\x7c\xe5\x42\x00\xb4\xfe\x58\x1c\x53\x01\x61\
+\xce\x17\x0c\x85\x00\x04\x0a\x11\xb0\xeb\xe4\x7f\x72\x36\xfd\xa8\
+\x2d\xb3\x85\x29\x80\x47\x80\x96\x7e\xa7\xa1\xff\x5a\x60\x2e\xf5\
+\xf9\xce\x76\x4c\x05\xdc\x01\xc3\x6a\x08\x40\x00\x02\xef\xdf\x3a\
+\x57\x23\x00\x35\x3c\x09\x50\x74\x04\x60\x00\xd8\xec\xd0\x7f\x77\
+\xf5\xef\xdb\x7b\xf7\xf3\x6a\x15\x1f\x21\x00\x01\x08\x40\x20\x3b\
+\x81\x36\x1a\x2c\x2a\x00\x48\x78\xb7\x07\x59\xeb\xd3\x21\xb7\x44\
+\x58\x03\x01\x08\x40\xa0\xeb\xbc\xdd\x08\x68\xf9\x2b\xfc\x34\x40\
+\x31\x01\xa0\xa1\x7f\x0e\xea\x5b\x02\x9a\x0e\x81\xcd\x2d\x17\xd6\
+\x40\x00\x02\x10\xc8\x75\x23\xe0\x12\xd2\x66\x4b\xf8\x27\x01\x8a\
+\x08\x80\x21\xc1\x31\xf4\x7f\xff\x28\xe3\x7e\x80\xfb\x6c\xf8\x06\
+\x02\x10\x80\x00\x04\x12\x10\x28\x22\x00\xcc\x6e\x92\xbf\x41\x78\
+\xb4\xd4\xfc\x9f\x21\x3d\xf2\x9b\xef\x20\x00\x01\x08\xdc\x23\x90\
+\xe7\x17\x01\xef\xb5\x7e\xb9\x5e\xa3\xb5\x97\x6b\xe2\x7d\xca\x2e\
+\x00\x86\xde\x7f\x3c\x52\x99\x2d\xd6\xc1\x05\xab\xcc\xd0\x69\x0e\
+\x02\x10\x80\x40\x43\x04\xb2\x0a\x80\x21\xa1\xd1\xfb\x5f\x7e\x80\
+\x31\x15\xb0\x9c\x15\x5b\x42\x00\x02\x10\xd8\x4d\x60\x4d\x05\xc3\
+\x93\x6c\x6b\x76\x71\xb5\x6d\x36\x01\x30\x80\x22\xf9\xaf\x0c\x3f\
+\x53\x01\x2b\x81\xb1\x39\x04\x20\x50\x2d\x01\x6f\x4f\x02\x44\x07\
+\x9d\x4d\x00\x90\xc8\xb6\x1d\x2a\x4c\x05\x6c\xe3\xc6\x5e\x10\x80\
+\x40\x9d\x04\x4e\xa7\xee\xc0\x1f\x04\xea\x56\xfd\x8b\xfe\x28\x60\
+\x16\x01\xa0\xa1\x7f\x25\xb2\x55\x64\xd9\x78\x4a\x80\xa9\x80\x29\
+\x0d\xde\x43\x00\x02\x10\x70\x40\xc0\xc4\x48\xe8\x47\x01\x0f\x17\
+\x00\x4a\xfe\x16\x27\x86\xfe\x0d\xc2\x9e\xc5\x94\x26\xbf\x12\xb8\
+\x07\x20\xfb\x42\x00\x02\x55\x10\xb0\xce\xe4\x61\xff\x27\x40\x15\
+\x80\x56\x38\x71\xb8\x00\x30\x5b\x48\xfe\x06\x21\xc5\xc2\xaf\x04\
+\xa6\xa0\x48\x1d\x10\x80\xc0\x5a\x02\xba\x87\x6b\x5a\xd4\xb1\x2b\
+\x55\x3c\xf5\xba\x4d\x8c\x7c\x2f\xc5\x61\x1a\x8f\xb5\xf1\x1c\xb7\
+\x3f\x54\x00\x08\xcc\xd8\x10\xaf\xfb\x09\x8c\x07\xdb\xfe\x9a\xa8\
+\x01\x02\x10\x80\xc0\x63\x02\x4a\x30\xea\x74\xd8\x75\xfc\x43\x23\
+\x90\xd3\x62\x7b\xaa\x63\x57\xa4\xe8\x3a\x68\xed\x1f\xb0\x6c\xae\
+\xb2\x08\x87\x69\x3c\x14\x23\x2b\xaf\x2a\x6b\xbc\x38\x4c\x00\x0c\
+\x86\x08\xcc\x1a\x7b\xd8\xf6\x39\x01\xee\x07\x78\xce\x88\x2d\x20\
+\x00\x81\x8d\x04\x74\xed\xb6\xd2\x27\x7d\x87\xc9\x76\xa3\x57\x4d\
+\xec\xa6\x7c\xfb\xa2\xd8\x59\x79\x5d\xe2\xf1\x61\x02\xc0\x1a\x97\
+\x31\xf6\xc2\x92\x9a\x00\x4f\x54\xa4\x26\x4a\x7d\x10\x80\xc0\xd8\
+\xe3\x37\x12\x4d\x5e\xbb\xcd\xef\x9a\x96\x45\x42\xe0\x10\x01\xb0\
+\x54\x7d\xd4\x44\x3b\xa7\x2f\x52\xe5\x30\xce\x49\x9c\xb6\x20\x50\
+\x37\x01\x25\x7f\x0d\x29\xeb\xda\x52\xb7\xa7\xcd\x79\x27\x21\x70\
+\x77\x34\x20\xb9\x00\x18\x12\x13\x0a\xf2\xf8\xe3\x8c\xa9\x80\xe3\
+\x19\xd3\x02\x04\x9a\x20\xa0\xe4\xdf\x84\xa3\x77\x9d\xac\xfa\x8b\
+\xbb\xb9\x22\xa9\x00\x90\x8a\x34\x8c\x24\x7f\x83\x90\x63\x61\x2a\
+\x20\x07\x65\xda\x80\x40\xdd\x04\x86\x4e\x5b\xdd\x4e\x36\xee\xdd\
+\xbd\x5c\x91\x54\x00\xdc\x6b\xa4\x71\xf6\x87\xb9\xaf\xe1\x3a\x4e\
+\xde\xc3\xf0\x52\x31\x04\x5a\x21\xd0\x7c\xa7\xad\xf6\x40\x2b\x57\
+\x0c\x1d\xf4\x0b\x57\x93\x09\x00\x25\x22\x35\x72\x51\x3b\x1f\x72\
+\x10\xb8\x3b\xbc\x93\xa3\x71\xda\x80\x00\x04\xe2\x12\xd0\x75\x3b\
+\xae\xf5\x58\xbe\x86\xc0\x5c\x07\x3d\x89\x00\x18\x0e\x22\x54\xe4\
+\x9a\x68\x24\xdc\x96\xf9\xbb\x84\x30\xa9\x0a\x02\x10\x68\x8c\x40\
+\xbb\xee\x26\x11\x00\x86\x8f\xe4\x6f\x10\x4a\x2e\xfa\xc1\x8e\x92\
+\xed\xd3\x36\x04\x20\x10\x8f\x80\xa7\x5f\xd5\x8b\x47\x2f\x96\xc5\
+\x73\x23\xf4\xbb\x05\xc0\xd0\xfb\x8f\x45\xa2\x42\x6b\x15\x5c\x62\
+\x51\x61\x60\x71\x09\x02\x07\x12\xb0\xeb\x46\xf3\xbf\xab\x7f\x20\
+\x5e\x57\x55\x9b\xd8\xfb\x75\x6d\xd0\x2e\x01\x30\x24\x1c\x7a\xff\
+\xd7\x54\xcb\x7d\xe6\x7e\x80\x72\xec\x69\x19\x02\x10\x80\x40\x28\
+\x02\xbb\x04\x80\x79\x4a\xf2\x37\x08\x9e\x96\xb9\x1b\x3d\x3c\xd9\
+\x87\x2d\x10\x80\x80\x1f\x02\xef\xdf\xba\x9b\x5e\x61\xd7\xd4\xbf\
+\x76\x9c\x9d\x1b\xed\xd9\x2c\x00\x98\x73\xf6\x79\xe0\x58\x90\xfb\
+\xff\x9d\xca\xa7\x75\x58\x05\x01\x08\x40\x00\x02\x5e\x08\x6c\x12\
+\x00\x1a\xfa\x57\xa2\xf1\xe2\x04\x76\xdc\x10\x60\x2a\xe0\x06\x09\
+\x2b\x20\x00\x81\x6b\x02\xff\xf3\xbf\x7f\xfc\x9a\x9b\x1b\xbe\xde\
+\xae\xd6\xcf\x2d\xf9\xf5\xf7\x7f\xff\x71\xf3\x93\xc0\xab\x05\x80\
+\x92\xbf\x41\x63\xe8\xdf\x20\x78\x5e\x98\x0a\xf0\x1c\x1d\x6c\x83\
+\x80\x1f\x02\xff\x77\xea\xde\xfc\x58\x83\x25\x07\x11\x98\x8d\xf1\
+\x6a\x01\x60\xc6\x91\xfc\x0d\x82\xf7\x45\x23\x34\x4c\xd3\x78\x8f\
+\x12\xf6\x41\x00\x02\xe5\x08\xd0\xf2\x2a\x01\x30\xf4\xfe\xa1\x16\
+\x84\x80\x44\xc0\xdc\xcf\x3f\x06\x31\x1f\x33\x21\x00\x81\x0c\x04\
+\x34\x0d\x60\xcd\xcc\xf6\x10\x6d\x3d\x4b\x7c\x02\x6f\x73\xc3\xff\
+\x72\x6b\xb1\x00\x18\x92\x3f\xbd\x7f\x51\x0b\x54\xf4\x2b\x81\x88\
+\x80\x40\x01\xc3\x54\x08\x14\x20\xa0\x04\xd1\xda\xbd\x00\x05\x30\
+\x17\x69\xf2\xd1\x93\x1e\x8b\x05\x80\x59\x4e\xf2\x37\x08\x11\x17\
+\xee\x07\x88\x18\x35\x6c\x86\x40\x5e\x02\xdc\x0b\x90\x97\x77\xa6\
+\xd6\xde\x86\x11\x9e\xd9\xe6\x16\x09\x80\xa1\xf7\x3f\x5b\x01\x2b\
+\xfd\x13\xd0\x54\x00\x31\xf4\x1f\x27\x2c\x84\x40\x49\x02\x4a\x14\
+\xed\x8c\x02\x94\x24\x9d\xaf\x6d\x8d\xec\x3c\x6a\xed\xa9\x00\x18\
+\x12\x07\xbd\xff\x5f\x0a\xf3\x70\x00\x00\x10\x00\x49\x44\x41\x54\
+\x47\x14\x63\x7c\xc7\xa3\x81\x31\xe2\x84\x95\x10\x28\x46\x80\x51\
+\x80\x62\xe8\x8f\x68\xf8\xe9\x7d\x1d\x4f\x05\x80\x59\x45\xf2\x37\
+\x08\x35\x2c\x4c\x05\xd4\x10\x45\x7c\x80\xc0\x71\x04\x34\x0a\x60\
+\xb5\x3f\x4d\x1c\xb6\x4d\xe8\xa5\x01\xe3\xef\xde\xf8\x37\xf5\xfd\
+\xa1\x00\x18\x7a\xff\xd3\xed\x79\x1f\x98\x00\x53\x01\x81\x83\x87\
+\xe9\x10\xc8\x44\x40\xc3\xc6\x4c\x05\x64\x82\x7d\x50\x33\x8a\xe1\
+\x92\xaa\xef\x0a\x80\x21\xf9\xd3\xfb\x5f\x42\x31\xd6\x36\xc4\x34\
+\x56\xbc\xb0\x16\x02\xd9\x09\xfc\xed\x5f\x7f\xfc\x25\x7b\xa3\xd9\
+\x1a\xac\xbe\xa1\xc5\x23\x38\x77\x05\x80\x21\x22\x51\x18\x84\x1a\
+\x17\x7e\x20\xa8\xc6\xa8\xe2\x13\x04\xd2\x12\x78\xff\xd6\x21\x02\
+\xd2\x22\xcd\x51\xdb\xa2\xa1\xff\xd1\x90\x59\x01\x30\xf4\xfe\xc7\
+\x6d\x78\xad\x8c\x80\xa6\x02\xf8\x6d\x80\xca\x82\x8a\x3b\x10\x48\
+\x4c\xa0\xd6\xfb\x01\x12\x63\x72\x53\x9d\xa6\x6d\x96\x0e\xfd\x8f\
+\x46\xcf\x0a\x00\xab\xe8\xb7\x71\x03\x5e\xeb\x24\xc0\x0d\x81\x75\
+\xc6\x15\xaf\x20\x90\x92\x80\x12\x8a\xe5\x83\x5f\x29\xeb\xa4\xae\
+\x63\x08\x6c\x79\x82\x63\x56\x00\xa8\x87\x78\x8c\x89\xd4\x0a\x01\
+\x08\x40\x00\x02\x91\x08\x6c\x49\x2c\x7e\xfd\xab\xd6\xb2\x87\x3f\
+\xf8\x73\xcf\xeb\x1b\x01\xc0\xf0\xff\x3d\x54\x75\xad\x97\xc8\x63\
+\x1a\xa0\xae\x98\xe2\x0d\x04\x8e\x20\xc0\x54\xc0\x11\x54\x93\xd6\
+\xb9\x6a\xde\x7f\xda\xf2\x8d\x00\xb0\xe1\x1e\x86\xff\xa7\x84\x2a\
+\x7e\xff\xed\xbd\xfb\xde\xf1\x0f\x02\x10\x80\xc0\x13\x02\xb5\x4c\
+\x05\x3c\x71\x33\xe4\xd7\x8a\xcd\x56\xc3\x6f\x04\xc0\xd6\x8a\xd8\
+\x0f\x02\x10\x80\x00\x04\xea\x25\xc0\x54\x80\xcb\xd8\x2e\x7e\xe4\
+\x6f\xce\xfa\x1b\x01\xa0\xa1\xe1\xb9\x0d\x59\x07\x01\x08\x40\x00\
+\x02\xed\x12\x88\x3f\x15\x50\x5d\xec\x36\x0f\xfd\x8f\x24\x6e\x04\
+\xc0\xf8\x05\xaf\xf5\x13\x60\xba\xa7\xfe\x18\xe3\x21\x04\x52\x12\
+\xd0\x70\xb3\x5d\x37\x78\x2a\x20\x25\xd4\x8d\x75\x29\x16\x1b\x77\
+\x3d\xef\x76\x23\x00\x08\xee\x99\x4d\xf5\x6f\x6c\xb4\xe7\x3f\xd5\
+\x3b\x89\x83\x10\x80\x40\x52\x02\x51\x7f\x25\x30\x29\x84\xc2\x95\
+\xa5\xfa\x91\xa6\x1b\x01\x40\x52\x28\x1c\xd9\x8c\xcd\xdb\x41\x84\
+\x92\xcf\xc8\x9b\xa6\x20\x50\x0b\x01\xbb\x76\xf0\x2b\x81\xe5\x82\
+\xb9\xe9\x91\xbf\x39\x73\x6f\x04\x80\x05\x96\xa4\x30\x47\xaa\xc2\
+\x75\xc3\x9c\x5e\x85\x9e\xe1\x12\x04\x20\x70\x24\x81\xe1\xda\xb1\
+\xeb\x06\xb4\x23\xed\xbb\xad\xbb\x9a\x35\xbb\xe7\xfd\xa7\x24\x6e\
+\x04\x80\x02\xcb\x34\xc0\x14\x51\xb5\xef\x39\x79\xab\x0d\x2d\x8e\
+\x41\xe0\x78\x02\x9a\x83\x26\x57\x1c\xcf\x79\xda\x82\x98\x4f\x3f\
+\xef\x7d\x7f\x23\x00\x54\x21\x8f\x7b\x88\x42\xd5\x25\xa9\x8a\xac\
+\x9a\x14\xce\x41\x00\x02\x77\x09\x44\xc9\x15\x77\x1d\x88\xf5\x45\
+\xf2\x4e\xdb\xac\x00\xd0\x28\x80\x4d\x05\x30\xc7\x13\xeb\xe0\x58\
+\x64\xad\x14\x7b\x6a\x15\xb9\xa8\x61\x36\x82\x00\x04\xaa\x23\xa0\
+\x5c\x61\x4e\x25\x4f\x4c\x56\x27\xcb\x25\x81\x43\x3a\x6d\xb3\x02\
+\x40\xed\x2a\xb0\x96\x28\x4e\xa7\x53\xc7\x3d\x01\x5d\x35\xff\xde\
+\xb8\x83\xb7\x9a\x58\xe2\x08\x04\x5c\x10\xb0\x3c\xf1\xea\x3b\x4f\
+\xb8\xc0\xb4\xcb\x08\x31\xde\x55\xc1\x9d\x9d\xef\x0a\x80\x71\xfb\
+\x21\x61\xa0\xf0\x46\x20\x01\x5f\x75\x72\x6a\x44\xe7\xa8\x83\x28\
+\x20\x12\x4c\x86\x00\x04\x12\x12\x60\x2a\x20\x21\xcc\xdb\xaa\x0e\
+\xcb\xbf\x4f\x05\x80\x6c\x51\xe2\xb0\x72\x52\x12\xb1\xcf\x87\x19\
+\x63\x75\xb3\x24\x22\x30\x26\x7d\xc5\x4c\x22\x4e\x23\x3a\x89\xaa\
+\xa6\x1a\x08\x40\x00\x02\x17\x04\x86\xeb\x8b\xcb\xdc\x70\x61\x68\
+\xbc\x0f\x87\x0c\xfd\x8f\x18\x16\x09\x80\x71\x63\x05\xd9\x84\xc0\
+\xab\x95\xd3\x58\x94\x60\x4a\x95\xd1\x2e\x27\xaf\x6f\xa5\x38\x4c\
+\xdb\x1d\xe3\x32\x26\x7d\xc5\xcc\x09\x1f\xcc\x80\x00\x04\x2a\x26\
+\x60\xd7\x1e\xa6\x02\x12\xc6\x57\x9d\x38\x31\x4d\x58\xe5\x4d\x55\
+\xab\x04\xc0\xcd\xde\xb6\x42\x09\xa6\x54\x11\x20\x33\xc1\xc5\x62\
+\xb6\xfc\x56\x8a\xc3\xb4\x5d\x17\x30\x30\x02\x02\x10\x68\x92\x80\
+\x3a\x1e\xbe\x1c\x8f\x6b\x4d\x8e\x69\x95\xdd\x02\x20\x2e\x5e\x2c\
+\x87\x00\x04\x20\x00\x81\xd4\x04\x34\x22\x99\xba\xce\x06\xeb\x4b\
+\xf6\x6b\x7f\x8f\xd8\x85\x16\x00\xfc\x6c\xf1\xa3\xd0\xf2\x1d\x04\
+\x20\x00\x81\xfc\x04\x34\x22\x69\xad\xba\xb8\x1f\xc0\xec\x88\xb8\
+\x1c\x3a\xef\x3f\x05\x12\x5a\x00\x98\xd2\x74\xf3\x88\xa2\x89\x91\
+\xef\x53\xb0\xbc\x87\x00\x04\x20\xd0\x2a\x01\xcd\x5d\xdb\xb4\xa8\
+\x9b\xeb\x73\xa4\x38\x88\x5d\x2e\x7b\x43\x0b\x80\x5c\x90\x96\xb6\
+\xf3\x8f\xff\xfe\x81\x08\x58\x0a\x8b\xed\x20\x00\x81\xaa\x09\xe4\
+\x98\xc3\x7e\x0c\x30\xe4\xb7\x59\x47\x4e\x42\x0b\x80\x61\xa8\x29\
+\x64\x94\x31\x1a\x02\x10\x80\x40\xcd\x04\x86\xeb\x73\xd6\x84\x16\
+\x9c\x67\xb6\xa1\xff\x91\x53\x68\x01\x30\x3a\xe1\xe5\xf5\xdb\x7b\
+\xc7\x08\x40\xc7\x3f\x08\x40\x00\x02\x9f\x04\x34\x9c\x5d\x6a\x2a\
+\xe0\xd3\x82\x38\x7f\xc5\x2a\xb7\xb5\xe1\x05\x80\xa7\x83\xcb\x6c\
+\xf9\x2d\x77\x00\x69\x0f\x02\x10\x80\x80\x67\x02\x4c\x05\x3c\x8f\
+\xce\xfb\xb7\xae\xc8\xff\xbd\x13\x5e\x00\x3c\x47\xcb\x16\x10\x80\
+\x00\x04\x20\x50\x8a\x40\x99\xa9\x80\x52\xde\x6e\x6a\x37\xcb\x23\
+\x7f\x73\x96\x85\x17\x00\x1f\x1f\xdd\x7f\xe6\x1c\x2b\xb1\xce\x6c\
+\x61\x0a\xa0\x04\x78\xda\x84\x00\x04\x5c\x13\xd0\xf0\xb6\x8d\x90\
+\xf2\x54\xc0\x55\x94\xc4\x44\x6c\xae\x56\x67\xfb\x18\x5e\x00\xd8\
+\xd0\x89\xab\x83\x8a\x27\x01\xb2\x1d\xbb\x34\x04\x01\x08\x04\x22\
+\x90\xf3\x57\x02\xa3\x60\x29\xcd\x24\xbc\x00\x88\x12\x68\xec\x84\
+\x00\x04\x20\xd0\x3a\x01\xeb\xb0\x15\x99\xeb\x76\xca\xbd\xf8\x13\
+\x12\xe1\x05\xc0\x30\xbf\xe4\x26\xbe\x3c\x09\xe0\x26\x14\x18\x02\
+\x01\x08\x38\x23\x30\x5c\xaf\x0f\x4e\x7c\xce\x9c\x9e\x37\x27\xfb\
+\x23\x7f\x73\x66\x84\x17\x00\x72\x4a\xf3\x28\x7a\xf5\x50\xcc\x16\
+\x9e\x04\xf0\x10\x08\x6c\x80\x00\x04\x5c\x12\xd0\x9c\xb7\x5d\x27\
+\x5d\x4d\xdd\xe6\x06\x25\x06\xb9\xdb\x9c\x6b\xaf\x0a\x01\x30\xe7\
+\x58\xa9\x75\xdc\x08\x58\x8a\x3c\xed\x42\x00\x02\x51\x08\x1c\xf9\
+\x68\x60\x00\x06\x6e\x46\x40\xaa\x10\x00\x96\x74\xdd\x3c\x09\xa0\
+\x83\x8f\x1b\x01\x45\x81\x02\x01\x08\x40\x60\x9e\x40\xc3\x53\x01\
+\x2e\x86\xfe\xc7\xa8\x54\x21\x00\xde\xbf\x75\x4d\x0f\x27\x75\xfc\
+\x83\x00\x04\x20\x10\x8c\x80\x86\xc1\xd3\x4f\x05\xf8\x85\x20\x5f\
+\xe5\xb3\x27\x0b\xab\x10\x00\x9e\x80\xca\x96\xff\xfa\xe8\x5e\xf4\
+\x4a\x81\x00\x04\x20\x00\x81\xfb\x04\x5a\x9a\x0a\xf0\xe8\x6b\x15\
+\x02\x60\x18\x4e\xba\x7f\x94\xf1\x0d\x04\x20\x00\x01\x08\xb8\x23\
+\x30\x5c\xbb\x93\xcd\x89\xbb\x73\xf0\xcb\xa0\x62\xbf\xf6\xf7\x65\
+\xc2\xed\xbb\x2a\x04\x80\xdc\xd2\xf0\x8a\x5e\x3d\x94\x8f\x8f\xee\
+\x3b\xf7\x01\x78\x88\x04\x36\x40\x00\x02\xde\x09\x68\x58\xdc\xd3\
+\xf5\xfb\x00\x5e\xae\xe6\xfd\xa7\xfe\x55\x23\x00\xa6\x4e\xf1\x1e\
+\x02\x10\x80\x00\x04\xe2\x10\x48\xf3\x8b\x78\x3e\xfd\x95\xc0\xf1\
+\x69\x59\xd7\x55\x23\x00\xbc\xcd\xaf\x70\x1f\x80\xd7\x43\x1e\xbb\
+\x20\x00\x01\x8f\x04\xde\x0b\xfd\x8f\x78\x07\xb3\x70\x3d\xbd\x51\
+\x8d\x00\x18\xe6\x92\x0e\x8e\x25\xd5\x43\x00\x02\x10\x80\xc0\x11\
+\x04\x86\x6b\xf8\xe6\x84\x79\x84\x4d\x3b\xeb\x74\x3b\xf4\x3f\xfa\
+\x55\x8d\x00\x90\x43\x9e\xe6\x91\xb8\x0f\x40\x11\xa1\x40\x00\x02\
+\x10\x58\x4e\x40\xc3\xe5\x9e\xae\xe3\xcb\x2d\xbf\xdd\x52\xbe\xdc\
+\xae\xf5\xb5\xa6\x2a\x01\x60\x49\xd7\xd5\x0f\x02\xf9\x0a\x35\xd6\
+\x40\x00\x02\x10\xf0\x4f\x60\xdb\x74\xae\x3b\xbf\x42\x8c\x64\x54\
+\x25\x00\x6c\x0e\xe9\x97\xa7\xc3\x80\xfb\x00\x3c\x45\x03\x5b\x20\
+\x00\x81\x08\x04\x2a\x98\x0a\x70\x3f\xf4\x3f\x1e\x07\x55\x09\x80\
+\xe1\xc0\x19\x7d\x2b\xfe\x6a\x23\x12\xdf\x8b\x1b\x81\x01\x10\x80\
+\x00\x04\x82\x11\xd0\xf0\xf9\x9a\xa9\x00\x2f\xee\xc9\x66\xd9\xee\
+\xc5\x9e\x67\x76\x54\x25\x00\xe4\xac\x02\xa0\x57\x2f\x85\xdf\x03\
+\xf0\x12\x09\xec\x80\x00\x04\x22\x11\x88\x38\x15\x10\xcd\xe6\xea\
+\x04\x80\xf5\xba\x5d\xdd\x07\xc0\x34\x40\xa4\x4b\x0e\xb6\x42\x00\
+\x02\x5e\x08\x0c\x23\xba\x0b\xe6\xd2\xbd\x58\xdc\xb9\xfc\xb5\xbf\
+\x47\x74\xaa\x13\x00\xde\xee\x03\x78\x04\x9f\xef\x20\x00\x01\x08\
+\x40\xe0\x3e\x01\x0d\xa7\x7b\x1b\xd5\xbd\x63\x6d\x98\x79\xff\xa9\
+\xfd\xd5\x09\x80\x41\x35\x4e\x7d\x2c\xfa\xde\x46\x24\xf8\x59\xe0\
+\xa2\x11\xa0\x71\x08\x40\x20\x32\x81\x67\xbf\x12\xe8\xc1\x37\x09\
+\x15\x0f\x76\xac\xb5\xa1\x3a\x01\x20\x00\xde\x14\xe3\xb7\xf7\x8e\
+\x9b\x01\x3b\xfe\x41\x00\x02\x10\xd8\x46\xc0\x46\x76\xff\xb2\x6d\
+\xcf\x2c\x7b\x45\x9a\xa6\xb8\x00\x52\xa5\x00\xb0\x5e\xb7\xab\xfb\
+\x00\x4c\x90\xfc\x76\x41\x9d\x0f\x10\x80\x00\x04\x20\xb0\x98\xc0\
+\x30\xb2\x3b\x93\x68\x17\x57\x71\xd4\x86\x21\x87\xfe\x47\x18\x55\
+\x0a\x00\x53\x8b\xae\x7e\x0f\xc0\x04\x09\xd3\x00\xe3\x11\xc7\x2b\
+\x04\x20\x00\x81\x0d\x04\x34\xcc\x6e\x9d\x29\x57\xd7\x76\xd9\xb4\
+\xc1\x15\x37\xbb\x54\x29\x00\x06\xb5\xe8\x06\x32\x86\x40\x00\x02\
+\x10\x80\xc0\x7e\x02\xd7\x8f\xd9\xed\xaf\x71\x7b\x0d\xd6\xd1\xf4\
+\x3c\x2d\xb1\xc8\xb1\x2a\x05\x80\x3c\xf7\xa6\x14\x79\x1c\x50\x51\
+\xa1\x40\x00\x02\x10\xd8\x4e\x60\xe8\xdc\x79\x98\x0a\x08\xf7\xc8\
+\xdf\x1c\xf5\x6a\x05\x80\x27\xa5\x28\xf0\x4c\x03\x88\x02\x05\x02\
+\x10\x80\xc0\x3e\x02\x1a\x76\xff\xec\xe0\xed\xab\x67\xeb\xde\x6a\
+\x5b\x36\x6c\xdd\xdf\xd3\x7e\xd5\x0a\x00\x4f\x90\x47\x5b\x18\x05\
+\x18\x49\xf0\x0a\x01\x08\x40\x60\x3b\x81\x92\x1d\xbc\x08\x8f\x25\
+\x2e\x25\x5b\xad\x00\xd0\x50\x91\x94\xda\x52\x10\x6c\x07\x01\x08\
+\x40\x00\x02\x31\x08\xe8\xfa\x6e\x96\x96\x98\x0a\x28\xd1\xa6\xb9\
+\x7a\xcc\x52\xad\x00\x10\x2e\x1b\x76\x77\xf5\x38\xa0\xd9\xc3\xd3\
+\x00\x0a\x0c\x05\x02\x10\x80\xc0\x4e\x02\x1a\x86\xcf\xdc\xc9\x0b\
+\xfd\xc8\xdf\x1c\xee\xaa\x05\xc0\xfb\xb7\xce\xd5\x23\x23\x9d\xfd\
+\x63\x1a\xc0\x20\xb0\x40\x00\x02\x10\xd8\x45\xe0\x73\xe7\x9c\xc3\
+\xf1\x12\x1c\x9f\xad\xd6\xf3\xb7\x6a\x01\xa0\x61\xa2\xcc\x0a\xf1\
+\xe9\x91\xa1\x51\x80\xa7\x1b\xb1\x01\x04\x20\x00\x01\x08\x2c\x22\
+\x60\x1d\xbd\x1c\x8f\xe3\x55\x35\xf4\x3f\x82\xad\x5a\x00\xc8\xc9\
+\x92\x37\x8b\xa8\xfd\xb9\xc2\x7f\x11\x3c\x47\x85\x75\x10\x80\x00\
+\x04\x96\x11\x98\x6e\xa5\x8e\x9e\x7d\x3e\x32\x41\x57\x37\xf4\x6f\
+\xbc\xfa\xa5\x7a\x01\x30\x1c\x1c\xbd\xb3\x5e\xfe\x30\x0d\xe0\x25\
+\x12\xd8\x01\x01\x08\xd4\x40\x40\xc3\xf3\x07\x8d\xf6\x56\x9b\xfc\
+\x15\xf7\xea\x05\x80\x9c\x3c\xe8\xc0\x50\xd5\x9b\x8a\xa6\x01\x18\
+\x05\xd8\x84\x8e\x9d\x20\x00\x81\xe6\x09\xcc\x03\xd0\xfd\x00\x29\
+\xaf\xf5\xaa\x4b\xc2\x62\xbe\xb5\x3a\xd6\x36\x21\x00\x3c\x4e\x03\
+\x30\x0a\x50\xc7\x09\x84\x17\x10\x80\x80\x1f\x02\xa9\xae\xf5\x4a\
+\xfe\x12\x14\x7e\x3c\x3b\xc6\x92\x26\x04\x80\xc7\x69\x00\x46\x01\
+\x8e\x39\xa0\xa9\x15\x02\x10\xa8\x9b\xc0\x23\xef\x74\xad\xb7\x5e\
+\xfb\xe9\x74\xea\x36\x3f\x01\xa6\x7d\x5b\x48\xfe\x9d\xfd\x6b\x42\
+\x00\x98\x9f\x9d\x82\xaa\x57\x4f\xe5\xdb\x7b\xf7\xbd\xe3\x1f\x04\
+\x20\x00\x01\x08\x24\x25\x30\x24\xf0\x2d\x37\x06\xbe\x0d\xfb\x26\
+\xb5\xc7\x6b\x65\xcd\x08\x80\x54\x43\x43\x89\x03\xf9\x92\xb8\x3e\
+\xaa\x83\x00\x04\x20\x50\x31\x81\xe5\xae\xd9\x48\xc0\xab\x95\x93\
+\xed\xb1\x44\x08\xbc\xe9\x71\x42\xdb\xfe\xd5\xb6\x6f\x66\x69\x46\
+\x00\x68\x68\xc8\x63\x54\xb9\x19\xd0\x63\x54\xb0\x09\x02\x10\xa8\
+\x85\x80\x92\xba\x95\x93\x12\xbc\xf9\x24\x31\xd0\x17\x7d\x56\xd1\
+\x77\x56\x5e\xbd\xe6\x08\xb3\xf9\xb0\xa5\x19\x01\x20\x82\x1e\xa7\
+\x01\xb8\x19\x50\x91\xa1\x40\x00\x02\x10\x78\x4e\x60\xcf\x16\x4a\
+\xf0\x4a\xf4\x63\xd1\x67\x95\x3d\x75\x46\xdf\xb7\x29\x01\xe0\x71\
+\x1a\x80\x9b\x01\xa3\x9f\x42\xd8\x0f\x01\x08\x40\x20\x26\x81\xa6\
+\x04\x80\xd4\x1e\xa3\x00\x31\x0f\x54\xac\x86\x00\x04\x5a\x27\x80\
+\xff\xa9\x09\x34\x25\x00\x52\xc3\x4b\x55\x1f\xa3\x00\xa9\x48\x52\
+\x0f\x04\x20\x00\x01\x08\x2c\x25\xd0\x9c\x00\xf0\x38\x0d\xa0\x60\
+\x71\x2f\x80\x28\x50\x20\x00\x01\x08\xcc\x13\x60\x6d\x7a\x02\xcd\
+\x09\x00\xaf\xd3\x00\x8c\x02\xa4\x3f\xb8\xa9\x11\x02\x10\x80\x00\
+\x04\xee\x13\x68\x4e\x00\x08\x05\xa3\x00\xa2\x40\x81\x00\x04\x20\
+\x10\x85\x00\x76\x1e\x41\xa0\x49\x01\xc0\x28\xc0\x11\x87\x12\x75\
+\x42\x00\x02\x10\x80\x40\x24\x02\x4d\x0a\x00\x05\x88\x51\x00\x51\
+\xa0\x40\x00\x02\x10\xf0\x4f\x00\x0b\x8f\x21\xd0\xac\x00\xd0\x28\
+\xc0\x31\x48\xf7\xd5\xca\xbd\x00\xfb\xf8\xb1\x37\x04\x20\x00\x01\
+\x08\x2c\x23\xd0\xac\x00\x18\xf0\xe8\x27\x21\x87\xb7\x7e\x5e\x78\
+\x22\xc0\x4f\x2c\xb0\x04\x02\x10\x28\x4d\x80\xf6\x8f\x22\xd0\xb4\
+\x00\xd0\x4f\x42\x1e\x05\x76\x4f\xbd\x8c\x02\xec\xa1\xc7\xbe\x10\
+\x80\x00\x04\x20\xb0\x84\x40\xd3\x02\x40\x80\x3c\xfe\x32\xa0\xec\
+\x62\x14\x40\x14\x28\x10\x80\x40\xeb\x04\xf0\xff\x38\x02\xcd\x0b\
+\x00\xaf\x37\x03\x6a\x14\xe0\x9f\x7f\xfd\xd1\xd4\x7f\x4d\x79\xdc\
+\x61\x4e\xcd\x10\x80\x00\x04\x20\x70\x4d\xa0\x79\x01\xa0\x9b\x01\
+\xbd\x8e\x02\x58\xb0\x5e\xac\xb0\x40\x00\x02\x10\x68\x94\x00\x6e\
+\x1f\x49\xa0\x79\x01\x20\xb8\x5e\x47\x01\x64\x1b\xa3\x00\xa2\x40\
+\x81\x00\x04\x20\x00\x81\xd4\x04\x10\x00\x46\xd4\xfb\x28\xc0\x3f\
+\xfe\xfb\xc7\x77\x33\x93\x05\x02\x10\x80\x40\x53\x04\x70\xf6\x58\
+\x02\x08\x80\x81\xaf\xe7\x51\x00\x6e\x08\x1c\x82\xc4\x0b\x04\x20\
+\x00\x01\x08\x24\x23\x80\x00\x18\x50\x7a\x1e\x05\xd0\x0d\x81\x8c\
+\x02\x0c\x81\xe2\x05\x02\x10\x68\x84\x00\x6e\x1e\x4d\x00\x01\x30\
+\x21\xec\x79\x14\xe0\xdb\x7b\xf7\x73\x62\x2a\x6f\x21\x00\x01\x08\
+\x40\x00\x02\xbb\x08\x20\x00\x26\xf8\x3c\x8f\x02\xc8\x4c\x6e\x08\
+\x14\x05\x0a\x04\x20\xd0\x02\x01\x7c\x3c\x9e\x00\x02\xe0\x8a\xb1\
+\xe7\x51\x00\x33\xf5\x85\xa9\x00\xa3\xc0\x02\x01\x08\x40\x00\x02\
+\xbb\x09\x20\x00\xae\x10\x7a\x1f\x05\xe0\x86\xc0\xab\x80\xf1\x11\
+\x02\x10\xa8\x90\x00\x2e\xe5\x20\x80\x00\x98\xa1\xec\x79\x14\x40\
+\x37\x04\x32\x15\x30\x13\x34\x56\x41\x00\x02\x10\x80\xc0\x2a\x02\
+\x08\x80\x19\x5c\xde\x47\x01\xcc\x64\xa6\x02\x0c\x02\x0b\x04\x20\
+\x50\x27\x01\xbc\xca\x43\x00\x01\x70\x87\xb3\xe7\x51\x00\x99\xcc\
+\x54\x80\x28\x50\x20\x00\x01\x08\x40\x60\x2b\x01\x04\xc0\x1d\x72\
+\xde\x47\x01\x98\x0a\xb8\x13\x38\x56\x43\x00\x02\xc1\x09\x60\x7e\
+\x2e\x02\x08\x80\x07\xa4\xbd\x8f\x02\x98\xe9\x4c\x05\x18\x04\x16\
+\x08\x40\x00\x02\x10\x58\x4f\x00\x01\xf0\x80\x99\x46\x01\xec\xeb\
+\x37\x2b\x6e\x17\xa6\x02\xdc\x86\x06\xc3\x20\x00\x81\x0d\x04\xd8\
+\x25\x1f\x01\x04\xc0\x13\xd6\x7f\xff\xf7\x1f\xaf\xa7\x53\xf7\xab\
+\x73\xfa\x8f\xa9\x00\xa7\x81\xc1\x2c\x08\x40\x00\x02\xce\x09\x20\
+\x00\x16\x04\x88\xa9\x80\x05\x90\xd8\x04\x02\x10\x80\xc0\x6e\x02\
+\x54\x90\x93\x00\x02\x60\x01\x6d\x4d\x05\x78\x1e\x05\x90\x0b\xfa\
+\xbf\x02\xf8\x95\x40\x91\xa0\x40\x00\x02\x10\x80\xc0\x12\x02\x08\
+\x80\x25\x94\x6c\x9b\x00\xa3\x00\x1d\xf7\x03\x58\xa0\x58\x20\x00\
+\x81\xb0\x04\x30\x3c\x2f\x01\x04\xc0\x42\xde\x11\x46\x01\xb8\x1f\
+\x60\x61\x30\xd9\x0c\x02\x10\x80\x00\x04\x3a\x04\xc0\x8a\x83\xe0\
+\x6f\xff\xfa\xe3\x2f\x2b\x36\x2f\xb5\x29\x8f\x06\x96\x22\x4f\xbb\
+\x10\x80\xc0\x0e\x02\xec\x9a\x9b\x00\x02\x60\x3d\x71\xd7\x8f\x05\
+\xca\x1d\xee\x07\x10\x05\x0a\x04\x20\x70\x24\x01\xdd\x73\xa4\xff\
+\x97\x44\xe5\xcf\xdf\x7f\xfc\x54\xd1\xfb\xb1\x1c\xd9\x36\x75\xa7\
+\x21\x80\x00\x58\xc9\xd1\xfb\x63\x81\xa3\x3b\xdc\x0f\x30\x92\xe0\
+\x15\x02\x10\x48\x45\x40\x49\x7f\x48\xf4\x1f\xea\x68\x58\xbd\x2f\
+\x2a\x9a\x7e\x54\xd1\xfb\xb1\x98\x10\xf8\xb0\xf2\xaa\x62\xeb\x9e\
+\x2e\x6c\x90\x9f\x00\x02\x60\x03\xf3\x08\x37\x04\xea\x64\xd4\x89\
+\xba\xc1\x3d\x76\x81\x00\x04\x20\x70\x41\x60\x4c\xfc\x4a\xfa\xba\
+\xb6\x5c\x7c\xf9\xf8\x43\x2f\x10\x4c\x04\xf4\x62\xe0\xf1\xa6\x7c\
+\x9b\x9b\x00\x02\x60\x03\xf1\x08\x37\x04\xca\x2d\x9d\xa8\x76\xe2\
+\xbd\xea\x3d\x05\x02\x10\x80\xc0\x5a\x02\x3b\x12\xff\x5c\x53\x2f\
+\xba\x1e\xa9\xce\xdb\x2f\x59\x53\x82\x00\x02\x60\x23\xf5\x08\xa3\
+\x00\x83\x6b\xdc\x14\x38\x80\xe0\x05\x02\x10\x58\x4e\x40\xc9\x7a\
+\x43\x8f\xff\x59\x03\x2f\xaa\x13\x11\xf0\x0c\x53\x9e\xef\x11\x00\
+\x1b\x39\x6b\x14\xc0\x76\x75\x7f\x43\xa0\xd9\xd8\x71\xc2\x89\x02\
+\x05\x02\x10\x58\x4a\x40\xc9\xdf\xb6\xd5\xf0\xbd\xbd\xa4\x5f\xae\
+\xaf\x49\xe9\x5b\xa0\xc6\x25\x04\x10\x00\x4b\x28\xdd\xd9\x26\xca\
+\x0d\x81\x32\x9f\x9b\x02\x45\x81\x02\x01\x08\x3c\x23\x70\x74\xf2\
+\x1f\xdb\x47\x04\x8c\x24\xca\xbd\x22\x00\x76\xb2\x0f\xf2\xdb\x00\
+\x9d\xee\x07\xe0\xa6\xc0\x9d\xc1\x66\x77\x08\x54\x4e\x20\x57\xf2\
+\x1f\x31\x7e\x76\x4c\xc6\x4f\xbc\xe6\x26\x80\x00\x48\x40\xfc\xfd\
+\x5b\x17\xe1\x07\x82\x10\x01\x09\x62\x4d\x15\x10\xa8\x95\x40\xee\
+\xe4\x2f\x8e\xea\x98\x0c\xed\xea\x23\x25\x33\x01\x04\x40\x02\xe0\
+\x91\xee\x07\xe0\x84\x4b\x10\x70\xaa\x80\x40\x65\x04\x86\x24\x7c\
+\xd8\x9c\xff\x23\x5c\xf6\x5d\xa9\x76\xad\xe9\xb6\x17\x04\x40\xa2\
+\xf8\x47\xba\x1f\xc0\x5c\xee\x1f\xc7\xb1\x57\x16\x08\x40\xa0\x71\
+\x02\x85\x93\x7f\x4f\x9f\xa7\x02\x7a\x0c\xd9\xff\x20\x00\x12\x22\
+\x0f\xf4\x68\xa0\xbc\x46\x04\x88\x02\x05\x02\x0d\x13\x28\x9f\xfc\
+\x3f\xe1\x73\x2f\xc0\x27\x87\xdc\x7f\x11\x00\x09\x89\x47\x9a\x0a\
+\x18\xdc\x46\x04\x0c\x20\x78\x81\x40\x6b\x04\x86\x5e\xb7\x8b\xe1\
+\x77\x4d\x4d\xb6\xc6\xdf\x83\xbf\x08\x80\xc4\x51\x08\x36\x15\x20\
+\xef\x11\x01\xa2\x40\x81\x40\x43\x04\x94\xfc\xf5\x18\x5e\x69\x97\
+\xa7\xed\xcb\xa6\xe9\x67\xde\x1f\x4f\x00\x01\x70\x00\xe3\x60\x53\
+\x01\x22\x80\x08\x10\x05\x0a\x04\x1a\x20\xa0\x44\xeb\x2d\xf9\x37\
+\x80\xdd\xa5\x8b\x08\x80\x03\xc2\x12\x70\x2a\x40\x14\x10\x01\xa2\
+\x40\x81\x40\xc5\x04\x7c\x25\xff\x4b\xd0\x26\x4a\xbe\x5f\xae\xe1\
+\xd3\xd1\x04\x10\x00\x07\x11\x0e\x38\x15\x20\x12\x88\x00\x51\xa0\
+\x40\xa0\x42\x02\x9e\x93\x7f\x85\xb8\x43\xb8\x84\x00\x38\x30\x4c\
+\x51\x7e\x25\xf0\x0a\x01\xff\x79\xd0\x15\x10\x3e\x42\x20\x3a\x01\
+\x8f\xc9\x3f\x3a\xd3\x1a\xec\x47\x00\x1c\x1c\xc5\x28\xbf\x12\x38\
+\xc5\x60\x43\x71\x3f\x87\xc7\x83\xa6\xab\x79\x0f\x01\x08\x04\x24\
+\x40\xf2\x0f\x18\xb4\x4c\x26\x23\x00\x0e\x06\x1d\xf4\x7e\x00\x51\
+\x61\x3a\x40\x14\x28\x10\x08\x4c\xc0\x6f\xf2\xbf\x85\x6a\x9d\xa5\
+\x5f\xb7\x6b\x59\x73\x24\x01\x04\xc0\x91\x74\x87\xba\x83\xde\x0f\
+\x20\xeb\x11\x01\xa2\x40\x81\x40\x40\x02\x91\x92\xbf\xf0\x0e\x9d\
+\x25\xbd\xa5\x64\x22\x80\x00\xc8\x04\x5a\xf7\x03\x9c\x4e\x5d\x44\
+\x85\x8b\x08\xe8\xf8\x07\x81\x58\x04\xbc\x27\xff\x6b\x9a\x41\xaf\
+\x8d\xd7\x6e\x84\xfb\x8c\x00\xc8\x18\xb2\x80\xbf\x0f\x30\xd2\x41\
+\xb3\xbd\x06\x61\x00\x00\x0f\x33\x49\x44\x41\x54\x04\x8c\x24\x78\
+\x85\x80\x73\x02\xba\x7f\x47\xf7\xf1\x38\x37\xf3\xc2\xbc\x8f\x8f\
+\xee\x3f\x17\x2b\xf8\x90\x85\x00\x02\x20\x0b\xe6\xcf\x46\x34\xc4\
+\x65\xf3\x5c\x21\xfe\xeb\xe0\x4f\x8b\x2f\xfe\x22\x02\x2e\x70\xf0\
+\x01\x02\xfe\x08\x28\xf9\x9b\x55\x2e\x7e\xde\xd7\xec\xb8\xb3\xdc\
+\xae\xd6\x34\xe9\xed\x5a\xd6\x1c\x4d\x00\x01\x70\x34\xe1\xab\xfa\
+\x25\x02\x6c\xd5\x9b\x95\x88\x0b\x22\x20\x62\xd4\xb0\xb9\x09\x02\
+\x51\x93\xbf\x05\x27\xea\xf5\xd0\x4c\x8f\xbd\x20\x00\x0a\xc4\x6f\
+\x50\xbb\x51\x0f\xfa\x97\x3f\x7f\xff\xf1\x53\x73\x8c\x05\xd0\xd1\
+\x24\x04\x20\x30\x43\x20\x52\xf2\xbf\x36\x7f\xb8\x1e\x5e\xaf\xe6\
+\x73\x06\x02\x08\x80\x0c\x90\xe7\x9a\xd0\x41\x1f\xf5\xc6\x17\x9b\
+\xaf\xfb\xae\x39\x46\x44\xc0\x5c\x64\x59\x07\x81\xbc\x04\x24\xc8\
+\xad\xc5\x70\xc3\xfe\x66\xb3\x96\xa8\x1d\x21\xd9\x1e\xbe\x20\x00\
+\x0a\x86\x30\xf0\x93\x01\x3d\x35\x89\x80\xa1\xe7\xd1\x7f\xe6\x0f\
+\x04\x20\x90\x8f\x80\x04\xb8\x92\xbf\x04\x79\xbe\x56\xf7\xb6\xf4\
+\xb5\xbf\x3a\x40\xea\x08\x7d\xad\xe1\x5d\x6e\x02\x08\x80\xdc\xc4\
+\xaf\xda\x0b\xfc\x64\xc0\xe8\x09\xf7\x05\x8c\x24\x78\x85\x40\x26\
+\x02\x4a\xfe\x12\xe0\x51\x93\xbf\x30\x55\x70\xed\x93\x1b\xa1\x0b\
+\x02\xa0\x70\xf8\x74\x53\x60\xe0\x27\x03\x46\x7a\x88\x80\x91\x04\
+\xaf\x10\x38\x98\x80\x46\xdd\x94\xfc\x0f\x6e\xe6\x90\xea\x27\x95\
+\xbe\xe9\xda\x37\xf9\xcc\xdb\x02\x04\x10\x00\x05\xa0\x5f\x37\x39\
+\x9c\x08\xd1\xe7\xc2\x24\x02\x3e\xd4\x33\xb9\xf6\x8f\xcf\x10\x80\
+\x40\x1a\x02\x1a\xf2\xb7\x9a\xa2\xce\xf7\x9b\xe9\xfd\xf2\xc6\xd0\
+\x7f\xcf\xa1\xf8\x1f\x04\x40\xf1\x10\x7c\x1a\x30\x9c\x10\xd1\x45\
+\x40\xa7\x9e\x89\x7a\x28\x9f\x5e\xf1\x17\x02\x10\x48\x41\x40\xc2\
+\x5a\xc9\x3f\xf2\x90\x7f\xd7\xf5\x24\x48\xfe\x3d\x06\x1f\x7f\x10\
+\x00\x3e\xe2\xd0\x5b\x51\x8b\x08\x30\x67\x34\x1a\xf0\x6a\xaf\x2c\
+\x10\x80\xc0\x4e\x02\x12\xd4\x12\xd6\x24\xff\x9d\x20\xd9\xfd\x86\
+\x00\x02\xe0\x06\x49\xd9\x15\x12\x01\xba\x3b\xb6\xac\x15\x49\x5a\
+\xe7\xf7\x02\x92\x60\xa4\x92\x96\x09\xa8\xd7\x6f\xfe\x47\x1f\xf2\
+\x37\x17\xba\x37\x5d\xdb\xf4\x86\xe2\x87\x00\x02\xc0\x4f\x2c\xce\
+\x96\x44\x7f\x3c\x70\x74\x44\x3d\x16\xf5\x5c\xd4\x83\x19\xd7\xf1\
+\x0a\x01\x08\x3c\x27\x50\xd1\x90\x7f\xa7\x0e\x0d\xc9\xff\x79\xcc\
+\x4b\x6c\x81\x00\x28\x41\x7d\x41\x9b\xb5\x88\x80\xc1\x55\xa6\x04\
+\x06\x10\xbc\x40\xe0\x19\x01\x09\x66\x09\x67\x09\xe8\x67\xdb\x7a\
+\xff\x5e\xc9\x5f\xd7\xb2\xae\xf3\x6e\x69\x9b\xf6\x21\x00\x1c\xc7\
+\x5d\x27\x8e\x4e\x20\xc7\x26\xae\x31\x4d\x22\xe0\x43\x17\xb7\x35\
+\x3b\xb1\x2d\x04\x5a\x21\x30\xf6\xfa\xcd\xdf\x1a\x86\xfc\xcd\x8d\
+\xae\xd3\x35\xac\x7f\xc3\x1f\x97\x04\x10\x00\x2e\xc3\xf2\x65\x94\
+\x4e\xa0\x8a\x44\x80\x1c\x93\x10\xe0\x06\x41\x91\xa0\x40\x60\x20\
+\x20\x61\x5c\x4b\xaf\x7f\x70\xa9\x9b\xfe\xbe\xc9\xb8\x8e\x57\x5f\
+\x04\x10\x00\xbe\xe2\x31\x6b\x4d\xa5\x22\x80\xd1\x80\xd9\x68\xb3\
+\xb2\x25\x02\x35\xf6\xfa\x15\x3f\x25\xff\xe1\xf7\x4d\xf4\x91\xe2\
+\x94\x00\x02\xc0\x69\x60\xae\xcd\xaa\x50\x04\xc8\x45\x46\x03\x44\
+\x81\xd2\x24\x81\x1a\x7b\xfd\x0a\xe4\x6d\xf2\xd7\x5a\x8a\x47\x02\
+\x08\x00\x8f\x51\xb9\x63\x53\xc5\x22\x80\xd1\x80\x3b\x31\x67\x75\
+\x7d\x04\x6a\xed\xf5\x2b\x52\x24\x7f\x51\x88\x53\x10\x00\x71\x62\
+\xd5\x5b\x5a\xa9\x08\x90\x6f\x8c\x06\x88\x02\xa5\x6a\x02\xb5\xf6\
+\xfa\x15\xb4\x7b\xc9\x5f\xdf\x51\x7c\x12\x40\x00\xf8\x8c\xcb\x43\
+\xab\x2a\x17\x01\x8c\x06\x3c\x8c\x3e\x5f\x46\x24\x50\x73\xaf\x5f\
+\x37\x29\x93\xfc\x23\x1e\x95\x5d\x87\x00\x88\x19\xb7\xfe\xf1\x1a\
+\x9d\x78\x41\xcd\x7f\x66\xb6\x46\x03\x10\x02\xcf\x28\xf1\xbd\x7b\
+\x02\x63\xe2\xaf\xed\x0e\xff\x11\xbc\xae\x41\xea\x90\xdc\xbf\xe1\
+\x6f\xdc\x92\x57\x8f\x04\x10\x00\x1e\xa3\xb2\xd0\x26\x9d\x78\x3a\
+\x01\x17\x6e\x1e\x71\x33\x09\x81\x57\x0d\x9b\x46\x34\x1e\x9b\xdb\
+\x26\xa0\xe3\xb6\xd6\xc4\xaf\xc8\xea\xda\xa3\x6b\x90\xde\x53\x62\
+\x12\x40\x00\xc4\x8c\xdb\xd9\x6a\x9d\x80\x3a\x11\xcf\x2b\xea\x7b\
+\xa3\x1f\x45\xe9\x85\x40\x7d\xae\xe1\x51\x8d\x04\x94\xf8\xad\x7c\
+\x98\x6f\x3a\x76\xed\xa5\xbe\x45\xd7\x1c\x5d\x7b\x9e\x79\xc6\xf7\
+\xbe\x09\x20\x00\x7c\xc7\x67\x91\x75\x3a\x11\x75\x42\x2e\xda\x38\
+\xee\x46\x12\x01\x4c\x0b\xc4\x8d\x5f\xf5\x96\x8f\xc3\xfd\xe6\x68\
+\xb5\x89\xdf\x7c\xeb\x7f\xdb\x5f\xd7\x1c\xbd\xa7\xc4\x26\x80\x00\
+\x88\x1d\xbf\xb3\xf5\x3a\x21\x1b\x10\x01\xf2\x17\x21\x20\x0a\x14\
+\x37\x04\xc6\xc4\x5f\xf3\x70\xff\x04\xf6\x9b\xae\x35\x93\xcf\x0f\
+\xde\xf2\x95\x77\x02\x08\x00\xef\x11\x5a\x61\xdf\x70\x62\xbe\xad\
+\xd8\x25\xf2\xa6\x08\x81\xc8\xd1\xab\xc0\xf6\xc6\x12\xbf\x22\xf6\
+\xc6\xff\xea\x27\x0c\xf5\x14\x04\x40\x3d\xb1\xec\x3d\x19\x4e\xd0\
+\x56\x44\x80\x7c\x46\x08\x88\x02\x25\x1b\x81\x06\x13\xbf\xd8\xae\
+\x4e\xfe\xda\x89\xe2\x9b\x00\x02\xc0\x77\x7c\x36\x59\xd7\xa0\x08\
+\x10\x27\x84\x80\x28\x50\x0e\x23\xd0\x68\xe2\x17\x4f\x92\xbf\x28\
+\x54\x58\x10\x00\x15\x06\x55\x2e\x49\x04\xe8\xc7\x39\xf4\xbe\xb1\
+\x82\x10\x68\x2c\xe0\x47\xbb\xdb\x70\xe2\xef\xff\x47\x3f\x5d\x4b\
+\xd6\x33\x66\x8f\x08\x04\x10\x00\x11\xa2\xb4\xd1\x46\xfd\x38\x87\
+\x9d\xbc\xa7\xd3\xa9\xfb\xd5\xb5\xf7\xef\x2c\x04\x74\x01\x6f\xcf\
+\x7d\x3c\xde\x43\x40\xc7\xcc\x3f\xff\xfa\x43\xbf\x41\xf1\xd1\xc8\
+\xcd\x7d\x17\xb8\x74\xcd\x50\x07\x42\xd7\x90\x8b\x2f\xf8\x50\x15\
+\x01\x04\x40\x55\xe1\x9c\x77\xa6\xb1\x9b\x03\xaf\x21\xbc\xe8\x02\
+\x3e\x5c\xcc\x5f\xaf\xbf\xe4\x33\x04\xa6\x04\x94\xf8\xff\xfc\xfd\
+\xc7\x4f\x1d\x33\xb6\xbe\xea\xc7\xf9\xcc\xbf\xd9\x45\xc9\x5f\xd7\
+\x8c\x3d\xc9\x7f\xb6\x62\x56\xba\x23\x80\x00\x70\x17\x92\x63\x0c\
+\xb2\x91\x00\x25\xbf\x96\x6e\x0e\xbc\x06\xa9\x8b\xf9\x79\x54\xe0\
+\xfa\x4b\x3e\xb7\x4d\x60\x9a\xf8\x3f\x3e\xba\xef\x5d\xbb\xff\x78\
+\xcc\xaf\xa1\xd8\x23\x00\x1a\x0a\x36\x22\xe0\x1c\xec\xb3\x10\xd0\
+\xc8\xc0\x79\x2d\x6f\x9a\x22\x30\x26\x7d\x3b\x06\x9a\x1c\xe6\x9f\
+\x09\x76\xa2\x9b\xfd\x66\x6a\x66\x95\x4b\x02\x08\x00\x97\x61\x39\
+\xce\x28\x89\x00\xcd\xed\x1d\xd7\x42\xa8\x9a\x19\x15\x08\x15\xae\
+\xfd\xc6\x2a\xe9\xab\x8c\xc3\xfc\x8d\xf7\xf6\x7b\xa0\x1a\xf2\xd7\
+\x35\x41\xd7\x86\x7e\x05\x7f\x9a\x21\x80\x00\x68\x26\xd4\x5f\x8e\
+\x6a\x6e\xcf\x4e\xf6\x93\xad\x69\x79\x4a\xc0\xdc\xbf\x58\xfa\x51\
+\x01\x25\x06\xeb\x11\x6a\xba\xe4\xe2\x4b\x3e\xc4\x26\x30\x4d\xfa\
+\x9a\xdf\x27\xf1\x7f\xc6\x53\xc9\x3f\xf5\x7c\xff\x67\xcd\xfc\x8d\
+\x40\x00\x01\x10\x21\x4a\x07\xd9\x68\x22\x40\x89\x0e\x11\x30\xe1\
+\x3b\x24\x06\xc4\xc0\x84\x49\xd4\xb7\x63\xd2\x37\x41\xc7\x10\xff\
+\x7c\x10\x99\xef\x9f\xe7\xd2\xcc\x5a\x04\x40\x33\xa1\x9e\x77\x14\
+\x11\x30\xcf\x45\x6b\x11\x03\xa2\x10\xa7\x28\xe1\xab\x0c\xa3\x38\
+\x24\xfd\xc7\xa1\x3b\x68\xbe\xff\x71\xa3\x7c\xeb\x8b\x00\x02\xc0\
+\x57\x3c\x8a\x58\x23\x11\xa0\x39\x40\x0d\x07\x16\x31\x20\x40\xa3\
+\x53\x31\xa0\x1e\xa5\x15\x3d\x23\xae\x11\x94\x00\xd6\xd7\x6b\xe2\
+\x98\xf0\x95\xf4\x35\xb4\xaf\x32\xc4\xaa\x5e\xa7\x77\x78\xa6\x73\
+\x5c\xe7\xba\xce\xf9\x1d\xd5\xb0\x6b\x25\x04\x10\x00\x95\x04\x72\
+\xaf\x1b\xba\x2f\x40\x73\x81\x56\x0f\x53\x02\x06\x61\xc1\x72\x71\
+\x03\xa1\x04\xc1\x82\x7d\xd8\x64\x27\x01\x25\x7c\x15\x25\x7c\x63\
+\x7e\xee\xe5\x93\xf4\x17\x81\xed\x87\xfc\x75\xae\x2f\xda\x7a\xc3\
+\x46\xec\x12\x8b\x00\x02\x20\x56\xbc\x0e\xb7\x76\xe8\x19\x20\x02\
+\xd6\x91\x9e\x8a\x81\x0f\x4b\x4c\xfd\xe8\x80\x12\xd5\xba\x6a\xd8\
+\xfa\x9a\x80\x18\xaa\x4c\x13\x3e\xbd\xfc\x6b\x4a\xcf\x3f\xd3\xeb\
+\x7f\xce\xa8\xc5\x2d\x10\x00\x2d\x46\xfd\x89\xcf\x12\x01\x56\x78\
+\x4a\xe0\x09\xa7\x07\x5f\xf7\x82\x40\x89\xca\xc4\xc0\xc7\x90\xbc\
+\x5e\x95\xc8\x1e\xec\xd3\xfc\x57\xe2\xa3\x62\xcc\x5e\x07\x66\x7d\
+\x0f\x5f\x1c\xe9\xe1\x6f\x3b\x3c\x34\xe4\xaf\x73\x39\x4f\xaf\x7f\
+\x9b\x8d\xec\x55\x8e\x00\x02\xa0\x1c\x7b\xf7\x2d\xdb\x85\x43\x73\
+\xdc\x8c\x06\xec\x8c\xd4\x90\xbc\xc6\x9f\x24\xd6\x08\xc1\x59\x14\
+\x28\xd9\xed\xac\x3e\xe4\xee\x4a\xf4\x2a\xf2\xff\x3a\xd9\x9b\x43\
+\x2f\x03\x33\x7b\xcb\xb2\x83\x40\x3f\xe4\xbf\x63\x7f\x76\xad\x9c\
+\x00\x02\xa0\xf2\x00\xef\x75\x4f\x22\xc0\x0a\xa3\x01\x7b\x41\x5e\
+\xed\x3f\x24\xb8\x7e\xa4\xc0\x92\xe0\x8d\x28\xb0\x75\xe1\x47\x0c\
+\x94\xe0\xc7\x22\x7f\x94\xe8\x55\xec\xfd\xb9\x67\x6f\x58\x48\xf6\
+\x06\x21\xe5\xa2\x5e\x7f\x89\x21\xff\x94\x3e\x50\x57\x1e\x02\x08\
+\x80\x3c\x9c\xc3\xb7\x62\x22\x80\xd1\x80\x83\xa3\x38\x15\x05\xd6\
+\xd4\xcd\x88\xc1\x90\x3c\xfb\xfb\x0b\x2c\x89\xf6\x02\x41\x09\xd6\
+\xb6\xcd\xbe\xa8\xdd\xb1\xc8\x16\x15\xd9\x37\x16\xfb\x7c\x4e\xf2\
+\x1a\xc2\x37\x03\xfb\x44\x3f\xf8\x68\x1f\x59\x0e\x22\xd0\xf7\xfa\
+\x19\xf2\x3f\x88\x6e\x65\xd5\x22\x00\x2a\x0b\xe8\x91\xee\x48\x04\
+\x58\x61\x34\xe0\x48\xc8\x77\xea\x56\xe2\x54\xb1\xaf\xfb\x51\x03\
+\xbd\x2a\xb1\xaa\x28\xd9\x4e\xcb\x98\x84\xaf\x5f\x6d\x9b\xb3\x78\
+\x98\x7b\x7f\xbd\xfd\xf5\x67\xdb\xa7\x1f\xa9\xd0\xab\xda\x1d\x8b\
+\x6c\x51\x91\x7d\x63\xb1\xcf\x2c\x19\x09\x94\xef\xf5\x67\x74\x96\
+\xa6\x92\x11\x40\x00\x24\x43\xd9\x4e\x45\x26\x02\x18\x0d\x70\x1c\
+\xee\x31\x09\x5f\xbf\x9a\xc9\x67\xf1\x30\xf7\xfe\x7a\xfb\xeb\xcf\
+\xb6\x0f\x8b\x4f\x02\xf4\xfa\x7d\xc6\xc5\xbd\x55\x08\x00\xf7\x21\
+\xf2\x69\xa0\x44\x80\xe6\x19\xd5\xf3\xf0\x69\x21\x56\x41\xa0\x6e\
+\x02\x3a\xf7\x74\x0e\xea\x5c\x2c\xed\x29\xed\xc7\x24\x80\x00\x88\
+\x19\x37\x17\x56\x6b\x9e\x91\x1f\x0f\x72\x11\x0a\x8c\x68\x8f\x00\
+\xbd\xfe\xf6\x62\x9e\xdc\x63\x04\x40\x72\xa4\xed\x55\xa8\x1e\x88\
+\x15\xee\x0d\x68\x2f\xf4\x78\x9c\x99\x80\x7a\xfd\x3a\xd7\xac\x68\
+\x1a\x2e\x73\xeb\xf7\x9a\x63\x7d\x54\x02\x08\x80\xa8\x91\x73\x68\
+\xf7\x70\x51\x7a\xd3\x45\xca\xa1\x79\x98\x04\x81\xb0\x04\x74\x4e\
+\x69\xb8\x7f\x18\x71\x0b\xeb\x07\x86\xfb\x22\x80\x00\xf0\x15\x8f\
+\xf0\xd6\x48\x04\x0c\x17\x29\x7e\x40\x28\x7c\x34\x71\xc0\x09\x01\
+\xd7\xc3\xfd\x4e\x18\x61\xc6\x06\x02\x08\x80\x0d\xd0\xd8\xe5\x39\
+\x01\x09\x01\x2b\x4c\x0b\x3c\x47\xc5\x16\x10\xb8\x47\xe0\x4d\xe7\
+\x90\x15\x86\xfb\xef\x11\x62\xfd\x2e\x02\x08\x80\x5d\xf8\xd8\xf9\
+\x19\x01\x5d\xbc\xac\x20\x04\x9e\x81\xe2\x7b\x08\x0c\x04\xc6\xe1\
+\x7e\x3b\x6f\x02\x24\xfe\xc1\x68\x5e\x42\x12\x40\x00\x84\x0c\x5b\
+\x3c\xa3\x87\x8b\x99\xa6\x05\x54\xe2\x39\x80\xc5\x10\x38\x98\xc0\
+\x98\xf8\x35\x85\xa6\x27\x6c\x0e\x6e\x8e\xea\x21\xd0\x21\x00\x38\
+\x08\xb2\x11\x90\x08\x50\xb1\x06\x11\x01\x06\x81\x05\x02\x13\x02\
+\x21\xe7\xf9\x27\xf6\xf3\x36\x20\x01\x04\x40\xc0\xa0\x45\x37\x59\
+\x22\xc0\x0a\xd3\x02\xd1\x03\x89\xfd\x29\x08\x30\xcf\x9f\x82\x22\
+\x75\x6c\x22\x80\x00\xd8\x84\x8d\x9d\x52\x10\x30\x11\xf0\x6a\x05\
+\x21\x90\x02\x26\x75\x44\x23\x50\x41\xe2\x8f\x86\x1c\x7b\xaf\x09\
+\x20\x00\xae\x89\xf0\x39\x3b\x01\x13\x01\x08\x81\xec\xd4\x69\xb0\
+\x10\x01\x12\x7f\x21\xf0\x34\x7b\x4b\x00\x01\x70\xcb\x84\x35\x85\
+\x08\x20\x04\x0a\x81\xa7\xd9\x1c\x04\xaa\x4b\xfc\x39\xa0\xd1\xc6\
+\xb1\x04\x10\x00\xc7\xf2\xa5\xf6\x0d\x04\x10\x02\x1b\xa0\xb1\x8b\
+\x57\x02\x24\x7e\xaf\x91\xc1\x2e\x9e\x02\xe0\x18\xf0\x4b\xe0\x4a\
+\x08\xf0\xe4\x80\xdf\x50\x61\xd9\x84\xc0\xf8\x38\x9f\x1d\xbf\x27\
+\x2b\x95\x3e\xcb\x3f\x71\x98\xb7\x61\x09\x30\x02\x10\x36\x74\xed\
+\x18\xae\x8b\xa8\x8a\x7e\x0b\xdd\xbc\x46\x08\x18\x04\x16\x7f\x04\
+\xc6\xc4\xcf\x73\xfc\xfe\x62\x83\x45\xf3\x04\x10\x00\xf3\x5c\x58\
+\xeb\x90\x80\x7e\x1c\x45\x42\xc0\x0a\x4f\x0e\x38\x8c\x4f\xab\x26\
+\xb5\x98\xf8\x5b\x8d\x75\x6d\x7e\x23\x00\x6a\x8b\x68\x23\xfe\x98\
+\x08\xe0\xc9\x81\x46\x62\xed\xd8\xcd\x7e\x7e\x9f\x1e\xbf\xe3\x08\
+\x61\xda\x43\x02\x08\x80\x87\x78\xf8\xd2\x3b\x81\xa9\x10\x50\x4f\
+\xcc\xbb\xbd\xd8\x17\x9b\x80\x8e\x31\x4d\x45\xd9\x71\xd7\xf0\xfc\
+\x7e\xec\x18\x62\xfd\x17\x01\x04\xc0\x17\x0b\xde\x05\x26\x60\x17\
+\xe4\x57\xf5\xc4\xec\x95\xe9\x81\xc0\x71\xf4\x68\xfa\x98\xf4\x95\
+\xf8\x75\x8c\x69\x2a\xca\xa3\x9d\xd8\x04\x81\xb5\x04\x10\x00\x6b\
+\x89\xb1\xbd\x7b\x02\x26\x02\xfa\xe9\x01\x5d\xb0\xcd\x58\x6e\x1a\
+\x34\x08\x2c\xeb\x09\x8c\x89\x7f\x4c\xfa\x24\xfe\x4f\x86\xfc\xad\
+\x87\x00\x02\xa0\x9e\x58\xe2\xc9\x15\x01\x5d\xb0\x11\x03\x57\x50\
+\xf8\xf8\x90\xc0\x98\xf4\xed\xb8\x39\x8d\x89\xff\xe1\x0e\x7c\x09\
+\x81\xc0\x04\x10\x00\x81\x83\x87\xe9\xcb\x09\x4c\xc5\x80\xed\xa5\
+\x51\x01\x15\x7b\xcb\xd2\x3a\x81\x31\xe9\x6b\xc4\x88\xa4\xff\xec\
+\x68\xe0\xfb\x9a\x08\x20\x00\x6a\x8a\x26\xbe\x2c\x22\x60\xbd\x3b\
+\x4d\x11\xa8\x8c\xf7\x0b\x20\x06\x16\x91\xab\x67\xa3\x31\xe9\xdb\
+\xb1\x70\xee\xe9\x4b\x24\xd6\xe3\x21\x9e\x40\xe0\x39\x01\x04\xc0\
+\x73\x46\x6c\x51\x31\x01\x4b\x00\x12\x02\x2a\x88\x81\x8a\xe3\x2c\
+\xd7\xe6\x92\xbe\xd6\x53\x96\x13\x60\xcb\xba\x08\x20\x00\xea\x8a\
+\x27\xde\xec\x20\x30\x27\x06\x94\x34\x76\x54\xc9\xae\x05\x09\x28\
+\x76\x2a\x1a\xda\xb7\xd8\x9e\x7b\xfa\x05\x4d\xa2\x69\x08\xb8\x22\
+\x80\x00\x70\x15\x0e\x8c\xf1\x42\xc0\x12\x86\x46\x05\xce\x8f\x16\
+\x2a\x89\x98\x6d\x6f\x4a\x28\xf6\xca\xe2\x90\x80\x62\xa3\xa2\x58\
+\x59\xfc\xfa\x84\xcf\x9c\x7e\xca\x40\x51\x57\x6d\x04\x10\x00\xb5\
+\x45\x14\x7f\x0e\x21\xa0\xf9\x61\x4b\x2a\x08\x82\x43\xe8\x6e\xab\
+\x54\xc9\x5e\x45\x09\x5f\x45\xc9\x5e\x45\xb1\xda\x56\x23\x7b\x41\
+\xa0\x2d\x02\x08\x80\xb6\xe2\x8d\xb7\x89\x08\x28\xc9\xcc\x09\x02\
+\xab\x9e\x1b\x0a\x0d\xc2\x11\x8b\x92\xbd\x8a\x92\xbd\x8a\x92\xbd\
+\x8a\x62\xa1\x72\x44\x9b\xd4\xf9\x45\x80\x77\xf5\x11\x40\x00\xd4\
+\x17\x53\x3c\x2a\x40\x40\x09\x48\x82\x60\x28\x27\x25\x28\x33\x43\
+\x62\x80\x69\x03\x03\xb1\x76\x51\xa2\x57\x11\x47\x15\xe3\x7a\x31\
+\xa4\x2f\xde\x6b\xeb\x64\x7b\x08\x40\xe0\x92\x00\x02\xe0\x92\x07\
+\x9f\x20\x90\x84\x80\x12\x94\x25\xad\x8b\xfb\x08\xec\xf3\x8d\x30\
+\x50\x92\x4b\xd2\x60\xd0\x4a\xe4\xbf\x8a\x99\xff\xa6\x44\xaf\x22\
+\x4e\xea\xd9\xab\x88\xa3\x8a\x7d\xcf\x52\x94\x00\x8d\xd7\x48\x00\
+\x01\x50\x63\x54\xf1\xc9\x2d\x01\x25\x33\x4b\x70\x67\x61\xa0\x24\
+\x67\x9f\x7b\x61\xa0\xe4\x67\x86\x57\x37\x6a\xa0\x04\xaf\x22\xdf\
+\xe4\xe3\x58\xe4\xb7\xfc\x57\xb1\xf7\xaf\x62\xa3\x62\xdb\xb1\x40\
+\x00\x02\x19\x08\x20\x00\x32\x40\xa6\x09\x08\x3c\x23\xa0\xc4\xa7\
+\xa2\x44\xa8\x32\x24\x45\xfd\x8f\x73\x37\xe2\xc0\xea\xea\xa7\x15\
+\x94\x54\xa7\xc5\xd6\x67\x5d\xae\xda\xee\x85\xcb\x98\xdc\xc7\x57\
+\xf3\xe5\x3c\x74\x6f\xef\xcf\x49\x5e\xbe\x66\x35\x96\xc6\x76\x11\
+\x60\xe7\x3a\x09\x20\x00\xea\x8c\x2b\x5e\x55\x44\x40\xc9\x52\x45\
+\x09\x74\x2c\x12\x08\xd7\xc5\xbe\xeb\x05\xc3\xf5\xeb\x98\x8c\xc7\
+\x57\x43\xd3\x27\xeb\xeb\xd7\xf1\xfb\x47\xaf\xd3\xba\xa7\xed\xdb\
+\xfa\x7e\x54\x43\x76\x4e\x8b\xb5\xc1\x02\x01\x08\x38\x25\x80\x00\
+\x70\x1a\x18\xcc\x82\x40\x2a\x02\xd3\x84\xac\xf7\x63\xb2\xbe\x7e\
+\xd5\x77\xcf\x4a\x2a\x9b\xa8\x27\x12\x01\x6c\xad\x95\x00\x02\xa0\
+\xd6\xc8\xe2\x17\x04\x20\x00\x01\x08\x40\xe0\x01\x01\x04\xc0\x03\
+\x38\x7c\x05\x01\x08\x40\xa0\x75\x02\xf8\x5f\x2f\x01\x04\x40\xbd\
+\xb1\xc5\x33\x08\x40\x00\x02\x10\x80\xc0\x5d\x02\x08\x80\xbb\x68\
+\xf8\x02\x02\x10\x80\x40\xeb\x04\xf0\xbf\x66\x02\x08\x80\x9a\xa3\
+\x8b\x6f\x10\x80\x00\x04\x20\x00\x81\x3b\x04\x10\x00\x77\xc0\xb0\
+\x1a\x02\x10\x80\x40\xeb\x04\xf0\xbf\x6e\x02\x08\x80\xba\xe3\x8b\
+\x77\x10\x80\x00\x04\x20\x00\x81\x59\x02\x08\x80\x59\x2c\xac\x84\
+\x00\x04\x20\xd0\x3a\x01\xfc\xaf\x9d\x00\x02\xa0\xf6\x08\xe3\x1f\
+\x04\x20\x00\x01\x08\x40\x60\x86\x00\x02\x60\x06\x0a\xab\x20\x00\
+\x01\x08\xb4\x4e\x00\xff\xeb\x27\x80\x00\xa8\x3f\xc6\x78\x08\x01\
+\x08\x40\x00\x02\x10\xb8\x21\x80\x00\xb8\x41\xc2\x0a\x08\x40\x00\
+\x02\xad\x13\xc0\xff\x16\x08\x20\x00\x5a\x88\x32\x3e\x42\x00\x02\
+\x10\x80\x00\x04\xae\x08\x20\x00\xae\x80\xf0\x11\x02\x10\x80\x40\
+\xeb\x04\xf0\xbf\x0d\x02\x08\x80\x36\xe2\x8c\x97\x10\x80\x00\x04\
+\x20\x00\x81\x0b\x02\x08\x80\x0b\x1c\x7c\x80\x00\x04\x20\xd0\x3a\
+\x01\xfc\x6f\x85\x00\x02\xa0\x95\x48\xe3\x27\x04\x20\x00\x01\x08\
+\x40\x60\x42\x00\x01\x30\x81\xc1\x5b\x08\x40\x00\x02\xad\x13\xc0\
+\xff\x76\x08\x20\x00\xda\x89\x35\x9e\x42\x00\x02\x10\x80\x00\x04\
+\xce\x04\x10\x00\x67\x14\xbc\x81\x00\x04\x20\xd0\x3a\x01\xfc\x6f\
+\x89\x00\x02\xa0\xa5\x68\xe3\x2b\x04\x20\x00\x01\x08\x40\x60\x20\
+\x80\x00\x18\x40\xf0\x02\x01\x08\x40\xa0\x75\x02\xf8\xdf\x16\x01\
+\x04\x40\x5b\xf1\xc6\x5b\x08\x40\x00\x02\x10\x80\x40\x4f\x00\x01\
+\xd0\x63\xe0\x0f\x04\x20\x00\x81\xd6\x09\xe0\x7f\x6b\x04\x10\x00\
+\xad\x45\x1c\x7f\x21\x00\x01\x08\x40\x00\x02\x46\x00\x01\x60\x10\
+\x58\x20\x00\x01\x08\xb4\x4e\x00\xff\xdb\x23\x80\x00\x68\x2f\xe6\
+\x78\x0c\x01\x08\x40\x00\x02\x10\xe8\x10\x00\x1c\x04\x10\x80\x00\
+\x04\x9a\x27\x00\x80\x16\x09\x20\x00\x5a\x8c\x3a\x3e\x43\x00\x02\
+\x10\x80\x40\xf3\x04\x10\x00\xcd\x1f\x02\x00\x80\x00\x04\x5a\x27\
+\x80\xff\x6d\x12\x40\x00\xb4\x19\x77\xbc\x86\x00\x04\x20\x00\x81\
+\xc6\x09\x20\x00\x1a\x3f\x00\x70\x1f\x02\x10\x68\x9d\x00\xfe\xb7\
+\x4a\x00\x01\xd0\x6a\xe4\xf1\x1b\x02\x10\x80\x00\x04\x9a\x26\x80\
+\x00\x68\x3a\xfc\x38\x0f\x01\x08\xb4\x4e\x00\xff\xdb\x25\x80\x00\
+\x68\x37\xf6\x78\x0e\x01\x08\x40\x00\x02\x0d\x13\x40\x00\x34\x1c\
+\x7c\x5c\x87\x00\x04\x5a\x27\x80\xff\x2d\x13\x40\x00\xb4\x1c\x7d\
+\x7c\x87\x00\x04\x20\x00\x81\x66\x09\x20\x00\x9a\x0d\x3d\x8e\x43\
+\x00\x02\xad\x13\xc0\xff\xb6\x09\xfc\x3f\x00\x00\x00\xff\xff\x98\
+\x53\x03\x37\x00\x00\x00\x06\x49\x44\x41\x54\x03\x00\x4e\x4a\x6c\
+\x4b\x98\xe2\xf0\xc5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x66\x4e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\xbd\xcf\xaf\x25\xc7\
+\x79\xdf\xdd\x3d\x23\x12\x94\x00\x12\xb1\x0c\x49\x81\x08\x8b\xaf\
+\xfd\x9a\x78\x63\xbd\x0b\x09\x08\x37\x52\x0c\x98\x5a\x78\x33\x09\
+\x05\xef\xb3\x64\x16\x31\x40\x60\xfe\x04\x8a\x7f\x02\x01\x02\xf1\
+\x22\x5c\x7a\x6f\x88\xc1\x6c\xbc\xa0\x0c\xc4\xd2\x86\x01\xe4\x8d\
+\x6c\x60\x0c\x05\x94\x41\xc1\x92\x60\xc5\x20\x01\x69\x40\x89\x73\
+\x52\x9f\x9a\x5b\x97\x7d\xcf\x3d\xe7\x74\xfd\x78\xaa\xba\xba\xfb\
+\x7b\x71\xeb\x9e\x3e\xdd\xf5\xf3\x53\x75\xfa\xf9\xd6\x53\xd5\xe7\
+\xde\x19\xf4\x23\x02\x22\x20\x02\x22\x20\x02\x22\xb0\x3b\x02\x12\
+\x00\xbb\xeb\x72\x35\x58\x04\x44\x40\x04\x44\x40\x04\x86\x41\x02\
+\x40\xa3\x40\x04\x44\x40\x04\x44\x40\x04\x76\x48\x40\x02\x60\x87\
+\x9d\xae\x26\x8b\x80\x08\x88\x80\x08\xec\x9b\x00\xad\x97\x00\x80\
+\x82\x82\x08\x88\x80\x08\x88\x80\x08\xec\x8c\x80\x04\xc0\xce\x3a\
+\x5c\xcd\x15\x01\x11\x10\x01\x11\xd8\x3b\x81\x27\xed\x97\x00\x78\
+\xc2\x41\x7f\x45\x40\x04\x44\x40\x04\x44\x60\x57\x04\x24\x00\x76\
+\xd5\xdd\x6a\xac\x08\x88\x80\x08\x88\xc0\xde\x09\x84\xf6\x4b\x00\
+\x04\x12\x7a\x15\x01\x11\x10\x01\x11\x10\x81\x1d\x11\x90\x00\xd8\
+\x51\x67\xab\xa9\x22\x20\x02\x22\x20\x02\x7b\x27\xf0\x69\xfb\x25\
+\x00\x3e\x65\xa1\x23\x11\x10\x01\x11\x10\x01\x11\xd8\x0d\x01\x09\
+\x80\xdd\x74\xb5\x1a\x2a\x02\x22\x20\x02\x22\xb0\x77\x02\xd3\xf6\
+\x4b\x00\x4c\x69\xe8\x58\x04\x44\x40\x04\x44\x40\x04\x76\x42\x40\
+\x02\x60\x27\x1d\xad\x66\x8a\x80\x08\x88\x80\x08\xec\x9d\xc0\xcd\
+\xf6\x4b\x00\xdc\xe4\xa1\x77\x22\x20\x02\x22\x20\x02\x22\xb0\x0b\
+\x02\x12\x00\xbb\xe8\x66\x35\x52\x04\x44\x40\x04\x44\x60\xef\x04\
+\x8e\xdb\x2f\x01\x70\x4c\x44\xef\x45\x40\x04\x44\x40\x04\x44\x60\
+\x07\x04\x24\x00\x76\xd0\xc9\x6a\xa2\x08\x88\x80\x08\x88\xc0\xde\
+\x09\xdc\x6e\xbf\x04\xc0\x6d\x26\x3a\x53\x99\xc0\x7f\xfa\xc1\xff\
+\x7e\x39\x84\x6f\xff\xed\xfb\xdf\x99\x86\x57\x7e\xf0\x93\x77\x4f\
+\x86\xef\xbf\x7f\x78\xe5\x52\x38\x4a\x37\xcd\x73\x7a\x1c\xca\xe5\
+\xb5\x72\x33\x95\xbd\x08\x88\x80\x08\x74\x4d\x40\x02\xa0\xeb\xee\
+\x59\x6f\xe5\x30\xb0\x04\x8c\xef\xb5\x41\xbf\x32\xe0\xe3\xe1\xce\
+\xbb\x21\x1c\xc6\xe1\xf5\x69\x18\x0e\x87\x97\x4f\x86\x39\x14\x47\
+\xe9\xa6\x79\x4e\x8f\x43\xb9\xbc\x5e\x0b\x0a\x27\x1e\xa8\x27\x81\
+\x3a\xcf\x15\xa5\xeb\x22\x20\x02\x22\xb0\x36\x02\xa7\xea\x2b\x01\
+\x70\x8a\x8a\xce\x45\x11\xc0\x58\x86\x70\x6d\xe4\x9d\x31\xc5\xb0\
+\x62\x60\x09\x18\xdf\x6b\x83\x1e\x95\xeb\x02\x91\x9c\x78\xa0\x9e\
+\x04\xea\x4c\xfd\x7d\x70\x6d\x41\x14\x84\x40\x5b\x17\xa8\x9d\x8a\
+\x14\x01\x11\x10\x81\x2a\x04\x24\x00\xaa\x60\xdd\x66\xa6\x18\xc0\
+\x6b\x43\xef\x66\xf3\x18\xcb\x10\xae\x8d\xbc\x33\xa6\x9b\x69\xbd\
+\x6b\x0b\xa2\x20\x04\xda\xea\x85\x81\x6b\xbb\x44\xc1\x66\x7a\x59\
+\x0d\x11\x81\x1d\x10\x38\xdd\x44\x09\x80\xd3\x5c\x74\xd6\x11\xc0\
+\xe0\x63\xe8\xbc\xd1\x77\x46\x0f\x03\x78\x6d\xe8\xdd\xf5\x3d\xff\
+\x1e\x8b\x02\x38\x11\xf6\xcc\x44\x6d\x17\x01\x11\x58\x17\x01\x09\
+\x80\x75\xf5\x57\xd5\xda\x62\xf0\x09\x53\x83\x8f\xa1\xf3\x46\xbf\
+\x6a\xc9\xeb\xcf\x1c\x4e\x84\x63\x0f\xc1\xfa\x5b\xa6\x16\x88\x80\
+\x08\xac\x9d\xc0\xb9\xfa\x4b\x00\x9c\x23\xb3\x83\xf3\x18\x7b\xc2\
+\xd4\xe0\x5f\xcf\xf2\x77\xd0\xfe\x9a\x4d\x44\x0c\x10\x24\x08\x6a\
+\x52\x56\xde\x22\x20\x02\x25\x04\x24\x00\x4a\xe8\xad\x30\xad\x0c\
+\xfe\x32\x9d\x86\x18\x20\x78\x41\x70\xb5\xb9\x70\x99\x9a\xa8\x54\
+\x11\x10\x81\x7d\x11\x38\xdf\x5a\x09\x80\xf3\x6c\x36\x73\x05\xa3\
+\x4f\x60\xa6\xaf\x19\x7e\x07\xdd\x7a\xb5\xb9\x10\x31\xc0\xbe\x01\
+\x42\x07\xb5\x52\x15\x44\x40\x04\x76\x46\x40\x02\x60\xc3\x1d\x3e\
+\x35\xfa\x32\xfc\x7d\x76\x34\x5e\x01\x42\x10\x03\xf4\x59\x9f\x35\
+\x55\xad\x44\x40\x04\xd6\x48\xe0\x52\x9d\x25\x00\x2e\xd1\x59\xe1\
+\x35\x0c\x08\x33\x7d\x0c\x8a\x8c\xfe\xba\x3a\x10\x21\x40\x9f\xd1\
+\x77\xf2\x0a\xac\xab\xef\x54\x5b\x11\x58\x23\x01\x09\x80\x35\xf6\
+\xda\x51\x9d\xaf\x8d\xbe\x5b\x5b\xc6\x80\x68\xd7\xfe\x11\xa0\x15\
+\xbe\x45\x0c\x04\x21\x20\x31\xb0\xc2\x0e\x54\x95\x45\xa0\x0b\x02\
+\x97\x2b\x21\x01\x70\x99\x4f\xd7\x57\x83\xe1\xbf\x36\xfa\x6e\x6d\
+\xb9\xeb\x0a\xab\x72\xc9\x04\x10\x02\x04\x89\x81\x64\x74\x4a\x20\
+\x02\x22\x30\x43\x40\x02\x60\x06\x50\x8f\x97\x6f\x19\xfe\x1e\x2b\
+\xa9\x3a\x99\x13\x40\x08\x10\xf0\x08\x10\xcc\x0b\x50\x86\x22\x20\
+\x02\x9b\x22\x30\xd7\x18\x09\x80\x39\x42\x1d\x5d\xe7\xa6\xcf\x4c\
+\xf0\x7a\xc6\xdf\x51\xdd\x54\x95\x76\x04\x10\x01\x04\xc6\x03\xa1\
+\x5d\xc9\x2a\x49\x04\x44\x60\x4b\x04\x24\x00\x56\xd0\x9b\xdc\xe4\
+\x31\xfc\xdc\xf4\x57\x50\x5d\x55\xb1\x11\x01\xc6\x03\x81\xf1\x41\
+\x68\x54\xac\x8a\x11\x01\x11\x58\x05\x81\xf9\x4a\x4a\x00\xcc\x33\
+\x5a\x2c\x06\x37\x75\x19\xfe\x0b\xf8\xc7\xe1\xe1\x10\xc2\x85\x68\
+\x5b\xbf\x84\x08\x20\x30\x56\x18\x33\x5b\x6f\xaf\xda\x27\x02\x22\
+\x60\x43\x40\x02\xc0\x86\xa3\x59\x2e\x61\x7d\x9f\x9b\x39\x37\x75\
+\xb3\x8c\x7b\xcc\x28\x18\xef\xbb\xc3\x83\x61\x12\x0e\x4f\x0f\x6f\
+\xde\x0a\x9f\x3d\xbc\x76\x38\x0e\xcf\x1c\xde\x3c\x84\x70\x7c\x8d\
+\xf7\x47\xf9\x4c\xcb\xb8\x3e\xa6\x0e\x3d\xb2\xc9\xac\x13\x63\x86\
+\xb1\x23\x21\x90\x09\x50\xc9\x44\x60\x23\x04\x62\x9a\x21\x01\x10\
+\x43\xa9\x41\x9c\x60\xf8\x37\xb9\xbe\x8f\x91\x25\x38\x23\x7f\x6d\
+\xd8\x31\xd0\xc1\x78\x3f\x7d\x78\x70\x98\x84\xe1\xee\xe1\xe1\xad\
+\x90\xd3\x07\x47\xf9\x4c\xcb\xb8\x3e\xa6\x0e\xd4\x85\xe0\x04\xc3\
+\xb5\x30\x70\x75\xf5\xde\x85\x9c\x72\x3b\x48\x23\x21\xd0\x41\x27\
+\xa8\x0a\x22\xd0\x39\x01\x09\x80\x0e\x3a\x88\x2f\xee\x59\xbd\xe1\
+\xc7\xc0\x13\x9c\xe1\xbc\x61\xe4\x31\xac\x18\x59\x82\x33\xf2\xd7\
+\x86\xbd\x03\xee\xb7\xaa\xe0\x04\xc3\xb5\x30\x70\x75\xf5\xde\x05\
+\xea\x4f\x98\x8a\x03\xda\x79\x2b\x71\x9f\x27\x24\x04\xfa\xec\x17\
+\xd5\x4a\x04\xea\x12\x88\xcb\x5d\x02\x20\x8e\x53\x95\x58\x7e\xd6\
+\xff\xfd\xf7\x0f\xab\xfd\xe2\x1e\x67\x08\xaf\x8d\x3d\x06\x9e\xe0\
+\x0c\x67\xd7\x46\x3e\xb7\x27\xa7\xe2\x80\x76\x4e\x45\x81\xe3\x90\
+\x9b\x6d\xab\x74\x08\x01\x2d\x0b\xb4\xa2\xad\x72\x44\x60\x1d\x04\
+\x24\x00\x16\xe8\x27\x6f\xf8\xc3\xb7\xf6\x2d\x50\x7e\x76\x91\xce\
+\xd0\x5d\x1b\x7c\x0c\xa0\x33\x84\x9b\x34\xf6\xb1\x80\x82\x28\x70\
+\x1c\xd8\x9f\x70\xbd\x7c\xe0\x38\xc5\x66\xd1\x32\x1e\x22\x40\xfb\
+\x03\x5a\x12\x57\x59\x22\xb0\x0c\x81\xd8\x52\x25\x00\x62\x49\x19\
+\xc5\x63\x16\xb6\x1a\x77\xbf\x33\x64\x32\xf8\xf1\x1d\x7f\xbd\x7c\
+\xd0\xb9\x20\x90\x10\x88\xef\x53\xc5\x14\x81\x2d\x13\x90\x00\x68\
+\xd4\xbb\x7e\xd6\xef\xdc\xfd\xdc\x7c\x1b\x15\x99\x57\x4c\x30\xfa\
+\x9a\xe1\xe7\xf1\x9b\xa4\x3a\x2b\x08\x26\x71\x96\x3c\x64\x2c\x22\
+\x48\x97\xac\x83\xca\x16\x01\x11\xb0\x26\x10\x9f\x9f\x04\x40\x3c\
+\xab\xac\x98\xde\xf0\xf7\xee\xee\x3f\x65\xf4\xb3\x5a\xab\x44\x97\
+\x08\x5c\x0b\x02\x27\xae\xfc\x72\x81\xe3\x7e\x29\x7e\x8b\x6b\x88\
+\x00\x2d\x0b\xb4\x20\xad\x32\x44\xa0\x3f\x02\x12\x00\x15\xfb\x84\
+\xd9\x55\xb7\xee\x7e\x67\x7c\xbc\x7b\xdf\x19\x23\x76\xbb\xfb\xb5\
+\xfc\x8a\x2c\x94\xf5\x4d\x02\x5e\x0c\xb0\x54\x10\x9e\x2e\xb8\x79\
+\xb9\xf9\x3b\x09\x81\xe6\xc8\x55\xa0\x08\x54\x21\x90\x92\xa9\x04\
+\x40\x0a\xad\xc8\xb8\x61\xd6\xcf\x4d\x35\x32\x49\x9b\x68\xc1\xe8\
+\x3b\xa3\x23\xa3\xdf\x06\xf9\x6c\x29\x61\x23\xa1\x13\x62\xde\x2b\
+\x70\x77\x78\x30\x9b\xa6\x62\x04\xc6\x2c\xc2\xb5\x62\x11\xca\x5a\
+\x04\x44\xa0\x13\x02\x12\x00\xc6\x1d\xd1\xe5\x33\xfd\xc1\xf0\xbb\
+\x19\xa7\x9f\xe9\x3b\xa3\x63\xdc\x6c\x65\x67\x40\xc0\x7b\x05\x9e\
+\x3e\x3c\xb8\xf1\x44\x81\x41\xbe\xa9\x59\x20\x02\xb4\x2c\x90\x4a\
+\x4d\xf1\x45\xa0\x07\x02\x69\x75\x90\x00\x48\xe3\x75\x36\x76\x98\
+\xf5\x77\xf3\x4c\x7f\x30\xfa\x6e\x66\xa9\xd9\xfe\xd9\x6e\xeb\xf6\
+\xc2\x01\x21\x40\x70\xfd\xe7\x3d\x03\x0b\xd4\x14\x21\x20\x6f\xc0\
+\x02\xe0\x55\xa4\x08\x34\x22\x20\x01\x60\x00\x9a\x9b\x64\x37\x6b\
+\xfd\xc1\xf0\x87\xd9\xbe\x41\xfb\x94\xc5\xb2\x04\xbc\x18\x58\x48\
+\x08\x20\x02\xf0\x6a\x21\x70\x97\xa5\xa0\xd2\x45\x40\x04\xe6\x08\
+\xa4\x5e\x97\x00\x48\x25\x76\x14\x9f\x9b\x23\x37\xc9\xa3\xd3\xed\
+\xdf\xca\xf0\xb7\x67\xde\xb8\xc4\xc5\x84\xc0\xe1\xf0\x32\x02\x17\
+\xa1\xdb\xb8\xc9\x2a\x4e\x04\x44\xa0\x22\x01\x09\x80\x4c\xb8\xcc\
+\x88\x30\xfe\x8b\xbb\xfc\x65\xf8\x33\x7b\x70\xbd\xc9\x96\x12\x02\
+\x08\x5d\x89\x80\xf5\x8e\x1b\xd5\x7c\xeb\x04\xd2\xdb\x27\x01\x90\
+\xce\x6c\xe0\x26\xc8\x8c\x68\x51\xe3\x2f\xc3\x9f\xd1\x73\xdb\x4a\
+\xb2\x84\x10\x40\x04\x20\x7c\x11\xc0\xdb\xa2\xa9\xd6\x88\xc0\xfe\
+\x08\x48\x00\x24\xf6\x39\x37\x3f\x6e\x82\x89\xc9\xec\xa2\xcb\xf0\
+\xdb\xb1\xdc\x48\x4e\xcd\x85\x80\x96\x04\x36\x32\x72\xd4\x8c\x2d\
+\x11\xc8\x69\x8b\x04\x40\x24\x35\x66\x3c\x18\xff\xc5\x66\xfd\x32\
+\xfc\x91\x3d\xb5\xdf\x68\xad\x85\x00\x42\x18\x6f\xd8\x7e\x89\xab\
+\xe5\x22\xb0\x6e\x02\x12\x00\x11\xfd\xc7\x4d\x6e\x31\x97\xbf\x0c\
+\x7f\x44\x0f\x29\xca\x94\x40\x4b\x21\x80\x08\x40\x18\x23\x90\xa7\
+\x75\xd0\xb1\x08\x88\x40\x4b\x02\x79\x65\x49\x00\xcc\x70\xe3\xe6\
+\xc6\x4d\x6e\x26\x5a\x9d\xcb\x77\x87\x07\x7a\x86\xbf\x0e\xda\x3d\
+\xe4\xea\x85\xc0\xd3\xc3\x9b\xd5\xbf\x47\x40\x4b\x02\x7b\x18\x4e\
+\x6a\xe3\x06\x09\x48\x00\x5c\xe8\x54\x8c\xff\x22\x2e\xff\x30\xeb\
+\x7f\xfa\xb0\xe8\xd7\xc2\x5e\x40\xb3\x8b\x4b\x7f\xf6\x85\x67\x5f\
+\x24\xbc\xfe\x07\x5f\xba\xf7\xf6\x57\x9f\xbf\x1f\xc2\x3b\x5f\x7f\
+\xe1\xad\xe3\xc0\x35\xe2\x85\x40\xba\x2e\x20\xdd\x3d\x3c\x44\x08\
+\x54\x17\x01\xae\xb1\x08\x65\xbc\x65\xee\x50\xbf\x22\x20\x02\x0d\
+\x09\xe4\x16\x25\x01\x70\x86\xdc\x22\xc6\x3f\x18\x7e\x7d\x89\xcf\
+\x99\x5e\xa9\x7f\x1a\xc3\x8d\x31\x27\xbc\xfa\xfc\xe7\xef\x13\x5e\
+\x7a\xee\x99\x7b\x5f\x7c\xfa\x33\x2f\x86\x70\xaa\x16\x5c\x23\x5e\
+\x08\xa4\x43\x24\x04\x41\x70\x2a\x4d\xcb\x73\x88\x80\xeb\xaf\x18\
+\xae\x58\xb0\x44\x40\x45\xb8\xca\x5a\x04\x8c\x09\x48\x00\x1c\x01\
+\x65\x2d\x93\xef\x41\x6f\x3e\xf3\x5f\x81\xbb\xff\x8f\x7f\xe7\x73\
+\x5f\x9e\x86\xff\xf2\xfc\xe7\x5f\x9a\x86\xe9\xb5\x23\xac\xdd\xbf\
+\x0d\x86\x1f\xc3\x8d\x31\x27\x58\x54\x3a\x08\x02\xc4\x00\xa2\x02\
+\x41\x60\x91\x6f\x6e\x1e\x08\x01\xef\x0d\x70\x62\x33\x37\x8f\xb9\
+\x74\x12\x01\x73\x84\x74\x5d\x04\x2c\x09\xe4\xe7\x25\x01\x30\x61\
+\x87\xf1\xf7\x9b\xfd\x26\xe7\xaa\x1f\xba\x1b\xf1\xc1\xad\xd3\xfa\
+\x1b\x73\xf5\xc2\xe2\x0a\x08\x86\x1c\xe3\xfe\xc6\x1f\x7e\xe9\xdb\
+\x84\xff\xf6\x47\x5f\xfe\xaf\xff\xf9\xdf\xfe\x9b\x6f\x4f\xc3\xbf\
+\x7f\xee\x99\x97\xa6\x61\x7a\x8d\xf8\xa4\x23\x0f\xf2\x8b\x2b\xb9\
+\x7d\xac\x63\xc3\x5f\xb3\x06\x88\x0a\x04\x01\x62\x60\x49\x21\xc0\
+\x58\x7b\xb2\xb7\xa4\xde\x7f\x1e\x94\x08\xa8\x39\x92\x94\xb7\x08\
+\xd8\x10\x90\x00\xb8\xe2\xb8\x84\xf1\xf7\x86\xbf\x03\x77\x3f\x06\
+\x9a\x80\xc1\x26\x04\x43\x8e\x71\xff\xe2\x53\x77\xbf\x4c\xb8\xc2\
+\x94\xf4\x42\x3a\xf2\x20\x3f\x04\x01\x62\x20\x29\x83\xca\x91\x99\
+\x91\x87\x19\x7f\xe5\xa2\x6e\x65\xdf\x8d\x10\xa8\xf8\x3f\x06\x10\
+\x01\x7e\x29\xed\x56\xeb\x75\x42\x04\x44\xc0\x8a\x40\x49\x3e\x12\
+\x00\x8e\x1e\x1b\x97\x9a\xce\xfc\xaf\x66\xfd\xc3\xdd\xc3\x43\x57\
+\xfc\x22\xbf\xa7\x0c\x3e\x06\x9b\x50\xab\x42\x88\x81\x5e\x84\x00\
+\xc6\x9f\x19\x79\xad\xb6\xc6\xe6\xdb\x8b\x10\xf0\xcb\x02\xb1\x95\
+\x4e\x89\x77\x38\xbc\x2c\x11\x90\x02\x4c\x71\x45\xa0\x1d\x81\xdd\
+\x0b\x00\x8c\x3f\x33\x95\x66\xc8\x17\x5c\xeb\x3f\x36\xfa\x18\x7b\
+\x42\xb3\xb6\x5f\x15\x34\x15\x02\xd4\xe9\xea\x74\xb3\x97\x5e\x8c\
+\xff\xb4\xc1\x4b\x0b\x01\xbf\x2c\xe0\x96\xa2\x06\x27\x4e\xa7\xf5\
+\x32\x39\x46\x04\x7c\xff\xfd\x03\x5e\x36\x93\xfc\x94\x89\x08\x88\
+\xc0\x15\x81\xb2\x97\x5d\x0b\x80\xd6\xc6\xdf\xbb\xfc\x17\x78\xb4\
+\x0f\x23\x1b\x5c\xfb\x18\x7c\x42\xd9\xb0\xb1\x49\x8d\x10\x60\x79\
+\xa0\xe5\xd2\x40\x8f\xc6\x7f\x4a\x13\x21\xb0\xd8\xfe\x00\xe7\x91\
+\xaa\xb9\x37\x00\x2f\x9b\x44\xc0\xb4\xb7\x75\x2c\x02\xcb\x12\xd8\
+\xad\x00\x68\x6a\xfc\xdd\xac\xea\xc9\x23\x58\xed\x5c\xfe\x18\x7d\
+\x0c\x2b\x2e\x77\x8c\x6c\x2f\x46\xff\xd4\x70\x47\x08\x50\xd7\x53\
+\xd7\x2c\xcf\x61\x58\x7b\x70\xfb\xcf\xb5\x09\x11\x80\x50\x61\x83\
+\xe2\x5c\xdc\x1a\xd7\xf1\x06\xd4\x5a\x12\x40\x04\xf0\xd9\xab\x51\
+\x6f\xe5\x29\x02\x7b\x23\x50\xda\xde\x5d\x0a\x00\xd6\x24\x9b\xb9\
+\xfd\x83\xcb\xbf\xb4\xa7\x22\xd3\x63\xf8\xc3\x6c\x1f\xc3\x1a\x99\
+\x6c\xf1\x68\xd4\x15\xb1\x52\x53\x08\x60\x58\x17\x6f\x68\x64\x05\
+\x10\x2a\x6c\x50\x44\xb4\x44\x26\x31\x8d\x86\x08\xc0\x63\x55\x63\
+\x49\x80\xcf\x9e\x44\x80\x69\x77\x29\x33\x11\xc8\x22\xb0\x3b\x01\
+\xe0\x6f\x3c\x6e\x4d\x32\x8b\x56\x62\x22\x6e\xa0\xdc\x48\x13\x93\
+\x65\x47\xc7\x78\xf6\x3e\xdb\x9f\x6b\x1c\x42\x80\x76\xcc\xc5\x4b\
+\xbd\xbe\x94\x21\x4d\xad\xe7\x71\x7c\x44\xcb\x62\x75\xaf\xb8\x24\
+\x80\x08\xd0\x72\xc0\x71\x6f\xeb\xbd\x08\xa4\x10\x28\x8f\xbb\x2b\
+\x01\x80\xf1\xe7\xc6\x53\x8e\x6d\x26\x87\xc6\x2e\x7f\x0c\x26\xb3\
+\x67\x8c\xe7\x4c\xcd\x56\x71\x99\x76\xd0\x26\xcb\xca\x7e\xe5\x99\
+\xcf\xbc\x68\x99\x5f\xcb\xbc\x16\x15\x01\xae\xa1\x5e\xc4\x3a\x4f\
+\x96\x3b\x34\xfd\x65\x39\x40\x22\xc0\x14\xa9\x32\x13\x81\x24\x02\
+\xbb\x11\x00\xcd\x8c\xbf\xbb\x51\xfa\x8d\x54\x49\xdd\x90\x17\x39\
+\xb8\xfb\x31\x98\x79\x39\xf4\x9b\x8a\x36\xd1\x3e\xab\x1a\xe2\x52\
+\xb7\xca\x6b\x89\x7c\x7a\x10\x01\x78\xb4\xac\x97\x04\x24\x02\x96\
+\x18\x4d\x2a\x73\x0b\x04\x2c\xda\xb0\x0b\x01\xd0\xd4\xf8\x37\xd8\
+\xe5\x8f\x61\x0c\xeb\xfc\x3d\x6f\xee\x2b\x1d\xa0\x2c\x67\xd0\xd6\
+\xd2\x7c\x96\xda\x4c\x57\x5a\xef\xe3\xf4\x4b\x8b\x00\xbe\xb7\xc2\
+\x8b\x5b\x27\x72\x8f\xeb\x56\xf2\x1e\x11\x50\x92\x5e\x69\x45\x40\
+\x04\xf2\x08\x6c\x5e\x00\xb4\x32\xfe\xcc\x8e\xbc\xab\x34\xaf\x1f\
+\xa2\x53\xe1\x1a\xc7\x30\x6e\xd9\xf0\x4f\x61\xfc\xe9\xef\x3e\xfb\
+\xd2\xf4\xfd\xde\x8f\x17\x17\x01\xae\x03\xfc\x38\x37\x16\x01\x6c\
+\xcc\x75\x59\xeb\x57\x04\x44\x20\x8a\x80\x4d\xa4\x4d\x0b\x80\x96\
+\xc6\x9f\xd9\x91\x4d\x97\x9c\xce\x05\xc3\xbf\xa5\x75\xfe\xd3\xad\
+\xbc\x7d\x16\xa1\x43\xdb\x6f\x5f\xd9\xef\x99\x4d\x8a\x80\x83\xbe\
+\x31\x70\xbf\x23\x5a\x2d\x5f\x8a\xc0\x66\x05\x00\x9b\x8b\xaa\x6f\
+\xf8\x63\xb3\x1f\xdf\x9e\x76\xb7\xde\xf3\xfd\xb8\xc0\x71\xf7\xb3\
+\x26\xbe\xd4\x20\x59\xba\xdc\x3d\xb7\xfd\x1c\x7b\x44\xc0\xd2\x4b\
+\x1b\xe6\x9e\x00\x89\x80\x73\xdd\xad\xf3\x22\x70\x83\x80\xd5\x9b\
+\x4d\x0a\x00\x8c\x7f\xf5\x75\x45\x8c\x7f\xe5\x7f\xe4\x83\xf1\xdf\
+\x93\xbb\xff\xd2\xa0\x96\x17\xe0\x36\x9d\x57\xbe\xf0\xdc\xbd\xdb\
+\x67\xdb\x9e\xa9\x21\x02\xf0\xdc\xb5\x6d\x85\x4a\x13\x81\x7d\x12\
+\xd8\xa4\x00\x68\x66\xfc\x2b\x8e\x19\x0c\x1e\xc6\xbf\x62\x11\xab\
+\xca\x1a\x2f\x00\x82\x28\xa7\xd2\x7f\xf5\x8b\x8f\x1e\xfe\xfc\xe3\
+\xdf\x2e\xf6\x8f\x97\x72\xea\x1c\x93\x86\x27\x1b\x96\xf6\x02\x50\
+\x4f\x6b\x11\x80\xe7\x4e\x22\x00\xb2\x0a\x22\x70\x8a\x80\xdd\xb9\
+\xcd\x09\x80\xea\x9b\x89\xee\x0e\x0f\xfc\x4e\x68\xbb\x3e\xb8\x91\
+\x13\x46\x6e\xef\x2e\xff\x1b\x40\xf4\xe6\x22\x81\x1e\xbc\x00\x54\
+\x10\x11\xc0\x46\x58\x8e\x2d\x82\x44\x80\x05\x45\xe5\x21\x02\x97\
+\x09\x6c\x4a\x00\x78\xe3\xef\xd6\x11\x2f\x37\xb9\xe0\x2a\xc6\xbf\
+\xe2\x63\x7e\x61\xd6\xcf\xc6\xb7\x82\x5a\x6e\x36\x69\xc9\x13\x01\
+\xef\xfc\xe2\xc3\x07\x5b\x04\x83\x17\xa0\x9b\x76\xdd\x3d\x3c\x94\
+\x08\xe8\xa6\x37\x54\x91\x8d\x12\xb0\x6c\xd6\x66\x04\x80\x77\x19\
+\xae\xd8\xf8\x6b\xd6\x3f\x3f\xac\x4b\x84\xd1\x56\x97\x01\xa0\xd6\
+\xc3\x32\x00\xf5\xf0\x01\x11\xf0\xd9\xc3\x6b\x56\x5f\x18\x84\x27\
+\x80\x3d\x3d\x3e\x6f\xfd\x11\x01\x11\x30\x25\xb0\x09\x01\x80\xf1\
+\xe7\x46\x61\x4a\x66\x9a\x59\xc5\x99\x7f\x70\xf9\x97\x18\xb7\x69\
+\x55\xb7\x7e\x0c\xaf\xdc\x36\x6e\xd5\x0b\x90\xcb\xa3\x66\x3a\xbf\
+\x4c\x36\x0e\x26\xfb\x2e\xc6\xe1\xee\xeb\x83\x7e\x44\x40\x04\x86\
+\x61\xb0\x85\xb0\x7a\x01\xc0\xec\x60\xad\xc6\x5f\x2e\xff\xf4\xc1\
+\x5c\xb2\x0c\x80\x17\xe0\xbd\x0f\x1f\x6d\x72\x29\x20\x9d\x64\xfd\
+\x14\x66\x22\xc0\x79\xf6\xfc\xf2\x5e\xfd\x2a\xab\x04\x11\xd8\x15\
+\x81\xd5\x0b\x80\xb1\xe6\xec\xa0\xe2\xcc\x1f\xe3\xcf\xce\xf6\x41\
+\x3f\x4d\x09\xbc\xf1\xe3\x9f\x3d\xd8\xda\x13\x01\x5f\x7b\xf6\x73\
+\xdd\xfe\xa3\xa3\xc3\x53\x83\x8d\xe0\x72\x22\x00\x4f\x5f\xd3\xc1\
+\xa2\xc2\x44\xa0\x33\x02\xd6\xd5\x59\xb5\x00\xf0\x37\x04\x77\x63\
+\xb0\x86\xe2\xf3\x93\xf1\xf7\x18\x7a\xfb\x63\xb1\x54\xf2\xea\x8f\
+\x3e\x78\x73\x4b\x22\xe0\xef\x3e\xfa\x95\x89\xab\xbd\x4a\x5f\xb3\
+\x27\x80\x2f\xcb\x32\xc8\x1c\x4f\x1f\x1e\x3f\x83\xac\x94\x85\x08\
+\x88\x80\x23\xb0\x5a\x01\x80\xf1\xe7\x86\xe0\xda\x60\xff\xeb\xd6\
+\x2e\x79\xac\xc9\x3e\xe3\x61\xd0\x66\xbf\x1a\x54\xd3\xf3\xdc\x92\
+\x08\x60\x69\x23\x9d\x40\xc3\x14\x86\x22\x60\xac\xe9\xf1\x1b\xf4\
+\x23\x02\x3d\x13\xb0\xaf\xdb\x2a\x05\x00\xb3\x80\xaa\xc6\x9f\x6f\
+\xf8\xb3\x67\xed\x8d\xbf\xc5\x0c\xb6\x42\xd5\x76\x99\x25\x22\x60\
+\xed\x7b\x02\x56\x53\x7f\x27\x02\x06\xe7\x55\x2b\x1e\x68\xce\xe3\
+\xa7\xfd\x00\xc5\x14\x95\x81\x08\x78\x02\xab\x14\x00\x63\xad\x59\
+\x00\x33\xff\x0a\xc6\x9f\x9d\xeb\xcc\xfc\x65\xfc\x07\x93\x1f\x78\
+\x9a\x64\xe4\x32\x61\x4f\xc0\x6a\x8c\xa8\xab\xef\xf1\x2f\xf5\x3f\
+\x3e\xd7\xeb\x7b\xef\x55\x33\x12\x01\x78\x00\x7b\x6d\xa7\xea\x25\
+\x02\x35\x08\xd4\xc8\x73\x75\x02\xc0\x7f\xf0\xdd\x2c\xa0\x06\x0c\
+\xb3\x0d\x4b\x93\xca\x61\xac\xf8\x4a\x5f\x19\xff\x09\x94\xc2\xc3\
+\xff\xf9\x7f\x7e\xf5\xd3\xc2\x2c\x6e\x24\xc7\x88\xbe\xfd\xc1\x2f\
+\xdf\x5c\x9b\x10\x58\x5b\x7d\x81\x6e\x25\x02\xf0\x00\xe2\x09\x24\
+\x4f\x05\x11\x10\x81\x3c\x02\xab\x12\x00\x18\x7f\x3e\xf8\x79\x4d\
+\xbd\x9c\xca\x7f\x83\x19\x6e\xca\xcb\xd1\x92\xae\x06\xe3\x9f\x94\
+\x48\x91\x17\x21\xc0\x3a\x3a\x42\x60\x2d\x46\x95\x7a\x52\xdf\x45\
+\x60\x15\x16\x6a\x25\x02\xc6\x5a\x9e\xc0\x41\x3f\x22\xd0\x1b\x81\
+\x3a\xf5\x59\x8d\x00\x40\xed\xaf\xc9\xf8\xf3\x98\x1f\x33\xff\x3a\
+\xdd\xb6\xdf\x5c\x7f\xfe\x9b\x4f\x4c\x67\xff\xc7\x24\x31\xaa\xaf\
+\xfc\xf0\xfd\xd7\x30\xb0\xbd\x3e\x29\x40\xdd\xa8\xe7\x71\xdd\xd7\
+\xf4\xde\x44\x04\x38\x4f\xa0\xf6\x03\xac\xa9\xd7\x55\xd7\xde\x08\
+\xac\x46\x00\x8c\xb5\xd4\x3e\x6b\x92\x15\x66\xfe\x7a\xc6\x7f\x58\
+\xf5\x0f\x06\x96\x4d\x82\x29\x62\x00\xc1\x40\xc0\x40\x87\xc0\xd2\
+\x42\x08\xe1\x1c\xaf\xc4\x23\xa4\x40\x22\x3e\x79\x51\xb7\x94\x74\
+\xbd\xc6\xf5\x22\x60\x2c\xfc\xb6\xab\x65\xba\x37\x00\x00\x10\x00\
+\x49\x44\x41\x54\x40\x27\x02\xf0\x0c\xf6\xda\x46\xd5\x4b\x04\x2c\
+\x08\xd4\xca\x63\x15\x02\xc0\x7f\xc0\xdd\x07\xdd\x1c\x82\x33\xfe\
+\xfe\x26\x64\x98\xb1\xdc\xfe\x86\x30\x4f\x64\xf5\x4f\xbf\xfe\x4d\
+\x55\x0f\xc0\x89\x22\x07\x0c\x6e\x10\x03\x08\x02\x8c\xf0\x34\x70\
+\x8e\x40\x1c\x02\xf1\x43\x60\x69\x21\x84\x70\x8e\x57\xe2\x11\x48\
+\x47\x5e\x88\x82\x10\x30\xf4\xd3\xc0\x79\xe2\x10\x9f\xbc\x4e\xd5\
+\x71\xad\xe7\xfc\xb7\x05\x16\x56\x1e\xcf\x20\x1e\xc2\xc2\x6c\x94\
+\x5c\x04\x76\x47\xa0\x7b\x01\xc0\x07\x9b\x0f\xb8\x79\xcf\x54\x30\
+\xfe\xd4\x51\x6e\x7f\x28\x6c\x3b\x60\x84\xa7\xa1\xb4\xb5\xe4\x85\
+\x28\x08\x01\x43\x3f\x0d\x9c\x27\x4e\x69\x39\xbd\xa6\xf7\xfb\x6f\
+\x0a\x2b\x37\xd6\xf2\x10\x0e\xfa\x11\x81\xa5\x09\xd4\x2b\xbf\x7b\
+\x01\x70\xe7\xf1\x9d\x97\x6b\x34\xdf\x7a\xe6\x4f\x1d\x79\xd4\x8f\
+\x57\x85\x7a\x04\xfe\xfb\x07\xbf\x7c\xaf\x5e\xee\xca\x79\x11\x02\
+\x2c\xc1\x39\x41\x5e\x54\xb6\xf3\x10\x32\x59\x28\xca\x43\x89\x45\
+\x60\x67\x04\xee\xf4\xdc\x5e\x5c\xff\xb5\x66\xff\xd6\xed\xc6\xf8\
+\xeb\x51\x3f\x6b\xaa\x37\xf3\xab\xbd\x01\xf0\x66\x69\x7a\xd7\x92\
+\x80\x17\xe4\x85\xfb\x01\xc6\xc3\x9d\x77\x5b\xd6\x59\x65\x89\x40\
+\x0b\x02\x35\xcb\xe8\x5a\x00\xd4\x32\xfe\xfe\x66\x63\x48\x95\x1d\
+\xff\x32\xfe\x86\x40\xcf\x64\xb5\xc4\xfa\xff\x99\xaa\xe8\x74\x05\
+\x02\x16\xfb\x01\x98\x34\x54\xa8\x9a\xb2\x14\x81\x4d\x12\xe8\x56\
+\x00\x54\xf9\x20\x3b\x37\x63\x0d\xe3\xaf\x1d\xff\x6d\x3e\x1b\xff\
+\xf0\xab\x47\xcd\x37\x00\xb6\x69\x99\x4a\x09\x04\x4a\xf7\x03\x30\
+\x69\xd0\x52\x40\xa0\xa9\xd7\xf5\x13\xa8\xdb\x82\x2e\x05\x00\xc6\
+\x9f\x0f\xb2\x75\xd3\x65\xfc\xad\x89\xb6\xcb\xef\x7f\x7d\xf8\xe8\
+\x3d\xeb\x6f\x00\x6c\x57\x7b\x95\x14\x4d\xc0\x60\x3f\xc0\xa8\x0d\
+\x81\x83\x7e\x44\x20\x86\x40\x97\x02\xe0\x70\x67\xfc\x93\x98\xca\
+\x27\xc5\x71\xb3\xff\xa4\xf8\x33\x91\x71\xfb\x6b\xe6\x3f\x03\x49\
+\x97\x45\x20\x83\x80\x17\xea\x25\xfb\x01\x0e\x87\x97\x99\x44\x64\
+\x14\xad\x24\x22\xd0\x15\x81\xda\x95\xe9\x4e\x00\xf8\x0f\xae\xfb\
+\x00\x9b\x36\xdc\x19\x7f\x7f\x53\x31\xca\x94\x67\xfd\x65\xfc\x8d\
+\x60\x46\x64\xc3\xec\x5f\xbb\xff\x23\x40\x6d\x28\x4a\xe9\x7e\x80\
+\x1a\x1e\xc4\x0d\xe1\x55\x53\x44\xc0\x13\xe8\x4e\x00\x98\x7f\x70\
+\xdd\x4c\xc2\xd2\xf8\x43\xed\x4f\x7f\xf7\xd9\x97\x78\x55\x68\x43\
+\x40\xc6\xbf\x0d\xe7\xde\x4a\x29\xdd\x0f\xa0\xaf\x09\xee\xad\x47\
+\x55\x9f\x34\x02\xf5\x63\x77\x25\x00\xfc\xec\xdf\xb8\xcd\xa5\x33\
+\x89\xe3\xea\xe0\xfa\xd7\x8e\xff\x63\x2a\xf5\xde\x33\xfb\xaf\x97\
+\xbb\x72\xee\x9a\x40\xe9\x7e\x00\xe7\x49\xd4\x86\xc0\xae\x7b\x58\
+\x95\x5b\x98\x40\x37\x02\x00\xe3\x6f\x3e\xfb\x77\xae\x7f\x4b\xbe\
+\x18\x7f\xb9\xfe\x2d\x89\x5e\xce\x0b\xe3\xaf\xd9\xff\x65\x46\x5b\
+\xbf\xea\xbd\x77\xce\x8b\x97\xdb\xce\x51\x1b\x02\x07\xfd\xac\x93\
+\x40\x8b\x5a\x77\x23\x00\x6a\x18\x7f\x7f\xf3\x30\xa4\x28\xe3\x6f\
+\x08\x73\x26\x2b\x19\xff\x19\x40\x3b\xba\x7c\x78\x6a\x78\x90\xdd\
+\x5c\xe7\x05\x60\x72\x91\x9d\x5e\x09\x45\x60\xc3\x04\xba\x10\x00\
+\x35\x3e\xa0\xd6\xc6\x9f\xd9\xff\x86\xc7\x41\x57\x4d\x93\xf1\xef\
+\xaa\x3b\x96\xaf\x0c\x4b\x01\x05\x5e\x00\xf3\xc9\xc5\xf2\x44\x54\
+\x83\xcd\x13\x68\xd3\xc0\x2e\x04\x80\xf9\x07\x54\xae\xff\x36\xa3\
+\xa7\x42\x29\x32\xfe\x15\xa0\x6e\x20\xcb\xd2\xbd\x3c\x35\x26\x19\
+\x1b\xc0\xaa\x26\xec\x9c\xc0\xe2\x02\xa0\xc6\x07\xd3\x7a\xf6\x2f\
+\xd7\x7f\x9b\x4f\x89\x8c\x7f\x1b\xce\x6b\x2d\xa5\xe4\xa9\x00\xf3\
+\x49\xc6\x5a\x21\xaa\xde\xab\x20\xd0\xaa\x92\x8b\x0b\x00\xf3\x0f\
+\x66\x85\xd9\x7f\xab\xce\xd8\x6b\x39\xfc\x93\x9f\xbf\xfc\xe7\x7f\
+\xfd\xae\x36\xfc\xed\x75\x04\x44\xb6\xbb\x70\x29\xa0\xc6\x64\x23\
+\xb2\xe6\x8a\x26\x02\x5d\x12\x58\x54\x00\x98\x7f\x20\x9d\xf1\xb7\
+\x9c\xfd\xeb\x0b\x7f\xea\x8f\x59\x66\xfd\xaf\xff\xe3\xcf\xbe\xab\
+\xaf\xf9\xad\xcf\x7a\x0b\x25\x94\x6c\x08\x34\x9f\x6c\x6c\x01\xa8\
+\xda\xd0\x21\x81\x76\x55\x5a\x54\x00\x58\x7f\x20\x2d\x8d\x3f\x5d\
+\xf0\xef\x3e\xf7\xcc\x97\x79\x55\xb0\x27\xa0\x59\xbf\x3d\xd3\x5d\
+\xe4\x88\x17\xc0\x09\xfd\xdc\xb6\x9a\x4f\x3a\x72\x2b\xa2\x74\x22\
+\xd0\x01\x81\xc5\x04\x80\xf9\x07\xb1\xe0\xa6\x70\xaa\x1f\xd8\xf5\
+\xaf\xb5\xff\x53\x64\xca\xcf\x69\xd6\x5f\xce\x70\xcf\x39\x94\x08\
+\x7d\xeb\x49\xc7\x9e\xfb\x41\x6d\xaf\x43\xa0\x65\xae\x8b\x09\x00\
+\xeb\x0f\x62\xc9\x4d\xe1\x14\x70\x19\xff\x53\x54\xca\xce\x31\xeb\
+\xff\xf3\xbf\xff\xe9\x5f\x68\xad\xbf\x8c\xa3\x52\x0f\x43\xc9\x86\
+\x40\x7d\x3b\xa0\x46\x90\x08\x3c\x21\xb0\x88\x00\x58\xc3\xec\xff\
+\x09\x1e\xfd\xb5\x20\x80\xe1\x67\x93\x1f\x6b\xfd\x16\xf9\x29\x0f\
+\x11\x18\x58\x0a\xc8\xfc\x6e\x80\x51\xdf\x0e\x38\xe8\xa7\x57\x02\
+\x6d\xeb\xb5\x88\x00\x38\xdc\x19\xff\xc4\xac\x99\xce\xf5\xaf\xd9\
+\xbf\x19\x4d\xd3\x8c\xa6\x86\x5f\x9b\xfc\x4c\xd1\x2a\x33\x47\x20\
+\x7b\x43\xe0\xe1\xf0\xb2\xbc\x00\x0e\xa0\x7e\x77\x4f\xa0\xb9\x00\
+\xf0\xb3\x7f\xf7\x01\xb4\x22\x6f\x6d\xfc\x59\xfb\xb7\xaa\xdb\x5e\
+\xf3\x91\xe1\xdf\x6b\xcf\x37\x6e\xb7\xbc\x00\x8d\x81\xab\xb8\xda\
+\x04\x5a\xe7\xdf\x5c\x00\x98\x36\xd0\xcd\xfe\x4d\xf3\x73\x99\x69\
+\xed\xdf\x41\xc8\xfc\x95\xe1\xcf\x04\xa7\x64\xd9\x04\xe4\x05\xc8\
+\x46\xa7\x84\x22\x30\x34\x15\x00\xcc\xfe\x2d\x37\xff\x69\xf6\xdf\
+\xc7\x08\x66\x57\x7f\x58\xe3\x97\xab\xbf\x8f\x3e\xd9\x4d\x2d\xe4\
+\x05\xd8\x4d\x57\x6f\xbf\xa1\xed\x5b\xd8\x54\x00\x98\x36\x4f\xb3\
+\x7f\x53\x9c\x39\x99\x61\xf8\xc3\xae\x7e\x19\xfe\x1c\x82\x4a\x63\
+\x41\x40\x5e\x00\x0b\x8a\xca\x63\x8f\x04\x9a\x09\x00\x36\xdd\x58\
+\xce\xfe\xad\x3b\x4b\x6b\xff\x71\x44\x83\x9b\x3f\x18\xfe\xb8\x54\
+\x8a\x25\x02\x15\x09\xc8\x0b\x50\x11\xae\xb2\x6e\x45\x60\x89\x72\
+\x9a\x09\x80\x3b\x8f\xef\xbc\x6c\xd6\x40\x37\xfb\xb7\x76\xff\x6b\
+\xed\xff\x72\xef\x04\xc3\xcf\xa3\x7c\x9a\xed\x5f\x66\xa5\xab\xed\
+\x09\xc8\x0b\xd0\x9e\xb9\x4a\x5c\x3f\x81\x3b\xad\x9a\xa0\xd9\x7f\
+\x2b\xd2\xb6\xe5\xc8\xf0\xdb\xf2\x54\x6e\x95\x08\xc8\x0b\x50\x09\
+\xac\xb2\x6d\x43\x60\x99\x52\x9a\x08\x00\x36\xff\x99\x35\xaf\xc2\
+\xec\xff\xf7\x3e\xfb\x94\xbe\xf3\xff\x44\x07\xb1\xc6\xaf\x19\xff\
+\x09\x30\x3a\xd5\x25\x81\x6c\x2f\x40\x97\xad\x51\xa5\x44\xa0\x3e\
+\x81\x26\x02\xa0\x7e\x33\xf2\x4b\x60\xed\xff\x8b\x4f\xdd\x95\x00\
+\x98\x20\x64\xd6\xaf\x35\xfe\x09\x10\x1d\xae\x83\x40\xae\x17\xe0\
+\xa0\x2f\x06\x5a\x47\x07\x6f\xb7\x96\x4b\xb5\xac\x89\x00\x30\x73\
+\xff\x57\x98\xfd\x2f\x05\xbe\xc7\x72\x31\xfc\xe1\x71\xbe\x1e\xeb\
+\xa7\x3a\x89\xc0\x1c\x81\x5c\x2f\xc0\xa8\xaf\x07\x1e\xf4\xb3\x3f\
+\x02\xd5\x05\x80\xa9\xfb\xbf\x42\xff\x68\xf3\xdf\x30\x4c\x0d\xbf\
+\x36\xf8\x55\x18\x64\xca\xb2\x1d\x81\x02\x2f\x40\xbb\x4a\xaa\x24\
+\x11\x98\x12\x58\xee\xb8\xba\x00\xb0\xfc\xde\x7f\xeb\x9d\xff\xb8\
+\xff\x97\x43\xdf\x47\xc9\x5a\xe7\xef\xa3\x1f\x54\x0b\x3b\x02\xb9\
+\x5e\x00\x1e\x55\xb6\xab\x85\x72\x12\x81\xfe\x09\x54\x17\x00\x83\
+\x5b\x5f\x33\xc1\xe0\xdc\xff\x26\xf9\x4c\x32\xd9\xf3\xec\x3f\xcc\
+\xfa\xf5\xaf\x79\x27\x03\x42\x87\xdb\x20\x90\xe9\x05\x18\xb5\x0c\
+\x30\xe8\xa7\x3d\x81\x25\x4b\xac\x2a\x00\x2c\xdd\xff\x9a\xfd\xdb\
+\x0d\x13\xcd\xfa\xed\x58\x2a\xa7\x3e\x09\x64\x79\x01\xdc\x64\x45\
+\x5e\x80\x3e\xfb\x53\xb5\xaa\x43\xa0\xaa\x00\xb0\xdc\xfc\x57\xa7\
+\xf9\xfb\xca\x55\xb3\xfe\x7d\xf5\xf7\xae\x5b\x8b\x17\x60\xd7\x00\
+\xd4\xf8\x75\x10\x58\xb6\x96\xd5\x04\x80\xe9\xec\xff\xee\xf0\xd0\
+\x1a\xd3\xde\xdc\xff\x18\x7f\x3d\xd3\x6f\x3d\x8a\x94\x5f\xd7\x04\
+\xc6\xf4\xfb\xc6\xa8\x65\x80\x41\x3f\xfb\x21\x50\x4d\x00\x98\x22\
+\x34\x56\xf3\x7b\xdb\xfc\x17\x5c\xfe\xa6\x7d\xa2\xcc\x44\xa0\x73\
+\x02\x5a\x06\xe8\xbc\x83\x54\xbd\x61\x69\x04\xd5\x04\x80\xdc\xff\
+\x4b\x77\xed\x93\xf2\x79\xae\x5f\x1b\xfd\x9e\xb0\xd0\xdf\x9d\x11\
+\xc8\x9c\x38\x8c\xf2\x02\x0c\xfa\xd9\x07\x81\x2a\x02\xc0\xd4\xfd\
+\xff\xf4\xe1\x81\x75\x57\xec\xc1\xfd\x8f\xcb\x1f\xe3\xaf\xe7\xfa\
+\xad\x47\x8f\xf2\x5b\x15\x81\x8c\x65\x00\xb3\x27\x97\x56\x05\x4a\
+\x95\x6d\x4f\x60\xf9\x12\xab\x08\x00\xb3\x66\x55\x78\xf4\xef\x8f\
+\x7f\xe7\x73\x9b\xff\xda\xdf\xe0\xf2\x97\xf1\x37\x1b\x89\xca\x68\
+\xa5\x04\xb2\x96\x01\x5c\x5b\xf5\x34\x80\x83\xa0\xdf\xcd\x13\xa8\
+\x22\x00\xcc\xdc\xff\x15\xf0\xff\xbb\xcf\x3d\xb3\x69\x01\x80\xf1\
+\x97\xcb\xbf\xc2\xc0\x51\x96\xeb\x24\xc0\x32\x40\x86\x17\xc0\xf4\
+\xdf\x97\xaf\x93\x9c\x6a\x5d\x99\x40\x0f\xd9\x9b\x0b\x00\x4b\xe5\
+\x6c\xfd\xec\x3f\xc0\xb7\xec\xfe\x97\xf1\xa7\x87\x15\x44\xe0\x26\
+\x81\x1c\x2f\x80\xe5\x37\x98\xde\xac\x8d\xde\x89\x40\x3f\x04\xcc\
+\x05\x80\x99\x72\x96\xfb\x3f\x69\x94\xc8\xf8\x27\xe1\x52\x64\x11\
+\xb8\x4c\xe0\x70\x78\xf9\x72\x04\x5d\x15\x81\x12\x02\x7d\xa4\x35\
+\x17\x00\x7d\x34\xeb\x74\x2d\xb6\xea\xfe\x97\xf1\x3f\xdd\xdf\x3a\
+\x2b\x02\x9e\x40\xe6\x32\x80\xa5\x37\xd3\xd7\x43\x7f\x44\xa0\x33\
+\x02\xe6\x02\xc0\x6a\xfd\xbf\x86\xfb\xbf\x33\xf6\x26\xd5\x61\xa7\
+\xbf\xd6\xfc\x4d\x50\x2a\x93\x0d\x13\xc8\x59\x06\x18\xf5\x38\xe0\
+\xa0\x9f\x3a\x04\x7a\xc9\xd5\x54\x00\x98\x29\xe6\x0a\xee\x7f\x80\
+\xff\xde\x67\x9f\xda\xd4\x06\x40\x66\xfe\xda\xe9\x4f\xcf\x2a\x88\
+\xc0\x0c\x01\xbc\x00\x33\x51\x74\x59\x04\xf6\x46\xc0\x54\x00\x58\
+\xad\xff\x1f\x2a\x7c\xf5\x2f\x1d\xfb\xc5\xa7\xee\x6e\x46\x00\x60\
+\xfc\x35\xf3\xa7\x57\x15\x44\x20\x92\x40\xea\xd3\x00\xda\x07\x10\
+\x09\x56\xd1\xd2\x08\xf4\x13\xdb\x54\x00\x98\x35\xab\x82\x5a\xdf\
+\xd2\xf3\xff\x32\xfe\x66\x23\x4d\x19\xed\x88\x40\xce\x32\x80\x99\
+\x57\x73\x47\x9c\xd5\xd4\xf5\x10\x30\x15\x00\x26\xeb\xff\xa9\x2a\
+\x3d\x92\xf5\x56\x36\x00\xca\xf8\x47\x76\xb8\xa2\x89\x80\x01\x81\
+\x51\xfb\x00\x06\xfd\xd8\x12\xe8\x29\x37\x33\x01\x60\xa6\x94\xef\
+\xa4\xff\x07\xaf\x18\xa0\x5b\x58\xff\x97\xf1\x8f\xe9\x69\xc5\x11\
+\x81\x33\x04\x2a\x78\x16\xcf\x94\xa4\xd3\x22\xb0\x0a\x02\x66\x02\
+\x40\xeb\xff\x75\xfb\x5b\xc6\xbf\x2e\x5f\xe5\xbe\x13\x02\xa9\x1e\
+\x46\xed\x03\xd8\xc9\xc0\x68\xd5\xcc\xbe\xca\x31\x13\x00\x66\xdf\
+\x9c\x25\x95\x7e\x72\x84\x68\xc3\xdf\x49\x2c\x3a\x29\x02\x49\x04\
+\xb4\x0f\x20\x09\x97\x22\x6f\x9c\x80\x99\x00\x30\xf9\x0f\x5a\x95\
+\x1e\xff\x5b\xfb\x06\x40\x9e\xf5\xdf\xf8\x38\x54\xf3\x44\xa0\x5b\
+\x02\xa3\xf6\x01\x0c\xfa\xb1\x21\xd0\x5b\x2e\x26\x02\xc0\x6c\xfd\
+\xbf\x37\x3a\x1d\xd4\x07\xd7\xbf\x9e\xf5\xef\xa0\x23\x54\x85\x6d\
+\x10\xc0\xc3\x98\xba\x0c\xb0\x8d\x96\xab\x15\x22\x70\x8b\x80\x89\
+\x00\xe8\x7d\xfd\x7f\xad\x4f\x00\x60\xfc\xe5\xfa\xbf\x35\x66\x75\
+\x42\x04\xda\x12\xd0\x3e\x80\xb6\xbc\x37\x5b\x5a\x7f\x0d\x33\x11\
+\x00\x66\xcd\x42\x9d\x9b\x65\xb6\xee\x8c\x7e\xfe\x9b\x4f\x7e\x2a\
+\xe3\xbf\xee\x3e\x54\xed\xfb\x24\xa0\x7d\x00\x7d\xf6\x8b\x6a\xd5\
+\x9e\x80\x89\x00\x30\xd9\x00\x58\x69\xfd\xbf\x3d\x52\x9b\x12\xff\
+\xfa\x5f\x3e\x7a\xcf\x26\x27\xe5\x22\x02\x22\x20\x02\x22\xb0\x34\
+\x81\x1e\xcb\x37\x11\x00\x26\x1b\x00\x2b\xd2\x59\xdb\x77\x00\xe0\
+\xfa\xd7\xba\x7f\xc5\x01\xa1\xac\xf7\x4d\x00\x4f\x63\xe2\x3e\x00\
+\xab\x65\xce\x7d\x83\x57\xeb\x7b\x23\x60\x23\x00\x0c\x5a\xa5\xff\
+\xfe\xf7\x04\x22\xc6\x5f\xae\xff\x27\x2c\xf4\x57\x04\x7a\x21\x60\
+\xe2\xe5\xec\xa5\x31\xaa\xc7\x02\x04\xfa\x2c\xb2\x58\x00\xe8\x09\
+\x00\xdb\x8e\x95\xf1\xb7\xe5\xa9\xdc\x44\xe0\x14\x81\x9c\x7d\x00\
+\xa7\xf2\xd1\x39\x11\x58\x33\x81\x62\x01\x60\xe2\x1a\x4b\x74\xc7\
+\xad\x19\xf8\xa5\xba\x33\xfb\xbf\x74\x5d\xd7\x44\x40\x04\x16\x22\
+\xa0\x27\x01\x16\x02\xbf\x8d\x62\x7b\x6d\x45\xb1\x00\x30\x69\x58\
+\xa5\xef\xff\x37\xa9\x5b\xa3\x4c\x30\xfe\x9a\xfd\x37\x82\xad\x62\
+\x44\x80\x7d\x00\x89\x14\xe4\xed\x4c\x04\xa6\xe8\xdd\x13\x28\x16\
+\x00\x5a\x1b\xb3\xe9\xe3\x7f\xf8\xd5\xa3\x9f\xda\xe4\xa4\x5c\x44\
+\x40\x04\xa2\x08\xc8\xf3\x18\x85\x49\x91\x4a\x09\xf4\x9b\xbe\x58\
+\x00\x58\x3c\x01\x70\xb8\x5b\xe7\x3f\x00\xf6\x8b\xfd\x66\xcd\x98\
+\xfd\x6b\xd7\xff\x4d\x26\x7a\x27\x02\xbd\x11\x30\x59\xee\xec\xad\
+\x51\xaa\xcf\xae\x09\x94\x0b\x00\x0b\x7c\x19\xee\xb8\x94\x62\xff\
+\xe9\xd7\xbf\xe9\x7a\x76\x2d\xd7\x7f\x4a\x6f\x2a\xae\x08\x18\x11\
+\x48\x5c\x7a\x94\xb7\xd3\x88\xfb\xce\xb2\xe9\xb9\xb9\x45\x02\x40\
+\x6b\x62\xe5\x5d\xcb\xec\xbf\x3c\x17\xe5\x20\x02\x22\x90\x4a\x60\
+\xef\x9e\xc7\x54\x5e\x8a\xbf\x3d\x02\x45\x02\xc0\xc4\x25\xb6\xe3\
+\x75\x38\x7d\xdd\xef\xf6\x3e\x50\x6a\xd1\x86\x09\xe8\x49\x80\x0d\
+\x77\x6e\xad\xa6\xf5\x9d\x6f\x91\x00\x30\x69\x5a\xa2\x1b\x2e\xa7\
+\xcc\x5e\x37\xd8\xf5\xbe\x34\x91\xc3\x5a\x69\x44\x60\x35\x04\x2a\
+\x2f\x3d\xae\x86\x43\xe3\x8a\xe2\x39\x26\x7c\xfb\x6f\xdf\xff\xce\
+\x2b\x3f\xf8\xc9\xbb\x37\xc2\xf7\xdf\x3f\xbc\x72\x29\x1c\xc5\x27\
+\x0f\x02\xf9\x35\x6e\xc6\x26\x8a\x5b\x5e\x00\x34\xc0\xd8\xe3\x06\
+\x3b\x5c\xff\x5a\xfb\x6f\xd0\xf9\x2a\x42\x04\x0c\x09\xc8\xd0\xa4\
+\xc1\x84\xd7\xb1\x81\x1f\x0f\x77\xde\x25\x1c\xc6\xe1\x75\xbf\x89\
+\x1c\xcf\x4a\x08\xc3\xcc\x4f\x88\x77\xf5\x4a\x1e\x84\xd1\xe5\x79\
+\x2d\x1c\x9c\x48\x40\x14\x10\x28\x7f\x26\xc7\xaa\x97\x7b\xcf\xbc\
+\x48\x00\x58\x6c\x8a\x69\xb5\x0e\x87\xbb\xbd\xa7\xce\x90\xf1\xef\
+\xa9\x37\x54\x97\xdd\x12\xd8\xf1\x12\x64\x8d\x3e\xc7\xe0\x5e\x1b\
+\x7c\x37\x93\xc7\x30\xdf\x30\xf2\x35\x0a\x3d\xce\xd3\x89\x03\x44\
+\x01\x81\xf2\x11\x06\x88\x01\x02\xf5\x3b\x8e\xbe\xe7\xf7\x45\x02\
+\xc0\x77\xec\x9e\xe9\x65\xb6\x9d\xd9\x7f\x66\x52\x25\x13\x01\x11\
+\x58\x90\x80\xc9\xbe\xa7\x05\xeb\x5f\xa3\x68\x8c\xaa\x37\xfa\xc7\
+\x06\xbf\x46\x61\x99\x79\x22\x06\x08\xc7\x82\x20\x33\xbb\xc8\x64\
+\xfd\x47\x2b\x13\x00\x16\xed\x6b\xb4\x0e\xf7\xd7\xff\xf2\xd1\x7b\
+\x16\xd5\x2d\xcd\x03\xe3\xaf\xd9\x7f\x29\x45\xa5\x17\x01\x23\x02\
+\x0d\xf6\x20\x19\xd5\xb4\xab\x6c\x4e\x1a\xfd\xae\x6a\x78\xb9\x32\
+\x88\x01\x42\xf0\x0e\x5c\x8e\xbd\xdd\xab\xcb\x0a\x80\x86\xee\xb7\
+\x1e\xf6\x01\xc8\xf8\x6f\xf7\x83\xa4\x96\xad\x93\x40\xea\x12\xa4\
+\xc5\xb2\xe7\x3a\x49\x0d\xc3\xda\x8d\xfe\x39\xee\x41\x08\xe0\xc5\
+\x60\x99\xe0\x5c\xbc\xd4\xf3\x6b\x88\xbf\xac\x00\x68\x4c\x68\xc9\
+\x7d\x00\x94\xad\x99\x7f\xe3\x0e\x57\x71\x22\x20\x02\xc5\x04\x82\
+\xe1\xc7\x7d\xbe\xe9\x65\xdf\xab\xbd\x03\x7b\xf2\x0a\x2c\x2b\x00\
+\x1a\xbb\xdf\x96\x5a\x06\xc0\xf8\xbf\xfe\x8f\x3f\xfb\x6e\xf1\x27\
+\x51\x19\x88\x80\x08\xd8\x12\x68\xb4\x04\x69\x5b\xe9\x36\xb9\xed\
+\xc6\xf0\x9f\xc0\x19\xbc\x02\xf9\x1e\x81\x13\x99\x76\x78\x2a\x5b\
+\x00\x30\x38\x3a\x6c\xcf\xc5\x2a\xb1\x0c\x80\x1b\xfe\x62\x24\xe3\
+\x8b\x32\xfe\xc6\x40\x95\x9d\x08\x88\x40\x55\x02\xdc\xdb\x71\x87\
+\x6f\x7e\xc6\x1f\x41\x71\xeb\x42\x20\x5b\x00\x44\xb0\xeb\x32\x0a\
+\x6e\x78\x8c\x72\x8b\xca\x51\x8e\x66\xfe\x2d\x48\xab\x0c\x11\x10\
+\x81\x52\x02\x32\xfc\xe7\x09\xa6\x0a\x81\xf3\x39\xf5\x75\x65\x77\
+\x02\x00\xfc\x2d\x96\x02\xf0\x34\xc8\xf8\x43\x5b\x41\x04\x3a\x27\
+\xd0\x70\x33\x72\xaf\x24\x70\x75\x37\x9f\xf1\xc3\x9d\x70\x77\x78\
+\x30\x4c\xc2\xe1\xe9\xe1\xcd\x10\xa6\xe7\xaf\x8f\x49\x43\x58\x00\
+\xa6\x17\x02\x57\x5f\x34\xb4\x40\xf1\xe6\x45\x2e\x2a\x00\x52\x77\
+\xe0\x5a\xb5\xbe\xe6\x52\x00\xb3\xfe\xbf\xfc\xe7\x7f\xfd\x2e\x9e\
+\x06\xab\xfa\x2a\x1f\x11\x10\x81\x4e\x08\x1c\x0e\x2f\x77\x52\x13\
+\x93\x6a\x84\x59\x3f\x86\xcd\x24\xc3\x53\x99\x60\xac\x9d\x81\x0f\
+\x46\xfd\xf0\xd9\xc3\x6b\x3e\x3c\x73\x78\xf3\x40\x78\xfa\xf0\xe0\
+\x30\x09\x03\xfb\x32\xae\xc2\xf4\xfc\xf5\x31\x69\x08\x21\x1f\x27\
+\x18\x6e\x88\x83\x53\x75\xb0\x3c\xe7\xc6\x00\xbc\x10\x4d\xa7\xb3\
+\x5d\xcf\xd9\x6c\x01\xb0\xf6\x2f\xc4\xc0\x40\x33\x4b\xb7\xec\x2a\
+\xf2\x63\xd6\x8f\xc0\xb0\xcc\x57\x79\x89\x80\x08\x88\x80\x35\x81\
+\x6a\xeb\xfc\x18\x7c\x17\xbc\xc1\xc7\x48\x63\xac\x9d\x81\xbf\x36\
+\xec\xd6\x0d\x71\x62\xe1\x86\x38\x70\x65\x5e\x0b\x02\xeb\xb2\x26\
+\xf9\x21\x02\xd6\xfe\xc4\x40\xb6\x00\x98\x70\x58\xed\x21\x22\x80\
+\xd9\x3a\xb3\xf6\x92\x46\x60\xf8\xff\xfc\xef\x7f\xfa\x17\xe4\x57\
+\x92\x8f\xd2\x8a\x80\x08\x88\x40\x6d\x02\x7e\xd6\xff\xfd\xf7\x0f\
+\xa6\x8f\xf4\x1d\x1b\x7c\x67\xf4\xbd\xc1\xaf\xdd\x98\x33\xf9\x5f\
+\x0b\x02\x27\x06\xf0\x36\x78\x41\x70\x26\x6e\xe9\x69\x84\xc0\xd4\
+\x1b\x50\x9a\x5f\xcb\xf4\xbb\x16\x00\x80\x66\xb6\xce\xac\x1d\x23\
+\x4e\xe0\x5c\x4c\x40\x34\x20\x1e\x64\xf8\x63\x68\x29\x8e\x08\x88\
+\x40\x0f\x04\x30\x54\x7e\xad\xdf\xa2\x32\xce\xe8\x63\x58\xfd\x4c\
+\x7f\x61\x83\x3f\xd7\x1c\x2f\x08\x10\x03\x61\xb9\x60\x2e\x41\xe2\
+\x75\x44\x00\x1e\x15\xc4\x55\x62\xd2\x45\xa3\xef\x5e\x00\x04\xfa\
+\xcc\xde\x09\x18\x74\x84\x00\x01\x23\x3f\x0d\x18\x7c\x02\x71\x10\
+\x0d\x88\x87\x90\x5e\xaf\x22\x20\x02\x2b\x25\x90\xf8\x7d\x24\x6b\
+\xbb\xc9\x87\x5e\xc1\x40\x61\xa8\xc2\xfb\xec\x57\x67\xf8\x83\xd1\
+\xc7\xb0\x2e\x39\xd3\x4f\x6e\x43\x58\x2e\x70\x62\x00\xf1\xe2\x43\
+\x72\x26\x67\x12\x1c\x0e\x2f\x8f\x87\x3b\xef\x22\xb2\xce\xc4\xe8\
+\xee\xf4\xb2\x02\xc0\x75\x46\x77\x44\x5c\x85\x10\x02\x04\x8c\xfc\
+\x34\x60\xf0\x09\x2e\x8a\x7e\x45\x40\x04\x44\x60\x15\x04\x10\x2c\
+\xac\x55\x17\xbb\xfc\x27\x86\x7f\x55\x46\xff\x4c\x2f\x21\x5e\x08\
+\x5e\x04\xdc\x1d\x1e\x9c\x89\x96\x7c\x1a\x91\xb5\x16\x11\xb0\xac\
+\x00\x48\x46\xab\x04\x22\x20\x02\x22\x20\x02\xb1\x04\x30\x44\xc5\
+\x2e\xff\x8d\x19\xfe\x63\x76\x88\x00\x82\x85\x10\x08\x79\x23\x02\
+\xf0\xb8\x84\xf7\xbd\xbe\x66\x0b\x80\x3d\xff\x53\x8c\x5e\x3b\x53\
+\xf5\x12\x01\x11\x10\x81\x40\x00\xe3\x8f\x21\x0a\xef\x93\x5f\x37\
+\x6e\xf8\x8f\x79\x20\x02\x08\x5e\x08\x1c\x5f\xcc\x79\xef\x96\x04\
+\x7a\x17\x01\xd9\x02\x20\x87\x87\xd2\x88\x80\x08\x88\x40\x6f\x04\
+\x96\xfa\x3e\x92\x9a\x1c\x4a\x8d\x7f\x58\xe3\xdf\x82\xab\x3f\x95\
+\x33\x22\x20\xef\xc9\x81\x13\x25\x21\x02\xbe\xff\xfe\x81\x65\x98\
+\x13\x57\x17\x3f\x25\x01\xb0\x78\x17\xa8\x02\x22\x20\x02\x22\x60\
+\x47\xa0\xc8\xf8\xbb\xb5\xf0\x27\xc6\xef\xf0\xd0\xae\x46\xeb\xcc\
+\xc9\x52\x08\xb0\x0c\xd3\xa3\x08\x58\x4e\x00\x38\xf7\xd2\x3a\x87\
+\x85\x6a\x2d\x02\x22\x20\x02\x7d\x12\xc8\x36\xfe\xee\x7e\xec\x67\
+\xfd\x7c\x61\x4f\x9f\x4d\x5b\xac\x56\x08\x81\x98\x65\x81\xb9\x0a\
+\xf6\x28\x02\xb2\x05\xc0\xf8\xf8\xf0\x37\x73\x0d\xd6\x75\x11\x10\
+\x01\x11\x10\x81\x36\x04\x8a\x8c\x7f\xe7\xcf\xf1\xb7\x21\x78\xbe\
+\x14\x44\x00\x02\x69\x70\x42\xe9\x7c\xac\xf9\x2b\xbd\x89\x80\x6c\
+\x01\x30\xdf\x54\xc5\x10\x01\x11\x10\x81\xed\x11\xf8\x1f\xdf\xf8\
+\xfd\xef\xf5\xd6\xb6\x7e\x7c\xa7\x00\x00\x10\x00\x49\x44\x41\x54\
+\xaa\x6c\xe3\x8f\xcb\x1f\xe3\x6f\xd0\xa0\x3f\xfb\xc2\xb3\x2f\xbe\
+\xfd\xd5\xe7\xef\x13\xde\xf9\xfa\x0b\x6f\x9d\x0a\xaf\xff\xc1\x97\
+\xee\x11\x0c\x8a\x6b\x9f\xc5\xdd\xc3\x43\xfe\x77\xc1\x69\x6f\x40\
+\x7c\x75\x7a\x12\x01\xcb\x09\x80\xc3\xf0\x62\x3c\x32\xc5\x14\x01\
+\x11\x10\x01\x11\x38\x45\x20\xcb\xf8\xbb\x99\x2c\x33\x5a\x66\xb6\
+\xa7\xf2\x8c\x3d\x17\x8c\x3e\xc6\xfe\xd5\xe7\x3f\x7f\xff\x8b\x4f\
+\x7f\xe6\x45\xc2\xb9\xf4\x2f\x3d\xf7\xcc\x3d\xc2\x6a\x45\x80\x6b\
+\x98\x67\xe6\x84\x93\x3b\xcc\xfe\x1d\x87\xbb\xaf\x0f\x1d\xfc\x2c\
+\x27\x00\x3a\x68\xbc\xaa\x20\x02\x22\x20\x02\xe3\x27\xeb\x9d\x8c\
+\x64\x1b\x7f\x66\xfd\x6e\x46\x9b\xdb\xfb\xc1\xf0\x07\xa3\x9f\x9a\
+\x0f\x22\x00\xd1\x40\x3e\xa9\x69\x7b\x88\x8f\x08\x40\x40\x85\xba\
+\x24\xbf\x1e\x0e\x2f\xf7\xf0\x88\x60\xb6\x00\x78\x7c\xe7\x71\x77\
+\x6e\xb0\xe4\x4e\x50\x02\x11\x10\x01\x11\x58\x29\x01\x76\x95\x1f\
+\xc6\x21\x6d\x26\xc9\xcc\x1f\xe3\x9f\xd9\x66\x0c\x36\x2e\xfe\x5c\
+\xc3\x7f\x5c\xec\x2b\x5f\x78\xee\xde\xf1\xb9\xd5\xbc\x77\x02\x6a\
+\xed\x22\x20\x5b\x00\xac\xa6\x93\x54\x51\x11\x10\x01\x11\xd8\x20\
+\x81\xf1\x70\xe7\xdd\xa4\x66\x39\xb7\xb5\x5f\xc3\x4e\x4a\xf4\x24\
+\xb2\xb5\xe1\x7f\x92\xeb\x30\x5c\x5a\x2e\x08\x71\xba\x7e\x45\x04\
+\x7c\xf6\xf0\x5a\xf6\xe6\x40\xe7\x09\xc0\x8b\xb3\x54\x1b\x25\x00\
+\x96\x22\xaf\x72\x45\x40\x04\xd6\x47\x60\x1c\xbb\xf0\x7c\x26\x1b\
+\x0d\x8c\x7f\xe6\x23\x7e\xac\xd7\x5b\xcd\xf8\x4f\x75\x38\xe2\xe2\
+\xd4\xf9\x35\x9d\xf3\xc2\x6a\x1c\xb2\xbe\x3b\x01\x2f\x0e\xde\x9c\
+\x25\xda\xbb\xac\x00\xf8\x64\xd4\x46\xc0\x25\x7a\x5d\x65\x8a\x80\
+\x08\xac\x96\x00\xc6\x1f\xa3\x11\xdd\x80\x02\xe3\x8f\xbb\xff\xa5\
+\xe7\x9e\x59\xaf\x9b\x3e\x1a\x52\x7e\xc4\x90\xb2\x44\x04\xe0\xcd\
+\x59\x42\x04\x2c\x2b\x00\x02\x39\xbd\x8a\x80\x08\x88\xc0\x52\x04\
+\x1e\xaf\x67\x13\x60\x2b\xe3\xcf\xac\x9c\x4d\x7a\x2d\x5c\xf4\x7f\
+\xf5\x8b\x8f\xb2\x66\xce\x4b\x0d\x97\x4b\xe5\x16\x89\x80\x05\x9e\
+\x0c\xc8\x16\x00\x3d\x3e\x0b\x7b\xa9\x63\x74\x4d\x04\x44\x40\x04\
+\xd6\x4e\x20\x69\xe6\xef\x5c\xd2\xec\x56\x4f\x6d\x73\x70\xf9\xa7\
+\xa6\xdb\x67\xfc\xdb\xad\x3e\x3c\x35\x3c\xb8\x7d\x36\xe2\xcc\x02\
+\xfb\x01\xb2\x05\x40\x44\x73\x14\x45\x04\x44\x40\x04\x44\xc0\x88\
+\x00\xb3\xff\xe8\xac\x30\xfe\x19\xbb\xfd\x31\xfe\x2d\x5d\xfe\xef\
+\x7d\xf8\x28\xcf\x58\x46\x83\x58\x20\x22\x1b\x03\x9f\x1e\xde\xcc\
+\x29\x19\x81\xd7\x72\x29\x40\x02\x20\xa7\x97\x94\x46\x04\x44\x60\
+\x97\x04\x96\xfa\x0a\x74\x8c\x3f\xc6\x21\x16\xba\x77\x45\xc7\x46\
+\xbe\x8a\xd7\xda\xf8\x53\xec\x1b\x3f\xfe\xd9\xaa\x05\x00\x6d\x38\
+\x19\x0a\x44\xc0\xd8\x70\x29\x60\x51\x01\xb0\xe6\x2f\xe0\x18\xf4\
+\x23\x02\x22\x20\x02\x8d\x08\xa4\x18\xff\x9c\xaf\xaa\x5d\x62\xb3\
+\xdf\x26\x67\xff\xd3\xf1\xe0\x44\x40\x4e\x5f\x0c\x0d\x97\x02\x16\
+\x15\x00\x53\x56\x3a\x16\x01\x11\x10\x81\x45\x08\x74\xfe\xb5\xe4\
+\xcc\xfe\xa3\xb9\x64\xec\xf8\xc7\xf8\xb7\xd8\xec\x37\x6d\x03\xc6\
+\x7f\xfd\xb3\xff\x69\x8b\x4e\x1f\xfb\x3d\x18\x6e\x39\xe6\xf4\xd5\
+\xf3\x67\x11\x7c\x2d\x96\x02\xca\x04\x40\x27\xcf\xc4\x9e\xc7\xa8\
+\x2b\x22\x20\x02\x22\xb0\x5e\x02\x18\x01\x8c\x41\x54\x0b\x9c\xa1\
+\xf1\x06\x27\x2a\xf2\x93\x48\xb8\xfd\x5b\x1b\x7f\x4a\xde\x83\xf1\
+\xa7\x9d\x84\xdc\x4d\x81\x63\x83\xa5\x80\x32\x01\x30\x14\xfe\xac\
+\xe8\xf1\x9b\xc2\x96\x2a\xb9\x08\x88\xc0\x06\x08\xb4\xfe\x0a\xf4\
+\x3b\x8f\xef\xbc\x1c\x8b\x2d\x75\xdd\x1f\xe3\xdf\x72\xc3\x5f\x68\
+\x07\xb3\xff\x70\xbc\xe6\xd7\xe8\xba\xbb\xa5\x80\xac\xaf\x0c\x76\
+\x4b\x01\x08\xc0\xe8\x72\x32\x22\xde\xc9\x48\x73\x9d\x64\xa9\x0d\
+\x31\xd7\x15\xd0\x81\x08\x88\x80\x08\x94\x10\x48\xfc\x32\xb2\x96\
+\x8f\x3f\xe3\xfa\x8f\x9e\xfd\x3b\xd7\x7f\x0a\x86\x25\x8d\xff\x9e\
+\x66\xff\xd7\x7d\xe2\x44\x40\xce\x7e\x80\xb1\xb2\x17\xa0\x48\x00\
+\x14\xab\xe1\xce\xd7\xde\x06\xfd\x88\x80\x08\x6c\x9a\x40\xcf\x1b\
+\x91\x53\x8c\x7f\x8a\xeb\x5f\xc6\xdf\x62\x48\xa7\xe7\x91\xd2\x47\
+\xd7\xb9\x57\xf6\x02\x14\x09\x80\xeb\x4a\xea\x40\x04\x44\x40\x04\
+\xb6\x4e\xa0\xe1\x9e\x27\x66\xff\xb1\x38\x53\x0c\x8b\x8c\x7f\x2c\
+\xd5\x3a\xf1\x72\x96\x02\xc6\x8a\x5e\x80\x22\x01\x60\xe2\x0e\x4b\
+\x74\xc1\x0d\xfa\x11\x01\x11\x10\x81\x05\x08\xb4\x5c\xf2\x3c\xdc\
+\x19\xff\x24\xaa\x89\x89\xae\xff\x25\xd6\xfc\x7f\xfe\xf1\x6f\x1f\
+\x6e\xcd\xed\x1f\xd5\x37\xa7\x22\xb1\x14\x30\x26\xfe\xd3\xa0\x8a\
+\x5e\x80\x22\x01\xe0\xdb\xd7\x50\x15\xfb\xf2\xf4\x47\x04\x44\x40\
+\x04\xac\x08\x74\xb8\x11\xd9\xcf\xfe\xdd\x4d\x3f\xa6\x89\xa9\xb3\
+\xff\x98\x3c\xad\xe3\xbc\xfa\xa3\x0f\xb2\xbe\x15\xcf\xba\x1e\xbd\
+\xe4\x97\xf3\x54\xc0\x58\xc9\x0b\x50\x2e\x00\x86\xb2\x9f\x9e\xd7\
+\xe0\xca\x5a\xa6\xd4\x22\x20\x02\x81\x00\xff\x5c\x06\xf7\xf3\x34\
+\x70\x2e\x5c\x5f\xec\x35\x61\x1f\x52\xf1\x9e\x27\xeb\x46\x26\xcc\
+\xfe\xe1\xbe\xc4\xec\xff\xed\x0f\x7e\xb9\x41\xe3\x5f\xd8\x91\x1d\
+\x79\x01\x8a\x05\x40\xb1\x5b\xac\x43\x05\x5e\xd8\xbd\x4a\x2e\x02\
+\x22\x70\x45\x00\xc3\xc3\x7f\x95\x7b\xf5\xf9\xcf\xdf\xc7\x00\x4d\
+\x03\xe7\xb8\x46\x9c\xab\xe8\xbb\x7f\x61\xf6\x1f\xbb\xf9\x2f\x65\
+\xf6\x0f\xf7\xd6\x70\x79\xdc\x6f\x4b\xff\xe9\xcf\x92\x5f\x2f\x5e\
+\x80\x62\x01\xd0\x9d\x2a\xb6\xec\x25\xe5\x25\x02\x22\x90\x4d\x80\
+\x6f\x98\x8b\x31\x3c\xc4\x59\x44\x08\x24\xee\x3f\x32\xd9\xf3\x94\
+\x4d\xf3\x28\x61\xe2\xec\xff\x28\x75\xf5\xb7\x18\xff\xad\xae\xfb\
+\x9b\xc0\xeb\xc4\x0b\x50\x2c\x00\x8a\x61\x24\xb8\xe0\x8a\xcb\x52\
+\x06\x22\x20\x02\x4d\x08\x60\xfc\x53\xbf\x61\x0e\x21\xd0\xd2\x1b\
+\x90\xb4\xfc\xd8\x68\xaf\xd3\x56\x66\xff\x32\xfe\xf3\x1f\xb3\x1e\
+\xbc\x00\xc5\x02\xc0\x44\x15\x27\x2a\xf1\x79\xb4\x8a\x21\x02\x22\
+\xb0\x14\x01\x8c\x78\xaa\xf1\x0f\x75\x6d\x2d\x02\x42\xb9\x3d\xbc\
+\xe2\xfe\x8f\xaa\xc7\x0a\x66\xff\x51\xed\x58\x65\x24\xc3\x4a\x67\
+\x7a\x01\x0c\x6b\x30\x14\x0b\x00\xcb\xca\x28\x2f\x11\x10\x81\x75\
+\x13\xc0\xf8\x63\xc4\x4b\x5a\x41\x7a\xf2\x29\xc9\x23\x2a\x6d\xc2\
+\xfe\xa3\xe2\xbd\x4e\x11\x15\x8a\x7d\xf4\xaf\xe7\xb5\x7f\xb9\xfe\
+\x23\x3a\x7a\x12\x25\xc7\x0b\x60\xf9\xf5\xc0\x36\x02\xa0\xd0\x3d\
+\x96\xe4\x8a\x9b\xc0\xd3\xa1\x08\x88\x40\x5f\x04\x30\xde\x16\x35\
+\x22\x9f\xea\x4f\x09\xf4\xb6\xfc\x18\xf3\xe8\x5f\xe7\xb3\xff\xad\
+\xbb\xfe\x2d\xc6\xf6\x8d\x3c\x32\xbc\x00\xa3\xe1\x23\x81\x36\x02\
+\x60\x28\xfc\x49\x50\xe2\x85\x25\x29\xb9\x08\x88\x40\x25\x02\x4d\
+\x66\xed\x95\xea\x3e\x97\x6d\xed\xcd\xce\xb1\xee\xff\xde\x67\xff\
+\x73\x1c\xb7\x7a\x9d\xb1\xcf\xbe\x17\x36\xb3\x12\x78\x4f\x88\x69\
+\x6f\xb2\x17\x20\x46\x28\xc6\x14\xec\xe2\x98\x08\x80\x16\xee\x31\
+\x57\x57\xfd\x8a\x80\x08\x74\x4c\x80\x59\xbb\x65\xf5\x5e\xf9\xc2\
+\x73\xf7\x2c\xf3\xbb\x91\x57\xe2\xbe\x23\x93\xbd\x4e\x37\x2a\x70\
+\xf3\x4d\xd4\xe6\xbf\x84\x6f\x90\x8b\x35\x3e\x37\x6b\xa1\x77\x97\
+\x09\xdc\xbe\x0a\x67\x0c\xfe\x4b\xcf\x3d\x73\x6f\xba\xef\x85\xf7\
+\x04\xae\xdf\x4e\x75\x74\x06\x2f\xc0\xd1\xa9\xb9\xb7\x56\xcb\x00\
+\x26\x02\xa0\x58\x1d\xf7\xe6\x8a\x9b\xa3\xaf\xeb\x22\x20\x02\x37\
+\x08\x44\xdd\xe8\x6e\xa4\x98\x7f\xc3\x0d\xb5\xd6\x32\x40\xd2\xb2\
+\x63\xe1\x12\xe7\x7c\x4b\x23\x63\xdc\x89\xff\x0a\x59\x8c\x4f\x64\
+\xae\x66\xd1\xf6\xe6\xfe\x67\xcc\xcf\x71\xe6\x3a\xf1\x66\x21\x27\
+\x88\x3b\xf2\x1a\x8d\x96\x01\x4c\x04\x80\x89\x3a\x4e\x54\xe4\x83\
+\x7e\x44\x40\x04\xba\x21\xc0\x8d\xae\x9b\xca\x18\x57\xa4\xb6\x87\
+\xd3\xda\xfd\x1f\x65\x70\x8c\x19\xb1\xf9\xcf\x38\xcb\xee\xb2\x3b\
+\xae\x50\xec\x98\x27\xde\x9c\x90\x5d\x6a\x19\xc0\x44\x00\x78\x30\
+\x85\x2a\x39\x49\x91\xfb\x02\xf5\x47\x04\x44\xa0\x07\x02\x35\x0d\
+\xce\xd7\x9e\xfd\xdc\x8b\x55\xda\xf8\xc9\x50\x6f\x79\xa1\x46\x85\
+\x13\x36\xff\xd5\x28\x7e\x2e\xcf\xbf\xfb\xe8\x57\x0f\xe7\xe2\xec\
+\xf9\xfa\xec\x72\x16\xcb\x00\x89\x5e\x00\x8b\x65\x00\x33\x01\x70\
+\x18\x3e\x79\xa3\xa8\x83\xb5\x11\xb0\x08\x9f\x12\x8b\xc0\x52\x04\
+\x98\xe1\x2c\x55\x76\x56\xb9\x89\xde\xc6\xef\xfe\x87\x17\xbe\x93\
+\x55\x4e\x64\xa2\xa8\xf5\xff\xc8\xbc\x88\xb6\x44\x7f\x6c\xff\x2b\
+\x7f\x21\xfb\x69\x98\x9b\xd1\x7f\x1a\xf3\xc9\x51\xcd\xe5\xac\x27\
+\x25\xe4\xfd\x35\x13\x00\x79\xc5\x4f\x52\x69\x1f\xc0\x04\x86\x0e\
+\x45\x60\x1d\x04\x6a\xce\xfe\x6b\x11\x48\xf2\x36\x16\x7a\x36\xe7\
+\xda\x10\x3b\x8b\x8b\xdd\xfd\xbf\x44\x7f\xec\xd1\xfd\x3f\xd7\xaf\
+\xa7\xae\xcf\x79\x01\x52\x97\x01\x46\x83\x7d\x00\x66\x02\x40\xfb\
+\x00\x06\xfd\x88\xc0\xee\x08\x2c\x31\xdb\x2c\x86\x9c\xe0\x6d\xac\
+\xbd\xfe\x7f\xe7\xf1\x9d\x97\x8b\xdb\xa3\x0c\xaa\x13\x38\x2e\x20\
+\xc7\xe3\x61\xee\x05\x30\x78\x1c\xf0\xce\x71\xc3\x8a\xde\x17\xaa\
+\xe5\xf1\x37\x2b\x5b\x97\x2b\x82\xa5\xc4\x22\xb0\x6e\x02\x4b\xcc\
+\x36\x4d\x88\x25\x78\x1b\x8b\x9f\x70\xb2\xa8\x70\xc2\xfa\xff\x57\
+\x9e\xf9\x4c\x9d\x3d\x13\x17\xda\xa1\xf5\xff\x0b\x70\x52\x2e\x2d\
+\xb0\x0f\xc0\x54\x00\x1c\x4a\xf7\x01\xa4\xc0\x52\x5c\x11\x10\x81\
+\x45\x09\xac\x72\xf6\x9f\xb8\xfe\x6f\xe2\xd9\xbc\xd0\x4b\xb1\x5f\
+\xff\x7b\x21\x8b\x1b\x97\x98\x65\xde\x38\xd1\xe0\x4d\xce\x6c\xb8\
+\x41\xb5\x0c\x8b\x38\x9d\xd5\xcf\x3f\xfe\x6d\xf2\xc6\xc7\xb9\x65\
+\x80\xd3\x25\xd5\x3b\x6b\x2a\x00\x8a\xab\x99\xa0\xcc\x8b\xcb\x52\
+\x06\x22\x20\x02\xd9\x04\xd6\x3a\xfb\xef\x69\xfd\xdf\xc3\x8f\x70\
+\xe3\xc6\xae\xff\xa7\x6e\x4c\xf3\xe5\x17\xfe\xc9\x31\x82\x85\x45\
+\xae\x3a\xf9\x9c\x40\x4b\xdd\x07\x50\xba\x84\x64\x2a\x00\xbc\x5a\
+\x2e\x5c\x06\x18\x12\x15\xfa\xaa\x47\x83\x2a\x2f\x02\x22\x70\x91\
+\x80\xb9\x7b\xb9\xa3\xf5\xff\xd8\x0d\x80\x17\x01\x4d\x2e\x56\x7b\
+\x64\x72\x52\xc6\xf1\xe1\x4f\x1e\xa5\xcf\x82\x8f\xf3\xe8\xfd\xfd\
+\xb9\xfa\xe5\xb6\xdd\x52\xa8\x95\x7a\x90\x4c\x05\xc0\x39\x50\x29\
+\xe7\xb5\x0f\x20\x85\x96\xe2\x8a\x40\x7b\x02\xcc\xfe\x5b\xb9\xff\
+\xcd\xdd\xcb\x09\x5e\xc6\x2e\xd6\xff\x13\x9f\x0d\x6f\x3f\x1a\xf6\
+\x5b\xa2\xb9\x38\x05\x25\xfb\x00\x78\x6d\x14\xcc\x05\x80\xf6\x01\
+\x34\xea\x39\x15\x23\x02\x1b\x27\x60\xed\x5e\x1e\x3f\x1e\x93\xbe\
+\xfc\xc7\x7b\x34\x2b\x32\x8e\x72\xdf\x26\x7c\xfd\xef\x12\x1b\x00\
+\x2b\xe2\xe9\x24\x6b\xfb\x6a\xcc\x7a\x6a\x52\x44\x5f\xc4\x12\xd2\
+\xa5\x16\x98\x0b\x80\x4b\x85\x45\x5d\x43\xa1\x6b\x19\x20\x0a\x95\
+\x22\x89\x40\x6b\x02\x2d\x67\xff\xb9\x2e\x56\x13\x26\xa5\x4b\x99\
+\x26\x95\xe8\x3f\x93\x2a\xb3\xe0\xfe\x9b\xed\x6b\x98\xeb\x9d\xb2\
+\x16\x6a\x25\x4b\x49\xe6\x02\xc0\xab\x66\x7d\x78\xfc\x00\xd1\x1f\
+\x11\x10\x81\x7c\x02\xe6\xc6\xa5\xa3\xf5\x7f\xa8\xc4\xac\xdf\x1e\
+\xee\xc6\xff\x03\xa0\xb9\x0d\x66\x94\x69\x1d\x72\x8d\xa0\x75\x3d\
+\x6a\xe5\x37\x97\xaf\xb5\x97\xca\x97\x97\xe0\xf5\xf1\xf1\x0b\xfe\
+\x98\x0b\x80\x82\xba\x5c\x27\xd5\x3e\x80\x6b\x14\x3a\x10\x81\x6e\
+\x08\xb4\x9c\xfd\xd3\x68\x73\xe3\x82\x77\x91\x8c\x23\x42\x17\xeb\
+\xff\x11\xf5\x5c\x32\x4a\x15\xe3\xb7\x64\x83\x1a\x95\x3d\x27\xd4\
+\x52\x44\x1f\x55\x8e\x5a\x4a\x22\xe2\x89\x50\x45\x00\x14\xef\x03\
+\xe0\x83\xaa\x65\x80\x13\xdd\xa5\x53\x22\xb0\x0f\x02\xd6\x5f\x2f\
+\x3b\x76\xb6\xfe\xef\x7b\x31\x66\xfd\xb6\xf1\xa6\x30\x5f\xaf\xc8\
+\x3f\x8b\x2e\xd1\x44\xd6\xb1\x2c\xda\x7c\xea\xb5\x33\xa8\x22\x00\
+\xb4\x0c\x30\x3f\x70\x14\x43\x04\xd6\x44\xa0\xf5\xec\xdf\x9c\x4d\
+\xc2\x7f\xff\x1b\x0f\xc3\x1b\xe6\xe5\x37\xc8\x50\x33\xf2\x06\x90\
+\x8f\x8a\x30\x5f\xa6\x3a\xca\xbf\xf6\xdb\x2a\x02\xc0\xa2\xd2\x5a\
+\x06\xb0\xa0\xa8\x3c\x44\xc0\x86\x40\xab\xc7\xfe\x42\x6d\xdf\xf8\
+\xf1\xcf\x1e\x84\xe3\xd2\xd7\xd4\xd9\x7f\xed\xff\xfe\x57\xda\x9e\
+\x5e\xd2\xaf\xdd\xf8\xcd\x71\xac\x79\xdd\xf2\xbb\x00\x4a\xea\x59\
+\x4d\x00\x1c\x4a\xbf\x16\x58\xcb\x00\x25\xfd\xaa\xb4\x22\x60\x46\
+\x80\xd9\xbf\x59\x66\x11\x19\x59\xbb\xff\x23\x8a\xfc\x34\x8a\x36\
+\x30\x7f\xca\x62\xe6\xc8\x7c\x8f\xc6\x4c\x79\x3d\x5e\xee\x81\x41\
+\xcc\x66\xd2\x73\xec\xaa\x09\x00\x8b\x65\x00\x79\x01\xce\x75\x9b\
+\xce\x8b\x40\x3b\x02\xad\x67\xff\xe6\x2d\x4b\x71\xff\x3f\x3e\xfc\
+\x8d\x79\xf9\xb9\x19\xa6\x3c\x0f\x9e\x5b\x46\x66\xba\x45\x45\x5a\
+\x66\x9d\xd3\x92\xc5\xc7\x36\x5f\x7a\x69\xb8\xef\xa3\x9a\x00\x00\
+\x5f\xb1\x17\x80\x4c\x14\x44\x40\x04\x16\x23\xd0\x7a\xf6\x4f\x43\
+\xf7\xe0\xfe\x2f\x79\x76\x1b\x46\xa7\xc2\x3b\xbf\xf8\xd0\x6c\xd9\
+\xe4\x54\xfe\xd3\x73\x72\xff\x4f\x69\xac\xf7\xb8\xaa\x00\xf0\x5e\
+\x80\x12\x36\x5a\x06\x28\xa1\xa7\xb4\x22\x50\x4c\xa0\xf5\xec\xff\
+\xbd\x0f\x1f\x35\x33\x62\xc7\x70\xd6\xba\xf9\xef\xb8\x1d\x2d\xde\
+\xf7\xe0\xfa\xae\xd9\xce\xbd\xe4\x5d\x55\x00\x78\x88\x85\x6b\x6a\
+\x5a\x06\xf0\x14\xf5\x47\x04\x9a\x13\x58\xfb\xec\xdf\x03\x4b\x70\
+\xff\xfb\xf8\x2b\xfe\xd3\xca\x28\x2f\x29\xd2\x56\xdc\x3d\x5d\x56\
+\xbd\xba\x00\x28\x5e\x06\xc0\x0b\xd0\x25\x3a\x55\x4a\x04\xb6\x4b\
+\x00\xe3\xbf\xf6\xd9\x7f\xcf\xbb\xff\x8b\xbd\xa3\x67\x86\x9e\xf9\
+\x7a\xf4\x89\x72\x2c\x97\x68\x4e\x64\xdf\xc1\xa9\xfd\x54\xa1\xba\
+\x00\x30\x19\xe8\xfa\x52\xa0\xfd\x8c\x48\xb5\xb4\x0b\x02\xad\x8d\
+\x3f\x8d\x36\x37\x2c\x09\xb3\xff\x2e\xdd\xff\x19\x93\x9f\xda\xfb\
+\x00\x34\xfb\x67\xa4\xde\x0c\x39\x5f\x06\x74\xd1\x5b\x93\x68\xef\
+\xc6\x82\x8d\xab\xd5\x05\x80\x47\xa5\x65\x00\x8f\x41\x7f\x44\x60\
+\x0d\x04\x98\xfd\xb7\xae\xa7\xb9\x61\x49\xbc\x89\x6e\xe5\xab\x7f\
+\x2f\x1a\x16\x83\x4e\x35\x17\x69\x06\x75\xb2\xce\x22\x35\x3f\xeb\
+\x7f\xee\x93\x5a\x7e\x49\xfc\x26\x02\xc0\x64\x19\x20\xf1\x03\x5d\
+\x02\x45\x69\x45\x60\xaf\x04\x30\xfe\x5b\x98\xfd\x8f\x9f\x0c\x2f\
+\xa6\xf4\xa1\x89\xa7\x32\xa5\xc0\x8a\x71\x6b\x2d\x03\xbc\xfd\xc1\
+\x2f\xdf\xac\x58\x6d\x65\xbd\x00\x81\x26\x02\xc0\x7f\xb8\xe4\x05\
+\x58\xa0\x7b\x55\xa4\x08\xa4\x11\x58\xc2\xf8\x9b\xcf\xfe\x69\xf2\
+\xda\xdd\xff\xb4\x21\x33\xbc\xfa\xa3\x0f\xcc\x0d\x35\x7d\x54\xdb\
+\xbb\x90\xd9\x5c\xe3\x64\xf5\xb3\xab\x25\xd0\x72\x6a\xde\x44\x00\
+\x50\xb1\x92\x75\x0a\xd2\x0f\x19\xeb\x61\x3e\x9d\xfe\x88\x80\x08\
+\x44\x11\x60\xf6\x1f\x15\xd1\x38\x92\xb5\x5b\xb9\xe7\xcd\x7f\x37\
+\xd0\xc5\x4c\x8a\x32\x3d\x9f\x18\xec\x1b\x65\x15\xbc\x21\x2f\xeb\
+\x3e\x2a\xa8\x4e\x77\x49\xe7\xfe\xbb\xdf\x71\x85\xe7\xf6\x0c\xa4\
+\x7a\xaf\x8e\xf3\x4f\x79\xdf\x4c\x00\x58\xac\xb1\xa5\x7e\xb0\x53\
+\x40\x28\xae\x08\xec\x99\x00\xc6\x5f\xb3\xff\xed\x8c\x00\x0c\xb6\
+\xc5\x4c\x73\x6f\xc6\x7f\x8d\x23\xa0\xc4\xb6\x36\x13\x00\x16\xcb\
+\x00\x43\x82\x5b\x6f\x8d\x1d\xa9\x3a\x8b\xc0\x12\x04\xf8\xc7\x24\
+\x4b\x18\x7f\x0c\x14\x86\xca\xb2\xcd\x5b\x9b\x24\x94\xcc\x06\x59\
+\x0a\xc0\x80\xe7\xf0\xa5\x6f\x58\xf3\xb7\xee\x9f\x9c\xba\xf4\x9c\
+\x06\xe1\x9c\x5a\xbf\xd9\x6f\x51\x7c\xdc\x6e\xff\x4a\x33\x01\x00\
+\xa4\xe2\xcd\x80\x2e\x93\xad\x7d\xc0\x5d\x93\xf4\x2b\x02\x8b\x12\
+\x78\xf5\xf9\xcf\xdf\x5f\xa2\x02\x73\xae\xd0\xac\x3a\x25\x4c\x12\
+\x78\xf4\x6f\xc9\xff\xfc\x17\x75\x3f\x4c\x34\x06\xc7\xcc\x30\xe0\
+\x29\x22\x20\x18\x7e\xc4\xc3\xfe\xd6\xfc\x8f\xe9\xd5\x79\x3f\xcb\
+\xb5\xe1\x72\x77\x53\x01\x20\x2f\x40\x9d\x01\xa5\x5c\x45\x20\x97\
+\xc0\xdb\x5f\x7d\x7e\x11\xe3\x8f\x51\xc2\x38\xe5\xd6\xfb\x54\x3a\
+\x4d\x0e\x4e\x51\x19\x06\x38\xbf\xf2\xc3\xf7\x5f\x83\xf9\xa9\x18\
+\x18\x7d\x02\x33\x7e\x19\xfe\x53\x84\xce\x9f\x4b\x7d\x04\x10\xce\
+\xe7\x73\xcb\xb8\x12\xb3\x8f\xe4\x42\xb6\x4d\x05\x00\xf5\x88\x52\
+\xbd\x44\xbc\x10\xf4\x41\xbf\x00\x47\x97\x44\x20\x92\x00\xee\xcb\
+\xd4\x0d\x4c\x91\x59\xcf\x46\xc3\x28\xcd\x46\x4a\x8d\x90\x30\xfb\
+\x1f\xdc\x8d\x73\xc9\xd9\x7f\x74\xd3\x0c\x67\x83\x30\x47\x08\x1c\
+\x07\x8c\x3e\x61\x76\x66\x1a\x5d\xe9\x75\x46\xcc\xa9\x75\xea\xe7\
+\x67\xd6\xeb\x95\xb8\xe9\xb3\x74\x73\x7d\x73\x01\x20\x2f\x40\xce\
+\x30\x53\x1a\x11\xb0\x25\x80\xf1\x5f\x62\xdd\x9f\x56\x9c\x9b\x89\
+\x72\x2d\x37\xa4\x4e\x0a\x4a\x6f\x9c\xb9\xf5\x9c\xa6\xf3\xf7\xc2\
+\xe9\x89\x73\xc7\x89\x46\xe1\x5c\x36\x3a\x6f\x4b\x80\xbd\x33\xb6\
+\x39\x0e\x43\xc9\x9e\x8f\x21\xe3\xa7\xb9\x00\xa0\x8e\x16\x5e\x80\
+\x41\x1f\x0a\x50\x2a\x88\x40\x32\x81\xa5\x8d\x3f\x33\xd1\xe4\x4a\
+\xcf\x25\x48\x99\xfd\xbb\xbc\xba\x99\xfd\x3b\x4f\x84\xab\x8e\x7e\
+\x17\x27\x90\x5e\x81\xaf\x3d\xfb\xb9\xa4\x2f\x9b\xa2\x84\x2a\x63\
+\x9f\x8c\x33\xc3\x22\x02\xc0\x2b\xdf\xc2\x81\xaf\xff\x12\x98\xd9\
+\xe3\x4a\xb6\x6b\x02\xcc\x5a\x96\x9a\xf9\x03\xbe\xc6\x0d\x30\x79\
+\xf6\x7f\x18\xde\xa0\x2e\x6b\x09\xba\xd7\xf5\xd9\x53\xa9\x9f\xa3\
+\xa8\xf5\xff\x44\x21\x5b\xf2\x08\x20\x54\x17\x11\x00\x14\x7c\x18\
+\x3e\x79\x83\xd7\xec\xc0\xda\x98\xbc\x00\xd9\xf8\x94\x70\x7f\x04\
+\x30\xfe\x4b\xed\xf8\x87\x76\x0d\xd7\x3f\xf9\x0e\x89\x37\xcd\x6e\
+\x66\xff\xae\xf2\x87\x98\xfb\x20\xf7\x3a\x17\x57\xbf\xf5\x08\xa4\
+\xe6\xcc\x67\x29\x35\xcd\xec\xfa\x7f\x6a\x86\x2e\xbe\x9f\x4c\xbb\
+\xd7\xdc\xdf\xc5\x04\x80\xaf\xb8\xbc\x00\xb9\xfd\xa6\x74\x22\x90\
+\x44\x80\x1b\xd6\xd2\xc6\x5f\xb3\xff\xa4\x2e\xbb\x19\x59\x93\x9d\
+\x9b\x3c\x16\x7e\x57\xc3\xfd\xbf\x84\x27\x6b\x31\x01\x40\xff\x45\
+\xa9\x5f\x22\x9e\x0b\x28\x63\x7d\x30\xce\xd1\xd1\x79\x11\xf0\x04\
+\x96\x36\xfe\x54\xa2\x86\xf1\x27\xdf\xd4\xd0\xd3\xec\x9f\xba\x5b\
+\x4c\x84\xc8\x47\xa1\x84\x40\x7a\xda\xc5\x1f\xff\x4b\xaf\xf2\xc9\
+\x14\x8b\x0a\x00\x8b\xc1\xaf\xf5\xb1\x93\xfd\xaa\x93\x22\xe0\x09\
+\xf4\x60\xfc\x6b\xb9\xfe\xfd\x8c\x29\xc1\xfd\xcf\x17\xff\x78\x28\
+\x2b\xfc\xa3\xfb\x5c\x3f\x9d\xc6\x67\xca\xfc\xf1\x3f\x9a\x97\x30\
+\x96\x89\x6e\x21\x66\x17\x15\x00\x34\xc2\xc2\x0b\xe0\x6f\x04\x64\
+\xa6\x20\x02\x22\x70\x4d\x80\x1b\xd5\x92\x6e\x7f\x2a\x82\xf1\xaf\
+\x36\xfb\x5f\xe0\x86\x49\x9b\xac\x43\xd4\x3d\x50\xde\x4e\x6b\xec\
+\xd7\xf9\xa5\x1e\xf4\xe0\xfe\x4f\xad\xf3\xb9\xf8\x8b\x0b\x00\x0b\
+\x2f\x80\xdf\x04\xa4\xa5\x80\x73\x7d\xac\xf3\x3b\x24\xc0\xa3\x7e\
+\x5b\x36\xfe\xa9\xa2\xbf\xe7\xd9\xbf\xbf\x07\xee\x70\x8c\xae\xb5\
+\xc9\xa9\xbb\xff\x11\xc1\xd6\x6d\xb5\x1a\xcf\x8b\x0b\x00\xc0\x44\
+\x29\x60\x22\x5e\x08\x72\x91\x5d\x80\xa3\x4b\xbb\x22\x80\xf1\x4f\
+\xbd\x49\xd5\x00\x54\x6b\xe6\xef\x8d\xff\x46\x66\xff\xd7\xdc\x23\
+\x36\x44\xeb\x1e\x77\x4d\xcb\xf0\x20\x2d\x2b\x3e\x5b\x69\x29\x22\
+\x63\x27\x8e\xe7\xc8\x5c\x67\xa3\x75\x21\x00\xbc\x02\x8e\xf8\x00\
+\x5c\x6c\x8d\x5c\x64\x17\xf1\xe8\xe2\x3e\x08\x70\x83\xea\xc1\xf8\
+\xf3\xbd\xf2\xd5\x88\x27\xfe\x83\x1c\xab\xd9\x52\xb5\xf6\xb8\x8c\
+\xa3\x26\x41\xba\xc7\x39\x52\xcb\xfe\xe6\x7c\xb6\xe6\x84\xb0\x17\
+\xb7\xf9\xb5\xa0\x00\x00\x10\x00\x49\x44\x41\x54\xb4\x89\xcd\xb2\
+\x58\xff\xa7\xc8\x2e\x04\x00\x15\x89\xfa\x00\x10\xf1\x42\x18\x3f\
+\x1e\x16\xf9\xc7\x26\x17\xaa\xa4\x4b\x22\xd0\x8c\x00\xff\xd8\x27\
+\xe7\x06\x65\x5d\x41\x5c\x9e\xb5\xbe\x57\x7e\xfc\x78\xbc\x37\x60\
+\x08\x23\x2b\x8d\xf1\xb7\xba\x59\x46\x16\x99\x15\xcd\x4f\x82\x22\
+\x52\xca\x0b\x10\x01\x29\x21\x4a\x4a\x54\xc4\x75\x4a\x7c\xe2\xf2\
+\x59\xe0\xf5\x62\x58\x50\xd0\x76\x23\x00\xf8\x00\xf0\x61\xbd\x08\
+\x2a\xe2\xe2\xc8\x0d\x22\x22\x9e\xa2\x88\xc0\x56\x08\xb0\xd9\x0f\
+\xe3\x9f\xba\x33\xb9\x46\xfb\xb9\xe1\xcd\xcd\x78\x8a\xca\x4d\x74\
+\x95\x96\x7e\x53\x5a\x51\x5d\x53\x13\xc7\x78\x41\x13\xc4\x4f\x6a\
+\xf1\x8a\x7f\x99\x40\xaa\xb8\x8e\xf9\x2c\x78\x7b\xb5\x60\x9f\x76\
+\x23\x00\x40\xef\x95\x7a\xcc\x87\x80\xc8\xe7\x02\x37\x08\x6d\x08\
+\x3c\x47\x47\xe7\x37\x46\x80\x59\x09\x9b\xfd\xf6\x60\xfc\xfd\xcd\
+\x32\xa1\xff\x98\x50\x30\xb1\x48\x48\xb2\x68\xd4\x58\x2f\x68\x2a\
+\x87\x45\x1b\xd5\x75\xe1\xf1\x95\xe3\x73\x16\x1f\xbb\x6e\x4c\x6f\
+\x27\x8d\x8a\xe8\x4a\x00\xd0\xa6\xd8\x0f\x01\x71\xcf\x05\xb9\xc9\
+\xce\x91\xd1\xf9\x2d\x11\x60\xd6\x9f\x3a\x2b\xa9\xd5\x7e\xbe\xe7\
+\xbc\xe6\xcc\xdf\x1b\x3d\xc4\x7d\x42\x03\x2c\x6f\x94\x09\xc5\x66\
+\x47\x8d\x16\x2b\x89\x1c\xb2\x2b\xa4\x84\x9e\x00\xc6\x3f\xf5\x73\
+\x16\x33\xfb\xf7\x99\x27\xf6\x25\xa2\xd6\xa7\x33\xfa\xd3\x9d\x00\
+\xf0\x1f\x82\x52\x2f\x80\x73\xa9\xf8\x1b\x86\x11\x24\x65\x23\x02\
+\x3d\x11\xc0\xe5\xff\xce\xd7\x5f\x78\xab\x87\x59\x7f\xe0\xf2\xea\
+\x8f\x3e\x78\x33\x1c\x57\x79\x5d\xf8\x46\x59\xa5\x4d\xa7\x32\x8d\
+\xbd\xf7\xc9\xcb\x79\x8a\x5e\xd2\xb9\xd8\xc8\xa9\xc6\x3f\x36\xdf\
+\x1c\x1b\x65\x2d\x6a\xbb\x13\x00\xc0\xb3\xf0\x02\xf8\xef\x06\x20\
+\x33\x05\x11\xd8\x10\x01\x66\x23\xb8\xfc\x7b\x6a\x52\xd5\x1d\xff\
+\xae\xa1\xa9\x37\x4a\x66\x49\xd6\x37\x4a\x57\x8d\x26\xbf\xb1\xf7\
+\x3e\x79\x39\x9b\x74\xc7\xc0\xe7\x2d\xb5\xa4\xb5\xcc\xfe\x69\x57\
+\x97\x02\x00\x2f\x00\x1f\x62\x2a\x58\x12\xc6\x47\xa3\x9e\x0a\x28\
+\x01\xa8\xb4\xdd\x10\x60\xd6\xdf\x93\xcb\x3f\x80\xc1\xf8\xd7\xda\
+\xf1\x1f\xca\x48\x15\xf3\x6b\x35\xfe\xb4\x97\x7b\xdf\x10\xe3\x05\
+\x70\x5e\xce\x41\x5e\x00\x90\x65\x86\xf9\x64\x18\xff\xd4\xd9\x7f\
+\xec\x52\x58\xaa\xa8\x9d\xaf\x6d\x5e\x8c\x2e\x05\x00\x4d\xf1\x1f\
+\xe2\x98\x0f\x02\x91\xcf\x05\xf7\x21\xe9\x05\xf4\xb9\x2a\xea\xbc\
+\x08\xcc\x11\xe0\x46\xc4\xac\xbf\x27\x97\x3f\x75\x66\xa6\x53\xdb\
+\xf8\xa7\x8a\xf8\xf1\x30\xbc\x41\xdd\xd6\x1c\x0e\xc3\x27\x6f\xc4\
+\xd4\x7f\xd4\x63\xcf\x31\x98\xb2\xe2\xf0\x99\x4b\x35\xfe\x14\xf4\
+\xce\x2f\x3e\x7c\xc0\xeb\xa5\x30\xf2\xa4\x5a\xc6\x92\x96\xb7\x89\
+\x97\x32\xce\xb8\xd6\xad\x00\xa0\x2d\x87\xc8\x0f\x02\x71\xcf\x06\
+\x40\x4b\x29\x9f\xc5\xa3\x0b\xfd\x12\xe8\x75\xd6\x0f\xb1\xf7\x3e\
+\x7c\xf4\xa0\xe6\xa6\x3f\xca\xf0\x37\x4a\x27\xe2\x39\x8e\x0d\x35\
+\x6e\x92\xb1\x65\x5b\xc5\x8b\xf6\x02\xb8\x02\x53\x05\x92\x4b\xa2\
+\xdf\x61\x18\x2e\x41\xe0\x73\x97\x63\xfc\xf9\x4c\x44\x09\xe2\xc4\
+\xe7\xfe\x2f\xd5\xb5\xf4\x5a\xd7\x02\x20\xe5\x83\x70\x09\x84\xd6\
+\xcb\x2e\xd1\xd1\xb5\xde\x08\x70\x03\xc2\xdd\xdf\xe3\xac\x1f\x56\
+\xdc\xe8\x9a\x18\x7f\xc4\x3b\x05\x46\x86\x2d\xcc\xfe\x43\x53\xa3\
+\x27\x3f\x08\x24\x4d\x70\x02\xb6\xe2\x57\x3e\x7b\x7c\xee\x52\x33\
+\x8a\xfd\x4c\xe4\x88\x5a\xc6\x75\x2d\x61\xdb\xb5\x00\xa0\x13\xa2\
+\x3f\x08\x44\x3e\x17\xdc\x87\xc4\x83\x3f\x77\x5d\xe7\x45\xa0\x03\
+\x02\xdc\x7c\x7a\x36\xfc\x20\x8a\xbd\xd1\x11\xb7\x28\x64\x18\xff\
+\x5a\x37\xc9\xa2\x76\x64\x26\x4e\x99\xfc\x68\x82\x93\x0a\xf9\x7c\
+\xfc\x1c\xe3\x1f\xbb\xee\xef\x4b\x4d\x1c\xd7\x3e\x4d\xc5\x3f\xdd\
+\x0b\x00\x3e\x08\x28\xa0\x62\x06\x0e\xbc\x44\x40\x31\x45\x65\x50\
+\x89\x40\xef\x86\x9f\x66\xb7\x32\xfe\x39\x6e\xed\x2d\x19\x7f\x58\
+\x13\xa2\x27\x3f\x9a\xe0\x80\xab\x38\xf0\x19\x4c\xcd\x04\xe3\x1f\
+\xfb\x08\x6c\x96\xfd\x19\xc7\xef\xd5\x1c\xdb\xdd\x0b\x00\x3a\xc4\
+\x03\x70\x20\x38\x2e\x0a\x4e\x04\x68\xe7\x6c\x11\x41\x25\x36\x24\
+\xc0\x8c\x9f\xcd\x46\xbd\x3d\xd3\x7f\xaa\x89\xcd\x8c\x3f\x1b\xa4\
+\x9c\x41\x3b\x55\x87\x73\xe7\x4c\x26\x08\xe7\x32\x5f\xf0\x3c\x93\
+\x9f\x21\xf6\xbe\xa7\x7b\x5b\x74\x4f\x1d\x47\xe4\x73\x88\xf1\x4f\
+\xdd\x64\x9b\x6c\xfc\xe9\xa3\xe3\xc2\x67\xde\x47\x8b\xc0\x99\x7c\
+\xce\x5d\x5e\x85\x00\xa0\xf2\xef\x7c\xe3\x2b\xdf\x8a\xfe\x30\x90\
+\xe0\x4c\x90\xbb\xec\x0c\x18\x9d\x6e\x46\x20\xdc\x70\x70\x37\xe6\
+\x6c\x36\x6a\x56\xd1\xab\x82\x9a\x1a\xff\xc4\x9b\x24\xc6\xdf\x4f\
+\x10\xae\xea\xba\xb5\x17\x7f\xdf\x8b\x6c\x94\xee\x6d\x91\xa0\x26\
+\xd1\xf8\x2c\xf2\x39\xac\x69\xfc\xfd\xa4\x33\x71\x5c\x53\x45\xc6\
+\xb6\x17\x81\xbc\xa9\x14\x56\x23\x00\x68\xbf\x89\x1a\x72\xb3\x8b\
+\x2c\x57\x0c\x15\x50\x10\x81\x02\x02\xdc\x6c\x98\x69\xe4\xdc\x70\
+\x0a\x8a\x2d\x4a\xda\xca\xf8\xfb\x4a\xa6\xde\x24\xdd\xec\x78\xcb\
+\xc6\xdf\x33\x71\x7f\x30\x04\xee\x65\xfe\x57\xf7\xb6\x79\x46\xc3\
+\xa7\x51\xf0\xbe\xf1\x59\xfc\xf4\x4c\xdc\x11\x33\xff\x98\xc7\xfd\
+\x42\x6e\xb9\xc2\xac\xc5\xd8\x5e\x95\x00\x40\x0d\x45\x7f\x18\x02\
+\xfd\x53\xaf\xee\x46\x23\x11\x70\x0a\x8c\xce\x59\x13\xc0\xe8\x73\
+\xa3\xc1\xcd\xcf\xcd\x26\x75\xa6\x61\x5d\x9f\x94\xfc\xf8\x92\x9f\
+\xda\xbb\xfd\x43\x7d\x72\xd6\xfd\x53\x66\xc7\xa1\x9c\x35\xbe\x7a\
+\x43\xe0\xc4\x4e\x54\xdd\x75\x6f\x8b\xc2\xc4\x67\x32\xc7\xfb\x86\
+\x20\x66\xcd\x3f\xea\x71\x3f\x57\x13\x6f\x67\x9c\x30\x73\x87\x49\
+\xbf\x26\x76\x2e\xa2\xc4\x55\x09\x00\xda\x93\xf4\x61\x20\xc1\xb9\
+\xe0\x3e\x28\xde\x35\x73\xee\xba\xce\x8b\x40\x01\x01\x0c\x7f\x98\
+\xed\xe7\xdc\x68\x0a\x8a\x36\x49\x8a\xf1\x8f\xbd\xc9\x95\x16\x98\
+\x73\x93\x6c\x75\x83\x2c\x6d\x9b\x55\xfa\x24\xef\xa7\xee\x6d\x67\
+\xb1\x73\x81\xcf\x65\xce\x67\x12\xe3\x9f\x22\x88\xfd\xb8\xa6\x2f\
+\x28\x34\x21\x30\xb6\xbd\x9d\x4b\x48\x93\x1b\x75\x75\x02\x80\x86\
+\x5a\x29\xff\x5c\xd7\x0c\x75\x50\x10\x81\x63\x02\xc1\xe8\xaf\x71\
+\xb6\x1f\xda\x82\x7b\xb3\xb9\xf1\x4f\xbc\x49\xb6\xbc\x41\x06\x2e\
+\x4b\xbf\xa6\x7a\x3f\x47\xbe\x25\x50\xdf\x0f\x70\xa3\xdb\xc2\xe7\
+\x33\xc7\x0b\xc7\x67\xa2\x85\xf1\xa7\xc2\x8f\xef\x3c\xfe\x1e\xaf\
+\x2d\xc2\x2a\x05\x00\x60\x0e\xe3\xe3\x6f\xf1\x5a\x14\x9c\x6b\x26\
+\xc7\xf5\x58\x54\xa6\x12\x6f\x86\x00\x37\x14\x02\x33\x8a\x35\x1b\
+\xfd\xd0\x21\x18\xff\x14\xf7\x66\x48\x97\xfd\x8a\x81\x4a\x34\xfe\
+\x6c\x04\x6e\x35\x3b\xca\x6e\x57\xa5\x84\xbe\xdd\xb1\x4b\x01\xae\
+\x0e\x9a\xe0\x38\x08\x57\xbf\xb8\xfc\x5f\x7d\xfe\xf3\xf7\x53\x8d\
+\x3f\x9f\x89\x57\x7e\xf8\xfe\x6b\x49\xde\xb0\x9c\x71\x7d\x55\x4f\
+\xc4\x2d\x62\xef\xea\x6d\xf5\x97\xd5\x0a\x00\x20\x01\xab\x98\x10\
+\x22\x80\x47\x8f\x8a\x33\x52\x06\x7b\x20\x10\x0c\x3e\x46\x9f\x35\
+\x7d\x42\xea\x4d\xa5\x47\x4e\xb8\x37\x31\xfe\xcd\xea\xe6\x6e\x92\
+\x7e\x96\x9a\x58\xa0\x95\xf7\x2f\xb1\xd8\x6e\xa2\x27\x2d\x05\x70\
+\x6f\xd3\x3f\x44\x1b\xf8\xac\xa6\xba\xfc\x31\xfc\xcc\xfa\x93\x3f\
+\x13\x99\xe3\x9a\x01\x86\x3d\xf3\x22\x8f\x37\x8d\xc2\x6a\x05\x00\
+\x7c\x3c\xac\x04\x45\x4c\x9a\x93\xc1\xcd\x42\x46\x89\x80\x93\x68\
+\xf6\x7e\x12\x83\x4f\xe0\x26\x32\x9d\xe5\x6f\xc1\xe8\x87\xbe\xc5\
+\xf8\xa7\xb8\x37\x43\xba\x92\xd7\x11\x17\x75\x62\x06\xdc\x20\x13\
+\x93\x6c\x2e\x7a\xf2\xc4\x67\xe7\x22\x80\x99\x7f\xf8\xac\xc6\x0e\
+\x86\x60\xf8\x93\x66\xfd\x57\x99\xe7\x8c\x6b\x9f\xd4\xd9\x31\x6f\
+\xcf\xfc\x9b\x76\x7f\x56\x2d\x00\xc0\x64\x36\x23\x90\x08\x00\xe7\
+\xee\x03\xc6\x9e\x30\x35\xf8\x5b\x99\xe5\x9f\xea\x5c\x6e\x76\xcd\
+\x8d\x7f\xc6\xac\x14\xe3\xbf\xc4\x0d\xf2\x14\xb3\xa5\xcf\xc1\x01\
+\x1e\xd1\xf5\x40\x04\xec\x70\x82\xc3\xe7\x38\x76\xe6\xcf\x8c\x1f\
+\x21\x9c\xec\xee\x0f\x9d\xc0\xcc\x3f\x63\x5c\x87\xe4\x49\x9e\x9d\
+\x90\xc8\xe0\x75\xf5\x02\x00\x06\x26\xfb\x01\xc8\x48\x22\x00\x0a\
+\xbb\x0b\xdc\x28\x98\x29\x60\xf4\x31\xf6\x84\xd4\x59\xc3\xda\xa0\
+\x71\xc3\xc3\xf8\xe7\xcc\x72\x4a\xda\xea\xf7\xdc\x38\x83\x94\x94\
+\xc7\x42\xb3\xa3\xa4\x3a\x36\x8e\x8c\x08\x60\x3f\x44\x74\xb1\xdc\
+\xdb\x0a\x0c\x54\x74\x39\xdd\x46\x3c\x5d\xb1\xf0\x39\xc0\xd5\x9f\
+\x2d\x84\x31\xfe\x78\xb4\x52\xc7\xf5\x55\x95\x10\x73\x78\x76\xae\
+\xde\x36\x7d\xd9\x84\x00\x00\x1e\x10\x4d\xc8\xb9\x0f\x8a\x1e\x0f\
+\x34\x21\xd9\x75\x26\x18\x7d\x0c\x3e\x01\x83\xcf\x4c\x61\xeb\x46\
+\x3f\x74\x08\x33\x1d\x6e\x78\xcd\x8d\x3f\xb3\xd0\x8c\x9b\xa4\x99\
+\x97\x2f\x00\xd8\xc8\x6b\xf2\xac\xd1\xb1\xf7\x02\x6c\x23\xed\x9f\
+\x6b\x06\xe3\x9b\xb1\x7e\x2a\xde\xd4\xf0\x13\xef\x54\x9c\xa8\x73\
+\xc1\xf8\x47\x45\xbe\x1d\x09\xbb\xe5\xc5\xdc\xed\x4b\x4d\xce\x6c\
+\x42\x00\x40\x0a\x88\xc0\xe4\xb8\x34\xf8\x75\x1c\xd7\xb1\xa5\xf9\
+\x28\x7d\x5f\x04\x30\xfa\x84\x60\xf4\x31\xf8\x84\xbe\x6a\x59\xb7\
+\x36\xcc\xfa\xb3\x67\x3a\x05\x55\x1b\x31\xfe\x88\xeb\xc4\x3c\xcc\
+\xbc\x7b\x89\xe5\xae\x21\x3a\x13\x9f\x64\x3e\x88\x80\x5f\x8f\x6f\
+\xed\x65\x92\xc3\x58\x67\xcc\x4f\x03\x6e\x7e\x0b\x01\xcc\x98\x1e\
+\x99\xf9\x67\x0e\x16\xec\x15\x76\x2b\x33\xb9\x49\xb2\xcd\x08\x00\
+\x68\x00\x13\xa8\x1c\x97\x06\xdf\xb1\x12\x01\xa5\x18\xbb\x48\x3f\
+\x35\xfa\xcc\xf6\xf7\x66\xf4\xe9\x84\x30\xe3\x29\x9a\xed\x90\x51\
+\x46\x18\x33\x8d\x3f\x9f\x65\x8c\x5c\x46\x91\xbb\x49\x02\x9f\x64\
+\x11\xe0\xe8\x8c\xce\x70\x8d\xf4\x8b\x3b\xde\xfa\x2f\x63\x7e\x1a\
+\x2c\xda\xeb\xd9\x65\x08\xda\xeb\xb2\x3b\x59\xd6\xda\x94\x00\x00\
+\x2e\x22\x20\x69\x6d\x8c\x44\x67\xc2\xe8\x3e\x24\x67\x2e\xe9\xf4\
+\x0a\x08\x4c\x0d\xff\x1e\x8d\x7e\xe8\x22\xdc\xa0\x16\x33\x9e\x90\
+\x5f\xca\xeb\x88\x91\xc9\xb8\x51\x62\xfc\xfd\x67\x39\xa5\xb0\x9d\
+\xc6\x45\x04\xc0\x2b\xb9\xf9\xae\x5f\x7c\xff\x24\x27\x5c\x5b\x02\
+\xdb\xfa\xfa\x65\x14\xc7\x2e\x3b\x57\x67\xfc\x7b\x59\xd6\xda\x9c\
+\x00\xa0\x53\x3c\x5c\x07\x99\xe3\xd2\xe0\x3b\xbb\x34\x13\xa5\x6f\
+\x4e\x80\x4d\x7d\x7b\x9d\xed\x07\xd8\x61\xd6\x8f\x1b\x34\x9c\x6b\
+\xf9\xea\x8d\x4b\xc6\x8d\x12\x63\x26\xe3\x9f\xd6\x53\xf0\x82\x5b\
+\x5a\x2a\x17\xdb\xf5\x8f\xee\x71\x8e\x43\xcc\xaf\xf3\x08\x8f\x2c\
+\x9f\xb8\x65\x94\x98\xe8\x27\xe3\x38\xbb\xe4\xed\xd3\xc9\x8b\xed\
+\x4f\x6e\x52\x00\x80\xd1\x43\x76\xb0\x39\x2e\x0a\xae\xb3\xf5\x01\
+\x29\x22\xd8\x34\x71\x98\xf5\xb3\xa9\xaf\x69\xc1\x9d\x15\xb6\xe4\
+\xac\x1f\x14\x32\xfe\x50\x68\x1b\xb2\x45\x00\xf7\x38\x67\xd8\x7c\
+\x9f\xb5\xad\x72\x93\xd2\x2c\x0a\x81\xcd\x58\xea\x11\x76\xf6\x28\
+\x79\xe3\xa6\x45\xe5\x2f\xe4\xb1\x59\x01\x40\x9b\xcd\x60\xf3\x01\
+\xe1\x11\x1a\xa7\x00\xc9\x57\xa1\x4f\x02\x18\x7f\xcd\xfa\x7f\xfb\
+\x90\x0d\x4f\x4b\xcd\xfa\x19\x19\xa3\xdc\xfe\x60\x58\x24\x64\x8b\
+\x00\x6a\x8b\x37\x80\xbe\xe3\x58\xe1\x09\x01\x77\xcf\xf7\x13\x40\
+\xc7\xe6\xc9\x89\xcc\xbf\xce\xf8\x33\x29\x65\xb9\x26\x33\x87\x2a\
+\xc9\x36\x2d\x00\x80\x9d\xb3\x41\xe6\x24\x69\x44\x00\x0a\xd0\x0d\
+\x88\x93\xd7\x75\x72\x71\x02\x18\xff\xc5\x2b\xb1\x60\x05\x96\x9e\
+\xf5\xd3\xf4\x5c\xe3\xcf\xbe\x1d\x8c\x17\x79\x28\x94\x11\x80\x63\
+\xd6\x72\x00\xc5\x3a\x43\x87\x9b\xdb\xf7\x23\xef\x57\x1f\xf2\x1b\
+\x80\xe1\x1f\xb9\xe7\xbb\x7b\x7f\x7e\x2e\x2e\xe5\x95\xf1\x77\x47\
+\xdd\xfd\x6e\x5a\x00\x40\xdb\x54\x04\xb8\x0c\xfd\x80\x90\x08\x70\
+\x24\xfa\xfa\x65\xcd\xbf\xaf\x1a\xb5\xab\x0d\x6b\xfd\x3c\xda\xb4\
+\xe4\xac\x9f\xd6\x8e\xcc\x1e\x9d\x01\xe1\x38\x29\x74\x7c\x83\x4c\
+\x6a\x47\x47\x91\x11\x01\x45\x93\x1f\xd7\x8f\x7b\x15\x02\x8c\x63\
+\xda\x3e\x94\x1a\x7e\x37\x1e\x10\x62\xcc\xfc\xdd\x61\x97\xbf\x9b\
+\x17\x00\x50\x47\x04\xd0\x11\x1c\x5b\x84\xd1\xa9\xc2\x91\x9b\x9d\
+\x45\x66\xca\xa3\x98\x00\xae\xff\x3d\xae\xf9\x63\xf8\x71\xf7\xb3\
+\xc3\xbf\x18\x62\x61\x06\xcc\x96\x06\x67\x34\x92\xb3\x91\xf1\x4f\
+\x46\x16\x9b\x80\xfb\x5e\x91\x08\xa0\x20\xd7\xa7\xdc\xeb\x08\xbc\
+\x5d\x5b\x48\xaa\xaf\x9b\xd8\x65\x8f\xe3\x13\x05\x61\x73\x10\x62\
+\x27\x2e\x75\x73\x6a\x17\x02\x00\xda\x74\x04\x1d\xc2\xb1\x49\xb8\
+\xfa\x60\x98\xe4\xa5\x4c\x8a\x08\x7c\xed\xd9\xcf\xbd\x58\x94\xc1\
+\xca\x12\x4f\x0d\x3f\xcf\x37\x2f\x5d\x7d\x7f\xd3\xcc\x9c\x2d\x99\
+\xed\xd3\x59\x1a\x42\xa7\xe5\x23\x02\xde\xf9\xe6\x0b\x63\xd1\xbd\
+\xcf\xdd\xeb\x10\x77\x88\x00\x42\xa7\x4d\xcd\xaf\xd6\x95\xe1\x1f\
+\xdd\xc4\xce\x62\xd6\x4f\x45\xe0\x8d\xcd\xe1\xb8\xe7\xb0\x1b\x01\
+\x40\x27\xd0\x21\x74\x0c\xc7\x26\xc1\x7d\x30\x46\x79\x02\x4c\x50\
+\x96\x64\xf2\x95\x67\x3e\xb3\x1b\x01\xd0\xc3\x3a\xff\xb4\xaf\x8a\
+\x8c\xff\xf8\xf8\x5b\x18\xa8\x69\x7e\x3a\xae\x43\xc0\xe4\xde\xe7\
+\xee\x77\x5e\x08\x3c\x1a\xef\xaf\xe3\xbe\x77\x99\x25\x6d\x60\xfc\
+\x8e\x86\x86\x9f\xbd\x2c\x78\x5d\xe0\x7d\xb9\xf4\x3e\xae\xee\x4a\
+\x00\x80\x9c\x8e\x19\x0f\xc3\x1b\x1c\x9b\x04\xf7\xa1\x18\x25\x02\
+\x4c\x50\x2a\x93\xf3\x04\x30\xfc\x3d\xac\xf3\x5f\xd7\x90\x59\xd3\
+\xaf\xc7\xb7\x72\x67\x4c\xdc\x24\x65\xfc\xaf\x69\x36\x39\x30\xbb\
+\xf7\xe1\xed\xe1\xbe\xe7\xfa\x9f\x7b\x1f\xa1\x49\x03\x2c\x0a\x61\
+\xdc\x22\x60\x5c\xdd\x11\x33\xb9\xe3\xf7\x64\x55\xae\x96\xb3\xd6\
+\x34\xae\x77\x27\x00\xe8\x38\xb3\x0f\x02\x99\x11\xf8\x30\x48\x04\
+\x40\x42\xc1\x98\x40\x77\x86\x9f\xf6\x71\x13\x65\xd6\xc4\x71\x46\
+\x90\xf1\xcf\x80\x66\x94\x84\x7b\x5f\xf1\x92\xc0\xb4\x2e\xee\xde\
+\x87\x21\x65\xd3\x9c\x17\x02\x6e\x6c\x4c\x2f\x2f\x79\x7c\x5d\xb6\
+\xab\x93\x9f\xe9\x3b\xa3\x3f\x32\x6e\x11\x30\xd7\x17\x6d\x0e\x98\
+\x54\xf6\xbc\xd9\xef\x5c\x2b\x77\x29\x00\x80\xc1\x07\x81\x4e\xe3\
+\xd8\x24\xb8\x0f\x02\x83\xcc\x24\x2f\x65\x92\x44\xe0\x27\x8f\x7e\
+\xfb\x30\x29\x41\xe7\x91\xc3\x1a\x7f\x57\x33\xfe\xc0\x8c\x9b\x29\
+\x37\xd1\xf0\x3e\xe5\x95\x19\x92\x5b\x8f\x5e\xd3\x0c\x29\xa5\x79\
+\x6b\x8a\x6b\x7e\xff\xa3\xf1\xdc\x03\xdd\xd8\x08\x62\x60\x64\x52\
+\xe4\xc6\x0b\x97\x9a\x06\x57\x26\x65\x73\x3f\x7e\x52\x97\xe1\xfe\
+\x50\xc1\xe8\xfb\x36\xb9\x31\x8d\xa0\x85\xa7\x7f\xbf\xb2\x3f\xbb\
+\x15\x00\xf4\x13\x9d\x66\x2a\x02\xdc\x20\x7b\x32\xe0\xc6\x7b\xe4\
+\xaf\xd0\x86\xc0\xdf\x7d\xf4\xab\x4d\x08\x80\x60\xf8\xd9\xd5\xdf\
+\xc3\xe6\xbe\xe3\xde\x1b\xdd\x0d\x7d\x74\x37\xf8\xe3\xf3\x51\xef\
+\xdd\x8d\x72\x8d\x33\xa4\xa8\xb6\xad\x34\x12\xf7\x3f\x53\x6f\xc0\
+\x94\x83\x13\x03\xde\x33\xe0\xc6\x4b\xb8\x27\x8e\x7e\xfc\x8c\xf7\
+\x06\x67\xa0\xa7\x51\x8b\x8e\xc9\xcb\x85\x91\xbc\xaf\x5c\xfb\xa3\
+\x2b\x73\xf8\x64\xb8\x57\xcd\xe8\x5f\x55\x18\xdb\xc1\x98\x5e\xb3\
+\xa0\xdd\xb5\x00\xa0\x1f\xf9\x10\xa0\xe0\x38\x36\x0b\x6e\xf0\x8f\
+\x6e\x40\x9a\xe5\xa7\x8c\x2e\x12\xc0\x58\x62\x3c\x2f\x46\xea\xf8\
+\x22\x75\x0f\x8f\xf3\xd1\x96\xee\xaa\xca\x0d\xd6\xdd\x5c\x07\x37\
+\xae\xb3\xea\x26\xe3\x9f\x85\xad\x55\x22\xee\x81\x18\xb3\xaa\xe5\
+\x31\x76\xae\xc2\xe8\x0c\xb4\x17\x05\xb8\xe4\xdd\xb8\xf2\x33\x75\
+\x5e\xdd\x3d\x73\x3c\x17\xb8\x3e\x0d\xa4\x25\x90\x97\x0b\x7e\x6c\
+\xba\x09\x58\xd5\x36\x84\xcc\x19\xcf\xce\x93\x05\xb7\x70\x6a\xad\
+\xaf\xbb\x17\x00\x74\x1c\x0a\x4e\x22\x00\x12\xeb\x0d\xef\xfc\xe2\
+\xc3\x07\x6b\xaa\x7d\x30\xfa\xb8\xf9\x7b\x9d\xf1\x7b\x9e\x18\x7f\
+\x6e\xb0\x99\x37\x57\x0c\x0b\xb3\x24\x9f\x97\xfe\x74\x4b\x00\x63\
+\x56\xcd\x1b\x70\xa9\xd5\x8c\xab\x10\xae\x04\x82\x37\xe6\xc7\xc7\
+\x21\x4e\x78\xbd\x94\xe7\x30\x0c\x55\x2e\x3b\xc3\x8f\x9d\xd8\xd2\
+\x78\x96\x00\xb8\x1a\x29\x88\x00\x3e\x00\x83\xeb\xe4\xab\x53\xe5\
+\x2f\x6e\x10\x7b\xa5\xeb\x54\x6d\x79\x66\xca\xe1\x12\x01\x66\xce\
+\xef\x7d\xf8\xa8\x6b\x11\xb0\x1a\xa3\x7f\x05\xfa\xc9\x6c\x6c\xb8\
+\x7f\xf5\x36\xf9\x05\xe3\x8f\x61\x49\x4e\xa8\x04\x8b\x11\xa0\xbf\
+\xb8\x0f\xd2\x77\x8b\x55\xa2\xb7\x82\x9d\x4d\x08\x86\x1f\x3b\xd1\
+\x5b\xf5\x4a\xea\x23\x01\x70\x44\xcf\xab\x3b\xd7\xe1\x47\xa7\xcb\
+\xde\x22\x04\x24\x02\xca\x18\x46\xa4\xe6\xab\x70\x7b\x12\x01\x18\
+\x7c\x02\xee\xfd\xee\x67\xfa\x53\xbe\xcc\xfa\x9d\xbb\xd5\xcf\xc4\
+\xa6\xe7\x13\x8e\x31\x20\x18\x93\x84\x24\x8a\xda\x11\x01\xfa\x6e\
+\xbd\x42\xc0\x08\xa4\xb3\x03\x5b\x35\xfc\x81\x90\x04\x40\x20\x31\
+\x79\x45\x04\x70\x03\x9b\x9c\x2a\x3f\x94\x08\x28\x67\x18\x91\xc3\
+\x92\x22\x00\x63\x4f\xc0\xe0\x13\x70\xed\x13\xf0\x4e\x44\x54\xbd\
+\x8f\x28\x18\xff\x02\x97\x3f\x8d\xe0\xb3\x83\x01\xe1\x58\x61\xdd\
+\x04\xe8\xc7\xdd\x09\x81\x1d\x18\xfe\x30\x2a\x25\x00\x02\x89\xa3\
+\x57\x06\x3e\x37\xb2\xa3\xd3\x65\x6f\x11\x01\x7e\xe3\xca\xa8\xa7\
+\x04\xca\x48\x5e\x4c\x8d\x08\x60\xc6\x8d\x37\x80\x70\x31\x72\xc1\
+\x45\x8c\x3d\xf9\x63\xec\x09\x18\x7b\x02\x06\x9f\x50\x90\xf5\x22\
+\x49\x47\xe7\xa5\x1a\x31\xfe\x05\xa5\x33\x63\xe2\xb3\x53\x90\x85\
+\x92\x76\x48\x80\x3e\x0d\x42\xc0\xfc\xbe\x68\xdc\xde\xec\xec\x76\
+\x64\xf8\x03\x23\x09\x80\x40\xe2\xc4\x2b\x83\xbe\xca\x60\x47\x08\
+\xb8\x9b\xed\x89\x22\x75\xca\x90\x00\x42\x80\x30\x15\x03\x18\x6d\
+\x42\x6c\x31\xc4\x25\x4c\x0d\x3d\xc6\x9e\x3c\x31\xf6\xe4\x8f\xb1\
+\x27\xc4\xe6\xd9\x5d\x3c\x66\xfd\x85\x2e\x7f\xda\x84\xf1\xdf\xda\
+\x1a\x29\xed\x52\xf8\x94\x00\xf7\x44\x42\x10\x03\x9f\x5e\x59\xe9\
+\x51\x30\xfa\xdf\x7c\x61\xc4\xf3\xbb\xb7\xf1\x2b\x01\x30\x33\x6e\
+\x19\xec\xd5\x44\x80\xbb\xe9\x8e\x12\x02\x33\x3d\x60\x73\x19\x43\
+\x4d\xc0\x68\x13\x30\xe0\x04\x8c\x79\x08\xbc\x3f\x0e\xc4\x25\x90\
+\x16\x23\x1f\x82\x4d\xad\x96\xcf\x85\xf1\x37\x32\xeb\x67\x77\x75\
+\x6e\x75\xdc\x4d\x14\x83\xb0\xb7\x9b\x67\x2e\xae\xad\xa4\xe3\xde\
+\x48\xbf\x23\xfc\xfc\x3d\xd2\x8d\x83\xe5\xdb\x16\x51\x03\x57\x4f\
+\xea\x4c\xdd\xf7\x68\xf4\xa7\x84\x24\x00\xa6\x34\xce\x1c\x87\x81\
+\xee\x07\xf9\x99\x38\x59\xa7\xb9\xe9\xca\x1b\x90\x85\xce\x2a\x51\
+\x30\xe8\xbc\x5a\xe5\xb9\x8a\x7c\x8c\x66\xfd\x7c\x26\xb8\x89\xae\
+\xa2\xcd\xaa\x64\x15\x02\x08\x3f\x7f\x8f\xfc\xc6\x57\xbe\x85\x51\
+\x65\x4c\x10\xaa\x14\x96\x93\xa9\x33\xf8\xd4\x47\x46\xff\x36\x3c\
+\x09\x80\xdb\x4c\xce\x9e\x61\x90\x33\x90\xce\x46\xc8\xbd\x80\x08\
+\xd0\xde\x80\x5c\x7a\x4a\x97\x42\xe0\xca\xf0\x17\xcf\xfa\x5d\x99\
+\xdc\x50\xf9\x4c\xb8\x43\xfd\x8a\xc0\x35\x01\xc6\x04\x01\x31\x40\
+\xe0\x9e\x49\xf0\x8f\x58\x3b\x63\x7c\x1d\xb1\xc2\x41\x28\x83\xf2\
+\x18\x9f\x94\x8f\x40\xa5\x3e\x08\x95\x1a\x45\xae\x39\x4f\x09\x80\
+\xc4\xde\x63\x20\x31\xb8\x12\x93\xc5\x45\x47\x08\xb0\x24\xe0\x6e\
+\xd2\x71\x09\x14\x4b\x04\xe2\x09\x8c\x6e\x6c\x8d\xa5\xee\x7e\x8a\
+\x73\x37\x71\x6e\xac\xba\xa1\x02\x43\x61\x8e\x00\xf7\x4c\x02\x86\
+\xd8\x07\xb7\xde\x8e\x71\x26\x70\x2f\x9d\x86\x60\x4e\xa1\x59\x87\
+\x00\x00\x10\x00\x49\x44\x41\x54\xc0\xe7\x5e\x43\x1a\xf2\x20\x30\
+\x1e\x7d\xc0\x0b\xe1\x02\xe5\x69\x7c\xce\xf5\xcc\x30\x48\x00\xcc\
+\x33\xba\x15\x83\xc1\xc5\x60\x63\x10\xde\xba\x58\x7a\xc2\x8b\x80\
+\xe1\xfe\xe8\x6e\xd6\xa5\x59\x29\xbd\x08\x78\x02\x4e\x50\xf2\x75\
+\xab\x25\xcf\xf5\xfb\x7c\xdc\x1f\xc6\x3c\x37\x71\x77\xa8\xdf\x08\
+\x02\xff\xe9\x07\xff\xfb\x65\xc2\xb7\xff\xf6\xfd\xef\xbc\xf2\x83\
+\x9f\xbc\x7b\x2b\x7c\xff\xfd\xc3\x2b\x31\xe1\x28\x2d\xf9\x85\x40\
+\xfe\x11\x55\xe9\x2a\x0a\xc6\x99\xc0\xbd\x74\x1a\x18\x5b\x31\x21\
+\xa4\x21\x0f\xc2\x93\xc6\xe9\x6f\x2a\x01\x09\x80\x54\x62\x93\xf8\
+\x0c\x42\x6e\x88\x93\x53\x76\x87\x08\x01\x2d\x0b\xd8\xf1\xdc\x69\
+\x4e\x18\xfe\xd1\x68\xd6\xcf\x4c\x8b\x31\xbf\x53\x94\x17\x9b\x8d\
+\x11\x26\xdc\x30\xf0\xce\xb0\x8f\x87\x3b\xef\x12\x0e\xe3\xf0\xfa\
+\x70\x38\xbc\x7c\x2b\x0c\x91\x3f\x47\x69\xc9\x2f\x84\xd1\x95\x71\
+\x2d\x22\x9c\x50\x58\xb3\x30\x88\xa4\xa1\x68\x46\x04\x24\x00\x0a\
+\x41\x72\x43\xac\x26\x02\xa8\x1b\x42\x40\xde\x00\x48\x28\x24\x10\
+\x18\xdd\x98\xe1\x6b\xa8\x07\x36\x9a\x26\xa4\x3b\x19\x15\x97\xbf\
+\x73\xab\x6a\xa6\xf5\x29\x9d\x1b\xc6\x7e\x62\xe8\x6f\x18\xf8\x4f\
+\xa3\xb7\x3b\x72\x42\xe1\x96\x30\x98\x88\x82\x76\x15\x69\x5f\x92\
+\x4a\x4c\x27\x20\x01\x90\xce\xec\x56\x0a\x44\x40\xb5\x25\x01\x4a\
+\x43\x04\xc8\x1b\x00\x09\x85\x39\x02\x86\xee\x7e\x8a\x42\xdc\xe2\
+\x92\xe5\x78\xcf\x01\x83\xcf\xcc\xda\xcf\xf0\xaf\x0c\xfe\xb5\xb1\
+\xef\x1d\xcc\x44\x14\x78\x4f\x81\x04\x41\xef\x3d\xd6\xac\x7e\x12\
+\x00\x86\xa8\x11\x02\xdc\x30\x0d\xb3\xbc\x99\x95\x84\xc0\x4d\x1e\
+\x7a\xf7\x29\x81\x2b\xc3\x3f\x5a\xb8\xfb\xc9\xd5\xcd\xfa\xf7\xee\
+\xf2\xc7\xe8\x4f\x0d\x3e\x33\x6b\x6f\xf4\xe1\xb3\xe6\x70\x24\x08\
+\x10\x36\x84\x35\x37\x69\x18\x54\xfb\x1c\x02\x12\x00\x39\xd4\x2e\
+\xa4\x41\x04\x54\xf5\x06\x50\xb6\x84\x00\x14\x14\x20\x60\x6d\xf8\
+\x5d\x9e\x88\x58\x66\xfd\x7b\x74\xf9\x1f\x1b\xfd\x4d\x18\x7c\xd7\
+\xa7\x97\x7e\x11\x36\x04\xbc\x03\x08\x01\xc2\xa5\xf8\xba\xb6\x1d\
+\x02\x12\x00\x95\xfa\x12\x21\xc0\x8d\xb4\x52\xf6\x4f\xb2\x9d\x08\
+\x81\xd1\xad\xf9\x3e\x39\xa9\xbf\xbb\x20\x50\xc1\xf0\xf3\xe8\xd5\
+\x1e\x67\xfd\x18\x7d\x02\xb3\xfd\xf1\x70\xe7\xdd\x3d\x18\xfd\x73\
+\x9f\x11\x84\x00\x21\x88\x01\xb8\x9c\x8b\xdb\xd3\x79\xd5\x25\x8f\
+\x80\x04\x40\x1e\xb7\xa8\x54\x88\x80\xea\xde\x00\x6a\xe2\x84\x00\
+\x8f\x78\x21\x02\x08\x9c\x52\xd8\x26\x01\xfa\x97\xcd\x7d\xa3\x95\
+\xab\x1f\x4c\x57\xee\xfe\xbd\xcd\xfa\x31\x6e\xc1\xe8\xef\xdd\xf0\
+\x33\x0c\x8e\x03\x42\x00\x2e\x30\x92\x57\xe0\x98\xce\x36\xde\x4b\
+\x00\x34\xe8\x47\x84\x00\x33\xab\x16\x1e\x01\x09\x81\x06\x1d\xba\
+\x40\x11\xa3\xf3\xf0\x60\xf8\xe9\x5f\xcb\xe2\x19\x93\x7b\x36\xfc\
+\x7b\x9e\xed\x47\x8f\xa3\xab\x3d\x03\xc1\x2b\x10\x9d\xae\x59\x44\
+\x15\x94\x4b\x40\x02\x20\x97\x5c\x62\x3a\xd6\x53\x11\x02\xdc\x70\
+\x13\x93\xa6\x47\x0f\x1e\x01\xfd\xb3\xa1\x74\x76\x3d\xa5\x08\x6e\
+\xfe\x5f\x8f\x6f\x59\x1b\xfe\x3d\xba\xfb\xa7\x33\x7e\x19\xfe\xbc\
+\x81\x8e\x57\x40\x42\x20\x8f\x5d\x8f\xa9\x24\x00\x1a\xf7\x0a\x22\
+\xa0\xc9\xb2\x00\xed\xe2\x19\x70\x27\x06\x98\x39\xfa\x19\xa4\x9b\
+\x45\x72\x5a\xa1\x63\x02\xce\xe8\x0f\x2e\x98\x7d\x81\xcf\x89\xa6\
+\xe2\x8d\xda\xd3\xac\x5f\x86\xff\xc4\x20\x28\x3c\xd5\x93\x10\x28\
+\x6c\xca\xae\x93\x4b\x00\x2c\xd4\xfd\x08\x01\xef\x0d\x70\xeb\xaf\
+\x4d\xaa\xe0\x84\xc0\xe0\x42\x10\x03\x83\x33\x32\x4d\xca\x55\x21\
+\x71\x04\x5c\x7f\x04\xa3\x3f\x5a\xae\xef\x4f\x4a\x67\xbc\x21\x3e\
+\xf1\x46\x4d\x4e\x6f\xf6\xb0\x7b\xc3\x3f\x0e\x0f\x87\xe3\x70\x77\
+\x78\x30\x5c\x0a\xc7\xf1\x17\xee\x3d\x09\x81\x85\x3b\xa0\xb0\x78\
+\x09\x80\x42\x80\x25\xc9\x11\x01\xcc\xc4\xb8\x31\x97\xe4\x93\x9c\
+\x16\x21\xe0\x8c\xcc\xb5\x18\x48\xce\x40\x09\x4c\x08\x04\xa3\xef\
+\x5c\xfc\xb5\x8c\xbe\xaf\xa7\x13\x99\xcc\xfa\x19\x6f\xfe\xfd\xc6\
+\xff\x74\x65\xf8\x83\xc1\x76\x46\xfd\xf0\xf4\xf0\xa6\x0f\x9f\x3d\
+\xbc\x76\x20\x3c\x73\x78\xf3\x70\x1c\x9e\x3e\x3c\x38\x5c\x0a\xc7\
+\xf1\xc9\x87\xe0\xf2\xbe\x16\x0e\x94\xd9\xb8\x8f\xbd\x10\xb8\xfa\
+\x82\xa1\xb6\x45\xab\xb4\x12\x02\x12\x00\x25\xf4\x8c\xd2\x72\x63\
+\x66\x66\xd6\x5c\x08\x50\x7f\xc4\x80\x37\x40\xe3\xbd\x51\x4b\x04\
+\x10\xa9\x1b\x82\xd1\xf7\xfb\x33\x86\xfb\x03\xcb\x34\xb5\x4a\xbc\
+\x32\xfc\x88\xcc\xbd\xcc\xfa\xd9\xad\x3e\x2e\xf9\x28\x9f\x33\xbe\
+\xde\xc8\x3b\x83\x7c\xc3\xc8\x3b\xa3\x3e\xdc\x3d\x3c\xf4\xa1\x46\
+\x7f\xbb\xbc\xaf\x85\x03\x22\x01\x51\x40\x70\xf5\xb8\x16\x06\x35\
+\xca\x9d\xe6\x79\xb5\x59\x90\x3e\x98\x9e\xd6\x71\xbf\x04\x24\x00\
+\x3a\xea\x9b\xa5\x85\xc0\x70\x2c\x06\x9c\xb1\xea\x08\xcf\x7a\xab\
+\xe2\x38\x7a\xf7\xfe\xd4\xe8\xcb\xf0\x9b\xf6\x67\x98\xf5\x33\x13\
+\x35\xcd\x78\x2e\xb3\x13\x06\xdf\x1b\x79\x67\x90\xe7\x92\x36\xb9\
+\xee\xea\x71\x2d\x0c\xa6\x82\xc0\xd5\xbb\x56\xf9\xf4\x41\xab\x8d\
+\x82\xb5\xda\xb0\x97\x7c\x25\x00\x3a\xec\xe9\x45\x85\x00\x3c\x9c\
+\x10\xf0\x62\x60\xb2\x4c\x20\xef\x00\x60\x22\x03\x06\xdf\x79\x53\
+\xbc\xd1\xf7\xde\x95\xe1\xc9\x4c\xbf\xa6\xd1\xa7\x6a\x3b\x9c\xf1\
+\x07\xc3\x3f\xb6\x9c\xf5\x3b\xe3\xe9\x67\xf9\x18\x54\x37\xdb\xee\
+\xca\xe0\x33\x0e\x2e\x85\x20\x08\x5c\xbd\xf1\x50\xd4\xf4\x0e\x78\
+\x21\xa0\x65\x81\x4b\xbd\xb1\xf8\x35\x09\x80\xc5\xbb\xe0\x7c\x05\
+\x16\x17\x02\xa1\x6a\x41\x10\x60\xcc\x08\x18\x37\x17\xc2\xe5\xdd\
+\xbf\x9e\x32\xf8\x30\xab\x6d\xf0\x03\xf8\x1d\x1a\x7e\x9a\x8e\xab\
+\xb9\x99\xe1\x3f\x65\xf4\xa9\xc4\xca\xc3\xd4\x3b\x50\x45\x0c\x54\
+\x5d\x16\x58\x39\xfc\x0e\xaa\x2f\x01\xd0\x41\x27\xcc\x55\x61\x2a\
+\x04\x16\xd9\x27\x70\x5c\x41\x8c\x9b\x0b\x7e\x13\xe1\x1e\x05\x81\
+\x33\xf8\x83\x0b\x37\x66\xf8\x8e\xc7\xd0\xca\xe0\x87\xfe\xd8\xa9\
+\xe1\xa7\xf9\x18\x7f\x66\x98\x1c\x57\x0b\xc1\xe8\xbb\x75\x74\x36\
+\xeb\xf9\x99\x7e\xb5\xc2\x96\xcf\xf8\x96\x18\x30\xac\x12\x7d\x45\
+\x9f\x19\x66\xa9\xac\x0c\x08\x48\x00\x18\x40\x6c\x95\x05\x42\x80\
+\x80\x08\x20\xb4\x2a\x77\xb6\x1c\x8c\x9f\x0b\xd7\x82\xc0\xaf\x75\
+\x8f\x7e\x53\xe1\x88\xa7\xc0\x19\xcb\xd9\x3c\x7a\x8b\x40\x9d\xaf\
+\x82\x37\xf4\xb4\x89\xe0\x05\xcf\x70\x7f\x74\xcb\x23\x43\x6b\x83\
+\x1f\x18\xed\xd8\xf0\x07\x97\x3f\x06\x25\xe0\x30\x7f\x0d\x86\xdf\
+\xb9\xc9\xbd\xd1\x77\x6e\x73\xf3\x32\x3a\xcf\xd0\x8b\x01\xb7\xc4\
+\x61\xe9\x15\xa0\xcf\x2c\xf7\x06\x74\x8e\x70\x15\xd5\x93\x00\x58\
+\x45\x37\xdd\xac\x24\x22\x80\x80\x08\x20\xdc\xbc\xda\xc1\x3b\x0c\
+\xa3\x13\x04\xc3\x55\xc0\x58\x9e\x12\x07\x03\x06\x76\xe9\xea\x52\
+\x07\x17\x46\x27\x54\xae\x0d\xfd\xc4\xc8\x8f\xc1\xd0\xd3\x26\xc2\
+\x52\xf5\x0d\x46\xff\x9b\x2f\x8c\x7b\xda\xd5\x3f\xc5\xcd\x0c\x72\
+\xac\xb9\xd6\x7f\x6c\xf8\xa7\x85\xef\xf4\xd8\x0b\x01\xff\x04\xc3\
+\xd5\xf7\x13\x18\x70\x40\x08\xd0\x97\x06\x59\x29\x8b\x42\x02\x12\
+\x00\x85\x00\x97\x4c\x8e\x08\x20\x84\x47\x08\xbb\x14\x03\xc7\x80\
+\x30\xa2\xa7\x84\x01\x46\x97\xc0\x2c\x7b\x1a\x30\xcc\x27\x82\x17\
+\x0f\xce\x70\x4f\x5f\xc7\x13\xf1\xae\x8d\xfa\x34\x4f\xca\x09\xc1\
+\x19\xf8\xd1\x85\x81\x3a\x51\x37\xc2\x71\x9d\x97\x7c\x1f\x0c\xff\
+\x37\xbe\xf2\xad\xbd\x3c\xca\x77\x0a\x37\x06\x03\xc3\x71\xea\x5a\
+\xf1\x39\x19\xfe\x59\x84\xd6\x42\x80\xbe\xa4\x4f\x67\x0b\x3e\x1b\
+\x41\x17\x2c\x08\x48\x00\x58\x50\xec\x20\x0f\x84\x00\x21\x88\x81\
+\x0e\xaa\x94\x57\x05\x0c\xf0\x34\x60\x98\x4f\x04\x8c\xf6\x71\xf0\
+\x46\xfc\x38\xee\x34\xaf\x70\x9c\x57\xb3\x76\xa9\x82\xd1\xdf\xf1\
+\x6c\x3f\xc0\xae\xea\xf2\x97\xe1\x0f\x98\xa3\x5f\x83\x10\xb8\x7e\
+\x82\x20\x3a\xe5\xed\x88\x88\x00\x96\x04\xe8\xe3\xdb\x57\x75\xa6\
+\x05\x01\x09\x80\x16\x94\x1b\x97\x11\x84\xc0\x61\x7c\xfc\xad\x55\
+\x78\x05\x1a\xf3\xe9\xb2\x38\x19\xfd\x5b\xdd\x82\x61\xa8\xe2\xf2\
+\x97\xe1\xbf\xc5\x3a\xe7\x04\x62\xc0\xef\x11\xc8\x49\x3c\x49\x43\
+\x1f\xa7\x7a\x03\x26\xc9\x75\x58\x40\x40\x02\xa0\x00\x5e\xef\x49\
+\x71\x19\x07\x31\x80\x10\x20\xf4\x5e\xe7\x5d\xd5\xcf\x19\xfd\xc1\
+\x05\x84\xda\x5e\xd7\xf5\xcf\xf5\xf7\xb5\xf1\x3f\x17\x21\xf7\x3c\
+\x5f\xc9\x1b\x36\xf7\xe5\xe6\xa1\x74\xd7\x04\x10\x01\x56\xde\x00\
+\x89\x80\x6b\xac\xcd\x0e\x24\x00\x9a\xa1\x5e\xb6\x20\x84\x00\xe1\
+\x7a\x89\xc0\x19\x9e\x65\x6b\xb4\xe3\xd2\x1d\xfb\x60\xf4\x65\xf8\
+\x6f\x8f\x03\x0c\x01\xb3\xc2\xdb\x57\x0a\xce\x84\x59\x3f\x1b\xda\
+\x0a\xb2\x51\xd2\xd3\x04\x2c\x84\x00\x4b\x02\xf4\xfd\xe9\x12\xa6\
+\x67\x75\x6c\x45\x40\x02\xc0\x8a\xe4\x8a\xf2\xf1\x42\xe0\x1b\x5f\
+\xf9\x16\x62\x00\x43\xe4\x3d\x03\xce\x28\xad\xa8\x09\xeb\xaa\xaa\
+\x63\x0b\x67\x02\xcc\x65\xf4\xcf\x77\x1f\x06\x00\x43\x70\x3e\x46\
+\xe2\x95\x60\xf8\x35\xeb\x4f\x04\x97\x17\x1d\x21\x50\xb2\x2c\x40\
+\xdf\x33\x06\xf2\x4a\x57\xaa\x54\x02\x12\x00\xa9\xc4\x36\x16\xff\
+\x7a\x99\xe0\x4a\x10\x20\x06\x08\xb8\xa6\x37\xd6\xd4\x76\xcd\x39\
+\x63\xf0\x61\xdd\xae\x12\xeb\x2b\x89\x1b\x3f\x06\xc0\xac\xe6\x18\
+\xff\x9d\x1b\xfe\x3f\xfb\xc2\xb3\x2f\x12\x5e\xff\x83\x2f\xdd\x3b\
+\x0e\x9c\x37\x63\x3d\xc9\x08\x11\x50\xb2\x2c\xc0\x18\x60\x2c\x4c\
+\xb2\xbc\x71\xa8\x37\x76\x04\x24\x00\xec\x58\x6e\x22\x27\xbc\x03\
+\x04\x66\xa9\xcc\x56\x11\x03\x84\x4d\x34\xae\x56\x23\x9c\xc1\x87\
+\xd1\xf1\x0c\x5f\x06\x3f\x1e\x38\x37\x7c\x6e\xfc\xf1\x29\x66\x62\
+\x86\xb5\xfe\x99\x68\x5b\xbc\x8c\x61\x7f\xfb\xab\xcf\xdf\x7f\xe7\
+\xeb\x2f\xbc\xf5\xea\xf3\x9f\xbf\x4f\x78\xe9\xb9\x67\xee\x1d\x07\
+\xce\x13\x27\x08\x03\x6b\x16\x08\x81\x5c\x6f\x00\x63\xe1\x95\x1f\
+\xfc\xe4\x5d\xeb\x3a\x29\xbf\x9b\x04\x24\x00\x6e\xf2\xd0\xbb\x23\
+\x02\x88\x01\x02\x62\x80\x80\xa1\x23\xec\xd6\x43\xe0\x8c\x3d\x6d\
+\x87\xc1\xd4\xe0\xc3\x48\x06\xff\x68\xf0\x44\xbe\x35\x35\xfe\xcc\
+\xfa\xf9\xea\xde\x0a\x6b\xfd\x7f\xfc\x3b\x9f\xfb\x32\xe1\xbf\x3c\
+\xff\xf9\x97\x08\x6f\xfc\xe1\x97\xbe\x7d\x2a\x70\x8d\x40\xdc\x48\
+\x04\x66\xd1\x30\xe6\x18\xf6\x2f\x3e\xfd\x99\x17\x63\x33\x0d\xc2\
+\x20\x88\x81\xd8\x74\x31\xf1\x4a\x44\xc0\x70\x38\xbc\x7c\x5b\x04\
+\xc4\x94\xaa\x38\xb1\x04\x24\x00\x62\x49\x29\x9e\x27\x80\xa1\x23\
+\x04\x0f\x01\xa2\x00\x43\x88\x41\x24\x60\x1c\x7d\xc4\xb5\xff\x39\
+\x32\xf4\xb4\x91\xb6\xfa\x76\xbb\xe5\x12\x18\xc8\xe0\x97\x77\xb2\
+\xb9\xf1\x37\x76\xf9\x63\xc4\x83\x91\xff\xcf\xff\xf6\xdf\x7c\x9b\
+\xf0\xef\x9f\x7b\xe6\x25\xc2\x17\x9f\xba\xfb\xe5\x53\x81\x6b\x04\
+\xe2\xfe\xb7\x3f\xfa\xf2\x7f\x25\x3d\x82\xa0\x9c\xd6\xe5\x1c\x30\
+\xfe\x18\xf3\xcb\xb1\x2e\x5f\x25\x3d\xf9\x5c\x8e\x95\x76\x15\x11\
+\x90\xbd\x24\xe0\x44\x00\x63\x24\xad\x44\xc5\x8e\x25\x20\x01\x10\
+\x4b\x4a\xf1\xce\x12\xc0\x10\x62\x10\x09\xde\x40\xf2\x05\x36\x2e\
+\x60\x34\x11\x05\x21\x74\x27\x0e\xae\x8c\x3c\xf5\xa2\xae\x21\x9c\
+\x32\xf4\xb4\xf1\x2c\x00\x5d\xc8\x22\xc0\x8d\x1d\x57\x6f\x56\xe2\
+\xe3\x44\x86\x2e\xff\x60\xf4\x31\xde\x18\xf1\x60\xe4\x8f\x8b\x8c\
+\x7d\x4f\x7a\x04\x01\xf9\xd5\x12\x02\x18\x6d\x8c\x77\x6c\x9d\x2e\
+\xc5\x23\x1f\xbc\x01\x2c\x25\x5c\x8a\x97\x7a\x0d\x21\x90\xb3\x24\
+\xc0\x18\x61\xac\x50\x9e\x82\x2d\x01\x09\x00\x5b\x9e\xca\x6d\x42\
+\x00\xa3\x89\x28\x08\xe1\x58\x1c\x04\x83\x1b\x5e\x83\x50\x98\xbe\
+\x62\x9c\x6f\x85\x50\xc6\xc4\x80\x87\x38\xd3\xb4\x1c\x87\xbc\x8f\
+\x5f\xa7\x46\x9e\x7a\x51\xd7\x10\x42\xf6\x7a\xad\x47\x80\x1b\x3a\
+\x37\x76\x93\x12\x30\xfe\x06\x2e\xff\x60\xf8\x83\xd1\x37\xa9\xdb\
+\x51\x26\xb5\x84\x00\x46\xfb\xa8\xa8\xe2\xb7\x2c\x25\x48\x04\x14\
+\x63\xec\x3a\x03\x09\x80\xae\xbb\x67\xbb\x95\x0b\xc6\x76\xfa\x1a\
+\x84\xc2\xf4\x15\xe3\x7c\x2b\x38\xef\xc2\xb1\x01\x0f\x71\xa6\x69\
+\x39\x9e\xe6\x3f\x3d\xde\x2e\xd9\xfe\x5b\xc6\x97\xfc\x58\x19\xff\
+\x83\xc1\x7a\x3f\xb3\x72\x66\xe7\x35\x0d\xff\x71\xaf\x20\x04\x28\
+\xf7\xf8\x7c\xce\x7b\x66\xff\x39\xe9\x62\xd2\xbc\xf2\x85\xe7\xee\
+\xc5\xc4\x4b\x89\x93\xef\x09\x18\x5e\x47\x38\xa6\x94\xa5\xb8\x97\
+\x09\x48\x00\x5c\xe6\xa3\xab\x22\x20\x02\x86\x04\x30\xfe\x56\x5f\
+\xf2\x83\xf1\x1f\xee\x1e\x1e\xe6\x56\x2f\xcc\xf8\x31\xc6\xb9\x79\
+\x94\xa4\xa3\x5c\xf6\x07\x94\xe4\x41\xda\xaf\x3c\x13\xbf\xe1\x8f\
+\xf8\x29\x81\xcd\x84\x3c\x51\x90\x92\x26\x26\x2e\x22\xc0\xf7\x5f\
+\x4c\xe4\x49\x1c\x84\xa3\x44\xc0\x04\x48\xe1\xa1\x04\x40\x21\x40\
+\x25\x17\x01\x11\x88\x27\x60\x62\xfc\xaf\x76\xfa\xe7\x1a\xff\x60\
+\xf8\x5b\xce\xf8\xcf\x11\x62\x7f\x40\xa9\x08\xc0\x48\x9f\xcb\xdf\
+\xe2\x3c\xf9\x5b\x2f\x05\xf8\x7a\x39\xf1\x96\x22\x02\x7c\x1a\xf7\
+\x07\x11\x80\x90\x74\x87\xfa\x2d\x24\x20\x01\x50\x08\x50\xc9\x45\
+\x40\x04\xe2\x08\x98\xcc\xdc\x30\xfe\x05\x3b\xfd\x71\xbb\xf7\x60\
+\xf8\xa7\xc4\x10\x01\x88\x92\xe9\xb9\xde\x8e\xd9\x0f\x50\xa5\x4e\
+\x88\x80\xcf\x1e\x5e\x1b\xc6\x21\xc9\x93\x33\x0e\x77\x5f\x1f\xf4\
+\x53\x4c\x40\x02\xa0\x18\xa1\x32\x10\x01\x11\x98\x23\x80\xf1\x67\
+\xe6\x36\x17\xef\xe2\x75\x67\x24\x0e\x18\xff\x8b\x91\xce\x5f\xc4\
+\xf8\xe3\x76\x3f\x1f\x63\xb9\x2b\x88\x92\xe5\x4a\x8f\x2b\xb9\x8a\
+\x17\xe0\xaa\x68\xdf\xaf\xae\x7f\xaf\xde\x9e\x78\x39\x3a\x75\xd0\
+\x77\x04\x1c\x11\xc9\x7a\x2b\x01\x90\x85\x4d\x89\x44\x40\x04\x62\
+\x09\x98\x18\x7f\x57\x98\x37\x12\xee\x35\xf5\x97\xd9\x35\x6e\xf6\
+\x5e\x8d\x7f\x68\x0f\x02\x25\x1c\xa7\xbc\xfe\xfc\xe3\xdf\x26\xcd\
+\x9e\x53\xf2\x9e\xc6\xad\xb1\x21\x70\x9a\xff\xe1\xa9\xe1\xc1\xf4\
+\xfd\xec\xb1\x13\x01\x8c\xad\xd9\x78\x8a\x70\x96\x80\x04\xc0\x59\
+\x34\xba\x20\x02\x22\x60\x41\xa0\x78\xe6\xef\x2a\x91\xb3\x56\xec\
+\x92\x0d\x18\x7f\x66\xd7\xb8\xd9\x79\xdf\x73\xe8\x5d\xa0\xb0\x17\
+\xa0\x2a\x3f\x96\x03\x9e\x1e\xde\x3c\x55\xc6\xb9\x73\x8c\x2d\xed\
+\x07\x38\x47\x67\xfe\xbc\x04\xc0\x3c\x23\xc5\x10\x01\x11\xc8\x24\
+\x60\x31\x43\xf3\xc6\xdf\x19\x87\xd4\x2a\x30\xa3\xc6\xf8\xa7\xa6\
+\x5b\x32\x3e\x82\x25\xb5\xfc\x77\x7e\xf1\x61\xda\xcc\x39\xb5\x80\
+\x49\xfc\x9a\xcb\x00\xbe\x18\xd7\xcf\xbe\xbf\xfd\x9b\xb8\x3f\xa3\
+\xf6\x03\x0c\xb9\x3f\x12\x00\xb9\xe4\x94\x4e\x04\x44\xe0\x22\x01\
+\x8c\x3f\x33\xb4\x8b\x91\xe6\x2e\xde\x75\x6e\x61\x67\x14\xe6\xa2\
+\x1d\x5f\xc7\xf8\xf7\x3e\xa3\x3e\xae\xb3\xde\x5f\x11\xa0\xbf\xe9\
+\xf7\xab\xb7\xc3\x30\x73\xe0\x96\x02\xf4\x3f\x03\x66\x18\x9d\xb9\
+\x2c\x01\x70\x06\x8c\x4e\x8b\x80\x08\xe4\x13\xb0\x32\xfe\x3c\x2f\
+\x9e\x5a\x8b\x35\x1b\xff\x3f\xfd\xdd\x67\x5f\x4a\x6d\xef\x5f\xfd\
+\xe2\xa3\x87\xad\xf6\x01\x7c\xed\xd9\xcf\x45\xff\x93\xa1\xd4\x76\
+\x4c\xe3\xfb\x7e\x4f\x14\x01\x8c\xb9\x69\x1e\x3a\x9e\x27\x20\x01\
+\x30\xcf\x48\x31\x44\x40\x04\x12\x09\x58\xcc\xfc\xbd\x11\x48\x2c\
+\x77\xcd\xc6\x3f\xb1\xa9\x37\xa2\xb7\x5a\x06\xf8\xbb\x8f\x7e\xd5\
+\x64\xc3\x21\x8d\xf3\xfd\x7f\x77\x78\xc0\x71\x4c\x28\x1e\x73\x31\
+\x85\x6c\x2c\x8e\x04\xc0\xc6\x3a\x54\xcd\x11\x81\xa5\x09\x14\xcf\
+\xc4\xc6\xe1\xa1\xbf\xf9\x27\x36\x84\xf5\xf3\xb5\xbb\xfd\xff\xe9\
+\xd7\xbf\xf9\x69\x62\xb3\x7d\xf4\x96\x5e\x00\x5f\x60\xa3\x3f\x7e\
+\x1c\xb8\xf1\x10\x5b\x9c\x96\x02\x62\x49\x3d\x89\x27\x01\xf0\x84\
+\x83\xfe\x8a\x80\x08\x18\x11\x28\x9d\x89\xe5\x3e\xee\xb7\xb6\x0d\
+\x7f\x46\xb8\xaf\xb3\x69\xe1\x05\x40\x68\x5c\x17\xd8\xe4\x60\x18\
+\x92\x1e\x0f\x3c\x1c\x5e\xd6\x53\x01\xf1\x1d\x23\x01\x10\xcf\x4a\
+\x31\x45\x40\x04\x66\x08\x14\xcf\xfe\x53\xd6\x7d\x27\x75\xe1\x39\
+\xff\xc9\xdb\x5d\x1e\x62\x9c\xdf\xfb\xf0\x51\xb5\x27\x02\x6a\xe6\
+\x7d\xb1\xc3\x12\x37\x05\x8e\x7a\x2a\x60\x88\xfd\x91\x00\x88\x25\
+\xa5\x78\x22\x20\x02\x17\x09\x60\xfc\x8b\x66\xff\xce\xf8\x7b\x97\
+\xef\xc5\x52\x6e\x5f\x64\xdd\x7f\x0d\xcf\xf9\xdf\xae\xb9\xfd\x99\
+\x37\x7e\xfc\xb3\x07\xb5\x36\x04\x92\xb7\x7d\x8d\x2f\xe7\x18\xae\
+\xfa\x71\xe1\xc6\x47\x78\x7f\xf1\xd5\x79\x01\x18\x8b\x17\xe3\xe8\
+\xa2\x27\x20\x01\xe0\x31\xe8\x8f\x08\x88\x40\x29\x81\x22\xe3\xef\
+\xd6\x79\xfd\x4d\x3e\xb1\x12\x18\xff\xb5\xaf\xfb\x4f\x9b\xfc\xdf\
+\x3f\xf8\xe5\x7b\xd3\xf7\x39\xc7\xaf\xfe\xe8\x83\x37\xad\x67\xeb\
+\xd6\xf9\xe5\xb4\xcb\x8f\x0f\x37\x4e\x62\xd2\x32\x16\xb5\x14\x30\
+\x4f\x4a\x02\x60\x9e\x91\x62\x88\x80\x08\xcc\x10\x28\x9d\x71\xe5\
+\xae\xfb\x6f\xc9\xf8\xff\xaf\x0f\x1f\x15\x1b\xff\xd0\x4d\xcc\xd6\
+\xad\x8c\x36\xf9\x90\x5f\xc8\xbb\xdd\xeb\xed\x92\x52\xf6\x03\x8c\
+\x5a\x0a\x18\xe6\x7e\x24\x00\xe6\x08\xe9\xba\x08\x88\xc0\x2c\x01\
+\x66\x5c\xb3\x91\xce\x45\x88\x75\xed\x1e\xa5\x67\xf6\x7f\x74\x4a\
+\x6f\x27\x04\x30\xda\xaf\xfc\xf0\xfd\xd7\x30\xe0\x39\xcb\x02\xa4\
+\x79\xfb\x83\x5f\xbe\x49\x3e\x93\x6c\x97\x3d\x4c\xd9\x0f\xe0\x96\
+\x02\xe4\x05\xb8\xdc\x5d\x12\x00\x97\xf9\xe8\xaa\x08\x88\xc0\x0c\
+\x81\xe2\xd9\xff\xd3\x87\xe4\x8d\x6b\x18\xff\x2d\xcd\xfe\x7f\xfe\
+\x9b\x4f\x7e\x6a\xe1\xfe\x3f\xd5\x55\x18\x70\x96\x05\x82\x18\x08\
+\x82\x00\x03\x7f\x1c\x9f\x73\x04\x0c\x3f\x69\xd8\x58\x78\x1c\xa7\
+\xd5\xfb\x73\xe5\xa4\x2c\x05\x8c\xf2\x02\x0c\x97\x7e\x24\x00\x2e\
+\xd1\xd1\x35\x11\x10\x81\x59\x02\x4b\xcc\xfe\x67\x2b\xb5\xb2\x08\
+\xb9\xcf\xff\xa7\x36\x13\x31\x40\xc0\xb8\x13\x10\x05\xd3\xc0\x39\
+\x42\x8f\x86\x7f\xda\xd6\xe8\xa5\x00\x79\x01\xa6\xd8\x6e\x1d\x4b\
+\x00\xdc\x42\xa2\x13\x22\x20\x02\xb1\x04\x8a\x66\xff\xce\xf5\xef\
+\x67\x73\xb1\x85\x5d\xc5\xdb\xda\xec\x9f\xb5\xff\x5a\xb3\xff\x2b\
+\x64\x2b\x7c\x99\xa9\x32\x4b\x01\x91\x1b\x02\x47\x79\x01\x86\x73\
+\x3f\x12\x00\xe7\xc8\xe8\xbc\x08\x88\xc0\x2c\x81\x92\xd9\x7f\x8e\
+\xf1\xa7\x42\xbf\xf7\xd9\xa7\xbe\xcc\xeb\x56\x82\x8c\x7f\x5e\x4f\
+\xca\x0b\x90\xc7\x6d\x9a\x4a\x02\x60\x4a\x43\xc7\x22\x20\x02\xd1\
+\x04\x4a\x67\xff\xd1\x05\x4d\x22\x32\xfb\xdf\xca\x33\xff\xac\xfb\
+\xff\xe5\x3f\xff\xeb\x77\x27\xcd\xd3\xe1\x15\x81\xa8\x17\xbc\x00\
+\xce\x8b\x14\x13\x77\x94\x17\x60\x38\xf5\x23\x01\x70\x8a\x8a\xce\
+\x89\x80\x08\xcc\x12\x58\x62\xf6\x3f\x5b\xa9\x95\x44\xc0\xf8\xbf\
+\xfe\x8f\x3f\xfb\xee\xff\xfc\x3f\xbf\xca\xfa\xee\xff\x95\x34\xb3\
+\x7a\x35\xbd\x17\x29\x66\x29\x40\x7b\x01\x4e\xf6\x85\x04\xc0\x49\
+\x2c\x3a\x29\x02\x22\x70\x89\xc0\x12\xb3\x7f\xea\xb3\x85\x9d\xff\
+\xc1\xf8\xd3\x1e\x85\x53\x04\xd2\xce\xc5\x2e\x05\x8c\xf2\x02\x0c\
+\xc7\x3f\x12\x00\xc7\x44\xf4\x5e\x04\x44\x60\x96\xc0\x12\xb3\x7f\
+\xdc\xff\xb3\x15\xeb\x38\x02\x86\x1f\x97\x3f\x33\xff\x8e\xab\xb9\
+\xbe\xaa\xb1\x14\x10\x53\x6b\x79\x01\x6e\x51\x92\x00\xb8\x85\x44\
+\x27\x44\x40\x04\x2e\x11\x58\x6a\xf6\xbf\xd6\xcd\x7f\x53\xc3\x2f\
+\x97\xff\xa5\x91\xf5\xe4\x5a\xd6\x66\x2c\x0f\x16\x00\x00\x10\x00\
+\x49\x44\x41\x54\x5f\xed\x05\xc8\xc2\x26\x01\x90\x85\x4d\x89\x44\
+\x40\x04\x72\x08\xf8\x35\xdb\x9c\x84\x2e\xcd\xda\x36\xff\xc9\xf0\
+\xbb\x4e\x6b\xf4\x5b\x32\xae\x1a\x55\xb1\xcb\x62\x24\x00\xba\xec\
+\x16\x55\x4a\x04\xfa\x25\x90\xed\xfe\x8f\x9c\xa5\x9d\x6a\xf9\x5a\
+\xdc\xff\xc1\xe8\xff\xf9\xdf\xff\xf4\x2f\x70\xf5\x6b\xc6\x7f\xaa\
+\x37\x2f\x9d\x2b\xb8\x16\x33\xbe\xb4\x0c\x70\x03\xb0\x04\xc0\x0d\
+\x1c\x7a\x23\x02\x22\x70\x89\x40\x89\xfb\x7f\xcb\xb3\xb4\x60\xf8\
+\x65\xf4\x2f\x8d\x9e\xba\xd7\x62\xc7\xd7\xa8\xcd\x80\x43\xf8\x91\
+\x00\x08\x24\xf4\x2a\x02\x22\x30\x4b\x60\x89\xd9\x3f\x95\xea\x71\
+\xfd\x3f\x18\x7d\xcd\xf6\xe9\x21\x9b\x50\x9c\x4b\xe4\x23\x81\xc5\
+\xe5\x6c\x24\x03\x09\x80\x8d\x74\xa4\x9a\x21\x02\xb5\x09\x94\xfc\
+\x67\xb5\xd8\xd9\x59\xed\x36\x58\xe4\x1f\x0c\xbf\x66\xfb\x16\x34\
+\x6d\xf3\x88\x7d\x24\xb0\x64\x2c\xdb\xd6\x78\xd9\xdc\x24\x00\x96\
+\xe5\xaf\xd2\x45\x60\x35\x04\xee\x3c\xbe\xf3\x72\x56\x65\x63\x66\
+\x65\x33\x19\xf7\xb2\x01\x90\xef\xed\x97\xe1\x9f\xe9\xac\xec\xcb\
+\x06\x09\x79\x24\x30\x62\xbc\x8d\x5a\x06\x18\xf8\xb9\xc3\x1f\x05\
+\x11\x10\x01\x11\x98\x23\x90\xed\xfe\xbf\x33\x3c\x9c\xcb\xbb\xf7\
+\xeb\x61\xd6\xaf\xef\xed\xef\xbd\xa7\x86\x21\xca\x0b\xa0\xcd\x80\
+\xbe\x23\x25\x00\x3c\x06\xfd\x11\x01\x11\xb8\x44\x60\xcf\x9b\xff\
+\x34\xeb\xbf\x34\x32\xec\xae\x99\xe5\x84\x17\xc0\x2c\xb3\x6d\x67\
+\x24\x01\xb0\xed\xfe\x55\xeb\x44\x60\x59\x02\x31\x8f\x66\x2d\x5b\
+\xc3\x8b\xa5\x63\xfc\x35\xeb\xbf\x88\xa8\xcf\x8b\x5a\x06\x88\xea\
+\x17\x09\x80\x28\x4c\x8a\x24\x02\xfb\x26\x70\xb8\x33\xfe\xc9\xde\
+\x08\xf0\xb5\xbd\x32\xfe\xad\x7a\xdd\xb6\x9c\xd8\x65\x00\xdb\x52\
+\xd7\x97\x9b\x04\xc0\xfa\xfa\x4c\x35\x16\x81\xf6\x04\xdc\x9a\x69\
+\x4e\xa1\x56\xbb\xff\x59\x83\xcf\x29\x3f\x37\x0d\xc6\x5f\x5f\xe2\
+\x93\x4b\xaf\x83\x74\x91\xcb\x00\x7b\x7f\x1a\x40\x02\xa0\x83\xb1\
+\xaa\x2a\x88\x40\xcf\x04\xb2\xd7\xff\x57\xea\xfe\x97\xf1\x6f\x3f\
+\x1a\xab\x94\x18\xb1\x0c\x90\xfd\x64\x4b\x95\x0a\xb7\xcf\x54\x02\
+\xa0\x3d\x73\x95\x28\x02\x22\x90\x48\xe0\x9f\x7e\xfd\x9b\x9f\x26\
+\x26\xc9\x8a\x2e\xe3\x9f\x85\xad\xcb\x44\x31\xcb\x00\x7b\x5c\xda\
+\x9a\x76\x96\x04\xc0\x94\x86\x8e\x45\x40\x04\x6e\x11\xc8\xbd\x49\
+\x5a\xb9\xff\xa9\xd0\x3f\xfc\xea\x51\x55\x01\xc0\x12\x83\x8c\x3f\
+\xa4\x97\x08\x0b\x96\x99\xb9\xb4\xb5\x60\x8d\x4d\x8b\x96\x00\x30\
+\xc5\xa9\xcc\x44\x60\x83\x04\x72\x6e\x92\x11\xee\xd7\x14\x52\x35\
+\xd7\xe3\x31\xfe\xfa\x72\x9f\x94\xde\x58\x49\x5c\xf6\x01\x44\x8c\
+\xc3\x3d\xef\x03\x90\x00\x58\xc9\x58\x56\x35\x45\x60\x09\x02\xd9\
+\xeb\xff\x15\xbe\xfc\x07\x43\x6d\xcd\x80\xc7\xfc\x30\xfe\xd6\xf9\
+\x2a\xbf\x78\x02\x4b\xc7\xdc\xf3\x3e\x00\x09\x80\xa5\x47\x9f\xca\
+\x17\x01\x11\x88\x22\xf0\xd7\xff\xf2\xd1\x7b\x51\x11\x23\x23\xe1\
+\xf2\xd7\x63\x7e\x91\xb0\x56\x1a\x4d\xfb\x00\x2e\x77\x9c\x04\xc0\
+\x65\x3e\xba\x2a\x02\xbb\x26\xd0\xc3\xfa\x7f\xe8\x00\x96\x01\x98\
+\xb1\x87\xf7\xb9\xaf\x78\x12\xf8\x0f\x7e\xe4\x97\x9b\x87\xd2\x59\
+\x11\xe8\x20\x9f\x9c\x25\xae\x0e\xaa\x6d\x51\x05\x09\x00\x0b\x8a\
+\xca\x43\x04\xb6\x4a\x20\xe7\xe6\x18\xb1\xee\x9a\x8b\x8b\x19\x3b\
+\x06\x3c\x27\x3d\xe9\x98\xf5\xcb\xe5\x9f\x43\x6f\xa5\x69\x22\xf7\
+\x01\xac\xb4\x75\xc5\xd5\x96\x00\x28\x46\xa8\x0c\x44\x40\x04\x6e\
+\x10\xa8\xb0\xfe\x3f\xcd\x1f\x03\x9e\xe2\x09\x98\x1a\x7e\xcd\xfa\
+\xa7\x24\x97\x3f\xee\xa5\x06\x7b\xdd\x08\x28\x01\xd0\xcb\x08\x54\
+\x3d\x44\xa0\x33\x02\x3d\xdf\x14\xf1\x04\x20\x02\x30\xee\xa7\xb0\
+\x71\x9e\x10\x66\xfc\x32\xfc\xa7\x28\xed\xe4\x5c\x65\x41\xba\x66\
+\x8a\x12\x00\x6b\xee\x3d\xd5\x5d\x04\x2a\x12\xc8\xdd\x1d\x7d\xb8\
+\xdb\xe6\xdf\xff\x22\x02\xf0\x06\xb0\x9e\x8f\xa1\x0f\x81\xf7\x9c\
+\x27\xc8\xf0\x57\x1c\x20\xc5\x59\xb7\xc9\x20\x66\x3c\xe6\x8e\xf5\
+\x36\x2d\xa8\x57\x8a\x04\x40\x3d\xb6\xca\x59\x04\xf6\x49\x80\x75\
+\xd7\xc6\x2d\xc7\xd0\x87\xd0\xb8\x68\x15\xb7\x01\x02\xb9\x9b\x5d\
+\xd7\xde\x74\x09\x80\xb5\xf7\xa0\xea\x2f\x02\x22\x20\x02\x2b\x24\
+\xd0\xac\xca\x0b\x08\xd2\x66\x6d\x2b\x2c\x48\x02\xa0\x10\xa0\x92\
+\x8b\xc0\x56\x09\x64\xcd\x8a\x2a\x3e\x01\xb0\x55\xce\x6a\x57\x03\
+\x02\x73\xe3\x32\xe7\x69\x97\x06\xd5\xae\x5d\x84\x04\x40\x6d\xc2\
+\xca\x5f\x04\xd6\x4a\x20\xe7\xa6\xa8\x0d\x57\x6b\xed\xed\xc6\xf5\
+\xee\xaf\xb8\x9e\x37\xbd\xd6\xa2\x25\x01\x50\x8b\xac\xf2\x15\x01\
+\x11\x10\x01\x11\xe8\x83\x80\x84\xe9\xc9\x7e\x90\x00\x38\x89\x45\
+\x27\x45\x40\x04\x44\x40\x04\x6a\x11\x68\x9d\x6f\xcc\x93\x00\xad\
+\xeb\xd4\x43\x79\x12\x00\x3d\xf4\x82\xea\x20\x02\x9d\x11\xc8\x75\
+\x87\xea\x46\xdb\x59\x47\xaa\x3a\x22\x70\x81\x80\x04\xc0\x05\x38\
+\xba\x24\x02\x22\x20\x02\x22\x60\x4d\x40\xf9\xf5\x42\x40\x02\xa0\
+\x97\x9e\x50\x3d\x44\x40\x04\x44\x40\x04\x16\x23\xb0\xc7\x2f\x03\
+\x92\x00\x58\x6c\xb8\xa9\x60\x11\x10\x01\x11\xd8\x1f\x01\xb5\xb8\
+\x1f\x02\x12\x00\xfd\xf4\x85\x6a\x22\x02\xdd\x10\xc8\x9e\x0d\xe9\
+\x4b\x57\xba\xe9\x43\x55\x44\x04\xe6\x08\x48\x00\xcc\x11\xd2\x75\
+\x11\x10\x01\x11\x10\x01\x23\x02\x0b\x65\x23\x61\x7a\x12\xbc\x04\
+\xc0\x49\x2c\x3a\x29\x02\x22\x20\x02\x22\xb0\x27\x02\x59\xdf\x7c\
+\xb9\x72\x40\x12\x00\x2b\xef\x40\x55\x5f\x04\x44\x40\x04\xd6\x42\
+\x40\xf5\xec\x8b\x80\x04\x40\x5f\xfd\xa1\xda\x88\x80\x08\x88\x80\
+\x08\x2c\x40\x60\x7c\x7c\xf8\x9b\x05\x8a\x5d\xb4\x48\x09\x80\x45\
+\xf1\xab\x70\x11\x10\x01\x11\xd8\x0b\x01\xb5\xb3\x37\x02\x12\x00\
+\xbd\xf5\x88\xea\x23\x02\x1d\x10\x78\x7c\xe7\xf1\xf7\x3a\xa8\x86\
+\xaa\x20\x02\x22\x50\x91\x80\x04\x40\x45\xb8\xca\x5a\x04\x44\x40\
+\x04\x44\xe0\x09\x81\x45\xff\x7e\x32\xbe\xb8\x68\xf9\x9d\x16\x2e\
+\x01\xd0\x69\xc7\xa8\x5a\x22\xb0\x4a\x02\xba\xd1\xae\xb2\xdb\x54\
+\xe9\x7d\x12\x90\x00\xd8\x67\xbf\xab\xd5\x22\x20\x02\x22\xd0\x90\
+\x80\x8a\xea\x91\x80\x04\x40\x8f\xbd\xa2\x3a\x89\x80\x08\x88\x80\
+\x08\x34\x25\xb0\xc7\x7d\x2f\x12\x00\x4d\x87\x98\x0a\x13\x81\x75\
+\x10\xf8\x1f\xdf\xf8\x7d\x6d\x02\x5c\x47\x57\xad\xa2\x96\xaa\x64\
+\x9f\x04\x24\x00\xfa\xec\x17\xd5\x4a\x04\x44\x40\x04\x44\xc0\x88\
+\xc0\xf8\xc9\xa0\x4d\x80\x27\x58\x4a\x00\x9c\x80\xa2\x53\x22\x20\
+\x02\x79\x04\x74\xa3\xcd\xe3\xb6\xed\x54\xeb\x68\xdd\x1e\xbd\x5e\
+\x12\x00\xeb\x18\x9b\xaa\xa5\x08\xb4\x27\x30\x8e\xe9\xcb\x00\x8f\
+\x35\xd3\x6a\xdf\x51\x2a\x71\x8e\xc0\x78\x18\xff\x70\x2e\xce\x1e\
+\xaf\x4b\x00\xec\xb1\xd7\xd5\x66\x11\x10\x01\x11\x68\x44\xa0\x87\
+\x62\x0e\x87\xc3\x27\x17\xeb\x91\x23\x76\x2f\x66\xb8\x8e\x8b\x12\
+\x00\xeb\xe8\x27\xd5\x52\x04\x9a\x13\xc8\xfa\x6e\xf4\x83\x3c\x00\
+\xcd\x3b\x4a\x05\xce\x13\x38\x0c\x7f\x74\x29\x52\xd6\x58\xbf\x94\
+\xe1\x4a\xae\x49\x00\xac\xa4\xa3\x54\x4d\x11\x68\x4d\x20\xfb\xb1\
+\x28\x7d\x19\x50\xeb\xae\xea\xb8\xbc\x0e\xaa\xa6\xf1\x78\xb6\x13\
+\x24\x00\xce\xa2\xd1\x05\x11\x10\x01\x11\x10\x01\x11\xd8\x2e\x01\
+\x09\x80\xed\xf6\xad\x5a\x26\x02\x45\x04\xf6\xb8\x2b\xba\x08\x98\
+\x12\xdf\x22\xd0\xc3\x89\x98\x27\x53\xb2\xbd\x5d\x3d\x34\xb0\xa0\
+\x0e\x12\x00\x05\xf0\x94\x54\x04\x44\xe0\x36\x81\xf1\x37\xc3\xbd\
+\xdb\x67\x75\x46\x04\x96\x21\x30\x0e\xc3\x61\xae\xe4\xbd\x8a\x5d\
+\x09\x80\xb9\x91\xa1\xeb\x22\xb0\x67\x02\x3b\xdd\x1d\xbd\xe7\x2e\
+\xb7\x6b\x7b\x1f\x39\x1d\x0e\xc3\xff\x33\xe8\xe7\x24\x01\x09\x80\
+\x93\x58\x74\x52\x04\x44\x20\x9b\x80\x9e\x04\xc8\x46\xa7\x84\x15\
+\x08\x3c\x1e\xfe\xff\x8b\xb9\xee\x58\xe4\x4a\x00\x5c\x1c\x19\xba\
+\x28\x02\xfb\x26\x70\x18\x3e\x79\x23\x8b\x80\x76\x5e\x67\x61\xdb\
+\x52\xa2\x94\xb6\xfc\xd9\x17\x9e\x7d\xf1\xf5\x3f\xf8\xd2\xbd\x10\
+\x52\xd2\x5e\x8a\x3b\x7e\x3c\xce\x2e\x47\xed\xf5\x11\x40\xb8\x49\
+\x00\x40\x41\x41\x04\x44\xe0\x24\x81\xdc\xb5\x51\xed\x03\x38\x89\
+\x53\x27\x8f\x08\x60\xf8\xdf\xfe\xea\xf3\xf7\x5f\x7d\xfe\xf3\xf7\
+\x5f\x7a\xee\x99\x7b\x21\xbc\xf3\xf5\x17\xde\x42\x0c\x1c\x45\xaf\
+\xf2\x76\xaf\x1b\x00\x81\x29\x01\x00\x05\x05\x11\x10\x81\xf3\x04\
+\x76\xec\x22\x3d\x0f\x45\x57\x2e\x13\x98\xbf\x8a\xf1\xc7\xf0\x7f\
+\xf1\xe9\xcf\x9c\xfc\x47\x3d\x88\x01\x84\x00\xf1\xe6\x73\x3b\x13\
+\xe3\x93\xf9\x0d\xa9\xb9\x22\xf7\x4c\x89\xab\x3a\x2d\x01\xb0\xaa\
+\xee\x52\x65\x45\x60\x25\x04\xb4\x0f\x60\x25\x1d\xb5\x5c\x35\x5f\
+\xf9\xc2\x73\xb3\xee\x79\x6a\x17\x1b\x8f\xb8\xc9\x61\xe7\xe2\x56\
+\x02\x20\x79\xc4\x28\x81\x08\xec\x8b\xc0\x41\xfb\x00\xf6\xd5\xe1\
+\x06\xad\x9d\xcb\x02\xf7\xfe\xb9\x99\xff\x71\x5a\xe2\xe5\x78\x01\
+\x46\xad\xff\x1f\xa3\xbc\xf5\x5e\x02\xe0\x16\x12\x9d\x10\x01\x11\
+\x98\x12\xc8\x75\x91\x6a\x1f\xc0\x94\xa2\x8e\x03\x01\x8c\xff\x4b\
+\x6e\xbd\x3f\xbc\x8f\x79\xcd\xf1\x02\x1c\xdc\xcf\x5c\xde\x7b\x5e\
+\xff\x87\x8d\x04\x00\x14\x14\x44\x40\x04\x2e\x13\xc8\x71\x95\x6a\
+\x19\xe0\x32\xd3\xcd\x5e\xbd\xdc\xb0\x54\xe3\x7f\x39\xb7\xf3\x57\
+\xc7\xc7\xe3\x7f\x3c\x7f\xf5\xc9\x95\x5c\x71\xfb\x24\xf5\xfa\xff\
+\x4a\x00\xac\xbf\x0f\xd5\x02\x11\xe8\x97\x80\x1e\x07\xec\xb7\x6f\
+\x16\xa8\x19\xb3\xff\x16\xc5\x46\xb9\xff\x0f\xc3\x1b\x2d\xea\xd2\
+\x73\x19\x12\x00\x3d\xf7\x8e\xea\x26\x02\x9d\x10\x38\x64\xee\x03\
+\x18\xf5\xb5\xc0\x9d\xf4\x60\xbb\x6a\x5c\x2a\x29\x77\xf6\xff\x93\
+\x47\xbf\x7d\x78\x29\x5f\x5d\xcb\x23\x20\x01\x90\xc7\x4d\xa9\x44\
+\x60\x57\x04\xbc\xab\x54\xcb\x00\xbb\xea\x73\xeb\xc6\xb6\x9a\xfd\
+\xfb\x7a\x47\x3c\xfe\xf7\xdd\xff\xf0\xc2\x77\x7c\xdc\x1d\xff\x91\
+\x00\xd8\x71\xe7\xab\xe9\x22\xd0\x84\x80\x96\x01\x9a\x60\xee\xa3\
+\x90\xd3\xb5\xc0\xf8\xe7\xce\xfe\x4f\xe7\x78\xfe\xac\xdc\xff\xe7\
+\xd9\x1c\x5f\x91\x00\x38\x26\xa2\xf7\x22\x20\x02\x27\x09\x68\x19\
+\xe0\x24\x16\x9d\x8c\x20\x50\x6a\xfc\xdf\xf8\xf1\xcf\x1e\x44\x14\
+\xf3\x24\xca\x27\x87\xff\xf7\xc9\x81\xfe\xce\x11\x90\x00\x98\x23\
+\xa4\xeb\x22\x20\x02\x9e\x40\xd1\x32\x80\xbc\x00\x9e\xe1\xd6\xff\
+\x9c\x6a\x1f\xb3\xff\x53\xe7\x63\xcf\xbd\xf7\xe1\xa3\x78\xe3\xef\
+\x33\x1d\xff\x3f\xff\x72\xe1\x8f\xdc\xff\x4f\xe0\x48\x00\x3c\xe1\
+\xa0\xbf\x22\x20\x02\x11\x04\xb2\xbd\x00\x9f\x0c\x27\xbf\xee\x35\
+\xa2\x48\x45\x59\x31\x01\x8c\x7f\xe9\xec\x3f\xa5\xf9\x72\xff\xa7\
+\xd0\x1a\x06\x09\x80\x34\x5e\x8a\x2d\x02\x22\x90\x43\x20\x62\x53\
+\x56\x4e\xb6\x4a\xd3\x13\x81\x9b\x75\xe1\xdb\xfb\x2c\x8c\x7f\x9a\
+\xfb\x7f\xfe\xbb\xff\x6f\xd6\x72\xdf\xef\x24\x00\xf6\xdd\xff\x6a\
+\xbd\x08\x24\x11\xc8\x5e\x06\x70\xa5\xc4\xcc\xce\x5c\x34\xfd\x6e\
+\x84\x40\xce\xb7\xf7\x1d\x37\x3d\xc5\xfd\x1f\x3b\xbe\xe4\xfe\xff\
+\x94\xb2\x04\xc0\xa7\x2c\x74\x24\x02\x22\x10\x41\x20\x77\x19\x60\
+\x90\x17\x20\x82\xee\x7a\xa3\x4c\x6b\x8e\xeb\x9f\xef\xf0\x9f\x9e\
+\xcb\x39\xb6\x9e\xfd\x8f\xfa\xf2\x9f\x1b\xdd\x20\x01\x70\x03\x87\
+\xde\x88\x80\x08\xcc\x11\xf0\x5e\x80\xb9\x48\xe7\xae\x6b\x33\xe0\
+\x39\x32\x9b\x39\x8f\xf1\xb7\x70\xfd\x6b\xf6\x5f\x7f\x48\x48\x00\
+\xd4\x67\xac\x12\x44\x60\x73\x04\x72\x67\x52\xfa\x66\xc0\xcd\x0d\
+\x85\xab\x06\x3d\x79\xb1\x32\xfe\x3f\xff\xf8\xb7\x0f\x35\xfb\x7f\
+\xc2\xb4\xe6\x5f\x09\x80\x9a\x74\x95\xb7\x08\x6c\x94\x40\xf6\x3a\
+\x2a\xff\x20\x48\x5e\x80\x4d\x8e\x0a\x2b\xe3\x0f\x9c\x94\xaf\xfe\
+\xd5\xda\x3f\xc4\xf2\x82\x04\x40\x1e\x37\xa5\x12\x81\xdd\x13\x90\
+\x17\x60\xf7\x43\xe0\x1a\x80\xa5\xf1\xc7\xf5\xaf\xd9\xff\x35\xda\
+\xaa\x07\x12\x00\x55\xf1\x2a\x73\x11\xd8\x2e\x81\x12\x2f\x40\xec\
+\xac\x6d\xbb\xf4\xb6\xd3\x32\x4b\xe3\x9f\xea\xfa\x8f\x1d\x47\x8f\
+\xef\x3c\xfe\xde\x76\x88\xdb\xb5\x44\x02\xc0\x8e\xa5\x72\x12\x81\
+\xdd\x11\xc8\xf5\x02\xf8\x27\x02\xb4\x14\xb0\xfa\xf1\xf2\xc4\xf8\
+\x3f\x73\xcf\xaa\x21\xef\xfc\xe2\xc3\xb4\x6f\xfd\x8b\x78\xb2\x84\
+\x31\x5a\xb4\x71\xd5\xaa\x71\x1d\xe6\x23\x01\xd0\x61\xa7\xa8\x4a\
+\x22\xb0\x16\x02\x25\x33\x2b\x6d\x08\x5c\x4b\x2f\x9f\xae\xe7\xdb\
+\x5f\x7d\xfe\xbe\xc5\x6e\xff\x90\xfb\x7b\x1f\x3e\x7a\xf0\x57\xbf\
+\xf8\x28\xfa\xdf\xfe\xc6\xce\xfe\x43\xfe\x7a\xbd\x4d\x40\x02\xe0\
+\x36\x13\x9d\x11\x01\x11\x88\x24\xe0\x67\x56\x39\xff\x26\x98\xfc\
+\xb5\x21\x10\x0a\xab\x0b\x7c\xc3\x1f\xc6\x3f\x3c\xe7\x6f\xd1\x00\
+\x8c\x7f\xca\xba\xbf\x37\xfe\x91\xb3\xff\xec\xa5\x2a\x8b\x86\x75\
+\x9e\x87\x04\x40\xe7\x1d\xa4\xea\x89\x40\xef\x04\xb2\xbf\x18\xc8\
+\x35\x4c\x5e\x00\x07\x61\x45\xbf\xb8\xfc\x5f\x7d\xfe\xf3\xf7\x2d\
+\x8d\x7f\xea\xba\xbf\xc7\x15\x61\xfc\x7d\x3c\xfd\xb9\x48\x40\x02\
+\xe0\x22\x1e\x5d\x14\x01\x11\x98\x23\x80\x17\x60\xcc\xfd\x86\x35\
+\xe7\x05\xf0\xb3\xb9\xb9\x42\x74\x7d\x51\x02\x61\xd6\x7f\xdb\xe5\
+\x5f\x56\x2d\x8c\xff\xab\x3f\xfa\xe0\xcd\x94\x5c\x62\xc7\x0b\x63\
+\x52\xb3\xff\xcb\x64\x25\x00\x2e\xf3\xd1\x55\x11\x10\x81\x08\x02\
+\xfe\x46\x9b\xbb\x14\xc0\x6c\x4e\x1b\x02\x23\x28\x2f\x13\xa5\xc6\
+\xac\x3f\xb4\x24\x7d\xd3\xdf\xf8\xa2\xdf\x40\x1a\x32\xb8\xf0\xea\
+\xc7\xe4\x85\xeb\xba\xa4\xff\x06\xa8\x31\x20\x02\x22\x60\x44\x40\
+\x4b\x01\x46\x20\x3b\xc9\x26\x66\xd6\x5f\x52\xd5\xb7\x3f\xf8\xe5\
+\x9b\x29\x9b\xfe\x28\x2b\x76\xc9\x88\xd9\x3f\xf1\x15\x2e\x13\x90\
+\x07\xe0\x32\x1f\x5d\x15\x01\x11\x88\x24\xc0\x52\xc0\x90\xeb\x05\
+\xd0\x52\x40\x24\xe5\x36\xd1\x6a\xce\xfa\x69\x41\x96\xf1\xff\x78\
+\xbc\x37\xb8\x71\x42\xfa\x8b\xc1\x8d\x41\xcd\xfe\x2f\x12\xba\xbe\
+\x28\x01\x70\x8d\x42\x07\x22\x20\x02\xa5\x04\x4a\xbc\x00\xde\xb5\
+\xab\xa5\x80\xd2\x2e\x28\x4a\x9f\x36\xeb\xcf\x2b\x2a\xdb\xf8\xb3\
+\x54\x14\x51\xe4\xf8\xf8\xf0\x37\x11\xd1\x14\xc5\x11\x90\x00\x70\
+\x10\xf4\x2b\x02\x22\x60\x43\x00\x2f\x40\x89\xfb\x75\xfc\x78\xb8\
+\x3f\x48\x04\xd8\x74\x46\x42\x2e\xc1\xf0\x5b\xef\xf0\x3f\xae\x42\
+\x8e\xf1\xf7\xe3\x21\xd6\xf8\x1f\x86\x37\x34\xfb\x3f\xa6\x7e\xfe\
+\xbd\x04\xc0\x79\x36\xba\x22\x02\x22\x90\x41\xc0\xdf\x80\x9d\x1b\
+\x36\x23\xa9\x4f\x12\xbb\xce\xeb\x23\xeb\x4f\x11\x81\x12\xc3\x9f\
+\x52\x30\xbb\xfd\xb3\x8c\xbf\x2b\x24\x65\x3c\xf8\xb1\xe7\xd2\xe8\
+\x37\x8e\x80\x04\x40\x1c\x27\xc5\x12\x01\x11\x48\x20\x50\xb4\x14\
+\xe0\xd6\x79\x47\xd6\x7b\x13\xca\x53\xd4\x34\x02\xad\x0c\x3f\xb5\
+\xc2\xf8\xf3\xa8\x5f\xea\x86\x3f\xd2\xfa\x71\xe0\xc6\x03\xc7\x73\
+\xa1\xc4\xf3\x34\x97\xf7\x56\xaf\x4b\x00\x6c\xb5\x67\xd5\x2e\x11\
+\x58\x90\x40\xe9\x52\xc0\xe0\x5c\xbe\xfe\xe6\xbf\x60\x1b\xb6\x58\
+\xb4\x9d\xe1\x8f\xa3\xc3\x37\xfc\x61\xfc\xe3\x62\xdf\x8c\xe5\xfb\
+\xdf\x8d\x83\x9b\x67\x4f\xbf\xc3\xf8\x6b\xf6\x7f\x9a\xcd\xa5\xb3\
+\x12\x00\x97\xe8\xe8\x9a\x08\x88\x40\x36\x01\x7f\x43\x2e\x58\x0a\
+\x40\x04\x0c\xda\x0f\x90\xcd\x3f\x24\xc4\xe8\xb3\xab\x9f\xaf\xef\
+\xad\xbd\xc6\x1f\xca\xe4\x15\xe3\x9f\xf2\xf5\xbe\xa4\x09\x21\xc5\
+\xf8\xf3\xe4\x89\x1f\x6b\x21\xb1\x5e\xa3\x09\x48\x00\x44\xa3\x52\
+\x44\x11\x10\x81\x54\x02\xef\x7c\xe3\x2b\xdf\x4a\x4d\x33\x8d\x3f\
+\x6a\x53\xe0\x14\x47\xd2\x31\x86\x3f\x18\x7d\xbe\xc1\xcf\xf2\xeb\
+\x7b\xe7\x2a\xc2\x7a\x7f\xae\xf1\xf7\xa2\x2f\x72\xe6\x4f\x3d\x8a\
+\x96\x9b\xc8\x60\xc7\x41\x02\x60\xc7\x9d\xaf\xa6\x8b\x40\x0b\x02\
+\x87\xf1\xb1\x44\x40\x0b\xd0\xae\x8c\x60\xf4\xdf\xf9\xfa\x0b\x6f\
+\xb5\x9c\xed\xbb\xa2\xfd\x2f\xeb\xfd\x18\xff\x9c\xf5\x7e\x9f\x81\
+\xf3\xf8\x78\xd1\xe7\xdf\xcc\xff\xc1\xf5\xcf\x72\xd3\x7c\x4c\xc5\
+\x38\x45\x40\x02\xe0\x14\x15\x9d\x13\x01\x11\x30\x23\xc0\x0d\x9a\
+\x1b\x75\x49\x86\x29\x46\xa1\xa4\x9c\x35\xa6\x6d\x6f\xf4\x4f\x53\
+\xc2\xe5\xcf\x7a\x7f\x4b\xe3\x2f\xd7\xff\xe9\xbe\x88\x3d\x2b\x01\
+\x10\x4b\x4a\xf1\x44\x40\x04\xb2\x09\xf8\x1b\x75\xc9\x7e\x00\x57\
+\xf2\xf8\x68\xbc\xef\x5e\xf4\x7b\x45\x20\x18\xfe\x25\x66\xfa\x57\
+\x55\xf0\x2f\x61\xd6\x9f\xed\xf2\xf7\xb9\x0c\x43\xca\xe3\x7e\x5a\
+\xf7\x1f\x4c\x7e\x24\x00\x4c\x30\x2a\x13\x11\x10\x81\x39\x02\xa5\
+\xfb\x01\x86\xc3\xf0\xa2\x44\xc0\x30\xb0\xa1\x6f\x29\x17\x3f\x7d\
+\x3c\x0d\xc5\xb3\xfe\xab\xcc\x7c\xbf\xba\xfe\xbd\x7a\x3b\xfb\xa2\
+\x75\xff\x59\x44\x51\x11\x24\x00\xa2\x30\x29\x92\x08\x88\x80\x05\
+\x81\xd2\xfd\x00\xd7\x22\xc0\xad\x15\x5b\xd4\x67\x6d\x79\xb0\xa9\
+\x8f\x0d\x7d\x4b\xd7\xdb\x6a\xd6\xcf\x86\xbf\xf1\xd7\xe3\x5b\xf4\
+\x6b\x6c\x9b\xc6\xc3\xf0\x06\xcb\x4a\xb1\xf1\x15\xef\x3c\x01\x09\
+\x80\xf3\x6c\x74\x45\x04\x44\xc0\x98\x00\x37\x6e\x13\x11\xb0\xc3\
+\xa7\x03\x30\xfe\x2d\x77\xf2\x9f\xee\xfa\x61\xb0\x9a\xf5\x7b\xe3\
+\x4f\x3f\x9e\x2b\xe8\xc4\x79\x8c\xbf\x5f\x4e\x3a\x71\x4d\xa7\xd2\
+\x09\x48\x00\xa4\x33\x53\x0a\x11\x10\x81\x02\x02\x26\x22\xc0\x95\
+\xef\x37\x06\xee\xc4\x13\x80\xdb\x7f\x69\xe3\x8f\xe1\x7f\xe5\x87\
+\xef\xbf\x56\xba\xd6\xef\xba\x6e\x90\xf1\xf7\x14\x16\xff\x23\x01\
+\xb0\x78\x17\xa8\x02\x22\xb0\x3f\x02\x88\x00\x66\x73\xa5\x2d\x47\
+\x04\x8c\xfa\xda\xe0\x52\x8c\x17\xd3\x4f\xdd\xfd\x17\x23\x46\x5e\
+\xa4\xbf\x46\xcd\xfc\x23\x69\xd5\x8d\x26\x01\x50\x97\xaf\x72\x17\
+\x01\x11\x38\x43\x00\x57\xae\x85\x08\x18\x3e\x19\xee\x8d\x1b\x17\
+\x01\x4b\xac\xfb\x07\xc3\x5f\xf4\x68\xdf\x51\xdf\xfb\x7e\x72\xfd\
+\x75\x74\xfa\xe2\x5b\xc6\x08\x63\xe5\x62\x24\x5d\xcc\x22\x20\x01\
+\x90\x85\x4d\x89\x44\x40\x04\x2c\x08\x70\x63\xe7\x06\x5f\x9c\x97\
+\x33\x2a\xde\xb8\x14\x67\xd4\x67\x06\x18\xe3\x56\x35\xa3\x2c\xbe\
+\xcc\xe7\xb6\xe1\x2f\xab\x81\xdf\xe9\xef\xfa\x29\x25\x17\xc6\x06\
+\x63\x24\x25\x8d\xe2\xc6\x13\x90\x00\x88\x67\xa5\x98\x22\x20\x02\
+\x15\x08\x70\x83\xe7\x46\x5f\x9c\xb5\x33\x2e\x7e\x47\xf9\x06\xf7\
+\x05\xfc\xe4\xd1\x6f\x1f\x16\xf3\xb9\x90\x41\x30\xfa\xac\xf1\x5b\
+\x1b\xfe\xc1\xf5\x87\xef\x97\x84\xc7\xfc\x7c\x55\xc7\xf1\x7b\x8c\
+\x0d\x7f\xac\x3f\x55\x08\x48\x00\x54\xc1\xaa\x4c\x45\x40\x04\x52\
+\x08\x70\xa3\x37\x11\x01\xae\xd0\xd1\xad\x2f\x8f\x1b\x5b\x12\x60\
+\xe3\x1d\x46\xda\x35\xcf\xec\x97\xfc\x08\xb1\xb3\xfd\x9c\x82\xe9\
+\x87\xd1\xf5\x47\x6a\x5a\xc6\x42\xf1\xf7\x46\xa4\x16\xba\xc3\xf8\
+\x12\x00\x3b\xec\x74\x35\x59\x04\x7a\x24\x60\x29\x02\x06\xbc\x01\
+\x1b\x13\x01\xcc\xcc\xd9\x89\x5f\xd2\x77\x18\x7c\xf2\x08\x46\x9f\
+\x3c\xb3\xbf\xba\x77\xa6\x22\x39\x2e\x7f\xb2\xc4\xf8\x33\x16\x38\
+\x56\xa8\x4b\x40\x02\xa0\x2e\x5f\xe5\x2e\x02\x22\x90\x40\x80\x1b\
+\x3f\x06\x20\x21\xc9\xf9\xa8\x88\x80\x5f\x8f\x6f\x8d\x1b\x12\x02\
+\x78\x02\x30\xde\x18\x71\x8c\xf9\xf9\xc6\x0f\x03\xd7\x09\xc4\x25\
+\x4d\x70\xef\x93\x47\xba\xd1\xbf\x54\xd2\xd1\xb5\x5c\x97\xbf\xcb\
+\x86\xbe\x67\x0c\xb8\x43\xfd\x36\x20\x20\x01\xd0\x00\xb2\x8a\x10\
+\x01\x11\x88\x27\x0a\xa2\x87\xa7\x00\x00\x05\xbb\x49\x44\x41\x54\
+\x80\x01\x28\xfe\xb2\xa0\x69\x71\x08\x81\x0d\x89\x00\x8c\x37\x46\
+\x9c\xd9\x3b\x46\xfd\x5c\xe0\x3a\x81\xb8\xa4\x99\x22\xa9\x72\x8c\
+\xe1\x7f\x34\xde\x1f\x33\x5c\xfe\xd4\x67\x3c\x0c\x6f\xd0\xf7\x1c\
+\x2b\xb4\x21\x20\x01\xd0\x86\xb3\x4a\x11\x01\x11\x48\x20\xc0\xf7\
+\x04\x98\x8b\x80\x8d\x79\x03\x12\x70\x16\x47\x9d\xcb\x60\x74\x02\
+\x6b\xc4\xf0\xa7\x6e\xf4\xbb\xca\x58\xc6\xff\x0a\x44\xe3\x17\x09\
+\x80\xc6\xc0\x55\x9c\x08\x88\x40\x1c\x81\x6b\x11\x30\x8e\xdf\x8b\
+\x4b\x11\x11\x0b\x6f\x80\x84\x40\x04\xa8\xc8\x28\x57\xb3\x7e\xf6\
+\x5c\x44\xa6\xb8\x15\x0d\xa1\xa7\x99\xff\x2d\x2c\x4d\x4e\x48\x00\
+\x34\xc1\xac\x42\x44\x40\x04\x72\x08\x20\x02\xd8\x0d\xce\x0c\x31\
+\x27\xfd\xd9\x34\x08\x01\x37\x6b\x3d\x7b\x5d\x17\x26\x04\x4e\x1c\
+\x5e\x19\xfe\x92\x59\xff\xe0\x84\xdd\x3b\xdf\x7c\x61\xa4\x8f\x4f\
+\x94\xa0\x53\x0d\x08\x48\x00\x34\x80\xac\x22\x44\x40\x04\xca\x08\
+\x30\x43\xac\x22\x02\xe4\x0d\x48\xeb\x18\x0b\xc3\xef\x4a\xa4\x2f\
+\x11\x76\xee\x50\xbf\x0b\x12\x90\x00\x58\x10\xbe\x8a\x16\x01\x11\
+\x88\x27\x80\x08\xc0\x5d\xcc\xcc\x31\x3e\x55\x44\x4c\xbc\x01\x57\
+\x42\x60\x94\x57\xe0\x16\x30\x7f\xc2\xc8\xf0\x93\x17\x7d\x48\x5f\
+\x72\xac\xb0\x2c\x01\x09\x80\x65\xf9\xab\x74\x11\x10\x81\x04\x02\
+\xb8\x8b\x99\x39\x32\x83\x4c\x48\x16\x17\xd5\x09\x01\xd6\xb2\x11\
+\x01\x84\xb8\x44\x1b\x8f\x65\x68\xf8\x11\x6e\x72\xf9\xf7\x35\x5e\
+\x24\x00\xfa\xea\x0f\xd5\x46\x04\x44\x20\x82\x00\x33\xc8\x2a\x22\
+\x80\xb2\x83\x10\xf0\x8f\xb4\x8d\xf7\x38\xb5\xab\xe0\x8c\xfe\xe0\
+\x02\x5f\xe4\x33\x7e\x3c\xdc\x1f\x32\x77\xf6\x4f\x99\xd1\x57\x08\
+\xb7\xe9\x39\x1d\x2f\x4f\x40\x02\x60\xf9\x3e\x50\x0d\x44\x40\x04\
+\x32\x08\x20\x02\x98\x51\x62\x5c\x32\x92\xcf\x27\xc1\xf0\x39\x31\
+\xc0\xf7\xd8\x8f\x6e\x69\x80\x30\x9f\x68\xc5\x31\x26\x46\x7f\x2c\
+\x78\xa4\xef\x06\x81\x71\xfc\x9e\x5c\xfe\x37\x88\x74\xf5\x46\x02\
+\xa0\xab\xee\x50\x65\x44\x40\x04\x52\x09\x20\x04\xaa\x89\x80\x50\
+\x19\x27\x04\x06\x17\x36\x27\x06\x82\xd1\xf7\x7b\x20\x86\x5b\xb3\
+\xfd\xd0\xfc\x9c\x57\x0c\x3f\xb3\x7e\x96\x6d\x72\xd2\x2b\x4d\x7d\
+\x02\x12\x00\xf5\x19\xab\x04\x11\x10\x81\xca\x04\x10\x01\x55\xbd\
+\x01\xd3\xfa\x3b\x21\x70\x2d\x06\xc2\x32\x81\x33\xa4\xd3\x28\xdd\
+\x1e\xbb\x7a\x8e\x78\x33\xa8\x77\x05\xa3\x4f\xbb\x11\x63\xf4\x85\
+\x0c\x3f\x34\xfa\x0e\x12\x00\x7d\xf7\x8f\x6a\x27\x02\x22\x90\x40\
+\xa0\xa9\x10\xa0\x5e\x61\x99\xc0\xb9\xcc\x6f\x78\x07\x9c\xa1\xe5\
+\xf2\xe2\x81\x7a\xb8\xe0\xd7\xf3\x83\xc1\x47\xc0\x50\xef\xd9\xca\
+\x25\x46\x90\xbb\x3f\x11\xd8\xf2\xd1\x25\x00\x96\xef\x03\xd5\x40\
+\x04\x44\xc0\x98\x00\x42\x80\x99\xa8\x71\xb6\xf3\xd9\x61\x5c\x5d\
+\x18\x83\x20\xc0\xe8\x32\xdb\x66\xd6\xed\xc2\xe0\x8c\xf1\x7c\x26\
+\x19\x31\xc8\xd7\x85\xd1\x95\xe1\x8d\x3d\x65\x52\x36\xf5\x70\x61\
+\xa8\x61\xf0\x27\xd5\x84\xb5\xdc\xfd\x13\x20\x2b\x39\x94\x00\x58\
+\x49\x47\xa9\x9a\x22\x20\x02\x69\x04\x10\x01\xb8\xa2\x31\x4e\x69\
+\x29\x8d\x63\x63\x7c\x9d\x28\x18\x5c\x18\x9d\x31\xf6\x9e\x02\x8c\
+\x33\x46\x7a\x1a\x30\xde\x97\xc2\x34\x6e\x38\x26\x1f\x02\xf9\xba\
+\x40\x19\xde\xd8\x53\x66\x61\x33\x66\x93\x5f\xcd\xf8\x61\x0c\xeb\
+\xd9\xf8\x8a\xd0\x1d\x01\x09\x80\xee\xba\x44\x15\x12\x01\x11\xb0\
+\x24\x80\x71\xc2\x48\x21\x04\x08\x96\x79\x17\xe5\x85\x91\x9e\x06\
+\x27\x10\xbc\x01\x3f\xf7\x3a\x8d\x1b\x8e\x8b\x2a\x90\x99\x38\x18\
+\xfe\x6f\x7c\xe5\x5b\x5a\xe7\xcf\x64\xd8\x49\x32\x09\x80\x4e\x3a\
+\x42\xd5\x10\x01\x11\xa8\x4b\x00\x21\x40\x40\x04\x10\xea\x96\xb6\
+\xf6\xdc\x4f\xd4\x5f\x86\xff\x04\x94\x75\x9f\x92\x00\x58\x77\xff\
+\xa9\xf6\x22\x20\x02\x89\x04\x10\x01\x04\x44\x00\x21\x31\xf9\xfe\
+\xa2\xcb\xf0\x6f\xb6\xcf\x25\x00\x36\xdb\xb5\x6a\x98\x08\x88\xc0\
+\x25\x02\x88\x00\x42\x58\x1e\xe0\xab\x6a\x2f\xc5\xdf\xd3\x35\x58\
+\x20\x8e\xf4\x2c\xff\xb6\x7b\x5d\x02\x60\xdb\xfd\xab\xd6\x89\x80\
+\x08\x44\x10\xf0\x42\xc0\xad\x69\x63\xf0\x30\x7c\x11\x49\xb6\x19\
+\x65\x32\xdb\x87\x89\xd6\xf8\xb7\xd9\xcd\xa1\x55\x12\x00\x81\x84\
+\x5e\x45\x40\x04\x76\x4f\x00\x83\x87\xe1\x0b\x5e\x81\x5d\x88\x81\
+\x60\xf4\xbf\xf9\xc2\xf8\xe4\x51\xbe\xdf\xff\xde\xee\x07\xc2\x4e\
+\x00\x48\x00\xec\xa4\xa3\xd5\x4c\x11\x10\x81\x34\x02\x08\x01\x02\
+\x62\xe0\xda\x33\xe0\x8c\x65\x5a\x2e\x1d\xc6\x76\x6d\x40\xd8\xd0\
+\x26\xda\x26\xa3\xdf\x61\x1f\x35\xaa\x92\x04\x40\x23\xd0\x2a\x46\
+\x04\x44\x60\xbd\x04\xae\x3d\x03\x6e\x99\x00\xa3\x89\xf1\xc4\x88\
+\xb2\x56\xde\x7d\xab\x9c\xc1\xa7\x9e\xd4\x99\xba\x63\xf0\x11\x36\
+\xb4\xe9\x54\xdd\x75\x6e\x3f\x04\x24\x00\xf6\xd3\xd7\x6a\xa9\x08\
+\x88\x80\x11\x01\x8c\x27\x46\x14\x63\x8a\x51\xc5\xb8\x22\x08\x08\
+\x18\x5b\x1f\x8c\xca\x8a\xce\xe6\xca\xd0\x53\x07\xea\x43\xa0\x6e\
+\xbe\x8e\x4e\xb8\x50\xe7\xe8\xbc\x14\x71\x17\x04\x24\x00\x76\xd1\
+\xcd\x6a\xa4\x08\x88\x40\x4d\x02\x18\x57\x04\x01\x21\x18\x5c\x6f\
+\x7c\xdd\xba\x3a\x86\x18\xa3\x4c\xf0\xc2\xe0\xca\x50\x5f\x1f\xcf\
+\x55\xec\x38\xbe\x7b\x4f\x5e\x04\xf2\x26\xf8\xb2\x9c\x91\xa7\x6c\
+\xea\x40\x7d\x08\x73\x59\xdf\xbe\xae\x33\x7b\x22\x20\x01\xb0\xa7\
+\xde\x56\x5b\x45\x40\x04\x9a\x13\xc0\x10\x63\x94\x09\x18\xe8\x5b\
+\xc1\x89\x04\x6f\xc0\xcf\xbd\x5e\x19\xf6\x69\x3a\xf2\x22\x90\x37\
+\xa1\x79\xa3\x54\xe0\x26\x08\x48\x00\x6c\xa2\x1b\xd5\x08\x11\x10\
+\x01\x11\x28\x27\xa0\x1c\xf6\x45\x40\x02\x60\x5f\xfd\xad\xd6\x8a\
+\x80\x08\x88\x80\x08\x88\x80\x27\x20\x01\xe0\x31\xe8\x8f\x08\x88\
+\x80\x08\xec\x9d\x80\xda\xbf\x37\x02\x12\x00\x7b\xeb\x71\xb5\x57\
+\x04\x44\x40\x04\x44\x40\x04\x1c\x01\x09\x00\x07\x41\xbf\x22\x20\
+\x02\x22\xb0\x77\x02\x6a\xff\xfe\x08\x48\x00\xec\xaf\xcf\xd5\x62\
+\x11\x10\x01\x11\x10\x01\x11\x18\x24\x00\x34\x08\x44\x40\x04\x44\
+\x60\xf7\x04\x04\x60\x8f\x04\x24\x00\xf6\xd8\xeb\x6a\xb3\x08\x88\
+\x80\x08\x88\xc0\xee\x09\x48\x00\xec\x7e\x08\x08\x80\x08\x88\xc0\
+\xde\x09\xa8\xfd\xfb\x24\x20\x01\xb0\xcf\x7e\x57\xab\x45\x40\x04\
+\x44\x40\x04\x76\x4e\x40\x02\x60\xe7\x03\x40\xcd\x17\x01\x11\xd8\
+\x3b\x01\xb5\x7f\xaf\x04\x24\x00\xf6\xda\xf3\x6a\xb7\x08\x88\x80\
+\x08\x88\xc0\xae\x09\x48\x00\xec\xba\xfb\xd5\x78\x11\x10\x81\xbd\
+\x13\x50\xfb\xf7\x4b\x40\x02\x60\xbf\x7d\xaf\x96\x8b\x80\x08\x88\
+\x80\x08\xec\x98\x80\x04\xc0\x8e\x3b\x5f\x4d\x17\x01\x11\xd8\x3b\
+\x01\xb5\x7f\xcf\x04\x24\x00\xf6\xdc\xfb\x6a\xbb\x08\x88\x80\x08\
+\x88\xc0\x6e\x09\x48\x00\xec\xb6\xeb\xd5\x70\x11\x10\x81\xbd\x13\
+\x50\xfb\xf7\x4d\xe0\xff\x02\x00\x00\xff\xff\x85\xcf\x13\x59\x00\
+\x00\x00\x06\x49\x44\x41\x54\x03\x00\xad\x57\xb0\xd1\x75\x81\xde\
+\x79\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x3b\x2a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x9d\x5b\x92\xdb\x48\
+\x92\xae\x83\x1c\x53\xd5\xd3\x2c\xe0\xf4\xd9\x80\xde\x7b\xc6\xc6\
+\xac\x64\x6d\x95\xf9\x3e\xfd\x5e\xaa\x05\x4c\x3f\x6b\x05\x4a\xad\
+\x40\xbb\x28\xf5\x2e\x32\xdb\xca\xa4\x35\xe4\x56\x7a\xca\x5a\x98\
+\xf0\x00\x41\x32\x99\x00\x89\x4b\x5c\xdc\x23\xbe\x34\x85\x48\x82\
+\x40\x84\xfb\xe7\x48\xf8\x1f\x17\x20\xf7\x8e\x1f\x08\x40\x00\x02\
+\x10\x80\x00\x04\x9a\x23\x80\x00\x68\x2e\xe4\x38\x0c\x01\x08\x40\
+\x00\x02\x10\x70\x0e\x01\xc0\x59\x00\x01\x08\x40\x00\x02\x10\x68\
+\x90\x00\x02\xa0\xc1\xa0\xe3\x32\x04\x20\x00\x01\x08\xb4\x4d\x40\
+\xbc\x47\x00\x08\x05\x0a\x04\x20\x00\x01\x08\x40\xa0\x31\x02\x08\
+\x80\xc6\x02\x8e\xbb\x10\x80\x00\x04\x20\xd0\x3a\x81\xde\x7f\x04\
+\x40\xcf\x81\xff\x21\x00\x01\x08\x40\x00\x02\x4d\x11\x40\x00\x34\
+\x15\x6e\x9c\x85\x00\x04\x20\x00\x81\xd6\x09\x0c\xfe\x23\x00\x06\
+\x12\xbc\x42\x00\x02\x10\x80\x00\x04\x1a\x22\x80\x00\x68\x28\xd8\
+\xb8\x0a\x01\x08\x40\x00\x02\xad\x13\x38\xf9\x8f\x00\x38\xb1\xe0\
+\x1d\x04\x20\x00\x01\x08\x40\xa0\x19\x02\x08\x80\x66\x42\x8d\xa3\
+\x10\x80\x00\x04\x20\xd0\x3a\x81\x73\xff\x11\x00\xe7\x34\x78\x0f\
+\x01\x08\x40\x00\x02\x10\x68\x84\x00\x02\xa0\x91\x40\xe3\x26\x04\
+\x20\x00\x01\x08\xb4\x4e\xe0\xa5\xff\x08\x80\x97\x3c\xf8\x04\x01\
+\x08\x40\x00\x02\x10\x68\x82\x00\x02\xa0\x89\x30\xe3\x24\x04\x20\
+\x00\x01\x08\xb4\x4e\xe0\xd2\x7f\x04\xc0\x25\x11\x3e\x43\xa0\x72\
+\x02\x6f\x7f\xf9\xfd\x2e\x94\x5f\xbf\x3e\xbc\x1d\xca\xfb\x6f\x8f\
+\x6f\x47\xcb\xd7\xee\xed\xfb\x5c\x65\xc4\x86\xc1\xbe\xe1\xf5\x60\
+\x7b\xe5\x21\xc2\x3d\x08\x64\x21\x80\x00\xc8\x82\x99\x46\x20\x90\
+\x8f\x40\x48\xee\x92\x28\x87\xa4\x79\x4c\xec\x7d\x22\x77\xbb\xfd\
+\x63\x28\x9d\xfb\xe8\x86\xe2\xba\x3b\x37\x5a\x5c\xc6\x9f\x11\x1b\
+\x06\xfb\x86\xd7\x83\xed\x27\x51\xe2\x45\xc3\xe0\xa7\xbc\x7a\xbf\
+\x33\x1a\x4c\x53\x10\x30\x44\xe0\xb5\xa9\x08\x80\xd7\x4c\xd8\x02\
+\x01\x33\x04\x8e\xc9\xfe\x2c\xc9\x87\xe4\x2e\x89\x72\x48\x9a\xc7\
+\xc4\x6e\xc6\xad\x05\x86\x7a\xd1\x30\xf8\x29\xaf\xde\xef\x31\x71\
+\xb0\xa0\x42\x76\x85\x40\x33\x04\x10\x00\xcd\x84\x1a\x47\x6b\x20\
+\x10\x12\xbe\xf4\x74\x43\xc2\xff\xda\x1d\x93\x7d\xd5\x49\x7e\x6d\
+\xe4\xba\xbb\x61\x84\xe3\x28\x0a\x84\x9d\x14\x46\x0a\xd6\x42\xe5\
+\x38\xa3\x04\xc6\xcc\x46\x00\x8c\x51\x61\x1b\x04\x14\x10\x08\xc9\
+\xde\x27\xaa\xd3\xdc\xfc\x21\xe1\x4b\x4f\x37\x24\x7c\x05\x46\x5a\
+\x33\x41\xd8\x49\x39\x8e\x14\x9c\xa6\x10\xac\xb9\x82\xbd\x10\xd8\
+\x4a\x00\x01\xb0\x95\x20\xc7\x43\x20\x22\x81\xf3\xa4\x4f\xef\x3e\
+\x22\xd8\xc9\xaa\x2e\x46\x09\x64\x74\xc0\x97\xc9\xdd\xf9\x02\x02\
+\x26\x09\x8c\x1b\x8d\x00\x18\xe7\xc2\x56\x08\x64\x23\x10\x92\x7e\
+\x18\xd2\xff\xd6\x2f\xce\xf3\xbd\xd3\x7e\x41\x5e\x36\x13\x68\x68\
+\x20\x20\xa3\x03\xbe\x84\x29\x03\x2f\x04\xe4\x2e\x89\xe1\x2b\x5e\
+\x21\x50\x1b\x01\x04\x40\x6d\x11\xc5\x1f\x13\x04\x5e\x25\xfd\x30\
+\xa4\xef\x7b\xa3\x26\xac\x6f\xc4\x48\x2f\x04\x64\x0d\x41\x10\x03\
+\x22\xd0\xbc\x20\x68\xc4\x73\xdc\xac\x8c\xc0\x94\x3b\x08\x80\x29\
+\x32\x6c\x87\x40\x64\x02\x24\xfd\xc8\x40\xb3\x56\xe7\xc5\x99\x17\
+\x04\x88\x81\xac\xd0\x69\x2c\x31\x01\x04\x40\x62\xc0\x54\x0f\x81\
+\x21\xf1\x87\x39\x7d\x7a\xfa\x15\x9c\x10\x67\x62\x80\x51\x81\x0a\
+\xe2\x59\xbb\x0b\xd3\xfe\x21\x00\xa6\xd9\xf0\x0d\x04\x36\x11\x78\
+\x9d\xf8\x37\x55\xc7\xc1\x1a\x09\x0c\xa3\x02\x5e\x08\xb0\x5e\x40\
+\x63\x80\xb0\xe9\x1a\x01\x04\xc0\x35\x3a\x7c\x07\x81\x85\x04\x86\
+\xa4\x2f\x43\xc5\xa7\x1e\xff\xc2\x4a\xd8\xdd\x1e\x01\x2f\x04\x8e\
+\xeb\x05\xbc\x18\xb0\xe7\x00\x16\xd7\x4a\xe0\x9a\x5f\x08\x80\x6b\
+\x74\xf8\x0e\x02\x33\x09\x0c\x89\x9f\xa4\x3f\x13\x58\xcd\xbb\x79\
+\x31\x20\x02\x90\x11\x81\x9a\x83\x5c\x87\x6f\x08\x80\x3a\xe2\x88\
+\x17\x85\x08\x90\xf8\x0b\x81\xb7\xd0\xec\x99\x10\x40\x0c\x58\x08\
+\x58\x8d\x36\x5e\xf7\x09\x01\x70\x9d\x0f\xdf\x42\x60\x94\x00\x89\
+\x7f\x14\x0b\x1b\xc7\x08\x78\x21\x10\xa6\x07\x98\x1a\x18\xa3\xc3\
+\xb6\x82\x04\x10\x00\x05\xe1\xd3\xb4\x3d\x02\x24\x7e\x7b\x31\x53\
+\x63\xb1\x17\x02\x4c\x0d\xa8\x89\x46\x13\x86\xdc\x72\x12\x01\x70\
+\x8b\x10\xdf\x43\xc0\x13\x20\xf1\x7b\x08\xfc\x8b\x43\x00\x21\x10\
+\x87\x23\xb5\x6c\x26\x80\x00\xd8\x8c\x90\x0a\x6a\x27\x10\xe6\x6f\
+\x79\x3c\x6f\xed\x61\xce\xef\x1f\x42\x20\x3f\xf3\xa6\x5a\xbc\xed\
+\x2c\x02\xe0\x36\x23\xf6\x68\x94\x80\x24\x7e\x19\xb2\x95\xf9\xdb\
+\x46\x11\xe0\x76\x0e\x02\x08\x81\x1c\x94\x69\x63\x84\x00\x02\x60\
+\x04\x0a\x9b\xda\x26\x70\x1c\xee\xf7\x17\xe6\xb6\x49\xe0\x7d\x56\
+\x02\xfe\x7c\x0b\xa2\xf3\x97\xdf\xef\xb2\xb6\x4b\x63\x55\x12\x98\
+\xe3\x14\x02\x60\x0e\x25\xf6\x69\x86\xc0\xdb\xf7\x87\xbf\xc8\x17\
+\x1e\xd9\xdb\x8c\xdb\x38\xaa\x85\x80\x17\x01\xf2\x2c\x09\x11\x02\
+\x5a\x4c\xc2\x8e\x7a\x09\x20\x00\xea\x8d\x2d\x9e\x2d\x20\xd0\xf7\
+\xfa\xbf\x76\xfc\x19\xde\x05\xd0\xd8\x35\x1d\x01\x2f\x04\x82\x18\
+\x4d\xd7\x02\x35\x57\x4d\x60\x9e\x73\x08\x80\x79\x9c\xd8\xab\x62\
+\x02\xe1\x42\x1b\x16\xf9\x55\xec\x24\xae\x19\x24\xd0\xdd\xc9\x1a\
+\x14\x46\x03\x0c\x86\xce\x88\xc9\x08\x00\x23\x81\xc2\xcc\xf8\x04\
+\xe8\xf5\xc7\x67\x4a\x8d\x09\x08\xc8\x68\x00\x0f\x11\x4a\x00\xb6\
+\xde\x2a\xe7\x7a\x86\x00\x98\x4b\x8a\xfd\xaa\x22\x10\x7a\x55\xf4\
+\xfa\xab\x8a\x69\xd5\xce\x88\x08\x78\xff\xb5\x0b\xe7\x6d\xd5\x8e\
+\xe2\x5c\x4e\x02\x08\x80\x9c\xb4\x69\xab\x38\x81\xbe\xd7\xff\xed\
+\x91\x5b\xfb\x8a\x87\x02\x03\xd6\x10\xe8\xdc\x47\x44\xc0\x1a\x70\
+\x2d\x1d\x33\xdf\x57\x04\xc0\x7c\x56\xec\x69\x9c\x40\xb8\x70\x86\
+\x5e\x7f\xc7\x6d\x56\xc6\x63\xd9\xb4\xf9\x22\x02\x18\x0d\x68\xfa\
+\x14\x88\xe5\x3c\x02\x20\x16\x49\xea\x51\x4d\x20\x2c\xf4\xf3\x17\
+\x4e\xd5\x46\x62\x1c\x04\x96\x10\xf0\xe7\x73\x10\xb5\x4b\x8e\x61\
+\xdf\xea\x09\x2c\x71\x10\x01\xb0\x84\x16\xfb\x9a\x23\xd0\x0f\xf9\
+\x73\x7b\x9f\xb9\xc0\x61\xf0\x3c\x02\x88\x80\x79\x9c\xd8\x6b\x94\
+\x00\x02\x60\x14\x0b\x1b\x6b\x20\x10\x7a\x47\x61\xc8\xbf\x06\x6f\
+\xf0\x01\x02\x13\x04\x44\x04\xbc\xff\xf6\x28\x62\x77\x62\x0f\x36\
+\x37\x43\x60\x99\xa3\x08\x80\x65\xbc\xd8\xdb\x08\x81\x90\xfc\xfd\
+\x85\xd1\x88\xb9\x98\x09\x81\x8d\x04\xba\x3b\x9e\x20\xb8\x11\x61\
+\x83\x87\x23\x00\x1a\x0c\x7a\xed\x2e\x93\xfc\x6b\x8f\x30\xfe\x4d\
+\x12\xf0\xa2\x37\x9c\xff\x93\x3b\xf0\x45\xcd\x04\x96\xfa\x86\x00\
+\x58\x4a\x8c\xfd\x55\x13\x60\xb1\x9f\xea\xf0\x60\x5c\x0e\x02\x88\
+\x80\x1c\x94\xab\x68\x03\x01\x50\x45\x18\x71\x42\xe6\x3f\xe5\xb1\
+\xa9\x3c\xcb\x9f\x73\x01\x02\x9e\x00\x22\xc0\x43\x68\xed\xdf\x72\
+\x7f\x11\x00\xcb\x99\x71\x84\x32\x02\x61\xc8\x93\xc5\x7e\xca\xa2\
+\x82\x39\xc5\x09\x88\x08\x60\x71\x60\xf1\x30\x68\x36\x00\x01\xa0\
+\x39\x3a\xd8\x76\x93\x40\x48\xfe\xfe\x42\x77\x73\x47\x76\x80\x40\
+\x93\x04\x0e\x8b\x03\x7f\xf9\xfd\xae\x49\xf7\x1b\x72\x7a\x8d\xab\
+\x08\x80\x35\xd4\x38\x46\x05\x01\x92\xbf\x8a\x30\x60\x84\x05\x02\
+\x7e\x84\x4c\xa6\xc9\x2c\x98\x8a\x8d\xf9\x08\x20\x00\xf2\xb1\xa6\
+\xa5\x88\x04\x48\xfe\x11\x61\x52\x55\x1b\x04\x10\x01\x15\xc7\x79\
+\x9d\x6b\x08\x80\x75\xdc\x38\xaa\x20\x01\x92\x7f\x41\xf8\x34\x6d\
+\x9b\x00\x22\xc0\x76\xfc\x22\x5b\x8f\x00\x88\x0c\x94\xea\xd2\x12\
+\x20\xf9\xa7\xe5\x4b\xed\x0d\x10\x40\x04\x54\x17\xe4\xb5\x0e\x21\
+\x00\xd6\x92\xe3\xb8\xec\x04\x48\xfe\xd9\x91\xd3\x60\xad\x04\x10\
+\x01\xb5\x46\x76\x91\x5f\x08\x80\x45\xb8\xd8\xb9\x14\x01\x92\x7f\
+\x29\xf2\xb4\x5b\x2d\x01\x44\x40\x25\xa1\x5d\xef\x06\x02\x60\x3d\
+\x3b\x8e\xcc\x44\x80\xe4\x9f\x09\x34\xcd\xb4\x47\x00\x11\xd0\x5e\
+\xcc\xcf\x3c\x46\x00\x9c\xc1\xe0\xad\x3e\x02\x24\x7f\x7d\x31\xc1\
+\xa2\xca\x08\x20\x02\x4c\x07\x74\x8b\xf1\x08\x80\x2d\xf4\x38\x36\
+\x29\x01\x92\x7f\x52\xbc\x54\x0e\x81\x13\x81\xdd\xbf\x7d\x3c\x7d\
+\xe0\x5d\x2b\x04\x10\x00\xad\x44\xda\x98\x9f\xe1\xa1\x25\x3c\xe1\
+\xcf\x58\xd4\x30\xd7\x2e\x81\xee\x2e\xfc\x21\x2d\xbb\x0e\x34\x6a\
+\xf9\x36\xb7\x11\x00\xdb\xf8\x71\x74\x2a\x02\x7e\x58\x32\x55\xd5\
+\xd4\x0b\x01\x08\x8c\x11\xf0\x22\xe0\xd7\xaf\x0f\x63\xdf\xb0\xad\
+\x4e\x02\x08\x80\x3a\xe3\x6a\xda\xab\x30\xf4\x6f\xda\x03\x8c\x87\
+\x80\x51\x02\x7e\xd4\x8d\xdf\x3f\x3b\xb1\xdb\x6a\x29\x02\x60\x2b\
+\x41\x8e\x8f\x4a\x20\x5c\x7c\xfc\x45\x28\x6a\xa5\x54\x06\x01\x08\
+\xcc\x27\xe0\x7f\xff\xc2\x14\xdc\xfc\x23\xd8\xd3\x28\x01\x04\x80\
+\xd1\xc0\xd5\x68\x36\xc9\xbf\xc6\xa8\xe2\x93\x49\x02\x7e\x0a\x0e\
+\x11\xa0\x3d\x72\xdb\xed\x43\x00\x6c\x67\x48\x0d\x11\x08\x84\x8b\
+\x8d\xef\x79\x44\xa8\x8a\x2a\x20\x00\x81\x18\x04\xb8\x33\x20\x06\
+\x45\xd5\x75\x20\x00\x54\x87\xa7\x21\xe3\x7c\x8f\xa3\x21\x6f\x71\
+\x15\x02\x06\x08\xb0\x28\x50\x73\x90\x62\xd8\x86\x00\x88\x41\x91\
+\x3a\x36\x11\xe0\xf6\xa3\x4d\xf8\x38\x18\x02\xe9\x08\xf8\x51\xb9\
+\x30\x35\x97\xae\x05\x6a\x2e\x48\x00\x01\x50\x10\x3e\x4d\x3b\xd7\
+\x5f\x5c\xba\x3b\x58\x40\x00\x02\x4a\x09\x88\x08\xf8\xe5\x77\x7e\
+\x47\x55\x85\x27\x8e\x31\x08\x80\x38\x1c\xa9\x65\x05\x81\x90\xfc\
+\xfd\xc5\x65\xc5\xa1\x1c\x02\x01\x08\xe4\x24\xe0\xa7\xe8\xc2\x3a\
+\x9d\x9c\x6d\xd2\x56\x72\x02\x08\x80\xe4\x88\x69\x60\x92\x00\xc9\
+\x7f\x12\x0d\x5f\x40\x40\x1d\x01\x16\x05\xaa\x09\x49\x2c\x43\x10\
+\x00\xb1\x48\x52\xcf\x22\x02\xa1\xf7\xbf\xe8\x08\x76\x86\x00\x04\
+\xca\x12\x60\x51\x60\x59\xfe\xf1\x5b\x47\x00\xc4\x67\x4a\x8d\x37\
+\x08\x84\xe4\x4f\xef\xff\x06\x25\xbe\x86\x80\x42\x02\xfe\xf7\x96\
+\xa9\x80\xd2\x71\x89\xd7\x3e\x02\x20\x1e\x4b\x6a\x9a\x4b\xc0\x5f\
+\x44\xe6\xee\xca\x7e\x10\x80\x80\x32\x02\x4c\x05\x28\x0b\xc8\x7a\
+\x73\x10\x00\xeb\xd9\x71\xe4\x0a\x02\xa1\xf7\xbf\xe2\x38\x0e\x81\
+\x00\x04\xb4\x10\x60\x2a\xa0\x64\x24\x62\xb6\x8d\x00\x88\x49\x93\
+\xba\xae\x12\x08\xc9\x9f\xde\xff\x55\x46\x7c\x09\x01\x13\x04\xfc\
+\xef\x31\x53\x01\x26\x22\x75\xd5\x48\x04\xc0\x55\x3c\x7c\x19\x95\
+\x80\xbf\x68\x44\xad\x8f\xca\x20\x00\x81\x72\x04\x98\x0a\x28\xc0\
+\x3e\x6e\x93\x08\x80\xb8\x3c\xa9\x6d\x82\x40\xe8\xfd\x4f\x7c\xc7\
+\x66\x08\x40\xc0\x22\x01\xa6\x02\x2c\x46\xed\xdc\x66\x04\xc0\x39\
+\x0d\xde\x27\x21\x10\x92\x3f\xbd\xff\x24\x6c\xa9\x14\x02\x45\x09\
+\xf0\x7b\x9d\x15\x7f\xec\xc6\x10\x00\xb1\x89\x52\xdf\x6b\x02\x5c\
+\x24\x5e\x33\x61\x0b\x04\x2a\x21\xc0\xdf\xf2\xb0\x1b\x48\x04\x80\
+\xdd\xd8\x99\xb0\x3c\xf4\xfe\x4d\x58\x8a\x91\x10\x80\xc0\x3a\x02\
+\x7e\x2a\x80\xbf\x15\xb0\x0e\xdd\xa2\xa3\xe2\xef\x8c\x00\x88\xcf\
+\x94\x1a\x0f\x04\xc2\x2a\x61\x7a\xff\x07\x1a\xbc\x40\xa0\x62\x02\
+\x2c\x08\x34\x19\x5c\x04\x80\xc9\xb0\x19\x31\x7a\xbf\xe7\x2f\x88\
+\x19\x09\x15\x66\x42\x60\x1b\x01\x46\x01\xb6\xf1\xbb\x7d\x74\x8a\
+\x3d\xf6\x29\x2a\xa5\x4e\x08\x84\xa1\x7f\x7a\xff\x9c\x08\x10\x68\
+\x87\x00\xa3\x00\xe6\x62\x8d\x00\x30\x17\x32\x0c\x86\x00\x04\x20\
+\xa0\x91\x80\x1f\x05\xf8\xf5\xeb\x83\x46\xcb\xec\xdb\x94\xc6\x03\
+\x04\x40\x1a\xae\x4d\xd7\x4a\xef\xbf\xe9\xf0\xe3\x7c\xcb\x04\x18\
+\xf5\x33\x15\x7d\x04\x80\xa9\x70\x19\x31\x96\x8b\x80\x91\x40\x61\
+\x26\x04\xe2\x13\x08\x1d\x80\xf8\xd5\x36\x5d\x63\x2a\xe7\x11\x00\
+\xa9\xc8\x36\x5a\x2f\xbf\xfc\x8d\x06\x1e\xb7\x21\x30\x10\xa0\x03\
+\x30\x90\x50\xff\x8a\x00\x50\x1f\x22\x63\x06\xf2\xcb\x6f\x2c\x60\
+\x98\x0b\x81\xf8\x04\x78\x38\x50\x4c\xa6\xe9\xea\x42\x00\xa4\x63\
+\xdb\x5c\xcd\xf4\xfe\x9b\x0b\x39\x0e\x43\x60\x82\x40\x77\x17\x9e\
+\x03\x32\xf1\x2d\x9b\x75\x10\x40\x00\xe8\x88\x43\x1d\x56\xd0\xfb\
+\xaf\x23\x8e\x78\x01\x81\x18\x04\xb8\x2d\x30\x06\x45\x97\xb2\x12\
+\x04\x40\x4a\xba\x0d\xd5\x4d\xef\xbf\xa1\x60\xe3\x2a\x04\x66\x11\
+\x60\x14\x60\x16\xa6\x82\x3b\x21\x00\x0a\xc2\xaf\xaa\x69\x7a\xff\
+\x55\x85\x13\x67\x20\x10\x85\x00\xa3\x00\x1b\x31\xa6\x3d\x1c\x01\
+\x90\x96\x6f\x13\xb5\xd3\xfb\x6f\x22\xcc\x38\x09\x81\x15\x04\x3a\
+\x1e\x07\xbe\x82\x5a\xae\x43\x10\x00\xb9\x48\xd3\x0e\x04\x20\x00\
+\x81\x06\x09\xb0\x18\x70\x7d\xd0\x53\x1f\x89\x00\x48\x4d\xb8\x85\
+\xfa\x19\xfe\x6f\x21\xca\xf8\x08\x81\x75\x04\x98\x06\x58\xc7\x2d\
+\xc3\x51\x08\x80\x0c\x90\x6b\x6e\x82\xe1\xff\x9a\xa3\x8b\x6f\x10\
+\x88\x41\x80\xc5\x80\xeb\x28\xa6\x3f\x0a\x01\x90\x9e\x71\xdd\x2d\
+\xd0\xfb\xaf\x3b\xbe\x78\x07\x81\x18\x04\x18\x05\x88\x41\x31\x7a\
+\x1d\x08\x80\xe8\x48\xdb\xa9\x90\xde\x7f\x3b\xb1\xc6\x53\x08\x6c\
+\x23\xc0\x28\xc0\x52\x7e\x39\xf6\x47\x00\xe4\xa0\x5c\x6b\x1b\xf4\
+\xfe\x6b\x8d\x2c\x7e\x41\x20\x3e\x81\xfd\x9e\x3b\x02\xe2\x53\xdd\
+\x54\xe3\x7e\xd3\xd1\x1c\xdc\x2c\x01\x7a\xff\xcd\x86\xfe\xcc\xf1\
+\xdd\x93\x73\x87\xb2\x73\x9f\xdc\x54\x19\xf6\x71\xfc\x34\x4d\xa0\
+\xdb\xfd\xdc\xb4\xff\x8b\x9c\xcf\xb3\x33\x02\x20\x0f\x67\x5a\x81\
+\x80\x61\x02\x87\x24\xdf\x7d\xbf\x77\xbe\x3c\x7f\x79\xb7\xeb\xcb\
+\x4f\xf7\xcf\x5f\x0e\xe5\xb7\x77\x0f\xcf\x53\x65\xd8\xe7\x70\x9c\
+\xd4\x71\x14\x0b\x41\x1c\x18\x46\x83\xe9\x0b\x08\x30\x0d\xb0\x00\
+\x56\x96\x5d\x11\x00\x59\x30\x57\xd8\x48\xe7\x3e\x56\xe8\x15\x2e\
+\x1d\x09\xf8\xa4\xef\x93\xbd\x24\xeb\x63\x92\xff\xfb\x5f\x9e\x9e\
+\x7d\x39\xee\xb2\xf2\x8d\xd4\x71\x14\x0b\x41\x1c\xbc\xdb\x49\x3b\
+\x41\x14\x20\x08\x56\x52\x35\x72\x18\x8b\x01\x67\x05\x2a\xd7\x4e\
+\x08\x80\x5c\xa4\x2b\x6a\x87\xe1\xff\x8a\x82\xf9\xc2\x95\x3e\xe9\
+\x3f\x87\x9e\xba\xef\xd9\xfb\x64\x2f\xc9\xfa\xc5\x2e\x89\x3e\x48\
+\x3b\x41\x14\x0c\x82\x40\xa6\x13\x10\x03\x89\x68\x97\xac\x96\x51\
+\x80\x92\xf4\x2f\xdb\x46\x00\x5c\x12\xe1\x33\x04\x5a\x23\x20\xc9\
+\xd6\xf7\xf6\x9f\x25\xf9\xfa\xa4\xaf\xc1\xfd\x41\x0c\x84\x51\x01\
+\xb1\x4f\x83\x51\xd8\x00\x81\x2c\x04\xf2\x35\x82\x00\xc8\xc7\xba\
+\x9e\x96\x18\xfe\xaf\x20\x96\x67\xbd\x7d\x99\xbb\x57\x92\xf8\x2f\
+\xc1\x06\x21\x20\xf6\xf9\x51\x89\x20\x06\x2e\x77\xe0\xb3\x3d\x02\
+\x4c\x03\xa8\x89\x19\x02\x40\x4d\x28\x6c\x18\xc2\xf0\xbf\x8d\x38\
+\x5d\xb5\x52\x59\x6f\xff\xaa\xad\x67\x5f\x06\x31\x80\x10\x38\x23\
+\x62\xf5\x2d\x7f\x20\xe8\x5a\xe4\x72\x7e\x87\x00\xc8\x49\x9b\xb6\
+\x20\x50\x92\x80\x1f\x4a\x7f\xf6\x09\x54\xe6\xdb\x4b\x9a\xb1\xb5\
+\x6d\x84\xc0\x56\x82\xe5\x8f\xe7\x0f\x04\x95\x8f\x81\x58\x80\x00\
+\x10\x0a\x94\xf9\x04\x18\xfe\x9f\xcf\x4a\xcd\x9e\x87\xe1\x7e\x3f\
+\x94\xae\xc6\xa4\x08\x86\x88\x10\x60\x5a\x20\x02\xc8\x12\x55\x30\
+\x0d\x30\x41\x3d\xef\x66\x04\x40\x5e\xde\xa6\x5b\x63\xf8\xdf\x60\
+\xf8\x42\xaf\xbf\x5f\xd1\x6f\xd0\xfa\x9b\x26\x8b\x08\x90\x51\x0d\
+\x84\xc0\x4d\x54\xca\x76\x60\x1a\x40\x43\x40\x10\x00\x1a\xa2\x80\
+\x0d\x10\x88\x4e\xa0\xce\x5e\xff\x14\x26\x11\x02\x88\x80\x29\x3a\
+\x3a\xb7\x33\x0d\xf0\x3a\x2e\xb9\xb7\x20\x00\x72\x13\xb7\xdc\x1e\
+\xc3\xff\x36\xa2\x57\x79\xaf\x7f\x2a\x08\x22\x02\xc2\x68\x00\xcf\
+\x0f\x98\x42\xa4\x6b\x3b\xd3\x00\xc5\xe3\x81\x00\x28\x1e\x02\x1b\
+\x06\xa0\xd6\x6d\xc4\x49\x7a\xc1\x92\x08\x8d\x58\x9b\xc4\xcc\xe7\
+\x2f\x3f\xdd\x0b\x87\x24\x95\x53\x29\x04\x92\x11\xc8\x5f\x31\x02\
+\x20\x3f\x73\x9b\x2d\xf2\x97\xbc\xf4\xc7\x4d\x6e\xef\xab\x6c\xa1\
+\xdf\x5a\xe8\x41\x04\xed\xdc\xa7\xb5\xc7\x73\x5c\x0e\x02\x3c\x15\
+\x30\x07\xe5\x6b\x6d\x20\x00\xae\xd1\xe1\xbb\x13\x01\x86\xff\x4f\
+\x2c\x34\xbe\x93\xe4\xaf\xf4\x61\x3e\xa5\x70\x21\x02\x4a\x91\x5f\
+\xd0\x2e\x1d\x8b\x23\xac\x12\x6f\x10\x00\x25\xa8\xd3\x26\x04\x62\
+\x12\x20\xf9\x4f\xd2\x44\x04\x4c\xa2\xd1\xf1\x45\xb7\xfb\x59\x87\
+\x21\x6d\x5a\x81\x00\x68\x33\xee\x8b\xbc\x66\xfe\x7f\x11\xae\xbc\
+\x3b\x93\xfc\x6f\xf2\x46\x04\xdc\x44\x54\x70\x07\x6e\x07\xec\xe1\
+\x97\xf9\x1f\x01\x50\x86\xbb\xad\x56\x19\xa6\xd3\x19\x2f\x92\xff\
+\xec\xb8\x20\x02\x66\xa3\xca\xbe\x23\x1d\x8c\xec\xc8\x8f\x0d\x22\
+\x00\x8e\x28\x78\x33\x49\x80\x61\xba\x49\x34\xc5\xbe\xd8\xb9\x4f\
+\xd6\x1f\xe9\x9b\x9b\x5d\x10\x01\xdc\x22\x98\x1b\x3b\xed\xcd\x20\
+\x50\x6a\x17\x04\x40\x29\xf2\xa6\xda\x65\x98\x4e\x55\xb8\x24\xf9\
+\xb3\xda\x7f\x55\x48\xc2\x2d\x82\x88\x80\x55\xec\x92\x1d\xc4\xf3\
+\x00\x92\xa1\xbd\x55\x31\x02\xe0\x16\x21\xbe\x87\x80\x26\x02\x24\
+\xff\xed\xd1\xe8\xfe\xc5\xed\x81\xdb\x29\x52\x43\x34\x02\xe5\x2a\
+\x42\x00\x94\x63\x6f\xa2\x65\x9e\xff\xaf\x2b\x4c\xfd\x30\xb6\x2e\
+\x9b\xac\x59\x13\xa6\x4e\xba\xef\xf7\xd6\xec\xae\xd7\x5e\x46\x18\
+\x4b\xc5\x16\x01\x50\x8a\x3c\xed\x42\x60\x29\x81\x1d\x0f\xb6\x59\
+\x8a\x6c\x6a\xff\x20\x02\xe0\x39\x85\x27\xfb\xf6\x96\x17\x02\x66\
+\x87\x7d\xd6\x20\x02\xe0\x0c\x06\x6f\x47\x08\xb0\x00\x70\x04\x4a\
+\x81\x4d\x3e\x59\xd1\xfb\x8f\xcb\x1d\x9e\x71\x79\x6e\xaa\x8d\x3b\
+\x8d\x36\xe1\x5b\x7b\x30\x02\x60\x2d\xb9\x66\x8e\x63\x78\x4e\x43\
+\xa8\x49\x56\x89\xa2\xc0\x54\x40\x22\xb0\x0b\xab\x6d\xb6\xa3\xb1\
+\x90\x53\xe4\xdd\x11\x00\x91\x81\xd6\x54\x1d\xc3\x72\x4a\xa2\xe9\
+\x7b\xff\x4a\x2c\xa9\xce\x8c\x30\x15\xc0\x5d\x01\xd5\xc5\x15\x87\
+\xe6\x11\x40\x00\xcc\xe3\xd4\xe6\x5e\x0c\xcb\x95\x8f\xbb\x4f\xfe\
+\xf4\xfe\x13\x87\x81\xbb\x02\x12\x03\x9e\x53\x7d\x9b\x23\x8d\x73\
+\xc8\xa4\xdc\x07\x01\x90\x92\x2e\x75\x43\x00\x02\xea\x09\x84\x51\
+\x00\x2f\xb4\xd4\x1b\x5a\xb9\x81\x8c\x38\xe6\x0f\x30\x02\x20\x3f\
+\x73\x5a\x84\xc0\x3c\x02\x3e\x29\xd1\xfb\x9f\x87\x6a\xeb\x5e\x70\
+\xde\x4a\x90\xe3\x97\x13\x28\x7f\x04\x02\xa0\x7c\x0c\xf4\x5a\xc0\
+\xc2\x1c\xbd\xb1\xc1\xb2\xf8\x04\xbc\xe0\x8a\x5f\x29\x35\xce\x26\
+\xc0\x94\xe3\x6c\x54\xb1\x76\x44\x00\xc4\x22\x59\x65\x3d\xcc\xcb\
+\x15\x0b\xab\x4f\x46\xf4\x4a\xf3\xd2\x87\x77\x5e\xde\xad\xb7\xa6\
+\xc1\x7f\x04\x80\x86\x28\x60\x03\x04\x20\xa0\x84\xc0\xee\x49\x89\
+\x21\xed\x99\xc1\x88\x63\xf6\x98\x23\x00\xb2\x23\xb7\xd1\x20\x0b\
+\x72\xca\xc6\x89\xde\x68\x21\xfe\xdc\x11\x50\x08\x7c\x6b\xcd\xea\
+\xf0\x17\x01\xa0\x23\x0e\x58\x01\x81\x13\x01\x3f\xfc\x7f\xfa\xc0\
+\xbb\x9c\x04\xc2\x1d\x01\x3c\x17\x20\x27\xf2\xb3\xb6\x98\x72\x3c\
+\x83\x91\xe5\x2d\x02\x20\x0b\x66\x83\x8d\xb0\x20\xa7\x58\xd0\xe8\
+\xfd\x17\x43\xdf\x37\xcc\x28\x40\xcf\x81\xff\x93\x11\xd0\x52\x31\
+\x02\x40\x4b\x24\xb0\x03\x02\x81\x00\x73\xd0\x01\x43\xc1\xff\xfa\
+\x51\x80\x82\x06\x34\xdc\x34\x53\x8f\x79\x83\x8f\x00\xc8\xcb\x9b\
+\xd6\x20\x70\x9d\xc0\xae\xfb\xc7\xf5\x1d\xf8\x36\x0f\x01\x84\x58\
+\x1e\xce\x2d\xb6\xa2\xc7\x67\x04\x80\x9e\x58\xe8\xb2\x84\x15\xb9\
+\x65\xe2\xf1\xfd\x3b\xab\xd0\xcb\x90\x7f\xd9\x2a\x42\xec\x25\x8f\
+\x5c\x9f\x98\x7a\xcc\x45\x3a\xb4\x59\x38\x13\x33\x00\x00\x10\x00\
+\x49\x44\x41\x54\x83\x00\x08\x18\xf8\xef\x35\x01\x16\xe4\xbc\x66\
+\x92\x7e\x0b\xc3\xcf\xe9\x19\xcf\x6a\x01\x21\x36\x0b\x13\x3b\x2d\
+\x27\xa0\xe9\x08\x04\x80\xa6\x68\x60\x4b\xdb\x04\x58\xfd\xaf\x26\
+\xfe\x08\xb1\x42\xa1\x60\xe4\x31\x2b\x78\x04\x40\x56\xdc\x34\x06\
+\x01\x08\xd8\x21\xc0\x3a\x00\x3b\xb1\xb2\x62\xa9\x2e\x3b\x11\x00\
+\xba\xe2\x81\x35\x2d\x13\x60\xd8\x59\x57\xf4\x59\x07\xa0\x2b\x1e\
+\x58\x13\x9d\x00\x02\x20\x3a\x52\xfb\x15\x72\x2b\x4e\x99\x18\x32\
+\xec\x5c\x86\xfb\x64\xab\x08\xb2\x49\x34\x7c\xb1\x8e\x80\xb6\xa3\
+\x10\x00\xda\x22\x82\x3d\x8d\x12\x60\xb8\xb9\xd1\xc0\xe3\xf6\x0b\
+\x02\x2c\x3e\x7e\x81\x23\xf1\x07\x04\x40\x62\xc0\x26\xab\xe7\x56\
+\x9c\xfc\x61\x63\xb8\x39\x3f\xf3\x1b\x2d\x32\x22\x73\x03\x10\x5f\
+\x2f\x24\xa0\x6f\x77\x04\x80\xbe\x98\x60\x11\x04\x20\xa0\x86\x00\
+\x23\x33\x6a\x42\x81\x21\xd1\x09\x20\x00\xa2\x23\xa5\x42\x08\x40\
+\x00\x02\x10\x58\x4b\xa0\xd6\x35\x48\x6b\x79\xa4\x3c\x0e\x01\x90\
+\x92\x2e\x75\x43\x60\x2e\x01\x16\x9c\xcd\x25\xc5\x7e\x10\x80\x40\
+\x24\x02\x08\x80\x48\x20\xab\xaa\x86\x87\x71\x54\x15\x4e\x9c\xd9\
+\x40\x80\xb5\x19\x1b\xe0\x71\xe8\x89\x80\xce\x77\x08\x00\x9d\x71\
+\xc1\x2a\x08\x40\x00\x02\x6d\x12\x60\x11\x72\xb6\xb8\x23\x00\xb2\
+\xa1\xa6\x21\x08\x4c\x13\x60\xc5\xf9\x34\x1b\xbe\x81\x80\x75\x02\
+\x5a\xed\x47\x00\x68\x8d\x4c\x51\xbb\xb8\x17\xb7\x28\x7e\x1a\xd7\
+\x43\x80\xb5\x19\xf9\x63\xc1\x14\x64\x36\xe6\x08\x80\x6c\xa8\x69\
+\x08\x02\x10\x80\x00\x04\xda\x23\xa0\xd7\x63\x04\x80\xde\xd8\x60\
+\x19\x04\x20\x00\x01\x08\x40\x20\x19\x01\x04\x40\x32\xb4\x36\x2b\
+\xe6\x1e\xdc\x12\x71\xe3\x61\x33\x25\xa8\xd3\x26\x04\x72\x10\xd0\
+\xdc\x06\x02\x40\x73\x74\xb0\x0d\x02\x10\x80\x40\x73\x04\x58\x83\
+\x94\x2b\xe4\x08\x80\x5c\xa4\xad\xb4\xc3\x2d\x38\x56\x22\x85\x9d\
+\x19\x08\x70\x77\x46\x06\xc8\x55\x37\xa1\xdb\x39\x04\x80\xee\xf8\
+\x60\x1d\x04\x20\x00\x01\x08\x40\x20\x09\x01\x04\x40\x12\xac\x54\
+\x0a\x81\x05\x04\x78\xda\xdc\x02\x58\xec\xda\x02\x81\x5a\xd6\x22\
+\x69\x8f\x15\x02\x40\x7b\x84\xb0\x0f\x02\x10\x80\x00\x04\x20\x90\
+\x80\x00\x02\x20\x01\x54\xd3\x55\xf2\x10\x0e\xd3\xe1\xc3\xf8\x14\
+\x04\xb8\x4b\x23\x05\xd5\xfa\xeb\xd4\xef\x21\x02\x40\x7f\x8c\xb0\
+\x10\x02\x10\x80\x40\x5b\x04\x58\x8c\x9c\x25\xde\x08\x80\x2c\x98\
+\x69\x04\x02\x10\x80\x00\x04\x5a\x22\x60\xc1\x57\x04\x80\x85\x28\
+\x65\xb5\x91\x7b\x70\xb3\xe2\x96\xc6\x78\xde\xbc\x50\xa0\x40\xe0\
+\x44\x80\xa9\xc8\x13\x8b\x84\xef\x10\x00\x09\xe1\x52\x35\x04\x20\
+\x50\x01\x01\xee\xd2\xa8\x20\x88\xb9\x5d\xb0\xd1\x1e\x02\xc0\x46\
+\x9c\xb0\x12\x02\x10\x80\x00\x04\x20\x10\x95\x00\x02\x20\x2a\x4e\
+\xdb\x95\x71\xef\xad\xed\xf8\x61\x3d\x04\x20\xa0\x83\x80\x15\x2b\
+\x10\x00\x56\x22\x85\x9d\xd5\x12\xe0\x71\xb3\xd5\x86\x16\xc7\x56\
+\x13\x60\x2d\xd2\x6a\x74\x0b\x0e\x44\x00\x2c\x80\x55\xfd\xae\xdc\
+\x7a\x53\x7d\x88\x71\x70\x05\x01\x16\x69\xae\x80\xd6\xf2\x21\x76\
+\x7c\x47\x00\xd8\x89\x15\x96\x42\x00\x02\x10\x80\x00\x04\xa2\x11\
+\x40\x00\x44\x43\x49\x45\x10\x80\x00\x04\x20\x10\x8b\x80\xd5\x35\
+\x49\xb1\xfc\xcf\x51\x0f\x02\x20\x07\x65\xda\x80\xc0\x24\x01\x1e\
+\x33\x3b\x89\x86\x2f\x20\x00\x81\xa4\x04\x10\x00\x49\xf1\x1a\xab\
+\x9c\x87\x6f\x18\x0b\x18\xe6\x42\x00\x02\xba\x08\xd8\xb2\x06\x01\
+\x60\x2b\x5e\x58\x0b\x01\x08\x64\x26\xc0\x5d\x1a\x99\x81\x0f\xcd\
+\xb1\x28\x79\x20\x91\xec\x15\x01\x90\x0c\x2d\x15\x43\x00\x02\x10\
+\x80\x40\x4b\x04\xac\xf9\x8a\x00\xb0\x16\xb1\xa4\xf6\x72\xef\x6d\
+\x52\xbc\x63\x95\xf3\x98\xd9\x31\x2a\x6c\x83\x80\x73\x4c\x49\x26\
+\x3f\x0b\x10\x00\xc9\x11\xd3\x00\x04\x20\x60\x9f\x00\x8b\x35\xed\
+\xc7\x30\xb5\x07\xf6\xea\x47\x00\xd8\x8b\x19\x16\x43\x00\x02\x10\
+\x80\x00\x04\x36\x13\x40\x00\x6c\x46\x58\x47\x05\xdc\x73\x5b\x47\
+\x1c\xf1\x02\x02\x10\x28\x43\xc0\x62\xab\x08\x00\x8b\x51\xc3\x66\
+\x08\x40\x00\x02\xd5\x13\x60\x4d\x52\xea\x10\x23\x00\x52\x13\xb6\
+\x52\x3f\xb7\xdc\x94\x89\x14\xcf\x99\x2f\xc3\x9d\x56\x21\x10\x95\
+\x80\xcd\xca\x10\x00\x36\xe3\x86\xd5\x10\x80\x40\x4e\x02\xdc\xad\
+\x91\x93\x36\x6d\x65\x22\x80\x00\xc8\x04\x9a\x66\x20\x00\x01\x08\
+\x40\x60\x19\x01\x2b\x6b\x93\x96\x79\xa5\x67\x6f\x04\x80\x9e\x58\
+\x60\x09\x04\x20\x00\x01\x08\x40\x20\x1b\x01\x04\x40\x36\xd4\xca\
+\x1b\xe2\xa1\x1b\x45\x02\xc4\x63\x66\x8b\x60\xa7\x51\x08\x44\x24\
+\x60\xb7\x2a\x04\x80\xdd\xd8\x61\x79\xc3\x04\x3e\x3f\xfe\x71\x47\
+\x59\xce\x60\xf5\x29\xc3\x62\xcd\xd5\xe8\x36\x1d\xc8\xe2\xe4\x4d\
+\xf8\x6e\x1d\x8c\x00\xb8\x45\x88\xef\x4d\x13\xf8\xd3\x9f\xfe\xdd\
+\xcd\x29\xff\xf1\xe7\xff\xef\xe6\x94\xbf\xfe\xf5\xad\x5b\x5b\xfe\
+\xf6\x3f\xff\xe9\x2e\xcb\xe7\xc7\xff\xed\xd6\x14\xe7\xba\x47\xca\
+\x72\x06\x6b\x58\xcb\x31\x7f\xfb\xdb\x7f\x3d\x5e\xc6\x4e\x3e\xaf\
+\x3d\x17\xe6\x9c\x6b\xe7\xfb\xcc\x39\x87\x1d\x3f\x45\x08\x58\x6e\
+\x14\x01\x60\x39\x7a\x51\x6d\x4f\x77\xcf\xed\xad\x8b\xd7\xf9\x85\
+\xee\xfc\xfd\xad\x8b\xab\x5c\x80\x6f\x95\xbf\xfe\xb7\x4f\xd8\x33\
+\xca\x9f\xff\xfc\x27\x37\xa7\xfc\xe9\xff\xfd\xbb\x5b\x5b\x1c\x3f\
+\xd5\x11\x58\x7b\x2e\xcc\x39\xd7\xce\xf7\x99\x73\x1e\xdf\xfa\x5d\
+\x90\xef\xaf\xfd\x4e\x9d\xff\xee\x8d\xbd\x9f\xfa\x3d\x4e\x1a\x54\
+\xa6\x26\x93\xe2\x45\x00\x24\xc5\x6b\xaf\xf2\xb1\x5f\xf2\xb1\x8b\
+\xc1\xd4\x85\x44\x2e\x32\x97\xe5\xd6\xc5\xeb\xfc\x42\x77\xfe\xfe\
+\xd6\xc5\xd5\x1e\x5d\x2c\x86\x40\x59\x02\xd7\x7e\xa7\xce\x7f\xf7\
+\xc6\xde\x4f\xfd\x1e\x5f\xfe\xbe\x0f\x9f\xc7\xae\x11\x63\xd7\x12\
+\xd9\x36\x76\xdd\x29\x4b\x6a\x6e\xeb\xb6\xf7\x43\x00\xd8\x8e\xdf\
+\x4d\xeb\x3f\x1f\xe7\x8a\xff\xf9\xf0\xf9\x51\xca\x1f\x8f\x7e\xdb\
+\xa1\x9c\x86\x9f\x8f\xbf\xb4\x23\xbd\xe5\xb1\x8b\xc1\xd4\x85\xe4\
+\xa6\x41\xec\x00\x01\x08\x34\x41\x60\xec\x1a\x31\x76\x2d\x91\x6d\
+\x63\xe2\xa2\xbf\x26\xfd\xc7\xdd\xe7\x17\xd3\x64\xc3\xf5\x4b\xae\
+\x65\x43\xf9\xe3\xae\x09\xa0\x09\x9c\x44\x00\x24\x80\x5a\xaa\xca\
+\xcf\xc7\x64\x3f\xfc\x92\xfc\x6f\x77\x9a\x27\xde\x7d\x74\x4e\x4a\
+\xe7\x7f\x59\x86\xe2\xf8\x81\x00\x04\x20\x60\x88\xc0\x70\xed\x92\
+\x6b\xd9\x50\x3a\xdf\xa1\x19\x3a\x33\x72\xed\xeb\x85\x41\x0e\xa7\
+\xac\xb7\x81\x00\x30\x1c\xc1\x97\x09\xff\x3c\xd9\x0f\xbf\x24\x86\
+\x9d\xc3\x74\x08\x40\x00\x02\x8b\x09\xc8\xb5\xaf\x17\x06\x9f\x8f\
+\x23\x07\x08\x82\x29\x8c\x08\x80\x29\x32\x4a\xb7\x7f\xee\x7b\xf9\
+\x5e\xf1\xfe\x71\xbe\x0a\xdc\xf7\xea\x95\x1a\x8c\x59\x10\x80\x00\
+\x04\x8a\x12\x38\x17\x04\xfd\x08\x41\x1c\x73\xec\xd7\x82\x00\x30\
+\x10\xc3\x43\xd2\xf7\x73\x61\xc7\xa4\xef\x13\xbe\x28\x5d\x03\xc6\
+\x63\x22\x04\x20\x00\x01\x35\x04\xe4\xba\xb9\xfb\xf8\x39\x8c\x0e\
+\x30\x32\x80\x00\x50\x73\x62\xbe\x36\xe4\xf3\xa1\xb7\xef\x4e\xf7\
+\x7c\xfb\xc4\xff\x7a\x3f\xb6\x40\x00\x02\x10\x80\xc0\x52\x02\xe7\
+\x23\x03\xff\x7c\x58\x7a\x74\x0d\xfb\x23\x00\x14\x46\xf1\x22\xf1\
+\x93\xf4\x15\xc6\x08\x93\x20\x00\x81\x9a\x08\xb4\x39\x2a\x80\x00\
+\x50\x74\x0e\x0f\xb7\xe9\x1d\x7a\xfc\x24\x7e\x45\xb1\xc1\x14\x08\
+\x40\xa0\x05\x02\xc3\xa8\xc0\xad\xe9\x81\x3a\x58\x20\x00\x14\xc4\
+\xb1\x4f\xfc\xb2\x8a\x5f\x4e\x3e\x99\xa3\x52\x60\x14\x26\x40\x00\
+\x02\x10\x68\x96\x80\x5c\x8b\x65\x54\xa0\xee\x45\x83\x08\x80\x82\
+\x27\xf8\x69\xa8\x5f\x4e\xb6\x82\x86\xd0\x34\x04\x20\x00\x01\x08\
+\x8c\x10\x90\x0e\x99\x08\x81\x97\x6b\x04\x46\x76\x34\xb9\x09\x01\
+\x50\x20\x6c\xa7\xc4\x1f\xfe\x98\x09\x43\xfd\x05\x62\x40\x93\x10\
+\x80\x00\x04\xe6\x13\x10\x11\x20\x0f\x1b\xaa\x4b\x08\x20\x00\xe6\
+\x9f\x01\x51\xf6\x94\xe1\x7e\xe6\xf8\xa3\xa0\xa4\x12\x08\x40\x00\
+\x02\x99\x09\x88\x10\xa8\x47\x08\x20\x00\x32\x9d\x3e\xa7\x5e\x3f\
+\xc3\xfd\x99\x90\xd3\x0c\x04\x20\x00\x81\x44\x04\x44\x08\xd8\x1f\
+\x0d\x40\x00\x24\x3a\x3d\xce\xab\x95\xe4\x4f\xaf\xff\x9c\x08\xef\
+\x21\x00\x01\x08\xd8\x24\x70\xb2\x5a\x44\x80\x2c\x12\xb4\xfb\xc7\
+\x88\x10\x00\xa7\x68\x26\x79\xe7\x93\xff\xe1\x91\xbd\x49\xaa\xa7\
+\x52\x08\x40\x00\x02\x10\x28\x46\x40\x16\x09\xca\x1f\x23\xb2\x39\
+\x1a\x80\x00\x48\x78\xe2\x1c\x92\x3f\x8b\xfc\x12\x32\xa6\x6a\x08\
+\x40\x00\x02\xf9\x08\x4c\xb5\x24\xa3\x01\xf6\x44\x00\x02\x60\x2a\
+\x9e\x1b\xb6\xfb\xc4\x7f\xf7\xf9\x51\xee\xeb\x17\x75\xb8\xa1\x22\
+\x0e\x85\x00\x04\x20\x00\x01\x23\x04\xec\x89\x00\x04\x40\xe4\x53\
+\xeb\xb4\xca\x3f\x72\xc5\x54\x07\x01\x08\x40\x00\x02\x45\x09\xdc\
+\x6e\x5c\x44\x80\xfc\xd1\xb6\xdb\x7b\x6a\xd8\x03\x01\x10\x31\x0a\
+\x7d\xf2\x67\x95\x7f\x44\xa4\x54\x05\x01\x08\x40\xc0\x18\x81\x2e\
+\x8c\x00\x7f\x7e\xd4\xbf\x38\x10\x01\x10\xe9\xd4\x22\xf9\x47\x02\
+\x49\x35\x10\x80\x00\x04\x54\x12\x58\x6a\x94\x2c\x0e\xd4\x2d\x02\
+\x10\x00\x4b\x63\x3a\xb2\x3f\xc9\x7f\x04\x0a\x9b\x20\x00\x01\x08\
+\x34\x4f\x40\xb7\x08\x40\x00\x6c\x3c\x41\x49\xfe\x1b\x01\x72\x38\
+\x04\x20\x00\x01\x03\x04\xd6\x9b\xa8\x57\x04\x20\x00\xd6\x47\xd5\
+\x91\xfc\x37\xc0\xe3\x50\x08\x40\x00\x02\xcd\x10\xd0\x29\x02\x10\
+\x00\x2b\x4f\x40\x92\xff\x4a\x70\x1c\x06\x01\x08\x40\xc0\x1c\x81\
+\x18\x06\xcb\x1f\x7f\x8b\x51\x4f\xbc\x3a\x10\x00\x2b\x58\xf6\xab\
+\x3b\x59\xed\xbf\x02\x1d\x87\x40\x00\x02\x10\x68\x96\x80\xcf\x1d\
+\x8f\x9a\x9c\x47\x00\xac\x8a\x86\x3e\x25\xb7\xca\x0d\x0e\x82\x00\
+\x04\x20\x00\x81\x9b\x04\xe2\xed\x20\xb7\x08\xea\x79\x62\x20\x02\
+\x60\x61\x64\xb5\x29\xb8\x85\xe6\xb3\x3b\x04\x20\x00\x01\x08\x14\
+\x25\x20\x0f\x0b\xd2\x21\x02\x10\x00\x0b\x4e\x84\x7e\xde\x9f\xc7\
+\xfb\x2e\x40\xc6\xae\x10\x80\x00\x04\x8c\x13\x48\x61\xbe\x88\x80\
+\xf2\xcf\x08\x40\x00\xcc\x8c\x6d\x9f\xfc\x99\xf7\x9f\x89\x8b\xdd\
+\x20\x00\x01\x08\x40\xe0\x3a\x81\x8f\xd7\xbf\x4e\xff\x2d\x02\x60\
+\x36\x63\x92\xff\x6c\x54\xec\x08\x01\x08\x40\xa0\x12\x02\xe9\xdc\
+\x90\xf5\x00\x65\xff\x6e\x00\x02\x60\x46\x74\xfb\xde\xff\x8c\x1d\
+\xd9\x05\x02\x10\x80\x00\x04\x20\x30\x9b\x40\x10\x01\x77\xb3\x77\
+\x8f\xbc\x23\x02\xe0\x06\xd0\x3e\xf9\xd3\xfb\xbf\x81\x89\xaf\x21\
+\x00\x01\x08\x54\x48\x20\x87\x4b\xe5\xee\x2a\x43\x00\xdc\x8c\x2f\
+\xc9\xff\x26\x22\x76\x80\x00\x04\x20\x00\x81\xd5\x04\x4a\xdd\x5d\
+\x86\x00\xb8\x12\xb2\xbe\xf7\x7f\x65\x07\xbe\x82\x00\x04\x20\x00\
+\x81\x6a\x09\xe4\x73\xac\xcc\x54\x00\x02\xe0\x6a\x84\xe9\xfd\x5f\
+\xc5\xc3\x97\x10\x80\x00\x04\x20\x10\x8b\x40\xf6\xbb\x02\x10\x00\
+\x13\xa1\xa3\xf7\x3f\x01\x86\xcd\x10\x80\x00\x04\x9a\x20\x90\xdb\
+\xc9\xfc\xa3\x00\x08\x80\x91\x18\xf7\xc9\x9f\xde\xff\x08\x1a\x36\
+\x41\x00\x02\x10\x80\x40\x3a\x02\x59\x47\x01\x10\x00\xe9\x02\x49\
+\xcd\x10\x80\x00\x04\x20\x60\x94\x40\x19\xb3\x65\x14\x20\xdf\x63\
+\x82\x11\x00\x17\x51\xa6\xf7\x7f\x01\x84\x8f\x10\x80\x00\x04\x20\
+\x90\x91\x40\xbe\xd1\x67\x04\x40\xc6\xb0\xd2\x14\x04\x20\x00\x01\
+\x08\x58\x20\x50\xd6\xc6\xcf\x8f\x79\xfe\x4e\x00\x02\xe0\x55\x9c\
+\xf3\xa9\xaf\x57\x4d\xb3\x01\x02\x10\x80\x00\x04\x20\xe0\x5c\x96\
+\xb5\x00\x08\x80\xb3\x53\xad\x1f\xfe\x3f\xdb\xc0\x5b\x08\x40\x00\
+\x02\x10\x68\x8e\x40\x79\x87\x65\x2d\x40\xfa\x51\x00\x04\xc0\x8b\
+\x48\xd3\xfb\x7f\x81\x83\x0f\x10\x80\x00\x04\x20\x50\x8a\x40\xf2\
+\x51\x00\x04\xc0\x21\xb4\xf4\xfe\x0f\x20\x78\x81\x00\x04\x20\xd0\
+\x34\x01\x2d\xce\xa7\x1f\x05\x40\x00\x1c\x63\xbd\xff\xf9\xf8\x96\
+\x37\x10\x80\x00\x04\x20\x00\x81\xca\x09\x20\x00\x8e\x01\xee\x8a\
+\xfd\x49\xc6\xa3\x09\xbc\x81\x00\x04\x20\x00\x81\xa2\x04\x94\x35\
+\x9e\x74\x1a\x00\x01\xe0\xa3\xcd\xf0\xbf\x87\xc0\x3f\x08\x40\x00\
+\x02\x10\x50\x46\x20\xed\x34\x00\x02\x20\x84\x9b\xe1\xff\x80\x81\
+\xff\x20\x00\x01\x08\x34\x4d\xa0\x2d\xe7\x11\x00\x21\xde\x0c\xff\
+\x07\x0c\xfc\x07\x01\x08\x40\x00\x02\xda\x08\x24\x9b\x06\x68\x5e\
+\x00\x30\xfc\xaf\xed\x5c\xc7\x1e\x08\x40\x00\x02\x65\x08\xe8\x6c\
+\x35\xdd\x34\x40\xf3\x02\x40\x67\xc0\xb1\x0a\x02\x10\x80\x00\x04\
+\x20\x90\x96\x00\x02\xc0\xf1\xf0\x9f\xb4\xa7\x18\xb5\x43\x00\x02\
+\x10\xb0\x40\x40\xb5\x8d\x49\xa6\x01\x10\x00\xaa\x63\x8e\x71\x10\
+\x80\x00\x04\x20\x00\x81\x34\x04\x9a\x16\x00\xcc\xff\xa7\x39\xa9\
+\xa8\x15\x02\x10\x80\x80\x35\x02\xba\xed\x4d\xb3\x50\xbd\x69\x01\
+\xa0\x3b\xe0\x58\x07\x01\x08\x40\x00\x02\x10\xe8\x09\xa4\xf8\x13\
+\xc1\x8d\x0b\x00\xee\xff\xef\x4f\x2d\xfe\x87\x00\x04\x20\xd0\x32\
+\x01\x0b\xbe\x7f\x8f\xfe\xb4\xda\xc6\x05\x40\x9a\x61\x15\x0b\xa7\
+\x12\x36\x42\x00\x02\x10\x80\x80\x25\x02\xf1\x3b\xac\x8d\x0b\x00\
+\x4b\xc1\xc7\x56\x08\x40\x00\x02\x10\x48\x41\xa0\xd5\x3a\x9b\x15\
+\x00\x29\xe6\x53\x5a\x3d\x89\xf0\x1b\x02\x10\x80\x00\x04\x52\x13\
+\x88\x3f\x62\xdd\xac\x00\x70\x2e\xfe\x7c\x4a\xea\xf0\x53\x3f\x04\
+\x20\x00\x01\x08\xc4\x26\xd0\x6e\x7d\x0d\x0b\x80\x76\x83\x8e\xe7\
+\x10\x80\x00\x04\x20\x60\x8f\x40\xec\x91\x6b\x04\x80\xbd\x73\x00\
+\x8b\x21\x00\x01\x08\x40\x20\x12\x81\x96\xab\x69\x58\x00\xc4\x5f\
+\x51\xd9\xf2\x89\x84\xef\x10\x80\x00\x04\x20\x90\x9a\x40\xdc\xa9\
+\xeb\x86\x05\x40\xea\x40\x51\x3f\x04\x20\x00\x01\x08\xe8\x26\xd0\
+\xb6\x75\x0d\x0b\x80\xf8\x2b\x2a\xdb\x3e\x95\xf0\x1e\x02\x10\x80\
+\x00\x04\xd2\x12\x88\x3b\x72\xdd\xb0\x00\x48\x1b\x26\x6a\x87\x00\
+\x04\x20\x00\x01\xdd\x04\x5a\xb7\x0e\x01\xd0\xfa\x19\x80\xff\x10\
+\x80\x00\x04\x20\xd0\x24\x81\x26\x05\x40\xec\x5b\x29\x9a\x3c\x73\
+\x70\x1a\x02\x10\x80\x80\x69\x02\x18\xdf\xa4\x00\x20\xec\x10\x80\
+\x00\x04\x20\x00\x01\x7b\x04\xe2\xae\x5d\x6b\x54\x00\xc4\xbd\x95\
+\xc2\xde\x49\x84\xc5\x10\x80\x00\x04\xda\x26\x80\xf7\xce\x35\x2a\
+\x00\x08\x3d\x04\x20\x00\x01\x08\x40\xc0\x1e\x81\x98\x53\xd8\x08\
+\x00\x7b\xf1\xc7\x62\x08\x40\x00\x02\x10\xd8\x44\x80\x83\x85\x00\
+\x02\x40\x28\x50\x20\x00\x01\x08\x40\x00\x02\x8d\x11\x68\x54\x00\
+\xc4\x7d\x98\x42\x63\xe7\x0c\xee\x42\x00\x02\x10\x30\x4d\x00\xe3\
+\x7b\x02\x8d\x0a\x80\xde\x79\xfe\x87\x00\x04\x20\x00\x01\x08\xd8\
+\x22\x10\x6f\x11\x3b\x02\xc0\x56\xe4\xb1\x16\x02\x10\x80\x00\x04\
+\x36\x11\xe0\xe0\x81\x40\xa3\x02\x20\xee\xbd\x94\x03\x4c\x5e\x21\
+\x00\x01\x08\x40\x00\x02\x56\x08\x34\x2a\x00\xac\x84\x07\x3b\x21\
+\x00\x01\x08\x40\x20\x26\x01\xfb\x75\xc5\x5b\xc3\x86\x00\xb0\x7f\
+\x36\xe0\x01\x04\x20\x00\x01\x08\x40\x60\x31\x01\x04\xc0\x62\x64\
+\x1c\x00\x01\x08\x40\x00\x02\x36\x09\x60\xf5\x39\x81\xe6\x04\x40\
+\xcc\xa7\x28\x9d\x83\xe4\x3d\x04\x20\x00\x01\x08\x40\xc0\x12\x81\
+\xe6\x04\x80\xa5\xe0\x60\x2b\x04\x20\x00\x01\x08\xc4\x23\x50\x47\
+\x4d\xf1\x16\xb1\x23\x00\xea\x38\x23\xf0\x02\x02\x10\x80\x00\x04\
+\x20\xb0\x88\x00\x02\x60\x11\x2e\x76\x86\x00\x04\x20\x00\x01\x9b\
+\x04\xb0\xfa\x92\x40\x83\x02\x20\xde\x53\x94\x2e\x61\xf2\x19\x02\
+\x10\x80\x00\x04\x20\x60\x85\x40\x83\x02\xc0\x4a\x68\xb0\x13\x02\
+\x10\x80\x00\x04\x62\x11\xa8\xa9\x9e\x58\x8b\xd9\x11\x00\x35\x9d\
+\x15\xf8\x02\x01\x08\x40\x00\x02\x10\x98\x49\x00\x01\x30\x13\x14\
+\xbb\x41\x00\x02\x10\x80\x80\x55\x02\xd8\x3d\x46\xa0\x41\x01\x10\
+\xef\x31\x8a\x63\x40\xd9\x06\x01\x08\x40\x00\x02\x10\xb0\x40\xa0\
+\x41\x01\x60\x21\x2c\xd8\x08\x01\x08\x40\x00\x02\xb1\x08\x50\xcf\
+\x38\x01\x04\xc0\x38\x17\xb6\x42\x00\x02\x10\x80\x00\x04\x94\x12\
+\x88\x73\x37\x1b\x02\x40\x69\x78\x31\x0b\x02\x10\x80\x00\x04\x62\
+\x10\xa0\x8e\x29\x02\x0d\x0a\x80\x78\x8f\x51\x9c\x82\xca\x76\x08\
+\x40\x00\x02\x10\x80\x80\x76\x02\x0d\x0a\x00\xed\x21\xc1\x3e\x08\
+\x40\x00\x02\x10\x88\x45\x80\x7a\xa6\x09\x20\x00\xa6\xd9\xf0\x0d\
+\x04\x20\x00\x01\x08\x40\x40\x21\x81\x38\x77\xb3\x21\x00\x14\x86\
+\x16\x93\x20\x00\x01\x08\x40\x20\x06\x01\xea\xb8\x46\x00\x01\x70\
+\x8d\x0e\xdf\x41\x00\x02\x10\x80\x00\x04\x2a\x25\x80\x00\xa8\x34\
+\xb0\xb8\x05\x01\x08\x40\xa0\x75\x02\xf8\x7f\x9d\x40\x53\x02\x20\
+\xd6\x1f\x50\xb8\x8e\x94\x6f\x21\x00\x01\x08\x40\x00\x02\xfa\x09\
+\x34\x25\x00\xf4\x87\x03\x0b\x21\x00\x01\x08\x40\x20\x0e\x81\x9a\
+\x6b\x89\x73\x3b\x3b\x02\xa0\xe6\x73\x04\xdf\x20\x00\x01\x08\x40\
+\x00\x02\x13\x04\x10\x00\x13\x60\xd8\x0c\x01\x08\x40\x00\x02\x76\
+\x09\x60\xf9\x6d\x02\x08\x80\xdb\x8c\xd8\x03\x02\x10\x80\x00\x04\
+\x20\x50\x1d\x81\xc6\x04\x40\x9c\x3f\xa0\x50\xdd\x59\x80\x43\x10\
+\x80\x00\x04\xaa\x22\x80\x33\x73\x08\x34\x26\x00\xe6\x20\x61\x1f\
+\x08\x40\x00\x02\x10\x80\x40\xfd\x04\x10\x00\xf5\xc7\x18\x0f\x21\
+\x00\x01\x08\x34\x45\xa0\x05\x67\x63\xdc\xd6\x8e\x00\x68\xe1\x4c\
+\xc1\x47\x08\x40\x00\x02\x10\x80\xc0\x05\x01\x04\xc0\x05\x10\x3e\
+\x42\x00\x02\x10\x80\x80\x65\x02\xd8\x3e\x97\x00\x02\x60\x2e\x29\
+\xf6\x83\x00\x04\x20\x00\x01\x08\x54\x44\x00\x01\x50\x51\x30\x71\
+\x05\x02\x10\x80\x40\xeb\x04\xf0\x7f\x3e\x81\xc6\x04\xc0\xfe\xe7\
+\xf9\x68\xd8\x13\x02\x10\x80\x00\x04\x20\x50\x2f\x81\xc6\x04\x40\
+\xbd\x81\xc4\x33\x08\x40\x00\x02\x10\x80\xc0\x12\x02\x08\x80\x25\
+\xb4\xd8\x17\x02\x10\x80\x00\x04\x20\xa0\x82\xc0\xf6\x07\xdb\x21\
+\x00\x54\x04\x12\x23\x20\x00\x01\x08\x40\x60\x2b\x01\x8e\x5f\x46\
+\x00\x01\xb0\x8c\x17\x7b\x43\x00\x02\x10\x80\x00\x04\xaa\x20\x80\
+\x00\xa8\x22\x8c\x38\x01\x01\x08\x40\xa0\x75\x02\xf8\xbf\x94\x00\
+\x02\x60\x29\x31\xf6\x87\x00\x04\x20\x00\x01\x08\x54\x40\x00\x01\
+\x50\x41\x10\x71\x01\x02\x10\x80\x40\xeb\x04\xf0\x7f\x39\x81\xc6\
+\x04\x40\x77\xb7\x1c\x11\x47\x40\x00\x02\x10\x80\x00\x04\xea\x23\
+\xd0\x98\x00\xc8\x15\xc0\xdd\x93\x73\x97\xa5\xfb\xe4\xdc\x65\xd9\
+\xdd\xfb\xfd\x7c\xb9\xdc\x7e\xfe\x79\xa8\xc7\xf1\x03\x01\x08\x40\
+\x00\x02\xa3\x04\xd8\xb8\x86\x00\x02\x60\x0d\xb5\x70\xcc\x90\x98\
+\x25\x59\x0f\x89\x7c\x77\xff\xe1\xfe\x87\xdd\x87\xfb\x37\xfe\xf5\
+\xb2\xfc\xf8\xf0\xe1\xfe\xb2\xbc\x79\xf2\xfb\xfa\x72\xb9\xfd\xfc\
+\xf3\x50\x8f\xd4\xdb\x17\xe7\xa4\x3d\x69\x77\x28\x62\x8b\xe3\x07\
+\x02\x10\x80\x00\x04\x20\x30\x9b\x00\x02\x60\x16\x2a\x49\xb0\xa1\
+\xf8\xde\xfa\x65\x92\x97\x64\x3d\x24\xf2\x37\xbe\xe7\x3f\xab\xc2\
+\x4d\x3b\xbd\x16\x0d\x22\x12\x06\x71\x80\x28\xd8\x04\x97\x83\x21\
+\x00\x01\x73\x04\xda\x34\x78\xfb\xa3\xed\x11\x00\xa3\x67\x8e\x24\
+\x7b\x49\xa4\x97\xc9\xbe\x4f\xf4\xa3\x87\x28\xd9\x78\x1a\x65\xe8\
+\x45\x81\x7b\x31\x5a\xe0\xf8\x81\x00\x04\x20\x00\x01\x08\x04\x02\
+\x08\x80\x80\x41\x12\x7e\x28\x7e\xe8\x5e\x7a\xd2\x92\x3c\xfb\x9e\
+\x7d\xf8\xda\xf0\x7f\x2f\x47\x0b\x7e\xd8\xb9\xa3\x20\xd8\x65\x19\
+\xad\x70\xfc\x40\xe2\x08\x2c\x87\x00\x00\x10\x00\x49\x44\x41\x54\
+\x00\x02\x10\x48\x4a\x80\xca\xd7\x12\x68\x58\x00\x48\x02\x94\xb9\
+\x74\xe9\xe5\x4b\xc2\x0f\xa5\xfa\xa4\x78\x12\x04\xe2\xaf\x08\x02\
+\x19\xe9\x90\xb2\xf6\x14\xe2\x38\x08\x40\x00\x02\x10\xb0\x48\xa0\
+\x31\x01\xf0\x2a\xe9\x3f\x49\x42\xb4\x18\xb8\x58\x36\x9f\xa6\x0c\
+\x06\x31\x20\x8c\x62\xd5\x4e\x3d\x10\x80\x00\x04\xd2\x12\xa0\xf6\
+\xf5\x04\x9a\x12\x00\x3e\xd9\xfb\x21\x7e\xfd\xf3\xf8\xeb\xc3\xb9\
+\xed\xc8\x5e\x0c\x9c\x8f\x0c\x6c\xab\x8f\xa3\x21\x00\x01\x08\x40\
+\x40\x2f\x81\xa6\x04\x80\xde\x30\xe8\xb3\xac\x17\x03\xc3\xa8\x00\
+\x53\x04\xfa\x22\x84\x45\x10\x80\x80\x73\x30\xd8\x42\x00\x01\xb0\
+\x85\x5e\x03\xc7\xf6\x42\xe0\xc7\x07\x77\x5c\x3c\xe8\xf8\x81\x00\
+\x04\x20\x00\x81\x0a\x08\x20\x00\x2a\x08\x62\x0e\x17\xfc\xf4\xc9\
+\x53\x2f\x06\x86\x51\x81\x1c\xad\xd2\x06\x04\x20\x00\x81\x69\x02\
+\x7c\xb3\x8d\x00\x02\x60\x1b\xbf\x26\x8f\x46\x08\x34\x19\x76\x9c\
+\x86\x00\x04\x2a\x23\x80\x00\xa8\x2c\xa0\x39\xdd\x41\x08\xe4\xa4\
+\x4d\x5b\x10\x80\xc0\x4b\x02\x7c\xda\x4a\x00\x01\xb0\x95\x20\xc7\
+\x3b\x84\x00\x27\x01\x04\x20\x00\x01\x7b\x04\x10\x00\xf6\x62\xa6\
+\xd6\x62\x11\x02\xce\xc9\xc3\x95\xb8\x6b\xc0\xf1\x03\x01\x08\x24\
+\x25\x40\xe5\xdb\x09\x20\x00\xb6\x33\xa4\x86\x33\x02\xc3\x62\x41\
+\xe7\x10\x01\x67\x58\x78\x0b\x01\x08\x40\x20\x32\x81\xee\x6e\x6b\
+\x85\x08\x80\xad\x04\x39\x7e\x94\x80\x8c\x06\x7c\xb8\xe7\x8e\x81\
+\x51\x38\x6c\x84\x00\x04\x36\x12\xe0\xf0\x18\x04\x10\x00\x31\x28\
+\x52\xc7\x24\x81\x0f\xf7\xc3\x33\x04\x78\xc4\xf0\x24\x24\xbe\x80\
+\x00\x04\x20\x50\x80\x00\x02\xa0\x00\xf4\xd6\x9a\xec\xa7\x05\xde\
+\xdc\x33\x2d\xd0\x5a\xe4\xf1\x17\x02\x69\x08\x50\x6b\x1c\x02\x08\
+\x80\x38\x1c\xa9\x65\x06\x01\x46\x03\x66\x40\x62\x17\x08\x40\x00\
+\x02\x99\x08\x20\x00\x32\x81\xa6\x99\x9e\x00\xa3\x01\x3d\x07\xfe\
+\x87\x00\x04\xd6\x12\xe0\xb8\x58\x04\x10\x00\xb1\x48\x52\xcf\x22\
+\x02\xfd\x68\x00\x77\x0a\x2c\x82\xc6\xce\x10\x80\x00\x04\x22\x12\
+\x40\x00\x44\x84\x49\x55\xcb\x08\xf4\x22\x40\x9e\x1b\xc0\x02\xc1\
+\x65\xe4\xd8\x1b\x02\xed\x12\xc0\xf3\x78\x04\x10\x00\xf1\x58\x52\
+\xd3\x0a\x02\x4c\x09\xac\x80\xc6\x21\x10\x80\x00\x04\x22\x10\x40\
+\x00\x44\x80\x48\x15\xdb\x09\xf4\xa3\x01\x4c\x09\x6c\x27\x49\x0d\
+\x10\xa8\x99\x00\xbe\xc5\x24\x80\x00\x88\x49\x93\xba\x36\x11\x40\
+\x04\x6c\xc2\xc7\xc1\x10\x80\x00\x04\x16\x11\x40\x00\x2c\xc2\xc5\
+\xce\xa9\x09\xf4\x22\x40\xd6\x05\xa4\x6e\x89\xfa\x21\x00\x01\x6b\
+\x04\xb0\x37\x2e\x01\x04\x40\x5c\x9e\xd4\x16\x81\x40\xbf\x2e\x40\
+\x1e\x23\xcc\xe2\xc0\x08\x38\xa9\x02\x02\x10\x80\xc0\x28\x01\x04\
+\xc0\x28\x16\x36\x6a\x20\xe0\x85\x00\x4f\x0f\xd4\x10\x08\x6c\x80\
+\x80\x0a\x02\x18\x11\x9b\x00\x02\x20\x36\x51\xea\x8b\x4a\xa0\x9f\
+\x12\x60\x71\x60\x54\xa8\x54\x06\x01\x08\x40\xc0\x13\x40\x00\x78\
+\x08\xfc\xd3\x4d\x00\x11\xa0\x3b\x3e\x58\x07\x81\x1c\x04\x68\x23\
+\x3e\x01\x04\x40\x7c\xa6\xd4\x98\x80\x00\x22\x20\x01\x54\xaa\x84\
+\x00\x04\x9a\x26\x80\x00\x48\x1c\xfe\xb7\xbf\xfc\x7e\xf7\xa2\xfc\
+\xfa\xf5\xe1\xed\x9c\xe2\x8f\x4b\x6c\x9a\xb9\xea\x11\x01\xe6\x42\
+\x86\xc1\x10\x88\x44\x80\x6a\x52\x10\x40\x00\x44\xa0\x7a\x4c\xf0\
+\x92\xd8\xdf\x7f\x7b\x7c\x1b\xca\xd7\xee\xed\xfb\xaf\x9d\xdb\xed\
+\x1f\x5f\x94\xce\x7d\x74\x73\x8a\x3f\x4e\x8e\x3f\x15\x5f\xaf\xd4\
+\x2f\xa5\x61\x71\x80\x08\x70\xfc\x40\x00\x02\x10\x88\x42\x00\x01\
+\xb0\x02\xe3\x31\xe1\x87\x44\xff\xed\x94\xe0\x25\xb1\xbb\xee\xce\
+\x85\xb2\xa2\xe2\xab\x87\xf8\x7a\xa5\x7e\x29\xe7\xe2\x40\x04\x81\
+\x94\x86\x44\x41\x2f\x02\xb8\x45\xf0\xea\xe9\xc2\x97\x10\xa8\x88\
+\x00\xae\xa4\x21\x80\x00\x98\xc9\x35\x24\xfd\x90\xf0\xcf\x7a\xf5\
+\x21\xd1\xfb\xc4\x3c\xb3\x8e\x24\xbb\x89\x20\x90\x32\x88\x02\x11\
+\x03\xbe\x24\x69\x4b\x51\xa5\xfd\x2d\x82\x88\x00\x45\x21\xc1\x14\
+\x08\x40\xc0\x18\x01\x04\xc0\x95\x80\xbd\x4a\xfa\x21\xe1\x5f\x39\
+\x40\xc3\x57\x22\x06\x7c\xe9\xa7\x0e\xfa\x69\x03\x0d\x66\xa5\xb0\
+\xa1\x17\x01\x29\x6a\xa6\x4e\x08\x40\x40\x0f\x01\x2c\x49\x45\x00\
+\x01\x70\x41\xd6\x64\xd2\xbf\xf0\xe1\xf4\xd1\x8f\x4e\x0c\x62\xc0\
+\x8f\x0a\xc8\xe2\xc3\xd3\x77\xb5\xbc\xdb\xdd\xd7\xe2\x09\x7e\x40\
+\x00\x02\x10\xc8\x49\x00\x01\x70\xa0\x3d\x24\x7e\xe7\x87\xd2\xd3\
+\xcc\xe1\x1f\x1a\x2a\xf5\xe2\x85\x80\x2c\x3e\x0c\x23\x03\x5e\x0c\
+\x94\x32\x23\x76\xbb\x7e\x14\xe0\xc9\xb9\x1d\x22\xc0\xf1\x03\x81\
+\x3a\x09\xe0\x55\x3a\x02\xcd\x0b\x80\x61\xc5\xbe\xab\x35\xf1\x8f\
+\x9d\x3b\x9d\xfb\x58\x93\x10\xe8\x45\x00\x4f\x0b\x1c\x0b\x35\xdb\
+\x20\x00\x01\x08\x4c\x11\x68\x56\x00\xc8\x70\xb8\x24\xc1\x2a\x7b\
+\xfb\x53\xd1\xbe\xdc\x5e\x91\x10\xe8\xef\x0c\x40\x04\x5c\x86\x98\
+\xcf\x10\xb0\x4d\x00\xeb\x53\x12\x68\x4e\x00\x1c\x13\xbf\x4f\x7e\
+\x29\xc1\x9a\xaa\xdb\xb3\x10\x31\x24\x6c\x4c\xd9\x7d\x61\x6c\x2f\
+\x02\xb8\x33\xe0\x02\x0b\x1f\x21\x00\x01\x08\x8c\x12\x68\x46\x00\
+\x48\x72\x93\x24\x27\xf3\xe0\xa3\x24\xd8\xe8\x07\x43\xaa\x98\x1a\
+\xf8\x44\x28\x21\x00\x81\x3a\x08\xe0\x45\x5a\x02\xd5\x0b\x80\xe3\
+\xe2\x3e\xdf\xcb\x4d\x8b\xb2\xa2\xda\x3d\xab\xb0\x36\xc2\xe0\x62\
+\xc1\x7e\x3d\xc0\x8e\x45\x81\x15\x9d\x8e\xb8\x02\x01\x08\xa4\x21\
+\x50\xb5\x00\x90\x5e\xbf\x6b\x69\x71\x5f\xd4\x73\xe4\x70\x0b\xa1\
+\x59\x11\xc0\x7a\x80\xa8\xa7\x03\x95\x41\x20\x3b\x01\x1a\x4c\x4d\
+\xa0\x4a\x01\x40\xaf\x3f\xe2\x69\x13\x46\x03\xbe\x76\x41\x4c\x45\
+\xac\x36\x75\x55\xac\x07\x48\x4d\x98\xfa\x21\x00\x01\xeb\x04\xaa\
+\x13\x00\x21\x51\xd1\xeb\x8f\x7f\x5e\x8a\x10\xb0\x37\x1a\xc0\x7a\
+\x80\xf8\x67\x02\x35\x42\x20\x0b\x01\x1a\x49\x4f\xa0\x2a\x01\x20\
+\xf3\xd6\x2c\xf2\x4b\x78\xd2\x88\x08\x78\xff\xed\x31\x61\x0b\x51\
+\xab\xee\xd7\x03\x30\x15\x10\x15\x2a\x95\x41\x00\x02\xd5\x10\xa8\
+\x42\x00\xf4\x43\xfe\x5f\x3b\x67\xe1\x59\xfd\xe6\x4f\x9d\xee\x4e\
+\xee\xa6\x08\x23\x2d\x06\x7c\x39\x4c\x05\xdc\xbb\xf0\xb4\xc0\x1d\
+\xaf\x70\x18\x39\x07\x44\x24\x5e\x16\x6e\x27\x75\x45\x7f\x68\x3c\
+\x07\x01\xf3\x02\x20\x24\xa2\x30\xe4\x9f\x03\x17\x6d\x1c\x09\xc8\
+\x68\x80\x91\x29\x01\x19\x09\xa0\xbc\x79\x82\xc1\x14\x83\x1f\x1f\
+\x44\x28\xbe\x2c\x6f\xee\x3f\xdc\xff\xb0\x93\xe2\x8e\xa2\x49\x44\
+\x02\xc2\xc0\xf1\x53\x0d\x01\xd3\x02\x20\x24\x7f\x9f\x88\xaa\x89\
+\x86\x35\x47\x3c\xfb\x10\x03\x6b\x76\x63\x2f\x04\x16\x10\x38\x09\
+\x27\x11\x0a\xbd\x30\x70\x41\x14\x88\x20\x90\xe2\xf8\x89\x4c\x80\
+\xea\xe6\x10\xd8\x2e\x46\xcd\x0a\x80\x90\x78\x7c\x02\x9a\x83\x89\
+\x7d\x12\x12\xf0\x31\x08\xb1\x48\xd8\x04\x55\x43\x40\x1b\x81\x5e\
+\x14\x88\x20\x90\xf2\xc3\xce\x4f\x3f\x7e\xea\x8b\x36\x4b\xb1\x07\
+\x02\xd3\x04\x4c\x0a\x00\x16\xfb\x4d\x07\xb4\xc8\x37\x22\x02\x0c\
+\x2d\x0e\x2c\xc2\x88\x46\xab\x26\xf0\xe1\x5e\x84\x80\x94\x41\x0c\
+\x54\xed\x6e\x62\xe7\xa8\x3e\x17\x01\x73\x02\x20\x24\x7f\x16\xfb\
+\xe5\x3a\x3f\x16\xb4\x23\x8b\x03\xbf\x3d\xca\x82\xcc\x05\x07\xb1\
+\x2b\x04\xaa\x23\xd0\x8b\x81\x41\x08\x30\x45\x50\x5d\x80\x2b\x72\
+\xc8\x94\x00\x20\xf9\x6b\x3f\xf3\xba\x3b\xc7\x82\x4c\xed\x41\xc2\
+\xbe\x4c\x04\x7a\x21\xf0\xe3\x43\x3f\x35\x80\x10\x98\x8b\x9d\xfd\
+\xf2\x11\x30\x23\x00\x48\xfe\xf9\x4e\x8a\xad\x2d\xf5\xb1\xda\x5a\
+\x0b\xc7\x43\xa0\x0e\x02\x08\x81\x3a\xe2\x58\xa3\x17\x26\x04\x40\
+\x9f\x50\x7c\xef\xb2\xc6\x08\x54\xe9\x53\x3f\x1d\x50\xa5\x6b\x38\
+\x05\x81\x95\x04\x5e\x0a\x81\x95\x95\x54\x7f\x18\x0e\xe6\x24\xa0\
+\x5e\x00\xf4\x2b\xcc\x49\xfe\x39\x4f\x8a\x38\x6d\x21\x02\xe2\x70\
+\xa4\x96\xda\x08\xf4\x42\x60\x58\x23\x50\x9b\x77\xf8\x63\x89\x80\
+\x6a\x01\x10\x92\x7f\xe7\x3e\x5a\x02\x8a\xad\xe7\x04\xbc\x08\x30\
+\xf2\xb0\xa0\x73\xab\x79\x0f\x81\x1c\x04\x44\x08\xb8\xf0\x3c\x01\
+\xc7\xcf\x81\x00\x2f\x79\x09\xa8\x15\x00\x24\xff\xbc\x27\x42\xb2\
+\xd6\xbc\x80\x0b\xb1\x4c\xd6\x00\x15\x43\xc0\x2e\x81\xfe\x79\x02\
+\x8c\x06\xd8\x8d\xa0\x6d\xcb\x55\x0a\x80\x90\x30\x7c\xe2\xb0\x8d\
+\x16\xeb\x8f\x04\x7c\x2c\xb9\x3d\xf0\x48\x83\x37\x10\x78\x45\xa0\
+\x1f\x0d\x68\xfd\x4e\x81\x57\x58\xd8\x90\x98\x80\x4a\x01\xe0\x7c\
+\xc2\x48\xec\x37\xd5\xe7\x26\xb0\xdb\xf3\x8c\x80\xdc\xcc\x69\xcf\
+\x14\x81\x5e\x04\xec\xe4\x8f\x15\x3d\x99\x32\x1c\x63\xcd\x12\x50\
+\x27\x00\xfa\x15\xff\x66\x79\x62\xf8\x35\x02\xbb\x7f\x63\x3d\xc7\
+\x35\x3e\x7c\xd7\x3c\x81\x7e\x4a\xe0\x4d\x93\x22\xa0\xf9\xe0\x2f\
+\x06\xf0\xfd\x1f\x8b\x0f\xb9\x38\x40\x95\x00\x08\x43\xff\x3c\xe5\
+\xef\x22\x44\x35\x7d\x64\x51\x60\x4d\xd1\xc4\x97\x74\x04\xbc\x10\
+\xf0\x22\x80\x29\x81\x74\x84\xa9\x59\x08\xa8\x11\x00\x21\xf9\x77\
+\x8e\x1e\xa2\x44\xa5\xe6\xe2\x63\xcc\x7a\x80\x9a\x03\x8c\x6f\xb1\
+\x08\xf4\x53\x02\xad\x88\x80\x58\xd4\xa8\x67\x09\x01\x35\x02\xc0\
+\xf9\xc4\xb0\xc4\x70\xf6\x35\x4c\x60\xb7\x7f\x34\x6c\x3d\xa6\x43\
+\x20\x1b\x01\x44\x40\x36\xd4\x4d\x36\xa4\x42\x00\x84\xde\x7f\x93\
+\xf8\xdb\x75\x9a\xb5\x1e\xed\xc6\x1e\xcf\x97\x11\x68\x41\x04\x2c\
+\x23\xc2\xde\xb1\x08\x14\x17\x00\x61\x38\x98\xde\x7f\xac\x78\x1a\
+\xaa\xa7\xbb\x0b\xb1\x37\x64\x31\xa6\x42\xa0\x14\x81\x5e\x04\xec\
+\x9e\x4a\xb5\x4f\xbb\x75\x12\x28\x2e\x00\x1c\x2b\xc3\xeb\x3c\xb3\
+\xe6\x78\x45\xec\xe7\x50\x62\x1f\x08\x04\x02\xfd\xc2\xc0\x1a\x45\
+\x40\x70\x8f\xff\x0a\x10\x28\x2a\x00\xfa\xa1\x7f\x9e\xf3\x5f\x20\
+\xee\x4a\x9a\xf4\xa3\x00\x3c\x2a\x58\x49\x2c\x30\xc3\x02\x01\x44\
+\x80\x85\x28\xd9\xb1\xb1\xa8\x00\x60\xe1\x9f\x9d\x13\x25\x99\xa5\
+\x9d\xfb\xc8\x54\x40\x32\xba\x54\x5c\x27\x81\x4f\x35\xb9\x85\x2f\
+\xe5\x08\x14\x13\x00\x7d\xef\xbf\x9c\xe3\xb4\xac\x88\x00\x53\x01\
+\x8a\x82\x81\x29\xda\x09\xf8\x51\x80\x27\xe7\xb8\x3d\x50\x7b\x9c\
+\x2c\xd8\x57\x4c\x00\xd0\xfb\xb7\x70\x7a\xe4\xb2\xd1\x4f\x05\xfc\
+\xf2\xfb\x5d\xae\xd6\x68\x07\x02\xd6\x09\xf4\x8b\x02\x6b\x10\x01\
+\xd6\x23\x51\xd2\xfe\xbd\x17\x82\xdb\xda\xdf\x6f\x3b\x7c\xdd\xd1\
+\xf4\xfe\xd7\x71\xab\xfa\x28\x46\x01\xaa\x0e\x2f\xce\xc5\x27\xd0\
+\x8b\x00\x16\x05\xc6\x27\xdb\x4e\x8d\x45\x04\x00\xbd\xff\x76\x4e\
+\xb0\xf9\x9e\x32\x0a\x30\x9f\x15\x7b\x42\xe0\x48\xc0\xf4\x7a\x80\
+\xa3\x17\xbc\x29\x42\x20\xbb\x00\xa0\xf7\x5f\x24\xce\x36\x1a\x65\
+\x14\xc0\x46\x9c\xb0\x52\x0d\x01\xd6\x03\xa8\x09\x85\x49\x43\xb2\
+\x0b\x00\x7a\xff\x26\xcf\x93\x4c\x46\x33\x0a\x90\x09\x34\xcd\x54\
+\x44\xa0\x9f\x0a\xb0\xe8\x10\x36\x97\x26\x90\x55\x00\xd0\xfb\x2f\
+\x1d\x6e\x03\xed\x33\x0a\x60\x20\x48\x98\xa8\x8f\xc0\xee\x5e\x9f\
+\x4d\x58\xa4\x9d\x40\x56\x01\x40\xef\x5f\xfb\xe9\xa0\xc1\x3e\x1e\
+\x0c\xa5\x21\x0a\xd8\x60\x8b\x40\x3f\x15\x60\x6b\x41\xa0\x2d\xc2\
+\xfa\xac\xed\x63\xbe\xcd\xae\x6c\x02\x80\xde\xff\xb6\x40\xb5\x74\
+\x34\x0f\x06\x6a\x29\xda\xf8\x1a\x91\x00\x0b\x02\x23\xc2\x6c\xa1\
+\xaa\x6c\x02\xa0\x05\x98\xf8\x18\x89\xc0\x6e\xff\x28\x7f\x2d\x90\
+\xf2\x0d\x0e\xef\x13\x33\xf8\xf5\xeb\x83\x74\x4e\x8e\xc5\xf0\xf3\
+\x28\xfa\x1e\xa1\x95\x51\x80\x48\xd7\x0a\xaa\xd9\x44\x20\x9f\x00\
+\xe8\xdc\xc7\x4d\x96\x72\x70\x63\x04\x64\x2a\x80\xe2\x1c\x0c\x92\
+\x32\x90\xeb\xd2\x79\x09\xe2\xf3\x6b\x17\xc4\xa7\x88\x03\x7b\x82\
+\x80\x51\x80\xc6\xae\x94\x5b\xdc\xcd\x22\x00\x44\x5d\x6f\x31\x92\
+\x63\x21\x00\x01\x08\xe4\x25\xe0\x85\x97\x08\x83\x41\x10\x78\x31\
+\x90\xb7\xfd\x75\xad\x59\x19\x05\x58\xe7\x1d\x47\xc5\x26\x90\x45\
+\x00\xb8\x6e\xf7\x73\x6c\xc3\xa9\x0f\x02\x10\x80\x40\x36\x02\x5e\
+\x0c\xbc\x7d\xef\x47\x06\x6c\x08\x01\x46\x01\xb2\x9d\x18\xb6\x1b\
+\xca\x23\x00\xc2\x30\xa6\x6d\x50\x58\x0f\x01\x08\x40\xc0\x19\x10\
+\x02\xfa\x47\x01\x38\x8f\xb4\x10\x48\x2e\x00\x18\xfe\xd7\x12\x6a\
+\xec\x80\x00\x04\xa2\x11\x10\x21\xa0\x7b\x34\x80\x51\x80\x68\xc1\
+\xd6\x58\x51\x9c\xc5\x9e\xc9\x05\x80\x46\x74\xd8\x04\x01\x08\x40\
+\x60\x33\x01\xc5\x22\xa0\x1f\x05\xd8\xec\x61\x92\x0a\xa8\x54\x0f\
+\x81\xf4\x02\xc0\xff\x92\xe8\x71\x17\x4b\x20\x00\x01\x08\x44\x24\
+\xe0\xaf\x6f\x61\x6d\x80\xca\xbb\x05\xe2\xf4\x12\x23\xd2\xa2\x2a\
+\x65\x04\x92\x0a\x00\x86\xff\x95\x45\x1b\x73\x20\x00\x81\x34\x04\
+\xe4\x6e\x01\x7d\x22\x40\xe1\x34\x40\x1a\xfc\xd4\xba\x8e\x40\x52\
+\x01\xb0\xce\x24\x8e\x82\x00\x04\x20\x60\x90\x80\xb2\xbf\x63\xc1\
+\x34\x80\xc1\x73\x68\xb6\xc9\xdf\xff\x31\x7b\xd7\x2b\x3b\xa6\x15\
+\x00\xdc\xfe\x77\x05\x3d\x5f\x41\x00\x02\x75\x11\xe8\xee\xe4\x01\
+\x42\xba\x7c\xd2\x35\x0d\xa0\x8b\x0d\xd6\xa4\x15\x00\x4d\xdc\xfe\
+\x27\xbf\x60\xbe\x74\xdf\xef\x9d\x2f\xcf\x5f\xde\xed\x52\x16\x69\
+\x23\x94\x9d\xf3\xc3\x7b\xbe\x5d\xce\x61\x08\x40\x40\x11\x01\x2f\
+\x02\x74\xdd\x1d\xe0\xaf\x13\x8a\xf0\x60\x8a\x2a\x02\xc9\x04\x40\
+\xfd\x7f\xd0\xc5\x27\xdf\x90\xf0\x7f\xba\x7f\xfe\xe2\xcb\xdf\xff\
+\xf2\xf4\xec\x4b\xea\xe8\x4a\x1b\xa1\xfc\xf6\xee\x21\xb4\xeb\x05\
+\x87\x0b\x62\x20\x75\xcb\xd4\x0f\x01\x08\xcc\x22\x20\x0b\x03\xf5\
+\xad\x07\x98\x65\x7a\xda\x9d\xa8\x5d\x1b\x81\x64\x02\xc0\xed\xf7\
+\x77\xda\x9c\x8d\x63\xcf\x59\xe2\xcf\x90\xf0\xe7\xd8\xfc\x1c\xc4\
+\xc0\xbb\x1d\x42\x60\x0e\x2d\xf6\x81\x40\x06\x02\x4a\xd6\x03\xb0\
+\x0e\x20\x43\xac\x0d\x37\xb1\x37\x6c\x7b\x7e\xd3\x7d\x4f\x3b\xf4\
+\xba\x95\x24\xfe\x4b\x00\x22\x04\x10\x01\x97\x54\xf8\x0c\x81\x12\
+\x04\xfc\x54\x80\x9a\x51\x80\xdd\x53\x09\x02\x97\x6d\xf2\x59\x1f\
+\x81\x74\x02\xa0\xb6\x05\x80\x32\xdc\xef\x7b\xda\xfa\x42\xf8\xd2\
+\x22\x44\xc0\x4b\x1e\x7c\x82\x40\x31\x02\x4a\x46\x01\x9c\xfb\x1e\
+\x65\xc5\x78\x31\x8e\x34\x3c\x42\x60\x1f\x45\xd4\xed\x47\x6a\x66\
+\xd3\x25\x01\xe9\xf9\x2b\xed\xf5\x5f\x9a\x2a\x9f\x11\x01\x42\x81\
+\x02\x81\xd2\x04\xfc\x28\x80\x8a\x05\x81\xfb\x28\xc9\x62\x1b\x4d\
+\x8e\xd6\x48\x60\x9f\xce\xa8\xae\x8e\x35\x00\x92\xfc\x0d\xf4\xfc\
+\x2f\xe3\x88\x08\xb8\x24\xc2\x67\x08\x14\x20\x50\xdb\x48\x68\x01\
+\x84\x34\x99\x8e\x40\x42\x01\x90\xce\xe8\x6c\x35\x1b\x4d\xfe\x03\
+\x9f\x20\x02\x1c\xf3\x7f\x03\x0f\x5e\x21\x90\x9f\x80\x1f\x05\x28\
+\xbc\x16\x40\xc3\x42\xc0\xfc\xdc\xeb\x6e\x31\x56\x4c\x93\x08\x80\
+\xfa\x6f\x01\x34\x74\x72\x75\xff\xe2\x3e\x60\x43\xe1\xc2\x54\x08\
+\xa4\x21\x40\x47\x20\x0d\x57\xdb\xb5\x26\x11\x00\x55\xdc\x02\x68\
+\xbc\xf7\x3f\x9c\x96\xf2\xcc\x00\xc7\x28\x80\xe3\x07\x02\xc5\x08\
+\xa8\x59\x0c\x58\x8a\x00\xed\x6a\x25\x90\x46\x00\x68\xf5\xb6\x55\
+\xbb\x18\x05\x68\x35\xf2\xf8\xad\x82\x40\x25\xeb\xa1\x54\xb0\xc4\
+\x88\x98\x04\x10\x00\x13\x34\xfb\xf9\xf3\x89\x2f\x8d\x6d\xee\x47\
+\x01\x8c\x19\x8d\xb9\x10\xa8\x88\x40\xf9\x69\xd1\x72\xb7\x02\x56\
+\x14\xc6\xea\x5c\x41\x00\x8c\x86\xb4\xc6\xf9\xb2\x1a\x7d\x1a\x0d\
+\x1e\x1b\x21\x00\x01\x08\x54\x4c\x20\xde\xb5\x1c\x01\x30\x76\x9a\
+\xec\xba\xfa\x1e\x9c\x51\xa3\x4f\x63\xb1\x63\x1b\x04\x34\x12\xa8\
+\xf6\xd1\xe8\xb7\x60\xf3\xbd\x66\x02\x08\x00\xcd\xd1\xc1\x36\x08\
+\x40\x00\x02\x10\x80\x40\x22\x02\x69\x04\x00\x0f\xbf\x48\x14\xae\
+\x0d\xd5\x7e\xff\xce\xd3\xc0\x36\xe0\xe3\x50\x08\x6c\x22\x50\xfc\
+\x9a\xb8\x2f\xf2\xfb\xbf\x89\x19\x07\x4f\x10\x88\xb7\x9e\x63\x3f\
+\xd1\x42\xdb\x9b\x6b\x4c\x96\x0c\x41\xb6\x7d\x4e\xe3\x3d\x04\x20\
+\x00\x81\x0b\x02\x69\x04\x80\xf5\xf9\x66\x92\xe5\xc5\x69\xc2\x47\
+\x08\x40\x00\x02\x4b\x09\xb0\xbf\x76\x02\x69\x04\x80\x76\xaf\xb1\
+\x0f\x02\x10\x80\x00\x04\x20\xd0\x38\x01\x04\xc0\xd8\x09\x50\x7c\
+\xbe\x6e\xcc\xa8\x8d\xdb\x6a\xf4\x69\x23\x12\x0e\x87\x00\x04\xd2\
+\x11\xa0\xe6\x54\x04\xf6\xd1\xd6\x73\xec\x53\x99\x68\xbb\xde\x1a\
+\x9f\xdc\x55\xa3\x4f\xb6\xcf\x32\xac\x87\x00\x04\x20\x50\x92\x00\
+\x02\x60\x82\x7e\xf9\x27\x77\x4d\x18\xb6\x62\xf3\xdb\x5f\xbf\x3e\
+\xac\x38\x8c\x43\x20\x00\x01\x08\xac\x24\xc0\x61\x16\x08\xa4\x11\
+\x00\x35\xac\xa2\xe7\x0f\x78\x58\x38\x7f\xb1\x11\x02\x10\x80\x40\
+\x53\x04\x62\xfd\x29\x60\x81\x96\x46\x00\x48\xcd\xe6\x4b\x77\x57\
+\xc3\x28\x40\xe8\xfd\x77\xee\xa3\xf9\x70\xe0\x00\x04\x20\x60\x86\
+\x00\x86\xda\x20\x80\x00\xb8\x16\x27\x46\x01\xae\xd1\xe1\x3b\x08\
+\x40\x00\x02\x10\x30\x4c\x20\x89\x00\xa8\xe7\xaf\xcf\xf9\x51\x00\
+\xc3\xf3\xe7\xf4\xfe\x0d\xff\x66\x62\x3a\x04\xcc\x12\xc0\xf0\x74\
+\x04\xe2\xfd\x21\x20\xb1\x31\x89\x00\x90\x8a\x9d\x8b\x6b\xa8\x2b\
+\xf5\xe3\x87\xcf\x43\x22\x2d\xd5\xfe\xca\x76\x83\xcd\xde\xf6\x95\
+\x87\x73\x18\x04\x20\x00\x01\x08\x54\x4e\x20\xa1\x00\xa8\x88\x9c\
+\x4f\xa4\x21\xa1\x1a\x71\x29\xac\x5d\xf0\x36\x1b\x31\x17\x33\x21\
+\x00\x81\x8a\x08\xe0\x8a\x1d\x02\x08\x80\xb9\xb1\xf2\x09\xd5\x82\
+\x08\x08\x36\xee\xf6\x8f\x73\xdd\x62\x3f\x08\x40\x00\x02\x10\xb0\
+\x42\x20\xde\x1f\x02\x12\x8f\xd3\x09\x80\xee\x5f\x9f\xa4\x81\xaa\
+\x8a\x62\x11\x20\xbd\xfe\xb7\xef\xbf\x3d\xba\xce\xb1\xe2\xbf\xaa\
+\x93\x0e\x67\x20\x60\x89\x00\xb6\x5a\x22\x90\x4e\x00\x58\xa2\xb0\
+\xc4\x56\x9f\x60\xdf\xbe\xff\xda\x85\x9e\xf6\x92\xe3\x12\xed\x7b\
+\x4c\xfc\xa1\xd7\xcf\xd3\xfe\x12\x61\xa6\x5a\x08\x40\x00\x02\xd5\
+\x11\x48\x26\x00\xea\xb9\x13\x60\x22\xe6\x83\x10\xf0\xbd\x6e\x11\
+\x03\x21\x11\xff\xf2\xfb\xdd\xc4\xde\xd1\x36\x0f\xed\x48\x6f\x5f\
+\x8a\x23\xf1\x47\x63\x4b\x45\x10\x80\xc0\x36\x02\x1c\x9d\x9a\xc0\
+\xfe\x29\x66\x0b\xfb\x98\x95\xbd\xae\xab\x92\x3b\x01\x5e\x3b\x76\
+\xb6\xc5\xf7\xba\x3b\x3f\xec\x2e\x89\xd8\x97\x30\x3a\x20\x23\x04\
+\x89\x4a\x48\xf8\xbe\x1d\xe7\x7c\xbb\xa1\x9c\x99\xc2\x5b\x08\x40\
+\x00\x02\x10\x80\xc0\x4c\x02\x89\x05\xc0\x4c\x2b\xd8\x0d\x02\x10\
+\x80\x00\x04\x8c\x13\xc0\xfc\xd4\x04\x62\x3e\x06\x58\x6c\x4d\x2b\
+\x00\x6a\x5c\x08\x28\xd4\x28\x10\x80\x00\x04\x20\x00\x01\xe3\x04\
+\x92\x0a\x80\xea\xd7\x01\x18\x0f\x3e\xe6\x43\x00\x02\x10\x88\x45\
+\x80\x7a\x52\x13\x88\x3f\xa5\x9e\x54\x00\xf4\x38\xe2\x1b\xdd\xd7\
+\xcb\xff\x10\x80\x00\x04\x20\x00\x81\x56\x08\xc4\x7d\x06\x80\x50\
+\x4b\x2f\x00\x98\x06\x10\xce\x14\x08\x40\x00\x02\x15\x13\xc0\x35\
+\x8b\x04\xd2\x0b\x00\x8b\x54\xb0\x19\x02\x10\x80\x00\x04\x20\xa0\
+\x8a\xc0\xfe\x29\xb6\x39\xfb\xd8\x15\x5e\xd6\xd7\xaf\x03\x60\x1a\
+\xe0\x92\x0b\x9f\x21\x00\x01\x08\xd4\x42\x00\x3f\xd2\x13\x88\x7d\
+\x07\x80\x58\x9c\x5c\x00\x48\x23\x14\x08\x40\x00\x02\x10\x80\x00\
+\x04\xd6\x12\x48\xd3\x89\xce\x23\x00\x58\x07\xb0\x36\xea\x1c\x07\
+\x01\x08\x40\x40\x39\x01\xcc\x4b\x4f\x20\xfe\x02\x40\xb1\x39\x8b\
+\x00\x60\x1a\x40\x50\x53\x96\x11\x10\xc5\x6b\xb5\x2c\xf3\xd4\xce\
+\xde\xb9\xe2\x61\x87\x08\x96\x42\x20\x0f\x81\x7d\xf4\xf9\x7f\xb1\
+\x07\x22\x08\xe7\x00\x00\x0a\xbb\x49\x44\x41\x54\x7b\x2f\xff\x65\
+\x29\x8c\x02\x64\xc1\x5c\x45\x23\x3b\xf7\xe9\xf9\xcb\x4f\xf7\x56\
+\x8b\x73\x92\x28\x5d\x65\x3f\xbb\xa7\x5c\xf1\x70\x55\xf2\x73\xd5\
+\xfe\xe0\x58\x7a\x02\x29\xe6\xff\xc5\xea\x6c\x02\xa0\x1f\x05\x90\
+\x26\x29\x10\xb8\x4e\xe0\xf9\xb7\x77\x0f\xd7\xf7\xe0\x5b\x08\x40\
+\x00\x02\xad\x10\xe8\x3e\xa5\xf2\x34\x9b\x00\xe8\x1d\xa8\xb1\x67\
+\xd4\x7b\xc6\xff\x91\x08\xf8\xde\x7f\xa4\x9a\xa8\x06\x02\x10\x48\
+\x4e\x80\x06\x2c\x13\xc8\x2b\x00\x98\x06\xb0\x7c\xae\x64\xb1\x9d\
+\xde\x7f\x16\xcc\x34\x02\x01\x08\x18\x21\xf0\xe1\xfe\xc7\x64\x23\
+\xa2\x59\x05\x40\x3f\x0d\xc0\x28\x80\x91\xf3\x2e\xbf\x99\xf4\xfe\
+\xf3\x33\xa7\x45\x08\x6c\x20\xc0\xa1\xa9\x09\xa4\x1b\xfe\x17\xcb\
+\xb3\x0a\x00\x69\xd0\x31\x0a\x10\x30\xf0\x1f\x04\x20\x00\x01\x08\
+\x40\xa0\x24\x81\xec\x02\x80\x51\x80\x92\xe1\x56\xdc\xb6\xef\xfd\
+\x33\xfc\xaf\x38\x3e\x98\x06\x81\x57\x04\xd8\x90\x9a\x40\xca\xe1\
+\x7f\xb1\x3d\xbb\x00\x90\x46\x19\x05\x08\x14\xf8\xef\x8c\x00\xc9\
+\xff\x0c\x06\x6f\x21\x00\x01\x08\xb8\xb4\xc3\xff\x02\xb8\x88\x00\
+\x60\x14\x40\xd0\x53\x8e\x04\x7c\xef\xff\xf8\x9e\x37\x10\x80\x80\
+\x09\x02\x18\x99\x96\x40\xea\xde\xbf\x58\x5f\x44\x00\x48\xc3\x8c\
+\x02\x04\x0a\xfc\xe7\x09\xd0\xfb\xf7\x10\xf8\x07\x01\x08\x40\xe0\
+\x48\x20\x7d\xef\x5f\x9a\x2a\x26\x00\xc2\x28\x00\x3d\x3f\x89\x41\
+\xdb\x85\x73\xa0\xed\xf8\xe3\xbd\x51\x02\x98\x5d\x03\x81\x62\x02\
+\x40\xe0\xf5\x3d\x3f\x6e\x0b\x14\x16\xad\x96\xfe\x1c\x68\xd5\x7b\
+\xfc\x86\x00\x04\x20\x70\x49\xa0\xfb\x94\x63\xf8\x5f\x5a\x2d\x2a\
+\x00\xc4\x00\xa6\x02\x02\x85\x36\xff\xa3\xf7\xdf\x66\xdc\xf1\xda\
+\x3c\x01\x1c\xa8\x83\x40\x71\x01\x10\xa6\x02\xf8\xe3\x1f\x75\x9c\
+\x4d\x4b\xbc\xf0\xc9\x9f\xde\xff\x12\x60\xec\x0b\x01\x08\xd4\x4f\
+\x20\x5f\xef\x5f\x58\x16\x17\x00\x62\x04\xa3\x00\x81\x42\x53\xff\
+\x91\xfc\x9b\x0a\x37\xce\x56\x45\x00\x67\x52\x11\xc8\x35\xf4\x3f\
+\xd8\xaf\x42\x00\x84\x51\x00\xdf\x23\x1c\x8c\xe2\xb5\x72\x02\xc4\
+\xba\xf2\x00\xe3\x1e\x04\x20\xb0\x9c\x40\x9e\x95\xff\xe7\x76\xa9\
+\x10\x00\x62\x50\xe8\x11\x92\x18\x04\x45\xdd\xc5\xc7\x38\xc4\xba\
+\x6e\x2f\xf1\x0e\x02\xd5\x12\xc0\xb1\x34\x04\x72\xf7\xfe\xc5\x0b\
+\x35\x02\x40\x8c\xe9\x13\x03\x77\x05\x08\x8b\x5a\x4b\x1f\xe3\x5a\
+\xbd\xc3\x2f\x08\x40\x00\x02\x6b\x08\xe4\xef\xfd\x8b\x95\xaa\x04\
+\x80\x18\xc4\x7a\x80\x40\xa1\xce\xff\xba\xef\xf7\x75\x3a\x86\x57\
+\x10\x68\x85\x00\x7e\xc6\x27\x90\x77\xe1\xdf\xb9\xfd\xea\x04\x00\
+\xeb\x01\xce\xc3\x53\xd1\xfb\x9d\xfb\x14\x62\x5b\x91\x4b\xb8\x02\
+\x01\x08\x40\x60\x2b\x81\x12\x43\xff\x83\xcd\xea\x04\x80\x18\x16\
+\x86\x89\x7d\xc2\x90\xf7\x94\x0a\x08\xf8\x58\x86\x98\x56\xe0\x0a\
+\x2e\x40\xa0\x65\x02\xf8\x1e\x9b\x40\x99\xa1\xff\xc1\x0b\x95\x02\
+\x40\x8c\xeb\x13\x06\xeb\x01\x84\x85\xed\xb2\x7b\xea\x63\x69\xdb\
+\x0b\xac\x87\x00\x04\x20\x10\x97\x40\xb9\xa1\xff\xc1\x0f\xb5\x02\
+\x40\x0c\x7c\xfe\xf2\xd3\xbd\xe3\x21\x41\xce\xee\x8f\x4f\xfe\x21\
+\x86\x76\x3d\xc0\x72\x08\x40\x60\x20\xc0\x6b\x4c\x02\x25\x87\xfe\
+\x07\x3f\x54\x0b\x00\x31\x12\x11\x20\x14\x2c\x16\x92\xbf\xc5\xa8\
+\x61\x33\x04\x20\x90\x83\xc0\xce\x77\x6e\x73\xb4\x73\xbd\x0d\xf5\
+\x02\x20\x98\xdf\xfd\xeb\x53\x78\xe5\x3f\x33\x04\x7a\xe1\x66\xc6\
+\x5c\x0c\x85\x00\x04\x6e\x10\xe0\xeb\x58\x04\x64\xe8\xff\xcd\x53\
+\xac\xda\xb6\xd4\x63\x42\x00\x84\xd5\xe3\xdc\x42\xb6\x25\xce\x79\
+\x8f\x25\x56\x79\x79\xd3\x1a\x04\x20\x60\x84\x80\x24\xff\x1f\x1f\
+\xb4\x18\x6b\x42\x00\x08\x2c\x44\x80\x50\x30\x50\x7c\xf2\x0f\xb1\
+\x32\x60\x2a\x26\x2e\x20\xb0\xeb\xfe\xb1\x60\x6f\x76\xbd\x24\x60\
+\x9e\xdf\xa5\x43\x7c\x5e\x4e\x40\x57\xf2\x17\xfb\xcd\x08\x00\x31\
+\x56\x12\xcb\xf3\x97\x77\x3b\xc7\xc2\x40\xa7\xef\x67\xf7\xe4\x48\
+\xfe\x7d\x58\xb8\xd8\xf7\x1c\xd6\xfe\x0f\xbf\xb5\xe4\xae\x1c\xf7\
+\xfd\xee\xca\x97\x7c\x95\x9c\xc0\xee\x49\xc3\xa2\xbf\x4b\x37\x4d\
+\x09\x80\xc1\xf8\xe7\xb0\xb2\xdc\x27\x9c\x61\x03\xaf\x85\x09\xf4\
+\x0b\xfe\x44\xa0\x15\x36\x84\xe6\x21\x00\x81\x04\x04\xa8\x72\x0b\
+\x01\x49\xfe\x6f\x54\x2c\xfa\xbb\xf4\xc2\xa4\x00\x10\x27\x10\x01\
+\x42\x41\x43\xe9\x93\xbf\x06\x4b\xd4\xd8\xf0\xfd\xbb\x8a\x05\x3e\
+\x6a\x78\x2c\x35\x04\x7e\x4b\x89\xb1\xbf\x5a\x02\x7a\x93\xbf\x20\
+\x33\x2b\x00\xc4\xf8\x20\x02\x76\x8e\x3b\x04\x04\x46\x89\xe2\xd9\
+\x87\x18\x94\x68\x9b\x36\xf3\x12\x20\x29\x6f\xe3\x6d\x9a\xdf\x36\
+\xd7\xdb\x3d\x5a\x77\xf2\x97\xb8\x98\x16\x00\xe2\x40\x78\xca\x9c\
+\x4f\x44\xf2\x9e\x92\x91\x80\x67\x1e\xd8\x67\x6c\x92\xa6\xca\x11\
+\x60\x7a\x67\x1b\x7b\xf8\x6d\xe3\x67\xef\x68\xfd\xc9\x5f\x98\x9a\
+\x17\x00\xe2\x44\x48\x44\x1d\x7f\x69\x4e\x58\xa4\x2f\xbb\x7e\xb1\
+\xdf\x6f\xef\xd4\xdc\xca\x92\xde\xe7\x65\x2d\xf4\x17\x7b\xcf\x69\
+\xd9\x61\xec\x7d\x20\x00\xbf\x03\x88\xa8\x2f\xfb\x9f\xd7\x56\xc7\
+\x71\x4b\x09\xc8\x6a\x7f\x9d\x73\xfe\x97\x9e\x54\x21\x00\xc4\x29\
+\xb9\x68\x3c\xcb\x1d\x02\xbe\x67\x2a\x9f\x29\x29\x08\xf4\xf3\xfd\
+\xc2\x3a\x45\xed\xd4\xa9\x94\x00\xbf\x53\xdb\x02\x03\xbf\x6d\xfc\
+\x4c\x1d\x2d\xc9\x5f\xcf\x7d\xfe\xb7\xd0\x55\x23\x00\x06\x47\xc3\
+\x68\x00\xbf\x70\x03\x8e\x78\xaf\x9e\xe9\x73\xb8\xfb\x22\x5e\x95\
+\x55\xd7\xc4\xd3\x2b\xb7\x85\x17\x7e\xdb\xf8\xbd\x3a\xba\x5b\x79\
+\x1b\xe0\xab\x8a\xd8\x30\x49\x60\x77\xaf\xf1\x56\xbf\x49\x73\xfd\
+\x17\xd5\x09\x00\xef\x93\x13\x11\xf0\xcc\x68\x80\xa0\x88\x50\xfc\
+\x50\xb6\x9f\x5e\x11\xa6\x11\x2a\x6b\xa6\x8a\x9a\x46\x49\x4a\xc4\
+\x1e\x7e\xcd\xfc\xaa\x54\xe0\xa8\xbf\x46\x3a\x49\xfe\x3a\x1e\xef\
+\xbb\x04\x68\x95\x02\x60\x00\x10\x2e\x5c\xbe\xe7\x3a\x7c\xe6\x75\
+\x09\x01\x7f\x52\x4b\xe2\xf7\xbd\xfe\x9a\x2e\xc6\x4b\x08\x6c\xdf\
+\xd7\x33\xdc\x5e\x49\xd9\x1a\x8a\xfe\xfe\xc0\x2f\x46\xf0\x3f\x3f\
+\xfe\xb1\xba\xf7\x1f\xa3\xfd\xba\xeb\x90\x21\xff\x37\xbe\xe7\x6f\
+\x2f\xf9\x4b\x5c\xaa\x16\x00\xe2\xa0\x88\x00\x46\x03\x84\xc4\x82\
+\xe2\x2f\xfa\xcf\x24\xfe\x05\xc0\x26\x76\xad\x60\x18\x5b\x7e\x7f\
+\x26\xbc\x4b\xbf\x19\x7e\x91\x18\x7f\x47\x00\x44\x22\x79\xaa\x46\
+\xc4\xa9\xf4\xfa\xed\xcc\xf7\x9f\x6c\x3f\xbd\xab\x5e\x00\x0c\xae\
+\xca\x85\xec\x99\x69\x81\x01\xc7\xc4\xab\x3f\xa9\xa5\xd7\xcf\x0a\
+\xff\x09\x3e\xcb\x36\xf7\x23\x27\x9e\xe9\xb2\xc3\xf4\xec\xed\x85\
+\x60\x49\x63\xe0\x57\x92\xbe\xb4\x4d\x19\x27\x60\xbb\xd7\x7f\xee\
+\x53\x33\x02\x60\x70\x5a\x84\x80\x3c\xb3\xde\x15\xbe\xb8\x0d\xf6\
+\xe8\x78\xf5\x49\x4a\x12\x3f\xbd\xfe\xe8\xe1\x78\xf6\x4c\xa3\x57\
+\x9a\xa9\xc2\xf0\xbb\x92\xa9\xad\xa9\x66\xe0\x37\x45\x66\xc9\x76\
+\x6e\x01\x5c\x42\x6b\x7a\x5f\x7f\x9d\x0c\x73\xfd\xb6\x7b\xfd\xe7\
+\xfe\x35\x27\x00\xc4\x79\xe9\x59\x84\x8b\x9b\x88\x00\x29\xb2\xb1\
+\xc9\xe2\x4f\x68\x12\x7f\xfa\xc8\x5b\x3c\xc7\x34\xd9\xac\xc9\x96\
+\xb9\x67\x8b\x2a\x9b\xd7\xdd\x01\x30\xd7\xd5\xfa\xf7\xf3\xd7\xc9\
+\x90\xf8\xed\xce\xf5\x4f\xc5\xa8\x49\x01\x30\xc0\x10\x11\x10\x4a\
+\x73\x53\x03\xfe\x84\x26\xf1\x0f\xa7\x41\xf2\x57\x39\xc7\x9c\xa9\
+\xbf\x60\xb9\x7b\xea\x6d\x76\x2a\x7e\x7a\x5b\xfc\x39\xab\xc2\x9a\
+\x39\x46\xe8\xe1\xf7\xf9\xf1\x9f\x3c\xb0\x6b\x4e\xc8\x26\xf7\xa9\
+\x67\xb8\x7f\xcc\xc5\xa6\x05\xc0\x39\x10\xb9\xc8\x3c\x1f\x85\x80\
+\xa5\x8b\xcd\xb9\x17\xd7\xde\x7b\x9f\x42\xd2\x7f\xb7\x7b\xf6\xc3\
+\xd2\x32\x0a\x72\x6d\x6f\xbe\x8b\x4c\xc0\xd0\x82\x36\x39\x3f\x22\
+\x7b\xbf\xbd\x3a\xf8\x6d\x67\xb8\xa8\x86\x96\x77\xf6\xd7\xca\xd0\
+\xe3\xff\x61\x67\xed\xbe\xfe\xa5\x51\x43\x00\x5c\x10\xeb\x85\xc0\
+\x4f\xf7\x75\xac\x13\x08\x27\x72\xff\xe8\x5e\x92\xfe\x45\xa4\xf3\
+\x7e\x0c\x82\xcb\x0b\xb0\xbc\xad\xae\x68\x4d\xd5\xd0\xf5\xc9\x7e\
+\xf8\x9d\x58\x2c\x7b\xb7\xfb\xb8\x6c\xff\x96\xf7\x0e\xd7\x4b\xb9\
+\xa5\x4f\x4a\x13\x7f\xd1\x13\x01\x30\x71\xbe\xcb\x05\xa7\x17\x03\
+\xef\x76\x27\x31\x20\x27\xc8\xc4\x01\x6a\x36\x7b\x1b\x25\xd1\xf8\
+\x22\x3d\xb9\x50\xfe\xfe\x97\x26\x4e\x66\x35\x21\x98\x30\x44\xce\
+\x29\xd5\x8b\x4f\x7d\xf2\x97\x73\x7e\xc2\xfc\xe2\x9b\xe1\xb7\x2c\
+\x04\x5b\xee\xff\x5f\xd6\x92\xf5\xbd\xfd\x35\x33\xf4\xf8\xeb\x9b\
+\xe3\xbf\x15\x19\x04\xc0\x2d\x42\xfe\x7b\xb9\xf0\xc8\x85\x31\x24\
+\xd3\x61\x9a\xc0\x5f\x2c\x9d\x8a\x79\xdd\x70\xf2\x1e\x7a\xf9\xa7\
+\xe1\x7d\xb1\xd9\xf1\xa3\x8e\x80\x9c\x47\x2a\x45\x80\x3f\x9f\x83\
+\x6d\xea\x88\xbd\x34\x28\xd8\xe8\x6d\x7d\xb9\x55\xc1\x27\x6f\x53\
+\xb0\x4d\x81\x29\x27\x13\xb8\xff\xff\xc4\xe2\xf2\x5d\xb8\x6e\xfa\
+\x9e\xbe\x0c\xf3\xb7\x97\xf8\x07\x1a\x08\x80\x81\xc4\x82\x57\xf9\
+\x45\x0f\x45\x86\xd5\x45\x10\xf8\xde\x76\xb8\xa8\xfb\x8b\x80\x4b\
+\x2a\x0a\xc2\x49\x1b\x92\xbd\x8c\x4a\x3c\xfb\xb6\x9f\x83\x0d\x3f\
+\xdd\x93\xf0\x9d\x99\x1f\x39\x77\xc2\xf9\xa2\xc5\x62\x7f\xfe\x06\
+\x9b\xb4\xd8\x73\xc3\x8e\x60\x6b\xf8\x5d\xbb\xb1\x63\xae\xaf\xd5\
+\xf2\x5b\x3b\xfc\x9f\x0b\x5c\xee\x76\xc2\xf5\xf3\xde\x35\xda\xdb\
+\x77\x23\x3f\x08\x80\x11\x28\x4b\x37\x49\xf2\x95\x8b\x52\x28\x21\
+\x21\x4b\x4f\xfc\x30\x75\xe0\x2f\x0e\xe1\x62\xbf\x73\x9f\xdc\x79\
+\x09\x42\x21\x9c\x90\x7e\x78\xde\xbf\x9e\x7f\x27\xef\xe5\xb8\x43\
+\x79\x0e\x89\x5e\xea\xf4\x89\x5e\xea\xf7\x43\xfa\xd2\xe6\x52\x3b\
+\xd9\x5f\x0f\x01\x39\x57\x44\xc4\xb9\x70\x1e\xb8\x42\x3f\xfe\xbc\
+\xf3\xe7\x98\xc5\x73\x09\x7e\xd7\x4f\x19\x56\xff\x0b\x1f\x7f\x7e\
+\xbb\xee\x93\x0b\x09\xff\xd4\xd3\xff\x70\x6f\xf3\xb1\xbd\x2e\xc1\
+\x0f\x02\x20\x01\xd4\xa1\x4a\xb9\xb0\x86\xf2\xdb\xbb\x07\xb9\x60\
+\xbd\x28\x92\xc8\xcf\xcb\xe5\x3e\x87\x24\x2f\xc7\x0f\xf5\xf1\x5a\
+\x17\x01\x89\xed\xb3\x3f\x07\x82\x30\xcc\xee\xda\xee\x49\xda\x16\
+\x1b\xb2\x37\x1d\xa9\x41\xb1\x5d\x7c\x80\x5f\x24\xa0\x87\x6a\x6c\
+\xbe\x9c\x92\xbd\x7b\x91\xf0\x7f\x7c\x20\xe1\xbb\xc9\x1f\x04\xc0\
+\x24\x1a\xbe\x80\x40\x1e\x02\x22\x0c\x43\x12\x93\x91\x9f\xe4\x4d\
+\xfa\x0b\xa5\xf4\xfa\x45\x78\x24\x6f\x2b\x4f\x03\xf0\x7b\xc9\xb9\
+\x5f\xfc\x67\x79\xf8\xdf\x9f\xa3\x61\x64\xec\xf2\x55\x7a\xf3\x52\
+\x76\xf7\xce\x27\x79\x29\x1f\xee\xa5\x67\x2f\x45\xe6\xf1\xfb\x64\
+\x4f\xc2\x77\xb3\x7f\x10\x00\xb3\x51\xb1\x23\x04\xd2\x11\x90\x24\
+\x26\x25\x9d\x10\xf0\x17\xd3\x43\xe2\x97\x9e\x73\x3a\x4f\xca\xd4\
+\x2c\xec\xa4\xc0\x4f\xf8\x6f\x59\xfc\x27\xc7\xcf\x2d\xfe\x9c\xba\
+\x9a\xa8\x25\x59\x0f\xe5\x94\xb4\xdd\x21\x79\xcb\xeb\x29\x81\x4b\
+\x12\x1f\x8a\x24\xf3\xb1\x22\x09\x5e\xca\x9b\x27\x49\xf2\x52\x1c\
+\x3f\x9b\x08\x20\x00\x36\xe1\xe3\x60\x08\xc4\x25\x20\x49\x4c\x4a\
+\x58\x1f\xb0\x73\x32\x7f\xf9\xb4\xbe\x05\x7f\x81\x96\x3a\x2a\x4e\
+\xfc\x97\x6c\x84\x9d\x94\xb6\xf9\xc9\xb3\xff\x7d\xec\x8f\xc9\x79\
+\x48\xc2\x63\xaf\xe3\x89\xd9\x1d\x92\xf4\x78\x82\x9e\x9b\xa8\x25\
+\x59\x0f\xe5\x94\xb4\x25\x71\x0f\xc5\xf1\x53\x94\x00\x02\xa0\x28\
+\x7e\x1a\x87\xc0\x38\x01\xe9\xa5\x4b\x22\x93\x39\xee\xe7\x2f\xef\
+\x76\x4e\x12\xb9\x94\xe3\x45\x7d\x77\x26\x0c\xe4\xfd\xa1\xc8\x3e\
+\x21\xe1\x1f\x16\x8d\xca\xda\x92\xbf\xff\xe5\x6c\xdf\xf1\xf6\x6a\
+\xdb\xda\x32\x3f\x9f\x5c\xef\x5f\x96\x21\x09\x8f\xbd\xbe\x39\xf6\
+\xa6\xfd\x31\x4f\x97\xa5\xb6\xf3\x02\x7f\x5e\x12\x40\x00\xbc\xe4\
+\xc1\x27\x08\xa8\x24\x10\xc4\x80\x24\x73\x3f\x77\xff\x7c\x2c\x92\
+\xe4\xa5\x1c\xee\x0e\x91\xed\xb2\x4f\x83\x09\xff\x56\xd0\xe0\x77\
+\x8b\x10\xdf\xb7\x48\x00\x01\xd0\x62\xd4\xf1\x19\x02\x10\x80\xc0\
+\x2b\x02\x6c\x68\x8d\x00\x02\xa0\xb5\x88\xe3\x2f\x04\x20\x00\x01\
+\x08\x40\xc0\x13\x40\x00\x78\x08\xfc\x83\x00\x04\x20\xd0\x3a\x01\
+\xfc\x6f\x8f\x00\x02\xa0\xbd\x98\xe3\x31\x04\x20\x00\x01\x08\x40\
+\xc0\x21\x00\x38\x09\x20\x00\x01\x08\x34\x4f\x00\x00\x2d\x12\x40\
+\x00\xb4\x18\x75\x7c\x86\x00\x04\x20\x00\x81\xe6\x09\x20\x00\x9a\
+\x3f\x05\x00\x00\x01\x08\xb4\x4e\x00\xff\xdb\x24\x80\x00\x68\x33\
+\xee\x78\x0d\x01\x08\x40\x00\x02\x8d\x13\x40\x00\x34\x7e\x02\xe0\
+\x3e\x04\x20\xd0\x3a\x01\xfc\x6f\x95\x00\x02\xa0\xd5\xc8\xe3\x37\
+\x04\x20\x00\x01\x08\x34\x4d\x00\x01\xd0\x74\xf8\x71\x1e\x02\x10\
+\x68\x9d\x00\xfe\xb7\x4b\x00\x01\xd0\x6e\xec\xf1\x1c\x02\x10\x80\
+\x00\x04\x1a\x26\x80\x00\x68\x38\xf8\xb8\x0e\x01\x08\xb4\x4e\x00\
+\xff\x5b\x26\x80\x00\x68\x39\xfa\xf8\x0e\x01\x08\x40\x00\x02\xcd\
+\x12\x40\x00\x34\x1b\x7a\x1c\x87\x00\x04\x5a\x27\x80\xff\x6d\x13\
+\xf8\x3f\x00\x00\x00\xff\xff\x43\xa5\x0e\xc6\x00\x00\x00\x06\x49\
+\x44\x41\x54\x03\x00\x00\xef\x0e\x4b\x6b\x51\x49\x65\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x5f\x69\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\xbd\x0b\xbc\x5d\x65\
+\x79\xe7\xff\xbe\x3b\x09\x10\x3a\x6a\x2b\x84\x2a\x04\xab\x95\x9c\
+\x93\x20\xe8\xdf\x89\x4a\xc9\x39\x29\x78\xe9\xc5\xff\x38\x63\x6c\
+\x01\x47\x19\xab\x55\x2a\x4a\x4e\x22\x42\x1d\x29\xb6\x36\xb5\x15\
+\x75\x2c\x88\xd9\x27\x28\x2d\x5a\x2f\x45\x2b\xd8\x02\x33\xce\xd8\
+\x8b\x17\x68\xce\x09\x52\xc9\xac\x51\x90\xe4\x9c\x60\xb5\x92\xa0\
+\x4d\xc0\x56\x9d\x26\x40\x72\xf6\x3b\xcf\x6f\xed\xbd\x93\x7d\xce\
+\xd9\x97\xb5\xd6\x5e\x97\xf7\xf2\x3b\x9f\xf5\x9e\xb5\xf7\x5a\xef\
+\xe5\x79\xbe\xcf\xfb\x3e\xcf\xb3\xd6\xbe\xd5\x14\xff\x48\x80\x04\
+\xac\x26\x70\xe1\x2d\x66\xc9\xfa\x0f\x3d\xf0\xf4\xf5\x37\xec\x7e\
+\xee\xba\xfa\xee\x97\xac\xdf\xb6\xe7\x82\xf1\xc9\x99\x37\x8f\x4f\
+\xee\x79\xe7\x58\x7d\xe6\x7d\xe3\x93\xb3\x37\x8c\x4d\xce\xfe\xb9\
+\x94\x3b\xc6\x26\x67\xbe\x2c\xe5\x6b\x72\xfe\x9b\xb2\xdf\x23\xfb\
+\x87\x64\xbf\x5f\xca\xbf\x8e\x4d\xee\xfe\xb7\xb1\xc9\x99\xc7\xa5\
+\x1c\x91\xd2\x90\x62\x5a\x05\x8f\x71\x4c\xce\xc5\x75\xa4\xee\xcc\
+\xfe\x56\x5b\xf4\x81\xbe\xbe\x26\x75\xa5\xef\x59\x19\x63\xf6\xcf\
+\xe3\x31\xe3\xb1\xf7\xbc\x53\xea\xbd\x19\x32\xc5\xb2\x89\x8c\x90\
+\x15\x32\x5b\x0d\x95\xc2\x91\x00\x09\x28\x26\x00\x9c\x04\x24\x50\
+\x21\x81\xb5\x37\x7e\xfb\x29\x71\x60\xbf\x61\xf6\x3f\x8c\xdd\x30\
+\xfb\x96\xf1\x6d\xb3\x7f\x24\x81\xf6\xcf\xc6\xea\xbb\xff\x46\x02\
+\x2b\x02\xef\xfe\x87\xf7\xcf\x1e\x69\x2c\x5b\xf2\x70\xa3\xa1\xbf\
+\xa1\xb5\xfe\x72\xc3\x34\x6e\x35\x4a\xdd\x68\x54\xe3\xfd\x4a\xab\
+\xab\x8c\x32\x6f\x55\xca\x5c\x2c\xe5\x3f\x89\x2a\x2f\x91\x72\x8e\
+\x9c\x3f\x5b\xf6\x67\xc8\x7e\xa5\xec\x57\x48\x79\x8a\x52\xfa\x44\
+\xa5\xd4\x71\x52\x96\x48\xd1\x52\xda\x1b\x1e\xe3\x98\x9c\x8b\xeb\
+\x48\x5d\xb5\xa2\xd5\x16\x7d\xa0\xaf\x73\xa4\xb2\xf4\x6d\x64\x0c\
+\x73\x71\x3c\x66\x3c\x76\xe3\xfd\x52\xef\x46\xc8\x14\xcb\x26\x32\
+\x42\x56\xc8\x2c\x7a\x20\x89\xf8\x26\x74\x91\xc7\x7f\x16\xeb\x26\
+\x3a\xae\x13\x5d\xa1\x33\x74\x97\x3e\xb9\x91\x00\x09\x54\x42\x40\
+\x31\x01\xa8\x88\x3b\x87\x0d\x88\xc0\xf9\xdb\xee\x7f\xda\xba\xc9\
+\x07\x7e\x71\x7c\x72\xcf\x1b\x25\x10\x5e\x23\xe5\x73\x52\xbe\x2e\
+\xe5\x91\x13\x0e\x1f\xf9\xd7\x38\xb0\x37\xcc\x17\x54\xc3\x7c\xc4\
+\x18\xf3\x2e\x41\xf3\x06\xa5\xf5\x2f\x4b\x60\x45\xe0\x45\xf0\x96\
+\x43\x4e\x6e\x48\x22\xce\x86\x2e\x22\xfd\x1b\x62\xdd\x44\x47\x2d\
+\xba\x42\x67\xe8\x0e\x06\x52\xc0\x02\x4c\xae\x01\xa3\x75\xc2\x0a\
+\xcc\xa4\x0d\x37\x12\x20\x81\x02\x09\xf0\x0e\x40\x81\x70\xd9\x75\
+\x58\x04\xce\xd9\xba\x67\xe5\xf8\xb6\xdd\xbf\xba\x6e\x72\xe6\x8a\
+\xb1\x6d\x33\x37\xc9\x15\xfc\xb4\x04\xb7\x47\x0f\x9b\x65\xdf\xd7\
+\x6a\xc9\x5d\x46\x35\x3e\xa6\x94\xfa\x1d\x29\x17\x49\x79\x81\x94\
+\x93\xa4\x84\xbe\x81\x01\x58\x80\xc9\xef\x80\x91\x16\x56\x60\x06\
+\x76\x31\x43\x61\x09\xa6\x60\x0b\xc6\x8a\x7f\x24\x40\x02\x43\x13\
+\x40\x07\x4c\x00\x40\x81\x85\x04\x52\x12\x38\xb7\xbe\xeb\x6c\x09\
+\x4e\xaf\x93\x72\xad\x94\x2f\x49\xb0\xda\xbf\xb4\xd6\x78\xc8\x18\
+\xfd\x45\xad\xd4\xb5\xca\xa8\x37\xc9\x15\xfc\x3a\xe9\xf6\xa9\x52\
+\xb8\x65\x23\xf0\xd4\x98\xa1\xb0\x04\x53\xb0\x05\x63\xb0\x06\x73\
+\x29\x60\xff\x3a\xd8\x22\x5b\xf7\x6c\x45\x02\x61\x13\x60\x02\x10\
+\xb6\xfd\xa9\x7d\x02\x02\xe7\x6e\xfb\xd6\x19\xf2\xfa\xf5\x6b\xe4\
+\xaa\xfe\x3a\x29\x7f\x3f\x36\xb9\xfb\xdf\x6a\xba\xf6\x4d\x09\x4e\
+\x9f\x92\x72\x85\x94\x97\x4a\x37\x2e\xdf\xaa\x17\xf1\x9d\xda\xf0\
+\xd2\xc2\x4b\x85\x3b\xd8\x7f\x0a\xb6\x80\x4d\x62\xdb\x6c\x9b\xb9\
+\x0e\xb6\x82\xcd\x9c\xd2\x88\xc2\x92\x40\xa9\x04\x9a\x83\x31\x01\
+\x68\x72\xe0\x7f\x12\x68\x12\x90\xcb\x4c\x09\x24\xe3\x63\x93\xb3\
+\xef\x18\x9b\x9c\xf9\x2b\x79\xfc\x70\xcd\x2c\xdd\x23\xaf\x5f\x7f\
+\x46\x19\xf5\x76\x29\xeb\x55\xf3\xcd\x74\x8a\x7f\x36\x11\xd0\x27\
+\xc6\xb6\x11\x1b\xc1\x56\x35\xb1\x19\x6c\x17\xdb\x10\xb6\xdc\x36\
+\x33\xae\xc4\xb6\x36\x49\x4c\x59\x48\xa0\x6a\x02\x4c\x00\xaa\xb6\
+\x00\xc7\xaf\x94\xc0\xf9\x5b\xbe\xba\xf4\xdc\xc9\x99\x97\x8e\xd7\
+\x67\xb6\x48\xb0\xf8\xf2\xd8\xb6\xd9\xc7\x94\x51\xdb\x95\x32\xff\
+\x4d\x04\x7b\x95\x3c\x7e\xba\xec\xb9\xb9\x48\xc0\x28\xd8\xee\x55\
+\xb1\x2d\xc5\xa6\xb0\x2d\x6c\x0c\x5b\xc3\xe6\xb0\xbd\x8b\x6a\x51\
+\x66\x12\x18\x96\x40\xbb\x3d\x13\x80\x36\x09\xee\x83\x21\xb0\x6e\
+\x72\xd7\xb9\x12\x08\xae\x96\x2b\xc4\xbf\x3b\x7c\xf2\xa9\x87\x64\
+\x11\x7c\xc9\x68\xf5\xfb\x02\xe0\x25\x52\x8e\x93\xc2\xcd\x4f\x02\
+\xb0\xed\x4b\x60\x6b\xd8\x1c\xb6\xc7\x1c\xc0\x5c\xc0\x9c\xf0\x53\
+\x65\x6a\x45\x02\xbd\x09\xc8\x3a\xe8\x7d\x92\x67\x48\xc0\x07\x02\
+\x63\xd7\xdf\xff\x8c\xb1\x6d\x7b\xde\x24\xce\xfe\x2f\xc4\xd9\x3f\
+\xa2\x55\x6d\x87\x52\xea\xbd\xca\xa8\x97\xc9\x7e\xa9\x14\x6e\x61\
+\x12\x58\xda\x9a\x03\xef\xd5\x32\x27\x30\x37\xe2\x39\x82\xb9\x22\
+\x73\x46\xf1\x8f\x04\xbc\x24\x70\x4c\x29\x26\x00\xc7\x58\xf0\x91\
+\x47\x04\xc4\x91\x8f\x8f\x37\xbf\x54\xe7\x5e\xb5\x74\xd9\x3f\x29\
+\xd3\xb8\x49\x9c\xfd\xab\x45\x45\x7c\xec\x4c\x76\xdc\x48\x60\x11\
+\x81\x93\xe2\x39\x82\xb9\x22\x73\x46\x12\x82\x7b\xe3\x39\x84\xf7\
+\x0f\x2c\xaa\xca\x03\x24\xe0\x3e\x01\x26\x00\xee\xdb\x90\x1a\x08\
+\x01\x7c\xf5\xec\xba\xc9\x3d\xaf\x1c\x9b\x9c\xf9\x53\x09\xfe\x0f\
+\x8b\x23\xdf\x6e\x9a\x5f\xaa\xb3\x56\x4e\x73\x23\x81\x2c\x04\xd6\
+\xc6\x73\xc8\xa8\xed\x98\x53\x98\x5b\xeb\x64\x8e\x61\xae\x65\xe9\
+\x8c\x6d\x48\xc0\x06\x02\x9d\x32\x30\x01\xe8\xa4\xc1\xc7\x4e\x11\
+\x58\x7b\xe3\xbd\x27\xca\x15\x1a\x3e\x9e\xf7\x17\x0f\xef\x9f\xfd\
+\x89\x56\x8d\xdb\x45\x81\x4b\x24\xf8\xe3\xcd\x5f\xf2\x90\x1b\x09\
+\xe4\x44\xa0\xf9\x86\xc2\x4b\x30\xc7\x30\xd7\x24\x21\xf8\x0b\xcc\
+\x3d\xcc\xc1\x9c\x46\x60\x37\x24\x50\x3a\x01\x26\x00\xa5\x23\xe7\
+\x80\xc3\x10\x78\xf9\xd6\x3d\xc7\xc3\xf1\x8e\x4f\xce\xde\x7a\xc2\
+\xe1\x27\xfd\x58\xae\xd0\xf0\xf1\x3c\xdc\xda\x5f\x3e\x4c\xbf\x6c\
+\x4b\x02\x29\x08\x2c\x97\x24\xf3\xd5\x98\x7b\x98\x83\x98\x8b\x98\
+\x93\x98\x9b\x29\xfa\x60\x55\x12\xa8\x80\xc0\xfc\x21\x99\x00\xcc\
+\xe7\xc1\x67\x96\x12\xc0\xad\xd7\xb1\xc9\xd9\x3f\xff\x71\xad\xf1\
+\x23\x38\x5e\xa3\xcc\x05\x22\x2a\x7e\xc0\x46\x76\xdc\x48\xa0\x32\
+\x02\x4b\x30\x17\x31\x27\x31\x37\x31\x47\x31\x57\x2b\x93\x86\x03\
+\x93\x40\x0a\x02\x4c\x00\x52\xc0\x62\xd5\x72\x09\xc8\x6d\xd6\xf1\
+\xb1\xfa\x4c\x7d\x6c\x72\x66\x3f\x6e\xbd\xaa\xf8\x17\xef\xd4\xf1\
+\xe5\x4a\xc1\xd1\x48\x20\x31\x01\x99\x9b\xe6\x62\xcc\x55\xcc\xd9\
+\x78\xee\xf2\x0d\x84\x89\xe1\xb1\x62\xf1\x04\x16\x8e\xc0\x04\x60\
+\x21\x11\x3e\xaf\x94\x40\xf3\x23\x7b\x33\x57\x8d\x4f\xce\x7c\x53\
+\x6e\xb3\x6e\x57\x5a\x4d\x88\x40\xfc\x9a\x5d\x81\xc0\xcd\x29\x02\
+\x2b\xe2\xb9\x6b\xd4\x76\xcc\x65\x49\x66\xaf\xc2\xdc\x76\x4a\x03\
+\x0a\xeb\x3d\x01\x26\x00\xde\x9b\xd8\x0d\x05\xd7\xd5\x67\x7f\x5d\
+\xae\x9a\x6e\x6f\x7e\x64\x4f\xbd\xcf\x28\x75\xb6\x1b\x92\x53\x4a\
+\x12\xe8\x4f\x20\x9e\xcb\x46\xbd\x0f\x73\x1b\x73\x1c\x73\xbd\x7f\
+\x0b\x9e\x25\x81\x22\x08\x2c\xee\x93\x09\xc0\x62\x26\x3c\x52\x12\
+\x81\x5f\xfc\xf0\x03\xab\xc6\xb7\xcd\xfe\x91\x5c\x21\x3d\xa4\xb5\
+\xf9\xbc\x0c\xfb\x4a\x29\xdc\x48\xc0\x67\x02\xaf\xc4\x5c\xc7\x9c\
+\xc7\xdc\xc7\x1a\xf0\x59\x59\xea\x66\x37\x01\x26\x00\x76\xdb\xc7\
+\x4b\xe9\xd6\x4d\xee\xc6\xe7\xf5\x6f\x9f\x5b\xb2\x64\xd6\x18\xf3\
+\x2e\xb9\x42\x5a\xe9\xa5\xa2\x54\x8a\x04\x7a\x10\xc0\x9c\xc7\xdc\
+\xc7\x1a\x88\xef\x0a\xc8\x9a\xe8\x51\x95\x87\x49\x20\x17\x02\xdd\
+\x3a\x61\x02\xd0\x8d\x0a\x8f\xe5\x4e\x60\xed\x8d\xdf\x7e\xca\xf8\
+\xb6\x99\x2b\xc5\xd9\xed\xd2\x4a\xe3\xf3\xfa\xbc\xda\xcf\x9d\x32\
+\x3b\x74\x94\xc0\x2b\xb5\xac\x09\xac\x0d\xac\x11\xac\x15\x47\xf5\
+\xa0\xd8\x8e\x11\x60\x02\xe0\x98\xc1\x5c\x13\xf7\xdc\xfa\xae\xb3\
+\xc7\xea\x33\xf5\x13\x0e\x1f\xd9\x6f\x8c\xfa\x63\x91\x7f\xb5\x14\
+\x6e\x24\x40\x02\x8b\x09\xac\xc6\x1a\xc1\x5a\xc1\x9a\xc1\xda\x59\
+\x5c\x85\x47\x48\x20\x0b\x81\xee\x6d\x98\x00\x74\xe7\xc2\xa3\x43\
+\x12\x58\xb7\x75\xd7\x2f\xcb\x15\xcd\x5f\xd5\x74\xed\x9b\xf1\xbb\
+\xa1\x95\xc2\x2f\xb1\x0d\xd9\x2b\x9b\x93\x40\x10\x04\x8e\xc3\x9a\
+\xc1\xda\xc1\x1a\xc2\x5a\x0a\x42\x6b\x2a\x59\x3a\x01\x26\x00\xa5\
+\x23\xf7\x7b\xc0\xf1\x6d\xb3\xaf\x11\xa7\x35\xa5\x6b\xb5\xbf\x11\
+\x4d\x5f\x25\x85\x1b\x09\x90\x40\x76\x02\xaf\xc2\x5a\xc2\x9a\xc2\
+\xda\xca\xde\x0d\x5b\x86\x4c\xa0\x97\xee\x4c\x00\x7a\x91\xe1\xf1\
+\x54\x04\xc6\x6e\x98\x7d\x8b\x38\xa9\x6f\x19\x63\x3e\x23\x0d\xc7\
+\xa4\x70\x23\x01\x12\xc8\x8f\xc0\x18\xd6\x16\xd6\x18\xd6\x5a\x7e\
+\xdd\xb2\xa7\x90\x09\x30\x01\x08\xd9\xfa\x43\xea\x8e\x5f\x45\x5b\
+\x37\x39\x73\xc5\xd8\xe4\xec\x3f\xa9\x86\xf9\x88\x74\x77\xa6\x14\
+\x6e\x24\x40\x02\xc5\x11\x38\x13\x6b\x0d\x6b\x6e\x9d\xac\x3d\xac\
+\xc1\xe2\x86\x62\xcf\x7e\x10\xe8\xad\x05\x13\x80\xde\x6c\x78\xa6\
+\x07\x81\x33\xb7\xdc\x7f\xdc\xf8\xe4\x9e\x77\x3e\xbc\x7f\x76\x9f\
+\x56\xea\x5a\xa5\xcc\x33\x7a\x54\xe5\x61\x12\x20\x81\x42\x08\x98\
+\x67\x60\xed\x61\x0d\x62\x2d\x62\x4d\x16\x32\x0c\x3b\xf5\x9a\x00\
+\x13\x00\xaf\xcd\x9b\xaf\x72\xe7\x6f\xf9\xea\x52\x38\x9b\x9f\x39\
+\x79\xd9\x5e\xa3\x1a\xef\x97\xde\x7f\x56\x0a\x37\x12\x20\x81\xea\
+\x08\xfc\x2c\xd6\x22\xd6\x24\xd6\x26\xd6\x68\x75\xa2\x70\x64\x1b\
+\x09\xf4\x93\x89\x09\x40\x3f\x3a\x3c\x77\x94\x00\x6e\x37\x1e\x3e\
+\xf9\xd4\x87\xe0\x6c\xe4\xe0\x0a\x29\xdc\x48\x80\x04\xec\x21\xb0\
+\x02\x6b\x13\x6b\x14\x6b\xd5\x1e\xb1\x28\x89\xcd\x04\x98\x00\xd8\
+\x6c\x1d\x0b\x64\xc3\x1b\x8e\xc6\x26\x67\xbe\x83\xdb\x8d\x22\xce\
+\xd3\xa4\x70\x23\x01\x12\xb0\x97\xc0\xd3\xb0\x56\xb1\x66\xb1\x76\
+\xed\x15\x93\x92\x95\x43\xa0\xff\x28\x4c\x00\xfa\xf3\x09\xf6\x2c\
+\x3e\x72\x34\x8e\x5f\xe4\x6b\xbe\xb9\xef\x99\xc1\x82\xa0\xe2\x24\
+\xe0\x26\x81\x67\xe2\xcd\x82\x58\xc3\x58\xcb\x6e\xaa\x40\xa9\x8b\
+\x26\xc0\x04\xa0\x68\xc2\x8e\xf5\x8f\x2f\x1d\x59\x57\xdf\x7d\x27\
+\x3e\x72\x64\xf8\x8b\x7c\x8e\x59\x8f\xe2\x92\xc0\x7c\x02\x58\xc3\
+\x58\xcb\x58\xd3\x58\xdb\xf3\xcf\xf2\x99\xef\x04\x06\xe9\xc7\x04\
+\x60\x10\xa1\x40\xce\xe3\x6b\x47\xe5\xb6\xe1\xe7\xf0\xa5\x23\x5a\
+\xeb\xf3\x02\x51\x9b\x6a\x92\x40\x10\x04\xb0\xa6\xb1\xb6\xb1\xc6\
+\xb1\xd6\x83\x50\x9a\x4a\x0e\x24\xc0\x04\x60\x20\x22\xbf\x2b\xe0\
+\x87\x47\xe4\x36\xe1\xb5\xf8\xda\x51\xd1\xf4\x22\x29\xdc\x48\x80\
+\x04\xfc\x25\x70\x11\xd6\x3a\xd6\x3c\xd6\xbe\xbf\x6a\x52\x33\xa5\
+\x06\x33\x60\x02\x30\x98\x91\xb7\x35\xc6\xb6\xcd\x4c\x9c\x70\xf8\
+\xc8\xb7\xe5\x36\xe1\x15\xde\x2a\x49\xc5\x48\x80\x04\x16\x11\xc0\
+\x9a\xc7\xda\x87\x0f\x58\x74\x92\x07\x82\x21\xc0\x04\x20\x18\x53\
+\x1f\x53\x54\x6e\x01\xfe\x8a\xdc\x0a\xfc\x9a\x32\xaa\x2e\x47\x4f\
+\x92\xc2\x8d\x04\x48\x20\x3c\x02\x27\xc1\x07\xc0\x17\xc0\x27\x84\
+\xa7\xbe\xdf\x1a\x27\xd1\x8e\x09\x40\x12\x4a\x9e\xd4\x39\x67\xeb\
+\x9e\x95\xb2\xd8\xff\x4c\x6e\x01\xfe\xb5\xa8\x74\x8e\x14\x6e\x24\
+\x40\x02\x24\x70\x0e\x7c\x02\x7c\x03\x7c\x04\x71\x84\x43\x80\x09\
+\x40\x20\xb6\x96\x5b\x7d\x6f\x5f\x5a\x6b\xcc\x8a\xba\x6f\x90\xc2\
+\x8d\x04\x48\x80\x04\x16\x12\x78\x03\x7c\x04\x7c\xc5\xc2\x13\x7c\
+\xee\x1a\x81\x64\xf2\x32\x01\x48\xc6\xc9\xd9\x5a\xe7\x6e\xdd\x75\
+\xde\xf8\xe4\xcc\xb4\xdc\xea\xbb\x4e\x94\x58\x2e\x85\x1b\x09\x90\
+\x00\x09\xf4\x22\xb0\x1c\xbe\x02\x3e\x03\xbe\xa3\x57\x25\x1e\xf7\
+\x83\x00\x13\x00\x3f\xec\xb8\x48\x8b\x97\x6f\xdd\x73\xfc\xd8\xe4\
+\xec\x87\x6a\xb5\xda\x9d\x46\xa9\x75\x8b\x2a\xf0\x00\x09\x90\x00\
+\x09\xf4\x20\x00\x9f\x01\xdf\x01\x1f\x02\x5f\xd2\xa3\x1a\x0f\x5b\
+\x4a\x20\xa9\x58\x4c\x00\x92\x92\x72\xa8\xde\xfa\x6d\x7b\x2e\xf8\
+\x71\xad\xb1\x4b\x29\x73\xb9\x43\x62\x53\x54\x12\x20\x01\xeb\x08\
+\x98\xcb\xe1\x4b\xc6\xeb\xbb\x2f\xb4\x4e\x34\x0a\x34\x34\x01\x26\
+\x00\x43\x23\xb4\xa7\x83\xf5\x5b\xf7\xac\x18\x9b\x9c\xf9\x44\xc3\
+\x34\x6e\x15\xa9\x9e\x25\x85\x1b\x09\x90\x00\x09\x0c\x4b\xe0\x59\
+\x46\xeb\x5b\xe0\x5b\xe0\x63\x86\xed\x8c\xed\x8b\x26\x90\xbc\x7f\
+\x26\x00\xc9\x59\x59\x5d\x73\x7c\x72\xcf\xeb\x1a\xb5\xc6\xb7\x44\
+\xc8\xd7\x4b\xe1\x46\x02\x24\x40\x02\x79\x13\x78\x3d\x7c\x0c\x7c\
+\x4d\xde\x1d\xb3\xbf\x6a\x08\x30\x01\xa8\x86\x7b\x6e\xa3\xae\xfb\
+\xc8\x83\xa7\xc8\xeb\x74\x7f\x6e\x54\xe3\x53\xd2\x29\x7f\xa6\x57\
+\x20\x70\x23\x01\x12\x28\x8c\x00\x7e\x76\xf8\x53\xf0\x39\xf0\x3d\
+\x85\x8d\xc2\x8e\x33\x13\x48\xd3\x90\x09\x40\x1a\x5a\x96\xd5\xc5\
+\xaf\x7c\xe9\xb9\xb9\xfb\xe4\xb5\xfe\x8b\x2d\x13\x8d\xe2\x90\x00\
+\x09\x78\x4d\xc0\x5c\x0c\xdf\x03\x1f\xe4\xb5\x9a\x9e\x2b\xc7\x04\
+\xc0\x41\x03\xaf\xbd\xf1\xde\x13\xe5\xf5\xb8\x3f\xc5\xaf\x7c\x89\
+\xf8\xa7\x48\xe1\x46\x02\x24\x40\x02\x65\x13\x38\x05\x3e\x08\xbe\
+\x08\x3e\xa9\xec\xc1\x39\x5e\x37\x02\xe9\x8e\x31\x01\x48\xc7\xab\
+\xf2\xda\x63\xf5\x99\x97\x9f\x70\xf8\x49\xdf\x10\x41\x2e\x91\xc2\
+\x8d\x04\x48\x80\x04\xaa\x26\x70\x09\x7c\x12\x7c\x53\xd5\x82\x70\
+\xfc\x74\x04\x98\x00\xa4\xe3\x55\x69\x6d\xc9\xb4\xdf\xab\xb4\xfa\
+\x5f\x22\xc4\x19\x52\xb8\x91\x00\x09\x90\x80\x2d\x04\xce\x80\x6f\
+\x8a\x7d\x94\x2d\x12\x05\x28\x47\x5a\x95\x99\x00\xa4\x25\x56\x41\
+\xfd\xb1\xc9\x6f\x3d\x67\xdd\xb6\xdd\x77\xca\xd0\x57\x4b\xe1\x46\
+\x02\x24\x40\x02\xb6\x12\xb8\x1a\xbe\x0a\x3e\xcb\x56\x01\x29\xd7\
+\x31\x02\x4c\x00\x8e\xb1\xb0\xf2\xd1\xf8\xe4\x9e\x37\x2a\xb5\xf4\
+\x7f\x6b\xa3\xcf\xb3\x52\x40\x0a\x45\x02\x24\x40\x02\x1d\x04\x74\
+\xec\xab\x96\xfe\xef\xa6\xef\xea\x38\xc1\x87\x05\x13\x48\xdf\x7d\
+\x2d\x7d\x13\xb6\x28\x8b\xc0\xd8\xe4\xec\x47\x8d\x6a\x7c\x4c\xc6\
+\x3b\x4e\x0a\x37\x12\x20\x01\x12\x70\x85\xc0\x71\xf0\x5d\xf0\x61\
+\xae\x08\x1c\xa2\x9c\x4c\x00\x2c\xb4\xfa\xf8\x87\x77\xad\x95\xd7\
+\xd2\xee\x55\xca\x5c\x6a\xa1\x78\x14\x89\x04\x48\x80\x04\x12\x12\
+\x30\x97\xc2\x97\xc1\xa7\x25\x6c\xc0\x6a\x19\x09\x64\x69\xc6\x04\
+\x20\x0b\xb5\x02\xdb\x8c\x6d\xdb\xf3\x26\xb3\xa4\xf6\x75\x19\x62\
+\xad\x14\x6e\x24\x40\x02\x24\xe0\x3a\x81\xb5\xf0\x69\xf0\x6d\xae\
+\x2b\xe2\x9b\xfc\x4c\x00\x2c\xb2\xa8\x64\xca\x5b\x95\x69\xdc\x24\
+\x22\x69\x29\xdc\x48\x80\x04\x48\xc0\x17\x02\x1a\xbe\x2d\xf6\x71\
+\xbe\x68\x64\x95\x1e\xd9\x84\x61\x02\x90\x8d\x5b\xae\xad\xc6\x6f\
+\x98\xfd\x79\x79\xad\xec\xab\xd2\xe9\x26\x29\xdc\x48\x80\x04\x48\
+\xc0\x57\x02\x9b\xe0\xeb\xe0\xf3\x7c\x55\xd0\x25\xbd\x98\x00\x54\
+\x6c\xad\x73\x27\x77\xbd\xc2\x34\xcc\xd7\xe4\xf5\xfe\xf3\x2b\x16\
+\x85\xc3\x93\x00\x09\x90\x40\x09\x04\xcc\xf9\xf0\x79\xf0\x7d\x25\
+\x0c\x16\xc4\x10\x59\x95\x64\x02\x90\x95\x5c\x0e\xed\xc6\xb7\xcd\
+\x5c\x59\x53\xb5\xff\x21\x5d\xf1\x47\x7c\x04\x02\x37\x12\x20\x81\
+\x60\x08\xac\x80\xef\x83\x0f\x0c\x46\x63\x0b\x15\x65\x02\x50\x91\
+\x51\xd6\x4d\xce\xdc\x68\x8c\xfa\xe3\x8a\x86\xe7\xb0\x24\x40\x02\
+\x24\x50\x39\x01\xf8\x40\xf8\xc2\xca\x05\x71\x5a\x80\xec\xc2\x33\
+\x01\xc8\xce\x2e\x53\xcb\x73\x3f\x32\x73\xda\xd8\xe4\xcc\x97\xb5\
+\x52\x6f\xce\xd4\x01\x1b\x91\x00\x09\x90\x80\x47\x04\xe0\x0b\xe1\
+\x13\xe1\x1b\x3d\x52\xcb\x09\x55\x98\x00\x94\x68\xa6\xb1\x6d\x33\
+\xe3\xb5\x39\x35\x25\x43\xbe\x44\x0a\x37\x12\x20\x01\x12\x20\x81\
+\x26\x81\x97\xc0\x37\xc2\x47\x36\x9f\xf2\x7f\x52\x02\xc3\xd4\x63\
+\x02\x30\x0c\xbd\x14\x6d\xc7\x6f\x98\x7d\xad\x32\x6a\xbb\x34\x79\
+\xa6\x14\x6e\x24\x40\x02\x24\x40\x02\xf3\x09\x3c\x13\x3e\x32\xf6\
+\x95\xf3\x8f\xf3\x59\x41\x04\x98\x00\x14\x04\xb6\xb3\xdb\xf1\xc9\
+\x3d\xef\x34\x0d\x73\x73\xe7\x31\x3e\x26\x01\x12\x20\x01\x12\x58\
+\x4c\x00\xbe\x12\x3e\x73\xf1\x19\x1e\x59\x4c\x60\xb8\x23\x4c\x00\
+\x86\xe3\x37\xb0\xb5\xbc\xb6\xb5\xd5\xa8\xc6\xfb\x07\x56\x64\x05\
+\x12\x20\x01\x12\x20\x81\x98\x00\x7c\x26\x7c\x67\xfc\x84\xff\x0a\
+\x23\xc0\x04\xa0\x20\xb4\x5b\xb6\x98\xda\xf8\xe4\xec\xad\xd2\x3d\
+\xbf\xdc\x47\x20\x70\x23\x01\x12\x20\x81\x94\x04\x36\xc1\x87\xc2\
+\x97\xa6\x6c\x17\x4c\xf5\x61\x15\x65\x02\x30\x2c\xc1\x2e\xed\xd7\
+\x7d\xf0\x1b\xa7\xfc\xdd\x8a\xd9\x3b\x8d\x32\x17\x74\x39\xcd\x43\
+\x24\x40\x02\x24\x40\x02\x09\x08\xc0\x87\xc2\x97\xc2\xa7\x26\xa8\
+\xce\x2a\x29\x09\x30\x01\x48\x09\x6c\x50\xf5\xf5\x5b\xef\x3f\x53\
+\x2f\x3f\xe1\x2e\x65\xd4\xfa\x41\x75\x79\x9e\x04\x48\x80\x04\x48\
+\x60\x00\x01\xf1\xa5\xf0\xa9\xf0\xad\x03\x6a\x06\x76\x7a\x78\x75\
+\x99\x00\x0c\xcf\xf0\x68\x0f\x63\xd7\xdf\x3f\xde\xa8\x2d\xbb\x53\
+\x0e\xac\x96\xc2\x8d\x04\x48\x80\x04\x48\x20\x1f\x02\xab\xe1\x5b\
+\xe1\x63\xf3\xe9\x8e\xbd\x80\x00\x13\x00\x50\xc8\xa1\x8c\x4f\xee\
+\x7a\x85\x5a\xba\x0c\x3f\xe8\xc3\xaf\xf5\xcd\x81\x27\xbb\x20\x01\
+\x12\x20\x81\x05\x04\x56\xc0\xc7\xc6\xbe\x76\xc1\x89\x10\x9f\xe6\
+\xa1\x33\x13\x80\x1c\x28\x8e\x6f\x9b\x7d\x8d\x69\x7e\xa7\xff\xd2\
+\x1c\xba\x63\x17\x24\x40\x02\x24\x40\x02\xdd\x09\x2c\x85\xaf\x85\
+\xcf\xed\x7e\x9a\x47\xd3\x10\x60\x02\x90\x86\x56\x97\xba\xeb\xb7\
+\xcd\xfc\x96\x31\xe6\x33\x5d\x4e\xf1\x10\x09\x90\x00\x09\x90\x40\
+\x01\x04\xe0\x73\xe1\x7b\x0b\xe8\xda\x91\x2e\xf3\x11\x93\x09\xc0\
+\x10\x1c\xc7\xeb\xbb\xdf\xd6\x30\xea\x4f\x86\xe8\x82\x4d\x49\x80\
+\x04\x48\x80\x04\x32\x10\x80\xef\x85\x0f\xce\xd0\x94\x4d\x5a\x04\
+\x98\x00\xb4\x40\xa4\xdd\x8d\x4f\xee\x7e\xa7\xd1\xfa\xfa\xb4\xed\
+\x58\x9f\x04\x48\x80\x04\x48\x20\x1f\x02\xf0\xc1\xf0\xc5\xf9\xf4\
+\xe6\x4e\x2f\x79\x49\xca\x04\x20\x03\xc9\xb1\xfa\xee\xdf\x33\x4a\
+\xf3\xdb\xfd\x32\xb0\x63\x13\x12\x20\x01\x12\xc8\x93\x00\x7c\x31\
+\x7c\x72\x9e\x7d\x86\xd2\x17\x13\x80\x94\x96\x1e\x9b\x9c\xf9\x03\
+\xa5\xf5\x7b\x52\x36\x63\x75\x12\x20\x01\x12\x20\x81\xa2\x08\x88\
+\x4f\x8e\x7d\x73\x51\xfd\x5b\xd5\x6f\x7e\xc2\x30\x01\x48\xc1\x72\
+\xdd\xe4\xee\x3f\x94\xea\xef\x96\xc2\x8d\x04\x48\x80\x04\x48\xc0\
+\x2e\x02\xef\x6e\xf9\x68\xbb\xa4\xb2\x58\x1a\x26\x00\x09\x8d\x83\
+\x89\xa5\x95\xfe\xdd\x84\xd5\x59\x8d\x04\x48\x80\x04\x48\xa0\x64\
+\x02\xf0\xd1\xf0\xd5\x25\x0f\x5b\xea\x70\x79\x0e\xc6\x04\x20\x01\
+\x4d\xdc\x5a\xc2\xc4\x4a\x50\x95\x55\x48\x80\x04\x48\x80\x04\x2a\
+\x24\x00\x5f\x0d\x9f\x5d\xa1\x08\xce\x0c\xcd\x04\x60\x80\xa9\x5a\
+\x6f\x2e\xe1\x6d\xff\x01\x9c\x78\x9a\x04\x48\x80\x04\x2c\x22\xf0\
+\xee\x96\xef\xb6\x48\xa4\x3c\x44\xc9\xb7\x0f\x26\x00\x7d\x78\xc6\
+\x1f\x2f\xd1\x7c\xc3\x5f\x1f\x44\x3c\x45\x02\x24\x40\x02\x76\x12\
+\x10\xdf\x1d\xfb\x70\x3b\xa5\xb3\x00\x69\x17\x7f\x00\x00\x10\x00\
+\x49\x44\x41\x54\x42\x2a\x26\x00\x3d\xcc\x80\x2f\x98\xc0\xc7\x4b\
+\x7a\x9c\xe6\x61\x12\x20\x01\x12\x20\x01\xcb\x09\xc0\x87\xc3\x97\
+\x5b\x2e\x66\x62\xf1\xf2\xae\xc8\x04\xa0\x0b\x51\x7c\xc5\x24\xbe\
+\x60\xa2\xcb\x29\x1e\x22\x01\x12\x20\x01\x12\x70\x88\x00\x7c\x39\
+\x7c\xba\x43\x22\x97\x26\x2a\x13\x80\x05\xa8\xc7\xb7\xcd\xbe\x06\
+\x5f\x31\xb9\xe0\x30\x9f\x92\x00\x09\x90\x00\x09\x38\x4a\x00\x3e\
+\x1d\xbe\xdd\x51\xf1\x5b\x62\xe7\xbf\x63\x02\xd0\xc1\x74\x7c\x72\
+\xd7\x2b\xf0\x23\x13\x1d\x87\xf8\x90\x04\x48\x80\x04\x48\xc0\x03\
+\x02\xf0\xed\xf0\xf1\x1e\xa8\x92\x9b\x0a\x4c\x00\x5a\x28\xc7\xae\
+\xbf\x7f\xdc\xa8\xda\x6d\xad\xa7\xdc\x91\x00\x09\x90\x00\x09\x78\
+\x46\x00\x3e\x1e\xbe\xde\x45\xb5\x8a\x90\x99\x09\x80\x50\x5d\xbf\
+\xf5\xfe\x33\xd5\xd2\x65\x7f\x25\x0f\x97\x4a\xe1\x46\x02\x24\x40\
+\x02\x24\xe0\x27\x81\xa5\xf0\xf5\xb1\xcf\xf7\x53\xbf\x54\x5a\x05\
+\x9f\x00\xac\xfb\xe0\x37\x4e\x69\xd4\x96\xfd\xa5\x50\x5b\x21\x85\
+\x1b\x09\x90\x00\x09\x90\x80\xdf\x04\x56\xc0\xe7\xc3\xf7\xbb\xa3\
+\x66\x31\x92\x06\x9d\x00\x6c\xd9\x62\x6a\xfa\xc4\x13\x3e\x2f\x68\
+\x57\x4b\xe1\x46\x02\x24\x40\x02\x24\x10\x06\x81\xd5\xf0\xfd\x88\
+\x01\x61\xa8\xdb\x5d\xcb\xa0\x13\x80\x2f\x9d\xbc\xe7\x73\xca\xa8\
+\xf5\xdd\xd1\xf0\x28\x09\x90\x00\x09\x90\x80\xb7\x04\xc4\xf7\xc7\
+\x31\xc0\x01\x05\x8b\x12\x31\xd8\x04\x60\x6c\x72\x66\xab\x51\xe6\
+\x82\xa2\xc0\xb2\x5f\x12\x20\x01\x12\x20\x01\xbb\x09\x20\x06\x20\
+\x16\xd8\x2d\x65\x71\xd2\x05\x99\x00\x8c\x4f\xee\x79\xa7\x20\xdd\
+\x24\x85\x1b\x09\x90\x00\x09\x90\x40\xd8\x04\x36\xb5\x62\x82\xa5\
+\x14\x8a\x13\x2b\xb8\x04\x60\xfc\x86\xd9\xd7\x1a\xd5\x78\x7f\x71\
+\x48\xd9\x33\x09\x90\x00\x09\x90\x80\x4b\x04\x10\x13\x10\x1b\x5c\
+\x92\x39\x0f\x59\x83\x4a\x00\xc6\xb6\xcd\x8c\x9b\x86\xb9\x39\x0f\
+\x70\xec\x83\x04\x48\x80\x04\x48\xc0\x1f\x02\x88\x0d\x88\x11\xb6\
+\x69\x54\xa4\x3c\xc1\x24\x00\xe7\x7e\x64\xe6\x34\x65\xd4\xa7\x8b\
+\x84\xc9\xbe\x49\x80\x04\x48\x80\x04\x1c\x26\x20\x31\x22\x8e\x15\
+\x0e\xab\x90\x46\xf4\x60\x12\x80\xda\x9c\xfa\x94\x80\x79\xa6\x14\
+\x6e\x24\x40\x02\x24\x40\x02\x24\xd0\x8d\xc0\x33\x5b\xb1\xa2\xdb\
+\xb9\x0a\x8e\x15\x3b\x64\x10\x09\xc0\xba\xc9\x99\x1b\x05\xe3\x4b\
+\xa4\x70\x23\x01\x12\x20\x01\x12\x20\x81\x7e\x04\x5e\xd2\x8a\x19\
+\xfd\xea\x78\x71\xce\xfb\x04\x60\x7c\xdb\xcc\x95\x5a\xa9\x37\x7b\
+\x61\x2d\x2a\x41\x02\x24\x40\x02\x24\x50\x38\x01\xc4\x0c\xc4\x8e\
+\xc2\x07\x1a\x30\x40\xd1\xa7\xbd\x4e\x00\xce\x8d\x7f\xdd\x4f\xfd\
+\x71\xd1\x10\xd9\x3f\x09\x90\x00\x09\x90\x80\x5f\x04\x8c\x51\x7f\
+\x8c\x18\xe2\x97\x56\xf3\xb5\xf1\x36\x01\x18\xbf\x61\xf6\xe7\x6b\
+\xaa\xf6\xf1\xf9\xea\xf2\x19\x09\x90\x00\x09\x90\x00\x09\x24\x23\
+\x80\x18\x82\x58\x92\xac\x76\xde\xb5\x8a\xef\xcf\xdb\x04\xc0\x34\
+\xd4\xc7\x04\x1f\x7f\xe0\x47\x20\x70\x23\x01\x12\x20\x01\x12\xc8\
+\x44\x60\x45\x2b\x96\x64\x6a\x6c\x7b\x23\x2f\x13\x80\xe6\x57\x3b\
+\x9a\xf3\x6d\x87\x4f\xf9\x48\x80\x04\x48\x80\x04\x6c\x27\x60\xce\
+\x6f\xc6\x94\x72\xe5\x2c\x63\x34\xef\x12\x80\xb1\x6d\x7b\xde\x24\
+\xe0\xf8\x35\xbf\x02\x81\x1b\x09\x90\x00\x09\x90\x40\x2e\x04\x36\
+\xb5\x62\x4b\x2e\x9d\xd9\xd2\x89\x57\x09\xc0\xf8\x87\x77\xad\x55\
+\xa6\xf1\xa7\xb6\xc0\xa5\x1c\x24\x40\x02\x24\x40\x02\x9e\x10\x90\
+\xd8\x12\xc7\x98\x52\xd4\x29\x67\x10\xaf\x12\x00\xb3\xa4\x86\xcf\
+\xfb\xeb\x72\xd0\x71\x14\x12\x20\x01\x12\x20\x81\x80\x08\xe8\x56\
+\x8c\xf1\x46\x65\x6f\x12\x80\xb1\xc9\xd9\x8f\x8a\x55\xd6\x4a\xe1\
+\x46\x02\x24\x40\x02\x24\x40\x02\x45\x10\x58\xdb\x8a\x35\x45\xf4\
+\x7d\xb4\xcf\xb2\x1e\x78\x91\x00\x8c\x4f\xee\x79\xa3\x52\xe6\xd2\
+\xb2\xa0\x71\x1c\x12\x20\x01\x12\x20\x81\x50\x09\x98\x4b\x9b\x31\
+\xc7\x7d\xfd\x9d\x4f\x00\xc6\x26\xbf\xf5\x1c\xa3\x1a\x1f\x71\xdf\
+\x14\xd4\x80\x04\x48\x80\x04\x48\xc0\x05\x02\x88\x39\x88\x3d\xc5\
+\xc8\x5a\x5e\xaf\xce\x27\x00\x46\x2f\xd9\x26\xb8\x8e\x93\xc2\x8d\
+\x04\x48\x80\x04\x48\x80\x04\xca\x20\x70\x5c\x2b\xf6\x94\x31\x56\
+\x61\x63\x38\x9d\x00\x8c\x4d\xce\xbc\x57\x1b\x7d\x5e\x61\x74\xd8\
+\x31\x09\x90\x00\x09\x90\x00\x09\x74\x21\xa0\x25\xf6\x20\x06\x75\
+\x39\x35\xd4\xa1\x32\x1b\x3b\x9b\x00\x8c\xd5\x67\x5e\x2e\xa0\xae\
+\x96\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\xaa\x20\x70\x75\x2b\x16\
+\x55\x31\xf6\xd0\x63\x3a\x99\x00\xac\xbd\xf1\xde\x13\x95\x56\x5b\
+\x87\xd6\x9e\x1d\x90\x00\x09\x90\x00\x09\x90\xc0\x30\x04\x24\x16\
+\xc5\x31\x69\x98\x3e\x8e\xb6\x2d\xf7\x81\x93\x09\xc0\x09\x87\x9f\
+\xf4\x61\xc1\x74\x86\x14\x6e\x24\x40\x02\x24\x40\x02\x24\x50\x25\
+\x81\x33\x5a\x31\xa9\x4a\x19\x32\x8d\xed\x5c\x02\x30\xbe\x6d\xf6\
+\x35\xa2\xe9\x25\x52\xb8\x91\x00\x09\x90\x00\x09\x90\x80\x0d\x04\
+\x2e\x69\xc5\xa6\xa1\x64\x29\xbb\xb1\x53\x09\xc0\xba\x8f\x3c\x78\
+\x8a\x31\xe6\xfa\xb2\x21\x71\x3c\x12\x20\x01\x12\x20\x01\x12\xe8\
+\x47\x00\xb1\x09\x31\xaa\x5f\x1d\xdb\xce\x39\x95\x00\xe8\xb9\xc6\
+\x75\x02\xf0\x14\x29\xdc\x48\x80\x04\x48\x80\x04\x48\xc0\x26\x02\
+\xa7\xb4\x62\x54\x46\x99\xca\x6f\xe6\x4c\x02\x30\x3e\xb9\xe7\x75\
+\x4a\x99\x8b\xcb\x47\xc4\x11\x49\x80\x04\x48\x80\x04\x48\x20\x09\
+\x01\x73\x71\x33\x56\x25\xa9\x5b\x7d\x1d\x27\x12\x80\xf5\x5b\xf7\
+\xac\x30\xaa\x71\x6d\xf5\xb8\x28\x01\x09\x90\x00\x09\x90\x00\x09\
+\xf4\x26\x80\x58\x85\x98\xd5\xbb\x46\xf7\x33\x55\x1c\x75\x22\x01\
+\x68\xd4\x1a\x1f\x14\x38\x2b\xa4\x70\x23\x01\x12\x20\x01\x12\x20\
+\x01\x9b\x09\xac\x68\xc5\x2c\x9b\x65\x8c\x65\xb3\x3e\x01\x18\xaf\
+\xef\xbe\x50\x24\x7d\xbd\x14\x6e\x24\x40\x02\x24\x40\x02\x24\xe0\
+\x02\x81\xd7\xb7\x62\x57\x42\x59\xab\xa9\x66\x75\x02\xf0\xf2\xad\
+\x7b\x8e\x37\x5a\x7f\xa0\x1a\x34\x1c\x95\x04\x48\x80\x04\x48\x80\
+\x04\xb2\x11\x40\xec\x42\x0c\xcb\xd6\xba\x9c\x56\x56\x27\x00\x3f\
+\xae\x99\xf7\x0b\x86\x67\x49\xe1\x46\x02\x24\x40\x02\x24\x40\x02\
+\x2e\x11\x78\x56\x2b\x86\x0d\x94\xb9\xaa\x0a\xd6\x26\x00\xe7\x6e\
+\xdd\x75\x9e\x52\xe6\xf2\xaa\xc0\x70\x5c\x12\x20\x01\x12\x20\x01\
+\x12\x18\x8e\x80\xb9\xbc\x19\xcb\x86\xeb\xa5\xa8\xd6\xd6\x26\x00\
+\x4b\x6a\xb5\x6b\x8a\x52\x9a\xfd\x92\x00\x09\x90\x00\x09\x90\x40\
+\x19\x04\x06\xc7\xb2\x32\xa4\xe8\x3e\x86\x95\x09\xc0\xd8\xb6\x99\
+\xb7\x1b\xa5\xd6\x75\x17\x99\x47\x49\x80\x04\x48\x80\x04\x48\xc0\
+\x0d\x02\x88\x65\x88\x69\x36\x4a\x6b\x5d\x02\x70\xce\xd6\x3d\x2b\
+\x95\x51\xef\xb5\x11\x16\x65\x22\x01\x12\x20\x01\x12\x20\x81\xd4\
+\x04\x24\xa6\xc5\xb1\xad\x4b\xc3\x2a\x0f\x59\x97\x00\x2c\xad\x35\
+\xfe\x50\x80\x2c\x97\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\x7c\x20\
+\xb0\xbc\x15\xdb\xac\xd2\xc5\xaa\x04\xe0\xdc\xfa\xae\x5f\x11\x3a\
+\x6f\x90\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\x7c\x22\xf0\x86\x56\
+\x8c\xeb\xd0\xa9\xda\x87\x56\x25\x00\x35\x5d\xfb\x83\x6a\x71\x70\
+\x74\x12\x20\x01\x12\x20\x01\x12\x28\x86\x80\x6d\x31\xce\x9a\x04\
+\x60\x6c\xdb\xcc\x84\x20\x3f\x47\x0a\x37\x12\x20\x01\x12\x20\x01\
+\x12\xf0\x91\xc0\x39\xad\x58\x17\xeb\x56\xf5\x3f\x2b\x12\x80\xb5\
+\x37\x7e\xfb\x29\xca\xa8\x2d\x8a\x7f\x24\x40\x02\x24\x40\x02\x24\
+\xe0\x33\x01\x89\x75\x71\xcc\xb3\x40\x47\x2b\x12\x80\xe5\x87\x8f\
+\xbc\x5b\x58\x9c\x24\x85\x1b\x09\x90\x00\x09\x90\x00\x09\xf8\x4c\
+\xe0\xa4\x66\xcc\xab\x5e\xc5\xca\x13\x80\x73\xeb\xbb\xce\x36\x4a\
+\x5d\x51\x3d\x0a\x4a\x40\x02\x24\x40\x02\x24\x40\x02\xc5\x13\x40\
+\xcc\x43\xec\x2b\x7e\xa4\xfe\x23\x54\x9e\x00\xd4\x74\xed\x77\xfb\
+\x8b\xc8\xb3\x24\x40\x02\x24\x40\x02\x24\xe0\x17\x01\x1b\x62\x5f\
+\xa5\x09\xc0\xba\xad\xbb\x7e\x59\x4c\x7a\x91\x14\x6e\x24\x40\x02\
+\x24\x40\x02\x24\x10\x12\x81\x8b\x5a\x31\xb0\x32\x9d\x2b\x4d\x00\
+\x94\xd6\x57\x57\xa6\x39\x07\x26\x01\x12\x20\x01\x12\x20\x81\x4a\
+\x08\xb4\x06\xad\x38\x06\x56\x96\x00\x8c\x6f\x9b\x7d\x8d\xd6\xfa\
+\xbc\x16\x06\xee\x48\x80\x04\x48\x80\x04\x48\x20\x28\x02\x88\x81\
+\x88\x85\x55\x29\x5d\x59\x02\xa0\x8c\xf9\x9d\xaa\x94\xe6\xb8\x24\
+\x40\x02\x24\x40\x02\x24\x50\x15\x81\x79\xe3\x56\x18\x0b\x2b\x49\
+\x00\xc6\x6e\x98\x7d\x8b\x51\xea\xec\x79\x10\xf8\x84\x04\x48\x80\
+\x04\x48\x80\x04\x02\x23\x80\x58\x88\x98\x58\x85\xda\x95\x24\x00\
+\xaa\x61\xde\x59\x85\xb2\x1c\x93\x04\x48\x80\x04\x48\x80\x04\xaa\
+\x25\xd0\x65\xf4\x8a\x62\x62\xe9\x09\xc0\xba\xc9\x19\x7c\xe6\xff\
+\x99\x5d\x10\xf0\x10\x09\x90\x00\x09\x90\x00\x09\x84\x48\xe0\x99\
+\xad\xd8\x58\xaa\xee\xa5\x26\x00\xe7\x6f\xf9\xea\x52\xad\xd4\x3b\
+\x4a\xd5\x90\x83\x91\x00\x09\x90\x00\x09\x90\x80\x25\x04\x7a\x89\
+\x81\xd8\x88\x18\xd9\xeb\x7c\x11\xc7\x4b\x4d\x00\x8e\x9c\xbc\xf2\
+\x4a\x51\xe2\x69\x52\xb8\x91\x00\x09\x90\x00\x09\x90\x00\x09\x1c\
+\x23\xf0\xb4\x56\x8c\x3c\x76\xa4\xe0\x47\xa5\x25\x00\x67\x6e\xb9\
+\xff\x38\xa3\x1a\x48\x00\x0a\x56\x89\xdd\x93\x00\x09\x90\x00\x09\
+\x90\x80\x8d\x04\xfa\xcb\x84\x18\x89\x58\xd9\xbf\x56\x7e\x67\x4b\
+\x4b\x00\x9e\x7a\xf2\xf1\x6f\x17\xb1\x57\x48\xe1\x46\x02\x24\x40\
+\x02\x24\x40\x02\x24\xb0\x98\xc0\x8a\x56\xac\x5c\x7c\xa6\x80\x23\
+\xa5\x24\x00\x17\xde\x62\x96\x48\x66\x83\x04\xa0\x00\x15\xd8\x25\
+\x09\x90\x00\x09\x90\x00\x09\xd8\x4f\x20\x89\x84\x88\x95\x88\x99\
+\x49\xea\x0e\x5b\xa7\x94\x04\x60\xdf\xfe\xd9\xb7\x89\xa0\x3f\x2b\
+\x85\x1b\x09\x90\x00\x09\x90\x00\x09\x90\x40\x6f\x02\x3f\xdb\x8a\
+\x99\xbd\x6b\xe4\x74\xa6\x94\x04\x40\x2b\x8d\x04\x20\x27\x91\xd9\
+\x0d\x09\x90\x00\x09\x90\x00\x09\xb8\x46\x20\xb9\xbc\x65\xc5\xcc\
+\xc2\x13\x80\xe6\x37\x1c\x99\x67\x24\x57\x9d\x35\x49\x80\x04\x48\
+\x80\x04\x48\x20\x64\x02\xe6\x19\xcd\xd8\x59\x2c\x83\xc2\x13\x00\
+\xd5\x30\x9b\x8a\x55\x81\xbd\x93\x00\x09\x90\x00\x09\x90\x80\xdd\
+\x04\x52\x4b\x57\x42\xec\x2c\x34\x01\x68\xfd\xca\xd1\x99\xa9\x15\
+\x67\x03\x12\x20\x01\x12\x20\x01\x12\x08\x9b\xc0\x99\xad\x18\x5a\
+\x18\x85\x42\x13\x00\x63\xcc\xc6\xc2\x24\x67\xc7\x24\x40\x02\x24\
+\x40\x02\x24\xe0\x04\x81\x6c\x42\x16\x1d\x43\x0b\x4b\x00\xd6\x6d\
+\xdd\xf5\xcb\xa2\xf2\x98\x14\x6e\x24\x40\x02\x24\x40\x02\x24\x40\
+\x02\xe9\x09\x8c\xb5\x62\x69\xfa\x96\x09\x5a\x14\x96\x00\xe8\x5a\
+\xed\x2d\x09\xc6\x67\x15\x12\x20\x01\x12\x20\x01\x12\xf0\x9a\xc0\
+\x30\xca\x15\x19\x4b\x0b\x49\x00\xce\xad\xef\x3a\x5b\x14\x7e\x95\
+\x14\x6e\x24\x40\x02\x24\x40\x02\x24\x40\x02\xd9\x09\xbc\xaa\x15\
+\x53\xb3\xf7\xd0\xa3\x65\x21\x09\x40\x4d\xd5\xde\xdc\x63\x3c\x1e\
+\x26\x01\x12\x20\x01\x12\x20\x81\x80\x08\x0c\xaf\x6a\x51\x31\x35\
+\xf7\x04\x60\xed\x8d\xdf\x7e\x8a\xd2\x8a\x09\xc0\xf0\x36\x67\x0f\
+\x24\x40\x02\x24\x40\x02\x24\xa0\x10\x53\xe3\xd8\xaa\xf2\xfd\xcb\
+\x3d\x01\x58\x7e\xe4\xc8\x25\x22\xe2\x71\x52\xb8\x91\x00\x09\x90\
+\x00\x09\x90\x40\xd0\x04\x72\x52\xfe\xb8\x56\x6c\xcd\xa9\xbb\x66\
+\x37\xb9\x27\x00\xc6\x28\x24\x00\xcd\xde\xf9\x9f\x04\x48\x80\x04\
+\x48\x80\x04\x48\x60\x68\x02\x45\xc4\xd6\x5c\x13\x80\x75\x93\xbb\
+\x5f\x29\x5a\xae\x96\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\x02\x27\
+\x90\xab\xfa\xab\x5b\x31\x36\xb7\x4e\x73\x4d\x00\xb4\xd2\xbf\x99\
+\x9b\x64\xec\x88\x04\x48\x80\x04\x48\x80\x04\x48\xe0\x28\x81\xbc\
+\x63\x6c\x6e\x09\xc0\x2f\x7e\xf8\x81\x55\x22\x25\xee\x00\xc8\x8e\
+\x1b\x09\x90\x00\x09\x90\x00\x09\x84\x4d\xa0\x00\xed\x5f\xd9\x8a\
+\xb5\xb9\x74\x9d\x5b\x02\xd0\x58\xba\xf4\xf5\xb9\x48\xc4\x4e\x9c\
+\x22\xf0\xfc\xd3\x4e\x54\xbd\x8a\x53\x8a\x50\x58\x12\xb0\x90\x40\
+\xaf\xb5\xd5\x79\xdc\x42\xb1\x29\x52\x81\x04\xf2\x8c\xb5\xb9\x25\
+\x00\xca\x18\x26\x00\x05\x1a\xbd\xec\xae\xdb\x0e\xe6\x8d\x2f\x3a\
+\x49\xd5\x37\x9c\x1e\x97\xa9\x8d\x23\x6a\x61\xa9\x6f\x58\x29\xe7\
+\xba\x97\xc5\x75\x9b\xfd\xd4\xa5\xbf\x37\x4a\xbf\xed\x52\xb6\x6e\
+\x1c\x8f\x04\xaa\x26\xd0\x6d\x7d\x61\x5d\xa0\x74\xae\x9b\x7a\x9f\
+\xf5\xd5\x3e\xd7\x59\x1f\x8f\xeb\x0b\xd6\x17\xc6\xaa\x5a\xdf\x30\
+\xc7\x2f\x48\xeb\x1c\x63\x6d\x2e\x09\xc0\xba\xfa\xec\xaf\x1b\xa5\
+\x56\x16\xa4\x2e\xbb\x2d\x90\x00\x9c\x03\x02\x31\x9c\x06\x0a\x1c\
+\x08\x4a\xbd\xe5\x78\xde\xf8\xc2\x93\xe4\x0a\x7f\x79\x5c\x86\x15\
+\xe3\xf9\xa7\x35\xfb\xc1\x1e\xfd\xb6\x0b\xc6\x43\x81\x1c\x28\x90\
+\x69\xd8\xb1\xd8\x9e\x04\x6c\x22\x80\x39\x8d\xb9\x5d\x97\xe0\xdc\
+\x2c\xcd\xa4\x19\x6b\x00\xeb\xa1\xb3\x0c\x2b\x37\xfa\x42\xbf\xed\
+\x52\x97\xb5\x8c\xf5\x85\x52\x97\xf1\x21\x07\xca\xb0\xe3\xb0\x7d\
+\x35\x04\x10\x6b\x11\x73\xf3\x18\x3d\x97\x04\x40\x6b\xf3\xba\x3c\
+\x84\x61\x1f\xc5\x13\x80\x23\x42\x81\x23\x68\x3a\x84\x95\x0a\x8e\
+\x02\x4e\x03\xa5\x78\x09\x7a\x8f\x00\x39\x50\xea\x2d\x87\x55\xef\
+\x70\x56\x90\xb9\x77\x4b\x9e\x21\x01\x7b\x08\x60\xae\xa2\x60\xfe\
+\xa2\xd8\xb4\xce\xb0\xc6\xb1\xc6\x50\x20\x17\x0a\x92\x01\x14\xc8\
+\x6c\x0f\x45\xf7\x25\x29\x52\x83\xbc\x62\xee\xd0\x09\xc0\xd8\xf5\
+\xf7\x3f\x43\x14\xe5\x9b\xff\x04\x82\x8d\x1b\x16\x35\x4a\xa7\x23\
+\xaa\x4b\x80\x85\x23\xb0\x51\xde\x4e\x99\x20\x23\x1c\x15\x0a\x64\
+\x6e\x3b\x2b\xe8\xd3\x59\x8f\x8f\x49\xa0\x6a\x02\x98\x93\x75\x49\
+\x58\x9b\xa5\x79\x75\x8f\xf9\x8b\x52\xb5\x6c\x83\xc6\xc7\xfa\x42\
+\xa9\x8b\x5f\xc0\x1a\xab\x8b\x1e\x48\x08\x06\xb5\xe3\xf9\x4a\x09\
+\xbc\xb2\x15\x7b\x87\x12\x62\xe8\x04\x40\x2d\x5b\xf6\xda\xa1\x24\
+\x60\xe3\xdc\x09\xc0\x19\x61\x01\x63\x21\xd7\x65\x51\xa3\xb8\xe0\
+\x88\x92\x80\xe8\x74\x54\xd0\x31\x49\x1b\xd6\x21\x81\x22\x08\x2c\
+\x5c\x67\x58\x63\x28\x45\x8c\x55\x66\x9f\xd0\x01\xeb\x0c\xc9\x00\
+\xd6\x18\x4a\x99\xe3\xfb\x31\x56\x09\x5a\xe4\x10\x7b\x87\x4e\x00\
+\xb4\x51\x4c\x00\x4a\xb0\x75\x92\x21\xe0\x90\xea\x92\xbd\xd7\x25\
+\xe8\x63\x01\x63\x21\x27\x69\xe7\x6a\x1d\xe8\x08\x27\x55\x17\x9d\
+\xe9\xa4\x5c\xb5\xa2\x5b\x72\x63\x8d\xa1\x60\xce\xd5\x03\x58\x67\
+\x58\x63\x28\x58\x67\x58\x63\x28\x6e\x59\xcc\x5f\x69\xf3\x88\xbd\
+\x43\x25\x00\x63\xdb\x66\xc6\x8d\x52\x67\xfb\x8b\xd8\x7e\xcd\xda\
+\xce\x08\x0b\x14\x0e\xc9\xf7\xa0\xdf\xcd\x22\xd0\xb9\xed\xa4\xea\
+\x4c\x06\xba\x21\xe2\xb1\x21\x09\xb4\xd7\x59\x5d\x82\x3e\x0a\xe6\
+\xdc\x90\x5d\x3a\xd7\x1c\x6b\x0c\x05\xbe\x06\x89\x00\x8a\x73\x4a\
+\x94\x24\x70\x19\xc3\x20\xf6\x22\x06\x0f\x33\xd6\x50\x09\x80\x6a\
+\xa8\x57\x0f\x33\x38\xdb\x66\x27\x80\xc5\x87\x85\x18\xaa\x33\xea\
+\x45\x0e\x8e\xb9\xd3\x49\xf5\xaa\xc7\xe3\x24\x30\x88\x40\x3b\xe8\
+\x73\x9d\x2d\x26\x85\x35\x86\x52\x67\xc2\xbd\x18\x4e\x99\x47\x86\
+\x8c\xc1\xc3\x25\x00\x9a\x09\x40\x99\xb6\xc6\x58\xed\xc0\x8f\xc5\
+\x87\xe7\x2c\xbd\x09\x80\x11\x9c\x37\x98\xf5\xae\xc5\x33\x24\x30\
+\x9f\x40\x3b\xf0\xd7\xe5\x6a\x1f\x09\xe5\xfc\xb3\x7c\xd6\x49\x00\
+\x7c\xb8\xce\x3a\x89\xe0\x71\x89\x65\xc8\x18\x9c\x39\x01\x58\x37\
+\xb9\x07\xef\xfc\x5f\x51\xa2\xaa\x41\x0f\x85\x20\x16\x07\xb3\x17\
+\x9e\x14\x34\x87\x2c\xca\x77\x3a\x28\x70\xcc\xd2\x07\xdb\xf8\x4f\
+\x80\x81\x7f\x38\x1b\x77\xae\xb3\xe1\x7a\x62\xeb\x14\x04\x56\xb4\
+\x62\x71\x8a\x26\xc7\xaa\x66\x4e\x00\xb4\x32\x17\x1e\xeb\x86\x8f\
+\x8a\x20\xd0\x76\x48\x0c\xfc\xf9\xd0\x85\x83\x42\xa9\xf3\xb6\x65\
+\x3e\x40\x3d\xe9\xa5\xbd\xce\xea\xbc\xe2\xcf\xc5\xa2\x58\x63\xb1\
+\xcf\x7a\x51\x98\x17\x2b\xb9\x40\x4c\xd1\xc9\x30\xb1\x38\x53\x02\
+\xf0\xf2\xad\x7b\x8e\x57\xca\x5c\x90\x42\x46\x56\x4d\x49\x00\x57\
+\xaa\x74\x48\x29\xa1\x25\xac\xce\xdb\x96\x09\x41\x79\x5e\x8d\x81\
+\xbf\x58\x03\x33\x11\x28\x96\xef\xb1\xde\xcd\x05\xcd\x98\x7c\xec\
+\x48\xd2\x47\x99\x12\x80\x9f\x2c\x31\xbf\x26\x03\x48\x12\x20\xff\
+\xb9\xe5\x4a\xa0\xed\x94\xb0\x78\x72\xed\x98\x9d\x75\x25\x00\xce\
+\xbc\x5a\xe9\x8a\xc6\xdb\x83\xed\x35\xc6\x04\xbb\x1c\x13\x87\xb5\
+\xc6\xca\x61\xba\x60\x94\xe3\x5b\x31\x79\xc1\xe1\xc1\x4f\x33\x25\
+\x00\xca\x28\x24\x00\x83\x7b\x67\x8d\xc4\x04\xe8\x94\x12\xa3\x2a\
+\xa4\x22\x9c\x14\xee\xba\x14\xd2\x39\x3b\xb5\x82\x00\xd7\x58\xb5\
+\x66\xe0\x1a\x2b\x90\x7f\xc6\x98\x9c\x3a\x01\x58\x7b\xe3\xbd\x27\
+\x1a\x65\x5e\x55\xa0\x2a\xc1\x75\x8d\xc0\xc3\xab\x91\xea\xcd\x0e\
+\x07\xc5\xbb\x01\xd5\xdb\xa1\x08\x09\xea\x1b\x4e\x8f\x7f\xb5\x12\
+\x2f\xff\x14\xd1\x3f\xfb\x4c\x46\xc0\xf7\x35\x96\x8c\x42\xfe\xb5\
+\x10\x93\x11\x9b\xd3\xf6\x9c\x3a\x01\x58\x7e\xe4\xc9\x78\xf7\xff\
+\x92\xb4\x03\xb1\xfe\x62\x02\xed\x2b\x12\x2c\x8a\xc5\x67\x79\xa4\
+\x2a\x02\xb0\x07\x13\x81\xaa\xe8\xe7\x3b\x2e\x92\x6b\xd8\x92\x81\
+\x3f\x5f\xae\xc3\xf6\xc6\x35\x36\x2c\xc1\x45\xed\x97\xb4\x62\xf3\
+\xa2\x13\xfd\x0e\xa4\x4e\x00\x24\xd3\x40\x02\xd0\xaf\x4f\x9e\x4b\
+\x40\x00\x8e\xa9\xce\x77\x1d\x27\x20\x55\x5d\x15\x3a\xa9\xea\xd8\
+\x0f\x3b\x32\x93\xeb\x61\x09\x96\xd3\x1e\x6b\x0c\xbe\xb0\x9c\xd1\
+\x8a\x1e\xa5\xda\xfe\xb3\xc4\xe6\x54\x09\xc0\x85\xb7\x98\x25\xca\
+\xa8\xff\x54\xad\x9a\x6e\x8f\x4e\xc7\xe4\x9e\xfd\xda\x4e\x0a\xb6\
+\x73\x4f\xfa\xb0\x24\x86\x8d\xea\xbc\xdd\xef\x94\xd1\xdb\xeb\xcb\
+\x29\xa1\x6d\x14\x56\x62\x73\x1c\xa3\x53\xc8\x96\x2a\x01\xd8\xb7\
+\xff\xc1\x57\x48\xdf\xcb\xa5\x70\xcb\x40\xa0\xe9\x9c\x56\x2a\xde\
+\x8e\xcc\x00\xaf\xe2\x26\x70\x52\x75\xb9\x63\xc3\xab\x95\x8a\x0d\
+\xd1\x67\x78\xd8\x06\x36\xe2\xfa\xea\x03\xc9\xd2\x53\x58\x5f\x78\
+\xa9\x06\x36\xb4\x54\xc4\x81\x62\x59\x50\x61\x79\x2b\x46\x27\x16\
+\x25\x55\x02\xa0\x55\x03\x09\x40\xe2\xce\x59\xf1\x18\x01\x4c\x6c\
+\x38\xa7\x63\x47\xf8\xc8\x45\x02\x70\x54\x75\xb9\xc2\x44\x32\xe7\
+\xa2\xfc\x3e\xca\x0c\x5b\xc0\x26\xb0\x8d\x8f\xfa\x85\xa4\x13\x6c\
+\x08\x5f\x19\x92\xce\x79\xea\x9a\x36\x46\xa7\x4a\x00\x94\x56\xff\
+\x21\x4f\x61\x43\xe8\x8b\xce\xc9\x3f\x2b\xe3\x0a\xb3\xce\xbb\x01\
+\x56\x18\x16\xc1\x02\xb6\x80\x4d\xac\x10\x88\x42\x0c\x4d\x00\x49\
+\x40\xdd\xb9\x24\x7b\x68\xb5\xf3\xe9\x20\x65\x8c\x4e\x9c\x00\xc4\
+\x3f\x3b\x68\xd4\xd3\xf3\x91\x32\x8c\x5e\xe8\x9c\xfc\xb6\x33\x1d\
+\x55\x75\xf6\x65\x62\x5d\x1d\xfb\x32\x46\x46\x42\x57\x67\x92\x9d\
+\x1e\xb5\xc4\xe8\x38\x56\x27\x6c\x99\x38\x01\xd0\x4a\xff\x6a\xc2\
+\x3e\x59\x4d\x08\x20\xf8\x23\x40\xc8\x43\x6e\x1e\x13\xa0\xa3\x2a\
+\xdf\xb8\x58\x5b\x08\x0e\x60\x5f\xfe\xe8\x1c\xb1\x4c\x02\xf0\xa1\
+\xb0\x77\x99\x63\x66\x19\xcb\xa6\x36\x69\x62\x75\xe2\x04\xc0\x18\
+\xc3\x04\x20\xa1\x95\x31\x61\x31\x71\x13\x56\x67\x35\x0f\x08\xc0\
+\xde\x7c\x13\x53\xb1\x86\xe4\x55\x7f\xb1\x7c\x6d\xed\x1d\x6b\x0b\
+\x3e\xd5\x56\xf9\x6c\x93\x2b\x4d\xac\x4e\x94\x00\x8c\x5d\x7f\xff\
+\x33\x44\xc9\xb5\x0e\xf4\x2a\x8e\x00\x00\x10\x00\x49\x44\x41\x54\
+\x52\xb8\x0d\x20\x80\x89\x8a\x09\x3b\xa0\x1a\x4f\x7b\x4a\x00\xb6\
+\xc7\x1c\xf0\x54\xbd\xca\xd4\x02\x53\x5e\xf5\x57\x86\xbf\xf2\x81\
+\xed\x5e\x57\x95\xe3\x59\x28\xc0\xda\x56\xcc\x5e\x78\x7c\xd1\xf3\
+\x44\x09\x80\x5a\x76\xfc\x2f\x2d\x6a\xc9\x03\x8b\x08\xc0\x49\x61\
+\xa2\x2e\x3a\xc1\x03\x41\x11\xc0\x1c\xc0\x5c\x08\x4a\xe9\x02\x95\
+\xad\x6f\x38\x5d\x81\x69\x81\x43\xb0\x6b\x07\x08\x60\x0e\x70\x5d\
+\x25\x34\x54\xc2\x98\x9d\x2c\x01\x50\x0d\x26\x00\x03\xb8\xd3\x49\
+\x0d\x00\x14\xd8\x69\x38\x2b\xbe\x24\x30\x9c\xd1\x71\xcb\x1f\x0c\
+\xf9\x5a\xff\x70\x1c\x7d\x6a\x8d\x75\x65\x5b\x12\x60\x27\xdf\x64\
+\x31\x3b\x59\x02\x60\xd4\xcb\xec\x54\xd2\x0e\xa9\x10\xfc\xe9\xa4\
+\xec\xb0\x85\x6d\x52\xd0\x61\x65\xb3\x08\x9c\x7c\x7d\xc3\xca\x6c\
+\x8d\xd9\xca\x6b\x02\x58\x53\x75\xb9\x2b\xe4\xb5\x92\xc3\x2a\x97\
+\x30\x66\x0f\x4c\x00\xd6\x4d\xee\x3a\x57\x64\x39\x49\x0a\xb7\x2e\
+\x04\x30\x11\x19\xfc\xbb\x80\xe1\xa1\xa3\x04\xe0\xb0\x10\xd0\x8e\
+\x1e\xe0\x83\xbe\x04\xb0\xa6\xc0\xac\x6f\x25\x9e\x0c\x9a\x00\x7c\
+\x2e\xe6\x49\xf5\x10\xac\x95\xe0\xa4\x56\xec\xee\x2b\xe0\xc0\x04\
+\x40\xab\xda\x8b\x15\xff\xba\x12\x80\x53\xc7\x44\xec\x7a\x92\x07\
+\x49\xa0\x83\x00\x02\x1a\x6e\x67\x63\xce\x74\x1c\xe6\xc3\x0e\x02\
+\xbc\xe5\xdf\x01\x83\x0f\x07\x12\x80\xef\xe5\x7a\xea\x8d\x49\x27\
+\x88\xdd\x03\x13\x00\xa5\x15\x13\x00\xb5\xf8\x0f\x13\x0f\x4e\x7d\
+\xf1\x19\x1e\x21\x81\xde\x04\x30\x67\x30\x77\x7a\xd7\x08\xf3\x0c\
+\x98\xd4\x79\xcb\x3f\x4c\xe3\x0f\xa1\x75\xd5\xeb\x69\x08\xd1\x8b\
+\x6f\x9a\x20\x76\xf7\x4d\x00\xce\xdf\xf2\xd5\xa5\xca\xa8\xf3\x15\
+\xff\xe6\x11\x80\xb3\xc2\xc4\x9b\x77\x90\x4f\x48\x20\x21\x01\xcc\
+\x1d\xcc\xa1\x84\xd5\xbd\xaf\x56\x97\xd7\x73\xc1\xc4\x7b\x45\xa9\
+\x60\x21\x04\x30\x77\xb8\x9e\xba\xa0\x95\xd8\x1d\xc7\xf0\x2e\xa7\
+\xda\x87\xfa\x26\x00\x8f\x9f\x7c\xea\x79\x52\x71\xa9\x14\x6e\x2d\
+\x02\x98\x68\x98\x70\xad\xa7\xdc\x91\x40\x26\x02\x98\x43\x08\x7c\
+\xb8\xed\x9d\xa9\x03\x0f\x1a\x41\xf7\x26\x03\xfe\xc0\xa8\x07\xe6\
+\xac\x54\x05\xac\x27\xf8\xe6\x72\x85\xb0\x7e\xb4\xa5\xad\x18\xde\
+\x53\xd0\xbe\x09\xc0\x12\xa3\xd6\xf7\x6c\x19\xe0\x09\x4c\x30\x4c\
+\xb4\x00\x55\xa7\xca\x05\x10\xc0\x6b\x98\x75\xb9\xed\x8d\x79\x55\
+\x40\xf7\x56\x77\xd9\x0c\xfe\x2b\x15\x18\x58\x2d\x28\x85\x73\x86\
+\x00\x7c\x73\x88\x6b\xa9\x9f\x81\x06\xc5\xf0\xbe\x09\x80\xd1\x4c\
+\x00\xda\x70\x31\xb1\x30\xc1\xda\xcf\xb9\x27\x81\xbc\x08\x60\x5e\
+\x61\x7e\xe5\xd5\x9f\xed\xfd\x40\x57\x24\x3e\xb6\xcb\x49\xf9\xdc\
+\x23\x80\xb5\x84\xe4\xb2\x0c\xc9\x5d\x18\x63\x50\x0c\xef\x9d\x00\
+\x18\x69\xaa\xd4\xb8\x0b\x4a\x96\x21\x23\x26\x56\x19\xe3\x70\x8c\
+\x30\x09\x60\x7e\x21\x30\xfa\xae\x3d\x74\x84\xae\xbe\xeb\x49\xfd\
+\xaa\x23\xc0\xe4\x72\x1e\xfb\x71\xd5\x8c\xe5\xf3\x0e\xb6\x9f\xf4\
+\x4c\x00\xc6\x6e\x98\x1d\x93\x4a\xc7\x49\x09\x7e\x83\xd3\x0a\x1e\
+\x02\x01\x14\x4e\x00\x81\xd1\xe7\xb9\x56\xe7\x9b\xfd\x0a\x9f\x43\
+\x1c\xa0\x49\x00\x73\xad\xf9\xa8\xa8\xff\xce\xf4\x7b\x5c\x2b\x96\
+\x77\x15\xb8\x67\x02\xa0\x8c\xc6\x17\x00\x75\x6d\x14\xd2\x41\x38\
+\x64\x38\xe6\x90\x74\xa6\xae\xd5\x11\xc0\x5c\xc3\xf7\x05\xf8\x74\
+\x1b\x13\xba\xc0\x21\xf3\xf5\xfe\xea\xe6\x55\x68\x23\x63\xae\xc1\
+\x77\x87\xa6\x77\x57\x7d\xfb\xc4\xf2\xde\x09\x80\x32\xc1\x27\x00\
+\x98\x40\x70\xc8\x5d\xa1\xf2\x20\x09\x14\x48\xa0\xbe\x01\x6f\x90\
+\x3b\xb1\xc0\x11\xca\xeb\x1a\xce\x18\xa5\xbc\x11\x39\x12\x09\xa8\
+\xf8\x07\xa4\x90\x7c\x16\xc1\xc2\xad\x3e\x7b\xc7\xf2\xde\x09\x80\
+\x56\xbf\xe0\x96\x92\xf9\x4b\xcb\xe0\x9f\x3f\x53\xf6\x98\x9c\x00\
+\x92\x00\x24\xa1\xc9\x5b\xd8\x59\xf3\xe3\xff\xf0\xa8\x8a\xf6\x1d\
+\xb2\x53\x38\x4a\xe5\x35\x01\xfa\x70\x31\x6f\x9f\x58\xde\x35\x01\
+\x38\x77\xdb\xb7\xce\x50\x46\x3d\x5d\x9a\x06\xbb\xf9\xe0\x78\x83\
+\x35\x9e\x47\x8a\xc3\x81\xf9\x30\x17\x37\xdd\xfe\x10\x93\x00\x8f\
+\xe6\xa5\x2b\xaa\xe0\xce\x53\x7d\xc3\xe9\x39\x8b\xeb\x58\x77\x12\
+\xcb\xe3\x98\xde\x45\xec\xae\x09\xc0\x12\xb5\xec\x85\x5d\xea\x06\
+\x73\x08\x0e\x17\x8e\x37\x18\x85\x13\x2a\x8a\xab\xb8\x76\xd9\x74\
+\xfb\x5e\xd5\xad\x8c\x6f\x9b\x3d\x7a\xfc\xe3\x5f\x7f\x54\x75\x16\
+\xb4\x4d\x38\x14\xab\x75\x10\xc0\x5c\xc4\x9c\xec\x38\xe4\xe4\x43\
+\x24\x01\x4e\x0a\x5e\xa2\xd0\x58\x23\x28\xed\x75\xd3\xb9\xc6\xb0\
+\xb6\x50\x3a\x8f\xe1\x71\xbb\x2e\xda\x95\x28\xaa\x33\x43\x21\x09\
+\xf0\x61\xfd\x0c\x03\xbc\x57\x4c\xef\x9a\x00\x18\x65\xc2\x4e\x00\
+\x5e\xc8\x1f\x3f\xc4\x64\x83\x43\x81\x83\x41\x69\x3a\x9e\x87\x24\
+\xb8\x37\x4b\xb4\xef\xa0\x5c\xd1\x2d\x2e\xcd\x76\xcd\xe3\xb8\xf5\
+\xdb\x59\x10\x00\xd0\x0f\x1d\x16\x28\xa5\x2b\xfe\x24\x01\x7b\xd3\
+\x29\xee\x79\xed\x48\x5e\x1a\x41\x59\xb8\xc6\xda\xeb\x26\xea\x58\
+\x67\x6d\x14\x9d\xc7\xf0\xb8\x5d\xb7\xbd\xbe\xb0\xc6\xd0\x5f\x7b\
+\x9d\xb5\xdb\x85\xbc\xc7\xfa\xc9\xeb\xfd\x00\x2e\x72\xec\x15\xd3\
+\xbb\x26\x00\xa2\xe0\x0b\xa4\x04\xb9\x85\x9c\x29\x46\xe2\x8c\xe0\
+\x34\xe0\x3c\x9a\x4e\x04\xb7\x6d\x9b\xc1\x3c\xcf\xc9\xb0\xd0\x61\
+\x61\x4c\x94\x3c\xc7\xf0\xb1\x2f\x38\x31\xd7\xe7\x67\x24\x01\x0d\
+\xf3\xcb\x47\xfb\x24\xd5\x29\x92\x75\x06\x06\xed\x35\x86\xc0\x1d\
+\x09\x97\xa4\xed\x93\xd4\x43\x7f\xed\x75\xd6\x1c\x67\x6f\x7c\x37\
+\x2e\x49\x5b\x5f\xeb\x60\xfd\xf8\xaa\x5b\x02\xbd\xba\xc6\xf4\xee\
+\x09\x80\x31\x6b\x13\x74\xe8\x5d\x15\x38\xd7\x10\x27\x49\xd4\x72\
+\x48\x70\x44\x70\x1a\x51\xce\xce\x68\xd0\x44\xc1\x98\x28\x70\x54\
+\x48\x04\x22\x91\x67\x50\x9b\x50\xcf\x63\x7e\xba\xfe\x9a\x66\x24\
+\xf3\x0b\x76\x0e\xc9\x86\x91\xcc\xe9\xce\xa0\x1f\x09\x83\x32\xf5\
+\xc7\x78\xed\x35\x06\x39\x42\xe3\x0f\xd6\x78\x29\x60\xf8\xbb\x00\
+\xe8\xc9\xc1\xd2\x23\xa6\x2f\x4a\x00\xce\xad\xef\x3a\x5b\x29\xed\
+\xc7\xe7\x8f\x54\xba\x3f\x38\xd7\x74\x2d\xdc\xad\x1d\x55\xec\x90\
+\x7a\x91\x83\x93\x42\x22\xd2\x4e\x06\x7a\xd5\x0b\xf9\x38\x1c\x99\
+\xeb\x49\x00\xec\x1c\x42\x10\x6a\xaf\x33\xcc\xe9\xa8\xe4\xa0\xdf\
+\x6b\x8d\x40\x0e\xf0\x6f\xaf\xb1\x10\xec\xd0\x66\x11\x92\x8f\x6f\
+\xeb\xdc\xdc\xeb\x13\x9b\xb1\xbd\xf9\xac\xfd\x7f\x51\x02\xb0\x44\
+\xd7\xfe\xbf\xf6\xc9\x90\xf6\xb8\xfa\x0f\x41\xdf\xa8\x15\xf8\x6d\
+\x72\x48\xbd\xb8\x77\x3a\xa9\x5e\x75\x42\x3d\xce\x24\xc0\x5e\xcb\
+\xb7\xd7\x18\x02\xac\xed\xeb\x0c\x6b\x2c\x2e\xad\x37\xec\xda\x4b\
+\x35\x1f\xc9\xb0\x6e\x86\xf1\xf5\xf9\x48\x51\x4d\x2f\xdd\x62\x7b\
+\xad\x8b\x28\xc1\x25\x00\xb8\x2d\xe4\x7b\x66\xd8\x76\x4a\xb6\x3b\
+\xa4\x2e\xf3\x51\xc1\x41\xc1\x99\x86\x74\xa5\xd2\x8d\xc3\xc2\x63\
+\x70\x66\xae\x7f\x6b\x20\x6c\x8b\xb9\xb9\x50\x37\x57\x9f\xe3\xf6\
+\xba\xab\x6b\x0c\xb6\xc0\x1a\x43\x71\x95\x7f\x12\xb9\xe1\xeb\xe1\
+\xf3\x93\xd4\xf5\xac\xce\xa2\xd8\xde\x2d\x01\x78\x9e\x67\x4a\x0f\
+\x54\x07\x8e\x74\x60\x25\x47\x2b\xc0\xb9\xba\xea\x94\x16\x22\x87\
+\x83\x62\x22\xb0\x90\x8a\x52\x75\xc7\xbf\x35\xb0\x19\x30\xdd\xfe\
+\xa2\x20\x04\x4d\xcc\xcd\xc8\x92\xdb\xfc\x8b\x67\x49\xb2\x23\x58\
+\x63\x71\x91\x3b\x02\xc9\x5a\xb8\x59\x0b\x49\x40\x7a\xc9\x9d\x6f\
+\xb1\x28\xb6\x2f\x4a\x00\x8c\x52\xcf\x75\x5e\xcd\x14\x0a\xe0\x76\
+\x90\xaf\x93\x01\x4e\xa9\xe9\x5c\x0f\xa6\x20\x62\x7f\x55\x38\x28\
+\x38\x5b\xe8\x67\xbf\xb4\xe5\x48\xe8\x7a\x12\xe0\xaa\x2d\x21\x77\
+\x3c\x17\xff\xe1\xd1\x72\x0c\x5d\xd2\x28\xbe\xaf\x31\x5c\xf4\x85\
+\x76\x17\xa0\x5b\x6c\x9f\x97\x00\x9c\xb3\x75\xcf\x4a\x99\x5f\x2b\
+\xa4\x04\xb3\xf9\x18\xfc\xa3\xd6\xeb\xfc\x58\xc4\x3e\x1b\x12\xfa\
+\xc5\xce\xd7\xf3\xab\x95\xa4\x36\x74\x39\x09\x88\xe4\xca\x19\x77\
+\xaa\x92\xea\x5a\x75\x3d\x5f\x03\xff\x42\xae\x58\x63\xb0\x4b\x24\
+\x3e\x65\xe1\x39\xd7\x9f\xa7\xf5\xfd\xae\xeb\x2b\xf2\xaf\x68\xc5\
+\x78\x79\xd8\xdc\xe6\x25\x00\xcb\x96\xcc\x9d\xd5\x3c\x1c\xc6\x7f\
+\x5c\xfd\xfb\xa6\x29\x1c\xd3\xa6\xf8\x6b\x57\xfd\xba\xea\xef\x67\
+\xa7\xb6\x93\x82\xee\xfd\xea\x85\x70\xce\xf5\x24\xc0\x76\x1b\x22\
+\x10\x22\x20\x62\xce\x85\x30\x9f\xa0\x63\x14\x27\x67\x0f\x29\xdb\
+\x6d\x03\x59\xd3\x94\x10\xef\x02\x2c\x8c\xf1\xf3\x12\x80\x86\xd1\
+\x67\xa6\x01\xe8\x7a\x5d\xdf\x32\x40\x2c\xd0\x90\x1c\x53\xe7\xfc\
+\x83\x93\x82\xee\x60\xd0\x79\x3c\xc4\xc7\x2e\x27\x01\xb0\x61\x64\
+\xe9\xd5\x26\xe6\x56\x68\xc9\x75\xe7\xfa\x81\x6d\xc0\xa0\xf3\x98\
+\xeb\x8f\x93\xc7\x00\xd7\x35\x6d\xca\xbf\x30\xc6\xcf\x4b\x00\xb4\
+\x56\xc1\x24\x00\x3e\x5d\xfd\xc3\x61\x86\x76\x55\xd2\x9c\xce\x8b\
+\xff\xc3\x49\xf1\x65\x01\xb7\xdf\x18\xd8\x0c\xb2\xf6\xbc\x29\x10\
+\xeb\x2b\x9e\x53\x9e\xbd\xce\xbf\x78\xf5\x0c\x3e\x82\xf5\x05\x5f\
+\x33\xb8\xa6\x1b\x35\x42\xbb\x0b\xb0\x30\xc6\xcf\x4f\x00\x8c\x5a\
+\xe3\x86\xd9\x86\x97\xf2\xf9\xa7\xfa\xf1\x5d\x47\x70\x4e\x4d\x87\
+\x19\xce\x2d\xff\x24\xd6\x87\xa3\xf2\xed\x6a\x25\x89\xde\x9d\x75\
+\x9c\xbe\x13\x60\xc1\xfb\x3a\x9a\x6b\x0b\x3f\x7a\xf5\x50\x27\xd6\
+\xe0\x1f\x47\xf2\x92\x00\x12\xa2\xc8\xd2\x3b\x35\x69\x0d\x94\xe4\
+\x2e\x40\xda\x3e\x6d\xad\xaf\x17\xc4\xf8\x79\x09\x80\x51\x6a\xb5\
+\xad\x82\xe7\x29\x17\xae\xfe\x91\xf9\xe5\xd9\x67\x15\x7d\x61\x01\
+\x22\xf8\x57\x31\xb6\x0b\x63\x22\x09\x80\xa3\x0a\x39\x11\x70\x35\
+\x09\x88\x24\xc8\x54\x79\xa5\x19\x49\x70\xc3\xda\x8a\x44\x0e\x17\
+\xe6\x7a\x15\x32\x36\xf9\xd8\x73\xa7\x26\x2b\x03\xc4\x82\x50\x3e\
+\x11\xb0\x30\xc6\x1f\x4d\x00\xce\xdf\x76\xff\xd3\x04\xe0\x53\xa5\
+\x70\x73\x80\x00\x82\x1a\x16\xa0\x03\xa2\x56\x2e\x22\x12\x01\xf0\
+\xaa\x5c\x90\x8a\x04\x70\x39\x09\xa8\xc2\x6e\x48\x3c\xb8\xb6\x92\
+\x4d\x56\x70\xaa\xc2\x46\xc9\xa4\x4b\x5e\xab\xff\x5d\x80\xe4\xfd\
+\x38\x50\xf3\xa9\xad\x58\x1f\x8b\x7a\x34\x01\x78\xc2\xd4\x46\xe2\
+\x23\x9e\xff\xc3\xd5\xbf\xeb\xc6\xc6\x82\x43\x50\xf3\xdc\x54\xb9\
+\xaa\x07\x5e\x21\xdf\x0d\x70\x35\x09\x80\xdd\x30\xdf\x73\x9d\x0c\
+\x3d\x3a\x8b\xe4\xaa\x1f\x73\x24\xe2\x55\x7f\x0f\x42\xdd\x0f\xc3\
+\x46\x91\xb0\xeb\x7e\xd6\x8d\xa3\x21\xdd\x05\xe8\x8c\xf5\x47\x13\
+\x80\x9a\x5a\x76\x86\xe2\x9f\xf5\x04\xb0\xd0\xb0\xe0\xac\x17\xd4\
+\x52\x01\xc1\xae\xac\x80\x62\x1b\x02\x57\x13\x5f\xd8\x0c\xf3\xbe\
+\x48\x9e\x98\x13\xb8\x9a\x2d\x72\x0c\x9f\xfb\x06\xbb\xa2\x6d\x54\
+\x34\xbf\x5e\xeb\xa3\xe8\x71\xcb\xee\xbf\xd6\x11\xeb\x8f\x26\x00\
+\x46\x35\x82\x48\x00\x5c\x36\x32\x16\x18\x16\x9a\xe2\xdf\x50\x04\
+\x10\x50\x70\x9b\x17\x3c\x87\xea\xc8\xb1\xc6\xb8\xca\xa9\x6f\x38\
+\xdd\x31\xa9\x9b\xe2\x22\x40\x37\x1f\xe5\xfb\x1f\x73\x00\x73\x01\
+\x73\x22\xdf\x9e\xc3\xeb\x0d\xbe\x09\x3c\x5d\xd5\x1c\xeb\xc3\x55\
+\xd9\xd3\xc8\xdd\x19\xeb\x8f\x26\x00\xd2\xc1\xb3\xa5\x78\xbd\xe1\
+\xf6\xbf\xcb\x0a\x62\x81\xb9\x2c\xbf\x4d\xb2\x47\x72\x9b\x17\x3c\
+\x8b\x0a\x2c\x36\xe9\xda\x29\x0b\x9c\x9c\x8b\x49\x40\xd3\x5e\x7b\
+\x3b\x55\x19\xfa\x71\x24\xb7\xad\x31\x07\x22\x99\x0b\x43\x77\xc6\
+\x0e\x62\x02\xae\xaf\xa7\xc5\x6f\x06\x8c\xd5\xf2\xed\xdf\xd1\x58\
+\xdf\x99\x00\xfc\xbc\x6f\x5a\x2e\xd4\xc7\xe5\x8f\xfe\xb9\xbe\xb0\
+\x16\xda\xc2\x96\xe7\xb8\xf2\x0b\x8d\xad\xcb\x49\x40\x5e\xb6\x42\
+\x3f\x08\xfe\xb6\xcc\x43\x5f\xe4\x40\x32\x85\x3b\x2a\xae\xea\xe3\
+\xf2\x1d\xe2\x14\xcc\x8f\xc6\xfa\xce\x04\xe0\x59\x29\x3a\x70\xb2\
+\x2a\x1c\x9f\x8b\x82\xc3\x59\x21\x50\xb9\x28\xbb\x0b\x32\x83\x2d\
+\x9c\x56\x24\x57\x84\x2e\xc8\x9b\x87\x8c\x58\x0b\x2e\xde\x11\x83\
+\xad\x86\xb5\x13\x6c\x8d\x7e\xf2\xe0\xc8\x3e\x16\x13\x88\xe4\x8e\
+\x0a\x7c\xd6\xe2\x33\xf6\x1f\xc1\xba\xe8\xbc\x0b\x60\xbf\xc4\x99\
+\x24\x3c\x1a\xeb\xe3\x04\x60\xed\x8d\xdf\x7e\x8a\x74\x73\x92\x14\
+\x6f\x37\x17\x9d\x1d\x8c\x81\x85\x44\x67\x05\x12\xc5\x16\x38\x2d\
+\x5c\x11\x82\x77\xb1\x23\xd9\xd3\x3b\xae\x76\x5c\x5c\x17\xb0\x53\
+\x94\x21\x59\x43\x1b\xbe\xcb\xbf\x9c\xf9\x07\x9f\x05\xde\xe5\x8c\
+\xc6\x51\x52\x12\x38\xa9\x15\xf3\x55\x9c\x00\x9c\x38\x77\xf8\xe7\
+\x52\x76\xe0\x5c\x75\x38\x3b\xe7\x84\x16\x81\xb1\x90\x64\xc7\xad\
+\x24\x02\xe0\xcd\x24\xa0\x24\xd8\x43\x0c\x93\xd6\x46\xa8\x8f\xc4\
+\x61\x88\x21\xd9\x34\x25\x01\x57\x79\x1f\x8b\x15\x29\x15\x76\xa8\
+\x7a\x3b\xe6\xc7\x09\xc0\x9c\xaa\xb9\xf9\xd6\xe0\x84\xc0\x5d\xbc\
+\xca\x81\x6a\x70\x5a\xd8\xb3\x94\x4b\x80\x49\x40\xb9\xbc\xb3\x8c\
+\x16\xc9\x6d\xe6\x4d\xb7\x27\x7b\x53\x20\xd6\x11\x6c\x9a\x65\x1c\
+\xb6\x19\x8e\x40\x52\x1b\x0d\x37\x4a\xbe\xad\x43\x78\x19\xa0\x1d\
+\xf3\xe3\x04\x40\x2b\xe5\x75\x02\x90\xef\xf4\x28\xa7\x37\x3a\xad\
+\x72\x38\xf7\x1a\x05\x01\xc3\x45\xe7\xd5\x4b\x9f\x41\xc7\x71\xd5\
+\xe3\x5a\xa2\x8c\x24\x00\xeb\xa4\x9f\x6e\xb0\x21\x6c\xd9\xaf\x0e\
+\xcf\x15\x47\x00\x36\x8a\x32\xbc\x5c\x53\x9c\x44\xc9\x7b\xf6\xb9\
+\x66\x3b\xe6\x37\x13\x00\xa3\x56\xfa\xac\x2c\x9c\x9b\x6b\xfa\xd1\
+\x69\x55\x6f\xb1\x48\xae\x32\x9b\xaf\x19\xbb\xff\x7d\xe7\x49\x68\
+\x62\x9d\xb8\xf6\x06\x28\xac\x93\x6e\x49\x40\x24\x41\x07\xc1\x3f\
+\x12\x1b\x26\xd1\x9d\x75\x8a\x23\xd0\xcd\x3e\xc5\x8d\x96\x4f\xcf\
+\x58\x0b\xf9\xf4\x64\x67\x2f\xba\x15\xf3\xe3\x04\xc0\x18\x73\x9a\
+\x9d\x62\x86\x29\x95\x8b\x0b\xc6\x67\x4b\x6d\xba\xfd\x21\x15\x8a\
+\x4d\xea\x1b\x56\x2a\xd7\x93\x80\x28\x0e\xfe\x0f\xa9\x88\xc1\xdf\
+\x8a\x65\x09\x3b\xb8\xb6\x7e\x9e\x7f\xda\x72\xe7\xd6\x41\x1a\x63\
+\xb7\x63\x7e\x9c\x00\x28\x63\x4e\x4d\xd3\xd8\xa5\xba\xae\xdd\xd6\
+\x04\x5b\x5c\xd5\x60\xcf\x62\x0f\x01\xd8\xc4\x35\x27\x96\x95\x9e\
+\x8b\x57\x3f\xb0\x4f\x24\x81\x1f\x36\x42\xc2\x96\x55\x77\xb6\x2b\
+\x86\x40\xdb\x3e\xc5\xf4\xce\x5e\x53\x13\x68\xc5\xfc\x38\x01\xd0\
+\x5a\x3f\x3d\x75\x07\x6c\x50\x08\x01\x38\xb0\x42\x3a\x66\xa7\x43\
+\x13\x80\x13\x0b\xc1\x3e\x78\x13\x54\xdd\xc1\xaf\x0c\x46\xe0\x87\
+\x8d\x86\x36\x34\x3b\x28\x84\x40\xf4\xf0\xc1\x42\xfa\x2d\xa2\x53\
+\xf4\xe9\x62\x22\x0c\xb9\x93\x94\x76\xcc\x8f\x13\x00\xa3\xd4\xd3\
+\x92\x34\x72\xb1\x8e\x6b\x46\xa4\x03\xb3\x7b\x96\xc1\x3e\xa1\x24\
+\x01\x2e\xde\x3d\xb3\x7b\xf6\x84\x2d\x1d\xd6\x4e\xd8\x04\xec\xd1\
+\xbe\x1d\xf3\x6b\x17\xde\x62\x96\x88\x58\x2b\xa4\x78\xb7\x39\xf7\
+\x5a\xe6\xd7\x1f\xf5\xce\x06\x3e\x2a\x04\x47\x86\x37\x98\xf9\xa8\
+\x5b\xa7\x4e\x48\x9e\x99\x04\x74\x12\xe1\xe3\x61\x09\xb8\x91\x3c\
+\x37\xb5\xc4\x9d\x30\xd7\x62\x48\x53\xf2\x44\xff\x57\x20\xf6\xd7\
+\x7e\xb0\x6f\xd7\x29\x89\xaa\x3b\x58\x09\x06\x74\x49\x6c\x04\x16\
+\x97\xe4\x0d\x59\xd6\x68\xdf\x41\xc5\x24\x20\xe4\x19\x40\xdd\xb3\
+\x10\xa0\x8f\xcb\x42\xad\x98\x36\x88\xfd\x35\x75\x7c\xcd\xcb\xab\
+\xff\x62\x90\x15\xd7\xab\x4b\x99\x71\x71\x14\xdc\xea\xb9\x9d\x04\
+\x44\xfb\xfc\xfe\x98\x20\xee\x04\x78\x7c\x25\xe4\xd6\xa4\xf3\x40\
+\x5a\xdb\xd7\x4b\x27\x62\xcc\xfd\xce\xe7\x5e\x3d\x96\xd8\x5f\x9b\
+\x9b\x53\x27\x7b\xa5\x54\x87\x32\x2e\x19\xcf\xa5\x45\xd1\x81\x38\
+\xf8\x87\x51\x7c\x27\x00\x1f\x39\x3b\xe4\x35\x8b\xfa\x86\x95\x5e\
+\xeb\x47\xe5\xca\x23\xc0\x8b\x9d\xf2\x58\xf7\x1b\x09\xb1\xbf\xb6\
+\xa4\xb6\xe4\xa9\xfd\x2a\xf1\x5c\xf1\x04\x22\xb9\x82\x8c\x24\x90\
+\x14\x3f\x12\x47\x28\x8a\xc0\xa6\xdb\x43\x48\x02\xf8\x85\xa1\x45\
+\xcd\x9f\x90\xfa\x85\xaf\x8b\xc4\xe7\xd9\xa9\xf3\x7c\xa9\x5c\x7b\
+\x19\x79\xbe\xf4\xfd\x9f\x21\xf6\xd7\x8c\x69\x78\x99\x00\xb8\x74\
+\xcb\xd2\xb5\x8f\xc7\xf4\x9f\x56\xe1\x9e\xf5\x3d\x09\x80\x33\xe4\
+\x9b\x02\xc3\x9d\xdf\x79\x6a\xee\xd2\x5d\x00\x97\x62\x49\x1a\x1b\
+\x21\xf6\xd7\x94\xaa\xfd\x4c\x9a\x46\xae\xd4\x85\xb3\x72\x45\x56\
+\xbe\x31\xc6\x15\x4b\x0d\x96\x13\x49\x80\x4b\xce\x6d\xb0\x46\xf3\
+\x6b\xe0\x65\x35\x26\x01\xf3\x99\xf0\x99\x3f\x04\xba\x69\xe2\x52\
+\x2c\xe9\x26\x7f\xef\x63\xb5\x9f\xc1\x1d\x80\x9f\xee\x5d\x81\x67\
+\x8a\x26\xe0\xca\xad\xb0\xa2\x39\xf8\xd4\x3f\x12\x3a\xdf\x93\x00\
+\x5f\xaf\x8a\x7c\x9a\x87\x36\xeb\x12\xc9\x4b\x9e\x91\x2b\x2f\x03\
+\x9c\x7a\xa2\xcd\x28\x33\xcb\x26\x77\x00\x7e\xba\xa6\xb5\x7e\x4a\
+\xe6\x1e\x2c\x6e\xf8\x7c\x47\x8c\xc6\xdb\xff\x16\x4f\xa2\x21\x44\
+\xf3\x3d\x09\xe0\x9b\x02\x87\x98\x1c\x6c\x6a\x29\x81\xb0\xc4\x42\
+\xec\xaf\x19\xa5\x9e\xec\xa3\xda\xae\xdc\xb6\x71\x25\x0b\xf6\x71\
+\x8e\x14\xad\x93\xff\x49\x00\xdf\x14\x58\xf4\x1c\xf2\xb9\x7f\x9f\
+\xef\x92\xb9\x60\x37\xc4\xfe\x9a\x08\xfa\x24\x29\xdc\x2a\x22\x10\
+\xc9\xad\xb0\x8a\x86\xe6\xb0\x25\x10\xf0\x39\x09\x40\x92\xcd\xf7\
+\x03\x94\x30\x89\x3c\x1d\xc2\x36\xdf\xd7\x0b\x33\xe6\x79\xaf\x73\
+\x8e\x1f\x7f\x92\x24\x00\xe6\xdf\x39\xae\xc4\x22\xf1\x5d\x79\x7d\
+\x32\x72\xe4\x35\xb0\x45\x80\x79\x20\x15\x01\x9f\x93\x00\xbc\x29\
+\xd0\x95\xf5\x96\xca\x68\xac\x5c\x0a\x01\x57\x7c\xa0\x9f\x73\xdc\
+\xfc\x3b\x49\x00\xd4\x4f\x95\x62\xe9\x12\x07\x71\x25\x63\xe3\xeb\
+\xff\x25\x4e\x8a\x8a\x87\xf2\x39\x09\xc0\xfb\x01\xfc\x74\x90\x15\
+\x4f\x9a\x00\x86\xb7\xc7\x07\x06\x00\x7b\xb1\x8a\x3f\x55\xd3\x4a\
+\xf9\xf9\x16\xc7\xc5\xca\xf2\x08\x09\x54\x4a\x00\x49\x80\x2b\x57\
+\x3c\x69\x41\xe1\x4e\x40\xda\x36\xac\x4f\x02\xbe\xae\x07\x17\x2c\
+\x8b\xd8\x8f\x37\x01\x2e\x77\x41\x58\x1f\x65\xe4\xe4\xf7\xd1\xaa\
+\xfd\x75\xc2\xf7\x04\xf8\x68\x77\xdc\x75\xab\x6f\xe0\x9b\x02\xfb\
+\x5b\x9f\x67\x6d\x25\x30\x48\x2e\xcc\xef\x41\x75\x5c\x3b\x6f\x94\
+\x5a\x8e\x3b\x00\x27\xb8\x26\xb8\x2f\xf2\x46\x7c\x03\xa0\x2f\xa6\
+\x4c\xa5\x87\xcf\x49\x00\xdf\x14\x98\x6a\x2a\x04\x5f\x99\x3e\xb0\
+\xba\x29\x20\x77\x00\x4e\xc0\x1d\x80\xe3\xab\x13\x81\x23\x93\x40\
+\x98\x04\x7c\x4d\x02\xf0\x52\x00\x93\x80\x30\xe7\xb4\xbb\x5a\x0f\
+\x96\xdc\x95\xef\x95\x19\xac\xc9\xb1\x1a\x72\x07\xe0\x78\xbc\x09\
+\xf0\xb8\x63\x87\xfc\x78\xe4\x82\xb1\x22\x7e\x02\xc0\x8f\xc9\x36\
+\x84\x16\x3e\x27\x01\x7c\x53\xe0\x10\x13\x23\xb0\xa6\xf4\x85\x95\
+\x19\xfc\x38\x49\x00\xcc\xb2\xca\x86\xe7\xc0\x24\x10\x38\x01\x24\
+\x01\x3e\x22\xa8\xf3\xe7\x83\x7d\x34\xab\x97\x3a\x85\xab\x94\x59\
+\x26\x09\x80\x5e\x1a\x2e\x00\x6a\x4e\x02\xd5\x13\xd8\x74\xfb\xde\
+\xea\x85\x28\x40\x82\x3a\xdf\x14\x58\x00\x55\x76\x49\x02\x79\x11\
+\xd0\x4b\x25\x01\x50\x4b\xf2\xea\x8e\xfd\x24\x27\xc0\xcf\xbf\x26\
+\x67\xe5\x7b\xcd\x68\xdf\x41\xe5\x63\x12\x80\x77\x4e\x33\x09\xf0\
+\x7d\xf6\xba\xae\x5f\xd0\xf2\x2f\x41\x02\x80\xe2\x15\x05\x38\x1e\
+\xaf\x14\xa2\x32\xde\x13\xf0\x39\x09\xe0\x9b\x02\xbd\x9f\xbe\x43\
+\x29\xc8\x8b\xa1\xa1\xf0\x0d\xd3\xb8\x86\xe0\xaf\x87\xe9\x81\x6d\
+\x49\x80\x04\xf2\x21\x80\x24\xc0\xc7\x1f\x48\xe1\x27\x03\xf2\x99\
+\x1f\xec\x25\x7f\x02\x49\x7b\xf4\xf4\xa2\x52\x23\x01\x48\xca\x80\
+\x6e\x55\x62\x49\x00\x00\x10\x00\x49\x44\x41\x54\xf5\x48\x80\x04\
+\x0a\x26\x80\x6f\x0b\x64\x12\x50\x30\x64\x76\x4f\x02\x24\x10\x13\
+\x40\x02\x60\xe2\x47\xfc\x47\x02\x24\x60\x05\x01\x9f\x93\x00\x7e\
+\x3c\xd0\x8a\x29\x46\x21\x62\x02\xc9\xff\x45\x7e\x7e\x6c\xdb\x20\
+\x01\x68\x24\xc7\xe0\x46\x4d\x17\x8c\xe5\xc2\x77\x15\xb8\x61\x6d\
+\x3f\xa5\x44\x12\xe0\xc2\x3c\x4e\x4b\xbf\xbe\x61\xa5\x62\x12\x90\
+\x96\x1a\xeb\x93\x40\x21\x04\x1a\x48\x00\xe6\x0a\xe9\x9a\x9d\x92\
+\x00\x09\x0c\x45\x00\xdf\x11\xc0\x24\x60\x28\x84\x6c\xec\x00\x81\
+\xaa\x2e\x86\x1c\x40\x53\xb4\x88\x73\x92\x00\x98\x23\x45\x8f\xc2\
+\xfe\x49\x80\x04\xb2\x11\x40\x12\x90\xad\xa5\xdd\xad\x78\x27\xc0\
+\x6e\xfb\x50\xba\x10\x08\x98\x23\x92\x00\xe8\xc3\x21\xa8\x4a\x1d\
+\x49\xc0\x55\x02\x3e\x7e\x47\x00\x6c\x81\x4f\x07\x60\xcf\x42\x02\
+\xe5\x13\xe0\x88\x4a\xe9\xc3\x92\x00\xa8\x27\x14\xff\x4a\x27\xe0\
+\xe9\xc7\x4a\x4a\xe7\x18\xc2\x80\xd1\xbe\x83\xca\xc7\x4f\x06\x60\
+\x0d\xd4\xf9\x6d\x81\x21\x4c\xe1\xbe\x3a\x62\x1e\xf4\xad\x60\xc1\
+\x49\x4f\xbf\xab\xe0\x09\xfc\x1c\xf0\xe3\x16\xf0\xcd\x55\x04\x4f\
+\x8d\x95\x2b\x23\x76\xe6\x16\x01\xbc\x29\x90\x49\x80\x5b\x36\xa3\
+\xb4\xf6\x12\xa0\x64\x4a\x69\xa5\x1e\xaf\x19\xa5\x1e\x53\xfc\xab\
+\x84\x00\xdf\x0d\x5d\x09\x76\x67\x07\x65\x12\xe0\xac\xe9\x28\x78\
+\x0f\x02\xf4\x81\x3d\xc0\x94\x70\x18\xb1\x1f\x77\x00\x0e\x95\x30\
+\x16\x87\x20\x01\x12\xc8\x81\x00\x92\x80\xc8\xc3\xcf\x24\xe3\x36\
+\x30\x5f\x0e\xc8\x61\x82\x38\xd6\x05\xec\x5e\xbe\xc8\x1c\x11\x04\
+\xe4\x0e\xc0\x21\xdc\x01\x38\x88\x27\x3e\x15\x57\x1c\x24\x27\xbf\
+\x4f\xb3\xae\x3c\x5d\x7c\x7c\x29\x00\xf4\xb0\x1e\xf8\xbb\x01\x20\
+\xc1\x62\x1b\x01\x57\x62\x4a\x1a\x6e\x72\x07\xe0\x20\xde\x04\xf8\
+\x6f\x69\x1a\xb1\x6e\x7e\x04\xf8\xf9\xd7\xfc\x58\x86\xd4\x53\xb4\
+\xcf\xcf\x5f\x0f\x84\x0d\xf1\xc9\x00\x26\x01\x20\x11\x46\xa9\xc2\
+\x07\x66\x21\x8b\x35\x97\xa5\x9d\xe5\x6d\xfe\x4d\x12\x00\xfd\x7f\
+\x2d\x17\x32\xb5\x78\xae\x18\x0b\x57\x3c\xa9\x95\x63\x03\x12\x10\
+\x02\x98\xe3\xbe\xde\x09\x60\x12\x20\x06\x0e\x64\xa3\x0f\xac\xd2\
+\xd0\xfa\xff\x4a\x02\xa0\x7e\x52\xa5\x08\xa1\x8f\xcd\x37\xc1\x84\
+\x3e\x03\xb2\xeb\xef\xeb\xfb\x01\x40\x84\x49\x00\x28\xf8\x5d\xaa\
+\xb9\xd3\xe3\x37\xd3\x94\xda\xfd\x04\x6f\x02\xfc\x71\xca\x46\x4e\
+\x54\x8f\x1c\x79\xa3\x14\x1c\x9d\x13\x40\x29\xa4\x95\x04\x7c\xfd\
+\xa6\x40\xc0\xc6\xda\x60\x90\x00\x09\x96\x2a\x09\xb8\x12\x4b\xd2\
+\x32\xd2\x4a\xfd\xb8\x66\x8c\xf9\x51\xda\x86\xac\x4f\x02\x24\x60\
+\x0f\x01\x5f\xbf\x29\x10\x84\x99\x04\x80\x82\x9f\xa5\x8a\xd7\xff\
+\xb3\x90\xf4\xf5\x7b\x65\x10\xfb\x6b\x5a\xd7\xfe\x35\x0b\x14\xdb\
+\xdb\xb8\x62\x34\xbc\x06\xc6\x97\x01\x6c\x9f\x4d\x76\xcb\x17\xed\
+\xf3\xf3\x9b\x02\xdb\xd4\x99\x04\xb4\x49\xf8\xb5\x87\xef\xf3\x4b\
+\x23\xb7\xb4\x41\xec\xaf\x29\xd5\xf8\x17\xb7\xc4\x4e\x26\x6d\xe4\
+\xc8\x4b\x00\xc9\xb4\x61\x2d\x12\xe8\x4f\x00\xef\x07\xf0\xf5\x4d\
+\x81\xd0\x1c\x49\x00\xbf\x27\x00\x24\xfc\x28\xd5\xbc\xb4\x93\x8d\
+\x9d\xbf\xb1\xa4\xf1\x2f\xb8\x03\xf0\xc3\x6c\x58\xd8\x2a\x2f\x02\
+\x70\x6e\x79\xf5\xc5\x7e\xc2\x25\x80\x24\xc0\x5f\x67\xa5\x14\xae\
+\x18\x99\x04\xf8\x31\xbf\x5d\xf2\x79\x91\xdc\x61\xf3\x83\xfa\x7c\
+\x2d\xe4\x0e\xc0\x0f\x6b\x73\x8d\x39\x2f\x13\x00\x97\x8c\x06\xc7\
+\xc6\x97\x01\xe6\x4f\x4e\x3e\xcb\x46\xc0\xe7\x37\x05\x82\x08\xd6\
+\x0a\x93\x00\x90\x70\xb7\x54\xe5\xeb\xb2\x10\x8b\x3c\xbe\x93\x8c\
+\xd8\x5f\x5b\xb2\x44\x3d\x92\x05\x8c\x0b\x6d\x5c\x32\x9e\x4b\x19\
+\xb1\x0b\xb6\x0f\x59\x46\x9f\xdf\x14\x08\xbb\x22\x09\x98\xda\x38\
+\x22\x77\x04\x4e\xc4\x53\x16\xc7\x08\xc0\x7e\xae\x88\xec\xca\x7b\
+\xc9\xb2\xf0\x44\xec\xaf\xa9\xc7\x1b\x07\xb2\x34\x76\xa1\x8d\x4b\
+\xaf\x89\xba\xb4\x28\x5c\xb0\x7d\xc8\x32\x46\x72\xcb\xd2\xa5\xb9\
+\x9f\xd5\x56\xf5\x0d\x2b\x99\x04\x64\x85\x57\x61\xbb\x6a\x2e\x76\
+\x2a\x54\xd8\xd6\xa1\x25\xf6\xd7\x9e\x76\xda\x9a\xfd\xb6\xca\x17\
+\x9a\x5c\x6f\x7c\xd1\x49\xa1\xa9\x4c\x7d\x0b\x22\x80\xf7\x03\x84\
+\x92\x04\x70\xdd\x14\x34\x89\x0a\xe8\xd6\x35\x5b\x61\x1d\x15\x80\
+\xc1\x8a\x2e\x11\xfb\x6b\xb7\x5e\xa4\xe7\x44\x1a\x2f\xef\x02\xe0\
+\x4a\x48\x74\x73\x66\x63\x66\xec\x8c\xa9\x9c\x10\x14\xce\x2b\x84\
+\x24\x00\xeb\xc6\xb5\xc0\xe2\xc4\x04\x2a\x40\x48\xd8\xaa\x80\x6e\
+\x07\x76\xc9\x0a\x8b\x08\x1c\x40\xec\xaf\xe1\xb0\x56\xea\x07\xd8\
+\xfb\x58\x22\xc7\xde\xc4\x41\x47\xe6\xe3\x2c\xac\x4e\x27\x24\x01\
+\xae\xad\x81\x2c\xb4\x10\x58\xb8\x76\xb2\x90\x2b\xaf\x8d\x6b\xf6\
+\xf1\x39\x79\x6e\xc7\xfc\x38\x01\x30\xc6\x7c\xbf\xbc\x69\x50\xee\
+\x48\xae\x19\xd1\x95\x6f\xc7\x2a\xd7\x8a\x1c\x6d\x18\x02\xf8\x64\
+\x00\x93\x80\x61\x08\xb2\x6d\x1e\x04\x90\xa4\xe5\xd1\x4f\xfa\x3e\
+\xd8\x62\x21\x81\x76\xcc\x8f\x13\x00\xa5\xf5\xc3\x0b\x2b\xf0\x79\
+\x35\x04\xf0\x66\x40\xd7\x32\xe5\x6a\x48\x95\x3b\xaa\x4b\x1f\x5d\
+\xea\x46\xc6\xb5\x44\xb8\x9b\x0e\x49\x8e\x21\xc8\x70\xfd\x24\x21\
+\x55\x6e\x1d\x17\x6d\x82\xbb\x67\xe5\x52\x2a\x71\xb4\x56\xcc\x8f\
+\x13\x00\xad\xf5\xbe\x12\x87\x2e\x75\xa8\x68\xdf\x41\x15\xb9\xf6\
+\x32\xc0\x0b\x4f\xe2\xbb\x9b\x4b\x9d\x25\xbd\x07\x43\xe0\xaf\x6f\
+\x38\x5d\x21\xb0\xf4\xae\x65\xff\x99\x48\xd6\x81\xef\x1f\x0f\x6c\
+\x5b\x01\xb6\x82\xcd\xda\xcf\xb9\xaf\x9e\x00\x6c\x52\x95\x14\x59\
+\xc6\x8d\x1c\x8b\x19\x69\x75\x6c\xc7\xfc\x38\x01\x30\x5a\xed\x4d\
+\xdb\x01\xeb\x17\x4b\xc0\xb5\x05\x53\x2c\x8d\x6a\x7a\x6f\x06\x7f\
+\x7c\xd4\x6c\xb9\x24\x64\xcb\x95\xeb\x41\x25\x92\x24\x20\x94\x3b\
+\x01\xb8\x93\xc6\xef\x0a\xa8\x66\xdd\x2c\x1c\xd5\xc5\xab\x7f\x9f\
+\x3f\xff\x0f\xfb\xb4\x63\x7e\x33\x01\x50\xea\x21\x1c\xf4\xb5\xb8\
+\xe8\xf4\xe0\xc0\x10\x80\x7c\xb5\x89\xed\x7a\xc1\x69\xd5\x37\xac\
+\x9c\x27\x26\x6c\x82\xe3\xf3\x0e\x3a\xf6\x04\xb7\x35\x5d\x5c\x0f\
+\x59\x31\xc3\x86\xae\xdb\x2c\xab\xee\x36\xb4\x03\xfb\x6a\x2f\x66\
+\xb2\x51\xc0\x3a\xc9\xd6\xd2\x8d\x56\xa6\x15\xf3\xe3\x04\x60\x89\
+\x6a\x78\x9d\x00\xe0\xca\x27\x72\xf0\x96\x0e\x9c\x97\x1b\xd3\xc9\
+\x2f\x29\xfb\x39\x2d\x38\x33\x9c\x77\x59\x63\x38\xb7\x90\x92\x00\
+\x1f\x6c\xe6\xea\x7c\x03\x7b\xd7\x64\x77\x31\x56\xa4\x65\xdc\x8e\
+\xf9\x71\x02\x70\x70\xc9\xb2\x7f\x4a\xdb\x81\x6b\xf5\x5d\xbd\xa5\
+\x53\x97\xd7\x9f\x5d\x63\xed\xb2\xbc\xe0\x3d\xc8\x69\xe1\xbc\xeb\
+\x77\x67\x98\x04\xb8\x3c\x4b\xdd\x90\xdd\x86\x44\x39\x0b\x29\x57\
+\x63\x45\x1a\x5d\xdb\x31\x3f\x4e\x00\x76\x5e\xfa\xec\x1f\x49\xe3\
+\x47\xa5\x78\xbb\xb9\x9a\xd5\xf9\x70\xdb\xd9\x85\x49\x85\x80\x8e\
+\xe0\x0f\xde\x49\xe4\xad\x2f\x78\x79\x20\x49\x1b\xdb\xea\x84\x98\
+\x04\xf0\x7d\x01\xe5\xcc\x42\x04\x7f\x24\xca\xe5\x8c\x96\xef\x28\
+\x58\x17\xf9\xf6\x68\x5d\x6f\x8f\xb6\x62\xbe\x8a\x13\x80\x96\x78\
+\xdf\x69\xed\xbd\xdc\x45\xfb\xdc\xfb\x34\x40\xdb\x10\x58\x48\x08\
+\x50\xed\xe7\xdc\xe7\x4b\x00\xce\x0a\x01\x3d\x69\xf0\x6f\x8f\x5e\
+\xf7\xe0\xee\x0c\x9c\x5d\xe4\xe0\xcb\x63\x6d\x1b\x64\xd9\xd7\x25\
+\x79\x83\xcd\xb3\xb4\x65\x9b\xc1\x04\xc0\x16\x3e\x6b\x70\xcd\xa2\
+\x6b\xa4\xef\x3f\x90\x97\xc6\x8e\xc6\xfa\xce\x04\xe0\x1f\xd3\xe3\
+\x72\xab\x85\xcb\xc6\x85\xd3\x62\x12\x90\xff\x7c\xab\x4b\x10\xcf\
+\xea\xac\x90\x30\xc0\xd9\xe5\x2f\x55\xb9\x3d\x6e\xba\xfd\x21\xe7\
+\x3e\x2a\x3b\x2c\x21\xd8\xdc\x07\xdb\x0d\xcb\x21\xef\xf6\xf0\x51\
+\x60\x9b\x77\xbf\xec\x2f\x57\x02\x47\x63\x7d\x67\x02\xf0\xed\x5c\
+\x87\xb0\xb0\xb3\x48\xee\x02\x58\x28\x56\x62\x91\xb8\xb0\x12\xa3\
+\x1a\x58\x11\x8e\x0a\xc1\x1f\x41\x7c\x60\xe5\x3e\x15\x60\x13\x1f\
+\x02\x49\xa8\x49\x00\x5f\x12\xe8\x33\xb9\x33\x9c\xc2\x7a\xc8\xd0\
+\xac\x90\x26\x59\x3a\xc5\x1d\xb1\x2c\xed\x1c\x6b\x73\x34\xd6\x1f\
+\x4d\x00\xb4\xaa\x3d\xa8\x02\xf8\x8b\x1c\xbe\xdd\x89\x60\x85\xa0\
+\x15\x80\x99\x0a\x55\x11\x01\xbb\x2e\xb7\x81\xc1\x33\x8f\x81\xe0\
+\xf4\x90\x50\xe4\xd1\x57\x95\x7d\x84\x98\x04\x80\x37\xe6\x02\xe6\
+\x04\x1e\xb3\x64\x27\x50\x97\xbb\x69\x79\xad\xa9\xec\x52\x64\x6f\
+\xe9\xf2\x1d\xe2\x34\x5a\xeb\x8e\x58\x7f\x34\x01\x68\xa8\xc3\x41\
+\x24\x00\xae\x1b\x19\x0b\x0c\x0b\x4d\xf1\x2f\x13\x01\xb0\x43\xc0\
+\xce\xd4\xb8\x4f\xa3\x7a\x9c\x50\x9c\xd8\xa7\x86\x1b\xa7\x42\x4d\
+\x02\x30\x27\x98\x04\x64\x9f\xa3\x75\xeb\x82\x7f\x7a\x5d\x02\xb9\
+\xfa\x57\x9d\xb1\xfe\x68\x02\x70\x9c\x6e\xcc\xa6\x47\xe6\x5e\x8b\
+\x48\x5e\x06\x88\x1c\xbe\x0b\x00\xe2\x48\x02\xe8\xac\x40\x22\x79\
+\xc1\x15\x7a\xf3\x76\xef\xf2\xe4\x8d\x52\xd6\x44\x10\x49\xd9\xc4\
+\xca\xea\xae\x27\xc9\x59\xa1\xc2\x7e\x98\x23\x5c\x5b\xe9\x08\x7a\
+\x11\xfc\xbf\xee\xf5\x87\xe0\xe6\x19\xb4\x33\xd6\x1f\x4d\x00\xee\
+\xdc\x78\x16\x7e\x12\xf8\x87\xf3\x6a\x7a\xfa\xc4\x07\x07\x07\x67\
+\x85\x85\xe7\xa9\x89\x72\x55\x0b\x9c\xea\x72\x85\x9e\x6b\xa7\x5d\
+\x3a\x43\x62\x56\x97\x2b\xa1\x2e\xa7\x9c\x3a\x14\x49\x92\x1c\xca\
+\xef\x06\x74\x33\x0c\xd6\x16\x93\x80\x6e\x64\x16\x1f\xc3\x7c\xc7\
+\xbc\x5f\x7c\xa6\xda\x23\x69\x47\x8f\x1c\xbf\x28\x4c\xa1\xef\x0f\
+\x5b\xb1\x3e\x6e\x72\x34\x01\xc0\x33\xad\xd4\x6e\xec\x7d\x2f\x91\
+\x38\xb8\xc8\x03\x83\x63\xe1\x61\x01\xfa\x6e\xaf\xac\xfa\x95\x71\
+\xd5\xbf\x50\x36\xd8\xc4\x87\xe0\x11\xc9\x1a\x09\x3d\x09\xe0\xdd\
+\x80\x85\xb3\xfb\xd8\x73\xac\x2d\xf8\x1e\xcc\xf7\x63\x47\xdd\x7c\
+\x84\x0b\x42\xcc\x77\x37\xa5\x4f\x27\xf5\xc2\x18\x3f\x2f\x01\x30\
+\x5a\xed\x4a\xd7\x9d\xbb\xb5\x61\x74\x77\xa5\x3f\x26\x39\x16\x20\
+\x1c\x15\x16\xe4\xb1\xa3\x7c\x04\xe7\x54\x2f\xe1\xaa\xbf\x1b\x69\
+\x5f\xae\x20\xe1\x14\x43\x4e\x02\x60\x5b\x5f\x6c\x09\x5d\xf2\x2a\
+\xf0\x35\x58\x5b\xf0\x3d\x79\xf5\x99\x6f\x3f\xec\xad\x17\x81\x85\
+\x31\x7e\x7e\x02\x60\xd4\x03\xbd\x1a\xfa\x76\x1c\xce\x2d\xf2\xe0\
+\x2e\x40\xdb\x2e\x58\x90\x3e\x5c\x79\xb6\xf5\xc9\xba\x07\x83\x66\
+\x42\x54\xdc\x6b\xfd\x49\x64\x43\xe0\x80\xa3\x4c\x52\xd7\xe6\x3a\
+\x51\xe0\x77\x02\x60\x1b\xd8\x12\x73\x0a\x73\x0b\xcf\x43\x2e\x60\
+\x00\x5f\xe3\x13\x83\x50\xde\xfc\x07\x9b\x99\x05\x31\x7e\x5e\x02\
+\x50\xd3\x26\x98\x04\x00\x30\x7c\xb9\x0b\x00\x5d\x50\xe0\xa8\xb0\
+\x40\xf1\x38\xb4\x82\x60\x5b\x97\xd7\xdf\xc1\xc0\x16\xdd\x6d\x92\
+\x65\x18\x26\x4c\x02\x9a\xf4\x60\x4f\xac\x2f\x94\xe6\x91\xb0\xfe\
+\xdb\xb6\xbe\x7a\xd1\x4f\x73\xdc\xb7\x18\x30\x48\xf7\x85\x31\x7e\
+\x5e\x02\x70\x78\x6e\xc9\xfd\x83\x3a\xf0\xe9\x3c\x1c\x5b\xe4\xd1\
+\x5d\x00\xd8\x06\x4e\x0a\x57\x2b\x08\x88\x78\x1e\x42\x81\x63\xaa\
+\xcb\xed\x7e\xdb\x6e\x49\x42\x9e\xba\x24\x25\x3e\xd8\x20\xe2\x9d\
+\x80\xd8\x8c\x58\x5f\x71\x79\xd1\x49\xf1\xf3\x10\xfe\xc1\x97\x60\
+\x1e\x63\x3e\xfb\xa4\x6f\x24\xbe\x3f\xa4\xab\x7f\xd8\x6e\x61\x8c\
+\x9f\x97\x00\xdc\xb3\x79\xd5\x5e\xa9\x74\x40\x4a\x30\x9b\xaf\x19\
+\x60\x5d\x02\xa2\xef\x57\x2a\xd0\xaf\x99\xec\x54\x7b\xbb\xbf\xdf\
+\x62\x81\xd3\x84\x9c\xfd\xea\xb8\x72\x2e\x62\x12\x70\xd4\x54\x48\
+\x02\x30\xf7\x7c\xb1\xed\x51\xc5\x16\x3c\x80\x7e\xf0\x25\x98\xc7\
+\x0b\x4e\x59\xfa\x34\xb9\x58\x21\xfc\xea\xdf\x02\x1a\x07\x5a\x31\
+\xfe\xe8\xe1\x79\x09\x00\x8e\x6a\xa5\xbe\x89\x7d\x28\x05\x4e\x2d\
+\x92\x4c\xd0\x47\x7d\x7d\x75\x52\x4d\xa7\x74\xba\x82\x7e\x2e\xd8\
+\x0d\x72\x42\x66\x17\x64\x1d\x24\x63\xc4\x24\x60\x1e\x22\xd8\xd6\
+\xc7\x44\x00\x57\xfd\xb1\x5e\x2f\xf4\xf3\x4e\x07\x2e\xfc\x42\xbb\
+\xfa\xef\x16\xdb\x17\x25\x00\x32\xbb\xbf\x21\x25\xa8\x0d\x93\xc1\
+\x67\x85\xe1\xa4\x10\x80\x50\x5c\xd6\x13\xf2\xb7\x9d\x92\x6b\x57\
+\x24\xb0\x01\x9c\xaa\xcb\xfc\xdb\xb2\xb7\x93\x80\xc8\xd3\xc4\xb9\
+\xad\x67\x9a\x3d\xec\x1b\xcf\x4d\xc7\x5f\x1a\xc0\x1c\xad\xcb\xcb\
+\x56\x75\xb9\x83\x98\x46\x7f\x5b\xea\x26\x95\x23\xb4\xe0\xdf\xe2\
+\xb2\x28\xb6\x77\x4b\x00\xfe\x4f\xab\x72\x30\xbb\x48\xae\x6a\x82\
+\x48\x02\x24\x9b\x47\x10\x45\x71\xc9\xb8\x90\x37\x76\xae\x22\xbf\
+\x4b\x72\x2f\x94\x15\x4e\x15\x0e\x76\xe1\x71\x17\x9f\x63\xcd\x84\
+\xfa\xb5\xc1\xfd\xec\xe5\x6a\x22\x80\x79\x59\x6f\x05\x7e\xd7\x92\
+\xeb\x7e\xf6\xe8\x76\xce\x77\x5f\xdf\x4d\xe7\xd6\xb1\x45\xb1\x7d\
+\x51\x02\x30\x67\x1a\x8b\x2a\xb5\x1a\x7b\xbd\x0b\x25\x23\x84\x83\
+\x8a\x8b\x5c\xa9\x20\xb0\xda\x6a\xd4\xb6\x43\xf2\x21\xf0\x77\x32\
+\x06\xfb\xce\xe7\xae\x3f\x66\x12\xd0\xdd\x82\xb0\x73\x3c\x77\x65\
+\x9d\x61\x2e\x77\xaf\x55\xfd\x51\xc8\xe6\x4f\xe0\x4f\xc6\x33\x14\
+\x5f\xbf\x90\x46\xb7\xd8\xbe\x28\x01\xb8\x7b\xd3\x9a\xfb\x94\x32\
+\x07\x17\x36\x0e\xe1\x79\x48\x5f\x7a\x02\x07\x85\x62\x9b\x93\xf2\
+\xdd\x21\xe1\xea\x0a\x0e\xd7\xa7\xf5\xc4\x24\xa0\xb7\x35\xb1\xc6\
+\xea\x72\x3b\xbd\x2e\x57\xd7\xb6\x24\xdc\xed\x35\x86\xb5\x5f\x17\
+\xd9\x30\x27\x7b\x6b\xe0\xd7\x99\x70\xaf\xfe\xcd\xc1\x66\x6c\x9f\
+\x6f\xcf\x45\x09\x40\x7c\x5a\xeb\x9d\xf1\x3e\xb0\x7f\xb8\xad\x19\
+\x05\xf8\xba\x66\xdb\x49\xc1\x21\xc0\x49\xc1\x41\x94\x69\x7a\x8c\
+\x57\x17\x07\x89\xf1\xeb\x01\x38\x24\x38\x5c\x70\x2e\x93\x71\xd1\
+\x63\x21\x09\x08\xd7\xb9\x0e\xa6\x1b\xdb\x5c\x5e\xc2\xc2\x1c\x87\
+\xed\x51\x06\xb7\xca\xaf\x46\x7b\x8d\xd5\x65\x9d\xd5\x3d\x5d\x63\
+\x83\x68\x61\x7e\x86\x7a\xf5\xaf\x7a\xc4\xf4\xee\x09\x80\x52\xf7\
+\x0e\x82\xe9\xeb\x79\x4c\x12\x5f\x75\x4b\xa2\x57\x67\x32\x50\x17\
+\x67\x01\x47\x05\xe7\x91\xa4\x6d\xd2\x3a\xe8\x0f\x7d\xa3\xc0\x21\
+\xd6\x03\x74\x48\xe0\x0c\xb6\x49\x99\xb9\x50\x0f\xce\x35\xf4\xf5\
+\x93\xc4\x4e\xb1\xed\x5b\xc9\x40\xbd\xb5\xc6\xf2\x9e\x0b\x58\x63\
+\xe8\x13\xfd\x77\xae\x31\x24\x22\x49\x64\xf4\xb1\x0e\xe6\xa7\x8f\
+\x7a\x25\xd4\xa9\x6b\x4c\xef\x9a\x00\x68\xa5\xbf\x9e\xb0\x53\xef\
+\xaa\x45\x01\xbc\x21\x30\xa9\xd1\xe0\x2c\xe0\xac\xea\x12\xa0\xe1\
+\x44\x50\xea\x1d\x0e\x0b\x0e\x06\x8e\xa6\x5f\x41\x1d\x14\xb4\x43\
+\x69\xf6\xb1\x52\xa1\x6f\x94\xa4\xb2\xf8\x58\x0f\x6c\xc1\xc6\x27\
+\xdd\xe0\x64\x99\x04\x24\xb7\x28\xd6\x40\x3c\x0f\x5a\x09\x01\xd6\
+\x07\xe6\x44\x67\x69\xaf\x2f\xf4\xda\x7e\xdc\xb9\x47\x5d\xac\x2d\
+\x14\xb4\x47\xa9\xcb\x9a\x45\xbf\xe8\x1f\xed\xfc\x2f\xfd\x35\x0c\
+\x7d\x4e\xf6\x8a\xe9\x5d\x13\x80\x39\x75\x38\xd8\x04\x00\xd3\x08\
+\x4e\x2c\x0a\xf0\xa5\x00\xe8\x3e\xa8\xc0\xa1\xc0\xb1\xb4\x0b\x1c\
+\x4d\xbf\xd2\xae\x87\x76\x28\x83\xfa\x0f\xed\x7c\xcc\xe7\x45\x7e\
+\x7d\xd6\x1a\xeb\x27\x74\x87\x3b\xcc\x3c\x8e\xe7\x84\x24\x04\xed\
+\x7d\x7b\x7d\xb5\x03\x7b\xfb\x79\x7b\x8f\x7a\x58\x5b\x28\xc3\x8c\
+\xeb\x6b\x5b\xcc\x45\xcc\x49\x5f\xf5\x4b\xa2\x57\xaf\x98\xde\x35\
+\x01\xb8\x7b\xe3\x73\x1e\x54\x5a\x7d\x3f\x49\xc7\xbe\xd6\xc1\x6b\
+\x9a\xbe\xea\x46\xbd\xec\x22\xd0\x74\xe0\x27\xda\x25\xd4\x90\xd2\
+\xc0\xe1\xc2\xf1\x0e\xd9\x0d\x9b\x93\x40\x22\x02\xfd\x2a\x61\x2e\
+\xf6\x3b\xef\xfd\x39\xa3\xbe\x1f\xc7\xf4\x2e\x8a\x76\x4d\x00\xe2\
+\x7a\x46\x7d\x2d\xde\x07\xfc\x2f\xa4\x4f\x05\x04\x6c\x66\x2b\x54\
+\xc7\xd5\x1c\x6e\xeb\x5a\x21\x4c\x4e\x42\xc0\xf1\x72\x0d\xe5\x04\
+\x93\xdd\x64\x22\xc0\xf9\x27\xd8\x74\xef\x58\xde\x3b\x01\x50\xfa\
+\x6e\x69\x1a\xf4\x16\xf1\xfd\x00\x41\xdb\xbf\x6c\xe5\x91\x04\x94\
+\x3d\x66\xd1\xe3\x61\x0d\xc1\x09\x47\x7c\x49\xad\x68\xd4\x01\xf7\
+\xdf\x5d\x75\xdc\x81\x8a\xc4\x87\x77\x3f\x1b\xd2\xd1\xde\xb1\xbc\
+\x77\x02\xa0\x4d\xf0\x09\x00\xa6\x08\xae\x62\x22\x3a\x2f\xa0\x60\
+\x29\x81\x00\xde\xd0\x55\xc2\x30\xa5\x0e\x11\x89\x13\xc6\x4b\x6a\
+\x70\xc8\xa5\x0e\xcc\xc1\x82\x25\x80\xb9\x06\xdf\x1d\x2c\x80\x4e\
+\xc5\xfb\xc4\xf2\x9e\x09\xc0\xf4\x65\x23\xd3\xd2\xc7\x13\x52\x82\
+\xdf\xe0\xbc\x82\x87\x40\x00\x85\x13\xf0\xdd\x69\xc1\x21\x43\xc7\
+\xc2\x41\x72\x80\xa0\x08\x74\x53\x16\x73\xad\xdb\xf1\x00\x8f\x3d\
+\xd1\x8a\xe5\x5d\x55\xef\x99\x00\x28\xad\x8d\xb4\x98\x92\xc2\x4d\
+\x08\xe0\x36\xa6\xec\xb8\x91\x40\x21\x04\x10\x18\x43\x70\x5a\xd0\
+\x11\xba\x16\x02\x91\x9d\x92\x80\x10\xa0\xaf\x16\x08\xc7\xb6\xa9\
+\x56\x2c\x3f\x76\xa4\xe3\x51\xef\x04\x40\x2a\x49\x0a\xb0\x5d\x76\
+\xdc\x84\x00\x6e\x63\xd2\x71\x09\x08\x6e\xb9\x13\x80\xc3\x42\x60\
+\xcc\xbd\x63\x4b\x3b\x84\xae\xd0\xd9\x52\xf1\x28\x96\x53\x04\xe6\
+\x0b\x0b\x1f\x0d\x5f\x3d\xff\x68\xb8\xcf\x06\xc5\xf0\xbe\x09\xc0\
+\x9c\x56\x4c\x00\x3a\xe6\x0e\x1c\x17\x26\x58\xc7\x21\x3e\x24\x81\
+\xcc\x04\xa2\x7d\x87\xd4\xf8\xb6\x59\x15\xc9\x6b\xe4\x99\x3b\x71\
+\xb4\x21\x74\x6e\xea\x7e\xc8\x51\x0d\x28\xb6\x6d\x04\xe0\x9b\xe1\
+\xa3\x6d\x93\xab\x4a\x79\x06\xc5\xf0\xbe\x09\xc0\xf1\x8f\x3c\x7c\
+\x97\x08\x7f\x44\x0a\xb7\x16\x01\x4c\x30\x4c\xb4\xd6\x53\xee\x48\
+\x20\x13\x01\xcc\x21\xbe\xb7\x44\x29\x30\x00\x8b\x4c\x10\xd9\x28\
+\x78\x02\x6d\x00\x98\x43\xf0\xcd\xed\xe7\xdc\xc7\x04\x8e\xb4\x62\
+\x78\xfc\xa4\xdb\xbf\xbe\x09\xc0\x9d\x5b\x5e\x7c\x44\x69\x75\xa7\
+\xe2\xdf\x3c\x02\x98\x68\x98\x70\xf3\x0e\xf2\x09\x09\x24\x24\x80\
+\xb9\x83\x39\x94\xb0\xba\xf7\xd5\xc0\x02\x4c\xbc\x57\x94\x0a\x16\
+\x42\x00\x73\x07\x73\xa8\x90\xce\x5d\xee\x54\x62\x77\x1c\xc3\xfb\
+\xe8\xd0\x37\x01\x88\xdb\x19\xf5\xd5\x78\xcf\x7f\xf3\x08\x60\xc2\
+\x45\x72\x0b\x77\xde\x41\x3e\x21\x81\x01\x04\xf0\xda\x37\xe6\xce\
+\x80\x6a\xc1\x9d\x06\x13\x38\xf2\xe0\x14\xa7\xc2\x43\x10\x50\x0a\
+\x73\x06\x73\x67\xa8\x4e\x7c\x6d\x9c\x20\x76\x0f\x4c\x00\x8c\x6a\
+\x30\x01\xe8\x31\x41\x70\xfb\x92\x49\x40\x0f\x38\x3c\x3c\x8f\x00\
+\xe6\x49\xf3\x35\xef\x83\xf3\x8e\xf3\xc9\x31\x02\x70\xe4\x60\x04\
+\xa7\x7e\xec\x28\x1f\x91\x40\x77\x02\x58\x53\x98\x33\xdd\xcf\xf2\
+\x68\x92\xd8\x3d\x30\x01\xd8\x31\xb1\x06\x5f\x08\xf4\x28\x71\x76\
+\x27\xc0\x24\xa0\x3b\x17\x1e\x3d\x46\x00\x01\x0d\xf3\xe4\xd8\x11\
+\x3e\xea\x47\x00\x4e\x1d\xcc\xfa\xd5\xe1\xb9\xb0\x09\x20\xf8\x73\
+\x4d\xf5\x9d\x03\x8f\xb6\x62\x77\xdf\x4a\x03\x13\x80\xb8\xb5\x56\
+\x5f\x8a\xf7\xfc\xd7\x95\x00\x26\x22\x1d\x56\x57\x34\x41\x1f\x6c\
+\x3a\xa9\xbd\x0a\x01\x2d\x68\x10\x19\x94\x07\x33\xae\xa9\x0c\xe0\
+\x02\x68\x82\x79\x01\x9f\x1b\x80\xaa\xd9\x55\x4c\x18\xb3\x93\x25\
+\x00\xaa\xf6\x77\xd9\x25\x09\xa3\x25\x1d\x56\x18\x76\x4e\xaa\x65\
+\xdb\x49\x45\x01\x7e\xc4\x2f\x29\xa3\x41\xf5\xb0\xa6\xf8\x92\xc0\
+\x20\x4a\x61\x9d\xc7\xba\xc2\xbc\x50\x2a\x2c\xbd\xd3\x6b\x9b\x2c\
+\x66\x27\x4b\x00\x0e\x3f\xce\x04\x20\x81\x05\x30\x31\x31\x41\x13\
+\x54\x65\x15\x8f\x09\x60\x0e\x60\x2e\x78\xac\x62\xa9\xaa\x81\x25\
+\x98\x96\x3a\x28\x07\xb3\x8e\x00\xe6\x00\xe6\x82\x75\x82\xd9\x28\
+\x50\xc2\x98\x9d\x28\x01\x98\xbe\xfc\xac\xef\x89\x8e\x3b\xa5\x70\
+\x1b\x40\x00\x13\x14\x13\x75\x40\x35\x9e\xf6\x90\x7a\x0d\x7c\xe7\
+\x00\x00\x10\x00\x49\x44\x41\x54\x40\xb4\xef\x90\xe2\xbb\xfc\x8b\
+\x31\x2c\xd6\x15\xd8\x16\xd3\x3b\x7b\xb5\x9d\x00\x7c\x2a\xe6\x40\
+\x5b\x4e\xee\xfb\x12\xd8\xd9\x8a\xd9\x7d\x2b\xe1\x64\xa2\x04\x00\
+\x15\xb5\xd6\x7f\x8d\x3d\xcb\x60\x02\x98\xa8\x98\xb0\x83\x6b\xb2\
+\x86\x2f\x04\x60\x6f\xbc\x2e\x19\xf1\x96\x7f\x61\x26\x05\x5b\xbe\
+\x24\x50\x18\x5e\x6b\x3b\xc6\xda\x82\x4f\xb5\x56\x40\xcb\x04\x4b\
+\x13\xab\x13\x27\x00\x46\x19\x26\x00\x29\x0c\x8d\x09\x8b\x89\x9b\
+\xa2\x09\xab\x3a\x48\x20\xe2\x55\x7f\xe9\x56\xc3\xda\xc2\xdd\x00\
+\xb0\x2f\x7d\x70\x0e\x58\x2a\x01\xd8\x19\xf6\x9e\x3f\x28\x9f\xf5\
+\x23\x90\x26\x56\x27\x4e\x00\xa6\x37\x8e\x4e\x29\xad\xbe\xdf\x6f\
+\x60\x9e\x9b\x4f\x00\x13\x17\x57\x2c\x74\x54\xf3\xb9\xf8\xf2\x0c\
+\x09\x1e\xaf\xfa\xab\xb1\x66\x24\x77\x5a\xc0\x1e\x36\xa8\x46\x02\
+\x8e\x5a\x24\x81\xa8\x95\x58\x47\x62\xe7\x22\xc7\xf1\xae\x6f\x89\
+\xd1\x71\xac\x4e\xa8\x58\xe2\x04\x20\xee\xcf\xa8\xff\x19\xef\xf9\
+\x2f\x15\x01\x3a\xaa\x54\xb8\xac\xaf\x1c\xb5\x9c\x13\x12\x3c\xeb\
+\x85\xf5\x5c\x40\xd8\x00\x57\x89\xb0\x89\xe7\xaa\x06\xa3\x1e\x92\
+\x3a\xf8\xcc\xa8\x47\xf0\x0f\x06\x44\x16\x45\x53\xc6\xe8\x54\x09\
+\x80\x51\xb5\x2f\x64\x91\x89\x6d\x54\xfc\x59\x70\x4c\x6c\xb2\x70\
+\x9b\x00\x6c\x48\xe7\x64\x97\x0d\x11\x28\x60\x13\xd8\xc6\x2e\xc9\
+\x28\x4d\x5a\x02\x48\xe6\x90\xd4\xa5\x6d\xc7\xfa\x4d\x02\x69\x63\
+\x74\xaa\x04\xe0\xb4\x53\xce\x40\x02\xc0\xdf\xef\x6c\xb2\x4e\xfd\
+\x1f\x13\x9b\x2f\x09\xa4\xc6\x66\x45\x83\x88\x57\xfd\x56\xd8\xa1\
+\x9f\x10\xed\xf5\xc5\x44\xa0\x1f\x25\x3b\xcf\x61\x7d\x35\x7d\xe3\
+\xa0\xaf\xca\xb6\x53\x7e\x4b\xa4\x3a\xd4\x8a\xd1\x89\xc5\x49\x95\
+\x00\xdc\x7a\x91\x9e\x53\x5a\xfd\xf7\xc4\xbd\xb3\x62\x57\x02\xbc\
+\x5a\xe9\x8a\xc5\xca\x83\x70\x4c\xb8\x2a\x81\xcd\x22\xde\x92\xb4\
+\xd2\x46\x0b\x85\x42\x22\xc0\x24\x60\x21\x15\x7b\x9f\xc3\x56\x58\
+\x5f\xf6\x4a\xe8\x88\x64\x12\x9b\xe3\x18\x9d\x42\xdc\x54\x09\x00\
+\xfa\xd5\x4a\xdf\x81\x3d\xcb\x70\x04\xe8\xa4\x86\xe3\x57\x46\xeb\
+\xb6\x63\x62\xe0\x2f\x83\x76\xbe\x63\x60\x7d\xe1\x8a\x12\x36\xcc\
+\xb7\x67\xf6\x96\x17\x81\x28\xc3\x5d\xb5\xbc\xc6\xf6\xb1\x9f\x2c\
+\xb1\x39\x75\x02\x70\x68\xe9\x8f\x91\x00\xcc\xf9\x08\xb0\x6c\x9d\
+\xe8\xa4\xca\x26\x9e\x6c\x3c\x04\x8d\x38\x78\xfc\x03\x7f\x03\x2b\
+\x19\x31\x7b\x6b\x71\x8d\xd9\x69\x1b\xac\x31\x5c\xf5\x47\xbc\xab\
+\x96\x97\x81\xe6\x5a\xb1\x39\x55\x7f\xa9\x13\x80\x9d\x97\xbe\xe0\
+\xa0\x64\x1a\xb7\xa5\x1a\x85\x95\xfb\x12\xa0\x93\xea\x8b\xa7\xb4\
+\x93\x11\xaf\x48\x4a\x63\x5d\xf6\x40\x5c\x63\x65\x13\xef\x3e\xde\
+\x70\x6b\xac\x7b\x9f\x3c\xaa\xe4\x95\x79\x7d\x1b\x62\xb3\x4a\xf9\
+\x97\x3a\x01\x88\xfb\xd7\xea\xaf\xe2\x3d\xff\xe5\x4a\x00\x4e\x0a\
+\x99\x71\xae\x9d\xb2\xb3\x81\x04\xda\x4e\x89\x57\x24\x03\x51\x39\
+\x5f\xa1\xbd\xc6\x60\x73\xe7\x95\x71\x48\x01\xf0\xe6\x7b\x69\x0a\
+\x34\x58\xc6\x98\x9c\x29\x01\x78\xd2\x9c\x46\x02\xf0\x78\x81\xea\
+\x04\xdb\x35\x1c\x54\x7c\xfb\xf9\xeb\xbc\xfd\x5c\xf4\x24\xa0\x53\
+\x2a\x9a\xb0\x9d\xfd\x63\x8d\x21\xd9\x63\xb2\x5d\x8e\x7d\xf2\x0a\
+\xfc\xe5\x48\xeb\xe4\x28\x8f\xb7\x62\x72\x6a\xe1\x33\x25\x00\x5f\
+\xdc\xbc\x4a\x82\xbf\xfe\x7c\xea\xd1\xd8\x20\x31\x01\x38\x29\x26\
+\x02\x89\x71\xa5\xaa\xc8\xc0\x9f\x0a\x97\xb7\x95\x3b\xd7\x18\x93\
+\x81\xfc\xcd\x0c\xa6\xf0\x61\x11\x5f\xe7\xcf\x1f\xee\xbc\x1e\xf5\
+\xe7\x9b\x31\x79\xde\xc1\x44\x4f\x32\x25\x00\xe8\xd9\x28\x7d\x2b\
+\xf6\x2c\xc5\x12\xe8\x74\x52\xc5\x8e\xe4\x7f\xef\x51\xeb\x35\x7e\
+\x5c\xfd\x45\x74\x4a\xfe\x1b\x3c\xa1\x86\x58\x63\x71\x91\xbb\x6e\
+\x08\x5a\x09\x9b\xb1\x5a\x0f\x02\x60\x88\xc0\x0f\xa6\x3d\xaa\x64\
+\x38\xcc\x26\xbd\x08\x0c\x13\x8b\x33\x27\x00\x3b\x26\x56\xe1\xd3\
+\x00\x07\x7a\x09\xc5\xe3\xf9\x12\xc0\x62\x8a\x17\x95\x38\xa9\x7c\
+\x7b\xf6\xbf\xb7\x88\x81\xdf\x7f\x23\xe7\xa0\x21\xd6\x18\x0a\xd7\
+\x59\x7a\x98\xed\x35\x16\xb3\xe3\xa7\x67\xd2\x03\xcc\xde\xe2\x40\
+\x2b\x16\x67\xea\x21\x73\x02\x10\x8f\x66\xd4\xe7\xe2\x3d\xff\x95\
+\x46\x80\x0e\x2a\x39\xea\xf6\x95\x08\xaf\xf8\x93\x33\x63\xcd\x26\
+\x01\xae\xb3\x26\x87\x41\xff\xdb\x81\xbf\xe8\x35\x36\x48\x8e\x60\
+\xcf\x0f\x19\x83\x87\x4b\x00\x6a\x4c\x00\xaa\x9a\x78\x9d\x0e\x0a\
+\x81\xae\x2a\x39\x6c\x1b\xb7\xed\x90\x78\x25\x62\x9b\x65\xdc\x94\
+\xa7\x73\x9d\x61\x6e\xb9\xa9\x45\xfe\x52\x83\x05\xdf\xdc\x97\x3f\
+\xd7\xd4\x3d\x0e\x19\x83\x87\x4a\x00\xf0\xb3\x83\x5a\xa9\xfb\x52\
+\x0b\xcd\x06\xb9\x11\x80\x83\x42\x89\x03\x9e\xbc\x3c\x10\x62\x32\
+\x70\xcc\x19\xed\x55\xbc\x12\xc9\x6d\x6a\xb1\xa3\x0e\x02\x58\x63\
+\x98\x5b\xed\x75\x86\x39\xd7\x71\x3a\x88\x87\xd0\x19\x41\x1f\x0c\
+\xc0\x22\x2a\xed\x7d\x34\x41\xe0\x4d\xad\x24\x62\x2f\x62\x70\xea\
+\x86\x1d\x0d\x86\x4a\x00\xd0\x8f\xd1\xea\x33\xd8\xb3\x54\x4f\x00\
+\x4e\x0a\x05\x0b\xd4\xf7\x44\x20\x3a\xfa\xba\xfe\xb1\xa0\x1f\xd1\
+\x21\x55\x3f\x09\x03\x90\x00\x6b\x0c\x01\xb0\xbd\xce\x22\x99\x8b\
+\xbe\xaa\x0d\xdd\x18\xf4\xed\xb4\x6e\x1e\xb1\x77\xe8\x04\x40\x1d\
+\x3e\xcc\x04\xc0\xc2\xf9\x01\x27\x05\x07\x85\xc5\x8b\x64\x00\xc5\
+\x42\x31\x53\x89\xd4\x76\x46\xd0\x09\x0e\x38\x92\x80\x8f\x92\xaa\
+\x13\x56\x26\x81\x1c\x09\x60\x9d\x61\x2e\x62\xad\x61\x8d\x45\x1e\
+\x24\x03\xd0\x01\x6b\x0c\x3a\x41\xb7\x48\xd6\x59\x8e\xc8\x52\x77\
+\xc5\x06\x3d\x08\xe4\x10\x7b\x87\x4e\x00\xa6\x2f\x3f\xeb\x7b\x22\
+\x1e\x3e\x11\x20\x3b\x6e\xb6\x11\xc0\xe2\x85\x93\x42\x69\x2e\xe8\
+\xbd\x0a\x8e\x0a\xc5\x36\x59\x17\xca\x13\x89\x33\x45\x81\x33\x6a\
+\x96\x87\x54\x24\xce\x08\x65\x61\x5d\x3e\x27\x81\xaa\x09\x60\x8d\
+\x21\x60\x62\xae\x62\x7d\xa1\x44\x32\x87\xab\x96\xab\xdf\xf8\x90\
+\x0f\x05\x32\xa3\x34\x7d\x44\x73\x9d\xf5\x6b\xc7\x73\x95\x13\xb8\
+\xa3\x15\x7b\x87\x12\x64\xe8\x04\x00\xa3\x1b\xa3\x3f\x8d\x3d\x8b\
+\xfd\x04\x22\x09\xa0\x70\x54\x28\xcd\xc5\x7e\x2c\x21\x88\x2a\x74\
+\x56\x18\x1b\x05\x4e\xb3\xd3\x11\xc1\xa1\x46\x22\x33\x8a\xfd\x74\
+\x29\x21\x09\xa8\x38\x49\xc5\xfa\x42\xc1\xfc\x5d\xb8\xce\xaa\x64\
+\x14\xc9\x1a\x47\xc1\x1a\x6b\x96\x87\x8e\xbe\x6f\x26\x92\x75\x56\
+\xa5\x6c\xdd\xc7\xe6\xd1\x6e\x04\xf2\x8a\xb9\xb9\x24\x00\x3b\x36\
+\x8d\xfc\xa5\x56\x6a\x6f\x37\x41\x79\xcc\x6e\x02\x58\xf4\x70\x54\
+\x28\x6d\x67\xb5\xd0\x61\x21\x28\x47\xe2\x38\x86\xd5\x04\x7d\x74\
+\x16\xf4\x0b\x27\xd4\x1c\xaf\xe9\x88\x20\x47\x44\x47\x34\x2c\x6a\
+\xb6\xb7\x8c\x00\xe6\x34\xe6\x36\x0a\xe6\x3b\x0a\xe6\x7f\x67\x89\
+\x64\x8d\xa1\x0c\x23\x3a\xda\xb7\x0b\xfa\xc6\xfa\x42\xc1\x78\x28\
+\x58\xe3\x28\x91\xac\x31\x94\x61\xc6\x62\xdb\x6a\x08\x20\xd6\x22\
+\xe6\xe6\x31\x7a\x2e\x09\x40\x2c\x88\xd6\x9f\x8c\xf7\xfc\xe7\x05\
+\x01\x38\x07\x38\xab\x76\x81\xd3\x80\x03\x59\x58\xe0\x5c\xfa\x95\
+\xce\xfa\xe8\xa3\xb3\xa0\x6f\x8c\xe3\x05\x30\x2a\x41\x02\x29\x09\
+\x60\xfe\x77\x96\xf6\xda\xe8\x5c\x33\x78\x9c\x74\x7d\x35\xeb\x36\
+\x13\x69\xf4\x85\xbe\xb1\xbe\x50\x52\x8a\x66\x4d\x75\x0a\xd2\x85\
+\x40\x8e\xb1\x36\xb7\x04\xa0\x76\xe4\x08\x13\x80\x2e\xb6\xf2\xfd\
+\x10\x9c\x4b\xbf\xe2\xbb\xfe\xd4\x8f\x04\x8a\x26\xc0\xf5\x55\x34\
+\x61\xb7\xfa\xcf\x33\xd6\xe6\x96\x00\xfc\xfd\xdb\xce\xdc\x23\x18\
+\xf9\x66\x40\x81\xc0\x8d\x04\x48\x80\x04\x48\x60\x58\x02\x6c\xdf\
+\x85\xc0\x1d\xad\x58\xdb\xe5\x54\xfa\x43\xb9\x25\x00\x18\xda\x28\
+\xf3\x67\xd8\xb3\x90\x00\x09\x90\x00\x09\x90\x00\x09\xe4\x4b\x20\
+\xef\x18\x9b\x6b\x02\xb0\x63\x62\x35\xee\x00\xec\xce\x57\x65\xf6\
+\x46\x02\x24\x40\x02\x24\x10\x1a\x01\xea\xbb\x88\xc0\xee\x56\x8c\
+\x5d\x74\x22\xeb\x81\x5c\x13\x00\x08\xa1\xb5\xba\x09\x7b\x16\x12\
+\x20\x01\x12\x20\x01\x12\x20\x81\x7c\x08\x14\x11\x5b\x73\x4f\x00\
+\x0e\x2d\x5d\x8a\x04\xe0\x89\x7c\x54\x66\x2f\x24\x40\x02\x24\x40\
+\x02\xe1\x11\xa0\xc6\x0b\x08\x3c\xd1\x8a\xad\x0b\x0e\x0f\xf7\x34\
+\xf7\x04\x60\xe7\xa5\xcf\xfe\x91\x32\xea\x4f\x86\x13\x8b\xad\x49\
+\x80\x04\x48\x80\x04\x48\x80\x04\x62\x02\x12\x53\xe3\xd8\x1a\x3f\
+\xc9\xef\x5f\xee\x09\x00\x44\x6b\xa8\x06\x13\x00\x80\x60\x21\x01\
+\x12\x20\x01\x12\x48\x4d\x80\x0d\xe6\x13\x28\x2a\xa6\x16\x92\x00\
+\xdc\xbd\x69\xcd\x7d\x22\xfe\x6d\x52\xb8\x91\x00\x09\x90\x00\x09\
+\x90\x00\x09\x64\x27\x70\x5b\x2b\xa6\x66\xef\xa1\x47\xcb\x42\x12\
+\x00\x8c\x65\x1a\x8d\x8f\x62\xcf\x42\x02\x24\x40\x02\x24\x40\x02\
+\xc9\x09\xb0\x66\x27\x81\x22\x63\x69\x61\x09\xc0\x8e\xcd\x6b\xfe\
+\x56\x94\x98\x96\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\x48\x20\x3d\
+\x81\xe9\x56\x2c\x4d\xdf\x32\x41\x8b\xc2\x12\x00\x8c\xad\xb5\xde\
+\x86\x3d\x0b\x09\x90\x00\x09\x90\x00\x09\x24\x21\xc0\x3a\xc7\x08\
+\x14\x1d\x43\x0b\x4d\x00\xa6\x36\x8e\x7c\x56\x54\x79\x40\x0a\x37\
+\x12\x20\x01\x12\x20\x01\x12\x20\x81\xe4\x04\x1e\x68\xc5\xd0\xe4\
+\x2d\x52\xd6\x2c\x34\x01\x88\x65\xa9\xe9\x7a\xbc\xe7\x3f\x12\x20\
+\x01\x12\x20\x01\x12\xe8\x4b\x80\x27\x8f\x12\x28\x21\x76\x16\x9e\
+\x00\x4c\x5f\x36\xf2\x51\xa5\xf4\xf7\x14\xff\x48\x80\x04\x48\x80\
+\x04\x48\x80\x04\x12\x10\xd0\xdf\x6b\xc6\xce\x04\x55\x87\xa8\x52\
+\x78\x02\x00\xd9\x8c\x32\x1f\xc6\x9e\x85\x04\x48\x80\x04\x48\x80\
+\x04\x7a\x11\xe0\xf1\x26\x81\xb2\x62\x66\x29\x09\xc0\x69\xa7\x8c\
+\x20\x01\xf8\xe7\xa6\x6a\xfc\x4f\x02\x24\x40\x02\x24\x40\x02\x24\
+\xd0\x83\xc0\x3f\xb7\x62\x66\x8f\xd3\xf9\x1d\x2e\x25\x01\xb8\xf5\
+\x22\x3d\xa7\x55\xed\x43\x8a\x7f\x24\x40\x02\x24\x40\x02\x24\xd0\
+\x95\x00\x0f\x82\x80\x96\x58\x89\x98\xa9\x4a\xf8\x2b\x25\x01\x80\
+\x1e\x3f\x7c\xe4\x71\x24\x00\x07\xf0\x98\x85\x04\x48\x80\x04\x48\
+\x80\x04\x48\x60\x11\x81\x03\xad\x58\xb9\xe8\x44\x11\x07\x4a\x4b\
+\x00\x1e\xd8\x72\xd6\x13\x5a\xd5\xae\x55\xfc\x23\x01\x12\x20\x01\
+\x12\x20\x81\x05\x04\xf8\x54\x29\x2d\x31\x12\xb1\x52\x95\xf4\x57\
+\x5a\x02\x00\x7d\x96\x3e\xb2\x17\x09\xc0\x0f\xf0\x98\x85\x04\x48\
+\x80\x04\x48\x80\x04\x48\xe0\x28\x81\x1f\xb4\x62\xe4\xd1\x03\x45\
+\x3f\x28\x35\x01\xb8\x73\xcb\x8b\x8f\x18\xa5\x3e\x58\xb4\x52\xec\
+\x9f\x04\x48\x80\x04\x48\xc0\x25\x02\x94\x15\xb1\x11\x31\xb2\x4c\
+\x12\xa5\x26\x00\x50\x6c\xc7\xc4\xe8\x75\xb2\xff\xae\x14\x6e\x24\
+\x40\x02\x24\x40\x02\x24\x40\x02\x4a\x7d\xb7\x15\x1b\x4b\x65\x51\
+\x7a\x02\x10\x6b\x57\xd3\x1f\x88\xf7\xfc\x47\x02\x24\x40\x02\x24\
+\x10\x3c\x81\xe0\x01\x54\x14\x13\x2b\x49\x00\xf0\x0d\x47\x5a\xa9\
+\xfb\x82\x37\x3a\x01\x90\x00\x09\x90\x00\x09\x04\x4d\x00\xb1\x10\
+\x31\xb1\x0a\x08\x95\x24\x00\xb1\xa2\x5a\xbf\x2f\xde\xf3\x1f\x09\
+\x90\x00\x09\x90\x40\xc0\x04\x02\x57\xbd\xc2\x58\x58\x59\x02\x80\
+\x5f\x39\x32\xc6\xdc\x15\xb8\xe9\xa9\x3e\x09\x90\x00\x09\x90\x40\
+\xa0\x04\x10\x03\x11\x0b\xab\x52\xbf\xb2\x04\x20\x56\xd8\x98\x6b\
+\xe2\x3d\xff\x91\x00\x09\x90\x00\x09\x04\x49\x20\x68\xa5\x2b\x8e\
+\x81\x95\x26\x00\x3b\x36\xaf\xf9\x5b\x31\xfe\x2d\x52\xb8\x91\x00\
+\x09\x90\x00\x09\x90\x40\x48\x04\x6e\x69\xc5\xc0\xca\x74\xae\x34\
+\x01\x80\xd6\x0d\xd3\xf8\x23\xec\x59\x48\x80\x04\x48\x80\x04\x42\
+\x23\x10\xae\xbe\x36\xc4\xbe\xca\x13\x80\xbb\x37\xad\xb9\x4f\x2b\
+\x85\xef\x06\x08\x77\x26\x50\x73\x12\x20\x01\x12\x20\x81\x60\x08\
+\x20\xe6\x21\xf6\x55\xad\x70\xe5\x09\x00\x00\x1c\x5a\xb6\xf4\x3d\
+\xb2\x7f\x54\x0a\x37\x12\x20\x01\x12\x20\x81\x40\x08\x04\xaa\xe6\
+\xa3\xad\x98\x57\xb9\xfa\x56\x24\x00\x3b\x2f\x7d\xf6\x8f\x94\x56\
+\x5b\x14\xff\x48\x80\x04\x48\x80\x04\x48\xc0\x67\x02\x12\xeb\xe2\
+\x98\x67\x81\x8e\x56\x24\x00\xe0\x30\xbd\x71\x74\x52\xf6\xf7\x48\
+\xe1\x46\x02\x24\x40\x02\x24\xe0\x3d\x81\x20\x15\xbc\xa7\x15\xeb\
+\xac\x50\xde\x9a\x04\x00\x34\x1a\xa6\xf1\xfb\xd8\xb3\x90\x00\x09\
+\x90\x00\x09\x90\x80\x6f\x04\x6c\x8b\x71\x56\x25\x00\x77\x6f\x5a\
+\xf3\x37\x62\xf0\x4f\x48\xe1\x46\x02\x24\x40\x02\x24\xe0\x31\x81\
+\x00\x55\xfb\x44\x2b\xc6\x59\xa3\xba\x55\x09\x00\xa8\x1c\x69\xd4\
+\x7e\x4f\xf6\x87\xa4\x70\x23\x01\x12\x20\x01\x12\x20\x01\x1f\x08\
+\x1c\x6a\xc5\x36\xab\x74\xb1\x2e\x01\xb8\x67\xf3\xaa\xbd\x4a\xab\
+\x77\x59\x45\x89\xc2\x90\x00\x09\x90\x00\x09\xe4\x48\x20\xb0\xae\
+\x24\xa6\xc5\xb1\xcd\x32\xb5\xad\x4b\x00\xc0\x67\x7a\xe3\xe8\x87\
+\xb4\x52\x3b\xf0\x98\x85\x04\x48\x80\x04\x48\x80\x04\x5c\x25\x80\
+\x58\x86\x98\x66\xa3\xfc\x56\x26\x00\x00\x35\xd7\x68\x5c\x8d\x3d\
+\x0b\x09\x90\x00\x09\x90\x80\x5f\x04\x42\xd2\xc6\xe6\x58\x66\x6d\
+\x02\x70\xf7\xe6\x35\x77\x29\xa5\xaf\x57\xfc\x23\x01\x12\x20\x01\
+\x12\x20\x01\x27\x09\xe8\xeb\x9b\xb1\xcc\x4e\xe1\xad\x4d\x00\x80\
+\xeb\xc9\x0d\x7d\x95\xec\xbf\x23\x85\x1b\x09\x90\x00\x09\x90\x80\
+\x17\x04\x82\x51\xe2\x3b\xad\x18\x66\xad\xc2\x56\x27\x00\x5f\xdc\
+\xbc\xea\x71\x6d\xcc\x3b\xad\xa5\x47\xc1\x48\x80\x04\x48\x80\x04\
+\x48\xa0\x0b\x01\xc4\x2e\xc4\xb0\x2e\xa7\xac\x39\x64\x75\x02\x00\
+\x4a\x53\x9b\x56\xdf\x2a\xfb\x4f\x4a\xe1\x46\x02\x24\x40\x02\x24\
+\xe0\x38\x81\x40\xc4\xff\x64\x2b\x76\x59\xad\xae\xf5\x09\x00\xe8\
+\xd5\x1a\xb5\x77\xc8\xfe\x80\x14\x6e\x24\x40\x02\x24\x40\x02\x24\
+\x60\x33\x81\x03\xad\x98\x65\xb3\x8c\xb1\x6c\x4e\x24\x00\xdb\x37\
+\xaf\x3a\xa0\x55\xed\x4a\xc5\x3f\x12\x20\x01\x12\x20\x01\x87\x09\
+\xf8\x2f\xba\x96\x58\x85\x98\xa5\x1c\xf8\x73\x22\x01\x00\xc7\xa9\
+\x89\x55\x9f\x56\x4a\xdf\xac\xf8\x47\x02\x24\x40\x02\x24\x40\x02\
+\x56\x12\xd0\x37\x37\x63\x95\x95\xc2\x2d\x12\xca\x99\x04\x00\x92\
+\x9b\x25\xb5\x2b\x64\xbf\x5f\x0a\x37\x12\x20\x01\x12\x20\x01\xc7\
+\x08\x78\x2e\xee\xfe\x56\x8c\x72\x46\x4d\xa7\x12\x80\x1d\x6f\x3d\
+\x63\xbf\xd6\xfa\x72\x67\xe8\x52\x50\x12\x20\x01\x12\x20\x81\x20\
+\x08\x20\x36\x21\x46\xb9\xa4\xac\x53\x09\x00\xc0\x4e\x6d\x1c\xf9\
+\xac\xec\x6f\x92\xc2\x8d\x04\x48\x80\x04\x48\xc0\x19\x02\x5e\x0b\
+\x7a\x53\x2b\x36\x39\xa5\xa4\x73\x09\x00\xe8\x3e\xb6\xec\x27\x6f\
+\x93\xfd\x83\x52\xb8\x91\x00\x09\x90\x00\x09\x90\x40\x95\x04\x1e\
+\x6c\xc5\xa4\x2a\x65\xc8\x34\xb6\x93\x09\xc0\xce\x4b\x5f\x70\x50\
+\x19\xb5\x39\x93\xc6\x6c\x44\x02\x24\x40\x02\x24\x50\x3a\x01\x6f\
+\x07\x94\x58\x14\xc7\x24\x07\x15\x74\x32\x01\x00\xe7\xe9\x4d\xa3\
+\x5f\x94\xfd\x35\x52\xb8\x91\x00\x09\x90\x00\x09\x90\x40\x15\x04\
+\xae\x69\xc5\xa2\x2a\xc6\x1e\x7a\x4c\x67\x13\x00\x68\x3e\x3d\x31\
+\xfa\x2e\xa3\xcd\x5d\x78\xcc\x42\x02\x24\x40\x02\x24\x60\x2b\x01\
+\xff\xe4\x42\xec\x41\x0c\x72\x59\x33\xa7\x13\x00\x80\xd7\x66\x6e\
+\xa3\xec\x9f\x90\xc2\x8d\x04\x48\x80\x04\x48\x80\x04\xca\x20\xf0\
+\x44\x2b\xf6\x94\x31\x56\x61\x63\x38\x9f\x00\x4c\x4f\x3c\xe7\x5b\
+\x5a\xd5\xde\xaa\xf8\x47\x02\x24\x40\x02\x24\x60\x25\x01\xdf\x84\
+\xd2\x12\x73\x10\x7b\x94\xe3\x7f\xce\x27\x00\xe0\x3f\x35\xb1\xea\
+\xe3\x4a\xe9\x1b\x15\xff\x48\x80\x04\x48\x80\x04\x48\xa0\x50\x02\
+\xfa\xc6\x66\xcc\x29\x74\x90\x52\x3a\xf7\x22\x01\x00\xa9\xe9\x89\
+\x91\xb7\xc8\x7e\xa7\x14\x6e\x24\x40\x02\x24\x40\x02\xd6\x10\xf0\
+\x4a\x90\x9d\xad\x58\xe3\x85\x52\xde\x24\x00\xb0\x86\x9e\x6b\x5c\
+\x2a\x7b\x23\x85\x1b\x09\x90\x00\x09\x90\x00\x09\xe4\x49\xc0\xb4\
+\x62\x4c\x9e\x7d\x56\xda\x97\x57\x09\xc0\xd4\xdb\xd6\xec\x54\xba\
+\xf6\x5b\x95\x12\xe5\xe0\x24\x40\x02\x24\x40\x02\x47\x09\x78\xf3\
+\x40\x62\x4b\x1c\x63\xbc\x51\x48\x29\xaf\x12\x00\xd8\x65\x7a\xe3\
+\xaa\x8f\xc9\xbe\x2e\x85\x1b\x09\x90\x00\x09\x90\x00\x09\xe4\x41\
+\xa0\xde\x8a\x2d\x79\xf4\x65\x4d\x1f\xde\x25\x00\x20\x3b\x3d\x31\
+\xba\x59\x29\x7d\xa7\xe2\x1f\x09\x90\x00\x09\x90\x40\x85\x04\x7c\
+\x18\x5a\xdf\xd9\x8c\x29\x3e\xe8\x32\x5f\x07\x2f\x13\x00\xa8\xa8\
+\x6b\xea\x4d\xb2\x3f\x20\x85\x1b\x09\x90\x00\x09\x90\x00\x09\x64\
+\x21\x70\xa0\x15\x4b\xb2\xb4\xb5\xbe\x8d\xb7\x09\xc0\xd4\x65\x23\
+\xff\xd8\x50\x8d\x37\x5a\x6f\x01\x0a\x48\x02\x24\x40\x02\x9e\x12\
+\x70\x5d\x2d\xc4\x10\xc4\x12\xd7\xf5\xe8\x25\xbf\xb7\x09\x00\x14\
+\xbe\x7b\x62\xcd\x17\xb4\x56\xbf\x8d\xc7\x2c\x24\x40\x02\x24\x40\
+\x02\x24\x90\x94\x00\x62\x07\x62\x48\xd2\xfa\x2e\xd6\xf3\x3a\x01\
+\x80\x41\xa6\x36\x8e\x5e\x6b\x94\xfa\x13\x3c\x66\x21\x01\x12\x20\
+\x01\x12\x28\x8b\x80\xbb\xe3\x20\x66\x20\x76\xb8\xab\x41\x32\xc9\
+\xbd\x4f\x00\x80\x61\xc7\xc4\x28\xbe\x1f\xe0\x2b\x78\xcc\x42\x02\
+\x24\x40\x02\x24\x40\x02\x7d\x08\x7c\xa5\x15\x33\xfa\x54\xf1\xe3\
+\x54\x10\x09\x00\x4c\xd5\x58\xa2\x7e\x43\xf6\xdf\x95\xc2\x8d\x04\
+\x48\x80\x04\x48\xa0\x60\x02\x8e\x76\xff\xdd\x56\xac\x70\x54\xfc\
+\x74\x62\x07\x93\x00\xdc\xfd\xd6\xd1\x7d\x4a\xab\xd7\xa5\xc3\xc3\
+\xda\x24\x40\x02\x24\x40\x02\xc1\x10\x90\x18\x11\xc7\x8a\x40\x14\
+\x0e\x26\x01\x80\x3d\xa7\x37\x8e\x4e\xe9\x9a\xbe\x18\x8f\x59\x48\
+\x80\x04\x48\x80\x04\x8a\x22\xe0\x5e\xbf\x88\x0d\x88\x11\xee\x49\
+\x9e\x5d\xe2\xa0\x12\x00\x60\x9a\xba\x6c\xe4\x33\x5a\xd5\xae\x52\
+\xfc\x23\x01\x12\x20\x01\x12\x20\x01\x21\xa0\x25\x26\x20\x36\xa8\
+\xc0\xfe\x82\x4b\x00\x60\xdf\xa9\x89\x55\x1f\x90\x3d\xbf\x2e\x58\
+\x20\x70\x23\x01\x12\x20\x81\xbc\x09\x38\xd6\x5f\xbd\x15\x13\x1c\
+\x13\x7b\x78\x71\x83\x4c\x00\x80\x6d\x7a\x62\x74\xb3\x56\xfa\xf3\
+\x78\xcc\x42\x02\x24\x40\x02\x24\x10\x1e\x01\xc4\x00\xc4\x82\xf0\
+\x34\x6f\x6a\x1c\x6c\x02\x00\xf5\x5f\xf6\xc8\xaa\x57\x2b\xad\xb6\
+\xe3\x31\x0b\x09\x90\x00\x09\x90\x40\x1e\x04\x1c\xe9\x43\x7c\x7f\
+\x1c\x03\x1c\x11\xb7\x08\x31\x83\x4e\x00\xb6\x6c\xd1\x0d\x73\xf0\
+\xb1\x0b\x04\xec\x6e\x29\xdc\x48\x80\x04\x48\x80\x04\xc2\x20\xb0\
+\x1b\xbe\x1f\x31\x20\x0c\x75\xbb\x6b\x19\x74\x02\x00\x24\x3b\xde\
+\xf1\xbc\xfd\xb5\xc6\xe1\x5f\x97\xc7\xfc\xe1\x20\x81\xc0\x8d\x04\
+\x48\x80\x04\x86\x21\xe0\x40\xdb\x03\xf0\xf9\xf0\xfd\x0e\xc8\x5a\
+\xa8\x88\xc1\x27\x00\xa0\xbb\x7d\xf3\x59\x0f\xa8\x23\x87\x7f\x4d\
+\x1e\x1f\x91\xc2\x8d\x04\x48\x80\x04\x48\xc0\x4f\x02\x47\xe0\xeb\
+\x63\x9f\xef\xa7\x7e\xa9\xb4\x62\x02\xd0\xc2\x35\x7d\xf9\x59\x53\
+\x5a\x35\x5e\xd5\x7a\xca\x1d\x09\x90\x00\x09\x90\x40\x6a\x02\x76\
+\x37\x80\x8f\x87\xaf\xb7\x5b\xca\xf2\xa4\x63\x02\xd0\xc1\x7a\x2a\
+\xfe\xf5\x40\xfd\xda\x8e\x43\x7c\x48\x02\x24\x40\x02\x24\xe0\x01\
+\x01\xad\xf5\x6b\xe1\xe3\x3d\x50\x25\x37\x15\x98\x00\x2c\x40\x39\
+\xb5\x71\xe4\xb3\x35\xad\xde\xbc\xe0\x30\x9f\x92\x00\x09\x90\x00\
+\x09\x0c\x20\x60\xeb\x69\xf8\x74\xf8\x76\x5b\xe5\xab\x4a\x2e\x26\
+\x00\x5d\xc8\x6f\xdf\x38\xfa\xa7\xda\x98\xcb\xbb\x9c\xe2\x21\x12\
+\x20\x01\x12\x20\x01\x87\x08\xc0\x35\xa6\x8b\x6a\x00\x00\x0e\xe2\
+\x49\x44\x41\x54\x97\xc3\xa7\x3b\x24\x72\x69\xa2\x32\x01\xe8\x81\
+\x7a\x6a\xd3\xea\x0f\x6b\x65\xf8\x95\xc1\x3d\xf8\xf0\x30\x09\x90\
+\x00\x09\xcc\x27\x60\xdf\x33\xf8\x70\xf8\x72\xfb\x24\xb3\x43\x22\
+\x26\x00\x7d\xec\x30\x35\xb1\xfa\x03\xca\x98\x77\xf7\xa9\xc2\x53\
+\x24\x40\x02\x24\x40\x02\x36\x12\x10\xdf\x1d\xfb\x70\x1b\x65\xb3\
+\x44\x26\x26\x00\x03\x0c\x31\xbd\x69\xf5\x1f\x4a\x95\xf7\x48\xe1\
+\x46\x02\x24\x40\x02\x24\xd0\x83\x80\x65\x87\xdf\xd3\xf2\xdd\x96\
+\x89\x65\x97\x38\x4c\x00\x12\xd8\x63\x7a\x62\xf4\xf7\x8d\x32\x7f\
+\x94\xa0\x2a\xab\x90\x00\x09\x90\x00\x09\x54\x48\x00\xbe\x1a\x3e\
+\xbb\x42\x11\x9c\x19\x9a\x09\x40\x42\x53\xed\x98\x58\xfd\x7b\x98\
+\x58\x09\xab\xb3\x1a\x09\x90\x00\x09\x04\x44\xc0\x0e\x55\xe1\xa3\
+\xe1\xab\xed\x90\xc6\x7e\x29\x98\x00\xa4\xb0\x51\x6b\x62\xf1\xe5\
+\x80\x14\xcc\x58\x95\x04\x48\x80\x04\x4a\x22\xf0\x9e\x96\x8f\x2e\
+\x69\x38\xf7\x87\x61\x02\x90\xd2\x86\xf1\xad\x25\xc3\x37\x06\xa6\
+\xc4\xc6\xea\x24\x40\x02\x1e\x13\xa8\x5c\x35\xf1\xc9\xb1\x6f\xae\
+\x5c\x10\xb7\x04\x60\x02\x90\xc1\x5e\x78\x73\x89\xe6\x47\x04\x33\
+\x90\x63\x13\x12\x20\x01\x12\xc8\x97\x00\x7c\x31\x7c\x72\xbe\xbd\
+\x86\xd1\x1b\x13\x80\x8c\x76\xc6\xc7\x4b\xf0\x05\x13\x19\x9b\xb3\
+\x19\x09\x90\x00\x09\x78\x42\xa0\x3a\x35\xe0\x83\xe1\x8b\xab\x93\
+\xc0\xed\x91\x99\x00\x0c\x61\x3f\x7c\xc1\x04\xbe\x62\x72\x88\x2e\
+\xd8\x94\x04\x48\x80\x04\x48\x20\x03\x01\xf8\x5e\xf8\xe0\x0c\x4d\
+\xd9\xa4\x45\x80\x09\x40\x0b\x44\xd6\x1d\xbe\x62\x12\x3f\x32\x91\
+\xb5\x3d\xdb\x91\x00\x09\x90\x80\xcb\x04\xaa\x90\x1d\x3e\x17\xbe\
+\xb7\x8a\xb1\x7d\x1a\x93\x09\x40\x0e\xd6\xc4\x8f\x4c\x68\xd5\xf8\
+\x8f\xd2\xd5\x11\x29\xdc\x48\x80\x04\x48\x80\x04\x8a\x21\x70\x04\
+\xbe\x16\x3e\xb7\x98\xee\xc3\xea\x95\x09\x40\x4e\xf6\x9e\x9a\x58\
+\xf3\x05\x75\xe4\xf0\x8b\xa5\xbb\x03\x52\xb8\x91\x00\x09\x90\x40\
+\x00\x04\x4a\x55\xf1\x00\x7c\x6c\xec\x6b\x4b\x1d\xd6\xdf\xc1\x98\
+\x00\xe4\x68\xdb\xe9\xcb\xcf\x9a\xaa\x35\x0e\x9f\x2f\x5d\xee\x96\
+\xc2\x8d\x04\x48\x80\x04\x48\x20\x1f\x02\xbb\xe1\x5b\xe1\x63\xf3\
+\xe9\x8e\xbd\x80\x00\x13\x00\x50\xc8\xb1\x6c\xdf\x7c\xd6\x03\xe6\
+\xd0\x63\xe7\x29\xad\xb6\xe7\xd8\x2d\xbb\x22\x01\x12\x20\x01\xeb\
+\x08\x94\x22\x90\xf8\x52\xf8\x54\xf8\xd6\x52\xc6\x0b\x68\x10\x26\
+\x00\x05\x18\x7b\xc7\x3b\x9e\xb7\xff\x97\x0e\x8c\x9c\xaf\x95\xfe\
+\x7c\x01\xdd\xb3\x4b\x12\x20\x01\x12\x08\x82\x00\x7c\x28\x7c\x29\
+\x7c\x6a\x10\x0a\x97\xac\x24\x13\x80\x82\x80\x6f\xd9\xa2\x1b\x53\
+\x13\x23\x17\x4a\xf7\x75\x29\xdc\x48\x80\x04\x48\xc0\x33\x02\x85\
+\xab\x53\x87\x0f\x85\x2f\x2d\x7c\xa4\x40\x07\x60\x02\x50\xb0\xe1\
+\xa7\x27\x46\x37\x6b\x55\xbb\x4a\xf1\x8f\x04\x48\x80\x04\x48\x20\
+\x11\x01\x2d\x3e\x13\xbe\x53\xf1\xaf\x50\x02\x4c\x00\x0a\xc5\xdb\
+\xec\x7c\x6a\x62\xd5\x07\x74\x4d\x5f\xdc\x7c\xc6\xff\x24\x40\x02\
+\x24\xe0\x3e\x81\xa2\x34\x80\xaf\x84\xcf\x2c\xaa\x7f\xf6\x7b\x8c\
+\x00\x13\x80\x63\x2c\x0a\x7d\x34\x75\xd9\xc8\x67\x94\x56\xeb\x65\
+\x90\xef\x4a\xe1\x46\x02\x24\x40\x02\x24\x30\x9f\xc0\x77\xe1\x23\
+\x63\x5f\x39\xff\x38\x9f\x15\x44\x80\x09\x40\x41\x60\xbb\x75\x3b\
+\xbd\x71\x74\xaa\xb1\x44\x8d\xcb\xb9\xaf\x48\xe1\x46\x02\x24\x40\
+\x02\x8e\x12\xc8\x5d\xec\xaf\xc0\x37\xc2\x47\xe6\xde\x33\x3b\xec\
+\x49\x80\x09\x40\x4f\x34\xc5\x9c\xb8\xfb\xad\xa3\xfb\xa6\x27\x46\
+\x5f\x6a\x94\xfa\x93\x62\x46\x60\xaf\x24\x40\x02\x24\xe0\x0e\x01\
+\xf8\x42\xf8\x44\xf8\x46\x77\xa4\xf6\x43\x52\x26\x00\x15\xd9\x71\
+\xc7\xc4\xe8\xa5\x5a\xab\xdf\xae\x68\x78\x0e\x4b\x02\x24\x40\x02\
+\x99\x09\xe4\xd5\x10\x3e\x10\xbe\x30\xaf\xfe\xd8\x4f\x3a\x02\x4c\
+\x00\xd2\xf1\xca\xb5\xf6\xd4\xc6\xd1\x6b\x1b\xcd\xdf\x10\xe0\xd7\
+\x07\xe7\x4a\x96\x9d\x91\x00\x09\x58\x4e\xe0\x00\x7c\x1f\x7c\xa0\
+\xe5\x72\x7a\x2d\x1e\x13\x80\x8a\xcd\x7b\xf7\xc4\x9a\x2f\xe8\x9a\
+\xfe\x05\xa5\xf4\x9d\x8a\x7f\x24\x40\x02\x24\x60\x3d\x81\x61\x05\
+\xd4\x77\xc2\xe7\xc1\xf7\x0d\xdb\x13\xdb\x0f\x47\x80\x09\xc0\x70\
+\xfc\x72\x69\x3d\x75\xd9\xc8\x3f\x4e\x4f\x8c\xe0\x87\x84\xf8\xa5\
+\x41\xb9\x10\x65\x27\x24\x40\x02\x96\x12\xa8\xc3\xd7\xc1\xe7\x59\
+\x2a\x5f\x50\x62\x31\x01\xb0\xc8\xdc\xd3\x13\xa3\x9b\x95\xae\x5d\
+\x22\x22\x19\x29\xdc\x48\x80\x04\x48\xc0\x3a\x02\x19\x05\x32\xf0\
+\x6d\xb1\x8f\xcb\xd8\x01\x9b\xe5\x4f\x80\x09\x40\xfe\x4c\x87\xea\
+\x71\x7a\xe3\xaa\x8f\xe9\xb9\xc6\x0b\xa5\x93\x9d\x52\xb8\x91\x00\
+\x09\x90\x80\xeb\x04\x76\xc2\xa7\xc1\xb7\xb9\xae\x88\x6f\xf2\x33\
+\x01\xb0\xd0\xa2\x53\x6f\x5b\xb3\x53\x32\xe5\x17\x28\xa5\x6f\x54\
+\xfc\x23\x01\x12\x20\x01\x6b\x08\xa4\x15\x44\xdf\x08\x5f\x06\x9f\
+\x96\xb6\x25\xeb\x17\x4f\x80\x09\x40\xf1\x8c\x33\x8f\x30\x3d\x31\
+\xf2\x16\xad\x6a\x6f\x52\x4a\x3d\x21\x85\x1b\x09\x90\x00\x09\xb8\
+\x42\xe0\x09\x2d\xbe\x0b\x3e\x4c\xf1\xcf\x5a\x02\x4c\x00\xac\x35\
+\x4d\x53\xb0\xa9\x89\x55\x1f\x57\xea\xc8\xbf\x37\xda\xdc\xd5\x3c\
+\xc2\xff\x24\x40\x02\x24\x50\x0d\x81\x24\xa3\x36\x7d\xd5\x91\x7f\
+\xdf\xf4\x5d\x49\x5a\xb0\x4e\x55\x04\x98\x00\x54\x45\x3e\xc5\xb8\
+\xd3\x13\xcf\xf9\xd6\x8e\x8d\xab\xcf\x97\x26\xd7\x48\xe1\x46\x02\
+\x24\x40\x02\xb6\x12\xb8\x06\xbe\x0a\x3e\xcb\x56\x01\x29\xd7\x31\
+\x02\x4c\x00\x8e\xb1\xb0\xfe\xd1\xf4\xc4\xe8\xbb\x94\x51\xff\xbf\
+\x08\xfa\xa0\x14\x6e\x24\x40\x02\x24\x50\x22\x81\xbe\x43\x3d\x08\
+\xdf\x14\xfb\xa8\xbe\xd5\x78\xd2\x26\x02\x4c\x00\x6c\xb2\x46\x02\
+\x59\xa6\x37\x8d\x7e\xf1\xb1\x65\x3f\x79\x9e\x54\xbd\x49\x0a\x37\
+\x12\x20\x01\x12\xa8\x9a\xc0\x4d\xf0\x49\xf0\x4d\x55\x0b\xc2\xf1\
+\xd3\x11\x60\x02\x90\x8e\x97\x15\xb5\x77\x5e\xfa\x82\x83\x92\x69\
+\xff\x96\xd6\xfa\xb5\x22\xd0\x7e\x29\xdc\x48\x80\x04\x48\xa0\x50\
+\x02\x5d\x3a\xdf\x0f\x1f\x04\x5f\x04\x9f\xd4\xe5\x3c\x0f\x59\x4e\
+\x80\x09\x80\xe5\x06\xea\x27\xde\xd4\xc6\x91\xcf\x9a\x25\x4b\xce\
+\x56\x4a\xdf\xac\xf8\x47\x02\x24\x40\x02\xa5\x11\xd0\x37\xc3\xf7\
+\xc0\x07\x95\x36\x24\x07\xca\x9d\x00\x13\x80\xdc\x91\x96\xdb\xe1\
+\x8e\xb7\x9e\xb1\x7f\x7a\x62\xe4\xbf\x68\x55\xfb\x0d\xa5\x14\x7f\
+\x54\x48\x20\x70\x23\x01\x12\xc8\x9b\xc0\xd1\xfe\x0e\x68\xf1\x35\
+\xf0\x39\xf0\x3d\x8a\x7f\x4e\x13\x60\x02\xe0\xb4\xf9\x8e\x09\x3f\
+\x35\xb1\xea\xd3\xb5\x46\xed\x39\x72\xe4\x93\x52\xb8\x91\x00\x09\
+\x90\x40\xde\x04\x3e\x09\x1f\x03\x5f\x93\x77\xc7\xec\xaf\x1a\x02\
+\x4c\x00\xaa\xe1\x5e\xc8\xa8\xdb\x37\xaf\x3a\x30\x3d\x31\xfa\x06\
+\x6d\xcc\x45\x32\xc0\x77\xa4\x70\x23\x01\x12\x20\x81\x61\x09\x7c\
+\xa7\xa6\x6b\x17\xc2\xb7\xc0\xc7\x0c\xdb\x19\xdb\xdb\x43\x80\x09\
+\x80\x3d\xb6\xc8\x4d\x92\xa9\x4d\xab\x6f\x7d\x72\xa3\xb6\x46\x29\
+\x7d\xbd\xe2\x1f\x09\x90\x00\x09\x64\x26\xa0\xaf\x87\x2f\xd9\xbe\
+\x71\xd5\xe7\x33\x77\xc1\x86\xd6\x12\x60\x02\x60\xad\x69\x86\x13\
+\xec\x8b\x9b\x57\x3d\x3e\x3d\x31\xf2\xf6\x46\xa3\x71\xbe\x56\x6a\
+\xc7\x70\xbd\xb1\x35\x09\x90\x40\x48\x04\xe0\x33\xe0\x3b\xe0\x43\
+\xbe\xb8\x79\xd5\xe3\x21\xe9\x1e\x92\xae\x4c\x00\x3c\xb7\xf6\xdd\
+\x9b\xd7\xdc\x35\x35\x31\x3a\xa6\xb4\xba\x42\x54\x3d\x24\x85\x1b\
+\x09\x90\x00\x09\xf4\x22\x70\x08\xbe\x02\x3e\x03\xbe\xa3\x57\x25\
+\x1e\xf7\x83\x00\x13\x00\x3f\xec\x38\x50\x8b\xe9\x8d\xa3\x1f\x3a\
+\xd2\xa8\x8d\x48\xc5\x4f\x48\xe1\x46\x02\x24\x40\x02\x0b\x09\x7c\
+\x02\x3e\x02\xbe\xa2\xf3\x04\x1f\xfb\x4b\x80\x09\x80\xbf\xb6\x5d\
+\xa4\xd9\x3d\x9b\x57\xed\x9d\x9e\x18\xfd\xcd\x86\x69\xfc\xaa\x9c\
+\xbc\x47\x0a\x37\x12\x20\x01\x12\xb8\x07\x3e\x01\xbe\xe1\x1e\xf1\
+\x11\xc4\x11\x0e\x01\x26\x00\xe1\xd8\xfa\xa8\xa6\x77\x6f\x5a\xf3\
+\x37\xb2\xd8\x7f\x41\x6e\xf5\x6d\x92\x83\x8f\x4a\xe1\x46\x02\x24\
+\x10\x1e\x81\x47\xe1\x03\xe0\x0b\xe0\x13\xba\xab\xcf\xa3\x3e\x13\
+\x60\x02\xe0\xb3\x75\x07\xe8\x26\xb7\xfa\x26\x1f\x5b\xb6\xf4\xd9\
+\x5a\xa9\xeb\x06\x54\xe5\x69\x12\x20\x01\x8f\x08\x60\xcd\x63\xed\
+\xc3\x07\x78\xa4\x16\x55\x49\x49\x80\x09\x40\x4a\x60\xbe\x55\xdf\
+\x79\xe9\xb3\x7f\x34\x35\x31\x7a\xa5\xdc\x02\x7c\xae\xe8\x76\x8b\
+\x14\x6e\x24\x40\x02\xfe\x12\xb8\x05\x6b\x1d\x6b\x1e\x6b\x7f\x90\
+\x9a\x3c\xef\x37\x01\x26\x00\x7e\xdb\x37\xb1\x76\x72\x0b\xf0\x3e\
+\xb9\x15\xf8\x6a\xd3\x68\xfc\x8a\x31\xe6\xae\xc4\x0d\x59\x91\x04\
+\x48\xc0\x7a\x02\x58\xd3\x58\xdb\x58\xe3\x58\xeb\xd6\x0b\x4c\x01\
+\x4b\x21\xc0\x04\xa0\x14\xcc\xee\x0c\xb2\x63\xf3\x9a\xbf\xdd\xb1\
+\x69\xf5\xf9\xf8\x95\x2f\xb9\x4d\x78\x9f\x3b\x92\x53\x52\x12\x20\
+\x81\x85\x04\xb0\x86\xb1\x96\xb1\xa6\xb1\xb6\x17\x9e\xef\xff\x9c\
+\x67\x7d\x27\xc0\x04\xc0\x77\x0b\x67\xd4\x0f\xbf\xf2\x25\xb7\x09\
+\x9f\xab\x6a\xfa\xad\xd2\xc5\x77\xa5\x70\x23\x01\x12\x70\x87\xc0\
+\x77\xb1\x76\xb1\x86\xb1\x96\xdd\x11\x9b\x92\x96\x49\x80\x09\x40\
+\x99\xb4\x1d\x1c\x6b\xfa\xb2\x91\x8f\xca\x6d\xc3\x67\x19\xa5\xae\
+\x14\xf1\x7f\x20\x85\x1b\x09\x90\x80\xbd\x04\x7e\x80\xb5\x8a\x35\
+\x8b\xb5\x3b\x8c\x98\x6c\xeb\x3f\x01\x26\x00\xfe\xdb\x38\x17\x0d\
+\x77\x4c\x8c\x5e\xb7\xec\x91\x87\x4f\xd7\xaa\x76\x95\x52\xea\x80\
+\x14\x6e\x24\x40\x02\xf6\x10\xc0\xcf\xf4\x5e\x85\x35\x8a\xb5\x6a\
+\x8f\x58\x94\xc4\x66\x02\x4c\x00\x6c\xb6\x8e\x65\xb2\xdd\xb9\xe5\
+\xc5\x47\xa6\x26\x56\x7d\xe0\x5f\x1e\x39\xbc\x52\x37\x13\x81\x7f\
+\x56\xfc\x23\x01\x12\xa8\x92\xc0\x3f\x6b\x59\x8b\x58\x93\x58\x9b\
+\x58\xa3\x2a\x97\x3f\x76\x12\x02\x01\x26\x00\x21\x58\x39\x67\x1d\
+\x1f\xd8\x72\xd6\x13\x70\x36\xa7\x9e\x32\x72\x1a\x6e\x37\x2a\xa5\
+\xbf\xa7\xf8\x47\x02\x24\x50\x22\x01\xfd\x3d\xac\x3d\xac\x41\xac\
+\x45\xac\xc9\x12\x07\xe7\x50\x9e\x10\x60\x02\xe0\x89\x21\xab\x50\
+\xe3\xd6\x8b\xf4\x1c\x6e\x37\x4e\x4f\x8c\xfc\x1c\xde\x70\x24\x32\
+\x3c\x20\x85\x1b\x09\x90\x40\x71\x04\x1e\xc0\x5a\xc3\x9a\xc3\xda\
+\xc3\x1a\x2c\x62\x28\xf6\x19\x06\x01\x26\x00\x61\xd8\xb9\x70\x2d\
+\xf1\x86\xa3\xe9\x89\xd1\xe7\xe0\x23\x47\x32\xd8\xb4\x14\x6e\x24\
+\x40\x02\xf9\x11\x98\xc6\xda\xc2\x1a\xc3\x5a\xcb\xaf\x5b\xf6\x14\
+\x32\x01\x26\x00\x21\x5b\xbf\x00\xdd\xf1\x91\x23\x71\x52\xe3\xf8\
+\xd2\x11\xe9\xfe\x36\x29\xdc\x48\x80\x04\xb2\x13\xb8\x0d\x6b\x09\
+\x6b\x0a\x6b\x2b\x7b\x37\x69\x5a\xb2\x6e\x28\x04\x98\x00\x84\x62\
+\xe9\x92\xf5\xc4\x97\x8e\x88\xd3\xfa\x35\x7c\xed\xa8\x32\x6a\x52\
+\x86\x7f\x42\x0a\x37\x12\x20\x81\xc1\x04\x9e\xc0\x9a\xc1\xda\xc1\
+\x1a\xc2\x5a\x1a\xdc\x84\x35\x48\x20\x3d\x01\x26\x00\xe9\x99\xb1\
+\x45\x0a\x02\xf8\xda\xd1\xe9\x4d\xa3\x9b\x1e\x5b\xb6\xf4\x14\xad\
+\xd5\x6f\x4b\xd3\xdd\x52\xb8\x91\x00\x09\x2c\x26\xb0\x1b\x6b\x04\
+\x6b\x05\x6b\x06\x6b\x67\x71\x95\xe2\x8f\x70\x84\x70\x08\x30\x01\
+\x08\xc7\xd6\x95\x6a\x8a\x1f\x1e\x99\xda\x38\x7a\xad\x5c\xd1\xac\
+\x31\xca\x6c\x10\x61\xee\x90\xc2\x8d\x04\x48\x40\xa9\x3b\xb0\x26\
+\xb0\x36\xb0\x46\xb0\x56\x08\x85\x04\xca\x20\xc0\x04\xa0\x0c\xca\
+\x1c\x63\x1e\x81\x1d\x13\xab\xef\x10\x67\xb7\x61\xc9\xdc\xdc\x88\
+\xd6\xfa\xbd\x5a\xa9\xbd\xf3\x2a\xf0\x09\x09\x78\x4e\x00\x73\x1e\
+\x73\x1f\x6b\x00\x6b\x01\x6b\xc2\x0e\x95\x29\x45\x48\x04\x98\x00\
+\x84\x64\x6d\xcb\x74\xfd\xfb\xb7\x9d\xb9\x67\x6a\xe3\xc8\xef\x4e\
+\x4d\x8c\x9e\x6e\x8c\xbe\x40\xc4\xe3\x5d\x01\x81\xc0\xcd\x6b\x02\
+\x77\x60\xae\x63\xce\x63\xee\x63\x0d\x78\xad\x2d\x95\xb3\x9a\x00\
+\x13\x00\xab\xcd\x13\x8e\x70\x3b\x36\x8d\xfc\x25\xae\x84\xd4\x91\
+\xc3\x3f\xa7\xb4\xfa\x1d\xb9\x42\xe2\x2f\x11\x86\x63\x7e\xaf\x35\
+\x8d\xe7\xb2\xcc\x69\xcc\x6d\xcc\x71\xcc\x75\x5b\x15\xa6\x5c\x61\
+\x11\x60\x02\x10\x96\xbd\xad\xd7\x76\xfa\xf2\xb3\xbe\x37\xbd\x71\
+\xf4\xfd\x72\x85\xf4\x5c\x49\x04\xd6\xe3\xdd\xd0\x22\x34\x7f\x7b\
+\x40\x20\x70\x73\x8a\xc0\x81\x78\xee\x6a\xb5\x1e\x73\x19\x73\x1a\
+\x73\xdb\x29\x0d\x28\xac\xf7\x04\x98\x00\x78\x6f\x62\x77\x15\x14\
+\xa7\x39\x85\x77\x43\xcb\x55\xd3\x29\x46\xd5\x36\x28\xa5\x6f\x56\
+\x4a\x3d\x2e\x85\x1b\x09\xd8\x48\x40\xe6\xa6\xbe\x19\x73\x15\x73\
+\x36\x9e\xbb\x1b\x47\xa7\x6c\x14\xb4\xbb\x4c\x3c\x1a\x1a\x81\x5a\
+\x68\x0a\x53\x5f\x37\x09\xec\x98\x58\x75\xc7\xf4\xc4\xc8\x7f\x79\
+\x72\xa3\xf6\x14\xad\xf5\x6b\xb5\xd2\x9f\x17\x4d\xe6\xa4\x70\x23\
+\x81\x2a\x09\xcc\x61\x2e\x62\x4e\x62\x6e\x62\x8e\x62\xae\x56\x29\
+\x10\xc7\x26\x81\xa4\x04\x98\x00\x24\x25\xc5\x7a\x56\x10\xf8\xe2\
+\xe6\x55\x8f\x4f\x6d\x1c\xf9\xec\xd4\xc4\xc8\x85\x8f\x2d\xfb\xc9\
+\x93\xe1\x78\xe5\xa5\x82\xcf\x89\x70\x87\xa4\x70\x23\x81\x32\x08\
+\x1c\xc2\x9c\xc3\xdc\xc3\x1c\xc4\x5c\xc4\x9c\xc4\xdc\x2c\x63\xf0\
+\xa2\xc6\x60\xbf\xe1\x11\x60\x02\x10\x9e\xcd\xbd\xd1\x78\xe7\xa5\
+\x2f\x38\x08\xc7\x2b\x2f\x15\xfc\xe7\x53\x4f\x19\x79\x12\x6e\xbd\
+\x8a\x72\x37\x89\x73\xfe\xbe\xec\xb9\x91\x40\x7e\x04\xb4\xc2\x9c\
+\xba\x09\x73\x0c\x73\x0d\x73\x0e\x73\x0f\x73\x30\xbf\x41\xd8\x13\
+\x09\x94\x4b\x80\x09\x40\xb9\xbc\x39\x5a\x41\x04\xf0\xab\x68\xb8\
+\xf5\x3a\x3d\x31\xfa\x5b\xe2\x9c\x4f\x95\x24\x60\xbd\x5c\xa1\xbd\
+\x57\x86\xdb\x29\x85\x1b\x09\x64\x21\xb0\x33\x9e\x43\x5a\xad\xc7\
+\x9c\xc2\xdc\xc2\x1c\xc3\x5c\xcb\xd2\x99\xdd\x6d\x28\x5d\x88\x04\
+\x98\x00\x84\x68\xf5\x00\x74\x16\x87\x3d\x25\x57\x68\xbf\x2b\x4e\
+\xfb\x05\xf8\xf8\x95\xd2\xb5\x4b\x24\x29\xc0\x4b\x05\x8f\x06\xa0\
+\x3e\x55\xcc\x46\xe0\xd1\x78\x8e\x60\xae\x1c\x39\xfc\x73\x98\x3b\
+\xf1\x1c\xe2\x1b\xf9\xb2\xd1\x64\x2b\xeb\x09\x30\x01\xb0\xde\x44\
+\x14\x70\x58\x02\xf8\xf8\xd5\xf4\xc6\x55\x1f\x93\xa4\xe0\x3f\x8b\
+\x53\x3f\xd9\xa8\xc6\x3a\xe9\xf3\x5d\xe2\xec\xbf\x24\xfb\x23\x52\
+\xb8\x85\x49\xe0\x48\x6b\x0e\xbc\x0b\x73\x02\x73\x23\x9e\x23\x98\
+\x2b\x97\x9f\xf5\xbd\x90\x90\x50\xd7\x30\x09\x30\x01\x08\xd3\xee\
+\x41\x6b\xbd\x63\x62\xcd\xdd\xe2\xec\xaf\x11\x67\xff\x4b\xcb\x1e\
+\x79\x78\x79\x43\xa9\x97\x69\xa3\xfe\x40\xa0\x7c\x45\x0a\x7f\xb5\
+\x50\x20\x78\xba\xc1\xb6\x5f\x81\xad\x61\x73\xd8\x1e\x73\x00\x73\
+\x01\x73\xc2\x53\x9d\xa9\x16\x09\xf4\x24\xc0\x04\xa0\x27\x1a\x9e\
+\x08\x81\xc0\x9d\x5b\x5e\x7c\xe4\xee\x89\xd1\x2f\x4f\x6d\x1a\xdd\
+\x22\x81\xe0\xa5\xd3\x1b\x47\x4e\x50\xf2\x9a\xaf\x52\xfa\xbf\x2a\
+\xa5\x6e\x93\xc7\x78\xf3\x97\x3c\xe4\xe6\x1c\x81\xe6\x1b\xf7\x6e\
+\x53\xb0\xa5\xd8\x14\xb6\x85\x8d\x61\x6b\xd8\x1c\xb6\x57\xfc\x53\
+\x4a\x11\x42\xa8\x04\x98\x00\x84\x6a\x79\xea\xdd\x9d\x80\xd6\x66\
+\x5a\x5e\xf3\x9d\x9e\x18\xf9\xe0\xf4\xc4\xe8\xaf\xc9\xe3\x53\x1b\
+\xfa\xc8\x2a\xad\xf5\x6b\x25\x19\xf8\x90\x94\xed\x4a\x99\x83\xdd\
+\x1b\xf3\x68\x75\x04\xc4\x26\x5a\x6d\x17\xfb\x7c\x08\xb6\x82\xcd\
+\x60\xbb\xd8\x86\xb0\xa5\xd8\x54\x89\x6d\xab\x93\x8f\x23\x93\x80\
+\x7d\x04\x98\x00\xd8\x67\x13\x4a\x64\x19\x81\xbb\x37\x3e\xe7\xc1\
+\xa9\x8d\x23\x9f\x95\x80\x72\x85\x94\x5f\x9c\x9e\x58\xfd\x53\x0d\
+\xd3\x78\xae\x56\xea\x37\xa4\x5c\x27\xe5\xcb\x22\x32\xbf\xae\x58\
+\x20\x94\xb4\x1d\x00\x73\x29\x60\xff\x1b\xb0\x05\x6c\x12\xdb\x66\
+\xe3\xe8\x15\xb0\x15\x6c\x56\x92\x2c\xce\x0f\x43\x05\xc2\x25\xc0\
+\x04\x20\x5c\xdb\x53\xf3\x21\x08\xdc\xbd\x69\xcd\x7d\x53\x13\xa3\
+\x9f\x96\x72\xa5\x94\x97\xc9\x95\xe6\x29\x47\x1a\xb5\xd3\xe5\x22\
+\xf3\xe5\x46\xa9\x2b\x95\x56\x1f\x93\x00\xb5\x43\x86\xf8\xa1\x14\
+\x6e\xd9\x08\xfc\x30\x66\x28\x2c\xc1\x14\x6c\xc1\x18\xac\xc1\x5c\
+\x0a\xd8\x7f\x1a\xb6\xc8\xd6\x3d\x5b\x91\x40\xd8\x04\x98\x00\x84\
+\x6d\x7f\x6a\x9f\x23\x81\x7b\x36\xaf\xda\x3b\xb5\x71\xf5\x5f\xef\
+\x98\x18\xbd\x4e\xae\x46\x2f\x91\x00\x35\x26\xc1\xea\xa4\x65\xfa\
+\xf0\xd3\x8d\x9a\x3b\x4f\xab\xda\x9b\x94\x52\xef\x93\x72\x8b\x94\
+\x7b\xa5\x3c\x2a\x25\xf4\x0d\x0c\xc0\x02\x4c\xde\xa7\x85\x11\x58\
+\x81\x19\xd8\xc5\x0c\x37\x8e\x5e\x02\xa6\x60\x0b\xc6\x8a\x7f\x39\
+\x12\x60\x57\x21\x13\x60\x02\x10\xb2\xf5\xa9\x7b\x29\x04\xee\xdc\
+\x78\xd6\x0f\x76\x4c\x9c\xf9\xf7\x53\x13\xab\x3e\x3e\x3d\x31\x7a\
+\xb5\x94\x57\x4b\x79\xa1\x94\x93\x1f\x5b\xb6\xf4\xa7\x6b\x35\xf3\
+\x3c\x53\xd3\xaf\x50\x35\xfd\x56\x79\xfd\x1a\x5f\x5e\xf4\x09\x65\
+\xcc\xdf\xca\xd5\xef\x7d\x22\xa0\xcb\x2f\x2d\xe0\x56\xfd\x7d\xd0\
+\x45\xf4\xf8\x44\xac\x9b\xe8\x08\x5d\xa1\x33\x74\x07\x03\x29\x60\
+\x01\x26\x57\x4f\x09\x23\xb0\x02\x33\x69\xc3\x8d\x04\x48\xa0\x40\
+\x02\x4c\x00\x0a\x84\xcb\xae\x49\x60\x10\x81\x9d\x97\x3e\xfb\x47\
+\xdb\x2f\x5b\xfd\xcd\x1d\x97\x8d\xfc\xcf\xe9\xcb\x46\x3e\x2a\xaf\
+\x5f\xe3\xcb\x8b\x7e\x73\x7a\xd3\xea\x5f\x91\xab\xdf\xe7\x4e\x4f\
+\x8c\x9e\x72\xea\x29\x23\x4b\x6b\x87\xe7\x4e\x45\xd0\x34\xc6\xbc\
+\xb4\xa6\x6b\x17\x4a\x72\x70\xa9\x56\xb5\xab\x94\x51\xef\xd7\x4a\
+\x7f\x44\xc5\xbf\x94\xa8\xff\xbb\x52\x0a\x1f\x65\xbc\x47\x2b\x85\
+\xe4\xe1\x41\xd9\xef\x95\x63\x48\x22\x7e\xd4\x7a\xf3\x22\x3e\x0a\
+\x87\x1f\x51\x92\xbb\xea\x72\xa6\xb9\xe1\x31\x8e\xc9\x39\x83\x37\
+\x38\x4a\x5d\x85\xe0\x8d\xb6\xe8\x03\x7d\xdd\x23\x55\xa5\x6f\x8c\
+\xa1\x6f\xd6\x18\x33\x1e\xbb\x76\x95\x56\xea\x52\xc8\x14\xcb\x26\
+\xc9\x0c\x64\x85\xcc\x90\x3d\xd6\x41\x74\x91\xc7\xbf\x19\xeb\x26\
+\x3a\x42\x57\xe8\x0c\xdd\xa5\x4f\x6e\x15\x12\xe0\xd0\x61\x13\xf8\
+\x7f\x00\x00\x00\xff\xff\x09\xda\x26\x1c\x00\x00\x00\x06\x49\x44\
+\x41\x54\x03\x00\x63\x10\x8d\xb7\x58\xff\x50\xda\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4c\x06\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x9d\x0d\x72\xdb\x38\
+\xb3\x76\x29\xef\x67\xde\x6f\x09\x63\xdf\x6d\x65\xaa\xf2\xa6\x6a\
+\xb2\xad\x6b\xcf\x12\xee\x64\x3f\xe6\xe7\xa3\x84\x8e\x2c\xeb\x87\
+\x3f\x00\xd8\x00\x4e\x2a\x8c\x24\x12\x04\xba\x4f\x83\xe8\x07\x20\
+\xa5\x3c\x0c\xfe\x91\x80\x04\x24\x20\x01\x09\x48\xa0\x3b\x02\x0a\
+\x80\xee\x42\xae\xc3\x12\x90\x80\x04\x24\x20\x81\x61\x50\x00\xd8\
+\x0b\x24\x20\x01\x09\x48\x40\x02\x1d\x12\x50\x00\x74\x18\x74\x5d\
+\x96\x80\x04\x24\x20\x81\xbe\x09\xe0\xbd\x02\x00\x0a\x6e\x12\x90\
+\x80\x04\x24\x20\x81\xce\x08\x28\x00\x3a\x0b\xb8\xee\x4a\x40\x02\
+\x12\x90\x40\xef\x04\x7e\xfa\xaf\x00\xf8\xc9\xc1\x7f\x25\x20\x01\
+\x09\x48\x40\x02\x5d\x11\x50\x00\x74\x15\x6e\x9d\x95\x80\x04\x24\
+\x20\x81\xde\x09\x4c\xfe\x2b\x00\x26\x12\xbe\x4a\x40\x02\x12\x90\
+\x80\x04\x3a\x22\xa0\x00\xe8\x28\xd8\xba\x2a\x01\x09\x48\x40\x02\
+\xbd\x13\xf8\xed\xbf\x02\xe0\x37\x0b\xdf\x49\x40\x02\x12\x90\x80\
+\x04\xba\x21\xa0\x00\xe8\x26\xd4\x3a\x2a\x01\x09\x48\x40\x02\xbd\
+\x13\x38\xf5\x5f\x01\x70\x4a\xc3\xf7\x12\x90\x80\x04\x24\x20\x81\
+\x4e\x08\x28\x00\x3a\x09\xb4\x6e\x4a\x40\x02\x12\x90\x40\xef\x04\
+\x3e\xfa\xaf\x00\xf8\xc8\xc3\x4f\x12\x90\x80\x04\x24\x20\x81\x2e\
+\x08\x28\x00\xba\x08\xb3\x4e\x4a\x40\x02\x12\x90\x40\xef\x04\xce\
+\xfd\x57\x00\x9c\x13\xf1\xb3\x04\x24\x20\x01\x09\x48\xa0\x03\x02\
+\x0a\x80\x0e\x82\xac\x8b\x12\x90\x80\x04\x24\xd0\x3b\x81\xcf\xfe\
+\x2b\x00\x3e\x33\x71\x8f\x04\x24\x20\x01\x09\x48\xa0\x79\x02\x0a\
+\x80\xe6\x43\xac\x83\x12\x90\x80\x04\x24\xd0\x3b\x81\x4b\xfe\x2b\
+\x00\x2e\x51\x71\x9f\x04\x2a\x25\xf0\xe3\xaf\xc7\xc7\xd3\xad\x52\
+\x37\x34\x5b\x02\x12\x28\x40\x40\x01\x50\x00\xb2\x4d\x48\x20\x35\
+\x81\xf7\x24\xff\xe5\xe9\xf9\xc7\xdb\xf6\xef\x97\xa7\x91\x6d\x1c\
+\x0f\xcf\xa7\x1b\xfb\x4e\x37\xca\xfe\xdf\x5f\xff\xf3\x5f\x36\xea\
+\x48\x6d\x97\xf5\x49\x40\x02\x11\x09\x5c\xb6\x49\x01\x70\x99\x8b\
+\x7b\x25\x10\x8a\x00\xc9\x9a\xe4\x3d\x25\xf3\xf7\x24\x3f\x0c\x8f\
+\xe3\xdb\x36\xd7\x58\xca\x1e\xc6\xf1\x2b\xdb\xf8\x26\x16\xa8\x8f\
+\x7a\x11\x04\x73\xeb\xb0\x9c\x04\x24\xd0\x06\x01\x05\x40\x1b\x71\
+\xd4\x8b\x06\x09\x90\xf4\x49\xcc\x24\x68\x92\x35\xc9\x3b\x87\x9b\
+\xd4\x8b\x20\x50\x0c\xe4\xa0\x6b\x9d\x12\xd8\x9f\xc0\x35\x0b\x14\
+\x00\xd7\xc8\xb8\x5f\x02\x3b\x11\x20\xf1\x4f\x49\x9f\xc4\x4c\x82\
+\x2e\x65\x0a\x6d\xd1\x26\x62\xe0\x28\x3e\xfe\x7a\x7c\x2c\xd5\xb6\
+\xed\x48\x40\x02\x65\x09\x28\x00\xca\xf2\xb6\x35\x09\x5c\x25\x70\
+\x9a\xf8\x49\xc4\x57\x0b\x16\x3a\x80\x10\x60\xe5\x01\x21\xc0\x56\
+\xa8\x59\x9b\x91\x80\x04\x92\x12\xb8\x5e\x99\x02\xe0\x3a\x1b\x8f\
+\x48\xa0\x08\x81\x68\x89\xff\xdc\x69\x84\x00\x9b\x22\xe0\x9c\x8c\
+\x9f\x25\x50\x37\x01\x05\x40\xdd\xf1\xd3\xfa\xca\x09\x90\x54\x99\
+\x65\x47\x98\xf1\xdf\x43\x89\x08\x98\x6e\x0d\xdc\x2b\xeb\x71\x09\
+\x48\x20\x06\x81\x5b\x56\x28\x00\x6e\xd1\xf1\x98\x04\x32\x11\x98\
+\x66\xfd\x24\xd5\x4c\x4d\x64\xab\x16\x9b\x15\x02\xd9\xf0\x5a\xb1\
+\x04\x8a\x11\x50\x00\x14\x43\x6d\x43\x12\xf8\x49\xa0\xa6\x59\xff\
+\x4f\x8b\x2f\xff\x8b\x10\xe0\x61\x45\xfc\xb9\x5c\xc2\xbd\x12\x90\
+\xc0\xbe\x04\x6e\xb7\xae\x00\xb8\xcd\xc7\xa3\x12\x48\x4a\x80\x64\
+\x49\xe2\x4c\x5a\xe9\x8e\x95\x71\xeb\x02\x7f\xf0\x6b\x47\x33\x6c\
+\x5a\x02\x12\x58\x41\x40\x01\xb0\x02\x9a\xa7\x48\x60\x0d\x01\x92\
+\x24\xc9\x72\xcd\xb9\xd1\xcf\xc1\x2f\x6f\x0b\x44\x8f\x92\xf6\xf5\
+\x46\xe0\x9e\xbf\x0a\x80\x7b\x84\x3c\x2e\x81\x04\x04\x5a\x4e\xfe\
+\xa7\x78\x14\x02\xa7\x34\x7c\x2f\x81\xd8\x04\x14\x00\xb1\xe3\xa3\
+\x75\x0d\x10\xe0\x3e\x39\x89\xb1\x01\x57\x66\xbb\x80\xbf\x88\x1e\
+\xb6\xd9\x27\x59\x50\x02\x12\x48\x48\xe0\x7e\x55\x0a\x80\xfb\x8c\
+\x2c\x21\x81\xd5\x04\x48\xfe\xdc\x27\x5f\x5d\x41\xc5\x27\x22\x02\
+\xd8\x14\x01\x15\x07\x51\xd3\x9b\x26\xa0\x00\x68\x3a\xbc\x3a\xb7\
+\x27\x01\x12\x5f\xaf\xc9\xff\x94\x3b\x22\xc0\xe7\x03\x4e\x89\xf8\
+\x5e\x02\xf9\x09\xcc\x69\x41\x01\x30\x87\x92\x65\x24\xb0\x90\x00\
+\xc9\x9f\xc4\xb7\xf0\xb4\xa6\x8b\xc3\x43\x21\xd0\x74\x88\x75\xae\
+\x32\x02\x0a\x80\xca\x02\xa6\xb9\xf1\x09\xf0\x23\x3f\x24\xbb\xf8\
+\x96\xee\x63\x21\x6c\x10\x48\x70\xda\xc7\x02\x5b\x95\x40\xeb\x04\
+\xe6\xf9\xa7\x00\x98\xc7\xc9\x52\x12\x98\x4f\x60\x3c\x7c\x9d\x5f\
+\xb8\xcf\x92\x88\x00\x7e\x02\x19\x21\xd0\x27\x01\xbd\x96\xc0\xfe\
+\x04\x14\x00\xfb\xc7\x40\x0b\x1a\x22\x40\x42\xf3\xbe\xff\xfc\x80\
+\x22\x04\xbc\x2d\x30\x9f\x97\x25\x25\x30\x87\xc0\xdc\x32\x0a\x80\
+\xb9\xa4\x2c\x27\x81\x3b\x04\x48\xfe\x24\xb4\x3b\xc5\x3c\x7c\x81\
+\x00\xdc\x14\x02\x17\xc0\xb8\x4b\x02\x19\x09\x28\x00\x32\xc2\xb5\
+\xea\xbe\x08\x90\xc4\xfa\xf2\x38\xbd\xb7\x30\x44\x48\xa5\xaf\xd9\
+\x1a\x25\xd0\x0b\x81\xf9\x7e\x2a\x00\xe6\xb3\xb2\xa4\x04\xae\x12\
+\x30\x69\x5d\x45\xb3\xf8\x00\x22\xc0\xd5\x80\xc5\xd8\x3c\x41\x02\
+\x8b\x09\x28\x00\x16\x23\xf3\x04\x09\x7c\x26\x40\xd2\xfa\xbc\xd7\
+\x3d\x5b\x08\xc0\x54\x21\xb0\x85\xa0\xe7\xf6\x48\x60\x89\xcf\x0a\
+\x80\x25\xb4\x2c\x2b\x81\x0b\x04\x9c\xfd\x5f\x80\x92\x70\x17\x42\
+\x80\x5f\x54\x94\x73\x42\xa8\x56\x25\x81\x37\x02\x0a\x80\x37\x08\
+\xfe\x95\xc0\x5a\x02\x24\x25\x12\xd4\xda\xf3\x3d\x6f\x1e\x01\xbe\
+\x59\x01\x67\x78\xcf\x3b\xc3\x52\x12\xe8\x91\xc0\x32\x9f\x15\x00\
+\xcb\x78\x59\x5a\x02\x1f\x08\x90\x94\x3e\xec\xf0\x43\x56\x02\xf0\
+\xf6\xb6\x40\x56\xc4\x56\xde\x11\x01\x05\x40\x47\xc1\xd6\xd5\xb4\
+\x04\x9c\x8d\xa6\xe5\xb9\xa4\x36\x85\xc0\x12\x5a\x96\xed\x85\xc0\
+\x52\x3f\x15\x00\x4b\x89\x59\x5e\x02\xbf\x08\x90\x84\x7e\xbd\xf5\
+\x65\x27\x02\xc4\x00\x21\xc6\xb6\x93\x09\x36\x2b\x81\x6a\x09\x28\
+\x00\xaa\x0d\x9d\x86\xef\x49\xa0\xd6\x84\x73\x18\x86\x17\xb6\xf1\
+\x70\xf8\x76\xba\xb1\x8f\x6d\xa8\xf0\x0f\x22\x80\xad\xd6\x98\x54\
+\x88\x5c\x93\x43\x12\x58\x6e\x94\x02\x60\x39\x33\xcf\xe8\x9c\x00\
+\xff\x89\x0d\x09\xa7\x06\x0c\x24\xf5\xc3\x61\x7c\xfa\xcf\xf7\xe7\
+\x03\xdb\x1f\xdf\x9f\x9f\xd8\xfe\xdf\xdf\xff\xfb\xdf\xd3\x8d\x7d\
+\x6c\x94\x61\x43\x1c\xd4\xe0\xdf\xa9\x8d\xc4\xc4\xe7\x03\x4e\x89\
+\xf8\x5e\x02\xb7\x09\x28\x00\x6e\xf3\xf1\xa8\x04\x3e\x11\x78\x1d\
+\x1e\x1e\x3f\xed\x0c\xb6\x63\x4a\xfc\x24\xf5\x3f\xfe\x7e\x79\x59\
+\x6a\x1e\xe2\x60\x12\x02\xb5\x89\x01\x85\xc0\xd2\x68\x5b\xbe\x05\
+\x02\x6b\x7c\x78\x58\x73\x92\xe7\x48\xa0\x57\x02\x2c\x33\x93\x60\
+\xa2\xfa\x4f\xb2\x26\x71\xaf\x4d\xfc\xe7\x7e\x21\x04\xd8\xa8\x93\
+\xba\xcf\x8f\x47\xfe\x4c\x9c\x88\x17\x2b\x36\x91\xed\xd4\x36\x09\
+\xec\x45\x40\x01\xb0\x17\x79\xdb\xad\x92\x00\x49\x25\xaa\xe1\x2c\
+\xf5\x93\xac\x73\xd9\x47\xdd\x35\x8a\x00\xff\xdb\xe1\x5c\x3d\xc2\
+\x7a\xe3\x10\x58\x67\x89\x02\x60\x1d\x37\xcf\xea\x90\x00\xb3\xc9\
+\x88\x6e\xbf\x2f\xf7\xaf\x58\xea\x5f\xea\x0f\x22\x00\xa1\x41\x9b\
+\x4b\xcf\xdd\xb3\x3c\xc2\xcd\xe7\x03\xf6\x8c\x80\x6d\x47\x24\xa0\
+\x00\x88\x18\x15\x6d\x0a\x49\x80\x24\x12\xcd\x30\x12\x71\xaa\xe5\
+\xfe\xb9\xbe\xf1\x4c\x01\x6d\xd2\xf6\xdc\x73\xa2\x94\x23\x86\x0a\
+\x81\x28\xd1\xd0\x8e\x54\x04\xd6\xd6\xa3\x00\x58\x4b\xce\xf3\xba\
+\x22\x10\x71\xf6\xcf\x72\x3c\x89\x78\xaf\x40\xd0\x76\x8d\x22\x00\
+\x5e\x08\x81\x88\x31\xc5\x36\x37\x09\x94\x22\xa0\x00\x28\x45\xda\
+\x76\xaa\x25\x40\xa2\x20\x61\x44\x73\x80\xe5\xf8\xdd\x6d\x3a\x8c\
+\xdf\x76\xb7\x61\xa5\x01\xc4\xd4\xd5\x80\x95\xf0\x3c\x2d\x10\x81\
+\xf5\xa6\x28\x00\xd6\xb3\xf3\x4c\x09\xec\x46\x80\xfb\xf0\xbb\x35\
+\x7e\xd2\x30\xb7\x03\xa2\xd8\x72\x62\xd6\xa2\xb7\x0a\x81\x45\xb8\
+\x2c\xdc\x10\x01\x05\x40\x43\xc1\xd4\x95\xf4\x04\x22\xce\xfe\xc7\
+\xc3\xe1\x1b\x89\x37\xbd\xb7\xeb\x6a\xc4\x16\x6c\x5a\x77\x76\x9c\
+\xb3\x10\x02\xfe\xb7\xc3\x71\xe2\xa1\x25\xf3\x08\x6c\x29\xa5\x00\
+\xd8\x42\xcf\x73\x9b\x27\x40\x52\x88\xe4\x24\x89\x36\xc4\xd2\xff\
+\x19\x94\x88\x36\x9d\x99\x38\xeb\xe3\x38\x0c\x8f\xc4\x1c\xe1\x37\
+\xf8\x47\x02\x8d\x13\x50\x00\x34\x1e\x60\xdd\x5b\x4f\xc0\x24\xb0\
+\x8c\x5d\xed\xb7\x02\x4e\xbd\x45\x04\xf8\x7c\xc0\x29\x11\xdf\xc7\
+\x24\xb0\xcd\x2a\x05\xc0\x36\x7e\x9e\xdd\x30\x01\x92\x40\x24\xf7\
+\xa2\xce\xfe\x27\x46\xdc\x0a\xa8\xf5\x5b\x01\x93\x0f\xe7\xaf\xf4\
+\x01\x85\xc0\x39\x15\x3f\xb7\x42\x40\x01\xd0\x4a\x24\xf5\x23\x29\
+\x01\x67\xff\x49\x71\x56\x5f\x19\x42\x80\x3e\xc1\x56\xbd\x33\x3a\
+\xd0\x0c\x81\xad\x8e\x28\x00\xb6\x12\xf4\xfc\xe6\x08\x30\xc8\x33\
+\xe0\x47\x73\xac\x8a\xfb\xec\x15\x7f\x2d\xf0\x5e\xbc\xe9\x13\x6c\
+\xf4\x8f\x7b\x65\x3d\x2e\x81\x1a\x08\x28\x00\x6a\x88\x92\x36\x16\
+\x25\xf0\x30\x8e\x7f\x16\x6d\x70\x46\x63\x2c\xff\xcf\x28\xb6\x7b\
+\x91\x16\x6f\x03\x9c\x43\x45\x04\x78\x5b\xe0\x9c\x8a\x9f\xcb\x13\
+\xd8\xde\xa2\x02\x60\x3b\x43\x6b\x68\x88\x00\xb3\x3b\x9e\x04\x6f\
+\xc8\x25\x5d\xc9\x44\x40\x21\x90\x09\xac\xd5\x16\x23\xa0\x00\x28\
+\x86\xda\x86\x6a\x20\xc0\xa0\x1e\xd1\xce\x87\xe1\xf5\x25\xa2\x5d\
+\x17\x6d\x6a\xf8\x36\xc0\x25\x7f\xe9\x33\x08\x47\xff\xdb\xe1\x4b\
+\x74\xdc\x97\x8b\x40\x8a\x7a\x15\x00\x29\x28\x5a\x47\x13\x04\x18\
+\xc4\xa3\x3a\xc2\xd2\x7a\x54\xdb\xb4\x6b\x18\x10\x01\xe3\x78\x78\
+\x8e\xdc\x87\x06\xff\x48\xe0\x8c\x80\x02\xe0\x0c\x88\x1f\xfb\x25\
+\xc0\x20\xde\xaf\xf7\xe9\x3c\xef\x59\xac\xd0\x87\x7c\x3e\x20\x5d\
+\x5f\xb2\xa6\x6b\x04\xd2\xec\x57\x00\xa4\xe1\x68\x2d\x95\x13\x88\
+\x3c\x73\x6b\xed\xbb\xf5\x95\x77\x95\x59\xe6\x2b\x04\x66\x61\xb2\
+\xd0\xce\x04\x14\x00\x3b\x07\xc0\xe6\xf7\x27\x40\xf2\x67\xc0\xde\
+\xdf\x12\x2d\x68\x8d\x00\xfd\x8a\xfe\xd5\x9a\x5f\xfa\xb3\x2f\x81\
+\x54\xad\x2b\x00\x52\x91\xb4\x9e\x6a\x09\x30\x48\x57\x6b\xbc\x86\
+\x87\x27\x40\xff\xf2\xb6\x40\xf8\x30\x75\x69\xa0\x02\xa0\xcb\xb0\
+\xeb\xf4\x44\xa0\x86\xd9\x99\x5f\x4b\x9c\xa2\x55\xf7\xab\x42\xa0\
+\xee\xf8\xc5\xb1\x3e\x9d\x25\x0a\x80\x74\x2c\xad\xa9\x42\x02\x0c\
+\xca\x15\x9a\x1d\xda\x64\xbf\x0e\x77\x3b\x3c\xf4\xb9\x1f\x5f\x9e\
+\xfc\xc6\xc0\x6d\x4c\x1e\x2d\x40\x40\x01\x50\x00\xb2\x4d\xc4\x24\
+\x50\xc3\xec\x7f\x22\x57\x53\x52\x7d\x1d\x1e\x1e\x27\xbb\x7d\xbd\
+\x4c\x60\xf4\xbf\x1d\xbe\x0c\xc6\xbd\x77\x09\xa4\x2c\xf0\x90\xb2\
+\x32\xeb\x92\x40\x2d\x04\x48\xa8\xcc\xc4\xa2\xdb\xcb\x37\x00\x0e\
+\x87\xf1\xa9\xe7\xaf\xd6\x45\x8f\xd1\x16\xfb\xe8\x83\x3e\x1f\xb0\
+\x85\xa0\xe7\x6e\x21\xa0\x00\xd8\x42\xcf\x73\xab\x25\xf0\x5a\xc1\
+\x2c\x95\xdf\xff\xff\xe3\xfb\x73\x75\xc9\x3f\xe2\xff\xa5\x10\xbd\
+\xa3\x2a\x04\xa2\x47\x28\x8a\x7d\x69\xed\x50\x00\xa4\xe5\x69\x6d\
+\x15\x10\x60\xe9\x9f\x01\x37\xaa\xa9\xd3\xac\xbf\x8a\xff\xfd\xef\
+\x02\xc4\xf1\x6d\x79\xfb\xc2\x6e\x77\xcd\x20\x40\xbf\xa4\x7f\xb2\
+\x42\x35\xa3\xb8\x45\x24\xb0\x89\x80\x02\x60\x13\x3e\x4f\xae\x91\
+\x00\x83\x6c\x54\xbb\x8f\xcb\xfd\x15\xce\xfa\x27\x9e\x24\xaf\xe9\
+\xbd\xaf\xeb\x08\xd0\x3f\xfd\x59\xe1\x75\xec\x5a\x3f\x2b\xb5\x7f\
+\x0a\x80\xd4\x44\xad\x2f\x34\x81\xa8\x09\x8a\x59\xff\x7f\xbe\x3f\
+\x1f\x6a\xbf\xd7\x4f\xf2\x0a\xdd\x01\x2a\x32\x0e\x96\x3e\x1f\x50\
+\x51\xc0\x2a\x34\x55\x01\x50\x61\xd0\x34\x79\x3d\x01\x06\xd5\xf5\
+\x67\xa7\x3f\x93\xc4\x3f\xcd\xfa\xd3\xd7\x5e\xb6\xc6\xa8\xe2\xaa\
+\x2c\x85\xf4\xad\xd1\x67\x15\x02\xe9\xb9\xd6\x57\x63\x7a\x8b\x15\
+\x00\xe9\x99\x5a\x63\x50\x02\xd1\x12\x54\xad\x0f\xf9\x5d\x0b\x2f\
+\x89\xea\xda\x31\xf7\x6f\x27\x00\xdf\x68\x7d\x78\xbb\x57\xd6\xb0\
+\x27\x01\x05\xc0\x9e\xf4\x6d\xbb\x18\x01\x06\x4e\x06\xd0\x62\x0d\
+\xde\x68\x68\x9a\xf5\xd7\xfa\x90\xdf\x25\xd7\xe0\x7b\x69\xbf\xfb\
+\xd2\x12\xa0\x0f\xbb\x1a\x90\x96\x69\x2d\xb5\xe5\xb0\x53\x01\x90\
+\x83\xaa\x75\x86\x23\x10\xe5\xab\x69\xad\xcd\xfa\x09\x34\xc9\x9f\
+\xc4\xc4\x7b\xb7\x32\x04\xe0\xad\x10\x28\xc3\xba\xe5\x56\x14\x00\
+\x2d\x47\x57\xdf\x8e\x04\x48\x50\x7b\x7f\x35\xad\xc5\x59\xff\x11\
+\xee\xdb\x3f\x24\xa3\xb7\x17\xff\xee\x40\x00\xf6\xfe\xac\xf0\x0e\
+\xe0\x8b\x37\x99\xa7\x41\x05\x40\x1e\xae\xd6\x1a\x88\x00\x83\xe4\
+\x9e\xe6\x4c\x0f\xf9\xd5\xfe\x84\xff\x25\x86\x24\x9f\x4b\xfb\xdd\
+\x57\x8e\x00\xe2\x96\x3e\x8e\xd0\x2d\xd7\xaa\x2d\xb5\x40\x40\x01\
+\xd0\x42\x14\xf5\xe1\x2a\x81\x3d\x07\x45\x96\xfb\x5b\xf8\x6a\xdf\
+\x35\xb8\x24\x7f\x92\xcf\xb5\xe3\xee\x2f\x4b\x00\x11\xe0\x6d\x81\
+\xb2\xcc\x4b\xb5\x96\xab\x1d\x05\x40\x2e\xb2\xd6\x1b\x82\x00\x83\
+\x62\x69\x43\x5a\x5e\xee\x87\x25\xbf\x52\x67\xf2\x87\x44\xcc\x8d\
+\x3e\xaf\x10\x88\x19\x9b\x68\x56\x29\x00\xa2\x45\x44\x7b\x92\x11\
+\xd8\x63\xf6\xcf\xac\xbf\xc6\xdf\xef\x9f\x0b\x1d\xa6\xfc\x4a\x9d\
+\x33\xff\xb9\xc4\xf6\x2b\x87\x10\x20\x5e\x6c\xfb\x59\x61\xcb\xdb\
+\x09\xe4\xab\x41\x01\x90\x8f\xad\x35\xef\x48\x80\x41\x8f\x01\xb0\
+\x94\x09\xbd\xcc\xfa\x4b\x32\x2d\x15\xbb\x96\xdb\x21\x5e\x6c\x5c\
+\x0f\x2d\xfb\xa9\x6f\xeb\x08\x28\x00\xd6\x71\xf3\xac\xe0\x04\x18\
+\xf4\x4a\x99\x18\x69\xd6\xcf\xf2\x7c\x4a\xbf\xa9\xef\xb8\xdc\x3f\
+\x1e\x9e\x9d\xf5\xa7\x24\x5b\xb6\xae\xc3\x38\x7e\xf5\xb6\x40\x59\
+\xe6\xa9\x5a\xcb\x59\x8f\x02\x20\x27\x5d\xeb\xde\x85\x40\xa9\xd9\
+\x0e\xb3\x7e\x1e\xf2\x8b\xf0\x83\x3e\x24\x6a\x06\xf8\x94\xc0\x4d\
+\xfc\x29\x69\xc6\xa8\x4b\x21\x10\x23\x0e\x51\xac\x50\x00\x44\x89\
+\x84\x76\x24\x23\xc0\x20\x97\xac\xb2\x0b\x15\x91\xf8\xa7\xaf\xf6\
+\x5d\x38\x5c\x74\x17\x89\x7f\x4a\xd4\x29\x1b\xa6\x5e\x67\xfc\x29\
+\x89\xc6\xaa\x8b\x6b\x04\xa1\x4c\x9c\x63\x59\xa6\x35\x1f\x09\xe4\
+\xfd\xa4\x00\xc8\xcb\xd7\xda\x0b\x13\x60\x50\xcb\xd9\x64\xa4\xe5\
+\x7e\x7c\x3d\x7f\x20\xaf\xc5\xdf\x1a\xc8\x19\xcf\x9e\xeb\x46\x04\
+\xd0\x7f\xe8\x47\x3d\x73\xe8\xd9\x77\x05\x40\xcf\xd1\x6f\xcc\x77\
+\x66\x33\x0c\x6a\x39\xdc\x9a\x66\xfd\x51\x96\xfb\x99\xf5\xe7\xf2\
+\x35\x07\x3f\xeb\x8c\x4b\x80\x7e\xc4\xed\x23\x85\x40\xbc\x18\xe5\
+\xb6\x48\x01\x90\x9b\xb0\xf5\x17\x23\xf0\x3a\x3c\x3c\xe6\x68\x2c\
+\xfa\xac\x3f\x87\xcf\xd6\xd9\x1f\x01\x85\x40\x7f\x31\x7f\xe8\xcf\
+\x65\x3d\x6e\x91\x00\xb3\x17\x06\xb0\xd4\xbe\x31\xf3\x77\xd6\x9f\
+\x9a\xaa\xf5\x45\x26\xc0\x75\xc4\xf5\x14\xd9\xc6\x3e\x6c\xcb\xef\
+\xa5\x02\x20\x3f\x63\x5b\x28\x40\x80\x41\x2b\x47\x33\xe3\x30\x3c\
+\xee\x3d\x18\xb2\xdc\xcf\xbd\x5a\x6c\xc9\xe1\xa3\x75\x4a\xe0\x9c\
+\x00\xd7\x93\xb7\x05\xce\xa9\xb4\xf7\x59\x01\xd0\x5e\x4c\xbb\xf3\
+\x28\x77\x82\x66\x30\xe4\xf9\x82\xd2\x60\xf1\x8b\x41\x78\x8f\xc4\
+\xff\x9a\xe9\x76\x4a\x69\x86\xb6\xb7\x8d\x00\x7d\x9f\x3e\x48\x5f\
+\xdc\x56\x93\x67\x2f\x25\x50\xa2\xbc\x02\xa0\x04\x65\xdb\xc8\x4a\
+\x80\x41\x2a\x6b\x03\x54\x3e\x1e\xbe\xf2\x52\x62\x43\x6c\x30\xeb\
+\x2f\xe2\x57\x09\x87\x6c\xa3\x7a\x02\xf4\x45\xfa\xa4\x42\xa0\xfa\
+\x50\x7e\x70\x40\x01\xf0\x01\x87\x1f\x6a\x23\x50\x6a\x40\x1a\xdf\
+\x6e\x05\x90\x98\x73\xf3\xc1\x9f\xb5\xcb\xfd\x3c\xaf\x90\xdb\x3e\
+\xeb\xef\x97\x00\xd7\x00\x42\x80\x3e\xda\x2f\x85\x52\x9e\x97\x69\
+\x47\x01\x50\x86\xb3\xad\x64\x20\xc0\x40\xc4\x80\x94\xa1\xea\x8b\
+\x55\x92\x98\x2f\x1e\x48\xb0\x13\x71\xc1\x0c\xab\xa4\x3f\x09\xcc\
+\xb6\x8a\x0e\x09\xd0\x47\xbd\x2d\xd0\x46\xe0\x15\x00\x6d\xc4\x51\
+\x2f\x0a\x11\x20\x49\xa7\x6e\x0a\x21\x83\xb8\x60\x86\x95\xba\x6e\
+\xeb\x93\x40\x2e\x02\x0a\x81\x5c\x64\x87\xa1\x54\xcd\x0a\x80\x52\
+\xa4\x6d\x27\x29\x01\x92\x26\x03\x50\xd2\x4a\x67\x54\x46\x92\x66\
+\xb6\x3e\xa3\xe8\xdd\x22\xd4\xc3\x4c\x6a\x0f\x3f\xee\x1a\x67\x01\
+\x09\xcc\x24\x40\xff\xe5\x7a\x64\x9b\x79\x8a\xc5\x82\x10\x50\x00\
+\x04\x09\x84\x66\x2c\x23\xc0\xa0\xb3\xec\x8c\x84\xa5\x37\x3e\x10\
+\x48\xe2\x67\x25\x81\x59\x7f\x42\xab\xac\x4a\x02\xbb\x11\xe0\x7a\
+\x64\x53\x04\xa4\x08\x41\xb9\x3a\x14\x00\xe5\x58\xdb\x52\x22\x02\
+\x7b\x0f\x32\xac\x02\xac\xb5\x81\xf3\x48\xfc\xd4\x91\x08\xc7\x7b\
+\x35\xaf\x87\xc3\x3f\xef\x1f\x36\xbe\x79\x18\xc7\x3f\x37\x56\xe1\
+\xe9\x1d\x12\x40\x04\xb0\xaa\x45\x3f\xef\xd0\xfd\xea\x5c\x56\x00\
+\x54\x17\x32\x0d\x66\x90\xd9\x9b\x02\x36\x30\x93\x9f\x6b\x07\x65\
+\x99\xf5\x73\xde\xdc\x73\x2c\x27\x81\x5a\x09\xd0\xcf\x15\x02\xeb\
+\xa2\x57\xf2\x2c\x05\x40\x49\xda\xb6\xb5\x99\x40\xa8\x99\xc5\xcc\
+\x5b\x01\xd8\x3c\x8e\x87\xe7\x1c\xb3\xfe\xcd\x40\xad\x40\x02\x19\
+\x09\x1c\xc6\xf1\x2b\xfd\x1f\x01\x9c\xb1\x19\xab\x5e\x49\x40\x01\
+\xb0\x12\x9c\xa7\x95\x27\xc0\x40\xc2\x80\x52\xbe\xe5\xcb\x2d\x92\
+\xd0\xb1\xe9\xf2\xd1\x61\x60\xd0\x73\xd6\x7f\x8d\x8e\xfb\x7b\x21\
+\xc0\x35\x8b\x00\xbe\x75\xad\xf4\xc2\xe2\xbe\x9f\x65\x4b\x28\x00\
+\xca\xf2\xb6\xb5\x0d\x04\x22\xde\x97\x66\x70\x23\xd1\x9f\xbb\x45\
+\xe2\x67\xd0\x43\x24\x9c\x1f\xf3\xb3\x04\x7a\x24\xc0\xb5\xe2\x6d\
+\x81\x58\x91\x57\x00\xc4\x8a\x87\xd6\x5c\x21\xc0\xec\x21\x6c\x32\
+\x3d\xb9\x15\x80\x18\x60\x90\x0b\x6b\xeb\x15\xbe\xe7\xbb\x6b\xb7\
+\xff\xdc\x1f\x3f\xc7\x21\xa0\x10\xb8\x1e\x8b\xd2\x47\x14\x00\xa5\
+\x89\xdb\xde\x2a\x02\x0c\x1a\xab\x4e\x2c\x70\x12\xc9\x12\x81\x32\
+\xcd\xfa\x0b\x34\x69\x13\x12\xa8\x9e\x00\xd7\x34\xd7\x4d\xf5\x8e\
+\x54\xec\x80\x02\xa0\xe2\xe0\xf5\x62\x7a\x0d\x83\x04\x83\x19\x42\
+\x60\xcf\x98\x3c\x0c\xaf\x2f\x7b\xb6\x6f\xdb\x12\x58\x4a\x80\xeb\
+\x86\x15\xb3\x1a\xae\xf1\xa5\xbe\x2d\x2f\x5f\xfe\x0c\x05\x40\x79\
+\xe6\xb6\xb8\x90\x00\x83\xc4\xc2\x53\x2c\x2e\x01\x09\x54\x44\x80\
+\x6b\x5c\x21\x50\x3e\x60\x0a\x80\xf2\xcc\x6d\x71\x01\x01\x67\x06\
+\x0b\x60\x59\x54\x02\x95\x13\x40\x08\x70\x2b\xad\xc7\xeb\x7e\x8f\
+\xd0\x29\x00\xf6\xa0\x6e\x9b\xb3\x08\x30\x08\x30\x20\xcc\x2a\x6c\
+\x21\x09\x48\xa0\x09\x02\xdc\x4a\xe3\xba\xe7\xfa\x6f\xc2\xa1\xc0\
+\x4e\x28\x00\x02\x07\xa7\x77\xd3\x18\x04\x7a\x67\xa0\xff\x12\xe8\
+\x95\x00\xd7\x7f\x3f\xb7\x05\xf6\x89\xb2\x02\x60\x1f\xee\xb6\x7a\
+\x87\x80\xea\xff\x0e\xa0\x8c\x87\xf9\x2a\x63\xc6\xea\xad\x5a\x02\
+\x8b\x08\x28\x04\x16\xe1\x5a\x54\x58\x01\xb0\x08\x97\x85\x4b\x11\
+\xe0\xa2\x2f\xd5\x56\x2b\xed\xfc\xf1\xf7\xcb\x4b\x2b\xbe\xe8\x87\
+\x04\xce\x09\x30\x26\x30\x31\x60\x3b\x3f\x56\xfb\xe7\xbd\xec\x57\
+\x00\xec\x45\xde\x76\xaf\x12\xf0\x02\xbf\x8a\xc6\x03\x12\xe8\x9a\
+\x00\x22\x80\xcd\x31\x22\x4d\x37\x50\x00\xa4\xe1\x68\x2d\x89\x08\
+\xb0\xfc\xcc\x05\x9e\xa8\x3a\xab\x91\x80\x04\x1a\x24\xc0\x18\xd1\
+\xce\xf3\x01\xfb\x05\x48\x01\xb0\x1f\x7b\x5b\xbe\x40\xe0\x75\x78\
+\x78\xbc\xb0\xdb\x5d\x12\x90\x80\x04\x3e\x11\x50\x08\x7c\x42\xb2\
+\x68\xc7\xc3\xa2\xd2\x16\x96\x40\x46\x02\x2c\xeb\x71\x41\x67\x6c\
+\xc2\xaa\x67\x10\x50\x84\xcd\x80\xc8\x1d\x38\xec\x00\x00\x10\x00\
+\x49\x44\x41\x54\x64\x91\x50\x04\x18\x37\x18\x3f\x58\x41\x0c\x65\
+\xd8\x0c\x63\xf6\x2c\xa2\x00\xd8\x93\xbe\x6d\x7f\x20\xc0\x45\xfc\
+\x61\x87\x1f\x24\x20\x01\x09\xcc\x24\xc0\xf8\xc1\xff\xc0\x89\x10\
+\x98\x79\x4a\xf7\xc5\x14\x00\xdd\x77\x81\x18\x00\xbc\x68\xb7\xc5\
+\xe1\x30\x0c\x7e\x03\x60\xf0\x8f\x04\x86\x01\x21\x50\xcf\xf3\x01\
+\xc3\xae\x7f\x14\x00\xbb\xe2\xb7\xf1\x89\x00\x17\xed\xf4\xde\x57\
+\x09\x48\x40\x02\x5b\x09\x30\xa6\x28\x04\x6e\x53\x54\x00\xdc\xe6\
+\xe3\xd1\x02\x04\x9c\xfd\x17\x80\x6c\x13\x12\xe8\x94\x00\x42\x20\
+\xea\x18\xb3\x77\x48\x14\x00\x7b\x47\xa0\xf3\xf6\xb9\x30\xb9\x40\
+\x3b\xc7\xa0\xfb\x12\x90\x40\x46\x02\x8c\x31\xae\x06\x7c\x06\xac\
+\x00\xf8\xcc\xc4\x3d\x12\x90\x80\x04\x24\xd0\x20\x81\x58\x42\x60\
+\x7f\xc0\x0a\x80\xfd\x63\xd0\xad\x05\xce\xfe\x63\x86\xfe\x61\x1c\
+\xff\x8c\x69\x99\x56\x49\x20\x0d\x01\x84\xc0\x8f\x2f\x4f\xcf\x8c\
+\x41\x69\x6a\xac\xb3\x16\x05\x40\x9d\x71\x6b\xc2\x6a\x2e\xc2\x26\
+\x1c\x09\xe0\xc4\x38\x0c\x8f\x0c\x66\xd7\x36\xbe\x1f\x7d\xbe\x05\
+\x30\x5b\x13\x24\xb0\x1b\x01\xae\x19\xc6\x20\xae\x99\x3d\x8c\x88\
+\xd0\xa6\x02\x20\x42\x14\x3a\xb4\xa1\xe7\x8b\x2e\x57\xb8\x19\xcc\
+\xae\x6d\xe3\x78\x78\x3e\xdf\xb8\x27\x7a\x69\x63\x60\xcc\x65\xa3\
+\xf5\x4a\x20\x1a\x81\xc3\x38\x7e\xe5\x3a\xe8\x71\x4c\x52\x00\x44\
+\xeb\x8d\x9d\xd8\xc3\x45\xd7\x89\xab\xba\x29\x01\x09\x54\x40\x80\
+\x31\xa9\x9c\x10\x88\x01\x44\x01\x10\x23\x0e\x5d\x59\xd1\xa3\xd2\
+\xee\x2a\xc0\x3a\x2b\x81\x8a\x09\x20\x04\x7a\x19\xa3\x14\x00\x15\
+\x77\xd4\x1a\x4d\xe7\xc2\xe2\x02\xab\xd1\x76\x6d\x96\x80\x04\xfa\
+\x20\xc0\x18\xc5\x43\x82\x3c\x37\x93\xc3\xe3\x28\x75\x2a\x00\xa2\
+\x44\xa2\x13\x3b\x7c\xc2\xbc\x93\x40\xeb\xa6\x04\x2a\x27\xc0\xb3\
+\x30\x3c\x37\xc3\xa4\xa5\x72\x57\xae\x9a\xaf\x00\xb8\x8a\xc6\x03\
+\xa9\x09\x70\x21\x71\x51\xa5\xae\xd7\xfa\x24\x90\x92\x00\xff\xaf\
+\x02\x5b\xca\x3a\xad\xab\x5e\x02\xac\x06\x30\x76\xa5\xf3\x20\x4e\
+\x4d\x0a\x80\x38\xb1\x68\xde\x12\x2e\xa4\xe6\x9d\xd4\xc1\xaa\x09\
+\x8c\x87\xc3\xb7\x3f\xbe\x3f\x3f\xbd\x1e\x0e\xff\x54\xed\x88\xc6\
+\x27\x25\xc0\xd8\xc5\x2d\x81\xa4\x95\x06\xa8\x4c\x01\x10\x20\x08\
+\x3d\x98\xd0\xaa\x82\xee\x21\x76\x3d\xf8\xc8\x8c\xff\x70\x18\x9f\
+\xfe\xdf\xdf\xff\xfb\xdf\x1e\xfc\xd5\xc7\xe5\x04\x58\xbd\x4c\x21\
+\x02\x96\xb7\x9c\xef\x0c\x05\x40\x3e\xb6\xd6\x7c\x42\x00\x05\x7d\
+\xf2\xd1\xb7\x12\x08\x43\x60\x9a\xf5\xff\xf1\xf7\xcb\x4b\x18\xa3\
+\x34\x24\x24\x81\xd6\x44\x80\x02\x20\x64\x37\x6b\xcb\x28\x67\xff\
+\x6d\xc5\xb3\x15\x6f\x9c\xf5\xb7\x12\xc9\xb2\x7e\x6c\x13\x01\x65\
+\x6d\xbd\xd7\x9a\x02\xe0\x1e\x21\x8f\x6f\x22\x40\xf2\x77\xf6\xbf\
+\x09\xa1\x27\x67\x20\xe0\xac\x3f\x03\xd4\x8e\xaa\x44\x04\x30\xb6\
+\xd5\xee\xb2\x02\xa0\xf6\x08\x06\xb7\xdf\xe4\x1f\x3c\x40\x9d\x99\
+\xe7\xac\xbf\xb3\x80\x67\x74\x97\xb1\x6d\xa9\x08\xc8\x68\xce\xaa\
+\xaa\x15\x00\xab\xb0\x79\xd2\x1c\x02\xb5\x5f\x1c\x73\x7c\xb4\x4c\
+\x3d\x04\x9c\xf5\xd7\x13\xab\x5a\x2c\xad\x5d\x04\x28\x00\x6a\xe9\
+\x69\x15\xda\xc9\xc5\x51\xa1\xd9\x9a\xdc\x18\x01\x67\xfd\x8d\x05\
+\x34\x98\x3b\xf3\xc7\xb9\x60\x86\xbf\x99\xa3\x00\x78\x83\xe0\xdf\
+\xf4\x04\x9c\xfd\xa7\x67\x6a\x8d\xcb\x09\x38\xeb\x5f\xce\xcc\x33\
+\x96\x13\xa8\xf5\xeb\x81\x0a\x80\xe5\xb1\xf6\x8c\x3b\x04\xf8\xfd\
+\xec\x9a\x55\xf1\x1d\xf7\x3c\x5c\x01\x01\x67\xfd\x15\x04\xa9\x21\
+\x13\x79\x28\x90\x71\xef\x96\x4b\x11\x8f\x29\x00\x22\x46\xa5\x72\
+\x9b\x5e\x87\x87\xc7\xca\x5d\xd0\xfc\x4a\x09\x4c\x89\x9f\x5f\xf3\
+\xf3\x7b\xfd\x95\x06\xb1\x56\xb3\xc7\xc3\xd7\xda\x4c\x7f\xa8\xcd\
+\x60\xed\x8d\x4d\x80\xa5\x7f\x67\xff\xb1\x63\xd4\xaa\x75\x2e\xf7\
+\xb7\x1a\xd9\x3a\xfc\x1a\x87\xe1\x91\xf1\xef\xb2\xb5\x31\xf7\x2a\
+\x00\x62\xc6\xa5\x5a\xab\x4c\xfe\xd5\x86\xae\x5a\xc3\xa7\x59\xbf\
+\x3f\xe3\x5b\x6d\x08\x9b\x31\x9c\xf1\xaf\xa6\x5b\x01\x0a\x80\x66\
+\xba\xde\xfe\x8e\xd4\xa6\x7e\xf7\x27\xa6\x05\x5b\x08\x4c\x89\xdf\
+\xe5\xfe\x2d\x14\x3d\x37\x39\x81\x0b\xb7\x02\x92\xb7\x91\xa8\x42\
+\x05\x40\x22\x90\x56\x33\x0c\xa8\xdf\xc1\x3f\x12\xc8\x4c\xc0\xc4\
+\x9f\x19\xb0\xd5\x6f\x22\xc0\xad\x80\x4d\x15\x14\x3c\x59\x01\x50\
+\x10\x76\xcb\x4d\x39\xfb\x6f\x39\xba\xfb\xfb\x46\xd2\xe7\x1e\xff\
+\x7f\xbe\x3f\x1f\x9c\xf1\xef\x1f\x0f\x2d\xb8\x4d\xe0\xe3\x6d\x80\
+\xdb\x65\xf7\x3c\xaa\x00\xd8\x93\x7e\x23\x6d\x93\xfc\x9d\xfd\x37\
+\x12\xcc\x60\x6e\x90\xf8\x0f\x87\xf1\x89\xa4\xef\x3d\xfe\x60\xc1\
+\xd1\x9c\xeb\x04\x2a\xb9\x0d\xa0\x00\xb8\x1e\x42\x8f\x48\x40\x02\
+\x3b\x10\x98\x92\xfe\x94\xf8\xfd\x3a\xdf\x0e\x41\xb0\xc9\x4d\x04\
+\xb8\x0d\x30\xad\x02\x6c\xaa\x28\xf3\xc9\x0a\x80\xcc\x80\x5b\xaf\
+\xde\xd9\x7f\xeb\x11\x2e\xe3\xdf\x94\xf4\x4f\x97\xf8\x4d\xfc\x65\
+\xd8\xdb\x4a\x26\x02\x15\xac\x02\x28\x00\x32\xc5\xbe\x97\x6a\x5d\
+\xfa\xef\x25\xd2\x69\xfd\x24\xe1\x73\x4f\x9f\x59\xfe\x69\xd2\x4f\
+\xdb\x8a\xb5\x49\x60\x3f\x02\xac\x02\x0c\xc3\x7e\xed\xcf\x69\x59\
+\x01\x30\x87\x92\x65\x2e\x12\x60\xf6\x7f\xf1\x80\x3b\x25\x70\x42\
+\x80\x64\x7f\xdc\xde\xee\xe5\x9f\x26\x7c\xee\xe9\x47\x9d\xe5\x3f\
+\x8c\xe3\x9f\x27\x2e\xf8\x56\x02\xab\x08\x44\xbf\x0d\xa0\x00\x58\
+\x15\x56\x4f\x82\x80\xb3\x7f\x28\xb8\x9d\x13\x20\xd9\x7f\x9a\xdd\
+\x7f\x7f\x7e\x22\xd9\xb3\x9d\x97\xf7\xb3\x04\x5a\x25\xf0\x1a\xfc\
+\x67\xd1\x15\x00\xad\xf6\xbc\xcc\x7e\x39\xfb\xcf\x0c\xb8\x92\xea\
+\x4f\x93\x7d\x2d\xb3\xfb\x4a\xd0\x6a\x66\x03\x04\xa2\xaf\x24\x29\
+\x00\x1a\xe8\x64\xa5\x5d\x20\xf9\x3b\xfb\x2f\x4d\x7d\xdf\xf6\x48\
+\xf4\x6c\xd3\xcc\xfe\x52\xb2\x77\x76\xbf\x6f\x8c\x6c\x3d\x1a\x81\
+\xf8\xf6\x28\x00\xe2\xc7\x28\x9c\x85\xd1\x55\x6d\x38\x60\x95\x19\
+\x44\xa2\x67\x9b\x92\xfd\xfb\x43\x7a\x6f\xcb\xf8\xd3\x7d\x7b\x93\
+\x7d\x65\x41\xd5\xdc\x5d\x08\x8c\xc3\x10\xfa\x7f\x46\x55\x00\x0c\
+\xfe\x59\x42\x80\xd9\x7f\xf4\x4e\xbd\xc4\x9f\xde\xcb\x92\xe8\x8f\
+\xdb\xd9\x03\x7a\xd3\x0f\xef\x98\xe8\x7b\xef\x21\xfa\xbf\x96\xc0\
+\x74\x5e\xe4\x07\x01\x15\x00\x53\x94\x7c\x9d\x45\xc0\xa5\xff\x59\
+\x98\x42\x16\x3a\x26\xfa\x61\x78\xb9\x34\xb3\x27\xd1\xb3\x85\x34\
+\x7c\x07\xa3\x5e\x0f\x87\x7f\x76\x68\xd6\x26\x25\x50\x94\x80\x02\
+\xa0\x28\xee\xba\x1b\x63\xf6\x5f\xb7\x07\x7d\x59\x4f\xc2\xbf\x94\
+\xec\xa7\x65\xfc\xbe\x68\x2c\xf3\xf6\x61\x78\x7d\x59\x76\x86\xa5\
+\x25\x70\x4a\xe0\xf7\xfb\xd7\xc0\xdf\x04\x50\x00\xfc\x8e\x93\xef\
+\xee\x10\x70\xf6\x7f\x07\xd0\x8e\x87\x49\xf6\xc7\xed\x6c\x29\xdf\
+\x64\xbf\x63\x50\x6c\x5a\x02\xc1\x09\x28\x00\x82\x07\x28\x8a\x79\
+\xce\xfe\xa3\x44\xe2\xa7\x1d\x24\xfb\x4b\xb3\x7b\x96\xf1\xd9\x7e\
+\x96\xf2\xdf\xb5\x04\x64\xb8\x96\x9c\xe7\x41\xa0\x96\x4d\x01\x50\
+\x4b\xa4\x76\xb4\x93\xe4\xef\xec\x7f\xc7\x00\xbc\x35\x4d\xc2\x3f\
+\x6e\x6f\x33\xfc\xe9\xa9\x7c\x67\xf7\x6f\x60\xfc\x2b\x01\x09\xac\
+\x26\xa0\x00\x58\x8d\xae\x9f\x13\x4d\xfe\xe5\x63\x7d\x4c\xf6\xc3\
+\xf0\x72\xfa\x7d\x7b\x9e\xcc\x77\x66\x3a\x14\xfb\x43\x0c\x8a\x35\
+\x66\x43\x0d\x11\xa8\xc7\x15\x05\x40\x3d\xb1\xda\xc5\x52\x66\xff\
+\xbb\x34\xdc\x61\xa3\x24\x1c\x12\x3e\xdb\x31\xd9\x7f\xff\xf9\xf3\
+\xb9\x1d\xa2\x58\xe5\x72\xea\xbe\xea\x37\x01\x56\x85\xc1\x93\x2a\
+\x22\xa0\x00\xa8\x28\x58\x7b\x98\xea\xec\x3f\x2f\xf5\x29\xe9\x4f\
+\xcb\xfa\xcc\xf0\xd9\xf2\xb6\xda\x5e\xed\x24\xff\xd4\x7d\xd5\x6f\
+\x02\xb4\xd7\x4f\x4a\x78\x54\x53\x1b\x0a\x80\x9a\xa2\x55\xd8\x56\
+\x06\xd5\xc2\x4d\x76\xd1\xdc\xa5\xa4\xdf\x85\xe3\x19\x9c\xe4\x47\
+\x56\x7e\x7c\x79\x7a\x26\xf9\xc3\x35\x43\x13\x56\x29\x81\x66\x09\
+\x28\x00\x9a\x0d\xed\x36\xc7\x18\x58\x19\x54\xb7\xd5\xe2\xd9\x13\
+\x01\x92\x13\x4b\xfb\xa7\x33\xfd\xe9\x98\xaf\xeb\x08\x20\x50\xc7\
+\xf1\xf0\x3c\x66\xfa\xb9\x55\x56\x62\x88\xdb\x3a\xeb\x3c\xab\x4f\
+\x02\x9f\xbd\x8e\xbc\x92\xa4\x00\xf8\x1c\x2f\xf7\xbc\x11\x78\x0d\
+\xfc\xe3\x15\x6f\xe6\x55\xf1\x97\xe4\x61\xd2\xcf\x13\x2a\x92\xff\
+\x61\x1c\xbf\x9e\xd6\xee\x3d\xfb\x53\x1a\xbe\x97\xc0\x7d\x02\x0a\
+\x80\xfb\x8c\xba\x2b\x71\x69\x70\xed\x0e\xc2\x06\x87\xa7\xc4\x7f\
+\x7c\x90\xef\xef\x97\x97\x0d\x55\x79\xea\x19\x01\x56\xa6\xa6\x25\
+\xff\xb3\x43\x79\x3e\x1e\xc6\x6f\x79\x2a\xb6\xd6\x16\x09\x5c\xf2\
+\x89\x95\xa4\x4b\xfb\x23\xec\x53\x00\x44\x88\x42\x30\x1b\xce\x67\
+\x56\xc1\xcc\x0b\x69\xce\x94\xf4\x5d\xe2\xcf\x17\x1e\x84\xe9\x98\
+\x71\xc9\x3f\x9f\xe5\xd6\x2c\x81\x98\x04\x14\x00\x31\xe3\xb2\x9b\
+\x55\x0c\xb2\xbb\x35\x5e\x61\xc3\x53\xe2\x77\xb6\x9f\x37\x78\xf4\
+\xcb\x7b\xc2\x34\xc7\xbd\x56\x66\x6f\xc4\x38\xaf\x77\xd6\xde\x06\
+\x81\xcf\x5e\x8c\x87\x43\xe8\x15\x24\x05\xc0\xe7\x98\x75\xbd\xe7\
+\xde\x20\xdb\x35\x9c\x13\xe7\x49\x0a\xdc\xdf\x37\xf1\x9f\x40\xc9\
+\xf0\x76\xc9\x92\x3f\xc9\x3a\x83\x09\x56\x29\x81\x66\x09\x28\x00\
+\x9a\x0d\xed\x72\xc7\x98\x65\x2d\x3f\xab\xaf\x33\x4c\xfc\xe5\xe2\
+\x4d\x7f\x0c\xb1\xe4\xef\x73\x00\xe5\x82\x5e\x71\x4b\x97\x4c\xcf\
+\xb1\x2a\x75\xa9\x9d\xb5\xfb\x14\x00\x6b\xc9\x35\x76\x1e\x83\xad\
+\xb3\xff\xeb\x41\x35\xf1\x5f\x67\x93\xe3\x48\xa4\xfe\xe8\xca\x42\
+\x8e\x08\xf7\x51\x67\xf4\xbe\xa3\x00\xe8\xa3\x1f\xde\xf5\xf2\x61\
+\x1c\xff\xbc\x5b\xa8\xc3\x02\x26\xfe\xb2\x41\x5f\xb2\xe4\x7f\x6a\
+\x19\x71\x3a\xfd\x9c\xfa\x7d\xee\xfa\x53\xdb\x6b\x7d\xa5\x09\x7c\
+\x6e\x2f\xfa\xfd\x7f\x2c\x56\x00\x40\xa1\xf3\x8d\xd9\xd6\x98\xe9\
+\xc7\x54\x6a\x46\xcb\x05\xec\x3d\xfe\x72\x11\x3c\xf6\xc3\x95\x4f\
+\xf9\x67\xff\x0d\x00\x6f\x03\x94\xeb\x08\xb6\x54\x8c\x80\x02\xa0\
+\x18\xea\xb8\x0d\xb9\xf4\xff\x31\x36\xcc\xf6\xf8\x3a\x1f\xff\xdd\
+\xee\xc7\x23\x7e\xca\x45\x80\xe4\x6f\x3f\xcc\x45\xd7\x7a\x73\x13\
+\xb8\x54\x7f\x0d\xe3\x87\x02\xe0\x52\xe4\x3a\xda\xc7\xc0\xdb\x91\
+\xbb\x37\x5d\x25\xf1\x4f\x4f\xf6\xdf\x2c\xe8\xc1\x64\x04\xd6\x2e\
+\xf9\x27\x33\x60\x66\x45\xdc\xcb\xa5\x7f\xcc\x2c\x6e\xb1\xce\x09\
+\xb0\x7a\x58\x03\x02\x05\x40\x0d\x51\xca\x68\xa3\xb3\xae\x9f\x70\
+\xb9\x60\x5d\xee\xff\xc9\xa2\xd4\xbf\x88\xcf\x71\xe5\x92\xff\xb9\
+\x8d\x45\x9e\xb6\xf6\x36\xc0\x39\x76\x3f\x1f\x09\x7c\xfe\xa7\x86\
+\xd9\x3f\x56\x2b\x00\xa0\xd0\xe9\xc6\x00\xdc\xa9\xeb\xef\x6e\x33\
+\xab\x63\xd6\x5f\xcb\x05\xfb\x6e\x78\xe5\x6f\xe8\x7b\x8a\xcf\xca\
+\x83\xa8\xf9\x17\x09\x30\x99\xb8\x78\x20\xe0\x4e\x05\x40\xc0\xa0\
+\x94\x30\xc9\x01\x78\x18\xb8\x50\x9d\xf5\x97\xe8\x6d\xbf\xdb\xc8\
+\xb5\xe4\xcf\x12\xfd\xef\x56\xf2\xbc\xa3\x0d\x04\x63\x9e\xda\xad\
+\xb5\x56\x02\x35\xdb\xad\x00\xa8\x39\x7a\x1b\x6c\xef\x7d\xf6\x45\
+\xf2\x77\xd6\xbf\xa1\x03\xad\x38\x15\xd1\x99\x6a\xc9\x7f\x45\xf3\
+\x9e\x22\x81\xec\x04\x6a\x1b\x57\x14\x00\xd9\xbb\x44\xbc\x06\x18\
+\x88\xe3\x59\x55\xc6\x22\x66\x70\x2e\xf9\x97\x61\x7d\xda\x0a\x7d\
+\x2e\x97\xe8\x24\xa6\xa7\x6d\x65\x7d\xef\x73\x00\x59\xf1\xd6\x57\
+\x79\xdd\x16\x2b\x00\xea\x8e\xdf\x2a\xeb\x73\x0d\xc4\xab\x8c\x29\
+\x78\x12\x89\xc2\x25\xff\x82\xc0\xdf\x9a\xca\xb5\xe4\xff\x56\xf5\
+\x2e\x7f\xbd\x0d\xb0\x0b\xf6\x2a\x1a\xad\x6d\xf6\x0f\x54\x05\x00\
+\x14\x3a\xda\x98\x89\x75\xe4\xee\xbb\xab\x5c\x9c\x24\xff\xf7\x1d\
+\xbe\xc9\x4e\x80\xbe\x56\x62\xc9\x3f\xfb\x8f\x00\x65\x27\x65\x03\
+\xb5\x12\xa8\xdd\x6e\x05\x40\xed\x11\x5c\x60\x3f\xb3\xb1\x1e\x67\
+\xff\x24\x7f\xef\xf7\x2f\xe8\x28\x09\x8a\x92\xfc\x9b\xed\x6b\xde\
+\x06\x48\xd0\x43\xda\xaa\xa2\xd6\x31\x46\x01\xd0\x56\x3f\xbc\xe9\
+\xcd\xeb\xf0\xf0\x78\xb3\x40\x83\x07\x23\x5d\x98\x08\xb0\x06\x11\
+\x7f\x70\x09\x1f\x7f\x7c\x79\x7a\x6e\x36\xf9\xbf\x79\xeb\x6d\x80\
+\x37\x08\xfe\x1d\x86\xe1\x37\x84\x5a\x27\x18\x0f\xbf\x5d\xf0\x5d\
+\xcb\x04\x9a\x9e\x91\x5d\x09\x5c\x84\xe4\x3f\x25\xc4\x7f\xbf\x3c\
+\x8d\x57\xcc\x6c\x66\x37\x7d\xac\xc4\x92\xff\x39\xb0\x22\x3f\x02\
+\x74\xde\xa8\x9f\x25\xf0\x8b\x00\xe3\xcc\xaf\xb7\xd5\xbd\x28\x00\
+\xaa\x0b\xd9\x3a\x83\x5b\x9e\x91\x5d\x22\xc2\x45\xb9\xa7\x2a\x9f\
+\x12\xff\x94\x10\xb1\x87\x99\xe3\x25\x5b\x5b\xd8\xb7\xe7\xac\x7f\
+\x17\xae\x87\xf1\x5b\x0b\x71\xd3\x87\xf5\x04\xa6\x33\xf7\x1c\x67\
+\x26\x1b\xd6\xbe\x2a\x00\xd6\x92\xab\xe8\x3c\x66\x66\x15\x99\xbb\
+\xd9\xd4\xf1\x70\xf8\xb6\xd7\x45\x79\x9e\xf8\x71\x66\x4f\x7b\x68\
+\x3f\xe7\xf6\xee\x6f\x67\xff\x9b\x24\xa2\x83\x6f\x95\xe4\x64\x6b\
+\xdd\xf1\x09\x70\x6d\xc7\xb7\xf2\xba\x85\x0a\x80\xeb\x6c\x9a\x39\
+\xd2\xd3\xec\x9f\x0b\x72\x8f\xe4\xff\x9e\x08\x2f\xfc\xb6\x7d\xab\
+\x4b\xd4\x08\xcb\x69\x85\x63\xaf\x8b\x65\xd7\x24\xec\x2a\xc0\x5e\
+\x61\x0f\xd0\xee\xcf\x5f\x12\xdd\x63\xac\x49\xe9\xbc\x02\x20\x25\
+\xcd\x80\x75\x31\x48\x07\x34\x2b\x8b\x49\x7b\x25\x7f\x18\x5f\x4b\
+\x84\xd8\xc4\x6c\x31\x8b\xc3\x3b\x56\xba\xe7\x92\xff\x8e\x6e\xdb\
+\xb4\x04\xde\x09\xb4\x20\xec\x15\x00\xef\xe1\x6c\xef\x0d\x89\xa9\
+\x97\xd9\x3f\x33\xc1\xd2\x6a\x9c\x59\x3f\x0f\xf7\xdd\x62\x5c\xda\
+\xa6\xdc\xbd\x18\x9f\x49\xfe\x63\x90\x25\xff\x3d\x7f\x03\x00\x61\
+\x47\xbf\xcb\xcd\xdc\xfa\xe3\x11\x68\x45\xd8\x2b\x00\xe2\xf5\x2d\
+\x2d\x5a\x41\xa0\xe4\x8f\xfc\xbc\x27\xc1\xb7\xe5\xfe\x5b\xa6\x32\
+\x48\xdc\x3a\x5e\xdb\x31\x04\xe5\xb5\x95\x8e\xda\x7c\x49\x66\xaf\
+\xb7\x01\x92\xa1\xac\xa9\xa2\x56\x84\xbd\x02\xa0\xa6\x5e\xb7\xc0\
+\x56\x06\xeb\x5b\x33\xd3\x05\x55\x85\x2f\xca\x6f\xfb\x97\x32\x12\
+\xae\x73\x93\x60\x2b\x83\x04\x6c\x99\xf5\xf7\xd2\x9f\xf0\xd7\x4d\
+\x02\xd7\x08\x8c\x87\x43\x33\xdf\x00\x51\x00\x5c\x8b\x72\xe5\xfb\
+\x7b\x19\xac\x99\x65\xb3\x14\x9b\x3b\x5c\xd3\xac\x7f\x2e\x57\xec\
+\xca\x6d\x53\x89\xfa\x27\xbf\xa3\x2c\xf9\x9f\xfb\xbc\xf7\x7d\x58\
+\xfa\x9e\xb7\x01\xce\xa3\xd2\xf6\xe7\x96\x84\xbd\x02\xa0\xc1\xbe\
+\xca\x2c\xb5\x41\xb7\x3e\xb9\x44\x92\x2d\x71\x31\xc2\x73\xee\xac\
+\xff\x93\x91\x15\xef\xe8\xd5\xef\xc5\x21\xf3\x36\xc0\x62\x64\xb5\
+\x9e\xc0\x98\x53\xab\xed\x97\xec\x56\x00\x5c\xa2\x52\xf9\xbe\xb9\
+\xb3\xd4\xca\xdd\x1c\x4a\x25\xff\x35\x3c\x4b\xd8\x96\x33\x7e\xb5\
+\x2c\xf9\x33\x03\xcf\xc9\x61\x4e\xdd\x11\x6c\x98\x63\xa7\x65\xb6\
+\x11\x20\xf9\xd7\x7e\x5d\x9f\x13\x50\x00\x9c\x13\xa9\xfc\x33\xb3\
+\xb6\xca\x5d\x98\x65\x3e\x17\xe3\xac\x82\x1b\x0a\xad\x4d\x82\x25\
+\x6c\xdb\xe0\xd6\xcd\x53\xa3\x2f\xf9\xdf\x34\x7e\xc7\x83\xde\x06\
+\xd8\x11\x7e\xa1\xa6\x7f\x26\xff\x42\x8d\x15\x6a\x46\x01\x50\x08\
+\x74\x89\x66\x48\xfe\x6b\x66\xab\x25\x6c\x4b\xd9\x06\x09\x36\xf7\
+\xc5\x48\xf2\x5f\x7b\xdf\x3b\xb7\x6d\x29\x59\x9e\xd6\x45\xff\xa9\
+\xe9\x56\x47\xa8\xa4\xeb\x6d\x80\xd3\xae\xd4\xdc\x7b\xc6\x9c\xe6\
+\x9c\x7a\x73\x48\x01\xf0\x06\xa1\x95\xbf\x0f\xe3\xf8\x67\x2b\xbe\
+\xdc\xf2\x23\x67\x82\xdd\x3a\x03\x0e\x95\x94\x6e\x41\x3c\x3b\x86\
+\xe0\xa9\x4d\x3c\xee\xf9\x1b\x00\x67\xf8\x06\x6f\x03\x9c\x13\x69\
+\xeb\xf3\x34\xe6\xb4\xe5\xd5\x30\x28\x00\x1a\x89\xe8\x71\xf6\x16\
+\xe4\xc7\x59\x72\x22\xcd\xa9\xc4\x49\xfe\xe3\x78\x78\x5e\x3b\xf3\
+\xc7\xef\x48\x49\x09\x7b\xee\x6d\xf8\x4c\xf2\xdf\xe2\xf3\xbd\x36\
+\x7a\x39\x7e\x18\x86\x97\xc1\x3f\xcd\x11\xc8\x39\xe6\xec\x0d\x4b\
+\x01\xb0\x77\x04\x12\xb5\x7f\x18\xc7\xaf\x89\xaa\x0a\x5b\x0d\x17\
+\x62\x2e\x25\x4e\x22\x1c\xdf\x92\x7f\x58\xe7\x33\x18\x76\x14\x8d\
+\x6f\x3e\x9b\xfc\x13\xc1\xf5\x36\x40\x22\x90\x71\xaa\x41\xd4\xfd\
+\x1e\x73\xe2\xd8\x95\xca\x12\x05\x40\x2a\x92\x3b\xd6\xc3\x40\xbe\
+\x63\xf3\x4d\x34\x9d\x2a\xf9\xef\xfd\xbd\xf4\xb9\xc1\x60\xd6\x5f\
+\xbb\x68\x8c\xc6\xda\xdb\x00\x73\x7b\x5f\x3d\xe5\x6a\x5b\xd1\x5b\
+\x4a\x56\x01\xb0\x94\x58\xc0\xf2\xb5\x0f\xe4\x73\x90\x66\x9d\xfd\
+\x7f\x79\x7a\x9e\x63\xc3\x9c\x32\xb5\x24\x81\xd6\x07\xb6\x39\xb1\
+\xca\x51\x86\x19\x63\x8e\x7a\xad\xb3\x3c\x81\xf3\x31\xa7\xbc\x05\
+\xf9\x5b\x54\x00\xe4\x67\x9c\xb5\x85\x5e\x66\xff\xb9\x96\xe1\xe0\
+\xd7\xe3\x12\x38\x3c\xf9\x09\x65\x06\xb9\xac\x1d\x34\x63\xe5\x21\
+\xc5\xd6\x61\x6c\xe6\x67\x62\x33\x86\xae\x8a\xaa\xb9\x46\xaa\x30\
+\x74\x83\x91\x0a\x80\x0d\xf0\xf6\x3e\x95\xe4\xd5\xcb\xec\x3f\x07\
+\xeb\xd4\xfc\x6a\x9b\xfd\x91\x40\x19\xe4\xc6\x43\x3b\xbf\x6d\x9e\
+\xa3\x9f\x2c\xa9\x13\xa6\x4b\xca\x5b\x36\x26\x81\xcf\xd7\x44\x4c\
+\x3b\xb7\x5a\xa5\x00\xd8\x4a\x70\xc7\xf3\x7b\x48\xfe\xe0\x25\x49\
+\xf1\x9a\x72\x4b\x9d\xfc\x53\xda\x56\xba\x2e\xf8\xfe\xe7\xfb\xf3\
+\xa1\xa6\x41\x2f\xb2\xd8\x8a\x6c\x5b\xe9\xbe\x55\x6b\x7b\x5c\x13\
+\xb5\xda\xbe\xc4\x6e\x05\xc0\x12\x5a\x81\xca\x92\xc0\x02\x99\x93\
+\xcd\x94\x5c\x49\xa9\x17\xf1\xb4\x24\x30\x0c\x7a\xb5\x09\x81\x25\
+\xfe\x15\x2b\xeb\x6d\x80\x62\xa8\x73\x34\x74\x69\xcc\xc9\xd1\x4e\
+\x84\x3a\x15\x00\x11\xa2\xb0\xc2\x06\x13\xd8\x0a\x68\xbf\x4e\xe9\
+\x45\x3c\xfd\x72\x77\xf1\x0b\x42\x80\x41\x90\x6d\xf1\xc9\x85\x4e\
+\x88\xfc\x10\xa3\xb7\x01\x0a\x75\x82\x0c\xcd\xd0\xe7\xe9\xff\x19\
+\xaa\x0e\x59\xa5\x02\x20\x64\x58\x6e\x1b\xd5\x4b\x02\x63\x29\x35\
+\xf5\xc5\x08\x3b\xc5\xd3\xed\xfe\xc5\x51\xb8\xb3\x31\x20\xf2\xd9\
+\x6d\x19\x01\xfa\xee\xb2\x33\x2c\x1d\x97\x40\xbb\x96\x29\x00\x2a\
+\x8b\x2d\x3f\x58\xd3\x4b\x02\xcb\x31\xcb\xcb\xc9\xae\xc5\x6f\x13\
+\x20\x02\xbc\x2d\xb0\x62\x90\xf0\x36\xc0\x0a\x68\xfb\x9e\x82\xd8\
+\xa5\xbf\xef\x6b\x45\xd9\xd6\x15\x00\x65\x79\x6f\x6e\xed\x75\x78\
+\x78\xdc\x5c\x49\x25\x15\xa4\xbe\x18\x99\xfd\x57\xe2\x7a\x38\x33\
+\x89\x45\x24\x21\x10\xed\x47\x80\xce\x03\xe6\x6d\x80\x73\x22\xf1\
+\x3f\xd3\xc7\x2f\x59\xd9\xf2\xbe\x87\x96\x9d\x6b\xcd\x37\x12\x58\
+\xce\x19\x6c\x24\x5e\x39\x96\x50\x4b\xb0\x63\x85\x26\x12\xc7\x56\
+\x6d\xa9\x21\xc1\xe6\xe8\xc3\xad\xc6\x73\x6f\xbf\x98\xfd\xef\x6d\
+\xc3\x1e\xed\x2b\x00\xf6\xa0\xbe\xb2\xcd\x12\x09\x6c\xa5\x69\xc9\
+\x4f\x4b\xbd\xfc\x8f\x78\x4a\x6e\x64\x67\x15\xc2\xb0\xa7\x3e\xb8\
+\x39\xbc\xde\x06\xd8\x8c\xb0\x54\x05\xd7\x67\xff\xa5\x2c\xd8\xa7\
+\x1d\x05\xc0\x3e\xdc\x17\xb7\xca\xe0\xbb\xf8\xa4\x8a\x4f\x48\x7d\
+\x41\x96\x4a\x5c\x2d\xdf\xa2\x29\xc5\xb0\xe2\x6e\xab\xe9\x15\x12\
+\xe8\x75\xf6\x4f\xa8\x14\x00\x50\xa8\x60\xeb\x69\xf0\x4d\xbd\x74\
+\x5a\x52\x3c\x3d\x8c\xe3\x9f\x15\x74\xa7\xc5\x26\x96\x64\x78\xcf\
+\xb8\xd4\xfd\xe3\x5e\x7b\x6b\x8f\x73\x9b\xa2\x16\x5b\xd7\xfa\x58\
+\xfb\x79\x24\xff\x5b\x93\x8d\xda\xfd\xbb\x67\xbf\x02\xe0\x1e\xa1\
+\x00\xc7\x23\x0d\xbe\x25\x70\xa4\x5e\xfe\x2f\x29\x9e\xc6\x61\x68\
+\xf2\x21\xcd\x92\x0c\x87\x3b\x7f\x52\xf7\x8f\x3b\xcd\x79\xb8\x61\
+\x02\x3d\x27\x7f\xc2\xaa\x00\x80\x42\xe0\x8d\xe4\x1f\x69\xf0\x0d\
+\x8c\xea\xa2\x69\x28\x26\x30\x3e\x00\x00\x10\x00\x49\x44\x41\x54\
+\xf0\xbb\x78\x20\xe3\xce\xd6\x1e\x04\xdc\x83\x61\xc6\xf0\x94\xad\
+\xda\xe7\x00\xca\xf2\x5e\xd0\x1a\xb3\xff\xdb\xc5\xdb\x3f\xaa\x00\
+\x68\x3f\xc6\xd5\x79\x58\xbd\x2a\x1f\x0f\x5f\xab\x83\x7e\xc5\x60\
+\xc4\x8c\x02\xf4\x0a\x9c\x19\xbb\xb9\x0d\x30\xa3\x98\x45\x76\x20\
+\x50\xfd\x38\x93\x80\x99\x02\x20\x01\xc4\x5c\x55\x30\xf3\xea\x6d\
+\xf0\x4d\x7d\xcf\x74\x0f\x7e\xdc\x06\x20\x71\xe6\xea\x17\x25\xeb\
+\x7d\x0d\xf8\xbb\x13\xd1\x7f\x03\xe0\x3c\x3e\xa9\xfb\xf4\x79\xfd\
+\x7e\x5e\x4e\x60\xce\xec\x7f\x79\xad\xf5\x9d\xa1\x00\x08\x1c\xb3\
+\x3d\x92\xd7\xde\x38\x52\xde\xdf\x45\x40\xed\xe6\x4f\x03\xab\x00\
+\xf0\xeb\xb1\x0f\x26\xef\x33\xde\x06\x48\x8e\x74\x6b\x85\xce\xfe\
+\x7f\x12\x54\x00\xfc\xe4\x10\xee\x5f\x06\xdf\x70\x46\x69\xd0\x6c\
+\x02\xe3\x30\x3c\xd6\xbe\x0a\x90\x23\xf9\x33\xf3\x62\x9b\x0d\xf2\
+\x42\xc1\xda\x96\xd5\x6b\xb3\xf7\x02\xf2\xa6\x76\xcd\xeb\x7f\x4d\
+\xb9\x7c\xd5\x19\x05\xc0\x55\x34\xfb\x1e\xc8\x31\xf8\xee\xeb\x51\
+\xf9\xd6\x77\x67\x58\xf1\x2a\x40\x2e\x01\xca\xcc\x8b\x2d\xd2\xcf\
+\x0a\x97\xe8\x99\xde\x06\x28\x41\xf9\x7e\x1b\x24\x7f\xfa\xdf\xfd\
+\x92\x7d\x94\x50\x00\x04\x8c\x73\xae\xc1\x37\xa0\xab\x9f\x4c\x4a\
+\x75\x7f\x37\xc2\xec\xbb\xe6\x55\x80\x1c\xe2\x89\xc1\xf7\x34\xe0\
+\x0c\xc4\xec\x63\x3b\xdd\x7f\xeb\x7d\xb5\x89\xd4\xdb\x00\xb7\xc2\
+\x5a\xec\x18\x7d\x6e\x4e\x63\xbd\x94\x51\x00\x04\x8b\x34\xc9\x3f\
+\xc7\xe0\x1b\xcc\xcd\xab\xe6\xa4\x5a\x2e\x7d\x8d\xf2\xf0\x5a\x85\
+\xab\x00\xf4\xc1\xab\x01\xda\x70\xe0\xd2\xe0\xcb\x3e\xb6\x25\x22\
+\x60\x83\x09\x9e\xda\x31\x01\xfb\xd8\xe7\xe0\x2b\x00\x3e\x33\xd9\
+\x75\x4f\xab\xbf\x24\xb7\x2b\xd4\x1d\x1b\x1f\x87\xe1\x31\x57\x42\
+\xcd\xe1\x16\xb6\xe6\x10\xa0\xf7\x06\x5f\x44\xc0\x9c\xdb\x02\x29\
+\x1f\x12\xcd\xc1\xef\x5a\x9d\xa9\x84\xed\xb5\xfa\xdd\x7f\x9f\x00\
+\x7d\xec\x7e\x29\x4a\xf4\xb3\x29\x00\x02\xc5\x9a\xc1\x97\x84\x11\
+\xc8\xa4\x6a\x4d\x89\x24\xa4\x48\xa8\x11\x6e\x49\xcc\x09\x66\x0e\
+\x6e\x24\xff\xb9\x83\x2f\xe5\xe6\x08\x81\x39\xbe\x44\x2b\x53\xed\
+\xed\x8b\x68\x20\x57\xd8\x43\x1f\x5c\x71\x5a\xf3\xa7\x28\x00\x02\
+\x85\x98\x44\x11\xc8\x9c\xe2\xa6\xb4\x3c\x40\x8e\xe3\xe1\x39\xba\
+\x08\xc8\x25\x40\xd7\x3c\xd7\x81\x10\x60\xd0\x3e\xef\x13\x6b\xea\
+\x2a\xde\x91\xaf\x35\xe8\x73\x00\xd7\xc8\x64\xdd\x4f\x1f\xa2\x3f\
+\xcd\x6d\xa4\xa7\x72\x0a\x80\x20\xd1\x66\xf0\x0d\x62\x4a\x13\x66\
+\x44\x5c\x49\x89\x2e\x02\x72\x08\x50\x92\xf8\xda\xe5\x6f\x06\xed\
+\x3f\xbe\x3f\x3f\x51\x47\x13\x9d\x52\x27\x76\x21\x50\xeb\x6d\xa3\
+\x12\xb0\x14\x00\x25\x28\xcf\x68\x23\xc7\xe0\x3b\xa3\x59\x8b\x94\
+\x26\x30\xc6\xfc\x99\xe0\x5c\x02\x94\x24\xbe\x15\x31\x75\x4c\xb7\
+\x05\xd6\x8a\x89\xad\x36\xa4\x38\x1f\xdb\x99\x8d\xa6\xa8\xcb\x3a\
+\xe6\x11\x40\x3c\xd2\x7f\xe6\x95\xa6\x54\x5f\x9b\x02\x20\x40\xbc\
+\x73\x0d\xbe\x01\x5c\xd3\x84\x33\x02\xac\x4c\xfc\xf8\xf2\x14\xee\
+\x76\x40\x0e\x01\xca\xe0\x7b\xe6\xfe\xa6\x8f\x0e\xe4\x9b\xf0\x75\
+\x79\xb2\x7d\xe6\x76\xd8\x15\x00\xb7\xf9\x64\x3f\x4a\xf2\xcf\x31\
+\xf8\x66\x37\xdc\x06\x56\x13\x40\x04\x70\x3b\x80\xd8\xaf\xae\x24\
+\xe1\x89\xb9\xec\x70\xf0\xbd\x10\xa4\xc3\xf8\xed\xc2\x5e\x77\x65\
+\x20\x30\x1e\x0e\x8b\x59\x67\x30\x23\x74\x95\x0a\x80\x9d\xc3\x63\
+\xf2\xdf\x39\x00\x3b\x36\x4f\xec\x73\x25\xdf\xb9\x6e\xd1\x3e\x76\
+\xcc\x2d\x3f\xb7\x9c\x83\xef\x5c\x52\x96\xcb\x45\x40\x01\x7a\x9f\
+\xac\x02\xe0\x3e\xa3\x6c\x25\x18\x7c\xb3\x55\x6e\xc5\x55\x10\x20\
+\xf9\xee\xd9\x0f\x68\x3f\x35\x28\x92\xbf\x83\xef\x65\xaa\x3c\x07\
+\x70\xf9\x88\x7b\x53\x12\xa0\x0f\x2e\xaf\xaf\xbf\x33\x14\x00\x3b\
+\xc6\x3c\xc7\xe0\xbb\xa3\x3b\x9b\x9b\x66\x69\x7c\x73\x25\xbf\x2a\
+\xa8\xe9\x61\x2b\xfa\xc1\xbf\x5f\x9e\xc6\xd2\x42\x20\x57\x7b\x26\
+\xff\x5f\x9d\xf0\xca\x4b\x4d\x7d\xf3\x8a\x0b\xa1\x77\x93\xfc\xed\
+\x83\xf3\x42\xa4\x00\x98\xc7\x29\x79\xa9\x5c\x83\x6f\x72\x43\xad\
+\xb0\x18\x01\x84\x00\x0f\x08\x96\xea\x1b\xb4\x97\xda\x39\x06\xdf\
+\xd4\x75\xb6\x56\x9f\x5f\x4b\xcb\x1b\xd1\xb5\xbf\x15\x91\xd7\xaa\
+\x98\xb5\x2b\x00\x76\x88\x0b\x3f\x08\x93\x63\xf0\xdd\xc1\x95\xe4\
+\x4d\xc2\x26\x79\xa5\x15\x55\xc8\x2a\x08\x7d\x23\xf7\x8a\x40\x2e\
+\x91\xe1\xcc\xeb\x7e\x67\x33\x41\xdd\x67\xb4\xb6\x04\x02\xd4\xdb\
+\x2c\xf3\xe9\x29\x00\xe6\xb3\x4a\x56\xf2\x35\xca\x7f\x54\x93\xcc\
+\xa3\x80\x15\x35\xf0\xb4\xf5\xa9\x10\x48\x29\x8c\xa8\x8b\xba\x53\
+\x47\x8d\xc1\x37\x75\x9d\x2d\xd6\x67\x82\xca\x17\xd5\xf5\x02\x34\
+\x9f\x4d\x91\x6b\x56\x00\x14\x8e\x0e\x33\xaf\x1c\x83\x6f\x61\x37\
+\xc2\x37\xd7\xd2\x20\x4b\x7f\xe1\x6b\x83\xd3\xaa\x00\x7d\x68\x4b\
+\x00\x72\x09\x50\x07\xdf\xf9\x51\xf1\x39\x80\xf9\xac\xe6\x96\x54\
+\x80\xce\x25\xf5\xbb\x9c\x02\xe0\x37\x8b\x22\xef\x18\xcc\x8b\x34\
+\x54\x6b\x23\x09\x7f\x29\xaf\xc5\x41\x96\xfe\xc3\x86\x18\x60\x9b\
+\x9e\x19\x40\x14\xb0\x31\xbb\x3f\xdf\xd8\xcf\x46\x59\x36\xce\x4f\
+\xdd\x3d\x1c\x7c\x53\x13\xb5\xbe\xa5\x04\xb6\x08\xd0\xa5\x6d\xb5\
+\x52\x5e\x01\x50\x30\x92\x0c\xc2\x05\x9b\xeb\xbe\xa9\x1e\x1e\xb6\
+\x1a\x87\xe1\x91\x84\x3e\x6d\xac\x14\x9c\x6f\xef\xc7\xde\xca\x52\
+\x7e\x48\xfc\x87\xe4\xef\xe0\xbb\x0c\x6a\x0f\x7d\x73\x19\x91\x6d\
+\xa5\xe9\x83\xdb\x6a\xe8\xf3\x6c\x05\x40\xc1\xb8\x33\x10\x17\x6c\
+\xae\xca\xa6\x52\x26\x28\x1f\xb6\x2a\xd3\x05\x4c\xfe\xcb\x39\xdb\
+\x37\x97\x33\xbb\x76\x06\xc9\x7f\x5b\x1f\xbc\x56\x73\xfb\xfb\x15\
+\x00\x85\x62\xec\xec\x7f\x3e\x68\x96\xb0\xe7\x97\xbe\x5e\x92\xe7\
+\x00\x5a\xbc\x0d\x70\xdd\xe3\xf2\x47\x18\x7c\xcb\xb7\x5a\x7f\x8b\
+\xf4\xcd\xfa\xbd\x88\xe1\x81\xc9\x7f\x7d\x1c\x14\x00\xeb\xd9\xcd\
+\x3e\x93\xe4\xef\xec\x7f\x36\xae\xb4\x05\x1b\xf8\x36\x40\x5a\x20\
+\x69\x6b\x73\xf0\x4d\xcb\xd3\xda\x96\x11\x48\x21\x40\x97\xb5\xd8\
+\x56\x69\x05\x40\x5b\xf1\x6c\xc3\x9b\x84\x0f\x02\x32\xd3\x72\x15\
+\x20\x4f\xb7\x70\xf0\xdd\xc6\xd5\x7e\xb9\x8d\x1f\x67\x2b\x40\xa1\
+\xb0\x7e\x53\x00\xac\x67\x37\xeb\x4c\x67\xff\xb3\x30\x7d\x28\x94\
+\xf2\x39\x80\x63\xc5\xae\x02\x1c\x31\xa4\xfc\x87\xe4\xe5\xe0\x9b\
+\x92\xa8\x75\x2d\x25\x90\x46\x80\x2e\x6d\xb5\xad\xf2\x0a\x80\xcc\
+\xf1\x74\xe9\x7f\x1d\xe0\x54\xcf\x01\xd0\xba\xab\x00\x50\x48\xbb\
+\xf9\x14\xfb\x76\x9e\x32\x5c\xcf\x50\x01\xba\x9e\xdd\xe9\x99\x0a\
+\x80\x53\x1a\x89\xdf\x33\xfb\x4f\x5c\x65\x3f\xd5\x25\xbc\x0d\x00\
+\xb4\x3f\xbe\x3f\x3f\xf1\xea\xb6\x9d\x00\x33\x2f\x67\xff\xdb\x39\
+\xfa\x4d\x80\xf5\x0c\x53\x89\xa7\xf5\x16\xb4\x71\xa6\x02\x20\x63\
+\x1c\x9d\xfd\xaf\x87\x9b\xfc\x36\xc0\x9b\x29\x87\xc3\xa8\x08\x78\
+\xe3\xb0\xf5\xaf\xc9\x7f\x2b\x41\xcf\xdf\x42\x60\x3c\x1c\xbe\xd9\
+\x07\xb7\x10\xfc\x7d\xae\x02\xe0\x37\x8b\xa4\xef\x9c\xfd\x6f\xc7\
+\x99\xf2\x36\x00\xd6\x70\x2b\x80\xc1\x83\xf7\x6e\xeb\x09\xa4\x8e\
+\xcb\x7a\x4b\xca\x9f\x99\xd2\x77\xfa\x63\x79\x0f\xea\x6f\x31\x5d\
+\xf2\xaf\x9f\xc5\x56\x0f\x14\x00\x5b\x09\x5e\x38\x9f\xe4\xef\xec\
+\xff\x02\x98\xa5\xbb\x12\xdf\x06\xa0\x79\x06\x0f\xee\x1f\xf2\xde\
+\x6d\x18\x60\xc1\x36\x2c\xf9\x93\x21\x2e\x4b\x9a\xdf\xb3\x2c\xbf\
+\xb2\xb8\x67\xfb\xbd\xb7\xad\x80\x4f\xdb\x03\x14\x00\x69\x79\x1e\
+\x6b\x7b\x18\xc7\x3f\x8f\x6f\xfc\x67\x13\x01\x6e\x03\xa4\x9c\x71\
+\xbd\x1b\xe3\xb7\x02\x8e\x28\x18\x4c\xd7\x3c\x1b\x91\x2d\x2e\x47\
+\xab\xe2\xfe\x83\xb0\x4f\x6d\xdd\x62\xf1\x95\xda\x80\xca\xea\x43\
+\xc0\xa7\x32\xd9\x7a\x86\x41\x01\x90\xb8\x17\x30\x48\x30\x40\x26\
+\xae\xb6\xdf\xea\x32\xcc\x36\x59\x7a\xed\xf9\x79\x80\xc3\x30\xbc\
+\xfc\xe7\xfb\xf3\x61\xd3\x60\x9a\x21\x2e\xd1\x3b\xf9\xb4\xaa\x97\
+\x45\x94\x46\x77\x3e\x80\x7d\x08\xd6\x00\x66\x34\x65\x82\x02\x20\
+\x71\x38\xa7\x41\x22\x71\xb5\xdd\x56\x87\x98\xca\x31\xe0\xf6\x28\
+\x02\x48\xfc\x08\x9f\x35\xb3\xfe\xf3\x0e\x98\x2b\x2e\xe7\xed\x44\
+\xf9\x8c\xb0\x8f\x62\x4b\x8f\x76\x90\xfc\x37\x09\xd6\x4f\xd0\xdc\
+\x01\x01\x05\x00\x14\x12\x6d\x0e\x12\x89\x40\x9e\x57\x93\x69\xb6\
+\xd9\x8b\x08\x38\x4d\xfc\xf8\x7c\x8e\x77\xf5\xe7\x4c\x71\x59\x6d\
+\x4f\xc6\x13\x73\x09\x7b\xbf\xce\x96\x31\x68\x56\x7d\x97\x80\x02\
+\xe0\x2e\xa2\xf9\x05\x72\x0d\x12\xf3\x2d\x68\xb3\x64\xce\xd9\x26\
+\x09\x91\xe5\x70\x92\x64\x8b\xf4\x98\x39\x31\xe3\xc7\xcf\xd4\xfe\
+\xe5\x8c\x4b\x6a\x5b\xb7\xd4\xf7\xe3\xcb\xd3\xf3\xe9\xf9\xaf\xc3\
+\xc3\xe3\xe9\x67\xdf\xe7\x25\x40\x1f\x4e\x3d\xfb\xcf\x6b\x71\x3d\
+\xb5\x3f\xd4\x63\x6a\x6c\x4b\x9d\xfd\x67\x8e\x4f\xe6\xd9\x26\x49\
+\x92\x81\x26\xb3\x17\xc5\xaa\x47\xd0\xb0\xdc\x9f\x7d\xe0\xcc\x1c\
+\x97\x62\xc0\xae\x34\xc4\x75\x3d\x0e\x83\x09\x7f\xd8\xef\x4f\xf6\
+\x3e\xbc\x9f\x6b\xbb\xb7\xac\x00\x48\x10\x02\x06\x09\x67\xff\x09\
+\x40\xde\xa8\x82\x41\x18\xce\x37\x8a\x6c\x3e\xc4\x40\x53\xbb\x08\
+\x98\x12\x3f\x82\x26\xc7\xac\xff\x1c\x72\x89\xb8\x9c\xb7\x59\xea\
+\x33\xfd\xcd\xeb\xba\x14\xed\xcb\xed\xe4\xb9\x1e\x2f\xb7\xd5\xe3\
+\x5e\x05\x40\x82\xa8\x3b\x48\x24\x80\x38\xa3\x8a\x12\x9c\x11\x01\
+\xcc\x9c\x49\xa4\x33\x4c\x0a\x53\x04\x7b\xb1\xbb\x54\xe2\x3f\x75\
+\x9c\xb8\xe4\x78\x50\xf3\xb4\x8d\x3d\xde\xe3\xd7\xa5\x76\x53\x7e\
+\xcd\xd7\x9f\x03\xbe\x44\xf8\xf7\x3e\xae\xc7\xdf\x9f\x7c\x97\x9a\
+\x80\x02\x60\x23\x51\x66\x09\x1b\xab\xf0\xf4\x05\x04\xce\xef\xc7\
+\x2e\x38\x75\x76\x51\x66\xce\x24\xd2\x1a\x66\x1f\x7b\x26\xfe\x53\
+\xa0\xe3\x78\x78\x6e\x49\x04\x94\xe8\x67\xa7\xfc\x7c\xff\x99\x40\
+\xae\xeb\xef\x73\x4b\xfd\xee\x51\x00\x6c\x8c\xfd\xb5\x59\xc2\xc6\
+\x6a\x3d\xfd\x0a\x81\x92\x4b\xce\xcc\x3e\x78\x40\x30\xe2\x40\x14\
+\x25\xf1\x7f\x08\x53\x23\xcf\x03\x20\xea\xe9\x67\x1f\x7c\xf3\x43\
+\x51\x02\x5c\x73\x5c\x7f\x45\x1b\xed\xb0\x31\x05\xc0\x86\xa0\x33\
+\x50\x6c\x38\xdd\x53\x57\x12\x40\x74\x95\x9c\x6d\x32\x10\x45\x11\
+\x02\x21\x13\xff\xaf\x38\x92\x34\x6b\xbf\x26\xb0\x9f\xfe\xf5\xcb\
+\x25\x5f\x76\x22\x90\xef\xd6\xc8\x4e\x0e\x05\x6d\x56\x01\xb0\x32\
+\x30\x24\x20\x07\x8a\x95\xf0\x52\x9c\xb6\xc3\x6c\x73\x12\x02\xdc\
+\x6b\x67\x86\x92\xc2\x8d\x39\x75\x4c\x49\x9f\x76\xb9\x35\xc1\x2d\
+\x8a\x39\xe7\xed\x51\x86\x6b\x82\x24\xba\x47\xdb\x5b\xdb\xc4\x6e\
+\xec\xdf\x5a\x8f\xe7\x6f\x23\xc0\xb5\x15\xb9\x8f\x6f\xf3\x2e\xd6\
+\xd9\x0a\x80\x95\xf1\x78\xf5\xbb\xc0\x2b\xc9\xa5\x39\x6d\x1c\x86\
+\xc7\xbd\xee\xd3\x32\x38\x4d\x62\x80\xc1\x8a\x8d\x24\x9d\xc6\xb3\
+\x9f\xb5\x50\x1f\x09\x9f\x95\x87\x29\xe9\xd3\xee\xcf\xa3\xb1\xff\
+\x25\x89\xee\x15\x9b\xb5\x64\xb0\x17\xbb\xd7\x9e\xef\x79\xe9\x08\
+\x70\x6d\xa5\xab\xed\x63\x4d\x7e\xfa\x48\x40\x01\xf0\x91\xc7\xac\
+\x4f\xce\x14\x66\x61\xca\x5e\x08\x11\x40\x2c\xb2\x37\x74\xa3\x01\
+\x06\x2b\x36\x92\x34\xc9\x9a\xa4\x8d\x20\x60\x3b\x26\xf1\x61\x78\
+\x99\x5e\x87\xb3\x3f\xd3\xfe\x63\xd9\xc3\xf8\xc4\xb9\x6c\xd4\x43\
+\x7d\xb5\x24\xfc\x33\xb7\x8e\x1f\x89\x0d\x49\xf5\xf8\x21\xf0\x3f\
+\xac\xe4\x61\x27\xf6\x06\x36\xb3\x1b\xd3\xc6\xc3\xe1\x5b\x37\xce\
+\x06\x70\x54\x01\xb0\x22\x08\xce\x14\x56\x40\xcb\x74\x0a\xb1\xd8\
+\x5b\x04\x9c\xba\x46\xd2\x46\x10\xb0\x1d\x93\xf8\xf7\xe7\xa7\xe9\
+\x95\xc4\x7e\xba\x4d\xfb\x8f\x65\xff\x7e\x79\xe1\x5c\xb6\xd3\xfa\
+\x6a\x7e\x4f\x52\xfd\xf7\xcb\xd3\x18\x29\x3e\xa7\x3c\x49\xfe\x7c\
+\x7b\x01\x3b\x4f\xf7\x97\x7c\xff\xea\x4a\xe2\x07\xdc\x5c\x0b\x1f\
+\x76\x24\xfd\x60\x65\xe7\x04\x14\x00\xe7\x44\xee\x7c\x8e\x3a\x98\
+\xdd\x31\xbb\xe9\xc3\xd1\x44\x40\xd3\xb0\x57\x38\x17\x31\x3e\x5c\
+\xc7\x24\xff\x15\xee\x0c\xfe\x7e\xff\x1a\x6a\xf7\xcf\x71\xf6\x7f\
+\x9f\x51\xea\x12\x0a\x80\x85\x44\x19\xcc\x16\x9e\x62\xf1\x02\x04\
+\x88\x0b\x83\x7a\x81\xa6\x6c\x62\x05\x01\xe2\x13\x61\x35\x80\x3e\
+\x82\x1d\xd8\xb3\xc2\x0d\x4f\xc9\x44\x80\xe4\x9f\x7b\xf6\x9f\xc9\
+\xf4\xaa\xab\x55\x00\x2c\x08\x1f\x83\xc7\x82\xe2\x16\x2d\x4c\x80\
+\x41\xdd\x18\x2d\x87\x5e\x72\x46\x4b\x8c\x48\xc0\xa5\xe3\xc4\x72\
+\x3f\xf7\xfa\x69\x7f\x39\x21\xcf\xc8\x4d\xc0\xe4\x9f\x9b\xf0\xe5\
+\xfa\x15\x00\x97\xb9\x7c\xda\xcb\x80\xe5\xe0\xf1\x09\x4b\xb8\x1d\
+\xc4\x88\x58\x85\x33\x4c\x83\x3e\x10\x98\xe2\x94\x3b\x56\x53\xe2\
+\x67\xb9\x7f\x1c\x86\x24\xff\xa9\x8f\xdf\x51\x1f\x92\xfe\x61\xf6\
+\x9f\xb4\xc2\x8b\x95\xb9\xf3\x12\x01\x05\xc0\x25\x2a\x17\xf6\xa5\
+\xfc\xfd\xef\x0b\xd5\xbb\x2b\x21\x01\x92\x0b\xb3\xbd\x84\x55\x5a\
+\x55\x06\x02\xc4\x89\x6d\x5a\x11\x48\x21\x06\x8e\x09\xff\xaf\xc7\
+\xe3\x57\x44\xa9\x37\x65\xe2\xcf\x80\x60\x70\x5c\x19\x06\x67\xff\
+\x39\x7a\xd6\xbc\x3a\x15\x00\x33\x38\x31\x30\xa5\x9a\x3d\xcc\x68\
+\xce\x22\x09\x08\x10\x2f\x12\x00\xb1\x4b\x50\x5d\xd3\x55\x44\x98\
+\xd1\x22\x04\xd8\x88\x19\xe2\x8d\xb8\xb1\xbd\x27\xf4\xb7\xa4\x7e\
+\x1a\x84\xd3\xfd\xc7\x72\x5f\x9e\x9e\x39\xef\x98\xf0\xc7\xc3\x33\
+\xf1\x3f\x2d\x9f\xf2\x7d\x4b\xdf\xd4\x48\xc9\x65\x4d\x5d\xa5\x66\
+\xff\x6b\x6c\xeb\xe1\x1c\x05\xc0\x8c\x28\x1f\xc6\xf1\xeb\x8c\x62\
+\x16\x09\x48\x80\xd8\x91\x20\x02\x9a\xa6\x49\x57\x08\x90\xbc\x89\
+\x1b\xdb\x48\x32\xff\xb5\x21\x0e\xa6\xed\x74\xff\xb1\xdc\xdb\xf2\
+\x3e\xe7\x5d\xa9\x32\xec\xee\x1a\x6d\x4e\x05\x93\xdf\xc1\x70\xf6\
+\x9f\x8a\xe6\xba\x7a\x14\x00\x77\xb8\x99\x3c\xee\x00\xaa\xe0\x30\
+\x09\x82\x38\x32\x6b\xac\xc0\x5c\x4d\x0c\x4c\x80\xa4\x15\xd8\xbc\
+\xaa\x4c\x2b\xf7\xf0\x69\x55\x58\x8a\x1a\xab\x00\xb8\x83\x9b\xe4\
+\x71\xa7\x88\x87\x2b\x20\x40\x1c\x99\x35\x22\x04\x2a\x30\x57\x13\
+\x83\x12\x48\x99\xb4\x7a\x16\xa4\x2c\xfd\x3b\xfb\xdf\xbf\x93\x2b\
+\x00\x6e\xc4\xc0\x64\x71\x03\x4e\xa5\x87\x10\x02\x2c\x23\x1b\xdb\
+\xdf\x01\xf4\x9e\xf6\x6f\x16\x25\xdf\xbd\x76\xfc\x2b\x80\x25\x93\
+\x7f\xc9\x98\xd6\xd6\x96\x02\xe0\x4a\xc4\x48\x10\x24\x8b\x2b\x87\
+\xdd\x5d\x39\x01\x62\x4b\x8c\xd9\x2a\x77\x25\x89\xf9\x2e\x6d\xcf\
+\xc3\x68\xe2\x9a\xc7\xe9\x56\x29\x66\xff\xb7\x8e\x7b\xac\x1c\x01\
+\x05\xc0\x15\xd6\x24\x88\x2b\x87\xdc\xdd\x08\x01\x62\xcc\x86\x08\
+\x60\x6b\xc4\xad\x55\x6e\xa4\x5c\xda\x5e\x65\x40\x87\x27\xf5\xfa\
+\x15\xc0\xb2\x22\xaa\xc3\x8e\xb5\xc0\x65\x05\xc0\x05\x58\xbd\x27\
+\x83\x0b\x48\x9a\xde\x85\x08\x60\x23\xee\x6c\x4d\x3b\x7b\xc5\xb9\
+\x08\x5f\x05\xbc\x62\x5a\x98\xdd\xa9\x67\xae\xe3\x30\x24\xf9\x61\
+\xa2\xa1\xa2\x3f\xa9\x19\x56\xe4\x7a\x48\x53\x15\x00\x17\xc2\x42\
+\x32\xb8\xb0\xdb\x5d\x8d\x13\x20\xee\x6c\xd3\x33\x02\x3d\x3d\xa4\
+\xe5\x73\x00\x65\x3b\x77\x4f\x7d\x6b\x22\x4b\xf2\x2f\x3d\xfb\x9f\
+\xda\xf6\xf5\x32\x01\x05\xc0\x19\x97\x5e\x67\x80\x67\x18\xba\xff\
+\x88\x10\xe0\x5b\x03\xfc\xb8\x0c\x7d\xa2\x87\x01\xdb\xe7\x00\x6e\
+\x77\xfb\x94\xc9\xeb\xb5\xe3\x07\x00\x6f\x53\xf6\x68\x49\x02\x0a\
+\x80\x13\xda\x0c\xf2\x0c\xfc\x27\xbb\x7c\xdb\x39\x81\xf1\x6d\x99\
+\x96\x3e\x81\x18\x98\x56\x06\x10\x04\x9d\x63\xe9\xce\x7d\x66\xaf\
+\xdd\x39\x9d\xd0\x61\xf8\xa5\x14\x50\xf3\x4c\xb3\xd4\x3d\x02\x0a\
+\x80\x13\x42\xaf\xaa\xf2\x13\x1a\xbe\xbd\x44\x00\x31\xc0\x86\x18\
+\x60\x9b\x56\x08\x10\x05\x08\xc8\x4b\xe7\x54\xb3\xef\x30\x7e\xab\
+\xc6\xd6\xc2\x86\xa6\x7e\x46\x82\x3e\x54\xd8\x85\x5d\x9b\x33\xf9\
+\xef\x8a\xff\x6a\xe3\x0a\x80\x5f\x68\x18\xc0\x7b\xbb\x28\x7f\xb9\
+\xee\xcb\x06\x02\xe3\xaf\x15\x02\xfa\xce\xb4\x4a\x80\x30\x60\x43\
+\x1c\x4c\x1b\xfd\x8b\x6d\xfa\x3c\xbd\xb2\x6f\x43\xf3\x49\x4f\xf5\
+\x39\x80\xcb\x38\xb9\x35\x92\x92\x4d\xa4\x98\x5f\xf6\x38\xed\xde\
+\xf1\x70\xd8\x45\x58\xa6\xf5\xa2\xcd\xda\x14\x00\xbf\xe2\xca\x00\
+\xfe\xeb\xad\x2f\x12\x48\x42\x00\x71\x30\x6d\xf4\x2f\xb6\xe9\xf3\
+\xb1\x81\xb7\x19\x77\xb4\x99\x11\xc9\xee\x68\x9b\xff\xbc\x13\xf0\
+\x2b\x92\xef\x28\x56\xbd\x89\xd6\xc7\x57\x39\xd1\xe8\x49\x0a\x80\
+\xb7\xc0\xf6\xa6\xc8\xdf\x5c\xf6\xef\x8e\x04\x98\x11\xfd\xf1\xfd\
+\xf9\x29\xe5\xac\x32\x99\x3b\x6f\xa2\x24\x59\x5d\x8d\x54\x94\x3a\
+\x81\x21\x04\x1b\x41\x73\xd7\x0d\xfa\xfa\xdd\x42\x59\x0a\x58\xe9\
+\x1c\x02\x0a\x80\x37\x4a\x3d\x5d\x90\x6f\xee\xfa\x77\x27\x02\xcc\
+\xae\x0f\x87\xf1\x29\x75\x42\x49\xe9\x0e\xa2\x04\x3b\x53\xd6\x59\
+\x73\x5d\xa9\x13\x58\x4f\x93\x0d\xd8\x45\xee\xeb\x35\xf7\xcb\x54\
+\xb6\x77\x2f\x00\x7a\xba\x20\x53\x75\x1a\xeb\x59\x4e\x80\xc1\x30\
+\xec\xac\xff\xdc\x1d\x57\x01\x8e\x44\x88\x99\x09\xec\x88\x62\xd5\
+\x3f\xa9\x1f\x9c\x5c\x62\x84\x65\xe7\x11\xe8\x5a\x00\x90\xfc\x9d\
+\xfd\xcf\xeb\x28\x96\x5a\x47\x80\xd9\x74\xf4\x59\xff\xb9\x67\xae\
+\x02\x9c\x13\x49\xf7\xb9\x97\xf1\x06\xf1\x44\x3f\x4a\x47\xce\x9a\
+\x72\x10\xe8\x5a\x00\xe4\x00\x6a\x9d\x12\x98\x08\x90\xf8\xab\x99\
+\xf5\x4f\x46\x4f\xaf\x9d\xaf\x02\x90\xc0\x52\xcf\xfe\x99\x70\x4c\
+\x78\x5b\x7f\x4d\xcd\x6e\x19\x2f\x4b\xcf\x25\xd0\xad\x00\xe0\x62\
+\xec\x45\x8d\xcf\xed\x0c\x96\x4b\x43\x80\x59\xff\x7f\xbe\x3f\x1f\
+\x6a\x9e\x01\x61\x3b\x7e\xa4\x21\x52\x57\x2d\xf8\x9d\x23\x81\xf5\
+\x32\xde\x20\x9e\xea\x8a\x78\xbf\xd6\x76\x2b\x00\x7a\xb9\x18\xfb\
+\xed\xda\xe5\x3d\x27\x71\x4c\xb3\xfe\xf2\xad\x67\x68\xb1\xd7\x55\
+\x80\x0c\x7e\x33\xe1\xc8\x10\xa1\x90\x55\xe6\x10\x4f\x4b\x1c\xb5\
+\xec\x7c\x02\x5d\x0a\x80\x9e\x2e\xc6\xf9\x5d\xc1\x92\x5b\x08\x30\
+\xeb\xa9\x76\xb9\xff\x8a\xe3\xac\x02\xe0\xd7\x95\xc3\x4d\xee\xc6\
+\x5f\xfc\x6e\xd2\xb9\x02\x4e\xc1\xaf\x40\x33\x36\x91\x88\x40\x97\
+\x02\xc0\xd9\x7f\xa2\xde\x63\x35\xc3\x34\xeb\x6f\x75\xd6\xd3\xaa\
+\x5f\x97\xba\x2e\xc9\x2b\x87\xbf\xfc\x44\x74\x0f\x63\x4e\x2e\x7e\
+\x97\x62\x75\x7d\x9f\x47\x96\x10\xe8\x4e\x00\x38\xfb\x5f\xd2\x3d\
+\x2c\x7b\x8b\x00\x03\x5e\x6b\xb3\xfe\x4b\xfe\x72\x5b\xe3\xd2\xfe\
+\xd6\xf6\xe5\x48\xfe\x30\x7a\xed\xe4\xff\x18\xc9\xc5\x0f\x86\x6e\
+\x79\x08\x74\x25\x00\x48\xfe\x3d\x28\xf1\x3c\x5d\xc5\x5a\x27\x02\
+\x91\x67\xfd\xcc\x36\xd9\x26\x5b\x53\xbc\xb2\x24\x8e\xd8\x49\x51\
+\x57\xd4\x3a\x72\x89\x9c\x5e\xc6\x9c\x28\xfd\x23\x6a\xff\x8a\x6a\
+\x57\x57\x02\xe0\x61\x1c\xff\x8c\x1a\x08\xed\xaa\x83\x00\x89\x22\
+\xfc\xac\x7f\x3c\x7c\x4d\x4d\x93\xd9\x5d\xab\x83\xfc\x31\xa6\x7f\
+\xbf\xbc\xa4\x66\x46\x7d\xbd\x4c\x38\xe8\x1f\xf8\xeb\x56\x17\x81\
+\x6e\x04\x00\x4a\x7c\x1c\x86\xc7\xc1\x3f\x12\x58\x41\x80\xe4\x57\
+\xc3\x57\xfb\x5e\xdf\x96\x9b\xc7\xb7\x7e\x9e\x7a\x15\x00\x64\x0c\
+\xf2\x70\xe0\x7d\x2b\x5b\xce\xe4\xcf\x98\xd3\x0a\xa7\x5b\x7e\xc4\
+\xe9\x13\xb7\xac\xf4\xd8\x25\x02\xdd\x08\x80\x5e\x94\xf8\xa5\x20\
+\xbb\x6f\x3d\x81\xc8\xcb\xfd\x37\xbd\xca\xb0\x0a\x40\x7b\x2d\x89\
+\x80\x9c\xc9\x1f\x56\x3d\x8c\x39\x5c\x1f\xf4\x09\xfc\x75\xab\x8f\
+\x85\x2c\x76\xd5\x00\x00\x10\x00\x49\x44\x41\x54\x40\x17\x02\xa0\
+\x17\x25\x5e\x5f\xf7\x8b\x6d\x31\x33\x9b\xf0\xcb\xfd\x57\x10\xe6\
+\x5a\x05\xa0\x39\x06\x7c\xd8\xf0\xbe\xd6\x0d\xfb\x79\xb6\x21\x97\
+\xfd\xbd\x8c\x39\x91\xfe\xab\xe4\x5c\xb1\x6c\xb9\xde\x2e\x04\x40\
+\x0f\x4a\xbc\xe5\x4e\x5a\xda\x37\x66\x35\xcc\x0e\x49\x74\xa5\xdb\
+\x4e\xda\x5e\xa6\x55\x00\x6c\x84\x0d\x49\x94\xf7\xb5\x6d\xb9\x63\
+\x4b\xf2\xef\x61\xcc\x21\xfe\xf4\x83\xda\xe2\xaf\xbd\xbf\x09\x34\
+\x2f\x00\xb8\x18\x7f\xbb\xeb\x3b\x09\xdc\x26\xc0\xa0\x56\xeb\xac\
+\xff\xdc\x33\x56\x01\x72\xf6\x7f\x06\x7f\x78\x9d\xb7\x1b\xf5\x33\
+\xc2\x2e\xf7\x73\x1c\x3c\x7b\xd1\x43\xf2\x27\xc6\xc4\x9f\xd7\x18\
+\x9b\x56\xac\x21\xd0\xb4\x00\x60\xf0\xeb\xe5\x62\x5c\x13\x7c\xcf\
+\xf9\x4d\x60\x4a\x0e\xad\x0d\x6a\xf4\x7f\x92\xd2\x6f\x4f\xd3\xbe\
+\x83\x17\x33\x6a\xf8\xa5\xad\x39\x6d\x6d\x08\x15\x84\x5d\xda\x5a\
+\x2f\xd4\x96\x71\xd5\xe5\x42\x6b\xbb\xed\x82\xe7\x6e\x8d\xdb\x70\
+\x32\x02\x4d\x0b\x00\x06\xbf\x64\xa4\xac\xa8\x49\x02\x24\x2e\x12\
+\x58\x91\xe4\x50\x80\xe0\xc5\xaf\xba\x66\x4e\x4a\xdc\x4b\x87\x5f\
+\xc4\xa4\x30\xc5\x17\xa1\x92\x1b\x3f\x13\x0e\x56\x5d\x72\xb7\x13\
+\xa1\xfe\x12\x3c\x97\xf8\x69\xd9\x75\x04\x9a\x15\x00\x5c\x8c\xeb\
+\x90\x78\x56\x2f\x04\x48\x58\x24\x2e\x12\x58\xcb\x3e\x93\x94\x4a\
+\x5c\x0f\x24\x05\x96\xd8\xe1\x1a\x81\x27\x76\x94\x8a\x2f\x7c\x7b\
+\x99\x70\xc0\x35\x42\x7c\xb5\x61\x3b\x81\x66\x05\x40\x2f\x17\xe3\
+\xf6\x2e\xd0\x5f\x0d\x25\x67\x85\x51\xe8\x72\x3d\xe4\xbc\x15\x70\
+\xea\x27\x42\x80\x24\xc1\x76\xba\xbf\xd4\x7b\xda\x45\x88\x60\x47\
+\xa9\x36\xe1\x5b\xaa\xad\x3d\xdb\x81\x6d\x49\xae\xf3\x7c\xb5\xd4\
+\x5a\x02\x4d\x0a\x00\xd4\xf8\x5a\x20\x9e\xd7\x36\x01\x06\xb0\x52\
+\xb3\xc2\x70\x24\x33\xdf\x0a\x38\xf5\x97\x24\xc1\x46\x22\x86\xf9\
+\xe9\xb1\x5c\xef\x69\x87\xf6\x68\x37\x57\x1b\x97\xea\xfd\xf1\xe5\
+\xe9\xf9\xd2\x7e\xf7\x49\x20\x3a\x81\xe6\x04\x00\xb3\x9c\x5e\xd4\
+\x78\xf4\xce\x15\xc9\xbe\x1e\x67\xfd\xe7\xfc\xb9\x15\xb0\x47\xb2\
+\x22\x21\x93\x98\x49\xd0\x6c\xc4\xe2\xdc\xb6\x35\x9f\xa9\xe7\xb8\
+\x1d\xc6\x27\xea\xa7\x9d\x35\xf5\x6c\x39\x87\xc9\x06\x5c\xb7\xd4\
+\x51\xcb\xb9\xc4\x6e\x0f\xc6\xf7\xf8\x78\x7c\x3d\x81\xe6\x04\xc0\
+\xeb\xf0\xe0\xcf\xfd\xae\xef\x0f\x4d\x9e\x39\x3d\xe4\xd7\xfa\xbd\
+\xfe\x39\xc1\x1b\x87\xe1\x91\xa4\x35\xa7\x6c\xea\x32\x24\x0f\x36\
+\x56\x60\x48\xd8\x87\xb7\xc4\x4d\x52\x39\x26\xf1\x61\xb8\xfa\x5b\
+\xfc\xd3\x71\x5e\x8f\xe5\xdf\xce\xe3\x7c\xea\x39\x6e\x99\x7e\xc7\
+\x7f\xb8\xf3\x07\x8e\x3d\x4d\x36\x88\xdd\x1d\x24\x1e\xae\x8c\xc0\
+\x43\x65\xf6\xde\x34\xb7\xb7\x0b\xf2\x26\x0c\x0f\x0e\x24\x8c\x63\
+\xa2\xd8\x29\x41\xec\x11\x02\x12\xfc\xbd\x76\x49\x5a\x5c\x2b\xf7\
+\xca\xe5\x3e\x8e\x20\x23\xa9\x1c\x93\xf8\xf7\xe7\xe3\x2c\x9e\x78\
+\x9d\x6f\xd3\x71\x5e\x8f\xe5\x03\xc4\x13\x7e\x70\xcc\xcd\x28\x4a\
+\xfd\x08\xaf\x28\xb6\x7c\xb4\xc3\x4f\x5b\x08\x34\x25\x00\x7a\xba\
+\x20\xb7\x04\xbd\xf5\x73\x49\xfc\xcc\x2e\x49\x18\xad\xfb\xba\xd6\
+\x3f\xae\x15\x92\xd8\xda\xf3\x7b\x3e\x0f\x6e\xf0\xeb\x89\x01\xc2\
+\xab\x27\x7f\x7b\xf1\xb5\x19\x01\xc0\x45\xd9\x4b\xd0\xf4\xf3\x3a\
+\x01\x66\x2a\x24\x7e\x66\x97\xd7\x4b\x79\x04\x02\x24\x31\xaf\x1b\
+\x48\xcc\xdf\xe0\x05\xb7\xf9\x67\xd4\x5f\x92\x6b\x2a\xaa\x17\xda\
+\xb5\x8d\x40\x33\x02\xa0\xb7\x8b\x72\x5b\xd8\xdb\x3b\x7b\x9a\xf5\
+\x3b\x53\x59\x16\x5b\xae\x1b\x92\xda\xb2\xb3\xfa\x2c\x0d\x27\x78\
+\xf5\xe4\x3d\xc9\xdf\x6b\xaa\xdd\x88\x37\x21\x00\xb8\x30\xdb\x0d\
+\x91\x9e\xdd\x23\xc0\x20\xe5\xac\xff\x1e\xa5\xeb\xc7\x49\x6a\x5e\
+\x43\xd7\xf9\x70\x04\x3e\x70\xe2\x7d\x4f\x5b\xec\xe4\xdf\x53\x24\
+\xf2\xf8\x5a\xbd\x00\xe8\xf5\xc2\xcc\xd3\x1d\xac\xb5\x57\x02\x24\
+\x37\xae\xa5\x5e\xfd\xbf\xe5\x37\x5f\x9d\x84\xcf\xad\x32\x2d\x1e\
+\x43\x58\xb7\xe8\x97\x3e\xfd\x26\x50\xbd\x00\xf8\xed\x8a\xef\x7a\
+\x25\xc0\xe0\xfc\xef\x97\xa7\xb1\xf7\x04\xc6\x6f\x60\x6c\xe9\x03\
+\x70\xec\x9d\xe1\x29\x3f\x78\xd2\xaf\xe6\x7c\xb3\xe2\xf4\xbc\x56\
+\xde\x47\x9f\xfd\xb7\xc2\x79\x4f\x3f\xaa\x16\x00\x0c\x56\x0c\x5a\
+\x7b\x02\xb4\xed\x38\x04\xe8\x0b\x0c\xd8\xf4\x8b\x38\x56\xd5\x65\
+\x09\x0c\x99\xf1\xd6\x65\x75\x7a\x6b\xe9\x43\xe3\x78\xe8\xf6\x17\
+\xfe\x9c\xfd\xa7\xef\x53\x11\x6b\xac\x5a\x00\x30\x58\x45\x84\xaa\
+\x4d\xfb\x12\xa0\x5f\x90\xc4\x18\xc4\xf7\xb5\xa4\xce\xd6\x99\xf1\
+\x22\xa4\x98\x01\xd7\xe9\xc1\x7a\xab\xf1\x99\xbe\x43\x1f\x5a\x5f\
+\x4b\xfd\x67\xc6\x9f\xfd\xd7\xcf\x38\x82\x07\xd5\x0a\x00\x07\xf7\
+\x08\xdd\x27\xae\x0d\x24\x31\x06\x71\xfb\xc9\xfa\x18\x31\x03\xee\
+\x89\x1f\xbe\xe2\x33\x7d\x67\x3d\xb5\xfa\xcf\x74\xf6\x5f\x7f\x0c\
+\xe7\x7a\x50\xad\x00\x60\x70\x9f\xeb\xa4\xe5\xfa\x25\x40\x3f\x61\
+\x36\xcb\xe0\xde\x2f\x85\xf5\x9e\xf7\xc2\xcf\x59\xff\xcf\x3e\x42\
+\xf2\xaf\x61\xf6\xff\xd3\x5a\xff\xdd\x4a\xa0\x4a\x01\xe0\x60\xbe\
+\x35\xec\xfd\x9d\xdf\x4b\x22\xcb\x15\x59\xf8\xb5\x78\xdd\xe1\x13\
+\x02\xb1\xf7\x59\xff\xd4\x6f\x4c\xfe\x13\x89\x3e\x5e\xab\x14\x00\
+\x0f\xe3\xf8\x67\x1f\xe1\xd1\xcb\xd4\x04\xa6\x44\xc6\xc0\x9f\xba\
+\xee\xbd\xeb\x7b\xcd\xfc\x1f\x61\xc1\x8e\x64\x59\x3b\xbb\xe9\x3e\
+\x3f\xbe\xe0\xd3\xde\x71\x8b\xd2\x3e\xb3\xff\x28\xb6\xdc\xb6\xc3\
+\xa3\xa9\x08\x54\x27\x00\x18\x7c\xc6\x61\xf0\x7f\xfc\x1b\xfc\xb3\
+\x96\x00\x83\x3e\x1b\x7d\x69\x6d\x1d\x3d\x9f\x07\x3b\x92\x67\x6d\
+\xfc\xa6\xc4\x3f\x8e\x87\x67\xc7\x90\xcf\x3d\xd8\xd9\xff\x67\x26\
+\xad\xef\xa9\x4e\x00\xb4\x1e\x10\xfd\x2b\x47\xe0\x30\x8e\x5f\x6b\
+\x4c\x64\xe5\x08\xdd\x6e\xa9\x16\x7e\x26\xfe\xdb\x71\xe4\x68\x4d\
+\xb3\x7f\xec\x75\x4b\x43\xa0\x3a\x01\xc0\xa0\x93\xc6\x75\x6b\x91\
+\xc0\x4f\x02\xf4\x29\x85\xc0\x4f\x16\x6b\xfe\x9d\xf8\xf1\x20\x5d\
+\x94\x55\x01\x92\x3e\xb6\x60\x93\x33\xfe\xdb\x51\xe5\xff\xd1\x70\
+\xf6\x7f\x9b\x51\xab\x47\xab\x12\x00\x5c\xd0\xad\x06\x42\xbf\xf6\
+\x27\x40\x22\xa3\x8f\x91\x3c\xf6\xb7\xa6\x3e\x0b\x58\x56\x87\xe1\
+\x24\xa6\x4a\xb3\x24\x6e\x24\x7c\xda\x27\xe9\x63\x0b\x36\xd5\x47\
+\xb2\xac\xc5\xaf\x87\xc3\x3f\x65\x5b\xdc\xd2\x9a\xe7\xa6\x24\x50\
+\x95\x00\xf0\xe1\xbf\x94\xa1\xb7\xae\x4b\x04\x8e\x49\xe3\xed\x1e\
+\x31\xc9\xeb\xd2\x71\xf7\xcd\x23\x00\x47\x36\x12\x31\x09\x99\xc4\
+\x0c\x53\xb6\x79\x35\xdc\x2e\x75\x4c\xf6\x7f\x3d\x3e\x52\x1f\x75\
+\xd3\x06\x6d\x99\xf0\x6f\x73\x3b\x3f\xca\xd2\xbf\xb3\xff\x73\x2a\
+\xfd\x7c\xae\x4a\x00\x78\x71\xf7\xd3\x31\xf7\xf6\x94\xe4\x45\x52\
+\x21\xc1\xec\x6d\x4b\x0b\xed\x73\xed\xc2\x94\x0d\xae\x6c\x24\xee\
+\x69\x83\xf3\xb5\x6d\x2a\xc3\x2b\xe7\xb1\x1d\x93\xfd\x9b\x50\xa3\
+\x3e\xea\x6e\x81\xd1\x1e\x3e\xd4\x96\xfc\xf7\x60\xd4\x72\x9b\xd5\
+\x08\x00\x14\x7f\xcb\x81\xd0\xb7\x98\x04\x48\x30\x24\x1c\x92\x53\
+\x4c\x0b\x7f\x5b\x55\xdb\x0a\x19\x89\x7b\xda\xe0\x7c\x6d\x9b\xca\
+\xf0\xfa\xdb\x5b\xdf\x6d\x25\xc0\xec\x7f\x6b\x1d\x9e\x5f\x37\x81\
+\x6a\x04\xc0\x6b\xe6\xef\x38\xd7\x1d\x46\xad\xcf\x4d\x80\xe4\x54\
+\x83\x08\xc8\xcd\xc1\xfa\xdb\x21\x50\xdf\xec\xbf\x1d\xf6\x51\x3c\
+\xa9\x46\x00\xd4\x36\xbb\x89\x12\x60\xed\x48\x47\x00\x11\x50\xcb\
+\x6a\x40\x3a\xaf\xad\xa9\x45\x02\xce\xfe\x5b\x8c\xea\x72\x9f\xaa\
+\x11\x00\xa3\x3f\xfe\xb3\x3c\xba\x9e\x91\x85\x80\x42\x20\x0b\x56\
+\x2b\x2d\x44\x80\xe4\x5f\xe3\xec\xbf\x10\x9e\xae\x9a\xa9\x42\x00\
+\x78\xff\xbf\xab\x3e\x59\x8d\xb3\x08\x01\x1e\x4c\xf3\xd6\x40\x35\
+\x21\xd3\xd0\x37\x02\x0f\xc3\xeb\xcb\xdb\x8b\x7f\x25\x30\x54\x21\
+\x00\x8c\x93\x04\xa2\x12\x60\x65\x0a\x21\x10\x41\x04\x60\x4b\x54\
+\x4e\xda\x15\x83\x00\xb3\xff\x3f\xfe\x7e\x79\x89\x61\xcd\x12\x2b\
+\x2c\x9b\x83\x40\x15\x02\xe0\xd5\x07\x00\x73\xc4\xde\x3a\x13\x12\
+\x40\x04\xf8\x7c\x40\x42\xa0\x56\x95\x85\x80\x4b\xff\x59\xb0\x56\
+\x5b\x69\x15\x02\xa0\x5a\xba\x1a\xde\x1d\x01\x85\x40\x77\x21\xaf\
+\xc6\x61\x66\xff\xd5\x18\x7b\x66\xa8\x1f\xf3\x10\x50\x00\xe4\xe1\
+\x6a\xad\x9d\x13\x40\x08\x70\x5b\x80\xad\x73\x14\xba\x1f\x84\x80\
+\xb3\xff\x20\x81\x08\x64\x86\x02\x20\x50\x30\x34\xa5\x2d\x02\x88\
+\x00\x36\x45\x40\x5b\x71\xad\xd1\x9b\xba\x67\xff\x35\x12\xaf\xc3\
+\x66\x05\x40\x1d\x71\xd2\xca\x8a\x09\x20\x02\x7c\x3e\xa0\xe2\x00\
+\x56\x6e\x3a\xc9\xdf\xd9\x7f\xe5\x41\xcc\x64\xbe\x02\x20\x13\x58\
+\xab\x95\xc0\x39\x01\x85\xc0\x39\x11\x3f\x97\x20\x50\x7b\xf2\x2f\
+\xc1\xa8\xd7\x36\x14\x00\xbd\x46\x5e\xbf\x77\x23\x80\x10\x48\x7d\
+\x5b\xc0\xdf\xca\xd8\x2d\x9c\xa1\x1b\x66\xf6\x1f\xda\x40\x8d\xdb\
+\x95\x40\x15\x02\xc0\x9f\x01\xde\xb5\x8f\xd8\x78\x06\x02\x88\x00\
+\x6f\x0b\x64\x00\x6b\x95\x1f\x08\xd4\x3f\xfb\xff\xe0\x8e\x1f\x12\
+\x13\xa8\x42\x00\xbc\x1e\x0e\xff\x24\xf6\xdb\xea\x24\x10\x82\x80\
+\x42\x20\x44\x18\x9a\x34\xc2\xd9\x7f\x93\x61\x4d\xea\x54\x15\x02\
+\xc0\x9f\xae\x4c\x1a\x73\x2b\x0b\x48\x40\x21\x10\x30\x28\x15\x9b\
+\x74\x18\x86\x97\x16\x66\xff\x15\x87\xa0\x0a\xd3\xab\x10\x00\x55\
+\x90\xd4\x48\x09\x24\x20\x80\x10\x48\xfd\x7c\x40\x02\xb3\xac\xa2\
+\x32\x02\xae\x9a\x56\x16\xb0\x9d\xcc\xad\x42\x00\xf8\xdb\xd5\x3b\
+\xf5\x0e\x9b\xdd\x85\x00\x22\x60\xe9\xf3\x01\xfe\x5c\xf6\x2e\xa1\
+\x0a\xd9\x28\x4b\xff\x6d\xcc\xfe\x43\xe2\x6d\xca\xa8\x2a\x04\x00\
+\xc4\x59\xd2\xe2\xd5\x4d\x02\xbd\x10\x58\x23\x04\x7a\x61\xa3\x9f\
+\xd7\x09\x98\xfc\xaf\xb3\xf1\xc8\x47\x02\xd5\x08\x80\x8f\x66\xfb\
+\x49\x02\xfd\x10\x40\x08\x70\x5b\x80\xad\x1f\xaf\xf5\x74\x0d\x01\
+\x66\xff\x6b\xce\x8b\x78\x8e\x36\xe5\x27\x50\x8d\x00\xf0\x9e\x56\
+\xfe\xce\x60\x0b\x71\x09\x20\x02\xd8\x14\x01\x71\x63\x14\xc1\x32\
+\x67\xff\x11\xa2\x50\x8f\x0d\xd5\x08\x00\xbf\x09\x50\x4f\xa7\xd2\
+\xd2\x7c\x04\x10\x01\x4b\x9f\x0f\xc8\x67\x8d\x35\x47\x22\xd0\xd6\
+\xec\x3f\x12\xd9\x76\x6d\xa9\x46\x00\xf0\x20\xa0\xcf\x01\xb4\xdb\
+\x11\xf5\x6c\x19\x01\x85\xc0\x32\x5e\xad\x97\x26\xf9\x3b\xfb\x6f\
+\x3d\xca\xe9\xfd\xab\x46\x00\xa4\x77\xdd\x1a\x25\x50\x3f\x01\x84\
+\x00\xb7\x05\xfc\xb5\xcc\xfa\x63\xa9\x07\xbf\x09\xf8\xae\x0c\x81\
+\xba\x04\xc0\x61\xfc\x56\x06\x8b\xad\x48\xa0\x1e\x02\x88\x80\x71\
+\x18\x1e\x07\xff\x74\x49\x60\x3c\x1c\xbe\x39\xfb\xef\x32\xf4\x9b\
+\x9d\xae\x4a\x00\x78\x1b\x60\x73\xbc\xad\x40\x02\x12\x68\x8c\x40\
+\x7b\xc9\xbf\xb1\x00\x05\x76\xa7\x2a\x01\x70\xe4\xe8\x2a\xc0\x11\
+\x83\xff\x48\x40\x02\x12\x60\xf6\x2f\x05\x09\xac\x25\x50\x9d\x00\
+\x60\x15\x60\xad\xb3\x9e\x27\x01\x09\x48\xa0\x25\x02\x2d\xce\xfe\
+\x5b\x8a\x4f\x74\x5f\xaa\x13\x00\x00\xf5\xdb\x00\x50\x70\x93\x80\
+\x04\x7a\x26\xe0\xec\xbf\xe7\xe8\xa7\xf1\xbd\x4a\x01\x30\x78\x1b\
+\x20\x4d\xf4\xad\x45\x02\x12\xa8\x92\x00\xc9\xbf\xcd\xd9\x7f\x95\
+\xe1\xa8\xd6\xe8\x2a\x05\x00\xb7\x01\xb8\x00\xaa\xa5\xae\xe1\x12\
+\x90\x80\x04\x36\x10\xf0\x87\xd1\x36\xc0\xf3\xd4\x77\x02\x55\x0a\
+\x00\xac\x47\xfd\x7a\x2b\x00\x12\x6e\x12\x90\x40\x4f\x04\x98\xfc\
+\x30\x09\x6a\xd1\x67\x7d\x2a\x4b\xa0\x5a\x01\x70\xc4\xe4\xad\x80\
+\x23\x06\xff\x91\x80\x04\xfa\x21\xc0\xe4\xa7\x1f\x6f\xf5\x34\x27\
+\x81\xaa\x05\x00\x2a\x18\x35\x9c\x13\x90\x75\x4b\x40\x02\x12\x88\
+\x42\xa0\xed\xf1\x2e\x0a\xe5\x7e\xec\xa8\x5a\x00\x10\x26\xd4\xb0\
+\xb7\x02\x20\xe1\x26\x01\x09\xb4\x4e\x80\xf1\xae\x75\x1f\xf5\xaf\
+\x1c\x81\xea\x05\xc0\x11\x95\xb7\x02\x8e\x18\xfc\x47\x02\x12\x68\
+\x97\x40\xeb\xb3\xff\x76\x23\x17\xd7\xb3\x26\x04\x80\xb7\x02\xe2\
+\x76\x30\x2d\x93\x80\x04\xb6\x13\x20\xf9\x3b\xfb\xdf\xce\xd1\x1a\
+\x3e\x12\x68\x42\x00\xe0\x12\x17\x07\x17\x09\xef\xdd\x24\x20\x01\
+\x09\xb4\x44\x80\xf1\xad\x25\x7f\x3e\xfb\xe2\x9e\x3d\x08\x34\x23\
+\x00\x80\xc7\x45\xa2\x08\x80\x84\x9b\x04\x24\xd0\x0a\x01\xc7\xb4\
+\x56\x22\x19\xcf\x8f\xa6\x04\x00\x78\x15\x01\x50\x70\x93\x80\x04\
+\x5a\x21\xc0\x98\xd6\x8a\x2f\xd7\xfc\x70\xff\x3e\x04\x9a\x13\x00\
+\x60\xe4\x82\x51\x35\x43\xc2\x4d\x02\x12\xa8\x99\x80\xe3\x58\xcd\
+\xd1\x8b\x6f\x7b\x93\x02\x00\xec\x8a\x00\x28\xb8\x49\x40\x02\xb5\
+\x12\xe0\xeb\xcd\x8c\x63\xb5\xda\x3f\xdf\x6e\x4b\xee\x45\xa0\x59\
+\x01\x00\x50\x2e\x1e\x15\x34\x24\xdc\x24\x20\x81\xda\x08\xbc\x1e\
+\x0e\xff\xd4\x66\xb3\xf6\xd6\x45\xa0\x69\x01\x40\x28\x10\x01\x87\
+\xc3\xf8\xc4\x7b\x37\x09\x48\x40\x02\x35\x10\x18\x0f\x87\x6f\x8c\
+\x5d\x35\xd8\xba\xd5\x46\xcf\xdf\x8f\x40\xf3\x02\x00\xb4\xfc\x4e\
+\xc0\x7f\xbe\x3f\x1f\xb8\xa8\xf8\xec\x26\x01\x09\x48\x20\x32\x01\
+\x93\x7f\xe4\xe8\xb4\x63\x5b\x17\x02\x60\x0a\x17\x17\x95\x22\x60\
+\xa2\xe1\xab\x04\x24\x10\x91\x40\x5f\x63\x54\xc4\x08\xf4\x63\x53\
+\x57\x02\x80\xb0\x22\x02\x5c\x0d\x80\x84\x9b\x04\x24\x10\x91\x00\
+\x63\x54\x44\xbb\xb4\xa9\x3d\x02\xdd\x09\x80\x29\x84\x5c\x64\x2a\
+\xed\x89\x86\xaf\x12\x90\x40\x04\x02\xbd\x8d\x49\x11\x98\xf7\x6c\
+\x43\xb7\x02\x80\xa0\x23\x02\x5c\x0d\x80\x84\x9b\x04\x24\xb0\x37\
+\x01\x92\x3f\x63\xd2\xde\x76\xd8\x7e\x3f\x04\xba\x16\x00\x53\x98\
+\xb9\xe8\x14\x02\x13\x0d\x5f\x5b\x26\xc0\x77\xcb\x49\x34\xbc\x9e\
+\x6f\x2d\xfb\xad\x6f\x11\x09\x68\xd3\xde\x04\x14\x00\x27\x11\x40\
+\x08\xf0\x95\x41\x06\xc8\x93\xdd\xbe\x95\x40\x33\x04\xf8\x6e\x39\
+\xfd\xfc\x8f\xef\xcf\x4f\xe7\x1b\x22\xf8\xda\xc6\x75\xf1\x69\x1b\
+\x86\x97\xc1\x3f\x49\x08\x30\xe6\x10\x97\x24\x95\x59\x89\x04\x66\
+\x12\x50\x00\x9c\x81\xe2\x2b\x83\x5c\x88\x5c\x90\x67\x87\xfc\x28\
+\x81\x6e\x09\x70\x5d\x9c\x6f\xdd\xc2\xc8\xe0\x38\x63\x4e\x86\x6a\
+\x43\x57\xa9\x71\xfb\x13\x50\x00\x5c\x89\x01\x17\x24\xb3\x21\x85\
+\xc0\x15\x40\xee\x96\x80\x04\x92\x10\x70\x8c\x49\x82\xd1\x4a\x56\
+\x10\x50\x00\xdc\x81\xa6\x10\xb8\x03\xc8\xc3\xdd\x12\x18\x87\xe1\
+\x71\xf0\xcf\x66\x02\x8c\x31\x9b\x2b\xa9\xae\x02\x0d\x8e\x40\x40\
+\x01\x30\x33\x0a\x5c\xa4\x28\x75\xb6\x99\xa7\x58\x4c\x02\x12\x90\
+\xc0\x4d\x02\x8e\x27\x37\xf1\x78\x30\x33\x01\x05\xc0\x02\xc0\x88\
+\x00\x36\x2f\xda\x05\xd0\x2c\x1a\x8a\xc0\xc3\xf0\xea\x83\x7b\x41\
+\x22\xc2\x38\xc2\x78\x12\xc4\x9c\xa2\x66\xd8\x58\x0c\x02\x0a\x80\
+\x15\x71\xe0\xa2\xf5\xf9\x80\x15\xe0\x3c\x45\x02\x12\x78\x27\xa0\
+\x18\x7b\x47\xe1\x9b\x9d\x08\x28\x00\x36\x80\x57\x08\x6c\x80\xe7\
+\xa9\x12\xe8\x98\x00\xb3\x7f\xbe\x55\xd1\x27\x02\xbd\x8e\x42\x40\
+\x01\x90\x20\x12\x08\x01\x2e\x68\x7e\x58\x25\x41\x75\x56\x21\x01\
+\x09\x34\x4e\x80\x31\xa3\x71\x17\x75\xaf\x02\x02\x0a\x80\x44\x41\
+\xe2\x82\xe6\x87\x55\x10\x02\x89\xaa\xb4\x1a\x09\x84\x25\xf0\xe3\
+\xaf\xc7\xc7\xb0\xc6\x05\x37\xac\xf7\x31\x22\x78\x78\xba\x32\x4f\
+\x01\x90\x38\xdc\x08\x01\x9f\x0f\x48\x0c\xd5\xea\x92\x11\x70\xd9\
+\x39\x19\xca\xd5\x15\x31\x46\xac\x3e\xd9\x13\x25\x90\x90\x80\x02\
+\x20\x21\xcc\xd3\xaa\xb8\xc8\x15\x02\xa7\x44\x7c\x2f\x01\x09\x38\
+\xfb\xb7\x0f\x44\x22\xa0\x00\xc8\x1c\x0d\x84\x80\x17\x7d\x66\xc8\
+\x56\x2f\x81\x0a\x08\x30\x0e\x30\x1e\x54\x60\xaa\x26\x76\x42\x40\
+\x01\x50\x20\xd0\x5c\xf4\xae\x06\x14\x00\x6d\x13\x12\x08\x4c\x80\
+\x71\x20\xb0\x79\x45\x4c\xb3\x91\x58\x04\x14\x00\x05\xe3\xc1\x00\
+\xa0\x10\x28\x08\xdc\xa6\x24\x10\x84\x00\xb3\xff\x20\xa6\x68\x86\
+\x04\xde\x09\x28\x00\xde\x51\x94\x7b\x83\x10\xe0\xbf\x56\x75\x50\
+\x28\xc7\xdc\x96\xd2\x12\x78\x1d\x1e\xfc\x16\xc0\x02\xa4\x5c\xf3\
+\x0b\x8a\x37\x5a\x54\xb7\xa2\x11\x78\x88\x66\x50\x2f\xf6\xf0\x34\
+\x36\x83\x82\x22\xa0\x97\x88\xef\xef\xa7\xbf\x53\xb1\x4f\x0c\xbc\
+\xc6\xf7\xe1\x6e\xab\xf7\x09\x28\x00\xee\x33\xca\x5a\x02\x11\xe0\
+\x6d\x81\xac\x88\xad\x5c\x02\xbb\x11\x40\x74\x71\x8d\xef\x66\x40\
+\xa0\x86\x35\x25\x1e\x01\x05\x40\x90\x98\x30\x48\x28\x04\x82\x04\
+\x43\x33\x24\x90\x88\xc0\xeb\xe1\xf0\x4f\xa2\xaa\xac\x46\x02\xc9\
+\x09\x28\x00\x92\x23\xdd\x56\x21\x42\x80\x25\x43\xb6\x6d\x35\x79\
+\xb6\x04\xda\x25\xc0\x33\x34\x6c\x91\x3d\xe4\x1a\xe6\x7a\x8e\x6c\
+\x63\x39\xdb\x6c\x29\x22\x01\x05\x40\xc0\xa8\x30\x68\xb0\x31\x80\
+\x04\x34\x4f\x93\x24\xb0\x1b\x01\xae\x09\x56\xca\x78\x86\x86\x8d\
+\x25\xf6\xdd\x8c\xb9\xd3\x30\xd7\xf0\x9d\x22\x1e\x96\xc0\xae\x04\
+\x14\x00\xbb\xe2\xbf\xdd\x38\x03\x08\x83\x1d\x83\xde\xed\x92\x1e\
+\x95\x40\x59\x02\x0f\xe3\xf8\x67\xc9\x16\x49\xf4\xcc\xf8\xb9\x26\
+\x4e\xdb\xe5\xff\xdf\x38\xfd\x1c\xe5\xbd\xd7\xec\xc7\x48\xf8\x29\
+\x26\x01\x05\x40\xcc\xb8\x7c\xb0\x8a\x41\x4f\x21\xf0\x01\x89\x1f\
+\x56\x10\xa8\xf5\x7e\x34\xc9\x94\x44\xcf\x8c\xff\x92\xdb\x1c\xbf\
+\xb4\x7f\xcf\x7d\x5c\xb3\x7b\xb6\x6f\xdb\x12\x98\x43\x40\x01\x30\
+\x87\x52\x90\x32\x0c\x2a\x11\x07\xbb\x20\x78\x34\xa3\x31\x02\xd7\
+\x66\xfd\xe7\x6e\x72\x5d\x50\xf6\x7c\xff\x5e\x9f\xbd\x46\xcf\xc9\
+\xfb\x39\x2a\x01\x05\x40\xd4\xc8\x5c\xb1\x8b\xc1\xce\xd5\x80\x2b\
+\x70\xdc\xdd\x0c\x01\x92\xe8\xad\x59\xff\x27\x47\x0f\xe3\xb7\x4f\
+\xfb\x76\xd8\x31\x1e\x0e\xdf\xb8\x46\x77\x68\xda\x26\x25\xb0\x98\
+\x80\x02\x60\x31\xb2\x18\x27\x30\xc8\x28\x04\x62\xc4\x42\x2b\xd2\
+\x11\x60\x26\x4f\xbf\xa6\x7f\x2f\xa9\x95\xdb\x03\x24\xdf\x25\xe7\
+\xe4\x28\xfb\x30\xbc\xbe\xe4\xa8\xb7\xe6\x3a\xb5\x3d\x2e\x01\x05\
+\x40\xdc\xd8\xcc\xb2\x8c\x81\x92\x01\x33\xc2\xe0\x37\xcb\x60\x0b\
+\x49\xe0\x02\x01\x12\x3f\x0f\xf9\x31\xeb\xbf\x70\x78\xd6\x2e\xae\
+\x05\xea\x99\x55\x38\x43\x21\xae\x41\x84\x48\x86\xaa\xad\x52\x02\
+\x59\x08\x28\x00\xb2\x60\x2d\x5f\x29\x83\x1f\x03\x50\xf9\x96\x6d\
+\xb1\x47\x02\xe3\x30\x24\xfb\xbf\x00\xe8\xb7\x24\xfe\x24\xc9\x73\
+\xc7\x5b\x01\x5c\x83\x83\x7f\xce\x08\xf8\x31\x32\x01\x05\x40\xe4\
+\xe8\x2c\xb4\x8d\x01\xc8\xd5\x80\x85\xd0\x2c\xbe\x1b\x01\x66\xeb\
+\xcc\xfa\xe9\xb7\xa9\x8c\x40\x44\x20\x28\x52\xd5\x37\xb7\x9e\x3d\
+\xda\x9c\x6b\x9b\xe5\x24\x70\x8d\x80\x02\xe0\x1a\x99\x8a\xf7\x33\
+\xa0\x2a\x04\x2a\x0e\x60\x26\xd3\x23\xdd\x9f\x26\x61\x26\x9b\xf5\
+\x9f\xf1\xa2\xff\x9f\xed\xca\xfe\x71\x8f\x36\xb3\x3b\x95\xa0\x01\
+\xab\x88\x4d\x40\x01\x10\x3b\x3e\x9b\xac\x63\x50\x62\x86\xc5\x60\
+\xbb\xa9\x22\x4f\x96\x40\x22\x02\x39\x66\xfd\x97\x4c\xa3\xdf\x5f\
+\xda\x9f\x63\x9f\xd7\x57\x0e\xaa\xd6\x59\x82\x80\x02\xa0\x04\xe5\
+\x1d\xdb\x60\x49\x14\x21\xe0\x20\xb5\x63\x10\x6c\xfa\x48\x80\xa4\
+\x9c\x6b\xd6\x7f\x6c\xe0\xe4\x1f\xfa\x3d\x62\xe3\x64\x57\x96\xb7\
+\x5c\x57\x5c\x5f\x59\x2a\xaf\xbe\x52\x1d\x88\x4e\x40\x01\x10\x3d\
+\x42\x89\xec\x63\x90\xf2\xb6\x40\x22\x98\x56\xb3\x88\x00\x89\x98\
+\xbe\x47\x52\x5e\x74\xe2\xd6\xc2\x05\x1e\x08\xe4\xba\xda\x6a\xa6\
+\xe7\x4b\x60\x2f\x02\x0a\x80\xbd\xc8\xef\xd4\x2e\x2a\x88\x56\x23\
+\x00\x00\x0b\x8b\x49\x44\x41\x54\x03\x16\x83\x31\x33\x97\x9d\x4c\
+\xb0\xd9\xca\x09\xfc\xf8\xeb\xf1\x71\x8e\x0b\x24\xfe\x69\xd6\x3f\
+\xa7\x7c\xea\x32\x08\x8e\x9c\xfd\x3c\x67\xdd\xa9\x59\xec\x51\x9f\
+\x6d\xc6\x27\xa0\x00\x88\x1f\xa3\x2c\x16\x22\x04\x18\xc0\x18\xa4\
+\xb3\x34\x60\xa5\xe1\x08\x90\x10\x4b\x19\x45\xdf\x2a\xb5\xdc\x7f\
+\xcb\x27\xfa\x79\xae\x3e\x4e\xdd\xb7\xda\xf6\x98\x04\xa2\x13\x50\
+\x00\x44\x8f\x50\x46\xfb\x18\xc0\x18\xa4\x19\xac\x33\x36\x63\xd5\
+\x1d\x11\x20\xd9\x32\xeb\xa7\x6f\xed\xed\x36\x2b\x15\x3f\xbe\x3c\
+\x3d\xa7\xfc\xcd\x82\xc9\x27\xaf\x99\x89\xc4\xb5\x57\xf7\xd7\x40\
+\x40\x01\x50\x43\x94\x32\xdb\xc8\x60\xed\x6d\x81\xcc\x90\x3b\xa8\
+\x9e\xa4\x88\xa0\x2c\xb9\xd2\x70\x0d\xeb\xff\xfd\xf5\x3f\xff\x1d\
+\xc7\x43\x96\xe4\x4f\x9b\x5c\x33\xbc\xba\x49\xa0\x66\x02\x0a\x80\
+\x9a\xa3\x97\xd8\x76\x06\x35\x85\x40\x62\xa8\x1d\x54\x17\x6d\xd6\
+\xff\xef\x97\xa7\xf1\x30\x8e\x5f\x73\xa1\x47\xe8\xe4\xaa\xbb\x95\
+\x7a\xf5\xa3\x0e\x02\x0a\x80\x3a\xe2\x54\xd4\x4a\x84\x80\x83\x5c\
+\x51\xe4\x55\x36\x36\x25\xfe\x08\xb3\xfe\xf7\xe5\xfe\xb7\x59\x7f\
+\x4e\x98\x5c\x17\x5c\x1f\x39\xdb\xb0\x6e\x09\x94\x22\xa0\x00\x28\
+\x45\xba\xb2\x76\x18\xe4\x5c\x0d\xa8\x2c\x68\x57\xcc\x9d\x12\xf5\
+\x95\xc3\x8b\x77\xbf\x0e\x0f\x8f\x24\xc2\x08\x89\x1f\xe3\x73\x2f\
+\xf7\xd3\xc6\xb4\x71\x5d\x4c\xef\x7d\xbd\x46\xc0\xfd\xb5\x10\x50\
+\x00\xd4\x12\xa9\x9d\xec\x64\xc0\x53\x08\xec\x04\x7f\x63\xb3\x53\
+\xe2\x4f\x9d\xa8\xe9\x13\x6c\x1b\xcd\xdb\x7c\xfa\x34\xeb\xcf\xb9\
+\xdc\x7f\x6a\x24\xa2\xe7\xf4\xb3\xef\x25\x50\x3b\x01\x05\x40\xed\
+\x11\x2c\x64\x3f\x03\x3e\x4f\x77\x3b\x08\x16\x02\xbe\xb1\x19\x62\
+\x95\x3a\xf1\x6f\x34\x29\xe9\xe9\x25\x67\xfd\x93\xe1\x5c\x03\xd3\
+\x7b\x5f\xaf\x13\xf0\x48\x3d\x04\x14\x00\xf5\xc4\x6a\x77\x4b\x79\
+\xba\x9b\x41\x50\x11\xb0\x7b\x28\xae\x1a\xc0\xac\x9f\x15\x1b\x62\
+\x75\xb5\x50\xc5\x07\x4a\xcf\xfa\x27\x54\xf6\xf9\x89\x84\xaf\x2d\
+\x11\x50\x00\xb4\x14\xcd\x42\xbe\x20\x02\x48\x32\x0e\x8a\x85\x80\
+\xcf\x6c\x86\x78\x30\xeb\x9f\x59\xbc\xba\x62\xc7\xef\xf4\x8f\x87\
+\x6c\x5f\xed\xbb\x06\x04\x51\x45\x9f\xbf\x76\xdc\xfd\xa7\x04\x7c\
+\x5f\x13\x01\x05\x40\x4d\xd1\x0a\x66\x2b\x83\xa2\x42\x20\x46\x50\
+\x48\xfe\xc4\x23\x86\x35\x69\xad\x60\xd6\xcf\x57\xfb\xc6\x61\x98\
+\xf5\x13\xc4\x43\xe2\x3f\xaf\x87\xc3\x3f\x89\xab\xb4\x3a\x09\x84\
+\x20\xa0\x00\x08\x11\x86\xba\x8d\x20\xf1\x90\x80\xd8\xea\xf6\xa4\
+\x4e\xeb\xe1\x4e\x0c\xea\xb4\xfe\xba\xd5\x24\xfe\x69\xd6\x7f\xbd\
+\x54\xde\x23\xad\xb2\xcd\x45\xcd\x7a\xeb\x22\xa0\x00\xa8\x2b\x5e\
+\x61\xad\x25\x01\xb1\x31\x60\x86\x35\xb2\x41\xc3\xe0\x0d\xf7\xd6\
+\x5c\xdb\xe3\x21\xbf\x4b\x0c\x5b\x64\x7b\xc9\x4f\xf7\xf5\x49\x40\
+\x01\xd0\x67\xdc\xb3\x79\xcd\x80\xe9\x6d\x81\x6c\x78\x3f\x55\x0c\
+\xef\x4f\x3b\x2b\xde\x31\xcd\xfa\x0f\x19\x7f\xc9\x6f\x2e\x1e\xc4\
+\xd5\xdc\xb2\x96\x83\x80\x5b\x6d\x04\x14\x00\xb5\x45\xac\x12\x7b\
+\x49\x4c\x0a\x81\xbc\xc1\xe2\xab\x7e\x79\x5b\x28\x5b\x7b\x94\x59\
+\xff\xe4\x35\x7d\x78\x7a\xef\xab\x04\x5a\x24\xa0\x00\x68\x31\xaa\
+\x81\x7c\x62\x10\x65\x26\xc5\x93\xd4\x81\xcc\xaa\xde\x14\x98\xb6\
+\xf2\x55\xbf\x48\xb3\xfe\xa9\x63\xc0\x77\x7a\xef\xeb\x3c\x02\x96\
+\xaa\x8f\x80\x02\xa0\xbe\x98\x55\x67\x31\x22\x80\xaf\xa7\x39\xa8\
+\xa6\x0b\x1d\x4c\xd3\xd5\xb6\x5f\x4d\xd3\x43\x7e\x7b\x3d\xe1\x7f\
+\xc9\x73\xfa\x69\x2b\x7c\x2f\xf9\xe7\x3e\x09\x4c\x04\x14\x00\x13\
+\x09\x5f\xb3\x13\x60\x50\xf5\xb6\xc0\x76\xcc\x24\xa8\xed\xb5\xec\
+\x5b\x03\xcb\xfd\x7b\x7e\xb5\xef\x96\xf7\x0f\xc3\xeb\xcb\xad\xe3\
+\x1e\xbb\x44\xc0\x7d\x35\x12\x50\x00\xd4\x18\xb5\xca\x6d\x56\x08\
+\x54\x1e\xc0\x0d\xe6\x47\x5c\xee\x3f\x75\x07\x71\xd5\xca\xad\x95\
+\x53\xbf\x7c\x2f\x81\x4b\x04\x14\x00\x97\xa8\xb8\xaf\x08\x01\x84\
+\x00\x03\x6e\x91\xc6\x1a\x69\x84\x67\x29\xe0\x56\xa3\x3b\xcc\xfa\
+\xc7\x1d\x7e\xc9\x6f\x09\xab\x5a\xd9\x2e\xf1\x31\x47\x59\xeb\xac\
+\x93\x80\x02\xa0\xce\xb8\x35\x63\x35\x03\xae\xb7\x05\xe6\x87\xb3\
+\xc6\x5f\xa5\x8b\x3e\xeb\x9f\xe8\x2b\x46\x27\x12\xbe\xf6\x42\x40\
+\x01\xd0\x4b\xa4\x83\xfb\xa9\x10\x08\x1e\xa0\x95\xe6\xd5\x30\xeb\
+\x9f\x5c\xa3\x0f\x4e\xef\x7d\x5d\x42\xc0\xb2\xb5\x12\x50\x00\xd4\
+\x1a\xb9\x46\xed\x66\x10\xe6\xfb\xed\xce\xc6\x2e\x07\xb8\xa6\x07\
+\xd4\x98\xf9\x47\xf8\x41\x9f\xcb\x24\x3f\xee\xb5\xbf\x7d\xe4\xe1\
+\xa7\x3e\x08\x28\x00\xfa\x88\x73\x55\x5e\xf2\x10\x16\x42\xc0\x41\
+\xf9\x73\xd8\x60\xf3\x79\xaf\x7b\xb6\x10\xa0\x9f\xd1\xdf\xb6\xd4\
+\xd1\xf3\xb9\xfa\x5e\x2f\x01\x05\x40\xbd\xb1\x6b\xde\x72\x06\x65\
+\x9f\x0f\xa8\x37\xcc\xb5\x88\x15\xfa\x59\xbd\x94\xb5\x5c\x02\xeb\
+\x09\x28\x00\xd6\xb3\xf3\xcc\x42\x04\x18\xa0\x15\x02\x85\x60\x77\
+\xd6\x0c\xb3\xff\xce\x5c\x4e\xec\xae\xd5\xd5\x4c\x40\x01\x50\x73\
+\xf4\x3a\xb3\x1d\x21\xc0\x80\xcd\xd6\x99\xeb\x47\x77\xf9\x0a\xe0\
+\xf1\x8d\xff\x24\x23\x40\x9f\x4a\x56\x99\x15\x49\xa0\x32\x02\x0a\
+\x80\xca\x02\xd6\xbb\xb9\x0c\xd8\x6c\xbd\x8a\x80\xde\xe3\x9f\xd2\
+\x7f\xfb\xd0\x76\x9a\xd6\x50\x37\x01\x05\x40\xdd\xf1\xeb\xd6\x7a\
+\x44\x40\x6f\xb7\x05\x22\xfd\x5e\x7e\xed\x1d\x8f\xd5\x14\xfa\x50\
+\xed\x7e\x68\xbf\x04\xb6\x10\x50\x00\x6c\xa1\xe7\xb9\xbb\x13\x60\
+\x10\xef\x49\x08\xf0\xd5\xba\xdd\xa1\xcf\x34\x20\xb2\xad\x35\xfe\
+\xa0\xd2\x4c\xec\x05\x8b\xd9\x54\xed\x04\x14\x00\xb5\x47\x50\xfb\
+\x8f\x04\x10\x02\x2c\xe9\x32\xb3\x3b\xee\xf0\x9f\xdd\x09\xbc\x0e\
+\x0f\x8f\xbb\x1b\x71\xc1\x00\xfa\x09\xfd\xe5\xc2\x21\x77\x49\xa0\
+\x2b\x02\x0f\x5d\x79\xab\xb3\x4d\x13\x60\x50\x6f\xfd\xbf\x1d\x8e\
+\x9a\x54\x6b\xea\x58\xf4\x93\x9a\xec\x8d\x6a\xab\x76\xd5\x4f\x40\
+\x01\x50\x7f\x0c\xf5\xe0\x8c\x00\x03\x7c\xab\xb7\x05\x1e\xc6\xf1\
+\xcf\x33\x77\xc3\x7e\x8c\xf8\x2b\x80\xcc\xfe\xc3\x02\xd3\x30\x09\
+\x14\x26\xa0\x00\x28\x0c\xdc\xe6\xca\x11\x68\x51\x08\x8c\xc3\xf0\
+\x18\xf9\xde\x7a\xb9\xe8\xae\x6b\x89\x3e\xb1\xee\x4c\xcf\xfa\x48\
+\xc0\x4f\x2d\x10\x50\x00\xb4\x10\x45\x7d\xb8\x49\x80\x41\xbf\xa5\
+\x99\xdf\x6b\xd0\x7b\xeb\xa7\x41\xe0\x3f\x01\x3a\xfd\x1c\xe1\x7d\
+\x4b\x7d\x20\x02\x4f\x6d\xa8\x9f\x80\x02\xa0\xfe\x18\xea\xc1\x0c\
+\x02\x88\x80\x56\x6e\x0b\xd4\x70\x1b\x20\xda\xf2\x3f\xc9\x9f\x3e\
+\x30\xa3\xab\x58\x64\x06\x01\x8b\xb4\x41\x40\x01\xd0\x46\x1c\xf5\
+\x62\x26\x01\x92\x40\xed\x42\x60\x0c\x7e\x1b\x20\xe2\xec\x7f\x66\
+\xf7\xb0\x98\x04\xba\x22\xa0\x00\xe8\x2a\xdc\x3a\x3b\x11\x40\x08\
+\xd4\xfc\xdf\x0e\x8f\xe3\xe1\x79\xf2\x25\xda\xab\xb3\xff\x68\x11\
+\x49\x6d\x8f\xf5\xb5\x42\x40\x01\xd0\x4a\x24\xf5\x63\x31\x01\xfe\
+\xb7\x3a\x84\x00\xcb\xc3\x8b\x4f\x0e\x70\x42\xc4\x99\x76\x44\x9b\
+\x88\x71\x80\x70\x69\x82\x04\xc2\x11\x50\x00\x84\x0b\x89\x06\x95\
+\x26\x40\x82\xa8\xf1\xb6\x00\x33\xed\x48\xdf\x08\x20\xf9\x63\x53\
+\xe9\xf8\xdd\x6a\xaf\x56\x71\x77\xcb\xa7\xbd\x8f\xd9\x7e\x3b\x04\
+\x14\x00\xed\xc4\x52\x4f\x36\x12\xa8\x51\x08\x70\x2b\x20\x82\x08\
+\xc0\x86\x68\xc9\x9f\xee\x40\x4c\x79\x75\x93\x80\x04\x3e\x13\x50\
+\x00\x7c\x66\xe2\x9e\xce\x09\x90\x34\x98\x39\xb2\xd5\x80\x62\x6f\
+\x11\x40\xf2\xc7\x86\x68\xac\x6a\x89\x5f\x34\x6e\xb7\xed\xf1\x68\
+\x4b\x04\x14\x00\x2d\x45\x53\x5f\x92\x11\x40\x04\xb0\x55\x93\x44\
+\xc6\xc3\xd7\x64\xce\x2f\xa8\x28\x72\xf2\x27\x7e\x0b\x5c\xb1\xa8\
+\x04\xba\x23\xa0\x00\xe8\x2e\xe4\x3a\xbc\x84\x00\x49\xa4\x86\xe7\
+\x03\xf8\x6a\xe0\xbf\x5f\x9e\x46\xee\xc3\x2f\xf1\x6f\x4b\x59\xda\
+\x8a\x38\xf3\xc7\xa7\x87\xe1\xf5\x85\x57\xb7\xb4\x04\xac\xad\x2d\
+\x02\x0a\x80\xb6\xe2\xa9\x37\x99\x08\xd4\x22\x04\xb8\x0f\x4f\x62\
+\xce\x84\xe1\xbd\xda\x1f\x5f\x9e\x9e\x69\xeb\x7d\x47\xa0\x37\xac\
+\xda\xf0\x0d\x8f\x40\x26\x69\x8a\x04\x42\x12\x50\x00\x84\x0c\x8b\
+\x46\x45\x25\x80\x10\x20\xc1\x44\xb5\x0f\xbb\x48\xcc\x24\xe8\x1c\
+\x42\x80\x3a\x59\x69\x60\xc5\x81\xb6\x22\x6e\xc4\x28\xa2\x5d\xf5\
+\xdb\xa4\x07\xad\x11\x50\x00\xb4\x16\x51\xfd\xc9\x4e\x80\x04\x13\
+\xfd\xb6\x00\x09\x1a\x21\x40\xb2\x26\x69\x6f\x81\xc2\x7d\xfe\xe3\
+\x16\x78\xd6\x3f\xf9\x17\x5d\x9c\x4d\x76\xfa\x2a\x81\x08\x04\x14\
+\x00\x11\xa2\xa0\x0d\x55\x12\xa8\x41\x08\x00\xf6\x54\x08\x20\x06\
+\x48\xe6\xec\xbf\xb5\x51\xe6\xb8\xbd\x25\x7d\xee\xf3\x1f\xb7\x61\
+\x78\x1c\x82\xff\x21\x26\xc1\x4d\xac\xd6\x3c\x0d\x6f\x8f\x80\x02\
+\xa0\xbd\x98\xea\x51\x61\x02\x24\x9d\xe8\x2b\x02\x20\x41\x08\xb0\
+\x91\xcc\x59\x19\xe0\x36\xc1\xa5\x8d\x63\x94\x39\x6e\x15\x24\x7d\
+\x7c\x63\x73\xf6\x0f\x05\x37\x09\xcc\x27\xa0\x00\x98\xcf\xca\x92\
+\x12\xb8\x49\x00\x21\x50\x53\x12\xe2\x36\xc1\xa5\xed\xa6\x93\x41\
+\x0f\xc2\x1d\xfe\x41\xcd\x6b\xc0\x2c\x5d\x68\x91\x80\x02\xa0\xc5\
+\xa8\xea\xd3\x6e\x04\x48\x42\x35\xac\x06\xec\x06\x28\x53\xc3\x70\
+\xcf\x54\xb5\xd5\x4a\xa0\x59\x02\x0a\x80\x66\x43\xab\x63\x7b\x12\
+\x20\x21\x29\x04\xca\x44\x80\xd9\x7f\x99\x96\xfa\x6d\x45\xcf\xdb\
+\x24\xa0\x00\x68\x33\xae\x7a\x15\x84\x00\x42\xe0\x70\x18\x9f\x4c\
+\x52\xf9\x02\x02\xe3\x7c\xb5\x5b\xb3\x04\xda\x25\xa0\x00\x68\x37\
+\xb6\x7a\x16\x84\x00\x3f\x4a\x43\x92\x52\x04\xa4\x0f\x88\x4c\xd3\
+\x33\xfd\x5c\xa3\x7b\x5a\x25\xa0\x00\x68\x35\xb2\xfa\x15\x8e\x00\
+\x22\xc0\xdb\x02\xe9\xc2\x72\x18\x86\x17\x98\xa6\xab\xd1\x9a\x24\
+\xd0\x17\x01\x05\x40\x5f\xf1\xd6\xdb\x00\x04\x48\x5a\x0a\x81\xed\
+\x81\xf8\xe3\xfb\xf3\xd3\xf6\x5a\xac\xe1\x1e\x01\x8f\xb7\x4b\x40\
+\x01\xd0\x6e\x6c\xf5\x2c\x38\x01\x84\x00\x4b\xd8\xcc\x64\x83\x9b\
+\x1a\xce\x3c\xb8\x85\x33\x4a\x83\x24\x50\x19\x01\x05\x40\x65\x01\
+\xd3\xdc\xb6\x08\x20\x02\x98\xc9\x9a\xd0\xe6\xc7\x15\x56\x70\x9b\
+\x7f\x86\x25\xd7\x13\xf0\xcc\x96\x09\x28\x00\x5a\x8e\xae\xbe\x55\
+\x43\x80\x84\xe6\x6d\x81\x79\xe1\x82\xd5\xbc\x92\x96\x92\x80\x04\
+\x6e\x11\x50\x00\xdc\xa2\xe3\x31\x09\x14\x26\x40\x72\x53\x08\x5c\
+\x87\xce\x57\x2a\xaf\x1f\xf5\x48\x6a\x02\xd6\xd7\x36\x01\x05\x40\
+\xdb\xf1\xd5\xbb\x4a\x09\x20\x04\x58\xea\xae\xd4\xfc\x2c\x66\xc3\
+\x83\xaf\x54\x66\xa9\xdc\x4a\x25\xd0\x21\x01\x05\x40\x87\x41\xd7\
+\xe5\x3a\x08\x20\x02\x5c\x0d\xf8\x19\x2b\x92\x3f\x3c\x7e\x7e\xf2\
+\xdf\x32\x04\x6c\xa5\x75\x02\x0a\x80\xd6\x23\xac\x7f\xd5\x13\x20\
+\xf1\xf5\x2c\x04\x4c\xfe\xd5\x77\x61\x1d\x08\x4a\x40\x01\x10\x34\
+\x30\x9a\x25\x81\x73\x02\x08\x01\xee\x81\x93\x10\xcf\x8f\xb5\xfa\
+\x19\x5f\xf1\xbb\x55\xff\x22\xfb\xa5\x6d\xed\x13\x50\x00\xb4\x1f\
+\x63\x3d\x6c\x88\x00\xf7\xc0\x49\x88\x24\xc6\x86\xdc\xba\xe8\x0a\
+\x3e\xe2\xeb\xc5\x83\xee\x94\x80\x04\x36\x13\x50\x00\x6c\x46\x68\
+\x05\x12\x28\x4f\x80\xc4\xd8\xf2\x6d\x01\x93\x7f\xf9\x3e\xf5\xb1\
+\x45\x3f\xf5\x40\x40\x01\xd0\x43\x94\xf5\xb1\x59\x02\xad\x09\x01\
+\x7e\x15\x91\xdb\x1c\xf8\xd5\x6c\xd0\x74\x4c\x02\x41\x08\x28\x00\
+\x82\x04\x42\x33\x24\xb0\x85\x00\x09\x93\x59\x33\xdb\x96\x7a\xf6\
+\x3c\x17\xdb\xf9\x55\x44\x6e\x73\xec\x69\x87\x6d\x0f\x83\x0c\xfa\
+\x20\xa0\x00\xe8\x23\xce\x7a\xd9\x01\x01\x44\x00\x1b\x89\xb4\x26\
+\x77\x9d\xf5\xd7\x14\x2d\x6d\x6d\x89\x80\x02\xa0\xa5\x68\xea\x8b\
+\x04\xde\x08\x20\x02\x6a\x79\x3e\x00\xb1\xe2\xac\xff\x2d\x68\xa1\
+\xfe\x6a\x4c\x2f\x04\x14\x00\xbd\x44\x5a\x3f\xbb\x23\x10\x59\x08\
+\x38\xeb\xef\xae\x3b\xea\x70\x40\x02\x0a\x80\x80\x41\xd1\x24\x09\
+\xa4\x24\x70\x2a\x04\x98\x71\xa7\xac\x7b\x49\x5d\x24\x7d\xda\xe7\
+\x21\x3f\x67\xfd\x4b\xc8\x95\x2d\x6b\x6b\xfd\x10\x50\x00\xf4\x13\
+\x6b\x3d\xed\x9c\x00\x42\x80\x8d\x04\x4c\x22\x2e\x85\x83\xc4\x4f\
+\x9b\x24\x7d\xda\xf7\x21\xbf\x52\xe4\x6d\x47\x02\xb7\x09\x28\x00\
+\x6e\xf3\xf1\xa8\x04\x9a\x23\x40\x02\x26\x11\xf3\x9c\x00\x89\x19\
+\x31\xc0\x96\xca\xd1\x63\xc2\x1f\x86\x17\xea\xa6\x0d\x12\x3f\x6d\
+\x0e\xfe\xa9\x80\x80\x26\xf6\x44\x40\x01\xd0\x53\xb4\xf5\x55\x02\
+\x67\x04\x48\xcc\x88\x01\x36\x92\x35\x1b\x62\x80\xed\x3d\x91\x93\
+\xcc\x4f\xb6\xa9\x8a\xe9\xf8\xb1\xec\x61\x7c\xfa\x90\xf0\xbf\x3f\
+\x3f\x51\xf7\x54\xd6\x57\x09\x48\x20\x1e\x01\x05\x40\xbc\x98\x68\
+\x91\x04\x76\x25\x80\x18\x60\x3b\xce\xdc\x49\xe4\x67\x1b\x22\x81\
+\x6d\x3a\x7e\x2c\xfb\xf7\xcb\x8b\x09\x7f\xd7\xb0\x25\x69\xdc\x4a\
+\xfa\x22\xa0\x00\xe8\x2b\xde\x7a\x2b\x01\x09\x48\x40\x02\x12\x38\
+\x12\x50\x00\x1c\x31\xf8\x8f\x04\x24\x20\x81\xde\x09\xe8\x7f\x6f\
+\x04\x14\x00\xbd\x45\x5c\x7f\x25\x20\x01\x09\x48\x40\x02\x6f\x04\
+\x14\x00\x6f\x10\xfc\x2b\x01\x09\x48\xa0\x77\x02\xfa\xdf\x1f\x01\
+\x05\x40\x7f\x31\xd7\x63\x09\x48\x40\x02\x12\x90\xc0\xa0\x00\xb0\
+\x13\x48\x40\x02\x12\xe8\x9e\x80\x00\x7a\x24\xa0\x00\xe8\x31\xea\
+\xfa\x2c\x01\x09\x48\x40\x02\xdd\x13\x50\x00\x74\xdf\x05\x04\x20\
+\x01\x09\xf4\x4e\x40\xff\xfb\x24\xa0\x00\xe8\x33\xee\x7a\x2d\x01\
+\x09\x48\x40\x02\x9d\x13\x50\x00\x74\xde\x01\x74\x5f\x02\x12\xe8\
+\x9d\x80\xfe\xf7\x4a\x40\x01\xd0\x6b\xe4\xf5\x5b\x02\x12\x90\x80\
+\x04\xba\x26\xa0\x00\xe8\x3a\xfc\x3a\x2f\x01\x09\xf4\x4e\x40\xff\
+\xfb\x25\xa0\x00\xe8\x37\xf6\x7a\x2e\x01\x09\x48\x40\x02\x1d\x13\
+\x50\x00\x74\x1c\x7c\x5d\x97\x80\x04\x7a\x27\xa0\xff\x3d\x13\x50\
+\x00\xf4\x1c\x7d\x7d\x97\x80\x04\x24\x20\x81\x6e\x09\x28\x00\xba\
+\x0d\xbd\x8e\x4b\x40\x02\xbd\x13\xd0\xff\xbe\x09\xfc\x7f\x00\x00\
+\x00\xff\xff\xc6\x13\xef\x90\x00\x00\x00\x06\x49\x44\x41\x54\x03\
+\x00\x8f\x9a\xdc\xb4\x12\x5d\x0d\xa3\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\xcd\x73\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x04\x00\x00\x00\x04\x00\x08\x06\x00\x00\x00\x7f\x1d\x2b\x83\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\xdd\x4b\x7a\xe3\xc6\
+\xb5\x00\x60\x52\x6b\x88\xb3\x94\x24\x33\xb7\xf7\x14\x67\xda\xee\
+\x69\x7c\xf7\xe4\xf6\x2c\xc9\x52\xe2\xac\x41\xbc\x75\x20\x41\xe2\
+\x9b\x00\x88\x47\x3d\xfe\xfe\x1a\x12\x09\x02\xf5\xf8\x0b\x28\x14\
+\x0e\x00\xea\x65\xe7\x1f\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x50\xbb\xc0\x4e\x00\xa0\xfa\x26\x56\x41\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\xb0\x13\x00\
+\xb0\x11\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x81\xea\x05\x52\x05\xdd\x01\x90\x10\xfc\x27\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x35\x0b\x44\xdd\x04\x00\x42\
+\xc1\x44\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\xea\x15\xe8\x6a\x26\x00\xd0\x31\xf8\x41\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x6a\x15\x78\xab\x97\x00\xc0\x9b\
+\x83\x9f\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\xa0\x4e\x81\xf7\x5a\x09\x00\xbc\x43\xf8\x45\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x6a\x14\xe8\xeb\x24\x00\xd0\
+\x4b\xf8\x4d\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\xea\x13\xf8\xa8\x91\x00\xc0\x07\x85\x17\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x36\x81\xcf\xfa\x08\x00\
+\x7c\x5a\x78\x45\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\xea\x12\x38\xaa\x8d\x00\xc0\x11\x86\x97\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x26\x81\xe3\xba\x08\
+\x00\x1c\x6b\x78\x4d\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\xea\x11\x38\xa9\x89\x00\xc0\x09\x87\x37\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x16\x81\xd3\x7a\
+\x08\x00\x9c\x7a\x78\x47\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\xea\x10\x38\xab\x85\x00\xc0\x19\x88\xb7\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x06\x81\xf3\
+\x3a\x08\x00\x9c\x8b\x78\x4f\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\xca\x17\xb8\xa8\x81\x00\xc0\x05\x89\x19\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x74\x81\
+\xcb\xf2\x0b\x00\x5c\x9a\x98\x43\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\xca\x16\xb8\x52\x7a\x01\x80\x2b\x28\x66\
+\x11\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x92\
+\x05\xae\x95\x5d\x00\xe0\x9a\x8a\x79\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\xa0\x5c\x81\xab\x25\x17\x00\xb8\xca\
+\x62\x26\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x28\x55\xe0\x7a\xb9\x05\x00\xae\xbb\x98\x4b\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\xca\x14\xb8\x51\x6a\x01\x80\
+\x1b\x30\x66\x13\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x81\x12\x05\x6e\x95\x59\x00\xe0\x96\x8c\xf9\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x3c\x81\x9b\x25\x16\
+\x00\xb8\x49\xe3\x03\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x50\x9a\xc0\xed\xf2\x0a\x00\xdc\xb6\xf1\x09\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x28\x4b\xe0\x4e\
+\x69\x05\x00\xee\xe0\xf8\x88\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x94\x24\x70\xaf\xac\x02\x00\xf7\x74\x7c\x46\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\xca\x11\
+\xb8\x5b\x52\x01\x80\xbb\x3c\x3e\x24\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\xa5\x08\xdc\x2f\xa7\x00\xc0\x7d\x1f\
+\x9f\x12\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\
+\x32\x04\x1e\x94\x52\x00\xe0\x01\x90\x8f\x09\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x40\x09\x02\x8f\xca\x28\x00\xf0\
+\x48\xc8\xe7\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x20\x7f\x81\x87\x25\x14\x00\x78\x48\x64\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x90\xbb\xc0\xe3\xf2\x09\
+\x00\x3c\x36\xb2\x04\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\xc8\x5b\x60\x40\xe9\x04\x00\x06\x20\x59\x84\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xe4\x2c\x30\xa4\
+\x6c\x02\x00\x43\x94\x2c\x43\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\xf2\x15\x18\x54\x32\x01\x80\x41\x4c\x16\x22\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xb9\x0a\
+\x0c\x2b\x97\x00\xc0\x30\x27\x4b\x11\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x81\x3c\x05\x06\x96\x4a\x00\x60\x20\x94\
+\xc5\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x40\
+\x8e\x02\x43\xcb\x24\x00\x30\x54\xca\x72\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\x20\x3f\x81\xc1\x25\x12\x00\x18\
+\x4c\x65\x41\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x90\x9b\xc0\xf0\xf2\x08\x00\x0c\xb7\xb2\x24\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\xc8\x4b\x60\x44\x69\x04\
+\x00\x46\x60\x59\x94\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\xe4\x24\x30\xa6\x2c\x02\x00\x63\xb4\x2c\x4b\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\xf2\x11\x18\x55\
+\x12\x01\x80\x51\x5c\x16\x26\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\xb9\x08\x8c\x2b\x87\x00\xc0\x38\x2f\x4b\x13\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x3c\x04\
+\x46\x96\x42\x00\x60\x24\x98\xc5\x09\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x40\x0e\x02\x63\xcb\x20\x00\x30\x56\xcc\
+\xf2\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x60\
+\x7b\x81\xd1\x25\x10\x00\x18\x4d\x66\x05\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\xb0\xb5\xc0\xf8\xfc\x05\x00\xc6\
+\x9b\x59\x83\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x6c\x2b\x30\x21\x77\x01\x80\x09\x68\x56\x21\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x5b\x0a\x4c\xc9\x5b\x00\
+\x60\x8a\x9a\x75\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\xc0\x76\x02\x93\x72\x16\x00\x98\xc4\x66\x25\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\xb0\x95\xc0\xb4\x7c\
+\x05\x00\xa6\xb9\x59\x8b\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x6c\x23\x30\x31\x57\x01\x80\x89\x70\x56\x23\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x5b\x08\x4c\
+\xcd\x53\x00\x60\xaa\x9c\xf5\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\xc0\xfa\x02\x93\x73\x14\x00\x98\x4c\x67\x45\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\xb0\xb6\
+\xc0\xf4\xfc\x04\x00\xa6\xdb\x59\x93\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\xac\x2b\xf0\x44\x6e\x02\x00\x4f\xe0\
+\x59\x95\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\xac\x29\xf0\x4c\x5e\x02\x00\xcf\xe8\x59\x97\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\xac\x27\xf0\x54\x4e\x02\x00\
+\x4f\xf1\x59\x99\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\xac\x25\xf0\x5c\x3e\x02\x00\xcf\xf9\x59\x9b\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xac\x23\xf0\x64\x2e\
+\x02\x00\x4f\x02\x5a\x9d\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\xac\x21\xf0\x6c\x1e\x02\x00\xcf\x0a\x5a\x9f\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\x2f\xf0\
+\x74\x0e\x02\x00\x4f\x13\x4a\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x2c\x2d\xf0\x7c\xfa\x02\x00\xcf\x1b\x4a\
+\x81\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\
+\x2b\x30\x43\xea\x02\x00\x33\x20\x4a\x82\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x2c\x29\x30\x47\xda\x02\x00\x73\
+\x28\x4a\x83\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x2c\x27\x30\x4b\xca\x02\x00\xb3\x30\x4a\x84\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\x25\x30\x4f\xba\x02\
+\x00\xf3\x38\x4a\x85\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x08\x2c\x23\x30\x53\xaa\x02\x00\x33\x41\x4a\x86\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\x21\x30\x57\
+\x9a\x02\x00\x73\x49\x4a\x87\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\xcc\x2f\x30\x5b\x8a\x02\x00\xb3\x51\x4a\x88\
+\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xcc\x2d\
+\x30\x5f\x7a\x02\x00\xf3\x59\x4a\x89\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\xcc\x2b\x30\x63\x6a\x02\x00\x33\x62\
+\x4a\x8a\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\xcc\x29\x30\x67\x5a\x02\x00\x73\x6a\x4a\x8b\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\xcc\x27\x30\x6b\x4a\x02\x00\
+\xb3\x72\x4a\x8c\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\xcc\x25\x30\x6f\x3a\x02\x00\xf3\x7a\x4a\x8d\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xcc\x23\x30\x73\x2a\
+\x02\x00\x33\x83\x4a\x8e\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\xcc\x21\x30\x77\x1a\x02\x00\x73\x8b\x4a\x8f\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x3c\x2f\x30\
+\x7b\x0a\x02\x00\xb3\x93\x4a\x90\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x3c\x2b\x30\xff\xfa\x02\x00\xf3\x9b\x4a\
+\x91\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x3c\
+\x27\xb0\xc0\xda\x02\x00\x0b\xa0\x4a\x92\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x3c\x23\xb0\xc4\xba\x02\x00\x4b\
+\xa8\x4a\x93\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x4c\x17\x58\x64\x4d\x01\x80\x45\x58\x25\x4a\x80\x00\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\xa6\x0a\x2c\xb3\x9e\x00\
+\xc0\x32\xae\x52\x25\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\xd3\x04\x16\x5a\x4b\x00\x60\x21\x58\xc9\x12\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x29\x02\x4b\xad\
+\x23\x00\xb0\x94\xac\x74\x09\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\xc0\x78\x81\xc5\xd6\x10\x00\x58\x8c\x56\xc2\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x60\xac\xc0\
+\x72\xcb\x0b\x00\x2c\x67\x2b\x65\x02\x04\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x30\x4e\x60\xc1\xa5\x05\x00\x16\xc4\x95\
+\x34\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x18\
+\x23\xb0\xe4\xb2\x02\x00\x4b\xea\x4a\x9b\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x08\x0c\x17\x58\x74\x49\x01\x80\x45\
+\x79\x25\x4e\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x86\x0a\x2c\xbb\x9c\x00\xc0\xb2\xbe\x52\x27\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xc3\x04\x16\x5e\x4a\x00\
+\x60\x61\x60\xc9\x13\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x81\x21\x02\x4b\x2f\x23\x00\xb0\xb4\xb0\xf4\x09\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\xc0\x63\x81\xc5\x97\
+\x10\x00\x58\x9c\x58\x06\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\xe0\x91\xc0\xf2\x9f\x0b\x00\x2c\x6f\x2c\x07\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x70\x5f\x60\
+\x85\x4f\x05\x00\x56\x40\x96\x05\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\xb8\x27\xb0\xc6\x67\x02\x00\x6b\x28\xcb\
+\x83\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xdc\
+\x16\x58\xe5\x13\x01\x80\x55\x98\x65\x42\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x6e\x09\xac\x33\x5f\x00\x60\x1d\
+\x67\xb9\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\
+\x81\xeb\x02\x2b\xcd\x15\x00\x58\x09\x5a\x36\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\xe0\x9a\xc0\x5a\xf3\x04\x00\
+\xd6\x92\x96\x0f\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\xb8\x14\x58\x6d\x8e\x00\xc0\x6a\xd4\x32\x22\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xe7\x02\xeb\xbd\x17\
+\x00\x58\xcf\x5a\x4e\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\xe0\x54\x60\xc5\x77\x02\x00\x2b\x62\xcb\x8a\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x1c\x0b\xac\xf9\
+\x5a\x00\x60\x4d\x6d\x79\x11\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x81\x4f\x81\x55\x5f\x09\x00\xac\xca\x2d\x33\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\xd0\x0b\xac\
+\xfb\x5b\x00\x60\x5d\x6f\xb9\x11\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\x80\x00\x81\x37\x81\x95\x7f\x0a\x00\xac\x0c\x2e\x3b\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x10\x02\
+\x6b\x4f\x02\x00\x6b\x8b\xcb\x8f\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\xec\x76\xab\x1b\x08\x00\xac\x4e\x2e\x43\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\xb0\xbe\
+\x80\x00\xc0\xfa\xe6\x72\x24\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\xd6\x05\x36\xa8\xbf\x00\xc0\x06\xe8\xb2\x24\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\xb6\x05\xb6\xa8\
+\xbd\x00\xc0\x16\xea\xf2\x24\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x96\x05\x36\xa9\xbb\x00\xc0\x26\xec\x32\x25\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x76\x05\xb6\xa9\
+\xb9\x00\xc0\x36\xee\x72\x25\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x56\x05\x36\xaa\xb7\x00\xc0\x46\xf0\xb2\x25\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x36\x05\xb6\xaa\
+\xb5\x00\xc0\x56\xf2\xf2\x25\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x16\x05\x36\xab\xb3\x00\xc0\x66\xf4\x32\x26\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\xf6\x04\xb6\xab\
+\xb1\x00\xc0\x76\xf6\x72\x26\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\xd6\x04\x36\xac\xaf\x00\xc0\x86\xf8\xb2\x26\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\xb6\x04\xb6\xac\
+\xad\x00\xc0\x96\xfa\xf2\x26\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x96\x04\x36\xad\xab\x00\xc0\xa6\xfc\x32\x27\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x76\x04\xb6\xad\
+\xa9\x00\xc0\xb6\xfe\x72\x27\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x56\x04\x36\xae\xa7\x00\xc0\xc6\x0d\x20\x7b\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x68\x43\x60\xeb\
+\x5a\x0a\x00\x6c\xdd\x02\xf2\x27\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x81\x16\x04\x36\xaf\xa3\x00\xc0\xe6\x4d\xa0\x00\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x50\xbf\xc0\
+\xf6\x35\x14\x00\xd8\xbe\x0d\x94\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x6a\x17\xc8\xa0\x7e\x02\x00\x19\x34\x82\
+\x22\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x40\xdd\
+\x02\x39\xd4\x4e\x00\x20\x87\x56\x50\x06\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\x10\xa8\x59\x20\x8b\xba\x09\x00\x64\xd1\
+\x0c\x0a\x41\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\xf5\x0a\xe4\x51\x33\x01\x80\x3c\xda\x41\x29\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x56\x81\x4c\xea\x25\x00\x90\
+\x49\x43\x28\x06\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\xd4\x29\x90\x4b\xad\x04\x00\x72\x69\x09\xe5\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x1a\x05\xb2\xa9\x93\x00\
+\x40\x36\x4d\xa1\x20\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\x50\x9f\x40\x3e\x35\x12\x00\xc8\xa7\x2d\x94\x84\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x6a\x13\xc8\xa8\x3e\
+\x02\x00\x19\x35\x86\xa2\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x40\x5d\x02\x39\xd5\x46\x00\x20\xa7\xd6\x50\x16\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\xa8\x49\x20\xab\
+\xba\x08\x00\x64\xd5\x1c\x0a\x43\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\xf5\x08\xe4\x55\x13\x01\x80\xbc\xda\x43\x69\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x16\x81\
+\xcc\xea\x21\x00\x90\x59\x83\x28\x0e\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\xd4\x21\x90\x5b\x2d\x04\x00\x72\x6b\x11\
+\xe5\x21\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x1a\
+\x04\xb2\xab\x83\x00\x40\x76\x4d\xa2\x40\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x20\x50\xbe\x40\x7e\x35\x10\x00\xc8\xaf\
+\x4d\x94\x88\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x4a\x17\xc8\xb0\xfc\x02\x00\x19\x36\x8a\x22\x11\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x80\x40\xd9\x02\x39\x96\x5e\x00\x20\
+\xc7\x56\x51\x26\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x28\x59\x20\xcb\xb2\x0b\x00\x64\xd9\x2c\x0a\x45\x80\x00\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xe5\x0a\xe4\x59\x72\x01\
+\x80\x3c\xdb\x45\xa9\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\xa0\x54\x81\x4c\xcb\x2d\x00\x90\x69\xc3\x28\x16\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x94\x29\x90\x6b\xa9\
+\x05\x00\x72\x6d\x19\xe5\x22\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x12\x05\xb2\x2d\xb3\x00\x40\xb6\x4d\xa3\x60\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x50\x9e\x40\xbe\
+\x25\x16\x00\xc8\xb7\x6d\x94\x8c\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x4a\x13\xc8\xb8\xbc\x02\x00\x19\x37\x8e\xa2\
+\x11\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x40\x59\x02\
+\x39\x97\x56\x00\x20\xe7\xd6\x51\x36\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x28\x49\x20\xeb\xb2\x0a\x00\x64\xdd\x3c\
+\x0a\x47\x80\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xe5\
+\x08\xe4\x5d\x52\x01\x80\xbc\xdb\x47\xe9\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\xa0\x14\x81\xcc\xcb\x29\x00\x90\x79\
+\x03\x29\x1e\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\x94\x21\x90\x7b\x29\x05\x00\x72\x6f\x21\xe5\x23\x40\x20\x7b\x81\
+\xbf\xfd\xfd\x4f\x5f\x62\xfa\xcb\x3f\xfe\xfc\x4b\x3f\xfd\xf5\xe7\
+\x1f\x7e\xbb\x36\xfd\xe5\xe7\x1f\x0e\xd7\xa6\xab\xcb\x1e\xa5\xd7\
+\xa7\x1b\xf9\x64\x0f\xa2\x80\x04\x08\x34\x23\x10\x7d\x52\x4c\x7d\
+\x1f\x15\xbf\xaf\xf5\x67\x31\xef\x5a\xdf\x17\xf3\xe2\xb3\xf3\x29\
+\xd2\x39\x9f\x22\x9f\x66\x60\x55\x94\x00\x81\x52\x05\xb2\x2f\xb7\
+\x00\x40\xf6\x4d\xa4\x80\x04\x08\xdb\xf9\x88\x56\x00\x00\x10\x00\
+\x49\x44\x41\x54\xe4\x20\x10\x03\xcf\x98\x62\x40\xda\x0f\x54\x63\
+\xe0\x1a\xd3\xeb\x7e\xff\x5b\x4c\xbb\xc3\xe1\x6b\x3f\x1d\x76\xbb\
+\x2f\xd7\xa6\xdd\x8d\x7f\x57\x97\x3d\x4a\xaf\x4f\x37\xf2\x89\x3c\
+\x63\x8a\x72\x44\x79\xfa\x29\xca\x17\xd3\x8d\x2c\xcc\x26\x40\x80\
+\xc0\x68\x81\xe8\x53\xfa\x29\xfa\x9a\xe8\x77\x62\x8a\x3e\x28\xa6\
+\xe8\x93\x62\xea\xfb\xa8\xf8\x7d\xad\x3f\x8b\x79\xb7\x32\x8f\xcf\
+\xce\xa7\x48\xe7\x7c\x8a\x7c\x22\xcf\x98\xba\x32\x1c\x05\x49\xa3\
+\x8c\xb7\xd2\x37\x9f\x00\x01\x02\xeb\x09\xe4\x9f\x93\x00\x40\xfe\
+\x6d\xa4\x84\x04\x08\xac\x2c\x10\x03\xc9\x18\x5c\xc6\x14\x03\xcd\
+\x98\x62\xe0\x19\x53\x0c\x48\xfb\x81\xea\xca\xc5\xba\xc8\x2e\xca\
+\x11\xe5\xe9\xa7\x28\x5f\x4c\x51\xde\xae\xec\x69\x70\x1c\x75\xb9\
+\x58\xd1\x0c\x02\x04\x08\xdc\x10\x88\x3e\xa3\x3f\xd1\x8f\xbe\x24\
+\xfa\x94\x7e\x8a\xbe\x26\xfa\x9d\x98\x6e\xac\xbe\xda\xec\xae\x0c\
+\x47\x41\xd2\x28\x63\x94\x37\xa6\xbe\xff\x8b\x7a\xac\x56\x20\x19\
+\x11\x20\x40\x20\x04\x0a\x98\x04\x00\x0a\x68\x24\x45\x24\x40\x60\
+\x39\x81\x18\xec\xc6\x14\x03\xc6\x98\x62\xf0\x18\x03\xc9\x18\x5c\
+\xc6\xb4\x5c\xce\xcb\xa6\xdc\x95\x3d\x0d\x8e\xa3\x2e\x51\xa7\x6e\
+\x4a\x01\x81\x18\x10\x47\x7d\x97\xcd\x5d\xea\x04\x08\x94\x20\x10\
+\x7d\x41\x4c\xd1\xf7\xc5\x14\xfd\x44\xf4\x19\xfd\x89\x7e\x09\x75\
+\xb8\x56\xc6\xbe\xff\x8b\x7a\x44\x9d\xba\xe9\xbd\xff\xbb\xb6\xbc\
+\x79\x04\x08\x10\x98\x4b\xa0\x84\x74\x04\x00\x4a\x68\x25\x65\x24\
+\x40\x60\x36\x81\x18\xec\xc6\x74\x3c\xd8\x8d\x01\x6f\x0c\x18\x63\
+\x9a\x2d\xa3\x1c\x13\x4a\x01\x81\x18\x10\x47\x7d\x0d\x88\x73\x6c\
+\x20\x65\x22\xb0\xbc\x40\xeb\xfd\x5f\xd7\xf7\xc5\x77\xb1\x08\x08\
+\x2c\xbf\xb1\xc9\x81\x40\x7b\x02\x45\xd4\x58\x00\xa0\x88\x66\x52\
+\x48\x02\x04\x9e\x11\x88\x01\x6f\x4c\x71\xd2\x1f\x27\xbf\x31\x55\
+\x7f\xb2\x3f\x04\xec\x3d\x20\x10\x03\xe2\xb0\x89\xbb\x03\x86\xac\
+\x66\x19\x02\x04\xca\x11\x88\xbe\x2f\xa6\x6e\x1f\x4f\x27\xbe\xfa\
+\xbf\xf7\xb6\xd3\xff\xbd\x43\xf8\x45\x80\xc0\x7c\x02\x65\xa4\x24\
+\x00\x50\x46\x3b\x29\x25\x01\x02\x23\x05\xfa\x01\x6f\x0c\x7a\x63\
+\xc0\x1b\x93\x93\xfe\xdb\x88\x9d\x4d\x1a\x10\x47\x30\xa0\x9b\xd2\
+\xd5\xb1\x30\xbc\xbd\x86\x4f\x08\x10\xc8\x55\x20\xf6\xdd\xe8\xfb\
+\x62\x8a\xbe\x2f\xa6\x6e\x1f\xcf\xb5\xc0\x1b\x97\xab\xb3\x79\xef\
+\xff\xc2\x2c\x82\xa1\x61\xb8\x71\xb1\x64\x4f\x80\x40\x69\x02\x85\
+\x94\x57\x00\xa0\x90\x86\x52\x4c\x02\x04\x1e\x0b\xc4\x80\x2d\x06\
+\x6f\x31\xf5\x03\xde\x6e\x60\xf7\x78\x55\x4b\x9c\x0b\xa4\xc1\x70\
+\x18\xf6\xc1\x80\xf3\x8f\xbd\x27\x40\x20\x2f\x01\xfd\xdf\x3c\xed\
+\xd1\x1d\x33\xce\xfa\xbf\xb0\x9d\x27\x75\xa9\x10\x20\x50\xb3\x40\
+\x29\x75\x13\x00\x28\xa5\xa5\x94\x93\x00\x81\x9b\x02\x31\x38\x73\
+\xd2\x7f\x93\xe7\xf9\x0f\xd2\x60\xb8\x0f\x04\xc4\x95\xb1\xe7\x13\
+\x94\x02\x01\x02\x73\x09\xe8\xff\xe6\x92\xbc\x91\x4e\xea\xff\x04\
+\x43\x6f\xd8\x98\x4d\x80\xc0\xb1\x40\x31\xaf\x05\x00\x8a\x69\x2a\
+\x05\x25\x40\xe0\x58\x20\x06\xbd\x71\x32\x1a\x27\xa6\x31\x38\xeb\
+\xae\xda\x1c\x2f\xe0\xf5\xfc\x02\x69\x20\x1c\x5f\x22\x18\xe6\x61\
+\x3f\x7f\x06\x52\x24\x40\x60\x88\x40\xdf\xff\x1d\x07\x3e\x87\xac\
+\x67\x99\x27\x05\x52\x1f\xa8\xff\x7b\xd2\xd0\xea\x04\xaa\x15\x28\
+\xa7\x62\x02\x00\xe5\xb4\x95\x92\x12\x20\x90\x04\x62\xe0\xdb\x0f\
+\x7a\xe3\x64\x34\xcd\xf2\x7f\x0b\x81\xa3\x81\xb0\x60\xc0\x16\x0d\
+\x20\xcf\x16\x05\xce\xfb\x3f\x81\xcf\x8d\xb6\x02\xfd\xdf\x46\xf0\
+\xb2\x25\x90\xb1\x40\x41\x45\x13\x00\x28\xa8\xb1\x14\x95\x40\xcb\
+\x02\xc7\x03\x5f\x83\xde\x8c\xb6\x84\x34\x10\x8e\x40\x8c\xab\x62\
+\x19\xb5\x89\xa2\x54\x27\xa0\xff\xcb\xb4\x49\xdf\xfb\xbf\x08\x4a\
+\x0b\x84\x66\xda\x46\x8a\x45\x60\x25\x81\x92\xb2\x11\x00\x28\xa9\
+\xb5\x94\x95\x40\x83\x02\x31\xa8\x8a\xc1\x95\xdb\xfc\x0b\x68\xfc\
+\x34\x18\x16\x08\x28\xa0\x9d\x14\xb1\x18\x01\x27\xfe\x65\x34\x55\
+\x17\x94\xd6\xff\x95\xd1\x58\x4a\x49\x60\x19\x81\xa2\x52\x15\x00\
+\x28\xaa\xb9\x14\x96\x40\x3b\x02\xfd\xc0\x37\xae\x2e\x77\x83\xab\
+\x76\xaa\x5e\x7e\x4d\x0d\x84\xcb\x6f\x43\x35\xd8\x54\xa0\xef\xff\
+\x04\x3e\x37\x6d\x86\x69\x99\xeb\xff\xa6\xb9\x59\x8b\x40\xd1\x02\
+\x65\x15\x5e\x00\xa0\xac\xf6\x52\x5a\x02\xd5\x0b\x18\xf8\x56\xd4\
+\xc4\x06\xc2\x15\x35\xa6\xaa\xac\x21\xa0\xff\x5b\x43\x79\xa5\x3c\
+\xf4\x7f\x2b\x41\xcb\x86\x40\x06\x02\x85\x15\x41\x00\xa0\xb0\x06\
+\x53\x5c\x02\xb5\x0a\x18\xf8\xd6\xda\xb2\xa9\x5e\x31\x10\xfe\xc7\
+\x9f\x7f\x89\xc7\x39\xd2\x3b\xff\x09\x10\x38\x13\xd0\xff\x9d\x81\
+\xd4\xf4\x56\xff\x57\x53\x6b\xaa\x0b\x81\xab\x02\xa5\xcd\x14\x00\
+\x28\xad\xc5\x94\x97\x40\x65\x02\x06\xbe\x95\x35\xe8\xad\xea\xa4\
+\x41\x70\x3c\xce\x21\x08\x70\x0b\xc8\xfc\x16\x05\xf4\x7f\x8d\xb4\
+\xba\xfe\xaf\x91\x86\x56\xcd\x46\x05\x8a\xab\xb6\x00\x40\x71\x4d\
+\xa6\xc0\x04\xea\x11\x88\x93\x41\xcf\xb8\xd6\xd3\x9e\x83\x6a\x92\
+\x06\xc2\xbe\x28\x70\x90\x94\x85\x2a\x17\xd0\xff\x55\xde\xc0\xd7\
+\xaa\xa7\xff\xbb\xa6\x62\x1e\x81\xc2\x05\xca\x2b\xbe\x00\x40\x79\
+\x6d\xa6\xc4\x04\x8a\x17\x88\xab\x5e\x71\x12\x18\x57\x84\x8b\xaf\
+\x8c\x0a\x4c\x13\x30\x10\x9e\xe6\x66\xad\xe2\x05\xa2\xff\x8b\xbf\
+\x6c\xa2\xff\x2b\xbe\x29\xa7\x57\x40\xff\x37\xdd\xce\x9a\x04\x72\
+\x13\x28\xb0\x3c\x02\x00\x05\x36\x9a\x22\x13\x28\x59\x20\x06\xbe\
+\x71\xd5\xbf\xe4\x3a\x28\xfb\x8c\x02\x31\x10\xfe\xc7\x9f\x7f\x99\
+\x31\x45\x49\x11\xc8\x56\xa0\xef\xff\xfc\x65\x93\x6c\x9b\x68\xdd\
+\x82\xe9\xff\xd6\xf5\x96\x1b\x81\x05\x04\x4a\x4c\x52\x00\xa0\xc4\
+\x56\x53\x66\x02\x05\x0a\xc4\x55\xaf\xb8\xea\x6f\xe0\x5b\x60\xe3\
+\x2d\x5d\xe4\x18\x04\xff\xfc\xc3\x21\x6e\x89\x5e\x3a\x2b\xe9\x13\
+\xd8\x42\x40\xff\xb7\x85\x7a\x21\x79\xea\xff\x0a\x69\x28\xc5\x24\
+\x70\x55\xa0\xc8\x99\x02\x00\x45\x36\x9b\x42\x13\x28\x4b\xa0\xbf\
+\xea\x55\x56\xa9\x95\x76\x75\x81\x18\x08\xbb\x1b\x60\x75\x76\x19\
+\x2e\x27\x10\x27\xfe\xfa\xbf\xe5\x7c\xab\x4a\x59\xff\x57\x55\x73\
+\xaa\x4c\x2b\x02\x65\xd6\x53\x00\xa0\xcc\x76\x53\x6a\x02\x45\x08\
+\xc4\xe0\xd7\x55\xff\x22\x9a\x2a\x9f\x42\xc6\x20\xd8\xdd\x00\xf9\
+\xb4\x87\x92\x4c\x16\x88\xfe\x2f\x1e\x77\x72\xd7\xd3\x64\xc2\xf6\
+\x56\xd4\xff\xb5\xd7\xe6\x6a\x5c\xb6\x40\xa1\xa5\x17\x00\x28\xb4\
+\xe1\x14\x9b\x40\xee\x02\xae\x7a\xe5\xde\x42\x99\x97\x2f\x06\xc2\
+\xee\x06\xc8\xbc\x91\x14\xef\x96\x40\x3c\xce\x12\x27\xff\xb7\x3e\
+\x37\x9f\xc0\x5d\x01\xfd\xdf\x5d\x1e\x1f\x12\xc8\x45\xa0\xd4\x72\
+\x08\x00\x94\xda\x72\xca\x4d\x20\x53\x81\xb8\xea\x15\x27\xff\xae\
+\x7a\x65\xda\x40\x25\x15\x2b\x0d\x82\x63\x5b\x2a\xa9\xc8\xca\xda\
+\xb6\x40\xdf\xff\xf9\x86\xff\xb6\xb7\x83\x59\x6a\x9f\xfa\xbf\xb8\
+\x83\x2e\xb6\xa9\x59\xd2\x93\x08\x01\x02\x73\x0b\x14\x9b\x9e\x00\
+\x40\xb1\x4d\xa7\xe0\x04\xf2\x13\xe8\xaf\x7a\x39\xf9\xcf\xaf\x6d\
+\x4a\x2d\x51\x6c\x4b\x31\x08\x8e\x6d\xab\xd4\x3a\x28\x77\x1b\x02\
+\x71\xa2\x16\x57\xfd\x63\x9b\x6d\xa3\xc6\x6a\xb9\x86\x40\x6c\x53\
+\xfa\xbf\x35\xa4\xe5\x41\x60\xac\x40\xb9\xcb\x0b\x00\x94\xdb\x76\
+\x4a\x4e\x20\x2b\x81\x6e\x80\x92\xae\x58\x64\x55\x28\x85\xa9\x47\
+\x20\x6d\x5b\xdd\x36\x56\x4f\x8d\xd4\xa4\x22\x81\xd8\x36\xe3\x44\
+\xad\xa2\x2a\xa9\x4a\x4e\x02\xfa\xbf\x9c\x5a\x43\x59\x08\xbc\x09\
+\x14\xfc\x53\x00\xa0\xe0\xc6\x53\x74\x02\xb9\x08\x74\xb7\x69\xa7\
+\x01\x4a\x2e\xe5\x51\x8e\x4a\x05\xd2\x36\xd6\x6d\x6b\x95\x56\x4f\
+\xb5\xca\x13\x88\xab\xfe\xdd\x36\x99\xb6\xcd\xf2\x4a\xaf\xc4\x45\
+\x09\xa4\x6d\x2c\x02\x4d\x45\x95\x59\x61\x09\x54\x2c\x50\x72\xd5\
+\x04\x00\x4a\x6e\x3d\x65\x27\xb0\xb1\x40\x3f\xf8\x75\xcb\xeb\xc6\
+\x0d\xd1\x50\xf6\xb1\xad\xc5\x23\x01\xb1\xed\x35\x54\x6d\x55\xcd\
+\x50\x20\xb6\xc1\xb8\xea\x1f\xdb\x64\x86\xc5\x53\xa4\x1a\x05\x22\
+\x08\xf0\xf3\x0f\x87\xd8\xf6\x6a\xac\x9e\x3a\x11\x28\x48\xa0\xe8\
+\xa2\x0a\x00\x14\xdd\x7c\x0a\x4f\x60\x3b\x81\xb8\x12\x61\xf0\xbb\
+\x9d\x7f\xeb\x39\xc7\xb6\x17\xdb\x60\xeb\x0e\xea\xbf\x8d\x40\x9c\
+\x80\xc5\x36\xb8\x4d\xee\x72\x6d\x5d\x20\xb6\x3d\xfd\x5f\xeb\x5b\
+\x81\xfa\x6f\x2b\x50\x76\xee\x02\x00\x65\xb7\x9f\xd2\x13\xd8\x44\
+\xa0\x1b\x78\xa4\x2b\x11\x9b\x64\x2e\x53\x02\xbd\x40\xda\x06\xbb\
+\x6d\xb1\x7f\xef\x37\x81\x15\x04\x62\x9b\x8b\x13\xb0\x15\xb2\x92\
+\x05\x81\xdb\x02\xfa\xbf\xdb\x36\x3e\x21\xb0\xb4\x40\xe1\xe9\x0b\
+\x00\x14\xde\x80\x8a\x4f\x60\x6d\x81\x18\xfc\xfa\x13\x57\x6b\xab\
+\xcb\xef\xa6\x80\x41\xf0\x4d\x1a\x1f\xcc\x2f\xa0\xff\x9b\xdf\x54\
+\x8a\x4f\x08\xe8\xff\x9e\xc0\xb3\x2a\x81\xe9\x02\xa5\xaf\x29\x00\
+\x50\x7a\x0b\x2a\x3f\x81\x15\x05\x0c\x7e\x57\xc4\x96\xd5\x70\x01\
+\x83\xe0\xe1\x56\x96\x9c\x2c\xa0\xff\x9b\x4c\x67\xc5\x25\x05\xf4\
+\x7f\x4b\xea\x4a\x9b\xc0\x35\x81\xe2\xe7\x09\x00\x14\xdf\x84\x2a\
+\x40\x60\x1d\x01\x83\xdf\x75\x9c\xe5\x32\x51\x20\x0d\x82\xbb\x6f\
+\x63\x9f\xb8\xba\xd5\x08\xdc\x13\xe8\xb6\xad\xb4\x8d\xdd\x5b\xc6\
+\x67\x04\x36\x13\x48\xdb\x66\x77\x8c\xde\xac\x00\x32\x26\xd0\x92\
+\x40\xf9\x75\x15\x00\x28\xbf\x0d\xd5\x80\xc0\xe2\x02\x06\xbf\x8b\
+\x13\xcb\x60\x06\x81\xf8\x36\xf6\x6e\x5b\x9d\x21\x2d\x49\x10\xe8\
+\x05\x62\x9b\x8a\x6d\xab\x7f\xef\x37\x81\x2c\x05\x04\x01\xb2\x6c\
+\x16\x85\xaa\x50\xa0\x82\x2a\x09\x00\x54\xd0\x88\xaa\x40\x60\x49\
+\x01\x83\xdf\x25\x75\xa5\x3d\xb7\x40\x9c\xa8\xc5\x36\x3b\x77\xba\
+\xd2\x6b\x53\x20\xb6\xa5\xd8\xa6\xda\xac\xbd\x5a\x17\x27\x90\x82\
+\x00\xb1\xcd\x16\x57\x6e\x05\x26\x50\x90\x40\x0d\x45\x15\x00\xa8\
+\xa1\x15\xd5\x81\xc0\x42\x02\x31\x90\x30\xf8\x5d\x08\x57\xb2\x8b\
+\x09\xc4\x36\x1b\xdb\xee\x62\x19\x48\xb8\x09\x81\xd8\x86\x62\x5b\
+\x6a\xa2\xb2\x2a\x59\x8d\x40\x6c\xb3\xb1\xed\x56\x53\x21\x15\x21\
+\x90\x97\x40\x15\xa5\x11\x00\xa8\xa2\x19\x55\x82\xc0\xfc\x02\x31\
+\x80\x88\x81\xc4\xfc\x29\x4b\x91\xc0\xf2\x02\xb1\xed\xc6\x36\xbc\
+\x7c\x4e\x72\xa8\x51\x20\xb6\x9d\xd8\x86\x6a\xac\x9b\x3a\xd5\x2f\
+\x10\xdb\x6e\x6c\xc3\xf5\xd7\x54\x0d\x09\xac\x2d\x50\x47\x7e\x02\
+\x00\x75\xb4\xa3\x5a\x10\x98\x55\x20\x06\x0e\x31\x80\x98\x35\x51\
+\x89\x11\x58\x59\x20\xb6\xe1\xd8\x96\x57\xce\x56\x76\x85\x0b\xc4\
+\x36\x13\xdb\x4e\xe1\xd5\x50\xfc\xc6\x05\x62\x1b\x8e\x6d\xb9\x71\
+\x06\xd5\x27\x30\xaf\x40\x25\xa9\x09\x00\x54\xd2\x90\xaa\x41\x60\
+\x2e\x81\x18\x30\xc4\xc0\x61\xae\xf4\xa4\x43\x60\x4b\x81\xd8\x96\
+\x63\x9b\xde\xb2\x0c\xf2\x2e\x47\x20\xb6\x95\xd8\x66\xca\x29\xb1\
+\x92\x12\xb8\x2d\x10\xdb\x72\x6c\xd3\xb7\x97\xf0\x09\x01\x02\x63\
+\x04\x6a\x59\x56\x00\xa0\x96\x96\x54\x0f\x02\x33\x08\xc4\x9f\x11\
+\x8a\x01\xc3\x0c\x49\x49\x82\x40\x36\x02\xb1\x4d\x1b\x04\x67\xd3\
+\x1c\xd9\x16\x44\xff\x97\x6d\xd3\x28\xd8\x13\x02\xd1\xff\xc5\xb6\
+\xfd\x44\x12\x56\x25\x40\xe0\x4d\xa0\x9a\x9f\x02\x00\xd5\x34\xa5\
+\x8a\x10\x78\x4e\xa0\x1b\x20\x1c\x0e\x5f\x9f\x4b\xc5\xda\x04\xf2\
+\x14\x30\x08\xce\xb3\x5d\x72\x29\x95\xfe\x2f\x97\x96\x50\x8e\x45\
+\x04\xd2\xb1\xbd\xdb\xc6\x17\x49\x5c\xa2\x04\x5a\x11\xa8\xa7\x9e\
+\x02\x00\xf5\xb4\xa5\x9a\x10\x98\x2c\xd0\x0d\x0c\xd2\x00\x61\x72\
+\x02\x56\x24\x50\x82\x40\xda\xc6\xbb\x6d\xbd\x84\xb2\x2a\xe3\x6a\
+\x02\xdd\x36\x91\xb6\x8d\xd5\x32\x94\x11\x81\x2d\x04\xd2\x36\xde\
+\x6d\xeb\x5b\xe4\x2d\x4f\x02\x35\x08\x54\x54\x07\x01\x80\x8a\x1a\
+\x53\x55\x08\x4c\x11\xe8\x06\x04\x69\x60\x30\x65\x5d\xeb\x10\x28\
+\x4e\x20\x6d\xeb\xdd\x36\x5f\x5c\xc1\x15\x78\x09\x81\x6e\x5b\x48\
+\xdb\xc4\x12\x69\x4b\x93\x40\x76\x02\x69\x5b\xef\xb6\xf9\xec\x0a\
+\xa6\x40\x04\xf2\x17\xa8\xa9\x84\x02\x00\x35\xb5\xa6\xba\x10\x18\
+\x29\xf0\xb7\xbf\xff\xe9\xcb\x2e\x0d\x08\x46\xae\x66\x71\x02\x65\
+\x0b\xa4\x6d\xbe\xdb\xf6\xcb\xae\x85\xd2\x3f\x29\xd0\x6d\x03\x69\
+\x5b\x78\x32\x19\xab\x13\x28\x4b\x20\x6d\xf3\xdd\xb6\x5f\x56\xa9\
+\x95\x96\xc0\xd6\x02\x55\xe5\x2f\x00\x50\x55\x73\xaa\x0c\x81\xe1\
+\x02\x31\x00\x78\xdd\xef\x7f\x1b\xbe\x86\x25\x09\xd4\x23\x10\xdb\
+\x7e\xec\x03\xf5\xd4\x48\x4d\xc6\x0a\xc4\x36\x30\x76\x1d\xcb\x13\
+\xa8\x41\x20\xb6\x7d\xfd\x5f\x0d\x2d\xa9\x0e\xeb\x09\xd4\x95\x93\
+\x00\x40\x5d\xed\xa9\x36\x04\x06\x0b\xc4\x00\x60\xf0\xc2\x16\x24\
+\x50\xa1\xc0\x61\xbf\xf7\xa5\x97\x15\xb6\xeb\x90\x2a\xf9\xab\x10\
+\x43\x94\x2c\x53\xb3\x80\xfe\xaf\xe6\xd6\x55\xb7\xd9\x05\x2a\x4b\
+\x50\x00\xa0\xb2\x06\x55\x1d\x02\x43\x04\x3c\x03\x38\x44\xc9\x32\
+\xb5\x0b\xc4\x5f\x06\x70\x22\x58\x7b\x2b\x5f\xd6\x2f\xfa\xbf\x68\
+\xfb\xcb\x4f\xcc\x21\xd0\x8e\x40\xec\x03\xfa\xbf\x76\xda\x5b\x4d\
+\x9f\x13\xa8\x6d\x6d\x01\x80\xda\x5a\x54\x7d\x08\x3c\x10\x88\xc1\
+\xaf\xe7\xfe\x1f\x20\xf9\xb8\x19\x81\x18\x04\x77\xfb\x44\x33\x35\
+\x6e\xbb\xa2\x5d\x5b\x1f\xfc\xb9\xd3\xb6\xb7\x02\xb5\xef\x05\xf4\
+\x7f\xbd\x84\xdf\x04\xee\x0a\x54\xf7\xa1\x00\x40\x75\x4d\xaa\x42\
+\x04\x6e\x0b\x74\xcf\xfc\x19\xfc\xde\x06\xf2\x49\x9b\x02\x69\x9f\
+\xe8\xf6\x8d\x36\x6b\xdf\x4c\xad\x9d\xfc\x37\xd3\xd4\x2a\x3a\x46\
+\x40\xff\x37\x46\xcb\xb2\x4d\x0a\xd4\x57\x69\x01\x80\xfa\xda\x54\
+\x8d\x08\xdc\x14\xf0\xdc\xff\x4d\x1a\x1f\x34\x2e\x10\xfb\x86\x20\
+\x40\xe5\x1b\x41\x3a\xd1\xa9\xbc\x86\xaa\x47\x60\x92\x80\xef\x03\
+\x98\xc4\x66\xa5\x56\x04\x2a\xac\xa7\x00\x40\x85\x8d\xaa\x4a\x04\
+\xae\x09\x74\x57\xbf\xae\x7d\x60\x1e\x01\x02\x9d\x80\x41\x70\xc7\
+\x50\xe5\x0f\xfd\x5f\x95\xcd\xaa\x52\x33\x09\xc4\xa3\x00\xbe\x0f\
+\x60\x26\x4c\xc9\x54\x27\x50\x63\x85\x04\x00\x6a\x6c\x55\x75\x22\
+\x70\x26\xd0\x0d\x7e\x5d\xfd\x3a\x53\xf1\x96\xc0\xa9\x40\x0c\x82\
+\xbb\x7d\xe5\x74\xb6\x77\x85\x0b\x74\x6d\xaa\xff\x2b\xbc\x15\x15\
+\x7f\x69\x01\xfd\xdf\xd2\xc2\xd2\x2f\x54\xa0\xca\x62\x0b\x00\x54\
+\xd9\xac\x2a\x45\xe0\x53\xa0\xbb\xad\xd9\xe0\xf7\x13\xc4\x2b\x02\
+\xf7\x04\xd2\xbe\xd2\xed\x33\xf7\x96\xf1\x59\x31\x02\x5d\x5b\xa6\
+\x36\x2d\xa6\xc0\x0a\x4a\x60\x4b\x81\xb4\xaf\x74\xfb\xcc\x96\x65\
+\x90\x37\x81\xac\x04\xea\x2c\x8c\x00\x40\x9d\xed\xaa\x56\x04\x3e\
+\x04\xdc\xd6\xfc\x41\xe1\x05\x81\x41\x02\xf6\x99\x41\x4c\x45\x2c\
+\xa4\x2d\x8b\x68\x26\x85\xcc\x48\xc0\x3e\x93\x51\x63\x28\xca\xf6\
+\x02\x95\x96\x40\x00\xa0\xd2\x86\x55\x2d\x02\x21\x10\xb7\xbe\xc6\
+\x6d\x7d\xf1\xda\x44\x80\xc0\x30\x81\xd8\x67\x62\xdf\x19\xb6\xb4\
+\xa5\x72\x15\x88\x36\x8c\xb6\xcc\xb5\x7c\xca\x45\x20\x47\x81\xd8\
+\x67\x62\xdf\xc9\xb1\x6c\xca\x44\x60\x6d\x81\x5a\xf3\x13\x00\xa8\
+\xb5\x65\xd5\xab\x79\x81\xee\x36\xbe\xc3\xe1\x6b\xf3\x10\x00\x08\
+\x4c\x11\x48\xfb\x4e\xb7\x0f\x4d\x59\xd7\x3a\x9b\x0b\x74\x27\x30\
+\xa9\x0d\x37\x2f\x88\x02\x10\x28\x51\x20\xed\x3b\xfa\xbf\x12\x1b\
+\x4e\x99\x67\x16\xa8\x36\x39\x01\x80\x6a\x9b\x56\xc5\x5a\x17\x70\
+\x1b\x5f\xeb\x5b\x80\xfa\x3f\x2b\x10\x7f\x1a\xf0\xd9\x34\xac\xbf\
+\x91\x40\x3a\x81\xd9\x28\x67\xd9\x12\xa8\x42\xc0\x18\xa2\x8a\x66\
+\x54\x89\xa7\x04\xea\x5d\x59\x00\xa0\xde\xb6\x55\xb3\x86\x05\xe2\
+\xea\x57\xdc\xc6\xd7\x30\x81\xaa\x13\x98\x45\xc0\x9f\xc6\x9a\x85\
+\x71\xd5\x44\xa2\xff\x5b\x35\x43\x99\x11\xa8\x50\x20\xc6\x10\xf6\
+\xa5\x0a\x1b\x56\x95\x86\x0b\x54\xbc\xa4\x00\x40\xc5\x8d\xab\x6a\
+\x0d\x0b\xb8\xfa\xd5\x70\xe3\xab\xfa\x9c\x02\x31\x08\x76\x2b\xec\
+\x9c\xa2\xcb\xa6\xd5\x9d\xb0\xe8\xff\x96\x45\x96\x7a\x3b\x02\x69\
+\x5f\xd2\xff\xb5\xd3\xdc\x6a\x7a\x2a\x50\xf3\x3b\x01\x80\x9a\x5b\
+\x57\xdd\x9a\x14\xe8\x06\xc0\x4d\xd6\x5c\xa5\x09\x2c\x23\xe0\x56\
+\xd8\x65\x5c\xa5\x4a\x80\x40\xfe\x02\xfa\xbf\xfc\xdb\x48\x09\x17\
+\x11\xa8\x3a\x51\x01\x80\xaa\x9b\x57\xe5\x5a\x13\xe8\x4e\xfe\x53\
+\xc4\xbe\xb5\x7a\xab\x2f\x81\x25\x05\xdc\x05\xb0\xa4\xee\x7c\x69\
+\xeb\xff\xe6\xb3\x94\x12\x81\x5e\x40\xff\xd7\x4b\xf8\xdd\x96\x40\
+\xdd\xb5\x15\x00\xa8\xbb\x7d\xd5\xae\x35\x01\x27\xff\xad\xb5\xb8\
+\xfa\xae\x24\xe0\x0b\x01\x57\x82\x7e\x26\x1b\xfd\xdf\x33\x7a\xd6\
+\x25\x70\x53\xc0\x5d\x00\x37\x69\x7c\x50\xab\x40\xe5\xf5\x12\x00\
+\xa8\xbc\x81\x55\xaf\x1d\x81\xee\xea\x57\x3b\xd5\x55\x53\x02\xab\
+\x0b\xd8\xc7\x56\x27\x1f\x9c\xa1\xb6\x19\x4c\x65\x41\x02\xa3\x05\
+\xe2\x2e\x00\xfb\xd8\x68\x36\x2b\x14\x2c\x50\x7b\xd1\x05\x00\x6a\
+\x6f\x61\xf5\x6b\x47\xc0\xd5\xaf\x2c\xda\x7a\xbf\xdb\x7d\x8f\x69\
+\xb7\xdf\x7f\x7b\x39\x1c\x7e\x3a\x9f\xfe\xf3\xeb\x1f\xfb\x6b\xd3\
+\xf9\x72\xbb\xb4\x7e\x3f\x75\xe9\xed\xfc\xdb\x5c\x20\xed\x63\xbe\
+\x10\x6b\xf3\x56\xb8\x28\x40\xd7\x26\xa9\x6d\x2e\x3e\x30\x63\x75\
+\x81\xe8\xab\x62\x8a\xbe\xeb\xbc\x4f\x8b\xf7\xd7\xfa\xbe\x98\x17\
+\x9f\x1d\x4f\xb1\x7e\x3f\x75\xe9\xad\x5e\x13\x19\x5e\x08\xa4\x7d\
+\xac\xdb\xd7\x2e\x3e\x30\x83\x40\x75\x02\xd5\x57\x48\x00\xa0\xfa\
+\x26\x56\xc1\x16\x04\x44\xe6\xd7\x6f\xe5\x18\x94\xc6\xd4\x0f\x5a\
+\x63\x10\x1b\xd3\xbf\x7f\xfd\xe3\xa7\x98\xfe\xf3\xcf\xff\xfe\xf2\
+\xaf\xff\xfb\xdf\xf7\xf3\xe9\x56\x49\xcf\x97\x8b\xf5\xfb\xa9\x4b\
+\xef\x3d\x70\x10\xf9\x19\x18\xdf\x52\x5c\x7e\xbe\x5b\x61\x97\x37\
+\x1e\x9b\xc3\xeb\xcb\xcb\x97\xb1\xeb\x58\xfe\x39\x81\xe8\xfb\x62\
+\x8a\xfe\x28\xa6\xe8\xfb\x62\x8a\xbe\x2a\xa6\xe8\xbb\xce\xfb\xb4\
+\x78\x7f\x2b\xd7\xf8\xec\x78\x8a\xf5\xfb\xa9\x4b\x4f\xff\x77\x8b\
+\x6e\xd5\xf9\xfa\xbf\x55\xb9\x65\xb6\x99\x40\xfd\x19\xbf\xd4\x5f\
+\x45\x35\x24\xd0\x80\x40\x8a\xcc\x37\x50\xcb\x4d\xab\x18\x83\xdd\
+\x38\xf1\xee\x07\xbb\x31\x28\x8d\xa9\x1f\xb4\xae\x55\xb8\xc8\xef\
+\x7c\x60\x1c\x65\x8a\xb2\x75\x65\x5c\xab\x20\x8d\xe6\x13\xb7\xc2\
+\xba\x0a\x96\x4f\xe3\x77\xc1\x4f\xfd\xdf\xe2\x0d\xd2\xf5\x2d\xfb\
+\x7d\x77\x57\xd3\xf1\x89\x7e\xf4\x47\x31\x2d\x5e\x80\xf7\x0c\x22\
+\x2f\xfd\xdf\x3b\xc6\x06\xbf\xf4\x7f\x1b\xa0\xcb\x72\x7d\x81\x06\
+\x72\x14\x00\x68\xa0\x91\x55\xb1\x6e\x81\x6e\x00\x5c\x77\x15\x37\
+\xab\x5d\x0c\x7a\xe3\xe4\x3a\xa6\x38\xd9\x8f\x81\x67\x0c\x40\x37\
+\x2b\xd0\x8d\x8c\xa3\x4c\x51\xb6\xae\x8c\xe9\x4a\xd9\x2e\x0d\xd4\
+\xa3\xec\x37\x16\x37\xfb\x49\x01\x57\xc1\x9e\x04\x9c\x73\x75\x27\
+\xff\x73\x6a\x9e\xa4\x15\x7d\x48\xf4\x7d\x31\x75\x7d\xcb\xfb\x5d\
+\x4d\x27\x0b\x65\xf0\x46\xff\xb7\x6e\x23\xe8\xff\xd6\xf5\x96\xdb\
+\xfa\x02\x2d\xe4\x28\x00\xd0\x42\x2b\xab\x63\xdd\x02\x06\xc0\xb3\
+\xb6\xef\xf9\xa0\x37\x06\x97\x31\xcd\x9a\xc9\xc2\x89\x9d\x07\x03\
+\x16\xce\xae\xb9\xe4\x5d\x05\xcb\xa3\xc9\x05\x3f\xe7\x6f\x07\xfd\
+\xdf\xfc\xa6\xb5\xa5\xa8\xff\xab\xad\x45\xd5\xe7\x4c\xa0\x89\xb7\
+\x02\x00\x4d\x34\x0a\x91\x68\x5f\x00\x00\x10\x00\x49\x44\x41\x54\
+\xb3\x4a\xd6\x2a\x60\x00\x3c\x5f\xcb\xf6\x03\xdf\xb8\xd2\x15\x27\
+\xfc\x31\xcd\x97\xfa\x76\x29\x45\x30\x20\x6e\xd9\x8d\xbb\x02\xba\
+\x69\xbb\xa2\x54\x95\xb3\xab\x60\x19\x34\xa7\xe0\xe7\x6c\x8d\xa0\
+\xff\x9b\x8d\xb2\x89\x84\xf4\x7f\x4d\x34\x73\xa3\x95\x6c\xa3\xda\
+\x02\x00\x6d\xb4\xb3\x5a\x56\x28\xd0\x9d\xfc\x1b\x00\x3f\xdd\xb2\
+\xe7\x03\xdf\xa7\x13\xcc\x34\x81\x2e\x10\xf0\xcf\xff\xfe\xf2\x11\
+\x0c\xc8\xb4\x9c\xa5\x14\xcb\x55\xb0\x6d\x5b\xaa\xeb\xff\xb6\x2d\
+\x42\x15\xb9\xeb\xff\xaa\x68\xc6\xd5\x2b\xa1\xff\x5b\x9d\x5c\x86\
+\x6b\x09\x34\x92\x8f\x00\x40\x23\x0d\xad\x9a\x04\x08\x9c\x0a\xc4\
+\xc0\x37\x4e\x86\xfb\x2b\xfe\xa7\x9f\xd6\xfd\xae\x0b\x06\xbc\x7f\
+\x57\x40\xdd\x35\x5d\xb6\x76\xae\x82\x2d\xeb\x7b\x37\x75\xc1\xcf\
+\xbb\x3c\x8f\x3e\xd4\xff\xfd\xb1\x77\x47\xd4\xa3\xad\xe4\xfe\xe7\
+\xfa\xbf\xfb\x3e\x3e\x2d\x53\xa0\x95\x52\x0b\x00\xb4\xd2\xd2\xea\
+\x59\x95\x40\x77\xf5\xcb\x00\x78\x52\x9b\xee\x77\xbb\xef\xfd\x97\
+\x5a\x4d\x4a\xa0\xa2\x95\x22\x10\x10\x16\x06\xc2\xd3\x1a\xd5\x55\
+\xb0\x69\x6e\xcf\xae\xd5\xf5\x7f\xcf\x26\xd2\xe8\xfa\x7b\xfd\xdf\
+\x47\xcb\xeb\xff\x3e\x28\x26\xbd\xd0\xff\x4d\x62\xb3\x52\xde\x02\
+\xcd\x94\x4e\x00\xa0\x99\xa6\x56\x51\x02\x6d\x0b\x1c\x0f\x7c\x6b\
+\x79\xbe\x7f\x8e\x16\x0d\x8b\x18\x08\x0b\x02\x4c\xd3\x74\x15\x6c\
+\x9a\x9b\xb5\xd6\x15\xd0\xff\x5d\xf7\xd6\xff\x5d\x77\x19\x3a\x57\
+\xff\x37\x54\xca\x72\x65\x08\xb4\x53\x4a\x01\x80\x76\xda\x5a\x4d\
+\x2b\x11\xf8\xdb\xdf\xff\xf4\x65\xe7\xea\xff\xb8\xd6\xdc\xef\xbf\
+\xb5\x78\xab\xff\x18\xa4\x08\x02\xc4\x23\x11\x02\x01\x63\xd4\x76\
+\x3b\x57\xc1\xc6\x79\x3d\xbb\x74\x77\xf5\x5f\xff\x37\x8e\x51\xff\
+\xf7\xd0\x4b\xff\xf7\x90\xe8\xea\x02\xfa\xbf\xab\x2c\x66\x96\x2a\
+\xd0\x50\xb9\x05\x00\x1a\x6a\x6c\x55\xad\x43\xe0\xf5\xe5\xe5\x4b\
+\x1d\x35\x59\xa7\x16\x71\x8b\x7b\x0c\xee\xd6\xc9\xad\xfc\x5c\x3a\
+\xab\x74\xc2\x50\x7e\x4d\xd6\xab\x81\xab\x60\xeb\x59\xcb\x69\x9c\
+\x80\xfe\x6f\x9c\x97\xfe\x6f\x9c\x57\x2c\xad\xff\x0b\x05\x53\x0d\
+\x02\x2d\xd5\xe1\xa5\xa5\xca\xaa\x2b\x81\x2a\x04\x5c\xfd\x1a\xd4\
+\x8c\x71\xcb\x6b\x5c\xd1\x8e\x5b\x3c\x07\xad\x60\xa1\x0f\x81\x18\
+\x04\x87\x9d\xbb\x01\x3e\x48\xee\xbe\x70\x15\xec\x2e\xcf\x6c\x1f\
+\xba\xfb\x69\x38\xa5\xfe\x6f\xb8\xd5\xf9\x92\xfa\xbf\x73\x91\xfb\
+\xef\xa3\xff\xbb\xbf\x84\x4f\x09\x14\x21\xd0\x54\x21\x05\x00\x9a\
+\x6a\x6e\x95\x2d\x5d\xa0\xbb\xfd\xb5\xf4\x4a\xac\x51\xfe\x74\x05\
+\x3b\x6e\xf9\x5f\x23\xab\x9a\xf3\x88\x81\xb0\x20\xc0\xb0\x16\x76\
+\x15\x6c\x98\xd3\x33\x4b\xb9\xfb\x69\xa0\x9e\xfe\x6f\x20\xd4\xfd\
+\xc5\xf4\x7f\xf7\x7d\x8e\x3f\xed\x82\x73\xc7\x33\xbc\x26\x50\x9c\
+\x40\x5b\x05\x16\x00\x68\xab\xbd\xd5\xb6\x70\x81\xfd\xe1\xf0\x63\
+\xe1\x55\x58\xbe\xf8\x69\xf0\xdb\x0d\xdc\x96\xcf\xa9\x89\x1c\x3a\
+\xcb\x64\xda\x44\x65\x9f\xa8\xa4\xab\x60\x4f\xe0\x0d\x5d\xd5\xdd\
+\x4f\x8f\xa5\xd2\xbe\xda\xed\xb3\x8f\x97\xb4\xc4\x00\x81\xce\x32\
+\x99\x0e\x58\xb4\xe9\x45\x04\x40\x9b\x6e\xfe\x3a\x2a\xdf\x58\x2d\
+\x04\x00\x1a\x6b\x70\xd5\x2d\x57\x20\xae\xfe\x3b\xc9\xb8\xdf\x7e\
+\x9e\x77\xbd\xef\x33\xf5\xd3\x18\x04\x87\xed\xd4\xf5\x5b\x59\xcf\
+\x55\xb0\xe5\x5a\x3a\xfa\xbf\xe5\x52\xaf\x23\xe5\xd8\x47\x63\x5f\
+\xad\xa3\x36\xf9\xd4\x22\x4c\xc3\x36\x9f\x12\xe5\x57\x92\x18\x9b\
+\xe8\xff\xf2\x6b\x17\x25\x1a\x2e\xd0\xda\x92\x02\x00\xad\xb5\xb8\
+\xfa\x12\xa8\x54\x20\x06\x68\x9e\xf7\x5f\xae\x71\xc3\x36\x8c\x97\
+\xcb\xa1\xfc\x94\x5d\x05\x5b\xae\x0d\xdd\xfd\x74\xdf\x36\xf6\xcd\
+\xd8\x47\xef\x2f\xe5\xd3\xa9\x02\x61\x1b\xc6\x53\xd7\x6f\x61\x3d\
+\xfd\x5f\x0b\xad\x5c\x6d\x1d\x9b\xab\x98\x00\x40\x73\x4d\xae\xc2\
+\xc5\x0a\xb8\xfd\xf5\x6a\xd3\xf9\xb2\xab\xab\x2c\x8b\xcc\x8c\x41\
+\x70\x7c\x39\x60\x98\x2f\x92\x41\xe1\x89\xba\x0a\xb6\x4c\x03\xc6\
+\x95\xc5\xb0\x5d\x26\xf5\xb2\x53\x8d\x7d\x31\xf6\xc9\xd8\x37\xcb\
+\xae\x49\xfe\xa5\x0f\xe3\xb0\x0e\xf3\xfc\x4b\xbb\x7e\x09\xed\xa3\
+\xeb\x9b\xcb\x71\x2e\x81\xf6\xd2\x11\x00\x68\xaf\xcd\xd5\xb8\x40\
+\x01\xb7\xbf\xde\x6e\x34\x5f\xf6\x77\xdb\x66\xa9\x4f\x98\xdf\x96\
+\x75\x15\xec\xb6\xcd\xd4\x4f\x7c\xf9\xdf\x6d\x39\xfb\xe2\x6d\x9b\
+\xa5\x3e\x61\x7e\x5b\x36\x82\x75\xb7\x3f\xf5\x09\x81\x4c\x05\x1a\
+\x2c\x96\x00\x40\x83\x8d\xae\xca\x05\x0a\xb8\xfa\x7f\xb5\xd1\xdc\
+\x92\x79\x95\x65\x95\x99\xec\xaf\x33\xbb\x0a\x76\xdd\xe5\xa9\xb9\
+\xfa\xbf\xab\x7c\xf6\xc1\xab\x2c\xab\xcc\x64\x7f\x9d\x59\x00\xf4\
+\xba\x8b\xb9\x79\x0b\xb4\x58\x3a\x01\x80\x16\x5b\x5d\x9d\x8b\x12\
+\x10\x51\xbf\xde\x5c\x31\x00\x8b\x5b\x32\xaf\x7f\x6a\xee\xd2\x02\
+\x61\x1f\x6d\xb0\x74\x3e\x25\xa6\x6f\x9f\x9d\xaf\xd5\xdc\xfd\x74\
+\xdd\x32\xf6\xbd\xd8\x07\xaf\x7f\x6a\xee\xd2\x02\x61\x1f\x6d\xb0\
+\x74\x3e\xa5\xa5\x1f\x01\x50\xfd\x5f\x69\xad\xd6\x7c\x79\x9b\x04\
+\x10\x00\x68\xb2\xd9\x55\xba\x24\x01\xb7\xbf\x5e\x69\xad\xfd\xfe\
+\x5b\x0c\xc0\xae\x7c\x62\xd6\x8a\x02\x5d\x1b\xa4\xb6\x58\x31\xcb\
+\x22\xb2\x72\x15\x6c\xbe\x66\xf2\xe5\x7f\x57\x2c\xd3\x3e\xd7\xed\
+\x7b\x57\x3e\x32\x6b\x3d\x81\xae\x0d\x52\x5b\xac\x97\x63\x19\x39\
+\xe9\xff\xca\x68\x27\xa5\xec\x05\xda\xfc\x2d\x00\xd0\x66\xbb\xab\
+\x75\x49\x02\x6e\x7f\x3d\x6d\xad\x34\xe0\x8a\x3f\xcb\x74\x3a\xd3\
+\xbb\xad\x04\xba\xb6\x48\x6d\xb2\x55\xfe\x39\xe6\xeb\x2a\xd8\x7c\
+\xad\x12\x96\xf3\xa5\x56\x41\x4a\x69\x5f\xeb\xf6\xb9\x0a\xaa\x52\
+\x43\x15\xba\xb6\x48\x6d\x52\x43\x5d\xd4\x81\x40\x93\x02\x8d\x56\
+\x5a\x00\xa0\xd1\x86\x57\xed\x32\x04\xdc\x4a\x77\xd6\x4e\x69\xa0\
+\xd5\x0d\xb8\xce\x66\x7b\xbb\xad\x40\xb4\x89\x6f\xc6\xde\xb6\x0d\
+\x6a\xcc\xdd\xed\xff\x67\xad\xaa\xff\x3b\x03\xc9\xe3\xad\xfe\xef\
+\xb4\x1d\x22\x68\x67\xec\x72\x6a\xe2\x5d\xbe\x02\xad\x96\x4c\x00\
+\xa0\xd5\x96\x57\xef\x22\x04\xdc\xfe\x7f\xda\x4c\x31\xd0\x3a\x9d\
+\xe3\x5d\x2e\x02\xbe\x19\xfb\xb4\x25\xdc\x06\x7b\xea\xe1\xdd\xf3\
+\x02\xfa\xbf\xe7\x0d\x97\x4a\x41\xff\x77\x2a\x6b\xec\x72\xea\xe1\
+\x5d\xb6\x02\xcd\x16\x4c\x00\xa0\xd9\xa6\x57\xf1\x12\x04\x3c\xff\
+\x7a\xd4\x4a\xe9\xea\xd7\xd1\x3b\x2f\x33\x14\xf0\xa5\x58\x9f\x8d\
+\x12\x57\xc1\x3e\xdf\x79\x35\x49\xc0\xe3\x4f\x9f\x6c\xfa\xbf\x4f\
+\x8b\x4c\x5f\xe9\xff\x3e\x1b\xc6\xd8\xe5\xd3\xc2\xab\x9c\x05\xda\
+\x2d\x9b\x00\x40\xbb\x6d\xaf\xe6\x05\x08\x38\x89\x78\x6f\xa4\x34\
+\xf8\x75\xf5\xeb\xdd\x22\xe3\x5f\xbe\x14\xeb\xb4\x71\xdc\x06\x7b\
+\xea\x31\xe6\x9d\xdb\xff\x8f\xb4\xf4\x7f\x47\x18\xf9\xbe\xd4\xff\
+\x7d\xb6\x4d\x8c\x5d\xf4\x7f\x9f\x1e\x5e\x65\x2a\xd0\x70\xb1\x04\
+\x00\x1a\x6e\x7c\x55\xcf\x5b\xc0\x00\xf8\xb3\x7d\x9c\xfc\x7f\x5a\
+\xe4\xfe\x2a\xda\xca\xf7\x01\xbc\xb5\x92\xc7\x00\xde\x1c\xfc\x7c\
+\x4e\x20\xf6\xa9\xe7\x52\xb0\xf6\x5a\x02\xd1\x56\xfa\xbf\xb5\xb4\
+\xe5\x43\xe0\x39\x81\x96\xd7\x16\x00\x68\xb9\xf5\xd5\x3d\x6b\x01\
+\xb7\xd0\xbd\x37\x4f\xba\xfa\xf5\xfe\xca\xaf\x42\x04\xd2\xb6\xfb\
+\xad\x90\xa2\x2e\x5a\xcc\xb8\x0a\xb6\x68\x06\x35\x27\xee\xf6\xff\
+\xb7\xd6\xd5\xff\xbd\x39\x14\xf4\x53\xff\xf7\xd6\x58\x02\xa0\x6f\
+\x0e\x7e\x66\x2b\xd0\x74\xc1\x04\x00\x9a\x6e\x7e\x95\xcf\x59\xc0\
+\xc9\x43\x6a\x9d\x34\xf8\x8d\x2b\x2a\xe9\x95\xff\x05\x09\xc4\xad\
+\xb0\xae\x82\xbd\x35\x98\xdb\x60\xdf\x1c\xc6\xfc\x64\xf6\xae\xa5\
+\xff\x7b\x87\x28\xeb\x97\xfe\xef\xad\xbd\x8c\x61\xde\x1c\xfc\xcc\
+\x55\xa0\xed\x72\x09\x00\xb4\xdd\xfe\x6a\x9f\xa9\x80\xdb\xff\xdf\
+\x1a\xe6\xe5\xf5\xf5\xfb\xdb\x2b\x3f\x4b\x13\x70\x15\xec\xad\xc5\
+\x5c\x05\x7b\x73\x18\xf3\xd3\x37\x88\xbf\x69\xe9\xff\xde\x1c\x4a\
+\xfc\xa9\xff\x7b\x6b\x35\xc1\xbc\x37\x07\x3f\x33\x14\x68\xbc\x48\
+\x02\x00\x8d\x6f\x00\xaa\x4f\x20\x5b\x81\x74\xf5\x2b\xae\xa4\x64\
+\x5b\x3e\x05\xbb\x2b\x10\x6d\xe7\x2e\x80\xbb\x44\x3e\xbc\x25\xe0\
+\xf6\xff\xdd\x4e\xff\xb7\x2b\xf9\x9f\xfe\xef\xad\xf5\x04\x40\xdf\
+\x1c\xfc\xcc\x4f\xa0\xf5\x12\x09\x00\xb4\xbe\x05\xa8\x7f\x9e\x02\
+\x06\xc0\x3b\xb7\xfe\xe7\xb9\x69\x8e\x29\xd5\xbf\x7f\xfd\xe3\xa7\
+\x31\xcb\xd7\xb8\x6c\xdc\x06\xfb\x97\x9f\x7f\x38\x98\x86\x1b\xd4\
+\xb8\x1d\x8c\xad\x93\xfe\x6f\xac\x58\x7e\xcb\xeb\xff\xf2\x6b\x13\
+\x25\x22\xf0\x2e\xd0\xfc\x2f\x01\x80\xe6\x37\x01\x00\x04\x32\x14\
+\x48\x57\xbf\x32\x2c\x95\x22\x4d\x10\x70\x17\xc0\x04\x34\xab\xb4\
+\x2d\xa0\xff\xab\xa6\xfd\x5b\xef\xff\x22\x00\xea\x31\x80\x6a\x36\
+\xe7\x8a\x2a\xa2\x2a\x02\x00\xb6\x01\x02\x99\x09\x78\xfe\x7f\xe7\
+\xea\x7f\x66\xdb\xe4\x33\xc5\xf1\x2c\xec\x33\x7a\xd6\x6d\x51\xc0\
+\xd5\xff\x7a\x5a\x5d\xff\x57\x4f\x5b\xaa\x49\x45\x02\xaa\xb2\x13\
+\x00\xb0\x11\x10\x20\x90\x97\x80\xab\x5f\x79\xb5\xc7\x93\xa5\xf1\
+\x2c\xec\x93\x80\x56\x6f\x4b\x40\xff\x57\x55\x7b\xeb\xff\x76\x3b\
+\xdf\x03\x50\xd5\x26\x5d\x45\x65\x54\x62\x27\x00\x60\x23\x20\x90\
+\x9b\x40\xba\x62\xf0\x63\x6e\x65\x52\x1e\x02\xcf\x08\xa4\x6d\xfa\
+\xdb\x33\xeb\x5b\x97\x00\x01\x02\xa5\x0a\xe8\xff\x4a\x6d\x39\xe5\
+\xae\x54\x40\xb5\x92\x80\x3b\x00\x12\x82\xff\x04\x72\x12\x88\x67\
+\xe6\x72\x2a\xcf\xda\x65\x71\xfb\xeb\xda\xe2\xcb\xe7\xe7\x2a\xd8\
+\xf2\xc6\x72\xa8\x43\x40\xff\x57\x47\x3b\x1e\xd7\xa2\xf5\xfe\xaf\
+\xf5\x31\xcd\xf1\xb6\xe0\x75\x0e\x02\xca\x10\x02\x02\x00\xa1\x60\
+\x22\x90\x89\x40\xf3\x5f\x96\xe3\xf6\xd7\x4c\xb6\xc4\xf9\x8b\xe1\
+\x2a\xd8\xfc\xa6\x52\xac\x4c\x40\xff\x57\x59\x83\x7e\x56\xa7\xf5\
+\xfe\xaf\xf9\xb1\xcd\xe7\xa6\xe0\xd5\xd6\x02\xf2\xef\x04\x04\x00\
+\x3a\x06\x3f\x08\xe4\x21\xf0\xfa\xf2\xf2\x25\x8f\x92\x6c\x53\x0a\
+\x57\xbf\xb6\x71\x97\x2b\x01\x02\xdb\x0b\xe8\xff\xb6\x6f\x03\x25\
+\x20\x40\xa0\x6e\x01\xb5\x7b\x13\x78\x79\xfb\xe5\x27\x01\x02\x04\
+\xb6\x15\xd8\xef\x76\xdf\x77\xfe\x55\x2b\xd0\xfa\x6d\xb0\xd5\x36\
+\xac\x8a\xcd\x22\xa0\xff\x9b\x85\x31\xdb\x44\x5a\xef\xff\x7c\x11\
+\x60\xb6\x9b\x66\x6b\x05\x53\xdf\x77\x01\x01\x80\x77\x08\xbf\x08\
+\x64\x21\x70\x38\x7c\xcd\xa2\x1c\x1b\x14\x22\x0d\x10\x7e\xdf\x20\
+\x5b\x59\xae\x28\xd0\xfa\x6d\xb0\x2b\x52\xcb\xaa\x30\x01\xfd\x5f\
+\x61\x0d\x36\xa1\xb8\xfa\xbf\x09\x68\x56\x21\x30\xab\x80\xc4\x7a\
+\x01\x01\x80\x5e\xc2\x6f\x02\x1b\x09\xc4\xb3\x71\x7f\xfd\xf9\x87\
+\xdf\x62\xda\xa8\x08\x59\x64\xeb\xf6\xd7\x2c\x9a\x41\x21\x08\x10\
+\xd8\x40\x40\xff\xb7\x01\xba\x2c\x57\x13\x88\x2f\x02\xfc\xcb\xcf\
+\x3f\x1c\xfe\xf2\x8f\x3f\xff\x12\xd3\x6a\x19\xcb\x88\xc0\xb1\x80\
+\xd7\x1f\x02\x02\x00\x1f\x14\x5e\x10\x58\x47\x20\x4e\xf8\x63\x8a\
+\x13\xfe\x38\x20\xbe\xee\xf7\xbf\xc5\xc1\x31\xa6\x75\x4a\x90\x5f\
+\x2e\x6e\x7f\xcd\xaf\x4d\x96\x28\x51\xeb\xb7\xc1\x2e\x61\x2a\xcd\
+\xf2\x05\xf4\x7f\xe5\xb7\xe1\x90\x1a\xe8\xff\x92\x52\xdc\xe5\x98\
+\xa6\x18\xfb\x44\x20\x20\xa6\x34\xd7\x7f\x02\xab\x08\xc8\xe4\x53\
+\x40\x00\xe0\xd3\xc2\x2b\x02\x8b\x09\xf4\x27\xfc\x71\xd2\x1f\x27\
+\xfc\x31\xb5\x7c\xc2\x7f\x0e\xed\xf6\xd7\x73\x91\x7a\xdf\x6b\xeb\
+\x7a\xdb\x56\xcd\xa6\x09\xd8\x27\xa6\xb9\x95\xb8\x96\xb6\x3e\x6a\
+\xb5\x14\x08\xd8\xa5\xa9\x0b\x06\xb8\x3b\xe0\x08\xc6\xcb\x85\x04\
+\x24\x7b\x24\x20\x00\x70\x84\xe1\x25\x81\xb9\x04\xe2\x84\x3f\xa6\
+\x38\xe1\x8f\x83\x5b\x7f\xc2\xef\xa4\xff\xba\xf0\xcb\xeb\xab\x2f\
+\x00\xbc\x4e\x53\xdd\x5c\x6d\x5d\x5d\x93\xaa\xd0\x93\x02\xf6\x89\
+\x27\x01\x0b\x5a\x5d\x5b\xdf\x69\xac\x14\x0c\xf8\x08\x08\x78\x54\
+\xe0\x0e\x94\x8f\xa6\x09\x58\xeb\x58\x40\x00\xe0\x58\xc3\x6b\x02\
+\x4f\x0a\xf4\x27\xfd\x71\xc2\x1f\x93\x13\xfe\x61\xa0\x71\x6b\xe4\
+\xb0\x25\x2d\x55\xba\x80\xb6\x2e\xbd\x05\x95\x7f\x6e\x01\xfb\xc4\
+\xdc\xa2\xf9\xa6\xa7\xad\x07\xb6\x8d\x60\xc0\x40\x28\x8b\x0d\x16\
+\xb0\xe0\x89\x80\x00\xc0\x09\x87\x37\x04\xc6\x0b\xf4\x27\xfd\xc7\
+\x57\xfa\xc7\xa7\xd2\xee\x1a\x9e\x7f\x6d\xaf\xed\xb5\x79\x7b\x6d\
+\xae\xc6\xd7\x05\xec\x0b\xd7\x5d\x6a\x9e\xab\xcd\x47\xb6\xae\x60\
+\xc0\x48\x30\x8b\x5f\x13\x30\xef\x54\x40\x00\xe0\xd4\xc3\x3b\x02\
+\x83\x04\x9c\xf4\x0f\x62\x1a\xb4\x90\x67\x22\x07\x31\x59\x88\x00\
+\x81\x0a\x05\xf4\x7f\x15\x36\xaa\x2a\x2d\x27\x20\x18\xb0\x9c\x6d\
+\xdd\x29\xab\xdd\x99\x80\x00\xc0\x19\x88\xb7\x04\x6e\x09\x38\xe9\
+\xbf\x25\x63\x3e\x81\x71\x02\xfb\xc3\xe1\xdb\xb8\x35\x2c\x4d\x80\
+\x00\x81\x3a\x04\xf4\x7f\x33\xb5\xe3\x59\x30\x60\xa6\x54\x25\x53\
+\xa5\x80\x4a\x9d\x0b\x08\x00\x9c\x8b\x78\x4f\xe0\x4c\xa0\x3f\xf1\
+\xf7\x4c\xff\x19\xcc\x4c\x6f\x7d\x29\xd2\x4c\x90\x92\x21\x40\xa0\
+\x38\x01\xfd\x5f\x71\x4d\xa6\xc0\x39\x0a\xa4\x60\x40\x3c\x86\x19\
+\x7f\x56\x30\xa6\x1c\x8b\xa8\x4c\x1b\x0a\xc8\xfa\x42\x40\x00\xe0\
+\x82\xc4\x0c\x02\xbb\x5d\x7f\xd2\x1f\x07\x14\x27\xfe\xcb\x6e\x11\
+\xbe\x14\x69\x59\xdf\x1c\x53\xd7\xe6\x39\xb6\x8a\x32\x6d\x21\x60\
+\x5f\xd8\x42\x7d\xdb\x3c\xb5\xf9\x82\xfe\x29\x10\x70\xfc\x97\x04\
+\x16\xcc\x49\xd2\x05\x09\x28\xea\xa5\x80\x00\xc0\xa5\x89\x39\x8d\
+\x0a\xc4\x49\x7f\x44\x8e\xe3\x4f\xf7\x39\xe9\x6f\x74\x23\x50\x6d\
+\x02\x04\x08\x10\x20\x40\xa0\x7c\x81\x14\x0c\x88\x8b\x38\x31\xae\
+\x8b\xa9\xfc\x0a\xa9\xc1\x44\x01\xab\x5d\x11\x10\x00\xb8\x82\x62\
+\x56\x5b\x02\x71\xe2\xdf\x9f\xf4\x47\xe4\xd8\x9f\xee\x5b\xaf\xfd\
+\x7d\x1b\xf2\x7a\xd6\xb9\xe5\xa4\xed\x73\x6b\x11\xe5\x59\x5b\xc0\
+\x3e\xb0\xb6\x78\x3e\xf9\x69\xfb\x15\xdb\x22\x05\x02\x62\x6c\xd7\
+\x07\x03\x56\xcc\x59\x56\x59\x08\x28\xc4\x35\x01\x01\x80\x6b\x2a\
+\xe6\x35\x21\x70\x7c\xe2\xef\xa4\x7f\x9b\x26\x3f\xec\xf7\xbf\x6f\
+\x93\xb3\x5c\x09\x10\x20\xb0\xad\x80\xfe\x6f\x5b\x7f\xb9\x37\x28\
+\x90\x82\x01\x02\x01\x8d\xb5\xbb\xea\x5e\x15\x10\x00\xb8\xca\x62\
+\x66\xcd\x02\x4e\xfc\x6b\x6e\x5d\x75\x2b\x45\xc0\xc9\x4f\x29\x2d\
+\xa5\x9c\x04\x08\xcc\x2d\xa0\xff\x9b\x5b\x74\x64\x7a\x47\x81\x00\
+\x8f\x07\x8c\xb4\x2b\x6c\x71\xc5\xbd\x2e\x20\x00\x70\xdd\xc5\xdc\
+\x0a\x05\x9c\xf8\x57\xd8\xa8\xaa\x54\xac\x80\x6f\x3f\x2f\xb6\xe9\
+\x14\x9c\x00\x81\x27\x05\xf4\x7f\x4f\x02\xce\xb5\x7a\x0a\x04\x74\
+\x8f\x07\xfc\xe3\xcf\xbf\x08\x04\xcc\x85\x9a\x55\x3a\x0a\x73\x43\
+\x40\x00\xe0\x06\x8c\xd9\xf5\x08\x44\xa7\x1e\xb7\x7c\xf9\x62\xbf\
+\xfc\xda\xd4\x20\x28\xbf\x36\x51\x22\x02\x04\xd6\x11\xd0\xff\xad\
+\xe3\x2c\x17\x02\x0f\x05\xfa\x40\xc0\xcf\x3f\x1c\x62\xcc\xf8\x70\
+\x79\x0b\x14\x22\xa0\x98\xb7\x04\x04\x00\x6e\xc9\x98\x5f\xbc\x40\
+\x74\xe2\x71\xe2\x1f\xd1\xdd\xe2\x2b\xa3\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\xcb\x0a\xa4\x60\x40\x8c\x1d\x63\x0c\xb9\x6c\x46\
+\x52\x5f\x5c\x40\x06\x37\x05\x04\x00\x6e\xd2\xf8\xa0\x54\x81\xe8\
+\xb4\xa3\xf3\x76\xe2\x5f\x6a\x0b\x2a\x37\x01\x02\x04\x08\x10\x20\
+\x40\x60\x43\x01\x81\x80\x0d\xf1\xe7\xc9\x5a\x2a\xb7\x05\x04\x00\
+\x6e\xdb\xf8\xa4\x30\x81\x78\xc6\xdf\x89\x7f\x61\x8d\xa6\xb8\x04\
+\x08\x10\x20\x40\x80\x00\x81\x5c\x05\x04\x02\x72\x6d\x99\x47\xe5\
+\xf2\xf9\x1d\x01\x01\x80\x3b\x38\x3e\x2a\x43\x20\x4e\xfc\xff\xfa\
+\xf3\x0f\xbf\xc5\x33\xfe\x65\x94\x58\x29\x7b\x81\x7f\xfd\xdf\xff\
+\xbe\xf7\xaf\xfd\x6e\x4b\x40\xdb\xb7\xd5\xde\x6a\x7b\x29\x60\x1f\
+\xb8\x34\x69\x65\x8e\xb6\x2f\xb0\xa5\x23\x10\xe0\xcb\x02\x0b\x6a\
+\x38\x45\xbd\x27\x20\x00\x70\x4f\xc7\x67\x59\x0b\x1c\x9f\xf8\x1f\
+\x76\xbb\x2f\x3b\xff\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\
+\x21\x90\x82\x00\xf1\x78\x69\xf7\xa8\x69\x0a\x06\x2c\x91\x85\x34\
+\x67\x12\x90\xcc\x5d\x01\x01\x80\xbb\x3c\x3e\xcc\x51\xc0\x89\x7f\
+\x8e\xad\xa2\x4c\x04\x08\x10\x20\x40\x80\x00\x81\x06\x04\x8e\x02\
+\x01\x0d\xd4\xb6\xc8\x2a\x2a\xf4\x7d\x01\x01\x80\xfb\x3e\x3e\xcd\
+\x4c\x20\xa2\xae\x71\xab\xbf\x2b\xfe\x99\x35\x8c\xe2\x10\x20\x40\
+\x80\x00\x01\x02\x04\x5a\x12\x48\x81\x80\xf8\xee\xa9\x18\x9b\xb6\
+\x54\xed\x02\xea\xaa\x88\x0f\x04\x04\x00\x1e\x00\xf9\x38\x0f\x81\
+\xb8\xea\x1f\x9d\x6c\xdc\x7a\x95\x47\x89\x94\x82\x00\x01\x02\x04\
+\x08\x10\x20\x40\xa0\x79\x01\x81\x80\xcc\x36\x01\xc5\x79\x24\x20\
+\x00\xf0\x48\xc8\xe7\x9b\x0a\xc4\x89\xbf\x2f\xf8\xdb\xb4\x09\x64\
+\x4e\x80\x00\x01\x02\x04\x08\x10\x20\xf0\x48\x20\x02\x01\xbe\x1b\
+\xe0\x91\xd2\xf2\x9f\xcb\xe1\xa1\x80\x00\xc0\x43\x22\x0b\x6c\x25\
+\x10\xb7\x54\xb9\xdd\x7f\x2b\x7d\xf9\x12\x20\x40\x80\x00\x01\x02\
+\x04\x08\x8c\x12\x88\x20\xc0\xcf\x3f\x1c\x62\x0c\x3b\x6a\x3d\x0b\
+\xcf\x26\x20\xa1\xc7\x02\x02\x00\x8f\x8d\x2c\xb1\xb2\x40\x5c\xf5\
+\x77\xbb\xff\xca\xe8\xb2\x23\x40\x80\x00\x01\x02\x04\x08\x10\x98\
+\x47\x40\x20\x60\x1e\xc7\xf1\xa9\x58\x63\x80\x80\x00\xc0\x00\x24\
+\x8b\xac\x23\x10\x27\xfe\x6e\xf7\x5f\xc7\x5a\x2e\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x0b\x0b\x44\x20\xc0\x63\x01\x0b\x23\x1f\x27\
+\xef\xf5\x10\x01\x01\x80\x21\x4a\x96\x59\x5c\x20\x6e\x95\x72\xbb\
+\xff\xe2\xcc\x32\x20\x40\x80\x00\x01\x02\x04\x08\x10\x58\x53\x20\
+\x82\x00\x1e\x0b\x58\x47\x5c\x2e\x83\x04\x04\x00\x06\x31\x59\x68\
+\x49\x81\xb8\xea\xef\xdb\xfd\x97\x14\x96\x36\x01\x02\x04\x08\x10\
+\x20\x40\x80\xc0\xa6\x02\x11\x08\x70\x37\xc0\xa2\x4d\x20\xf1\x61\
+\x02\x02\x00\xc3\x9c\x2c\xb5\x80\x40\xdc\xf2\x1f\xcf\xfa\x1f\x76\
+\xbb\x2f\x3b\xff\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xd4\x2c\
+\x10\x41\x00\x77\x03\x2c\xd5\xc2\xd2\x1d\x28\x20\x00\x30\x10\xca\
+\x62\xf3\x0a\xf4\xb7\xfc\xcf\x9b\xaa\xd4\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x64\x2e\x10\x81\x00\x77\x03\xcc\xdc\x48\x92\x1b\
+\x2a\x20\x00\x30\x54\xca\x72\xb3\x08\xc4\x55\x7f\xb7\xfc\xcf\x42\
+\x29\x11\x02\x04\x08\x10\x20\x40\x80\x00\x81\x52\x05\x22\x08\xe0\
+\x6e\x80\xf9\x5a\x4f\x4a\x83\x05\x04\x00\x06\x53\x59\xf0\x59\x81\
+\xfe\xaa\xbf\x5b\xfe\x9f\x95\xb4\x3e\x01\x02\x04\x08\x10\x20\x40\
+\x80\x40\x15\x02\x11\x08\x70\x37\xc0\xd3\x4d\x29\x81\xe1\x02\x02\
+\x00\xc3\xad\x2c\x39\x51\xc0\x55\xff\x89\x70\x56\x23\x40\x80\x00\
+\x01\x02\x04\x08\x10\xa8\x5f\x20\x82\x00\x3f\xff\x70\x88\x31\x73\
+\xfd\x95\x5d\xa4\x86\x12\x1d\x21\x20\x00\x30\x02\xcb\xa2\xe3\x05\
+\xa2\x23\xf3\xe7\xfd\xc6\xbb\x59\x83\x00\x01\x02\x04\x08\x10\x20\
+\x40\xa0\x2d\x81\x18\x33\xc7\x1d\xb3\x6d\xd5\x7a\x8e\xda\x4a\x63\
+\x8c\x80\x00\xc0\x18\x2d\xcb\x8e\x12\x88\x0e\x2c\x3a\xb2\x51\x2b\
+\x59\x98\x00\x01\x02\x04\x08\x10\x20\x40\x80\x40\xab\x02\x71\x37\
+\x80\x47\x02\xc6\xb5\xbe\xa5\x47\x09\x08\x00\x8c\xe2\xb2\xf0\x50\
+\x01\x5f\xf4\x37\x54\xca\x72\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x8e\x04\x52\x10\x20\xc6\xd2\x71\x27\xed\xd1\x5c\x2f\x6f\x08\
+\x9a\xe2\xca\x05\x00\x00\x10\x00\x49\x44\x41\x54\x98\x3d\x4e\x40\
+\x00\x60\x9c\x97\xa5\x1f\x08\x44\x47\x15\x1d\x96\x2f\xfa\x7b\x00\
+\xe5\x63\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x37\x04\x62\x2c\
+\x1d\x77\xd2\xc6\x1d\xb5\x37\x16\x31\xfb\x4d\xc0\xcf\x91\x02\x02\
+\x00\x23\xc1\x2c\x7e\x5b\x20\x3a\xa8\xe8\xa8\xa2\xc3\xba\xbd\x94\
+\x4f\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x18\x24\x70\x38\
+\x7c\x8d\x31\xf6\xa0\x65\x9b\x5c\x48\xa5\xc7\x0a\x08\x00\x8c\x15\
+\xb3\xfc\x55\x81\xae\x63\x4a\x1d\xd4\xd5\x0f\xcd\x24\x40\x80\x00\
+\x01\x02\x04\x08\x10\x20\x40\x60\x9a\x40\x1a\x63\xc7\x1d\xb6\xd3\
+\x56\xae\x7c\x2d\xd5\x1b\x2d\x20\x00\x30\x9a\xcc\x0a\xe7\x02\x5d\
+\x87\x94\x3a\xa6\xf3\xf9\xde\x13\x20\x40\x80\x00\x01\x02\x04\x08\
+\x10\x20\xf0\xbc\x40\xdc\x61\xfb\x17\x7f\x2a\xf0\x02\xd2\x8c\xf1\
+\x02\x02\x00\xe3\xcd\xac\x71\x24\x10\x27\xff\xd1\x21\x1d\xcd\xf2\
+\x92\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x05\x04\xe2\x71\
+\xdb\xee\xce\xdb\x05\xd2\x2e\x30\x49\x45\x9e\x20\x20\x00\x30\x01\
+\xcd\x2a\xbb\x5d\x7c\xd9\x5f\x44\x21\x9d\xfc\xdb\x1a\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x08\xac\x28\x70\xf0\xbd\x00\x6f\xda\x7e\
+\x4e\x11\x10\x00\x98\xa2\xd6\xf8\x3a\x71\xf2\x1f\xd1\xc7\xc6\x19\
+\x54\x9f\x00\x01\x02\x04\x08\x10\x20\x40\x80\xc0\x36\x02\x82\x00\
+\xbb\xdd\x36\xf2\xc5\xe7\x2a\x00\x50\x7c\x13\xae\x5b\x81\xb8\xe5\
+\xc8\xc9\xff\xba\xe6\x72\x23\x40\x80\x00\x01\x02\x04\x08\x10\x20\
+\x70\x21\xd0\x78\x10\xe0\xc2\xc3\x8c\x41\x02\x02\x00\x83\x98\x2c\
+\x14\x02\x71\xf2\xbf\x4b\x1d\x4d\xbc\x36\x11\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x20\xb0\xb1\x40\x1a\x9b\xc7\x77\x72\x6d\x5c\x8a\
+\x2d\xb2\x97\xe7\x44\x01\x01\x80\x89\x70\xad\xad\xe6\xe4\xbf\xb5\
+\x16\x57\x5f\x02\x04\x08\x10\x20\x40\x80\x00\x81\x12\x04\xe2\x3b\
+\xb9\xe2\xbb\xb9\xe2\x31\xdd\x12\xca\x3b\x4f\x19\xa5\x32\x55\x40\
+\x00\x60\xaa\x5c\x43\xeb\x39\xf9\x6f\xa8\xb1\x55\x95\x00\x01\x02\
+\x04\x08\x10\x20\x40\xa0\x48\x81\x78\x4c\xb7\x99\x20\x40\x91\x2d\
+\x94\x47\xa1\x05\x00\xf2\x68\x87\x6c\x4b\xe1\xe4\x3f\xdb\xa6\x51\
+\x30\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x27\x02\x11\x04\xe8\
+\xc6\xef\x27\x73\xeb\x7b\xa3\x46\xd3\x05\x04\x00\xa6\xdb\x55\xbf\
+\x66\xd7\x79\x1c\x0e\x5f\xab\xaf\xa8\x0a\x12\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\xa8\x45\x20\x8d\xdf\xbb\x71\x7c\x2d\xf5\xb9\xac\
+\x87\x39\x4f\x08\x08\x00\x3c\x81\x57\xf3\xaa\x5d\xa7\x91\x3a\x8f\
+\x9a\xeb\xa8\x6e\xcb\x0a\xec\x77\xbb\xef\xfd\xb4\xdb\xef\xbf\xc5\
+\xf4\x72\x38\xfc\xd4\x4f\xff\xf9\xf5\x8f\xf4\xf1\xce\x3f\x02\x04\
+\x08\x10\x20\xd0\x9c\x40\x1c\x03\xfb\xe3\x61\x1c\x1f\xfb\x29\x1d\
+\x18\xbb\x63\x67\x73\x20\x2a\x3c\xbf\x40\x1a\xc7\x77\xe3\xf9\xf9\
+\x53\xce\x20\x45\x45\x78\x46\x40\x00\xe0\x19\xbd\x4a\xd7\xed\x3a\
+\x8b\xd4\x69\x54\x5a\x3d\xd5\x9a\x41\xa0\x1f\xa0\xc4\xef\x18\xb4\
+\xf4\x83\x98\xf8\x1d\x83\x9a\x98\xfe\xfd\xeb\x1f\x3f\xf5\xd3\x7f\
+\xfe\xf9\xdf\x5f\x62\xfa\xd7\xff\xfd\xef\x7b\x3f\xcd\x50\x0c\x49\
+\x10\x20\x40\x80\x00\x81\x62\x05\xfa\xe3\x61\x1c\x1f\xfb\xe9\xe3\
+\xb8\x99\x82\xe4\x71\x2c\x8d\x29\x8e\xad\x31\xc5\xf1\xb6\x9f\xe2\
+\xf8\x1b\x53\xb1\x95\x57\xf0\x75\x04\xd2\x78\xbe\x1b\xd7\xaf\x93\
+\xdb\x7a\xb9\xc8\xe9\x29\x01\x01\x80\xa7\xf8\xea\x5b\xb9\xeb\x24\
+\x52\x67\x51\x5f\xcd\xd4\x68\x88\x40\x0c\x26\xfa\xa9\x1f\x64\xc4\
+\xa0\xa3\x9f\x62\x20\x12\x53\x3f\x40\x89\xdf\x31\x68\xe9\x07\x31\
+\xf1\x7b\x48\x3e\x96\x21\x40\x80\x00\x01\x02\x04\x86\x09\xc4\xb1\
+\x35\xa6\x38\xde\xf6\x53\x1c\x7f\x63\x8a\x63\x72\x3f\xf5\xc7\xea\
+\xfe\xf8\x1d\xbf\x3f\x8e\xe9\xc3\xb2\xb2\x54\x8d\x02\x69\x5c\xdf\
+\x8d\xef\x2b\xaa\x9b\xaa\x3c\x27\x20\x00\xf0\x9c\x5f\x55\x6b\x77\
+\x9d\x43\xea\x24\xaa\xaa\x94\xca\x9c\x08\xf4\x03\x81\xf8\x1d\x03\
+\x83\x7e\xb0\xd0\x0f\x1e\x62\x30\xd1\x4f\xfd\x20\x23\x06\x1d\xfd\
+\x74\x92\x98\x37\x04\x9e\x14\xe8\xb7\x3b\xbf\xff\xd8\x33\x68\xcf\
+\xe0\xc9\xdd\xc7\xea\x04\x2e\x04\xfa\x63\x75\x7f\xfc\x8e\xdf\x1f\
+\xc7\xf4\xf7\x3b\x0a\xe2\xb8\x1f\xc7\xff\x7e\xea\xc6\x03\x17\x29\
+\x99\x51\x9d\x40\x1a\xdf\x77\xe3\xfc\x3a\x2a\xa6\x16\x4f\x0a\x08\
+\x00\x3c\x09\x58\xcb\xea\x5d\xa7\x90\x3a\x87\x5a\xea\xa3\x1e\xbb\
+\x5d\x77\x50\xdf\xef\xbf\xc5\xc1\x3e\xa6\x38\xc1\xe8\x07\x02\xf1\
+\x3b\x06\x06\xfd\x60\x61\xe7\x1f\x01\x02\x04\x08\x10\x20\x50\xbd\
+\x40\x1c\xf7\xe3\xf8\xdf\x4f\xdd\x78\xe0\x5a\x70\xa0\x7a\x89\x06\
+\x2b\x98\xc6\xf9\xdd\x78\xbf\xf8\xaa\xab\xc0\xb3\x02\x02\x00\xcf\
+\x0a\x56\xb0\x7e\xd7\x19\xa4\x4e\xa1\x82\xaa\x34\x5b\x85\x38\xd9\
+\x8f\x29\x4e\xf4\x63\xea\x4f\xf6\xe3\x00\x1f\x07\xfb\x98\x9a\xc5\
+\x51\x71\x02\x04\x08\x10\x20\x40\xe0\xa1\x40\x8c\x15\x62\xdc\xd0\
+\x4d\x67\x41\x81\x18\x63\x3c\x4c\xc0\x02\xf9\x0b\xa4\xf1\x7e\x37\
+\xee\xcf\xbf\xa4\xb7\x4b\xe8\x93\xa7\x05\x04\x00\x9e\x26\x2c\x3b\
+\x81\xae\x13\x48\x9d\x41\xd9\xb5\x68\xaf\xf4\xdd\x81\xf8\xfd\xea\
+\x7e\x7f\xb2\x1f\x51\xfc\x38\x78\xc7\xd4\x9e\x88\x1a\x13\x20\x40\
+\x80\x00\x01\x02\x73\x0b\xc4\x98\x22\x02\x02\x31\xc6\x88\xf1\x46\
+\x5c\x64\xd8\xa5\xf1\x47\x37\x0e\x99\x3b\x33\xe9\xad\x23\x90\xc6\
+\xfd\xdd\xf8\x7f\x9d\xdc\x66\xcf\x45\x82\xcf\x0b\x08\x00\x3c\x6f\
+\x58\x6c\x0a\xdd\xce\x9f\x3a\x81\x62\x2b\xd0\x50\xc1\xe3\x40\x1b\
+\x53\x1c\x78\xe3\x00\xdc\x1d\x88\xff\xf9\xdf\x5f\xe2\xc0\xdc\x10\
+\x83\xaa\x12\x20\x40\x80\x00\x01\x02\x1b\x0a\xc4\xb8\xe3\x38\x20\
+\x10\xc1\x80\x6e\xda\xb0\x4c\xb2\x9e\x20\x90\xc6\xff\x7f\xfb\xfb\
+\x9f\xbe\x4c\x58\x73\xeb\x55\xe4\x3f\x83\x80\x00\xc0\x0c\x88\x25\
+\x26\xe1\xe4\x3f\xff\x56\xeb\x4f\xf8\xe3\xa4\x3f\x4e\xf8\x63\x8a\
+\x03\x6f\xfe\x25\x57\x42\x02\x04\x08\x10\x20\x40\xa0\x05\x81\x08\
+\x06\x74\xd3\xaf\x7f\xec\x63\xbc\x22\x18\x50\x4e\xab\xbf\xee\xf7\
+\xbf\x95\x17\x04\x28\xc7\x37\xe7\x92\x0a\x00\xe4\xdc\x3a\x0b\x95\
+\xad\xdb\xd9\x53\xe4\x6f\xa1\xe4\x25\xfb\x84\xc0\xf9\x49\x7f\x9c\
+\xf0\xc7\xf4\x44\x92\x56\x25\x40\x80\x00\x01\x02\x04\x08\x2c\x2e\
+\x10\xe3\x95\x3e\x18\xd0\x05\x02\xf6\xfb\x6f\x8b\x67\x2a\x83\xa7\
+\x04\x8a\x0b\x02\x3c\x55\x5b\x2b\xf7\x02\x02\x00\xbd\x44\x23\xbf\
+\xe3\xe4\x3f\x76\xf6\x46\xaa\x5b\x44\x35\xe3\xa4\x3f\xa6\x88\x9c\
+\xf7\x57\xf9\xe3\x20\x5a\x44\xe1\x15\x92\x00\x01\x02\x04\x08\x10\
+\x20\x70\x26\xd0\x05\x02\xfe\xf9\xdf\x5f\xe2\xb1\x45\xc1\x80\x33\
+\x9c\xcc\xde\xc6\x79\x41\x9c\x1f\x64\x56\xac\xab\xc5\x31\x73\x1e\
+\x01\x01\x80\x79\x1c\x8b\x49\x25\x76\xf2\x62\x0a\x5b\x79\x41\x8f\
+\x4f\xfa\xfb\x13\xff\xca\xab\xac\x7a\x04\x08\x10\x20\x40\x80\x40\
+\x63\x02\x17\xc1\x80\xc6\xea\x5f\x42\x75\x0f\xfb\xfd\xd7\x02\xca\
+\xa9\x88\x33\x09\x08\x00\xcc\x04\x59\x42\x32\x7f\xfd\xf9\x87\xdf\
+\x4a\x28\x67\xcd\x65\x8c\x93\xfe\x88\x84\x47\x44\xdc\x49\x7f\xcd\
+\x2d\xad\x6e\x04\x08\x10\x20\x40\x80\xc0\xb9\x40\x17\x0c\xf8\xf5\
+\x8f\x7d\x8c\x85\xba\xe9\x7c\x01\xef\x37\x11\x38\xec\x76\x5f\xf2\
+\x3f\x4f\xd8\x84\xa6\xca\x4c\x05\x00\xaa\x6c\xd6\xcb\x4a\xc5\x97\
+\xfe\xc5\xce\x7d\xf9\x89\x39\x6b\x08\xec\x77\xbb\xef\xfd\x2d\xfe\
+\x71\xf0\x5b\x23\x4f\x79\x10\x20\x40\x80\x00\x01\x02\x04\x72\x14\
+\x88\xb1\x50\x4c\x5d\x10\xc0\x77\x05\x64\xd1\x44\x71\x9e\x90\x75\
+\x10\x20\x0b\xa5\x3a\x0a\x21\x00\x50\x47\x3b\xde\xad\x45\x9c\xfc\
+\xef\x7c\xe9\xdf\x5d\xa3\xa5\x3e\xdc\x1f\x9d\xf8\x7b\xae\x7f\x29\
+\x65\xe9\x12\x20\x40\x80\x00\x01\x02\x25\x0a\x44\x10\xa0\x9b\xfa\
+\xbb\x02\x4a\xac\x44\x45\x65\x8e\x20\x40\x77\xde\x90\x61\x9d\x14\
+\x69\x3e\x01\x01\x80\xf9\x2c\xb3\x4c\xa9\xdb\x89\x9d\xfc\xaf\xde\
+\x36\x4e\xfc\x57\x27\x97\x21\x01\x02\x04\x08\x10\x20\x50\xb0\x80\
+\x40\x40\x26\x8d\x97\xce\x1b\xba\xf3\x87\x4c\x8a\xf3\x5e\x0c\xbf\
+\x66\x14\x10\x00\x98\x11\x33\xb7\xa4\xba\x6f\xf4\x4c\x3b\x71\x6e\
+\xe5\xaa\xb9\x3c\x4e\xfc\x6b\x6e\x5d\x75\x23\x40\x80\x00\x01\x02\
+\x04\x96\x16\x10\x08\x58\x5a\x78\x40\xfa\xe9\xfc\xa1\x3b\x8f\x18\
+\xb0\xe8\x3a\x8b\xc8\x65\x4e\x01\x01\x80\x39\x35\x33\x4b\xcb\x37\
+\x7a\xae\xd7\x20\x4e\xfc\xd7\xb3\x96\x13\x01\x02\x04\x08\x10\x20\
+\x50\xbf\x80\x40\xc0\xb6\x6d\x9c\xd5\x5f\x0e\xdb\x96\xa2\xba\xdc\
+\x05\x00\xaa\x6b\xd2\xb7\x0a\xc5\xad\x3b\xf1\x1c\xcf\xdb\x3b\x3f\
+\x97\x12\x70\xe2\xbf\x94\xac\x74\x09\x10\x20\x40\x80\x00\x01\x02\
+\xbb\x5d\x04\x02\x7c\x59\xe0\x36\x5b\x42\x2e\x5f\x0a\xb8\x4d\xed\
+\xeb\xcd\x55\x00\xa0\xc2\xb6\x8d\x93\x7f\x5f\xfa\xb7\x7c\xc3\xf6\
+\xdf\xea\xef\xcb\xfd\x96\xb7\x96\x03\x01\x02\x04\x08\x10\x20\xd0\
+\xae\x40\x04\x01\x62\xea\x02\x01\xed\x32\xac\x5e\xf3\xb8\x98\xd8\
+\x9d\x57\xac\x9e\xf3\x49\x86\xde\xcc\x2c\x20\x00\x30\x33\xe8\xd6\
+\xc9\x75\xcf\xeb\x1c\x0e\x5f\xb7\x2e\x47\xd5\xf9\xef\xf7\xdf\xfe\
+\xf3\xeb\x1f\x7b\x27\xfe\x55\xb7\xb2\xca\x11\x20\x40\x80\x00\x01\
+\x02\x99\x09\x44\x10\x20\xc6\x60\x02\x01\x2b\x36\x4c\x3a\xaf\xd8\
+\x36\x08\xb0\x62\x5d\x1b\xc9\x4a\x00\xa0\xb2\x86\xf6\xbc\xce\x72\
+\x0d\xda\xdf\xee\x1f\x07\x9f\xe5\x72\x91\x32\x01\x02\x04\x08\x10\
+\x20\x40\x80\xc0\x3d\x81\x18\x8b\xc5\x9d\x98\x31\x36\xbb\xb7\x9c\
+\xcf\x66\x12\x48\x41\x80\xee\x22\xe3\x4c\xc9\x8d\x4a\xc6\xc2\xb3\
+\x0b\x08\x00\xcc\x4e\xba\x5d\x82\xa2\x73\x0b\xda\xa7\xab\xfe\xff\
+\xfe\xf5\x8f\x9f\x5c\xf5\x5f\xd0\x58\xd2\x04\x08\x10\x20\x40\x80\
+\x00\x81\x81\x02\x31\x26\x8b\xb1\x99\xbb\x01\x06\x82\x3d\xb9\xd8\
+\x56\x17\x19\x9f\x2c\xb6\xd5\xaf\x08\x08\x00\x5c\x41\x29\x71\x56\
+\x77\xf2\x9f\xa2\x73\x25\x96\x3d\xe7\x32\x47\x64\x39\x22\xcc\x11\
+\x69\xce\xb9\x9c\xca\x46\x80\x00\x01\x02\x04\x08\x10\x68\x51\x20\
+\xc6\x68\x1e\x0b\x58\xa7\xe5\x37\xf8\x52\xc0\x75\x2a\xd6\x58\x2e\
+\x02\x00\x15\x34\x78\x77\x4b\x8e\x93\xff\xf9\x5b\xd2\x55\xff\xf9\
+\x4d\xa5\x48\x80\x00\x01\x02\x04\x08\x10\x58\x40\x20\x02\x01\xee\
+\x06\x58\x00\xf6\x28\xc9\xf5\xbf\x14\xf0\x28\x73\x2f\x67\x13\x10\
+\x00\x98\x8d\x72\xbb\x84\x0e\xfb\xbd\x2f\xfd\x9b\x91\xdf\x55\xff\
+\x19\x31\x25\x45\x80\x00\x01\x02\x04\x08\x10\x58\x49\x20\x82\x00\
+\xee\x06\x58\x18\x3b\x5d\x74\xec\x2e\x3e\x2e\x9c\x4d\x97\xbc\x1f\
+\x8b\x08\x08\x00\x2c\xc2\xba\x5e\xa2\x71\xeb\x7f\x44\xe3\xd6\xcb\
+\xb1\xf2\x9c\x5c\xf5\xaf\xbc\x81\x55\x8f\x00\x01\x02\x04\x08\x10\
+\xa8\x5d\x20\x02\x01\xee\x06\x58\xae\x95\xd7\xba\xf8\xb8\x5c\x0d\
+\xda\x4e\x59\x00\xa0\xe0\xf6\xef\xa2\x6f\x29\x0a\x57\x70\x15\xb2\
+\x2a\xba\x67\xfd\xb3\x6a\x0e\x85\x21\x40\x80\x00\x01\x02\x04\x08\
+\x4c\x16\x88\x20\x40\x8c\xed\x26\x27\x60\xc5\x9b\x02\x71\xf1\x31\
+\x2e\x42\xde\x5c\x60\x9e\x0f\xa4\xb2\x90\x80\x00\xc0\x42\xb0\x6b\
+\x24\x2b\xfa\x36\x8f\x72\x7f\xcb\x7f\x7c\x9b\xec\x3c\x29\x4a\x85\
+\x00\x01\x02\x04\x08\x10\x20\x40\x60\x6b\x81\x18\xdb\x79\x24\x60\
+\xa1\x56\x48\x17\x21\xbb\x8b\x91\x0b\x25\xbf\xdb\x49\x78\x29\x01\
+\x01\x80\xa5\x64\x17\x4e\x37\xa2\x6e\x11\x7d\x5b\x38\x9b\xfa\x93\
+\x77\xcb\x7f\xfd\x6d\xac\x86\x04\x08\x10\x20\x40\x80\x40\xd3\x02\
+\x71\x37\x80\x47\x02\xe6\xdf\x04\x16\xfd\xd3\x80\xf3\x17\x57\x8a\
+\xef\x02\x02\x00\xef\x10\x25\xfd\xea\xa2\x6d\x29\xea\x56\x52\x99\
+\xb3\x2c\x6b\x3a\xf9\xef\x0e\x08\x59\x16\x4e\xa1\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\xe6\x12\x88\x31\x9f\x47\x02\xe6\xd2\xfc\x4c\
+\x67\xa9\x3f\x0d\xf8\x99\x83\x57\x73\x0b\x08\x00\xcc\x2d\xba\x42\
+\x7a\x6e\xfd\x9f\x01\xd9\xc9\xff\x0c\x88\x92\x20\x40\x80\x00\x01\
+\x02\x04\x08\x94\x23\xd0\x3f\x12\x10\x8f\x7f\x96\x53\xea\xbc\x4b\
+\x1a\x77\x24\x77\x17\x27\xe7\x2d\xa6\xd4\x16\x14\x10\x00\x58\x10\
+\x77\x89\xa4\xdd\xfa\xff\xbc\x6a\x44\x7f\x23\x0a\xfc\x7c\x4a\x52\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x28\x4d\xe0\xdf\xbf\xfe\xf1\
+\x93\x47\x02\xe6\x6b\xb5\xf9\x1f\x05\x98\xaf\x6c\x52\xba\x14\x10\
+\x00\xb8\x34\xc9\x76\x4e\x17\x5d\x73\xeb\xff\xe4\xf6\x89\x68\x6f\
+\x7c\x11\x4c\x44\x7f\x27\x27\x62\x45\x02\x04\x08\x10\x20\x40\x80\
+\x00\x81\xe2\x05\xba\x8b\x41\xfb\xfd\xb7\xe2\x2b\x92\x49\x05\xe2\
+\x22\xe5\x6c\x45\x91\xd0\xa2\x02\x02\x00\x8b\xf2\xce\x9b\xf8\xeb\
+\xcb\xcb\x97\x79\x53\x6c\x27\xb5\x38\xf9\xef\xa2\xbd\xed\x54\x59\
+\x4d\x09\x10\x20\x40\x80\x00\x01\x02\x04\xee\x08\x08\x02\xdc\xc1\
+\x19\xfb\x51\xba\x48\xd9\x5d\xac\x1c\xbb\xde\x95\xe5\xcd\x5a\x56\
+\xe0\x65\xd9\xe4\xa5\x3e\x97\x40\x17\x55\x4b\x3b\xd6\x5c\xe9\xb5\
+\x94\x8e\x93\xff\x96\x5a\x5b\x5d\x09\x10\x20\x40\x80\x00\x01\x02\
+\xc3\x05\x22\x08\x10\x8f\x87\x0e\x5f\xc3\x92\xb7\x04\x66\xfa\x9e\
+\xb2\x5b\xc9\x9b\x3f\x93\x80\x00\xc0\x4c\x90\x8b\x27\xe3\xe4\x7f\
+\x1a\xf1\x7e\xff\xcd\x95\xff\x69\x74\xd6\x22\x40\x80\x00\x01\x02\
+\x04\x08\xb4\x20\x10\x8f\x87\x0a\x02\x3c\xdf\xd2\xf1\x85\x80\xdd\
+\x45\xcb\xa7\x92\xb2\xf2\xd2\x02\x02\x00\x4b\x0b\xcf\x90\xbe\x1d\
+\x69\x22\x62\x3a\xf9\x8f\xa8\xee\xc4\xb5\xad\x46\x80\x00\x01\x02\
+\x04\x08\x10\x20\xd0\x88\x80\x20\xc0\x4c\x0d\x9d\x2e\x5a\x3e\xf5\
+\x28\xc0\x4c\xc5\x90\xcc\x6d\x01\x01\x80\xdb\x36\xf9\x7c\x92\x76\
+\xa4\x7c\x0a\x53\x48\x49\x9c\xfc\x17\xd2\x50\x8a\x49\x80\x00\x01\
+\x02\x04\x08\x10\xc8\x43\x20\x82\x00\xf1\x85\xd1\xf1\xf8\x68\x1e\
+\x25\x2a\xb3\x14\xcf\x3c\x0a\x50\x66\x8d\xcb\x2a\xb5\x00\x40\xe6\
+\xed\xe5\xea\xff\x84\x06\x72\xf2\x3f\x01\xcd\x2a\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x21\x10\x8f\x8f\x0a\x02\x84\xc4\xb4\x29\x1e\
+\x05\x98\x78\x17\xc0\xb4\x0c\xad\x35\x4a\x40\x00\x60\x14\xd7\xba\
+\x0b\x77\x3b\x8e\xab\xff\xe3\xd0\x9d\xfc\x8f\xf3\xb2\x34\x01\x02\
+\x04\x08\x10\x20\x40\x80\xc0\x85\x80\x20\xc0\x05\xc9\xa8\x19\xd3\
+\xee\x02\x18\x95\x85\x85\x27\x0a\x08\x00\x4c\x84\x5b\x63\x35\x7f\
+\xf6\x6f\xa4\xb2\x93\xff\x91\x60\x16\x27\x40\x80\x00\x01\x02\x04\
+\x08\x10\xb8\x25\x20\x08\x70\x4b\xe6\xf1\xfc\xb8\x0b\x60\xf4\x9d\
+\xcc\x8f\x93\xb5\xc4\x0c\x02\x02\x00\x33\x20\x2e\x91\x44\xb7\xc3\
+\xb8\xfa\x3f\x98\x36\x6e\xd3\xf2\x85\x7f\x83\xb9\x2c\x48\x80\x00\
+\x01\x02\x04\x08\x10\x20\x30\x40\x40\x10\x60\x00\xd2\xad\x45\x46\
+\x9e\xcb\xdc\x4a\xc6\xfc\x79\x05\x04\x00\xe6\xf5\x9c\x2f\x35\x3b\
+\xcc\x28\xcb\xe8\x9c\x47\xad\x60\x61\x02\x04\x08\x10\x20\x40\x80\
+\x00\x01\x02\x03\x04\x62\x9c\x19\x17\x9b\x06\x2c\x6a\x91\x33\x81\
+\xee\xa2\xe6\xd9\xbc\x1b\x6f\xcd\x5e\x49\x40\x00\x60\x25\xe8\x31\
+\xd9\xd8\x51\xc6\x68\xed\x76\x2f\x87\xc3\x4f\xe3\xd6\xb0\x34\x01\
+\x02\x04\x08\x10\x20\x40\x80\x00\x81\xe1\x02\x11\x04\x18\xbe\xb4\
+\x25\x3f\x04\x06\x5f\xd4\xfc\x58\xc3\x8b\x85\x05\x04\x00\x16\x06\
+\x9e\x94\xbc\x1d\x65\x30\x5b\x9c\xfc\xc7\x9f\x6c\x19\xbc\x82\x05\
+\x09\x10\x20\x40\x80\x00\x01\x02\x04\x08\x4c\x10\x88\x71\xe7\x84\
+\xd5\x9a\x5f\xe5\xaf\x3f\xff\xf0\xdb\x43\x04\x0b\xac\x26\x20\x00\
+\xb0\x1a\xf5\xb0\x8c\x5c\xfd\x1f\xe6\xd4\x2d\xb5\xdf\x7f\x73\xf2\
+\xdf\x49\xf8\x41\x80\x00\x01\x02\x04\x08\x10\x20\xb0\xb0\x40\x8c\
+\x3b\x05\x01\xc6\x23\xc7\x17\x02\x76\x7f\xdd\xec\xce\xaa\x3e\x5a\
+\x4f\x40\x00\x60\x3d\xeb\x61\x39\xb9\xfa\x3f\xcc\x29\x9d\xfc\xfb\
+\xd2\xbf\x61\x54\x96\x22\x40\x80\x00\x01\x02\x04\x08\x10\x98\x47\
+\x40\x10\x60\x9a\xe3\x61\xbf\xff\x7a\x67\x4d\x1f\xad\x28\x20\x00\
+\xb0\x22\xf6\xa3\xac\x5c\xfd\x7f\x24\xf4\xfe\xb9\x93\xff\x77\x08\
+\xbf\x08\x10\x20\x40\x80\x00\x01\x02\x04\xd6\x16\x88\x20\xc0\x2e\
+\x8d\x47\xd7\xce\xb7\xe4\xfc\xee\xdf\x05\x50\x72\xcd\xca\x2b\xbb\
+\x00\x40\x4e\x6d\xe6\xea\xff\xa0\xd6\x70\xe5\x7f\x10\x93\x85\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x16\x12\xe8\xc6\xa3\x82\x00\xa3\
+\x74\x6f\xde\x05\x30\x2a\x15\x0b\x3f\x2b\x20\x00\xf0\xac\xe0\x4c\
+\xeb\xbb\xfa\x3f\x0c\xd2\x73\x57\xc3\x9c\x2c\x45\x80\x00\x01\x02\
+\x04\x08\x10\x20\xb0\xac\x40\x04\x01\xf6\xbb\xdd\xf7\x9d\x7f\x83\
+\x04\x6e\xdd\x05\x30\x68\x65\x0b\xcd\x26\x20\x00\x30\x1b\xe5\x93\
+\x09\xb9\xfa\xff\x18\x30\x45\x59\xbb\x5b\xae\x1e\x2f\x69\x09\x02\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x8b\x0b\xc4\x9f\x07\x14\x04\
+\x18\xce\x7c\xe5\x2e\x80\xe1\x2b\x5b\x72\x16\x01\x01\x80\x59\x18\
+\x9f\x4b\xc4\xd5\xff\x01\x7e\xe9\xe4\x3f\xa2\xac\x03\x96\xb4\x08\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\xd5\x04\xf6\x87\xc3\xb7\
+\xd5\x32\x2b\x3c\xa3\xcb\xbb\x00\x0a\xaf\x50\x81\xc5\x17\x00\xc8\
+\xa1\xd1\x5c\xfd\xbf\xdb\x0a\x11\x55\x75\xf2\x7f\x97\xc8\x87\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x1b\x09\xc4\x1d\xaa\x1e\x53\x1d\
+\x8e\x7f\x38\xfe\x8b\x00\xc3\x57\xb3\xe4\x4c\x02\x02\x00\x33\x41\
+\x4e\x4d\xc6\xd5\xff\xc7\x72\xa2\xaa\x8f\x8d\x2c\x41\x80\x00\x01\
+\x02\x04\x08\x10\x20\xb0\x9d\x40\x04\x01\xfc\x65\x80\x61\xfe\x71\
+\x17\x40\xbf\xa4\xdf\xeb\x0b\x08\x00\xac\x6f\x2e\xc7\x31\x02\xfb\
+\xfd\xb7\xae\x43\x1d\xb3\x8e\x65\x09\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\xac\x2c\x10\x77\xac\xc6\x9d\xab\x2b\x67\x5b\x64\x76\xef\
+\x17\x41\x8b\x2c\x7b\xe9\x85\x16\x00\xd8\xba\x05\xdd\xfe\x7f\xb3\
+\x05\xa2\x03\x8d\x8e\xf4\xe6\x02\x3e\x20\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x90\x91\x40\x7c\x29\x60\x46\xc5\xc9\xb7\x28\xdd\x39\
+\x50\xbe\xc5\xab\xb9\x64\x02\x00\x1b\xb6\xae\xc8\xd7\x7d\x7c\xb7\
+\xfe\xdf\xf7\xf1\x29\x01\x02\x04\x08\x10\x20\x40\x80\x40\x7e\x02\
+\xbe\x0f\x60\x58\x9b\xfc\xed\xef\x7f\xfa\x32\x6c\x49\x4b\xcd\x29\
+\x20\x00\x30\xa7\xe6\xd8\xb4\x44\xbe\x6e\x8b\xb9\xf5\xff\xb6\x8d\
+\x4f\x08\x10\x20\x40\x80\x00\x01\x02\x04\xb2\x15\xe8\x1e\x5f\x4d\
+\x63\xd9\x6c\x0b\x98\x49\xc1\x7c\x19\xe0\x36\x0d\x21\x00\xb0\x8d\
+\xfb\xce\xd5\xff\x3b\xf0\xa9\xc3\x74\xeb\xff\x1d\x1f\x1f\x11\x20\
+\x40\x80\x00\x01\x02\x04\x08\x64\x2d\x10\x63\xd9\x78\x9c\x35\xeb\
+\x42\x6e\x5b\xb8\x5d\x7c\x19\xe0\xdf\xdc\x05\xb0\x7a\x2b\x08\x00\
+\xac\x4e\x2e\xc3\x47\x02\xd1\x61\x3e\x5a\xc6\xe7\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x04\x72\x16\xf0\x38\xeb\xbd\xd6\x79\xfb\xcc\
+\x5d\x00\x6f\x0e\x6b\xfe\x14\x00\x58\x53\xfb\x38\x2f\xb7\xff\x1f\
+\x6b\x7c\xbe\x4e\x57\xff\x3f\xdf\x78\x45\x80\x00\x01\x02\x04\x08\
+\x10\x20\x40\xa0\x4c\x81\x78\x14\xc0\xf7\x01\xdc\x68\xbb\xf7\xd9\
+\x71\x17\xc0\xfb\x4b\xbf\x56\x12\x10\x00\x58\x09\xfa\x38\x1b\xb7\
+\xff\x1f\x6b\x9c\xbe\x76\xf5\xff\xd4\xc3\x3b\x02\x04\x08\x10\x20\
+\x40\x80\x00\x81\x72\x05\x22\x08\xe0\x51\x80\xcb\xf6\x3b\x9e\xe3\
+\xdc\xe8\x58\x63\xf9\xd7\x02\x00\xcb\x1b\x5f\xe6\xe0\xea\xff\xa5\
+\x49\xcc\x71\xf5\x3f\x14\x4c\x04\x08\x10\x20\x40\x1e\x1a\x05\x6c\
+\x00\x00\x10\x00\x49\x44\x41\x54\x80\x00\x01\x02\x15\x09\x78\x14\
+\xe0\xa2\x31\x4f\x67\xa4\x73\x23\xdf\x05\x70\x4a\xb2\xe4\x3b\x01\
+\x80\x25\x75\xaf\xa4\x2d\xc2\x75\x05\x25\x66\xa5\x93\x7f\x57\xff\
+\x03\xc2\x44\x80\x00\x01\x02\x04\x08\x10\x20\x50\x93\x40\xdc\x05\
+\xb0\x4b\x63\xdd\x9a\xea\xf4\x5c\x5d\x2e\xd7\xf6\x5d\x00\x97\x26\
+\x4b\xcd\x11\x00\x58\x4a\xf6\x46\xba\x29\x02\xf8\xe3\x8d\x8f\x9a\
+\x9e\xfd\xf2\xfa\xfa\xbd\x69\x00\x95\x27\x40\x80\x00\x01\x02\x04\
+\x08\x10\xa8\x56\x20\x2e\x74\x79\x14\xe0\xbd\x79\xfd\xda\x54\x40\
+\x00\x60\x45\xfe\xbf\xfc\xfc\xc3\xc1\x17\x5d\x5c\x01\x4f\x11\xd1\
+\x2e\x32\x7a\xe5\x23\xb3\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\xd4\x20\x90\x2e\x04\x7e\xab\xa1\x1e\xcf\xd6\xe1\xda\xfa\x71\x8e\
+\xe4\x31\x80\x6b\x32\xf3\xcf\x13\x00\x98\xdf\xf4\x6a\x8a\x6e\xfd\
+\xbf\xca\xd2\xcd\x8c\x88\x68\xf7\xc2\x0f\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x95\x0a\x74\x17\xbc\xd2\x85\xaf\x4a\xab\x37\xb4\
+\x5a\x37\x97\xf3\x18\xc0\x4d\x9a\x59\x3f\x10\x00\x98\x95\xf3\x4e\
+\x62\x87\xc3\xd7\x3b\x9f\xb6\xfb\x91\x4e\xb0\xdd\xb6\x57\x73\x02\
+\x04\x08\x10\x20\x40\x80\x40\x63\x02\x71\xe1\xab\xed\x47\x01\x6e\
+\x37\x78\xdc\x05\x70\xfb\x53\x9f\xcc\x25\x20\x00\x30\x97\xe4\x9d\
+\x74\xdc\xce\x72\x1b\x27\x3a\xc1\xdb\x9f\xfa\x84\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x40\x5d\x02\x4d\x3f\x0a\xf0\xa0\x29\x9d\x37\
+\x3d\x00\x9a\xe1\x63\x01\x80\x19\x10\x1f\x25\xf1\xfa\xf2\xf2\xe5\
+\xd1\x32\x4d\x7e\xee\xea\x7f\x93\xcd\xae\xd2\x04\x08\x10\x20\x40\
+\x80\x00\x81\x96\x05\xe2\x51\x80\x56\xef\x02\x78\xd4\xee\x1e\x03\
+\x78\x24\xf4\xfc\xe7\x2f\xcf\x27\x21\x85\x87\x02\x6e\xff\xbf\x4a\
+\xe4\xea\xff\x55\x16\x33\x09\x10\x20\x40\x80\x00\x01\x02\x04\x2a\
+\x17\x68\xf4\x2e\x80\x87\xad\xea\x31\x80\x87\x44\x4f\x2f\x20\x00\
+\xf0\x34\xe1\xfd\x04\x7c\xf9\xdf\x0d\x1f\x57\xff\x6f\xc0\x98\x4d\
+\x80\x00\x01\x02\x04\x08\x10\x20\x50\xbb\x40\x9b\x77\x01\x0c\x6b\
+\x55\x8f\x01\x0c\x73\x9a\xba\x94\x00\xc0\x54\x39\xeb\x3d\x25\xe0\
+\xea\xff\x53\x7c\x56\x26\x40\x80\x00\x01\x02\x04\x08\x10\x28\x5c\
+\xa0\xb9\xbb\x00\x06\xb6\x97\xc7\x00\x06\x42\x4d\x5c\x4c\x00\x60\
+\x22\xdc\xe0\xd5\xdc\xfe\x7f\x49\xe5\xea\xff\xa5\x89\x39\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x4d\x09\xb4\x76\x17\xc0\xd0\xc6\x8d\
+\xc7\x00\xdc\x05\x30\x54\x6b\xfc\x72\x02\x00\xe3\xcd\x06\xaf\xe1\
+\xf6\xff\xeb\x54\xae\xfe\x5f\x77\x31\x97\x00\x01\x02\x04\x08\x10\
+\x20\x40\xa0\x2d\x81\x7f\xff\xfa\xc7\x4f\x8d\xd4\x78\x54\x35\x7d\
+\x89\xfa\x28\xae\x51\x0b\x0b\x00\x8c\xe2\xb2\xf0\xd3\x02\xae\xfe\
+\x3f\x4d\x28\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x8a\x04\x9a\
+\x18\x1f\x8f\x6b\xaf\xfd\xe1\xf0\xe3\xb8\x35\x2c\x3d\x54\x40\x00\
+\x60\xa8\xd4\x94\xe5\xdc\xfe\x7f\xa1\xe6\xea\xff\x05\x89\x19\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x0d\x0b\x34\x31\x3e\x1e\xd9\xbe\
+\x1e\x03\x18\x09\x36\x62\x71\x01\x80\x11\x58\x63\x16\x75\xfb\xff\
+\x15\x2d\xd1\xcd\x2b\x28\x66\x11\x20\x40\x80\x00\x01\x02\x04\x08\
+\xb4\x2e\xb0\xdf\xed\xbe\xef\x2a\xfe\x37\xa5\x6a\xbe\x0c\x70\x8a\
+\xda\xe3\x75\x04\x00\x1e\x1b\x4d\x5a\xc2\x6d\x2b\x97\x6c\xa2\x9b\
+\x97\x26\xe6\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x48\xe7\x0e\
+\xdf\x2a\x56\x98\x54\xb5\xb8\x0b\x60\xd2\x8a\x56\xba\x2b\x20\x00\
+\x70\x97\x67\xfa\x87\x36\xd8\x33\x3b\x57\xff\xcf\x40\xbc\x25\x40\
+\x80\x00\x01\x02\x04\x08\x10\x20\xf0\x26\x50\xf7\x5f\x04\x78\xab\
+\xe3\x94\x9f\xfe\x1a\xc0\x14\xb5\xfb\xeb\x08\x00\xdc\xf7\x99\xf4\
+\xa9\xdb\xff\x27\xb1\x59\x89\x00\x01\x02\x04\x08\x10\x20\x40\x80\
+\x40\xb3\x02\xd5\xde\x05\xf0\x44\x8b\x7a\x0c\xe0\x09\xbc\x1b\xab\
+\x0a\x00\xdc\x80\x79\x6a\xb6\x2f\xff\xbb\xe0\x73\xfb\xff\x05\x89\
+\x19\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x3e\x04\x6a\xbd\x0b\
+\xe0\xa3\x82\x13\x5e\xb8\xab\x7a\x02\xda\x83\x55\x04\x00\x1e\x00\
+\x8d\xfd\xd8\x6d\x2a\x57\xc4\xdc\xfe\x7f\x05\xc5\x2c\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\xa7\x02\x15\xde\x05\x70\x5a\xc1\x09\
+\xef\x9c\x5f\x4d\x40\xbb\xb3\x8a\x00\xc0\x1d\x9c\x29\x1f\xbd\xbe\
+\xbc\x7c\x99\xb2\x5e\xcd\xeb\xb8\xfa\x5f\x73\xeb\xaa\x1b\x01\x02\
+\x04\x08\x10\x20\x40\x80\xc0\x5c\x02\xf5\xdd\x05\xf0\xbc\x8c\xc7\
+\x00\x9e\x37\x3c\x4e\xe1\xe5\xf8\x8d\xd7\x33\x08\xb8\xfd\xff\x14\
+\xd1\xd5\xff\x53\x0f\xef\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\
+\xdc\x11\xa8\xea\x2e\x80\x3b\xf5\x1c\xfa\x91\xc7\x00\x86\x4a\x0d\
+\x5b\x4e\x00\x60\x98\xd3\xa0\xa5\x7c\xf9\xdf\x25\xd3\xcb\xeb\xeb\
+\xf7\xcb\xb9\xe6\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x70\
+\x4d\xa0\xa6\xbb\x00\xae\xd5\x6f\xca\x3c\x8f\x01\x4c\x51\xbb\xbe\
+\x8e\x00\xc0\x75\x17\x73\x67\x12\x88\x0e\x6c\xa6\xa4\x24\x43\x80\
+\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x09\x81\x4a\xee\x02\x98\xad\
+\xad\x3c\x06\x30\x1b\xe5\x4e\x00\x60\x3e\xcb\xdd\xce\xed\xff\x27\
+\x9a\xfb\xdd\xce\xd5\xff\x9d\x7f\x04\x08\x10\x20\x40\x80\x00\x01\
+\x02\x04\x5a\x14\x98\xaf\xce\xf1\x18\x80\xbb\x00\xe6\xf1\x14\x00\
+\x98\xc7\x71\xe7\xf6\xff\x4b\xc8\x14\xa9\xfb\xfd\x72\xae\x39\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\xdc\x13\x88\xbb\x68\x8b\
+\xbf\x98\x76\xaf\x82\x13\x3e\xf3\x65\xeb\x13\xd0\xae\xac\x22\x00\
+\x70\x05\xc5\xac\x79\x04\x7c\xfb\xff\x3c\x8e\x52\x21\x40\x80\x00\
+\x01\x02\x04\x08\x10\x68\x4f\xa0\xf4\xc7\x00\xe6\x6e\xb1\xe4\xf1\
+\xe3\xdc\x69\xb6\x98\x9e\x00\xc0\x5c\xad\xee\xf6\xff\x53\x49\xdf\
+\xfe\x7f\xea\xe1\x1d\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x11\
+\x02\x71\x17\xc0\x88\xc5\x73\x5b\x74\xf6\xf2\x78\x0c\x60\x1e\x52\
+\x01\x80\x19\x1c\xdd\xfe\x3f\x03\xa2\x24\x08\x10\x20\x40\x80\x00\
+\x01\x02\x04\x08\x10\x38\x11\x28\xf7\x31\x80\x93\x6a\xcc\xf6\xe6\
+\xb0\xdf\x7f\x9d\x2d\xb1\x46\x13\x12\x00\x98\xa1\xe1\xdd\x8e\x72\
+\x89\xe8\xf6\xff\x4b\x13\x73\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x8c\x11\x48\xe7\x19\xdf\xc6\x2c\x9f\xcd\xb2\x0b\x15\x24\xee\
+\x02\x58\x28\xe9\x66\x92\x15\x00\x98\xa1\xa9\x6d\x88\x67\x88\x6e\
+\xff\x3f\x03\xf1\x96\x00\x01\x02\x04\x08\x10\x20\x40\x80\xc0\x78\
+\x81\x52\x1f\x03\x18\x5f\xd3\xe1\x6b\xf8\x6b\x00\xc3\xad\xae\x2d\
+\x29\x00\x70\x4d\x65\xc4\x3c\xb7\xff\x5f\x62\xbd\xbc\xbe\xfa\xf3\
+\x7f\x97\x2c\xe6\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x18\x2d\
+\x50\xe0\x63\x00\xa3\xeb\x38\x66\x05\x8f\x01\x8c\xd1\xba\x5c\x56\
+\x00\xe0\xd2\x64\xdc\x1c\x5f\xfe\x77\xe1\x25\x52\x79\x41\x62\x06\
+\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x49\x02\xe5\x3d\x06\x30\
+\xa9\x9a\x83\x57\x72\xf7\xf5\x60\xaa\xab\x0b\x0a\x00\x5c\x65\x19\
+\x36\xd3\xed\x27\x57\x9c\xdc\xfe\x7f\x05\xc5\x2c\x02\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\xd3\x04\x8a\xbb\xb8\x36\xad\x9a\xa3\xd6\
+\x72\x1e\x36\x8a\xeb\x64\x61\x01\x80\x13\x8e\x71\x6f\x5e\x5f\x5e\
+\xbe\x8c\x5b\xa3\xfe\xa5\x7d\xf9\x5f\xfd\x6d\xac\x86\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\xeb\x0a\x94\xf4\x18\xc0\x1a\x32\x1e\x03\
+\x98\xae\xfc\x32\x7d\x55\x6b\xee\xdc\xfe\x7f\xba\x11\xb8\xfa\x7f\
+\xea\xe1\x1d\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\x19\x04\x0a\
+\x7a\x0c\x60\x86\xda\x3e\x4e\xc2\x63\x00\x8f\x8d\x6e\x2d\x21\x00\
+\x70\x4b\xe6\xc1\x7c\x5f\xfe\xf7\x00\xc8\xc7\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x04\x08\xcc\x22\x10\x8f\x01\x94\x71\x17\xc0\x2c\
+\xd5\x1d\x94\x88\xc7\x00\x06\x31\x5d\x2c\x24\x00\x70\x41\x62\xc6\
+\x54\x01\xb7\xff\x4f\x95\xb3\x1e\x01\x02\x04\x08\x10\x20\x40\x80\
+\x00\x81\x0a\x04\x56\xac\x82\xc7\x00\xa6\x61\x0b\x00\x4c\x73\xdb\
+\xb9\xfd\xff\x0c\xce\xed\xff\x67\x20\xde\x12\x20\x40\x80\x00\x01\
+\x02\x04\x08\x10\x98\x4f\xa0\x84\xc7\x00\xe6\xab\xed\xe3\x94\xe2\
+\x31\x00\x77\x01\x3c\x76\x3a\x5f\x42\x00\xe0\x5c\x64\xc0\x7b\xb7\
+\xff\x0f\x40\xb2\x08\x01\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\
+\xb3\x09\x14\xf0\x18\xc0\x6c\x75\x1d\x9a\x90\x2f\x65\x1f\x2a\xf5\
+\xb9\x9c\x00\xc0\xa7\x85\x57\x4f\x08\xb8\xfd\xff\x09\x3c\xab\x12\
+\x20\x40\x80\x00\x01\x02\x04\x08\x10\x18\x20\x90\xf7\x5d\x00\x03\
+\x2a\x30\xf3\x22\xc9\xe3\xc7\x99\x93\xac\x3e\x39\x01\x80\x29\x4d\
+\xec\xdb\xff\x4f\xd5\xdc\xfe\x7f\xea\xe1\x1d\x01\x02\x04\x08\x10\
+\x20\x40\x80\x00\x81\xd6\x04\x36\xa8\xaf\xc7\x00\xc6\xa3\x0b\x00\
+\x8c\x34\x73\xfb\xff\x25\x98\xab\xff\x97\x26\xe6\x10\x20\x40\x80\
+\x00\x01\x02\x04\x08\x10\x98\x5b\x20\xe7\xc7\x00\xe6\xae\xeb\xd0\
+\xf4\x7c\x19\xe0\x50\xa9\xb7\xe5\x04\x00\xde\x1c\x06\xff\x74\x9b\
+\xc9\x29\x95\x3f\x47\x72\xea\xe1\x1d\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x81\x25\x05\xd2\xf9\xc8\xb7\x25\xd3\x9f\x98\xf6\x66\xab\
+\xc5\x5d\x00\x9b\x65\x5e\x60\xc6\x02\x00\x23\x1b\xcd\x06\x76\x0a\
+\x96\x22\x6e\xbf\x9f\xce\xf1\x8e\x00\x01\x02\x04\x08\x10\x20\x40\
+\x80\x00\x81\xa5\x04\xe2\x2e\x80\xa5\xd2\x9e\x9e\xee\xb6\x6b\xfa\
+\x6b\x00\xc3\xfd\x05\x00\x86\x5b\xed\xdc\xfe\x7f\x89\xe5\xf6\xff\
+\x4b\x13\x73\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x2c\x29\x90\
+\xdd\x5d\xb8\x4b\x56\x76\x40\xda\xe9\xa2\xe4\xd7\x01\x8b\x59\x24\
+\x09\x08\x00\x24\x84\xc1\xff\x7d\xf9\xdf\x29\x95\x2f\xff\x3b\xf5\
+\xf0\x8e\x00\x01\x02\x04\x08\x10\x20\x40\x80\xc0\x0a\x02\xb9\x3d\
+\x06\xb0\x42\x95\xef\x66\xe1\x2e\xed\xbb\x3c\x27\x1f\x0a\x00\x9c\
+\x70\xdc\x7e\xe3\xb6\x92\xdb\x36\x3e\x21\x40\x80\x00\x01\x02\x04\
+\x08\x10\x20\x40\x60\x3d\x81\xcc\x1e\x03\x58\xaf\xe2\x77\x72\x72\
+\xbe\x76\x07\xe7\xe8\x23\x01\x80\x23\x8c\x7b\x2f\x5f\x5f\x5e\xbe\
+\xdc\xfb\xbc\xc5\xcf\xdc\xfe\xdf\x62\xab\xab\x33\x01\x02\x04\x08\
+\x10\x20\x40\x80\x40\x0e\x02\xf9\x3c\x06\x90\x83\xc6\x6e\xe7\x31\
+\x80\x61\xed\xf0\x32\x6c\x31\x4b\xed\xdc\xfe\x7f\xba\x11\xb8\xfd\
+\xff\xd4\xc3\x3b\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x2b\x0a\
+\x64\xf3\x18\xc0\x8a\x75\xbe\x97\x55\x3c\x06\xe0\x2e\x80\x7b\x42\
+\x6f\x9f\x09\x00\xbc\x39\xdc\xfd\xe9\xcb\xff\x2e\x79\x5e\x5e\x5f\
+\xbf\x5f\xce\x35\x87\x00\x01\x02\x04\x08\x10\x20\x40\x80\x00\x81\
+\x35\x04\x72\x79\x0c\x60\x8d\xba\xca\x63\x3e\x01\x01\x80\xf9\x2c\
+\x9b\x4a\x49\x87\xd3\x54\x73\xab\x2c\x01\x02\x04\x08\x10\x20\x40\
+\x80\x40\x86\x02\x19\x3c\x06\x90\x95\x8a\xc7\x00\x1e\x37\x87\x00\
+\xc0\x63\xa3\x9d\xdb\xff\xcf\x90\xdc\xfe\x7f\x06\xe2\x2d\x01\x02\
+\x04\x08\x10\x20\x40\x80\x00\x81\xf5\x05\xb6\x7f\x0c\x60\xfd\x3a\
+\xdf\xcb\xd1\x63\x00\xf7\x74\xde\x3e\x13\x00\x78\x73\xb8\xf9\xd3\
+\xed\xff\x97\x34\xbe\xfc\xef\xd2\xc4\x1c\x02\x04\x08\x10\x20\x40\
+\x80\x00\x01\x02\x6b\x0b\xc4\x5d\xb9\x9b\xde\x05\xb0\x76\x85\x07\
+\xe4\xe7\x2e\x80\xfb\x48\x02\x00\xf7\x7d\x7c\x7a\x2e\xe0\xea\xff\
+\xb9\x88\xf7\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x9a\x14\x50\
+\xe9\xf2\x04\x04\x00\x1e\xb5\x99\x6f\xff\x7f\x24\xe4\x73\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x36\x12\xd8\xf0\x31\x80\x8d\
+\x6a\x7c\x3f\x5b\x8f\x01\xdc\xf7\x11\x00\xb8\xe3\xe3\xf6\xff\x4b\
+\x1c\xb7\xff\x5f\x9a\x98\x43\x80\x00\x01\x02\x04\x08\x10\x20\x40\
+\x60\x2b\x81\xed\x1e\x03\xd8\xaa\xc6\x8f\xf3\xf5\x18\xc0\x6d\x23\
+\x01\x80\xdb\x36\x3e\x39\x17\x70\xfb\xff\xb9\x88\xf7\x04\x08\x10\
+\x20\x40\x80\x00\x01\x02\x04\x36\x17\xd8\xe4\x2e\x80\xcd\x6b\x7d\
+\xbb\x00\x71\x17\xc0\xed\x4f\xdb\xfe\x44\x00\xe0\x5e\xfb\xbb\xfd\
+\xff\x9e\x8e\xcf\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x68\
+\x54\x20\xf7\x6a\xff\xed\xef\x7f\xfa\x92\x7b\x19\xb7\x28\x9f\x00\
+\xc0\x0d\x75\xb7\xff\x5f\xc2\xb8\xfd\xff\xd2\xc4\x1c\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x5b\x0b\x6c\xf0\x18\xc0\xd6\x55\x7e\
+\x98\xbf\xc7\x00\xae\x13\x09\x00\x5c\x77\xd9\xed\x0f\x87\x1f\x6f\
+\x7c\xd4\xe6\x6c\xb7\xff\xb7\xd9\xee\x6a\x4d\x80\x00\x01\x02\x04\
+\x08\x10\x20\x50\x84\x40\x3a\x7f\xf9\xb6\x5e\x41\xf3\xcf\xc9\x63\
+\x00\xd7\xdb\x48\x00\xe0\x8a\x4b\xdc\x2e\x62\x83\x39\x85\x71\xf5\
+\xff\xd4\xc3\x3b\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x39\x09\
+\xc4\x5d\x00\xab\x95\xa7\x90\x8c\xe2\xbc\xae\x90\xa2\xae\x56\x4c\
+\x01\x80\x2b\xd4\xaf\x2f\x2f\x9e\x17\x39\x72\xd9\xef\x76\xdf\x77\
+\xfe\x11\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x90\xb5\xc0\x5a\
+\xe3\xf6\xac\x11\x8e\x0a\xe7\x31\x80\x23\x8c\xf7\x97\x2f\xef\xbf\
+\xfd\x3a\x16\xf0\xe5\x7f\xc7\x1a\xbb\xb4\xe3\xfc\x7e\x32\xc3\x1b\
+\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\xb2\x13\x58\xe9\x31\
+\x80\xec\xea\x7d\xab\x40\x71\x57\xb7\xbb\x00\x4e\x75\x04\x00\x4e\
+\x3d\x76\x36\x90\x33\x90\xf4\xd6\xed\xff\x09\xc1\x7f\x02\x04\x08\
+\x10\x20\x40\x80\x00\x01\x02\x99\x0b\xac\xf3\x18\x40\xe6\x08\x8a\
+\x77\x57\x40\x00\xe0\x8c\xc7\xed\xff\x67\x20\xbe\xfc\xef\x0c\xc4\
+\x5b\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\xf9\x0a\x2c\xfe\x18\
+\x40\xbe\x55\xbf\x5a\xb2\xc3\x7e\xff\xf5\xea\x07\x8d\xce\x14\x00\
+\x38\x6f\x78\xb7\xff\x9f\x8b\x78\x4f\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x40\x21\x02\x4b\x3f\x06\x50\x08\xc3\x47\x31\x3d\x06\
+\xf0\x41\xd1\xbd\x10\x00\xe8\x18\xde\x7e\xfc\xe5\x1f\x7f\xfe\xe5\
+\xed\x95\x9f\xbd\x80\xdb\xff\x7b\x89\xcf\xdf\xf1\x98\xc8\xf1\x14\
+\xdb\x4d\x4c\x7f\xfd\xf9\x87\xdf\x1e\x4d\x7f\xf9\xf9\x87\xc3\xad\
+\xe9\xd6\xba\x91\xf6\xbd\xa9\x2f\xcb\x67\x09\xbd\x22\x40\x80\x00\
+\x01\x02\x04\x08\xcc\x2b\xd0\x8f\x37\xe2\xf7\xad\x71\xc9\xad\xb1\
+\x4c\xcc\xbf\x35\xfe\x89\xf9\xf1\xf9\xb5\xe9\x5a\x3e\x91\x7f\x4c\
+\xf3\xd6\xae\xae\xd4\x16\x7e\x0c\xa0\x48\x2c\x77\x01\x7c\x36\x9b\
+\x00\xc0\xa7\x85\x57\xe7\x02\x0d\xde\xfe\x1f\x07\x94\x98\xfa\x03\
+\xce\xf1\xc1\x28\x0e\x50\x31\xbd\xee\xf7\xbf\x1d\x4f\xbb\xb8\x6b\
+\x24\x4d\x11\x5d\x7c\x34\x9d\x13\x1f\xbf\xbf\xb5\x6e\x9f\xfe\xad\
+\xdf\x7d\x59\xa2\x6c\x31\xf5\x65\xee\xeb\x10\xbf\xa3\x4e\x31\x1d\
+\xe7\xe7\x35\x01\x02\x04\x08\x10\x20\x40\x20\x04\x62\x8c\xd0\x4f\
+\x31\x6e\xe8\xc7\x12\xf1\x3b\xc6\x16\x31\xf5\xe3\x8d\xf8\x7d\x6b\
+\x4c\x72\x6b\x2c\x13\xf3\x23\x9f\x5b\x53\x7c\x7e\x6d\xba\x96\x4f\
+\xe4\x1f\x53\x94\xa9\x9f\xa2\x9c\x31\x45\xd9\x8f\xa7\xa8\xd3\xad\
+\x3c\x6b\x9f\xbf\xdc\x63\x00\xb5\xcb\xd5\x5f\x3f\x01\x80\xe3\x36\
+\x4e\x27\x71\xc7\x6f\x5b\x7f\xfd\xf2\xfa\x5a\xe5\x9f\xff\x8b\x83\
+\x41\x4c\x71\x80\x88\x83\x45\x4c\xfd\x01\x24\x0e\x28\x31\xf5\x07\
+\x9c\xe3\x83\x51\x29\xdb\x43\x5f\xe6\xbe\x0e\xf1\x3b\xea\x14\x53\
+\x5f\xcf\xa8\x73\x4c\x61\xd0\x4f\xa5\xd4\x4f\x39\x09\x10\x20\x40\
+\x80\x00\x81\x71\x02\x31\xee\x89\xa9\x3f\xe6\xc7\x18\x20\xa6\x7e\
+\x5c\x10\x63\x84\x7e\x8a\x71\x43\x3f\x96\x88\xdf\xe3\x72\xda\x66\
+\xe9\x28\x67\x4c\x51\xf6\xe3\x29\xea\xd4\xd7\xb1\xab\xef\x3f\xfe\
+\xfc\x4b\x18\x84\x45\x4c\xdb\x94\x76\x9d\x5c\xf7\x87\xc3\xb7\x45\
+\x72\x2a\x34\xd1\xd8\x3e\x6a\x6f\xf3\xa1\x4d\x23\x00\xf0\x2e\x15\
+\x9d\xc1\xfb\x4b\xbf\xde\x05\x4a\xbf\x7d\x28\x76\xf2\x98\xa2\x6d\
+\xa3\xd3\x8f\x29\x0e\x02\x71\x30\x88\x29\x0e\x10\xd1\x19\xc4\xf4\
+\x5e\xe5\x66\x7e\x45\x9d\x63\x0a\x83\x7e\x0a\x9b\x98\x3a\xa7\xa3\
+\x03\x64\x33\x28\x2a\x4a\x80\x00\x01\x02\x04\x2a\x10\x88\xb1\x4f\
+\x4c\xfd\xf8\x27\x8e\xed\x31\xee\x89\xa9\x3f\xe6\xc7\x18\x20\xa6\
+\x0a\xaa\x3b\xb8\x0a\x5d\x7d\xe3\x62\x5f\x9a\xc2\x22\xa6\xb0\x89\
+\xe9\x78\xec\x33\x38\xc1\xcc\x17\x8c\x71\xfc\x12\x77\x01\x64\x5e\
+\xed\xbb\xc5\x3b\xf8\x32\xc0\xce\x47\x00\xa0\x63\xf0\xe3\x42\xa0\
+\xb0\xdb\xff\xe3\x40\x17\xd3\xad\x83\x5d\x74\xfa\x31\x5d\xd4\xd3\
+\x8c\x0b\x81\xce\x29\x1d\x1c\x63\x90\xd0\x1f\x1c\x8f\x0f\x8c\xe1\
+\x7c\xb1\x92\x19\x04\x08\x10\x20\x40\x80\xc0\xea\x02\x71\x4c\x8e\
+\x29\x8e\xd3\x31\xc5\xc9\x6c\x1c\xbb\x63\x8a\xe3\x78\x77\x4c\x5f\
+\xbd\x54\xe5\x65\xd8\x39\xbd\x8f\x7d\xc2\x30\xa6\xce\xf3\xfd\x82\
+\x48\x79\x35\x5a\xac\xc4\x45\x27\xdc\xb5\x73\xd1\x35\x98\xa7\xf0\
+\x02\x00\xbd\x63\xec\xf4\xfd\x6b\xbf\x77\xb9\x7f\xf9\x5f\x1c\xec\
+\xfa\x93\xfd\xe8\xa0\xe3\x40\x17\x93\x83\xdd\x32\x1b\x6f\xd7\x61\
+\xc6\x3e\x92\xa6\x70\x3e\x3f\x30\x46\x7b\x2c\x93\xb3\x54\x09\x10\
+\x20\x40\x80\x00\x81\x10\x88\x63\x6d\x4c\x31\xee\x89\x29\x8e\xc5\
+\x71\x4c\x8e\x29\x8e\xd3\x31\xc5\x72\xa6\x79\x04\x3a\xcf\x34\xee\
+\x89\xb1\x65\x58\x77\xd3\x7b\x40\x20\xda\x61\x9e\x5c\x96\x4d\x65\
+\xfe\xc7\x00\x96\x2d\xef\x1a\xa9\x97\xd2\x76\x4b\x5a\x08\x00\x24\
+\xdd\x38\x91\x4c\xbf\xfc\xef\x05\x32\xbc\xfa\x1f\x3b\x6b\xb4\xd3\
+\xf1\x01\x2f\x3a\xe4\xe8\x9c\x63\xea\x8b\xee\xf7\x7a\x02\x9d\xfb\
+\xfb\x81\x31\x06\x1f\xc7\x07\xc6\xf5\x4a\x21\x27\x02\x04\x08\x10\
+\x20\x50\xa7\x40\x8c\x7d\x62\x3a\x1e\xfb\xc4\xf1\x36\x8e\xbf\x31\
+\xd5\x59\xeb\xcc\x6b\x75\x36\xee\xe9\xda\xe6\x3d\x28\x90\x63\xc9\
+\x67\x7f\x0c\x20\xc7\x4a\x8e\x2c\x93\xc7\x00\x76\x3b\x01\x80\xb4\
+\xd1\xa4\xe8\xd8\x8f\xe9\x97\xff\x19\x09\xc4\x01\x2f\xa6\xae\x63\
+\xfd\xf9\x87\x43\x1c\xf0\xfa\x13\xfe\x8c\x8a\xa9\x28\xe7\x02\xef\
+\x07\xc6\x2e\x18\x90\xda\x2d\x82\x36\x31\x9d\x2f\xe6\x3d\x01\x02\
+\x04\x08\x10\x20\x70\x29\xd0\x8f\x7d\x62\xfc\x13\x63\x9f\x98\x9c\
+\xec\x5f\x3a\xe5\x32\xa7\x6b\x9b\xa3\xb1\x4f\xb4\x5b\x8c\x7b\xa2\
+\x1d\x73\x29\x63\x3a\xcf\x99\xed\xcb\x00\x73\xa9\xd3\x33\xe5\xe8\
+\xda\xec\x99\x04\x2a\x58\x57\x00\x20\x35\xa2\x0d\x21\x21\x1c\xfd\
+\xdf\xe2\xf6\xff\xe8\x28\x63\xea\x3a\xce\x74\xe2\x18\x07\xbc\x98\
+\xb4\xcd\x51\xc3\x94\xf8\x32\xf3\x83\x62\x89\xa4\xca\x4c\x80\x00\
+\x01\x02\xf5\x08\xc4\xd8\x27\xa6\xe3\xf1\x4f\x8c\x7d\x62\xaa\xa7\
+\x96\xed\xd4\xa4\x6b\xb7\x34\xf6\x89\x31\x6c\x77\x31\x24\xe3\xbb\
+\x03\x26\xb4\x4a\x35\xab\xc4\x3e\x57\x4d\x65\x26\x54\xa4\xf9\x00\
+\x40\x44\xe9\x26\xb8\xd5\xbb\xca\x8a\xb7\xff\xc7\xce\x17\x07\xbc\
+\x98\xa2\xa3\x8c\xa9\xeb\x38\xeb\xd5\x6d\xba\x66\x5d\xdb\x3a\x28\
+\x36\xbd\x0d\xa8\x3c\x01\x02\x04\x5a\x17\x88\xb1\x4f\x4c\x31\xf6\
+\x89\x13\xc4\x18\xfb\xc4\xd4\x1d\x23\x5b\xc7\xa9\xb1\xfe\x69\xdc\
+\x13\x77\xb0\x46\x5b\x77\xd3\x06\x01\x81\xf9\x1e\x03\xa8\xa7\x81\
+\x5a\x7f\x0c\xa0\xf9\x00\x40\xec\x94\xf5\x6c\xce\xf9\xd7\xa4\x3f\
+\xe8\xc5\x81\xaf\x3f\xe0\x39\xe8\xe5\xdf\x6e\x8b\x94\xf0\xe8\xa0\
+\x18\xdb\x83\x60\xdc\x22\xca\x12\x25\x40\x80\x00\x81\x8d\x05\xce\
+\xc7\x3e\xfd\xf8\x67\xe3\x62\xc9\x7e\x0b\x81\xa3\xb1\x4f\x8c\x7b\
+\x62\x5a\xa3\x18\xb3\x3c\x06\xb0\x46\x41\x57\xca\x23\xce\x3d\x62\
+\xbf\x5c\x29\xbb\xec\xb2\x69\x3a\x00\xd0\x72\xc3\xdf\xda\x12\x97\
+\xb8\xfd\x3f\x9c\xe3\x04\x2f\xa6\xbf\xf9\x11\x9f\x00\x00\x10\x00\
+\x49\x44\x41\x54\xfe\xa0\x17\x3b\xde\xad\x32\x98\xdf\x9e\x40\xb7\
+\x3d\xa4\x83\x62\x44\xc7\x63\x3b\x59\xeb\x80\xd8\x9e\xb4\x1a\x13\
+\x20\x40\x80\xc0\x5a\x02\xfd\xf8\xc7\xd8\x67\x2d\xf1\xc2\xf2\x49\
+\xe3\x9e\xb8\x10\x19\x63\x9f\x18\xf7\xc4\xb4\x54\x0d\xe2\x2e\x80\
+\x67\xd3\xb6\x7e\x3d\x02\x4d\x07\x00\x5e\x5f\x5e\xbe\xd4\xd3\x94\
+\x33\xd4\x64\xc6\xdb\xff\xfb\x83\x5e\x74\x6a\x0e\x7c\x33\xb4\x4d\
+\x43\x49\x1c\x07\x03\xe2\x60\x18\x53\x43\xd5\x57\x55\x02\x04\x08\
+\x10\x28\x58\xe0\xda\xf8\xa7\xe0\xea\x28\xfa\x5a\x02\x2b\x04\x03\
+\xf6\xbb\xdd\xf7\xdd\xf4\x7f\xd5\xad\xd9\xf2\x63\x00\x2f\xd5\xb5\
+\xe6\x98\x0a\xc5\xce\x36\x66\xf9\xca\x97\x7d\xf6\xea\x7f\x7f\xd0\
+\x8b\x2b\xb8\xfd\x49\x7f\xe5\x64\xaa\xb7\xb4\x40\xec\xa3\x69\x8a\
+\x40\x52\x04\x02\x62\x5a\x3a\x4b\xe9\x13\x20\x40\x80\x00\x81\x31\
+\x02\xfd\xf8\x27\x8e\x55\xc6\x3f\x63\xe4\x2c\x7b\x55\x20\x8d\x7b\
+\x8e\xef\x0c\x88\xed\xeb\xea\x72\x23\x67\x3e\xf7\x18\xc0\xc8\xcc\
+\x0a\x58\x3c\x2e\x38\xcd\x65\x5b\x40\x75\x4f\x8a\xd8\x6c\x00\xc0\
+\x89\xc4\xc9\x76\xb0\x7b\x26\x2a\x18\x3b\xcf\xf1\x49\x7f\xec\x50\
+\xa7\xa9\x7b\x47\x60\x06\x81\x85\x0e\x88\x33\x94\x4c\x12\x04\x08\
+\x10\x20\xd0\x98\x40\x3f\xf6\x71\xd2\xdf\x58\xc3\xaf\x5d\xdd\x34\
+\xf6\x89\xa0\x52\x8c\xb3\x9f\x3d\x77\x79\xea\x31\x80\xb5\xeb\xbd\
+\x52\x7e\xad\xde\x05\xd0\x6c\x00\x60\xa5\xed\xaa\x98\x6c\xd2\x0e\
+\xf0\xfb\x98\xc2\x3a\xf0\x8d\xd1\xb2\xec\xec\x02\xef\x07\xc4\x18\
+\x78\x3d\x7b\x40\x9c\xbd\x6c\x12\x24\x40\x80\x00\x81\x2a\x05\x62\
+\xec\x13\x53\x9c\x8c\xc5\x49\x99\x0b\x1e\x55\x36\x73\x96\x95\xea\
+\xb6\xb5\x34\xf6\xe9\xc7\x3d\x53\xc7\x3e\x53\x2f\xf8\x65\x89\xa2\
+\x50\x93\x05\xda\x0d\x00\xa4\x9d\x68\xb2\x5a\x85\x2b\x0e\xb9\xfd\
+\x3f\x0e\x7a\x31\x39\xf0\x55\xb8\x01\x94\x5c\xa5\xb4\x2f\x3f\x7b\
+\x40\x2c\xb9\xfa\xca\x4e\x80\x00\x01\x02\xcb\x0a\x1c\x8f\x7d\x9c\
+\xf8\x2f\x6b\x2d\xf5\x01\x02\x69\xdc\x73\xfc\x88\xc0\x80\x35\x3e\
+\x16\x99\xf8\x18\xc0\xc7\xfa\xb5\xbd\x88\xc0\x4a\xec\xdf\xb5\xd5\
+\xeb\x51\x7d\x9a\x0c\x00\x4c\x8d\x9a\x3d\xc2\x2c\xf6\xf3\x07\x5f\
+\xfe\x17\x3b\x46\x7f\xd2\xef\xc0\x57\x6c\x2b\xd7\x5f\xf0\xf7\x03\
+\x62\x6c\xab\xf6\xf1\xfa\x9b\x5b\x0d\x09\x10\x20\xb0\xb4\xc0\xf1\
+\xf8\x27\x4e\x14\x96\xce\x4f\xfa\x04\x46\x0b\xa4\xb1\xcf\x98\x8b\
+\x20\xd3\x1e\x03\x18\x5d\xaa\xa2\x56\x38\xec\xf7\x5f\x8b\x2a\xf0\
+\x0c\x85\x6d\x32\x00\x30\x83\x5b\x13\x49\x38\xf0\x35\xd1\xcc\xd5\
+\x55\xb2\x1b\xa4\x1d\x1d\x10\xab\xab\xa0\x0a\x11\x20\x40\x80\xc0\
+\xa2\x02\x11\x44\x8e\x60\xb2\x8b\x1e\x8b\x32\x4b\x7c\x4e\x81\x34\
+\xee\x19\x7a\x57\xc0\xe8\xc7\x00\xe6\x2c\x67\x86\x69\x75\xe3\xc6\
+\x0c\xcb\xb5\x64\x91\xda\x0c\x00\xc4\x4e\xb2\xa4\x6a\x61\x69\x9f\
+\xdf\xfe\xef\xc4\xbf\xb0\x06\x54\xdc\xdb\x02\x69\x5f\xef\x23\xe3\
+\xb7\x17\xf2\x09\x01\x02\x04\x08\xb4\x2e\xd0\x8f\x7d\xe2\x98\x11\
+\x27\x52\x2d\x9e\x14\xb4\xbe\x0d\x54\x53\xff\x07\x63\x9f\xb1\x8f\
+\x01\x54\xe3\x72\xa7\x22\xb1\xff\xdf\xf9\xb8\xba\x8f\x9a\x0b\x00\
+\x44\x54\xb7\xba\x56\x7c\xa6\x42\xef\xb7\xff\xc7\x86\x1f\xd1\xee\
+\x38\xf0\x89\x78\x3f\x03\x6a\xdd\x2c\x05\x8e\x0e\x86\xfa\x80\x2c\
+\x5b\x48\xa1\x08\x10\x20\xb0\x89\x40\x3f\xfe\x31\xf6\xd9\x84\x5f\
+\xa6\x4b\x0a\x1c\x8d\x7d\x8e\xb3\x89\xc7\x00\x46\xdc\x05\x70\xbc\
+\x6a\xb5\xaf\x5b\x7b\x0c\xa0\xb9\x00\x40\x8a\x7a\xfd\x58\xed\xd6\
+\x3b\xb1\x62\x71\xe2\xef\xc0\x37\x11\xcf\x6a\x65\x09\xa4\x83\x61\
+\x5c\xd9\x89\x20\x40\x4c\x65\x15\x5e\x69\x09\x10\x20\x40\x60\x2e\
+\x01\x27\xfe\x73\x49\x4a\x27\x7b\x81\x34\xf6\x89\x0b\x7c\xd3\xc6\
+\x3d\xd9\xd7\x6e\x96\x02\xb6\x76\xc7\x4f\x73\x01\x80\xd6\x1a\xf8\
+\xe1\x5e\x91\x3a\x05\x26\x0f\x95\x2c\x50\x9b\x40\xda\xee\xbb\x40\
+\xc0\xcf\x3f\x1c\x1c\x10\x6b\x6b\x5c\xf5\x21\x40\x80\xc0\x6d\x01\
+\x27\xfe\xb7\x6d\x7c\x52\xb9\x40\x1a\xfb\x8c\x0e\x04\x54\x4e\x72\
+\x5c\xbd\xe8\x1b\x8e\xdf\xd7\xfc\xba\xa9\x00\x80\x81\x7e\xcd\x9b\
+\xb2\xba\x11\x98\x28\xe0\x80\x38\x11\xce\x6a\x04\x08\x10\x28\x47\
+\x20\x06\xf7\xee\x78\x2c\xa7\xbd\x94\x74\x41\x81\x34\xee\x19\x7a\
+\xf1\x6f\xc1\x52\x64\x97\x74\x4b\x8f\x01\x34\x15\x00\x88\x2b\x7e\
+\xd9\x6d\x6d\x0a\x44\x80\x40\x1e\x02\xe9\x80\x28\x32\x9e\x47\x53\
+\x28\x05\x01\x02\x04\xe6\x12\x70\xe2\x3f\x97\xa4\x74\x1a\x14\x68\
+\xaa\xca\x11\x14\x89\xfe\xa2\x85\x4a\x37\x13\x00\x68\xa5\x41\x5b\
+\xd8\x68\xd5\x91\xc0\xa2\x02\x11\x08\xf8\xc7\x9f\x7f\x71\xc7\xd0\
+\xa2\xca\x12\x27\x40\x80\xc0\xa2\x02\x31\xee\x73\xc5\x7f\x51\x62\
+\x89\x57\x2f\xa0\x82\xb5\x0a\x34\x13\x00\x78\x7d\x79\xf9\x52\x6b\
+\x23\xaa\x17\x01\x02\x33\x0b\xa4\x20\x40\xdc\x31\x24\x08\x30\xb3\
+\xab\xe4\x08\x10\x20\xb0\xb0\x80\x13\xff\x85\x81\x25\xdf\x8e\x40\
+\x83\x35\x6d\xe5\x31\x80\x97\x66\xda\x36\x06\xf4\xcd\x54\x56\x45\
+\x09\x10\x98\x45\x20\xf5\x1b\x1e\x0b\x98\x45\x52\x22\x04\x08\x10\
+\x58\x54\xc0\x89\xff\xa2\xbc\x12\x6f\x50\xa0\xc5\x2a\xb7\xf2\x18\
+\x40\x13\x01\x00\x57\xf1\x5a\xdc\x85\xd5\x99\xc0\x8c\x02\x02\x01\
+\x33\x62\x4a\x8a\x00\x01\x02\xf3\x0a\xc4\x38\xcf\x9f\x33\x9e\xd7\
+\x54\x6a\xcd\x0b\x34\x0b\xd0\xc2\x5d\x00\x4d\x04\x00\x9a\xdd\x82\
+\x55\x9c\x00\x81\x79\x05\x04\x02\xe6\xf5\x94\x1a\x01\x02\x04\x9e\
+\x10\x88\x13\xff\xb8\x4b\x2b\x1e\xd9\x7a\x22\x19\xab\x12\x20\x70\
+\x21\x60\x46\xcd\x02\x6d\x04\x00\xd2\xa0\xbd\xe6\x46\x54\x37\x02\
+\x04\x56\x16\x48\x7d\x4a\x0c\x3a\x63\xf0\xb9\x72\xce\xb2\x23\x40\
+\x80\x40\xf3\x02\xfd\xed\xfe\x4e\xfc\x9b\xdf\x14\x00\x2c\x25\xd0\
+\x70\xba\x2d\x3c\x06\x50\x7d\x00\xc0\x00\xbd\xe1\x3d\x58\xd5\x09\
+\x2c\x2d\x10\x81\x80\x7f\xfc\xf9\x97\xa5\xb3\x91\x3e\x01\x02\x04\
+\x08\xec\x76\xfd\x89\xbf\xdb\xfd\x6d\x0d\x04\x96\x15\x68\x3d\xf5\
+\xda\x1f\x03\xa8\x3e\x00\xd0\xfa\x06\xac\xfe\x04\x08\x2c\x2c\x10\
+\x41\x80\x9f\x7f\x38\x08\x36\x2e\xec\x2c\x79\x02\x04\x9a\x16\x88\
+\x3e\xd6\x89\x7f\xd3\x9b\x80\xca\xaf\x27\xd0\x7c\x4e\x71\x17\x40\
+\xcd\x08\xf5\x07\x00\xd2\xe0\xbc\xe6\x06\x54\x37\x02\x04\x32\x11\
+\x48\x7d\xcd\x5f\x7f\xfe\xe1\xb7\xb8\x42\x95\x49\x89\x14\x83\x00\
+\x01\x02\xc5\x0b\x44\x9f\x1a\x7d\xab\xdb\xfd\x8b\x6f\x4a\x15\x28\
+\x46\x40\x41\x43\x20\xfa\x9e\xf8\x5d\xe3\x54\x75\x00\x20\xa2\xc5\
+\x35\x36\x9a\x3a\x11\x20\x90\xa7\x40\x44\x8c\xe3\x0a\x95\xbe\x27\
+\xcf\xf6\x51\x2a\x02\x04\xca\x12\x88\xbe\x34\xfa\xd4\xe8\x5b\xcb\
+\x2a\xb9\xd2\x12\x28\x58\x40\xd1\x3b\x81\x9a\x1f\x03\xa8\x3a\x00\
+\xb0\x3f\x1c\x7e\xec\x5a\xd0\x0f\x02\x04\x08\xac\x29\x70\x38\x7c\
+\xf5\x25\x81\x6b\x82\xcb\x8b\x00\x81\x9a\x04\xe2\xca\x9b\xab\xfe\
+\x35\xb5\xa8\xba\x94\x24\xa0\xac\x6f\x02\x35\x07\x1e\xab\x0e\x00\
+\xd4\xdc\x70\x6f\x9b\xa6\x9f\x04\x08\x64\x2d\x10\x81\x00\x5f\x12\
+\x98\x75\x13\x29\x1c\x01\x02\x79\x09\xc4\x89\xbf\xab\xfe\x79\xb5\
+\x89\xd2\x34\x25\xa0\xb2\x47\x02\x11\x8c\x3c\x7a\x5b\xcd\xcb\x6a\
+\x03\x00\x71\xdb\x58\x35\xad\xa4\x22\x04\x08\x94\x2b\x10\x41\x00\
+\x5f\x12\x58\x6e\xfb\x29\x39\x01\x02\xab\x08\xc4\x40\x3b\xee\x9c\
+\x72\xf1\x66\x15\x6e\x99\x10\xb8\x21\x60\xf6\xb1\x40\xad\x8f\x01\
+\x54\x1b\x00\xf0\x65\x31\xc7\x9b\xaf\xd7\x04\x08\x6c\x2e\x10\x81\
+\x00\x77\x03\x6c\xde\x0c\x0a\x40\x80\x40\x5e\x02\x71\xe2\xdf\x5f\
+\xf5\xcf\xab\x64\x4a\x43\xa0\x41\x01\x55\x3e\x11\x88\x80\x64\xf4\
+\x51\x27\x33\x2b\x78\x53\x65\x00\xa0\xc6\x86\xaa\x60\x5b\x53\x05\
+\x02\x04\x22\x08\xe0\x6e\x00\xdb\x01\x01\x02\x04\x3a\x81\xb8\x5b\
+\xd3\xed\xfe\x1d\x85\x1f\x04\xb2\x10\x50\x88\x36\x04\xaa\x0c\x00\
+\xbc\xbe\xbc\x7c\x69\xa3\xf9\xd4\x92\x00\x81\x22\x05\x22\x10\xe0\
+\x6e\x80\x22\x9b\x4e\xa1\x09\x10\x98\x47\x20\xae\xfa\xbb\x5b\x73\
+\x1e\x4b\xa9\x10\x98\x49\x40\x32\x57\x04\x6a\x7c\x0c\xe0\xe5\x4a\
+\x3d\xcb\x9f\x95\x06\xd7\xe5\x57\x42\x0d\x08\x10\xa8\x5a\x20\xf5\
+\x53\xf1\xbc\xab\x3b\x96\xaa\x6e\x65\x95\x23\x40\xe0\x4c\x20\xfa\
+\xbc\x38\xf9\x8f\x5b\x6b\xcf\x3e\xf2\x96\x00\x81\x4d\x05\x64\x7e\
+\x4d\x20\xfa\xaa\xe8\xb7\xae\x7d\x56\xea\xbc\xea\x02\x00\x71\x3b\
+\x59\xa9\x8d\xa1\xdc\x04\x08\xb4\x27\x10\xb7\xbf\xea\xb7\xda\x6b\
+\x77\x35\x26\xd0\xa2\x40\xf4\x75\xd1\xe7\xc5\x80\xba\xc5\xfa\xab\
+\x33\x81\xac\x05\x14\xee\xa6\x40\x6d\x77\x01\x54\x17\x00\xb8\xd9\
+\x72\x3e\x20\x40\x80\x40\xae\x02\x71\x37\x80\x47\x02\x72\x6d\x1d\
+\xe5\x22\x40\x60\x06\x81\xb8\xea\xef\x96\xff\x19\x20\x25\x41\x60\
+\x21\x01\xc9\xb6\x23\x50\x5f\x00\x20\x0d\xa4\xdb\x69\x3e\x35\x25\
+\x40\xa0\x1a\x81\xd4\x77\x79\x24\xa0\x9a\xd6\x54\x11\x02\x04\xde\
+\x05\xe2\xd6\xd9\x38\xf9\x77\xd5\xff\x1d\xc4\x2f\x02\x79\x0a\x28\
+\xd5\x1d\x81\xe8\xbf\xa2\x2f\xbb\xb3\x48\x51\x1f\x55\x15\x00\x88\
+\x5b\xcb\x8a\xd2\x57\x58\x02\x04\x08\x9c\x09\xc4\xed\xb1\xfa\xb2\
+\x33\x14\x6f\x09\x10\x28\x52\x20\xfa\xb2\xe8\xd3\x62\xf0\x5c\x64\
+\x05\x14\x9a\x40\x33\x02\x2a\xfa\x48\xa0\xa6\xc7\x00\xaa\x0a\x00\
+\x3c\x6a\x38\x9f\x13\x20\x40\xa0\x08\x81\xb8\x1b\xc0\x23\x01\x45\
+\x34\x95\x42\x12\x20\x70\x5d\x20\xae\xfa\xbb\xe5\xff\xba\x8d\xb9\
+\x04\xb2\x13\x50\xa0\x87\x02\x35\x05\x32\xeb\x0a\x00\xa4\x41\xf3\
+\xc3\xd6\xb3\x00\x01\x02\x04\x4a\x10\x48\xfd\x99\x47\x02\x4a\x68\
+\x28\x65\x24\x40\xe0\x58\x20\x6e\x93\x8d\x93\xff\x9a\x06\xcb\xc7\
+\xf5\xf3\x9a\x40\x8d\x02\xea\x34\x4c\x20\xfa\xb7\x61\x4b\xe6\xbd\
+\x54\x35\x01\x80\xb8\xcd\x2c\x6f\x6a\xa5\x23\x40\x80\xc0\x78\x81\
+\xb8\x7d\x56\xff\x36\xde\xcd\x1a\x04\x08\xac\x2f\x10\x7d\x55\xf4\
+\x59\x4e\xfe\xd7\xb7\x97\x23\x81\x27\x04\xac\x3a\x50\xa0\x96\xc7\
+\x00\xaa\x09\x00\x0c\x6c\x37\x8b\x11\x20\x40\xa0\x3c\x81\xb8\x1b\
+\xc0\x23\x01\xe5\xb5\x9b\x12\x13\x68\x48\x20\x4e\xfe\xdd\xf2\xdf\
+\x50\x83\xab\x6a\x45\x02\xaa\x32\x54\xa0\x96\xe0\x66\x3d\x01\x80\
+\x34\x40\x1e\xda\x78\x96\x23\x40\x80\x40\x71\x02\xa9\x8f\x8b\xdb\
+\x6a\x8b\x2b\xb7\x02\x13\x20\x50\xbd\x40\xd7\x37\xa5\x3e\xaa\xfa\
+\x8a\xaa\x20\x81\x1a\x05\xd4\x69\x94\x40\x0d\x8f\x01\x54\x11\x00\
+\xe8\xa2\xce\xa3\x9a\xce\xc2\x04\x08\x10\x28\x4f\x20\x22\xcf\xbe\
+\x17\xa0\xbc\x76\x53\x62\x02\xb5\x0a\xc4\x40\x38\x4e\xfe\xa3\x6f\
+\xaa\xb5\x8e\xea\x45\xa0\x76\x01\xf5\x1b\x27\x50\xc3\x63\x00\x55\
+\x04\x00\xf6\x87\xc3\x8f\xe3\x9a\xce\xd2\x04\x08\x10\x28\x57\x20\
+\x9e\xb1\x8d\x81\x77\xb9\x35\x50\x72\x02\x04\x4a\x17\x88\x3e\x28\
+\xfa\x22\x27\xff\xa5\xb7\xa4\xf2\x37\x2e\xa0\xfa\x23\x05\xa2\xcf\
+\x8b\xfe\x6f\xe4\x6a\x59\x2d\x5e\x7c\x00\x20\x1a\x20\x1a\x22\x2b\
+\x55\x85\x21\x40\x80\xc0\xc2\x02\x31\xf0\x76\xf7\xd3\xc2\xc8\x92\
+\x27\x40\xe0\xaa\x40\xf4\x3d\xd1\x07\x5d\xfd\xd0\x4c\x02\x04\x0a\
+\x12\x50\xd4\x16\x05\x8a\x0f\x00\xbc\xbe\xbc\x7c\x69\xb1\xe1\xd4\
+\x99\x00\x01\x02\xf1\x85\x5b\x31\x10\x27\x41\x80\x00\x81\xb5\x04\
+\xba\x3e\xc7\xf3\xfe\x6b\x71\xcb\x87\xc0\xb2\x02\x52\x9f\x24\x50\
+\xfa\x63\x00\x2f\x93\x6a\x9d\xd3\x4a\x0e\x42\x39\xb5\x86\xb2\x10\
+\x20\xb0\xb6\x40\xea\x03\xbb\x01\xf9\xda\xf9\xca\x8f\x00\x81\xe6\
+\x04\xba\xbe\x26\xf5\x39\xcd\x55\x5c\x85\x09\x54\x2a\xa0\x5a\xd3\
+\x04\xe2\xee\xf3\xb8\x0b\x7d\xda\xda\xdb\xaf\x55\x74\x00\xa0\x3b\
+\x10\x6d\x6f\xa8\x04\x04\x08\x10\xd8\x56\x20\x0d\xc8\xf5\x87\xdb\
+\x36\x81\xdc\x09\xd4\x2e\x10\x5f\xf6\x17\x77\x1d\xd5\x5e\x4f\xf5\
+\x23\xd0\x90\x80\xaa\x3e\x21\x50\xf2\x5d\x00\x45\x07\x00\x9e\x68\
+\x33\xab\x12\x20\x40\xa0\x2e\x81\x14\x04\xe8\x06\xe8\x75\xd5\x4a\
+\x6d\x08\x10\xd8\x58\x20\xae\x72\x45\xdf\x12\x57\xbc\x36\x2e\x8a\
+\xec\x09\x10\x98\x55\x40\x62\xad\x0a\x94\x1d\x00\x48\x03\xde\x56\
+\x1b\x4e\xbd\x09\x10\x20\x70\x2e\x10\x03\x74\x7f\x26\xf0\x5c\xc5\
+\x7b\x02\x04\xa6\x0a\xc4\xc9\x7f\x7c\xd9\x5f\xf4\x2d\x53\xd3\xb0\
+\x1e\x01\x02\x99\x0a\x28\xd6\x53\x02\xd1\x2f\x46\x1f\xf9\x54\x22\
+\x1b\xad\x5c\x6c\x00\xc0\xed\xae\x1b\x6d\x31\xb2\x25\x40\x20\x7b\
+\x81\x18\xb0\xeb\x23\xb3\x6f\x26\x05\x24\x90\xb5\x40\xf4\x21\xd1\
+\x97\x64\x5d\x48\x85\x23\x40\x60\xb2\x80\x15\x9f\x17\x28\xf5\x31\
+\x80\x62\x03\x00\xcf\x37\x99\x14\x08\x10\x20\x50\xb1\xc0\xe1\xf0\
+\x35\x06\xf0\x15\xd7\x50\xd5\x08\x10\x58\x48\xa0\xeb\x3b\x52\x1f\
+\xb2\x50\xf2\x92\x25\x40\x60\x7b\x01\x25\x98\x41\x20\xee\x02\x98\
+\x21\x99\xd5\x93\x28\x37\x00\xe0\xc0\xb4\xfa\xc6\x22\x43\x02\x04\
+\x0a\x13\x48\xfd\x64\x37\x90\x2f\xac\xd8\x8a\x4b\x80\xc0\x76\x02\
+\x5d\x9f\x91\xfa\x8e\xed\x4a\x20\x67\x02\x04\x96\x17\x90\xc3\x5c\
+\x02\x25\x3e\x06\x50\x64\x00\xa0\x3b\x38\xcd\xd5\x6a\xd2\x21\x40\
+\x80\x40\xcd\x02\x69\x20\xaf\xcf\xac\xb9\x81\xd5\x8d\xc0\x7c\x02\
+\x5d\x5f\x91\xfa\x8c\xf9\x52\x94\x12\x01\x02\x59\x0a\x28\xd4\x6c\
+\x02\x25\x3e\x06\x50\x64\x00\x60\xb6\x16\x93\x10\x01\x02\x04\x5a\
+\x10\x48\x03\xfa\x6e\x60\xdf\x42\x5d\xd5\x91\x00\x81\x49\x02\x5d\
+\x1f\x91\xfa\x8a\x49\x2b\x5b\x89\x00\x81\xa2\x04\x14\x76\x3e\x81\
+\x12\x1f\x03\x28\x33\x00\xe0\x00\x35\xdf\x56\x2b\xa5\xa7\x04\xf6\
+\xbb\xdd\xf7\x7e\xda\xed\xf7\xdf\x62\x7a\x39\x1c\x7e\xba\x35\xfd\
+\xe7\xd7\x3f\xf6\xb7\xa6\xf3\x75\x22\xad\x6b\x53\x9f\x5f\xff\x7b\
+\xe7\x1f\x81\x21\x02\xa9\xdf\xec\x06\xf8\x43\x96\xb5\x0c\x01\x02\
+\x4d\x09\x74\x7d\x43\xea\x23\x9a\xaa\xb4\xca\x4e\x16\xe8\xc7\x1f\
+\xc7\xbf\xcf\xc7\x2b\xe7\x63\x9a\xfe\xfd\xb5\x31\x50\xff\x59\xff\
+\xfb\x3c\xad\xfe\xfd\x71\x7e\xf1\x7a\x72\x05\xac\x48\x60\x66\x81\
+\xd2\x1e\x03\x28\x2e\x00\xd0\x1d\xa4\x66\x6e\x34\xc9\x11\xb8\x25\
+\x10\x07\x98\x98\xe2\xe0\xd3\x1f\x98\xe2\x77\x7f\x00\xfb\xf7\xaf\
+\x7f\xfc\xd4\x4f\xff\xf9\xe7\x7f\x7f\x89\xe9\x5f\xff\xf7\xbf\xef\
+\xb7\xa6\x5b\xf9\xc4\xfc\xf3\x75\x22\xad\x6b\x53\x9f\x5f\xff\xbb\
+\x2f\x4b\x94\x2b\xca\x19\x53\x57\xe6\x48\xd4\x44\xe0\x58\x20\x0d\
+\xf0\xf5\xa1\xc7\x20\x5e\x13\x20\xd0\xf5\x09\xa9\x6f\x20\x41\xe0\
+\x58\x20\xc6\x11\xfd\x14\xe3\x8a\x18\x63\xc4\x14\x63\x8e\x7e\xfc\
+\x71\xfc\xfb\x7c\xbc\x72\x3e\xa6\xe9\xdf\x1f\xe7\xd1\xbf\xee\x3f\
+\xeb\x7f\x9f\xa7\xd5\xbf\x3f\xce\x2f\x5e\x47\x59\x62\x8a\x72\x45\
+\x19\x63\x8a\x32\xf7\xe9\xfa\x7d\x4b\xc0\xfc\xb9\x05\x4a\x7b\x0c\
+\xa0\xb8\x00\xc0\xfe\x70\xf8\x71\xee\x46\x93\x1e\x81\x38\x60\xc4\
+\x14\x07\x8f\x38\x90\xc4\x14\x07\x95\x38\xc0\xc4\x14\x07\x9f\xfe\
+\xc0\x14\xbf\x73\x14\x8b\x72\x45\x39\x63\xea\xca\xfc\x7e\xb7\x41\
+\xd4\x25\xea\xd5\x4f\x5d\x3d\x73\xac\x80\x32\xad\x23\x90\x06\xfa\
+\xdd\x80\x7f\x9d\xdc\xe4\x42\x80\x40\xc6\x02\x5d\x5f\x90\xfa\x84\
+\x8c\x8b\xa8\x68\x0b\x0b\xc4\x98\x20\xa6\x18\x23\xc4\x78\x21\xa6\
+\xe3\xf1\x4f\x37\x9e\x48\x17\x38\x62\x8c\x11\xd3\xc2\xc5\x99\x94\
+\x7c\x94\x2b\xc6\x3e\x31\x75\xe5\x35\xfe\xb9\xef\xe8\xd3\xd9\x05\
+\xe2\x31\x80\x92\xee\x02\x28\x2e\x00\x10\xc0\xb3\xb7\x9a\x04\x9b\
+\x12\x88\x03\x5d\x4c\x71\x90\x8b\xe9\xf8\x40\x17\x07\x8f\x38\x90\
+\xc4\x54\x0b\x4a\xd4\x25\xea\xd5\x4f\xd7\x0e\x8e\xe1\x51\x4b\x7d\
+\xd5\x63\x80\x40\x1a\xf0\x77\x03\xff\x01\x8b\x5a\x84\x00\x81\x3a\
+\x05\xba\x3e\x20\xf5\x05\x75\xd6\x4e\xad\xae\x09\x74\xc7\xfa\xfd\
+\xfe\x5b\x3f\xf6\x31\xfe\xd9\x7f\xeb\x4c\xae\x61\x55\x3c\x4f\xd5\
+\x08\x14\x15\x00\xe8\x0e\x56\xda\x8c\xc0\x48\x81\xae\x73\x3f\x3a\
+\xe0\xc5\x09\x70\x4c\x71\x62\x1c\xd3\xc8\xe4\xaa\x5a\x3c\xea\x1f\
+\x81\x81\xf0\x88\x81\xc0\x2e\x39\xc5\xd4\x99\x55\x55\x53\x95\xb9\
+\x10\x48\x03\x7f\x7d\xea\x85\x8a\x19\x04\x9a\x10\xe8\xf6\xfd\xd4\
+\x07\x34\x51\xd9\x86\x2b\x19\xc7\xf2\x98\xfa\x13\xfe\xee\x58\xff\
+\x7e\x35\xbf\x61\x96\xae\xea\x0d\x8f\x7f\xba\xfa\xfb\x31\xbf\x40\
+\x49\x8f\x01\x14\x15\x00\xd8\x39\x58\xcd\xbf\xb5\x56\x98\x62\x1c\
+\xec\xe2\x24\xd6\x01\x6f\x7c\xe3\x46\x30\x20\xa6\x6e\x90\xf0\xeb\
+\x1f\xfb\x70\x8c\x69\xbf\xdb\x7d\xdf\xf9\x57\x9f\x40\xea\x53\xbb\
+\x13\x81\xfa\x6a\xa6\x46\x04\x08\xdc\x10\xe8\xf6\xf9\xb4\xef\xdf\
+\xf8\xd8\xec\x82\x05\xe2\x58\x1d\xd3\xf1\xf8\x27\x8e\xe7\x71\xb2\
+\x5b\x70\xb5\x56\x29\x7a\x8c\x7d\x62\x0a\xaf\xba\x2f\x88\xac\xc2\
+\xd9\x64\x26\x71\x97\x7a\x29\x8f\x01\x14\x13\x00\x28\x05\xb4\xc9\
+\x2d\x3e\x83\x4a\x9f\x1f\xf0\xa2\x13\x77\xc0\x7b\xbe\x61\xc2\x31\
+\xa6\xf3\x03\xe2\xf3\x29\x4b\x21\x1b\x81\x74\x22\xd0\x9d\x10\x64\
+\x53\x20\x05\x21\x40\x60\x29\x81\x6e\x5f\x4f\xfb\xfc\x52\xe9\x4b\
+\x77\x5d\x81\x18\xfb\xc4\xe4\x84\x7f\x7e\xf7\x18\xfb\xc4\x54\xdd\
+\xf8\x67\x7e\x2a\x29\x1e\x09\x94\x72\x17\x40\x31\x01\x80\xd7\x97\
+\x97\x2f\x47\xbe\x5e\x12\xd8\x9d\x1f\xf4\x9c\xf0\x2f\xbf\x51\xc4\
+\xc1\xb0\x9b\x7e\x7d\xfb\x73\x86\xbb\xbd\xe7\xe7\x96\x57\x5f\x21\
+\x87\x74\x42\x20\xc8\xba\x82\xb3\x2c\x08\x6c\x28\xe0\xe4\x7f\x43\
+\xfc\x19\xb3\xee\xc7\x3e\x71\xd2\x1f\x27\xa7\x31\x19\xff\xcc\x08\
+\x7c\x23\xa9\x6e\xec\xf3\xcf\xff\xfe\x12\x77\x07\xc4\x54\xea\xf8\
+\xe7\x46\xf5\xcc\x6e\x4c\xe0\xa5\x98\xfa\xa6\x01\x6a\x31\x65\x55\
+\xd0\x45\x04\xe2\xa0\x17\x53\x1c\xf4\xa2\xf3\x75\xd0\x5b\x84\x79\
+\x54\xa2\x71\x40\x8c\x76\x88\x36\x89\x83\xe1\xa8\x95\x2d\x9c\x95\
+\xc0\xeb\x7e\xff\x9b\x20\x40\x56\x4d\xa2\x30\x04\x66\x13\xe8\xf6\
+\x6d\xe3\xa8\xd9\x3c\xd7\x4e\x28\xc6\x3e\x31\xc5\xb1\x36\x8e\xb9\
+\x71\xc2\x1f\xd3\xda\xe5\x90\xdf\xa7\x40\xa1\xe3\x9f\xcf\x0a\x78\
+\xb5\x88\x40\x29\x8f\x01\x14\x11\x00\xe8\xa2\xd6\x8b\x34\x93\x44\
+\x4b\x10\x38\x3e\xe8\xf5\x07\xbe\x12\xca\xdd\x52\x19\x63\x20\x12\
+\x07\xc3\x08\xcc\x74\x81\x80\xfd\xfe\x5b\x4b\xf5\xaf\xa5\xae\x82\
+\x00\xb5\xb4\xa4\x7a\x10\x38\x15\x88\x7d\xfb\x74\x8e\x77\x25\x08\
+\x18\xff\xe4\xdf\x4a\x65\x8d\x7f\xf2\xf7\xac\xa1\x84\x25\x3c\x06\
+\x50\x44\x00\xa0\x86\x8d\x41\x1d\xc6\x09\xf4\x07\xbd\x38\xa1\x74\
+\xd2\x3f\xce\x6e\xeb\xa5\xbb\x40\xc0\xfb\x6d\x72\x82\x01\x5b\xb7\
+\xc6\xf8\xfc\x4b\x38\x70\x8d\xaf\x95\x35\x08\xb4\x2b\xf0\xd7\x9f\
+\x7f\xf8\xad\xdd\xda\x97\x57\x73\xe3\x9f\xf2\xda\xac\x2f\x71\xf6\
+\xe3\x9f\xbe\xa0\x7e\x2f\x2a\x10\x77\x01\x2c\x9a\xc1\x0c\x89\x97\
+\x11\x00\x70\xdb\xda\x0c\x4d\x5d\x46\x12\xfd\x81\xcf\x49\x7f\x19\
+\xed\xf5\xa8\x94\xe7\x07\xc3\x68\xdf\x47\xeb\xf8\x7c\x5b\x81\x38\
+\x70\x39\x61\xd8\xb6\x0d\xe4\x4e\x60\x2e\x81\xb8\x83\x32\xf6\xe9\
+\xb9\xd2\x93\xce\x32\x02\x71\x6c\x8c\xdb\xfb\x63\x32\xfe\x59\xc6\
+\x78\xed\x54\x73\x1c\xff\xac\x6d\xd0\x72\x7e\xdd\x63\x57\x19\x03\
+\x64\x1f\x00\x88\x83\x57\xc6\x7e\x8a\x36\x83\x40\x7f\xe0\x73\xb5\
+\x7f\x06\xcc\x8c\xbd\x6e\xa5\x65\x00\x00\x10\x00\x49\x44\x41\x54\
+\x93\x88\x83\x61\x0c\x6c\x62\x80\xd3\xdd\x19\x90\x71\x59\x5b\x2f\
+\x5a\x9c\x30\xe8\x7b\x5b\xdf\x0a\xd4\xbf\x74\x81\x6e\x1f\x76\x01\
+\x25\xeb\x66\xec\xc7\x3f\x71\x6c\x8c\x5b\xc9\x63\xca\xba\xc0\x0a\
+\x37\x49\x20\x93\xf1\xcf\xa4\xb2\x5b\x69\x9a\x40\xee\x77\x53\x66\
+\x1f\x00\x98\xc6\x6e\xad\x12\x04\xce\x0f\x7c\x25\x94\x59\x19\x9f\
+\x17\x88\x01\x4e\x1c\x0c\x23\xe0\x23\x10\xf0\xbc\xe7\x62\x29\xa4\
+\x13\x87\xee\x04\x62\xb1\x0c\x24\x4c\x80\xc0\x52\x02\xdd\xbe\x9b\
+\xf6\xe1\xa5\xd2\x97\xee\x93\x02\xfb\xfd\xb7\x38\x06\xf6\x27\xfe\
+\x4f\xa6\x66\xf5\x42\x04\xb6\x1d\xff\x14\x82\x54\x49\x31\xe3\x42\
+\x4a\xce\x55\xc9\x3f\x00\xe0\x00\x96\xf3\xf6\x33\xad\x6c\x0e\x7c\
+\xd3\xdc\x2a\x5c\x4b\x20\x20\xf3\x46\x4d\xfd\x6f\x77\x22\x91\x79\
+\x31\x15\x8f\x00\x81\x4f\x81\x6e\x9f\x4d\xfb\xee\xe7\x1c\xaf\xb2\
+\x11\x78\x1f\xff\xc4\xb1\x2f\x9b\x32\x29\xc8\x26\x02\xb1\x0d\x44\
+\x10\x68\xb5\x0b\x21\x9b\xd4\xb2\xed\x4c\x73\x7e\x0c\x20\xeb\x00\
+\x40\x77\x10\x6b\x7b\xdb\xa9\xab\xf6\x0e\x7c\x75\xb5\xe7\x8c\xb5\
+\x71\x20\x9c\x11\x73\xee\xa4\xd2\x89\x44\xce\x07\xb1\xb9\xab\x2b\
+\x3d\x02\x25\x0b\x74\xfb\x6a\xda\x67\x4b\xae\x43\x6d\x65\xef\xef\
+\x76\x8c\x93\xbd\x38\xd6\xd5\x56\x3f\xf5\x79\x4e\x20\xb6\x89\xd8\
+\x36\x96\x0e\x04\x3c\x57\x4a\x6b\x4f\x11\xc8\xf9\x31\x80\xac\x03\
+\x00\xfb\xc3\xe1\xc7\x29\xe0\xd6\xc9\x4c\xc0\x89\x7f\x66\x0d\x92\
+\x6f\x71\x1c\x08\xf3\x6c\x9b\xf8\x13\x62\xdd\x89\x45\x9e\xc5\x53\
+\x2a\x02\x04\x92\x40\xec\xa3\xb1\xaf\xa6\x97\xfe\x67\x20\xd0\x9f\
+\xf8\xbb\xcd\x3f\x83\xc6\x28\xa0\x08\x0b\x8f\x7f\x0a\x10\xa8\xaf\
+\x88\xf1\x18\x40\xf4\xcb\x39\xd6\x2c\xeb\x00\x40\xc0\xe5\x88\xa6\
+\x4c\x03\x05\x9c\xf8\x0f\x84\xb2\xd8\xb9\x80\x03\xe1\xb9\xc8\xf6\
+\xef\x73\x8e\x64\x6f\xaf\xa3\x04\x04\xb6\x17\x70\xf2\xbf\x7d\x1b\
+\x44\x09\x9c\xf8\x87\x82\x69\xaa\xc0\x32\xe3\x9f\xa9\xa5\xb1\xde\
+\xb3\x02\xaf\x2f\x2f\x5f\x9e\x4d\x63\x89\xf5\x5f\x96\x48\x74\x8e\
+\x34\xdd\xfe\x3f\x87\xe2\x46\x69\x38\xf1\xdf\x08\xbe\xbe\x6c\x4f\
+\x0e\x84\x69\xbb\xaa\xaf\x86\xe5\xd4\x28\x02\xb2\xfe\x3c\x60\x39\
+\xed\xa5\xa4\x6d\x09\xd8\x37\xb7\x6f\x6f\x27\xfe\xdb\xb7\x41\x4d\
+\x25\x98\x75\xfc\x53\x13\x4c\x61\x75\xc9\xf5\x6e\xf6\x6c\x03\x00\
+\x3b\xcf\xb0\x15\xb6\x89\xa7\xe2\xa6\x13\xb4\x78\x8e\x29\x3a\xad\
+\xf4\xce\x7f\x02\xb3\x09\xc4\x36\x15\x93\x67\xe4\x66\x23\x9d\x94\
+\x50\x04\x01\x04\x67\x27\xd1\x59\x89\xc0\x62\x02\xb1\x4f\xc6\xbe\
+\xb9\x58\x06\x12\xbe\x2b\xe0\xc4\xff\x2e\x8f\x0f\x9f\x14\x88\xb1\
+\x4f\x4c\xcf\x8c\x7f\x9e\x2c\x82\xd5\x9f\x10\x88\xbe\x39\xc7\xc7\
+\x00\xb2\x0c\x00\xe4\x08\xf5\x44\xdb\x57\xbf\x6a\x7f\xf0\xeb\x3a\
+\xa8\xea\x6b\xab\x82\x5b\x0a\xc4\x36\x16\x41\x26\x07\xc2\x0d\x5b\
+\x21\x05\x67\xe3\x84\x63\xc3\x12\xc8\x9a\x00\x81\x77\x81\x6e\x5f\
+\x4c\xfb\xe4\xfb\x5b\xbf\xd6\x16\x48\x17\x3e\x3c\xe3\xbf\x36\x7a\
+\x9b\xf9\x3d\x31\xfe\x69\x13\x2c\xa3\x5a\xe7\xf8\x08\x65\x96\x01\
+\x80\x5c\x9f\x97\xc8\x68\x5b\xca\xa2\x28\xfd\x89\xbf\x83\x5f\x16\
+\xcd\xd1\x54\x21\x1c\x08\x37\x6e\xee\x74\xc2\x21\x50\xbb\x71\x1b\
+\xc8\xbe\x79\x81\x6e\x1f\x4c\xfb\x62\xf3\x10\x1b\x00\xf4\xe3\x9f\
+\x38\x16\x6d\x90\xbd\x2c\x1b\x16\x88\x6d\x6e\xdc\x85\x90\x86\xb1\
+\x32\xa9\x7a\xdc\x05\x90\x49\x51\x3e\x8a\x91\x65\x00\xc0\xed\xff\
+\x1f\xed\x93\xef\x0b\x51\xef\x7c\xdb\xa6\xa1\x92\xc5\x81\xd0\xdd\
+\x00\xdb\x34\x78\x8e\x11\xed\x6d\x24\xe4\x4a\x60\x1b\x01\x5f\xfa\
+\xb7\xbe\x7b\x7f\xe2\xef\xc2\xc7\xfa\xf6\x72\x3c\x15\x18\x3c\xfe\
+\x39\x5d\xcd\xbb\x8d\x04\xba\x80\xed\x46\x79\x5f\xcb\x36\xbb\x00\
+\x40\x77\x3b\xdb\xb5\x92\x9a\x97\x85\x40\x1c\xfc\x22\xf2\xd8\x75\
+\x3c\x59\x94\x48\x21\x5a\x17\x88\x6d\x31\xb6\x49\x81\x80\x75\xb7\
+\x84\x88\x68\xfb\xe2\xb1\x75\xcd\xe5\x46\xa0\x17\x30\x56\xea\x25\
+\x56\xfc\xed\xc2\xc7\x8a\xd8\xb2\x1a\x22\x30\x64\xfc\x33\x24\x1d\
+\xcb\x2c\x2f\x90\xdb\x45\x93\xec\x02\x00\xcb\x37\x81\x1c\xa6\x08\
+\xc4\x89\xff\xcb\xe1\xf0\x53\x44\xbd\xa7\xac\x6f\x1d\x02\x4b\x0b\
+\x38\x10\x2e\x2d\x7c\x99\x7e\x04\x01\x9c\x88\x5c\xba\x98\x43\x60\
+\x49\x81\x6e\x9f\x73\xeb\xff\x92\xc4\x27\x69\xf7\xe3\x9f\x38\xc6\
+\x9c\x7c\xe0\x0d\x81\x4c\x04\x62\xdb\xbc\x71\x21\x24\x93\x12\x2a\
+\x46\x8c\x97\x72\x52\xc8\x2f\x00\xe0\xa0\x96\xd3\xf6\xf1\x56\x16\
+\x51\xef\x37\x07\x3f\x8b\x10\x88\x03\xa1\xbb\x01\x56\x6c\xaa\xd4\
+\x67\xe7\x76\x6b\xdb\x8a\xb5\x97\x15\x81\x55\x05\xba\x7d\x2d\xed\
+\x73\xab\x66\xda\x68\x66\xfd\x89\x7f\x5c\xf8\xf8\xd7\xff\xfd\xef\
+\x7b\xa3\x0c\xaa\x5d\x90\xc0\xe5\xf8\xa7\xa0\xc2\x37\x50\xd4\xae\
+\xff\xce\xa4\x9e\x59\x05\x00\xba\xa8\x76\x26\x30\x8a\xb1\xdb\xf5\
+\x07\xbf\xae\x43\xd9\xf9\x47\xa0\x1c\x81\xd8\x66\x45\xc3\xd7\x6b\
+\xaf\xdc\x6e\x6d\x5b\xaf\xe6\x72\x22\xb0\xae\x80\xe7\xfe\x57\xf2\
+\x76\xe1\x63\x25\x68\xd9\xcc\x2d\x70\x32\xfe\x99\x3b\x71\xe9\x3d\
+\x25\x90\xd3\x58\x29\xab\x00\xc0\x53\xaa\x56\x9e\x57\xc0\xc1\x6f\
+\x5e\x4f\xa9\x6d\x22\x10\x07\xc2\x78\x74\x25\x82\x59\x9b\x14\xa0\
+\x91\x4c\xe3\xd6\x36\xdf\x07\xd0\x48\x63\xab\xe6\x66\x02\x2e\x92\
+\x2c\x4f\x1f\xc7\x8a\x38\x66\xc4\xb1\x63\xf9\xdc\xe4\x40\x60\x39\
+\x81\xd8\x86\x63\x5b\x8e\x6d\x7a\xb9\x5c\xa4\x3c\x46\x20\xc6\x4a\
+\x63\x96\x5f\x72\xd9\xbc\x02\x00\x6e\x6b\x5b\xb2\xad\x07\xa5\x1d\
+\x1d\x45\x74\x18\xd1\x71\x0c\x5a\xc1\x42\x04\x32\x17\x88\x5b\x37\
+\xe3\x16\xce\x5d\x0a\x6a\x65\x5e\xd4\xa2\x8b\x17\x07\x36\x27\x28\
+\x45\x37\xa1\xc2\x67\x2c\xd0\xed\x5b\xc6\x48\xcb\xb6\x50\x3a\x46\
+\xc4\xb1\x22\x8e\x19\xcb\x66\x24\x75\x02\xab\x08\xec\x62\x5b\x8e\
+\x6d\xda\xf8\x67\x1d\xef\x21\xb9\xe4\xf2\x18\x40\x36\x01\x80\xee\
+\xe0\x36\x44\xce\x32\xcb\x09\x38\xf8\x2d\x67\x2b\xe5\xcd\x05\xba\
+\xa0\x56\xda\xc6\x37\x2f\x48\xcd\x05\x48\x27\x28\xb9\x1c\xdc\x6a\
+\x66\x56\xb7\xb6\x04\xba\x7d\x2a\xed\x5b\x6d\xd5\x7a\xe5\xda\xa6\
+\x63\x43\x77\x8c\x58\x39\x5b\xd9\x11\x58\x4e\xe0\x33\xe5\x6e\xdb\
+\x4e\xdb\xf8\xe7\x1c\xaf\xb6\x12\xc8\xe5\x31\x80\x6c\x02\x00\xfb\
+\xc3\xe1\xc7\xad\x1a\x43\xbe\xbb\x9d\xab\xfe\xb6\x82\x16\x04\xe2\
+\x20\x18\xdb\xfa\x7e\xb7\xf3\x85\x4e\xbb\x65\xfe\xe5\x72\x70\x5b\
+\xa6\x76\x52\x25\xb0\xbe\x80\xe7\xfe\x97\x33\x8f\x63\x41\x1c\x13\
+\xe2\xd8\xb0\x5c\x2e\x52\x26\xb0\x81\xc0\x59\x96\xb1\x8d\xc7\xb6\
+\x1e\xdb\xfc\xd9\x47\xde\xae\x28\x10\x77\x4b\x76\x41\xdd\x15\xf3\
+\xbc\x96\x55\x36\x01\x80\x00\xb9\x56\x40\xf3\x96\x15\x88\x8e\x20\
+\xbe\x2c\x2d\x6e\x13\x5a\x36\x27\xa9\x13\xc8\x43\x20\xb6\x75\xb7\
+\xc4\x2d\xd7\x16\xd1\x97\xfb\x3e\x80\xe5\x7c\xa5\xdc\x96\x80\xbb\
+\x23\x17\x6c\xef\x74\x45\x34\x8e\x05\x71\x4c\x58\x30\x17\x49\x13\
+\xd8\x44\xe0\x5a\xa6\xb1\xad\xc7\x36\xef\x91\x80\x6b\x3a\xeb\xcd\
+\x7b\x7d\x79\xf9\xb2\x5e\x6e\xd7\x73\x7a\xb9\x3e\x7b\xdd\xb9\x0e\
+\x70\xeb\x7a\x7f\xe4\xf6\x7e\xf0\xfb\x78\xef\x05\x81\x86\x04\x22\
+\x1a\xee\x20\xb8\x4c\x83\x47\x10\x40\xbf\xbe\x8c\xed\xad\x54\xe3\
+\x8a\xc2\xf1\x14\xfe\xfd\x14\x01\x99\xe3\xe9\x2f\x3f\xff\x70\x38\
+\x9e\x8e\x3f\x8b\xd7\xfd\x7a\xc7\xbf\x23\xed\x5b\x79\x9b\xbf\x8c\
+\x40\xf8\xef\xdc\xfa\xbf\x0c\x6e\x1a\xff\x74\xc7\x80\x65\x52\x97\
+\x2a\x81\xad\x05\xee\xe6\xdf\x6d\xfb\x69\x1f\xb8\xbb\x90\x0f\x17\
+\x13\xc8\xe1\xae\xf7\x2c\x02\x00\x0e\x70\x8b\x6d\x63\x37\x13\x8e\
+\xdb\x80\xba\x0e\xe0\xe6\x12\x3e\x20\x50\xbf\x40\xec\x03\xb1\x2f\
+\xc4\x9d\x30\xf5\xd7\x76\xe5\x1a\xa6\x13\x17\x27\x8d\xcb\x98\x87\
+\x6b\x4c\x71\xb2\x1e\x53\x9c\xcc\xc7\x6d\xe2\xc7\x53\x77\x5c\x4d\
+\x6d\x10\xbf\x23\x20\x73\x3c\x9d\x97\xea\xf8\xb3\x78\x1d\xeb\x9c\
+\x4f\x91\x76\xe4\x13\x53\x97\xe7\x3f\xfe\xfc\x4b\x9c\xa0\x46\x39\
+\xce\xd3\xf3\x7e\x26\x81\x68\xbf\x99\x92\x92\xcc\x9b\x40\xf4\xf5\
+\xd1\xe7\x47\xdf\xff\x36\xc7\x4f\x02\x35\x0a\x3c\xae\x53\xec\x03\
+\xb1\x2f\xc4\x3e\xf1\x78\x69\x4b\xcc\x29\x10\xc7\xd9\xad\x8f\x9d\
+\x9b\x07\x00\xb6\x06\x98\xb3\x41\x4b\x48\x2b\x76\xf4\xd8\xe1\xe3\
+\x36\xa0\x12\xca\xab\x8c\x04\x96\x16\x88\x7d\xc1\x2d\x71\xcb\x28\
+\xfb\x3e\x80\xe7\x5d\xe3\x18\x19\x53\x9c\x74\xc7\x14\x27\xe0\x71\
+\x32\x1e\x53\x0c\x22\x62\x7a\x3e\x97\x71\x29\x74\x79\xc6\xc9\x69\
+\x9a\xa2\x1c\x51\xa6\x6e\x12\x14\x18\x07\x79\x67\xe9\x08\xae\xdc\
+\xf9\xd8\x47\x53\x04\xd2\x15\xcf\xe8\xeb\xa3\xcf\x9f\xb2\xba\x75\
+\x08\x14\x23\x30\xb0\xa0\xb1\x2f\xc4\x3e\xe1\x6e\xc8\x81\x60\x33\
+\x2e\xb6\xf5\xf8\x68\xf3\x00\x40\x0e\xcf\x41\xcc\xd8\x9e\x59\x27\
+\x15\x27\xff\xb1\xa3\xc7\x0e\x9f\x75\x41\x15\x8e\xc0\x06\x02\x11\
+\x0d\x77\x10\x9c\x17\x3e\x4e\x14\xe3\xe4\x75\xde\x54\xeb\x4e\x2d\
+\xbc\xe2\x44\x3f\xa6\x38\xa9\x8e\x13\xec\x98\xc2\x32\xa6\xac\x6b\
+\x9f\x02\x02\x71\xe7\x40\x94\x37\xca\xde\xd5\x21\x05\x05\xb2\x2e\
+\x73\x86\x85\xeb\x4e\xfe\xc3\x32\xc3\xb2\x15\x5b\xa4\x74\xf2\xdf\
+\xf5\xf1\xc5\x56\x40\xc1\x09\x0c\x17\x18\xbb\x64\xb7\x6f\xa4\x7d\
+\x64\xec\x7a\x96\x9f\x2e\xb0\xf5\xf1\x7c\xf3\x00\x40\x0c\x16\xa6\
+\xf3\x59\x73\xb0\x40\xda\xb1\xe3\xe4\x7f\xf0\xf2\x16\x24\xd0\xa0\
+\x40\x1c\x04\xe3\x0e\x99\x08\x96\x35\x58\xfd\x45\xaa\x1c\x27\x83\
+\x8b\x24\x5c\x51\xa2\xc7\x27\xfd\xe1\x15\x03\x83\x98\x4a\xaf\x62\
+\x57\x87\x74\x22\x7b\x1c\x0c\x88\xba\x96\x5e\xaf\xc5\xcb\x9f\xcc\
+\x16\xcf\xa3\x91\x0c\xa2\x2f\x8f\x3e\x3d\xfa\xf6\x46\xaa\xac\x9a\
+\x04\x26\x09\xc4\x3e\x12\xfb\x4a\xec\x33\x93\x12\xb0\xd2\x68\x81\
+\x2d\x8f\x87\x9b\x06\x00\xba\x28\xf7\x68\x2e\x2b\x8c\x15\x88\x1d\
+\x3a\x76\xec\xb1\xeb\x59\x9e\x40\x8b\x02\x71\x87\x4c\x04\xcb\x1c\
+\x04\xe7\x6b\xfd\xb8\x12\x3c\x5f\x6a\x75\xa4\x14\x07\xfe\x70\x89\
+\xa9\xa6\x93\xfe\x5b\xad\xd3\x07\x03\xa2\xae\x11\x10\x88\xe3\x7f\
+\x18\xdc\x5a\xbe\xd5\xf9\xe1\xd2\x6a\xdd\xe7\xae\x77\xf4\xe1\xd1\
+\x97\x47\x9f\x3e\x77\xda\xd2\x23\x90\xaf\xc0\xf4\x92\xc5\xbe\x12\
+\xfb\x4c\xec\x3b\xd3\x53\xb1\xe6\x50\x81\x2d\x1f\x03\xd8\x34\x00\
+\x30\x14\xc8\x72\xd3\x04\x62\x07\x8e\x93\xff\xd8\xa1\xa7\xa5\x60\
+\x2d\x02\xed\x0a\xc4\x41\xd0\x23\x01\xf3\xb4\x7f\x9c\xfc\x39\xd9\
+\xdb\xed\xc2\x20\x4e\xf8\x63\x8a\x13\xe1\x70\x89\x69\x1e\xe5\xc2\
+\x52\x49\x57\xb9\xc3\xa0\x0f\x06\x38\xf1\xdd\xed\x3a\x83\xe4\x52\
+\x58\x4b\x66\x59\xdc\x18\xff\x74\x7d\x78\x96\xa5\x53\x28\x02\x0b\
+\x0a\xcc\x90\x74\xb7\xef\xec\xf7\xdf\x66\x48\x4a\x12\x77\x04\xb6\
+\x3c\xfe\x6f\x1b\x00\x70\xa0\xbb\xb3\x59\x3c\xf7\x51\x7f\xf0\x73\
+\xf2\xff\x9c\xa3\xb5\xdb\x16\xe8\xee\x9c\x71\x10\x9c\x65\x23\xd8\
+\x32\xd2\x3d\x4b\x05\x9e\x48\xa4\x3f\xf1\x8f\x13\xde\x38\xe0\xc7\
+\xf4\x44\x72\xf5\xad\x1a\x63\x81\x34\xc5\x09\x70\x4c\xf5\x55\x70\
+\x60\x8d\x92\xc1\xc0\x25\x2d\x76\x4f\x20\xf5\xd9\xdd\x09\xcc\xbd\
+\x65\x7c\x46\xa0\x52\x81\xb9\xaa\x65\xfc\x33\x97\xe4\xfd\x74\x62\
+\x7c\x70\x7f\x89\x65\x3e\xdd\x2c\x00\xd0\xf4\x41\x7e\x99\xb6\xfc\
+\x48\xb5\x3f\xf9\xff\x98\xe1\x05\x01\x02\x93\x05\x1c\x04\x27\xd3\
+\x9d\xac\x18\x27\xbd\xad\xf5\xfb\x71\x60\x3f\xbe\xda\x7f\x02\xe2\
+\xcd\xa5\x40\x9c\x00\xa7\xa9\xbf\x2b\xe0\x72\x81\x7a\xe7\xb4\xb6\
+\x6f\x2c\xd6\x92\xe9\xe4\xbf\xeb\xb3\x17\xcb\x40\xc2\x04\xb2\x16\
+\x98\xb5\x70\xdd\xbe\x94\xf6\xa9\x59\x13\x95\xd8\x89\xc0\x56\x17\
+\x47\x36\x0b\x00\x9c\xd4\xde\x9b\xf9\x04\xd2\x8e\x2a\xf2\x3d\x1f\
+\xa7\x94\x08\x84\x80\x83\x60\x28\xcc\x30\xa5\x93\xbb\x38\x29\x9e\
+\x21\xa5\xac\x93\x88\x3a\x3a\xf1\x7f\xb2\x89\xd2\xb6\xd2\x4a\x20\
+\x20\xb6\x17\x5f\x88\xfc\xe4\xf6\x12\xab\xa7\xf1\x4f\xd7\x57\xc7\
+\x6b\x13\x81\x26\x05\xe6\xaf\x74\xb7\x4f\xa5\x7d\x6b\xfe\x94\xa5\
+\x18\x02\x71\x71\x24\x7e\xaf\x3d\x6d\x17\x00\x48\x07\xf7\xb5\x2b\
+\x5b\x7d\x7e\x69\x07\xed\x76\xd4\xea\x2b\xaa\x82\x04\xd6\x17\xe8\
+\xf6\xad\xb4\x8f\xad\x9f\x73\x5d\x39\x6e\x15\xed\x5e\x43\x31\xae\
+\xe2\xc6\x49\x6b\x7f\xab\xff\x1a\x79\x56\x9f\x47\x1a\x2b\x84\x69\
+\xd8\xd6\x5a\xd7\x9a\xf7\x89\xd5\xda\x2c\xf5\xcd\x5d\x1f\xbd\x5a\
+\x86\x32\x22\x90\xa1\xc0\x42\x45\xea\xf6\xad\xb4\x8f\x2d\x94\x7c\
+\xf3\xc9\x76\x41\xe0\x95\x15\x36\x09\x00\xd4\x7c\x20\x5f\xb9\xfd\
+\x3e\xb3\x4b\x3b\x66\xb7\x83\x7e\xce\xf1\x8a\x00\x81\x99\x05\xba\
+\x7d\x2c\xed\x6b\x33\x27\xdb\x54\x72\x11\xed\xae\xe9\x18\x10\x07\
+\xee\xa8\x4f\x9c\xa4\xba\x8a\xbb\xe0\xa6\x5c\x69\x20\x20\xb6\x9d\
+\xd8\x27\x16\x94\xab\x3f\xe9\xd4\x27\x77\x7d\x73\xfd\x35\x55\x43\
+\x02\x77\x05\x96\xfc\xb0\xdb\xc7\xd2\xbe\xb6\x64\x1e\xad\xa6\xbd\
+\x45\x10\x78\x93\x00\x40\xab\x0d\xbc\x58\xbd\xd3\x0e\xd9\xed\x98\
+\x8b\x65\x20\x61\x02\x04\x7a\x81\xd8\xd7\xe2\xaf\x6b\xf4\xef\xfd\
+\x9e\x20\x90\x4e\xe6\xe2\xc4\x79\xc2\x9a\x59\xad\x12\x27\x6f\x71\
+\xb5\xdf\x89\xff\x8a\xcd\x92\xb6\x9d\x08\xb6\x84\xfd\x8a\xb9\x2e\
+\x97\x55\xaa\xcf\x72\x89\xd7\x9f\x72\xf4\xc5\xd1\x27\xd7\x5f\x53\
+\x35\x24\xf0\x50\x60\xf1\x05\x62\x5f\x8b\x7d\x6e\xf1\x8c\x1a\xcb\
+\x20\x82\xc0\x6b\x8f\x89\xb6\x09\x00\x38\xe0\xcd\xb7\x69\x3b\xf9\
+\x9f\xcf\x52\x4a\x04\x06\x0a\xc4\x5f\xd7\x70\x10\x1c\x88\x75\x63\
+\xb1\x2d\x22\xde\x37\x8a\x32\x7a\x76\x1c\xa8\xe3\x19\x7f\x27\xfe\
+\xa3\xe9\xe6\x5b\x21\x8d\x23\x22\x08\x10\x6d\x31\x5f\xa2\xeb\xa6\
+\x14\xe5\x5f\x37\xc7\xba\x72\x8b\x3e\x38\xfa\xe2\xba\x6a\xa5\x36\
+\x04\xa6\x0a\xac\xb3\x5e\xec\x73\xb1\xef\xad\x93\x5b\x3b\xb9\xbc\
+\xbe\xbc\x7c\x59\xb3\xb6\x2f\x6b\x66\x16\x79\x39\xe0\x85\xc2\x4c\
+\x93\x93\xff\x99\x20\x25\x43\x60\xbc\x40\x1c\x04\xff\xf3\xeb\x1f\
+\xfb\xf8\xab\x1b\xe3\xd7\xb6\xc6\x16\x11\xef\x39\xd4\xe3\x18\x16\
+\x57\xfd\xa3\xfc\x73\xa4\x27\x8d\x27\x04\x52\x10\x20\xda\x22\xda\
+\xe4\x89\x54\x36\x59\xb5\x2b\x73\x2a\xff\x26\x99\x17\x9e\x69\xf4\
+\xb9\x71\x02\x12\x7d\x70\xe1\x55\x51\x7c\x02\xf3\x09\xac\x98\x52\
+\xec\x7b\xc6\x3f\xf3\x82\xef\x0f\x87\x1f\xe7\x4d\xf1\x7e\x6a\xab\
+\x07\x00\xd6\xae\xe0\xfd\xea\x17\xfc\xa9\x93\xff\x82\x1b\x4f\xd1\
+\x6b\x12\x48\x7d\xda\xb7\x9a\xea\xb3\x66\x5d\x4a\xba\x0b\x20\xae\
+\x34\xbb\xea\xbf\xe6\xd6\x31\x22\xaf\x74\x22\x5d\xdc\x63\x01\xa9\
+\xcc\x23\x6a\x68\xd1\x23\x81\xf8\x4b\x47\x71\x02\x72\x34\xcb\x4b\
+\x02\xcd\x0b\x6c\x01\x60\xfc\x33\x9f\x7a\x5c\x54\x88\x71\xc6\x7c\
+\x29\xde\x4f\x69\xd5\x00\x40\x54\x2c\x2a\x78\xbf\x48\x3e\x7d\x28\
+\xe0\xe4\xff\x21\x91\x05\x08\xac\x25\x10\x03\xd1\xb8\x1a\xb5\x56\
+\x7e\x35\xe5\x13\xc7\x83\xee\x4a\x68\xe6\x95\x8a\x13\xff\xb8\xd2\
+\x1c\xe5\xcd\xbc\xa8\x6d\x17\x2f\x9d\x54\x97\xb0\x3d\x95\x50\xc6\
+\x5c\x37\x24\x7d\x6d\xae\x2d\xa3\x5c\x1b\x0b\x6c\x92\xbd\xf1\xcf\
+\xbc\xec\x6b\x5e\x14\x59\x35\x00\xb0\xf6\xf3\x0d\xf3\x36\x4b\x26\
+\xa9\x39\xf9\xcf\xa4\x21\x14\x83\xc0\xa7\x80\x83\xe0\xa7\xc5\xe8\
+\x57\xe9\xa4\x6d\xf4\x3a\x2b\xad\x10\x41\xeb\xb8\xb2\xec\xc4\x7f\
+\x25\xf0\x39\xb2\x49\xdb\x53\xb4\x59\xd6\x27\xd9\xa9\x8c\x73\x54\
+\xb5\xb5\x34\xe2\xe4\x3f\xfa\xda\xd6\xea\xad\xbe\x04\x1e\x0b\x6c\
+\xb7\x44\xec\x93\xb1\x6f\x6e\x57\x82\x7a\x72\x5e\x73\xac\xb1\x6a\
+\x00\xc0\x17\x26\x3d\xb9\x91\x3a\xf9\x7f\x12\xd0\xea\x04\x96\x13\
+\x88\x83\xe0\x2e\xed\xa3\xcb\xe5\x50\x6f\xca\x39\x9e\xac\xf5\x57\
+\xfd\xeb\x55\xaf\xbc\x66\xe9\x24\x3b\xc7\xed\x2a\xc7\x32\x15\xb1\
+\x25\xa4\xbe\xb5\xeb\x63\x8b\x28\xac\x42\x12\x58\x59\x60\xe3\xec\
+\xba\x7d\x33\xed\xa3\x1b\x17\xa3\x8a\xec\xe3\xc2\xc3\x1a\x15\x59\
+\x2d\x00\xe0\xa0\xf7\x64\x73\xa6\x1d\x2b\xfe\xfc\xc6\x93\xa9\x58\
+\x9d\x00\x81\x05\x05\xba\x7d\x34\xed\xab\x0b\x66\x51\x67\xd2\xe9\
+\x64\x6d\xad\x83\xde\x23\xc0\x28\x47\x9c\xfc\xaf\x19\x89\x7f\x54\
+\x26\x9f\x4f\x14\x48\xdb\x55\xdc\x0d\x10\x6d\x3a\x31\x85\xf9\x57\
+\x4b\x65\x9a\x3f\xd1\xca\x53\x4c\x7d\x6a\xd7\xb7\x56\x5e\x4d\xd5\
+\x23\x30\x55\x20\x87\xf5\xba\x7d\x34\xed\xab\x39\x94\xa5\xe4\x32\
+\xac\xf5\x18\xc0\x6a\x01\x80\x92\x1b\x63\xf3\xb2\xa7\x1d\xaa\xdb\
+\xb1\x36\x2f\x88\x02\x10\x20\xf0\x48\xa0\xdb\x57\xd3\x3e\xfb\x68\
+\x39\x9f\x9f\x0a\xac\x75\xd0\x3b\xcd\xf5\xf4\x5d\x04\xaa\x3d\xeb\
+\x7f\x6a\x52\xc3\xbb\x68\xd3\x68\xdb\xad\xeb\x92\x43\x19\xb6\x36\
+\x18\x9d\x7f\xea\x4b\xbb\x3e\x75\xf4\x8a\x56\x20\xd0\x8c\x40\x36\
+\x15\xed\xf6\xd5\xb4\xcf\x66\x53\xa0\x02\x0b\xb2\xd6\xc5\x87\xf5\
+\x02\x00\xa2\xde\x93\x36\xc3\xf8\x73\x37\xdd\x0e\x35\x69\x6d\x2b\
+\x11\x20\xb0\x85\x40\xb7\xcf\x3a\x08\x8e\xa2\x8f\x83\xde\x96\x57\
+\x6a\xbb\x93\x33\xc7\xa9\x51\x6d\x56\xd4\xc2\xa9\x6d\xbb\x36\xde\
+\xa8\xd0\xdd\xb6\x9d\xca\xb0\x51\xf6\x65\x66\x9b\xfa\xd0\xae\x2f\
+\x2d\xb3\xf4\x4a\x4d\x60\x25\x81\xbc\xb2\xe9\xf6\xd9\xb4\xef\xe6\
+\x55\xaa\xb2\x4a\xd3\x1d\x2f\x16\x2e\xf2\x2a\x01\x80\x2d\x0f\xba\
+\x0b\xfb\x2d\x9a\x7c\x9c\xfc\xc7\x9f\xbb\x59\x34\x13\x89\x13\x20\
+\xb0\x88\x80\x83\xe0\x78\xd6\xad\xee\x02\xe8\x8e\x51\x4e\xce\xc6\
+\x37\x58\x69\x6b\xa4\x36\xee\xda\x7a\x83\x72\xfb\x12\xe4\x91\xe8\
+\xe9\x04\xa2\xeb\x43\x47\xae\x66\x71\x02\xcd\x09\x64\x58\xe1\x6e\
+\xdf\x4d\xfb\x70\x86\x45\x2b\xa2\x48\x6b\x8c\x85\x56\x09\x00\x14\
+\xa1\x9d\x61\x21\x9d\xfc\x67\xd8\x28\x8a\x44\x60\x84\x40\x1c\x04\
+\x23\x90\x37\x62\x95\xa6\x17\x5d\xfb\x2e\x80\x88\xb2\xc7\xf3\xfe\
+\xbe\xa0\xb6\xa1\xcd\x2e\x05\x01\xba\x36\x5f\xb1\xca\x5d\xd0\x21\
+\xe5\xbb\x62\x96\x65\x67\x95\x4e\x1c\xa2\xef\x2c\xbb\x12\x4a\x4f\
+\x60\x1d\x81\x5c\x73\x89\x7d\xd8\xf8\x67\x5a\xeb\xac\x31\x16\x5a\
+\x27\x00\xe0\xc0\x37\x7a\x0b\xf0\x27\x35\x46\x93\x59\x81\x40\x96\
+\x02\x11\xc8\x73\x10\x1c\xde\x34\x6b\x44\xbe\xa3\x34\x71\xf2\x1f\
+\xcf\x86\xc7\x81\x36\xde\x9b\xda\x11\x88\x36\x5f\xf3\xcb\x01\xf7\
+\x87\xc3\x8f\xed\xe8\x3e\x57\xd3\xe8\x2b\xe3\xc4\xe1\xb9\x54\xac\
+\x4d\xa0\x19\x81\xac\x2b\x6a\xfc\x93\x6f\xf3\x2c\x1e\x00\xe8\x22\
+\xdf\xf9\xd6\x3f\xcf\x92\xa5\xe8\x77\xf7\x27\x35\xf2\x2c\x9d\x52\
+\x11\x20\x30\x52\xc0\x41\x70\x38\x58\x9c\x9c\xc5\xc9\xf9\xf0\x35\
+\xc6\x2f\x19\xc7\xa5\x38\xf9\x1f\xbf\xa6\x35\x6a\x12\x88\x6d\x20\
+\xb6\x85\x25\xeb\x14\xe9\xc7\x36\xbd\x64\x1e\xb5\xa4\x1d\x27\xff\
+\xd1\x57\xd6\x52\x1f\xf5\x20\xb0\xbc\x40\xfe\x39\xc4\x3e\x1d\xfb\
+\x76\xfe\x25\xcd\xab\x84\x4b\x5f\x0c\x59\x3c\x00\x90\x17\x67\x01\
+\xa5\x49\x27\xff\xa2\xdf\x05\xb4\x93\x22\x12\x18\x29\x90\xae\x02\
+\x7e\x1b\xb9\x4a\xb3\x8b\x2f\x79\xe0\x8b\x13\x32\xb7\xfc\x37\xbb\
+\x69\x5d\x56\xfc\x70\xf8\xda\x6d\x13\x97\x9f\xcc\x33\x27\xa5\x3f\
+\xdb\x43\x6b\xa3\x00\x00\x10\x00\x49\x44\x41\x54\x4f\x42\xf5\xa7\
+\xa2\x8f\xac\xbf\x8d\xd5\x70\x66\x81\x42\x92\xb3\x6f\x8f\x6f\xa8\
+\x08\x1c\x2f\x79\x31\x64\xf9\x00\x80\x83\xdf\xe0\x56\x8f\x08\x99\
+\x93\xff\xc1\x5c\x16\x24\x50\x94\x40\x77\x57\x4f\x0a\xf0\x15\x55\
+\xe8\x8d\x0a\x1b\x07\xbe\x25\x4e\xca\xba\x34\x1d\x93\x36\x6a\xd5\
+\x8c\xb3\x4d\xdb\x44\xb7\x6d\xcc\x5c\xc4\x25\xd2\x9c\xb9\x88\xf9\
+\x24\x97\xfa\xc6\xae\x8f\xcc\xa7\x44\x4a\x42\x20\x7b\x81\x52\x0a\
+\xd8\xed\xdb\x69\x1f\x2f\xa5\xbc\xb9\x94\x73\xc9\x8b\x21\x8b\x06\
+\x00\x1c\xfc\xc6\x6d\x42\x71\x9b\xcc\xb8\x35\x2c\x4d\x80\x40\x49\
+\x02\x5d\x80\xcf\x41\x70\x58\x93\xa5\x93\xb2\x61\x0b\x0e\x5b\xaa\
+\x3b\x1e\xcd\x9c\xe6\xb0\x9c\x2d\x55\x84\x40\xda\x36\xba\x6d\x64\
+\xce\xc2\xa6\x34\xe7\x4c\xae\xda\xb4\x52\x9f\xd8\xf5\x8d\xd5\x56\
+\x50\xc5\x08\x2c\x22\x50\x54\xa2\xdd\x3e\x9e\xf6\xf5\xa2\x0a\x5d\
+\x71\x61\x17\x0d\x00\xec\x7d\xf1\xcd\xe0\x4d\xc7\x97\xfe\x0d\xa6\
+\xb2\x20\x81\xa2\x05\xe2\x20\x18\x77\xfb\x14\x5d\x89\x95\x0a\x3f\
+\xd7\x09\x59\x97\x8e\x93\xb1\x95\x5a\xad\xe0\x6c\xd2\x36\x32\xd7\
+\x2d\x97\xdd\x36\x57\x30\xc5\x5a\x45\x8f\xbe\x30\xfa\xc4\xb5\xf2\
+\x93\x0f\x81\x7a\x04\xca\xab\x49\xec\xeb\xb1\xcf\x97\x57\xf2\x6d\
+\x4a\x1c\x77\x43\xce\x75\x4c\x3a\xaf\xc1\x62\x01\x80\x38\xf8\x45\
+\xc1\xcf\x33\xf4\xfe\x8a\x40\x8a\x88\x75\xb7\xc7\x5c\xf9\xc8\x2c\
+\x02\x04\xea\x13\x48\xc1\x51\xdf\x07\x30\xa0\x59\x93\xd3\xd3\xdf\
+\x9e\xde\x1d\x3c\xd3\x89\xdd\x80\xec\x2c\x42\x60\x17\x5f\x0c\xd8\
+\x6d\x33\xcf\x5a\xd8\xe6\x06\x09\xa6\x7d\x5c\x5f\x38\x48\xca\x42\
+\x04\xce\x04\x0a\x7d\x6b\x9f\x1f\xd7\x70\x4b\x3d\x06\xb0\x58\x00\
+\x60\x5c\xf5\x1a\x5e\x3a\x9d\xfc\x47\x44\xac\x61\x01\x55\x27\xd0\
+\x9c\x40\x17\xf0\x4b\xfb\x7e\x73\x15\x1f\x59\xe1\x08\x22\x3f\x73\
+\x32\x16\xeb\xc6\x09\xdd\xc8\x6c\x2d\xde\xb8\x40\x6c\x33\xb1\xed\
+\x4c\x65\x88\x0b\x20\x53\xd7\x6d\x6a\xbd\xd4\x07\x76\x7d\x61\x53\
+\x95\x56\x59\x02\xf3\x08\x94\x9a\x4a\xb7\xcf\xa7\x7d\xbf\xd4\xf2\
+\xaf\x5d\xee\x18\x07\x2d\x91\xe7\x72\x01\x00\xd1\xef\x87\xed\x15\
+\xb7\xc1\x38\xf9\x7f\xc8\x64\x01\x02\x55\x0a\x74\xfb\xbe\x83\xe0\
+\xc3\xb6\x9d\x1a\xfd\x8e\x13\xb8\x38\x91\x7b\x98\x81\x05\x08\x5c\
+\x11\x88\x6d\x27\xb6\xa1\x2b\x1f\x3d\x9e\x65\xfc\xf3\xd8\x28\xf5\
+\x7d\x5d\x1f\xf8\x78\x49\x4b\x10\x20\x70\x29\x50\xf4\x9c\x6e\xdf\
+\x4f\x7d\x40\xd1\x95\x58\xb1\xf0\x93\x8f\x45\x77\xca\xb8\x48\x00\
+\x40\xf4\xfb\x8e\xf8\xd1\x47\xbe\xf4\xef\x08\xc3\x4b\x02\x0d\x0a\
+\xc4\x41\x30\x02\x81\x0d\x56\x7d\x70\x95\x23\xfa\x3d\xf6\xe0\x17\
+\xcb\xc7\x09\xdc\xe0\x4c\x2c\x48\xe0\x8a\x40\x6c\x43\xb1\x2d\x5d\
+\xf9\xe8\xe6\x2c\xe3\x9f\x9b\x34\x1f\x1f\x44\x9f\x17\x7d\xdf\xc7\
+\x0c\x2f\x08\x10\x18\x29\x50\xfe\xe2\xd1\x07\x44\x5f\x50\x7e\x4d\
+\x96\xaf\xc1\xd4\x0b\x21\xf7\x4a\xb6\x48\x00\x60\x27\xfa\x7d\xcf\
+\xfc\xed\x33\x91\xaf\x37\x07\x3f\x09\x34\x2e\xe0\x79\xb8\xc7\x1b\
+\xc0\xd8\x83\x5f\x9c\xb8\x3d\x4e\xd5\x12\x04\x1e\x0b\x8c\xdd\xf6\
+\x1e\xa7\x68\x09\x7d\x9e\x6d\x80\xc0\x93\x02\x95\xac\xae\x2f\x18\
+\xd6\x90\x71\x21\x64\xd8\x92\xc3\x97\x9a\x3d\x00\x20\xfa\x3d\x00\
+\x3f\x9d\xfc\x47\xe4\x6b\xc0\x92\x16\x21\x40\xa0\x72\x01\xcf\xc3\
+\x3d\x6e\xe0\x38\xf8\x0d\xbd\x12\xeb\x18\xf4\xd8\xd3\x12\xc3\x05\
+\x62\xdb\xfb\xeb\xcf\x3f\xfc\x36\x78\x0d\x17\x40\xee\x53\xa5\xf1\
+\x4f\xd7\xe7\xdd\x5f\xca\xa7\x04\x08\xdc\x11\xa8\xe5\xa3\xae\x2f\
+\x48\x7d\x42\x2d\xf5\x59\xb2\x1e\x43\xc7\x40\x43\xcb\x30\x7b\x00\
+\xc0\xd5\xff\xc7\xf4\x4e\xfe\x1f\x1b\x59\x82\x40\x4b\x02\x5d\x9f\
+\xe0\x20\x78\xb7\xc9\x87\x5c\x89\xed\x4e\xfe\x9d\x80\xdd\x75\xf4\
+\xe1\x78\x81\x08\x02\x74\xdb\xd6\x83\x55\x87\x2c\xf3\x20\x89\xba\
+\x3f\x4e\x7d\x5c\xd7\xd7\xd5\x5d\x4b\xb5\x23\xb0\xb4\x40\x55\xe9\
+\x77\x7d\x42\xea\x1b\xaa\xaa\xd4\x02\x95\x19\x32\x06\x1a\x93\xed\
+\xac\x01\x00\x07\xbf\x01\xf4\x36\xf2\x01\x48\x16\x21\xd0\x9e\x40\
+\x1c\x04\x3d\x0f\x77\xbb\xdd\xe3\x24\xec\x5e\x04\xbc\xfb\xcc\xc9\
+\xff\x6d\x40\x9f\x3c\x27\x90\xb6\xad\x6e\x1b\xbb\x97\x4a\x5a\xe6\
+\xde\xc7\x2d\x7f\x16\x7d\x5b\xf4\x71\x2d\x1b\xa8\x3b\x81\x79\x04\
+\xea\x4b\x25\xfa\x86\xe8\x23\xea\xab\xd9\x7c\x35\x7a\x34\x06\x1a\
+\x9b\xd3\xac\x01\x00\x57\xff\x1f\xf0\xa7\x93\xff\xd8\xc8\x1f\x2c\
+\xe5\x63\x02\x04\x1a\x15\xf0\x3c\xdc\xfd\x86\x7f\x7d\x79\xf9\x72\
+\x6b\x09\xcf\xfd\xdf\x92\x31\x7f\x2e\x81\x7b\x57\x60\x5c\x00\xb9\
+\xaf\xac\x6f\xbb\xef\xe3\x53\x02\x83\x05\x2a\x5d\x50\x1f\xb1\x6e\
+\xc3\xbe\xcc\x95\x9d\x83\xdf\x63\x49\x27\xff\x8f\x8d\x2c\x41\xa0\
+\x65\x01\xcf\xc3\x3d\x68\xfd\x1b\x57\x58\x1d\x7f\x1e\xb8\xf9\x78\
+\x16\x81\xb8\x02\x73\xf3\xfb\x00\x6e\x6c\x9b\xb3\x64\x5c\x7a\x22\
+\xe9\xe2\x47\xd7\xb7\x95\x5e\x0f\xe5\x27\x90\x81\x40\xad\x45\xe8\
+\xfa\x88\xd4\x57\xd4\x5a\xbf\x39\xea\x75\x2f\x08\x3d\x36\xfd\xd9\
+\x02\x00\x29\x72\xf3\xe3\xd8\xcc\x9b\x5a\xde\x46\xdd\x54\x73\xab\
+\x2c\x81\xa9\x02\x11\x28\x74\x2b\xdc\x6d\xbd\xf3\xdb\xb0\xbb\x93\
+\x7f\x27\x5f\xb7\xc1\x7c\x32\xab\x40\x04\x01\xba\x6d\xee\x28\xd5\
+\xf3\xf7\x47\x1f\x79\x99\x04\xa2\x4f\x4b\xbf\xfc\x27\x40\xe0\x79\
+\x81\xaa\x53\x88\xbe\xc2\xf8\xe7\x76\x13\xc7\xf1\xe7\x7c\x0c\x74\
+\x7b\xe9\xfb\x9f\xcc\x12\x00\x88\x83\x5f\x14\xea\x7e\x56\x0d\x7f\
+\x9a\x4e\xfe\x63\xa3\x6e\x58\x40\xd5\x09\x10\x18\x21\x90\x02\xaa\
+\xdf\x46\x2c\xde\xd4\xa2\xc7\x11\xf0\xee\x40\xe8\xe4\xbf\xa9\xf6\
+\xcf\xa2\xb2\x69\x9b\xeb\xb6\xbd\xbe\x30\xe9\x7d\xff\xd2\xef\x33\
+\x81\x34\xfe\x39\x9b\xe3\x2d\x01\x02\x93\x05\xea\x5f\xd1\xf8\xe7\
+\x7e\x1b\x1f\x8f\x81\xee\x2f\x79\xff\xd3\x59\x02\x00\xf7\xb3\xf0\
+\xa9\x93\x7f\xdb\x00\x01\x02\x63\x04\xe2\x56\x38\x51\xf0\xeb\x62\
+\x11\x6c\xee\x4f\xbe\xe6\x3a\x10\x5e\xcf\xc9\x5c\x02\xb7\x05\xfa\
+\x6d\x2f\x2e\x80\xdc\x5e\xaa\xf1\x4f\xd2\xc9\xbf\xf1\x4f\xe3\xdb\
+\x80\xea\xcf\x2b\xd0\x40\x6a\xc6\x3f\xf7\x1b\x39\xc6\x40\xf7\x97\
+\x18\xf6\xe9\x3c\x01\x00\xd1\xef\xdb\xda\xe9\x00\x78\xfb\x43\x9f\
+\x10\x20\x40\xe0\xba\x80\x28\xf8\x75\x97\x98\x1b\x27\x5f\x71\xe2\
+\x35\xd7\x81\x30\xd2\x34\x11\x18\x23\x10\xdb\x5e\x6c\x83\x63\xd6\
+\x69\x6d\x59\x27\xff\xad\xb5\xb8\xfa\x2e\x2d\xd0\x4a\xfa\xc6\x3f\
+\xf7\x5b\xba\xbf\x08\x72\x7f\xa9\xfb\x9f\x3e\x1d\x00\x70\x00\xbc\
+\x0d\x1c\x57\xf0\x1c\x00\x6f\xfb\xf8\x84\x00\x81\xdb\x02\x11\x05\
+\xdf\x09\x20\x5e\x05\x8a\x93\x2f\x7f\x75\xe6\x2a\x8d\x99\x6b\x0a\
+\xc4\xc5\x8f\x98\xd6\xcc\xb3\x94\xbc\xf4\x5d\xa5\xb4\x94\x72\x96\
+\x23\xd0\x4c\x49\x8d\x7f\xee\x37\x75\x5c\x04\xb9\xbf\xc4\xe3\x4f\
+\x9f\x0e\x00\x18\x84\xdd\x46\x4e\x0d\xf4\xfb\xed\x4f\x7d\x42\x80\
+\x00\x81\xfb\x02\x11\x40\x8c\x40\xe2\xfd\xa5\x7c\x4a\x80\x00\x81\
+\xbc\x04\xa2\xef\xca\xab\x44\x4a\x43\xa0\x74\x81\xb6\xca\x1f\x7d\
+\x88\xf1\xcf\xf5\x36\x8f\x8b\x20\xcf\xde\x05\xf0\x54\x00\xe0\xd9\
+\xcc\xaf\x57\xab\x92\xb9\x29\xfa\x1d\x1b\x6f\x25\xb5\x51\x0d\x02\
+\x04\x36\x12\x70\x2b\xdc\x46\xf0\xb2\x25\x40\x60\x9a\x40\x1a\xff\
+\x4c\x5b\xd1\x5a\x04\x08\xdc\x14\x68\xf0\x03\xe3\x9f\xdb\x8d\x9e\
+\x2e\x32\x7f\xbd\xfd\xe9\xe3\x4f\x9e\x0a\x00\xbc\xbe\xbc\x7c\x79\
+\x9c\x45\x9b\x4b\x38\xf9\x6f\xb3\xdd\xd5\x9a\xc0\xdc\x02\x71\x2b\
+\x9c\x28\xf8\xdc\xaa\xd2\x23\x40\x60\x11\x81\x74\xf2\x6f\xfc\xb3\
+\x88\xac\x44\x1b\x17\x68\xb1\xfa\xc6\x3f\xb7\x5b\x3d\xee\x02\xb8\
+\xfd\xe9\xe3\x4f\x5e\x1e\x2f\x72\x67\x09\xcf\xbe\x5d\xc7\x49\x07\
+\xc0\xeb\x1f\x98\x4b\x80\x00\x81\xf1\x02\xa2\xe0\xe3\xcd\xac\x41\
+\x80\xc0\xfa\x02\x4e\xfe\xd7\x37\x97\x63\x13\x02\xcd\x56\xd2\xf8\
+\xe7\x76\xd3\x3f\x73\x27\xfe\xe4\x00\x80\x2f\xff\xbb\xdd\x20\x0e\
+\x80\xb7\x6d\x7c\x42\x80\xc0\x78\x81\x88\x82\xfb\x42\xc0\xf1\x6e\
+\xd6\x20\x40\x60\x45\x01\x17\x3f\x56\xc4\x96\x55\x5b\x02\xed\xd6\
+\xd6\xf8\xe7\x76\xdb\x3f\xf3\x18\xc0\xe4\x00\x40\x8a\xc8\xfc\x78\
+\xbb\x48\x0d\x7f\xe2\x00\xd8\x70\xe3\xab\x3a\x81\xe5\x04\x22\xb0\
+\xe8\x51\x80\xe5\x7c\xa5\x4c\x80\xc0\x73\x02\xd1\x47\x3d\x97\x82\
+\xb5\x09\x10\xb8\x2a\xd0\xf8\xcc\xe8\x5b\x8c\x7f\x2e\x37\x82\x78\
+\x0c\x60\xea\x5d\x00\x93\x02\x00\x91\x59\x64\x7a\x59\x94\xc6\xe7\
+\xa4\x93\xff\xd8\x48\x1b\x57\x50\x7d\x02\x04\x16\x12\x48\x81\xd7\
+\x6f\x0b\x25\x2d\x59\x02\x04\x08\x4c\x17\x48\xe3\x9f\xe9\x2b\x5b\
+\x93\x00\x81\x7b\x02\x3e\xdb\xed\x8c\x7f\x76\x57\xff\x4d\xbd\x0b\
+\x60\x52\x00\xc0\x97\xff\x5d\x6d\x03\x33\x09\x10\x20\xb0\xa8\x40\
+\xdc\x0a\x27\x0a\xbe\x28\xb1\xc4\x09\x10\x18\x2b\x90\x4e\xfe\x5d\
+\xfc\x18\x8b\x66\x79\x02\x83\x05\x2c\x98\x04\x8c\x7f\x12\xc2\x8c\
+\xff\x27\x05\x00\x76\xbe\xfc\xef\xb2\x09\x1c\x00\x2f\x4d\xcc\x21\
+\x40\x60\x76\x01\x51\xf0\xd9\x49\x25\x48\x80\x00\x01\x02\x04\x32\
+\x15\x50\xac\x5e\xc0\xf8\xa7\x97\xf8\xfc\x1d\x77\xe4\xc7\x9d\xf9\
+\x9f\x73\x86\xbd\x1a\x1d\x00\xf0\xe5\x7f\xc3\x60\x2d\x45\x80\x00\
+\x81\x25\x04\x44\xc1\x97\x50\x95\x26\x01\x02\x53\x05\x5c\xfd\x9f\
+\x2a\x67\x3d\x02\x03\x04\x2c\xf2\x21\x60\xfc\xf3\x41\x71\xf2\x62\
+\xca\x63\x00\xa3\x03\x00\x27\x39\x7a\xf3\x26\xe0\xea\xff\x9b\x83\
+\x9f\x04\x08\xac\x22\x20\x0a\xbe\x0a\xb3\x4c\x08\x10\x78\x24\x90\
+\xc6\x3f\x8f\x16\xf1\x39\x01\x02\xd3\x05\xac\x79\x2a\x60\xfc\x73\
+\xea\x31\xf5\xdd\xf8\x00\x80\xdb\xff\xa7\x5a\x5b\x8f\x00\x01\x02\
+\xb3\x08\x88\x82\xcf\xc2\x28\x11\x02\x04\x9e\x14\x70\xf5\xff\x49\
+\x40\xab\x13\xb8\x2f\xe0\xd3\x33\x01\xe3\x9f\x33\x90\xf4\x76\xca\
+\x63\x00\xa3\x02\x00\x6e\xff\x4f\xca\xe7\xff\x53\xf4\xdb\x01\xf0\
+\x1c\xc5\x7b\x02\x04\x96\x16\x10\x05\x5f\x5a\x58\xfa\x04\x08\xdc\
+\x15\x48\xe3\x9f\xbb\x9f\xfb\x90\x00\x81\x27\x05\xac\x7e\x4d\xc0\
+\xf8\xe7\x52\x65\xec\x63\x00\xa3\x02\x00\x97\xd9\x99\x43\x80\x00\
+\x01\x02\x5b\x08\x88\x82\x6f\xa1\x2e\x4f\x02\x04\x7a\x01\x17\x3f\
+\x7a\x09\xbf\x09\x2c\x24\x20\xd9\xab\x02\xc6\x3f\x97\x2c\x71\x17\
+\xc0\xe5\xdc\xdb\x73\xc6\x05\x00\xdc\xfe\x7f\x2a\x99\xa2\xdf\x0e\
+\x80\xa7\x24\xde\x11\x20\xb0\x9e\x80\x28\xf8\x7a\xd6\x72\x22\x40\
+\xe0\x48\x20\x8d\x7f\x8e\xde\x79\x49\x80\xc0\x02\x02\x92\xbc\x2d\
+\x60\xfc\x73\x69\x33\xe6\xaf\x01\x0c\x0e\x00\x8c\x49\xf4\xb2\x48\
+\xe6\x10\x20\x40\x80\xc0\xdc\x02\x11\x05\x9f\x3b\x4d\xe9\x11\x20\
+\x40\xe0\x91\x80\x8b\x1f\x8f\x84\x7c\x4e\xe0\x69\x01\x09\xdc\x11\
+\x30\xfe\xb9\xc4\x19\xf3\x18\xc0\xe0\x00\xc0\xeb\xcb\xcb\x97\xcb\
+\xac\xda\x9e\xe3\x00\xd8\x76\xfb\xab\x3d\x81\x2c\x04\x5c\x89\xcb\
+\xa2\x19\x14\x82\x40\x33\x02\xfa\x9c\x66\x9a\x5a\x45\xb7\x14\x90\
+\xf7\x43\x01\x7d\xd1\x43\xa2\x5b\x0b\xbc\xdc\xfa\xe0\x62\xbe\xdb\
+\xff\x4f\x49\x6c\x74\xa7\x1e\xde\x11\x20\xb0\x89\x80\x40\xe4\x26\
+\xec\x32\x25\xd0\xac\x80\x3e\xa7\xd9\xa6\x57\xf1\x35\x05\xe4\xf5\
+\x50\x40\x5f\x74\x4a\x14\xdf\x03\x30\xf4\x8e\xfd\x41\x01\x80\xa1\
+\x89\x9d\x16\xc3\x3b\x02\x04\x08\x10\x58\x45\x40\x40\x72\x15\x66\
+\x99\x10\x68\x5e\x40\x5f\xd3\xfc\x26\x00\x60\x1d\x01\xb9\x0c\x14\
+\xd0\x27\x9d\x40\x0d\xbd\x63\x7f\x50\x00\x60\x68\x62\x27\x25\xa8\
+\xfc\x8d\xa8\x53\xe5\x0d\xac\x7a\x04\x0a\x12\xd0\x1f\x15\xd4\x58\
+\x2b\x17\x75\xbf\xdb\x7d\xdf\xc5\x00\x29\x4d\x2f\x87\xc3\x4f\xfd\
+\xf4\x9f\x5f\xff\xd8\xc7\xd4\xbf\xef\x97\xf9\xf8\xbd\xf3\x8f\xc0\
+\xa5\x80\xbe\xe6\xd2\xc4\x1c\x02\x0b\x08\x48\x72\xa0\x80\x3e\xe9\
+\x14\x6a\x7f\x38\xfc\x78\x3a\xe7\xfa\xbb\x41\x01\x80\x9d\xdb\xff\
+\x4f\xf4\xba\x01\xd5\xc9\x1c\x6f\x08\x10\x20\xb0\xad\x80\x7e\x69\
+\x5b\xff\x5c\x72\x8f\xed\x20\xa6\x38\xb1\x8f\x13\xfc\x7f\xff\xfa\
+\xc7\x4f\x31\x40\x8a\x29\xbe\x34\xa9\x9f\xfa\xf2\xf6\xef\xe3\xf3\
+\x93\x29\x05\x08\x22\x8d\x08\x08\x44\x7a\xfd\xf2\x7e\x37\x2c\x90\
+\x82\x48\x0d\xd7\x5e\xd5\x09\xac\x28\x20\xab\x31\x02\x8e\x51\x9f\
+\x5a\xf1\x18\xc0\xe7\xbb\xdb\xaf\x86\x05\x00\x6e\xaf\xdf\xe4\x27\
+\x87\xfd\xfe\xf7\x26\x2b\xae\xd2\x04\x08\x64\x2b\x90\xa2\xbe\xdf\
+\xb2\x2d\x9c\x82\x2d\x2e\x10\x27\xeb\x31\xc5\x09\x7f\x4c\x71\x62\
+\xff\x6c\xa6\x91\x46\x04\x05\x22\xbd\x08\x26\x44\x30\xe0\xd9\x34\
+\xad\x5f\xae\xc0\xcb\xeb\xeb\xf7\x72\x4b\xaf\xe4\x04\x0a\x12\x50\
+\xd4\x51\x02\xc6\x3f\xa7\x5c\x43\x1e\xdd\x7f\x18\x00\xf8\xcb\x3f\
+\xfe\xfc\xcb\x69\xb2\xde\xc5\x80\x88\x02\x01\x02\x04\x72\x12\x88\
+\x93\x35\x51\xf0\x9c\x5a\x64\xa5\xb2\xa4\xab\xb2\x71\x72\x1e\xed\
+\x1f\xd3\x92\xb9\xc6\xb1\x2f\xf2\x12\x08\x58\x52\x39\xcf\xb4\xa3\
+\x6f\x59\x7a\xfb\xca\xb3\xe6\x4a\x45\x60\x7d\x01\x39\x8e\x13\x88\
+\xbe\x29\xfa\xa8\x71\x6b\xd5\xbb\x74\xba\x50\xfd\xf5\x51\xed\x1e\
+\x06\x00\x1e\x25\xd0\xdc\xe7\x69\xb0\xd5\x5c\x9d\x55\x98\x00\x81\
+\x22\x04\x44\xc1\x8b\x68\xa6\x79\x0a\x99\x8e\x45\x71\x32\x1e\x27\
+\xe5\xf3\x24\x38\x3c\x95\xc8\x33\xf2\x16\x08\x18\x6e\x56\xfa\x92\
+\x69\x40\xe9\xce\xc7\xd2\x1b\x51\xf9\x4b\x11\x50\xce\x09\x02\xc6\
+\x3f\x9f\x68\x43\x1e\x03\x78\x1c\x00\xf0\xfc\xff\xa7\x68\x7a\xe5\
+\x16\xb8\x84\xe0\x3f\x01\x02\x04\x08\x6c\x22\x10\x57\x39\xe2\x56\
+\xff\x38\x09\xdf\xa4\x00\x47\x99\x46\x19\x04\x02\x8e\x40\x2a\x7e\
+\x19\x6d\x5d\x71\xf5\x54\x8d\x40\x46\x02\x8a\x42\xe0\x79\x81\x47\
+\x8f\x01\xdc\x0d\x00\x3c\x5a\xf9\xf9\xe2\x15\x96\x42\xba\xe2\x12\
+\xb7\x99\x14\x56\x6a\xc5\x25\x40\xa0\x11\x81\xe8\x9f\xe2\x04\xb1\
+\x91\xea\xb6\x57\xcd\x74\x0c\x8a\xe7\xf1\xa3\x9d\x73\xaa\x7c\x77\
+\x72\x98\xca\x96\x53\x99\x94\x65\x46\x01\x6d\x3b\x23\xa6\xa4\x08\
+\x3c\x10\xf0\xf1\x24\x81\x38\x2e\x1a\xff\x7c\xd2\x3d\xfa\x0b\x7e\
+\x77\x03\x00\x8f\x56\xfe\xcc\xc6\x2b\x02\x04\x08\x10\xc8\x41\xc0\
+\x6d\x70\x39\xb4\xc2\x02\x65\x48\x27\x61\xdd\x89\xf6\x02\x49\xcf\
+\x91\x64\x57\xb6\x54\xc6\x39\xd2\x92\x06\x01\x02\x04\x5a\x15\x50\
+\xef\xe9\x02\xc6\x3f\x9f\x76\xc9\xe2\xee\x9f\x03\xbc\x1b\x00\x78\
+\xb4\xf2\x67\x36\x6d\xbc\xea\x06\x38\x6d\x54\x55\x2d\x09\x10\x28\
+\x54\x20\xa2\xe0\x85\x16\x5d\xb1\x6f\x08\xe4\x72\xcb\xff\x8d\xe2\
+\x7d\xcc\x8e\x63\x64\x94\xf5\x63\x86\x17\x55\x08\x44\xbb\x56\x51\
+\x11\x95\x20\x90\xbf\x80\x12\x3e\x21\x60\xfc\xf3\x89\xf7\xe8\x7b\
+\x00\xee\x06\x00\x1e\xad\xfc\x99\x4d\x03\xaf\x5c\xd9\x68\xa0\x91\
+\x55\x91\x40\x1d\x02\x6e\x83\xab\xa3\x1d\xa3\x16\x71\x42\x5d\xd2\
+\xa0\x26\xca\x1a\x65\x8e\xb2\x9b\x2a\x10\x30\xf6\xa9\xa0\x11\x55\
+\xa1\x1c\x01\x25\x7d\x56\xc0\xf8\xe7\x53\xf0\xde\xa3\xfc\x37\x03\
+\x00\xf7\x56\xfa\x4c\xba\x9d\x57\xbe\xfc\xaf\x9d\xb6\x56\x53\x02\
+\xa5\x0b\xec\x0f\x87\x6f\xa5\xd7\x41\xf9\x77\xbb\x38\x91\x8e\x13\
+\xea\xd2\x2c\xa2\xcc\x51\xf6\xd2\xca\xad\xbc\x04\x08\x10\xd8\x54\
+\x40\xe6\x4f\x0b\x18\xff\x7c\x12\xde\x7b\x94\xff\x66\x00\xe0\xde\
+\x4a\x9f\x49\xb7\xf3\x2a\x06\x34\xed\xd4\x56\x4d\x09\x10\x28\x59\
+\x20\xfa\xab\xfd\x6e\xf7\x7d\xe7\x5f\xb9\x02\xe9\xca\x6b\xb4\x63\
+\xa9\x15\xe8\xca\x9e\xea\x50\x6a\xf9\x95\xfb\x4d\xc0\xed\xff\x6f\
+\x0e\x7e\x12\x58\x43\x40\x1e\xcf\x0b\xc4\xb1\xc7\xf8\xe7\xcd\x31\
+\x05\x43\x6e\x7e\x0f\xc0\xcd\x00\xc0\xbd\x95\xde\x92\x6d\xe8\xa7\
+\x41\x4c\x43\x8d\xad\xaa\x04\x08\x10\xd8\x58\x20\x1d\x73\x6a\x38\
+\xf1\xea\xea\x90\xea\xb2\xb1\xa6\xec\xa7\x0a\x68\xbb\xa9\x72\xd6\
+\x23\x30\x45\xc0\x3a\x04\x66\x15\xb8\xf7\x28\xff\xcd\x00\xc0\xbd\
+\x95\x66\x2d\x5d\x01\x89\x75\x83\x98\x02\xca\xa9\x88\x04\x08\x10\
+\xe8\x05\x52\x10\xd7\x63\x00\x3d\x46\x49\xbf\xd3\x49\x57\x4d\xc7\
+\x9c\xa8\x8b\xab\x31\x25\x6d\x80\x9f\x65\xf5\xe8\xe3\xa7\x85\x57\
+\x04\x96\x17\x90\xc3\x5c\x02\xc6\x3f\x9f\x92\xb7\x1e\xe9\xbf\x1a\
+\x00\xb8\xb5\xf0\x67\x72\xed\xbc\x32\x70\x69\xa7\xad\xd5\x94\x40\
+\x4d\x02\x6e\x83\x2b\xb3\x35\xe3\x84\xb9\xcc\x92\xdf\x2e\xb5\xc1\
+\xd8\x6d\x9b\x5c\x3f\x89\xb1\x4f\xf4\x21\xb9\x96\x4f\xb9\x08\x54\
+\x27\xa0\x42\xb3\x09\x44\xdf\x15\x7d\xd8\x6c\x09\x56\x98\xd0\xd5\
+\x00\x80\xe7\xff\x3f\x5b\xfa\xb0\xdf\xff\xfe\xf9\xce\x2b\x02\x04\
+\x08\x94\x23\xe0\xc4\xab\x9c\xb6\xea\x4a\x9a\xae\xfe\x77\xbf\x2b\
+\xfb\x11\x83\xb1\x5d\xa5\x75\xab\xac\xa9\x3e\xaa\x63\xec\xf3\x41\
+\xe1\x05\x81\x55\x04\x64\x32\xaf\x80\xf1\xcf\x9b\x67\xea\xcb\xbf\
+\xbe\xbd\x3a\xfd\x79\x35\x00\x70\xba\x48\xdb\xef\x6a\xbc\x1a\xd3\
+\x76\x8b\xaa\x3d\x01\x02\x04\xf2\x14\xa8\xf9\x78\x53\x73\xdd\xf2\
+\xdc\x9a\x9e\x2b\x95\xf6\x7a\xce\xcf\xda\x04\x46\x0a\x58\x9c\xc0\
+\xaa\x02\xd7\x03\x00\x87\xc3\xd5\x68\xc1\xaa\x25\xcb\x20\x33\xb7\
+\x8f\x64\xd0\x08\x8a\x40\x80\xc0\x64\x81\xb8\xf2\xaa\x1f\x9b\xcc\
+\xb7\xee\x8a\x2d\x5c\x21\x6f\xa1\x8e\xeb\x6e\x35\x72\x23\x40\xa0\
+\x0a\x01\x95\x98\x5b\xc0\xf8\xe7\x4d\x34\xbe\xd3\xef\xda\xa3\xfd\
+\xd7\x03\x00\x6f\xeb\x34\xff\xf3\xe0\xf6\xff\xe6\xb7\x01\x00\x04\
+\x08\x10\x58\x43\xa0\x85\x2b\xae\x2d\xd4\x71\x8d\x6d\x65\xf1\x3c\
+\x04\x6a\x16\x27\x96\x01\x81\x13\x01\x6f\x08\xac\x2c\x70\x11\x00\
+\xf8\xcb\x3f\xfe\xfc\xcb\xca\x65\xc8\x36\x3b\x83\x95\x6c\x9b\x46\
+\xc1\x08\x10\x18\x28\xe0\x39\xb8\x81\x50\x5b\x2e\xd6\xd0\x09\xd7\
+\xcb\xe1\xf0\xd3\x96\xd4\xf2\x26\x40\x80\x40\x6e\x02\xca\xb3\x8c\
+\x80\xf1\xcf\x9b\xeb\xb5\xef\xf6\xbb\x08\x00\xbc\x2d\xea\x27\x01\
+\x02\x04\x08\xd4\x20\x10\xb7\xc1\xd5\x50\x8f\x9a\xeb\x20\xd8\x5c\
+\x73\xeb\x96\x57\x37\xdb\x63\x79\x6d\xa6\xc4\x45\x0b\x28\xfc\x42\
+\x02\xc6\x3f\x6f\xb0\x29\x10\xf2\xe3\xdb\xab\xcf\x9f\x17\x01\x80\
+\x6b\x0b\x7d\x2e\xde\xd0\xab\x86\xae\xc8\x34\xd4\xaa\xaa\x4a\xa0\
+\x49\x01\xdf\x03\x90\x6f\xb3\xb7\xd6\x36\x31\x20\x6b\xad\xce\xf9\
+\x6e\x7d\x97\x25\xd3\x36\x97\x26\xe6\x10\x58\x56\x40\xea\x4b\x0a\
+\xe8\xd3\x76\xbb\xf8\x1e\x80\x73\xe3\x8b\x00\xc0\xb5\x85\xce\x57\
+\x6a\xe1\xfd\xcb\xeb\xeb\xf7\x16\xea\xa9\x8e\x04\x08\x10\x20\xb0\
+\x9d\xc0\xc1\x77\xcd\x6c\x87\x2f\xe7\x0b\x01\xdb\xe3\x05\x89\x19\
+\x04\x96\x15\x90\x3a\x81\x0d\x04\x2e\x02\x00\x1b\x94\x21\xcb\x2c\
+\xe3\x2a\x45\x96\x05\x53\x28\x02\x04\x08\x8c\x14\xd8\x1f\x0e\xdf\
+\x46\xae\x62\xf1\x95\x04\x5a\x0c\x36\xdb\x1e\x57\xda\xb8\x64\x43\
+\x80\x40\xf6\x02\x0a\xb8\xac\x80\xe3\xcd\x9b\xef\xf9\x5f\x02\x38\
+\x09\x00\xf8\x02\xc0\x37\xa4\x9d\xdb\xff\xdf\x21\xfc\x22\x40\xa0\
+\x06\x01\x01\xcd\x7c\x5b\xb1\xc5\xb6\x69\xb1\xce\xf9\x6e\x81\xa7\
+\x25\xf3\xfc\xff\xa9\x87\x77\x04\x16\x16\x90\xfc\xc2\x02\x8e\x37\
+\xd7\x81\x4f\x02\x00\xd7\x17\x31\x97\x00\x01\x02\x04\x4a\x17\xf0\
+\x1c\x5c\x86\x2d\xd8\x70\xb0\xd9\xf6\x98\xdf\xf6\x2f\x3a\x23\x86\
+\x00\x00\x10\x00\x49\x44\x41\x54\xa8\x4d\xf2\x6b\x13\x25\xaa\x5d\
+\x40\xfd\xd6\x10\xd0\xb7\xed\x76\x87\xfd\xfe\xeb\xb1\xf5\x49\x00\
+\x60\x7f\x38\x5c\x7c\x4b\xe0\xf1\xc2\xad\xbc\x16\x01\x6f\xa5\xa5\
+\xd5\x93\x00\x01\x02\x04\xb6\x10\x48\x83\x91\xdf\xb7\xc8\x57\x9e\
+\xb7\x05\xb4\xc9\x6d\x1b\x9f\x10\x58\x44\x40\xa2\x04\x36\x12\x38\
+\x09\x00\xf8\x02\xc0\x8d\x5a\x41\xb6\x04\x08\x10\x58\x58\x20\x05\
+\x78\x7d\x0f\xc0\xc2\xc6\x92\x27\x40\x80\x00\x01\x02\x43\x05\x2c\
+\xb7\x8e\x80\xf1\xcf\x6e\x77\x7e\x8e\x7f\x12\x00\x58\xa7\x19\x32\
+\xcf\xa5\xe1\x5b\x32\x33\x6f\x19\xc5\x23\x40\xe0\x09\x01\xcf\xc1\
+\x3d\x81\x67\xd5\xd9\x05\x5a\xfc\xf2\xc3\xd9\x11\x67\x4e\xd0\xdd\
+\x8f\x33\x83\x4a\x8e\xc0\x7d\x01\x9f\xae\x24\x60\xfc\xf3\x06\x7d\
+\xfc\x45\x80\x1f\x01\x80\xe3\x99\x6f\x8b\xf9\x49\x80\x00\x01\x02\
+\x35\x09\x78\x0e\x2e\xaf\xd6\x74\x12\x9c\x57\x7b\xb4\x5c\x1a\x7d\
+\x43\xcb\xad\xaf\xee\xdb\x08\xc8\x75\x4d\x01\x7d\xdc\xa9\xf6\x47\
+\x00\xe0\x74\x76\xbb\xef\x44\xc0\xdb\x6d\x7b\x35\x27\x50\xbb\x80\
+\x67\x7c\x6b\x6f\x61\xf5\x23\x30\x4d\x40\xdf\x30\xcd\xcd\x5a\x04\
+\x26\x0b\x58\x71\x55\x01\x7d\xdc\x6e\xf7\xfa\xf2\xf2\x71\xb1\xff\
+\xa5\xd7\x3f\x9e\xd9\xcf\x6b\xed\xb7\xe8\x50\x6b\x2d\xae\xbe\x04\
+\xda\x12\x70\xc5\x39\xaf\xf6\x6e\xf9\xb6\xc4\x96\xeb\x9e\xd7\x56\
+\xf8\x56\x1a\x7d\xc3\x9b\x83\x9f\x04\xd6\x12\x90\xcf\xba\x02\xfa\
+\xb8\xdd\x6e\x7f\xf4\x65\xff\x1f\x01\x80\x9d\x7f\x3b\xd1\x21\x1b\
+\x01\x01\x02\x35\x0b\x38\xe9\xaa\xb9\x75\xd5\x8d\xc0\x74\x01\x7d\
+\xc3\x74\x3b\x6b\x12\x98\x20\x60\x95\x95\x05\xf4\x71\xa7\xe0\x1f\
+\x01\x80\xe3\xa8\xc0\xe9\x22\xde\x11\x20\x40\x80\x00\x01\x02\x73\
+\x0b\xb4\xfc\xdd\x3b\x2d\xd7\x7d\xee\xed\x48\x7a\x04\x08\x94\x26\
+\xa0\xbc\x04\xb6\x15\xf8\x08\x00\x9c\xff\x79\x80\x6d\x8b\xb5\x4d\
+\xee\x6e\x0f\xd9\xc6\x5d\xae\x04\x08\xac\x27\xe0\x51\xa7\xf5\xac\
+\xe5\x44\xa0\x04\x01\x7d\x42\x09\xad\xa4\x8c\x55\x09\xa8\xcc\x26\
+\x02\xad\xf7\x75\xc7\xe7\xfa\x1f\x01\x80\x4d\x5a\x22\xb3\x4c\xdd\
+\x1e\x92\x59\x83\x28\x0e\x01\x02\x04\x08\x54\x29\xe0\x7b\x87\xf2\
+\x69\x56\x8f\x3f\xe6\xd3\x16\x4a\xd2\x86\x80\x5a\x12\xd8\x4a\xa0\
+\xbf\xfb\xae\x0b\x00\xf4\x6f\xb6\x2a\x4c\x0e\xf9\xb6\x1e\x15\xca\
+\xa1\x0d\x94\x81\x00\x81\xe5\x05\x0c\xf6\x97\x37\x1e\x9a\x83\x93\
+\xe0\xa1\x52\x96\x23\x40\x80\x40\x35\x02\x2a\xb2\x91\x80\xf1\xcf\
+\x27\x7c\x17\x00\xf8\x7c\xdb\xee\x2b\x1b\x45\xbb\x6d\xaf\xe6\x04\
+\x5a\x12\xf0\xa8\x53\x4b\xad\xad\xae\x04\x08\x10\x20\x90\x97\x80\
+\xd2\x6c\x25\x60\xfc\xf3\x29\xdf\x05\x00\x5c\x85\xf8\x04\xf1\x8a\
+\x00\x01\x02\x04\x08\xac\x21\xe0\xcb\x77\xd7\x50\x96\xc7\x23\x01\
+\x83\xe2\x47\x42\x3e\x27\x30\xa3\x80\xa4\x08\x6c\x28\xd0\x9f\xf3\
+\x77\x01\x80\x0d\xcb\x91\x4d\xd6\x0e\x80\xd9\x34\x85\x82\x10\x20\
+\xb0\xa0\x80\xef\x3a\x59\x10\x77\x64\xd2\xc7\x5f\xc8\x33\x72\xd5\
+\xf2\x17\x3f\x1c\xbe\x96\x5f\x89\x3a\x6a\xa0\x4f\xa8\xa3\x1d\xd5\
+\xa2\x0c\x01\xa5\xdc\x4e\x40\x5f\xb7\xdb\xf5\x17\x1e\x04\x00\x76\
+\x6f\xff\x6c\x14\x6f\x0e\x7e\x12\x20\x50\xbf\x80\xef\x3c\xc9\xa7\
+\x8d\x5b\xfc\x0e\x9e\x16\xeb\x9c\xcf\x16\xa7\x24\x04\x08\x6c\x28\
+\x20\xeb\x8d\x05\x8c\x7f\xde\x1a\xa0\x0b\x00\xf4\xd1\x80\xb7\x59\
+\x7e\x12\x20\x40\x80\x00\x01\x02\x6b\x08\x1c\xf6\xfb\xe6\xae\x84\
+\xf7\xb7\x20\xae\xe1\x2b\x8f\xfb\x02\x06\xc3\xf7\x7d\x7c\x4a\x60\
+\x5e\x01\xa9\x11\xc8\x43\xa0\x0b\x00\xe4\x51\x94\xed\x4a\xe1\x00\
+\xb8\x9d\xbd\x9c\x09\x10\x20\x40\xa0\x2d\x01\x17\x1d\xf2\x69\xef\
+\x14\x80\xfa\x3d\x9f\xd2\x28\x09\x81\xca\x05\x54\x8f\xc0\xc6\x02\
+\xfd\xa3\x87\x5d\x00\xa0\x7f\xb3\x71\x99\x36\xcb\xde\x01\x70\x33\
+\x7a\x19\x13\x20\xb0\x81\x80\x3e\x6f\x03\xf4\x1b\x59\xc6\xf1\xb7\
+\xb5\x5b\xe2\xa3\xce\x37\x38\xcc\x26\x40\x80\x40\xb5\x02\x2a\xb6\
+\xbd\x80\xf1\xcf\x5b\x1b\x74\x01\x80\xb7\x97\x7e\x12\x20\x40\x80\
+\x40\x0b\x02\xbe\xf4\xb4\x85\x56\xce\xb3\x8e\x7f\xf9\xc7\x9f\x7f\
+\xc9\xb3\x64\x6d\x96\x4a\x5f\xd0\x66\xbb\xab\xf5\x26\x02\x32\xcd\
+\x40\x40\x9f\xf7\xd6\x08\x02\x00\xc9\xc1\xc6\x90\x10\xfc\x27\x40\
+\x80\x00\x81\x4d\x04\x5e\xf7\xfb\xdf\x36\xc9\x78\x8b\x4c\x7d\xfb\
+\xff\x16\xea\x37\xf3\xf4\x05\xc8\x37\x69\x7c\x40\x60\x66\x01\xc9\
+\x11\xc8\x43\x20\xee\x3a\x7c\x89\x1f\x79\x14\x67\xbb\x52\x38\x00\
+\x6e\x67\x2f\x67\x02\x04\xd6\x17\xd0\xe7\xad\x6f\xfe\x28\xc7\x16\
+\xae\x8c\xb7\x50\xc7\x47\xed\xec\x73\x02\x04\x1a\x15\x50\xed\x2c\
+\x04\x8c\x7f\xde\x9a\xc1\x1d\x00\x6f\x0e\x7e\x12\x20\x40\xa0\x29\
+\x01\x5f\x7e\x9a\x59\x73\xb7\x70\x65\xbc\x85\x3a\x66\xb6\x59\xdd\
+\x2b\x8e\x3e\xe0\x9e\x8e\xcf\x08\xcc\x2b\x20\xb5\x7c\x04\xf4\x7d\
+\xbb\xdd\x8b\x3f\xc7\x93\xcf\x06\xa9\x24\x04\x08\x10\x20\xd0\xae\
+\x40\xcd\x57\xc8\x6b\xae\x5b\xbb\x5b\xac\x9a\x13\x20\x30\x50\xc0\
+\x62\x04\xb2\x11\x88\x73\xff\xe6\xef\x00\xd8\xef\x76\xdf\x77\xfe\
+\x11\x20\x40\x80\x00\x81\xad\x05\xd2\x15\xf2\x6a\x1f\xcb\x4b\x75\
+\xdb\x9a\x57\xfe\x04\x08\x10\xd8\x46\x40\xae\x04\xf2\x12\x68\x3e\
+\x00\x90\x57\x73\x28\x0d\x01\x02\x04\x08\xb4\x2c\x70\xd8\xef\xbf\
+\xd6\x56\x7f\x57\xff\x6b\x6b\x51\xf5\x21\x40\x60\x94\x80\x85\x09\
+\x64\x26\xd0\x7c\x00\x20\x0d\xb6\x7e\xcf\xac\x4d\x14\x87\x00\x01\
+\x02\x04\x1a\x15\x38\xec\x76\x5f\x6a\x3a\x61\xee\xea\xe2\xea\x7f\
+\x96\x5b\xb3\xf1\x4f\x96\xcd\xa2\x50\x15\x0a\xa8\x12\x81\x9c\x04\
+\xf6\x87\xc3\x8f\x2f\xf1\x23\xa7\x42\x29\x0b\x01\x02\x04\x08\x2c\
+\x2f\x60\xf0\xbf\xbc\xf1\xe4\x1c\xd2\x09\x73\x77\xe2\x3c\x39\x81\
+\x3c\x56\xec\xea\x90\xea\x92\x47\x69\x94\x82\x00\x01\x02\x9b\x08\
+\xc8\x34\x33\x01\xe3\x9f\xdd\xae\xf9\x3b\x00\x32\xdb\x26\x15\x87\
+\x00\x01\x02\x04\x08\xec\x76\xe9\xc4\xb9\xe4\xef\x03\xe8\xca\x9e\
+\xea\xa0\x29\x09\x10\x20\xd0\xb6\x80\xda\x13\xc8\x4f\x40\x00\x20\
+\xbf\x36\x51\x22\x02\x04\x08\x10\x20\xb0\x7b\xdd\xef\x7f\xeb\x4e\
+\xa4\x0b\xb3\x88\x32\x47\xd9\x0b\x2b\xb6\xe2\x12\x20\x40\x60\x7e\
+\x01\x29\x12\xc8\x50\xa0\xf9\x00\xc0\xcb\xeb\xab\xbf\x02\x90\xe1\
+\x86\xa9\x48\x04\x08\x10\x20\xb0\x2b\x2e\x08\xe0\xe4\xdf\x56\x4b\
+\x80\x00\x81\x4f\x01\xaf\x08\xe4\x28\xd0\x7c\x00\x20\xc7\x46\x51\
+\x26\x02\x04\x08\x2c\x2d\x20\xf8\xb9\xb4\xf0\x7c\xe9\xc7\xd5\xf4\
+\xee\x79\xfa\xf9\x92\x5c\x24\xa5\x28\x63\x94\x75\x91\xc4\x25\x4a\
+\x80\x00\x81\xf2\x04\x94\x38\x43\x01\xe3\x1f\xdf\x01\x90\xe1\x66\
+\xa9\x48\x04\x08\x10\x20\x40\xe0\x4c\xe0\x70\xf8\x1a\x27\xd8\x67\
+\x73\xb3\x79\xdb\x95\x2d\x95\x31\x9b\x02\x29\xc8\x43\x01\x83\xe0\
+\x87\x44\x16\x20\xf0\xa4\x80\xd5\x09\xe4\x29\xe0\x0e\x80\x3c\xdb\
+\x45\xa9\x08\x10\x20\x40\x80\xc0\xa9\x40\x3a\xc1\xee\x4e\xb4\x4f\
+\xe7\x6e\xfa\x2e\x6e\xf9\xff\xeb\xcf\x3f\xfc\x16\x5f\x5a\xb8\x69\
+\x41\x64\x4e\x80\x00\x81\xdc\x04\x94\x87\x40\xa6\x02\x02\x00\x99\
+\x36\x8c\x62\x11\x20\x40\x80\x00\x81\x0b\x81\x08\x02\xfc\xfc\xc3\
+\x21\x87\x40\x40\x94\x21\x6e\xf9\x3f\xec\x76\x5f\x76\xfe\x11\x20\
+\x40\x80\xc0\x89\x80\x37\x04\x72\x14\x88\x63\xf6\x4b\xfc\xc8\xb1\
+\x70\x6b\x95\xe9\x5f\xff\xf7\xbf\xef\x6b\xe5\x25\x1f\x02\x04\x08\
+\x10\x20\x30\x8b\xc0\x86\x81\x80\x38\xf1\xff\x4b\x0a\x42\xb8\xea\
+\x3f\x4b\x4b\x4a\x84\x00\x81\x3a\x05\xd4\x8a\x40\xb6\x02\xee\x00\
+\xc8\xb6\x69\x14\x8c\x00\x01\x02\x04\x08\x3c\x10\x58\x29\x10\x10\
+\xb7\xfa\xc7\xe4\xc4\xff\x41\x7b\x14\xf4\xb1\x0b\x20\x05\x35\x96\
+\xa2\x16\x28\xa0\xc8\x04\xf2\x15\x10\x00\xc8\xb7\x6d\x94\x8c\x00\
+\x01\x02\x8b\x09\x18\xfc\x2f\x46\xbb\x4d\xc2\xef\x81\x80\x78\x1e\
+\x3f\xae\xd0\xc7\xc9\xfa\xb3\x05\x89\x34\x22\xbd\x98\xe2\x56\xff\
+\x98\x9e\x4d\xd3\xfa\x04\x08\x10\x68\x42\x40\x25\xb3\x15\x30\xfe\
+\xf1\x57\x00\xb2\xdd\x38\x15\x8c\x00\x01\x02\x04\x08\x8c\x15\xe8\
+\x1e\xeb\x4b\xc1\x80\x38\x59\x8f\xab\xf5\x11\x0c\x38\x9e\xe2\xa4\
+\x3e\xa6\x3e\xdd\x78\xdd\x4f\xfd\x72\x71\xc2\x1f\xeb\x46\x1a\x91\
+\x5e\x4c\xfd\xf2\x7e\x13\x20\x40\x80\xc0\x63\x01\x4b\x10\xc8\x59\
+\xc0\x1d\x00\x39\xb7\x8e\xb2\x11\x20\x40\x80\x00\x81\x67\x04\x52\
+\x30\xa0\x7b\x56\xff\xfd\x77\x9c\xd4\xc7\x14\x27\xf8\x31\xc5\xeb\
+\x7e\xea\x97\x73\xc2\xff\x0c\xb8\x75\x09\x10\x20\xb0\x43\x40\x20\
+\x6b\x01\x01\x80\xac\x9b\x47\xe1\x08\x10\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x28\x47\x40\x49\x09\xe4\x2d\xd0\x7c\x00\x20\x6e\x7d\
+\xcc\xbb\x89\x94\x8e\x00\x01\x02\x04\x08\x10\x20\x30\xaf\x80\xf1\
+\xcf\xbc\x9e\x52\x23\xf0\x21\xe0\x05\x81\xcc\x05\x9a\x0f\x00\x64\
+\xde\x3e\x8a\x47\x80\x00\x81\x45\x04\x0c\xfe\x17\x61\x95\x28\x01\
+\x02\x04\x08\x34\x2e\xa0\xfa\x79\x0b\x18\xff\xf8\x12\xc0\xbc\xb7\
+\x50\xa5\x23\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xa0\x14\x01\
+\xe5\x24\x90\xbd\xc0\xcb\x7e\xb7\xfb\xbe\xf3\x8f\x00\x01\x02\x04\
+\x08\x10\x20\x40\x80\x00\x01\x02\x04\x9e\x10\xb0\x2a\x81\xbc\x05\
+\xe2\xdc\xdf\x23\x00\x79\xb7\x91\xd2\x11\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x50\x82\x80\x32\x12\x28\x40\x40\x00\xa0\x80\x46\
+\x52\x44\x02\x04\x08\xcc\x2d\xf0\xfa\xf2\xf2\x65\xee\x34\xa5\x47\
+\x80\x00\x01\x02\x04\x5a\x16\x50\xf7\xfc\x05\x8c\x7f\x76\xbb\x97\
+\xfc\x9b\x69\xd9\x12\xda\x08\x96\xf5\x95\x3a\x01\x02\x04\x08\x10\
+\x20\x90\x9f\x80\xf1\x4f\x7e\x6d\xa2\x44\xc5\x0b\xa8\x00\x81\x22\
+\x04\x9a\x0f\x00\x14\xd1\x4a\x0a\x49\x80\x00\x01\x02\x04\x08\x10\
+\x20\x40\x80\x40\xc6\x02\x8a\x46\xa0\x0c\x01\x01\x80\x32\xda\x49\
+\x29\x09\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\xc8\x55\x40\xb9\
+\x08\x14\x22\x20\x00\x50\x48\x43\x29\x26\x01\x02\x04\x08\x10\x20\
+\x40\x80\x00\x01\x02\x79\x0a\x28\x15\x81\x52\x04\x9a\x0f\x00\xec\
+\x0f\x87\x1f\x4b\x69\x2c\xe5\x24\x40\x80\x00\x01\x02\x04\x08\xcc\
+\x21\x60\xfc\x33\x87\xa2\x34\x08\x7c\x08\x78\x41\xa0\x08\x81\xc3\
+\x7e\xff\xfb\x4b\xfc\x28\xa2\xb4\x0a\x49\x80\x00\x01\x02\xb3\x09\
+\x18\xfc\xcf\x46\x29\x21\x02\x04\x08\x10\x68\x5e\x00\x40\x29\x02\
+\xc6\x3f\xfe\x0a\x40\x29\xdb\xaa\x72\x12\x20\x40\x80\x00\x01\x02\
+\x04\x08\x10\x20\x90\xa3\x80\x32\x11\x28\x48\xe0\xe5\xe5\xf5\xf5\
+\x7b\x41\xe5\x55\x54\x02\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\
+\x08\x64\x23\xa0\x20\x04\x4a\x12\x68\xfe\x3b\x00\x4a\x6a\x2c\x65\
+\x25\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\x20\x2b\x01\x85\x21\
+\x50\x8c\x40\x5c\xfc\x6f\x3e\x00\x70\xd8\xed\xbe\xec\xfc\x23\x40\
+\x80\x40\x63\x02\xfa\xbe\xc6\x1a\x5c\x75\x09\x9c\x09\xe8\x03\xce\
+\x40\xbc\x25\x30\x59\xc0\x8a\x25\x09\xe8\xfb\x7c\x07\x40\xb7\xbd\
+\xfe\xed\xef\x7f\x12\x04\xe8\x24\xfc\x20\x40\x80\x00\x01\x02\x04\
+\x5a\x11\x30\xfe\x69\xa5\xa5\xd5\x73\x51\x01\x89\x13\x28\x4c\xe0\
+\xe5\x5f\xff\xf7\x3f\xdf\x01\x50\x58\xa3\x29\x2e\x01\x02\x04\x9e\
+\x11\x30\xe8\x7f\x46\xcf\xba\x04\x08\x10\x20\x40\xe0\x53\xc0\xab\
+\x72\x04\x8c\x7f\x76\xbb\x38\xf7\x6f\xfe\x11\x80\xd8\x64\x5f\x5f\
+\x5e\xdc\x01\x10\x10\x26\x02\x04\x9a\x10\xd0\xe7\x35\xd1\xcc\x2a\
+\x49\xe0\xa1\x80\xbe\xe0\x21\x91\x05\x08\x3c\x12\xf0\x79\x41\x02\
+\xfa\xbc\xb7\xc6\x7a\x79\xfb\xd5\xf6\x4f\x7f\x0f\xb2\xed\xf6\x57\
+\x7b\x02\x04\x08\x10\x20\xd0\xa2\x80\xf1\x4f\x8b\xad\xae\xce\xf3\
+\x0a\x48\x8d\x40\x79\x02\x5d\x00\x60\xbf\xdb\x79\x0c\x60\xe7\x1f\
+\x01\x02\x04\xda\x10\x30\xe8\x6f\xa3\x9d\xd5\x92\x00\x01\x02\x04\
+\x16\x16\x90\x7c\x51\x02\xc6\x3f\x6f\xcd\xd5\x05\x00\xde\x5e\xfa\
+\x49\x80\x00\x01\x02\x2d\x08\xf8\x06\xdc\x16\x5a\x59\x1d\x09\x10\
+\x20\x40\x60\x69\x01\xe9\x97\x25\xd0\xfa\xf8\xa7\xbf\xe8\x2f\x00\
+\x90\xb6\xdb\xd6\x37\x86\x44\xe0\x3f\x01\x02\x04\x08\x10\x20\xd0\
+\x98\x80\xf1\x4f\x63\x0d\xae\xba\x73\x0b\x48\x8f\x40\x51\x02\x87\
+\xfd\xfe\xf7\x28\x70\x17\x00\xe8\xdf\xc4\x8c\x56\x27\xdf\x0a\xd9\
+\x6a\xcb\xab\x37\x81\xb6\x04\xf4\x75\x6d\xb5\xb7\xda\x12\x78\x24\
+\xa0\x4f\x78\x24\xe4\x73\x02\xb7\x04\xcc\x2f\x49\x40\x5f\xf7\xd9\
+\x5a\x5d\x00\xe0\xe5\xf5\xd5\x77\x00\x7c\x9a\x78\x45\x80\x00\x81\
+\x6a\x05\x7c\x03\x6e\xb5\x4d\xab\x62\x04\x08\x10\x20\xb0\xa6\x80\
+\xbc\x8a\x12\x30\xfe\xf9\x6c\xae\x2e\x00\xf0\xf9\xb6\xdd\x57\x36\
+\x8a\x76\xdb\x5e\xcd\x09\x10\x20\x40\x80\x40\xab\x02\xc6\x3f\xad\
+\xb6\xbc\x7a\x3f\x2b\x60\x7d\x02\xa5\x09\xf4\x17\xfd\x05\x00\xde\
+\x5b\xce\xb7\x42\xbe\x43\xf8\x45\x80\x00\x01\x02\x04\x08\x34\x23\
+\x60\xfc\xd3\x4c\x53\xab\xe8\xbc\x02\x52\x23\x50\x9c\xc0\xbf\xfe\
+\xef\x7f\xdd\x5d\xff\x5d\x00\xa0\x7f\x53\x5c\x2d\x14\x98\x00\x01\
+\x02\x04\x46\x09\x18\xec\x8f\xe2\xb2\x30\x01\x02\x04\x08\x10\xb8\
+\x22\x60\x56\x69\x02\xc6\x3f\x9f\x2d\xd6\x05\x00\xe2\x6d\xff\x67\
+\x01\xe2\x75\x8b\x93\x6f\xc2\x6d\xb1\xd5\xd5\x99\x40\x7b\x02\xfa\
+\xba\xf6\xda\x5c\x8d\x09\xdc\x13\xd0\x27\xdc\xd3\xf1\x19\x81\x1b\
+\x02\x66\x17\x27\xa0\xaf\xfb\x6c\xb2\x8f\x00\xc0\xe7\x2c\xaf\x08\
+\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x40\xe0\x9a\x80\x79\
+\x04\x4a\x13\x38\xbe\xd8\x2f\x00\x70\xd4\x7a\xfe\x3c\xc4\x11\x86\
+\x97\x04\x08\x54\x27\xa0\x8f\xab\xae\x49\x55\x88\xc0\x2c\x02\xfa\
+\x86\x59\x18\x25\xd2\x8e\x80\x9a\x16\x26\xa0\x8f\xdb\xed\x0e\xfb\
+\xfd\xef\x7d\xb3\x7d\x04\x00\x8e\x67\xf6\x1f\xb6\xf6\xdb\x37\xe1\
+\xb6\xd6\xe2\xea\x4b\xa0\x2d\x01\x7d\x5c\x5b\xed\xad\xb6\x04\x86\
+\x0a\xe8\x1b\x86\x4a\x59\x8e\x40\x08\x98\x4a\x13\xd0\xc7\x9d\xb6\
+\xd8\x47\x00\xa0\xff\xb3\x00\xa7\x1f\xb7\xf5\xce\x97\x43\xb4\xd5\
+\xde\x6a\x4b\xa0\x35\x01\x7d\x5c\x6b\x2d\xae\xbe\x04\x86\x09\xe8\
+\x1b\x86\x39\x59\x8a\x40\x27\xe0\x47\x71\x02\xfa\xb8\xd3\x26\xfb\
+\x08\x00\x9c\xce\x6e\xf3\x9d\x2f\x87\x68\xb3\xdd\xd5\x9a\x40\x2b\
+\x02\xfa\xb8\x56\x5a\x5a\x3d\x09\x8c\x13\xd0\x37\x8c\xf3\xb2\x74\
+\xdb\x02\x6a\x5f\x9e\x80\x3e\x6e\xb7\xfb\xcf\x3f\xff\xfb\x4b\xdf\
+\x72\x1f\x01\x00\x7f\x0a\xf0\x8d\xc4\x33\x22\x6f\x0e\x7e\x12\x20\
+\x50\x97\xc0\x5f\xfe\xf1\xe7\x8f\x8e\xbf\xae\x9a\x8d\xac\xcd\x7e\
+\xff\x6d\xe4\x1a\x16\xaf\x5d\x20\x6d\x13\xc7\x5f\x8e\x54\x7b\x75\
+\x6f\xd5\xcf\xf8\xe7\x96\x8c\xf9\x04\x4e\x04\xbc\x29\x4c\xc0\xf8\
+\xe7\xb2\xc1\x3e\x02\x00\xf1\x91\x03\x60\xf7\x05\x09\x5f\xc3\xc2\
+\x44\x80\x00\x01\x02\x95\x09\xa4\x13\xbd\x2e\x02\x9e\x7e\x57\x56\
+\x33\xd5\x99\x2a\x90\xb6\x85\x6e\x9b\x98\xba\x7e\x45\xeb\x1d\xf6\
+\x7b\xe3\x9f\x8a\xda\x53\x55\x96\x12\x90\x2e\x81\xf2\x04\xce\xcf\
+\xf1\x4f\x02\x00\xe5\x55\x47\x89\x09\x10\x20\x40\x60\x88\x80\xe7\
+\xdf\x3e\x95\xba\x13\xbe\x74\xe2\xf7\x39\xc7\xab\x16\x05\x5e\x0e\
+\x87\x9f\xba\x6d\x21\x55\x3e\x9d\xfc\x7e\x7c\x3b\x72\x7a\xeb\x3f\
+\x01\x02\x04\xae\x0b\x98\x5b\x9c\x80\xf1\xcf\xee\xe4\x2f\x00\x44\
+\x03\x9e\x04\x00\x12\x50\xf3\xb7\x46\x7a\x46\x24\x36\x0b\x13\x01\
+\x02\xb5\x09\xe8\xdb\x76\xbb\xe3\x2f\xbb\x8d\x13\xbf\x38\x01\xac\
+\xad\x9d\xd5\x67\x98\x40\xb4\xfd\xf1\xa3\x8f\xc7\xdb\xc6\xb0\x14\
+\xea\x5b\x4a\x1f\x51\x5f\x9b\xaa\xd1\xfc\x02\x52\x2c\x4f\x40\xdf\
+\x76\xd9\x66\x27\x01\x80\xcb\x8f\xdb\x9c\xe3\x39\xb8\x36\xdb\x5d\
+\xad\x09\xd4\x2a\xe0\xf9\xb7\xb7\x96\x3d\x3e\xe1\x8b\x39\xf1\x3e\
+\x4e\x04\xe3\xb5\xa9\x0d\x81\xfd\x6e\xf7\x3d\xda\x3c\xda\xfe\xb8\
+\xc6\xe7\xef\x8f\x3f\x6b\xe9\xb5\xf1\x4f\x4b\xad\xad\xae\x13\x04\
+\xac\x52\x98\x80\xf1\xcf\x5b\x83\x9d\x07\xb9\x4f\x02\x00\x0e\x80\
+\x6f\x48\x07\xcf\xc1\xbd\x41\xf8\x49\x80\x00\x81\x4a\x04\xf6\xe9\
+\xc4\xef\x5a\x55\xe2\xb8\xf7\x9f\x5f\xff\xd8\xdf\xfa\xfc\xda\x3a\
+\xe6\x95\x29\x10\x6d\xfc\xef\x5f\xff\xf8\x29\xda\xfc\x5a\x0d\xe2\
+\xf3\x6b\xf3\x5b\x9a\x67\xfc\xd3\x52\x6b\xab\xeb\x78\x01\x6b\x10\
+\x28\x53\xe0\xfc\xb8\x77\x12\x00\x88\x2a\x39\x00\x86\x82\x89\x00\
+\x01\x02\xf5\x08\xec\x0f\x87\x1f\xeb\xa9\xcd\xb4\x9a\xa4\x13\x9b\
+\xbb\xcf\x78\xc7\x89\xe1\xce\xf7\x02\x4c\xc3\x2d\x61\xad\xd4\xb6\
+\x5d\x1b\x97\x50\x56\x65\x24\x40\x20\x4f\x01\xa5\x2a\x4e\xc0\xf8\
+\xe7\x7a\x93\x5d\x04\x00\xae\x2f\xd6\xd6\x5c\xcf\x8a\xb4\xd5\xde\
+\x6a\x4b\xa0\x76\x01\x7d\xda\xb0\x16\x8e\xef\x05\x10\x04\x18\x66\
+\x55\xd4\x52\xe9\xe4\xbf\x6b\xdb\x07\x85\x4e\x03\x45\xdf\x83\xb4\
+\xdb\x7d\xd9\xf9\x47\x80\xc0\x55\x01\x33\xcb\x13\x30\xfe\xd9\xed\
+\xae\x5d\xdc\xbf\x08\x00\x3c\xba\x4a\xb2\x6b\xe4\x9f\xe7\xe0\x1a\
+\x69\x68\xd5\x24\x50\xb9\x80\xe7\xdf\xde\x1a\xf8\xfc\xf9\xb7\xb7\
+\xb9\x97\x3f\xe3\x44\x31\x9e\x11\xbf\xfc\xc4\x9c\xd2\x04\x62\xd0\
+\x13\x6d\x19\x6d\x5a\x5a\xd9\xb7\x2c\xaf\xf1\xcf\x96\xfa\xf2\xce\
+\x58\x40\xd1\x0a\x13\x30\xfe\x79\x6b\xb0\x6b\xe7\xf6\x17\x01\x80\
+\xa1\x83\xa4\xb7\x24\xeb\xfd\x99\xb0\xbe\xd6\x5b\x3b\x35\x23\x40\
+\x80\x40\x5b\x02\xe7\xcf\xbf\xdd\xab\x7d\x2c\x1b\xdf\x0b\xb0\x4b\
+\x57\x8e\xef\x2d\xe7\xb3\x8c\x05\x52\xdb\xc5\x2d\xff\xd1\x96\x43\
+\x4b\x39\x66\xd9\xa1\x69\x96\xb8\x9c\xf1\x4f\x89\xad\xa6\xcc\xcb\
+\x0b\xc8\x81\x40\x3d\x02\x17\x01\x00\x07\xc0\x7a\x1a\x57\x4d\x08\
+\x10\x20\xb0\x3b\x1c\x9a\x0f\x66\xc6\x95\xe0\x29\x5b\x42\x77\xe5\
+\x38\x9d\x48\x4e\x59\xd7\x3a\x1b\x0a\xa4\x36\xeb\xda\x6e\x42\x11\
+\xa6\x6e\x2b\x13\xb2\xb2\x0a\x01\x02\x25\x09\x28\x6b\x79\x02\xc6\
+\x3f\x5d\x9b\x5d\x3b\x1e\x5e\x04\x00\x62\x49\x07\xc0\xdd\x2e\x9e\
+\x19\x71\x1b\x5c\x6c\x0d\x26\x02\x04\x08\x94\x2d\x90\xae\x68\xde\
+\xfd\x02\xc0\x7b\xb5\x8b\x03\x67\xdc\x46\x7e\x6f\x19\x9f\xe5\x21\
+\x10\x63\x97\x68\xab\x68\xb3\x3c\x4a\x54\x66\x29\x8c\x7f\xca\x6c\
+\x37\xa5\x5e\x56\x40\xea\x04\x6a\x12\xb8\x1a\x00\xa8\xa9\x82\xea\
+\x42\x80\x00\x81\x56\x05\x3c\xff\x36\x4f\xcb\xc7\x9d\x71\x1e\x09\
+\x98\xc7\x72\xb1\x54\xd2\x55\xff\xb1\xb7\xfc\x5f\x2b\x8b\x2f\x02\
+\xbc\xa6\x62\x1e\x81\xe6\x05\x00\x14\x26\x60\xfc\xf3\xde\x60\xe9\
+\xd8\xf8\xfe\xea\xe4\xd7\xd5\x00\x80\x03\xe0\x9b\x51\xba\x6a\xf4\
+\xf5\xed\x95\x9f\x04\x08\x10\x28\x4f\x20\xf5\xe5\xcd\xff\xf9\xbf\
+\x68\xb5\xb9\xbe\xdb\x26\xae\x2c\x0b\x04\x84\x68\x3e\x53\x5c\xf5\
+\x8f\x36\x89\xb6\xc9\xa7\x54\xe5\x97\xc4\xf8\xa7\xfc\x36\x54\x83\
+\x39\x05\xa4\x55\x9a\x80\xf1\xcf\xfd\x16\xbb\x1a\x00\xb8\xbf\x4a\
+\x3b\x9f\xba\x0d\xae\x9d\xb6\x56\x53\x02\xb5\x09\xc4\x23\x4c\xd1\
+\x87\xd5\x56\xaf\x29\xf5\x89\x2b\xf8\x53\xd6\xbb\xb5\x4e\x77\xb2\
+\x79\x23\xaa\x7e\x6b\x1d\xf3\xe7\x15\x88\x13\xff\xb8\xdd\x3f\xae\
+\xfa\xcf\x99\xf2\xdc\xdb\xca\x9c\x65\x5b\x33\xad\xe8\x3b\xa2\x0f\
+\x59\x33\x4f\x79\x11\xc8\x56\x40\xc1\x8a\x12\x88\xbe\x2b\xfa\xb0\
+\xa2\x0a\xbd\x50\x61\x6f\x5d\x00\xf4\x92\x58\x86\x00\x00\x10\x00\
+\x49\x44\x41\x54\xb9\x1a\x00\x70\x00\xfc\x6c\x05\x51\xf0\x4f\x0b\
+\xaf\x08\x10\x28\x47\xe0\xf5\xe5\xe5\x4b\x39\xa5\x5d\xae\xa4\x71\
+\xa2\xb8\x44\xea\x11\x04\x88\x2b\xcf\xfe\x52\xc0\x12\xba\x0f\xd2\
+\x4c\xc1\x97\x38\xf1\x5f\x6a\xac\xb2\xd4\x36\xf3\xa0\x56\xd9\x7d\
+\x6c\xfc\x93\x5d\x93\x28\xd0\x46\x02\xb2\x2d\x4b\xc0\xf8\xe7\xb3\
+\xbd\x6e\x1d\x27\x5f\x3e\x17\x39\x7d\xe5\x00\x78\xea\xe1\x1d\x01\
+\x02\x04\x8a\x12\xf0\xed\xb7\x5d\x73\xa5\x93\x98\xc9\x5f\x00\xd8\
+\x25\xf0\xe0\x87\x40\xc0\x03\xa0\x19\x3f\x8e\x71\x49\x5c\xf5\x0f\
+\xf3\x19\x93\xbd\x48\x6a\xe9\x6d\xe6\x22\x43\x33\x08\x10\xc8\x59\
+\x40\xd9\x4a\x13\x30\xfe\x79\x6b\xb1\x14\x2c\x7f\x7b\x71\xf9\xf3\
+\x66\x00\xc0\x01\xf0\x0d\x2b\x6e\x21\x89\x5b\x49\xde\xde\xf9\x49\
+\x80\x00\x81\xfc\x05\x7c\xf9\xcd\xfa\x6d\x14\x27\xa5\xee\x08\x58\
+\xc6\xbd\x3f\xf1\x5f\xf2\xaa\xff\x71\xc9\x6f\xdd\x32\x79\xbc\x4c\
+\x0b\xaf\x8d\x7f\x5a\x68\x65\x75\x7c\x2c\x60\x89\x92\x04\x8c\x7f\
+\x86\xb5\xd6\xcd\x00\x80\x03\xe0\x27\x60\x0a\x86\xf8\x32\xc0\x4f\
+\x0e\xaf\x08\x10\x20\x50\x8c\x40\x9c\x98\xaf\x59\xd8\xc8\x4f\x20\
+\x60\x1e\xf1\xb5\x4f\xfc\xe7\x29\x75\x5d\xa9\x18\xff\xd4\xd5\x9e\
+\x6a\x33\x41\xc0\x2a\x04\x0a\x15\xb8\x77\x2e\x7f\x33\x00\x70\xeb\
+\x99\x81\x42\x0d\x9e\x2a\x76\x44\xc1\x9f\x4a\xc0\xca\x04\x08\x10\
+\x58\x53\xc0\xed\x6f\x6b\x6a\x5f\xcd\x4b\x20\xe0\x2a\xcb\xa0\x99\
+\x5b\x9f\xf8\x1b\xff\x7c\x36\x93\xf1\xcf\xa7\x85\x57\x6d\x0a\xa8\
+\x75\x61\x02\xc6\x3f\x1f\x0d\x76\xef\x58\x76\x33\x00\x10\x6b\xc7\
+\x41\x38\x7e\x9b\x76\x3b\x8f\x01\xd8\x0a\x08\x10\x28\x41\xc0\xed\
+\x6f\x47\xad\x74\xe7\xf9\xb7\xa3\xa5\x16\x7d\x29\x10\x30\x8c\xb7\
+\x1b\x6f\xa4\xf6\x8a\xbb\x27\xd6\xba\xd5\xff\x5e\xc9\xba\xf2\xdc\
+\x5b\xa0\xa1\xcf\x8c\x7f\x1a\x6a\x6c\x55\x3d\x17\xf0\xbe\x20\x01\
+\xe3\x9f\xcf\xc6\x7a\x74\x0c\xbb\x1f\x00\x38\x1c\xbe\x7d\x26\xd5\
+\xf6\xab\xc3\x7e\xef\x31\x80\xb6\x37\x01\xb5\x27\x40\x80\xc0\x64\
+\x81\x93\x40\x40\x3a\xd1\x9d\x9c\x50\x65\x2b\xc6\x20\x25\xbe\xd8\
+\x2f\x4e\xfa\xc3\x28\x97\xea\xed\x8d\x7f\x3e\x9a\xc2\xf8\xe7\x83\
+\xc2\x8b\xe6\x04\x54\x98\x40\x99\x02\xa9\xdf\xbe\xfb\x05\xc8\x77\
+\x03\x00\x65\x56\x79\x99\x52\xc7\x6d\x70\xa2\xe0\xcb\xd8\x4a\x95\
+\x00\x81\x19\x05\xdc\xfe\xf6\x81\x99\xd3\x09\x65\x5f\xa8\x28\x53\
+\x37\xfd\xfa\xc7\xbe\xfb\x13\x82\x0d\x06\x03\xf6\xbb\xdd\xf7\x38\
+\xe9\xcf\xe5\x6a\x7f\xdf\x36\xc7\xbf\xef\xdd\x3a\x79\xbc\x5c\x0b\
+\xaf\x8d\x7f\x5a\x68\x65\x75\xbc\x2a\x60\x66\x59\x02\xc6\x3f\x1f\
+\xed\x75\xef\xf9\xff\x58\xe8\x6e\x00\x20\x0e\x80\xfb\x74\xa0\x8e\
+\x05\x4d\x04\x08\x10\x20\x90\xb7\x80\xdb\xdf\x8e\xda\xa7\x80\x13\
+\xeb\x2e\x10\xf0\xcf\xff\xfe\x12\x27\xc2\x11\x0c\xa8\xf9\x78\xdb\
+\xd5\x2d\xb5\x49\x9c\xf8\xc7\xd5\xfe\x18\x5f\x1c\xb5\x56\x96\x2f\
+\xbb\x32\x67\x59\x32\x85\x22\x40\x60\x0d\x01\x79\x94\x23\x60\xfc\
+\x73\xda\x56\x8f\x8e\xb1\x77\x03\x00\xa7\x49\x79\x77\xf0\x18\x80\
+\x8d\x80\x00\x81\x8c\x05\xf6\x87\xc3\x8f\x19\x17\x4f\xd1\xee\x08\
+\x44\x30\x20\x4e\x8c\xfb\x60\x40\xe9\x01\x81\x38\x79\x8e\x29\x4e\
+\xf8\xa3\x4e\x5d\xdd\x52\xb0\xe3\xd1\xa0\xe4\x0e\xd1\xea\x1f\xa5\
+\xfd\xc9\x63\x90\xef\xea\xc6\x3f\xef\x10\x7e\xb5\x24\xa0\xae\x05\
+\x09\xa4\xfe\xda\xf8\xa7\x6f\xaf\x14\x6c\xef\x5f\xde\xfa\xfd\x30\
+\x00\x90\x40\x1d\x00\xdf\xf5\xdc\x06\xf7\x0e\xe1\x17\x01\x02\xd9\
+\x09\xc4\x23\x4a\xd1\x47\x65\x57\xb0\x8d\x0a\x14\x27\xd4\x1b\x65\
+\xfd\x74\xb6\x51\xf6\x98\xba\x93\xe6\xa3\x47\x05\xe2\x84\xfa\xe9\
+\xc4\x17\x4a\x20\xca\x16\x53\x9c\xf0\xc7\x14\x65\x8f\xa9\xa4\x13\
+\xfe\x85\x68\xaa\x48\x36\xfa\x96\xe8\x63\xaa\xa8\x8c\x4a\x10\x18\
+\x24\x60\xa1\x52\x04\xa2\x6f\x8a\x3e\xaa\x94\xf2\xe6\x50\xce\x87\
+\x01\x00\x07\xef\xd3\x66\x12\x05\x3f\xf5\xf0\x8e\x00\x81\x3c\x04\
+\x5e\x5f\x5e\xbe\xe4\x51\x92\xed\x4b\x11\x27\xa2\xdb\x97\x62\xbe\
+\x12\x44\x30\x20\xa6\x38\xa1\x8e\xab\xe9\x71\x82\x1d\x77\x08\xc4\
+\x14\x75\x8d\x69\xbe\xdc\xee\xa7\x14\x79\xf5\x53\x94\xa3\x9f\xa2\
+\x6c\x31\xc5\x98\x21\xa6\xfb\xa9\x94\xf1\x69\xd4\x23\xea\x5a\x46\
+\x69\x97\x2f\xa5\xf1\xcf\xf2\xc6\x72\xc8\x48\x40\x51\x8a\x11\x30\
+\xfe\x39\x6d\xaa\x18\x2f\x9c\xce\xb9\x7c\xf7\x72\x39\xeb\x72\x8e\
+\x03\xe0\xa7\x89\x08\xd3\xa7\x85\x57\x04\x08\x64\x24\xe0\xcb\x6f\
+\x3e\x1a\x23\x9d\xa8\xdc\xfd\xf6\xdb\x8f\x05\x0b\x7d\x11\x27\xa6\
+\x71\x80\x8f\x29\x4e\xba\x63\xea\x03\x03\x71\x42\x1e\x81\x81\x7e\
+\x8a\xe3\xf7\xf9\x74\x5e\xed\xf3\xcf\xfb\xf7\x7d\x1a\x91\x66\x4c\
+\x91\x47\xe4\xd5\x4f\x51\x8e\x7e\x3a\x4f\xb3\x96\xf7\xb5\x6f\x4b\
+\x63\xda\xc9\xf8\x67\x8c\x96\x65\x4b\x17\x50\xfe\x82\x04\x8c\x7f\
+\x3e\x1a\x2b\x8e\xdf\x1f\x6f\xee\xbc\x18\x16\x00\xf0\xe7\x70\x4e\
+\x08\x7d\xd1\xc4\x09\x87\x37\x04\x08\x6c\x2c\xa0\x4f\x3a\x6d\x80\
+\x47\xdf\x7e\x7b\xba\x74\x3d\xef\xfa\x93\xf1\x08\x0c\xf4\x53\x7f\
+\xb2\x7e\xfc\x3b\x4e\xe4\x8f\xa7\xe3\xcf\x8e\x5f\xf7\x69\xf4\xe9\
+\xd6\x23\x35\xbc\x26\xad\x6e\x4b\xb7\x84\xf4\x35\xb7\x64\xcc\xaf\
+\x4c\x40\x75\x0a\x11\xd0\x27\x9d\x36\xd4\xd0\xa0\xf5\xa0\x00\xc0\
+\x69\xd2\xde\xed\x44\x9a\x6c\x04\x04\x08\xe4\x24\xa0\x4f\x3a\x69\
+\x8d\x38\x61\x3d\x99\xe1\x0d\x81\x89\x02\xb1\x2d\x0d\xbd\xa2\x32\
+\x31\x8b\xb2\x56\xd3\xd7\x94\xd5\x5e\x4a\x3b\x51\xc0\x6a\xc5\x08\
+\xe8\x93\x4e\x9a\x6a\x68\xd0\x7a\x50\x00\xc0\x01\xf0\xc4\xb6\x7b\
+\x23\xe2\xd4\x31\xf8\x41\x80\xc0\xc6\x02\xfa\xa2\xb3\x06\x18\xf0\
+\xed\xb7\x67\x6b\x78\x4b\x80\xc0\x08\x01\x7d\xce\x08\x2c\x8b\x96\
+\x29\xa0\xd4\x45\x08\xe8\x8b\x2e\x9b\x29\xce\xd9\x2f\xe7\x5e\xce\
+\x19\x14\x00\xb8\x5c\xcd\x1c\x77\x01\xd8\x06\x08\x10\xc8\x42\x40\
+\xf4\x3b\x8b\x66\x50\x88\x7a\x05\xfc\x35\xa4\xb3\xb6\xd5\xe7\x9c\
+\x81\x78\x5b\x9b\x80\xfa\x14\x22\xa0\x2f\x3a\x6d\xa8\x11\x17\x40\
+\x06\x07\x00\x1c\x00\x4f\x8d\xe3\x5d\xfc\xd9\x89\xf8\x6d\x22\x40\
+\x80\xc0\x16\x02\xa2\xdf\x97\xea\xf1\xdc\xfa\xe5\x5c\x73\x08\x4c\
+\x17\x18\x7a\x45\x65\x7a\x0e\xe5\xad\x69\xfc\x53\x5e\x9b\x29\xf1\
+\x60\x01\x0b\x16\x20\x60\xfc\x73\xd9\x48\x43\x6f\xff\x8f\x35\x07\
+\x07\x00\xe2\x00\xe8\x39\xb8\x20\xfb\x9c\x0e\xfb\xfd\xd7\xcf\x77\
+\x5e\x11\x20\x40\x60\x65\x01\xd1\xef\x53\xf0\x11\xd1\xef\xd3\x15\
+\xbd\x23\x70\x5f\xc0\xf8\xe7\xd4\xc7\xf8\xe7\xd4\xc3\xbb\x9a\x04\
+\xd4\xa5\x08\x01\xe3\x9f\x8b\x66\x8a\x73\xf5\x8b\x99\x37\x66\x0c\
+\x0e\x00\xdc\x58\xbf\xe9\xd9\xf1\x27\x71\x44\xc1\x9b\xde\x04\x54\
+\x9e\xc0\x66\x02\xa2\xdf\x9b\xd1\xcb\xb8\x41\x01\x77\x41\x9e\x36\
+\xba\xf1\xcf\xa9\x87\x77\x15\x09\xa8\x4a\xf6\x02\xc6\x3f\x57\x9a\
+\x68\xe4\x05\x90\x51\x01\x00\x07\xc0\x4b\x70\x51\xf0\x4b\x13\x73\
+\x08\x10\x58\x41\x40\xf4\xfb\x02\xd9\xed\xff\x17\x24\x66\xcc\x24\
+\x30\xe6\xca\xca\x4c\x59\x66\x9f\x8c\xf1\x4f\xf6\x4d\xa4\x80\x13\
+\x04\xac\x52\x80\x80\xf1\xcf\x45\x23\x8d\xb9\xfd\x3f\x56\x1e\x15\
+\x00\x88\x03\xa0\xdb\xe0\x82\xed\x73\x12\x05\xff\xb4\xf0\x8a\x00\
+\x81\x75\x04\x44\xbf\x2f\x9d\x1d\x9b\x2e\x4d\xcc\x99\x57\xc0\x36\
+\x76\xea\x69\xfc\x73\xea\xe1\x5d\x15\x02\x2a\x91\xb9\x80\xf1\xcf\
+\xf5\x06\x8a\x73\xf4\xeb\x9f\x5c\x9f\x3b\x2a\x00\x70\x3d\x09\x73\
+\x45\xc1\x6d\x03\x04\x08\xac\x2a\x20\xfa\x7d\xc1\x9d\xfa\xe1\xdf\
+\x2f\x66\x9a\x41\x60\x46\x01\x77\x41\x5e\x62\xa6\xfd\xce\x77\x21\
+\x5d\xb2\x98\x53\xac\x80\x82\x67\x2f\x60\xfc\x73\xd9\x44\x23\x6f\
+\xff\x8f\x04\x46\x07\x00\x1c\x00\x83\xed\x74\x12\x05\x3f\xf5\xf0\
+\x8e\x00\x81\xe5\x04\x44\xbf\xaf\xdb\xba\xfd\xff\xba\x8b\xb9\x04\
+\x96\x14\x30\xfe\x59\x52\x57\xda\xab\x0b\xc8\x30\x6b\x01\xe3\x9f\
+\xeb\xcd\x33\xf6\xf6\xff\x48\x65\x74\x00\x20\x6e\x31\x70\x1b\x5c\
+\xd0\x9d\x4e\xa2\xe0\xa7\x1e\xde\x11\x20\x40\x60\x35\x81\x09\xd1\
+\xef\xd5\xca\x26\xa3\x6a\x04\x8c\x7f\xae\x37\xa5\xf1\xcf\x75\x17\
+\x73\xcb\x13\x50\x62\x02\x25\x0a\xc4\xb1\x69\x6c\xb9\x47\x07\x00\
+\x22\x03\x77\x01\x84\xc2\xe9\x24\x0a\x7e\xea\xe1\x1d\x01\x02\xf3\
+\x0b\x74\xd1\x6f\xb7\xbf\xcd\x0f\x2b\x45\x02\x03\x05\x8c\x7f\x2e\
+\xa1\x8c\x7f\x2e\x4d\xcc\x29\x52\x40\xa1\x33\x16\x30\xfe\xb9\xd1\
+\x38\x13\x2f\x80\x4c\x0a\x00\xdc\x28\x42\xf3\xb3\x45\xc1\x9b\xdf\
+\x04\x00\x10\x58\x56\xc0\xc9\xff\x55\x5f\xb7\xff\x5f\x65\x31\x73\
+\x01\x81\x29\x57\x5a\x16\x28\x46\x76\x49\x1a\xff\x64\xd7\x24\x0a\
+\x34\x5a\xc0\x0a\x59\x0b\x18\xff\x5c\x6d\x9e\xa9\xe3\x9f\x49\x01\
+\x80\x38\x00\x7a\x0c\xe0\xb2\x1d\x22\x0a\xde\x45\xa8\x2e\x3f\x32\
+\x87\x00\x01\x02\x4f\x09\xe8\x5b\x6e\xf0\x4d\x8c\x7e\xdf\x48\xcd\
+\x6c\x02\x0f\x05\x8c\x7f\x2e\x89\x8c\x7f\x2e\x4d\xcc\x29\x4c\x40\
+\x71\xb3\x15\x30\xfe\xb9\xd1\x34\x4f\x8c\x7f\x26\x05\x00\xa2\x18\
+\x6e\x83\x0b\x85\x2b\x53\x8a\x50\xfd\xed\xef\x7f\xfa\x72\xe5\x13\
+\xb3\x08\x10\x20\x30\x5d\x20\xf5\x2d\xd3\x57\xae\x77\xcd\xa9\xd1\
+\xef\x7a\x45\xd4\x6c\x69\x01\xe3\x9f\x1b\xc2\xa9\x8f\x32\xfe\xb9\
+\x61\x63\x76\xf6\x02\x0a\x98\xb1\x40\xea\x5b\x32\x2e\x5d\x91\x45\
+\x9b\x1c\x00\x88\xbb\x00\x8a\xac\xf1\x0a\x85\x76\x2b\xdc\x0a\xc8\
+\xb2\x20\xd0\x90\x80\xe8\xf7\x8d\xc6\x7e\x22\xfa\x7d\x23\x45\xb3\
+\x09\x3c\x14\x88\xf1\x8f\xbb\x00\xae\x33\x19\xff\x5c\x77\x31\x37\
+\x7b\x01\x05\xcc\x54\xc0\xf8\xe7\x76\xc3\x3c\x73\x01\x64\x72\x00\
+\x20\x8a\xe3\x00\x18\x0a\x97\x53\xdc\x0a\x27\x0a\x7e\xe9\x62\x0e\
+\x01\x02\xe3\x05\xba\x83\x9f\xe8\xf7\x78\x38\x6b\x10\x58\x50\xc0\
+\x5d\x00\xd7\x71\x8d\x7f\xae\xbb\x98\x9b\xbb\x80\xf2\xe5\x28\x60\
+\xfc\x73\xa7\x55\x9e\xbc\x00\xf2\x5c\x00\xe0\x70\xf8\x76\xa7\x68\
+\x4d\x7f\x74\xd8\xef\xbf\x36\x0d\xa0\xf2\x04\x08\xcc\x23\xe0\xe4\
+\xff\xa6\xe3\x33\xd1\xef\x9b\x89\xfa\x80\xc0\x00\x01\x77\x01\xdc\
+\x46\x32\xfe\xb9\x6d\xe3\x93\x4c\x05\x14\x2b\x4f\x01\xe3\x9f\x9b\
+\xed\xf2\xec\xf8\xe7\xa9\x00\x80\x03\xe0\xcd\x76\xd9\x45\x14\xbc\
+\x8b\x5c\xdd\x5e\xc4\x27\x04\x08\x10\xb8\x2b\xa0\x0f\xb9\xc3\xf3\
+\x64\xf4\xfb\x4e\xca\x3e\x22\x30\x48\x20\x9d\xe8\xfe\x3e\x68\xc1\
+\xc6\x16\x32\xfe\x69\xac\xc1\x2b\xa8\xae\x2a\xe4\x27\x60\xfc\x73\
+\xa7\x4d\x66\x18\xff\x3c\x15\x00\x88\xa2\xb9\x0d\x2e\x14\x6e\x4c\
+\x29\x72\xe5\x51\x80\x1b\x36\x66\x13\x20\xf0\x58\x20\xf5\x21\x8f\
+\x17\x6a\x73\x89\x67\xa3\xdf\x6d\xaa\xa9\xf5\x9c\x02\x2f\xaf\xaf\
+\xdf\xe7\x4c\xaf\xaa\xb4\x52\xdf\x65\xfc\x53\x55\x8b\xd6\x5c\x19\
+\x75\xcb\x51\x20\xf5\x21\x39\x16\xab\x96\x32\x3d\x1d\x00\x88\xbb\
+\x00\x6a\xc1\x58\xa2\x1e\xe9\x0a\x81\x47\x01\x96\x80\x95\x26\x81\
+\xca\x05\x44\xbf\xef\x34\xf0\x0c\xd1\xef\x3b\xa9\xfb\x88\xc0\x20\
+\x81\x18\xff\xf8\x2e\xa4\xdb\x54\xc6\x3f\xb7\x6d\x7c\x92\x93\x80\
+\xb2\xe4\x26\x60\xfc\x73\xbf\x45\xe6\xb8\x00\xf2\x74\x00\x20\x8a\
+\xe8\x00\x18\x0a\xd7\xa7\xb8\x15\x4e\x14\xfc\xba\x8d\xb9\x04\x08\
+\x5c\x17\xe8\x0e\x7e\xa2\xdf\xd7\x71\xcc\x25\x90\x91\x80\xbb\x20\
+\x6f\x37\x86\xf1\xcf\x6d\x1b\x9f\x64\x24\xa0\x28\x59\x09\x18\xff\
+\x3c\x68\x8e\x99\x2e\x80\xcc\x13\x00\xf0\x65\x80\x77\x5b\x4b\x14\
+\xfc\x2e\x8f\x0f\x09\x10\x38\x17\x70\xf2\x7f\x2e\x72\xf2\x7e\x8e\
+\xe8\xf7\x49\x82\xde\x10\x98\x28\xe0\x2e\x80\xfb\x70\xc6\x3f\xf7\
+\x7d\x7c\xba\xbd\x80\x12\x64\x26\x60\xfc\x73\xb7\x41\xe6\x1a\xff\
+\xcc\x12\x00\x70\x00\xbc\xdb\x56\xbe\x10\xf0\x3e\x8f\x4f\x09\x10\
+\x38\x12\xe8\xa2\xdf\x47\xef\xbd\x3c\x13\x98\x29\xfa\x7d\x96\xaa\
+\xb7\x04\x26\x0b\xa4\x93\x5c\x5f\x06\x78\x43\x2f\xee\x02\xd0\xa7\
+\xdd\xc0\x31\x3b\x07\x01\x65\xc8\x48\x40\x5f\xf1\xa0\x31\x66\x1c\
+\xff\xcc\x12\x00\x88\xe2\xba\x0d\x2e\x14\xee\x4c\x29\xa2\xe5\x51\
+\x80\x3b\x3e\x3e\x22\x40\x60\xd7\xf5\x11\xa9\xaf\x40\x71\x5b\x60\
+\xae\xe8\xf7\xed\x1c\x7c\x42\x60\x9c\x80\x6d\xf2\x81\x57\xea\xd3\
+\xba\xbe\xed\xc1\x62\x3e\x26\xb0\xbe\x80\x1c\x73\x11\xe8\xfa\x88\
+\xd4\x57\xe4\x52\x9e\xda\xcb\x31\x5b\x00\xc0\x5d\x00\x8f\x37\x95\
+\x74\x95\xc0\x17\x02\x3e\x66\xb2\x04\x81\x66\x05\xf4\x11\x0f\x9a\
+\x7e\xc6\xe8\xf7\x83\x9c\x7c\x4c\x60\x94\x80\xef\x42\xba\xcf\xa5\
+\x6f\xbb\xef\xe3\xd3\x8d\x04\x64\x9b\x8d\x80\x3e\xe2\x41\x53\xa4\
+\xf1\xcf\x9c\xc1\xe6\xd9\x02\x00\x51\x6c\x77\x01\x84\xc2\xed\xc9\
+\xad\x70\xb7\x6d\x7c\x42\xa0\x75\x81\xb8\xf5\x2d\xfa\x88\xd6\x1d\
+\xd4\x9f\x40\x89\x02\xc6\x3f\xf7\x5b\x2d\xfa\xb6\xe8\xe3\xee\x2f\
+\xe5\x53\x02\xeb\x0a\xc8\x2d\x0f\x81\xe8\x1b\xa2\x8f\xc8\xa3\x34\
+\x6d\x94\x62\xd6\x00\x80\xbb\x00\x06\x6c\x34\x87\xc3\xd7\xd8\xd0\
+\x07\x2c\x69\x11\x02\x04\x1a\x11\xe8\xfa\x84\xd4\x37\x34\x52\xdd\
+\xc9\xd5\x9c\x33\xfa\x3d\xb9\x10\x56\x24\x70\x45\xc0\xf8\xe7\x0a\
+\xca\xf9\xac\xd4\xc7\x75\x7d\xdd\xf9\x7c\xef\x09\x6c\x23\x20\xd7\
+\x0c\x04\xba\x3e\x21\xf5\x0d\x19\x14\x25\xeb\x22\xcc\x3d\xfe\x99\
+\x35\x00\x10\x72\xa2\xe0\xa1\xf0\x60\x4a\x1b\x7a\xf7\xac\xcb\x83\
+\xc5\x7c\x4c\x80\x40\xfd\x02\x5d\x5f\x90\xfa\x84\xfa\x6b\xfa\x64\
+\x0d\xf7\xfb\x6f\x4f\xa6\x60\x75\x02\x8b\x0a\x18\xff\x0c\xe0\x4d\
+\x7d\x5d\xd7\xe7\x0d\x58\xd4\x22\x04\x96\x15\x90\xfa\xd6\x02\x5d\
+\x5f\x90\xfa\x84\xad\xcb\x91\x7d\xfe\x0b\x8c\x7f\x66\x0f\x00\x44\
+\x14\x3c\x7b\xc8\x0c\x0a\xe8\x59\x97\x0c\x1a\x41\x11\x08\x64\x20\
+\xa0\x2f\x18\xd6\x08\x73\x47\xbf\x87\xe5\x6a\x29\x02\xc3\x05\x62\
+\xfc\xe3\xbb\x00\x1e\x7b\xe9\xf3\x1e\x1b\x59\x62\x05\x01\x59\x6c\
+\x2e\xa0\x2f\x18\xd6\x04\x4b\x8c\x7f\x66\x0f\x00\x74\x55\x59\x20\
+\x52\xd1\xa5\x5b\xd1\x8f\x78\xd6\xa5\xbb\xed\xa5\xa2\x3a\xa9\x0a\
+\x01\x02\xe3\x04\xa2\x0f\x88\xbe\x60\xdc\x5a\x0d\x2e\xed\x98\xd2\
+\x60\xa3\x97\x59\x65\x77\x01\x3c\x6e\xb7\xe8\xf3\xa2\xef\x7b\xbc\
+\xa4\x25\x08\x2c\x27\x20\xe5\x6d\x05\xa2\x0f\x88\xbe\x60\xdb\x52\
+\x14\x90\xfb\x42\xe3\x9f\x45\x02\x00\x4b\x44\x2a\x0a\x68\xa2\xf1\
+\x45\x3c\xf8\x3e\x80\xf1\x68\xd6\x20\x50\x87\x40\x1c\xfc\x76\xa9\
+\x0f\xa8\xa3\x36\xcb\xd6\xc2\x31\x65\x59\x5f\xa9\xcf\x27\xe0\x2e\
+\x80\x81\x96\xa9\xef\xeb\xfa\xc0\x81\x8b\x5b\x8c\xc0\xcc\x02\x92\
+\xdb\x50\xa0\xdb\xf7\x53\x1f\xb0\x61\x11\x8a\xc9\x7a\xa9\xf1\xcf\
+\x22\x01\x80\x50\x75\x1b\x5c\x28\x0c\x98\xd2\x0e\xd0\x3d\x03\x33\
+\x60\x51\x8b\x10\x20\x50\x87\x40\xb7\xcf\xa7\x7d\xbf\x8e\xda\x2c\
+\x5c\x8b\x85\xa2\xdf\x0b\x97\x5a\xf2\x0d\x0b\xb8\x0b\x60\x60\xe3\
+\xa7\x3e\xb0\xeb\x0b\x07\x2e\x6e\x31\x02\xf3\x09\x48\x69\x2b\x81\
+\x6e\x9f\x4f\xfb\xfe\x56\xf9\x17\x95\xef\x82\xe3\x9f\xe5\x02\x00\
+\x87\x83\x2f\x6c\x1a\xb8\x95\x1d\xf6\xfb\xaf\x03\x17\xb5\x18\x01\
+\x02\x15\x08\xd8\xe7\x87\x37\xe2\x52\xd1\xef\xe1\x25\xb0\x24\x81\
+\x71\x02\xee\x02\x18\xee\xa5\x2f\x1c\x6e\x65\xc9\x19\x05\x24\xb5\
+\x99\x80\x7d\x7e\x38\xfd\x92\xe3\x9f\xc5\x02\x00\x71\x00\xdc\x2d\
+\x18\xb9\x18\xce\x97\xff\x92\xf1\x0c\x4c\x77\x3b\x4c\xfe\x45\x55\
+\x42\x02\x04\x9e\x14\x88\x7d\x3d\xf6\xf9\x27\x93\x69\x63\x75\xc7\
+\x90\x36\xda\xb9\xc2\x5a\xba\x0b\x60\x58\xa3\x46\x5f\x18\x7d\xe2\
+\xb0\xa5\x2d\x45\x60\x1e\x01\xa9\x6c\x23\x10\xfb\x7a\xec\xf3\xdb\
+\xe4\x5e\x58\xae\x0b\x8f\x7f\x16\x0b\x00\x04\xf3\x92\x91\x8b\x48\
+\xbf\xaa\xe9\xe0\xfb\x00\xaa\x6a\x4f\x95\x21\x70\x45\x20\x0e\x7e\
+\x9e\xfb\xbf\x02\x73\x6d\x56\x3a\xf8\x39\x86\x5c\x83\x31\xaf\x04\
+\x81\xb8\x08\xe2\x51\xc8\x81\x2d\x65\xfc\x33\x10\xca\x62\x33\x09\
+\x48\x66\x03\x01\xe3\x9f\x71\xe8\x4b\x8f\x7f\x16\x0d\x00\x74\x55\
+\x4d\x83\xb8\xee\xb7\x1f\x8f\x05\xd2\x41\xb0\x7b\x36\xe6\xf1\x92\
+\x96\x20\x40\xa0\x30\x81\x6e\xdf\x4e\xfb\x78\x61\xc5\x56\x5c\x02\
+\x04\x26\x0a\xb8\x0b\x60\x04\x5c\xea\x1b\xbb\x3e\x72\xc4\x2a\x16\
+\x25\x30\x4d\xc0\x5a\x6b\x0b\x74\xfb\x76\xda\xc7\xd7\xce\xb7\xd8\
+\xfc\x56\x38\x77\x5e\x3c\x00\xb0\x74\x04\xa3\xd8\xc6\xbd\x51\x70\
+\xcf\xc6\xdc\x80\x31\x9b\x40\xe1\x02\xf6\xed\x11\x0d\x98\x0e\x7e\
+\x8e\x1d\x23\xbc\x2c\x9a\xa5\x80\xbb\x00\xc6\x35\x8b\x3e\x72\x9c\
+\x97\xa5\x27\x0a\x58\x6d\x75\x01\xfb\xf6\x38\xf2\x35\xc6\x3f\x8b\
+\x07\x00\xba\x2a\xa7\xc1\x5c\xf7\xdb\x8f\x87\x02\xf1\x6c\xcc\x5f\
+\x7f\xfe\xe1\xb7\x87\x0b\x5a\x80\x00\x81\x62\x04\x62\x9f\x8e\x7d\
+\xbb\x98\x02\x2b\x28\x01\x02\xb3\x08\xb8\x0b\x60\x38\x63\xf4\x91\
+\xd1\x57\x0e\x5f\xc3\x92\x04\xc6\x0b\x58\x63\x5d\x81\xd8\xa7\x63\
+\xdf\x5e\x37\xd7\x82\x73\x5b\xe9\x9c\x79\x95\x00\xc0\x1a\x91\x8c\
+\x82\x9b\xfa\xa2\xe8\xb1\xa3\xc4\x0e\x73\xf1\x81\x19\x04\x08\x14\
+\x27\x10\xcf\xbd\xc5\x3e\x5d\x5c\xc1\xb7\x2a\x70\x3a\xf8\x39\x66\
+\x6c\x85\x2f\xdf\xb9\x05\xdc\x05\x30\x4e\x34\xfa\x4a\xe3\x9f\x71\
+\x66\x96\x1e\x25\x60\xe1\x15\x05\x8c\x7f\xc6\x63\xaf\x35\xfe\x59\
+\x25\x00\xd0\x55\x3f\x0d\xea\xba\xdf\x7e\x0c\x12\x88\x83\x60\xec\
+\x38\x83\x16\xb6\x10\x01\x02\x59\x0a\x74\xfb\xb0\xe7\xde\xb2\x6c\
+\x1b\x85\x22\xb0\x96\x80\xbb\x00\xc6\x49\x1b\xff\x8c\xf3\xb2\xf4\
+\x18\x01\xcb\xae\x25\x60\xfc\x33\x41\x7a\xc5\x73\xe5\xd5\x02\x00\
+\x6b\x45\x34\x26\x70\xe7\xbb\x4a\x3a\x71\xe8\x76\xa0\x7c\x4b\xa8\
+\x64\x04\x08\xdc\x10\xe8\xf6\xdd\xb4\x0f\xdf\xf8\xd8\xec\x6b\x02\
+\xe9\xe0\xe7\x58\x71\x0d\xc6\xbc\x92\x05\xdc\x05\x30\xa1\xf5\x52\
+\xdf\xd9\xf5\xa1\x13\x56\xb5\x0a\x81\x9b\x02\x3e\x58\x45\xa0\xdb\
+\x77\xd3\x3e\xbc\x4a\x66\x15\x65\xb2\xe6\xf8\x67\xb5\x00\x40\xb4\
+\xcf\xcb\xe1\xf0\x53\xfc\x36\x8d\x10\x48\x3b\x50\xb7\x23\x8d\x58\
+\xc5\xa2\x04\x08\x6c\x2b\xd0\xed\xb3\x69\xdf\xdd\xb6\x14\x72\x27\
+\x40\x20\x17\x01\x77\x01\x4c\x68\x89\xd4\x87\x76\x7d\xe9\x84\x55\
+\xad\x42\xe0\x9a\x80\x79\xcb\x0b\x74\xfb\x6c\xda\x77\x97\xcf\xa9\
+\xb2\x1c\xd2\x05\x90\x35\x6b\xb4\x6a\x00\x40\x14\x7c\x62\xd3\xa6\
+\x1d\xa9\xdb\xa1\x26\xae\x6e\x35\x02\x04\xd6\x13\xe8\xf6\xd5\xb4\
+\xcf\xae\x97\x63\x25\x39\xa5\x83\xdf\x9a\xd1\xef\x4a\xd4\x54\xa3\
+\x10\x01\xe3\x9f\x89\x0d\x95\xfa\xd2\xae\x4f\x9d\xb8\xba\xd5\x08\
+\x1c\x09\x78\xb9\xb0\x40\xb7\xaf\xa6\x7d\x76\xe1\x6c\xaa\x4b\x7e\
+\xbf\xdb\x7d\x5f\x7b\xfc\xb3\x6a\x00\x20\x5a\x4c\x14\x3c\x14\x26\
+\x4c\x69\x87\xea\x76\xac\x09\xab\x5a\x85\x00\x81\x75\x04\xba\x7d\
+\x34\xed\xab\xeb\xe4\x26\x17\x02\x04\x4a\x12\x30\xfe\x99\xd8\x5a\
+\xa9\x4f\xed\xfa\xd6\x89\xab\x5b\x8d\xc0\x9b\x80\x9f\x4b\x0a\x74\
+\xfb\x68\xda\x57\x97\xcc\xa3\xd6\xb4\x0f\xfb\xfd\xef\x6b\xd7\x6d\
+\xf5\x00\x80\x28\xf8\x13\x4d\x9c\x76\xac\xbf\xfd\xfd\x4f\x5f\x9e\
+\x48\xc1\xaa\x04\x08\x2c\x24\xd0\xed\x9b\x69\x1f\x5d\x28\xf9\xba\
+\x93\x75\xf5\xbf\x1c\x7b\xb8\x37\x00\x00\x10\x00\x49\x44\x41\x54\
+\xee\xf6\x55\xbb\x4e\xc0\xf8\xa7\x63\x98\xf6\x23\xf5\xad\x5d\x1f\
+\x3b\x6d\x6d\x6b\x11\xd8\xed\x18\x2c\x26\xd0\xed\x9b\x69\x1f\x5d\
+\x2c\x83\x9a\x13\xde\x68\xfc\xb3\x7a\x00\x20\xda\x50\x14\x3c\x14\
+\xa6\x4d\xaf\xfb\xfd\x6f\xdd\x8e\x36\x6d\x75\x6b\x11\x20\xb0\x80\
+\x40\xec\x93\xb1\x6f\x2e\x90\x74\x13\x49\xae\x7d\xeb\x5b\x13\xa8\
+\x2a\x99\xa5\xc0\xbf\x7f\xfd\xc3\x77\x21\x4d\x6c\x99\xe8\x63\xa3\
+\xaf\x9d\xb8\xba\xd5\x1a\x17\x50\xfd\x65\x04\x62\x9f\x8c\x7d\x73\
+\x99\xd4\xeb\x4f\x75\xab\xf1\xcf\x26\x01\x80\x88\x82\xef\x52\xc4\
+\xa3\xfe\x66\x5d\xa6\x86\xb1\xa3\xc5\x0e\xb7\x4c\xea\x52\x25\x40\
+\x60\xac\x40\xec\x93\x63\xd7\xb1\xfc\xbb\x80\x63\xc1\x3b\x84\x5f\
+\xcd\x08\xd8\xe6\x27\x37\x75\xf4\xb5\xc6\x3f\x93\xf9\x5a\x5e\x51\
+\xdd\x17\x12\x88\x7d\x72\xa1\xa4\xeb\x4f\x76\xc3\x63\xc1\x26\x01\
+\x80\x68\xd1\x88\x78\xc4\x97\x1e\xc4\x6b\xd3\x78\x81\xc3\x7e\xff\
+\x75\xfc\x5a\xd6\x20\x40\x60\x4e\x81\x18\x88\xfe\xf5\xe7\x1f\x7e\
+\x9b\x33\xcd\xa6\xd2\x4a\x07\xbf\x38\x16\x34\x55\x67\x95\x6d\x5e\
+\x20\xb6\x79\xe3\x9f\xe9\x9b\x81\xf1\xcf\x74\xbb\x76\xd7\x54\xf3\
+\xb9\x05\x8c\x7f\x9e\x17\x8d\x63\xc1\xf3\xa9\x4c\x4b\x61\xb3\x00\
+\x40\x14\xd7\xa3\x00\xa1\x30\x6d\x3a\xec\x76\x5f\xfe\xf2\xf3\x0f\
+\x87\xd8\x01\xa7\xa5\x60\x2d\x02\x04\x9e\x11\x88\x7d\x2f\x22\xdf\
+\xb1\x2f\x3e\x93\x4e\xcb\xeb\xbe\xbc\xbe\x7e\x6f\xb9\xfe\xea\xde\
+\xae\x80\xf1\xcf\xf4\xb6\x8f\x3e\xd7\xf8\x67\xba\x5f\x93\x6b\xaa\
+\xf4\xac\x02\xc6\x3f\x33\x70\xa6\x0b\x20\x33\xa4\x32\x39\x89\x4d\
+\x03\x00\xf1\x28\x80\x28\xf8\xe4\xb6\xeb\x56\x8c\x13\x90\xd8\x11\
+\xbb\x37\x7e\x10\x20\xb0\x8a\x40\xec\x73\xb1\xef\xad\x92\x59\xad\
+\x99\xa4\x83\x5f\x1c\x03\x6a\xad\x9e\x7a\x11\xb8\x27\xd0\x6d\xfb\
+\x69\x1f\xb8\xb7\xcc\xff\xb3\x77\x6f\xe9\xb1\xe3\xe4\x1a\x80\x13\
+\xe6\x00\x43\xd9\xdc\x6e\x06\x05\xb7\x74\xdf\xd2\xcc\x09\x2e\xd9\
+\x0c\x85\x66\x0e\xd9\xfe\xb4\x96\x7b\x55\x92\x4a\xe2\xf2\x51\x87\
+\x97\x07\x75\x92\x2a\x5b\xd6\xff\xca\x96\xe4\xbf\x9c\x2c\xef\x7d\
+\x2e\x90\x31\x38\x63\xf1\xe7\x5b\x79\x97\x00\x81\x3d\x05\x72\xcd\
+\xe5\xda\xdb\xb3\xce\xe1\xea\x9a\xc6\xfe\x2b\x3f\xfd\x8f\xf7\xa5\
+\x09\x80\x34\x40\x16\x3c\x0a\xdb\x4a\x2e\xc4\xf2\xcf\x6f\x6c\xab\
+\xc6\xde\x04\x08\x2c\x10\xc8\xb5\x96\x6b\x6e\xc1\xa6\x36\xf9\x44\
+\xe0\xea\xc9\xef\x93\xa6\x79\x8b\xc0\x29\x02\xb9\x06\x3e\xf9\x10\
+\xe4\x94\x36\xb4\x7e\x90\x8c\xc5\x19\x93\x5b\x8f\x43\xfb\x09\xb4\
+\x20\x90\x6b\x2d\xd7\x5c\x0b\x6d\xad\xb9\x8d\x35\x3c\xfd\x78\x79\
+\x02\x40\x16\x7c\xa7\x53\xf4\xe5\xe5\xaf\xb9\x30\x77\xaa\x4d\x35\
+\x04\x08\xdc\x11\x28\xd7\xd8\x74\xad\xdd\x79\xcb\x4b\x8f\x08\x4c\
+\xd9\xef\x47\x36\xb7\x2d\x81\x5e\x05\x3e\xfe\x10\xa4\xd7\x88\x0f\
+\x88\x6b\x1a\x93\xcb\xd8\x7c\x40\xd5\xaa\x24\x40\xe0\x9b\x40\xb9\
+\xc6\xa6\x6b\xed\xdb\x4f\xfe\xbb\x5a\x60\x5a\xff\x94\x7b\xdf\xd5\
+\x15\xec\xb3\xe3\xe5\x09\x80\x84\x21\x0b\x1e\x85\x1d\xca\x74\x61\
+\x96\x0b\x74\x87\xaa\x54\x41\x80\xc0\x6b\x81\x72\x6d\x4d\xd7\xd8\
+\xeb\x57\xfd\xf4\xb0\xc0\x34\xf9\x65\xcc\x7f\x78\x3f\x3b\x10\xe8\
+\x50\x20\x0b\xc1\xbb\x4f\x01\x74\x18\xeb\xa1\x21\x4d\x63\x73\x19\
+\xa3\x0f\x3d\x88\xca\x09\x8c\x29\x50\xae\xad\xe9\x1a\x1b\x33\xfa\
+\x7d\xa3\xae\x65\xfd\x53\x45\x02\x20\xb4\xb2\xe0\x51\xd8\xa1\x4c\
+\x17\x68\xb9\x50\x77\xa8\x4a\x15\x04\x08\x7c\x13\x28\xd7\xd4\x74\
+\x6d\x7d\xfb\xc9\x7f\xb7\x08\xd4\x32\xf9\x6d\x89\xc1\xbe\x04\xf6\
+\x14\xf8\xbf\x5f\x7e\xfd\xd3\xdb\xfa\xfc\xbc\x42\x60\x1a\xa3\xcb\
+\x58\xbd\x62\x57\xbb\x10\x20\x70\x5f\xa0\x5c\x53\xd3\xb5\x75\xff\
+\x5d\xaf\x3e\x24\x30\x7d\x00\xf2\xd0\xf6\x07\x6e\x5c\x4d\x02\x20\
+\x59\xf0\xa7\x8a\x60\x0e\x34\x3f\xbe\xea\xe9\x42\x2d\x17\xec\xf1\
+\x47\x72\x04\x02\xdd\x0b\x94\x6b\x69\xba\xa6\xba\x0f\xf4\x8c\x00\
+\x8d\xf1\x67\x28\x3b\x46\x83\x02\xbf\x7b\x79\xb9\x4d\x02\x34\x18\
+\x41\x25\x4d\x9e\xc6\xea\x32\x66\x57\xd2\x1c\xcd\x20\xd0\xb2\x40\
+\xb9\x96\xa6\x6b\xaa\xe5\x18\xaa\x69\xfb\xb4\xfe\xa9\xe9\x03\x90\
+\x6a\x12\x00\xe9\xa0\xc0\x78\x14\x2e\x12\x3b\x94\xe9\x82\x2d\x17\
+\xee\x0e\x55\xa9\x82\xc0\xa8\x02\x7f\xfc\xf3\xef\xff\xf1\x34\x5d\
+\x4b\xa3\xc6\xbf\x6b\xdc\x95\x4d\x7e\xbb\xc6\xa6\x32\x02\x1b\x05\
+\xf2\x21\xc8\x8f\xf5\xcf\xc6\xca\x46\xdf\x7d\x1a\xb3\xad\x7f\x46\
+\x3f\x09\xc4\xbf\x55\xc0\xfa\x67\xab\xe0\xeb\xfd\x73\x8f\xfb\xfa\
+\x95\x6b\x7f\xaa\x2a\x01\x10\x0a\xbf\x0a\x10\x85\x9d\xca\x34\x09\
+\x96\x0b\x78\xa7\xea\x54\x43\x60\x24\x81\x5c\x3b\xf9\xf7\xa6\x47\
+\x8a\xf9\xc8\x58\x6b\xf8\xab\xb7\x47\xc6\xa7\x6e\x02\x5b\x05\x7e\
+\x5b\xff\x6c\xad\xc8\xfe\x4f\x49\xdc\x66\x0c\x47\x41\x80\xc0\xe3\
+\x02\xb9\x76\xac\x7f\x1e\x77\xfb\x70\x8f\xe9\x03\x90\x0f\xdf\xbb\
+\xe8\x8d\xea\x12\x00\xb2\xe0\xfb\x9e\x09\xb9\x80\x73\x21\xe7\xdf\
+\xed\xdc\xb7\x66\xb5\x11\xe8\x53\x20\xd7\x4a\xae\x99\x5c\x3b\x7d\
+\x46\x78\x41\x54\xd3\xe4\x97\xb1\xfd\x82\x23\x3b\x24\x81\x66\x04\
+\xca\x35\xf2\xfc\xfc\x73\x33\x0d\xae\xbc\xa1\x19\xc3\x33\x96\x67\
+\x4c\xaf\xbc\xa9\x9a\x47\xa0\x0a\x81\x5c\x2b\xb9\x66\x72\xed\x54\
+\xd1\xa0\x1e\x1a\x31\xad\x7f\x6a\xfb\xf4\x3f\xac\xd5\x25\x00\xd2\
+\x28\x7f\x10\x27\x0a\xfb\x95\x5c\xc8\xf9\x77\x3b\x3d\x12\xb7\x9f\
+\xa9\x9a\xfa\x14\xc8\x35\x92\x6b\x25\xd7\x4c\x9f\x11\x5e\x13\x55\
+\x8d\x93\xdf\x35\x12\x8e\x4a\xe0\x73\x81\x7f\xff\xed\x3f\x3f\xf9\
+\x55\x80\xcf\x8d\x1e\x79\x37\x63\x79\xc6\xf4\x8c\xed\x8f\xec\x67\
+\x5b\x02\xa3\x09\xe4\x1a\xc9\xb5\x92\x6b\x66\xb4\xd8\x8f\x8c\xb7\
+\xd6\xf5\x4f\x95\x09\x80\x74\x84\x3f\x88\x13\x85\x9d\xcb\xcb\xcb\
+\x5f\x73\x81\xef\x5c\xab\xea\x08\x74\x21\x50\xae\x8d\xe9\x1a\xe9\
+\x22\x98\x9a\x82\x98\xb2\xdf\x35\x35\x47\x5b\x08\xd4\x2d\xf0\xf4\
+\xe4\x57\x01\x9e\xf6\xff\xdf\x34\xb6\x97\x31\x7e\xff\x9a\xd5\x48\
+\xa0\x79\x81\x72\x6d\x4c\xd7\x48\xf3\x81\xd4\x16\x40\xc5\xeb\x9f\
+\x6a\x13\x00\x79\x14\x4e\x16\xfc\x80\x33\x79\xba\xc0\xf3\x78\x4f\
+\x1e\xf3\x39\xa0\x76\x55\x12\x68\x4e\x20\xd7\x42\xae\x89\xfc\xce\
+\x68\x73\x8d\xaf\xbd\xc1\xd3\xe4\x57\x6b\xf6\xbb\x76\x3a\xed\x1b\
+\x54\x60\x0a\x3b\xeb\x1f\xff\x2a\xd2\x04\xb1\xf7\xff\xad\x7f\xf6\
+\x16\x55\x5f\xe3\x02\xd6\x3f\x07\x76\x60\xe5\xeb\x9f\x6a\x13\x00\
+\xe9\x92\xfc\x2a\x80\x24\x40\x24\xf6\x2d\x79\xbc\x27\x8f\xf9\x94\
+\x8c\xdf\xbe\x55\xab\x8d\x40\x53\x02\xb9\x06\x72\x2d\xe4\x9a\x68\
+\xaa\xe1\x8d\x34\xd6\xcd\x7f\x23\x1d\xa5\x99\xd5\x08\xcc\x0d\xc9\
+\xb5\x63\xfd\x33\x6b\xec\xf7\x35\x63\x7d\xc6\xfc\x8c\xfd\xfb\xd5\
+\xaa\x26\x02\xed\x09\xe4\x1a\xc8\xb5\x90\x6b\xa2\xbd\xd6\xd7\xdf\
+\xe2\x8c\xe1\x35\xb7\xb2\xea\x04\x40\xe0\x3c\x0a\x17\x85\x83\xca\
+\x94\x0d\xcf\x00\x70\x50\xed\xaa\x25\x50\xb5\x40\x39\xf7\xa7\x6b\
+\xa0\xea\x46\x36\xdc\x38\xbf\xc6\xd5\x70\xe7\x69\xfa\x55\x02\xaf\
+\x8e\x6b\xfd\xf3\x8a\x63\xdf\x1f\xa6\xb1\xbf\xcc\x01\xfb\xd6\xaa\
+\x36\x02\x4d\x08\x94\x73\x7f\xba\x06\x9a\x68\x6c\x8b\x8d\x9c\x3e\
+\xfd\xaf\xbd\xd9\xd5\x27\x00\x3c\x0a\x77\xf0\x29\x34\x0d\x00\x79\
+\xfc\x39\x8f\x01\x1d\x7c\x24\xd5\x13\xa8\x42\x20\xe7\x7a\xce\x79\
+\x8f\xfc\x1f\xd8\x1d\xd3\xe4\x57\xc6\xee\x03\x0f\xa1\x6a\x02\xfd\
+\x09\xbc\x8e\xa8\x5c\x43\xd3\xb5\xf4\xfa\x55\x3f\xed\x26\x60\xfd\
+\xb3\x1b\xa5\x8a\xda\x10\xb0\xfe\x39\xa1\x9f\xa6\x31\xbb\xf6\x4f\
+\xff\xa3\x50\x7d\x02\x20\x8d\x0c\xa4\x47\xe1\x22\x71\x4c\xc9\xe3\
+\x3f\x79\x0c\xa8\x64\x04\x8f\x39\x84\x5a\x09\x54\x21\x90\x73\x3c\
+\xe7\x7a\xce\xf9\x2a\x1a\xd4\x63\x23\x1a\x99\xfc\x7a\xa4\x17\x53\
+\xe3\x02\x77\x9a\x9f\xf5\x8f\xbf\x07\x70\x07\x66\xa7\x97\x32\x17\
+\x64\x4e\xc8\xdc\xb0\x53\x95\xaa\x21\x50\xa5\x40\xce\xf1\x9c\xeb\
+\x39\xe7\xab\x6c\x60\x07\x8d\xca\xbd\x6a\x19\xb3\x1b\x88\xa5\x89\
+\x04\x40\x1c\x3d\x0a\x17\x85\x83\xcb\x94\x0d\xcf\x00\x71\xf0\x51\
+\x54\x4f\xe0\x12\x81\x72\x6e\x4f\xe7\xf8\x25\x07\x1f\xe4\xa0\x2d\
+\x4d\x7e\x83\x74\x89\x30\x1b\x12\xf8\xa8\xa9\x59\x50\xe6\xda\xfa\
+\xe8\x7d\xaf\xef\x20\x30\xcd\x0d\x65\x8e\xd8\xa1\x2a\x55\x10\xa8\
+\x4d\xa0\x9c\xdb\xd3\x39\x5e\x5b\xbb\x7a\x6b\x4f\xfe\x76\x5d\x2b\
+\x31\x35\x93\x00\xf0\x28\xdc\x49\xa7\xd4\x34\x40\xe4\xf1\xe8\x3c\
+\x26\x74\xd2\x11\x1d\x86\xc0\xa1\x02\x39\x97\x73\x4e\x7b\xe4\xff\
+\x50\xe6\x52\xb9\x44\x6d\x61\xf0\x1f\x02\x6b\x04\x3e\xdd\xc7\xb5\
+\xf5\x29\xcf\x3e\x6f\x5a\xff\xec\xe3\xa8\x96\x6a\x04\xac\x7f\x4e\
+\xec\x8a\xe7\xe7\x9f\x4f\x3c\xda\xe6\x43\x35\x93\x00\x48\xa4\xb2\
+\xe0\x51\x38\xbe\xe4\xf1\xa0\x3c\x26\x54\x32\x86\xc7\x1f\xce\x11\
+\x08\x1c\x26\x90\x73\x38\xe7\x72\xce\xe9\xc3\x0e\xa2\xe2\x6f\x02\
+\xd3\xe4\x57\x12\xb5\xdf\x7e\xf2\x5f\x02\x04\x1e\x12\xf8\x7c\xe3\
+\x72\x6d\x4d\xd7\xd8\xe7\x5b\x79\x77\xab\x40\xe6\x8a\xcc\x19\x99\
+\x3b\xb6\xd6\x65\x7f\x02\x57\x0a\xe4\x1c\xce\xb9\x9c\x73\xfa\xca\
+\x76\x0c\x71\xec\x69\x6c\xce\x3d\x6a\x4b\xb1\x36\x95\x00\x08\x6c\
+\x1e\xaf\xf0\x28\x5c\x24\x4e\x28\x53\x36\xfc\x7f\xfe\xfc\xfb\x97\
+\x0c\x22\x27\x1c\xcd\x21\x08\xec\x26\x20\xeb\xbd\x1b\xe5\xb2\x8a\
+\x1a\x9c\xfc\x96\x05\x66\x2b\x02\x27\x09\x2c\x38\x4c\x59\x60\x4e\
+\xd7\xda\x82\x4d\x6d\xb2\x55\xc0\xfa\x67\xab\xa0\xfd\x2f\x12\xb0\
+\xfe\x39\x17\x3e\xf7\xa4\x65\x6c\x3e\xf7\xb0\x9b\x8f\xd6\x5c\x02\
+\x20\x11\x7b\x14\x2e\x0a\x27\x96\x4c\x84\x7f\xf9\xc3\x4f\x27\x1e\
+\xd1\xa1\x08\xac\x12\x98\x27\x3e\x59\xef\x55\x7c\xab\x76\x6a\x75\
+\xf2\x5b\x15\xac\x9d\x08\x1c\x24\xb0\xb4\xda\x2c\x34\x73\xcd\x2d\
+\xdd\xde\x76\x1b\x05\xac\x7f\x36\x02\xda\xfd\x2c\x01\xeb\x9f\xb3\
+\xa4\x5f\x1f\xa7\xd5\x7b\xd2\x26\x13\x00\x79\x14\xee\x77\x2f\x2f\
+\x7f\x7a\xdd\x05\x7e\x3a\x54\x20\x93\xa0\xa7\x01\x0e\x25\x56\xf9\
+\x36\x81\x3c\xa9\xe2\xc6\x7f\x9b\xe1\x9a\xbd\x5b\x9d\xfc\xd6\xc4\
+\x6a\x1f\x02\x07\x09\x3c\x54\xad\x6b\xee\x21\xae\xed\x1b\x5b\xff\
+\x6c\x37\x54\xc3\xa1\x02\xd6\x3f\x87\xf2\x7e\x5c\xf9\xf3\xf3\xcf\
+\xb9\x27\xfd\x78\x83\x7a\xdf\x69\x32\x01\x10\xce\x02\x3e\xc1\xe7\
+\x7b\xe5\x44\x01\x13\xe1\x89\xd8\x0e\xb5\x44\x60\xce\x7a\xfb\x23\
+\x7f\x4b\xb4\x76\xde\x66\x1a\x83\xcb\x58\xbc\x73\xb5\xaa\x23\x30\
+\x96\xc0\x63\xd1\x96\x6b\x6e\xba\xf6\x1e\xdb\xcb\xd6\x9b\x05\xac\
+\x7f\x36\x13\xaa\x60\x5f\x01\xeb\x9f\x7d\x3d\x1f\xaa\x6d\x1a\x83\
+\xf3\x44\xd6\x43\xfb\x54\xb4\x71\xb3\x09\x80\x18\x06\xde\xa3\x70\
+\x91\xb8\xa0\x64\x22\xf4\x6b\x01\x17\xc0\x3b\xe4\x2c\x30\x4f\x7c\
+\x3e\xf5\x9f\x45\x4e\xfe\xda\xf8\xe4\x77\xb2\x96\xc3\x11\xf8\x58\
+\x60\xc5\x3b\x59\xff\x3c\x4d\xd7\xe0\x8a\x5d\xed\xb2\x55\xc0\xfa\
+\x67\xab\xa0\xfd\x37\x0a\x58\xff\x6c\x04\xdc\xba\xfb\x34\xf6\x96\
+\x31\x78\x6b\x3d\x17\xee\xdf\x74\x02\x20\x6e\xfe\x28\x60\x14\x2e\
+\x2a\x99\x04\xfd\x5a\xc0\x45\xf8\x63\x1f\xd6\xe3\x6e\xd7\xf6\x7f\
+\x12\xaf\xad\x4f\x7e\xd7\x0a\x3a\x3a\x81\x1f\x02\x6b\xbf\xcb\x35\
+\x98\x6b\x71\xed\xfe\xf6\xdb\x20\x60\xfd\xb3\x01\xcf\xae\x5b\x04\
+\xac\x7f\xb6\xe8\xed\xb3\x6f\xc6\xde\x7d\x6a\xba\xae\x96\xe6\x13\
+\x00\xa1\xf3\xfb\x70\x51\xb8\xb0\x98\x08\x2f\xc4\x1f\xeb\xd0\x73\
+\xd6\xdb\xe3\xfe\xd7\xf6\xbb\x31\xf7\x5a\x7f\x47\xef\x4a\x60\x53\
+\x30\xae\xc5\x4d\x7c\xdb\x77\xb6\xfe\xd9\x6e\xa8\x86\x45\x02\xd6\
+\x3f\x8b\x98\x0e\xdf\xa8\x97\xbf\x41\xd7\x45\x02\xc0\xef\xc3\x1d\
+\x7e\xbe\x2f\x3b\x40\x26\xc2\xbf\xfc\xe1\xa7\x64\x27\x97\xed\x60\
+\x2b\x02\xcb\x04\xe6\x89\xcf\xe3\xfe\xcb\xbc\x0e\xdd\xea\xb9\xdd\
+\x3f\x7a\x73\xa8\x8b\xca\x09\xac\x12\xd8\xb6\x53\xd6\x3f\xbd\x2c\
+\x48\xb7\x49\x5c\xbc\xb7\xf5\xcf\xc5\x1d\xd0\xef\xe1\xad\x7f\x2a\
+\xea\xdb\x8e\xd6\x3f\x5d\x24\x00\x72\x6a\x94\xc7\x31\xa6\x8e\xc9\
+\xf7\xca\x85\x02\xd3\x24\x98\x4f\x67\xff\xc7\xaf\x06\x5c\xd8\x09\
+\xfd\x1c\xda\xc4\x57\x59\x5f\x4e\x63\x6c\x19\x6b\x2b\x6b\x96\xe6\
+\x10\x68\x56\x60\x87\x86\x27\x09\xe0\xef\x01\xec\x00\xb9\xb5\x0a\
+\xeb\x9f\xad\x82\xf6\xbf\x11\xb0\xfe\xb9\xc1\xa8\xe1\xdb\xce\xd6\
+\x3f\xdd\x24\x00\x72\x6e\x64\x61\xea\xf7\xe1\x22\x51\x49\x99\x26\
+\x43\x89\x80\x4a\xfa\xa2\xb1\x66\x98\xf8\x2a\xec\xb0\xce\x26\xbf\
+\x0a\x85\x35\x69\x40\x81\xbd\x42\xce\xfa\x47\x12\x60\x2f\xcd\x1d\
+\xea\xb1\xfe\xd9\x01\x71\xcc\x2a\xac\x7f\x2a\xec\xf7\x0e\xd7\x3f\
+\x5d\x25\x00\x72\xca\xf8\xa3\x80\x51\xa8\xac\x98\x08\x2b\xeb\x90\
+\x7a\x9b\x63\xe2\xab\xb3\x6f\x92\x58\x2d\x37\x18\x75\x36\x4f\xab\
+\x08\xb4\x2a\xb0\x6b\xbb\x73\x8d\xe6\x5a\xdd\xb5\x52\x95\x6d\x13\
+\xb0\xfe\xd9\xe6\x37\xd0\xde\xd6\x3f\x75\x76\x76\xc6\xd4\x8c\xad\
+\x75\xb6\x6e\x7d\xab\xba\x4b\x00\x84\x22\x49\x80\x7c\x55\x2a\x13\
+\x30\x11\x56\xd6\x21\xf5\x34\x27\x7f\x37\x22\x4f\x8b\xf8\x1d\xff\
+\x7a\xfa\x64\x6e\x49\x26\x3f\x63\xea\xac\xe1\x2b\x81\x3d\x05\xf6\
+\xaf\x2b\xd7\x6a\xae\xd9\xfd\x6b\x56\xe3\x26\x01\xeb\x9f\x4d\x7c\
+\x3d\xef\x6c\xfd\x53\x77\xef\x66\x4c\xad\xbb\x85\xeb\x5a\xd7\x65\
+\x02\x20\x14\xfe\x28\x4e\x14\x2a\x2d\x26\xc2\x4a\x3b\xe6\xfc\x66\
+\xcd\x13\x5f\xfe\x6e\xc4\xf9\x47\x77\xc4\x25\x02\xbd\x4e\x7e\x4b\
+\x62\xb7\x0d\x81\x43\x05\x0e\xaa\x3c\xd7\xac\x24\xc0\x41\xb8\x5b\
+\xab\xb5\xfe\xd9\x2a\xd8\xcd\xfe\xd6\x3f\xf5\x77\x65\xcf\xf7\x92\
+\xdd\x26\x00\xf2\x47\x71\x7a\xee\xb8\xfa\x2f\x9b\x05\x2d\xbc\x99\
+\x08\xf3\xe8\xd3\x82\x3d\x6c\xd2\x81\x40\xfa\xfa\x8f\x7f\xfe\xfd\
+\x3f\xf2\x89\xbf\x1b\xff\xba\x3b\xd4\x18\x5a\x77\xff\x68\x5d\xdb\
+\x02\x47\xb6\xde\x3f\x0f\x78\xa4\xee\x0e\x75\x5b\xff\xec\x80\xd8\
+\x5e\x15\xd6\x3f\x0d\xf5\xd9\x73\xdf\xff\xe2\x51\xb7\x09\x80\x9c\
+\x62\x49\x02\xf8\xa3\x38\x91\xa8\xbc\x4c\x13\x61\x1e\xfd\x2e\x37\
+\x85\x7f\xf9\xc3\x4f\x95\xb7\x56\xf3\x56\x08\x64\xd2\x4b\x49\x1f\
+\xa7\xaf\x5f\x9e\x9e\xfe\xf7\xc9\xff\xaa\x16\xc8\xcd\x7f\x19\x43\
+\xab\x6e\xa5\xc6\x11\x68\x56\xe0\xd0\x86\xe7\xda\xcd\x35\x7c\xe8\
+\x41\x54\xbe\x5d\xc0\xfa\x67\xbb\x61\xe5\x35\x64\xed\x93\x62\xfd\
+\x53\x79\x47\xdd\x36\x6f\xba\xf9\xef\xf1\xf7\xfe\x6f\x43\xec\x3a\
+\x01\x90\x40\x4b\x07\x4e\x1d\x99\xef\x95\xba\x05\xca\x4d\xe1\x34\
+\x19\xe6\x93\xe1\xf2\x68\x94\x64\x40\xdd\x1d\xb6\xa0\x75\xb7\x93\
+\x9e\x1b\xff\x05\x60\xb5\x6c\x32\x8d\x99\xb9\x81\xa8\xa5\x39\xda\
+\x41\xa0\x3f\x81\xe3\x23\xca\x35\x2c\x09\x70\xbc\xf3\x1e\x47\xb0\
+\xfe\xd9\x43\xb1\xae\x3a\xac\x7f\xea\xea\x8f\xc5\xad\x99\xd6\x3f\
+\xe5\xde\x71\xf1\x0e\x6d\x6e\xd8\x7d\x02\x20\xdd\x52\x3a\x72\xea\
+\xd0\x7c\xaf\x34\x22\x30\x25\x02\xf2\x78\xb8\x64\x40\x23\xfd\x75\
+\xd3\xcc\x79\xd2\x4b\xdf\xb9\xe9\xbf\x81\x69\xe5\xdb\x69\xac\x2c\
+\x63\x66\x2b\xed\xd5\x4e\x02\x2d\x0a\x9c\xd4\xe6\x24\x01\x3c\x09\
+\x79\x12\xf6\x5e\x87\xb1\xfe\xd9\x4b\xf2\xf4\x7a\xac\x7f\x4e\x27\
+\xdf\xf7\x80\x03\xad\x7f\x86\x48\x00\xe4\xec\x28\x0b\xda\xa9\x63\
+\xf3\xbd\xd2\x98\xc0\x9b\xc9\x30\x03\x6c\x63\x11\x74\xdf\xdc\xf4\
+\x49\x1e\x6f\x4b\x71\xd3\xdf\x70\x77\x4f\x63\x64\x19\x2b\x1b\x0e\
+\x41\xd3\x09\xb4\x20\x70\x66\x1b\xcb\x35\x3d\x5d\xdb\x67\x1e\xd3\
+\xb1\x76\x12\xb0\xfe\xd9\x09\xf2\xb8\x6a\xac\x7f\x8e\xb3\x3d\xb5\
+\xe6\x69\x8c\x2c\x63\xe5\xa9\x07\xbd\xee\x60\xc3\x24\x00\x42\x9c\
+\x8e\xf5\x97\x71\x23\xd1\x70\x99\x26\xc3\xdc\x60\xe6\x46\x33\xbf\
+\x26\xd0\x70\x24\xcd\x37\x3d\x93\x5e\x4a\xfa\x22\x7d\x92\x47\x18\
+\x53\x9a\x0f\x6c\xd4\x00\x06\x9b\xfc\x46\xed\x66\x71\x57\x21\x70\
+\x7a\x23\xb2\xfe\xf1\x24\xc0\xe9\xec\xfb\x1e\xd0\xfa\x67\x5f\xcf\
+\x0d\xb5\x65\xed\x93\x62\xfd\xb3\x01\xb1\xa6\x5d\x07\x5c\xff\x0c\
+\x95\x00\xc8\xb9\xe6\x9f\xc7\x89\x42\xfb\xa5\xdc\x68\x4e\x93\x61\
+\x1e\x33\x2f\xe5\x2f\x7f\xf8\x49\x42\xe0\xf8\x7e\x9d\x27\xbc\x79\
+\xd2\x9b\x6f\xfc\x8f\x3f\xb2\x23\x1c\x2a\x30\xe0\xe4\x77\xa8\xa7\
+\xca\x09\x7c\x2a\x70\xcd\x9b\x92\x00\xd7\xb8\xef\x7d\x54\xeb\x9f\
+\xbd\x45\x97\xd5\x67\xfd\xb3\xcc\xa9\xb5\xad\xf2\xc1\x70\x19\x1b\
+\x5b\x6b\xf8\xc6\xf6\x0e\x97\x00\x88\x97\x24\x40\x14\x3a\x2b\x53\
+\x32\x60\xfe\x9b\x01\xb9\x39\x4d\x32\x20\xa5\xb3\x28\x4f\x0f\xe7\
+\x76\xc2\x4b\xa2\x65\xbe\xe1\x2f\x0b\x90\xd3\x5b\xe3\x80\x47\x08\
+\x8c\x3a\xf9\x1d\x61\xa9\x4e\x02\x8b\x04\x2e\xdc\x28\x0b\xdd\x5c\
+\xf3\x17\x36\xc1\xa1\xf7\x16\xb0\xfe\xd9\x5b\xb4\xd4\x67\xfd\x53\
+\x18\xba\xfe\x4f\xc6\xc2\xdc\x13\x76\x1d\xe4\x07\xc1\x0d\x99\x00\
+\x88\x45\x3a\x3c\x1d\x9f\xef\x95\xbe\x04\xca\xcd\xa9\x09\x71\x55\
+\xa7\x9a\xf0\x56\xb1\x35\xbb\x53\xc6\xc0\x8c\x85\xcd\x06\xa0\xe1\
+\x04\x1a\x14\xb8\xba\xc9\xb9\xe6\x73\xed\x5f\xdd\x0e\xc7\xdf\x5f\
+\xc0\xfa\x67\xbd\xa9\xf5\xcf\x7a\xbb\x16\xf7\xcc\x18\x98\xb1\xb0\
+\xc5\xb6\xef\xd1\xe6\x61\x13\x00\xc1\x4b\xc7\xe7\x04\xc8\xf7\x4a\
+\xbf\x02\x1f\x4d\x88\x19\xec\xfb\x8d\x7a\x59\x64\x31\xc8\x93\x12\
+\xe5\xa9\x89\x3f\xff\xfe\xc5\x27\xfc\xcb\xdc\x7a\xd8\x2a\x63\x5f\
+\xc6\xc0\x1e\x62\x11\x03\x81\x86\x04\xaa\x68\x6a\xae\xfd\x8c\x01\
+\x55\x34\x46\x23\x0e\x13\xb0\xfe\xf9\x98\xd6\xfa\xe7\x63\x9b\xde\
+\xdf\xc9\xd8\x97\x31\xb0\xf7\x38\x3f\x8b\x6f\xe8\x04\x40\x60\x72\
+\x02\xe4\x44\xc8\xf7\xca\x18\x02\xf3\x84\x98\x9b\xdd\x3c\xd6\x9e\
+\x52\x6e\x80\xbf\xff\x1d\x81\xdc\x10\x67\x62\xe8\x45\x23\xb1\xa4\
+\x24\xae\xc4\x99\x92\x98\x53\x62\x90\x5f\x9d\x28\x26\xbd\x04\x2c\
+\x8e\x2f\x05\x32\xe6\x65\xec\xfb\x72\x43\x1b\x10\x20\xb0\xb3\x40\
+\x3d\xd5\x65\x0c\xc8\x58\x50\x4f\x8b\xb4\xe4\x68\x81\x32\xd7\xbf\
+\xbc\xfc\x35\x73\x7f\xd6\x00\x29\x65\x4d\x60\xfd\x73\x34\xbd\xfa\
+\x2b\x12\xc8\xd8\x57\x51\x73\x2e\x69\xca\xf0\x09\x80\xa8\x3f\xbf\
+\xbc\xfc\x9c\xaf\xca\xb8\x02\xf3\xa4\x98\x9b\xe1\x94\x8f\x26\xc7\
+\xdc\x48\xd7\xa8\x94\x76\xa5\xdc\xde\xe4\x97\x49\xfd\xfb\xa7\xfa\
+\x89\x27\x71\x25\xce\x94\x1a\x63\xd0\xa6\x73\x04\xb2\xe0\x37\xf9\
+\x9d\x63\xed\x28\x04\xde\x09\x54\xf6\x42\xc6\x82\x8c\x09\x95\x35\
+\x4b\x73\x4e\x14\x28\x6b\x82\x29\x29\x90\x35\x42\x4a\xd6\x0b\x49\
+\x0c\xa4\x94\x75\xc4\xf7\xe4\x40\xd6\x18\x27\x36\x6b\xf1\xa1\xd2\
+\xae\x14\xeb\x9f\xc5\x64\xc3\x6e\x98\xb1\xee\x77\x2f\x2f\x7f\x1a\
+\x16\xe0\x26\x70\x09\x80\x09\xe3\x5f\x7f\xff\xef\x3f\xff\xfd\xcb\
+\xaf\xcf\x39\x31\xa6\x1f\xfd\x9f\xc0\x2b\x81\xdb\xc9\xf1\xed\xc4\
+\x98\xc9\x71\x2e\x99\x7c\xee\x95\x4c\x4c\xb7\xe5\x55\xe5\xdf\x7f\
+\xb8\x7d\xff\xf6\xfb\xb7\xf5\xcd\xc7\xba\xfd\x9a\x49\x3a\xed\x4a\
+\xc9\xe4\x9d\xf6\xce\xe5\x7b\xf5\xbe\x10\x28\x02\x19\xe3\xb2\xe0\
+\x70\xe5\x18\x58\x00\x00\x10\x00\x49\x44\x41\x54\x2f\x3f\xf8\x0f\
+\x01\x02\xa7\x0b\xd4\x78\xc0\x8c\x09\x19\x1b\x6a\x6c\x9b\x36\x5d\
+\x2b\x90\xb5\x44\xd6\x15\x29\x59\x63\x64\xbd\x91\x72\xbb\x06\xc9\
+\xf7\x6f\xd7\x2a\xf3\xcf\xb7\xeb\x99\x7c\x7f\x2f\x9a\xbc\x7e\xaf\
+\xcc\x75\xcc\x5f\x73\x9c\xb7\x25\x6d\x49\xbb\x52\xd2\xc6\xb4\x77\
+\x2e\xf7\x8e\xe5\xb5\x71\x05\x32\xc6\x65\xac\xcb\x3d\xdf\xb8\x0a\
+\x3f\x22\x97\x00\xf8\x61\xf1\x94\x13\x23\x27\xc8\xcd\x4b\xbe\x25\
+\xf0\xa1\xc0\x3c\xc9\xcc\x5f\x33\xf9\xdc\x2b\x99\x98\x6e\x4b\x26\
+\xac\xb7\xe5\xf6\xfd\xdb\xef\xdf\xd6\x37\x1f\xeb\xf6\xeb\x87\x0d\
+\xf4\x06\x81\x5b\x81\xe7\xe7\x9f\x33\xc6\xdd\xbe\xe4\x7b\x02\x04\
+\x4e\x15\xa8\xf6\x60\x65\x6c\x98\xc6\x88\x6a\x1b\xa8\x61\x55\x09\
+\xdc\xae\x41\xf2\xfd\xdb\xb5\xca\xfc\xf3\xed\x7a\x26\xdf\xbf\x5d\
+\xfb\xe4\xe7\xbc\x7e\xaf\xcc\x75\xcc\x5f\x73\x9c\xb7\xa5\x2a\x14\
+\x8d\xa9\x56\x20\xf7\x76\x65\x8c\xab\xb6\x85\xe7\x37\x4c\x02\xe0\
+\x8d\x79\x4e\x90\x9c\x28\x6f\x5e\xf6\x23\x01\x02\x04\xda\x15\x98\
+\x16\xf6\xf9\xe7\xbf\xda\x0d\x40\xcb\x09\xf4\x20\x50\x77\x0c\x65\
+\x8c\x98\xc6\x8a\xba\x5b\xa9\x75\x04\x08\x10\x58\x2e\x90\x7b\xba\
+\xdc\xdb\x2d\xdf\x63\x8c\x2d\x25\x00\xee\xf4\x73\x4e\x94\x9c\x30\
+\x77\xde\xf2\x12\x01\x02\x04\xda\x12\x98\x16\xf4\x65\x61\xdf\x56\
+\xab\xb5\x96\x40\x7f\x02\x0d\x44\x54\xc6\x8a\x69\xcc\x68\xa0\xa9\
+\x9a\x48\x80\x00\x81\x4f\x05\x72\x2f\x97\x7b\xba\x4f\x37\x1a\xf4\
+\x4d\x09\x80\x0f\x3a\xbe\x9c\x30\x26\xc1\x0f\x74\xbc\x4c\x80\x40\
+\x13\x02\xd3\x18\x56\x16\xf4\x4d\x34\x56\x23\x09\xf4\x2d\xd0\x4a\
+\x74\x65\xcc\x98\xc6\x8e\x56\xda\xab\x9d\x04\x08\x10\x78\x2b\xe0\
+\xe6\xff\xad\xc8\xeb\x9f\x25\x00\x5e\x7b\xbc\xfa\xc9\x24\xf8\x8a\
+\xc3\x0f\x04\x08\xb4\x24\x30\x2d\xe0\xcb\x18\xd6\x52\x9b\xb5\x95\
+\x40\xbf\x02\x4d\x45\x56\xc6\x8e\x69\x0c\x69\xaa\xd1\x1a\x4b\x80\
+\x00\x81\x08\x4c\x63\x57\xf9\x20\x37\xdf\x2b\x77\x05\x24\x00\xee\
+\xb2\xfc\x78\xd1\x24\xf8\xc3\xc2\x77\x04\x08\x34\x22\x30\x4d\x7e\
+\x65\xec\x6a\xa4\xb9\x9a\x49\xa0\x7f\x81\xf6\x22\x2c\x63\xc8\x34\
+\x96\xb4\xd7\x72\x2d\x26\x40\x60\x58\x81\x69\xcc\x2a\x63\xd7\xb0\
+\x00\xcb\x02\x97\x00\x58\xe0\x54\x4e\xa4\xe9\x84\x5a\xb0\xa9\x4d\
+\x08\x10\x20\x70\xad\xc0\x34\x56\x95\x31\xeb\xda\x56\x38\x3a\x01\
+\x02\xb7\x02\x8d\x7e\x5f\xc6\x92\x69\x4c\x69\xb4\xf9\x9a\x4d\x80\
+\xc0\x48\x02\xd3\x58\x55\xc6\xac\x91\x62\x5e\x19\xab\x04\xc0\x42\
+\xb8\x72\x42\x4d\x27\xd6\xc2\xcd\x6d\x46\x80\x00\x81\xf3\x05\xa6\
+\x31\xaa\x8c\x55\xe7\x1f\xd9\x11\x09\x10\xf8\x44\xa0\xe5\xb7\xca\
+\x98\x32\x8d\x2d\x2d\xc7\xa0\xed\x04\x08\x74\x2e\x30\x8d\x51\x65\
+\xac\xea\x3c\xcc\xbd\xc2\x93\x00\x78\x40\xb2\x9c\x58\xd3\x09\xf6\
+\xc0\x2e\x36\x25\x40\x80\xc0\x29\x02\xbf\x7b\x79\xf9\x53\x19\xa3\
+\x4e\x39\x9a\x83\x10\x20\xf0\x80\x40\xf3\x9b\x66\x6c\xc9\x18\xd3\
+\x7c\x20\x02\x20\x40\xa0\x3b\x81\x8c\x4d\x19\xa3\xba\x0b\xec\xc0\
+\x80\x24\x00\x1e\xc4\xcd\x09\x96\x13\xed\xc1\xdd\x6c\x4e\x80\x00\
+\x81\xc3\x04\x32\x26\xfd\xeb\xef\xff\xfd\xe7\x61\x07\x50\x31\x01\
+\x02\x1b\x04\xfa\xd8\x35\x63\x4c\xc6\x9a\x3e\xa2\x11\x05\x01\x02\
+\x3d\x08\x64\x4c\xca\xd8\xd4\x43\x2c\x67\xc6\x20\x01\xb0\x42\x3b\
+\x27\xda\xbf\x7f\xf9\xf5\x39\xff\xc4\xc4\x8a\xdd\xed\x42\x80\x00\
+\x81\x5d\x04\x32\x06\x99\xfc\x76\xa1\x54\x09\x81\xe3\x04\x3a\xaa\
+\xd9\xfa\xa7\xa3\xce\x14\x0a\x81\x86\x05\xb2\xfe\xc9\xbd\x58\xc6\
+\xa4\x86\xc3\xb8\xac\xe9\x12\x00\x1b\xe8\xcb\x3f\x31\xe1\x57\x02\
+\x36\x08\xda\x95\x00\x81\xd5\x02\xd3\xd8\x93\x31\xc8\xe4\xb7\x5a\
+\xd0\x8e\x04\x4e\x11\xe8\xf1\x20\x19\x7b\x9e\xa6\x31\xa8\xc7\xd8\
+\xc4\x44\x80\x40\xdd\x02\xb9\xf9\x2f\x63\x50\xdd\xcd\xac\xba\x75\
+\x12\x00\x1b\xbb\x27\xbf\x12\x60\x12\xdc\x88\x68\x77\x02\x04\x1e\
+\x13\x98\x16\xde\x65\xec\x79\x6c\x2f\x5b\x13\x20\x70\xbe\x40\xb7\
+\x47\x2c\x63\xd0\x34\x16\x75\x1b\xa0\xc0\x08\x10\xa8\x4f\x60\x1a\
+\x73\xdc\xfc\x6f\xef\x16\x09\x80\xed\x86\x4f\x26\xc1\x1d\x10\x55\
+\x41\x80\xc0\x22\x81\x3c\xf2\x5f\xc6\x9c\x45\x5b\xdb\x88\x00\x81\
+\x6b\x05\xfa\x3e\x7a\xc6\xa2\x8c\x49\x7d\x47\x29\x3a\x02\x04\xaa\
+\x10\x98\x6e\xfe\x33\xe6\x54\xd1\x96\xc6\x1b\x21\x01\xb0\x53\x07\
+\xe6\x84\x34\x09\xee\x84\xa9\x1a\x02\x04\xde\x09\xe4\x91\x37\xbf\
+\xef\xf6\x8e\xc5\x0b\x04\xea\x16\x18\xa0\x75\xf9\x35\xa4\x8c\x4d\
+\x9e\x86\x1c\xa0\xb3\x85\x48\xe0\x02\x81\xac\x7f\x72\x8f\x95\x7b\
+\xad\x0b\x0e\xdf\xe5\x21\x25\x00\x76\xec\x56\x93\xe0\x8e\x98\xaa\
+\x22\x40\xe0\x87\xc0\x94\xf5\xf6\xc8\xdb\x0f\x0e\xdf\x11\x68\x45\
+\x60\xa4\x76\x96\xc5\xf9\x34\x56\x8d\x14\xb3\x58\x09\x10\x38\x56\
+\x20\x37\xff\x59\xff\xe4\x1e\xeb\xd8\x23\x8d\x55\xbb\x04\xc0\x01\
+\xfd\x6d\x12\x3c\x00\x55\x95\x04\x46\x15\x98\x16\xd4\x65\x4c\x19\
+\x35\x7e\x71\x13\x68\x57\x60\xb8\x96\x97\xb1\x6a\x1a\xb3\x86\x0b\
+\x5c\xc0\x04\x08\xec\x2f\x30\x8d\x25\xb9\xf9\xdf\xbf\x62\x35\x4a\
+\x00\x1c\x74\x0e\x98\x04\x0f\x82\x55\x2d\x81\x41\x04\x92\xf5\xf6\
+\xc8\xdb\x20\x9d\x2d\xcc\x4e\x05\xc6\x0c\x2b\xeb\x9f\x8c\x5d\x63\
+\x46\x2f\x6a\x02\x04\xf6\x10\xc8\x18\x92\xb1\x64\x8f\xba\xd4\xf1\
+\x5e\x40\x02\xe0\xbd\xc9\x6e\xaf\xe4\xc4\xcd\x09\x9c\x85\xfc\x6e\
+\x95\xaa\x88\x00\x81\xee\x05\x32\x66\x24\xeb\xed\x91\xb7\xee\xbb\
+\x5a\x80\x3d\x0b\x0c\x1c\x5b\xc6\x2e\x7f\x17\x60\xe0\x13\x40\xe8\
+\x04\x56\x0a\x64\xfd\x93\x7b\xa7\x8c\x21\x2b\xab\xb0\xdb\x02\x01\
+\x09\x80\x05\x48\x5b\x36\xc9\x09\x9c\x85\xbc\x3f\x8e\xb3\x45\xd1\
+\xbe\x04\x06\x12\xf0\xc8\xdb\x40\x9d\x2d\xd4\x9e\x05\xc4\xf6\xe4\
+\x5f\x49\x72\x12\x10\x20\xb0\x58\x20\x37\xff\xb9\x67\xca\xbd\xd3\
+\xe2\x9d\x6c\xb8\x4a\x40\x02\x60\x15\xdb\xe3\x3b\xe5\x69\x00\x49\
+\x80\xc7\xdd\xec\x41\x60\x24\x81\x64\xbd\xcb\x58\x31\x52\xd0\x62\
+\x25\xd0\xa7\x80\xa8\xbe\x0b\x94\x31\x6d\x4a\x6c\x7e\xff\xd1\x17\
+\x02\x04\x08\xbc\x17\x98\xc6\x88\xdc\xfc\xbf\x7f\xc3\x2b\x47\x08\
+\x48\x00\x1c\xa1\xfa\x41\x9d\x99\x04\xf3\x48\x5c\x32\x5c\x1f\x6c\
+\xe2\x65\x02\x04\x06\x14\xc8\x98\x90\x9b\x7f\x59\xef\x01\x3b\x5f\
+\xc8\x9d\x0a\x08\xeb\x56\xc0\xfa\xe7\x56\xc3\xf7\x04\x08\xcc\x02\
+\xf3\xfa\x27\x63\xc4\xfc\x9a\xaf\xc7\x0b\x48\x00\x1c\x6f\xfc\xee\
+\x08\x25\xc3\x35\x65\xba\xde\xbd\xe1\x05\x02\x04\xc6\x13\x98\xc6\
+\x82\x8c\x09\x6e\xfe\xc7\xeb\x7a\x11\x77\x2c\x20\xb4\xbb\x02\x19\
+\xeb\x3c\x0d\x79\x97\xc6\x8b\x04\xc6\x13\xb0\xfe\xb9\xac\xcf\x25\
+\x00\x2e\xa2\x2f\x99\xae\xe9\xc4\xbf\xe8\xf0\x0e\x4b\x80\xc0\xc5\
+\x02\xb2\xde\x17\x77\x80\xc3\x13\x38\x50\x40\xd5\x1f\x0b\x64\xfd\
+\x93\x27\x9e\x32\x06\x7e\xbc\x95\x77\x08\x10\xe8\x55\x20\xd7\x7e\
+\xc6\x80\x8c\x05\xbd\xc6\x58\x7b\x5c\x12\x00\x17\xf6\x50\x4e\xfc\
+\xfc\x4a\x80\x6c\xf8\x85\x9d\xe0\xd0\x04\xae\x10\x98\x92\x7f\xf9\
+\x24\xcc\xa7\xfe\x57\xe0\x3b\x26\x81\xc3\x05\x1c\xe0\x0b\x81\x8c\
+\x7d\x19\x03\xad\x7f\xbe\x80\xf2\x36\x81\xce\x04\x72\xf3\x9f\x6b\
+\x3f\x63\x40\x67\xa1\x35\x15\x8e\x04\x40\x05\xdd\x95\x44\x80\x49\
+\xb0\x82\x8e\xd0\x04\x02\x07\x0b\x64\xe2\x93\xf5\x3e\x18\x59\xf5\
+\x04\x2e\x17\xd0\x80\xa5\x02\x59\xff\x64\x4c\xcc\xd8\xb8\x74\x1f\
+\xdb\x11\x20\xd0\xa6\x40\xae\xf5\xdc\xfc\xb7\xd9\xfa\xbe\x5a\x2d\
+\x01\x50\x49\x7f\x66\x12\xf4\x34\x40\x25\x9d\xa1\x19\x04\x8e\x10\
+\xf0\xa9\xff\x11\xaa\xea\x24\x50\x9f\x80\x16\x3d\x24\x90\x4f\x02\
+\xcb\x4d\xc1\x34\x46\x3e\xb4\xa3\x8d\x09\x10\x68\x42\x20\x09\xbe\
+\xdc\xe3\xe4\x5a\x6f\xa2\xc1\x03\x34\x52\x02\xa0\xb2\x4e\x4e\x22\
+\xc0\xd3\x00\x95\x75\x8a\xe6\x10\xd8\x20\x90\x89\x2f\x59\xef\x72\
+\x6d\x6f\xa8\xc7\xae\x04\x08\xb4\x21\xa0\x95\xeb\x04\x32\x46\xe6\
+\x26\xc1\x1a\x68\x9d\x9f\xbd\x08\xd4\x26\x30\xaf\x7f\x4a\x82\xaf\
+\xb6\xc6\x0d\xde\x1e\x09\x80\x0a\x4f\x00\x93\x60\x85\x9d\xa2\x49\
+\x04\xd6\x08\x4c\x9f\x68\x65\xe2\x93\xf5\x5e\x83\x67\x1f\x02\x4d\
+\x0a\x68\xf4\x46\x81\xac\x81\x24\x01\x36\x22\xda\x9d\xc0\xd5\x02\
+\xd6\x3f\x57\xf7\xc0\xa7\xc7\x97\x00\xf8\x94\xe7\xda\x37\x4d\x82\
+\xd7\xfa\x3b\x3a\x81\xb5\x02\x73\xd6\xbb\x5c\xc3\x6b\x2b\xb1\x1f\
+\x01\x02\x0d\x0a\x68\xf2\x1e\x02\x19\x3b\x3d\x0d\xb0\x87\xa4\x3a\
+\x08\x9c\x2b\x60\xfd\x73\xae\xf7\xda\xa3\x49\x00\xac\x95\x3b\x69\
+\x3f\x93\xe0\x49\xd0\x0e\x43\x60\x2f\x01\x59\xef\xbd\x24\xd5\x43\
+\xa0\x3d\x01\x2d\xde\x55\x20\x6b\x20\x4f\x03\xec\x4a\xaa\x32\x02\
+\xc7\x09\x58\xff\x1c\x67\xbb\x73\xcd\x12\x00\x3b\x83\x1e\x55\x5d\
+\x26\xc1\xfc\x1e\xb1\x89\xf0\x28\x61\xf5\x12\xd8\x26\x20\xeb\xbd\
+\xcd\xcf\xde\x04\x7a\x10\x10\xc3\xfe\x02\x59\xff\x78\x1a\x60\x7f\
+\x57\x35\x12\xd8\x4b\xc0\xfa\x67\x2f\xc9\xf3\xea\x91\x00\x38\xcf\
+\x7a\xf3\x91\xf2\x7b\xc4\x99\x08\x25\x01\x36\x53\xaa\x80\xc0\xae\
+\x02\x49\xce\xf9\x5d\xff\x5d\x49\x55\x46\xa0\x45\x01\x6d\x3e\x50\
+\xc0\xfa\xe7\x40\x5c\x55\x13\x58\x21\x30\xdf\xf8\x5b\xff\xac\xc0\
+\xbb\x78\x17\x09\x80\x8b\x3b\x60\xcd\xe1\x33\x09\xca\x86\xaf\x91\
+\xb3\x0f\x81\x9d\x05\x9e\x9f\x7f\xce\xb5\x98\xe4\xdc\xce\x35\xab\
+\x8e\x00\x81\xe6\x04\x34\xf8\x68\x01\xeb\x9f\xa3\x85\xd5\x4f\x60\
+\xa1\xc0\xb4\xfe\x71\xe3\xbf\xd0\xaa\xc2\xcd\x24\x00\x2a\xec\x94\
+\xa5\x4d\x32\x11\x2e\x95\xb2\x1d\x81\x9d\x05\xa6\x89\x2f\x37\xfe\
+\xb9\x06\x77\xae\x59\x75\x04\x08\xb4\x2a\xa0\xdd\xa7\x09\x64\xec\
+\xcd\x18\xec\x89\xc8\xd3\xc8\x1d\x88\x40\x11\x98\x3f\xf5\xcf\x35\
+\x58\x5e\xf0\x9f\x26\x05\x24\x00\x9a\xec\xb6\xd7\x8d\x2e\x17\xe1\
+\x74\x43\x92\x8b\xf2\xf5\x3b\x7e\x22\x40\x60\x4f\x81\x5c\x63\x79\
+\xdc\xbf\x5c\x73\x7b\x56\xac\x2e\x02\x04\x9a\x17\x10\xc0\xf9\x02\
+\x19\x8b\x25\x02\xce\x77\x77\xc4\xf1\x04\xe6\xf5\x8f\x4f\xfd\xfb\
+\xe8\x7b\x09\x80\x3e\xfa\xf1\x29\x93\x60\x2e\x4a\xd9\xf0\x4e\x3a\
+\x54\x18\x55\x09\x98\xf8\xaa\xea\x0e\x8d\x21\x50\xa3\x80\x36\x5d\
+\x28\x90\x35\x50\x92\xb3\xd6\x40\x17\x76\x82\x43\x77\x2b\x90\x6b\
+\x2b\xf7\x18\x7e\xdd\xb1\x9f\x2e\x96\x00\xe8\xa7\x2f\x4b\x24\x99\
+\x04\x65\xc3\x0b\x85\xff\x10\xd8\x2c\xe0\xc6\x7f\x33\xa1\x0a\x08\
+\x0c\x22\x20\xcc\xab\x05\x72\x73\x92\x35\x50\x49\x02\x3c\x3f\xff\
+\x7c\x75\x7b\x1c\x9f\x40\xf3\x02\xd3\x75\x94\x7b\x8a\x5c\x5b\xcd\
+\xc7\x22\x80\x57\x02\x12\x00\xaf\x38\xfa\xf9\x21\x93\x60\x2e\xda\
+\x32\x11\xf6\x13\x96\x48\x08\x9c\x22\xe0\xc6\xff\x14\x66\x07\x21\
+\xd0\x8f\x80\x48\xaa\x11\x28\xeb\x9f\xbf\xfd\xe7\x27\xeb\x9f\x6a\
+\xba\x44\x43\x5a\x13\xf8\x7e\xe3\x9f\x6b\xa9\xb5\xa6\x6b\xef\x32\
+\x01\x09\x80\x65\x4e\xcd\x6e\x95\x8b\x57\x22\xa0\xd9\xee\xd3\xf0\
+\x0b\x04\x3c\xea\x76\x01\xba\x43\x12\x68\x5c\x40\xf3\xeb\x13\xb0\
+\xfe\xa9\xaf\x4f\xb4\xa8\x72\x01\x37\xfe\x95\x77\xd0\x7e\xcd\x93\
+\x00\xd8\xcf\xb2\xea\x9a\x4c\x84\x55\x77\x8f\xc6\xd5\x20\xf0\x7d\
+\xe2\xf3\xa8\x5b\x0d\x9d\xa1\x0d\x04\x9a\x12\xd0\xd8\x8a\x05\xac\
+\x7f\x2a\xee\x1c\x4d\xab\x43\xe0\xfb\xfa\x27\xd7\x4a\x1d\x0d\xd2\
+\x8a\xa3\x05\x24\x00\x8e\x16\xae\xac\xfe\x5c\xdc\x9e\x08\xa8\xac\
+\x53\x34\xe7\x5a\x01\x13\xdf\xb5\xfe\x8e\x4e\xa0\x79\x01\x01\xb4\
+\x20\x60\xfd\xd3\x42\x2f\x69\xe3\x99\x02\xf3\xaf\x3b\xe6\xda\x38\
+\xf3\xb8\x8e\x75\xbd\x80\x04\xc0\xf5\x7d\x70\x49\x0b\x72\xb1\x4b\
+\x04\x5c\x42\xef\xa0\x15\x08\x64\xd2\xcb\xef\x87\xe6\x1a\xc8\xb5\
+\x50\x41\x93\x34\x81\x00\x81\x56\x05\xb4\xbb\x29\x81\x8c\xf9\x19\
+\xfb\x33\x07\x34\xd5\x70\x8d\x25\xb0\x97\xc0\xf7\x0f\x3e\xfc\x65\
+\xff\xbd\x40\xdb\xab\x47\x02\xa0\xbd\x3e\xdb\xb5\xc5\x26\xc2\x5d\
+\x39\x55\x56\xb9\x40\x6e\xfc\xe7\xdf\xf1\xcf\xb9\x5f\x79\x73\x35\
+\x8f\x00\x81\x06\x04\x34\xb1\x4d\x81\xcc\x01\xbf\x25\x02\xa6\x1b\
+\xa2\x36\xa3\xd0\x6a\x02\xcb\x04\xe6\xf5\x4f\xce\xf9\x9c\xfb\xcb\
+\xf6\xb2\x55\xaf\x02\x12\x00\xbd\xf6\xec\x83\x71\x65\x30\xc8\xa0\
+\x50\x32\xe2\x26\xc2\x07\xf5\x6c\x5e\xbb\xc0\x3c\xf1\xc9\x76\xd7\
+\xde\x53\xda\x47\xa0\x39\x01\x0d\x6e\x5c\xa0\xac\x7f\xfe\xf6\x9f\
+\x9f\x92\x1c\x2e\x6b\xa0\xc6\xe3\xd1\x7c\x02\xb7\x02\xd6\x3f\xb7\
+\x1a\xbe\x9f\x05\x24\x00\x66\x09\x5f\x8b\xc0\x3c\x11\x96\x49\x50\
+\x22\xa0\x98\xf8\x4f\x9b\x02\x99\xf4\x72\x1e\x27\xb1\xe5\xc6\xbf\
+\xcd\x3e\xd4\x6a\x02\xf5\x0b\x68\x61\x2f\x02\xf9\x03\xb0\x65\x0d\
+\xf4\xcb\xaf\xcf\x99\x3b\x7a\x89\x4b\x1c\x63\x0a\x3c\x3f\x3d\xfd\
+\x33\x49\x2d\xeb\x9f\x31\xfb\xff\xab\xa8\x25\x00\xbe\x12\x1a\xf4\
+\xfd\x32\x09\x4e\x19\xf1\xdc\x3c\x99\x08\x07\x3d\x09\x1a\x0d\xfb\
+\xf9\x66\xd2\xcb\x79\xdc\x68\x18\x9a\x4d\x80\x40\x0b\x02\xda\xd8\
+\xa5\x40\xe6\x8e\xdf\xd6\x3f\x3e\x0c\xe9\xb2\x8f\x7b\x0d\xea\x76\
+\x0d\x94\xa4\x56\xaf\x71\x8a\x6b\x9b\x80\x04\xc0\x36\xbf\x21\xf6\
+\x36\x11\x0e\xd1\xcd\xcd\x07\x69\xd2\x6b\xbe\x0b\x05\x40\xa0\x39\
+\x01\x0d\xee\x5b\xa0\xac\x7f\xa6\x0f\x43\xf2\x49\xaa\x0f\x43\xfa\
+\xee\xeb\x96\xa3\x9b\xd7\x3f\x49\x5a\xf9\xc4\xbf\xe5\x9e\x3c\xaf\
+\xed\x12\x00\xe7\x59\x37\x7f\xa4\x79\x22\xcc\x00\x63\x22\x6c\xbe\
+\x3b\xfb\x09\x60\xfa\x74\x26\x8b\x33\x93\x5e\x3f\x5d\x2a\x12\x02\
+\x8d\x08\x68\xe6\x20\x02\xf9\x24\xb5\xac\x81\xfc\x7a\xc0\x20\x3d\
+\xde\x46\x98\xf3\x8d\xbf\xf5\x4f\x1b\xfd\x55\x53\x2b\x25\x00\x6a\
+\xea\x8d\x86\xda\xf2\x6a\x22\x9c\x6e\xc0\x1a\x6a\xba\xa6\x76\x20\
+\x30\x4f\x7a\x49\x46\xe5\x5c\xcc\xe2\xac\x83\xb0\x84\x40\x80\x40\
+\x53\x02\x1a\x3b\xa2\x40\xe6\x9c\xcc\x3d\xe5\x83\x10\xeb\x9f\x11\
+\x4f\x81\x4b\x63\xbe\x5d\xff\xb8\xf1\xbf\xb4\x2b\x9a\x3e\xb8\x04\
+\x40\xd3\xdd\x77\x7d\xe3\xcb\x44\xf8\xb7\xff\xfc\xf4\xdb\x64\x78\
+\x7d\x93\xb4\xa0\x53\x01\x93\x5e\xa7\x1d\x2b\x2c\x02\xad\x0a\x68\
+\xf7\xd0\x02\xef\xd6\x3f\x92\x01\x43\x9f\x0f\x47\x06\x3f\xaf\x7f\
+\x3c\xed\x78\xa4\xf2\x58\x75\x4b\x00\x8c\xd5\xdf\x87\x46\x5b\x26\
+\xc3\x5f\x7e\x7d\xce\x00\x55\x32\xe3\x87\x1e\x4d\xe5\x23\x08\xcc\
+\x93\x5e\x12\x4c\x32\xdd\x23\xf4\xb8\x18\x09\xb4\x23\xa0\xa5\x04\
+\x66\x81\xb2\xfe\xb9\xfd\x30\x44\x32\x60\xa6\xf1\x75\xa5\x40\xd6\
+\x3f\x29\x59\x53\xcf\xeb\x1f\x4f\x3b\xae\xc4\xb4\xdb\x3b\x01\x09\
+\x80\x77\x24\x5e\xd8\x2a\x90\x01\xaa\x4c\x86\x92\x01\x5b\x29\x87\
+\xdc\x7f\x9e\xf0\xdc\xf4\x0f\xd9\xfd\x82\x26\xd0\x8a\x80\x76\x12\
+\xb8\x2b\x50\xd6\x3f\x92\x01\x77\x6d\xbc\xf8\xb9\x40\xd6\x3f\x29\
+\xf3\x4d\xff\x7c\xe3\xff\xf9\x5e\xde\x25\xf0\xb8\x80\x04\xc0\xe3\
+\x66\xf6\x78\x40\x40\x32\xe0\x01\xac\x81\x37\x9d\x27\x3c\x37\xfd\
+\x03\x9f\x04\x42\x27\xd0\x94\x80\xc6\x12\xf8\x5a\x40\x32\xe0\x6b\
+\xa3\xd1\xb7\xc8\xfa\x27\xc5\x4d\xff\xe8\x67\xc2\xb9\xf1\x4b\x00\
+\x9c\xeb\x3d\xf4\xd1\xee\x25\x03\x32\xe8\x0d\x8d\x32\x70\xf0\xe9\
+\xfb\x4c\x78\x6e\xfa\x07\x3e\x09\x84\x4e\xa0\x55\x01\xed\x26\xf0\
+\xa0\x80\x64\xc0\x83\x60\x1d\x6f\x3e\xaf\x7f\xb2\x06\xca\xa7\xfc\
+\x29\x59\x23\x77\x1c\xb2\xd0\x2a\x13\x90\x00\xa8\xac\x43\x46\x69\
+\x4e\x06\xba\x4c\x86\x19\xf4\x72\x03\x58\xfe\x66\x80\xdf\x99\xeb\
+\xbe\xfb\xe7\x49\x2f\x7d\x9e\xbe\xcf\x79\xd0\x7d\xd0\x02\x24\x40\
+\xa0\x3b\x01\x01\x11\xd8\x22\x90\xf5\x4f\x29\xbf\xfc\xfa\x6c\xfd\
+\xb3\x45\xb2\x8d\x7d\x9f\x9f\x9e\xfe\x99\x92\x1b\xfe\xdb\xf5\x8f\
+\x35\xd0\x93\xff\x5d\x24\x20\x01\x70\x11\xbc\xc3\xbe\x16\x28\x13\
+\xe1\xf7\xdf\x99\xcb\x00\x99\x09\x31\x83\xe5\xeb\xad\xfc\xd4\x92\
+\x40\xfa\x2f\x25\xfd\x99\x72\x3b\xe9\xb5\x14\x87\xb6\x12\x20\x40\
+\xe0\x8d\x80\x1f\x09\xec\x26\x70\x6f\xfd\x93\x35\xd0\x6e\x07\x50\
+\xd1\x25\x02\xb7\xeb\x9f\x7c\xe0\x91\xe2\x86\xff\x92\xae\x70\xd0\
+\x3b\x02\x12\x00\x77\x50\xbc\x74\xad\x40\x06\xc8\x4c\x88\x19\x2c\
+\x73\xd3\x98\x9b\xc7\x32\x19\x7a\x42\xe0\xda\x8e\xf9\xe2\xe8\x99\
+\xec\x52\xd2\x5f\xe9\xb7\xf4\x5f\x4a\xfa\x33\xe5\x8b\xdd\xbd\x4d\
+\x80\x00\x81\x46\x04\x34\x93\xc0\x31\x02\x99\x2b\xb3\xfe\x29\xe5\
+\x97\x5f\x9f\x33\x97\xce\xeb\x9f\xcc\xaf\xc7\x1c\x55\xad\x7b\x08\
+\x94\xfe\x99\xd6\xa9\xb7\x6b\xa0\xf4\x67\xca\x1e\xf5\xab\x83\xc0\
+\x9e\x02\x12\x00\x7b\x6a\xaa\xeb\x10\x81\x0c\x9e\x65\x32\x7c\xf3\
+\x84\x40\x99\x14\x0f\x39\xa2\x4a\x97\x08\xdc\x9b\xec\xe6\x1b\xfe\
+\x25\xfb\xdb\x86\x00\x01\x02\x4d\x0a\x68\x34\x81\x13\x05\xe6\xf5\
+\x4f\xe6\xd7\x24\x04\x72\x83\x59\xd6\x3f\xd3\xcd\xe6\x89\xcd\x70\
+\xa8\x1b\x81\xac\x7f\x52\xd2\x17\x29\xe9\x97\xd2\x3f\xd3\x3a\x35\
+\x6b\xd6\x9b\x4d\x7d\x4b\xa0\x4a\x01\x09\x80\x2a\xbb\x45\xa3\x3e\
+\x13\xc8\xe0\x3a\x4f\x88\x19\x74\x53\xe6\xc9\x30\x03\xf2\x67\xfb\
+\x7a\x6f\x9d\x40\x5c\x53\x32\xd1\xa5\xc4\xdc\x64\xb7\xce\xd2\x5e\
+\x04\x08\xb4\x2d\xa0\xf5\x04\xae\x14\x78\xbb\x06\xca\x9c\x3c\xaf\
+\x81\xae\x6c\x57\xaf\xc7\xce\xda\x27\x25\xc6\xb1\x9e\xd7\x3f\x59\
+\x03\xa5\x2f\x52\x7a\x8d\x5d\x5c\xfd\x0a\x48\x00\xf4\xdb\xb7\x43\
+\x45\x36\x27\x04\x32\x20\x67\x70\x4e\xc9\x40\x9d\x01\x3b\xa5\x0c\
+\xde\x43\x89\xac\x0b\x36\x4e\x73\x89\x5b\x0c\x53\xe2\x9a\x92\x89\
+\x2e\x65\x5d\xed\xf6\x22\x40\x80\x40\xf3\x02\x02\x20\x50\x95\x40\
+\xe6\xe4\x79\x0d\x94\xb5\x4f\x4a\xe6\xed\xcc\xe1\x29\x99\xd3\xab\
+\x6a\x70\xc5\x8d\x89\x55\x4a\xfc\x52\x62\x99\xb5\x4f\x4a\x8c\x63\
+\x5d\x71\xf3\x35\x8d\xc0\x62\x01\x09\x80\xc5\x54\x36\x6c\x4d\x20\
+\x03\x75\x06\xec\x94\x32\x78\xbf\xf9\x7d\xba\x51\x27\xc6\x4c\x6e\
+\x29\x89\x3f\x13\xdc\x5c\x6e\x27\xba\xe2\xf5\xfd\x51\xb6\x38\xb6\
+\xd6\xf7\xda\x4b\x80\x00\x81\x63\x04\xd4\x4a\xa0\x7e\x81\xcc\xdb\
+\x59\xfb\xa4\x94\xf9\xfc\xfb\xfa\x27\xf3\x7c\xe6\xfc\xcc\xff\x29\
+\x59\x0b\xa4\xd4\x1f\xd1\x7e\x2d\x4c\xbc\x73\x89\x41\x3c\x52\x62\
+\x13\xab\x94\xf8\xa5\xec\x77\x54\x35\x11\xa8\x4b\x40\x02\xa0\xae\
+\xfe\xd0\x9a\x13\x04\x32\x21\xce\x25\x03\x7d\x06\xfd\xb9\x64\x12\
+\xc8\x84\x30\x97\x4c\x12\x27\x34\x69\xf7\x43\xa4\xdd\x29\x89\x23\
+\x31\xa5\xcc\x31\x26\xe6\x94\x18\x64\x82\x9b\xcb\xee\x8d\x50\x21\
+\x01\x02\x04\x7a\x13\x10\x0f\x81\xc6\x05\x32\xe7\x67\xfe\x4f\xc9\
+\x5a\x20\x65\x5e\x1f\x64\xad\x90\x75\xc3\x5c\xca\x3a\xa2\xb1\x78\
+\xd3\xe6\xb9\x24\x8e\xc4\x34\x97\xc4\x99\x78\xe7\x12\x83\x78\xa4\
+\x34\x16\xa6\xe6\x12\xd8\x24\x20\x01\xb0\x89\xcf\xce\xbd\x09\x64\
+\x12\xc8\x84\x30\x97\x4c\x12\x99\x30\x6e\xcb\x3c\x91\xe4\x6b\x26\
+\x97\xdb\x32\x4f\x3a\xf7\xbe\x7e\x65\x75\x6f\x9f\xbc\x76\x5b\x7f\
+\xbe\xcf\x71\xef\x95\xdb\x36\xa6\xdd\x29\x89\x23\x31\xa5\x7c\x75\
+\x7c\xef\x13\x20\x40\x80\xc0\xe7\x02\xde\x25\xd0\xb3\x40\xd6\x0a\
+\x59\x37\xcc\xa5\xac\x23\xde\x3c\x3d\xf0\x76\xfd\x59\xbb\x31\x8e\
+\x00\x00\x0c\x98\x49\x44\x41\x54\x91\x75\xc9\xbd\x92\xf5\xcb\xdb\
+\xf2\x95\xdd\xdb\xed\xdf\xfe\x3c\x1f\xe7\x6d\x1b\xee\xad\x7f\x4a\
+\xdb\x6f\x9e\x64\x4c\x6c\x5f\x1d\xdf\xfb\x04\x46\x11\x90\x00\x18\
+\xa5\xa7\xc5\xb9\x9b\x40\x26\x91\xb9\xcc\x93\xe4\xfc\x35\x13\xce\
+\x47\xe5\x76\x82\xba\xf7\xfd\x87\xfb\x4d\x13\xd8\x5c\x7f\xbe\xce\
+\xc7\x7e\xfb\x75\xb7\x00\x55\x44\x80\x00\x01\x02\xf7\x04\xbc\x46\
+\x60\x68\x81\xb7\xeb\x8e\xfc\x9c\x75\xc9\xbd\x72\x6f\x4d\x73\x6f\
+\xed\x73\xfb\xda\xbd\x7d\x6e\x5f\x9b\x8f\x93\xe3\xde\x96\xa1\x3b\
+\x45\xf0\x04\x56\x08\x48\x00\xac\x40\xb3\x0b\x01\x02\x04\x08\x10\
+\x20\x30\x9a\x80\x78\x09\x10\x20\x40\x80\x40\xfb\x02\x12\x00\xed\
+\xf7\xa1\x08\x08\x10\x20\x40\x80\x00\x81\xa3\x05\xd4\x4f\x80\x00\
+\x01\x02\x04\x3a\x10\x90\x00\xe8\xa0\x13\x85\x40\x80\x00\x01\x02\
+\x04\x08\x1c\x2b\xa0\x76\x02\x04\x08\x10\x20\xd0\x83\x80\x04\x40\
+\x0f\xbd\x28\x06\x02\x04\x08\x10\x20\x40\xe0\x48\x01\x75\x13\x20\
+\x40\x80\x00\x81\x2e\x04\x24\x00\xba\xe8\x46\x41\x10\x20\x40\x80\
+\x00\x01\x02\xc7\x09\xa8\x99\x00\x01\x02\x04\x08\xf4\x21\x20\x01\
+\xd0\x47\x3f\x8a\x82\x00\x01\x02\x04\x08\x10\x38\x4a\x40\xbd\x04\
+\x08\x10\x20\x40\xa0\x13\x01\x09\x80\x4e\x3a\x52\x18\x04\x08\x10\
+\x20\x40\x80\xc0\x31\x02\x6a\x25\x40\x80\x00\x01\x02\xbd\x08\x48\
+\x00\xf4\xd2\x93\xe2\x20\x40\x80\x00\x01\x02\x04\x8e\x10\x50\x27\
+\x01\x02\x04\x08\x10\xe8\x46\x40\x02\xa0\x9b\xae\x14\x08\x01\x02\
+\x04\x08\x10\x20\xb0\xbf\x80\x1a\x09\x10\x20\x40\x80\x40\x3f\x02\
+\x12\x00\xfd\xf4\xa5\x48\x08\x10\x20\x40\x80\x00\x81\xbd\x05\xd4\
+\x47\x80\x00\x01\x02\x04\x3a\x12\x90\x00\xe8\xa8\x33\x85\x42\x80\
+\x00\x01\x02\x04\x08\xec\x2b\xa0\x36\x02\x04\x08\x10\x20\xd0\x93\
+\x80\x04\x40\x4f\xbd\x29\x16\x02\x04\x08\x10\x20\x40\x60\x4f\x01\
+\x75\x11\x20\x40\x80\x00\x81\xae\x04\x24\x00\xba\xea\x4e\xc1\x10\
+\x20\x40\x80\x00\x01\x02\xfb\x09\xa8\x89\x00\x01\x02\x04\x08\xf4\
+\x25\x20\x01\xd0\x57\x7f\x8a\x86\x00\x01\x02\x04\x08\x10\xd8\x4b\
+\x40\x3d\x04\x08\x10\x20\x40\xa0\x33\x01\x09\x80\xce\x3a\x54\x38\
+\x04\x08\x10\x20\x40\x80\xc0\x3e\x02\x6a\x21\x40\x80\x00\x01\x02\
+\xbd\x09\x48\x00\xf4\xd6\xa3\xe2\x21\x40\x80\x00\x01\x02\x04\xf6\
+\x10\x50\x07\x01\x02\x04\x08\x10\xe8\x4e\x40\x02\xa0\xbb\x2e\x15\
+\x10\x01\x02\x04\x08\x10\x20\xb0\x5d\x40\x0d\x04\x08\x10\x20\x40\
+\xa0\x3f\x01\x09\x80\xfe\xfa\x54\x44\x04\x08\x10\x20\x40\x80\xc0\
+\x56\x01\xfb\x13\x20\x40\x80\x00\x81\x0e\x05\x24\x00\x3a\xec\x54\
+\x21\x11\x20\x40\x80\x00\x01\x02\xdb\x04\xec\x4d\x80\x00\x01\x02\
+\x04\x7a\x14\x90\x00\xe8\xb1\x57\xc5\x44\x80\x00\x01\x02\x04\x08\
+\x6c\x11\xb0\x2f\x01\x02\x04\x08\x10\xe8\x52\x40\x02\xa0\xcb\x6e\
+\x15\x14\x01\x02\x04\x08\x10\x20\xb0\x5e\xc0\x9e\x04\x08\x10\x20\
+\x40\xa0\x4f\x01\x09\x80\x3e\xfb\x55\x54\x04\x08\x10\x20\x40\x80\
+\xc0\x5a\x01\xfb\x11\x20\x40\x80\x00\x81\x4e\x05\x24\x00\x3a\xed\
+\x58\x61\x11\x20\x40\x80\x00\x01\x02\xeb\x04\xec\x45\x80\x00\x01\
+\x02\x04\x7a\x15\x90\x00\xe8\xb5\x67\xc5\x45\x80\x00\x01\x02\x04\
+\x08\xac\x11\xb0\x0f\x01\x02\x04\x08\x10\xe8\x56\x40\x02\xa0\xdb\
+\xae\x15\x18\x01\x02\x04\x08\x10\x20\xf0\xb8\x80\x3d\x08\x10\x20\
+\x40\x80\x40\xbf\x02\x12\x00\xfd\xf6\xad\xc8\x08\x10\x20\x40\x80\
+\x00\x81\x47\x05\x6c\x4f\x80\x00\x01\x02\x04\x3a\x16\x90\x00\xe8\
+\xb8\x73\x85\x46\x80\x00\x01\x02\x04\x08\x3c\x26\x60\x6b\x02\x04\
+\x08\x10\x20\xd0\xb3\x80\x04\x40\xcf\xbd\x2b\x36\x02\x04\x08\x10\
+\x20\x40\xe0\x11\x01\xdb\x12\x20\x40\x80\x00\x81\xae\x05\x24\x00\
+\xba\xee\x5e\xc1\x11\x20\x40\x80\x00\x01\x02\xcb\x05\x6c\x49\x80\
+\x00\x01\x02\x04\xfa\x16\x90\x00\xe8\xbb\x7f\x45\x47\x80\x00\x01\
+\x02\x04\x08\x2c\x15\xb0\x1d\x01\x02\x04\x08\x10\xe8\x5c\x40\x02\
+\xa0\xf3\x0e\x16\x1e\x01\x02\x04\x08\x10\x20\xb0\x4c\xc0\x56\x04\
+\x08\x10\x20\x40\xa0\x77\x01\x09\x80\xde\x7b\x58\x7c\x04\x08\x10\
+\x20\x40\x80\xc0\x12\x01\xdb\x10\x20\x40\x80\x00\x81\xee\x05\x24\
+\x00\xba\xef\x62\x01\x12\x20\x40\x80\x00\x01\x02\x5f\x0b\xd8\x82\
+\x00\x01\x02\x04\x08\xf4\x2f\x20\x01\xd0\x7f\x1f\x8b\x90\x00\x01\
+\x02\x04\x08\x10\xf8\x4a\xc0\xfb\x04\x08\x10\x20\x40\x60\x00\x01\
+\x09\x80\x01\x3a\x59\x88\x04\x08\x10\x20\x40\x80\xc0\xe7\x02\xde\
+\x25\x40\x80\x00\x01\x02\x23\x08\x48\x00\x8c\xd0\xcb\x62\x24\x40\
+\x80\x00\x01\x02\x04\x3e\x13\xf0\x1e\x01\x02\x04\x08\x10\x18\x42\
+\x40\x02\x60\x88\x6e\x16\x24\x01\x02\x04\x08\x10\x20\xf0\xb1\x80\
+\x77\x08\x10\x20\x40\x80\xc0\x18\x02\x12\x00\x63\xf4\xb3\x28\x09\
+\x10\x20\x40\x80\x00\x81\x8f\x04\xbc\x4e\x80\x00\x01\x02\x04\x06\
+\x11\x90\x00\x18\xa4\xa3\x85\x49\x80\x00\x01\x02\x04\x08\xdc\x17\
+\xf0\x2a\x01\x02\x04\x08\x10\x18\x45\x40\x02\x60\x94\x9e\x16\x27\
+\x01\x02\x04\x08\x10\x20\x70\x4f\xc0\x6b\x04\x08\x10\x20\x40\x60\
+\x18\x01\x09\x80\x61\xba\x5a\xa0\x04\x08\x10\x20\x40\x80\xc0\x7b\
+\x01\xaf\x10\x20\x40\x80\x00\x81\x71\x04\x24\x00\xc6\xe9\x6b\x91\
+\x12\x20\x40\x80\x00\x01\x02\x6f\x05\xfc\x4c\x80\x00\x01\x02\x04\
+\x06\x12\x90\x00\x18\xa8\xb3\x85\x4a\x80\x00\x01\x02\x04\x08\xbc\
+\x16\xf0\x13\x01\x02\x04\x08\x10\x18\x49\x40\x02\x60\xa4\xde\x16\
+\x2b\x01\x02\x04\x08\x10\x20\x70\x2b\xe0\x7b\x02\x04\x08\x10\x20\
+\x30\x94\x80\x04\xc0\x50\xdd\x2d\x58\x02\x04\x08\x10\x20\x40\xe0\
+\x87\x80\xef\x08\x10\x20\x40\x80\xc0\x58\x02\x12\x00\x63\xf5\xb7\
+\x68\x09\x10\x20\x40\x80\x00\x81\x59\xc0\x57\x02\x04\x08\x10\x20\
+\x30\x98\x80\x04\xc0\x60\x1d\x2e\x5c\x02\x04\x08\x10\x20\x40\xe0\
+\x9b\x80\xff\x12\x20\x40\x80\x00\x81\xd1\x04\x24\x00\x46\xeb\x71\
+\xf1\x12\x20\x40\x80\x00\x01\x02\x11\x50\x08\x10\x20\x40\x80\xc0\
+\x70\x02\x12\x00\xc3\x75\xb9\x80\x09\x10\x20\x40\x80\x00\x81\xa7\
+\x27\x06\x04\x08\x10\x20\x40\x60\x3c\x01\x09\x80\xf1\xfa\x5c\xc4\
+\x04\x08\x10\x20\x40\x80\x00\x01\x02\x04\x08\x10\x20\x30\xa0\x80\
+\x04\xc0\x80\x9d\x2e\x64\x02\x04\x08\x10\x20\x30\xba\x80\xf8\x09\
+\x10\x20\x40\x80\xc0\x88\x02\x12\x00\x23\xf6\xba\x98\x09\x10\x20\
+\x40\x80\xc0\xd8\x02\xa2\x27\x40\x80\x00\x01\x02\x43\x0a\x48\x00\
+\x0c\xd9\xed\x82\x26\x40\x80\x00\x01\x02\x23\x0b\x88\x9d\x00\x01\
+\x02\x04\x08\x8c\x29\x20\x01\x30\x66\xbf\x8b\x9a\x00\x01\x02\x04\
+\x08\x8c\x2b\x20\x72\x02\x04\x08\x10\x20\x30\xa8\x80\x04\xc0\xa0\
+\x1d\x2f\x6c\x02\x04\x08\x10\x20\x30\xaa\x80\xb8\x09\x10\x20\x40\
+\x80\xc0\xa8\x02\x12\x00\xa3\xf6\xbc\xb8\x09\x10\x20\x40\x80\xc0\
+\x98\x02\xa2\x26\x40\x80\x00\x01\x02\xc3\x0a\x48\x00\x0c\xdb\xf5\
+\x02\x27\x40\x80\x00\x01\x02\x23\x0a\x88\x99\x00\x01\x02\x04\x08\
+\x8c\x2b\x20\x01\x30\x6e\xdf\x8b\x9c\x00\x01\x02\x04\x08\x8c\x27\
+\x20\x62\x02\x04\x08\x10\x20\x30\xb0\x80\x04\xc0\xc0\x9d\x2f\x74\
+\x02\x04\x08\x10\x20\x30\x9a\x80\x78\x09\x10\x20\x40\x80\xc0\xc8\
+\x02\x12\x00\x23\xf7\xbe\xd8\x09\x10\x20\x40\x80\xc0\x58\x02\xa2\
+\x25\x40\x80\x00\x01\x02\x43\x0b\x48\x00\x0c\xdd\xfd\x82\x27\x40\
+\x80\x00\x01\x02\x23\x09\x88\x95\x00\x01\x02\x04\x08\x8c\x2d\x20\
+\x01\x30\x76\xff\x8b\x9e\x00\x01\x02\x04\x08\x8c\x23\x20\x52\x02\
+\x04\x08\x10\x20\x30\xb8\x80\x04\xc0\xe0\x27\x80\xf0\x09\x10\x20\
+\x40\x80\xc0\x28\x02\xe2\x24\x40\x80\x00\x01\x02\xa3\x0b\x48\x00\
+\x8c\x7e\x06\x88\x9f\x00\x01\x02\x04\x08\x8c\x21\x20\x4a\x02\x04\
+\x08\x10\x20\x30\xbc\x80\x04\xc0\xf0\xa7\x00\x00\x02\x04\x08\x10\
+\x20\x30\x82\x80\x18\x09\x10\x20\x40\x80\x00\x01\x09\x00\xe7\x00\
+\x01\x02\x04\x08\x10\x20\xd0\xbf\x80\x08\x09\x10\x20\x40\x80\x00\
+\x81\x27\x09\x00\x27\x01\x01\x02\x04\x08\x10\x20\xd0\xbd\x80\x00\
+\x09\x10\x20\x40\x80\x00\x81\x27\x09\x00\x27\x01\x01\x02\x04\x08\
+\x10\x20\xd0\xbd\x80\x00\x09\x10\x20\x40\x80\x00\x81\x49\xc0\x13\
+\x00\x13\x82\xff\x13\x20\x40\x80\x00\x01\x02\x3d\x0b\x88\x8d\x00\
+\x01\x02\x04\x08\x10\x88\x80\x04\x40\x14\x14\x02\x04\x08\x10\x20\
+\x40\xa0\x5f\x01\x91\x11\x20\x40\x80\x00\x01\x02\x45\x40\x02\xa0\
+\x30\xf8\x0f\x01\x02\x04\x08\x10\x20\xd0\xab\x80\xb8\x08\x10\x20\
+\x40\x80\x00\x81\x6f\x02\x12\x00\xdf\x1c\xfc\x97\x00\x01\x02\x04\
+\x08\x10\xe8\x53\x40\x54\x04\x08\x10\x20\x40\x80\xc0\x77\x01\x09\
+\x80\xef\x10\xbe\x10\x20\x40\x80\x00\x01\x02\x3d\x0a\x88\x89\x00\
+\x01\x02\x04\x08\x10\x98\x05\x24\x00\x66\x09\x5f\x09\x10\x20\x40\
+\x80\x00\x81\xfe\x04\x44\x44\x80\x00\x01\x02\x04\x08\xfc\x26\x20\
+\x01\xf0\x1b\x85\x6f\x08\x10\x20\x40\x80\x00\x81\xde\x04\xc4\x43\
+\x80\x00\x01\x02\x04\x08\xfc\x10\x90\x00\xf8\x61\xe1\x3b\x02\x04\
+\x08\x10\x20\x40\xa0\x2f\x01\xd1\x10\x20\x40\x80\x00\x01\x02\x37\
+\x02\x12\x00\x37\x18\xbe\x25\x40\x80\x00\x01\x02\x04\x7a\x12\x10\
+\x0b\x01\x02\x04\x08\x10\x20\x70\x2b\x20\x01\x70\xab\xe1\x7b\x02\
+\x04\x08\x10\x20\x40\xa0\x1f\x01\x91\x10\x20\x40\x80\x00\x01\x02\
+\xaf\x04\x24\x00\x5e\x71\xf8\x81\x00\x01\x02\x04\x08\x10\xe8\x45\
+\x40\x1c\x04\x08\x10\x20\x40\x80\xc0\x6b\x01\x09\x80\xd7\x1e\x7e\
+\x22\x40\x80\x00\x01\x02\x04\xfa\x10\x10\x05\x01\x02\x04\x08\x10\
+\x20\xf0\x46\x40\x02\xe0\x0d\x88\x1f\x09\x10\x20\x40\x80\x00\x81\
+\x1e\x04\xc4\x40\x80\x00\x01\x02\x04\x08\xbc\x15\x90\x00\x78\x2b\
+\xe2\x67\x02\x04\x08\x10\x20\x40\xa0\x7d\x01\x11\x10\x20\x40\x80\
+\x00\x01\x02\xef\x04\x24\x00\xde\x91\x78\x81\x00\x01\x02\x04\x08\
+\x10\x68\x5d\x40\xfb\x09\x10\x20\x40\x80\x00\x81\xf7\x02\x12\x00\
+\xef\x4d\xbc\x42\x80\x00\x01\x02\x04\x08\xb4\x2d\xa0\xf5\x04\x08\
+\x10\x20\x40\x80\xc0\x1d\x01\x09\x80\x3b\x28\x5e\x22\x40\x80\x00\
+\x01\x02\x04\x5a\x16\xd0\x76\x02\x04\x08\x10\x20\x40\xe0\x9e\x80\
+\x04\xc0\x3d\x15\xaf\x11\x20\x40\x80\x00\x01\x02\xed\x0a\x68\x39\
+\x01\x02\x04\x08\x10\x20\x70\x57\x40\x02\xe0\x2e\x8b\x17\x09\x10\
+\x20\x40\x80\x00\x81\x56\x05\xb4\x9b\x00\x01\x02\x04\x08\x10\xb8\
+\x2f\x20\x01\x70\xdf\xc5\xab\x04\x08\x10\x20\x40\x80\x40\x9b\x02\
+\x5a\x4d\x80\x00\x01\x02\x04\x08\x7c\x20\x20\x01\xf0\x01\x8c\x97\
+\x09\x10\x20\x40\x80\x00\x81\x16\x05\xb4\x99\x00\x01\x02\x04\x08\
+\x10\xf8\x48\x40\x02\xe0\x23\x19\xaf\x13\x20\x40\x80\x00\x01\x02\
+\xed\x09\x68\x31\x01\x02\x04\x08\x10\x20\xf0\xa1\x80\x04\xc0\x87\
+\x34\xde\x20\x40\x80\x00\x01\x02\x04\x5a\x13\xd0\x5e\x02\x04\x08\
+\x10\x20\x40\xe0\x63\x01\x09\x80\x8f\x6d\xbc\x43\x80\x00\x01\x02\
+\x04\x08\xb4\x25\xa0\xb5\x04\x08\x10\x20\x40\x80\xc0\x27\x02\x12\
+\x00\x9f\xe0\x78\x8b\x00\x01\x02\x04\x08\x10\x68\x49\x40\x5b\x09\
+\x10\x20\x40\x80\x00\x81\xcf\x04\x24\x00\x3e\xd3\xf1\x1e\x01\x02\
+\x04\x08\x10\x20\xd0\x8e\x80\x96\x12\x20\x40\x80\x00\x01\x02\x9f\
+\x0a\x48\x00\x7c\xca\xe3\x4d\x02\x04\x08\x10\x20\x40\xa0\x15\x01\
+\xed\x24\x40\x80\x00\x01\x02\x04\x3e\x17\x90\x00\xf8\xdc\xc7\xbb\
+\x04\x08\x10\x20\x40\x80\x40\x1b\x02\x5a\x49\x80\x00\x01\x02\x04\
+\x08\x7c\x21\x20\x01\xf0\x05\x90\xb7\x09\x10\x20\x40\x80\x00\x81\
+\x16\x04\xb4\x91\x00\x01\x02\x04\x08\x10\xf8\x4a\x40\x02\xe0\x2b\
+\x21\xef\x13\x20\x40\x80\x00\x01\x02\xf5\x0b\x68\x21\x01\x02\x04\
+\x08\x10\x20\xf0\xa5\x80\x04\xc0\x97\x44\x36\x20\x40\x80\x00\x01\
+\x02\x04\x6a\x17\xd0\x3e\x02\x04\x08\x10\x20\x40\xe0\x6b\x01\x09\
+\x80\xaf\x8d\x6c\x41\x80\x00\x01\x02\x04\x08\xd4\x2d\xa0\x75\x04\
+\x08\x10\x20\x40\x80\xc0\x02\x01\x09\x80\x05\x48\x36\x21\x40\x80\
+\x00\x01\x02\x04\x6a\x16\xd0\x36\x02\x04\x08\x10\x20\x40\x60\x89\
+\x80\x04\xc0\x12\x25\xdb\x10\x20\x40\x80\x00\x01\x02\xf5\x0a\x68\
+\x19\x01\x02\x04\x08\x10\x20\xb0\x48\x40\x02\x60\x11\x93\x8d\x08\
+\x10\x20\x40\x80\x00\x81\x5a\x05\xb4\x8b\x00\x01\x02\x04\x08\x10\
+\x58\x26\x20\x01\xb0\xcc\xc9\x56\x04\x08\x10\x20\x40\x80\x40\x9d\
+\x02\x5a\x45\x80\x00\x01\x02\x04\x08\x2c\x14\x90\x00\x58\x08\x65\
+\x33\x02\x04\x08\x10\x20\x40\xa0\x46\x01\x6d\x22\x40\x80\x00\x01\
+\x02\x04\x96\x0a\x48\x00\x2c\x95\xb2\x1d\x01\x02\x04\x08\x10\x20\
+\x50\x9f\x80\x16\x11\x20\x40\x80\x00\x01\x02\x8b\x05\x24\x00\x16\
+\x53\xd9\x90\x00\x01\x02\x04\x08\x10\xa8\x4d\x40\x7b\x08\x10\x20\
+\x40\x80\x00\x81\xe5\x02\x12\x00\xcb\xad\x6c\x49\x80\x00\x01\x02\
+\x04\x08\xd4\x25\xa0\x35\x04\x08\x10\x20\x40\x80\xc0\x03\x02\x12\
+\x00\x0f\x60\xd9\x94\x00\x01\x02\x04\x08\x10\xa8\x49\x40\x5b\x08\
+\x10\x20\x40\x80\x00\x81\x47\x04\x24\x00\x1e\xd1\xb2\x2d\x01\x02\
+\x04\x08\x10\x20\x50\x8f\x80\x96\x10\x20\x40\x80\x00\x01\x02\x0f\
+\x09\x48\x00\x3c\xc4\x65\x63\x02\x04\x08\x10\x20\x40\xa0\x16\x01\
+\xed\x20\x40\x80\x00\x01\x02\x04\x1e\x13\x90\x00\x78\xcc\xcb\xd6\
+\x04\x08\x10\x20\x40\x80\x40\x1d\x02\x5a\x41\x80\x00\x01\x02\x04\
+\x08\x3c\x28\x20\x01\xf0\x20\x98\xcd\x09\x10\x20\x40\x80\x00\x81\
+\x1a\x04\xb4\x81\x00\x01\x02\x04\x08\x10\x78\x54\x40\x02\xe0\x51\
+\x31\xdb\x13\x20\x40\x80\x00\x01\x02\xd7\x0b\x68\x01\x01\x02\x04\
+\x08\x10\x20\xf0\xb0\x80\x04\xc0\xc3\x64\x76\x20\x40\x80\x00\x01\
+\x02\x04\xae\x16\x70\x7c\x02\x04\x08\x10\x20\x40\xe0\x71\x01\x09\
+\x80\xc7\xcd\xec\x41\x80\x00\x01\x02\x04\x08\x5c\x2b\xe0\xe8\x04\
+\x08\x10\x20\x40\x80\xc0\x0a\x01\x09\x80\x15\x68\x76\x21\x40\x80\
+\x00\x01\x02\x04\xae\x14\x70\x6c\x02\x04\x08\x10\x20\x40\x60\x8d\
+\x80\x04\xc0\x1a\x35\xfb\x10\x20\x40\x80\x00\x01\x02\xd7\x09\x38\
+\x32\x01\x02\x04\x08\x10\x20\xb0\x4a\x40\x02\x60\x15\x9b\x9d\x08\
+\x10\x20\x40\x80\x00\x81\xab\x04\x1c\x97\x00\x01\x02\x04\x08\x10\
+\x58\x27\x20\x01\xb0\xce\xcd\x5e\x04\x08\x10\x20\x40\x80\xc0\x35\
+\x02\x8e\x4a\x80\x00\x01\x02\x04\x08\xac\x14\x90\x00\x58\x09\x67\
+\x37\x02\x04\x08\x10\x20\x40\xe0\x0a\x01\xc7\x24\x40\x80\x00\x01\
+\x02\x04\xd6\x0a\x48\x00\xac\x95\xb3\x1f\x01\x02\x04\x08\x10\x20\
+\x70\xbe\x80\x23\x12\x20\x40\x80\x00\x01\x02\xab\x05\x24\x00\x56\
+\xd3\xd9\x91\x00\x01\x02\x04\x08\x10\x38\x5b\xc0\xf1\x08\x10\x20\
+\x40\x80\x00\x81\xf5\x02\x12\x00\xeb\xed\xec\x49\x80\x00\x01\x02\
+\x04\x08\x9c\x2b\xe0\x68\x04\x08\x10\x20\x40\x80\xc0\x06\x01\x09\
+\x80\x0d\x78\x76\x25\x40\x80\x00\x01\x02\x04\xce\x14\x70\x2c\x02\
+\x04\x08\x10\x20\x40\x60\x8b\x80\x04\xc0\x16\x3d\xfb\x12\x20\x40\
+\x80\x00\x01\x02\xe7\x09\x38\x12\x01\x02\x04\x08\x10\x20\xb0\x49\
+\x40\x02\x60\x13\x9f\x9d\x09\x10\x20\x40\x80\x00\x81\xb3\x04\x1c\
+\x87\x00\x01\x02\x04\x08\x10\xd8\x26\xf0\xff\x00\x00\x00\xff\xff\
+\xb8\x8c\x08\xaa\x00\x00\x00\x06\x49\x44\x41\x54\x03\x00\x73\x70\
+\x92\xdf\xce\x02\x2b\x91\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x48\xbc\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x9d\xcd\xab\x65\xd9\
+\x79\xde\xf7\xa9\xff\x20\xc8\x83\xee\xc2\x86\xa0\x80\x8d\x95\x0a\
+\x84\x8e\x13\x77\xdf\x89\xaa\xff\x00\x21\x41\x37\xe2\x74\x67\x10\
+\x0f\x0c\x01\x19\xa2\x40\x0f\xbb\x45\xab\x71\x6b\x58\x60\x0d\xdc\
+\x60\xe2\xb1\x54\x88\x2a\xb0\xd1\x30\x83\x96\x26\xd5\x2d\x47\xee\
+\x04\xdc\x96\xb0\x21\x42\x46\xa2\xaa\x07\x29\x14\x32\x35\xf4\xc9\
+\x7e\xce\x3d\xeb\xde\x7d\xee\x3d\x1f\xfb\x63\xbd\x6b\xbd\x6b\xad\
+\x5f\x71\xd7\x3d\x5f\x7b\xaf\xf5\xbe\xbf\x77\xdf\xf3\x3c\x6b\xed\
+\x7d\x4e\xdd\xe9\xf8\x07\x01\x08\x40\x00\x02\x10\x80\x40\x73\x04\
+\x30\x00\xcd\x95\x9c\x84\x21\x00\x01\x08\x40\x00\x02\x5d\x87\x01\
+\xe0\x28\x80\x00\x04\x20\x00\x01\x08\x34\x48\x00\x03\xd0\x60\xd1\
+\x49\x19\x02\x10\x80\x00\x04\xda\x26\xa0\xec\x31\x00\xa2\x40\x83\
+\x00\x04\x20\x00\x01\x08\x34\x46\x00\x03\xd0\x58\xc1\x49\x17\x02\
+\x10\x80\x00\x04\x5a\x27\x70\x99\x3f\x06\xe0\x92\x03\xbf\x21\x00\
+\x01\x08\x40\x00\x02\x4d\x11\xc0\x00\x34\x55\x6e\x92\x85\x00\x04\
+\x20\x00\x81\xd6\x09\x84\xfc\x31\x00\x81\x04\xb7\x10\x80\x00\x04\
+\x20\x00\x81\x86\x08\x60\x00\x1a\x2a\x36\xa9\x42\x00\x02\x10\x80\
+\x40\xeb\x04\xae\xf3\xc7\x00\x5c\xb3\xe0\x1e\x04\x20\x00\x01\x08\
+\x40\xa0\x19\x02\x18\x80\x66\x4a\x4d\xa2\x10\x80\x00\x04\x20\xd0\
+\x3a\x81\x61\xfe\x18\x80\x21\x0d\xee\x43\x00\x02\x10\x80\x00\x04\
+\x1a\x21\x80\x01\x68\xa4\xd0\xa4\x09\x01\x08\x40\x00\x02\xad\x13\
+\xd8\xcf\x1f\x03\xb0\xcf\x83\x47\x10\x80\x00\x04\x20\x00\x81\x26\
+\x08\x60\x00\x9a\x28\x33\x49\x42\x00\x02\x10\x80\x40\xeb\x04\x6e\
+\xe6\x8f\x01\xb8\x49\x84\xc7\x10\x80\x00\x04\x20\x00\x81\x06\x08\
+\x60\x00\x1a\x28\x32\x29\x42\x00\x02\x10\x80\x40\xeb\x04\x6e\xe7\
+\x8f\x01\xb8\xcd\x84\x67\x20\x00\x01\x08\x40\x00\x02\xd5\x13\xc0\
+\x00\x54\x5f\x62\x12\x84\x00\x04\x20\x00\x81\xd6\x09\x1c\xca\x1f\
+\x03\x70\x88\x0a\xcf\x41\x00\x02\x10\x80\x00\x04\x2a\x27\x80\x01\
+\xa8\xbc\xc0\xa4\x07\x01\x08\x40\x00\x02\xad\x13\x38\x9c\x3f\x06\
+\xe0\x30\x17\x9e\x85\x00\x04\x20\x00\x01\x08\x54\x4d\x00\x03\x50\
+\x75\x79\x49\x0e\x02\x10\x80\x00\x04\x5a\x27\x70\x2c\x7f\x0c\xc0\
+\x31\x32\x3c\x0f\x01\x08\x40\x00\x02\x10\xa8\x98\x00\x06\xa0\xe2\
+\xe2\x92\x1a\x04\x20\x00\x01\x08\xb4\x4e\xe0\x78\xfe\x18\x80\xe3\
+\x6c\x78\x05\x02\x10\x80\x00\x04\x20\x50\x2d\x01\x0c\x40\xb5\xa5\
+\x25\x31\x08\x40\x00\x02\x10\x68\x9d\xc0\xa9\xfc\x31\x00\xa7\xe8\
+\xf0\x1a\x04\x20\x00\x01\x08\x40\xa0\x52\x02\x18\x80\x4a\x0b\x4b\
+\x5a\x10\x80\x00\x04\x20\xd0\x3a\x81\xd3\xf9\x63\x00\x4e\xf3\xe1\
+\x55\x08\x40\x00\x02\x10\x80\x40\x95\x04\x30\x00\x55\x96\x95\xa4\
+\x20\x00\x01\x08\x40\xa0\x75\x02\xe7\xf2\xc7\x00\x9c\x23\xc4\xeb\
+\x10\x80\x00\x04\x20\x00\x81\x0a\x09\x60\x00\x2a\x2c\x2a\x29\x41\
+\x00\x02\x10\x80\x40\xeb\x04\xce\xe7\x8f\x01\x38\xcf\x68\xf2\x16\
+\x2f\xbc\xf0\xc2\xfd\xd0\xee\xde\xbd\xfb\x6d\xb5\x17\x5f\x7c\xf1\
+\x43\x1a\x0c\x38\x06\xca\x3b\x06\xf4\xf7\xab\x16\xfe\xa6\x27\xbf\
+\x21\xb0\x43\x52\x02\xa1\x4e\xaa\x99\x5a\xea\xbf\x39\x8d\x19\x5a\
+\x88\x25\x29\x80\x09\x83\x61\x00\x26\xc0\x3a\xb5\xa9\x0a\xbd\x3b\
+\xd0\x36\xab\xd5\xea\xc3\xd0\x36\x9b\xcd\xbb\x9b\xbe\xf5\xfb\xde\
+\xa7\x75\x30\xe8\x60\xd0\x15\xc6\x40\x7f\xbf\x6a\xe1\x6f\xba\xff\
+\x3b\xdf\xf4\xed\x43\xbd\xc9\xf7\xb9\xf0\xe3\x80\xc0\xa1\xf7\x5f\
+\xd5\x4c\xad\x0f\x2f\xe9\xfb\x8e\xc6\x0c\x6d\x78\xcc\xe8\x78\x51\
+\xeb\xe3\x49\xf2\x33\x66\x10\x0c\xc0\x18\x4a\x07\xb6\xd1\x01\xa7\
+\xa6\x37\x82\xbe\x6d\x45\xbf\xdf\x4c\x07\x5a\x7f\xc3\x0f\x04\x20\
+\x50\x39\x81\xfb\x7a\x93\xd7\xdf\xbe\xb7\x37\xf5\xca\xb9\xef\xa5\
+\x17\xde\x83\x25\xb4\xfd\x0b\xae\xdf\x7f\x75\xbc\xa8\xe9\x98\xe9\
+\x9b\x0b\x03\x89\x01\xe8\x8f\x9a\xa9\x3f\x2a\x9e\x0e\x38\xb5\x7e\
+\x5f\xd7\x07\x5d\x1f\x1f\x3f\x10\x80\x80\x21\x81\xf0\xa6\x8e\x11\
+\x30\x84\x7c\xa3\xeb\x92\x84\xff\x46\xe8\xe1\xa1\xb1\x81\x0c\xc3\
+\x9c\xbe\xc5\x00\x9c\xe6\xb3\xf7\xaa\xfe\xc0\x7b\xf1\xdf\xf4\x4f\
+\x22\xfa\x3d\x04\x7e\x20\x00\x81\x6b\x02\x32\x02\x7a\x8f\xb8\x7e\
+\x86\x7b\x16\x04\xc4\xb8\xa6\xc9\x97\x8e\x1b\xe9\x8a\xf2\xb2\xe0\
+\x75\xaa\x4f\x0c\xc0\x29\x3a\xbb\xd7\x82\xdb\x54\xa1\x76\x4f\x71\
+\x03\x01\x08\x40\xe0\x16\x01\xbd\x47\xe8\xcd\x5c\xef\x19\xb7\x5e\
+\xe4\x89\xc5\x04\x7a\xb6\x1f\x8a\xf1\xe2\x8e\x1c\x76\xa0\xbc\x94\
+\x5f\x0c\x23\x30\x36\x3d\x0c\xc0\x19\x52\x2a\x46\x4d\x6e\xf3\x4c\
+\xba\xbc\x0c\x01\x08\x44\x20\xa0\xf7\x0c\xbd\x77\x44\xe8\x8a\x2e\
+\x7a\x02\x32\x54\x12\xc7\xfe\x6e\xed\xab\xaf\xdb\x53\x03\xa9\x8e\
+\x1d\x0c\x40\x7f\x44\x1d\xfa\xd9\x1d\x70\xbd\x29\xdb\xbc\x7b\xe8\
+\x75\x9e\x83\x00\x04\x20\x70\x8a\x40\xff\xe6\xf1\xae\xde\x47\x4e\
+\x6d\xc3\x6b\xe3\x08\xc8\x50\xf5\x5b\xd6\x2e\xfe\x7d\x8a\x97\x3f\
+\x3a\x76\x7a\xc3\xb3\x99\x67\x04\x2e\xfb\x18\xf3\x1b\x03\x70\x80\
+\x92\xa0\xef\x0e\xb8\x03\xaf\xf2\x14\x04\x20\x00\x81\x71\x04\xfa\
+\xf7\x11\x26\x10\xe3\x50\x1d\xdd\x4a\xef\xc7\x47\x5f\xac\xfc\x05\
+\x19\x01\xcb\xfc\x31\x00\x37\x0e\x20\xc1\x16\xf4\x1b\x4f\xf3\x10\
+\x02\x10\x80\xc0\x1c\x02\xf7\xfb\x99\xdc\x87\x73\x76\x64\x9f\xae\
+\xe3\xfd\xb8\xeb\xa4\x47\xe2\x30\xf6\x78\x98\xb2\x1d\x06\x60\x40\
+\x4b\x90\x05\x7b\xf0\x14\x77\x21\x00\x01\x08\x2c\x25\x70\x5f\xef\
+\x2d\x4b\x3b\x69\x6d\x7f\x31\xe3\xfd\xf8\xb2\xea\xe2\x20\x1e\x97\
+\x8f\xe2\xfd\xc6\x00\xec\x58\x0a\xae\x20\xef\x1e\x72\x03\x01\x08\
+\x40\x20\x1a\x01\xbd\xb7\x70\x3d\xc0\x34\x9c\x62\x36\x6d\x8f\xba\
+\xb7\x16\x0f\xe9\xd4\xe9\x2c\xa7\xbd\x8a\x01\xe8\x79\x09\xaa\xe0\
+\xf6\x77\xf9\x81\x00\x04\x20\x60\x42\x80\xeb\x01\xc6\x63\xd5\x7b\
+\xf2\xf8\xad\xdb\xd9\x52\x3a\x15\x93\x4d\xf3\x06\x40\xae\x5c\x50\
+\xdb\x39\x84\xc8\x14\x02\x10\xc8\x44\xa0\x99\xab\xd8\x97\xf2\xed\
+\xdf\x93\xbf\xbc\xb4\x8f\x5a\xf7\xef\xd9\x1c\xfd\x74\xc9\xd4\x9c\
+\x9b\x37\x00\x77\xee\xdc\xe1\x8f\x72\xea\x51\xc3\xf6\x10\x80\xc0\
+\x2c\x02\x9a\x70\xcc\xda\xb1\xbd\x9d\x78\x5f\x3e\x51\xf3\x58\xab\
+\x49\x77\x4e\x8c\x51\xfd\x4b\x5a\x4a\x91\x9b\xaa\x3e\x51\x12\x84\
+\x00\x04\x5c\x10\x88\xf5\xc6\xed\x22\x19\xa3\x20\xf4\xbe\x6c\xd4\
+\x75\x4d\xdd\x1e\xb8\xb0\x74\x7a\x7a\x4d\x1b\x00\xc4\x7f\xfa\x01\
+\xc3\x1e\x10\x80\xc0\x22\x02\xcc\x6c\xcf\xe0\xe3\x7d\xf9\x0c\xa0\
+\xdd\xcb\x31\x38\x35\x6b\x00\x70\x99\xbb\xa3\x88\x1b\x08\x40\x20\
+\x29\x01\x4e\x03\x1c\xc7\x0d\x9b\xe3\x6c\x0e\xbd\x32\xfc\x8e\x89\
+\x43\xaf\x9f\x7b\xae\x49\x03\x20\xf1\x8f\xe1\x9e\xce\xc1\xe5\x75\
+\x08\x40\x00\x02\x37\x09\x70\x1a\xe0\x26\x91\xeb\xc7\x5c\x93\x75\
+\xcd\x62\xe4\xbd\xfb\x4b\x4c\x53\x93\x06\xa0\x17\x7f\xae\x30\x1d\
+\x79\x74\xb1\x19\x04\x20\x10\x9d\x00\xa7\x01\x8e\x20\xe5\xbd\xf9\
+\x08\x98\x13\x4f\x5f\x1a\xca\x13\x1b\x9c\x78\xa9\x39\x03\xa0\xd9\
+\x7f\xcf\x83\x3f\xc0\x1e\x02\x3f\x10\x80\x40\x1e\x02\x4b\x66\x6d\
+\x79\x22\x4e\x36\x2a\xef\xcd\xd3\x51\xcf\x5e\x05\x68\xce\x00\xe4\
+\x70\x98\xf7\x5e\xbe\xd7\xa9\xad\xbf\xf9\x46\x47\x83\x41\xe9\xc7\
+\xc0\xf4\xf7\xa7\xf3\x7b\x5c\xbc\xfc\xa5\xee\xad\xff\xfa\x9a\xbb\
+\xa6\xb8\xce\x47\x3f\x7d\x8b\x25\xb3\xb6\xe9\xa3\x95\xb1\xc7\x6e\
+\x72\x66\x12\x6c\xca\x63\xcb\xea\x98\x39\x05\x66\xee\xf1\xd4\x9c\
+\x01\xe8\x21\x26\x71\x98\x12\xfc\xf7\xbf\xff\x9d\xee\xaf\x7e\xf1\
+\xd7\xdd\xfb\xdf\xfb\xce\xb6\xad\xbf\xb9\xee\x0d\x00\x0d\x0e\xe5\
+\x1e\x03\x3a\xae\xfb\xbf\xa1\xe8\x3f\x29\xdf\xa0\xa7\x8e\x15\x3d\
+\x59\x3a\x4c\x4a\x60\x6a\xbd\x97\x6e\xff\xe8\xe1\x3b\xdd\xd3\x5f\
+\x7e\xef\xca\xcc\x26\x4a\x76\xd6\x2a\x40\x53\x06\xc0\xd2\x61\x86\
+\x22\xeb\x0d\x52\xc2\x2f\xd1\xbf\xf7\x87\xf7\xc2\xd3\xdc\x42\x00\
+\x02\x05\x12\x78\xe5\xe5\xdf\xb7\x8a\x7a\xd6\x1b\xb6\x55\x30\x1e\
+\xfa\xed\x57\x67\xdf\xb5\x88\x23\xc7\x8c\x5c\x79\x0c\x8d\x84\x1e\
+\xdb\xb5\xf9\x3d\x37\x65\x00\xe6\x63\x1a\xb7\xe7\xba\x5f\xe2\x47\
+\xf8\xc7\xb1\x62\x2b\x08\x94\x42\xc0\x4a\x40\xe6\x2e\xdb\x96\xc2\
+\x6d\x4a\x9c\x96\x93\x33\x43\x13\x37\x2a\x45\x19\x81\xb0\x22\x30\
+\x6a\x87\x99\x1b\xcd\x39\x9e\x9a\x32\x00\x56\x0e\x53\xf5\x92\xf8\
+\xaf\xfb\x25\x7e\xdd\xa7\x41\x00\x02\xf5\x10\xd0\x1b\xb8\x51\x36\
+\x49\x4e\x47\x1a\xc5\x5e\x44\xb7\x86\xb5\x9b\x9c\xbf\x62\x51\x9b\
+\xbc\xe3\x99\x1d\x06\x2f\x4f\x3e\x9e\x9a\x31\x00\x96\x0e\x73\xdd\
+\xcf\xfc\xd7\x88\xff\xe0\x38\xe4\x2e\x04\x20\x30\x86\x80\xe5\xfb\
+\xd2\x98\xf1\x3d\x6c\x23\x06\x96\x93\x33\x0f\x39\x86\x18\x64\x00\
+\xac\x56\x94\x34\xc6\xd4\x4f\x97\x34\x63\x00\x04\xc7\xaa\x21\xfe\
+\x56\x64\xe9\x17\x02\xf9\x09\x68\x09\xd9\xea\x4d\xbb\x15\xe1\xcb\
+\x55\x45\x09\x6e\xae\xb1\x8f\x8d\xfb\xd6\x7f\xb9\x38\xf6\xd2\x8c\
+\xe7\xf7\x77\x99\x7a\x1a\xa0\x19\x03\xd0\xff\xa1\x99\x7c\xf9\xcf\
+\xba\x9f\xfd\xef\x97\x80\x47\x10\x80\x00\x04\xc6\x13\x98\x3a\x6b\
+\x1b\xdf\xb3\xff\x2d\x2d\x67\xff\x1e\xc5\xbf\xfb\xe7\xff\xd5\xbd\
+\xf2\x6f\xff\xa9\x7b\xeb\x4f\xfe\x95\x8b\xe2\x34\x63\x00\xac\x68\
+\xaf\x59\xfa\xb7\x42\x4b\xbf\x10\x70\x43\xc0\x52\x4c\xfa\x59\xdb\
+\x87\x6e\x12\x25\x10\x3b\x02\xbd\xf8\x77\xff\xfc\x3f\xb7\xfd\xbf\
+\xf5\x27\x5f\xdc\xde\x2e\xfd\xb5\x74\xff\x96\x0c\xc0\xe4\x0b\x24\
+\xce\xc1\x5d\x33\xfb\x3f\x87\x88\xd7\x21\x50\x05\x01\x9d\x06\xb0\
+\x4c\x64\xe9\x7f\xea\x62\x19\x9b\x55\xdf\x96\xb3\x7f\xc5\x6c\x69\
+\xda\xd4\xff\xa4\x36\x10\xff\xb0\xdf\xc5\x7f\xf8\x17\xe1\x6e\xcc\
+\xdb\x49\x3a\xd7\x92\x01\x88\x09\x99\xbe\x20\x00\x81\xc6\x08\x58\
+\x5d\x07\xb0\xc3\x78\x5f\x82\xb8\xbb\xdf\xc4\x4d\x7f\x5a\xd6\xe4\
+\x73\xff\xee\xe0\x1d\x10\x7f\xc5\xf8\xd6\xe2\xd3\x00\xea\x65\x59\
+\xc3\x00\x2c\xe0\xa7\x2f\xfd\x59\xb0\x3b\xbb\x42\x00\x02\x05\x11\
+\xb0\x9e\x51\x4a\x10\x5b\xb9\x1e\xc0\xda\xec\x58\xd7\x6a\xf4\x61\
+\x7b\x44\xfc\x47\xef\x3f\x63\xc3\x29\xc7\x50\x13\x06\x60\x0a\x90\
+\x29\xbc\xf9\xa6\xbf\x29\xb4\xd8\x16\x02\x65\x13\xd0\x69\x00\xe3\
+\x55\x80\x6e\xb5\x5a\x55\x3f\x2b\x96\xf8\xcb\xec\x58\x1e\x0d\x2e\
+\x0c\xc0\x19\xf1\x7f\xe5\xdf\x2f\x3b\x05\x10\x83\x5f\x13\x06\x20\
+\x06\x28\xfa\x80\x00\x04\x20\x90\x40\x58\xaa\x3e\x15\x80\xf8\xfb\
+\xfa\x1b\xc2\x00\xf8\xaa\x07\xd1\x40\x00\x02\x8e\x09\xa4\x58\x05\
+\xd0\xec\x58\x42\xe9\x18\xc3\xac\xd0\xb4\x12\xab\xdc\x66\xed\x3c\
+\x61\xa7\x04\x26\xed\x74\x34\x67\x66\xfe\xa7\x77\x1e\xfb\x6a\x9c\
+\xed\x30\x00\x71\x38\xd2\x0b\x04\x20\xd0\x08\x81\x14\x02\x23\xa1\
+\xac\xc9\x04\x28\x97\xfe\xf4\x86\xf9\xc7\x1d\x53\xd4\xe6\xe4\x61\
+\x5e\x90\xf8\x2b\x0f\x0c\x80\x28\xd0\x20\x00\x01\x08\x8c\x24\x90\
+\x62\x15\x40\xa1\xd4\x62\x02\x24\xfe\xca\x45\x39\x59\xb7\xac\x06\
+\x20\xa1\xf8\xc7\xe2\x88\x01\x88\x45\x92\x7e\x20\x00\x81\x66\x08\
+\xa4\x12\x1a\x09\xa7\x04\xb4\x54\xb0\x8a\x5d\x39\xa4\x88\x3f\x55\
+\x4d\x0e\xe6\x52\xa0\xf8\x2b\x0f\x0c\x80\x28\xd0\x20\x00\x01\x08\
+\x4c\x20\x90\x6a\x15\x40\x21\x49\x40\xf5\x45\x41\x3a\x87\xae\xc7\
+\xa5\xb4\x94\xe2\x2f\x26\xd9\x0c\x40\x72\xf1\x57\xb6\x71\x1a\x06\
+\x20\x0e\x47\x7a\x81\x00\x04\x1a\x23\x90\x58\x70\xee\xeb\x1c\xba\
+\x44\xd5\x3b\x66\x19\x15\x19\x16\x19\x97\x54\xb1\x26\xae\xc5\x75\
+\x5a\x05\x8b\xbf\x92\xc0\x00\x88\x02\x0d\x02\x10\x80\xc0\x44\x02\
+\x5a\x05\x48\x2d\x3c\x12\x55\xcf\x26\x40\xb1\xc9\xa8\xf4\x28\x27\
+\x7d\x25\x6d\xbf\xfd\xa2\x9f\xd4\x75\xd8\x06\x9b\x49\xfc\xb7\x63\
+\x47\xfa\x85\x01\x88\x04\x92\x6e\x20\x00\x81\xf6\x08\x48\x78\xac\
+\xbf\x1c\xe8\x26\x55\x99\x80\x7e\x86\xbd\x91\xd8\xde\x7c\x2d\xd7\
+\xe3\x1c\xb3\xfe\x90\xab\x6a\x10\xee\x27\xbb\xad\x40\xfc\xc5\x0a\
+\x03\x20\x0a\x34\x08\x40\x00\x02\x33\x09\x64\x11\xa0\x3e\x56\x0f\
+\x46\x20\x08\x7f\x8e\x59\x7f\x8f\xa0\x13\x7b\x35\xdd\x4f\xd6\xb2\
+\x8a\x7f\xdc\x2c\x31\x00\x71\x79\xd2\x1b\x04\x20\xd0\x18\x81\x1c\
+\xa7\x02\x86\x88\x73\x18\x01\xad\x3e\x68\x15\x22\x97\xf0\x87\xfc\
+\x11\xff\x40\x62\xde\x2d\x06\x60\x1e\x37\xf6\x82\x00\x04\x20\x70\
+\x45\x40\x42\x94\xfa\x54\xc0\xd5\xe0\xbb\x3b\x43\x23\x20\x81\xde\
+\x3d\x1d\xe5\x46\x33\x7d\xb5\x5e\xf4\x3f\xec\x5b\x3f\xd4\x26\xfb\
+\xff\x59\xf0\xf8\xe1\xb7\xa2\xe4\x36\xba\x13\x07\x33\xff\xd1\xb1\
+\x8e\xdc\x10\x03\x30\x12\x14\x9b\x41\x00\x02\x10\x38\x45\x40\x26\
+\xe0\xd4\xeb\xa9\x5e\xeb\xd5\xf9\x5d\x35\x09\x75\xdf\x3e\x94\x19\
+\x50\x93\x80\xab\x8d\x89\x43\xdb\xa9\x69\xff\xbe\x6d\x34\xd3\x57\
+\xeb\xf7\x4d\x7a\x71\x5f\x3f\xde\xc1\x1f\xb1\xd6\xca\xcb\xc1\x17\
+\x2d\x9e\xac\x50\xfc\x85\x09\x03\x20\x0a\x34\x08\x40\x00\x02\x0b\
+\x09\x48\x90\x24\x4c\x0b\xbb\x89\xbd\xfb\x7d\x99\x01\x35\x09\xb8\
+\x9a\x04\x7d\xd0\x34\xa3\x0f\x6d\x13\x9e\xd7\x76\x6a\x7d\x30\x2e\
+\x04\xbf\x8f\xe3\xea\x47\x8c\xd5\xae\x9e\xb0\xbe\xe3\x46\xfc\xe3\
+\x27\x8a\x01\x88\xcf\x94\x1e\x21\x00\x81\x46\x09\x48\x98\xd4\x0a\
+\x4a\x5f\x02\x1f\x9a\xfb\xb0\xc5\x56\x2d\x59\xa0\x15\x8b\xbf\x18\
+\x62\x00\x44\x81\x06\x01\x08\x40\x20\x12\x01\x09\x94\x5a\xa4\xee\
+\xe8\x66\x47\x40\xd7\x58\x24\xe5\xea\x4c\xfc\x77\x18\xa2\xde\x60\
+\x00\xa2\xe2\xa4\x33\x08\x40\x00\x02\x5d\x9e\x8f\xa7\x55\x0c\x5e\
+\xe2\xff\xe8\xe1\x3b\xe9\x32\x6c\x40\xfc\x05\x13\x03\x20\x0a\x34\
+\x08\x40\x00\x02\x91\x09\x68\xb6\xaa\x16\xb9\xdb\xe6\xba\x43\xfc\
+\x55\x72\x9b\x86\x01\xb0\xe1\x4a\xaf\x10\x80\x00\x04\x58\x09\x58\
+\x78\x0c\xc8\x40\x31\xf3\x5f\x08\xf1\xc4\xee\x18\x80\x13\x70\x78\
+\x09\x02\x10\x80\xc0\x52\x02\x12\x31\xb5\xa5\xfd\xb4\xb6\xbf\x98\
+\xa9\x25\xcb\xdb\xf1\xb2\xbf\x15\x03\x0c\x80\x15\x59\xfa\x85\x00\
+\x04\x20\xb0\x23\x20\x21\x53\xdb\x3d\xe4\xe6\x0c\x01\xb1\x52\x3b\
+\xb3\x59\xbc\x97\x1b\x14\x7f\xc1\xc3\x00\x88\x02\x0d\x02\x10\x80\
+\x80\x31\x01\x09\x9a\x9a\xf1\x30\xc5\x77\x2f\x46\x6a\xc9\x12\x71\
+\x2f\xfe\x76\x24\x30\x00\x76\x6c\xe9\x19\x02\x10\x80\xc0\x1e\x01\
+\x09\xdb\xd3\x5f\x7e\x6f\x7b\x6d\xc0\xde\x0b\x3c\xd8\x12\x10\x1f\
+\xb5\xed\x83\x14\xbf\x1a\x16\x7f\xe1\xc5\x00\x88\x02\x0d\x02\x10\
+\x80\x40\x42\x02\x12\x39\xb5\x84\x43\xba\x1e\x4a\x57\xfa\xeb\xbb\
+\xfd\x93\x32\x29\x44\xfc\x2d\x0b\x87\x01\xb0\xa4\x4b\xdf\x10\x80\
+\x00\x04\x8e\x10\x90\xd8\x49\xf4\x24\x7e\x47\x36\x69\xe2\x69\x71\
+\xd0\x95\xfe\xfa\x2a\xe5\x64\x09\x23\xfe\x5b\xd4\x18\x80\x2d\x86\
+\x79\xbf\x3e\xfd\xc9\xa7\xf3\x76\x64\x2f\x08\x14\x4a\xe0\xd3\x8f\
+\x6d\x8e\xf9\xa4\x6f\xfe\x8e\xd8\x2b\x6f\x89\x9f\x44\xd0\x51\x58\
+\x49\x42\x91\xf1\x91\x01\x4a\x9e\x7b\x51\xe2\x6f\x5b\x8a\x26\x0c\
+\xc0\x67\x9f\x7d\xf6\x23\x0b\x8c\xef\xbc\xf1\x76\xf7\xce\x9b\x6f\
+\x77\x0f\xbf\xfb\xb0\xc3\x0c\x58\x10\xa6\x4f\x0f\x04\x74\x6c\xeb\
+\x38\x57\x7b\xf8\xdd\xef\x7b\x08\xa9\xba\x18\x24\x82\x6a\xd5\x25\
+\x76\x24\x21\xe5\x2a\xe3\x23\x03\x74\x64\x13\x9b\xa7\x11\xff\x3d\
+\xae\x4d\x18\x80\xbd\x8c\x23\x3f\xd0\x8c\x48\x6f\x8a\x32\x03\x5f\
+\xfb\xe2\x57\xb7\x66\x40\x86\x20\xf2\x30\x74\x07\x81\x64\x04\x24\
+\xf8\x6a\x12\x7c\x1d\xd3\x3a\xb6\x75\x9c\xab\x25\x0b\xa2\xc1\x81\
+\x24\x8a\xb5\x5f\x20\xa8\x59\x7f\xb6\x1c\x0b\x14\x7f\xeb\x3f\x83\
+\x96\x0c\x80\xc9\x2a\xc0\xcd\x02\xc9\x0c\xa8\x6d\xdf\x38\x59\x1d\
+\xb8\x89\x87\xc7\x4e\x09\x04\xc1\x97\xe8\x4b\xf0\xd5\x52\x09\xbe\
+\x44\xc1\x29\x96\x2c\x61\x0d\x8d\x80\xee\x67\x09\x22\xe2\xa0\xaa\
+\xaf\x96\xfa\x25\xfc\x9a\xf5\x47\xec\x7a\x7c\x57\x88\xff\x41\x56\
+\x2d\x19\x80\x83\x00\x2c\x9f\xd4\x1b\xa8\xcc\x80\xde\x4c\xb5\x2a\
+\xa0\x66\x39\x1e\x7d\x43\x60\x2a\x81\x2b\xe1\xef\x4f\x67\xe9\x78\
+\x55\x9b\xda\xc7\xd2\xed\x93\x2f\x03\x2f\x0d\x38\xd1\xfe\x12\xff\
+\x61\x4b\x34\x6c\xb4\x61\x82\xf0\x4b\xf4\xb3\xd6\xb8\x58\xf1\x8f\
+\x56\x8a\xa3\x1d\x61\x00\x8e\xa2\x89\xfb\x82\x8c\xc0\x65\x7b\xb8\
+\x3d\x4d\x10\xb7\x77\x7a\x83\xc0\x34\x02\x37\x85\x7f\xda\xde\x6c\
+\x9d\x92\xc0\xd0\x04\xe8\x7e\xca\xb1\xe7\x8c\xe5\x46\xf8\x15\x3c\
+\xe2\x2f\x0a\x47\x5b\x33\x06\x60\xb3\xd9\xbc\x77\x94\x42\xc2\x17\
+\x2e\x4d\xc0\xf7\xb7\x26\x80\x15\x81\x84\xe0\x19\x6a\x4b\xc0\xa3\
+\xf0\x4b\x30\xb6\xc1\xf1\xeb\x24\x01\x89\xbf\x9a\x96\xd2\x75\xeb\
+\x89\x9b\x62\xd1\x32\xbf\x5a\xf6\x19\x7f\xa0\x58\xb8\xf8\x87\x34\
+\x2c\x6f\x9b\x31\x00\x56\x9f\x04\x98\x5b\x1c\x8c\xc0\x5c\x72\xec\
+\x37\x87\x80\x47\xe1\x0f\x79\x64\x5d\x1e\x0e\x41\x14\x76\x2b\x03\
+\x20\xa1\x0d\x66\x40\x8f\x53\xa6\x20\xc1\xd7\x98\x12\x7c\xc5\xa0\
+\x58\x54\x47\xb5\x94\x71\x1c\x1d\x0b\xf1\x3f\x8a\x66\xf8\x42\x33\
+\x06\x60\x97\x74\x92\x0b\x01\x77\x63\x8d\xba\x19\x1a\x01\xbd\x49\
+\x8f\xda\x89\x8d\x20\x30\x92\x80\x8e\xa9\x70\x61\x5f\x8e\xf3\xfb\
+\xe7\xc2\x94\x88\x9c\xdb\x86\xd7\x4f\x13\x10\x43\x35\x09\xb1\x9a\
+\xee\xab\x49\xa4\xd5\x4e\xef\x3d\xee\x55\xf5\xa3\x3e\x87\x82\xaf\
+\xc7\x6e\x04\x7f\x98\x46\x15\xe2\x3f\x4c\xc8\xee\x7e\x53\x06\xc0\
+\xcb\x69\x80\x43\xe5\x94\x11\x08\x17\x0b\x1e\x7a\x9d\xe7\x20\x30\
+\x95\x80\x4e\x31\xe9\x98\xf2\x28\xfc\x21\x17\x89\x48\xb8\xcf\x6d\
+\x1c\x02\x62\xaa\xa6\x59\xb9\x9a\x4c\x41\x68\x12\x70\x35\xbd\x7e\
+\xa8\xe9\xb5\x61\x0b\xfb\xa9\x1f\x6d\xef\x52\xf0\x87\xd8\x10\xff\
+\x21\x8d\xb3\xf7\x9b\x32\x00\xbb\xd3\x00\xee\x56\x01\x86\x55\xda\
+\x1a\x81\x37\xdf\x1e\x3e\xc5\x7d\x08\x4c\x22\x10\x66\xfd\x3a\x96\
+\x26\xed\x98\x78\x63\x09\x4a\xe2\x21\x9b\x1f\x4e\x02\xae\x26\xf6\
+\x87\x9a\x5e\x1b\xb6\xa2\x80\x55\x24\xfe\xa9\xb8\x37\x65\x00\x04\
+\xd5\xf3\x2a\x80\xe2\x53\xd3\x8c\x4d\xdf\x23\xa0\x19\x9c\x1e\xd3\
+\x20\x30\x96\xc0\x56\xfc\x77\x1f\xe9\x1b\xbb\x4f\xae\xed\x24\x40\
+\xb9\xc6\x66\xdc\xca\x08\x20\xfe\xb3\x0a\xda\x9c\x01\xd0\x2a\xc0\
+\x6a\xb5\x72\xf1\x89\x80\x73\x15\xd3\x0c\x0e\x13\x70\x8e\x12\xaf\
+\x07\x02\x3a\x56\xb4\xe4\x1f\x1e\x7b\xbe\x45\xfc\x3d\x57\xa7\xb0\
+\xd8\xaa\x13\xff\x74\xfc\x9b\x33\x00\x42\xfb\xf4\xe9\xd3\x6f\xf7\
+\xb7\xae\x4f\x05\xf4\xf1\x6d\x7f\x30\x01\x5b\x0c\xfc\x3a\x43\x40\
+\x17\xfa\xe9\x58\x39\xb3\x99\x8b\x97\x25\xfe\x6a\x2e\x82\x21\x88\
+\xb2\x09\x20\xfe\x8b\xea\xd7\xa4\x01\x10\xb1\x67\xcf\x9e\xbd\xda\
+\xdf\x16\x63\x02\xf4\x06\xdf\xc7\xcb\x0f\x04\xf6\x08\x6c\x97\xfc\
+\xdf\x7c\xbb\xd3\x69\xa3\xbd\x17\x9c\x3e\x08\x57\x93\x3b\x0d\x8f\
+\xb0\x4a\x22\x50\xa9\xf8\xa7\x2c\x41\xb3\x06\x40\x90\x4b\xb8\x1e\
+\x40\x71\xaa\xe9\x0d\x1e\x13\x20\x12\xb4\x21\x01\x2d\xf9\xeb\xd8\
+\x18\x3e\xe7\xf5\xbe\xc4\x5f\x57\x93\x7b\x8d\x8f\xb8\x0a\x22\x80\
+\xf8\x47\x29\x56\xd3\x06\x40\xd7\xab\xcb\x19\xd1\x00\x00\x10\x00\
+\x49\x44\x41\x54\x03\xf4\x26\xa0\x98\x95\x00\xbd\xd1\x63\x02\xa2\
+\x1c\xf7\x55\x74\x52\xd2\xb1\x80\xf8\x57\x71\xc8\xf9\x48\xa2\x6a\
+\xf1\x4f\x8b\xb8\x69\x03\x20\xd4\x32\x01\x3a\x1d\xb0\x2a\xe4\xc2\
+\x40\x4c\x80\xaa\x46\x93\xf8\xeb\x58\x28\x81\x84\xce\xf7\x33\xf3\
+\x2f\xa1\x52\x05\xc4\x88\xf8\x47\x2d\x52\xf3\x06\x20\xd0\xd4\x85\
+\x81\x25\x99\x00\x5d\xf1\x1d\x62\xe7\xb6\x2d\x02\xa5\x89\xbf\x0c\
+\x40\x5b\x15\x22\x5b\x13\x02\x0d\x88\xbf\x09\xb7\x13\x9d\x62\x00\
+\x06\x70\x64\x02\xfa\xd5\x80\xde\x07\xac\xdc\x7f\x4c\x50\x57\x7c\
+\x63\x02\x06\xc5\x6b\xe4\x6e\x29\xe2\xaf\x25\x7f\x7d\xa3\x1c\xe2\
+\xdf\xc8\x81\x69\x9d\x26\xe2\x6f\x42\x18\x03\x70\x00\x6b\x29\x46\
+\x00\x13\x70\xa0\x78\x15\x3f\x25\xc3\xe7\x79\xd9\x3f\x88\xbe\x84\
+\x5f\x4b\xfe\xfa\x46\xb9\x8a\xcb\x41\x6a\xa9\x08\x34\x23\xfe\xa9\
+\x80\x5e\x8f\x83\x01\xb8\x66\x71\xeb\x5e\x30\x02\xba\x50\x70\xe5\
+\xf4\x1a\x01\x4c\xc0\xad\xb2\x55\xf9\x84\xc4\x5f\xb5\xf6\x96\x9c\
+\x44\x5f\x6d\x28\xfa\x08\xbf\xb7\x2a\x15\x1c\x0f\xe2\x6f\x5a\x3c\
+\x0c\xc0\x08\xbc\xba\x50\xf0\x80\x19\x70\xf3\x1d\x02\x12\x06\x7d\
+\x1e\x7c\x44\x2a\x6c\x52\x20\x01\x6f\xe2\x1f\x04\x3f\x88\x3e\xb3\
+\xfd\x02\x0f\xaa\x12\x42\x6e\x4c\xfc\x73\x94\x04\x03\x30\x91\xfa\
+\xc0\x0c\xbc\x1a\xae\x17\xf0\xb0\x3a\x20\x13\x30\x31\x15\x36\x2f\
+\x84\x80\x87\xda\x06\xd1\xd7\xff\x0e\x17\x04\x9f\x99\x7e\x21\x07\
+\x50\x89\x61\x22\xfe\x49\xaa\x86\x01\x58\x88\x59\x2b\x03\x6a\xc1\
+\x0c\x2c\xec\x6e\xf6\xee\x3a\x37\xac\x99\xe2\xec\x0e\xd8\xd1\x25\
+\x81\xdc\x35\xd5\x45\x7c\x43\xd1\x77\x09\x89\xa0\xea\x22\xd0\xa4\
+\xf8\xe7\x29\x21\x06\x20\x22\xf7\xdc\x46\x40\x33\x45\x4e\x05\x44\
+\x2c\x68\xe6\xae\x24\xfe\xaa\x69\x8e\x30\x82\xf0\xeb\x36\xc7\xf8\
+\x8c\xd9\x28\x01\xc4\x3f\x69\xe1\x31\x00\x06\xb8\x73\x1a\x01\x7d\
+\x35\xac\x41\x4a\x74\x99\x81\x40\x0e\xf1\x97\xe0\x6b\xc6\xaf\xdb\
+\x0c\x29\x33\x64\xcb\x04\x1a\x16\xff\x5c\x65\xc7\x00\x18\x92\x97\
+\x11\xd0\x27\x08\xfa\x21\x92\x5e\x30\xa8\xcf\x8a\xf7\x63\xf2\x53\
+\x30\x01\xcd\xfe\x53\x87\xaf\x8b\xfa\x10\xfe\xd4\xd4\x19\x6f\x4b\
+\x00\xf1\xdf\x62\x48\xfd\x0b\x03\x60\x4c\x5c\x17\x0d\x3e\x7b\xf6\
+\xec\xd5\x94\x17\x0a\xea\x7a\x00\x4e\x05\x18\x17\xd6\xb0\x7b\x89\
+\x7f\xca\xd9\xbf\x2e\xf0\xd3\xac\x9f\x8b\xfa\x0c\x8b\x4a\xd7\xc7\
+\x09\x34\x2f\xfe\xc7\xd1\x58\xbf\x82\x01\xb0\x26\xbc\xeb\x5f\xab\
+\x01\x29\x4d\x40\x4a\x01\xd9\xa5\xc8\x4d\x24\x02\x29\x6b\xa7\x19\
+\xbf\xae\xea\x8f\x14\x3a\xdd\x40\x60\x1a\x01\xc4\x7f\x1a\xaf\xc8\
+\x5b\x63\x00\x22\x03\x3d\xd5\x5d\x4a\x13\xc0\x2a\xc0\xa9\x4a\xf8\
+\x7d\x4d\xb3\xff\x54\xd1\x49\xfc\xd5\x52\x8d\xc7\x38\x10\xd8\x23\
+\x80\xf8\x6f\x71\xe4\xfc\x85\x01\x48\x4c\x5f\x26\x60\x77\x5d\x80\
+\xf9\xc8\x29\x67\x92\xe6\xc9\x34\x32\x40\xaa\x9a\x49\xf8\xd5\x1a\
+\xc1\x4a\x9a\xde\x08\x20\xfe\x2e\x2a\x82\x01\xc8\x50\x06\x5d\x17\
+\x90\xe2\x74\x00\xab\x00\x19\x8a\xbb\x60\xc8\x54\xb3\x7f\x2e\xf6\
+\x5b\x50\x24\x76\x5d\x4e\x00\xf1\x1f\x30\xcc\x7b\x17\x03\x90\x89\
+\xbf\x56\x02\x52\x98\x80\x54\x33\xca\x4c\x18\x19\x76\x22\x01\xcd\
+\xfa\xb9\xd8\x6f\x22\x34\x36\x8f\x47\x00\xf1\x8f\xc7\x32\x42\x4f\
+\x18\x80\x08\x10\xe7\x76\x91\xc2\x04\x68\x15\x60\x6e\x7c\xec\x97\
+\x8e\x80\x66\xff\xd6\x66\x4d\xe2\xaf\x96\x2e\x2b\x46\x82\xc0\x80\
+\x00\xe2\x3f\x80\x71\x79\x37\xf7\x6f\x0c\x40\xe6\x0a\xc8\x04\xf4\
+\x21\x98\x7e\x4f\x80\xc4\xa5\x1f\x83\x9f\x86\x09\x48\xf8\xd5\x1a\
+\x46\x40\xea\x39\x09\x20\xfe\x39\xe9\x1f\x1d\x1b\x03\x70\x14\x4d\
+\xba\x17\xf4\x3d\x01\x96\xa3\x59\xcf\x2c\x2d\x63\x6f\xa5\x6f\xeb\
+\x1a\x21\xfe\xad\x1c\x49\x0e\xf3\x44\xfc\x8f\x14\x25\xff\xd3\x18\
+\x80\xfc\x35\xd8\x46\x60\xfd\xc9\x00\xbe\x18\x68\x8b\xd9\xe5\x2f\
+\xeb\x15\x1a\xc4\xdf\x65\xd9\xdb\x08\x0a\xf1\x77\x5d\x67\x0c\x80\
+\x93\xf2\xe8\x93\x01\x7d\x28\x66\xa7\x02\xac\x67\x98\x7d\xec\xfc\
+\xcc\x24\x60\x59\x1b\x89\xbf\xda\xcc\xd0\xd8\x0d\x02\xf3\x09\x20\
+\xfe\x27\xd9\x79\x78\x11\x03\xe0\xa1\x0a\xbb\x18\x2c\x4f\x05\xe8\
+\x62\x40\x56\x01\x76\xa0\x1d\xdd\x30\xfb\x77\x54\x0c\x42\x89\x47\
+\x00\xf1\x8f\xc7\xd2\xb0\x27\x0c\x80\x21\xdc\x39\x5d\xa7\xf8\x68\
+\xe0\x9c\xb8\xd8\xa7\x3c\x02\xcc\xfc\xcb\xab\x59\x15\x11\x23\xfe\
+\x23\xca\xe8\x63\x13\x0c\x80\x8f\x3a\x5c\x45\xf1\xf9\xe7\x9f\x73\
+\x1a\xe0\x8a\x46\xfd\x77\xac\x97\xff\xeb\x27\x48\x86\xae\x08\x20\
+\xfe\xae\xca\x71\x2e\x18\x0c\xc0\x39\x42\x89\x5f\xb7\xbe\x16\x20\
+\x71\x3a\x0c\x77\x82\x80\xe5\x29\x19\x66\xff\x27\xc0\xf3\x92\x0d\
+\x01\xc4\x7f\x34\x57\x2f\x1b\x62\x00\xbc\x54\x62\x10\xc7\x66\xb3\
+\x79\x6f\xf0\x30\xda\x5d\xae\x03\x88\x86\x32\x4a\x47\xaa\x47\x94\
+\x8e\x0e\x74\x82\x01\x38\x00\x85\xa7\xec\x08\x20\xfe\x76\x6c\x0d\
+\x7b\xc6\x00\x18\xc2\x9d\xdb\x35\xab\x00\x73\xc9\xb1\x9f\x08\x20\
+\xfe\xa2\x40\x4b\x46\x00\xf1\x9f\x88\xda\xcf\xe6\x18\x00\x3f\xb5\
+\xd8\x8b\xc4\x6a\x15\xc0\xf2\x9c\xf3\x5e\x02\x3c\x38\x4b\x80\x5a\
+\x9c\x45\xc4\x06\xde\x09\x20\xfe\xde\x2b\x74\x32\x3e\x0c\xc0\x49\
+\x3c\xf9\x5e\xdc\xad\x02\xe4\x0b\x80\x91\x8b\x25\xc0\x0a\x40\xb1\
+\xa5\x2b\x2b\x70\xc4\x7f\x56\xbd\x3c\xed\x84\x01\xf0\x54\x8d\xdb\
+\xb1\x44\xff\x44\x80\xce\x3b\x5b\x5e\x7c\x76\x3b\x05\x9e\x39\x44\
+\xc0\xaa\x06\x88\xff\x21\xda\x3c\x17\x9d\x00\xe2\x1f\x1d\x69\x8e\
+\x0e\x31\x00\x39\xa8\x33\x66\xf3\x04\x64\xc4\x9a\x87\x00\x80\x32\
+\x09\x20\xfe\x0b\xea\xe6\x6b\x57\x0c\x80\xaf\x7a\xec\x45\x63\x75\
+\x1d\x00\xe2\xb3\x87\xb9\xaa\x07\x17\x2f\x7f\xa9\xaa\x7c\x48\xc6\
+\x19\x01\xc4\xdf\x59\x41\x96\x85\x83\x01\x58\xc6\xcf\x74\x6f\xab\
+\xeb\x00\x3e\xfd\xc9\xdf\x99\xc6\x4d\xe7\xe7\x09\x58\xd5\xe0\x95\
+\x97\x7f\xff\xfc\xe0\x6c\x01\x81\x39\x04\x10\xff\x39\xd4\xf6\xf6\
+\xf1\xf6\x00\x03\xe0\xad\x22\xb7\xe3\x89\x7e\x1d\xc0\xed\x21\x78\
+\xa6\x06\x02\x9c\xff\xaf\xa1\x8a\x4e\x73\x40\xfc\x9d\x16\x66\x59\
+\x58\x18\x80\x65\xfc\xd8\x1b\x02\xb3\x08\x70\x1a\x66\x16\x36\x76\
+\xca\x41\x00\xf1\x8f\x44\xdd\x5f\x37\x18\x00\x7f\x35\xd9\x8b\x68\
+\xb5\x5a\xfd\x78\xef\x09\x1e\x40\x00\x02\x10\x48\x45\x00\xf1\x4f\
+\x45\x3a\xcb\x38\x18\x80\x2c\xd8\xf3\x0e\xca\xec\x33\x2f\x7f\x46\
+\x87\x40\x11\x04\x10\xff\xa8\x65\xf2\xd8\x19\x06\xc0\x63\x55\x06\
+\x31\x59\xfe\xef\x80\x83\x61\xb8\x5b\x01\x01\x3e\x01\x50\x41\x11\
+\xbd\xa4\x80\xf8\x7b\xa9\x84\x69\x1c\x18\x00\x53\xbc\x74\x0e\x01\
+\x08\x40\xa0\x30\x02\x88\xbf\x41\xc1\x7c\x76\x89\x01\xf0\x59\x17\
+\xa2\xaa\x98\x80\xd5\xb7\x00\x56\x8c\x8c\xd4\x52\x11\x40\xfc\x53\
+\x91\x76\x31\x0e\x06\xc0\x45\x19\x08\x02\x02\x10\x80\x40\x66\x02\
+\x88\xbf\x59\x01\xbc\x76\x8c\x01\xf0\x5a\x99\x5d\x5c\x77\xee\xdc\
+\xb9\xbf\xbb\xcb\x4d\x25\x04\xee\xfd\xe1\xbd\x4a\x32\x21\x8d\x6a\
+\x08\x20\xfe\xd5\x94\x72\x4a\x22\x77\xa6\x6c\xcc\xb6\x75\x10\xb8\
+\xf7\x32\x02\x54\x47\x25\xc9\x02\x02\x11\x08\x20\xfe\x11\x20\x9e\
+\xea\xc2\xef\x6b\x18\x00\xbf\xb5\x21\x32\x08\x4c\x22\xf0\xe4\xe3\
+\x9f\x4d\xda\x9e\x8d\x21\xd0\x21\xfe\x4d\x1f\x04\x18\x00\xe7\xe5\
+\xdf\x6c\x36\x5f\x76\x1e\x22\xe1\xcd\x20\xc0\x2a\xcc\x0c\x68\xec\
+\x12\x97\x00\xe2\x1f\x97\xe7\x91\xde\x3c\x3f\x8d\x01\xf0\x5c\x1d\
+\xa3\xd8\xee\xfd\xe1\xbf\x31\xea\x99\x6e\x73\x12\xf8\xe8\xe3\x9f\
+\xe7\x1c\x9e\xb1\x4b\x22\x80\xf8\x97\x54\x2d\xb3\x58\x31\x00\x66\
+\x68\xa3\x75\xcc\x45\x80\xd1\x50\xd6\xdd\x11\xa7\x00\xea\xae\x6f\
+\xb4\xec\x10\xff\x68\x28\xcf\x77\xe4\x7b\x0b\x0c\x80\xe3\xfa\xbc\
+\xf0\xc2\x0b\x88\xbf\xe3\xfa\x78\x0c\x8d\x55\x00\x8f\x55\x71\x14\
+\x13\xe2\xef\xa8\x18\xf9\x43\xc1\x00\xe4\xaf\xc1\xd1\x08\xac\x3e\
+\x02\xc8\xf9\xe7\xa3\xc8\x93\xbd\xc0\x69\x98\x64\xa8\x19\x28\x10\
+\x40\xfc\x03\x89\x64\xb7\xde\x07\xc2\x00\x78\xaf\x10\xf1\x55\x49\
+\xc0\xca\x84\x3d\xf8\xb3\xc7\x55\xf2\x22\xa9\x85\x04\x10\xff\x85\
+\x00\xeb\xdc\x1d\x03\xe0\xb8\xae\x9b\xcd\xe6\x5d\x8b\xf0\xee\xf1\
+\x45\x34\x16\x58\x27\xf5\x69\x55\x03\xae\x03\x98\x54\x86\x36\x36\
+\x46\xfc\x33\xd5\xd9\xff\xb0\x18\x00\xa7\x35\xba\x7b\xf7\xee\xb7\
+\x2d\x42\xb3\x9a\x79\x5a\xc4\x5a\x7b\x9f\x56\xb5\xe0\x3a\x80\xda\
+\x8f\x9c\x09\xf9\x21\xfe\x13\x60\xb5\xb7\x29\x06\xa0\xb1\x9a\xdf\
+\xe3\x23\x80\xd5\x57\x9c\xd3\x00\xd5\x97\x78\x5c\x82\x88\xff\x38\
+\x4e\x46\x5b\x95\xd0\x2d\x06\xc0\x61\x95\x74\xf5\xbf\xd9\xf2\x3f\
+\x5f\x03\xec\xa6\xe2\xeb\x6f\xbe\x61\x12\x8b\x4e\x03\xb0\x0a\x60\
+\x82\xb6\x9c\x4e\x11\xff\x72\x6a\x95\x31\x52\x0c\x40\x46\xf8\xc7\
+\x86\xb6\xba\xfa\x5f\xe3\xdd\xe3\xfc\xbf\x30\x54\xdf\x58\x05\xa8\
+\xbe\xc4\xc7\x13\x44\xfc\x8f\xb3\x49\xf6\x4a\x19\x03\x61\x00\x1c\
+\xd6\x89\xd9\xbf\xc3\xa2\x18\x84\x24\x33\x66\x75\x1d\x80\x56\x01\
+\x0c\x42\xa6\x4b\xef\x04\x10\x7f\xef\x15\x72\x15\x1f\x06\xc0\x55\
+\x39\xba\xce\xea\xe2\x3f\xa5\x79\x8f\xf3\xff\xc2\xd0\x4c\x63\x15\
+\xa0\x99\x52\x5f\x26\x8a\xf8\x5f\x72\x70\xf0\xbb\x94\x10\x30\x00\
+\xce\x2a\x65\x35\xfb\x57\x9a\x56\xb3\x4d\xf5\x4d\x9b\x47\xc0\xea\
+\x3a\x00\x45\x83\x01\x10\x85\x46\x1a\xe2\xdf\x48\xa1\xe3\xa6\x89\
+\x01\x88\xcb\x73\x51\x6f\x96\xb3\x7f\x05\x76\x8f\xf3\xff\xc2\xe0\
+\xaa\x59\xd7\xe4\xf5\xf5\xfb\xae\xf2\x25\x18\x03\x02\x88\xbf\x01\
+\xd4\x25\x5d\x96\xb3\x2f\x06\xc0\x49\xad\x24\xfe\x96\xb3\x7f\xcb\
+\x99\xa6\x13\x84\xc5\x86\x61\xb9\x32\xa3\x6b\x01\x58\x09\x28\xf6\
+\xd0\x38\x1f\x38\xe2\x7f\x9e\x11\x5b\x1c\x25\x80\x01\x38\x8a\x26\
+\xdd\x0b\xd6\xe2\xaf\x4c\xd6\xdf\x5c\xeb\x86\xe6\x90\xc0\xda\xe8\
+\xe3\x80\x21\x55\x19\x00\x3e\x16\x18\x68\x54\x74\x8b\xf8\xbb\x2c\
+\x66\x49\x41\x61\x00\x1c\x54\xcb\x72\xe6\xaf\xf4\xac\x05\x46\x63\
+\xd0\xe6\x13\xd0\x69\x00\xcb\x55\x00\x45\x26\x13\xa0\x5b\x5a\x25\
+\x04\x10\xff\x4a\x0a\x99\x37\x0d\x0c\x40\x5e\xfe\xa6\x57\xfd\x87\
+\xd4\xd6\xcc\xfe\x03\x0a\xb7\xb7\x6b\xe3\x55\x00\x4e\x05\xb8\x2d\
+\xfd\xf4\xc0\x10\xff\xe9\xcc\x92\xed\x51\xd6\x40\x18\x80\x8c\xf5\
+\x4a\xb3\xf4\x6f\xf3\x6d\x73\x19\xb1\x55\x39\x74\xaa\x55\x00\x56\
+\x02\x0a\x3f\x7c\x10\xff\xc2\x0b\xe8\x2b\x7c\x0c\x40\xa6\x7a\xa4\
+\x10\x7f\xa5\xb6\x66\xf6\x2f\x0c\x45\xb4\xb5\xf1\x2a\x80\x20\xc8\
+\x00\xa8\xe9\x3e\xad\x30\x02\x88\xbf\xfb\x82\x95\x16\x20\x06\x20\
+\x43\xc5\xd2\x89\x3f\xb3\xff\x0c\xe5\x9d\x3d\x64\x8a\x55\x00\x05\
+\x27\x03\xa0\xa6\xfb\xb4\x42\x08\x20\xfe\x85\x14\xaa\xac\x30\x31\
+\x00\x89\xeb\x95\x4a\xfc\x95\xd6\x9a\xd9\xbf\x30\x14\xd5\xd6\x09\
+\x56\x01\x04\x44\x06\x40\x4d\xf7\x69\xce\x09\x20\xfe\xce\x0b\x14\
+\xc2\x2b\xef\x16\x03\x90\xb0\x66\x69\xc5\x9f\xd9\x7f\xc2\xd2\x46\
+\x1b\x2a\xd5\x2a\x80\x02\x96\x01\x50\xd3\x7d\x9a\x53\x02\x88\xbf\
+\xd3\xc2\xd4\x11\x16\x06\x20\x41\x1d\xf5\xdf\xfb\xbe\xf8\xe2\x8b\
+\x1f\x5a\x7f\xdc\x6f\x98\xca\x9a\xd9\xff\x10\x47\x51\xf7\xd7\x89\
+\x56\x01\x04\x45\x06\x40\xdf\x16\xc8\xf7\x04\x88\x86\xb3\x86\xf8\
+\x3b\x2b\xc8\xe9\x70\x4a\x7c\x15\x03\x60\x5c\x35\xcd\xfa\x57\xab\
+\xd5\x87\xfd\x30\xf7\xfb\x96\xe4\x27\xa5\x80\x24\x49\xa8\xb1\x41\
+\x52\xae\x02\x08\xad\x3e\x22\xf8\xda\xfa\x4f\x3b\x99\x01\x3d\xa6\
+\x39\x20\x80\xf8\x3b\x28\x42\xfd\x21\x60\x00\x8c\x6a\x9c\x63\xd6\
+\xaf\x54\x24\xfe\x6b\x66\xff\x42\x51\x74\x7b\xff\x7b\xdf\x49\x1e\
+\xbf\x0c\x80\x5a\xf2\x81\x19\x70\x9f\x00\xe2\xbf\xcf\xa3\x88\x47\
+\x65\x06\x89\x01\x88\x5c\xb7\x20\xfc\xa9\x67\xfd\x21\x0d\xc4\x3f\
+\x90\x28\xff\xf6\xfd\xef\xe7\x31\x01\x77\xff\xe5\x9b\xac\x06\xe4\
+\x3a\x7c\x10\xff\x5c\xe4\x9b\x1c\x17\x03\x10\xa9\xec\xb9\x85\x5f\
+\x69\xac\x13\x9e\x3b\xd6\x78\x34\x5b\x02\x3a\x15\x90\xab\xa6\x5a\
+\x09\x08\x46\x40\xf7\x6d\x33\xa5\xf7\x2d\x01\xc4\x7f\x8b\xa1\xc4\
+\x5f\xa5\xc6\x8c\x01\x58\x50\x39\x89\xbe\x9a\x2e\xf0\xcb\x35\xe3\
+\x0f\xe1\x4b\x28\xd6\x2c\xfd\x07\x1c\xd5\xdc\xaa\xa6\xd6\xff\x4f\
+\xc0\x29\x58\x12\xff\x61\x3b\xb5\x2d\xaf\x2d\x20\x80\xf8\x2f\x80\
+\xc7\xae\x73\x09\x60\x00\x26\x92\x0b\x82\x1f\x44\x3f\xb7\xf0\x2b\
+\x7c\x09\x84\x84\x42\xf7\x69\xf5\x11\x58\x3b\x58\xd9\x09\x26\x40\
+\xab\x02\x6a\xe1\x71\x7d\xb4\x33\x64\x84\xf8\x67\x80\x1e\x73\xc8\
+\x72\xfb\xc2\x00\x8c\xa8\xdd\x40\xf4\x37\x03\xc1\x4f\x76\x55\xff\
+\xb9\x10\x3d\x08\xc4\xb9\x18\x79\x7d\x3e\x81\x9c\xa7\x02\x8e\x45\
+\x1d\x0c\x00\x66\xe0\x18\xa1\x91\xcf\x23\xfe\x23\x41\xb1\x99\x05\
+\x01\x0c\xc0\x11\xaa\x12\x7d\xb5\x30\xd3\xef\x37\x73\x23\xf8\x7d\
+\x2c\x57\x3f\x12\x7f\x09\xc4\xd5\x13\xdc\xa9\x92\xc0\xba\x3f\xbd\
+\xb3\x76\xb0\x12\x70\x08\xee\x4d\x33\x70\x68\x1b\x9e\x3b\x40\x00\
+\xf1\x3f\x00\xa5\xbc\xa7\x4a\x8e\x18\x03\x70\xa3\x7a\x43\xd1\x1f\
+\xcc\xf6\x6f\x6c\xe5\xe3\xa1\x04\x61\xdd\x0b\x83\x8f\x68\x88\xc2\
+\x9a\x80\x6a\xbd\x76\x6a\x02\x42\xee\x32\x03\xac\x0a\x04\x1a\x27\
+\x6e\x11\xff\x13\x70\x78\x29\x15\x01\x0c\xc0\x80\x74\x8e\x2f\xed\
+\x19\x0c\x3f\xe9\xae\x84\x60\x8d\xf8\x4f\x62\x56\xc3\xc6\xaa\xf9\
+\xda\xb9\x09\x10\x67\x19\x81\xd0\xf4\x98\x36\x20\x80\xf8\x0f\x60\
+\x94\x7e\xb7\xec\xf8\x31\x00\xbb\xfa\x49\xfc\x53\x7e\x55\xef\x6e\
+\xd8\x59\x37\x12\x80\x35\xe2\x3f\x8b\x5d\x0d\x3b\xa9\xf6\xeb\x02\
+\x4c\x80\x58\x63\x02\x44\x61\xd0\x10\xff\x01\x0c\xee\xe6\x26\x80\
+\x01\xe8\x2b\xa0\xf3\xfc\x88\x7f\x0f\x82\x9f\x62\x08\xac\x7b\x03\
+\xa8\x4f\x7f\x94\x10\x30\x26\x60\x57\x25\xc4\x7f\x07\xa2\x9e\x9b\
+\xd2\x33\x69\xde\x00\x48\xfc\xfb\x22\xba\xbc\xc0\xaf\x8f\x6b\xef\
+\x67\xdd\xcf\xfa\xd6\xfd\x1b\xff\xde\x93\x3c\x68\x96\x80\xbe\x2e\
+\x18\x13\x50\x48\xf9\x11\xff\x42\x0a\xd5\x56\x98\xcd\x1a\x80\x70\
+\xb1\x5f\x5f\x6e\xc4\xbf\x87\xc0\x4f\x99\x04\x4a\x33\x01\xfa\x9f\
+\x07\xcb\x24\xbd\x20\x6a\xc4\x7f\x01\x3c\xcf\xbb\x96\x1f\x5b\xb3\
+\x06\xe0\xce\x9d\x3b\x12\x7e\x35\xf7\x55\x5c\x33\xf3\x77\x5f\xa3\
+\x9c\x01\xca\x04\xe8\x18\xc9\x19\xc3\xd8\xb1\xf5\x3f\x0f\x36\x65\
+\x02\x10\xff\xb1\x87\x06\xdb\x65\x20\x70\x27\xc3\x98\xd9\x87\x2c\
+\xe5\x82\x3f\x2d\xef\xea\x3f\x84\x59\xb3\xec\x9f\xfd\x98\xf1\x1e\
+\x80\x8e\x91\x75\x6f\x14\xbd\xc7\xa9\xf8\x64\x02\x3e\xfa\xf8\xe7\
+\xba\x5b\x77\x43\xfc\xab\xae\x6f\x0d\xc9\x35\x69\x00\x4a\xb8\xe0\
+\x6f\x2b\xfe\xdf\xfb\x4e\xc7\x97\xfc\xd4\xf0\x67\x96\x26\x87\x75\
+\x6f\x14\x65\x18\xd3\x8c\xb6\x6c\x14\x5d\x18\xb8\xac\x07\xe7\x7b\
+\x23\xfe\xce\x0b\x44\x78\x22\xd0\x9c\x01\xd0\xec\x5f\x89\x7b\x6e\
+\x7a\x13\xd7\xb2\xae\xe7\x18\x89\xcd\x27\x01\x19\xc6\xbf\xfa\xc5\
+\x5f\x77\x6b\xe7\xab\x01\x55\xaf\x02\x20\xfe\x3e\xff\x38\xa2\x46\
+\x55\x47\x67\xcd\x19\x00\xcf\xb3\xff\xed\xac\xff\xfb\xcc\xfa\xeb\
+\xf8\xd3\xca\x9b\xc5\xba\x5f\x0d\x58\x3b\x37\x01\x55\xae\x02\x38\
+\x14\xff\x8f\xfe\xc7\x6f\xba\xd0\x1e\xfc\xf9\x2f\xba\x61\x7b\xfd\
+\x8f\x7e\xda\xa9\x0d\x9f\x0b\xdb\xea\x36\xef\x51\xcc\xe8\xd6\x04\
+\x9a\x32\x00\x9e\x67\xff\x7a\xb3\xd6\xac\x5f\x33\x38\xeb\xa2\xd3\
+\x7f\x1b\x04\xd6\xbd\x09\xf0\xbc\x1a\xa0\x55\x80\xaa\x4c\x80\x13\
+\xf1\x97\x70\x4b\xd4\xd5\xee\x7e\xe9\xbf\x77\xaf\xfd\xa7\x9f\x5e\
+\xb5\x07\x7f\xfe\xbf\x7b\x03\x70\xdd\x9e\xfc\xcd\x6f\x3a\xb5\xe1\
+\xf3\xc3\xed\xb5\x7f\x68\xea\x4f\x46\x41\xfd\xb7\xf1\x17\x74\x3c\
+\xcb\x5a\x5e\x69\xca\x00\x78\x9c\xfd\x87\x59\xbf\xde\xac\x6b\x39\
+\xa8\xc8\xc3\x17\x01\x1d\x5b\x3a\xad\xb4\x76\xb8\x22\x50\x8d\x01\
+\xc8\x28\xfe\x12\x64\x89\xb3\x9a\xc4\x5a\x02\x2e\x51\x57\x8b\x79\
+\x24\xaa\x3f\x19\x05\xf5\xaf\x71\x34\x9e\x0c\x81\x5a\xcc\x71\xe8\
+\x2b\x1d\x81\x66\x0c\x80\x3e\xf7\x9f\x0e\xeb\xf9\x91\x82\xf0\x33\
+\xeb\x3f\xcf\x8a\x2d\x96\x13\xd0\xca\xd2\xda\xe9\x8a\x40\xf1\x9f\
+\x08\x48\x2c\xfe\xa9\x04\xff\xdc\x51\x17\x0c\x81\x4c\x81\x0c\x81\
+\x8c\x80\xda\xb9\xfd\xca\x7f\xbd\x9e\x0c\x9a\x31\x00\xbb\xcf\xfd\
+\x67\xaf\xdc\xba\x9f\x85\x69\x59\x16\xe1\xcf\x5e\x8a\x66\x03\x58\
+\x3b\x35\x02\x45\x16\x24\xa1\xf8\x07\xe1\xd7\x0c\x5c\xe2\xab\xe6\
+\x89\x99\x8c\x80\x5a\x30\x03\x9e\x62\x23\x96\xc3\x04\x9a\x31\x00\
+\x87\xd3\x4f\xf7\xec\x7a\x27\xfc\xeb\xfe\xcd\x37\xdd\xa8\x8c\x04\
+\x81\xe3\x04\x74\x2c\xca\x8c\xae\xfb\x63\xf3\xf8\x56\xf6\xaf\xe8\
+\x5a\x00\xfb\x51\x0c\x46\x48\x24\xfe\x37\x85\xdf\x20\x93\xe8\x5d\
+\xd6\x6c\x04\xa2\xc3\xca\xd8\x61\x33\x06\x60\xb3\xd9\x7c\x39\x35\
+\xe7\xb0\xcc\x7f\xf9\x26\xbb\x4e\x3d\x3c\xe3\x41\x60\x14\x81\x75\
+\x6f\x4a\x2f\x8f\xd1\x37\xb2\x7c\x7c\xb0\xc8\x53\x00\xc6\xe2\x2f\
+\xd1\xd7\x72\xba\x66\xd3\x61\xc6\x3f\xaa\x98\xce\x36\xc2\x08\x38\
+\x2b\xc8\x8d\x70\x9a\x31\x00\x7d\xde\xe6\x5f\xfb\x2b\xc1\x57\xd3\
+\x05\x57\x7a\x43\x65\x99\xbf\xa7\xce\x4f\x31\x04\x64\x04\xd4\x74\
+\xec\xae\xfb\x55\x01\xb5\x62\x82\x4f\x19\xa8\xa1\xf8\x4b\xf8\x75\
+\x71\x9d\x44\x5f\xe2\x99\x32\x2d\xcb\xb1\x94\x8b\xcc\x8c\x4c\x8d\
+\xe5\x38\xf6\x7d\xd7\x35\x42\x4b\x06\xc0\xa4\x72\x41\xf0\x25\xfa\
+\x12\x7c\x35\x5d\x70\x65\x32\x18\x9d\x42\x20\x11\x81\x75\xbf\x2a\
+\xa0\x26\x33\xa0\xb6\x36\x34\x04\x45\x9d\x02\x30\x14\x7f\x89\xa3\
+\x84\xdf\xdb\xb9\xfd\x98\x87\x1c\x46\x20\x26\xcd\xe5\x7d\x35\x61\
+\x00\xac\x3e\x01\xa0\x37\xc6\x20\xf8\x88\xfe\xf2\x83\x91\x1e\xfc\
+\x12\x58\xef\x0c\x81\x8c\xae\x45\x94\x45\x9c\x06\x30\x12\xff\x30\
+\xeb\x97\x38\x5a\xb0\xf5\xd8\xa7\x72\xd5\x4a\x87\x72\xf7\x18\xdf\
+\xb1\x98\x6a\x7b\xbe\x09\x03\x50\x5b\xd1\xc8\x07\x02\x10\x48\x4c\
+\xc0\x48\xfc\x5b\x98\xf5\x1f\xab\x94\x56\x3a\xb4\xe2\x21\x06\xc7\
+\xb6\xe1\x79\x5b\x02\x18\x00\x5b\xbe\xf4\x0e\x01\x08\x94\x4e\xc0\
+\x40\xfc\x35\xf3\xd5\x0c\x58\x33\xe1\xd2\xf1\x2c\x8d\x5f\x0c\xca\
+\x30\x01\x4b\x33\xf5\xb7\x3f\x06\xc0\x5f\x4d\x88\x08\x02\x10\xf0\
+\x42\xc0\x40\xfc\x25\x76\x9a\xf9\x6a\x06\xec\x25\xcd\xdc\x71\xc8\
+\x04\x70\x91\x60\xfa\x2a\x60\x00\xd2\x33\x67\x44\x08\x40\xa0\x04\
+\x02\x46\xe2\x2f\xb1\x2b\x21\xfd\x1c\x31\x8a\x8d\x0c\x52\x8e\xb1\
+\xcf\x8d\x59\xe3\xeb\x18\x80\x1a\xab\x4a\x4e\x10\x80\xc0\x32\x02\
+\x88\xff\x32\x7e\x0b\xf6\x96\x09\xd0\xe9\x91\x05\x5d\xb0\xeb\x48\
+\x02\x18\x80\x91\xa0\xd8\x0c\x02\x10\x68\x84\x00\xe2\x9f\xbd\xd0\
+\x3a\x3d\xe2\xcb\x04\x64\x47\x62\x12\x00\x06\xc0\x04\x2b\x9d\x42\
+\x00\x02\x45\x12\x40\xfc\xdd\x94\x0d\x13\x60\x5f\x0a\x0c\x80\x3d\
+\x63\x46\x80\x00\x04\x4a\x20\x60\x20\xfe\x9a\xc5\x6a\x49\xbb\x84\
+\xf4\x3d\xc6\xe8\xc5\x04\x78\x64\x13\x23\x26\x0c\x40\x0c\x8a\xf4\
+\x01\x01\x08\x94\x4d\xc0\x48\xfc\x25\x60\x65\x83\xc9\x1f\xbd\x18\
+\xca\x48\xe5\x8f\x9d\x80\x0f\xa1\x00\x00\x10\x00\x49\x44\x41\x54\
+\xa4\xbe\x08\x30\x00\xf5\xd5\x94\x8c\x20\x00\x81\x29\x04\x10\xff\
+\x29\xb4\xb2\x6c\x9b\xd7\x04\x64\x49\x39\xc9\xa0\x18\x80\x24\x98\
+\x19\x04\x02\x10\x70\x49\xc0\x40\xfc\xf5\x31\x36\x09\x96\xcb\x7c\
+\x0b\x0e\x4a\x4c\x59\x09\x88\x5b\x40\x0c\x40\x5c\x9e\xf4\x06\x01\
+\x08\x94\x42\xc0\x48\xfc\x4b\x38\xe7\xff\x85\x97\x2e\xba\x43\xcd\
+\x7b\xe9\x64\x02\x64\xb0\x52\xc6\x59\xf3\x58\x18\x80\x9a\xab\x4b\
+\x6e\x10\x80\xc0\x61\x02\x8d\x88\x7f\x10\xf9\x8b\x0f\x1e\x77\x5f\
+\xf9\xf8\xe9\x55\xbb\xf8\xe0\x51\x77\xa8\x0d\xb7\xf9\xbd\x3f\x7e\
+\xab\x53\x53\x1f\x87\x21\xe6\x79\x56\x06\x4b\x5f\xa5\x9c\x67\xf4\
+\xba\x46\xc5\x00\xd4\x55\x4f\xb2\x81\x00\x04\xce\x11\x30\x10\x7f\
+\x0d\x29\x61\xd2\x6d\xee\x26\xc1\xbe\xd8\x09\xfe\xc5\x4e\xe8\xbf\
+\xf0\xd2\x2b\x93\xc3\xfa\xdd\xde\x00\xa8\xa9\x0f\x19\x03\x99\x01\
+\xb5\xc9\x1d\x19\xec\xa0\xaf\x52\x4e\x63\x02\x0c\x82\x77\xd4\x25\
+\x06\xc0\x51\x31\x08\x05\x02\x10\x30\x26\x60\x24\xfe\xb9\xcf\x4d\
+\xdf\x14\xfd\x39\x82\x7f\x8e\xbc\xcc\x80\x5a\x30\x03\x1a\xf3\xdc\
+\x3e\x96\xaf\x7b\x31\x5c\x96\x39\x5a\xf7\x8d\x01\xb0\x26\x4c\xff\
+\x10\x80\x80\x0f\x02\x46\xe2\xaf\x73\xd2\x3a\x37\x9d\x23\x49\x89\
+\xf0\x45\x3f\xdb\xbf\xe8\x67\xfa\x16\xa2\x7f\x2c\x27\x19\x01\x8d\
+\xa9\x15\x01\xb5\x63\xdb\x59\x3e\x2f\xe6\x62\x6f\x39\x46\xed\x7d\
+\x63\x00\x6a\xaf\x30\xf9\x41\x00\x02\x5d\x67\x24\xfe\x5a\x86\xce\
+\x31\x13\xcd\x25\xfc\x37\x0f\x25\x19\x01\xb5\xb0\x2a\x70\xf3\x75\
+\xeb\xc7\x62\xaf\x1a\x58\x8f\x53\x6b\xff\x18\x80\x5a\x2b\x4b\x5e\
+\x10\x80\xc0\x25\x01\x23\xf1\x57\xe7\x12\x20\xdd\xa6\x6c\x9a\x71\
+\x6b\xf6\x9d\x72\xc6\x3f\x26\x3f\x19\x01\xc5\x36\x66\xdb\x98\xdb\
+\xd8\xd5\x20\x66\x94\x3e\xfb\xc2\x00\xf8\xac\x0b\x51\x41\x00\x02\
+\x31\x08\x98\x8a\xff\x2f\x3a\x2d\x43\xc7\x08\x73\x6c\x1f\x17\xfd\
+\x72\xbf\x84\x76\xec\xf6\xa9\xb7\x53\x6c\x8a\x51\x2b\x14\xa9\xc6\
+\x56\x0d\x38\x15\x30\x8f\x36\x06\x60\x1e\x37\xf6\x82\x00\x04\xbc\
+\x13\x30\x14\x7f\xa5\x9e\x72\xe6\x29\x41\xd5\x32\xbb\xb7\x59\xbf\
+\x38\xdc\x6c\x8a\xf1\xe2\x83\x47\xdb\x8f\x10\xde\x7c\xcd\xea\xb1\
+\x6a\x11\xfb\x54\x80\x55\xac\x9e\xfa\xc5\x00\x78\xaa\x06\xb1\x40\
+\x00\x02\x71\x08\x98\x8b\xff\x2f\xe2\xc4\x39\xa2\x17\x2d\xab\x4b\
+\x50\x47\x6c\xea\x6a\x13\xad\x06\x28\xf6\x54\x41\xc9\x04\xa4\x1a\
+\xab\x96\x71\x30\x00\xb5\x54\x92\x3c\x20\x00\x81\x4b\x02\xc6\xe2\
+\xaf\x41\x52\x89\x8d\x04\x54\x42\xaa\x31\x4b\x6c\x8a\xfd\xa2\x3f\
+\x6d\x91\x22\x76\x9d\x0a\x88\xb7\x0a\x90\x22\xe2\xfc\x63\x60\x00\
+\xf2\xd7\x80\x08\x20\x00\x81\x58\x04\x92\x88\x7f\x9a\xd9\x7f\xe9\
+\xe2\x1f\x4a\x7a\x79\x4a\xe0\x71\x78\x68\x7a\x2b\x13\x60\x3a\x40\
+\x65\x9d\x63\x00\x2a\x2b\x28\xe9\x40\xa0\x59\x02\x09\xc4\x5f\x6c\
+\x53\xcc\xfe\x6b\x11\x7f\xf1\x52\x93\x09\x50\x4e\xba\x6f\xd9\x62\
+\xd5\xc6\x32\x46\x4f\x7d\x63\x00\x3c\x55\x83\x58\x20\x00\x81\x79\
+\x04\x92\x89\xbf\xfd\xec\x5f\x42\xa9\xa5\xf3\x79\x20\xfc\xee\xa5\
+\x9c\x94\x9b\x75\x84\x7c\x22\x60\x3c\x61\x0c\xc0\x78\x56\x6c\x09\
+\x01\x08\x78\x24\x90\x48\xfc\x95\xba\xf5\x0c\x53\x02\x29\xa1\xd4\
+\x58\x35\x36\xe5\xa6\x1c\x2d\x73\x5b\x5e\x23\xcb\xe8\x7c\xf5\x8d\
+\x01\xf0\x55\x0f\xa2\x81\x00\x04\xa6\x10\x48\x2a\xfe\xf6\xb3\x7f\
+\x09\xe4\x94\xf4\x4b\xdc\x56\x39\xea\x63\x8d\x96\xb1\x73\x31\xe0\
+\x38\xba\x18\x80\x71\x9c\xd8\x0a\x02\x10\xf0\x46\x20\xa1\xf8\xa7\
+\x48\xdd\x7a\x66\x9c\x22\x87\xb1\x63\x58\xe7\xba\x64\x15\x60\x6c\
+\x0e\x35\x6c\x87\x01\xa8\xa1\x8a\xe4\x00\x81\xd6\x08\x64\x10\x7f\
+\x4b\x51\x91\x20\x6a\x66\xdc\x4a\x19\xad\x2f\x0a\xd4\xa7\x01\x58\
+\x05\x38\x7f\x34\x61\x00\xce\x33\x62\x0b\x08\x40\xc0\x13\x81\x0c\
+\xe2\x6f\x2d\x26\x2d\x89\x7f\x38\x94\x94\xb3\xe5\xa9\x80\x79\x86\
+\x2d\x44\xd7\xc6\x2d\x06\xa0\x8d\x3a\x93\x25\x04\xea\x20\x90\x41\
+\xfc\x05\x4e\x33\x4a\xdd\x5a\x34\xcd\xfe\x2d\xfa\x2d\xa1\xcf\x96\
+\x73\xf7\x50\x1f\x0c\x80\x87\x2a\x10\x03\x04\x20\x70\x9e\x40\x26\
+\xf1\x57\x60\x96\xb3\x49\xcd\x84\x35\x46\x8b\x4d\xa7\x02\xac\x56\
+\x01\xe6\x98\xb6\xd6\x6a\x80\x01\x68\xad\xe2\xe4\x0b\x81\x12\x09\
+\x64\x14\x7f\x4b\x5c\xcc\x80\x3b\xd3\xff\x34\xc8\xfa\xd4\x8d\xe5\
+\xb1\x91\xa2\x6f\x0c\x40\x0a\xca\x8c\x01\x01\x08\xcc\x27\x90\x59\
+\xfc\x2d\xbf\x58\xa6\xe5\xd9\x7f\x38\x20\x2c\x57\x01\xa6\xad\xdc\
+\x84\x88\xda\xb9\xc5\x00\xb4\x53\x6b\x32\x85\x40\x79\x04\x32\x8b\
+\xbf\x25\x30\x66\xff\xd7\x74\xad\x58\x70\x1a\xe0\x9a\xf1\xa1\x7b\
+\x18\x80\x43\x54\x78\x0e\x02\x10\xc8\x4f\xc0\x89\xf8\x5b\xcd\x22\
+\x99\xfd\x5f\x1f\x62\x5a\x05\xb8\x7e\x14\xf7\xde\xd8\xd3\x00\x71\
+\x47\x2d\xa3\x37\x0c\x40\x19\x75\x22\x4a\x08\xb4\x45\xc0\x8d\xf8\
+\xdb\x7c\xfb\x9f\xd5\x85\x6f\x25\x1f\x24\x56\x4c\xac\x0c\x5c\xc9\
+\xac\x43\xec\x18\x80\x40\x62\xc6\xed\x3b\x6f\xbe\xdd\x79\x6b\x0f\
+\xbf\xfb\xb0\x0b\xed\xd3\x9f\x7c\xda\xa9\xcd\x48\x8d\x5d\x32\x10\
+\x50\xad\xd4\x42\xfd\xbc\x1d\x5b\x8a\xe7\xe1\x77\xbf\x6f\x42\xe6\
+\xc1\x9f\x3d\xee\x5e\x5f\xbf\x7f\xdd\xfe\xe3\x7f\xeb\x5e\xff\xa3\
+\x9f\x66\x6f\x56\xe2\xf1\x5b\x2f\xbd\x62\xc2\xb1\xe4\x4e\x2d\x4f\
+\x03\x9c\x3f\x96\xf2\x1c\x6b\xb9\xeb\x85\x01\x58\x50\x81\x4f\x3f\
+\xee\x05\xd6\x59\xd3\x1b\x74\x68\xef\xbc\xd1\x1b\x94\xbe\x7d\xed\
+\x8b\x5f\xed\xd4\x24\x2c\x0b\xd2\x65\xd7\xc8\x04\x24\xf6\x12\x55\
+\x35\xd5\x27\xd4\x2b\xd4\xcf\xe3\xf1\xa5\x98\x22\x63\xd8\x76\xf7\
+\xe4\xe3\x9f\x75\x7b\xed\x6f\x7e\xd3\xe9\xfc\x6d\xee\xb6\x0d\xce\
+\xe0\x97\xd5\x6c\xd7\x20\xd4\x64\x5d\x5a\x9e\x06\xc8\x7d\x1c\x1d\
+\x1b\x3f\x19\xdc\x23\x03\x61\x00\x8e\x80\xa9\xf1\x69\x09\x8b\x84\
+\x46\x46\x40\xad\xc6\x1c\x4b\xc8\xe9\x4a\xf8\x7b\x73\x26\x41\x55\
+\x2b\x21\x6e\x62\x8c\x47\xc0\x52\xec\xe2\x45\x99\xbe\xa7\x5c\xc6\
+\x28\x7d\xa6\x3e\x46\xc4\x00\xf8\xa8\x43\xd2\x28\x64\x04\x2e\xdb\
+\x43\x4e\x11\x24\x24\x7f\x53\xf8\x13\x0e\xcd\x50\x8e\x08\x58\x2d\
+\x75\x3b\x4a\x71\x76\x28\xb0\x99\x8d\x6e\xd6\x8e\x18\x80\x59\xd8\
+\xea\xd8\x49\x26\x40\xcb\xce\xac\x06\xd8\xd7\x53\x8c\xc5\x9a\xd9\
+\xbe\x3d\x6b\x46\x80\xc0\x34\x02\xed\x6e\x8d\x01\x68\xb7\xf6\x57\
+\x99\x6f\x8d\xc0\x9b\x6f\x5f\x3d\xe6\x4e\x5c\x02\x3a\xc7\x2f\xc6\
+\x71\x7b\xa5\xb7\x52\x09\xf0\xf1\xbf\xe3\x95\xd3\xa9\x11\x4e\x03\
+\x1c\xe7\x13\xfb\x15\x0c\x40\x6c\xa2\x85\xf6\xa7\x99\xa9\x84\xaa\
+\xd0\xf0\x5d\x86\xad\x25\x7f\x5d\x73\x21\xb6\x2e\x03\x24\xa8\xe4\
+\x04\x58\xe2\x3e\x8f\x3c\x35\xa3\xf3\x11\xd5\xbb\x05\x06\xa0\xde\
+\xda\x4e\xce\x4c\x42\x85\x09\x98\x8c\xed\xe8\x0e\x5a\xf2\x3f\xfa\
+\x22\x2f\x40\x00\x02\x10\xc8\x4c\x00\x03\x90\xb9\x00\xde\x86\xc7\
+\x04\xc4\xa9\x08\x46\x2a\x0e\xc7\xda\x7a\x61\xf9\xff\x7c\x45\xd3\
+\x9e\x06\x38\x1f\x4f\xcd\x5b\x60\x00\x6a\xae\xee\xcc\xdc\x64\x02\
+\x74\xd1\xda\xcc\xdd\x9b\xdf\x4d\xec\xc4\xb0\x79\x10\x00\xd8\x23\
+\xc0\xd2\xf6\x1e\x8e\x93\x0f\x60\x75\x12\x4f\xb4\x17\x31\x00\xd1\
+\x50\xd6\xd5\x91\x2e\x5a\xd3\x39\xec\xba\xb2\xb2\xcf\x46\xe2\x2f\
+\x76\xf6\x23\x31\x42\x69\x04\x98\xfd\x8f\xaf\x58\xaa\x55\x80\xf1\
+\x11\xd5\xb9\x25\x06\xa0\xce\xba\x46\xc9\x0a\x21\x9b\x8e\x11\x66\
+\xd3\x99\xb5\xb0\x07\x33\xda\xe9\x55\x86\xd9\x74\x66\x53\xf7\xc0\
+\x00\x4c\x25\xd6\xd0\xf6\x5a\xc6\x66\x15\x60\x7c\xc1\x35\xfb\x1f\
+\xbf\x35\x5b\xb6\x42\x40\x42\xc6\xec\x7f\x7a\xb5\xb5\x0a\x20\x76\
+\xd3\xf7\x1c\xbb\x07\xdb\x61\x00\x38\x06\x4e\x12\x60\x46\x7b\x12\
+\xcf\xde\x8b\xb0\xda\xc3\xc1\x83\x9e\x80\x3e\xd3\x8e\xf8\xf7\x20\
+\x66\xfe\x88\x9d\x18\xce\xdc\x9d\xdd\xce\x10\xc0\x00\x9c\x01\xd4\
+\xfa\xcb\xac\x02\x8c\x3b\x02\x98\xfd\x8f\xe3\xd4\xda\x56\xcc\x60\
+\x97\x57\xfc\xe2\x83\x47\x9d\x85\x09\x58\x1e\x59\xf9\x3d\x60\x00\
+\xca\xaf\xa1\x79\x06\x32\x01\xe6\x83\x30\x00\x04\x2a\x23\x70\xf1\
+\xc1\xe3\x5e\xb8\x5e\xa9\x2c\xab\x3c\xe9\x5c\x60\x02\x4c\xc0\x63\
+\x00\x4c\xb0\xd6\xd5\xe9\xa7\x3f\xf9\xbb\xba\x12\x32\xc8\x86\xe5\
+\x7f\x03\xa8\x85\x76\xa9\xd9\xea\x05\xe2\x1f\xbd\x7a\x17\x51\x4d\
+\x40\xf4\xf0\x8a\xec\x10\x03\x50\x64\xd9\xd2\x06\xad\x15\x00\x2e\
+\x06\x3c\xce\x9c\xe5\xff\xe3\x6c\x5a\x7b\x45\x4b\xfe\x97\x42\xc5\
+\xcc\xdf\xa2\xf6\x62\x2b\xc6\x16\x7d\xb7\xd8\x27\x06\xa0\xc5\xaa\
+\xcf\xc8\x59\x26\x60\xc6\x6e\xec\x02\x81\x26\x08\x84\x59\xbf\x2e\
+\x5a\x6b\x22\xe1\x8c\x49\x8a\xf1\x45\xbf\xc2\xb2\xc4\x08\x64\x0c\
+\xdf\xd5\xd0\x18\x00\x57\xe5\xf0\x1b\x0c\xa7\x01\x8e\xd7\x86\xe5\
+\xff\xe3\x6c\x6a\x7f\x25\x08\xff\xc5\x76\x79\x9a\x59\x7f\xaa\x7a\
+\xeb\x23\x82\x32\x02\x32\x01\x6a\xa9\xc6\xad\x6d\x1c\x0c\x40\x6d\
+\x15\x35\xca\x87\x15\x80\xc3\x60\x39\x35\x72\x98\x4b\xed\xcf\x22\
+\xfc\x3e\x2a\x2c\x13\xa0\xf6\x95\x8f\x9f\x76\xe3\x8d\x80\x8f\xd8\
+\x3d\x44\x81\x01\x58\x50\x85\x8b\x2f\xfd\xeb\xce\x63\x5b\x90\xd2\
+\xc9\x5d\x11\xbb\xdb\x78\x2c\x8d\x91\xc7\x63\x4b\x31\xdd\xa6\xb0\
+\xfc\x19\x09\xaa\xc7\x26\x51\x51\xbb\xe8\x97\x9c\xd5\x24\x34\x6a\
+\x17\xcc\xf8\x97\x17\x3d\x72\x0f\xc1\x08\x5c\xd6\xe7\x71\x77\xd1\
+\xd7\x4c\xb5\x0b\xcd\xe3\xf1\x15\x19\xc1\xe4\xee\x30\x00\x93\x91\
+\x5d\xef\xf0\xe8\x9d\xf7\x3a\x8f\xed\xf1\xb7\xde\xbb\x0e\x32\xe2\
+\x3d\x96\xba\x6f\xc3\xb4\x3a\x35\xf2\xd6\x6b\x5f\x77\x79\x6c\x29\
+\xae\xce\xe0\x9f\xde\xa4\x2f\x7a\x51\xf5\xd6\x24\x2a\x6a\x5a\x72\
+\x56\x33\x48\x9d\x2e\x0d\x08\xa8\x56\x6a\xaa\x5d\x68\xe1\xd8\xf2\
+\x74\x6b\x90\xfa\xa4\x2e\x31\x00\x93\x70\xb5\xbd\xb1\xe5\x6c\xb7\
+\x54\xb2\x56\x4c\xac\x84\xb6\x54\xce\xc4\x0d\x01\x08\xc4\x27\x80\
+\x01\x88\xcf\x34\x7b\x8f\xaf\xfc\xfe\xe5\xa9\x09\x8b\x40\x38\x0d\
+\x70\x4d\xd5\xea\xe3\x7f\x56\xcb\xec\xd7\x91\x73\x0f\x02\xad\x12\
+\x20\xef\x21\x01\x0c\xc0\x90\x06\xf7\xcf\x12\xe0\x34\xc0\x35\x22\
+\x2b\x16\x32\x70\xd7\xa3\x38\xbb\xf7\x7f\xff\x9f\xb3\x80\x08\x07\
+\x02\x10\x98\x4b\x00\x03\x30\x97\x9c\xf3\xfd\xac\x96\x90\xb5\xe4\
+\xcd\x2a\x40\xd7\x59\xcd\xfe\x75\x58\xb9\x5d\x01\xf8\xa7\x5f\x77\
+\xdd\x2f\x7f\xa5\x10\x69\x10\x28\x92\x00\x41\xef\x13\xc0\x00\xec\
+\xf3\xa8\xe6\x91\xe5\x2c\xd2\x6a\xe6\x5b\x12\x7c\x4b\x06\x96\xb5\
+\x9b\xcd\x18\xf1\x9f\x8d\x8e\x1d\x21\xe0\x95\x00\x06\xc0\x6b\x65\
+\x22\xc4\x65\x35\x93\x6c\x7d\x15\xc0\x72\xf6\x6f\xb5\x72\xb3\xe8\
+\x70\x42\xfc\x17\xe1\x63\x67\x2f\x04\x88\xe3\x26\x01\x0c\xc0\x4d\
+\x22\x15\x3d\xb6\x9c\x49\x5a\xce\x80\xbd\x97\xa0\xa9\xdc\x11\x7f\
+\xef\x87\x23\xf1\x41\x60\x36\x01\x0c\xc0\x6c\x74\xfe\x77\xb4\x5a\
+\x01\x50\xe6\x5a\x05\xb0\x9c\x09\x6b\x0c\x8f\xcd\x3a\x67\x57\x2b\
+\x00\x88\xbf\xc7\x43\x90\x98\x66\x12\x60\xb7\xdb\x04\x30\x00\xb7\
+\x99\x54\xf3\x8c\x56\x00\x2c\x4d\x80\x66\xc2\x2d\x5d\x10\x28\xf1\
+\x57\xce\x56\x07\x08\xe2\x6f\x45\x96\x7e\x21\x00\x81\x43\x04\x30\
+\x00\x87\xa8\x54\xf4\x9c\xb5\xa8\x58\x0a\xa2\xb7\x32\x34\x93\x2b\
+\x33\x7f\x6f\x87\x1e\xf1\x2c\x26\x40\x07\x87\x08\x60\x00\x0e\x51\
+\xa9\xe8\x39\xeb\x55\x80\x56\x4e\x05\x68\xf6\x6f\x7d\x58\x58\x9b\
+\xb5\x51\xf1\x23\xfe\xa3\x30\xb1\x11\x04\x6a\x20\x80\x01\xa8\xa1\
+\x8a\x67\x72\x90\x09\x38\xb3\xc9\xa2\x97\x35\x33\x4e\x21\x90\x8b\
+\x82\x5c\xb0\xb3\x72\x53\x8e\x0b\xba\x38\xbb\x2b\xe2\x7f\x16\x11\
+\x1b\x40\x60\x36\x01\x76\x3c\x4c\x00\x03\x70\x98\x4b\x55\xcf\xa6\
+\x10\x17\x09\xa4\x84\xb2\x2a\x70\x7d\x32\xca\x49\xb9\xf5\x77\x4d\
+\x7f\x52\xd4\xe8\x64\x02\xcc\xfc\x4f\xe2\xe1\x45\x08\xd4\x48\x00\
+\x03\x50\x63\x55\x0f\xe4\x94\x42\x60\x24\x94\x12\xcc\x03\xc3\x17\
+\xf9\x94\x72\x51\x4e\xd6\xc1\xa7\xa8\xcd\xc9\x1c\x10\xff\x93\x78\
+\x78\xb1\x74\x02\xc4\x7f\x8c\x00\x06\xe0\x18\x99\xca\x9e\x4f\x25\
+\x32\x12\x4c\x09\x67\xe9\xf8\x94\x83\x72\x49\x91\x47\xaa\xda\x1c\
+\xcc\x05\xf1\x3f\x88\x85\x27\x21\xd0\x02\x01\x0c\x40\x0b\x55\xde\
+\xe5\x68\xf9\x91\xc0\xdd\x10\xdb\x1b\x09\xa7\x04\x74\xfb\xa0\xc0\
+\x5f\x8a\x5d\x39\xa4\x08\x1d\xf1\x4f\x41\x99\x31\x5a\x26\x40\xee\
+\xc7\x09\x60\x00\x8e\xb3\xa9\xee\x95\x94\x62\x23\x01\x95\x90\x96\
+\x06\xf1\x9d\x37\xdf\xee\x14\x7b\xaa\xb8\x53\xd6\x64\x2f\x27\x66\
+\xfe\x7b\x38\x78\x00\x81\x16\x09\x60\x00\x1a\xaa\xba\x3e\x0d\x90\
+\x52\x70\x24\xa4\x12\xd4\x12\xbe\x2c\x48\x31\x6e\x63\xfd\xf8\xd3\
+\x64\x47\x44\xca\x5a\xec\x25\x85\xf8\xef\xe1\xe0\x41\xcd\x04\xc8\
+\xed\x14\x01\x0c\xc0\x29\x3a\x15\xbe\x26\xd1\x49\x75\x2a\x40\xf8\
+\xf4\x3d\x01\xef\xbc\xa1\x59\xf5\x43\x3d\x74\xd9\xb4\x52\xa1\x18\
+\x15\x6b\xca\x00\x55\x8b\x94\xe3\x6d\xc7\x42\xfc\xb7\x18\xf8\x05\
+\x01\x08\x74\x1d\x06\xa0\xc1\xa3\x20\x87\xf0\x68\x35\x40\x42\xeb\
+\x09\x77\x98\xf5\x2b\xb6\xd4\x71\xe5\xa8\x41\x87\xf8\xa7\x2e\x33\
+\xe3\x65\x26\xc0\xf0\xa7\x09\x60\x00\x4e\xf3\xa9\xf2\xd5\xd4\xa7\
+\x02\x02\x44\x09\xed\xd7\xbe\xf8\xd5\xfe\x1c\xfb\xc3\x6d\x0b\xcf\
+\xa7\xbe\x0d\xc2\x9f\x63\xd6\xaf\x5c\x25\xfe\x6a\xba\x9f\xac\x21\
+\xfe\xc9\x50\x33\x10\x04\x4a\x21\x80\x01\x28\xa5\x52\x91\xe3\x94\
+\x00\xa5\x3c\x15\x30\x0c\x5f\x46\x40\x4d\xe7\xdc\x53\xae\x0a\xe4\
+\x16\x7e\x31\x10\x73\xb1\xd7\xfd\x64\x0d\xf1\x4f\x86\x9a\x81\x3c\
+\x11\x20\x96\x73\x04\x30\x00\xe7\x08\x55\xfc\xfa\xa3\x77\xde\xcb\
+\x9a\x9d\xce\xb9\xcb\x08\x58\xae\x0a\x04\xd1\xd7\x18\xb9\x66\xfc\
+\x43\xc8\x88\xff\x90\x06\xf7\x21\x00\x81\x9c\x04\x30\x00\x39\xe9\
+\x3b\x18\xfb\xf1\xb7\xf2\x9a\x80\x80\x40\x46\x40\x6d\x2b\xd4\xdb\
+\x8f\xe2\xcd\x3b\x4d\x10\x04\x5f\xab\x0b\xdb\xbe\xde\x78\xbb\x93\
+\xd1\x08\xe3\xe4\xbc\x95\xf8\xeb\xf4\x4b\xb2\x18\x98\xf9\x27\x43\
+\xcd\x40\xfe\x08\x10\xd1\x79\x02\x18\x80\xf3\x8c\xaa\xde\x42\x82\
+\x24\x61\xf2\x94\xa4\x04\x5b\x66\x40\x4d\x22\x1e\x9a\x44\xfd\x50\
+\x0b\xaf\xeb\x36\xcc\xf2\xd5\x87\xa7\x9c\xc4\x58\x2d\x59\x4c\x88\
+\x7f\x32\xd4\x0c\x04\x81\x52\x09\x60\x00\x4a\xad\x5c\xc4\xb8\x25\
+\x4c\x6a\x11\xbb\x34\xe9\x4a\xa2\x7e\xa8\x99\x0c\x16\xb1\x53\xb1\
+\x55\x8b\xd8\xe5\xe9\xae\x10\xff\xd3\x7c\x78\xb5\x01\x02\xa4\x38\
+\x86\x00\x06\x60\x0c\xa5\x06\xb6\x91\x40\xe9\x02\xb5\x06\x52\x4d\
+\x9a\xa2\x98\x8a\x6d\xb2\x41\x11\xff\x64\xa8\x19\x08\x02\xa5\x13\
+\xc0\x00\x94\x5e\xc1\x88\xf1\xeb\xa2\x40\x09\x56\xc4\x2e\x9b\xee\
+\x4a\x2c\xc5\x34\x19\x04\xc4\x3f\x19\x6a\x06\xf2\x4d\x80\xe8\xc6\
+\x11\xc0\x00\x8c\xe3\xd4\xcc\x56\x12\x2c\x09\x57\x33\x09\x1b\x25\
+\x2a\x86\x62\x69\xd4\xfd\xed\x6e\x11\xff\xdb\x4c\x78\x06\x02\x10\
+\x38\x49\x00\x03\x70\x12\x4f\x9b\x2f\x4a\xb8\x24\x60\x6d\x66\xbf\
+\x3c\x6b\x2d\xf9\x8b\xe1\xf2\x9e\x46\xf6\x80\xf8\x8f\x04\xc5\x66\
+\x6d\x10\x20\xcb\xb1\x04\x30\x00\x63\x49\x35\xb6\x9d\x04\x0c\x13\
+\x30\xbd\xe8\x12\x7f\xb5\xe9\x7b\xce\xdc\x03\xf1\x9f\x09\x8e\xdd\
+\x20\x00\x01\x0c\x00\xc7\xc0\x51\x02\x32\x01\x49\xc5\xec\x68\x24\
+\x65\xbc\x20\x56\x6a\xc9\xa2\x45\xfc\x93\xa1\x66\xa0\x72\x08\x10\
+\xe9\x78\x02\x18\x80\xf1\xac\x9a\xdc\x52\x82\xa6\xd6\x64\xf2\x13\
+\x92\x16\x23\xb5\x09\xbb\x2c\xdb\x14\xf1\x5f\xc6\x8f\xbd\x21\x00\
+\x01\xfe\x37\x40\x8e\x81\xf3\x04\x24\x6c\x6a\xe7\xb7\x6c\x73\x0b\
+\xb1\x51\x4b\x96\x3d\xe2\x9f\x0c\x35\x03\x95\x46\x80\x78\xa7\x10\
+\x60\x05\x60\x0a\xad\x86\xb7\x95\xc0\x3d\xfd\xde\xa3\x4e\xb7\x0d\
+\x63\xd8\x4b\x5d\xd7\x48\xe8\xab\x94\x93\x32\x41\xfc\xf7\x6a\xc0\
+\x03\x08\x40\x60\x3e\x01\x0c\xc0\x7c\x76\x4d\xee\x29\xb1\x53\x6b\
+\x32\xf9\x41\xd2\x62\xa0\x6b\x24\xf4\x55\xca\x83\xa7\x6d\xef\x22\
+\xfe\xb6\x7c\xe9\xbd\x78\x02\x24\x30\x8d\x40\x13\x06\xe0\xce\x9d\
+\x3b\xf7\xa7\x61\x61\xeb\x53\x04\x24\x7e\x9a\xf9\x6a\x06\x7c\x6a\
+\xbb\x1a\x5f\x53\xce\xca\x5d\x0c\x92\xe6\xe7\x44\xfc\x5f\xb9\xfb\
+\x3b\x49\xd3\x66\x30\x08\x40\xc0\x8e\xc0\x1d\xbb\xae\xf3\xf6\xfc\
+\xc2\x0b\x2f\xdc\x57\x7b\xf1\xc5\x17\x3f\xdc\x6c\x36\xef\xc6\x8e\
+\x46\x42\x10\xbb\xcf\x92\xfa\xd3\xcc\x57\x33\xe0\xe4\x42\x98\x11\
+\x92\x72\x55\xce\xca\x3d\x69\x18\x4e\xc4\xdf\x32\xe7\x27\xdf\x78\
+\xad\xfb\xc7\xbf\x7c\xb0\x6d\xcf\x3f\xf9\xc8\x72\x28\xfa\xae\x96\
+\x00\x89\x4d\x25\x50\x95\x01\x08\x82\x2f\xd1\x5f\xad\x56\x1f\xaa\
+\xf5\x40\x4c\x66\xff\xc9\x45\xa0\x4f\xc4\xe3\x8f\x44\xb1\xf6\x6b\
+\x03\x64\xf6\xb2\xcc\xfa\x55\x70\x87\xe2\x7f\x61\xb4\x0a\xf0\x0f\
+\xbd\x01\x50\x93\x19\xf8\xe1\xcb\x77\xb7\x66\x40\xa6\x40\x18\x68\
+\x10\x80\x40\x7c\x02\x45\x1b\x00\x09\xbe\x9a\x04\xbf\x6f\x9b\x81\
+\xe0\x9b\x88\x7e\x7c\xfc\xf5\xf4\x58\xa3\x11\x50\x4e\x12\xfe\x2c\
+\xb3\x7e\x1d\x1a\x0e\xc5\x5f\x61\xa5\x6a\x32\x03\x6a\x32\x03\x4f\
+\xbe\xf1\xfa\xd6\x10\xa4\x1a\x9b\x71\xca\x23\x40\xc4\xd3\x09\x14\
+\x69\x00\x82\xe8\x4b\xf0\xd5\xfa\xb4\x11\xfc\x1e\x82\x87\x1f\x89\
+\x66\xc9\x2b\x02\x61\xb6\x1f\x72\xc8\xb6\xd2\xe3\x58\xfc\x73\x5c\
+\x07\xf0\xfc\x93\x27\x5d\x30\x03\xac\x0a\x78\xf8\x4b\x27\x86\x1a\
+\x08\x14\x65\x00\x86\xc2\xdf\xc3\xcf\x2a\xfa\x12\x8a\x3e\x06\x7e\
+\x8e\x10\x28\xcd\x08\xa8\x9e\x59\x67\xfb\x43\x8e\x8e\xc5\x5f\x61\
+\x5e\xbc\xf8\xdb\xba\xc9\xd6\x86\x46\xe0\x39\xd7\x0b\x64\xab\x83\
+\xaf\x81\x89\x66\x0e\x81\x22\x0c\x80\x27\xe1\x0f\x90\xb3\xcd\x0c\
+\x43\x00\x85\xdc\x0e\x8d\x80\xee\x7b\x0a\x5b\xa2\xaf\xe6\x46\xf8\
+\x05\xc7\xb9\xf8\x2b\x44\x2f\x4d\x46\x40\xd7\x0b\x68\x45\x40\xcd\
+\x4b\x5c\xc4\x01\x81\x52\x08\xb8\x36\x00\x1e\x85\x5f\x85\xf5\x26\
+\x64\x8a\xc9\x7b\x13\x33\xb5\xb0\xb4\xae\xfb\x12\xdf\x94\x71\x6b\
+\x3c\x35\x09\xbe\xe2\xd0\xb9\x7d\x35\x37\x66\xae\x10\xf1\xd7\x29\
+\x00\xab\x0b\x01\xe7\x1c\x0f\x32\x02\x6a\x32\x01\x6a\x73\xfa\x60\
+\x9f\xb2\x09\x10\xfd\x3c\x02\x2e\x0d\x80\x57\xe1\x9f\x87\x98\xbd\
+\x6e\x12\x90\xf8\xab\x49\x7c\x25\xc4\x12\x64\x3d\x96\x38\xdf\xdc\
+\x76\xc9\x63\xf5\xa7\xa6\xfe\xd5\x34\x9e\x9a\x1b\xc1\x1f\x26\x57\
+\x88\xf8\x87\x90\xdf\xfa\x77\xaf\x84\xbb\x6e\x6e\x65\x02\xd4\x30\
+\x01\x6e\x4a\x42\x20\xce\x09\xb8\x33\x00\x77\xef\xde\xfd\xb6\xe7\
+\x0b\xfb\x24\x54\x6a\xce\xeb\x5a\x54\x78\x12\x64\x31\x95\x38\xcb\
+\x10\x84\x26\xd1\x0e\x4d\xaf\x87\x26\x51\x57\x0b\x8f\xc3\x6d\xd8\
+\x56\xb7\xea\x43\xfd\xa9\xa9\x7f\x35\xb7\x50\x0a\x13\x7f\x71\xf4\
+\xb6\x0a\xa0\x98\x42\x93\x09\xd0\x27\x07\x30\x02\x81\x48\xed\xb7\
+\xe4\x37\x97\x80\x1b\x03\x10\x66\xfd\x16\x5f\xda\x33\x17\xce\xa1\
+\xfd\x24\x3c\x87\x9e\xe7\xb9\xf8\x04\x24\xda\xa1\x05\x91\xd7\xad\
+\x44\x5d\x4d\xf7\x87\x2d\x6c\xab\xdb\xf8\xd1\x18\xf5\x58\xa0\xf8\
+\x07\x12\x1e\x57\x01\x42\x6c\xba\x95\x11\xc0\x04\x88\x04\x0d\x02\
+\x19\x44\xe4\x34\x00\x00\x10\x00\x49\x44\x41\x54\x87\x09\xb8\x30\
+\x00\x12\x7f\xcf\xb3\xfe\x80\x4e\x62\x53\x94\xb8\x84\xc0\xb9\xf5\
+\x49\xa0\x60\xf1\x17\x50\xcf\xab\x00\x8a\x4f\x4d\x26\x40\xab\x01\
+\x7c\x5a\x40\x34\xea\x6c\x64\x35\x9f\x40\x76\x03\x30\x58\xf2\x9f\
+\x9f\x45\xa2\x3d\x65\x00\x12\x0d\xc5\x30\xb5\x13\x28\x5c\xfc\x43\
+\x79\xbc\xaf\x02\x84\x38\xc3\xa7\x05\xc2\x63\x6e\x21\x00\x81\xae\
+\xcb\x6a\x00\x5e\x34\xfa\x9e\x7e\x8b\xc2\x22\xfe\x16\x54\x1b\xed\
+\xb3\x12\xf1\x57\xf5\x4a\x58\x05\x50\x9c\x6a\x5a\x0d\xe0\x94\x80\
+\x48\xd4\xd4\xc8\x65\x09\x81\x2c\x06\x40\x4b\xfe\x12\xff\x3e\xf0\
+\xac\x5f\xe6\xd3\x8f\x3f\xea\x47\xe7\xfd\x31\x00\xa3\x50\xb1\xd1\
+\x39\x02\x15\x89\x7f\x48\xf5\xd1\x57\xbe\xde\x79\xfa\x58\x60\x88\
+\xeb\xd0\x2d\x26\xe0\x10\x15\x9e\x6b\x95\x40\x16\x03\x50\xc2\xf9\
+\xfe\x70\x40\x48\xf8\x75\xc1\x59\x78\xcc\x2d\x04\x66\x13\xa8\x50\
+\xfc\x03\x0b\x99\x80\xb7\xfe\xe0\x22\x3c\x74\x7d\x8b\x09\x70\x5d\
+\x9e\x49\xc1\xb1\xf1\x32\x02\xc9\x0d\xc0\x6e\xe6\xbf\x2c\xea\x44\
+\x7b\x4b\xfc\xd5\x12\x0d\xc7\x30\x35\x13\xa8\x58\xfc\x43\xd9\x74\
+\x3d\x00\x26\x20\xd0\xe0\x16\x02\xfe\x09\x24\x35\x00\x3b\xf1\x2f\
+\x62\xd9\x5f\xc2\xaf\xe6\xbf\x84\x44\xe8\x9e\x40\x03\xe2\x1f\x6a\
+\x50\x9a\x09\xd0\xff\x32\x18\x62\xe7\xb6\x34\x02\xc4\xbb\x94\x40\
+\x32\x03\x50\x92\xf8\xeb\x8b\x64\x10\xff\xa5\x87\x16\xfb\x6f\x09\
+\x34\x24\xfe\xdb\x7c\xfb\x5f\x25\x99\x80\xe7\x9f\x3c\xe9\x30\x01\
+\x7d\xd1\xf8\x69\x92\x40\x12\x03\xa0\x8f\xfa\xf5\x74\xdd\xcf\xfc\
+\x75\xb1\x9f\xc4\x9f\xcf\xfa\xf7\xd5\xe2\x67\x39\x81\x06\xc5\x3f\
+\x40\x93\x09\x78\xfc\x95\xaf\x77\x25\x9c\x12\x90\x09\xe0\xd3\x01\
+\xa1\x72\xe5\xdc\x12\xe9\x72\x02\xe6\x06\x40\xe2\xef\xf9\xdb\xfd\
+\x82\xe8\x87\xaf\x8e\x45\xfc\x97\x1f\x54\xf4\xd0\x13\x68\x58\xfc\
+\xfb\xec\xb7\x3f\xfa\x88\xa0\x8c\xc0\xd3\xff\xfc\xd6\xd6\x08\x5c\
+\xdc\xfd\x9d\xed\xf3\x1e\x7f\x71\x61\xa0\xc7\xaa\x10\x93\x35\x01\
+\x53\x03\xe0\x59\xfc\x83\xf0\xeb\x0a\x7f\x44\xdf\xfa\x30\x6b\xac\
+\x7f\xc4\xff\x56\xc1\x65\x04\xc2\x27\x05\xbc\xae\x0a\x60\x02\x6e\
+\x95\xcd\xf1\x13\x84\x16\x83\x80\x99\x01\xf0\x26\xfe\x12\x7c\x35\
+\x2d\xf1\x33\xdb\x8f\x71\xe8\xd0\xc7\x41\x02\x88\xff\x41\x2c\xe1\
+\x49\x19\x01\x35\xad\x0a\x84\x53\x04\x9e\x56\x06\x64\x02\x9e\x7f\
+\xf2\x51\x08\x97\x5b\x08\x54\x4d\xc0\xcc\x00\x78\x58\xf6\x0f\x82\
+\x2f\xd1\xd7\x4c\x5f\x8d\xd9\x7e\xd5\xc7\x73\xde\xe4\x10\xff\x49\
+\xfc\xc3\x29\x02\xad\x0c\xc8\x10\x68\x65\x40\x6d\x52\x27\x06\x1b\
+\xcb\x04\x18\x74\x4b\x97\x11\x09\xd0\x55\x1c\x02\x26\x06\x40\xb3\
+\xff\x38\xe1\xcd\xeb\x45\x57\xf0\x0f\x67\xf9\x88\xfe\x3c\x8e\xec\
+\x35\x81\x00\xe2\x3f\x01\xd6\xe1\x4d\xb5\x32\xa0\x16\x56\x06\x0e\
+\x6f\x65\xff\xec\x73\x3e\x19\x60\x0f\x99\x11\x5c\x10\x88\x6e\x00\
+\x24\xfe\xb9\x66\xff\x41\xf8\x75\xeb\x82\x2e\x41\xb4\x41\x00\xf1\
+\x8f\x5a\xe7\xb0\x32\x10\x56\x05\xa2\x76\x3e\xb2\x33\x99\x80\xe7\
+\x9c\x0a\x18\x49\x2b\xf5\x66\x8c\x17\x8b\x40\x54\x03\xa0\xef\xf8\
+\xcf\x21\xfe\x12\x7c\xcd\xf8\x75\x1b\x0b\x0c\xfd\x40\x60\x14\x01\
+\xc4\x7f\x14\xa6\xb9\x1b\x69\x45\x20\x97\x11\xe0\x54\xc0\xdc\xaa\
+\xb1\x5f\x29\x04\xa2\x1a\x80\xd5\x6a\xf5\x6e\xca\xc4\xc3\x39\x7e\
+\x84\x3f\x25\x75\xc6\xba\x22\x80\xf8\x5f\xa1\xb0\xbe\x23\x23\x90\
+\xfa\xfa\x80\xe7\xfd\xa9\x00\xbe\x1f\xc0\xba\xb2\xd3\xfb\x67\x8f\
+\x78\x04\xa2\x19\x00\x2d\xfd\xf7\x61\x25\xfb\xb2\x1f\x89\x3e\x17\
+\xf5\xf5\xc4\xf9\xc9\x43\x00\xf1\x4f\xce\x5d\x26\x40\xab\x01\x29\
+\x3f\x35\xa0\x55\x80\xe7\x9c\x0a\x48\x5e\x6b\x06\x4c\x43\x20\x9a\
+\x01\x48\xb9\xf4\x2f\xf1\x57\x4b\x83\x88\x51\x20\x70\x83\x00\xe2\
+\x7f\x03\x48\xda\x87\xfa\xd4\x40\xca\xd5\x00\x99\x80\xb4\x19\x32\
+\xda\x71\x02\xbc\x12\x93\x40\x14\x03\xb0\x9b\xfd\xc7\x8c\xeb\x68\
+\x5f\xfa\x48\x1f\xe2\x7f\x14\x0f\x2f\x58\x13\x40\xfc\xad\x09\x8f\
+\xea\x5f\xab\x01\xa9\x4c\xc0\xf3\xfe\x54\xc0\x73\x56\x01\x46\xd5\
+\x85\x8d\xca\x22\x10\xc5\x00\xa4\x9a\xfd\x4b\xfc\xf9\x48\x5f\x59\
+\x07\x58\x55\xd1\x22\xfe\xae\xca\x99\xd2\x04\xb0\x0a\xe0\xa3\xf4\
+\x44\x11\x97\xc0\x62\x03\x90\x6a\xf6\x8f\xf8\xc7\x2d\x3c\xbd\x4d\
+\x24\x80\xf8\x4f\x04\x96\x66\xf3\x54\x26\xe0\x39\xab\x00\x69\x0a\
+\xca\x28\x49\x09\x2c\x36\x00\xfd\xec\xff\xcb\xd6\x11\x6b\xc9\x9f\
+\x99\xbf\x35\x65\xfa\x3f\x4a\x00\xf1\x3f\x8a\xc6\xc3\x0b\xa9\x4c\
+\x00\xab\x00\xb9\xab\xcd\xf8\xb1\x09\x2c\x32\x00\xbb\xd9\xbf\xe9\
+\x95\xff\x12\x7f\xb5\xd8\x89\xd3\x1f\x04\x46\x11\x40\xfc\x47\x61\
+\xca\xbd\x51\x0a\x13\xc0\x2a\x40\xee\x2a\x33\x7e\x6c\x02\x8b\x0c\
+\x40\xec\x60\x6e\xf6\x27\xe1\x57\xbb\xf9\x3c\x8f\x21\x90\x84\x00\
+\xe2\x9f\x04\x73\xac\x41\x64\x02\xac\x3f\x22\xc8\x2a\x40\xac\x6a\
+\x4d\xef\x87\x3d\xe2\x13\x58\x64\x00\xfa\xe5\x7f\xb3\x2f\xfe\xd1\
+\x97\xfc\x20\xfe\xf1\x0b\x4e\x8f\x23\x09\x20\xfe\x23\x41\xf9\xda\
+\x4c\x26\xc0\x32\x22\x56\x01\x2c\xe9\xd2\x77\x6a\x02\xb3\x0d\xc0\
+\x6e\xf9\xdf\x2c\x5e\xc4\xdf\x0c\x2d\x1d\x9f\x23\x80\xf8\x9f\x23\
+\xe4\xf6\xf5\xed\xff\x23\xf0\x07\x17\xa6\xf1\xb1\x0a\x60\x8a\xf7\
+\x48\xe7\x3c\x6d\x41\x60\xb6\x01\xb0\x9c\xfd\x4b\xfc\xb9\xe8\xcf\
+\xa2\xdc\xf4\x79\x96\x00\xe2\x7f\x16\x91\xf7\x0d\xb4\x0a\x60\xf9\
+\x1d\x01\x5a\x05\xf0\xce\x80\xf8\x20\x30\x86\xc0\x2c\x03\xc0\xec\
+\x7f\x0c\x5a\xb6\x29\x8e\x00\xe2\x5f\x5c\xc9\x8e\x05\x2c\x13\x70\
+\xec\xb5\x18\xcf\x3f\xe7\x8b\x81\x62\x60\x1c\xdd\x07\x1b\xda\x10\
+\x98\x65\x00\x6c\x42\xb9\xec\x55\xb3\xff\xcb\x7b\xfc\x86\x40\x42\
+\x02\x88\x7f\x42\xd8\x69\x86\xb2\x5c\x05\xe0\x34\x40\x9a\x1a\x32\
+\x8a\x2d\x81\x59\x06\xa0\x5f\xfe\x37\xfb\xec\x3f\x06\xc0\xb6\xe0\
+\xf4\x7e\x80\x00\xe2\x7f\x00\x4a\xf9\x4f\x59\xae\x02\x3c\xff\xe4\
+\x49\xf9\x80\x8a\xc9\x80\x40\xad\x08\xcc\x32\x00\x7d\x30\x26\x9f\
+\xfd\x47\xfc\x7b\xb2\xfc\xa4\x25\x80\xf8\xa7\xe5\x9d\x78\x34\xcb\
+\x55\x80\xe7\x9c\x06\x48\x5c\x4d\x86\x8b\x4d\x60\xb2\x01\xb0\x3c\
+\xff\x8f\x01\x88\x5d\x5e\xfa\x3b\x49\x00\xf1\x3f\x89\xa7\x86\x17\
+\x2d\x57\x01\x6a\xe0\x53\x42\x0e\xc4\x68\x47\x60\xb2\x01\xb0\x0a\
+\x05\xf1\xb7\x22\x4b\xbf\x07\x09\x20\xfe\x07\xb1\xd4\xf8\xe4\xc5\
+\xdd\xdf\x31\x49\x8b\xeb\x00\x4c\xb0\xd2\x69\x42\x02\x93\x0d\xc0\
+\x66\xb3\x31\xf9\xf2\x1f\x0c\x40\xc2\xaa\xb7\x3e\x14\xe2\xdf\xd4\
+\x11\xc0\x2a\x40\xc9\xe5\x26\x76\x4b\x02\x93\x0d\x80\x45\x30\xfa\
+\xd6\x3f\x8b\x7e\xe9\x13\x02\xb7\x08\x20\xfe\xb7\x90\xd4\xfe\x84\
+\xbe\x1c\xc8\x62\x15\xe0\xf9\x27\x4f\xba\xe7\x5c\x07\x50\xfb\xe1\
+\x53\x75\x7e\x93\x0c\x80\xd5\xf9\x7f\xbe\xf4\xa7\xea\x63\xcc\x4f\
+\x72\x88\xbf\x9f\x5a\x24\x8e\x44\x26\x20\xf1\x90\x0c\x17\x81\x00\
+\x5d\xd8\x12\x98\x64\x00\x6c\x43\xa1\x77\x08\x18\x12\x40\xfc\x0d\
+\xe1\xfa\xef\xfa\xe2\xc5\xdf\x36\x09\xf2\x79\xbf\x0a\x60\xd2\x31\
+\x9d\x42\x20\x01\x81\x49\x06\x60\xb3\xd9\x98\x7c\xfe\x9f\xf3\xff\
+\x09\x2a\xdd\xf2\x10\x88\x7f\xcb\xd5\xdf\xe6\xce\x0a\xc0\x16\x43\
+\x61\xbf\x08\xd7\x9a\xc0\x24\x03\xd0\x07\x13\xfd\xf3\xff\x9c\xff\
+\xef\xa9\xf2\x63\x47\x00\xf1\xb7\x63\x5b\x58\xcf\x16\xd7\x01\xfc\
+\x1f\xae\x01\x28\xec\x28\x20\xdc\x21\x81\xa9\x06\x60\xb8\x6f\x94\
+\xfb\x9c\xff\x8f\x82\x91\x4e\x0e\x11\x40\xfc\x0f\x51\xe1\x39\x08\
+\x14\x41\x80\x20\xed\x09\x64\x37\x00\xf6\x29\x32\x42\x93\x04\x10\
+\xff\x26\xcb\x7e\x2a\x69\x4e\x03\x9c\xa2\xc3\x6b\x2d\x12\xc8\x6e\
+\x00\x38\x05\xd0\xe2\x61\x67\x9c\x33\xe2\x6f\x0c\x98\xee\x03\x01\
+\x2e\x02\x0c\x24\x62\xdf\xd2\x5f\x0a\x02\xa3\x0d\xc0\x0b\x2f\xbc\
+\x10\xfd\xfc\x7f\x8a\x04\x19\xa3\x31\x02\x88\x7f\x63\x05\x1f\x9f\
+\xae\xd5\x27\x01\xc6\x47\xc0\x96\x10\xf0\x45\x60\xb4\x01\xf0\x15\
+\x36\xd1\x40\xe0\x00\x01\xc4\xff\x00\x14\x9e\x82\x40\x79\x04\x88\
+\x38\x0d\x81\xec\x06\x80\x8b\x00\xd3\x14\xba\xfa\x51\x10\xff\xea\
+\x4b\xec\x35\xc1\xe7\x7c\x12\xc0\x6b\x69\x88\xeb\x0c\x81\xec\x06\
+\xe0\x4c\x7c\xbc\x0c\x81\xf3\x04\x10\xff\xf3\x8c\xd8\xa2\xe3\x22\
+\xc0\x52\x0e\x02\xe2\x4c\x45\x00\x03\x90\x8a\x34\xe3\xd8\x10\x40\
+\xfc\x6d\xb8\x56\xd8\xeb\x47\x4f\x7f\x55\x61\x56\xa4\x04\x81\xf9\
+\x04\xb2\x1b\x80\x8f\x7e\xfe\xf7\xf3\xa3\x67\xcf\xb6\x09\x20\xfe\
+\x6d\xd7\xdf\x49\xf6\x5f\x78\xe9\x15\x27\x91\xd4\x11\x06\x59\xa4\
+\x23\x30\xda\x00\x7c\xf6\xd9\x67\x3f\x4a\x17\x16\x23\x41\xe0\x0c\
+\x01\xc4\xff\x0c\x20\x5e\x86\x00\x04\x20\x70\x9a\xc0\x68\x03\x70\
+\xba\x1b\x5e\x85\x40\x42\x02\x88\x7f\x42\xd8\xf5\x0c\xf5\xe4\xd9\
+\xaf\xeb\x49\xa6\xda\x4c\x48\x2c\x25\x01\x0c\x40\x4a\xda\x8c\xb5\
+\x9c\x00\xe2\xbf\x9c\x21\x3d\x40\x00\x02\x10\xe8\x09\x4c\x35\x00\
+\xd1\x4f\x03\x3c\xf9\x19\xd7\x00\xf4\x75\xe0\x67\x0c\x01\xc4\x7f\
+\x0c\x25\xb6\x49\x48\xe0\x0b\x2f\x5d\x24\x1c\xad\xfe\xa1\xc8\x30\
+\x2d\x81\xa9\x06\x20\x7a\x74\x5c\x04\x18\x1d\x69\x9d\x1d\x22\xfe\
+\x75\xd6\x35\x61\x56\x0f\x7e\xfa\x24\xe1\x68\x0c\x05\x01\xff\x04\
+\xb2\x1b\x00\xff\x88\x88\x30\x3b\x01\xc4\x3f\x7b\x09\x08\xe0\x30\
+\x81\xdf\xe2\x13\x00\x87\xc1\xcc\x7a\x96\x9d\x52\x13\x98\x64\x00\
+\x56\xab\xd5\x8f\x63\x07\xa8\x53\x00\xac\x02\xc4\xa6\x5a\x51\x7f\
+\x88\x7f\x45\xc5\xcc\x97\xca\x83\xbf\xfd\x28\xdf\xe0\x8c\x0c\x01\
+\xa7\x04\x26\x19\x00\xa7\x39\x10\x56\xad\x04\x10\xff\x5a\x2b\x4b\
+\x5e\x10\xb8\x45\x80\x27\xd2\x13\x98\x64\x00\x3e\xff\xfc\xf3\xe8\
+\x17\x01\x2a\xe5\x07\x8f\x7f\xa0\x1b\x1a\x04\xae\x09\x20\xfe\xd7\
+\x2c\xb8\xb7\x98\x80\xd5\xf9\xff\xdf\xfd\xe3\xb7\x16\xc7\x46\x07\
+\x10\xc8\x45\x60\x92\x01\xb0\xfa\x32\x20\x9d\x06\xc8\x05\x80\x71\
+\x1d\x12\x40\xfc\x1d\x16\xa5\xdc\x90\xac\xbe\x02\x98\x4f\x00\xc4\
+\x3c\x26\xe8\x2b\x07\x81\x49\x06\x60\x17\xa0\xc9\x2a\x00\xd7\x01\
+\xec\xe8\xb6\x7e\x83\xf8\xb7\x7e\x04\x44\xcf\xdf\xea\x0b\x80\xb8\
+\x00\x30\x7a\xa9\xe8\x30\x31\x81\x39\x06\xc0\x24\x44\x4e\x03\x98\
+\x60\x2d\xab\x53\xc4\xbf\xac\x7a\x15\x12\xad\xd5\xf2\x3f\x2b\x00\
+\xf1\x0e\x00\x7a\xca\x43\x60\xb2\x01\xd8\x6c\x36\xef\x59\x84\xaa\
+\xd3\x00\xac\x02\x58\x90\x2d\xa4\x4f\xc4\xbf\x90\x42\x95\x15\xa6\
+\xe5\xd5\xff\xfc\x27\x40\x65\x1d\x0b\x44\x7b\x9b\xc0\x64\x03\x60\
+\x75\x1d\x80\x42\x63\x15\x40\x14\x1a\x6c\x88\x7f\x83\x45\x4f\x93\
+\x32\xb3\xff\x34\x9c\x97\x8d\xc2\xde\xb9\x08\x4c\x36\x00\xbb\x40\
+\x4d\xae\x03\x60\x15\x60\x47\xb7\xa5\x1b\xc4\xbf\xa5\x6a\x27\xcd\
+\xd5\x72\xf6\xcf\xf9\xff\xa4\xa5\x64\x30\x23\x02\xb3\x0c\x80\xd5\
+\x69\x00\xe5\xc8\x2a\x80\x28\x34\xd2\x10\xff\x46\x0a\x9d\x27\x4d\
+\xab\xd9\x7f\x9e\x6c\xea\x1d\x95\xcc\xf2\x11\x98\x65\x00\x2c\xc3\
+\xd5\x2a\x00\x26\xc0\x92\xb0\x93\xbe\x11\x7f\x27\x85\xa8\x33\x0c\
+\xcb\xd9\xbf\x88\xf1\xf9\x7f\x51\xa0\x95\x4e\x60\x96\x01\xd8\x5d\
+\x07\x60\x72\x1a\x40\x40\x65\x00\xb8\x20\x50\x24\x2a\x6d\x88\x7f\
+\xa5\x85\xf5\x91\x96\x3e\xf7\x6f\x39\xfb\xff\x3d\xbe\xfc\x27\x62\
+\xa1\xe9\x2a\x27\x81\x59\x06\x40\x01\x5b\x9e\x06\x50\xff\x32\x01\
+\xba\xa5\x55\x46\x00\xf1\xaf\xac\xa0\xfe\xd2\x61\xf6\xef\xaf\x26\
+\x44\xe4\x93\xc0\x6c\x03\x60\xbd\x0a\xc0\xa9\x00\x9f\x07\xcc\xa2\
+\xa8\x10\xff\x45\xf8\xd8\xf9\x3c\x01\x89\xff\x93\xa7\xbf\x3a\xbf\
+\xe1\xcc\x2d\x98\xfd\xcf\x04\x77\x64\x37\x9e\xce\x4b\x60\xb6\x01\
+\x50\xd8\x29\x56\x01\x38\x15\x20\xd2\x15\x34\xc4\xbf\x82\x22\xfa\
+\x4e\x41\xe2\x6f\xb9\xf4\xef\x3b\x7b\xa2\x83\xc0\x74\x02\x8b\x0c\
+\x80\xf5\x2a\x80\xd2\x79\xed\x4f\xdf\xed\x30\x01\x22\x51\x70\x43\
+\xfc\x0b\x2e\x5e\x19\xa1\xa7\x12\x7f\x2e\xfe\x8b\x79\x3c\xd0\x57\
+\x6e\x02\x8b\x0c\x80\x82\xb7\x5e\x05\xd0\x18\x98\x00\x51\x28\xb4\
+\x21\xfe\x85\x16\xae\x9c\xb0\xad\x2f\xfa\x0b\x24\x58\xfe\x0f\x24\
+\xb8\xad\x85\xc0\x62\x03\xb0\x5b\x05\x30\xe7\x81\x09\x30\x47\x1c\
+\x7f\x00\xc4\x3f\x3e\x53\x7a\xdc\x23\x20\xf1\x7f\xed\x87\x69\xfe\
+\x3b\x71\x66\xff\x7b\xe8\x17\x3f\xa0\x83\xfc\x04\x16\x1b\x00\xa5\
+\xb0\x5a\xad\x4c\xfe\x7f\x00\xf5\x3d\x6c\x98\x80\x21\x0d\xe7\xf7\
+\x11\x7f\xe7\x05\x2a\x3f\xbc\x94\xe2\xcf\xec\xbf\xfc\xe3\x85\x0c\
+\x6e\x13\x88\x62\x00\x9e\x3e\x7d\xfa\xed\xdb\x5d\xdb\x3c\x23\x13\
+\xc0\x47\x04\x6d\xd8\x46\xeb\x15\xf1\x8f\x86\x92\x8e\x0e\x13\x48\
+\x29\xfe\x8a\x80\xd9\xbf\x28\xc4\x6c\xf4\xe5\x81\x40\x14\x03\xa0\
+\x44\x56\x89\x56\x01\x34\x96\x0c\x80\x9a\xee\xd3\x9c\x11\x40\xfc\
+\x9d\x15\xa4\xbe\x70\x74\xc1\x5f\xaa\x65\x7f\xd1\x63\xf6\x2f\x0a\
+\xb4\x1a\x09\x44\x33\x00\xbb\x55\x00\xb3\x6f\x07\xbc\x09\x5f\x06\
+\xe0\xf5\xf7\xf9\x84\xc0\x4d\x2e\x59\x1f\x23\xfe\x59\xf1\xd7\x3e\
+\xb8\x66\xfd\xaf\xf7\xe7\xfb\x53\x7e\xd4\xef\x0b\x2f\x5d\x74\xcc\
+\xfe\xe3\x1f\x59\xf4\xe8\x83\x40\x34\x03\xa0\x74\x52\x7c\x22\x40\
+\xe3\x84\xa6\x2f\x0b\xe2\x94\x40\xa0\x91\xf9\x16\xf1\xcf\x5c\x80\
+\xba\x87\x0f\xb3\x7e\xcb\x2f\xf9\x39\x44\xf0\xe2\x83\x47\x87\x9e\
+\xe6\x39\x08\x54\x41\x20\xaa\x01\xd0\x27\x02\x52\x9e\x0a\x08\x15\
+\xd0\x6a\xc0\xdd\x37\x5f\xef\x74\x1b\x9e\xe3\x36\x21\x01\xc4\x3f\
+\x21\xec\xb6\x86\x92\xf0\xdf\xfd\x8b\x07\x5d\xca\x59\x7f\x20\xcc\
+\xd2\x7f\x20\x11\xfb\x96\xfe\xbc\x10\x88\x6a\x00\x94\x54\xea\x53\
+\x01\x1a\x33\x34\x19\x00\x8c\x40\xa0\x91\xe8\x16\xf1\x4f\x04\xba\
+\xad\x61\x72\x0a\xbf\x48\x4b\xfc\x59\xfa\x17\x09\x5a\xcd\x04\xa2\
+\x1b\x00\xc1\x7a\xf6\xec\xd9\xab\xfd\x6d\xb2\xeb\x01\xfa\xb1\xf6\
+\x7e\x86\x46\x80\x6f\x11\xdc\x43\x13\xf7\x01\xe2\x1f\x97\x67\xe3\
+\xbd\x85\x73\xfc\xb9\x66\xfc\x43\xfc\x88\xff\x90\x46\xdc\xfb\xf4\
+\xe6\x87\x80\x89\x01\x50\x7a\xa9\xaf\x07\xd0\x98\x37\x9b\x8c\x80\
+\xae\x11\x08\xab\x02\x7a\x7c\x73\x1b\x1e\xcf\x24\x80\xf8\xcf\x04\
+\xc7\x6e\x81\x80\x04\x5f\x4d\x17\xf6\x49\xf4\x75\x65\x7f\xea\x73\
+\xfc\x21\x96\xe1\xad\x66\xff\xc3\xc7\xdc\x87\x40\xad\x04\xcc\x0c\
+\x40\xae\xeb\x01\x8e\x15\x4a\xe2\xaf\x26\x33\xa0\x4f\x0f\xe8\xfe\
+\xb1\x6d\x79\xfe\x0c\x01\xc4\xff\x0c\x20\x5e\x3e\x46\x20\x08\xbe\
+\x44\x5f\x82\xaf\xe6\x41\xf4\x43\xbc\x12\x7f\x66\xff\x81\x86\xc5\
+\x2d\x7d\x7a\x22\x60\x66\x00\x94\x64\xce\xeb\x01\x34\xfe\xb1\xa6\
+\x4f\x0f\xc8\x00\xc8\x0c\xe8\x96\xd3\x04\xc7\x48\x1d\x78\x1e\xf1\
+\x3f\x00\x85\xa7\xce\x11\x08\xc2\x1f\x04\xdf\x93\xe8\x87\xd8\x11\
+\xff\x40\x82\xdb\x56\x08\x98\x1a\x00\x41\xf4\x70\x2a\x40\x71\x1c\
+\x6b\x32\x00\x3a\x4d\xc0\xaa\xc0\x31\x42\x83\xe7\x11\xff\x01\x0c\
+\xee\x9e\x23\x10\x44\xdf\xd3\xf2\xfe\xb1\x98\xf9\xbc\xff\x31\x32\
+\x71\x9f\xa7\x37\x5f\x04\xcc\x0d\x80\x4e\x05\xf4\x26\x40\x17\x05\
+\xfa\xca\xfc\x46\x34\xc3\x55\x01\x56\x04\x6e\xc0\xd1\x43\xc4\x5f\
+\x14\x68\x23\x09\xe8\x2a\xfe\x30\xdb\x1f\xb9\x4b\xb6\xcd\x24\xfe\
+\x7c\xde\x3f\x1b\x7e\x06\xce\x48\xc0\xdc\x00\x28\x37\x99\x80\x67\
+\xcf\x9e\xad\xfa\xfb\xd9\x3e\x19\xd0\x8f\x3d\xfa\x47\x2b\x02\x5a\
+\x19\x18\xbd\x43\xed\x1b\x22\xfe\xb5\x57\x38\x6a\x7e\x12\xff\x1c\
+\x9f\xdb\x9f\x9b\x84\x96\xfe\xe7\xee\xcb\x7e\x53\x08\xb0\xad\x37\
+\x02\x49\x0c\x40\x48\xba\x37\x01\x5a\x09\x28\xc2\x04\xc8\x00\xa8\
+\x85\xd8\x9b\xbd\x45\xfc\x9b\x2d\xfd\x9c\xc4\x75\x71\x5f\x29\xe2\
+\xaf\x99\xff\x57\x3e\x7e\xda\x7d\xe1\xa5\x57\xe6\xa4\xca\x3e\x10\
+\x28\x9e\x40\x52\x03\x20\x5a\x98\x00\x51\x28\xa4\x21\xfe\x85\x14\
+\xca\x47\x98\x12\x7f\x8f\x17\xf7\x1d\xa3\xc3\xb2\xff\x31\x32\x36\
+\xcf\xd3\xab\x3f\x02\xc9\x0d\x80\x10\x60\x02\x44\xc1\x79\x43\xfc\
+\x9d\x17\xc8\x57\x78\x25\x89\xbf\x66\xfe\x17\x1f\x3c\xf6\x05\x90\
+\x68\x20\x90\x81\x40\x16\x03\xa0\x3c\x31\x01\xa2\xe0\xb4\x21\xfe\
+\x4e\x0b\xe3\x33\x2c\x9d\xf3\x2f\x65\xe6\x7f\x29\xfe\x8f\x58\xf6\
+\x4f\x7e\x28\x31\xa0\x47\x02\xd9\x0c\x80\x60\xc8\x04\xe4\xf8\xcf\
+\x83\x34\xf6\xd4\xd6\xcc\xf5\x00\x88\xff\xd4\x43\xa3\xe9\xed\x25\
+\xfe\xa5\x9c\xf3\xd7\xc5\x7e\x17\xfc\xef\x7e\x4d\x1f\xaf\x24\xbf\
+\x4f\x20\xab\x01\x50\x28\xfa\xb2\x20\x4c\x80\x48\x38\x68\x88\xbf\
+\x83\x22\x94\x15\x42\x49\xe2\xcf\x37\xfc\xe5\x3b\xb6\x18\xd9\x27\
+\x81\xec\x06\x40\x58\x64\x02\xfa\xd5\x80\xde\x07\xac\xde\xd3\x63\
+\xaf\x4d\xab\x00\xd5\x7e\x47\x00\xe2\xef\xf5\xb0\x73\x1b\x97\x66\
+\xff\x6e\x83\xdb\x05\x76\xb9\xe4\xff\xb8\x43\xfc\x77\x40\xb8\x81\
+\xc0\x80\x80\x0b\x03\x10\xe2\x91\x11\x58\xad\x56\xee\x4d\x40\x88\
+\xb7\x9a\x5b\xc4\xbf\x9a\x52\xa6\x4c\xc4\xfb\xec\x3f\x2c\xf9\xf3\
+\x31\xbf\x94\x47\xc5\xa1\xb1\x78\xce\x2b\x01\x57\x06\x40\x90\x64\
+\x02\x3c\xaf\x06\xe8\x1b\x03\xab\x5a\x05\x40\xfc\x75\xd8\xd1\x26\
+\x12\xf0\x3c\xfb\x67\xd6\x3f\xb1\x98\x6c\xde\x2c\x01\x77\x06\x20\
+\x54\x42\x46\x60\xe5\x74\x35\x40\xa7\x02\x42\x9c\x45\xdf\x22\xfe\
+\x45\x97\x2f\x67\xf0\x1e\x67\xff\x41\xf8\x75\xa1\x1f\xb3\xfe\x9c\
+\x47\xc7\xfe\xd8\x3c\xf2\x4b\xc0\xad\x01\x10\x32\x99\x00\x8f\xab\
+\x01\x5a\x05\x50\x7c\x45\x37\xc4\xbf\xe8\xf2\xe5\x0c\x5e\xff\xc9\
+\x4f\xce\xf1\x6f\x8e\x2d\xe1\x67\xb9\xff\x26\x15\x1e\x43\xe0\x3c\
+\x01\xd7\x06\x20\x84\x3f\x34\x02\x5e\x56\x05\x8a\x3e\x0d\x80\xf8\
+\x87\x43\x8b\xdb\x19\x04\x9e\x3c\xfb\xf5\x8c\xbd\xe2\xef\x22\xe1\
+\xbf\xf8\xe0\x71\x77\xf1\xc1\x23\x2e\xf2\x8b\x8f\x37\x52\x8f\x74\
+\xe3\x99\x40\x11\x06\x20\x00\x94\x11\x50\x93\x09\x50\x0b\xcf\x73\
+\x3b\x81\x00\xe2\x3f\x01\x16\x9b\x7a\x24\x30\x14\x7e\x96\xfa\x3d\
+\x56\x88\x98\x4a\x21\x50\x94\x01\x08\x50\x65\x02\xd4\x64\x02\xd4\
+\xc2\xf3\x29\x6f\x8b\x3c\x0d\x80\xf8\xa7\x3c\x44\xaa\x1d\x2b\xd7\
+\x29\x00\x84\xbf\xbc\x43\x8a\x88\x7d\x13\x28\xd2\x00\x04\xa4\x32\
+\x01\x6a\xba\x4e\x60\xb3\xd9\xbc\xba\x33\x03\x49\xfe\xb7\xc1\xe2\
+\x4e\x01\x20\xfe\xe1\xb0\xe1\xb6\x10\x02\x12\xfc\xcb\x73\xfb\x8f\
+\x3b\xfd\xaf\x7d\x5a\xea\x67\xc6\x5f\x48\xf1\x08\xb3\x08\x02\x45\
+\x1b\x80\x21\xe1\xcf\x3e\xfb\xec\x47\x3b\x33\xf0\xaa\x0c\x81\xcc\
+\x80\xda\x70\x9b\x66\xef\x23\xfe\xcd\x96\xde\x22\x71\xab\xef\xfd\
+\x97\xe0\xab\x5d\xf4\xe7\xf5\x83\xe0\xeb\x0b\x7c\x10\x7d\x8b\x2a\
+\xa6\xe8\x93\x31\xbc\x13\xa8\xc6\x00\xdc\x04\x2d\x33\xa0\x16\xcc\
+\xc0\xcd\xd7\x97\x3e\x2e\xe6\x14\x00\xe2\xbf\xb4\xd4\xec\x9f\x80\
+\xc0\xe5\x4c\xff\xd1\xf6\x82\x3e\x04\x3f\x01\x70\x86\x80\x40\x4f\
+\xa0\x5a\x03\xd0\xe7\x76\xf5\xf3\xf9\xe7\x9f\x27\x39\x2d\x70\x35\
+\xa0\x97\x3b\x88\xbf\x97\x4a\x54\x13\x87\xd5\xf9\x7f\xcd\xfc\xab\
+\x81\x44\x22\x5b\x02\xfc\xf2\x4f\xa0\x09\x03\xe0\xbf\x0c\x06\x11\
+\x22\xfe\x06\x50\xe9\x12\x02\x10\x80\x40\x3d\x04\x30\x00\xf5\xd4\
+\xf2\x3a\x13\xc4\xff\x9a\x05\xf7\x20\x00\x81\x0c\x1a\x88\x4a\x83\
+\x00\x00\x08\x41\x49\x44\x41\x54\x04\x18\xb2\x04\x02\x18\x80\x12\
+\xaa\x34\x25\x46\xc4\x7f\x0a\x2d\xb6\x85\x00\x04\x20\xd0\x2c\x01\
+\x0c\x40\x4d\xa5\x47\xfc\x6b\xaa\x26\xb9\x40\xa0\x58\x02\x04\x5e\
+\x06\x01\x0c\x40\x19\x75\x3a\x1f\x25\xe2\x7f\x9e\x11\x5b\x40\x00\
+\x02\x10\x80\xc0\x15\x01\x0c\xc0\x15\x8a\x82\xef\x20\xfe\x05\x17\
+\x8f\xd0\x21\x50\x1b\x01\xf2\x29\x85\x00\x06\xa0\x94\x4a\x1d\x8b\
+\x13\xf1\x3f\x46\x86\xe7\x21\x00\x01\x08\x40\xe0\x04\x01\x0c\xc0\
+\x09\x38\xee\x5f\x42\xfc\xdd\x97\x88\x00\x21\xd0\x1a\x01\xf2\x2d\
+\x87\x00\x06\xa0\x9c\x5a\xed\x47\x8a\xf8\xef\xf3\xe0\x11\x04\x20\
+\x00\x01\x08\x4c\x22\x80\x01\x98\x84\xcb\xc9\xc6\x88\xbf\x93\x42\
+\x10\x06\x04\x20\xb0\x4f\x80\x47\x25\x11\xc0\x00\x94\x54\x2d\xc5\
+\x8a\xf8\x8b\x02\x0d\x02\x10\x80\x00\x04\x16\x12\xc0\x00\x2c\x04\
+\x98\x74\x77\xc4\x3f\x29\x6e\x06\x83\x00\x04\xa6\x11\x60\xeb\xb2\
+\x08\x60\x00\x4a\xa9\x17\xe2\x5f\x4a\xa5\x88\x13\x02\x10\x80\x40\
+\x11\x04\x30\x00\x25\x94\x09\xf1\x2f\xa1\x4a\xc4\x08\x81\xc6\x09\
+\x90\x7e\x69\x04\x30\x00\xde\x2b\x86\xf8\x7b\xaf\x10\xf1\x41\x00\
+\x02\x10\x28\x92\x00\x06\xc0\x73\xd9\x10\x7f\xcf\xd5\x21\x36\x08\
+\x40\x60\x40\x80\xbb\xe5\x11\xc0\x00\x78\xad\x19\xe2\xef\xb5\x32\
+\xc4\x05\x01\x08\x40\xa0\x0a\x02\x18\x00\x8f\x65\x44\xfc\x3d\x56\
+\x85\x98\x20\x00\x81\xa3\x04\x78\xa1\x44\x02\x18\x00\x6f\x55\x43\
+\xfc\xbd\x55\x84\x78\x20\x00\x01\x08\x54\x49\x00\x03\xe0\xa9\xac\
+\x88\xbf\xa7\x6a\x10\x0b\x04\x20\x30\x92\x00\x9b\x95\x49\x00\x03\
+\xe0\xa5\x6e\x88\xbf\x97\x4a\x10\x07\x04\x20\x00\x81\x26\x08\x60\
+\x00\x3c\x94\x19\xf1\xf7\x50\x05\x62\x80\x00\x04\x66\x11\x60\xa7\
+\x52\x09\x60\x00\x72\x57\x0e\xf1\xcf\x5d\x01\xc6\x87\x00\x04\x20\
+\xd0\x24\x01\x0c\x40\xce\xb2\x23\xfe\x39\xe9\x33\x36\x04\x20\x10\
+\x81\x00\x5d\x94\x4b\x00\x03\xb0\xa0\x76\x1f\xfd\xfc\xef\xe7\xef\
+\x8d\xf8\xcf\x67\xc7\x9e\x10\x80\x00\x04\x20\xb0\x98\x40\x13\x06\
+\xe0\xb3\xcf\x3e\xfb\xd1\x62\x52\x31\x3b\x40\xfc\x63\xd2\xa4\x2f\
+\x08\x40\x20\x1b\x01\x06\x9e\x4b\xe0\xf9\x27\x1f\xcd\xdd\x35\xda\
+\x7e\x4d\x18\x80\x68\xb4\x62\x74\x84\xf8\xc7\xa0\x48\x1f\x10\x80\
+\x00\x04\x8a\x26\xf0\xfc\x93\x27\x26\xf1\x4f\x99\xf0\x62\x00\x16\
+\x94\xe0\xc1\xe3\x1f\x4c\xdb\x1b\xf1\x9f\xc6\x8b\xad\x21\x00\x01\
+\xd7\x04\x08\xae\x6c\x02\x2d\x19\x80\xe8\xa7\x01\x9e\xfc\x6c\xc2\
+\x35\x00\x88\x7f\xd9\x7f\x29\x44\x0f\x01\x08\x40\x20\x22\x81\x7f\
+\xf8\xcb\x07\x11\x7b\xbb\xea\x6a\x92\xce\xb5\x64\x00\xae\x08\xc5\
+\xbc\x33\x6a\x15\x00\xf1\x8f\x89\x9c\xbe\x20\x00\x01\x17\x04\x08\
+\x62\x2e\x81\x7f\xb4\x11\xff\xc9\xe1\x34\x63\x00\x56\xab\xd5\x8f\
+\x27\xd3\x19\xb1\x83\x0c\xc0\xc9\x4f\x03\x20\xfe\x23\x28\xb2\x09\
+\x04\x20\x00\x81\x76\x08\x18\xcd\xfe\xbb\xd5\x44\x9d\x6b\xc6\x00\
+\x7c\xfe\xf9\xe7\x93\x96\x46\xa6\x1c\x8a\x32\x01\x07\xb7\x47\xfc\
+\x0f\x62\xe1\x49\x08\x40\xa0\x7c\x02\x64\x30\x8f\x80\x97\xd9\xbf\
+\xa2\x6f\xc6\x00\x4c\xb9\x32\x52\x60\xa6\x34\x5d\x0b\x70\xcb\x04\
+\x20\xfe\x53\x10\xb2\x2d\x04\x20\x00\x81\xea\x09\x48\xfc\xad\x66\
+\xff\x82\xf7\xf4\xe9\xd3\x6f\xeb\x76\x6c\x6b\xc6\x00\xec\x80\x98\
+\xae\x02\x5c\x99\x00\xc4\x7f\x87\x9b\x1b\x08\x40\xa0\x4e\x02\x64\
+\x35\x95\x80\xb5\xf8\xf7\xcb\xff\xef\x4d\x8d\xa9\x29\x03\xb0\xd9\
+\x6c\x26\x03\x9a\x02\x54\x06\xe0\xee\x9b\xaf\x77\xba\x9d\xb2\x1f\
+\xdb\x42\x00\x02\x10\x80\x40\x9d\x04\x9e\x7f\xf2\x51\xf7\xe4\x1b\
+\xaf\x77\x96\x33\xff\xb9\xe4\x9a\x32\x00\x96\xa7\x01\x86\x05\x78\
+\xf0\xd3\x27\xdd\x83\xbf\xfd\x68\xdb\x86\xcf\x73\x1f\x02\x10\x80\
+\x40\x0d\x04\xc8\xe1\x3c\x81\x20\xfc\x4f\xbe\xf1\x5a\xf7\xdc\xe8\
+\x4b\x7f\x86\x51\x4c\x5d\xfe\xd7\xbe\x4d\x19\x00\x25\xdc\x37\xb3\
+\xd3\x00\x7d\xdf\x57\x3f\x5b\x13\xd0\x1b\x81\xbb\x7f\xf1\xa0\x7b\
+\xfd\x87\x3f\xd8\x9a\x81\x60\x0a\xb8\xbd\x34\x47\x70\x28\x93\xc3\
+\xd5\x41\x1e\xf1\x8e\xde\x20\xb5\x44\x4a\x7b\xd0\xc1\xa0\x5c\x06\
+\x9a\xe9\xab\xfd\xf0\xe5\xbb\xfd\xac\x3f\x8d\xf0\xef\xfe\x0c\x67\
+\xe9\x5a\x73\x06\xc0\xfa\x34\xc0\xae\x18\x7b\x37\x4f\x9e\xfe\xaa\
+\x0b\x86\x80\xdb\x7e\x75\xa4\x37\x46\x70\x28\x93\x83\x8e\xe5\xbd\
+\x83\x3b\xd2\x03\x2d\x8f\xd2\x1e\x6c\x97\x89\xfd\x73\x20\xce\x63\
+\x35\x92\x91\x55\x8b\xf4\x67\x31\xba\x9b\xd5\xc4\x8f\xff\x85\x8e\
+\x9b\x33\x00\xbb\xd3\x00\xb3\xdc\x52\x80\xc6\x2d\x04\x20\x00\x01\
+\x08\x40\xc0\x0b\x81\x39\xcb\xff\x8a\xbd\x39\x03\xa0\xa4\x73\xac\
+\x02\x68\x5c\x1a\x04\x20\x00\x81\xd2\x09\x10\xbf\x2f\x02\xfd\xec\
+\xff\xbd\xb9\x11\x35\x69\x00\x58\x05\x98\x7b\xb8\xb0\x1f\x04\x20\
+\x00\x01\x08\x78\x21\x20\xf1\x9f\x3b\xfb\x57\x0e\x4d\x1a\x00\x25\
+\xfe\xec\xd9\xb3\x57\x75\x4b\x83\x00\x04\x20\x00\x81\xb1\x04\xd8\
+\xce\x13\x81\x25\xe2\xaf\x3c\x9a\x35\x00\x4a\xbe\x3f\x15\x80\x09\
+\x10\x08\x1a\x04\x20\x00\x01\x08\x14\x45\x40\xb3\xff\xa5\x01\x37\
+\x6d\x00\x38\x15\xb0\xf4\xf0\x61\x7f\x08\x40\xa0\x25\x02\xe4\xea\
+\x86\xc0\x8f\x96\xce\xfe\x95\x49\xd3\x06\x40\x00\xfa\x55\x80\xd9\
+\x17\x50\x68\x7f\x1a\x04\x20\x00\x01\x08\x40\x20\x25\x81\x58\xba\
+\xd5\xbc\x01\xd0\x2a\x40\x8c\xa5\x94\x94\xc5\x67\x2c\x08\x40\x00\
+\x02\xe9\x09\x30\xa2\x07\x02\xd2\x2b\xe9\x56\x8c\x58\x9a\x37\x00\
+\x82\xa8\xa5\x14\x41\xd5\x7d\x1a\x04\x20\x00\x01\x08\x40\xc0\x23\
+\x01\xe9\x94\xf4\x2a\x56\x6c\x18\x80\x1d\x49\x41\x15\xdc\xdd\x43\
+\x6e\x20\x00\x01\x08\x40\x60\x40\x80\xbb\x79\x09\x48\x9f\xa4\x53\
+\x31\xa3\xc0\x00\x0c\x68\x0a\xae\x20\x0f\x9e\xe2\x2e\x04\x20\x00\
+\x01\x08\x40\x20\x2b\x01\xe9\x92\xf4\x29\x76\x10\x18\x80\x1b\x44\
+\x05\x59\xb0\x6f\x3c\xcd\x43\x08\x40\x00\x02\x0d\x13\x20\xf5\x5c\
+\x04\xa4\x47\xd2\x25\x8b\xf1\x31\x00\x07\xa8\x0a\xb6\xa0\x1f\x78\
+\x89\xa7\x20\x00\x01\x08\x40\x00\x02\x49\x08\x6c\x36\x9b\x57\xa5\
+\x47\x56\x83\x61\x00\x8e\x90\x15\xf4\x67\xcf\x9e\xf5\x3e\x60\xc5\
+\xc7\x04\x8f\x30\xe2\x69\x08\x40\xa0\x0d\x02\x64\x99\x96\xc0\x6a\
+\xb5\x7a\x4f\xfa\x13\xeb\x6a\xff\x63\xd1\x63\x00\x8e\x91\xd9\x3d\
+\x2f\x23\xa0\x62\xf4\x0f\xf9\x1f\x04\x7b\x08\xfc\x40\x00\x02\x10\
+\x80\x80\x19\x81\x1f\x59\xcf\xfa\x87\x91\x63\x00\x86\x34\x8e\xdc\
+\x97\x09\xe8\xdd\xd8\xab\x3b\x23\x70\x64\x2b\x9e\x86\x00\x04\x20\
+\x50\x23\x01\x72\x4a\x41\x40\xfa\x22\x9d\xb1\x9e\xf5\x0f\x73\xc1\
+\x00\x0c\x69\x9c\xb9\xbf\x33\x02\x7d\x9d\x56\x9c\x16\x38\xc3\x8a\
+\x97\x21\x00\x01\x08\x40\x60\x14\x81\xa4\xb3\xfe\x61\x44\x18\x80\
+\x21\x8d\x91\xf7\x6f\x18\x01\x4e\x0d\x8c\xe4\xc6\x66\x10\x80\x40\
+\x79\x04\x88\xd8\x84\xc0\x56\xf4\xb5\xdc\x9f\x7a\xd6\x3f\xcc\x06\
+\x03\x30\xa4\x31\xf1\xfe\xce\x08\xbc\xda\x17\x70\xd5\xff\x7b\x4f\
+\x6d\x62\x17\x6c\x0e\x01\x08\x40\x00\x02\x6d\x10\xd8\x8a\xbe\xf4\
+\xa2\x6f\xaf\x6a\xa9\x5f\x2d\x67\xea\x18\x80\x48\xf4\x65\x06\xd4\
+\xfa\xc2\xae\xe4\xea\xd4\x64\x08\x42\xeb\x87\xd1\x4a\x01\xad\xeb\
+\x60\x00\x03\x8e\x81\x62\x8e\x01\xfe\x5e\xbb\x89\xb5\x0a\xef\xf9\
+\xd2\x80\xd0\xa4\x0b\x7d\xdb\x8a\x7e\xdf\x9f\x9b\x1f\x0c\x80\x41\
+\x29\xe4\xea\xd4\x64\x08\x42\x53\xf1\x69\xcf\xb4\x5a\x42\x7b\x06\
+\x07\xfe\x16\x38\x06\x6a\x3d\x06\xc2\x7b\xbe\x34\x20\x34\x03\x99\
+\x89\xd2\x25\x06\x20\x0a\x46\x3a\x81\x00\x04\x20\x50\x1f\x01\x32\
+\xaa\x9b\x00\x06\xa0\xee\xfa\x92\x1d\x04\x20\x00\x01\x08\x40\xe0\
+\x20\x01\x0c\xc0\x41\x2c\x3c\x09\x01\x08\x40\xa0\x75\x02\xe4\x5f\
+\x3b\x01\x0c\x40\xed\x15\x26\x3f\x08\x40\x00\x02\x10\x80\xc0\x01\
+\x02\x18\x80\x03\x50\x78\x0a\x02\x10\x80\x40\xeb\x04\xc8\xbf\x7e\
+\x02\x18\x80\xfa\x6b\x4c\x86\x10\x80\x00\x04\x20\x00\x81\x5b\x04\
+\x30\x00\xb7\x90\xf0\x04\x04\x20\x00\x81\xd6\x09\x90\x7f\x0b\x04\
+\x30\x00\x2d\x54\x99\x1c\x21\x00\x01\x08\x40\x00\x02\x37\x08\x60\
+\x00\x6e\x00\xe1\x21\x04\x20\x00\x81\xd6\x09\x90\x7f\x1b\x04\x30\
+\x00\x6d\xd4\x99\x2c\x21\x00\x01\x08\x40\x00\x02\x7b\x04\x30\x00\
+\x7b\x38\x78\x00\x01\x08\x40\xa0\x75\x02\xe4\xdf\x0a\x01\x0c\x40\
+\x2b\x95\x26\x4f\x08\x40\x00\x02\x10\x80\xc0\x80\x00\x06\x60\x00\
+\x83\xbb\x10\x80\x00\x04\x5a\x27\x40\xfe\xed\x10\xc0\x00\xb4\x53\
+\x6b\x32\x85\x00\x04\x20\x00\x01\x08\x5c\x11\xc0\x00\x5c\xa1\xe0\
+\x0e\x04\x20\x00\x81\xd6\x09\x90\x7f\x4b\x04\x30\x00\x2d\x55\x9b\
+\x5c\x21\x00\x01\x08\x40\x00\x02\x3b\x02\x18\x80\x1d\x08\x6e\x20\
+\x00\x01\x08\xb4\x4e\x80\xfc\xdb\x22\x80\x01\x68\xab\xde\x64\x0b\
+\x01\x08\x40\x00\x02\x10\xd8\x12\xc0\x00\x6c\x31\xf0\x0b\x02\x10\
+\x80\x40\xeb\x04\xc8\xbf\x35\x02\x18\x80\xd6\x2a\x4e\xbe\x10\x80\
+\x00\x04\x20\x00\x81\x9e\x00\x06\xa0\x87\xc0\x0f\x04\x20\x00\x81\
+\xd6\x09\x90\x7f\x7b\x04\x30\x00\xed\xd5\x9c\x8c\x21\x00\x01\x08\
+\x40\x00\x02\x1d\x06\x80\x83\x00\x02\x10\x80\x40\xf3\x04\x00\xd0\
+\x22\x01\x0c\x40\x8b\x55\x27\x67\x08\x40\x00\x02\x10\x68\x9e\x00\
+\x06\xa0\xf9\x43\x00\x00\x10\x80\x40\xeb\x04\xc8\xbf\x4d\x02\x18\
+\x80\x36\xeb\x4e\xd6\x10\x80\x00\x04\x20\xd0\x38\x01\x0c\x40\xe3\
+\x07\x00\xe9\x43\x00\x02\xad\x13\x20\xff\x56\x09\x60\x00\x5a\xad\
+\x3c\x79\x43\x00\x02\x10\x80\x40\xd3\x04\x30\x00\x4d\x97\x9f\xe4\
+\x21\x00\x81\xd6\x09\x90\x7f\xbb\x04\x30\x00\xed\xd6\x9e\xcc\x21\
+\x00\x01\x08\x40\xa0\x61\x02\x18\x80\x86\x8b\x4f\xea\x10\x80\x40\
+\xeb\x04\xc8\xbf\x65\x02\x18\x80\x96\xab\x4f\xee\x10\x80\x00\x04\
+\x20\xd0\x2c\x01\x0c\x40\xb3\xa5\x27\x71\x08\x40\xa0\x75\x02\xe4\
+\xdf\x36\x81\xff\x0f\x00\x00\xff\xff\x67\x96\x36\xb1\x00\x00\x00\
+\x06\x49\x44\x41\x54\x03\x00\x2d\xd0\xcc\x77\xc0\x9d\x55\x60\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x32\xeb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\xdd\x7f\xb0\xa5\x77\
+\x5d\x1f\xf0\xef\x73\x36\x90\xd0\x2a\xd4\x99\x1a\xeb\x14\xb5\xc5\
+\x38\x4a\xf6\x6c\x0a\x4d\x2d\xda\xd6\x92\xd0\x99\x8a\x0a\xf8\x87\
+\x68\x7f\x90\xbd\x9b\x44\x8a\x58\x71\xa0\xd6\xe2\x00\x7b\x6f\x2e\
+\xf7\x2e\x30\xd0\x19\x1b\x47\x2c\x4a\x31\x64\xef\x86\xfe\x50\xfa\
+\x87\x46\xab\x76\xa6\x24\xd4\x56\xb0\x9a\x42\xd9\xbb\x41\x47\xb0\
+\x15\xe9\xb4\xa0\x33\x16\xed\x94\x04\xb2\xf7\xe9\xf7\x7b\xee\x6e\
+\xb2\xd9\x64\x73\xef\x39\xcf\xcf\xef\xf3\x7d\xdd\x39\xcf\xee\xfd\
+\xf1\x3c\xdf\xef\xe7\xf3\xfa\x9c\xec\x79\xdf\x73\x7f\x64\x16\xbc\
+\x10\x20\x40\x80\x00\x01\x02\xc5\x09\x08\x00\xc5\x8d\x5c\xc3\x04\
+\x08\x10\x20\x40\x20\x04\x01\xc0\xbd\x80\x00\x01\x02\x04\x08\x14\
+\x28\x20\x00\x14\x38\x74\x2d\x13\x20\x40\x80\x40\xd9\x02\xa9\x7b\
+\x01\x20\x29\x38\x08\x10\x20\x40\x80\x40\x61\x02\x02\x40\x61\x03\
+\xd7\x2e\x01\x02\x04\x08\x94\x2e\xb0\xdf\xbf\x00\xb0\xef\xe0\x4f\
+\x02\x04\x08\x10\x20\x50\x94\x80\x00\x50\xd4\xb8\x35\x4b\x80\x00\
+\x01\x02\xa5\x0b\x5c\xec\x5f\x00\xb8\x28\xe1\x6f\x02\x04\x08\x10\
+\x20\x50\x90\x80\x00\x50\xd0\xb0\xb5\x4a\x80\x00\x01\x02\xa5\x0b\
+\x3c\xd6\xbf\x00\xf0\x98\x85\xd7\x08\x10\x20\x40\x80\x40\x31\x02\
+\x02\x40\x31\xa3\xd6\x28\x01\x02\x04\x08\x94\x2e\x70\x69\xff\x02\
+\xc0\xa5\x1a\x5e\x27\x40\x80\x00\x01\x02\x85\x08\x08\x00\x85\x0c\
+\x5a\x9b\x04\x08\x10\x20\x50\xba\xc0\xe3\xfb\x17\x00\x1e\xef\xe1\
+\x2d\x02\x04\x08\x10\x20\x50\x84\x80\x00\x50\xc4\x98\x35\x49\x80\
+\x00\x01\x02\xa5\x0b\x5c\xde\x7f\xaf\x01\x60\x7e\xeb\xc9\x9b\x16\
+\xc7\x89\xf5\xfb\xe6\xe9\x58\x5b\xaf\xe7\xe9\x58\xbc\xbe\xb1\x39\
+\x5f\x8b\x47\x3c\xe7\xf2\x22\xbd\x4d\x80\x00\x01\x02\x04\x08\xb4\
+\x2b\xd0\x4b\x00\x58\x3c\xb0\xc7\x07\xfa\xb0\x57\xdd\xb7\x38\xea\
+\x70\x53\x48\x47\xb8\xf0\xb2\x78\xbd\xbe\x23\x84\x78\xc4\x73\x16\
+\xa1\x20\x86\x81\x0b\x1f\xf5\x17\x01\x02\x04\x08\x10\x20\xd0\x48\
+\xe0\x89\x17\x77\x1a\x00\x2e\x7e\xb6\xbf\x78\x60\x7f\xe2\xde\x07\
+\xbc\xa7\xbe\x43\x10\x38\x80\xc8\x87\x09\x10\x20\x40\x80\xc0\x8a\
+\x02\x9d\x04\x80\x47\x1f\xf8\xe3\x67\xf3\x8f\xfb\x4c\x7f\xa5\x22\
+\x53\x10\xd8\xd8\x5c\xe9\x52\x17\x11\x20\x40\x80\x00\x01\x02\xe1\
+\xc9\x08\x3a\x09\x00\xa1\xae\xee\x08\x8b\xa7\xf5\x43\x4b\x2f\x31\
+\x04\x9c\x58\xbf\xaf\xa5\xc5\x2c\x43\x80\x00\x01\x02\x04\x8a\x17\
+\x68\x3d\x00\xa4\xaf\xf7\xb7\xfb\xe0\x7f\x61\x46\x31\x50\xa4\x6f\
+\x1c\xbc\xf0\x96\xbf\x08\x10\x20\x40\x80\x00\x81\x43\x09\x3c\xf9\
+\x49\xad\x06\x80\xc5\x83\x7f\xfa\x46\xbe\x27\xdf\xab\xf9\x7b\x53\
+\x08\xf0\xcd\x81\xcd\x1d\xad\x40\x80\x00\x01\x02\xc5\x0b\xb4\x16\
+\x00\x3a\x7f\xf0\x7f\x74\x54\xf1\xcb\x01\x42\xc0\xa3\x1a\x5e\x21\
+\x40\x80\x00\x01\x02\x4f\x25\x70\xa5\x8f\xb5\x16\x00\x56\xfb\x4e\
+\xff\x2b\x95\x75\xd0\xfb\xeb\x3b\x0e\x3a\xc3\xc7\x09\x10\x20\x40\
+\x80\x00\x81\x2b\x0b\xb4\x12\x00\xf6\x3f\xfb\xbf\xf2\x26\x5d\x7c\
+\x24\xfd\xa4\x41\x17\xeb\x5a\x93\x00\x01\x02\x04\x08\x4c\x47\xe0\
+\xca\x9d\xb4\x12\x00\x42\x55\xbf\xf0\xca\x5b\x74\xf4\x91\xf4\x93\
+\x06\x1d\x2d\x6d\x59\x02\x04\x08\x10\x20\x30\x75\x81\x76\x02\x40\
+\x1d\x6e\x0a\x7d\xbf\xc4\x3d\x3d\x0b\xd0\x37\xba\xfd\x08\x10\x20\
+\x40\x20\x27\x81\xa7\xaa\xb5\x71\x00\x18\xe2\xe9\xff\x47\x1b\xda\
+\x9b\xf5\x1f\x3c\x1e\xdd\xdc\x2b\x04\x08\x10\x20\x40\x20\x5f\x81\
+\x59\xe3\xd2\x87\x78\xfa\xff\x62\xd1\x43\xee\x7d\xb1\x06\x7f\x13\
+\x20\x40\x80\x00\x81\x51\x0a\x3c\x75\x51\xcd\x03\xc0\x53\xaf\xef\
+\xa3\x04\x08\x10\x20\x40\x80\xc0\x08\x05\x04\x80\x11\x0e\x45\x49\
+\x04\x08\x10\x20\x40\xa0\xa9\xc0\x41\xd7\x37\x0f\x00\x75\x18\xee\
+\xeb\xf0\x43\xee\x1d\xbc\x10\x20\x40\x80\x00\x81\x7c\x05\x9a\x07\
+\x80\x7c\x7b\x57\x39\x01\x02\x04\x08\x10\x98\xa8\xc0\xc1\x6d\x09\
+\x00\x07\x1b\x39\x83\x00\x01\x02\x04\x08\x4c\x4e\x40\x00\x98\xdc\
+\x48\x35\x44\x80\x00\x01\x02\xa5\x0b\x1c\xa6\x7f\x01\xe0\x30\x4a\
+\xce\x21\x40\x80\x00\x01\x02\x13\x13\x10\x00\x26\x36\x50\xed\x10\
+\x20\x40\x80\x40\xe9\x02\x87\xeb\x5f\x00\x38\x9c\x93\xb3\x08\x10\
+\x20\x40\x80\xc0\xa4\x04\x04\x80\x49\x8d\x53\x33\x04\x08\x10\x20\
+\x50\xba\xc0\x61\xfb\x17\x00\x0e\x2b\xe5\x3c\x02\x04\x08\x10\x20\
+\x30\x21\x01\x01\x60\x42\xc3\xd4\x0a\x01\x02\x04\x08\x94\x2e\x70\
+\xf8\xfe\x05\x80\xc3\x5b\x39\x93\x00\x01\x02\x04\x08\x4c\x46\x40\
+\x00\x98\xcc\x28\x35\x42\x80\x00\x01\x02\xa5\x0b\x2c\xd3\xbf\x00\
+\xb0\x8c\x96\x73\x09\x10\x20\x40\x80\xc0\x44\x04\x04\x80\x89\x0c\
+\x52\x1b\x04\x08\x10\x20\x50\xba\xc0\x72\xfd\x0b\x00\xcb\x79\x39\
+\x9b\x00\x01\x02\x04\x08\x4c\x42\x40\x00\x98\xc4\x18\x35\x41\x80\
+\x00\x01\x02\xa5\x0b\x2c\xdb\xbf\x00\xb0\xac\x98\xf3\x09\x10\x20\
+\x40\x80\xc0\x04\x04\x04\x80\x09\x0c\x51\x0b\x04\x08\x10\x20\x50\
+\xba\xc0\xf2\xfd\x0b\x00\xcb\x9b\xb9\x82\x00\x01\x02\x04\x08\x64\
+\x2f\x20\x00\x64\x3f\x42\x0d\x10\x20\x40\x80\x40\xe9\x02\xab\xf4\
+\x2f\x00\xac\xa2\xe6\x1a\x02\x04\x08\x10\x20\x90\xb9\x80\x00\x90\
+\xf9\x00\x95\x4f\x80\x00\x01\x02\xa5\x0b\xac\xd6\xbf\x00\xb0\x9a\
+\x9b\xab\x08\x10\x20\x40\x80\x40\xd6\x02\x02\x40\xd6\xe3\x53\x3c\
+\x01\x02\x04\x08\x94\x2e\xb0\x6a\xff\x02\xc0\xaa\x72\xae\x23\x40\
+\x80\x00\x01\x02\x19\x0b\x08\x00\x19\x0f\x4f\xe9\x04\x08\x10\x20\
+\x50\xba\xc0\xea\xfd\x0b\x00\xab\xdb\xb9\x92\x00\x01\x02\x04\x08\
+\x64\x2b\x20\x00\x64\x3b\x3a\x85\x13\x20\x40\x80\x40\xe9\x02\x4d\
+\xfa\x17\x00\x9a\xe8\xb9\x96\x00\x01\x02\x04\x08\x64\x2a\x20\x00\
+\x64\x3a\x38\x65\x13\x20\x40\x80\x40\xe9\x02\xcd\xfa\x17\x00\x9a\
+\xf9\xb9\x9a\x00\x01\x02\x04\x08\x64\x29\x20\x00\x64\x39\x36\x45\
+\x13\x20\x40\x80\x40\xe9\x02\x4d\xfb\x17\x00\x9a\x0a\xba\x9e\x00\
+\x01\x02\x04\x08\x64\x28\x20\x00\x64\x38\x34\x25\x13\x20\x40\x80\
+\x40\xe9\x02\xcd\xfb\x17\x00\x9a\x1b\x5a\x81\x00\x01\x02\x04\x08\
+\x64\x27\x20\x00\x64\x37\x32\x05\x13\x20\x40\x80\x40\xe9\x02\x6d\
+\xf4\x2f\x00\xb4\xa1\x68\x0d\x02\x04\x08\x10\x20\x90\x99\x80\x00\
+\x90\xd9\xc0\x94\x4b\x80\x00\x01\x02\xa5\x0b\xb4\xd3\xbf\x00\xd0\
+\x8e\xa3\x55\x08\x10\x20\x40\x80\x40\x56\x02\x02\x40\x56\xe3\x52\
+\x2c\x01\x02\x04\x08\x94\x2e\xd0\x56\xff\x02\x40\x5b\x92\xd6\x21\
+\x40\x80\x00\x01\x02\x19\x09\x08\x00\x19\x0d\x4b\xa9\x04\x08\x10\
+\x20\x50\xba\x40\x7b\xfd\x0b\x00\xed\x59\x5a\x89\x00\x01\x02\x04\
+\x08\x64\x23\x20\x00\x64\x33\x2a\x85\x12\x20\x40\x80\x40\xe9\x02\
+\x6d\xf6\x2f\x00\xb4\xa9\x69\x2d\x02\x04\x08\x10\x20\x90\x89\x80\
+\x00\x90\xc9\xa0\x94\x49\x80\x00\x01\x02\xa5\x0b\xb4\xdb\xbf\x00\
+\xd0\xae\xa7\xd5\x08\x10\x20\x40\x80\x40\x16\x02\x02\x40\x16\x63\
+\x52\x24\x01\x02\x04\x08\x94\x2e\xd0\x76\xff\x02\x40\xdb\xa2\xd6\
+\x23\x40\x80\x00\x01\x02\x19\x08\x08\x00\x19\x0c\x49\x89\x04\x08\
+\x10\x20\x50\xba\x40\xfb\xfd\x0b\x00\xed\x9b\x5a\x91\x00\x01\x02\
+\x04\x08\x8c\x5e\x40\x00\x18\xfd\x88\x14\x48\x80\x00\x01\x02\xa5\
+\x0b\x74\xd1\xbf\x00\xd0\x85\xaa\x35\x09\x10\x20\x40\x80\xc0\xc8\
+\x05\x04\x80\x91\x0f\x48\x79\x04\x08\x10\x20\x50\xba\x40\x37\xfd\
+\x0b\x00\xdd\xb8\x5a\x95\x00\x01\x02\x04\x08\x8c\x5a\x40\x00\x18\
+\xf5\x78\x14\x47\x80\x00\x01\x02\xa5\x0b\x74\xd5\xbf\x00\xd0\x95\
+\xac\x75\x09\x10\x20\x40\x80\xc0\x88\x05\x04\x80\x11\x0f\x47\x69\
+\x04\x08\x10\x20\x50\xba\x40\x77\xfd\x0b\x00\xdd\xd9\x5a\x99\x00\
+\x01\x02\x04\x08\x8c\x56\x40\x00\x18\xed\x68\x14\x46\x80\x00\x01\
+\x02\xa5\x0b\x74\xd9\xbf\x00\xd0\xa5\xae\xb5\x09\x10\x20\x40\x80\
+\xc0\x48\x05\x04\x80\x91\x0e\x46\x59\x04\x08\x10\x20\x50\xba\x40\
+\xb7\xfd\x0b\x00\xdd\xfa\x5a\x9d\x00\x01\x02\x04\x08\x8c\x52\x40\
+\x00\x18\xe5\x58\x14\x45\x80\x00\x01\x02\xa5\x0b\x74\xdd\xbf\x00\
+\xd0\xb5\xb0\xf5\x09\x10\x20\x30\x01\x81\xe7\xdf\xf6\x86\x2f\x3f\
+\x76\xfc\xe4\xb7\xcf\x8f\x9f\x7c\xc3\xfc\xf8\xfa\xe9\xa3\xc7\xd7\
+\xff\xe3\x7c\x6d\xfd\x13\xf1\xf8\xa3\x78\x7c\x31\x1e\x75\x06\xc7\
+\xf9\x58\xe3\x9f\xc4\xe3\x53\xb1\x87\xff\x72\x74\x6d\xfd\x67\xe7\
+\x27\x36\x4e\xc5\x5e\xfe\xee\xf5\xb7\x6c\x5e\x37\x81\x31\x2d\xd5\
+\x82\x00\xb0\x14\x97\x93\x09\x10\x20\x50\x8e\xc0\xb1\xe3\xeb\x2f\
+\x9c\xaf\x6d\xbc\x63\xbe\x76\xf2\x23\x5f\x3c\x7f\xd5\x67\xeb\xaa\
+\xfa\xc5\x50\x55\x6f\x0d\x55\x58\xab\xaa\xf0\x2d\x51\xe2\x6b\xe3\
+\xf1\x67\xe2\x71\x55\x3c\x72\xb8\xa5\xc7\xbc\x2f\x89\x85\x7e\x55\
+\xec\xe1\x1b\xab\x10\x5e\x1e\xea\xfa\x4d\xb1\x97\x7f\x35\x9b\x9d\
+\xff\x9d\xf9\xda\xfa\xef\xcd\xd7\x4e\xde\x75\xc3\xda\xc9\x97\xdf\
+\xf8\xaa\x9f\x7a\x5a\x3c\x6f\xc0\x5b\xf7\x5b\x27\x8c\xee\x77\xb1\
+\x03\x01\x02\x04\x08\x64\x21\x90\x3e\x13\x9e\x1f\x3f\x79\x6a\xbe\
+\xb6\xfe\xbb\x75\x15\xee\x0f\xa1\xfe\x27\x21\x54\xcf\x0b\x65\xbc\
+\x7c\x75\x08\xd5\x6d\x7b\xa1\xfa\xd9\x87\x1f\xfa\xf4\xe7\xa2\xc1\
+\x4f\xa7\x10\x14\x26\xfa\x22\x00\x4c\x74\xb0\xda\x22\x40\x80\xc0\
+\x32\x02\xd7\x1f\x5f\x7f\x41\x7c\x4a\xfc\x7d\xe9\x33\xe1\x50\x55\
+\x6f\x8a\xd7\xfe\xc5\x78\x94\x7c\x7b\x46\x6c\xfe\xf6\x14\x82\xe2\
+\xb3\x20\xbf\x3a\x3f\xb1\xfe\x3d\xf1\xed\xde\x6e\x7d\x6c\x24\x00\
+\xf4\xa1\x6c\x0f\x02\x04\x08\x8c\x54\xe0\x86\x5b\x4e\x7e\x7d\xfc\
+\x4c\xf7\xcc\xac\x0a\x1f\xae\x42\xf8\xfb\x23\x2d\x73\xe0\xb2\xea\
+\xbf\x11\xea\xf0\x6f\x62\x10\xf8\xcf\xc7\x8e\x9f\xfc\xf6\x81\x8b\
+\x69\x6d\x7b\x01\xa0\x35\x4a\x0b\x11\x20\x40\x20\x2f\x81\x63\xc7\
+\xd7\x37\xf6\x66\xd5\x6f\xc5\xaa\x6f\x89\x87\xdb\x81\x02\xf5\x5f\
+\xab\xab\xea\x17\x53\x60\xfa\x4b\x6b\x6f\xfa\xf3\x07\x9e\xbe\xf2\
+\x09\xfd\x5c\x28\x00\xf4\xe3\x6c\x17\x02\x04\x08\x8c\x46\x20\x7d\
+\x83\xdb\xfc\xc4\xc6\x87\xea\x2a\xbc\x79\x34\x45\xe5\x55\xc8\x2d\
+\xe7\xeb\xea\xdc\xd1\x13\xeb\x6b\x79\x95\xfd\xf8\x6a\x05\x80\xc7\
+\x7b\x78\x8b\x00\x01\x02\x93\x16\x98\xdf\xfa\xa6\xe3\x0f\x3f\xf4\
+\xe9\x2f\x84\xba\xfe\xa6\x49\x37\xda\x75\x73\x55\xf5\xac\xaa\x0e\
+\xa7\x8f\x9d\xd8\x78\x67\xdb\x5b\xf5\xb5\x9e\x00\xd0\x97\xb4\x7d\
+\x08\x10\x20\x30\xb0\xc0\xe2\x33\xd6\xbd\xd9\xce\xc0\x65\x4c\x6a\
+\xfb\xba\xae\x7f\xe0\xd8\xda\xc9\xff\x30\x7f\xe5\x1b\xbf\x22\xb7\
+\xc6\x04\x80\xdc\x26\xa6\x5e\x02\x04\x08\xac\x20\x30\x5f\x5b\xff\
+\x17\xe9\x33\xd6\x15\x2e\x75\xc9\x01\x02\x75\xa8\x5e\x14\xbe\x70\
+\xe4\xfe\xeb\x5f\xf1\x86\xeb\x0f\x38\xf5\x10\x1f\xee\xef\x14\x01\
+\xa0\x3f\x6b\x3b\x11\x20\x40\x60\x10\x81\xf9\xda\xc9\x3b\xe2\xc6\
+\xaf\x8c\x87\x5b\x77\x02\xdf\x30\x3b\x72\xd5\xaf\xcc\xd7\x36\x6f\
+\xe8\x6e\x8b\x76\x57\x16\x00\xda\xf5\xb4\x1a\x01\x02\x04\x46\x25\
+\x10\x9f\x9e\xbe\x3b\x84\x6a\x33\x78\xe9\x43\xe0\xd9\x21\x9c\xff\
+\xf9\xe7\xde\x7a\xf2\xeb\x56\xdd\xac\xcf\xeb\x04\x80\x3e\xb5\xed\
+\x45\x80\x00\x81\x1e\x05\xe6\xc7\xd7\x5f\x1d\x9f\x9e\x3e\xd1\xe3\
+\x96\xb6\x0a\xe1\x6b\x8e\xec\x85\x9f\xf9\xfa\xdb\x5f\xff\xa5\x63\
+\xc7\x10\x00\xc6\x3e\x21\xf5\x11\x20\x40\x60\x05\x81\x63\x6b\xeb\
+\xaf\x09\x55\x78\xd7\x0a\x97\xba\xa4\xb1\x40\xf5\xbc\xab\x1e\xb9\
+\xfa\xcc\xf2\xcb\xf4\x7b\x85\x00\xd0\xaf\xb7\xdd\x08\x10\x20\xd0\
+\xb9\xc0\x73\x6f\x79\xe3\x57\xd6\x21\xfc\x78\xe7\x1b\xd9\xe0\x8a\
+\x02\x55\x08\xdf\x79\x74\x6d\x63\xeb\x8a\x27\x8c\xe0\x03\x02\xc0\
+\x08\x86\xa0\x04\x02\x04\x08\xb4\x25\x70\xe3\xab\x36\xff\xd4\x6c\
+\x76\xe4\xd7\xda\x5a\xcf\x3a\xab\x0b\x54\xa1\x5e\xbf\xfe\x96\x93\
+\x2f\x3e\xec\x0a\x7d\x9f\x27\x00\xf4\x2d\x6e\x3f\x02\x04\x08\x74\
+\x28\xf0\xd0\xc3\xe7\xff\x59\xfc\xec\xf3\x2f\x74\xb8\x85\xa5\x97\
+\x10\x98\xcd\xaa\x1f\x5d\xe2\xf4\x5e\x4f\x15\x00\x7a\xe5\xb6\x19\
+\x01\x02\x04\xba\x13\x38\x7a\x7c\xe3\x5b\xab\x3a\xbc\xaa\xbb\x1d\
+\xac\xbc\x82\xc0\x73\xe7\x27\x36\x4e\x1d\x7c\x5d\xff\x67\x08\x00\
+\xfd\x9b\xdb\x91\x00\x01\x02\x9d\x08\x54\xd5\x9e\x1f\xf7\xeb\x44\
+\xb6\xe1\xa2\x75\xfd\xa6\xf4\x7f\x5d\x6c\xb8\x4a\xeb\x97\x0b\x00\
+\xad\x93\x5a\x90\x00\x01\x02\xfd\x0b\x1c\x5d\x7b\xd3\x89\x10\x2a\
+\xbf\xdf\x3f\x8c\xf3\x65\x6f\x36\xfb\x91\xa7\xaa\x6c\x88\x8f\x09\
+\x00\x43\xa8\xdb\x93\x00\x01\x02\x2d\x0b\x54\xa1\xfa\xa1\x96\x97\
+\xb4\x5c\xab\x02\xf5\x6d\xd7\x9f\x58\x3f\xda\xea\x92\x0d\x17\x13\
+\x00\x1a\x02\xba\x9c\x00\x01\x02\x43\x0b\x1c\x3d\xb1\xf1\x5d\x21\
+\x54\xd9\xfc\x0a\xda\x50\xe8\xcb\xac\x0e\xff\xf0\xc9\x5b\x1f\xe6\
+\xbd\x02\xc0\x30\xee\x76\x25\x40\x80\x40\x7b\x02\x75\xfd\xbd\xed\
+\x2d\x66\xa5\x0e\x05\x5e\x39\xa6\xdf\x10\x28\x00\x74\x38\x69\x4b\
+\x13\x20\x40\xa0\x6b\x81\xf4\x7b\xe7\xab\x10\xbe\xad\xeb\x7d\xac\
+\xdf\x8a\xc0\xd3\x9f\xf6\xc5\xab\x5f\x71\xf9\x4a\x43\xbd\x2d\x00\
+\x0c\x25\x6f\x5f\x02\x04\x08\xb4\x20\x70\xa4\x0e\x2f\x6f\x61\x19\
+\x4b\xf4\x24\x50\x55\xe1\xbb\x7b\xda\xea\xc0\x6d\x04\x80\x03\x89\
+\x9c\x40\x80\x00\x81\x11\x0b\xd4\xb3\x97\x8d\xb8\x3a\xa5\x5d\x26\
+\x50\x87\xf0\xa2\xeb\x6f\xdd\xfc\x73\x8f\xbd\x7b\xb8\xd7\x04\x80\
+\xe1\xec\xed\x4c\x80\x00\x81\x46\x02\xcf\xbd\xe5\x8d\x5f\x19\x42\
+\xed\x47\xff\x1a\x29\xf6\x7f\x71\x55\x9f\xff\xdb\xfd\xef\xfa\xc4\
+\x1d\x05\x80\x27\x9a\x78\x0f\x01\x02\x04\xb2\x10\x98\x5d\x75\xe4\
+\x85\x59\x14\xaa\xc8\xc7\x09\x54\x75\x7d\xd3\xc5\x77\x0c\xf9\xb7\
+\x00\x30\xa4\xbe\xbd\x09\x10\x20\xd0\x40\xa0\x3a\x1f\xbe\xb9\xc1\
+\xe5\x2e\x1d\x4c\x60\x36\x8a\xb9\x09\x00\x83\xdd\x01\x6c\x4c\x80\
+\x00\x81\x86\x02\x55\xfd\x97\x1b\xae\xe0\xf2\x41\x04\xea\x6f\xb8\
+\xe1\x87\x7f\xf8\x4f\x87\x30\xc8\xe6\x8f\x6e\x2a\x00\x3c\x4a\xe1\
+\x15\x02\x04\x08\xe4\x26\x50\x1d\xcd\xad\x62\xf5\xee\x0b\xcc\xfe\
+\xf0\x4b\xbe\x6e\xff\xb5\xe1\xfe\x14\x00\x86\xb3\xb7\x33\x01\x02\
+\x04\x56\x16\xb8\xf1\x55\x9b\x7f\x36\x5e\xfc\x65\xf1\x70\xcb\x50\
+\x60\xaf\xde\xfb\xda\xa1\xcb\x16\x00\x86\x9e\x80\xfd\x09\x10\x20\
+\xb0\x82\xc0\xe7\xbf\x10\x9e\xbd\xc2\x65\xad\x5f\x52\x57\xe1\xdd\
+\x7b\x55\x98\xef\xee\x6c\x57\x63\x3f\x9e\x76\xe4\x91\x6b\x63\xbd\
+\x3f\x52\x85\x70\xbe\x75\x88\x65\x17\xac\x87\x9f\x9f\x00\xb0\xec\
+\xd0\x9c\x4f\x80\x00\x81\x11\x08\xcc\xea\x47\xae\x1d\xba\x8c\xaa\
+\x0e\xa7\xce\x9d\xde\xfe\xbe\x07\x4f\x6f\x9f\x1b\xba\x96\xc3\xec\
+\xff\x91\xf7\xbe\xed\x0f\x62\xbd\xef\xa8\xab\xea\x3b\x0f\x73\x7e\
+\x97\xe7\xec\x55\xe1\xcb\xbb\x5c\xff\x30\x6b\x0b\x00\x87\x51\x72\
+\x0e\x01\x02\x04\x46\x26\xb0\x57\x87\x67\x0e\x5c\xd2\xef\x9f\x3d\
+\xb3\xbd\x3e\x70\x0d\x2b\x6d\xbf\x7b\x7a\xeb\x17\xe3\x85\xf7\xc4\
+\x63\xb0\x5b\x35\xfc\xfc\x82\x00\x30\xd8\xf8\x6d\x4c\x80\x00\x81\
+\xd5\x05\x8e\xec\xd5\x57\xaf\x7e\x75\x1b\x57\xd6\x1f\x6e\x63\x95\
+\xc1\xd6\xa8\xaa\xfb\x07\xdb\x3b\x84\x10\xf7\xbe\x26\x1e\x83\xde\
+\x04\x80\x41\xf9\x6d\x4e\x80\x00\x81\xd5\x04\xea\xd9\xac\x5a\xed\
+\xca\xb6\xae\xaa\x1e\x6e\x6b\xa5\x41\xd6\xa9\xeb\xbc\xeb\x6f\x01\
+\x4d\x00\x68\x01\xd1\x12\x04\x08\x10\x20\x40\xe0\xf0\x02\xe3\x38\
+\x53\x00\x18\xc7\x1c\x54\x41\x80\x00\x01\x02\x04\x7a\x15\x10\x00\
+\x7a\xe5\xb6\x19\x01\x02\x04\x08\x94\x2e\x30\x96\xfe\x05\x80\xb1\
+\x4c\x42\x1d\x04\x08\x10\x20\x40\xa0\x47\x01\x01\xa0\x47\x6c\x5b\
+\x11\x20\x40\x80\x40\xe9\x02\xe3\xe9\x5f\x00\x18\xcf\x2c\x54\x42\
+\x80\x00\x01\x02\x04\x7a\x13\x10\x00\x7a\xa3\xb6\x11\x01\x02\x04\
+\x08\x94\x2e\x30\xa6\xfe\x05\x80\x31\x4d\x43\x2d\x04\x08\x10\x20\
+\x40\xa0\x27\x01\x01\xa0\x27\x68\xdb\x10\x20\x40\x80\x40\xe9\x02\
+\xe3\xea\x5f\x00\x18\xd7\x3c\x54\x43\x80\x00\x01\x02\x04\x7a\x11\
+\x10\x00\x7a\x61\xb6\x09\x01\x02\x04\x08\x94\x2e\x30\xb6\xfe\x05\
+\x80\xb1\x4d\x44\x3d\x04\x08\x10\x20\x40\xa0\x07\x01\x01\xa0\x07\
+\x64\x5b\x10\x20\x40\x80\x40\xe9\x02\xe3\xeb\x5f\x00\x18\xdf\x4c\
+\x54\x44\x80\x00\x01\x02\x04\x3a\x17\x10\x00\x3a\x27\xb6\x01\x01\
+\x02\x04\x08\x94\x2e\x30\xc6\xfe\x05\x80\x31\x4e\x45\x4d\x04\x08\
+\x10\x20\x40\xa0\x63\x01\x01\xa0\x63\x60\xcb\x13\x20\x40\x80\x40\
+\xe9\x02\xe3\xec\x5f\x00\x18\xe7\x5c\x54\x45\x80\x00\x01\x02\x04\
+\x3a\x15\x10\x00\x3a\xe5\xb5\x38\x01\x02\x04\x08\x94\x2e\x30\xd6\
+\xfe\x05\x80\xb1\x4e\x46\x5d\x04\x08\x10\x20\x40\xa0\x43\x01\x01\
+\xa0\x43\x5c\x4b\x13\x20\x40\x80\x40\xe9\x02\xe3\xed\x5f\x00\x18\
+\xef\x6c\x54\x46\x80\x00\x01\x02\x04\x3a\x13\x10\x00\x3a\xa3\xb5\
+\x30\x01\x02\x04\x08\x94\x2e\x30\xe6\xfe\x05\x80\x31\x4f\x47\x6d\
+\x04\x08\x10\x20\x40\xa0\x23\x01\x01\xa0\x23\x58\xcb\x12\x20\x40\
+\x80\x40\xe9\x02\xe3\xee\x5f\x00\x18\xf7\x7c\x54\x47\x80\x00\x01\
+\x02\x04\x3a\x11\x10\x00\x3a\x61\xb5\x28\x01\x02\x04\x08\x94\x2e\
+\x30\xf6\xfe\x05\x80\xb1\x4f\x48\x7d\x04\x5a\x14\xb8\xe1\xf8\xfa\
+\x0b\xe6\xb7\xae\xbf\xfa\xe8\xda\xfa\x8f\x1f\x3b\xbe\xfe\x4b\xf3\
+\xb5\x8d\xb3\xf3\xb5\xf5\xcf\xcc\xd7\x4e\x3e\x34\x5f\x5b\xaf\xf3\
+\x38\x16\xb5\xc6\x9a\x37\xce\xa6\x1e\x52\x2f\xa9\xa7\xd4\x5b\x8b\
+\x54\x96\x22\x30\x79\x01\x01\x60\xf2\x23\xd6\x60\xc9\x02\xc7\x6e\
+\xdf\x7c\x4e\x7c\x90\x7f\x6d\x7a\xa0\x9c\xc7\x07\xf9\xbd\x2a\x7c\
+\x38\xec\x85\x77\x55\x21\xbc\xa6\xae\xc2\x8b\x43\xa8\xe7\xd1\xe7\
+\xda\x10\xaa\xab\x43\x36\x2f\x8b\x5a\x63\xcd\xf5\x3c\xf5\x90\x7a\
+\x49\x3d\xa5\xde\x52\x8f\xfb\xbd\x6e\xbc\x36\xf5\x9e\x4d\x4b\x0a\
+\x9d\xa0\xc0\xf8\x5b\x12\x00\xc6\x3f\x23\x15\x12\x58\x5a\xe0\xd8\
+\x89\x8d\xdb\xe6\x6b\xeb\x1f\xa8\x1f\x39\xff\xc9\xf8\x20\x7f\x67\
+\x7a\xa0\x0c\x59\x3d\xc8\x87\x15\x5f\xaa\xab\xf7\x7b\xad\xef\x4c\
+\xbd\x27\x83\x64\xb1\xe2\x62\x2e\x23\x30\x69\x01\x01\x60\xd2\xe3\
+\xd5\x5c\x49\x02\xd7\xbd\x62\xf3\x99\xf1\xb3\xdf\x8d\xf8\xa0\xf7\
+\x99\xba\xae\xef\x8a\xbd\xdf\x1c\x8f\xd2\x6f\x37\x27\x8b\x64\x92\
+\x6c\x92\x51\xe9\x20\xfa\xef\x47\x20\x87\x5d\x04\x80\x1c\xa6\xa4\
+\x46\x02\x07\x08\x1c\x3d\xb1\xfe\xfa\x6b\xae\x3a\xff\xa9\xf8\xd9\
+\xef\x9b\xe3\xa9\xf1\xe9\xf1\xf8\xa7\xdb\xa5\x02\xd7\x26\x9b\x64\
+\x94\xac\x2e\xfd\x80\xd7\x09\x94\x2a\x20\x00\x94\x3a\x79\x7d\x4f\
+\x42\x60\xbe\x76\xf2\x25\xf1\x6b\xfc\x67\xab\x3a\xbc\x3d\xd4\xe1\
+\x59\x93\x68\xaa\xcb\x26\xa2\x51\xb2\x4a\x66\xc9\xae\xcb\xad\xac\
+\x5d\xb2\x40\x1e\xbd\x0b\x00\x79\xcc\x49\x95\x04\x9e\x20\x90\xbe\
+\xfb\x3d\x84\xea\xde\xf8\x35\xfe\xf4\x8d\x7c\xc1\xcb\x32\x02\xe9\
+\x9b\x1f\xab\x7b\xf7\x0d\x97\xb9\xce\xb9\x04\xa6\x23\x20\x00\x4c\
+\x67\x96\x3a\x29\x44\xe0\xfa\x5b\x37\x9f\x37\x5f\x5b\xff\xcd\xc5\
+\x77\xbf\x17\xd2\x73\x57\x6d\x26\xc3\x64\x99\x4c\xbb\xda\xc3\xba\
+\xe5\x09\xe4\xd2\xb1\x00\x90\xcb\x29\x4b\x33\xe0\x00\x00\x10\x00\
+\x49\x44\x41\x54\xa4\xd4\x49\x20\x0a\x1c\x3d\xb1\xf1\x5d\xb3\xbd\
+\xf3\x1f\x8a\xaf\xde\x18\x0f\xb7\x76\x04\x6e\x4c\xa6\xc9\xb6\x9d\
+\xe5\xac\x42\x20\x0f\x01\x01\x20\x8f\x39\xa9\x92\x40\x98\x1f\x5f\
+\x7f\x75\x55\xd7\xef\x8f\x14\xd7\xc4\xc3\xad\x5d\x81\x6b\x92\x6d\
+\x32\x6e\x77\x59\xab\x95\x27\x90\x4f\xc7\x02\x40\x3e\xb3\x52\x69\
+\xc1\x02\xf3\xb5\x8d\xd7\x86\x2a\xbc\xab\x60\x82\x7e\x5a\x8f\xc6\
+\x0b\xeb\x7e\x76\xb3\x0b\x81\x41\x05\x04\x80\x41\xf9\x6d\x4e\xe0\
+\x60\x81\xfd\xcf\x4a\xeb\x3b\x0f\x3e\xd3\x19\xed\x08\xd4\x77\xee\
+\x9b\xb7\xb3\x9a\x55\xca\x12\xc8\xa9\x5b\x01\x20\xa7\x69\xa9\xb5\
+\x38\x81\xc5\xd7\xa5\xe3\x67\xa5\xc5\x35\x3e\x74\xc3\xd1\x7c\x61\
+\x3f\x74\x1d\xf6\x27\xd0\xa1\x80\x00\xd0\x21\xae\xa5\x09\x34\x11\
+\x48\xdf\x99\x5e\xd5\xf5\x3d\x4d\xd6\x70\xed\xea\x02\xc9\x3e\xcd\
+\x60\xf5\x15\x5c\x59\x9e\x40\x5e\x1d\x0b\x00\x79\xcd\x4b\xb5\x05\
+\x09\xcc\xf6\xce\xbf\x27\xb6\xeb\x1b\xfe\x22\xc2\x40\xb7\x6b\x2e\
+\xcc\x60\xa0\xed\x6d\x4b\xa0\x5b\x01\x01\xa0\x5b\x5f\xab\x13\x58\
+\x49\xe0\xc2\x2f\xa8\xf1\xa3\x7e\x2b\xe9\xb5\x7a\xd1\x8d\x17\x66\
+\xd1\xea\xa2\x16\x9b\xa6\x40\x6e\x5d\x09\x00\xb9\x4d\x4c\xbd\x93\
+\x17\x98\xaf\x9d\x7c\x49\xfa\x05\x35\x93\x6f\x34\x93\x06\xd3\x2c\
+\xd2\x4c\x32\x29\x57\x99\x04\x0e\x2d\x20\x00\x1c\x9a\xca\x89\x04\
+\xfa\x12\x98\xbd\xad\xaf\x9d\xec\x73\x58\x01\x33\x39\xac\x54\xb9\
+\xe7\xe5\xd7\xb9\x00\x90\xdf\xcc\x54\x3c\x61\x81\xfd\xff\x53\x5d\
+\xed\x77\xfb\x8f\x6e\xc6\xf5\x7c\x7f\x36\xa3\x2b\x4c\x41\x04\x56\
+\x16\x10\x00\x56\xa6\x73\x21\x81\x76\x05\xae\x7b\xc5\xe6\x33\xe3\
+\xd3\xcd\x6f\x6c\x77\x55\xab\xb5\x25\x90\x66\x93\x66\xd4\xd6\x7a\
+\xd6\x99\x96\x40\x8e\xdd\x08\x00\x39\x4e\x4d\xcd\x93\x14\x78\xc6\
+\xec\xfc\xeb\x42\x1d\x9e\x35\xc9\xe6\xa6\xd0\x54\x9c\xcd\x62\x46\
+\x53\xe8\x45\x0f\x04\xa2\x80\x00\x10\x11\xdc\x08\x8c\x41\xa0\xae\
+\xc2\x0f\x8c\xa1\x0e\x35\x5c\x59\xc0\x8c\xae\x6c\x53\xf6\x47\xf2\
+\xec\x5e\x00\xc8\x73\x6e\xaa\x9e\x98\xc0\xb1\x13\x1b\xb7\xc5\x96\
+\xae\x8d\x87\xdb\xb8\x05\xae\xbd\x30\xab\x71\x57\xa9\x3a\x02\x87\
+\x10\x10\x00\x0e\x81\xe4\x14\x02\x5d\x0b\xd4\x75\x7d\xbc\xeb\x3d\
+\xac\xdf\x8e\x80\x59\xb5\xe3\x38\xa5\x55\x72\xed\x45\x00\xc8\x75\
+\x72\xea\x9e\x8c\xc0\xb1\xdb\x37\x9f\x13\x9b\xb9\x39\x1e\x6e\x79\
+\x08\xdc\x7c\x61\x66\x79\x54\xab\x4a\x02\x57\x10\x10\x00\xae\x00\
+\xe3\xdd\x04\xfa\x12\xa8\x1f\xd9\x7b\x69\x5f\x7b\xd9\xa7\x1d\x01\
+\x33\x6b\xc7\x71\x1a\xab\xe4\xdb\x85\x00\x90\xef\xec\x54\x3e\x11\
+\x81\xaa\xae\x5f\x3c\x91\x56\x8a\x69\xc3\xcc\x8a\x19\x75\x67\x8d\
+\xd6\xa1\x7e\x46\x67\x8b\x1f\x72\x61\x01\xe0\x90\x50\x4e\x23\xd0\
+\x95\x40\x5d\xd5\x9e\xfe\xef\x0a\xb7\xa3\x75\xcd\xac\x23\xd8\x0c\
+\x97\xcd\xb9\x64\x01\x20\xe7\xe9\xa9\x3d\x7b\x81\x1b\x8e\xaf\xbf\
+\x20\x84\xea\xea\xe0\x25\x33\x81\xea\xea\xfd\xd9\x65\x56\xb6\x72\
+\x09\x5c\x22\x20\x00\x5c\x82\xe1\x55\x02\x7d\x0b\xec\x1d\x09\xcf\
+\xef\x7b\x4f\xfb\xb5\x23\x60\x76\xed\x38\xe6\xbd\x4a\xde\xd5\x0b\
+\x00\x79\xcf\x4f\xf5\x99\x0b\xd4\x7b\xe1\x68\xe6\x2d\x14\x5b\xbe\
+\xd9\x15\x3b\xfa\xc9\x34\x2e\x00\x4c\x66\x94\x1a\xc9\x51\x60\x56\
+\x87\xeb\x72\xac\x5b\xcd\x21\x98\x9d\x7b\x41\xee\x02\x02\x40\xee\
+\x13\x54\x7f\xd6\x02\x75\x55\x3d\x7b\xf0\x06\xea\xf0\x1b\x75\x5d\
+\xbd\x6c\x77\x67\x6b\xb6\xbb\xb3\x5d\x8d\xfb\xd8\x9a\xa5\x5a\x43\
+\xac\x79\x68\xb7\x51\xcc\x6e\x68\x04\xfb\x67\x2d\x20\x00\x64\x3d\
+\x3e\xc5\xe7\x2f\x50\x0f\xfb\xeb\x7f\xe3\x03\xe9\xee\x99\xad\x17\
+\x9c\x3b\xb3\x75\x6f\x08\x55\x1d\x46\xff\x52\xd5\xa9\xd6\x54\xf3\
+\xf0\x21\x60\xe0\xd9\x8d\x7e\x56\x53\x2f\x30\xff\xfe\x04\x80\xfc\
+\x67\xa8\x83\xac\x05\xea\x41\xff\xef\x7f\x75\xa8\xb6\x43\x16\x0f\
+\xfc\xe1\xb2\x97\xaa\xde\xaf\xfd\xb2\x77\xf7\xfa\x66\x3d\xe8\xec\
+\x7a\x6d\xd5\x66\x93\x14\x10\x00\x26\x39\x56\x4d\xe5\x23\x30\xec\
+\x8f\x00\x9e\x3b\xf3\xe6\x5f\xc8\xc7\xea\xf1\x95\x0e\x5f\xfb\xb0\
+\xb3\x7b\xbc\x86\xb7\xfa\x16\x98\xc2\x7e\x02\xc0\x14\xa6\xa8\x07\
+\x02\x2b\x0b\xe4\xf0\xb4\xff\x95\x9a\xcb\xb9\xf6\x2b\xf5\xe4\xfd\
+\x04\xfa\x13\x10\x00\xfa\xb3\xb6\x13\x01\x02\x04\x08\x4c\x42\x60\
+\x1a\x4d\x08\x00\xd3\x98\xa3\x2e\x08\x10\x20\x40\x80\xc0\x52\x02\
+\x02\xc0\x52\x5c\x4e\x26\x40\x80\x00\x81\xd2\x05\xa6\xd2\xbf\x00\
+\x30\x95\x49\xea\x83\x00\x01\x02\x04\x08\x2c\x21\x20\x00\x2c\x81\
+\xe5\x54\x02\x04\x08\x10\x28\x5d\x60\x3a\xfd\x0b\x00\xd3\x99\xa5\
+\x4e\x08\x10\x20\x40\x80\xc0\xa1\x05\x04\x80\x43\x53\x39\x91\x00\
+\x01\x02\x04\x4a\x17\x98\x52\xff\x02\xc0\x94\xa6\xa9\x17\x02\x04\
+\x08\x10\x20\x70\x48\x01\x01\xe0\x90\x50\x4e\x23\x40\x80\x00\x81\
+\xd2\x05\xa6\xd5\xbf\x00\x30\xad\x79\xea\x86\x00\x01\x02\x04\x08\
+\x1c\x4a\x40\x00\x38\x14\x93\x93\x08\x10\x20\x40\xa0\x74\x81\xa9\
+\xf5\x2f\x00\x64\x36\xd1\x1b\x8e\xaf\xbf\x60\x7e\xeb\xfa\xab\x8f\
+\xae\xad\xff\xf8\xb1\xe3\xeb\xbf\x34\x5f\xdb\x38\x3b\x5f\x5b\xff\
+\xcc\x7c\xed\xe4\x43\xf3\xb5\xf5\x3a\x8f\x63\x51\x6b\xac\x79\xe3\
+\x6c\xea\x21\xf5\x92\x7a\x4a\xbd\x65\x36\x0e\xe5\x12\x20\x40\x20\
+\x5b\x01\x01\x60\xe4\xa3\x3b\x76\xfb\xe6\x73\xe2\x83\xfc\x6b\xd3\
+\x03\xe5\x3c\x3e\xc8\xef\x55\xe1\xc3\x61\x2f\xbc\xab\x0a\xe1\x35\
+\x75\x15\x5e\x1c\x42\x3d\x8f\x2d\x5c\x1b\x42\x4e\xff\x67\xb2\x45\
+\xad\xb1\xe6\x7a\x9e\x7a\x48\xbd\xa4\x9e\x52\x6f\xa9\xc7\xfd\x5e\
+\x37\x5e\x9b\x7a\x0f\x5e\x08\x10\x20\x30\x0a\x81\xe9\x15\x21\x00\
+\x8c\x74\xa6\xc7\x4e\x6c\xdc\x36\x5f\x5b\xff\x40\xfd\xc8\xf9\x4f\
+\xc6\x07\xf9\x3b\xd3\x03\x65\xc8\xea\x41\x3e\xac\xf8\x52\x5d\xbd\
+\xdf\x6b\x7d\x67\xea\x3d\x19\x24\x8b\x15\x17\x73\x19\x01\x02\x04\
+\x08\x5c\x41\x40\x00\xb8\x02\xcc\x10\xef\xbe\xee\x15\x9b\xcf\x8c\
+\x9f\xfd\x6e\xc4\x07\xbd\xcf\xd4\x75\x7d\x57\xac\xe1\xe6\x78\x94\
+\x7e\xbb\x39\x59\x24\x93\x64\x93\x8c\x4a\x07\xd1\x3f\x01\x02\xfd\
+\x0b\x4c\x71\x47\x01\x60\x24\x53\x3d\x7a\x62\xfd\xf5\xd7\x5c\x75\
+\xfe\x53\xf1\xb3\xdf\x37\xc7\x92\xe2\xd3\xe3\xf1\x4f\xb7\x4b\x05\
+\xae\x4d\x36\xc9\x28\x59\x5d\xfa\x01\xaf\x13\x20\x40\x80\xc0\xf2\
+\x02\x02\xc0\xf2\x66\xad\x5e\x31\x5f\x3b\xf9\x92\xf8\x35\xfe\xb3\
+\x55\x1d\xde\x1e\xea\xf0\xac\x56\x17\x9f\xe2\x62\xd1\x28\x59\x25\
+\xb3\x64\x37\xc5\x16\xf5\x44\x80\xc0\xd8\x04\xa6\x59\x8f\x00\x30\
+\xe0\x5c\xd3\x77\xbf\x87\x50\xdd\x1b\xbf\xc6\x9f\xbe\x91\x2f\x78\
+\x59\x46\x20\x7d\xf3\x63\x75\xef\xbe\xe1\x32\xd7\x39\x97\x00\x01\
+\x02\x04\x92\x80\x00\x90\x14\x7a\x3e\xae\xbf\x75\xf3\x79\xf3\xb5\
+\xf5\xdf\x5c\x7c\xf7\x7b\xcf\x7b\x4f\x6d\xbb\x64\x98\x2c\x93\xe9\
+\xd4\x7a\xd3\x0f\x01\x02\xe3\x10\x98\x6a\x15\x02\x40\xcf\x93\x3d\
+\x7a\x62\xe3\xbb\x66\x7b\xe7\x3f\x14\xb7\xbd\x31\x1e\x6e\xed\x08\
+\xdc\x98\x4c\x93\x6d\x3b\xcb\x59\x85\x00\x01\x02\xd3\x17\x10\x00\
+\x7a\x9c\xf1\xfc\xf8\xfa\xab\xab\xba\x7e\x7f\xdc\xf2\x9a\x78\xb8\
+\xb5\x2b\x70\x4d\xb2\x4d\xc6\xed\x2e\x6b\x35\x02\x04\xca\x16\x98\
+\x6e\xf7\x02\x40\x4f\xb3\x9d\xaf\x6d\xbc\x36\x54\xe1\x5d\x3d\x6d\
+\x57\xee\x36\xd1\x78\x61\x5d\xae\x80\xce\x09\x10\x20\x70\x28\x01\
+\x01\xe0\x50\x4c\xcd\x4e\xda\xff\xac\xb4\xbe\xb3\xd9\x2a\xae\x3e\
+\xbc\x40\x7d\xe7\xbe\xf9\xe1\xaf\x70\x26\x01\x02\x04\x9e\x4c\x60\
+\xca\xef\x13\x00\x3a\x9e\xee\xe2\xeb\xd2\xf1\xb3\xd2\x8e\xb7\xb1\
+\xfc\xe5\x02\xd1\x7c\x61\x7f\xf9\xfb\xbd\x4d\x80\x00\x01\x02\x0b\
+\x01\x01\x60\xc1\xd0\xcd\x1f\xe9\x3b\xd3\xab\xba\xbe\xa7\x9b\xd5\
+\xad\x7a\x90\x40\xb2\x4f\x33\x38\xe8\x3c\x1f\x27\x40\x80\xc0\x93\
+\x0b\x4c\xfb\xbd\x02\x40\x87\xf3\x9d\xed\x9d\x7f\x4f\x5c\xde\x37\
+\xfc\x45\x84\x81\x6e\xd7\x5c\x98\xc1\x40\xdb\xdb\x96\x00\x01\x02\
+\xe3\x15\x10\x00\x3a\x9a\xcd\x85\x5f\x50\xe3\x47\xfd\x3a\xf2\x5d\
+\x62\xd9\x1b\x2f\xcc\x62\x89\x4b\x9c\x4a\x80\x00\x81\x10\xa6\x6e\
+\x20\x00\x74\x30\xe1\xf9\xda\xc9\x97\xa4\x5f\x50\xd3\xc1\xd2\x96\
+\x5c\x41\x20\xcd\x22\xcd\x64\x85\x4b\x5d\x42\x80\x00\x81\xc9\x0a\
+\x08\x00\x9d\x8c\x76\xf6\xb6\x4e\x96\xb5\x68\x03\x01\x33\x69\x80\
+\xe7\x52\x02\x05\x0a\x4c\xbf\x65\x01\xa0\xe5\x19\xef\xff\x9f\xea\
+\x6a\xbf\xdb\xbf\x65\xd7\xe6\xcb\xd5\xf3\xfd\xd9\x34\x5f\xc9\x0a\
+\x04\x08\x10\x98\x82\x80\x00\xd0\xe2\x14\xaf\x7b\xc5\xe6\x33\xe3\
+\xd3\xcd\x6f\x6c\x71\x49\x4b\xb5\x28\x90\x66\x93\x66\xd4\xe2\x92\
+\x96\x22\x40\x60\xa2\x02\x25\xb4\x25\x00\xb4\x38\xe5\x67\xcc\xce\
+\xbf\x2e\xd4\xe1\x59\x2d\x2e\x69\xa9\x36\x05\xe2\x6c\x16\x33\x6a\
+\x73\x4d\x6b\x11\x20\x40\x20\x53\x01\x01\xa0\xc5\xc1\xd5\x55\xf8\
+\x81\x16\x97\xb3\x54\x07\x02\x66\xd4\x01\xaa\x25\x09\x4c\x4e\xa0\
+\x8c\x86\x04\x80\x96\xe6\x7c\xec\xc4\xc6\x6d\x71\xa9\x6b\xe3\xe1\
+\x36\x6e\x81\x6b\x2f\xcc\x6a\xdc\x55\xaa\x8e\x00\x01\x02\x1d\x0b\
+\x08\x00\x2d\x01\xd7\x75\x7d\xbc\xa5\xa5\x2c\xd3\xb1\x80\x59\x75\
+\x0c\x6c\x79\x02\x99\x0b\x94\x52\xbe\x00\xd0\xc2\xa4\x8f\xdd\xbe\
+\xf9\x9c\xb8\xcc\xcd\xf1\x70\xcb\x43\xe0\xe6\x0b\x33\xcb\xa3\x5a\
+\x55\x12\x20\x40\xa0\x03\x01\x01\xa0\x05\xd4\xfa\x91\xbd\x97\xb6\
+\xb0\x8c\x25\x7a\x14\x30\xb3\x1e\xb1\x6d\x45\x20\x2b\x81\x72\x8a\
+\x15\x00\x5a\x98\x75\x55\xd7\x2f\x6e\x61\x19\x4b\xf4\x28\x60\x66\
+\x3d\x62\xdb\x8a\x00\x81\x51\x0a\x08\x00\x2d\x8c\xa5\xae\x6a\x4f\
+\xff\xb7\xe0\xd8\xe7\x12\x66\xd6\xa7\xb6\xbd\x08\xe4\x23\x50\x52\
+\xa5\x02\x40\xc3\x69\xdf\x70\x7c\xfd\x05\x21\x54\x57\x07\x2f\x99\
+\x09\x54\x57\xef\xcf\x2e\xb3\xb2\x95\x4b\x80\x00\x81\x96\x04\x04\
+\x80\x86\x90\x7b\x47\xc2\xf3\x1b\x2e\xe1\xf2\x81\x04\xcc\x6e\x20\
+\x78\xdb\x12\x18\xad\x40\x59\x85\x09\x00\x0d\xe7\x5d\xef\x85\xa3\
+\x0d\x97\x70\xf9\x40\x02\x66\x37\x10\xbc\x6d\x09\x10\x18\x85\x80\
+\x00\xd0\x70\x0c\xb3\x3a\x5c\xd7\x70\x09\x97\x0f\x24\x60\x76\x03\
+\xc1\xdb\x96\xc0\x48\x05\x4a\x2b\x4b\x00\x68\x38\xf1\xba\xaa\x9e\
+\xdd\x70\x89\xe6\x97\xd7\xe1\x37\xea\xba\x7a\xd9\xee\xce\xd6\x6c\
+\x77\x67\xbb\x1a\xf7\xb1\x35\x4b\xb5\x86\x58\x73\xf3\xc6\x9b\xad\
+\x30\x8a\xd9\x35\x6b\xc1\xd5\x04\x08\x10\x58\x59\x40\x00\x58\x99\
+\xee\xe2\x85\xf5\xb0\xbf\xfe\x37\x3e\x90\xee\x9e\xd9\x7a\xc1\xb9\
+\x33\x5b\xf7\x86\x50\xd5\x61\xf4\x2f\x55\x9d\x6a\x4d\x35\x0f\x1f\
+\x02\x06\x9e\xdd\xe8\x67\xa5\x40\x02\x25\x09\x94\xd7\xab\x00\xd0\
+\x78\xe6\xf5\xa0\xff\xf7\xbf\x3a\x54\xdb\x21\x8b\x07\xfe\x70\xd9\
+\x4b\x55\xef\xd7\x7e\xd9\xbb\x7b\x7d\xb3\x1e\x74\x76\xbd\xb6\x6a\
+\x33\x02\x04\x08\x5c\x26\x20\x00\x5c\x06\xb2\xfc\x9b\xc3\xfe\x08\
+\xe0\xb9\x33\x6f\xfe\x85\xe5\x6b\x1e\xc7\x15\xc3\xd7\x3e\xec\xec\
+\xc6\x31\x05\x55\x10\x20\x90\x04\x4a\x3c\x04\x80\xec\xa7\x9e\xc3\
+\xd3\xfe\x57\x42\xce\xb9\xf6\x2b\xf5\xe4\xfd\x04\x08\x10\xc8\x43\
+\x40\x00\xc8\x63\x4e\xaa\x24\x40\x80\x00\x81\xce\x04\xca\x5c\x58\
+\x00\x28\x73\xee\xba\x26\x40\x80\x00\x81\xc2\x05\x04\x80\xc2\xef\
+\x00\xda\x27\x40\x80\x40\xe9\x02\xa5\xf6\x2f\x00\x94\x3a\x79\x7d\
+\x13\x20\x40\x80\x40\xd1\x02\x02\x40\xd1\xe3\xd7\x3c\x01\x02\x04\
+\x4a\x17\x28\xb7\x7f\x01\xa0\xdc\xd9\xeb\x9c\x00\x01\x02\x04\x0a\
+\x16\x10\x00\x0a\x1e\xbe\xd6\x09\x10\x20\x50\xba\x40\xc9\xfd\x0b\
+\x00\x25\x4f\x5f\xef\x04\x08\x10\x20\x50\xac\x80\x00\x50\xec\xe8\
+\x35\x4e\x80\x00\x81\xd2\x05\xca\xee\x5f\x00\x28\x7b\xfe\xba\x27\
+\x40\x80\x00\x81\x42\x05\x04\x80\x42\x07\xaf\x6d\x02\x04\x08\x94\
+\x2e\x50\x7a\xff\x02\x40\xe9\xf7\x00\xfd\x13\x20\x40\x80\x40\x91\
+\x02\x02\x40\x91\x63\xd7\x34\x01\x02\x04\x4a\x17\xd0\xbf\x00\xe0\
+\x3e\x40\x80\x00\x01\x02\x04\x0a\x14\x10\x00\x0a\x1c\xba\x96\x09\
+\x10\x20\x50\xba\x80\xfe\x43\x10\x00\xdc\x0b\x08\x10\x20\x40\x80\
+\x40\x81\x02\x02\x40\x81\x43\xd7\x32\x01\x02\x04\xca\x16\xd0\x7d\
+\x12\x10\x00\x92\x82\x83\x00\x01\x02\x04\x08\x14\x26\x20\x00\x14\
+\x36\x70\xed\x12\x20\x40\xa0\x74\x01\xfd\xef\x0b\x08\x00\xfb\x0e\
+\xfe\x24\x40\x80\x00\x01\x02\x45\x09\x08\x00\x45\x8d\x5b\xb3\x04\
+\x08\x10\x28\x5d\x40\xff\x17\x05\x04\x80\x8b\x12\xfe\x26\x40\x80\
+\x00\x01\x02\x05\x09\x08\x00\x05\x0d\x5b\xab\x04\x08\x10\x28\x5d\
+\x40\xff\x8f\x09\x08\x00\x8f\x59\x78\x8d\x00\x01\x02\x04\x08\x14\
+\x23\x20\x00\x14\x33\x6a\x8d\x12\x20\x40\xa0\x74\x01\xfd\x5f\x2a\
+\x20\x00\x5c\xaa\xe1\x75\x02\x04\x08\x10\x20\x50\x88\x80\x00\x50\
+\xc8\xa0\xb5\x49\x80\x00\x81\xd2\x05\xf4\xff\x78\x01\x01\xe0\xf1\
+\x1e\xde\x22\x40\x80\x00\x01\x02\x45\x08\x08\x00\x45\x8c\x59\x93\
+\x04\x08\x10\x28\x5d\x40\xff\x97\x0b\x08\x00\x97\x8b\x78\x9b\x00\
+\x01\x02\x04\x08\x14\x20\x20\x00\x14\x30\x64\x2d\x12\x20\x40\xa0\
+\x74\x01\xfd\x3f\x51\x40\x00\x78\xa2\x89\xf7\x10\x20\x40\x80\x00\
+\x81\xc9\x0b\x08\x00\x93\x1f\xb1\x06\x09\x10\x20\x50\xba\x80\xfe\
+\x9f\x4c\x40\x00\x78\x32\x15\xef\x23\x40\x80\x00\x01\x02\x13\x17\
+\x10\x00\x26\x3e\x60\xed\x11\x20\x40\xa0\x74\x01\xfd\x3f\xb9\x80\
+\x00\xf0\xe4\x2e\xde\x4b\x80\x00\x01\x02\x04\x26\x2d\x20\x00\x4c\
+\x7a\xbc\x9a\x23\x40\x80\x40\xe9\x02\xfa\xbf\x92\x80\x00\x70\x25\
+\x19\xef\x27\x40\x80\x00\x01\x02\x13\x16\x10\x00\x26\x3c\x5c\xad\
+\x11\x20\x40\xa0\x74\x01\xfd\x5f\x59\x40\x00\xb8\xb2\x8d\x8f\x10\
+\x20\x40\x80\x00\x81\xc9\x0a\x08\x00\x93\x1d\xad\xc6\x08\x10\x20\
+\x50\xba\x80\xfe\x9f\x4a\x40\x00\x78\x2a\x1d\x1f\x23\x40\x80\x00\
+\x01\x02\x13\x15\x10\x00\x26\x3a\x58\x6d\x11\x20\x40\xa0\x74\x01\
+\xfd\x3f\xb5\x80\x00\xf0\xd4\x3e\x3e\x4a\x80\x00\x01\x02\x04\x26\
+\x29\x20\x00\x4c\x72\xac\x9a\x22\x40\x80\x40\xe9\x02\xfa\x3f\x48\
+\x40\x00\x38\x48\xc8\xc7\x09\x10\x20\x40\x80\xc0\x04\x05\x04\x80\
+\x09\x0e\x55\x4b\x04\x08\x10\x28\x5d\x40\xff\x07\x0b\x08\x00\x07\
+\x1b\x39\x83\x00\x01\x02\x04\x08\x4c\x4e\x40\x00\x98\xdc\x48\x35\
+\x44\x80\x00\x81\xd2\x05\xf4\x7f\x18\x01\x01\xe0\x30\x4a\xce\x21\
+\x40\x80\x00\x01\x02\x13\x13\x10\x00\x26\x36\x50\xed\x10\x20\x40\
+\xa0\x74\x01\xfd\x1f\x4e\x40\x00\x38\x9c\x93\xb3\x08\x10\x20\x40\
+\x80\xc0\xa4\x04\x04\x80\x49\x8d\x53\x33\x04\x08\x10\x28\x5d\x40\
+\xff\x87\x15\x10\x00\x0e\x2b\xe5\x3c\x02\x04\x08\x10\x20\x30\x21\
+\x01\x01\x60\x42\xc3\xd4\x0a\x01\x02\x04\x4a\x17\xd0\xff\xe1\x05\
+\x04\x80\xc3\x5b\x39\x93\x00\x01\x02\x04\x08\x4c\x46\x40\x00\x98\
+\xcc\x28\x35\x42\x80\x00\x81\xd2\x05\xf4\xbf\x8c\x80\x00\xb0\x8c\
+\x96\x73\x09\x10\x20\x40\x80\xc0\x44\x04\x04\x80\x89\x0c\x52\x1b\
+\x04\x08\x10\x28\x5d\x40\xff\xcb\x09\x08\x00\xcb\x79\x39\x9b\x00\
+\x01\x02\x04\x08\x4c\x42\x40\x00\x98\xc4\x18\x35\x41\x80\x00\x81\
+\xd2\x05\xf4\xbf\xac\x80\x00\xb0\xac\x98\xf3\x09\x10\x20\x40\x80\
+\xc0\x04\x04\x04\x80\x09\x0c\x51\x0b\x04\x08\x10\x28\x5d\x40\xff\
+\xcb\x0b\x08\x00\xcb\x9b\xb9\x82\x00\x01\x02\x04\x08\x64\x2f\x20\
+\x00\x64\x3f\x42\x0d\x10\x20\x40\xa0\x74\x01\xfd\xaf\x22\x20\x00\
+\xac\xa2\xe6\x1a\x02\x04\x08\x10\x20\x90\xb9\x80\x00\x90\xf9\x00\
+\x95\x4f\x80\x00\x81\xd2\x05\xf4\xbf\x9a\x80\x00\xb0\x9a\x9b\xab\
+\x08\x10\x20\x40\x80\x40\xd6\x02\x02\x40\xd6\xe3\x53\x3c\x01\x02\
+\x04\x4a\x17\xd0\xff\xaa\x02\x02\xc0\xaa\x72\xae\x23\x40\x80\x00\
+\x01\x02\x19\x0b\x08\x00\x19\x0f\x4f\xe9\x04\x08\x10\x28\x5d\x40\
+\xff\xab\x0b\x08\x00\xab\xdb\xb9\x92\x00\x01\x02\x04\x08\x64\x2b\
+\x20\x00\x64\x3b\x3a\x85\x13\x20\x40\xa0\x74\x01\xfd\x37\x11\x10\
+\x00\x9a\xe8\xb9\x96\x00\x01\x02\x04\x08\x64\x2a\x20\x00\x64\x3a\
+\x38\x65\x13\x20\x40\xa0\x74\x01\xfd\x37\x13\x10\x00\x9a\xf9\xb9\
+\x9a\x00\x01\x02\x04\x08\x64\x29\x20\x00\x64\x39\x36\x45\x13\x20\
+\x40\xa0\x74\x01\xfd\x37\x15\x10\x00\x9a\x0a\xba\x9e\x00\x01\x02\
+\x04\x08\x64\x28\x20\x00\x64\x38\x34\x25\x13\x20\x40\xa0\x74\x01\
+\xfd\x37\x17\x10\x00\x9a\x1b\x5a\x81\x00\x01\x02\x04\x08\x64\x27\
+\x20\x00\x64\x37\x32\x05\x13\x20\x40\xa0\x74\x01\xfd\xb7\x21\x20\
+\x00\xb4\xa1\x68\x0d\x02\x04\x08\x10\x20\x90\x99\x80\x00\x90\xd9\
+\xc0\x94\x4b\x80\x00\x81\xd2\x05\xf4\xdf\x8e\x80\x00\xd0\x8e\xa3\
+\x55\x08\x10\x20\x40\x80\x40\x56\x02\x02\x40\x56\xe3\x52\x2c\x01\
+\x02\x04\x4a\x17\xd0\x7f\x5b\x02\x02\x40\x5b\x92\xd6\x21\x40\x80\
+\x00\x01\x02\x19\x09\x08\x00\x19\x0d\x4b\xa9\x04\x08\x10\x28\x5d\
+\x40\xff\xed\x09\x08\x00\xed\x59\x5a\x89\x00\x01\x02\x04\x08\x64\
+\x23\x20\x00\x64\x33\x2a\x85\x12\x20\x40\xa0\x74\x01\xfd\xb7\x29\
+\x20\x00\xb4\xa9\x69\x2d\x02\x04\x08\x10\x20\x90\x89\x80\x00\x90\
+\xc9\xa0\x94\x49\x80\x00\x81\xd2\x05\xf4\xdf\xae\x80\x00\xd0\xae\
+\xa7\xd5\x08\x10\x20\x40\x80\x40\x16\x02\x02\x40\x16\x63\x52\x24\
+\x01\x02\x04\x4a\x17\xd0\x7f\xdb\x02\x02\x40\xdb\xa2\xd6\x23\x40\
+\x80\x00\x01\x02\x19\x08\x08\x00\x19\x0c\x49\x89\x04\x08\x10\x28\
+\x5d\x40\xff\xed\x0b\x08\x00\xed\x9b\x5a\x91\x00\x01\x02\x04\x08\
+\x8c\x5e\x40\x00\x18\xfd\x88\x14\x48\x80\x00\x81\xd2\x05\xf4\xdf\
+\x85\x80\x00\xd0\x85\xaa\x35\x09\x10\x20\x40\x80\xc0\xc8\x05\x04\
+\x80\x91\x0f\x48\x79\x04\x08\x10\x28\x5d\x40\xff\xdd\x08\x08\x00\
+\xdd\xb8\x5a\x95\x00\x01\x02\x04\x08\x8c\x5a\x40\x00\x18\xf5\x78\
+\x14\x47\x80\x00\x81\xd2\x05\xf4\xdf\x95\x80\x00\xd0\x95\xac\x75\
+\x09\x10\x20\x40\x80\xc0\x88\x05\x04\x80\x11\x0f\x47\x69\x04\x08\
+\x10\x28\x5d\x40\xff\xdd\x09\x08\x00\xdd\xd9\x5a\x99\x00\x01\x02\
+\x04\x08\x8c\x56\x40\x00\x18\xed\x68\x14\x46\x80\x00\x81\xd2\x05\
+\xf4\xdf\xa5\x80\x00\xd0\xa5\xae\xb5\x09\x10\x20\x40\x80\xc0\x48\
+\x05\x04\x80\x91\x0e\x46\x59\x04\x08\x10\x28\x5d\x40\xff\xdd\x0a\
+\x08\x00\xdd\xfa\x5a\x9d\x00\x01\x02\x04\x08\x8c\x52\x40\x00\x18\
+\xe5\x58\x14\x45\x80\x00\x81\xd2\x05\xf4\xdf\xb5\x80\x00\xd0\xb5\
+\xb0\xf5\x09\x10\x20\x40\x80\xc0\x08\x05\x04\x80\x11\x0e\x45\x49\
+\x04\x08\x10\x28\x5d\x40\xff\xdd\x0b\x08\x00\xdd\x1b\xdb\x81\x00\
+\x01\x02\x04\x08\x8c\x4e\x40\x00\x18\xdd\x48\x14\x44\x80\x00\x81\
+\xd2\x05\xf4\xdf\x87\x80\x00\xd0\x87\xb2\x3d\x08\x10\x20\x40\x80\
+\xc0\xc8\x04\x04\x80\x91\x0d\x44\x39\x04\x08\x10\x28\x5d\x40\xff\
+\xfd\x08\x08\x00\xfd\x38\xdb\x85\x00\x01\x02\x04\x08\x8c\x4a\x40\
+\x00\x18\xd5\x38\x14\x43\x80\x00\x81\xd2\x05\xf4\xdf\x97\x80\x00\
+\xd0\x97\xb4\x7d\x08\x10\x20\x40\x80\xc0\x88\x04\x04\x80\x11\x0d\
+\x43\x29\x04\x08\x10\x28\x5d\x40\xff\xfd\x09\x08\x00\xfd\x59\xdb\
+\x89\x00\x01\x02\x04\x08\x8c\x46\x40\x00\x18\xcd\x28\x14\x42\x80\
+\x00\x81\xd2\x05\x88\xa7\x32\x92\x00\x00\x10\x00\x49\x44\x41\x54\
+\xf4\xdf\xa7\x80\x00\xd0\xa7\xb6\xbd\x08\x10\x20\x40\x80\xc0\x48\
+\x04\x04\x80\x91\x0c\x42\x19\x04\x08\x10\x28\x5d\x40\xff\xfd\x0a\
+\x08\x00\xfd\x7a\xdb\x8d\x00\x01\x02\x04\x08\x8c\x42\x40\x00\x18\
+\xc5\x18\x14\x41\x80\x00\x81\xd2\x05\xf4\xdf\xb7\x80\x00\xd0\xb7\
+\xb8\xfd\x08\x10\x20\x40\x80\xc0\x08\x04\x04\x80\x11\x0c\x41\x09\
+\x04\x08\x10\x28\x5d\x40\xff\xfd\x0b\x08\x00\xfd\x9b\xdb\x91\x00\
+\x01\x02\x04\x08\x0c\x2e\x20\x00\x0c\x3e\x02\x05\x10\x20\x40\xa0\
+\x74\x01\xfd\x0f\x21\x20\x00\x0c\xa1\x6e\x4f\x02\x04\x08\x10\x20\
+\x30\xb0\x80\x00\x30\xf0\x00\x6c\x4f\x80\x00\x81\xd2\x05\xf4\x3f\
+\x8c\x80\x00\x30\x8c\xbb\x5d\x09\x10\x20\x40\x80\xc0\xa0\x02\x02\
+\xc0\xa0\xfc\x36\x27\x40\x80\x40\xe9\x02\xfa\x1f\x4a\x40\x00\x18\
+\x4a\xde\xbe\x04\x08\x10\x20\x40\x60\x40\x01\x01\x60\x40\x7c\x5b\
+\x13\x20\x40\xa0\x74\x01\xfd\x0f\x27\x20\x00\x0c\x67\x6f\x67\x02\
+\x04\x08\x10\x20\x30\x98\x80\x00\x30\x18\xbd\x8d\x09\x10\x20\x50\
+\xba\x80\xfe\x87\x14\x10\x00\x86\xd4\xb7\x37\x01\x02\x04\x08\x10\
+\x18\x48\x40\x00\x18\x08\xde\xb6\x04\x08\x10\x28\x5d\x40\xff\xc3\
+\x0a\x08\x00\xc3\xfa\xdb\x9d\x00\x01\x02\x04\x08\x0c\x22\x20\x00\
+\x0c\xc2\x6e\x53\x02\x04\x08\x94\x2e\xa0\xff\xa1\x05\x04\x80\xa1\
+\x27\x60\x7f\x02\x04\x08\x10\x20\x30\x80\x80\x00\x30\x00\xba\x2d\
+\x09\x10\x20\x50\xba\x80\xfe\x87\x17\x10\x00\x86\x9f\x81\x0a\x08\
+\x10\x20\x40\x80\x40\xef\x02\x02\x40\xef\xe4\x36\x24\x40\x80\x40\
+\xe9\x02\xfa\x1f\x83\x80\x00\x30\x86\x29\xa8\x81\x00\x01\x02\x04\
+\x08\xf4\x2c\x20\x00\xf4\x0c\x6e\x3b\x02\x04\x08\x94\x2e\xa0\xff\
+\x71\x08\x08\x00\xe3\x98\x83\x2a\x08\x10\x20\x40\x80\x40\xaf\x02\
+\x02\x40\xaf\xdc\x36\x23\x40\x80\x40\xe9\x02\xfa\x1f\x8b\x80\x00\
+\x30\x96\x49\xa8\x83\x00\x01\x02\x04\x08\xf4\x28\x20\x00\xf4\x88\
+\x6d\x2b\x02\x04\x08\x94\x2e\xa0\xff\xf1\x08\x08\x00\xe3\x99\xc5\
+\x8a\x95\xd4\xd5\x8a\x17\x8e\xe0\xb2\x9c\x6b\x1f\x01\x5f\x2b\x25\
+\xe4\x3c\x83\x9c\x6b\x6f\x3e\xbc\x6a\x6f\xaf\x6e\xbe\x4a\x93\x15\
+\xea\xab\x9b\x5c\x3d\xf8\xb5\x55\x95\x77\xfd\x2d\x00\x0a\x00\x8d\
+\x11\xeb\x87\x1b\x2f\xd1\x60\x81\xa3\xc7\xef\x78\x49\x83\xcb\x07\
+\xbd\x74\xf8\xda\x87\x9d\xdd\x3e\xfe\xb0\x35\x0c\x3f\x83\x7d\x85\
+\x55\xfe\x1c\xbe\xf6\x61\x67\x77\x7e\x56\x0d\xfa\x6f\x4f\x08\xd5\
+\x37\x85\xa5\x5f\x46\x74\x41\x5d\xdf\x34\x70\x35\x0f\x0d\xbc\x7f\
+\x10\x00\x1a\x4f\xa0\xfa\x5c\xe3\x25\x1a\x2c\x50\x85\x7a\x3d\x84\
+\x1c\x3f\x13\xaa\xab\xfd\xda\x1b\x34\xdf\xf8\xd2\x6a\xd0\xd9\xed\
+\x97\x3f\x6c\x0d\xfb\x33\xa8\x33\x7c\x16\xa9\xae\xf6\x6b\xdf\x57\
+\x1c\xe6\xcf\x6a\xd0\xfb\xcf\xac\x0a\x7f\x3c\x4c\xdf\x8f\xee\xfa\
+\x55\xc7\x8e\xaf\x6f\x3f\xfa\x56\x46\xaf\xcc\x4f\x6c\x7c\x47\x2c\
+\xf7\x96\x78\x0c\x76\xab\xc3\xe0\xf3\x0b\x02\x40\xe3\xf1\x57\x9f\
+\x6d\xbc\x44\x93\x05\xaa\xf0\x8d\xf3\xe3\x1b\xbf\x7e\xf4\xf8\xc6\
+\x4b\xf3\x08\x02\x75\x95\x6a\x4d\x35\x87\x58\x7b\x93\xd6\x9b\x5f\
+\x3b\xf0\xec\x16\x0d\x0c\x5c\x43\x9c\x41\x9a\x45\x9a\x89\xfb\xcf\
+\x62\x20\x4b\xfc\x31\xec\xec\xf6\xaa\xab\x86\xfd\xb7\x27\x4a\xd5\
+\x55\x38\x79\xf4\xc4\xfa\x4f\x5d\x7f\x62\xfd\x68\x7c\xf3\xc0\xdb\
+\xd0\x27\x3c\xff\xb6\x37\x7c\x79\xac\xf7\xf5\x55\x5d\xff\xdc\xd0\
+\xb5\xcc\xea\xf0\x07\x83\xd7\x30\x74\x01\xb9\xef\x1f\xef\x48\x9f\
+\x1e\xbc\x87\xf8\x8f\x78\x55\xd5\x3f\x3f\x5f\xdb\xd8\x9b\xaf\xad\
+\xd7\xe3\x3e\x36\xf6\x52\xad\xc3\x3f\xf8\x87\x30\x86\xd9\x8d\xa1\
+\x86\x34\x8b\x34\x13\xf7\x9f\xb0\xd4\xcb\xd0\xb3\x7b\xc6\xd3\xc3\
+\xf0\xff\xf6\x44\xb1\xaa\x0e\xaf\x8a\x0f\x66\xbb\xe3\xfe\x77\x67\
+\xff\xdf\xc5\x2f\x9e\xbf\xea\xb3\xb1\xde\xb7\xc7\xcf\xbe\x8f\xc4\
+\xd2\x07\xbd\xd5\xd5\xf0\xf3\xf3\x0c\x40\xc3\xbb\xc0\x5e\x15\x3e\
+\xd1\x70\x09\x97\x0f\x24\x30\x86\xd9\x8d\xa1\x86\x81\xf8\xb3\xdf\
+\x76\xe8\xd9\x3d\xf0\xee\xcd\x3f\x8c\x88\x7f\x14\x8f\x4c\x6e\xca\
+\xbc\x54\x20\x7e\xdd\xed\x93\x97\xbe\x3d\xc4\xeb\x02\x40\x43\xf5\
+\x6a\x16\xce\x35\x5c\xc2\xe5\x03\x09\x8c\x61\x76\x63\xa8\x61\x20\
+\xfe\xec\xb7\x1d\xc7\xec\x6a\xff\xfe\x64\x7a\x4f\x7a\xfa\x35\x5f\
+\x78\x70\xe8\xd2\x05\x80\x86\x13\x98\x9d\x0f\x1f\x69\xb8\x84\xcb\
+\x07\x12\x18\xc3\xec\xc6\x50\xc3\x40\xfc\xd9\x6f\x3b\x8a\xd9\xd5\
+\xd5\x7f\xcd\x05\x52\x9d\x97\x0a\x54\xbf\xf5\xc0\xbb\xdf\x3e\xe8\
+\x37\x91\xa6\x6a\x04\x80\xa4\xd0\xe0\xf8\xd8\x99\xed\x5f\x0f\x61\
+\xd8\x1f\x07\x6a\x50\x7e\xc1\x97\xd6\x0f\xef\xcf\x6e\x58\x82\xfd\
+\x1a\xdc\x7f\x86\x9d\xc2\x2a\xbb\x8f\xe3\xfe\x53\x1f\x09\x1f\x5a\
+\xa5\x7a\xd7\x0c\x2d\xb0\x37\x8a\xb9\x09\x00\x2d\xdc\x0f\xaa\xba\
+\xba\xaf\x85\x65\x2c\xd1\xa3\x40\x35\xa2\x99\x8d\xa9\x96\x1e\x47\
+\x90\xf5\x56\x63\x99\xd9\xde\x23\xe7\x3f\x98\x07\xa4\x2a\x2f\x15\
+\xa8\xab\xea\xfe\x4b\xdf\x1e\xea\x75\x01\xa0\x05\xf9\x38\xcc\x5f\
+\x6e\x61\x19\x4b\xf4\x28\x30\xa6\x99\x8d\xa9\x96\x1e\x47\x90\xf5\
+\x56\x63\x99\xd9\xc7\xef\x79\xeb\xff\x0a\xa1\xfa\x70\xf0\x92\x95\
+\x40\x5d\x1d\xf9\xf7\x63\x28\x58\x00\x68\x61\x0a\xd5\x55\xb3\x7b\
+\x5b\x58\xc6\x12\x3d\x0a\x8c\x69\x66\x63\xaa\xa5\xc7\x11\x64\xbd\
+\xd5\xa8\x66\x56\xed\xfd\xfc\xd8\x31\xd5\xf7\x98\x40\x15\xc2\x07\
+\x1e\xbc\x7b\xf3\x7f\x3f\xf6\x9e\xe1\x5e\x13\x00\x5a\xb0\x3f\x7b\
+\xd7\xe6\xef\xc6\x65\x7c\x19\x20\x22\x64\x72\xbb\xef\xc2\xcc\x46\
+\x51\xee\x85\x5a\xdc\x7f\x46\x31\x8d\x43\x15\x31\xaa\xfb\xcf\xf9\
+\x2a\xbc\xff\x50\x55\x3b\x69\x14\x02\x75\x1d\x7e\x76\x14\x85\xc4\
+\x22\x04\x80\x88\xd0\xc6\xad\xaa\xaa\x33\x6d\xac\x63\x8d\xee\x05\
+\xc6\x38\xab\x31\xd6\xd4\xfd\x24\xf2\xdc\x61\x6c\xb3\xfa\xf8\xdd\
+\xa7\x7e\xa7\x0e\xe1\x97\xc6\xab\xa9\xb2\x4b\x04\xbe\xf0\xc5\xa7\
+\x3d\xfc\xbe\x4b\xde\x1e\xf4\x55\x01\xa0\x25\xfe\xb3\xa7\xb7\xde\
+\x1b\x97\x1a\xfc\x57\x73\xc6\x1a\xdc\x9e\x5a\xe0\xb3\x17\x66\xf5\
+\xd4\x67\xf5\xfc\xd1\x0b\x35\xb9\xff\xf4\xec\xbe\xc2\x76\xa3\xbc\
+\xff\x84\xaa\xfa\xe9\x15\x7a\x71\x49\xff\x02\xef\xf9\xed\xbb\xde\
+\xf1\x27\xfd\x6f\xfb\xe4\x3b\x0a\x00\x4f\xee\xb2\xd2\x7b\xab\x3a\
+\xfc\xc4\x4a\x17\xba\xa8\x37\x81\x31\xcf\x68\xcc\xb5\xf5\x36\xa0\
+\x91\x6f\x34\xd6\x19\x9d\x3b\xbd\xf5\x6f\x43\xa8\x3f\x36\x46\x3e\
+\x35\x3d\x26\xb0\x57\x85\x7f\xfe\xd8\x5b\xc3\xbf\x26\x00\xb4\x38\
+\x83\xcf\xef\x1d\xb9\x33\x54\xe1\x73\x2d\x2e\x69\xa9\x36\x05\xe2\
+\x6c\x16\x33\x6a\x73\xcd\x16\xd7\x5a\xd4\x16\x6b\x6c\x71\x49\x4b\
+\xb5\x29\x10\x67\xb3\x98\x51\x9b\x6b\xb6\xb8\x56\x1d\xea\x1f\x6d\
+\x71\x39\x4b\xb5\x2e\x50\xbd\xf7\xc1\xd3\xdb\xa3\xfa\xcd\x8d\x02\
+\x40\x8b\x43\xfe\xc4\xfb\x36\xff\x38\x7e\x2d\xee\xad\x2d\x2e\x69\
+\xa9\x16\x05\xd2\x6c\xd2\x8c\x5a\x5c\xb2\xd5\xa5\x52\x6d\xa9\xc6\
+\x56\x17\xb5\x58\x6b\x02\x69\x36\x69\x46\xad\x2d\xd8\xf2\x42\xe7\
+\x76\xde\x72\x3a\x3e\x0b\x30\xb2\x1f\x09\x6c\xb9\xc9\x8c\x97\x9b\
+\xed\xed\xbd\x7d\x6c\xe5\x0b\x00\x2d\x4f\xe4\xdc\xe9\xed\x77\x84\
+\x50\xed\x06\x2f\x23\x13\xa8\x76\xf7\x67\x33\xb2\xb2\x2e\x2b\x67\
+\xbf\x46\xf7\x9f\xcb\x58\x46\xf0\x66\x1e\xf7\x9f\xba\x9e\x6d\x8e\
+\x00\x4b\x09\x97\x0b\x54\xd5\x5b\x3e\x76\xcf\xa9\xdf\xbe\xfc\xdd\
+\x43\xbf\x3d\x1b\xba\x80\x69\xee\xbf\xf7\x86\x69\xf6\x95\x73\x57\
+\x39\xcd\x24\xa7\x5a\x73\xbe\x4f\x2c\x53\x7b\x1e\x33\x39\x77\x66\
+\xeb\x57\xea\x2a\xbc\x7b\x99\xce\xba\x3c\xd7\xda\x0b\x81\x8f\xef\
+\x9e\xde\x3a\xb9\x78\x6d\x64\x7f\x08\x00\x1d\x0c\x64\x77\xe7\xd4\
+\x2f\xc4\xa7\x0b\xdf\xd9\xc1\xd2\x96\x5c\x41\x20\xcd\x22\xcd\x64\
+\x85\x4b\x07\xb9\x24\xd5\x9a\x6a\x1e\x64\x73\x9b\x3e\x41\x20\xcd\
+\x22\xcd\xe4\x09\x1f\x18\xe9\x3b\xae\xb9\xfa\xc8\x3f\x8a\x35\xff\
+\x8f\x91\x96\x57\x5c\x59\x7b\x7b\xf5\x0f\x8d\xb5\x69\x01\xa0\xa3\
+\xc9\x9c\xdb\xd9\xfe\xc1\xb8\xf4\x03\xf1\x70\x1b\x56\xe0\x81\x0b\
+\xb3\x18\xb6\x8a\x25\x77\xbf\x50\xb3\xfb\xcf\x92\x6e\x1d\x9c\x9e\
+\xdd\xfd\xe7\x81\x77\x6f\xfe\xbf\x23\xb3\xb0\xd6\x81\xc5\x92\x4b\
+\x3a\xbd\x0e\xd5\xf6\x83\xf7\x9c\x1a\xed\xaf\x8a\x17\x00\x3a\xbc\
+\x8f\xee\xcd\x8e\xbc\x32\x2e\xff\x50\x3c\xdc\x86\x11\x78\xe8\xc2\
+\x0c\x86\xd9\xbd\xe1\xae\x17\x6a\x77\xff\x69\xe8\xd8\xe0\xf2\x6c\
+\xef\x3f\x1f\xbb\x7b\xfb\x57\xab\x10\xd2\x27\x21\x0d\xda\x77\x69\
+\x13\x81\x3a\x84\x9f\x3b\xb7\xb3\xb5\xd1\x64\x8d\xae\xaf\x15\x00\
+\x3a\x14\x7e\xf0\xee\xcd\x8f\xd6\x55\x75\x4b\x87\x5b\x58\xfa\x29\
+\x04\x92\x7d\x9a\xc1\x53\x9c\x32\xea\x0f\xa5\xda\x53\x0f\xa3\x2e\
+\x72\xc2\xc5\x25\xfb\x34\x83\x5c\x5b\x3c\xbb\xb3\xfd\xce\x3a\x84\
+\xc1\x7e\x34\x30\x57\xb7\x76\xea\xae\x3f\xfa\xc8\x55\x0f\x1f\x6f\
+\x67\xad\xee\x56\x11\x00\xba\xb3\x5d\xac\x7c\x2e\xfd\x82\x8e\x3a\
+\x7c\xff\xe2\x0d\x7f\xf4\x27\x10\xcd\x17\xf6\xfd\xed\xd8\xc9\x4e\
+\x8b\x1e\x62\x2f\x9d\x2c\x6e\xd1\x2b\x0b\x44\xf3\x85\xfd\x95\xcf\
+\xc8\xe2\x23\xe7\x76\xb6\xff\x71\x15\xea\xd3\x59\x14\x3b\x9d\x22\
+\x7f\xef\xfc\x2c\x7c\xcf\x98\x7e\xe3\xdf\x95\x68\x05\x80\x2b\xc9\
+\xb4\xf8\xfe\xdd\x33\xdb\x3f\x19\x42\xf5\xba\xe0\xa5\x27\x81\xea\
+\x75\xfb\xe6\x3d\x6d\xd7\xf1\x36\xfb\xbd\xb8\xff\x74\xcc\x7c\xc9\
+\xf2\xd3\xba\xff\x9c\xdd\x39\x75\x6b\xa8\xea\x9e\x7f\xff\xfc\x25\
+\x9c\x65\xbd\xfa\xe9\x10\x8e\xbc\xec\xe3\x77\x9f\xfa\x9d\x1c\xda\
+\x16\x00\x7a\x9a\xd2\xee\xce\xd6\x8f\x85\xf8\x59\x45\x4f\xdb\x95\
+\xbb\x4d\x34\x5e\x58\x4f\x4c\x60\xd1\x53\xec\x6d\x62\x6d\x8d\xaf\
+\x9d\x68\xbc\xb0\x1e\x5f\x65\x8d\x2a\xda\x3d\x7d\x2a\x7d\x29\xf2\
+\x3d\x8d\x16\x71\xf1\x41\x02\xbf\xb5\x77\xfe\x91\x6f\xdd\xdd\xd9\
+\xcc\xe6\x57\x32\x0b\x00\x07\x8d\xb4\xc5\x8f\xa7\xcf\xe4\xea\xaa\
+\x7a\x79\x5c\xd2\x37\x76\x45\x84\x96\x6f\x0f\x25\xdb\x64\xdc\xf2\
+\xba\xa3\x59\x2e\xf5\x96\x7a\x8c\x05\xb9\xff\x44\x84\x96\x6f\xd3\
+\xbf\xff\xec\x6c\xff\x83\xaa\x0a\xa7\x5a\x76\x7b\xd2\xe5\x4a\x7b\
+\x67\xfc\x32\xcb\x07\xc2\xd3\xcf\xdf\xf4\xe0\xfb\xde\xf6\x60\x4e\
+\xbd\x0b\x00\x3d\x4f\x2b\x7d\x5d\x71\x6f\x76\xe4\x9b\xe3\xb6\x7e\
+\xc4\x2b\x22\xb4\x74\x7b\x20\x99\x26\xdb\x96\xd6\x1b\xed\x32\xa9\
+\xc7\xd4\x6b\x2c\xd0\xfd\x27\x22\xb4\x74\x2b\xe6\xfe\x73\xf6\xf4\
+\xf6\x7a\x98\xed\xf9\x11\xc1\x96\xee\x38\x69\x99\xaa\xaa\x7e\x22\
+\x7e\x99\xe5\x6f\xed\xbe\xe7\xad\x9f\x49\x6f\xe7\x74\x08\x00\x03\
+\x4c\xeb\xc1\xbb\x37\x3f\xba\xbb\xb3\xfd\x57\xea\x10\xfc\xb2\xa0\
+\x86\xfe\xc9\x30\x59\x26\xd3\x86\x4b\x65\x73\x79\xea\x35\xf5\x9c\
+\x7a\xcf\xa6\xe8\x91\x16\x9a\x0c\x93\x65\x32\x1d\x69\x89\xad\x97\
+\xb5\x7b\xf7\x5b\xce\x84\xa7\xd7\xd7\x87\xaa\xfa\x70\xeb\x8b\x2f\
+\x16\x2c\xe4\x8f\xba\xfe\x5c\x5d\x85\x13\x67\x4f\x6f\xbd\x26\xd7\
+\x8e\x05\x80\x01\x27\x77\x6e\xf1\xcb\x82\xea\x97\x86\x50\xf9\x7f\
+\x07\x84\x65\x5f\x92\x59\xfd\xd2\x7d\xc3\x65\xaf\x9d\xc6\xf9\xfb\
+\xbd\xbb\xff\xac\x36\xcd\xb2\xef\x3f\xbb\xef\x39\x95\x7e\x3d\xed\
+\x37\x57\xa1\xda\x58\xcd\xaf\xf8\xab\xee\x39\x52\xd5\x47\xcf\x9d\
+\xde\xde\xc9\x59\x42\x00\x18\x78\x7a\xe9\x57\x8c\xee\xee\x6c\x1d\
+\x8b\x49\xf2\x47\x42\x15\xfc\xaf\x84\x0f\x9a\x47\x34\x4a\x56\xc9\
+\x2c\xd9\x1d\x74\xfa\xd4\x3f\x9e\x0c\x92\x45\x32\x09\xd1\x66\xea\
+\xfd\x36\xee\x2f\x1a\x25\xab\x64\x96\xec\x1a\xaf\x97\xf9\x02\x67\
+\x77\xb6\xb6\x67\x7b\xf5\x37\xc4\x36\xee\x89\x47\x2b\xb7\x69\x2f\
+\x52\xfd\x5a\x55\xd7\xdf\xb1\xbb\xb3\x7d\xfc\xbf\xed\xbc\xe5\x7f\
+\xe6\xde\xab\x00\x30\x92\x09\xc6\x24\xf9\x8e\x87\x1e\x39\xf2\xd5\
+\x55\x1d\xee\x88\x25\x7d\x36\x1e\x6e\x8f\x17\xf8\x6c\xb2\x49\x46\
+\xc9\xea\xf1\x1f\xf2\x56\x32\x49\x36\xc9\x28\x6a\xb8\xff\x44\x84\
+\xcb\x6e\xee\x3f\x97\x81\x5c\x7c\x33\xfd\x5f\xea\xd2\x03\xda\x5e\
+\x1d\xbe\x29\x7e\x49\xe4\x5f\x5e\x7c\xbf\xbf\x2f\x15\xa8\xfe\x53\
+\x0c\xd8\x7f\x67\x77\x67\xeb\xaf\x9f\x3d\x73\xea\xdf\x5d\xfa\x91\
+\x9c\x5f\x17\x00\x46\x34\xbd\x4f\xbc\x6f\xf3\x8f\xcf\x9e\xd9\xde\
+\xda\xdd\xd9\xfe\x8a\xaa\xaa\x6e\x8f\xa5\xdd\x17\x8f\xd2\x6f\xf7\
+\x25\x8b\x64\x92\x6c\x92\x51\xe9\x20\x57\xea\x3f\xd9\x24\xa3\x64\
+\x95\xcc\xe2\x79\xee\x3f\x21\xb8\xff\xc4\x3b\xc2\x61\x6e\x0f\x9e\
+\xd9\xfe\xf5\xf8\x65\xa5\x57\xec\xed\x1d\xf9\xba\x50\xd7\x6f\x89\
+\xd7\xfc\xf7\x78\x2c\x79\x9b\xd4\xe9\x9f\x8f\xdd\xdc\x15\x43\xf5\
+\x4d\xbb\x3b\x5b\xdf\xb2\x7b\x7a\xfb\x67\xe2\xdb\x93\xba\x09\x00\
+\x23\x1d\xe7\xd9\xd3\x5b\xef\xdd\xdd\xd9\x7e\x51\x75\xd5\x91\xaf\
+\x0d\xa1\x7a\x5d\xbc\x13\xfe\x72\x08\xf5\xc3\x61\xf2\x2f\xf5\xc3\
+\xfb\xbd\xc6\x9e\x63\xef\xc9\x20\x59\x4c\xbe\xed\x96\x1b\x4c\x66\
+\xc9\xce\xfd\x67\xfb\x45\xc9\xa2\x65\xde\x49\x2f\xf7\xe0\x3d\x9b\
+\x9f\xd8\x3d\x73\xea\x64\xbc\xff\x3c\x27\xfe\xb7\x78\x53\x08\xd5\
+\x3f\x8d\xff\xf6\x7c\x34\x94\xf1\xf2\xa9\xd8\xeb\x7b\x67\xa1\xfe\
+\xee\xab\xaf\x79\xf6\xb3\xa2\xc1\xf7\xc6\x50\xfd\xc1\xa9\xb6\x2e\
+\x00\x8c\x7c\xb2\x67\xef\xda\xfc\xdd\xdd\x9d\xad\x1f\x8b\x77\xc2\
+\x6f\x8b\x5f\xb3\xbc\x66\x16\x9f\xa6\x0b\xb3\xf0\xfd\xf1\xa9\xba\
+\x77\xc6\xff\x38\x63\x28\xa8\xd2\x37\x10\xc6\xa7\x7c\xeb\x8c\xc2\
+\xc1\xa2\xd6\x58\x73\xb5\x9b\x7a\x48\xbd\xa4\x9e\x52\x6f\xa9\xc7\
+\xfd\x5e\xb7\x7e\x2c\xf5\x3e\xf2\xf1\x8c\xbe\xbc\x64\xe8\xfe\x33\
+\xfa\x31\x8d\xb6\xc0\xf8\xdf\xe2\x07\xe3\xfd\xe7\xf5\xf1\xbf\xcb\
+\xe7\x3f\xed\xc8\x23\xd7\xa6\xaf\x7f\xc7\x67\x07\xde\x18\xea\xb0\
+\x53\xd7\xe1\x57\x63\xe1\x9f\x8c\xc7\xff\x89\xc7\x23\xf1\x08\x19\
+\x1c\x7b\xb1\xc6\xff\x1b\x8f\xdf\x8f\x3d\xfc\x46\xfc\xb7\xe7\xfd\
+\xa1\xaa\xde\x12\x7b\xf9\x7b\xe9\x99\x8f\xdd\x9d\xed\xaf\x89\xbd\
+\xde\xfe\xb1\x9d\x53\xef\x7f\xe0\xdd\xdf\xf7\xc5\x78\xde\xa4\x6f\
+\x02\x40\x66\xe3\xfd\x58\x7c\x9a\x6e\xf7\xee\xed\x9f\x8c\x4f\xd5\
+\xfd\x60\xfc\x8f\x33\x86\x82\xad\x63\xf1\x4e\xfb\x15\xf1\x4e\x7b\
+\x4d\xfc\xbb\xca\xe3\x38\x95\x6a\x8d\x35\x6f\x1d\x4b\x3d\xa4\x5e\
+\x52\x4f\xa9\xb7\xcc\xc6\x91\x5d\xb9\xc9\x38\x59\x27\xf3\x64\xbf\
+\xbb\xe3\xfe\x93\xdd\x10\x07\x2a\xf8\x23\xef\x7d\xdb\x1f\xa4\xaf\
+\x7f\xc7\x67\x07\xde\xb6\x7b\x66\xfb\xc4\xb9\x33\xdb\x7f\x73\x77\
+\x67\xfb\xba\x78\x7c\x59\x3c\x9e\x16\x8f\x1c\xfe\xfd\x39\x12\xeb\
+\xfc\xd2\x78\x7c\x75\xec\xe1\xaf\xc6\xff\x0e\xbe\x7b\xf7\xf4\xd6\
+\xc9\xd8\xcb\xbf\x4e\xcf\x7c\x0c\x44\x3b\xd8\xb6\x02\xc0\x60\xf4\
+\x36\x26\x40\x80\xc0\x94\x04\xf4\x92\x9b\x80\x00\x90\xdb\xc4\xd4\
+\x4b\x80\x00\x01\x02\x04\x5a\x10\x10\x00\x5a\x40\xb4\x04\x01\x02\
+\x04\x4a\x17\xd0\x7f\x7e\x02\x02\x40\x7e\x33\x53\x31\x01\x02\x04\
+\x08\x10\x68\x2c\x20\x00\x34\x26\xb4\x00\x01\x02\x04\x4a\x17\xd0\
+\x7f\x8e\x02\x02\x40\x8e\x53\x53\x33\x01\x02\x04\x08\x10\x68\x28\
+\x20\x00\x34\x04\x74\x39\x01\x02\x04\x4a\x17\xd0\x7f\x9e\x02\x02\
+\x40\x9e\x73\x53\x35\x01\x02\x04\x08\x10\x68\x24\x20\x00\x34\xe2\
+\x73\x31\x01\x02\x04\x4a\x17\xd0\x7f\xae\x02\x02\x40\xae\x93\x53\
+\x37\x01\x02\x04\x08\x10\x68\x20\x20\x00\x34\xc0\x73\x29\x01\x02\
+\x04\x4a\x17\xd0\x7f\xbe\x02\x02\x40\xbe\xb3\x53\x39\x01\x02\x04\
+\x08\x10\x58\x59\x40\x00\x58\x99\xce\x85\x04\x08\x10\x28\x5d\x40\
+\xff\x39\x0b\x08\x00\x39\x4f\x4f\xed\x04\x08\x10\x20\x40\x60\x45\
+\x01\x01\x60\x45\x38\x97\x11\x20\x40\xa0\x74\x01\xfd\xe7\x2d\x20\
+\x00\xe4\x3d\x3f\xd5\x13\x20\x40\x80\x00\x81\x95\x04\x04\x80\x95\
+\xd8\x5c\x44\x80\x00\x81\xd2\x05\xf4\x9f\xbb\x80\x00\x90\xfb\x04\
+\xd5\x4f\x80\x00\x01\x02\x04\x56\x10\x10\x00\x56\x40\x73\x09\x01\
+\x02\x04\x4a\x17\xd0\x7f\xfe\x02\x02\x40\xfe\x33\xd4\x01\x01\x02\
+\x04\x08\x10\x58\x5a\x40\x00\x58\x9a\xcc\x05\x04\x08\x10\x28\x5d\
+\x40\xff\x53\x10\x10\x00\xa6\x30\x45\x3d\x10\x20\x40\x80\x00\x81\
+\x25\x05\x04\x80\x25\xc1\x9c\x4e\x80\x00\x81\xd2\x05\xf4\x3f\x0d\
+\x01\x01\x60\x1a\x73\xd4\x05\x01\x02\x04\x08\x10\x58\x4a\x40\x00\
+\x58\x8a\xcb\xc9\x04\x08\x10\x28\x5d\x40\xff\x53\x11\x10\x00\xa6\
+\x32\x49\x7d\x10\x20\x40\x80\x00\x81\x25\x04\x04\x80\x25\xb0\x9c\
+\x4a\x80\x00\x81\xd2\x05\xf4\x3f\x1d\x01\x01\x60\x3a\xb3\xd4\x09\
+\x01\x02\x04\x08\x10\x38\xb4\x80\x00\x70\x68\x2a\x27\x12\x20\x40\
+\xa0\x74\x01\xfd\x4f\x49\x40\x00\x98\xd2\x34\xf5\x42\x80\x00\x01\
+\x02\x04\x0e\x29\x20\x00\x1c\x12\xca\x69\x04\x08\x10\x28\x5d\x40\
+\xff\xd3\x12\xc8\x3e\x00\xcc\xd7\xd6\x6b\x07\x03\xf7\x01\xf7\x01\
+\xf7\x01\xf7\x81\x2c\xef\x03\x27\xd6\xef\x9b\xaf\x6d\x6c\x2e\x8e\
+\x5b\x4f\xde\xd4\x67\xc4\x68\x1e\x00\xaa\x70\x7f\xf0\x42\x80\x00\
+\x01\x02\x13\x17\xd0\x5e\x27\x02\x75\x88\x0f\xfa\xf5\x1d\x21\xc4\
+\x63\xaf\x8a\x61\x60\x3d\x7e\x52\xbb\xb1\x19\x7a\x78\x69\x1e\x00\
+\x7a\x28\xd2\x16\x04\x08\x10\x20\x40\xa0\x1c\x81\xfa\x8e\xfd\x67\
+\x33\xba\x0d\x02\xcd\x03\x40\x5d\x7d\xb0\x9c\xa1\xe8\x94\x00\x01\
+\x02\x65\x0a\xe8\x7a\x08\x81\x14\x04\xba\x0b\x01\xcd\x03\xc0\x10\
+\x26\xf6\x24\x40\x80\x00\x01\x02\x45\x08\xc4\x10\x70\x62\xfd\xbe\
+\x2e\x5a\x6d\x1e\x00\x66\x7b\xbe\x07\xa0\x8b\xc9\x58\x93\x00\x01\
+\x02\xa3\x11\x50\xc8\xa0\x02\x75\xb8\x69\xde\x41\x08\x68\x1e\x00\
+\x06\x55\xb1\x39\x01\x02\x04\x08\x10\x28\x40\x20\x85\x80\xb5\x76\
+\xbf\x1c\xd0\x38\x00\xec\xde\x7d\xca\x33\x00\x05\xdc\xf7\xb4\x48\
+\x80\x40\xb9\x02\x3a\x1f\x8b\x40\xfc\x72\x40\x8b\x21\xa0\x71\x00\
+\x58\xb0\xf8\x51\xc0\x05\x83\x3f\x08\x10\x20\x40\x80\x40\xb7\x02\
+\xf5\x1d\x6d\xad\xdf\x4e\x00\x68\xab\x1a\xeb\x10\x20\x40\x80\xc0\
+\xc8\x04\x94\x33\x36\x81\x79\x4b\xbf\x30\xa8\x9d\x00\x50\xd5\x6f\
+\x1e\x1b\x90\x7a\x08\x10\x20\x40\x80\xc0\x24\x05\xea\xaa\x95\x67\
+\x01\x5a\x09\x00\x8b\xef\x03\xf0\x65\x80\x49\xde\xcf\x34\x45\x80\
+\x40\xd9\x02\xba\x1f\xa1\x40\xfa\x86\xc0\x16\x9e\x05\x68\x25\x00\
+\x2c\x78\x3c\x0b\xb0\x60\xf0\x07\x01\x02\x04\x08\x10\xe8\x5c\x60\
+\x6f\x76\x53\xd3\x3d\x66\x4d\x17\xb8\x78\xbd\x67\x01\x2e\x4a\xf8\
+\x9b\x00\x01\x02\x53\x11\xd0\xc7\x68\x05\xaa\xfa\x85\x4d\x6b\x6b\
+\x2d\x00\x2c\x0a\xf1\x2c\xc0\x82\xc1\x1f\x04\x08\x10\x20\x40\x60\
+\xec\x02\xad\x06\x80\xc5\xb3\x00\x63\xef\x58\x7d\x04\x08\x10\x20\
+\x70\x28\x01\x27\x4d\x5b\xa0\xd5\x00\xb0\xa0\x9a\xd5\x37\x2f\xfe\
+\xf6\x07\x01\x02\x04\x08\x10\x20\x30\x5a\x81\xd6\x03\xc0\xe2\x59\
+\x00\x3f\x11\x30\xda\x81\x2b\x8c\x00\x01\x02\x87\x13\x70\xd6\xd4\
+\x05\x5a\x0f\x00\x0b\x30\xdf\x0b\xb0\x60\xf0\x07\x01\x02\x04\x08\
+\x10\x18\xab\x40\x27\x01\x60\xf1\x2c\x80\x2f\x05\x8c\x75\xe6\xea\
+\x22\x40\x80\xc0\x81\x02\x4e\x18\xb9\x40\x5d\x7d\xb0\x69\x85\x9d\
+\xb3\x29\x09\x12\x00\x00\x02\x7c\x49\x44\x41\x54\x04\x80\x54\xd4\
+\x22\x04\x84\xca\x6f\x08\x4c\x18\x0e\x02\x04\x08\x10\x20\xd0\xa2\
+\xc0\xee\xce\xd6\x66\xd3\xe5\x3a\x0b\x00\xa9\xb0\xfd\x02\x85\x80\
+\x64\xe1\x20\x40\x80\x40\x3e\x02\x2a\x1d\xb5\x40\x4b\xdf\x67\xd7\
+\x69\x00\x48\x80\x42\x40\x52\x70\x10\x20\x40\x80\x00\x81\x96\x04\
+\x5a\x78\xfa\x3f\x55\xd2\x79\x00\x48\x9b\x08\x01\x49\xc1\x41\x80\
+\x00\x81\x3c\x04\x54\x39\x6e\x81\xfd\xc7\xd4\xe6\x35\xf6\x12\x00\
+\x52\x99\xfb\x05\xfb\x72\x40\xb2\x70\x10\x20\x40\x80\x00\x81\xd5\
+\x04\xda\x7b\x1c\xed\x2d\x00\xa4\x46\x85\x80\xa4\xe0\x20\x40\x80\
+\xc0\x98\x05\xd4\x36\x5e\x81\xea\xcd\xfb\x8f\xa3\xed\x54\xd8\x6b\
+\x00\x48\x25\xa7\xe2\x77\x77\xb6\xab\xe0\x27\x04\x82\x17\x02\x04\
+\x08\x10\x20\x70\x38\x81\x76\x1f\xfc\xd3\x9e\xbd\x07\x80\xb4\x69\
+\x3a\x76\x17\x3f\xc2\xd0\xde\x53\x19\x69\x4d\x07\x01\x02\x04\x08\
+\x34\x13\x70\xf5\x08\x05\xaa\x70\xff\xfe\x63\x66\xbb\xb5\x0d\x16\
+\x00\x52\x1b\xa9\xa1\x5d\xcf\x06\x24\x0a\x07\x01\x02\x04\x08\x10\
+\x78\xa2\x40\x7c\xf0\x0f\x1d\xfd\x76\xdd\x41\x03\xc0\xc5\x4e\x77\
+\xe3\xb3\x01\xbb\x8f\x06\x01\xcf\x0a\x5c\x74\xf1\x37\x01\x02\x04\
+\xfa\x15\xb0\xdb\x68\x04\xd2\x03\xff\xac\xbe\x79\xf7\xf4\xf6\xcd\
+\xfb\xbf\x58\xaf\xfd\xca\x46\x11\x00\x2e\xb6\xb5\xbb\x08\x02\x5b\
+\x9b\xbb\x17\xc3\x40\x02\xb8\xf8\x41\x7f\x13\x20\x40\x80\x00\x81\
+\x22\x04\xe2\xd7\xfb\x3b\x7c\xe0\xbf\x48\x38\xaa\x00\x70\xb1\xa8\
+\xf4\xf7\x6e\x0a\x03\x09\x20\x85\x81\x98\x82\x42\x3a\x16\xdf\x38\
+\x18\x9f\x21\x48\xc1\x20\x1d\xe9\x44\x07\x01\x02\x04\x08\xb4\x22\
+\x60\x91\x01\x04\xd2\x63\x59\x3a\xd2\x63\x5c\x3c\x76\xe3\x63\xde\
+\x6e\x7c\xfc\xeb\xa3\x92\xd1\x06\x80\x4b\x9b\x4f\x4f\x7f\x2c\x8e\
+\x88\x92\x60\x16\x4f\x89\x5c\x08\x07\xbb\x0b\xac\xed\xca\xdf\x0c\
+\xdc\x07\xdc\x07\xdc\x07\xdc\x07\xb2\xbb\x0f\xa4\xc7\xb2\x74\xdc\
+\x7d\xea\xfe\xf4\x38\x77\xe9\x63\x5f\xd7\xaf\x67\x11\x00\xba\x46\
+\xb0\x3e\x01\x02\x04\x08\x10\x28\x4d\x40\x00\x28\x6d\xe2\xfa\x25\
+\x40\x80\x00\x01\x02\x51\x40\x00\x88\x08\x6e\x04\x08\x10\x28\x5d\
+\x40\xff\xe5\x09\x08\x00\xe5\xcd\x5c\xc7\x04\x08\x10\x20\x40\x20\
+\x08\x00\xee\x04\x04\x08\x10\x28\x5e\x00\x40\x89\x02\x02\x40\x89\
+\x53\xd7\x33\x01\x02\x04\x08\x14\x2f\x20\x00\x14\x7f\x17\x00\x40\
+\x80\x40\xe9\x02\xfa\x2f\x53\x40\x00\x28\x73\xee\xba\x26\x40\x80\
+\x00\x81\xc2\x05\x04\x80\xc2\xef\x00\xda\x27\x40\xa0\x74\x01\xfd\
+\x97\x2a\x20\x00\x94\x3a\x79\x7d\x13\x20\x40\x80\x40\xd1\x02\x02\
+\x40\xd1\xe3\xd7\x3c\x01\x02\xa5\x0b\xe8\xbf\x5c\x01\x01\xa0\xdc\
+\xd9\xeb\x9c\x00\x01\x02\x04\x0a\x16\x10\x00\x0a\x1e\xbe\xd6\x09\
+\x10\x28\x5d\x40\xff\x25\x0b\x08\x00\x25\x4f\x5f\xef\x04\x08\x10\
+\x20\x50\xac\x80\x00\x50\xec\xe8\x35\x4e\x80\x40\xe9\x02\xfa\x2f\
+\x5b\xe0\xff\x03\x00\x00\xff\xff\x37\xb1\x7d\x7f\x00\x00\x00\x06\
+\x49\x44\x41\x54\x03\x00\x34\x3e\x02\x1e\x2f\xe7\x93\xe3\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4e\xee\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x9d\x0d\xcc\x7c\xcd\
+\x59\x97\xb7\x96\x0f\xf9\x28\x2d\x46\x23\x6d\x68\x81\x52\x1b\x0c\
+\x90\x0a\x14\xe5\xa3\x29\xb4\x54\x24\x42\x30\x12\x12\xa8\xd4\x46\
+\xa1\x96\x62\xa0\x14\x88\x50\x94\xda\x17\x82\x08\x2a\x68\x88\x48\
+\x69\x10\x22\xa0\x10\x0d\x24\x80\x46\xc1\xf2\x5d\x14\xb5\xad\x14\
+\xa3\x06\x22\x25\x42\x2c\xa0\x12\x20\xa0\x11\xa1\xe2\x5c\xcf\xff\
+\x39\xcf\xb3\xbb\xcf\x7e\x9c\x3d\x3b\x73\x66\xee\x99\xeb\xcd\xb9\
+\xdf\x73\xf6\xec\x39\x33\xf7\x5c\xf7\xec\xdc\xbf\x99\xdd\xf3\x7f\
+\x7e\xcf\xc6\xff\x24\x20\x01\x09\x48\x40\x02\x12\x18\x8e\x80\x02\
+\x60\xb8\x90\xdb\x60\x09\x48\x40\x02\x12\x90\xc0\x66\xa3\x00\xb0\
+\x17\x48\x40\x02\x12\x90\x80\x04\x06\x24\xa0\x00\x18\x30\xe8\x36\
+\x59\x02\x12\x90\x80\x04\xc6\x26\x40\xeb\x15\x00\x50\xd0\x24\x20\
+\x01\x09\x48\x40\x02\x83\x11\x50\x00\x0c\x16\x70\x9b\x2b\x01\x09\
+\x48\x40\x02\xa3\x13\x78\xd4\x7e\x05\xc0\x23\x0e\xfe\x5f\x02\x12\
+\x90\x80\x04\x24\x30\x14\x01\x05\xc0\x50\xe1\xb6\xb1\x12\x90\x80\
+\x04\x24\x30\x3a\x81\xa9\xfd\x0a\x80\x89\x84\x7b\x09\x48\x40\x02\
+\x12\x90\xc0\x40\x04\x14\x00\x03\x05\xdb\xa6\x4a\x40\x02\x12\x90\
+\xc0\xe8\x04\xee\xdb\xaf\x00\xb8\x67\xe1\x91\x04\x24\x20\x01\x09\
+\x48\x60\x18\x02\x0a\x80\x61\x42\x6d\x43\x25\x20\x01\x09\x48\x60\
+\x74\x02\xdb\xed\x57\x00\x6c\xd3\xf0\x58\x02\x12\x90\x80\x04\x24\
+\x30\x08\x01\x05\xc0\x20\x81\xb6\x99\x12\x90\x80\x04\x24\x30\x3a\
+\x81\xdd\xf6\x2b\x00\x76\x79\xf8\x4a\x02\x12\x90\x80\x04\x24\x30\
+\x04\x01\x05\xc0\x10\x61\xb6\x91\x12\x90\x80\x04\x24\x30\x3a\x81\
+\xfd\xf6\x2b\x00\xf6\x89\xf8\x5a\x02\x12\x90\x80\x04\x24\x30\x00\
+\x01\x05\xc0\x00\x41\xb6\x89\x12\x90\x80\x04\x24\x30\x3a\x81\x87\
+\xed\x57\x00\x3c\x64\xe2\x19\x09\x48\x40\x02\x12\x90\x40\xf7\x04\
+\x14\x00\xdd\x87\xd8\x06\x4a\x40\x02\x12\x90\xc0\xe8\x04\x0e\xb5\
+\x5f\x01\x70\x88\x8a\xe7\x24\xd0\x17\x81\x67\xa6\xe6\x7c\x72\xb2\
+\x2f\x4b\xf6\x6d\xc9\xbe\x2f\xd9\x8f\x25\xfb\x91\x64\xdf\x9b\xec\
+\x1b\x92\x7d\x7e\xb2\xe7\x25\xfb\xfd\xc9\xdc\x24\x20\x81\x01\x08\
+\x28\x00\x06\x08\xb2\x4d\x1c\x92\xc0\x07\xa7\x56\xff\xed\x64\x3f\
+\x9f\xec\xa7\x93\xfd\x93\x64\xaf\x4a\xf6\x69\xc9\x3e\x36\xd9\x73\
+\x92\x3d\x37\xd9\x27\x24\x7b\x69\xb2\xaf\x4e\xf6\x83\xc9\xfe\x47\
+\xb2\xd7\x27\xfb\x9c\x64\x4f\x48\xe6\x26\x01\x09\x84\x27\x70\xb8\
+\x01\x0a\x80\xc3\x5c\x3c\x2b\x81\xa8\x04\x48\xec\xdf\x9d\x9c\x7f\
+\x63\xb2\x57\x24\x7b\x6a\xb2\x4b\xb7\x8f\x4c\x37\x7c\x6d\xb2\x5f\
+\x4e\xf6\x15\xc9\xde\x2d\x99\x9b\x04\x24\xd0\x19\x01\x05\x40\x67\
+\x01\xb5\x39\xc3\x12\x78\xd7\xd4\xf2\xaf\x4f\xc6\xd2\xfe\x27\xa6\
+\x7d\x8e\xed\x9d\x52\x21\x5f\x9c\xec\x67\x93\x7d\x46\x32\x37\x09\
+\x48\x20\x20\x81\x63\x2e\x2b\x00\x8e\x91\xf1\xbc\x04\xe2\x10\x78\
+\x7e\x72\xf5\x27\x93\xbd\x2c\x59\x89\x8d\xdf\x05\x7c\x63\x2a\xf8\
+\x5b\x93\xbd\x43\x32\x37\x09\x48\xa0\x03\x02\x0a\x80\x0e\x82\x68\
+\x13\x86\x26\xf0\xe7\x53\xeb\x7f\x20\xd9\xfb\x26\x2b\xbd\xbd\x28\
+\x55\xf0\xe3\xc9\xde\x27\x99\x9b\x04\x24\x10\x82\xc0\x71\x27\x15\
+\x00\xc7\xd9\xf8\x8e\x04\x5a\x27\xf0\x59\xc9\xc1\x6f\x4a\xb6\xe6\
+\xf6\xec\x54\xd9\xf7\x27\x7b\x46\x32\x37\x09\x48\x20\x30\x01\x05\
+\x40\xe0\xe0\xe9\xfa\xd0\x04\x5e\x98\x5a\xff\xf7\x92\xd5\xd8\x48\
+\xfe\xdf\x95\x2a\x7e\x52\x32\x37\x09\x48\xa0\x61\x02\xa7\x5c\x53\
+\x00\x9c\xa2\xe3\x7b\x12\x68\x93\x00\x8f\xf8\xf1\x3c\x7f\x4d\xef\
+\x3e\x30\x55\xfe\x0f\x92\xb9\x49\x40\x02\x41\x09\x28\x00\x82\x06\
+\x4e\xb7\x87\x26\xf0\x75\xa9\xf5\x2d\x7c\x76\x79\xda\xe0\x95\xc9\
+\x17\x37\x09\x48\xa0\x49\x02\xa7\x9d\x6a\x61\x10\x39\xed\xa1\xef\
+\x4a\x40\x02\xdb\x04\xfe\x72\x7a\xf1\x61\xc9\x5a\xd9\xfe\x7a\x72\
+\xe4\x0f\x27\x73\x93\x80\x04\x82\x11\x50\x00\x04\x0b\x98\xee\x0e\
+\x4d\xe0\xc9\xa9\xf5\x8f\x25\x6b\x6d\xfb\x92\xd6\x1c\xd2\x1f\x09\
+\x48\x60\xb3\x39\xc7\x40\x01\x70\x8e\x90\xef\x4b\xa0\x1d\x02\x9f\
+\x9b\x5c\x79\xfb\x64\xad\x6d\x7f\x26\x39\xc4\xef\x12\xd2\xce\x4d\
+\x02\x12\x88\x42\x40\x01\x10\x25\x52\xfa\x39\x3a\x81\xc7\x27\x00\
+\xa5\xfe\xa1\x9f\x54\xf4\xd5\xdb\x4b\xae\x2e\xc1\x02\x24\x20\x81\
+\x8c\x04\xce\x17\xa5\x00\x38\xcf\xc8\x2b\x24\xd0\x02\x81\x4f\x49\
+\x4e\x3c\x31\x59\xab\x1b\xff\x48\xd0\xe3\x5a\x75\x4e\xbf\x24\x20\
+\x81\x87\x04\x14\x00\x0f\x99\x78\x46\x02\x2d\x12\xe0\x17\xf7\x2d\
+\xfa\x35\xf9\xc4\x5f\x0e\xfc\xf8\xe9\x85\x7b\x09\x48\xa0\x2e\x81\
+\x39\xb5\x2b\x00\xe6\x50\xf2\x1a\x09\xd4\x27\xf0\x31\xf5\x5d\x38\
+\xeb\xc1\xf3\xce\x5e\xe1\x05\x12\x90\x40\x33\x04\x14\x00\xcd\x84\
+\x42\x47\x24\x70\x94\xc0\xd3\xd3\x3b\xfc\x41\x9e\xb4\x6b\x7a\xfb\
+\x63\x4d\x7b\xa7\x73\x12\x18\x86\xc0\xbc\x86\x2a\x00\xe6\x71\xf2\
+\x2a\x09\xd4\x24\x10\xe5\x39\xfb\xf7\xaf\x09\xc9\xba\x25\x20\x81\
+\xcb\x08\x28\x00\x2e\xe3\xe5\xd5\x12\xa8\x41\xe0\xa9\x35\x2a\x5d\
+\x50\x27\x7f\x1b\xe0\xdd\x16\xdc\xe7\x2d\x12\x90\x40\x46\x02\x73\
+\x8b\x52\x00\xcc\x25\xe5\x75\x12\xa8\x47\xe0\x0f\xd4\xab\xfa\xe2\
+\x9a\xdf\xfd\xe2\x3b\xbc\x41\x02\x12\xa8\x42\x40\x01\x50\x05\xbb\
+\x95\x4a\xe0\x22\x02\x2d\xfe\xe3\x3f\xc7\x1a\xf0\x0e\xc7\xde\xf0\
+\xbc\x04\x24\xb0\x06\x81\xf9\x75\x28\x00\xe6\xb3\xf2\x4a\x09\x48\
+\x40\x02\x12\x90\x40\x37\x04\x14\x00\xdd\x84\xd2\x86\x48\x40\x02\
+\x12\x90\xc0\xe8\x04\x2e\x69\xbf\x02\xe0\x12\x5a\x5e\x2b\x01\x09\
+\x48\x40\x02\x12\xe8\x84\x80\x02\xa0\x93\x40\xda\x0c\x09\x48\x40\
+\x02\x12\x18\x9d\xc0\x65\xed\x57\x00\x5c\xc6\xcb\xab\x25\x20\x01\
+\x09\x48\x40\x02\x5d\x10\x50\x00\x74\x11\x46\x1b\x21\x01\x09\x48\
+\x40\x02\xa3\x13\xb8\xb4\xfd\x0a\x80\x4b\x89\x79\xbd\x04\x24\x20\
+\x01\x09\x48\xa0\x03\x02\x0a\x80\x0e\x82\x68\x13\x24\x20\x01\x09\
+\x48\x60\x74\x02\x97\xb7\x5f\x01\x70\x39\x33\xef\x90\x80\x04\x24\
+\x20\x01\x09\x84\x27\xa0\x00\x08\x1f\x42\x1b\x20\x01\x09\x48\x40\
+\x02\xa3\x13\x58\xd2\x7e\x05\xc0\x12\x6a\xde\x23\x01\x09\x48\x40\
+\x02\x12\x08\x4e\x40\x01\x10\x3c\x80\xba\x2f\x01\x09\x48\x40\x02\
+\xa3\x13\x58\xd6\x7e\x05\xc0\x32\x6e\xde\x25\x01\x09\x48\x40\x02\
+\x12\x08\x4d\x40\x01\x10\x3a\x7c\x3a\x2f\x01\x09\x48\x40\x02\xa3\
+\x13\x58\xda\x7e\x05\xc0\x52\x72\xde\x27\x01\x09\x48\x40\x02\x12\
+\x08\x4c\x40\x01\x10\x38\x78\xba\x2e\x01\x09\x48\x40\x02\xa3\x13\
+\x58\xde\x7e\x05\xc0\x72\x76\xde\x29\x01\x09\x48\x40\x02\x12\x08\
+\x4b\x40\x01\x10\x36\x74\x3a\x2e\x01\x09\x48\x40\x02\xa3\x13\xb8\
+\xa6\xfd\x0a\x80\x6b\xe8\x79\xaf\x04\x24\x20\x01\x09\x48\x20\x28\
+\x01\x05\x40\xd0\xc0\xe9\xb6\x04\x24\x20\x01\x09\x8c\x4e\xe0\xba\
+\xf6\x2b\x00\xae\xe3\xe7\xdd\x12\x90\x80\x04\x24\x20\x81\x90\x04\
+\x14\x00\x21\xc3\xa6\xd3\x12\x90\x80\x04\x24\x30\x3a\x81\x6b\xdb\
+\xaf\x00\xb8\x96\xa0\xf7\x4b\x20\x2f\x81\x8f\x4e\xc5\x61\x8f\xa5\
+\xfd\x0f\xdd\xda\xab\xd2\x3e\xca\xf6\x33\xc9\x51\xfc\xc6\x7f\x8c\
+\xb6\xa4\x53\x6e\x12\x90\x40\x6b\x04\x14\x00\xad\x45\x44\x7f\x46\
+\x20\x40\x52\x9c\x8c\x24\x49\xc2\xc4\x7e\x37\x35\x9e\x3d\xf6\xea\
+\x74\x3c\x5d\x93\x0e\x43\x6d\xf8\x8d\xff\x18\x6d\xa1\x5d\x18\xc7\
+\xb4\x77\x32\xae\x0b\xd5\x30\x9d\x95\x40\x3b\x04\xae\xf7\x44\x01\
+\x70\x3d\x43\x4b\x90\xc0\x31\x02\x24\x38\x8c\x84\x47\xf2\xc3\xa6\
+\x44\xc8\x31\x46\x92\xe4\x1a\xec\x58\x39\xbd\x9c\xa7\x8d\xb4\x77\
+\x32\xda\x0f\x0f\x8c\x63\x38\x61\x5c\xd7\x4b\x9b\x6d\x87\x04\x9a\
+\x25\xa0\x00\x68\x36\x34\x3a\x16\x90\x00\x89\x0b\x23\x99\x6d\x1b\
+\x09\x8f\xf3\x58\xc0\x66\xad\xe2\x32\x6c\xe0\x84\xc1\x6e\x5f\x14\
+\xac\xe2\x84\x95\x48\x20\x0a\x81\x1c\x7e\x2a\x00\x72\x50\xb4\x8c\
+\x51\x09\x90\xb4\x98\xb1\x6e\x27\x2c\x8e\x39\x8f\x8d\xca\x25\x57\
+\xbb\x61\x88\x20\xc0\x10\x04\x18\xbc\x31\xde\xcb\x55\x8f\xe5\x48\
+\x60\x48\x02\x0a\x80\x21\xc3\x6e\xa3\x17\x12\x20\xe9\x90\xe0\x31\
+\x92\x11\x7b\x92\x13\xe7\x17\x16\xe9\x6d\x17\x12\x80\x37\x06\x7b\
+\x62\x80\x18\xc0\x2e\x2c\xc6\xcb\x25\x10\x99\x40\x1e\xdf\x15\x00\
+\x79\x38\x5a\x4a\xbf\x04\x48\xee\x53\xb2\x61\xcf\x6b\xac\xdf\x16\
+\xc7\x6a\x19\x62\x00\x43\x0c\x10\x1f\xc4\x80\xf1\x89\x15\x43\xbd\
+\xad\x44\x40\x01\x50\x09\xbc\xd5\x36\x4b\x80\xe4\x81\x91\x4c\xa6\
+\xa4\xc2\xeb\x66\x1d\xd6\xb1\x3b\x02\xc4\x09\x31\x30\xc5\x0e\x31\
+\x80\xdd\x5d\xe0\x81\x04\x7a\x20\x90\xab\x0d\x0a\x80\x5c\x24\x2d\
+\x27\x3a\x01\x92\x07\x89\x63\x32\x5e\x47\x6f\xd3\xe8\xfe\x23\x06\
+\x30\x84\x1c\x42\x00\x1b\x9d\x89\xed\x97\xc0\x1d\x01\x05\xc0\x1d\
+\x0a\x0f\x06\x24\x40\x92\x27\xe1\x93\x20\xd8\xf3\x7a\x40\x0c\x43\
+\x34\x19\x21\x80\x11\x6b\x85\xc0\x10\x21\xef\xb5\x91\xf9\xda\xa5\
+\x00\xc8\xc7\xd2\x92\x62\x10\x20\xc9\x93\xec\x27\xe3\x75\x0c\xcf\
+\xf5\x32\x17\x81\x49\x08\xd0\x07\x14\x03\xb9\xa8\x5a\x4e\x38\x02\
+\x0a\x80\x70\x21\xd3\xe1\x05\x04\x48\xf2\x18\x03\x3e\xc6\x31\xb6\
+\xa0\x28\x6f\xe9\x88\x00\x7d\x60\x12\x03\x08\x01\xac\xa3\xe6\xd9\
+\x94\x1e\x09\xe4\x6c\x93\x02\x20\x27\x4d\xcb\x6a\x8d\x00\x03\x3c\
+\x09\x7f\x32\x5e\xb7\xe6\xa3\xfe\xb4\x41\x00\x21\x80\x4d\x5f\x11\
+\xd8\x57\xda\x88\x8b\x5e\x14\x24\xa0\x00\x28\x08\xd7\xa2\xab\x10\
+\x60\xe0\x26\xe1\x33\x90\xb3\xe7\x75\x15\x47\xac\x34\x2c\x01\x84\
+\x00\x7d\x87\x3e\xe4\xaa\x40\xd8\x30\xf6\xe8\x78\xde\x36\x29\x00\
+\xf2\xf2\xb4\xb4\x7a\x04\x48\xf4\x0c\xda\x18\xc7\xf5\x3c\xb1\xe6\
+\x9e\x08\x20\x06\x14\x02\x3d\x45\xd4\xb6\xdc\x11\x50\x00\xdc\xa1\
+\xf0\x20\x28\x01\x92\x3d\x49\x1f\xe3\x38\x68\x33\x74\xbb\x71\x02\
+\xdb\x42\xc0\x55\x81\xc6\x83\xd5\xab\x7b\xb9\xdb\xa5\x00\xc8\x4d\
+\xd4\xf2\xd6\x22\x40\xb2\x27\xe9\x63\x1c\xaf\x55\xaf\xf5\x8c\x4d\
+\x00\x21\x80\x21\x02\xb0\xb1\x69\xd8\xfa\xd0\x04\x14\x00\xa1\xc3\
+\x37\xa4\xf3\x0c\xba\x2c\xc9\x9a\xf8\x87\x0c\x7f\x33\x8d\x46\x04\
+\x60\xf4\x47\xac\x19\xc7\x74\xa4\x57\x02\xf9\xdb\xa5\x00\xc8\xcf\
+\xd4\x12\xcb\x10\x60\x90\x25\xf1\x33\xe8\x96\xa9\xc1\x52\x25\x70\
+\x39\x01\xfa\x23\x46\xff\xc4\x2e\x2f\xc1\x3b\x24\x50\x89\x80\x02\
+\xa0\x12\x78\xab\x9d\x4d\x80\x41\xd5\xc4\x3f\x1b\x97\x17\x56\x22\
+\x80\x08\xc0\xe8\xab\xf4\xd9\x4a\x6e\x58\x6d\xaf\x04\x4a\xb4\x4b\
+\x01\x50\x82\xaa\x65\x5e\x4b\x80\xef\xf4\x59\xe2\x67\x30\x65\x50\
+\xbd\xb6\x3c\xef\x97\xc0\x9a\x04\xe8\xb3\xf4\x5d\x85\xc0\x9a\xd4\
+\xad\xeb\x62\x02\x0a\x80\x8b\x91\x79\x43\x41\x02\x53\xe2\x27\xf9\
+\x73\x5c\xb0\x2a\x8b\x96\x40\x71\x02\x0a\x81\xe2\x88\x47\xa9\xa0\
+\x4c\x3b\x15\x00\x65\xb8\x5a\xea\xe5\x04\x98\x2d\x99\xf8\x2f\xe7\
+\xe6\x1d\xed\x13\x50\x08\xb4\x1f\xa3\x21\x3d\x54\x00\x0c\x19\xf6\
+\xa6\x1a\x4d\xe2\x67\xb9\x94\x41\xb2\x29\xc7\x74\x46\x02\x99\x09\
+\xd0\xc7\x11\xb9\xf4\xf9\xcc\x45\x5b\x5c\xcf\x04\x4a\xb5\x4d\x01\
+\x50\x8a\xac\xe5\x9e\x23\xc0\x12\x3f\x83\x21\x83\xe2\xb9\x6b\x7d\
+\x5f\x02\xbd\x10\xa0\xdf\xd3\xe7\x15\x01\xbd\x44\x34\x70\x3b\x14\
+\x00\x81\x83\x17\xd4\x75\x06\x40\x12\x3f\xc6\x71\xd0\x66\xe8\xb6\
+\x04\xae\x22\x80\x08\x60\xe5\x4b\x21\x70\x15\xc6\x11\x6e\x2e\xd7\
+\x46\x05\x40\x39\xb6\x96\xfc\x90\x00\x83\x9d\x89\xff\x21\x17\xcf\
+\x8c\x4b\x00\x21\xc0\x67\x82\xcf\xc6\xb8\x14\x6c\x79\x15\x02\x0a\
+\x80\x2a\xd8\x87\xab\x94\x99\x3e\x83\x1c\x83\xdd\x70\x8d\xb7\xc1\
+\x12\x38\x43\x80\xcf\x07\x9f\x0d\x45\xc0\x19\x50\x23\xbe\x5d\xb2\
+\xcd\x0a\x80\x92\x74\x2d\x1b\x02\x0c\x6a\x24\x7f\x06\x39\x5e\x6b\
+\x12\x90\xc0\x61\x02\x88\x00\xbf\x16\x38\xcc\xc6\xb3\x05\x08\x28\
+\x00\x0a\x40\xb5\xc8\x1b\x02\x24\x7c\x12\x3f\x83\xda\xcd\x09\xff\
+\x27\x01\x09\xcc\x22\xc0\x67\x06\xe1\x3c\xeb\x62\x2f\xea\x99\x40\
+\xd9\xb6\x29\x00\xca\xf2\x1d\xb1\xf4\x29\xf1\x93\xfc\x39\x1e\x91\
+\x81\x6d\x96\xc0\xb5\x04\x10\x01\xae\x06\x5c\x4b\xd1\xfb\x4f\x12\
+\x50\x00\x9c\xc4\xe3\x9b\x17\x12\x60\xd6\x62\xe2\xbf\x10\x9a\x97\
+\x4b\xe0\x04\x01\x84\x80\x9f\xa9\x13\x80\x7a\x7e\xab\x74\xdb\x14\
+\x00\xa5\x09\x8f\x53\x3e\x83\x14\x83\xd5\x38\x2d\xb6\xa5\x12\x58\
+\x87\x00\x2b\x69\x7c\xbe\x10\xd8\xeb\xd4\x68\x2d\x43\x10\x50\x00\
+\x0c\x11\xe6\xa2\x8d\x9c\x06\x27\xf6\x45\x2b\xb2\x70\x09\x0c\x4e\
+\x00\x81\xad\x08\x18\xa6\x13\x94\x6f\xa8\x02\xa0\x3c\xe3\x9e\x6b\
+\x60\x30\x62\x66\x62\xf2\xef\x39\xca\xb6\xad\x25\x02\x88\x00\x7e\
+\x1b\xe0\x67\xae\xa5\xa8\x04\xf5\x45\x01\x10\x34\x70\x0d\xb8\x4d\
+\xe2\x67\x30\x6a\xc0\x15\x5d\x90\xc0\x70\x04\xf8\xfc\x21\xc0\x87\
+\x6b\xf8\x28\x0d\x5e\xa3\x9d\x0a\x80\x35\x28\xf7\x55\x07\x33\x0f\
+\x06\x1f\xf6\x7d\xb5\xcc\xd6\x48\x20\x16\x01\x04\xb8\x22\x20\x56\
+\xcc\x9a\xf2\x56\x01\xd0\x54\x38\x9a\x77\x86\xc1\xc6\xe4\xdf\x7c\
+\x98\x74\x70\x20\x02\x88\x00\xbf\x12\xe8\x2e\xe0\xeb\x34\x48\x01\
+\xb0\x0e\xe7\x1e\x6a\x21\xf1\x33\xd8\xf4\xd0\x16\xdb\x20\x81\xde\
+\x08\xf0\xf9\x44\xa0\xf7\xd6\x2e\xdb\x53\x90\x80\x02\xa0\x20\xdc\
+\x4e\x8a\x66\xa9\x9f\xc1\x85\x7d\x27\x4d\xb2\x19\x12\xe8\x92\x00\
+\x02\x5d\x11\xd0\x41\x68\xd7\x6a\x82\x02\x60\x2d\xd2\x31\xeb\x61\
+\x30\x31\xf9\xc7\x8c\x9d\x5e\x8f\x49\x00\x11\xe0\x57\x02\x63\xc6\
+\xfe\xe2\x56\x2b\x00\x2e\x46\x36\xcc\x0d\x24\x7e\x06\x93\x61\x1a\
+\xdc\x5b\x43\xdf\xf5\xe9\x1f\xbd\x99\xec\x5d\xde\xfb\x39\x9b\x77\
+\x7a\xca\x07\x6d\x9e\xf8\x01\x9f\xb4\x79\xc2\x33\x3f\x6e\xf3\x84\
+\x67\x7c\x4c\xb2\x17\x6c\xde\xed\xfd\x3e\x7e\xf3\xa4\x67\x7d\xea\
+\xe6\x9d\xdf\xf3\x43\xef\xae\x7d\xd7\xdb\xfb\x7a\xe3\x31\x58\x7b\
+\xf8\xfc\x22\xe0\x07\x6b\x76\x0f\xcd\x5d\xaf\x0d\x0a\x80\xf5\x58\
+\x47\xa9\x89\xa5\x7e\x67\x10\x0d\x46\x6b\x4a\xcc\xef\xf1\x82\xc7\
+\x36\xef\xfb\xd2\x1f\xda\xb1\x67\x7d\xe5\xef\x6e\xf6\x6d\xfb\x9a\
+\x67\xbc\xec\xc7\x36\xcf\x7c\xf9\x9b\x36\xef\xfd\xa2\xef\xdc\x3c\
+\xfd\xd3\xff\xf9\xe6\xe9\x2f\x79\x5d\xb2\x7f\xb9\x79\x9f\x3f\xf7\
+\x4f\x37\xef\xf5\xc2\x6f\xdf\xfc\xa1\xcf\xfe\xb7\x3b\xe5\x71\xef\
+\x7e\x79\xbc\xe6\xfc\x64\xf8\x81\xe1\x57\x83\xb8\x74\x69\xb3\x41\
+\xc0\x2b\x02\xec\x09\x47\x09\x28\x00\x8e\xa2\x19\xf2\x0d\x06\x0b\
+\x66\x0e\x43\x36\xbe\x95\x46\x93\x50\x31\x92\xeb\x94\x6c\xb7\x93\
+\xef\x1f\x7c\xc1\xab\xab\xcd\xd6\xf1\x6b\x32\xfc\xc0\xf0\x11\xff\
+\x30\x8e\xf1\x7b\x32\xae\x6d\x85\xeb\xa0\x7e\x20\x02\xfc\x4c\x07\
+\x0a\xfe\x9a\xae\x2a\x00\xd6\xa4\xdd\x76\x5d\x24\x7f\x06\x8b\xb6\
+\xbd\xec\xc8\x3b\x92\x23\x46\xd2\xc4\x48\xa0\x18\xc7\x18\xc9\x95\
+\xf7\xb1\x28\xcd\xc6\x57\xfc\x9e\x8c\x76\xd0\x26\x8c\xe3\x49\x18\
+\x44\x69\x4f\x27\x7e\xb2\xaa\x87\x08\x60\xdf\x49\x93\x6c\x46\x0e\
+\x02\x0a\x80\x1c\x14\xe3\x97\x61\xf2\x5f\x21\x86\x24\x47\x12\x20\
+\x89\x70\x4a\x88\x1c\x73\x1e\x5b\xc1\x85\xaa\x55\xd0\xc6\x49\x18\
+\xd0\x7e\x0c\x1e\x18\xef\x55\x75\xae\xff\xca\x49\xfe\x8a\x80\xe6\
+\xe3\xbc\xae\x83\x0a\x80\x75\x79\xb7\x58\x9b\xc9\xbf\x50\x54\x48\
+\x6a\x24\x78\x8c\x64\xc7\x9e\x04\xc8\xf9\x42\x55\x86\x2b\x16\x1e\
+\x18\x6c\x60\x84\x18\xc0\x64\x54\x2c\x94\x8a\x80\x62\x68\xe3\x15\
+\xac\x00\x88\x17\xb3\x9c\x1e\x9b\xfc\x33\xd2\x24\x69\x61\x53\x32\
+\x63\xcf\x6b\x2c\x63\x35\x5d\x17\x85\x18\xc0\x60\xb7\x2d\x08\xba\
+\x6e\xf4\xfa\x8d\x43\x04\xf0\xd9\x5f\xbf\x66\x6b\x3c\x49\x60\xed\
+\x37\x15\x00\x6b\x13\x6f\xa7\x3e\x06\x01\xbf\xf3\xbf\x32\x1e\x24\
+\x77\x66\xac\x24\xac\xc9\x38\x77\x65\xb1\xde\x7e\x4b\x00\x31\x80\
+\x29\x06\x6e\x81\xe4\xdb\xf1\xd9\x57\x04\xe4\xe3\x19\xb2\x24\x05\
+\x40\xc8\xb0\x5d\xed\x34\xc9\x9f\xef\x04\xaf\x2e\x68\xd4\x02\x48\
+\xf2\x53\xc2\x27\x41\xf1\x7a\x54\x16\x6b\xb5\x1b\xce\x98\x62\x20\
+\x1b\x71\x45\x40\x36\x94\x39\x0a\x5a\xbf\x0c\x05\xc0\xfa\xcc\x6b\
+\xd6\x48\xd2\x37\xf9\x2f\x8c\x00\x49\x9e\xa4\x4f\x02\x62\xcf\xeb\
+\x85\x45\x79\xdb\x95\x04\x10\x02\x18\xb1\x60\x05\xe6\xca\xe2\x46\
+\xbe\x5d\x11\x30\x70\xf4\x15\x00\xe3\x04\xdf\xe4\xbf\x20\xd6\x24\
+\x79\x92\x3d\x89\x86\x3d\xaf\x17\x14\xe3\x2d\x05\x09\x4c\x42\x80\
+\xf8\x28\x06\x16\x81\x56\x04\x2c\xc2\x96\xf7\xa6\x1a\xa5\x29\x00\
+\x6a\x50\x5f\xbf\xce\x29\xf9\xaf\x5f\x73\xc0\x1a\x49\xf2\x18\x09\
+\x05\xe3\x38\x60\x33\x86\x73\x99\x38\x4d\x62\x00\x21\x80\x0d\x07\
+\x61\x79\x83\x11\x01\xac\x0e\x2e\x2f\xc1\x3b\xc3\x11\x50\x00\x84\
+\x0b\xd9\xc5\x0e\xf3\x43\x1f\x3f\xd8\x33\xb0\x91\x40\x48\xf8\x93\
+\xf1\x7a\xc6\x6d\x5e\xd2\x20\x01\x84\x00\xc6\xca\x8d\x42\x60\x76\
+\x80\x9c\x28\xcc\x46\x95\xfb\xc2\x3a\xe5\x29\x00\xea\x70\x5f\xab\
+\x56\x92\x3f\xca\x7e\xad\xfa\x42\xd6\x43\xa2\x37\xe9\x87\x0c\xdd\
+\x2c\xa7\x15\x02\xb3\x30\x4d\x17\x4d\x22\x80\xfd\x74\xce\x7d\xa7\
+\x04\x14\x00\x9d\x06\x36\x35\xcb\xe4\x9f\x20\x9c\xda\x4c\xfc\xa7\
+\xe8\xf4\xf7\x9e\x42\x60\x76\x4c\x49\xfe\xac\x1a\xb2\x9f\x7d\x93\
+\x17\x2e\x27\x50\xeb\x4e\x05\x40\x2d\xf2\x65\xeb\x35\xf9\x9f\xe0\
+\x6b\xe2\x3f\x01\x67\x80\xb7\x14\x02\xb3\x83\xec\xea\xe1\x6c\x54\
+\x31\x2f\x54\x00\xc4\x8c\xdb\x29\xaf\x51\xed\x7e\x70\x0f\x10\x32\
+\xf1\x1f\x80\x32\xf0\xa9\x6d\x21\xe0\xef\x04\x0e\x76\x04\xc6\x12\
+\x56\x02\x0e\xbe\xe9\xc9\x5c\x04\xea\x95\xa3\x00\xa8\xc7\xbe\x44\
+\xcd\x7e\x60\x0f\x50\x35\xf1\x1f\x80\xe2\xa9\x3b\x02\x08\x01\x0c\
+\x11\x80\xdd\xbd\xe1\x01\x04\x1c\x53\xa0\xd0\xa9\x29\x00\xfa\x0a\
+\xac\x6a\x7d\x2b\x9e\x0c\xe6\xfe\xb8\x6f\x0b\x88\x87\x27\x09\x20\
+\x02\x30\xfa\x0d\x76\xf2\xe2\xb1\xde\x44\x04\xf0\xb5\xe2\x58\xad\
+\x5e\xa9\xb5\x35\xab\x51\x00\xd4\xa4\x9f\xb7\x6e\x93\xff\x2d\xcf\
+\x69\xc6\xcf\x60\xce\xf1\xed\x69\x77\x12\x98\x45\x80\x7e\x83\x29\
+\x02\x76\x70\xf1\xb5\xa2\x22\x60\x07\x49\xfc\x17\x0a\x80\xf8\x31\
+\xa4\x05\x24\x7f\x54\x3a\xc7\xc3\x1a\xc9\xde\x19\xff\xb0\xe1\xcf\
+\xde\x70\x44\x80\xff\x8e\xc0\x0e\x56\x45\xc0\x0e\x8e\x1c\x2f\xea\
+\x96\xa1\x00\xa8\xcb\x3f\x47\xed\xa8\xf2\xe1\x93\x3f\xb3\x35\x92\
+\x3f\x22\x20\x07\x54\xcb\x90\xc0\x44\x40\x21\x30\x91\xb8\xd9\x2b\
+\x02\x6e\x30\xf4\xf1\x3f\x05\x40\xec\x38\x92\xfc\xf9\x40\xc6\x6e\
+\xc5\x15\xde\x93\xf0\x49\xfc\x0c\xd2\x57\x14\xe3\xad\x12\x38\x4b\
+\x80\x3e\x86\xd0\x3c\x7b\x61\xff\x17\x30\xe6\x0c\x3f\xe9\xc8\x11\
+\xe6\xda\x65\x28\x00\x6a\x47\x60\x79\xfd\xc3\x27\x7f\x12\x3f\x86\
+\x08\x58\x8e\xd1\x3b\x25\x30\x9f\x00\x22\xc0\xaf\x05\x6e\x78\xf9\
+\xb5\xe3\x0d\x86\xd8\xff\x53\x00\xc4\x8c\xdf\xd0\xc9\x9f\x59\x18\
+\x83\xb0\x89\x3f\x66\xe7\xed\xc1\x6b\x84\x00\xfd\x70\xf0\x3e\xa8\
+\x08\xb8\xaa\x33\xd7\xbf\x59\x01\x50\x3f\x06\x97\x7a\x30\x6c\xf2\
+\x67\xb0\x65\xc6\xcf\xe0\x7b\x29\x66\xa8\x4e\xd0\x00\x00\x10\x00\
+\x49\x44\x41\x54\x34\xaf\x97\x40\x6e\x02\xf4\x43\xfa\x23\x42\x20\
+\x77\xd9\x81\xca\x43\x04\x04\x72\x57\x57\xb7\x09\x28\x00\xb6\x69\
+\xb4\x7f\x3c\x6c\xf2\x67\x90\x65\xb0\x45\x04\xb4\x1f\x26\x3d\x1c\
+\x89\xc0\x24\x04\x06\xee\x9b\x8a\x80\x05\x1d\xbe\x85\x5b\x14\x00\
+\x2d\x44\x61\x9e\x0f\xfc\xe8\x86\x1f\xdf\xcc\xbb\xba\xa3\xab\x48\
+\xfc\x0c\xb2\x1d\x35\xc9\xa6\x74\x46\x80\xe4\x4f\x3f\x45\xa8\x76\
+\xd6\xb4\x39\xcd\x61\x6c\x52\x04\xcc\x21\xd5\xd8\x35\x0a\x80\xc6\
+\x02\x72\xc2\x9d\xe1\x3e\x60\xd3\xa0\xca\xfe\x04\x17\xdf\x92\x40\
+\x33\x04\x10\xaa\x03\x8b\x00\x56\x28\x9b\x89\x45\xdb\x8e\xb4\xe1\
+\x9d\x02\xa0\x8d\x38\x9c\xf3\x62\xb8\x0f\x16\x83\x28\x33\x2a\x93\
+\xff\xb9\xae\xe1\xfb\xad\x11\x40\x04\x0c\xfa\x23\x55\x56\x28\x87\
+\x1b\xab\x5a\xeb\x7f\x97\xf8\xa3\x00\xb8\x84\x56\x9d\x6b\xf9\x40\
+\xf1\xc1\xaa\x53\x7b\x85\x5a\x49\xfc\x0c\xa2\x15\xaa\xb6\x4a\x09\
+\x64\x23\x40\x3f\x46\xc8\x66\x2b\x30\x46\x41\x8c\x55\x7c\x25\x10\
+\xc3\xdb\x4a\x5e\xb6\x52\xad\x02\xa0\x95\x48\x1c\xf6\x63\xa8\xe4\
+\xcf\x6c\x9f\x41\x93\xfd\x61\x1c\x9e\x95\x40\x2c\x02\x08\xd9\x41\
+\x45\x40\xac\x40\x0d\xea\xad\x02\xa0\xed\xc0\xa3\xa6\xdb\xf6\x30\
+\x93\x77\x0c\x92\x26\xff\x4c\x30\x2d\xa6\x29\x02\x88\x80\xc1\xbe\
+\x12\x60\x05\x80\xc9\x4b\x53\x71\x68\xc7\x99\x76\x3c\x51\x00\xb4\
+\x13\x8b\x7d\x4f\x86\xf9\x00\x91\xf8\x19\x24\xf7\x01\xf8\x5a\x02\
+\x3d\x11\xa0\x9f\x23\x74\x7b\x6a\xd3\x89\xb6\x30\x79\x41\x08\x9c\
+\xb8\xc4\xb7\x6a\x13\x50\x00\xd4\x8e\xc0\xe1\xfa\x49\xfe\x7c\x80\
+\x0e\xbf\xdb\xc9\x59\x96\xfa\x19\x14\xd9\x77\xd2\x24\x9b\x21\x81\
+\x93\x04\x10\xba\x03\x89\x00\x9e\x5c\x52\x04\xec\xf5\x88\x96\x5e\
+\x2a\x00\x5a\x8a\xc6\x23\x5f\xf8\xc0\x98\xfc\x1f\xb1\xf0\xff\x12\
+\xe8\x8e\x00\x22\x00\xe1\xdb\x5d\xc3\x0e\x37\xa8\xfb\xb1\xec\x70\
+\xb3\x63\x9c\x55\x00\xb4\x17\x27\x54\x73\x7b\x5e\x65\xf4\x88\x19\
+\xd0\x40\x03\x60\x46\x72\x16\xd5\x0b\x01\x56\xbd\x06\xf9\x0c\x30\
+\xa1\x61\x45\xb3\x97\xd0\x5d\xd9\x8e\xb6\x6e\x57\x00\xb4\x15\x8f\
+\xee\x3f\x28\x24\x7f\x66\x40\x6d\x61\xd7\x1b\x09\xac\x4f\x00\x11\
+\x30\xc8\x8f\x03\x59\x05\x40\x08\xac\x0f\xd9\x1a\x4f\x12\x50\x00\
+\x9c\xc4\xb3\xea\x9b\x24\x7f\x3e\x28\xab\x56\xba\x66\x65\x26\xff\
+\x35\x69\x5b\x57\x14\x02\xac\x04\x20\x06\xa2\xf8\xbb\xd0\x4f\x56\
+\x36\x87\x17\x01\x0b\xd9\x15\xbb\x4d\x01\x50\x0c\xed\x45\x05\xf3\
+\xc1\x30\xf9\x5f\x84\xcc\x8b\x25\xd0\x0f\x01\x44\x00\x02\xb9\x9f\
+\x16\x1d\x6c\x49\xd7\x63\xdc\xc1\x16\x37\x7e\x52\x01\xd0\x46\x80\
+\x50\xc7\x6d\x78\x52\xc0\x0b\x06\x36\x97\xfd\x0b\x80\xb5\xc8\xae\
+\x08\xf0\x19\xe1\xb3\xd2\x55\xa3\x76\x1b\xc3\x44\x87\x95\xce\xdd\
+\xb3\xc3\xbc\x6a\xaf\xa1\x0a\x80\xfa\x31\xe9\xfa\x03\xc1\xcc\x86\
+\x81\xad\x3e\x66\x3d\x90\x40\xfb\x04\xf8\xac\x74\x2e\x02\x58\x05\
+\x40\x08\xb4\x1f\x8c\x01\x3c\x54\x00\xd4\x0d\x32\xc9\x9f\x0f\x44\
+\x5d\x2f\x0a\xd5\x4e\xf2\x1f\xe0\xbb\xcd\x42\xf4\x2c\x76\x54\x02\
+\x03\x88\x00\x56\x3c\x87\x13\x01\x2d\xf6\x67\x05\x40\xdd\xa8\x74\
+\x99\xfc\x49\xfa\x26\xff\x7a\x1d\xeb\xd9\x4f\xdb\x6c\xb6\xed\x65\
+\xcf\xd9\x6c\xb0\x6f\x7c\xe1\x66\x73\xcc\x78\x7f\xdb\xb6\xef\xaf\
+\xd7\x92\x71\x6b\x1e\x40\x04\x74\x39\xf6\x45\xeb\xb1\x0a\x80\x7a\
+\x11\x63\xf6\x5f\xaf\xf6\x42\x35\x9b\xfc\x0b\x81\xbd\x2d\x76\x4a\
+\xcc\xfb\x89\xfc\x27\xbf\x68\xb3\x99\x6c\xff\xbd\x97\x7d\x64\x12\
+\x00\xc9\xa6\x7b\x0f\xed\xa7\x6b\xa6\xfd\x76\x19\x53\xb9\xec\xb7\
+\xcf\x23\x18\x28\xeb\xd6\x35\x77\x99\x09\x74\x2e\x02\x58\x01\xc0\
+\x32\x53\x6b\xb5\xb8\x36\xfd\x52\x00\xd4\x89\x0b\xc9\xbf\x4b\x05\
+\xcc\xcc\xbf\x0e\xd2\xfe\x6a\x25\xb9\x62\x24\x5a\x12\xef\x76\x02\
+\xe6\xfc\xb6\xad\xd5\xfa\xed\x3a\x11\x0b\x93\x5f\xf8\x86\x9f\x18\
+\xd7\xac\xe5\x4f\xef\xf5\x74\x2e\x02\xba\x1c\x03\x23\xf5\x49\x05\
+\x40\x9d\x68\x75\xd9\xf1\x4d\xfe\xd7\x75\x26\x12\x27\x09\x74\x4a\
+\xaa\xec\x31\x12\x2d\xef\x5d\x57\x7a\xf9\xbb\xf1\x13\xc3\x67\x04\
+\x01\x7b\xda\x83\x45\xf0\xbf\x3c\xa1\x65\x35\x74\x2c\x02\x58\x01\
+\x60\x32\xb4\x0c\x4c\xa0\xbb\x5a\x75\x55\x01\xb0\x7e\x64\xba\xec\
+\xf0\x24\x7f\x96\xff\xd7\xc7\x19\xb7\x46\x92\x22\x46\xa2\xbc\x4b\
+\x98\xb7\x4b\xf5\x71\x5b\x75\xef\x39\x6d\x43\x10\x60\x53\x1b\x11\
+\x03\xd8\xfd\x55\x1e\xcd\x21\xd0\xb1\x08\x60\x32\x84\x10\x98\x83\
+\xc1\x6b\x32\x13\x50\x00\x64\x06\x7a\xa6\x38\x3a\x3a\x1d\xfe\xcc\
+\x65\xb1\xde\xe6\xb1\x25\x93\xff\xfc\x98\x91\x18\x49\x88\x93\xf1\
+\x7a\xfe\xdd\xb1\xaf\x44\x0c\x60\x08\x1e\x84\x00\x16\xbb\x45\xeb\
+\x79\xdf\xb9\x08\x58\x0f\xe4\xea\x35\xb5\x5b\xa1\x02\x60\xdd\xd8\
+\x74\x99\xfc\x19\x98\xd6\xc5\x18\xaf\x36\x92\x3c\x09\x9f\xc4\xc7\
+\x9e\xd7\xf1\x5a\x91\xd7\x63\x84\x00\x06\x13\x85\xc0\x3c\xb6\x7c\
+\xd6\x3a\x14\xdb\x4c\x8c\xba\x5c\x19\x9d\x17\xd5\x7a\x57\x29\x00\
+\xd6\x63\x4f\x07\xa7\xa3\xaf\x57\x63\xe1\x9a\x98\xf9\x33\x20\x15\
+\xae\x26\x6c\xf1\x24\x79\x8c\x84\x8f\x71\x1c\xb6\x31\x85\x1d\xdf\
+\x16\x02\x8a\x81\xd3\xb0\x3b\xfd\xba\x8d\xc9\x51\x57\xe3\xe3\x14\
+\xc5\x96\xf7\x0a\x80\xf5\xa2\x43\x07\x5f\xaf\xb6\xc2\x35\x99\xfc\
+\x8f\x03\x26\xd1\x93\xf0\x27\xe3\xf5\xf1\xab\x7d\x67\x9b\x00\x42\
+\x00\x9b\x56\x05\x64\xb7\x4d\xe7\xfe\xb8\x63\x11\x70\xdf\x48\x8f\
+\x8a\x13\x50\x00\x14\x47\x7c\x53\x01\xb3\xff\x9b\x83\x1e\xfe\x67\
+\xf2\x7f\x18\x45\x12\x15\x09\x9f\xc4\xc5\x9e\xd7\x0f\xaf\xf2\xcc\
+\x25\x04\x10\x02\xb0\xc4\x5c\x15\x78\x48\xae\xc3\xd5\x37\x56\x00\
+\xb0\x87\x8d\x0d\x7b\xa6\x6d\xc7\x15\x00\xe5\xe3\x43\xf2\xef\x66\
+\xf6\x6f\xf2\xdf\xed\x30\x24\x7a\x12\x14\xc6\xf1\xee\xbb\xbe\xca\
+\x41\x00\xae\x88\x01\xc4\x95\x42\xe0\x9e\x28\xbf\x05\x60\x25\xe0\
+\xfe\x4c\x17\x47\xdd\x8c\x95\x11\xa2\xa1\x00\x28\x1f\xa5\x6e\x3a\
+\x34\x03\x4e\x87\xb3\x8e\x45\x3d\x80\xa4\x44\xd2\xc7\x38\x5e\x54\
+\x88\x37\x5d\x4c\x40\x21\xb0\x8b\x8c\xcf\x64\x67\x22\x80\x15\x00\
+\x26\x4d\xbb\x0d\x0d\xfa\xaa\x75\xb7\x15\x00\x65\x23\xd4\x55\x47\
+\xee\x6c\xa0\x59\x14\x79\x92\x3d\x49\x1f\xe3\x78\x51\x21\xde\x74\
+\x35\x01\x85\xc0\x3d\x42\x44\x00\x2b\x73\xf7\x67\xc2\x1f\x31\x69\
+\x42\x08\x84\x6f\x48\xeb\x0d\x50\x00\x94\x8d\x10\x1d\xb9\x6c\x0d\
+\x2b\x95\xde\xd9\x00\x73\x31\x35\x92\x3d\x49\x1f\xe3\xf8\xe2\x02\
+\xbc\xa1\x08\x01\x85\xc0\x23\xac\xac\xcc\x21\x04\x1e\xbd\xea\xe2\
+\xff\x1d\x8c\x9d\xed\xc7\x41\x01\x50\x2e\x46\xdd\xcc\xfe\x49\xfe\
+\x0c\x30\xe5\x50\xb5\x5d\x32\xdf\x3b\x9b\xf8\x1b\x8f\xd1\x47\x3e\
+\xfa\x63\x48\xc4\xaa\x6d\x4f\xcb\x79\xc7\x0a\x5d\x47\x22\x80\x15\
+\x00\xac\x1c\x30\x4b\xde\x28\x00\xca\x75\x82\x2e\x14\x2c\x03\xca\
+\xa8\xc9\x9f\x99\xfe\xcd\x0f\xcf\x52\x72\x29\xd7\x4d\x2c\x39\x27\
+\x01\x56\x04\x46\x16\x01\x9d\x7d\x56\x43\x8f\xa1\x39\xfb\x75\xa9\
+\xb2\x14\x00\x65\xc8\x76\x33\xfb\x67\x56\x51\x06\x51\xbb\xa5\x92\
+\xf8\x99\xf1\x63\xed\x7a\xa9\x67\xc7\x08\x20\x02\x6e\x84\xdb\x73\
+\x8e\x5d\xd1\xef\x79\x04\x3b\x2b\x76\x9d\xb4\x90\x15\x00\xac\x93\
+\xe6\xb4\xd7\x0c\x05\x40\x99\x98\x74\xa1\x5c\x3b\x1a\x48\x66\x47\
+\x99\xd9\x23\x89\x1f\x11\x30\xfb\x26\x2f\x6c\x92\xc0\x24\x04\x46\
+\x8b\x25\xab\x00\x08\x81\x26\x83\x72\xb9\x53\x41\xc7\xd2\xcb\x1b\
+\x5a\xe3\x0e\x05\x40\x7e\xea\x5d\xcc\xfe\x49\xfe\x0c\x24\xf9\xf1\
+\xb4\x5b\x22\x89\x9f\xa4\xd1\xae\x87\x7a\xb6\x84\xc0\x4d\x5c\x07\
+\x5b\x0d\x60\xe5\xae\x13\x11\xc0\x0a\x00\xb6\x24\xf4\xde\x73\x86\
+\x80\x02\xe0\x0c\xa0\x05\x6f\x87\x57\xac\x0c\x1c\x23\x25\x7f\x66\
+\x88\x2c\x19\xb3\x5f\x10\x6f\x6f\x09\x40\x00\x61\xc7\xea\x4e\x00\
+\x57\xb3\xb9\xd8\xd1\x67\x38\xdc\x98\x9a\x2d\x88\x85\x0b\x52\x00\
+\xe4\x05\xdc\xc5\xec\x9f\xd9\x43\x5e\x2c\xed\x96\x46\x52\x60\x86\
+\xd8\xae\x87\x7a\x96\x8b\x00\x22\x60\x24\xa1\x87\x90\x67\x25\x2f\
+\x17\xbf\x8a\xe5\xb0\x02\x80\x55\x74\xa1\xcf\xaa\x15\x00\x79\xe3\
+\x1a\x5e\xa9\x76\x32\x60\xcc\x8a\x2a\x89\x9f\xa4\x30\xeb\x62\x2f\
+\xea\x86\xc0\x4d\xdc\x07\xf9\x4a\x80\x55\x00\x84\x40\x07\xc1\x0b\
+\x34\xb6\xc6\xa1\xad\x00\xc8\x17\xab\xf0\xb3\x7f\x92\x3f\x03\x46\
+\x3e\x24\x6d\x96\xc4\x52\xff\x48\x33\xc1\x36\xa3\x50\xd7\x2b\x84\
+\x1f\xab\x3f\x75\xbd\x58\xa7\x76\x56\xf4\x3a\x10\x01\xac\x00\x60\
+\xeb\x40\x1b\xa4\x16\x05\x40\xbe\x40\x87\x56\xa8\x0c\x10\x23\x24\
+\x7f\x06\x7d\x66\x80\xf9\xc2\x6e\x49\x51\x09\x20\x02\x46\x11\x82\
+\x9d\x7c\xb6\x43\x8c\xb1\x91\x3e\x0f\x0a\x80\x3c\xd1\x0a\x3f\xfb\
+\x47\x00\xe4\x41\xd1\x6e\x29\x24\x7e\x06\xfd\x76\x3d\xd4\xb3\x1a\
+\x04\x6e\xfa\x45\xe7\x5f\x09\xf0\xf9\x66\x85\xaf\x06\xdf\x8c\x75\
+\xb2\x02\x80\x65\x2c\x72\xec\xa2\x14\x00\x79\xe2\x1f\x5a\x99\x32\
+\x30\x74\x32\x43\x38\x18\x4d\x96\xfc\x19\xe4\xd9\x1f\xbc\xc0\x93\
+\xc3\x13\x40\x18\xb2\x3a\xd4\x33\x88\x4e\x3e\xe3\x8d\x8f\xb5\xb1\
+\x7a\x90\x02\xe0\xfa\x78\x85\x9f\xfd\x77\x32\x30\x1c\x8c\x24\x83\
+\xba\xc9\xff\x20\x1a\x4f\xee\x11\x40\x04\xf4\xfe\x95\x00\xbf\x07\
+\xd8\x6b\x76\xb4\x97\xae\x00\x64\x8c\x98\x02\xe0\x7a\x98\xa1\x15\
+\x29\xb3\xff\xeb\x11\xb4\x59\x02\xc9\x9f\x41\xbd\x4d\xef\xf4\xaa\
+\x55\x02\x3d\x0b\x46\xbe\x0a\xc0\x5a\x65\x3f\xd3\xaf\x66\x27\x5d\
+\x33\xfd\x6f\xe6\x32\x05\xc0\x75\xa1\x08\xdd\x11\x49\xfe\xbd\xce\
+\xfe\x4d\xfe\xd7\x75\xec\xd1\xef\xee\x59\x04\x74\xf0\x99\x0f\x3d\
+\xe9\x6a\xe9\xb3\xa5\x00\xb8\x2e\x1a\xa1\x3b\x62\x07\x03\xc1\xc1\
+\xe8\x99\xfc\x0f\x62\xf1\xe4\x85\x04\x10\x01\xf4\xa5\x0b\x6f\x6b\
+\xfe\x72\x56\x00\x10\xff\xcd\x3b\x7a\xda\xc1\x06\x27\x5f\xa7\x1d\
+\x6e\xf1\x5d\x05\xc0\xf2\xa8\x84\xee\x80\x1d\x0c\x00\x07\x23\xc7\
+\x80\xed\xb2\xff\x41\x34\x9e\x5c\x40\x80\xbe\x44\x9f\x5a\x70\x6b\
+\xd3\xb7\x20\xfe\x11\x02\x4d\x3b\x79\xda\xb9\xd0\x93\xaf\xd3\x4d\
+\x5b\xef\x5d\x05\xc0\x72\xd6\x61\x3b\x20\x1f\x7c\x06\x80\xe5\x4d\
+\x6f\xf3\x4e\x06\x6a\x06\xec\x36\xbd\xd3\xab\xa8\x04\xe8\x53\xf4\
+\xad\xa8\xfe\x1f\xf3\xbb\x83\x31\xa0\xa9\x49\xd8\x31\xce\x2d\x9f\
+\x57\x00\x2c\x8b\x4e\xe8\x8e\x87\x00\x58\xd6\xec\x76\xef\x62\x80\
+\x66\xa0\x6e\xd7\x43\x3d\x8b\x4c\x80\xbe\x45\x1f\x8b\xdc\x86\x7d\
+\xdf\x19\x07\xb0\xfd\xf3\x81\x5e\x7f\x54\x20\x5f\x9b\x74\x55\x01\
+\xd0\x64\x58\xca\x39\xc5\xd2\x7f\x07\xca\x7f\x07\x10\x03\x33\x03\
+\xf4\xce\x49\x5f\x48\x20\x33\x01\xfa\x58\x6f\xff\x96\x44\xf0\xc7\
+\x02\x79\x24\x10\xcb\x1c\xe9\x25\xc5\xc5\xbc\x47\x01\xb0\x2c\x6e\
+\x61\x97\xff\x4d\xfe\xcb\x02\xee\x5d\x12\x80\x00\x3f\x0c\xec\x4d\
+\x04\x30\x29\xa0\x6d\x41\x2d\xec\x58\xdc\x02\x6f\x05\xc0\xe5\x51\
+\x08\xbb\xfc\x1f\xfc\x83\xfe\x20\x52\xce\xfc\x1f\x20\xf1\xc4\x0a\
+\x04\x7a\x13\x01\x4c\x0a\x02\x7f\x15\xd0\xc4\x0a\xc0\x0a\xdd\xae\
+\x48\x15\x0a\x80\x22\x58\xdb\x2c\x94\x0f\x7a\x9b\x9e\x5d\xee\x95\
+\xc9\xff\x72\x66\xde\x91\x8f\x40\x8f\x22\x20\x1f\x9d\xd5\x4b\x52\
+\x04\x2c\x44\xae\x00\xb8\x1c\x5c\xc8\x25\xa7\x9e\x66\xff\x2c\xc1\
+\xf2\x7d\xec\xe5\xa1\xf3\x0e\x09\xe4\x23\xd0\x53\x1f\x0c\xbc\x02\
+\x40\x40\x2b\x8f\xc9\xb8\x10\xd3\x14\x00\x97\xc5\x2d\xec\xf2\x7f\
+\x4f\xb3\x7f\x66\x5f\x97\x85\xcd\xab\x25\x90\x9f\xc0\x8d\x10\xed\
+\xe8\xaf\x08\x06\x9e\x24\xb8\x02\xb0\xb0\x7b\x2b\x00\x2e\x03\x17\
+\xf2\xb1\x93\xc0\x1f\xec\x07\xd1\x61\xe9\xff\xc1\x49\x4f\x48\xa0\
+\x12\x01\x56\x01\x10\x02\x95\xaa\xcf\x5a\x6d\xf0\x49\x42\x35\x11\
+\x90\x35\x08\x2b\x17\xa6\x00\x98\x0f\x9c\x0e\x86\xcd\xbf\xa3\x91\
+\x2b\x83\x7f\xb0\xef\x28\x92\xfc\x19\x70\xef\x4e\x78\x20\x81\x06\
+\x08\xb0\x22\xd5\x8b\x08\x08\x3c\x59\xf0\x6b\x80\x05\x9f\x05\x05\
+\xc0\x7c\x68\x21\x93\x7f\xe0\x0f\xf4\x4e\x64\x4c\xfe\x3b\x38\x7c\
+\xd1\x18\x81\x5e\x84\x69\xe0\xc9\x02\xe3\x33\xb6\x72\xcf\x88\x5d\
+\x9d\x02\x60\x7e\xfc\x42\x2a\xcc\xc0\x1f\xe8\x9d\xc8\xf4\x32\xc0\
+\xee\x34\xaa\xe2\x8b\x37\xff\xc6\xff\xdb\x60\x15\x5d\xe8\xaa\x6a\
+\x56\x00\x10\xa9\x3d\x34\x2a\xf0\xa4\x21\xe4\x18\x5d\xb3\xcf\x28\
+\x00\xe6\xd1\x0f\xf9\xe3\xbf\xc0\x1f\xe4\x9d\xa8\xf4\x32\xb0\xee\
+\x34\xaa\xc0\x0b\x12\x3a\xf6\x2d\xbf\xf8\xb6\x0d\xf6\x05\x3f\xf3\
+\xdb\x9b\x6d\x7b\xc1\x1b\x7f\x6b\x33\xd9\x74\x7e\x7a\xcd\x7e\x3a\
+\xc7\x9e\xfb\x27\xa3\xcc\x02\xee\x76\x57\x24\x22\xb5\x87\xbe\xfa\
+\x2e\x4f\x0f\xf9\x53\xa7\x2a\xfd\x29\x7a\xa5\x0a\x80\xe8\x11\xec\
+\xdc\x7f\x06\x54\x06\xd6\xce\x9b\xb9\xa8\x79\x24\x66\x92\x34\x09\
+\x7b\x3b\x81\x7f\xcb\x5b\x7f\x67\x83\xf1\xfe\xb6\x9d\xab\x64\xfb\
+\x5a\xee\x9f\x6c\xbb\x7c\xea\xc3\xb8\xf6\x5c\x79\x23\xbe\x4f\x5f\
+\x65\x35\x20\x72\xdb\x79\x24\x10\x0b\xd8\x06\xbe\x02\xc0\x02\xba\
+\x5e\xc7\x65\x05\xc0\x3c\xee\xe1\x96\x96\x98\xfd\x47\x5f\xfe\x37\
+\xf9\xef\x76\x4e\x92\x2e\xc9\x18\x9b\x12\x3e\x49\x9a\xf3\xbb\x57\
+\x96\x79\x45\x3d\xd4\x87\x4d\x3e\x20\x06\xb0\x32\x35\xc6\x2c\x15\
+\x11\x10\xd3\xf3\x7b\xaf\x03\x8f\x1d\x2b\x8e\xd5\xf7\xbc\xa2\x1e\
+\x29\x00\xce\x47\x2e\xe4\xf2\xff\xf9\x66\xb5\x7f\x45\x0f\x03\x69\
+\x0e\xca\x24\x5e\x12\x2e\xc6\x31\x96\xa3\xdc\x1c\x65\x20\x06\x30\
+\x04\x09\x42\x00\xcb\x51\x6e\xe4\x32\x58\x01\x40\xbc\x46\x6e\x03\
+\x2b\x00\x58\xc0\x36\xb8\x02\x70\x41\xd0\x14\x00\x17\xc0\x8a\x72\
+\x69\x2f\xb3\xff\x28\xbc\x4b\xf8\x49\x92\x27\xe1\x93\x58\xd9\xf3\
+\xba\x44\x3d\x39\xcb\x44\x08\x60\xf8\x3c\xba\x10\x40\xbc\x46\x17\
+\x01\x81\x57\x01\x56\x11\x01\x39\x3f\x3b\xb5\xca\x52\x00\x9c\x27\
+\xef\x92\xd2\x79\x46\x59\xaf\x60\xe0\x64\x00\xcd\x5a\x68\x80\xc2\
+\x48\xf2\x24\x4e\x12\x3e\xc6\xeb\x00\x6e\x1f\x74\x71\x5b\x08\xd0\
+\xa6\x83\x17\x75\x7e\x92\x3e\xcc\x6a\x40\xd4\x66\xb2\x02\x80\x05\
+\xf4\xdf\x31\x7b\x66\xd0\x14\x00\xa7\x41\x85\x5c\xfe\x0f\xac\xdc\
+\x6f\xa2\xc1\xc0\x79\x73\x30\xd0\xff\x48\x92\x24\x7d\x12\x67\xe4\
+\xc4\xbf\x1f\x32\xda\x83\x8d\xba\x2a\x10\xbd\x2f\x07\x1d\x4b\x58\
+\x01\xc0\xf6\xbb\x63\xc6\xd7\x7d\x14\xa5\x00\x38\x1d\xc7\x70\xcf\
+\xc3\xb0\xfc\x7f\xba\x49\x6d\xbf\xcb\xec\xbf\x6d\x0f\xf3\x7a\x47\
+\xe2\xbf\x49\x8e\x6f\xfd\x9d\xbc\x05\x37\x58\xda\x88\x42\x80\x15\
+\x00\xac\xc1\x70\xcc\x72\x89\x15\x00\x6c\xd6\xc5\x5e\x14\x8e\x80\
+\x02\xe0\x74\xc8\xc2\xa9\xc8\xa0\x8a\xfd\x26\x0a\x24\xff\xe8\x33\
+\xa6\x9b\x86\xcc\xf8\xdf\x48\x89\x7f\x1f\x07\x42\x80\xf6\x63\xfb\
+\xef\xf5\xf8\x9a\x7f\x2a\xb8\xc7\x76\x35\xde\xa6\xa2\x5f\x03\x34\
+\xde\xf6\xd9\xee\x29\x00\x8e\xa3\x0a\xb7\xfc\x1f\x5d\xa9\x8f\x90\
+\xfc\x59\xde\x9f\x96\xfa\x8f\x77\xbd\xfe\xdf\xb9\x11\x01\x69\xd5\
+\x43\x11\xd0\x7e\xac\x83\x4e\x2a\xc2\x4d\xde\x6a\xf4\x04\x05\x40\
+\x0d\xea\x85\xea\x8c\x2c\x00\x98\xfd\x17\xc2\xd2\x4c\xb1\x24\x3b\
+\x92\x3f\x22\xa0\x19\xa7\x2a\x3b\x82\x10\xb8\xf9\x0a\xe4\x17\xdf\
+\x56\xd9\x93\xb2\xd5\xf3\x35\x00\x56\xb6\x96\x32\xa5\x33\xae\x60\
+\x65\x4a\x2f\x5a\x6a\x21\x11\x50\xd4\xe7\x55\x0b\x57\x00\x1c\xc7\
+\x1d\x6e\x09\x29\xa8\x52\xbf\x89\x40\xef\xb3\x7f\x12\x3f\xc9\xee\
+\xa6\xb1\xfe\xef\x01\x01\xd8\x20\x90\x1e\xbc\xd1\xd1\x89\xc8\x7d\
+\x3c\xe8\xd8\x12\x6e\x0c\x5f\xbb\xbb\x2b\x00\x0e\x13\x0f\xa7\x1c\
+\x23\xff\xf8\xaf\xe7\xd9\x3f\xb3\x7d\x66\xb8\xec\x0f\x77\x35\xcf\
+\x4e\x04\x7a\x17\x01\xac\x00\x60\x53\x7b\xdd\xc7\x24\xd0\x93\xd7\
+\x0a\x80\xc3\xd1\x0c\x27\x00\x0e\x37\x23\xc6\xd9\xc8\x33\xa3\x53\
+\x84\x99\xd1\x32\xf3\x3f\x75\x8d\xef\xed\x12\x40\x04\x20\x98\x60\
+\xb7\xfb\x4e\x1f\xaf\xa2\xf6\x75\xbe\x02\xc0\x82\x45\x81\x71\x1c\
+\x0b\xe6\xf6\x7a\xee\x2a\x00\x0e\xb3\x0e\xf7\xf8\x5f\xd0\x25\xba\
+\x4d\xaf\xb3\x7f\x12\x3f\xc9\xec\x70\xf7\xf2\xec\x39\x02\xb0\xeb\
+\x51\x04\xb0\x02\x80\x9d\x6b\x7f\x8b\xef\x47\x1d\x63\xf2\xb2\xec\
+\xab\x34\x05\xc0\xe1\x78\x86\x52\x8d\x51\x97\xff\x49\xfe\x51\x67\
+\x44\x87\xbb\xcd\x66\xc3\x52\x3f\x33\x58\xf6\xc7\xae\xf1\xfc\x3c\
+\x02\xbd\x8a\x80\xa8\x7d\x3e\xe0\x0a\x00\x1d\xcd\xdf\x01\x40\xe1\
+\x88\x29\x00\x1e\x82\x09\x95\xfc\x1f\xba\xef\x99\x5a\x04\x48\xfa\
+\xcc\xfc\x6b\xd5\xdf\x63\xbd\x88\x80\xde\x98\xb2\x02\x80\x45\x8c\
+\x57\x50\x11\x90\x0d\x75\x6f\x05\x29\x00\x1e\x46\x34\x9c\x00\x88\
+\xb8\x34\xd7\xdb\xec\x9f\xe5\xea\xde\x12\xd5\xc3\x8f\x46\x9d\x33\
+\x3d\x0a\xab\xa8\xab\x00\x01\xc7\x1a\xc6\x73\xac\x4e\xe7\x6d\xbc\
+\x56\x05\xc0\xc3\x00\x85\xfa\xfe\x3f\xea\xf2\xff\x43\xec\x71\xcf\
+\x90\xfc\x99\xa9\xc6\x6d\x41\xfb\x9e\x23\x02\x7a\xfa\x6a\x85\x15\
+\x00\xac\x7d\xf2\xbb\x1e\xb2\x02\x80\xed\x9e\x1d\xe5\x55\x7f\xed\
+\x54\x00\x3c\x8c\x69\x28\xb5\x18\x50\x91\x6f\x18\xf8\xa2\xce\x80\
+\xf6\xbb\x8b\xc9\x7f\x9f\x48\xd9\xd7\xf0\x2e\x5b\xc3\x7a\xa5\xf7\
+\xf2\x19\x58\x8f\xd8\xe2\x9a\xfc\x1d\xc0\x11\x74\x0a\x80\x5d\x30\
+\xa1\x92\xff\xae\xeb\x71\x5e\x21\x00\xe2\x78\x7b\xdc\x53\x92\x91\
+\x33\xff\xe3\x7c\x4a\xbc\xc3\x4a\x40\x2f\x5f\xb5\xf0\x39\xc0\x4a\
+\x70\x2a\x59\x66\xc4\x49\x47\x0e\x1e\x3d\x96\xa1\x00\xd8\x8d\x6a\
+\x28\x01\x10\x75\xf9\xbf\x87\x99\x0f\x89\xc8\xe4\xbf\xfb\xe1\x59\
+\xeb\x15\xec\x7b\x11\x01\x11\x3f\x0b\x01\xbf\x02\x08\x35\xae\xaf\
+\xf5\x39\xa2\x1e\x05\x00\x14\xb4\xd5\x08\xf0\xe3\xbf\xd5\x2a\x2b\
+\x58\x51\x2f\x09\xa8\x20\xa2\xa2\x45\x23\x02\x58\x81\x29\x5a\xc9\
+\x0a\x85\x47\x5c\x01\x00\xcb\x78\x22\x80\x56\xf7\x67\x0a\x80\xdd\
+\x98\x86\xfa\xae\xc8\xa5\xb8\xdd\xe0\xad\xf5\xaa\x87\xc4\xb3\x16\
+\xab\x92\xf5\xb0\x02\xd3\x43\x2c\x22\x8a\x80\x80\x63\x8f\xab\x00\
+\x07\x3e\x8c\x0a\x80\x03\x50\x22\x9c\x72\xf9\xbf\x4e\x94\x48\x38\
+\x24\x9e\x3a\xb5\x5b\xeb\x3e\x01\x62\xc1\x6a\xc0\xfe\xf9\x48\xaf\
+\xfd\x1a\x60\x95\x68\x5d\xf5\x74\xd7\x2a\x1e\x56\xa8\x44\x01\x70\
+\x0f\xfd\xb1\xfb\x43\x8f\x4a\x10\x88\xbe\xfc\x6f\xf2\x2f\xd1\x2b\
+\xae\x2f\x93\xb8\x5c\x5f\x4a\xbd\x12\x58\x01\xc0\xea\x79\xb0\xac\
+\xe6\x60\x5f\x03\xb8\x02\x70\x20\xcc\x0a\x80\x03\x50\x22\x9c\x7a\
+\x97\xa7\xc7\x13\xb4\x11\x67\x3a\xdb\x7d\x81\xd9\xe6\xf6\x6b\x8f\
+\xdb\x20\xc0\x0a\x40\x74\x11\xd0\x06\xc9\xee\xbd\x58\x28\x02\xfa\
+\xe5\xa2\x00\x08\x1a\xdb\x60\xea\x3b\xfc\x1f\xfd\xf1\x47\x7f\x6d\
+\x7f\x50\x10\x67\x91\x45\x40\x44\x71\x1c\xf0\x77\x00\x6d\x77\xe2\
+\x0a\xde\x29\x00\xee\xa1\x87\x99\x52\x47\x4b\xfe\xf7\x88\x63\x1e\
+\x91\x58\x98\x65\xc6\xf4\x7e\x1c\xaf\x11\x01\x51\xe3\xc4\x57\x00\
+\xd8\x38\xd1\x8a\xd3\xd2\x9e\x3d\x55\x00\xdc\x47\x37\xcc\xf2\x50\
+\x44\x01\x10\x71\x86\x43\xd7\x20\xf9\x93\x58\x38\xd6\xda\x27\x40\
+\xbc\xda\xf7\xf2\xb0\x87\xd1\x3e\x23\x8c\x43\xd8\xe1\xd6\x34\x79\
+\x36\xd4\x53\x5e\xf8\x36\x8d\x9a\x00\x00\x10\x00\x49\x44\x41\x54\
+\x6b\x10\x54\x00\xac\x41\x39\x73\x1d\xd1\xbe\xff\x8f\xfc\xe3\xbf\
+\xa8\x33\xca\xcc\x5d\x2e\x4c\x71\xc4\x2b\xaa\x08\x70\x05\xa0\xc5\
+\x6e\xd6\xb7\x4f\x0a\x80\x47\xf1\x0d\x33\xfb\xc7\xdd\x60\xaa\x1b\
+\x97\x43\x1a\x89\x84\x84\x12\xd2\xf9\x81\x9d\x66\xc5\x26\x6a\xdc\
+\xa2\x89\x00\x7f\x07\x10\xfb\x83\xa6\x00\x78\x14\xbf\x30\x02\x20\
+\x62\xf2\x8f\xb6\xb4\xf9\xa8\x4b\x6c\x36\x24\x92\xe9\xd8\x7d\x2c\
+\x02\x88\xb7\x58\x1e\x3f\xf2\x36\xea\x67\xe5\x91\xf7\xcd\xff\xff\
+\xe2\x71\xbe\xf9\x16\x5d\xe9\xa0\x02\xe0\x4a\x80\x6b\xdf\x1e\x4d\
+\x00\x44\x5d\xfe\x8f\x9a\x40\xd6\xee\x8f\xad\xd6\xc7\x0a\x00\xd6\
+\xaa\x7f\xc7\xfc\x62\x05\x00\x3b\xf6\x7e\x6b\xe7\xa3\x8d\x47\x89\
+\x9f\x22\x20\x41\x98\x36\x05\xc0\x23\x12\x61\x9e\x00\x78\xe4\x6e\
+\x9c\xff\x3f\xfb\xa9\x71\x7c\xdd\xf6\xd4\xd9\xff\x36\x8d\x98\xc7\
+\x8a\xb8\x75\xe2\x16\x50\x04\xcc\x04\xd3\xff\x65\x0a\x80\x47\x31\
+\x0e\xa3\x0a\xa3\xfd\x00\x30\xd2\x6c\xe6\x51\x57\x48\x4b\xff\xbf\
+\xf8\xb6\xe9\xd0\x7d\x60\x02\xac\x00\x60\xd1\x9a\xe0\xd7\x00\x45\
+\x23\x16\x66\xac\x2f\x4a\xe1\xb6\x70\x05\xc0\x2d\x88\x28\xbb\x48\
+\x6a\x3b\xec\xf2\xff\x5b\x7f\x27\x4a\x77\xd0\xcf\x33\x04\x22\xae\
+\x02\x44\x13\xcd\x91\xc6\xa4\xd4\x5d\x66\xaf\xf6\xa6\x6b\xbb\xdf\
+\x14\x00\x9b\x8d\x8a\x70\xe3\x7f\x13\x81\x88\x09\x63\xf2\xdd\xfd\
+\x43\x02\xac\x00\x60\x0f\xdf\x69\xfb\x4c\x24\x11\x10\x6d\x55\xb2\
+\xed\xc8\xaf\xeb\x9d\x02\x20\x90\x00\x08\xa6\xb4\x37\x11\xbf\xff\
+\xf7\xbb\xff\x75\x07\xa0\x35\x6a\x7b\xf3\x6f\xfe\xee\x1a\xd5\x58\
+\x47\x0c\x02\x33\x27\x7c\x31\x1a\x73\xad\x97\x0a\x80\x6b\x09\xae\
+\x78\x7f\x38\x01\xf0\xb4\x15\xe1\x64\xa8\xca\xd9\x7f\x06\x88\x0d\
+\x16\x11\x71\x05\x20\xd2\xef\x00\xa2\x8d\x4b\xa9\x8b\x2a\x02\x12\
+\x04\x36\x05\x00\x14\x34\x09\x48\xa0\x5b\x02\x08\x00\xac\xdb\x06\
+\x36\xd0\xb0\x80\x22\xe0\x24\xb5\x51\xde\x54\x00\x6c\x36\xfe\x28\
+\xa4\x40\x6f\x8f\xf8\x03\x40\x97\xff\x0b\x74\x84\x46\x8a\x8c\xb6\
+\xba\x13\xe9\x37\x00\x8d\x84\x58\x37\x16\x10\x50\x00\x04\xfa\x0d\
+\x80\x3f\xb6\x59\xd0\xc3\x67\xde\x12\x2d\x41\xcc\x6c\xd6\xce\x65\
+\xbf\xfa\xc6\x1f\xdd\x4c\xf6\x73\xaf\xfd\xf2\xcd\x64\xd3\xb9\x9d\
+\x8b\x3b\x7b\x11\x71\x05\x20\x92\x08\x08\xb6\x02\x70\xe6\x2b\x80\
+\xce\x3a\xff\x89\xe6\x28\x00\x4e\xc0\x69\xed\xad\x48\x1f\xb2\x68\
+\x3f\x00\x8c\x98\x20\xce\xf5\xcf\x29\xb1\xbf\xe9\x33\x3f\x76\xf3\
+\x03\xcf\xfe\xbd\x1b\xf6\x93\xbd\x25\x09\x80\xc9\xa6\x73\x5c\x33\
+\x89\x82\x73\x65\x47\x7c\xbf\xc7\x18\xb7\x12\x87\x60\x93\x13\x57\
+\x7d\x6f\x3b\xce\xe8\x02\x40\x25\x78\xdb\x11\x72\xef\x22\xcd\x5e\
+\x68\x7b\x4f\xc9\x81\xc4\x3f\x25\x75\xf6\xbc\xa6\x8d\x73\x6c\x12\
+\x05\x93\x18\x98\x73\x4f\x94\x6b\xa2\xad\xf2\x44\xfa\x21\x60\x94\
+\x3e\x30\xc7\xcf\x91\xae\x19\x5d\x00\x84\x89\x75\xa8\xd9\xbf\xbf\
+\xfe\xaf\xd2\xaf\x48\xf4\x24\x7c\x8c\xe3\x6b\x9d\x40\x0c\xf4\x24\
+\x04\x10\x79\xd8\xb5\x5c\xbc\xff\x21\x81\x48\xe3\x53\xf2\xde\x89\
+\x5f\x82\xc0\xa6\x00\x80\x42\x00\x8b\xf4\x01\x73\xf6\xbf\x7e\x87\
+\x62\xe9\x3e\x57\xe2\xdf\xf7\x7e\x12\x02\x39\x44\xc5\x7e\xd9\xbe\
+\x3e\x4e\x20\xda\xe7\xe8\x78\x4b\x22\xbd\x33\x96\xaf\xa3\x0b\x00\
+\x95\xe0\x58\xfd\xfd\x60\x6b\xa3\xcf\x0a\x49\xfc\x24\xe9\x83\x8d\
+\xcb\x78\x92\x7a\x10\x1a\x19\x8b\x5c\xbd\xa8\x68\x5f\x03\x44\x12\
+\x01\x91\x26\x29\xab\x77\xbc\x46\x2b\x1c\x5d\x00\x34\x1a\x96\x87\
+\x6e\x45\xfa\x91\x4d\xa4\x1f\x00\xf6\x90\xfc\xd7\x9c\x99\x23\x34\
+\x22\x8b\x80\xe8\xf1\x7e\x38\x32\x78\x26\x27\x81\xd1\xca\x52\x00\
+\x8c\x16\x71\xdb\xbb\x43\x20\xf2\x3f\x13\xcb\x8c\x7c\xcd\xe4\x3f\
+\x81\x53\x04\x4c\x24\xca\xef\x5d\x01\x28\xcf\x78\xe4\x1a\x14\x00\
+\x23\x47\xbf\x50\xdb\x23\x0d\x5a\x85\x10\x14\x2f\x96\x59\x78\x8d\
+\xe4\x3f\x35\x2c\xba\x08\x98\xda\xe1\x7e\x58\x02\x07\xbe\xfe\x1d\
+\x8f\x85\x02\x20\x48\xcc\xfd\x7e\xad\x4c\xa0\x22\xfe\xeb\x7f\x24\
+\x7f\x12\x70\x19\x22\xf3\x4b\xc5\x87\x9a\x22\x64\xbe\xa7\xbb\x57\
+\x46\x5e\xf5\xd9\x6d\x89\xaf\x24\x70\x1d\x01\x05\xc0\x75\xfc\xbc\
+\x5b\x02\xab\x12\x20\xe1\x92\x78\x57\xad\xf4\x44\x65\x88\x91\x13\
+\x6f\x37\xf9\x56\xa4\xdf\x01\x44\xfa\x3d\x4d\x93\xc1\xbe\xc0\xa9\
+\x11\x2f\x1d\x5d\x00\xf8\x2f\x42\x8d\xd8\xeb\x6f\xdb\x1c\xed\x17\
+\xe1\xb8\xfd\x6b\x6f\xfc\x51\x76\xcd\x18\x82\x04\x6b\xc6\xa1\x19\
+\x8e\x44\x12\x00\x33\x9a\xd3\xcc\x25\x91\x7e\xa8\xdc\x0c\xb4\xca\
+\x8e\x8c\x2e\x00\x2a\xe3\xef\xaf\x7a\xbf\xff\x2f\x17\x53\x66\xdb\
+\x2d\xcd\xfe\xa7\x96\xe2\xd7\x74\x1c\x65\xaf\x08\x88\x12\xa9\xb5\
+\xfc\x1c\xb3\x1e\x05\xc0\x98\x71\xb7\xd5\x12\xc8\x46\x80\x15\x00\
+\x2c\x5b\x81\x16\x24\x01\x09\xac\x42\x40\x01\xb0\x0a\xe6\xeb\x2a\
+\xf1\x07\x80\xd7\xf1\xeb\xe5\xee\x16\x67\xff\x13\xdb\x88\xab\x00\
+\x93\xef\x2d\xef\x5d\x51\x2b\x16\x9d\x9d\xa7\x00\x8a\xd5\xd2\x78\
+\xc1\xa3\x0b\x00\x3b\x41\xe6\x0e\x1a\x69\xc0\x8a\xb4\x0c\xdc\x7a\
+\x82\x75\x05\x20\xf3\x07\xc9\xe2\x24\xb0\x02\x81\xd1\x05\xc0\x0a\
+\x88\xad\x42\x02\xd7\x13\x88\x90\x60\x23\xf8\x38\x45\xc2\x47\x01\
+\x27\x12\xee\x37\x9b\x71\x19\x28\x00\xc6\x8d\xfd\xf0\x2d\x8f\xb4\
+\x02\x10\x21\xb9\xb6\xbe\x4a\x11\xb5\xc3\x47\x59\x55\xf3\xab\xca\
+\x78\x3d\x4c\x01\x10\x2f\x66\x7a\x3c\x18\x81\x08\xc9\x7f\xb0\x90\
+\xd8\xdc\xf8\x04\xee\x1e\x01\x8f\xdf\x94\xe5\x2d\x50\x00\x2c\x67\
+\xb7\xda\x9d\x91\x94\xb5\xff\x70\xc9\x6a\xdd\xa2\xb9\x8a\x22\x09\
+\x95\x48\xab\x3f\xcd\x05\x5a\x87\xba\x21\xa0\x00\xe8\x26\x94\x36\
+\xa4\x57\x02\xad\xfd\xe3\x3f\xbd\x72\xb6\x5d\x23\x12\x18\xbb\xcd\
+\x23\x0b\x00\x9f\x00\x18\xb8\xef\x3b\x03\x2c\x13\xfc\x48\xab\x00\
+\x65\x08\xe4\x2f\x35\xca\x6f\x00\x68\x79\xa4\xd5\x4a\xfc\x1d\xdd\
+\x46\x16\x00\xa3\xc7\xde\xf6\x4b\x20\x3b\x81\x77\xff\x90\xe7\x66\
+\x2f\xd3\x02\xe3\x10\xf8\xcd\xb7\xfc\x70\x1c\x67\x37\x9b\xcd\xe8\
+\xce\x8e\x2c\x00\xec\xa9\x03\xf7\xfe\x67\x3d\x21\x4e\xd7\x7f\x92\
+\x49\x75\xe0\x9e\x6a\xd3\x25\x50\x8e\x40\x9c\x51\xb0\x1c\x83\xe6\
+\x4b\x56\x55\x37\x1f\x22\x1d\x0c\x46\x20\x92\x00\x7c\xc3\xcf\x07\
+\x83\x1b\xc6\x5d\x1d\x55\x00\xd8\x07\xb2\x12\x78\xc3\x2f\x64\x2d\
+\xce\xc2\x02\x11\x70\xf9\x3f\x50\xb0\x74\xf5\x47\x44\xb0\xd9\x28\
+\x00\xec\x05\xc3\x12\x88\x32\x0b\x8c\x92\x58\xa3\xf8\x39\x6c\x87\
+\xb7\xe1\x3b\x04\x7c\xa1\x00\xb0\x0f\x48\x20\x04\x01\x93\x6b\x88\
+\x30\x15\x71\x32\xca\x57\x00\x7e\x55\x59\x24\xfc\x45\x0b\x1d\x7d\
+\x05\xc0\x1f\x02\x66\xee\x5e\x51\x06\xab\xcc\xcd\x2e\x5e\xdc\xfb\
+\xbc\xf4\x4b\x8a\xd7\x71\x6d\x05\x11\x7c\x9c\xda\xf8\xac\x77\x7d\
+\xdc\x74\xe8\x7e\x48\x02\x36\x1a\x02\xa3\x0b\x00\x18\x68\x12\x68\
+\x9e\x40\xeb\x2b\x00\x4f\x0f\x20\x50\x9a\x0f\xb2\x0e\x4a\x60\x65\
+\x02\x0a\x80\x95\x81\x2f\xa9\xce\xa5\xb5\x25\xd4\xce\xdf\x13\xe5\
+\x37\x00\x53\x4b\x5a\x17\x01\x93\x9f\xee\xf3\x11\x70\x45\x2d\x1f\
+\xcb\xed\x92\x3c\x7e\x44\x40\x01\xf0\x88\x83\xff\x1f\x90\x40\xb4\
+\x65\xe0\x56\x97\xd8\x99\xfd\xb7\xea\xdb\xb1\x6e\x1d\x4d\xfc\x1d\
+\x6b\x87\xe7\x17\x13\xf0\xeb\xdf\x84\x4e\x01\x90\x20\xb8\xe5\x23\
+\xe0\x8c\x25\x1f\xcb\xfd\x92\x58\x01\x20\xd9\xee\x9f\xaf\xfd\x3a\
+\x5a\xf2\xaf\xcd\xab\xd7\xfa\xff\xd7\x5b\xa2\x3c\x59\xd7\x6b\x04\
+\x2e\x6f\xd7\xe8\x02\xc0\x1e\x7b\x79\x9f\xe9\xe6\x8e\x88\xb3\xc0\
+\xd6\x92\x6d\x8b\x82\xe4\x5c\x07\x7d\xf1\x53\xde\xee\xdc\x25\xcd\
+\xbc\xef\xbf\xab\xd1\x4c\x28\xba\x74\x64\x74\x01\xd0\x65\x50\x6d\
+\xd4\x7c\x02\x11\x45\xc0\x07\x7f\xc3\xf7\xcf\x6f\x60\xc1\x2b\x59\
+\x91\x68\x4d\x90\x14\x6c\xae\x45\x77\x42\xc0\x66\xdc\x13\x50\x00\
+\xdc\xb3\x68\xfa\x28\xd2\x0f\x01\xfd\x1a\xa0\x6c\x57\x22\xf1\xb6\
+\x30\xf3\x6e\x45\x88\x5c\x4a\x3b\xda\x6f\x3f\x2e\x6d\x9f\xd7\xcf\
+\x22\xe0\x6f\x00\x12\x26\x05\x40\x82\xe0\x36\x2e\x81\x17\x3f\xf9\
+\xf1\x21\x1b\xcf\xcc\xbb\xa6\x08\x88\x9a\xfc\x09\x76\xc4\x55\x1f\
+\xfc\xd6\x72\x10\xb0\x8c\x6d\x02\x0a\x80\x6d\x1a\x1e\x4b\x20\x10\
+\x81\x5a\x22\x80\xe4\xcf\x2a\x44\x20\x54\x77\xae\x46\x4b\xfe\x91\
+\x56\xd3\x22\xad\x52\xde\x75\x88\xc1\x0f\x46\x17\x00\x61\x96\x81\
+\x22\xfd\xc2\x36\xd2\x0f\x97\xa2\x25\x84\xfd\xf1\x6a\x4d\x11\x40\
+\xd2\xff\x98\x37\xfc\x9f\x0d\xfb\x7d\x3f\xa2\xbc\x8e\x16\xef\x48\
+\x02\x20\x42\x1f\xd0\xc7\x5d\x02\xa3\x0b\x80\x5d\x1a\x0d\xbf\x8a\
+\xa4\xae\xa3\x0d\x5a\xd1\x92\xc2\x7e\x37\x45\x04\x94\x9e\x95\xf3\
+\x75\x03\x75\xec\xd7\xed\x6b\x09\x4c\x04\x22\x8d\x51\x93\xcf\xa3\
+\xef\x15\x00\xa3\xf7\x80\x02\xed\x8f\x26\x00\xa2\xfe\x0e\x60\x3b\
+\x74\xcc\xca\x49\xd0\x24\xea\xed\xf3\xd7\x1e\x4f\xe5\x22\x32\xae\
+\x2d\xab\x85\xfb\x23\xc5\x3a\xda\xe7\xa8\x85\xf8\x9e\xf6\xc1\x77\
+\xf7\x09\x28\x00\xf6\x89\x34\xfa\x3a\x9a\xba\x8e\x34\x78\x45\x5f\
+\x01\xd8\xee\xb2\x24\x6a\x96\xe9\x11\x02\x24\xef\xed\xf7\x2e\x39\
+\xe6\x5e\x04\x05\xc6\xf1\x25\xf7\xb6\x7a\x6d\xa4\xe7\xff\x61\x18\
+\xe9\xab\xb4\x60\xe3\x53\x98\xaf\x7e\xe9\x07\x25\x6d\x74\x01\x60\
+\x47\x28\xd9\xbb\x02\x95\xdd\x93\x08\x00\x3b\x42\x80\xe4\x3d\x89\
+\x81\x53\x82\x80\x04\x3f\xd9\x74\x0f\x7b\xce\x51\x96\x26\x81\x73\
+\x04\x22\xfc\x46\x69\xab\x0d\xfe\x03\x70\xb7\x30\x46\x17\x00\x60\
+\x08\x23\x02\x22\xa9\xec\x48\xb3\x17\x3a\x41\xa4\xa5\x61\xfc\xbd\
+\xc4\x10\x03\x18\x49\x1d\x41\xb0\x6f\x9c\x9f\xac\xe7\xa4\x1f\x2d\
+\xc6\xaf\x79\xfd\x25\x51\xf6\x5a\x09\x5c\x4e\x40\x01\x70\x39\x33\
+\xef\x98\x41\x20\xd2\x57\x00\x34\x87\x15\x00\x8c\x63\xad\x3f\x02\
+\xd1\x96\xff\xa3\x45\xa0\xfd\xc9\x49\x34\xa2\xeb\xf8\xab\x00\x58\
+\x87\x73\x96\x5a\x22\x2d\xb3\x45\x13\x00\x04\x48\x01\x00\x85\x3e\
+\x2d\xdc\xec\xff\xc7\x63\xc5\x21\x98\x00\x08\xb3\xea\x5b\xba\x17\
+\x28\x00\x36\x9b\x2f\x2d\x0d\x39\x57\xf9\xc1\x3e\x64\x9b\x68\x22\
+\xc0\x7f\x22\x36\x57\x4f\x6d\xab\x1c\x67\xff\x6d\xc5\xa3\x86\x37\
+\x7b\x75\x2a\x00\x6e\x81\x28\x00\x6e\x41\xb8\x93\x00\x2b\x00\x98\
+\x24\x24\x50\x9b\x40\x24\xf1\x1c\x6d\x62\x52\x3b\xb6\x2d\xd5\xaf\
+\x00\x68\x29\x1a\x67\x7c\x89\xf6\x41\x7b\x4d\xb0\x65\x4c\xf0\x47\
+\x5b\x2a\xc6\x67\xed\x34\x81\x88\x31\x8d\x24\x00\xda\xff\x6a\x72\
+\xa7\x7f\x38\xfb\xdf\xc2\xa1\x00\xd8\x6c\x42\x75\x88\x68\x22\x60\
+\x13\xec\x3f\x56\x00\xb0\x60\x6e\xeb\xee\x11\x02\x2e\xff\x1f\x01\
+\x33\xee\x69\x1f\x01\xdc\x8a\xbd\x02\xe0\x11\x8c\x50\x22\xe0\x91\
+\xcb\xed\xff\x3f\xd2\x2c\x66\x9b\x66\xc4\x19\xe3\xb6\xff\x1e\xdf\
+\x13\x88\x18\xcb\x88\x2b\x67\xf7\xc4\xdb\x3b\xd2\xa3\xe3\x04\x14\
+\x00\xc7\xd9\x34\xf9\x4e\xb0\xe5\xb6\x70\x3f\x04\x24\xe8\xac\x00\
+\x60\x1c\x6b\x71\x09\x38\xfb\x5f\x27\x76\xc1\x56\x25\x9d\xec\x6d\
+\x75\x0b\x05\xc0\x23\x18\x61\x96\x85\x82\x7d\xd8\x36\x51\x67\x33\
+\x11\x67\x8e\x8f\xba\xb2\xff\x9f\x08\x44\x8d\x61\xb4\x7f\x00\xa8\
+\xed\x31\x69\xea\x0d\x77\x7b\x05\xc0\x1d\x8a\xcd\x46\x01\xf0\x08\
+\x86\x9d\xe2\x11\x87\xec\xff\x8f\xfa\x35\x00\x2b\x00\x58\x76\x20\
+\x16\xb8\x0a\x81\xa8\xb3\xff\x68\x82\x39\x58\xf2\x5f\xa5\xef\x45\
+\xaa\x44\x01\x10\x29\x5a\xc9\x57\x3e\x70\x58\x3a\x0c\xb3\x45\x15\
+\x01\x51\x67\x90\x61\x3a\x46\x21\x47\x11\x6e\xc6\xae\x10\xdc\xbd\
+\x62\x5b\xff\x4a\x72\xcf\x5d\x27\x7a\x7b\x40\x14\x00\x8f\x80\xd8\
+\x31\x1e\x71\x28\xf2\xff\x68\xb3\x9a\x09\xc2\x4d\x22\x79\xca\xdb\
+\x4d\x2f\xdd\x07\x21\x40\xdc\x82\xb8\xfa\xc0\x4d\x97\xff\x1f\x20\
+\xc9\x79\x22\xcc\x57\xbd\x39\x1b\x7d\xaa\x2c\x05\xc0\x29\x3a\x8d\
+\xbe\xf7\xcb\xaf\x0b\xf3\x8f\x17\xde\x10\x64\x05\x00\xbb\x79\x11\
+\xec\x7f\xce\x24\x63\x05\x8c\xa5\xff\xa8\x31\x8b\x28\x94\xdb\x5e\
+\x8d\x8c\xd5\x77\x6b\x78\xab\x00\xb8\xa7\xee\x2a\xc0\x3d\x8b\xec\
+\x47\x11\x07\xb7\x09\xc2\x57\x3f\xf3\xed\xa7\x43\xf7\x0d\x13\x60\
+\xe6\x1f\x35\xf9\x83\xd5\xd9\x3f\x14\xb4\x35\x09\x28\x00\xd6\xa4\
+\x9d\xa9\x2e\x55\x77\x26\x90\x33\x8b\xb9\x49\x2c\x7e\x15\x30\x93\
+\x56\xbd\xcb\x42\x27\xff\x80\xff\x6a\x66\xeb\xdf\xff\x1f\xe8\x89\
+\x4e\xf2\xf6\xa0\x28\x00\xee\x81\x84\xfa\x7e\x28\x9a\x08\xe0\x2b\
+\x00\xec\x1e\x77\xac\x23\x92\x0b\x42\x20\x96\xd7\xe3\x78\xcb\xd2\
+\xbf\xf1\x19\x27\xde\x0b\x5b\xaa\x00\xd8\x03\xa7\x00\xb8\x07\x12\
+\xaa\x73\x44\xfb\x1d\x00\x98\x23\x7f\x0d\x80\xff\x7e\x15\x00\x85\
+\xf6\x8c\xe4\x8f\x40\x6b\xcf\xb3\xf9\x1e\x45\x5b\xfe\xa7\x65\xbf\
+\xf4\xba\xc7\xd8\x35\x6a\xba\x35\x87\x80\x02\xe0\x9e\x52\x28\x01\
+\x70\xef\x76\x9c\xa3\xc8\x2b\x00\x13\x65\x45\xc0\x44\xa2\x8d\x3d\
+\xb3\xfe\xf0\xc9\x3f\xe0\xf2\x7f\xb4\x15\xc8\xd4\x5b\x63\xfd\x72\
+\x3a\x39\xbc\xc6\xa6\x00\xd8\xa5\x1c\x46\x04\xf0\x01\xc4\x76\xdd\
+\x6f\xff\x55\x74\x11\x70\x93\x70\xfc\x3d\x40\x33\x1d\x2d\x7a\xf2\
+\x07\x64\xc4\xcf\x44\xeb\xdf\xff\xc3\x55\x3b\x4f\x40\x01\x70\x9e\
+\x91\x57\x64\x24\x10\xfd\x6b\x00\x50\x90\x74\x10\x02\x1c\x6b\xf5\
+\x08\xb0\xf4\x1f\x3d\x0e\x24\x7f\xac\x1e\xc5\x65\x35\x07\x9c\x7c\
+\x84\x99\xdc\x2d\x8b\xc8\xb2\xbb\x14\x00\xbb\xdc\x42\x2d\x13\x45\
+\xfc\x1d\x00\x83\x1d\xb6\x8b\x3d\xde\x2b\xbe\x0a\x88\x9e\x7c\xe2\
+\x51\xbf\xf7\x98\xe4\x8f\x10\xbb\x3f\x13\xf3\xe8\x0d\xbf\x10\xd3\
+\xef\xb6\x05\xc0\x41\xa6\x0a\x80\x03\x58\x14\x00\x07\xa0\x44\x39\
+\x15\xf0\x43\x78\x83\xb6\x87\x55\x00\x1a\xa2\x08\x80\xc2\xfa\xd6\
+\x4b\xf2\x87\x5c\xc4\x1f\xff\x05\x9c\x78\x98\xfc\xe9\x6c\x07\x4c\
+\x01\xb0\x0b\x85\x8e\x82\xed\x9e\x6d\xf8\x55\x44\x11\xd0\xc3\x0a\
+\xc0\xd4\x25\x14\x01\x13\x89\x75\xf6\x5d\x25\xff\x80\x3f\xfe\x5b\
+\x27\xca\xd7\xd5\x72\xe0\xee\x50\x8f\x78\x1f\xf0\xbf\xd8\x29\x05\
+\x40\x31\xb4\xeb\x14\x1c\x50\x8d\xdf\x80\xe9\x65\x15\x80\xc6\xb0\
+\x14\xed\xd7\x01\x90\x28\x6b\x3d\x25\xff\xb2\xa4\xca\x96\x1e\xf0\
+\xf1\xbf\x50\x93\xba\xb2\xd1\xdb\x2d\x5d\x01\xb0\xcb\x83\x57\xa1\
+\x7e\x07\x10\x71\x05\x00\xc8\x11\x97\x3e\xf1\xfb\x90\x91\xfc\x5d\
+\x09\x38\x44\x26\xdf\xb9\xde\x92\x3f\x02\x38\xe2\x67\xa0\xfd\x09\
+\xc7\xc1\x3e\xa7\x00\x38\x88\x65\xb3\x51\x00\x1c\x01\x13\xe9\x74\
+\x58\x11\xd0\xd9\x12\xa8\x22\xa0\xcc\xa7\xa6\xb7\xe4\x0f\xa5\x88\
+\xc9\x1f\xbf\x03\x9a\xc9\xff\x44\xd0\x14\x00\x0f\xe1\x84\xeb\x30\
+\x41\x55\xf9\xa6\xc7\x41\x10\x11\x40\xc2\x7a\xd8\xad\x3c\xb3\x84\
+\x00\x2c\xf9\x8a\x65\xc9\xbd\xad\xde\xc3\xec\xbf\x55\xdf\xce\xf9\
+\xd5\xfa\xf2\xff\x01\xff\xfd\xfe\xff\x00\x94\xe9\x94\x02\x60\x22\
+\xb1\xbb\x0f\x25\x02\x58\x01\xc0\x76\x9b\x10\xe3\x55\xe4\xc1\xf0\
+\x18\x61\x12\x16\x89\xeb\xd8\xfb\x9e\x3f\x4f\x60\xfa\x5a\x05\x96\
+\xe7\xaf\x8e\x75\x45\x54\xe1\x1b\x75\xa2\x11\xab\x77\xac\xeb\xad\
+\x02\xe0\x30\xef\x50\xbf\x03\x38\xdc\x84\x18\x67\xa3\x0e\x86\xe7\
+\xe8\x92\xb8\x58\x0d\x20\x91\x9d\xbb\xd6\xf7\x77\x09\x20\x9e\x7a\
+\x65\x17\x59\xf0\xb6\x3f\xfb\xdf\xed\x47\xb7\xaf\xfc\x83\x05\xb7\
+\x20\x0e\xed\x14\x00\x87\xa8\x04\x3c\x17\x59\x9d\x47\x1e\x14\x4f\
+\x75\x15\x92\x3f\x89\x8c\x84\x76\xea\x3a\xdf\xbb\x27\x00\x2b\xc4\
+\xd3\xfd\x99\xbe\x8e\xa2\x0a\xde\xa0\x2b\x8c\xa1\x56\x72\x6b\xf4\
+\x74\x05\xc0\x61\xea\x74\x1c\xec\xf0\xbb\x0d\x9e\xe5\x03\x8a\x35\
+\xe8\xda\x59\x97\x18\x14\x7b\xfa\xb7\x01\xf6\x1b\x4c\x42\x23\xb1\
+\xed\x9f\xf7\xf5\x3d\x81\x3b\xb1\xf4\xe4\xc7\xdf\x9f\xec\xec\x28\
+\xb2\xd0\x8d\xf0\x6f\xff\x1f\xe8\x2e\x7e\xff\x7f\x00\xca\xf6\x29\
+\x05\xc0\x36\x8d\xe0\xc7\xae\x02\xb4\x1b\x40\x44\x00\xab\x01\x24\
+\xba\x76\xbd\xac\xe3\x19\xe2\x68\x04\x36\x08\xdd\x3a\x84\xaf\xaf\
+\x35\xe8\xf2\x7f\xa8\x49\xdc\xf5\x51\xba\xbc\x04\x05\xc0\x71\x66\
+\xe1\x7e\x07\x10\x75\x05\x80\x10\xb0\x02\x80\x71\xdc\xab\x91\xfc\
+\x49\x74\x24\xbc\x5e\xdb\x78\x49\xbb\xee\x78\x74\x3c\xeb\x9f\x78\
+\x44\x9e\xfd\xc7\x98\x58\x4c\xa4\x77\xf6\x0a\x80\x1d\x1c\x0f\x5f\
+\x28\x00\x1e\x32\x99\xce\x84\xec\x3c\x91\x45\x40\xe4\x41\x72\xea\
+\x34\x73\xf6\xac\x06\xbc\xee\x43\xde\x71\x33\xb2\x10\x40\x08\x61\
+\x88\x80\x39\xcc\x22\x5f\x43\xbf\x8e\x3c\xfb\x0f\xca\x3e\xdc\x04\
+\xae\x06\x67\x05\xc0\x69\xea\xe1\x44\x40\x60\xb5\xbe\x61\x05\x80\
+\xc1\xf2\x74\x48\xfa\x79\x77\x44\x21\x80\xe8\x41\xfc\x8c\x90\xf8\
+\xa7\x9e\x4a\xbf\x9e\x8e\x23\xee\x23\x2c\xff\x47\xe4\xda\x82\xcf\
+\x0a\x80\xd3\x51\x08\xa7\x22\x23\xaf\x00\x10\x0a\x66\x4a\xd1\x07\
+\x4c\xda\x71\x89\x21\x04\x98\x0d\x93\x1c\x2f\xb9\x2f\xd2\xb5\xb4\
+\x8d\xc4\x4f\x5b\x23\xf9\x7d\xad\xaf\x08\xda\xc8\xfd\x39\xf0\x84\
+\xc2\xc7\xff\x66\x74\x5e\x05\xc0\x69\x48\xe1\x56\x00\x68\x4e\xe0\
+\x0f\x2d\xee\x6f\x18\x34\x6f\x0e\x06\xfa\x1f\x33\x62\x92\xe3\x4d\
+\x92\x7c\xca\xdb\x75\xd1\x72\xda\x84\xb0\xb9\x69\xd3\x00\xdf\xf3\
+\xef\x07\x8d\xc4\x8f\xa0\xdd\x3f\x1f\xe9\x75\x8c\xd9\xff\x03\xa2\
+\xe1\x26\x6e\x0f\x5a\xb0\xd2\x09\x05\xc0\x79\xd0\xe1\x44\x40\xd0\
+\x0f\xed\x5d\x24\x6e\x06\xce\xce\xfe\x4e\xc0\x5d\xe3\x66\x1c\x6c\
+\x0b\x01\x66\xce\x33\x6e\x69\xe6\x12\x92\x3e\x3e\x93\xf8\x31\x5e\
+\x37\xe3\xdc\xca\x8e\x44\x17\xb2\x81\x27\x12\xe1\xc6\xec\x95\xbb\
+\xe6\x5d\x75\x0a\x80\x3b\x14\x47\x0f\x42\xaa\x49\xbf\x0a\x38\x1a\
+\xcf\x30\x6f\x20\x04\xb0\x9b\x19\x74\x5a\x15\x68\x39\x99\xe2\x1b\
+\x09\x1f\xc3\x67\x5e\x87\x01\x5d\xc0\x51\x92\x3f\x42\xb6\x40\xd1\
+\x16\xb9\x47\xe0\xc0\x4b\x05\xc0\x01\x28\x87\x4e\x29\x00\x0e\x51\
+\xd9\x3d\x47\x67\xc2\x76\xcf\x36\xfe\x2a\xb0\x7a\xbf\x23\xfb\x92\
+\x6f\xdf\xdc\xfc\x30\xf0\xee\xc4\xc0\x07\x24\x55\x92\xeb\x24\x06\
+\x98\x65\xd7\xc4\x41\x82\xc7\x26\x9f\xd8\xf3\xba\xa6\x4f\xad\xd4\
+\x4d\xf2\x8f\xbe\xf4\xcf\xf8\x11\x74\x25\x31\xe4\x84\xad\x56\xdf\
+\x55\x00\xcc\x23\x1f\xee\x5f\x94\x62\x05\x00\x9b\xd7\xbc\x76\xaf\
+\x62\x30\x6d\xd7\xbb\x3a\x9e\x21\x06\x30\xc4\x00\x86\x18\xc0\x4a\
+\x25\x60\xca\xc5\xa8\x83\x44\x4f\x9d\xec\x31\xce\xd7\xa1\xd0\x66\
+\xad\xcc\xfa\xa3\x27\xff\x36\xc9\x1e\xf3\xea\xc1\x79\x7f\xfc\xf7\
+\x00\xc9\xf1\x13\x0a\x80\xe3\x6c\xb6\xdf\x09\xb7\x02\x80\xf3\xa8\
+\x78\xf6\x91\xed\x66\x40\x1d\xf8\xf7\x00\x73\x62\x87\x18\xc0\x48\
+\xc8\x24\x67\x8c\x63\x8c\xa4\xbd\x6f\x24\xed\x7d\x9b\xae\xe1\x9e\
+\x6d\xdb\x29\xeb\xc9\x8f\xdf\x70\xdf\x1c\x9f\x46\xbd\x86\x55\xab\
+\xe8\x6d\x67\xdc\x08\x3a\xfb\x0f\x39\x4e\xd7\xec\x2f\x0a\x80\x79\
+\xf4\xe9\x58\xd8\xbc\xab\x1b\xb9\x8a\x15\x00\xac\x11\x77\x16\xbb\
+\xc1\x8c\x0a\x21\xb0\xb8\x80\x01\x6f\x24\x51\x63\x08\x83\x7d\xdb\
+\x4e\xf0\xd3\xf1\x74\x0d\xf7\x6c\xdb\x80\xe8\x16\x37\xd9\xd5\xaa\
+\xc5\xe8\x16\xdf\xb8\x77\x63\xb8\x95\xda\x3d\xff\x57\x7f\xa9\x00\
+\x7f\x44\xab\xe6\x00\x00\x10\x00\x49\x44\x41\x54\x98\x8f\x3c\xe4\
+\x77\x4b\xa8\xf9\xf9\x4d\x6c\xf7\x4a\x66\x56\x8a\x80\x76\xe3\x33\
+\xba\x67\x24\x7f\x84\x6a\x74\x0e\x8c\x17\x41\x67\xff\xa0\x77\xf9\
+\x1f\x0a\x17\x98\x02\x60\x3e\xac\x70\x2b\x00\x34\x8d\x15\x00\x8c\
+\xe3\xe8\xc6\x20\x1b\xbd\x0d\xfa\xdf\x1f\x01\x84\x69\x0f\xc9\x3f\
+\x5e\x64\x76\x3c\x0e\x39\x41\xdb\x69\x41\x85\x17\x0a\x80\xcb\xa0\
+\x87\x14\x01\xa8\xfa\xcb\x9a\xd9\xe6\xd5\x37\x03\xad\xbf\x07\x68\
+\x33\x38\x03\x7b\xc5\xea\x54\x2f\xcd\x0f\x3c\xfb\xef\x25\x04\xab\
+\xb6\x43\x01\x70\x19\xee\x90\x2a\x93\x15\x00\xec\xb2\xa6\xb6\x79\
+\x35\x33\x2d\x84\x40\x9b\xde\xe9\xd5\x68\x04\x7a\x5a\x95\x8a\x36\
+\x51\xd8\xeb\x6b\x2e\xff\xef\x01\x99\xf3\x52\x01\x30\x87\xd2\xfd\
+\x35\x21\x57\x00\x70\x3f\xf8\x87\x9b\x26\xdc\x19\x33\x2e\x45\xc0\
+\x1d\x0e\x0f\x2a\x11\x20\xf9\x23\x48\x2b\x55\x9f\xbd\xda\xc0\xb3\
+\xff\x90\x13\xb3\xec\x01\x5c\x50\xa0\x02\xe0\x72\x68\x21\x45\x00\
+\x2b\x00\xd8\xe5\xcd\x6d\xf3\x0e\x06\xdf\x36\x3d\xd3\xab\x11\x08\
+\xd0\xff\x7a\x4a\xfe\xf1\x26\x08\x3b\xbd\x2c\xe4\x98\xbc\xd3\x82\
+\x4a\x2f\x14\x00\x97\x83\x0f\xab\x36\x83\x7f\xc8\x77\x22\xc5\x0a\
+\x00\x2b\x01\x3b\x27\x7d\x21\x81\x15\x08\xf4\x96\xfc\x41\x16\x78\
+\xf6\x8f\xfb\x0a\x00\x28\x2c\x30\x05\xc0\xe5\xd0\xe8\x6c\xd8\xe5\
+\x77\x56\xbe\x83\x15\x00\xac\xb2\x1b\xd9\xaa\x57\x04\x64\x43\x69\
+\x41\x33\x09\xd0\xe7\x7a\x9a\xf9\xd3\xec\x88\x13\x03\xfc\xbe\xb5\
+\xb0\x13\xb2\x5b\xff\xab\xee\x14\x00\xcb\xf0\x87\xed\x74\xc1\x3f\
+\xec\x0f\xa2\xc5\x80\xec\x4a\xc0\x03\x2c\x9e\x28\x40\xa0\xc7\xbe\
+\xc6\x78\x10\x7c\xf6\xef\x8f\xff\xae\xe8\xeb\x0a\x80\x2b\xe0\x45\
+\xbc\x95\x15\x00\x3e\xf4\x11\x7d\x3f\xe6\x33\x03\x33\xcb\xb2\xc7\
+\xde\xf7\xbc\x04\xae\x25\x40\x1f\xeb\x51\x68\x32\x1e\x5c\xcb\x66\
+\xfd\xfb\xef\x6a\x0c\x3b\x11\xbb\x6b\x41\xe5\x03\x05\xc0\xb2\x00\
+\xf0\x15\x00\xb6\xec\xee\xca\x77\xa1\xf8\x83\x7f\xf0\x1f\x10\x64\
+\x59\x56\x11\xf0\x00\x8b\x27\x32\x10\xe8\x35\xf9\x33\x11\xe8\x6d\
+\x1c\xc8\x10\xee\xa1\x8a\x50\x00\x2c\x0f\x77\x68\xf5\xc9\x87\x7f\
+\x79\xd3\xdb\xbc\x53\x11\xd0\x66\x5c\x22\x7b\xd5\x6b\xf2\x27\x26\
+\x4c\x04\xd8\x47\xb3\x5b\x7f\x19\x7f\x5d\xfe\xbf\x85\xb1\x74\xa7\
+\x00\x58\x4a\x6e\xb3\x61\x05\x00\xdb\x44\xfc\x0f\xe5\x8f\x45\xf4\
+\xfd\x94\xcf\x88\x80\x1e\x97\x6a\x4f\xb5\xd9\xf7\xca\x10\xe8\x39\
+\xf9\xf7\x38\x01\x28\xd3\x0b\xfa\x2e\x55\x01\x70\x5d\x7c\x51\xa1\
+\xd7\x95\x50\xf1\xee\x9f\x7d\xed\xf3\x2a\xd6\x5e\xae\xea\x9e\x07\
+\xee\x72\xd4\x2c\x79\x9b\x40\xcf\x7d\x88\xe4\x1f\x77\xf6\x7f\x17\
+\x25\x67\xff\x77\x28\x96\x1f\x28\x00\x96\xb3\xe3\x4e\x56\x00\x30\
+\x8e\x43\x1a\x83\x41\x48\xc7\xcf\x38\xdd\xf3\x00\x7e\xa6\xe9\xbe\
+\x7d\x25\x01\x7e\x4b\xd2\xf3\x2a\x52\x07\xc9\x3f\xf4\xc4\xeb\xca\
+\xee\x99\xf5\x76\x05\xc0\xf5\x38\x43\x77\x46\x06\x83\x1e\xbf\x0a\
+\x20\xac\x88\x80\x3f\xf2\x55\x9b\x0d\x7b\x5e\x6b\x12\x38\x47\x80\
+\xe4\xcf\xd7\x48\xe7\xae\x8b\xfa\x7e\x74\xc1\x7f\xcb\xdd\xd9\xff\
+\x2d\x88\x6b\x77\x0a\x80\x6b\x09\x06\xff\x2d\x00\xcd\xef\x64\x50\
+\xa0\x29\x07\x8d\xd9\x1c\x03\xfb\xc1\x37\x3d\x29\x81\x5b\x02\x37\
+\xfd\xe4\xf5\xb7\x2f\x3a\xdc\xf1\x39\x47\xf0\x07\x6f\x5a\xe8\x09\
+\x57\x6b\xec\x15\x00\x79\x22\x12\xba\x53\xb2\x02\xc0\xe0\x90\x07\
+\x45\x9b\xa5\x30\xab\x53\x04\xb4\x19\x9b\xda\x5e\xb1\x42\x44\xf2\
+\x67\x5f\xdb\x97\x92\xf5\xf3\x39\x2f\x59\x7e\xf9\xb2\x6f\x6a\x70\
+\xf6\x7f\x83\x21\xcf\xff\x14\x00\x79\x38\xf2\x3b\x00\x2c\x4f\x69\
+\x15\x4a\x61\x66\xd0\xc9\x00\x71\x94\x1e\x22\x60\x84\x81\xfe\x28\
+\x00\xdf\x78\x40\x00\x51\x38\x42\x9f\x40\xe0\x77\xf0\xf9\x0e\x3d\
+\xd1\x7a\xd0\xf9\x1a\x38\xa1\x00\xc8\x17\x84\xf0\x9d\x93\x41\x22\
+\x1f\x8e\x36\x4b\x62\x96\xc7\x80\xcf\xc0\xdf\xa6\x87\x7a\xb5\x16\
+\x81\x9b\x7e\xd0\xf1\x92\xff\xc4\x91\xcf\x35\x02\x7f\x7a\x1d\x75\
+\x9f\xfc\x76\xf6\x9f\x20\xe4\xdc\x14\x00\xf9\x68\xb2\x02\x80\xe5\
+\x2b\x71\xe5\x92\x98\x21\x30\x58\xac\x5c\x6d\x95\xea\x58\x0d\x50\
+\x04\x54\x41\x5f\xbd\xd2\x49\x04\xb2\xaf\xee\xcc\x0a\x0e\x74\x92\
+\xfc\xc3\x4f\xb0\x56\x08\xf5\xc5\x55\x28\x00\x2e\x46\x76\xf2\x86\
+\xf0\x9d\x94\xc1\x62\x24\x11\xc0\x2c\x70\x94\x44\x70\xb2\xe7\x0e\
+\xf2\x26\xa2\x6f\xa4\x98\xf7\xf3\x59\xde\x38\xfb\xdf\xe4\xff\x4f\
+\x01\x90\x97\x29\x2b\x00\x58\xde\x52\x57\x2e\x0d\x11\xc0\x6a\xc0\
+\xca\xd5\x56\xa9\x8e\xe4\x4f\x42\x20\x31\x54\x71\xc0\x4a\x57\x23\
+\x70\x13\xe7\x01\x96\xfc\x27\xa0\x24\x7f\x3e\xcb\xd3\xeb\xc0\xfb\
+\xf0\x13\xab\x56\xd9\x2b\x00\xf2\x47\xa6\x8b\xce\xca\xe0\x91\x1f\
+\x4d\xbb\x25\xfa\x95\x40\xbb\xb1\xb9\xd6\xb3\x49\xe4\xb1\xbf\xb6\
+\xac\x28\xf7\x23\xe0\x3b\x49\xfe\x20\x7f\x8c\xff\x69\xf9\x09\x28\
+\x00\xf2\x33\x65\x05\x00\xcb\x5f\xf2\x8a\x25\x32\x80\x8c\x28\x02\
+\x6e\x66\x89\x3f\xbe\x22\x68\xab\x2a\x4a\x80\x95\x1d\x62\x3a\x52\
+\xf2\x07\x68\x47\xff\xcc\x77\x17\x13\x2a\x62\xd2\xa2\x29\x00\xca\
+\x44\xa5\x8b\x4e\xcb\x0c\x02\x21\x50\x06\x51\x9b\xa5\x92\x28\x5c\
+\x0d\x68\x33\x36\x97\x78\x45\x1c\x49\xfc\xc4\xf2\x92\xfb\x7a\xb8\
+\xb6\x33\xe1\xfe\xd8\x66\xd3\x43\x54\xda\x6c\x83\x02\xa0\x4c\x5c\
+\x58\x01\xc0\xca\x94\xbe\x62\xa9\xcc\x24\x46\x13\x01\xe0\x25\x71\
+\xf0\xcf\x08\x33\x83\xe4\xb5\x16\x87\x00\x89\x1f\x43\x04\xc4\xf1\
+\x3a\x8f\xa7\x24\x7f\x84\x7b\x9e\xd2\xaa\x97\xd2\xc5\x44\xaa\x3a\
+\xc5\x13\x0e\x28\x00\x4e\xc0\xb9\xf2\xad\x6e\x3a\x2f\x83\xca\x95\
+\x2c\xc2\xde\x8e\x10\x40\x04\x60\x61\x1b\x31\x88\xe3\xc4\x08\xd1\
+\x36\x62\xe2\x27\xc4\x08\xf5\x8e\x92\x3f\x4d\xba\xf9\xe5\x3f\x07\
+\x5a\x19\x02\x0a\x80\x32\x5c\x29\x95\x15\x00\x8c\xe3\xd0\xc6\xc0\
+\x32\xbc\x08\x78\xfd\x66\x43\x82\xc1\x42\x07\xb3\x43\xe7\x49\xf8\
+\xcc\xf8\x11\x6b\x1d\x36\x6f\x76\x93\x58\xad\x9b\x7d\x71\xfb\x17\
+\x76\x33\x81\x6a\x19\xb5\x02\xa0\x6c\x74\xba\xe9\xc4\xcc\x2c\x10\
+\x02\x65\x71\xb5\x5d\x3a\x09\xe6\xc6\xfc\x91\x60\x13\x81\x9a\x12\
+\x3f\xc9\x9f\xe3\x26\x9c\xaa\xe4\x44\x87\x02\xfd\x76\xf6\x5f\x09\
+\xe8\x20\xd5\x2a\x00\xca\x06\x9a\x15\x00\xac\x6c\x2d\x2b\x95\xce\
+\x0c\x63\x74\x11\x00\x6a\x44\x00\x4b\xcd\xae\x06\x40\x63\x7d\x23\
+\xd9\x93\xf4\x31\x8e\xd7\xf7\xa0\xad\x1a\x49\xfe\x08\xf4\xb6\xbc\
+\xba\xca\x9b\x6e\x26\x4e\x57\x51\x58\xe1\x66\x05\x40\x79\xc8\x5d\
+\x75\x66\x45\xc0\x7d\x87\xd9\x16\x02\x26\xa2\x7b\x2e\xa5\x8e\x60\
+\x4c\xd2\xc7\x38\x2e\x55\x4f\xa4\x72\x3b\x4d\xfe\x77\xb3\xff\x48\
+\xb1\x88\xe8\xab\x02\xa0\x7c\xd4\x58\x01\xe8\x4e\x04\x94\xc7\x16\
+\xa7\x06\x84\x00\x49\x09\x73\x55\x20\x6f\xdc\x48\xf4\x70\x65\xc5\
+\x85\x3d\xaf\xf3\xd6\x10\xb7\xb4\x0e\x93\x3f\xc1\x30\xf9\x43\x61\
+\x25\x53\x00\xac\x03\x9a\x4e\x8d\x10\x58\xa7\xb6\x15\x6a\x61\x25\
+\x60\x85\x6a\x42\x55\x41\x72\x42\x0c\x90\xac\x10\x02\x58\xa8\x06\
+\x34\xe4\x2c\x2c\x49\xf8\x18\xc7\x0d\xb9\xd6\x84\x2b\x9d\x26\xff\
+\xbd\x89\x52\x13\xa8\xbb\x76\x42\x01\xb0\x5e\x78\xbb\xea\xdc\xfc\
+\x16\x40\x11\x70\xbc\xf3\x20\x04\xb0\x49\x0c\x1c\xbf\xd2\x77\x26\
+\x02\x24\x7a\x12\x3e\xcc\xd8\xf3\x7a\x7a\xcf\xfd\x3d\x01\x3e\x7b\
+\x9d\x7d\xe7\x4f\xe3\x98\x20\x31\x51\xe2\x58\x5b\x89\x80\x02\x60\
+\x25\xd0\xa9\x1a\x3a\xb8\x22\x20\x81\x18\x6d\xdb\x16\x02\xae\x0a\
+\xec\x46\x9f\x24\x4f\xb2\x9f\x8c\xd7\xbb\x57\xf8\x6a\x9b\x00\xc9\
+\xbf\x53\xe1\xfd\x23\xdb\xed\xe4\x58\x2b\x4f\x40\x01\x50\x9e\xf1\
+\x76\x0d\xdd\x29\x5c\x06\x24\x96\x23\xb7\x1b\xe9\xf1\x61\x02\x08\
+\x01\x8c\x19\x2e\x42\x00\x3b\x7c\x65\xff\x67\x49\xf4\xdb\x49\x9f\
+\xd7\xfd\xb7\xfa\xfa\x16\x76\x9a\xfc\x99\x18\x75\x37\x36\x5e\x1f\
+\xed\xf2\x25\x28\x00\xca\x33\xde\xaf\xe1\x79\xfb\x27\xa2\xbf\x66\
+\x39\x52\x11\x70\x59\x14\x11\x02\xd8\x28\x62\x80\x04\x8f\x91\xf4\
+\x69\x33\x7b\x5e\x5f\x46\x6d\xec\xab\x3b\x4d\xfe\x04\xf5\x40\xf2\
+\xe7\xb4\x56\x9a\x80\x02\xa0\x34\xe1\x87\xe5\xf3\x55\x00\xf6\xf0\
+\x9d\xc0\x67\x14\x01\xcb\x83\x87\x10\xc0\x48\x8c\x18\x2b\x03\x58\
+\xd4\x04\x89\xdf\x18\x6d\x20\xd1\xd3\x26\xf6\x18\xe7\x97\x93\x1a\
+\xf7\x4e\x92\x3f\xab\x6d\x1d\x12\x60\xf6\xdf\x61\xb3\x62\x34\x49\
+\x01\x50\x27\x4e\x5d\x76\x7a\x45\x40\x9e\xce\x84\x18\xc0\x48\x98\
+\x53\xf2\x24\x99\x62\x2d\x26\x50\x7c\xc2\xb7\x6d\x7f\x39\xa6\x0d\
+\xbc\x97\x87\xca\xb8\xa5\xb0\xba\xd6\x71\xf2\x3f\x38\xfb\x1f\x37\
+\xda\xeb\xb6\x5c\x01\xb0\x2e\xef\xa9\x36\x56\x00\x14\x01\x13\x0d\
+\xf7\x27\x09\x90\x44\x49\xa6\x18\x89\x75\x5f\x14\x90\x7c\x27\xe3\
+\x5a\xec\x64\x81\x33\xdf\xa4\x9c\x6d\x9b\xea\xc0\x87\xc9\xee\x7c\
+\x79\xfd\x66\xc3\xb5\x33\x8b\xf6\xb2\x99\x04\x48\xfe\x08\xeb\x99\
+\x97\x47\xbb\xcc\xe4\x5f\x39\x62\x0a\x80\x7a\x01\xa0\xf3\x23\x04\
+\xea\x79\x50\xa8\x66\x06\x2c\x06\xae\x42\xc5\x5b\x6c\x22\x40\xb2\
+\x45\x10\xec\xdb\x76\x62\x26\x39\x4f\x36\x9d\x67\x3f\x25\x72\xf6\
+\xbc\xde\xb6\xe9\x7a\xf6\xdb\xe7\x39\x9e\xea\xa2\xee\xc9\x92\x2b\
+\x6e\x85\x08\xb0\xec\xcf\x67\xa9\x50\xf1\xb5\x8b\x3d\x31\x01\xaa\
+\xed\xda\x38\xf5\x2b\x00\xea\xc6\xba\xdb\x0f\x01\x03\x97\x22\xa0\
+\x6e\xe7\xda\xae\x7d\x4a\xd8\xec\xa7\x44\xce\x9e\xd7\xdb\xb6\x7d\
+\x8f\xc7\xf5\x08\x90\xfc\x3b\x5d\xf6\x07\x2a\x13\x1f\x26\x40\x1c\
+\x6b\x15\x09\x28\x00\x2a\xc2\x4f\x55\xf3\x41\x50\x04\x24\x10\x6e\
+\x12\x90\xc0\x66\x43\xd2\xef\x3c\xf9\x13\xe6\x93\x4f\x42\x71\x81\
+\xb6\x0e\x01\x05\xc0\x3a\x9c\x4f\xd5\x82\x12\x46\x08\x9c\xba\x26\
+\xec\x7b\xae\x04\x84\x0d\x9d\x8e\xaf\x4c\x60\x90\xe4\xdf\xed\x84\
+\x67\xe5\xee\x92\xa5\x3a\x05\x40\x16\x8c\x57\x17\x82\x22\xee\x5a\
+\x04\x30\xab\xb9\x9a\x92\x05\x48\xa0\x53\x02\x53\xf2\xef\xb4\x79\
+\x53\xb3\x48\xfe\x4c\x78\xa6\xd7\x07\xf6\x9e\x5a\x93\x80\x02\x60\
+\x4d\xda\xa7\xeb\xe2\xc3\x71\xfa\x8a\xc0\xef\x0e\x32\xc0\x05\x8e\
+\x90\xae\xd7\x22\xc0\x6f\x65\x06\x10\xc8\x4c\x70\x4c\xfe\xb5\x3a\
+\xd9\x91\x7a\x15\x00\x47\xc0\x54\x38\xcd\x07\x64\x08\x11\x80\x18\
+\xa8\xc0\xd7\x2a\x25\xd0\x1c\x01\x92\x3f\x5f\x93\x35\xe7\x58\x7e\
+\x87\x58\xe5\x3c\x5b\xaa\x17\xac\x4b\x40\x01\xb0\x2e\xef\x73\xb5\
+\xa1\x90\x11\x02\xe7\xae\x0b\xfb\x3e\xc9\x9f\xd9\x0e\xfb\xb0\x8d\
+\xd0\x71\x09\x64\x20\x30\x50\xf2\xef\x7a\x62\x93\xa1\x2b\x54\x2b\
+\x42\x01\x50\x0d\xfd\xd1\x8a\x51\xca\x5d\x8b\x00\x5a\xae\x08\x80\
+\x82\x36\x2a\x81\xc1\x92\x3f\x13\x9b\x19\xa1\xf6\x92\xb5\x09\x28\
+\x00\xd6\x26\x3e\xaf\xbe\x21\x14\x33\x22\x80\x81\x70\x1e\x12\xaf\
+\x92\x40\x1f\x04\xe8\xf7\x83\x2c\xfb\x33\x91\x31\xf9\x37\xdc\x6d\
+\x15\x00\x6d\x06\x87\x0f\xce\x10\x22\x80\x81\x50\x11\xd0\x66\x27\
+\xd4\xab\xbc\x04\xf8\xda\x8b\xe4\xcf\x3e\x6f\xc9\xcd\x96\xc6\x6a\
+\xe6\x6c\xe7\xbc\x70\x7d\x02\x0a\x80\xf5\x99\xcf\xad\x11\xe5\x8c\
+\x10\x98\x7b\x7d\xd8\xeb\x10\x01\x6f\x7e\xe5\xe3\x6e\xfe\x11\x94\
+\xb0\x8d\xd0\x71\x09\x9c\x20\x80\xc8\x1d\x2c\xf9\x0f\x31\x81\x39\
+\x11\xf2\x10\x6f\x29\x00\xda\x0e\x13\x0a\x7a\x08\x11\x40\x18\x18\
+\x20\x19\x28\x39\xd6\x24\xd0\x0b\x01\xfa\x35\x22\xb7\x97\xf6\xcc\
+\x68\x07\xc9\x9f\x09\xcc\x8c\x4b\xa7\x4b\xdc\xd7\x20\xa0\x00\xa8\
+\x41\xfd\xb2\x3a\xf9\x30\x5d\x76\x47\xe0\xab\x19\x28\x15\x01\x81\
+\x03\xa8\xeb\x77\x04\x58\xea\x27\xf9\xb3\xbf\x3b\xd9\xff\x01\x13\
+\x16\x93\x7f\x90\x38\x2b\x00\xda\x0f\x14\x1f\xa8\xe1\x44\x80\x5f\
+\x09\xb4\xdf\x31\xf5\xf0\x38\x01\x44\xec\x80\xc9\x1f\x20\xac\x5a\
+\xb2\xbf\xc8\xbc\xb8\x0e\x01\x05\x40\x1d\xee\x97\xd6\x8a\xa2\x46\
+\x08\x5c\x7a\x5f\xe8\xeb\x19\x40\x19\x48\x43\x37\x42\xe7\x87\x23\
+\x40\xbf\x65\x25\x6b\xb8\x86\x6f\x36\x43\x4d\x54\x7a\x88\xaf\x02\
+\x20\x4e\x14\x51\xd6\xc3\x89\x00\x06\x52\x45\x40\x9c\x4e\x3a\xb2\
+\xa7\x2c\xf5\x0f\xbc\x72\x45\xf2\x67\xa2\xb2\xa0\x0b\x78\x4b\x2d\
+\x02\x0a\x80\x5a\xe4\x97\xd5\x3b\xac\x08\x60\x60\x55\x08\x2c\xeb\
+\x34\xde\x55\x9e\x00\x7d\x93\x99\x7f\xf9\x9a\x9a\xac\xc1\xe4\xdf\
+\x64\x58\xce\x3b\xa5\x00\x38\xcf\xa8\xb5\x2b\xf8\xb0\xb5\xe6\xd3\
+\x2a\xfe\xb8\x1a\xb0\x0a\x66\x2b\xb9\x80\x00\xb3\x7e\x12\x3f\x7d\
+\xf3\x82\xdb\x7a\xba\x94\xf1\xe8\xaa\x99\x7f\x4f\x30\xa2\xb5\x45\
+\x01\x10\x2d\x62\x9b\x0d\x5f\x03\xb0\x12\xb0\x19\xf1\x3f\x06\x5a\
+\x57\x03\x46\x8c\x7c\x7b\x6d\x9e\x66\xfd\x88\x80\xf6\xbc\x5b\xc5\
+\x23\x93\xff\x2a\x98\xcb\x55\xa2\x00\x28\xc7\xb6\x64\xc9\x43\x8b\
+\x00\xc0\x22\x04\x18\x80\x39\xd6\x24\xb0\x26\x01\x12\x3e\x22\x94\
+\x3e\xb8\x66\xbd\x8d\xd5\xc5\x18\x94\x61\xe6\xdf\x58\xab\x06\x73\
+\x47\x01\x10\x37\xe0\x7c\x00\x51\xe0\x71\x5b\x70\xa5\xe7\x0c\xc0\
+\x0c\xc4\x0a\x81\x2b\x41\x7a\xfb\x2c\x02\x24\x7e\x96\xfb\xb1\x59\
+\x37\xf4\x7b\x11\x63\xcf\xb0\xab\x90\x3d\x85\x55\x01\x10\x3b\x9a\
+\x28\xf0\xa1\x45\x00\xe1\x43\x08\x30\x28\x2b\x04\xa0\xa1\x95\x20\
+\x40\xdf\xa2\x8f\x21\x02\x4a\x94\x1f\xac\xcc\x6c\xc9\x3f\x58\xbb\
+\xbb\x73\x57\x01\x10\x3f\xa4\x8a\x80\x14\x43\x06\x66\x84\x00\x03\
+\x75\x7a\xe9\x26\x81\x2c\x04\xe8\x57\x24\x7e\xfa\x56\x96\x02\xe3\
+\x17\x62\xf2\x8f\x1f\xc3\xbb\x16\x28\x00\xee\x50\x84\x3e\x50\x04\
+\xdc\x86\x8f\x81\xda\xaf\x05\x6e\x61\xb8\x5b\x4c\x60\x4a\xfc\x24\
+\x7f\x8e\x17\x17\xd4\xd7\x8d\x24\x7f\x96\xff\x33\xb5\xca\x62\x6a\
+\x13\x50\x00\xd4\x8e\x40\xbe\xfa\x15\x01\x5b\x2c\x15\x02\x5b\x30\
+\x3c\x9c\x4d\x80\x64\x4f\xd2\xc7\x38\x9e\x7d\x63\xff\x17\xf2\x55\
+\xa3\xc9\xbf\xb3\x38\x2b\x00\xfa\x0a\x28\x22\xc0\x0f\xe9\x56\x4c\
+\x15\x02\x5b\x30\x3c\x3c\x4a\x80\x64\x4f\xd2\xc7\x38\x3e\x7a\xe1\
+\x98\x6f\x90\xfc\x19\x5b\xb2\xb6\xde\xc2\xea\x13\x50\x00\xd4\x8f\
+\x41\x6e\x0f\x5c\xa6\x3b\x40\x54\x21\x70\x00\x8a\xa7\x36\x24\x7b\
+\x92\x3e\xc6\xb1\x48\x1e\x10\x30\xf9\x3f\x40\xd2\xcf\x09\x05\x40\
+\x3f\xb1\xdc\x6e\x89\x22\x60\x9b\xc6\xd6\xb1\x42\x60\x0b\xc6\xc0\
+\x87\x24\x7b\x92\x3e\xc6\xf1\xc0\x28\x4e\x35\xbd\x60\xf2\x3f\x55\
+\xad\xef\xad\x45\x40\x01\xb0\x16\xe9\xf5\xeb\xe1\xc3\xbb\x7e\xad\
+\x41\x6a\x54\x08\x04\x09\x54\x66\x37\x49\xf6\x24\x7d\x8c\xe3\xcc\
+\xc5\xf7\x54\x1c\xe3\x87\xcb\xfe\x3d\x45\xf4\x40\x5b\x14\x00\x07\
+\xa0\x74\x72\x8a\xdf\x02\x3c\x2e\xb5\x85\x7d\xda\xb9\x1d\x22\xa0\
+\x10\x38\x44\xa5\xbf\x73\x24\x7b\x92\x3e\xc6\x71\x7f\x2d\xcc\xda\
+\xa2\xe2\xc9\x3f\xab\xb7\x16\xb6\x98\x80\x02\x60\x31\xba\x30\x37\
+\xfa\x75\xc0\x8c\x50\x6d\x0b\x01\xff\x2d\x81\x19\xc0\x82\x5c\x42\
+\xb2\x27\xe9\x63\x1c\x07\x71\xbb\xa6\x9b\x26\xff\x9a\xf4\x57\xae\
+\x5b\x01\xb0\x32\xf0\x4a\xd5\x21\x02\xf8\x60\x57\xaa\x3e\x4e\xb5\
+\x08\x01\x6c\xfa\xb7\x04\x4c\x1a\x71\x62\x37\x79\x4a\xcc\x48\xf8\
+\xc4\x90\x3d\xaf\xa7\xf7\xdc\x9f\x24\xc0\x18\xb1\xc2\xb2\xff\x49\
+\x1f\x7c\x73\x45\x02\x0a\x80\x15\x61\x57\xae\xea\x6b\x53\xfd\xbf\
+\x95\xcc\x6d\x26\x01\x84\x00\x09\x04\x73\x55\x60\x26\xb4\x4a\x97\
+\x91\xe4\x89\x93\x49\x7f\x71\x00\x7e\x22\xdd\x69\xf2\x4f\x10\x46\
+\xda\x14\x00\xe3\x44\xfb\xe5\xa9\xa9\xef\x98\xcc\xed\x42\x02\x24\
+\x17\xc4\x00\xc9\x05\x21\x80\x5d\x58\x84\x97\x17\x20\x40\x5c\x30\
+\x12\x3f\xc6\x71\x81\x6a\x46\x29\xf2\xc3\x52\x43\x9f\x9b\xac\xf8\
+\x66\x05\xed\x10\x50\x00\xb4\x13\x8b\x92\x9e\x7c\x70\x2a\xfc\xd5\
+\xc9\xdc\xae\x24\x80\x10\xc0\x14\x03\x57\x82\xbc\xe2\x76\x12\x3d\
+\x09\x7f\x32\x5e\x5f\x51\x9c\xb7\xde\x13\x70\x8c\xb8\x67\x31\xc4\
+\x91\x02\x60\x88\x30\x6f\x3e\x73\x8c\x66\xae\xdb\x4a\x84\x00\x36\
+\x89\x01\x13\x51\x39\xfe\xb0\x25\xe1\xc3\x9a\x3d\xaf\xcb\xd5\x36\
+\x6c\xc9\xcf\x4f\x2d\x7f\x71\xb2\x82\x9b\x45\xb7\x44\x40\x01\xd0\
+\x52\x34\xca\xf8\xf2\x49\xa9\xd8\x97\x26\x73\x2b\x48\x00\x21\x40\
+\x62\x22\x41\xf1\x15\x01\x56\xb0\xba\xee\x8b\x26\xc1\x63\x13\x53\
+\xf6\xbc\xee\xbe\xe1\xf5\x1b\xe8\x64\xa1\x7e\x0c\x56\xf3\x40\x01\
+\xb0\x1a\xea\x6a\x15\xfd\xd5\x6a\x35\x0f\x5a\x31\x62\x00\x43\x0c\
+\x90\xb8\x10\x03\xd8\xa0\x38\x66\x35\x9b\xe4\x8e\xc1\x6b\xe2\xc6\
+\x31\xe7\x66\x15\xe0\x45\xb9\x08\x7c\x44\x2a\xe8\x55\xc9\x8a\x6c\
+\x16\xda\x16\x01\x05\x40\x5b\xf1\xc8\xed\xcd\xe7\xa5\x02\x9f\x95\
+\xcc\xad\x12\x01\x12\x18\x62\x00\x23\xb1\x61\x88\x01\x8c\xf7\x2a\
+\xb9\x55\xbd\x5a\xda\x0e\x03\x92\x3c\x4c\xd8\x63\x9c\xaf\xee\x9c\
+\x0e\xf0\x5b\x80\xa7\x89\xa1\x7f\x02\x0a\x80\x7e\x63\xfc\xfb\x52\
+\xd3\xf8\x20\xa7\x9d\x5b\x4b\x04\x10\x03\x18\x09\x6f\x4a\x7e\x24\
+\x43\x8c\x04\x88\xb5\xe4\xef\x35\xbe\xd0\x16\x8c\xb6\xd1\x5e\x6c\
+\x6a\x33\x0c\x78\xef\x9a\xf2\xbd\xb7\x08\x81\xc7\xa7\x52\x5f\x99\
+\x2c\xf3\x66\x71\xad\x11\x50\x00\xb4\x16\x91\x7c\xfe\xf0\xd8\xdf\
+\x13\xf3\x15\x67\x49\xa5\x08\x90\x04\x49\x86\x18\x09\x12\x9b\x92\
+\x24\xc7\x24\x4f\x8c\xeb\x4a\xf9\x70\x4d\xb9\xf8\x85\xe1\x23\xfe\
+\x62\xf8\x8f\x71\x8c\xd1\x36\xae\xc1\xae\xa9\xcb\x7b\x57\x23\xf0\
+\x59\xa9\x26\x1f\x0b\x4c\x10\x7a\xde\x14\x00\x7d\x46\xd7\xc7\xfe\
+\x3a\x88\x2b\xc9\x12\x23\x79\x62\x24\x52\x92\x2a\xc6\x31\x09\xf7\
+\x90\x71\xcf\xb6\x5d\x82\x62\xfb\xbe\xed\xe3\xfd\x7a\xa8\x1f\x9b\
+\x7c\xe1\x18\x1f\xa7\x7b\x2e\xa9\xd3\x6b\x9b\x25\xf0\x8a\x9c\x9e\
+\x59\x56\x7b\x04\x14\x00\xed\xc5\x24\x87\x47\xfe\x92\x37\x07\xc5\
+\x86\xcb\x20\xd1\x92\x70\x0f\x19\xc9\x78\xdb\x48\xd2\x73\x6d\xfb\
+\xbe\xed\xe3\xfd\x7a\xa8\x1f\x6b\x18\x91\xae\x5d\x4f\xe0\x4f\xa7\
+\x22\x7c\x2c\x30\x41\xe8\x75\x53\x00\xf4\x17\x59\x1f\xfb\xeb\x2f\
+\xa6\xb6\x48\x02\xb5\x08\x64\x9a\x4c\xd4\x72\xdf\x7a\x4f\x11\x50\
+\x00\x9c\xa2\x13\xf3\x3d\x1f\xfb\x8b\x19\x37\xbd\x96\x40\x8b\x04\
+\x7c\x2c\xb0\xc5\xa8\x64\xf2\x49\x01\x90\x09\x64\x23\xc5\xf8\xd8\
+\x5f\x23\x81\xd0\x0d\x09\x74\x44\x80\xa7\x89\xae\x7a\x2c\xb0\x23\
+\x16\x5d\x35\x45\x01\xd0\x4f\x38\x7d\xec\xaf\x9f\x58\xda\x12\x09\
+\xb4\x44\xc0\xc7\x02\x5b\x8a\x46\x46\x5f\x14\x00\x19\x61\x56\x2e\
+\xea\x8b\x52\xfd\x3e\xf6\x97\x20\xb8\x49\x40\x02\xd9\x09\x5c\xf1\
+\x58\x60\x76\x5f\x2c\x30\x13\x01\x05\x40\x26\x90\x95\x8b\xe1\xb1\
+\xbf\x2f\xac\xec\x83\xd5\x4b\x40\x02\x7d\x13\xe0\xab\x80\xbe\x5b\
+\x38\x58\xeb\x14\x00\x7d\x04\xdc\x5f\xea\xf6\x11\x47\x5b\x21\x81\
+\x96\x09\x2c\xfa\x6b\x81\x2d\x37\x68\x74\xdf\x14\x00\xf1\x7b\x80\
+\x8f\xfd\xc5\x8f\xa1\x2d\x90\x40\x14\x02\x4e\x36\xa2\x44\x6a\x86\
+\x9f\x0a\x80\x19\x90\x1a\xbf\xc4\xc7\xfe\x1a\x0f\x90\xee\x49\xa0\
+\x23\x02\x17\x3e\x16\xd8\x51\xcb\x3b\x6c\x8a\x02\x20\x76\x50\x7d\
+\xec\x2f\x76\xfc\xf4\x5e\x02\x11\x09\xf0\x5b\x80\xf7\x8a\xe8\xb8\
+\x3e\xef\x12\x50\x00\xec\xf2\x88\xf4\xca\xc7\xfe\x4d\xef\x0f\x40\
+\x00\x00\x0e\x73\x49\x44\x41\x54\x22\x45\x4b\x5f\x25\xd0\x0f\x01\
+\x1e\x0b\xe4\xa9\xa3\xb3\x2d\xf2\x82\xb6\x09\x28\x00\xda\x8e\xcf\
+\x29\xef\xf8\x00\xfa\xd8\xdf\x29\x42\xbe\x27\x01\x09\x94\x22\xe0\
+\x63\x81\xa5\xc8\xae\x58\xae\x02\x60\x45\xd8\x19\xab\xf2\xb1\xbf\
+\x8c\x30\x2d\x4a\x02\x12\x58\x44\xe0\xcc\x5f\x0b\x5c\x54\xa6\x37\
+\xad\x48\x40\x01\xb0\x22\xec\x8c\x55\xbd\x34\x63\x59\x16\x25\x01\
+\x09\x48\x60\x09\x01\xff\x5a\xe0\x12\x6a\x0d\xdd\xa3\x00\x68\x28\
+\x18\x33\x5d\xe1\xb1\x3f\x1f\xc5\x99\x09\xcb\xcb\x24\x20\x81\xa2\
+\x04\x8e\x8e\x45\x45\x6b\xb5\xf0\x2c\x04\x14\x00\x59\x30\xae\x5a\
+\x48\x0f\x8f\xfd\x7d\xc7\xaa\xc4\xac\x4c\x02\x6d\x12\xf8\xe1\xe4\
+\xd6\x77\x27\x8b\xbc\xf1\x58\x60\x0f\x63\x52\xe4\x18\x2c\xf6\x5d\
+\x01\xb0\x18\x5d\x95\x1b\x7b\x78\xec\xef\x35\x89\xdc\x0b\x93\x3d\
+\x2e\xd9\x97\x26\x73\x93\xc0\x68\x04\x48\xfc\xcf\x4b\x8d\xc6\x3e\
+\x3f\xed\xa3\x6f\x08\x80\xbd\xc7\x02\xa3\x37\x69\x0c\xff\x15\x00\
+\x71\xe2\xdc\xcb\x63\x7f\x5f\xbf\x85\xfc\xb1\x74\xac\x10\x48\x10\
+\xdc\x86\x21\x80\xe8\x25\xf1\x23\x02\x68\xf4\x5b\xd2\xff\xbe\x2c\
+\x59\xe4\xcd\xc7\x02\x83\x46\x4f\x01\x10\x27\x70\x3d\x3c\xf6\xf7\
+\x35\x09\xf7\x4f\x25\xdb\xdf\x10\x02\x0c\x8c\xd8\xfe\x7b\xbe\x96\
+\x40\x0f\x04\xe8\xdb\x88\x5d\xfa\xfa\x7e\x7b\x10\x00\xff\x66\xff\
+\x64\xb0\xd7\x3b\x8f\x05\x06\xf3\x7d\x58\x77\x15\x00\x31\x42\xdf\
+\xc3\x63\x7f\xbf\x92\x50\x33\xd0\xa5\xdd\xc1\x8d\x81\x11\x63\xa0\
+\xc4\x0e\x5e\xe4\x49\x09\x04\x23\x40\x5f\x3e\x96\xf8\xa7\xa6\xbc\
+\x2d\x1d\x7c\x43\xb2\xe8\x1b\xff\x42\x60\xf4\x36\x0c\xe5\xbf\x02\
+\x20\x46\xb8\x7b\x78\xec\x8f\xe4\xff\xeb\x33\x70\x23\x02\x30\x96\
+\x49\x19\x3c\x67\xdc\xe2\x25\x12\x68\x8e\x00\x7d\xf7\x5c\xe2\xdf\
+\x76\xfa\x9b\xd3\x8b\xe8\x3f\x08\xbc\xfd\x6b\x81\xa9\x25\x6e\x21\
+\x08\x28\x00\xda\x0f\x53\x0f\x8f\xfd\xbd\x29\x61\xfe\xda\x64\x97\
+\x6c\x7c\x47\x8a\x10\x60\x10\x65\x30\xbd\xe4\x5e\xaf\x95\x40\x2d\
+\x02\xf4\x55\xfa\x2c\x7d\xf7\x52\x1f\x2e\xfd\x8c\x5c\x5a\xfe\x1a\
+\xd7\xfb\x58\xe0\x1a\x94\x33\xd5\xa1\x00\xc8\x04\xb2\x60\x31\xfc\
+\xc2\xb6\x60\xf1\xab\x14\xcd\xa0\x78\x4d\x45\x0c\xa6\x0c\xaa\xd7\
+\x96\x73\x8d\x0f\xde\x2b\x81\x63\x04\x10\xab\xac\x58\xd1\x47\xe9\
+\xab\xc7\xae\x3b\x77\xfe\x07\xd3\x05\xaf\x4d\x16\x79\xfb\x88\xe4\
+\x7c\x0f\x63\x56\x6a\x46\xff\x9b\x02\xa0\xed\x18\xf7\xf2\xd8\xdf\
+\xf7\x64\xc2\xcc\xe0\xca\x20\xab\x10\xc8\x04\xd4\x62\xae\x22\x30\
+\x25\x7e\x92\x3f\xc7\x57\x15\x76\x7b\xf3\x57\xdd\xee\x23\xef\x10\
+\x00\x3e\x16\x18\x20\x82\x0a\x80\x76\x83\xd4\xe3\x63\x7f\xb9\x68\
+\x2b\x04\x72\x91\xb4\x9c\x25\x04\x48\xf6\x24\x7d\x8c\xe3\x25\x65\
+\x1c\xbb\x27\xf8\x63\x81\x37\xcd\xf2\xb1\xc0\x1b\x0c\xed\xff\x4f\
+\x01\xd0\x6e\x8c\x7a\x78\xec\xef\x2b\x13\xde\x43\x8f\xfd\xa5\xd3\
+\x59\x36\x85\x40\x16\x8c\x16\x32\x93\x00\xc9\x9e\xa4\x8f\x71\x3c\
+\xf3\xb6\x8b\x2f\xe3\x07\xb3\x3e\x16\x78\x31\x36\x6f\xb8\x94\x80\
+\x02\xe0\x52\x62\xeb\x5c\xdf\xcb\x63\x7f\x08\x80\x35\x88\x29\x04\
+\xd6\xa0\x3c\x6e\x1d\x24\x7b\x92\x3e\xc6\x71\x69\x12\x61\x1f\x0b\
+\xdc\x03\xf3\x8a\xbd\xd7\xbe\x6c\x8c\x80\x02\xa0\xb1\x80\xdc\xba\
+\x33\xd2\x63\x7f\xb7\x4d\xce\xb2\xdb\x16\x02\xfe\x4e\x20\x0b\xd2\
+\x61\x0b\x21\xd1\x93\xf0\x27\xe3\xf5\x9a\x30\x7a\x78\x2c\xd0\xbf\
+\x16\xb8\x66\x8f\x59\x50\x97\x02\x60\x01\xb4\xc2\xb7\x8c\xfa\xd8\
+\x5f\x4e\xac\x08\x01\x6c\xfa\xc1\xa0\x62\x20\x27\xdd\xbe\xcb\x22\
+\xd1\x6f\x27\x7d\x5e\xd7\x6a\x71\xb0\xc7\x02\x0f\x62\xf2\xb1\xc0\
+\x83\x58\xda\x38\xa9\x00\x68\x23\x0e\xdb\x5e\xf0\x0b\xda\xed\xd7\
+\x11\x8f\x5b\x4a\xb8\x08\x01\x6c\x12\x03\x35\x07\xf4\x88\xb1\x1c\
+\xc1\x67\xfa\x04\x49\x9f\x3e\xc2\x9e\xd7\x2d\xb4\xdb\xc7\x02\x5b\
+\x88\x42\xc7\x3e\x28\x00\xda\x0a\xae\x8f\xfd\x95\x8d\x07\x42\x80\
+\x01\x1e\x6b\x49\xa4\x94\x6d\xb5\xa5\x1f\x22\x40\x92\xa7\x1f\xb4\
+\x96\xf4\xf7\x7d\x0d\xf3\x58\xe0\xbe\xe3\x5b\xaf\x99\xd4\xf8\x58\
+\xe0\x16\x90\x56\x0e\x15\x00\xad\x44\x62\xb3\xf1\xb1\xbf\xf5\x62\
+\xc1\xe0\x8f\x18\x60\xf0\x47\x08\x60\xeb\xd5\x6e\x4d\xb5\x08\x10\
+\x77\x62\x4d\xe2\xc7\x78\x5d\xcb\x97\xb9\xf5\xfa\x58\xe0\x5c\x52\
+\x5e\x77\x31\x01\x05\xc0\xc5\xc8\x8a\xdd\xd0\xc3\x63\x7f\xc7\xfe\
+\xda\x5f\x31\x68\x19\x0a\x46\x08\x60\x8a\x81\x0c\x30\x1b\x2d\x82\
+\x44\x4f\xc2\xc7\x88\x35\xaf\x1b\x75\xf5\xa0\x5b\x3c\x16\xf8\x5f\
+\x0f\xbe\xd3\xcc\xc9\xb3\x8e\x7c\x56\xba\xe2\xb9\xc9\xdc\x1a\x22\
+\xa0\x00\x68\x23\x18\xbd\x3c\xf6\xc7\x40\xd5\x06\xd1\x65\x5e\x90\
+\x1c\x30\xc5\xc0\x32\x7e\xad\xdc\x45\x82\xc7\x48\xf8\xc4\x92\x3d\
+\xaf\x5b\xf1\xef\x52\x3f\x78\x2c\x90\x95\x8b\x4b\xef\x6b\xed\x7a\
+\xff\x5a\x60\x63\x11\x51\x00\xb4\x11\x10\x1f\xfb\x6b\x23\x0e\xdb\
+\x5e\x20\x04\x30\x12\x08\x83\x2f\xb6\xfd\xbe\xc7\x6d\x11\x20\xc1\
+\x93\xe8\xb7\x8d\x73\x6d\x79\xb9\xdc\x9b\xa6\x1f\x0b\x9c\xd9\xac\
+\xe7\xa7\xeb\x5e\x9c\xcc\xad\x11\x02\x0a\x80\xfa\x81\xf0\xb1\xbf\
+\xfa\x31\x38\xe7\x01\x42\x00\x43\x0c\x60\x88\x01\xec\xdc\x7d\xbe\
+\x5f\x8e\x00\xc9\x1d\x23\xe1\x13\x13\xf6\xbc\xc6\xca\xd5\x5a\xb7\
+\xe4\x1e\x1e\x0b\x7c\x59\x5d\x84\xd6\xbe\x4d\x40\x01\xb0\x4d\xa3\
+\xce\x31\xbf\x90\xad\x53\x73\xbe\x5a\x47\x4b\x86\x88\x01\x8c\xc4\
+\x83\xd1\x7e\xac\xe7\xe4\x93\xaf\xb7\x2c\x2b\x09\xb6\x30\x26\xd1\
+\xc3\x9c\x3d\xc6\xf9\x65\x25\xc6\xbb\x8b\xc7\x02\xbf\xa5\x3d\xb7\
+\x2f\xf2\xe8\xc3\xd3\xd5\x3d\x8c\x79\xa9\x19\xf1\x37\x05\x40\xdd\
+\x18\xfa\xd8\x5f\x5d\xfe\xb9\x6a\x47\x0c\x60\x24\x24\x92\x13\x89\
+\x0a\x1b\x29\x39\xe5\x62\x39\x95\x03\x3b\x78\x62\x30\x65\x0f\x63\
+\xce\x4f\xd7\x8c\xb8\xa7\x5f\x45\x6f\x37\x02\xc0\xc7\x02\x1b\x88\
+\xa2\x02\xa0\x5e\x10\x7c\xec\xaf\x1e\xfb\xd2\x35\x93\xa8\x30\x92\
+\x16\xc9\x0b\xe3\x98\xc1\x1b\x1b\x3d\x89\x4d\xfc\xe1\x80\xc1\x04\
+\x3e\x18\xac\x30\x8e\x79\x0f\x9b\xae\x77\xbf\xd9\x34\xf7\x58\xe0\
+\x82\xa0\xf8\xd7\x02\x17\x40\x2b\x71\x8b\x02\xa0\x04\xd5\x79\x65\
+\xbe\x3c\x5d\xf6\xc4\x64\x91\x37\xfe\xd8\x4f\xc9\xbf\xf6\x17\x99\
+\xcd\xbe\xef\x24\x32\x44\x01\x46\x72\x23\xc9\x61\x1c\x93\x00\x27\
+\xe3\xba\xfd\x7b\xa3\xbf\xa6\x4d\x18\x6d\xa4\xbd\xd8\xd4\x76\x8e\
+\x61\xc2\xfb\x58\xf4\xb6\xae\xe1\x3f\x4f\xdb\xf8\xd7\x02\xd7\x20\
+\xdd\x79\x1d\x0a\x80\x3a\x01\xe6\xb1\xbf\xe8\x8f\xc4\xfc\x4a\x42\
+\x87\x00\x48\x3b\xb7\x2b\x08\x90\xf4\x48\x80\x93\x91\x10\x49\x8e\
+\x18\xc7\x24\x4d\x8c\xeb\xb0\x2b\xaa\x2a\x76\x2b\x7e\x4d\x86\xaf\
+\xf8\x8d\xd1\x06\x8c\x63\x8c\x36\x4e\xd7\x15\x73\x66\x80\x82\x79\
+\x2c\xf0\xb5\x6d\xb4\xf3\x2a\x2f\xa2\x8f\x81\x57\x35\xbe\x85\x9b\
+\x15\x00\x75\xa2\xe0\x63\x7f\x75\xb8\x47\xab\x95\x64\x49\xd2\xc4\
+\x48\xa0\x18\x09\x75\xdf\x38\xbf\x6f\x24\xe2\x7d\xa3\xbc\x53\xb6\
+\x7f\xfd\x7e\x99\xd3\xeb\x53\xf5\xe3\xeb\x54\x47\x34\xde\x91\xfc\
+\xfd\xa6\xe4\xec\x77\x27\x8b\xbc\xf9\x58\x60\xe5\xe8\x29\x00\xd6\
+\x0f\x00\x7f\x22\x33\xfa\x5f\xc8\x7a\x53\xc2\xd6\xc3\x23\x49\xa9\
+\x19\x5d\x6c\x53\xc2\xdd\xde\x93\x88\xf7\x6d\x4a\xe0\xc7\xf6\xfb\
+\xd7\x6f\x97\xb7\x7d\xdc\x05\xb4\x0e\x1a\x51\xfd\x33\x98\x81\xa1\
+\x8f\x05\x66\x80\xb8\xb4\x08\x05\xc0\x52\x72\xcb\xef\xeb\x61\xd9\
+\x8b\x99\xe2\x72\x02\xde\x29\x01\x09\xe4\x20\xc0\x63\x81\xd1\xbf\
+\x0a\xf0\xb1\xc0\x1c\x3d\x61\x61\x19\x0a\x80\x85\xe0\x16\xde\xe6\
+\x63\x7f\x0b\xc1\x79\x9b\x04\x24\x70\x90\x40\xc5\xbf\x16\x78\xd0\
+\x9f\x25\x27\x7d\x2c\x70\x09\xb5\x0c\xf7\x28\x00\x32\x40\x9c\x59\
+\x84\x8f\xfd\xcd\x04\xe5\x65\x12\x90\xc0\x6c\x02\xbd\x3c\x16\x88\
+\x08\x98\xdd\x68\x2f\xcc\x43\x40\x01\x90\x87\xe3\x9c\x52\xfc\x6b\
+\x7f\x73\x28\x79\x8d\x04\x24\x70\x29\x01\x1e\x0b\x5c\xfd\xaf\x05\
+\x5e\xea\xe4\x99\xeb\x3f\x3d\xbd\xef\x5f\x0b\x4c\x10\xd6\xdc\x14\
+\x00\xeb\xd0\xe6\xb1\xbf\x2f\x5c\xa7\xaa\x62\xb5\xf0\xd8\x1f\x03\
+\x4d\xb1\x0a\x2c\x58\x02\x12\x58\x44\x80\xc7\x02\x7b\xf8\x6c\xf6\
+\xf0\xfb\xa8\x45\x01\xac\x75\x93\x02\x60\x1d\xf2\x3e\xf6\xb7\x0e\
+\x67\x6b\x91\xc0\xa8\x04\x56\x7e\x2c\xb0\x08\x66\x1f\x0b\x2c\x82\
+\xf5\x78\xa1\x0a\x80\xe3\x6c\x72\xbd\xe3\x63\x7f\xb9\x48\x5a\x8e\
+\x04\x24\x70\x8a\x80\x8f\x05\x9e\xa2\xe3\x7b\x0f\x08\x28\x00\x1e\
+\x20\xc9\x7e\xa2\x87\x65\x2d\x1f\xfb\xcb\xde\x2d\x2c\x50\x02\xd9\
+\x09\xf0\x58\xe0\x2a\x7f\x2d\x30\xbb\xe7\xf7\x05\xfa\x58\xe0\x3d\
+\x8b\xe2\x47\x0a\x80\xb2\x88\x7d\xec\xaf\x2c\x5f\x4b\x97\x80\x04\
+\x76\x09\xf4\x20\xd6\x79\x22\xc0\xbf\x16\xb8\x1b\xd7\x22\xaf\x14\
+\x00\x45\xb0\xde\x14\xea\x63\x7f\x37\x18\xfc\x9f\x04\x24\xb0\x22\
+\x81\x15\x1e\x0b\x2c\xde\x1a\xfe\x5a\x20\x22\xa0\x78\x45\xa3\x57\
+\xa0\x00\x28\xd7\x03\x5e\x91\x8a\xf6\xaf\xfd\x25\x08\x6e\x12\x90\
+\xc0\xaa\x04\x78\x22\x20\xfa\x5f\x0b\xe4\xb1\xc0\x0f\x5d\x95\xda\
+\x80\x95\x29\x00\xca\x04\xfd\x49\xa9\xd8\x57\x26\x8b\xbc\xf1\xd8\
+\x9f\x7f\xed\x2f\x72\x04\xf5\x7d\x54\x02\x3c\x16\x58\xec\x9f\x08\
+\x5e\x11\xea\xcb\x57\xac\x6b\xc8\xaa\x14\x00\x65\xc2\xfe\x71\xa9\
+\xd8\xb7\x4f\x16\x79\x63\x16\xf1\xeb\x91\x1b\xa0\xef\x12\x18\x98\
+\x40\x0f\x8f\x05\xbe\x28\xc5\xef\x3d\x92\xb9\x15\x22\xa0\x00\x28\
+\x03\x36\xba\x72\x7d\x63\xc2\xd2\xc3\x23\x45\xa9\x19\x6e\x12\x18\
+\x96\x40\x81\xcf\xf0\xea\x2c\x3f\x79\xf5\x1a\x07\xaa\x50\x01\x90\
+\x3f\xd8\xef\x99\x8a\xe4\x51\x96\xb4\x0b\xbb\x31\xfb\x0f\xeb\xbc\
+\x8e\x4b\x40\x02\x37\x04\x78\x2c\x30\xfa\x57\x01\x7f\xf2\xa6\x25\
+\xfe\xaf\x08\x01\x05\x40\x7e\xac\xcf\xc9\x5f\xe4\xaa\x25\xbe\x26\
+\xd5\xf6\x3d\xc9\xdc\x24\x20\x81\xf8\x04\xb2\xfe\xb5\xc0\x0a\x38\
+\x3e\xaa\x42\x9d\xc3\x54\xa9\x00\xc8\x1f\xea\x0f\xca\x5f\xe4\xaa\
+\x25\x7e\xfd\xaa\xb5\x59\x99\x04\x24\x50\x92\x40\xf4\xc7\x02\xdf\
+\x39\xc1\xf9\xc0\x64\x6e\x05\x08\x28\x00\xf2\x43\x7d\x66\xfe\x22\
+\x57\x2b\xf1\x6b\x52\x4d\x3f\x95\xcc\x4d\x02\x12\xe8\x87\x00\x5f\
+\xe9\x65\xf8\x6b\x81\xd5\x80\x3c\xa3\x5a\xcd\x9d\x57\xac\x00\xc8\
+\x1f\xe0\xa7\xe4\x2f\x72\x95\x12\x79\xec\x8f\x81\x62\x95\xca\xac\
+\x44\x02\x12\x58\x8d\x00\x8f\x05\x46\xfe\x6c\x47\x1d\x53\x57\x0b\
+\xf0\xd2\x8a\x14\x00\x4b\xc9\x1d\xbf\x2f\xea\x3f\xfe\xc3\x00\xe1\
+\x63\x7f\xc7\xe3\xea\x3b\x12\x88\x4c\xe0\xea\xc7\x02\x2b\x36\xfe\
+\x09\x15\xeb\xee\xba\x6a\x05\x40\xfe\xf0\x3e\x2e\x7f\x91\xc5\x4b\
+\xf4\xb1\xbf\xe2\x88\xad\x40\x02\xd5\x09\x44\x7d\x2c\xd0\x3c\x55\
+\xa8\xeb\x08\x36\x3f\xd8\xff\x9d\xbf\xc8\xe2\x25\x32\xfb\x2f\x5e\
+\x89\x15\x48\x40\x02\x55\x09\x5c\xf1\x58\x60\x55\xbf\x23\x8e\xa9\
+\x55\x81\xcd\xad\x5c\x01\x30\x97\xd4\xfc\xeb\x7e\x79\xfe\xa5\x4d\
+\x5c\xe9\x63\x7f\x4d\x84\x41\x27\x24\xb0\x0a\x81\x88\x8f\x05\xfe\
+\xf7\x55\xc8\x0c\x58\x89\x02\x20\x7f\xd0\xdf\x9c\xbf\xc8\xa2\x25\
+\xfa\xd8\x5f\x51\xbc\x16\x2e\x81\xa6\x08\x2c\x7a\x2c\xb0\x72\x0b\
+\xf0\xb9\xb2\x0b\x7d\x56\xaf\x00\xc8\x1f\xd7\x9f\xcb\x5f\x64\xb1\
+\x12\x7d\xec\xaf\x18\x5a\x0b\x96\x40\xb3\x04\xf8\xca\x2f\xd2\x5f\
+\x0b\xf4\xd1\xe4\x42\x5d\x49\x01\x90\x1f\xec\xbf\xca\x5f\x64\x91\
+\x12\x7d\xec\xaf\x08\x56\x0b\x95\x40\xf3\x04\x78\x2c\xf0\x82\x7f\
+\x22\xb8\x6a\x7b\xfe\x45\xaa\xdd\xdf\x00\x24\x08\x25\x36\x05\x40\
+\x7e\xaa\xa8\xd5\x08\x22\x80\x59\x80\x8f\xfd\xe5\x8f\xbf\x25\x4a\
+\x20\x02\x81\x28\x8f\x05\xfe\x44\x04\x98\x51\x7d\x54\x00\x94\x89\
+\x1c\xbf\xb6\x2d\x53\x72\x9e\x52\x7d\xec\x2f\x0f\x47\x4b\x91\x40\
+\x64\x02\xb3\x1e\x0b\xac\xdc\x40\xff\x2e\x49\xc1\x00\x28\x00\xca\
+\xc0\xfd\xc7\x65\x8a\xcd\x56\x2a\xb3\xff\x6c\x85\x59\x90\x04\x24\
+\x10\x92\x00\x13\x95\x96\xbf\x0a\xf8\xd1\x44\xf5\xdf\x27\x73\x2b\
+\x44\x40\x01\x50\x06\xec\x7f\x48\xc5\x7e\x67\xb2\x16\x37\x1f\xfb\
+\x6b\x31\x2a\xfa\x24\x81\x3a\x04\xce\x3c\x16\x58\xc7\xa9\xdb\x5a\
+\xbf\xee\x76\xef\xae\x10\x01\x05\x40\x21\xb0\xa9\xd8\x57\x25\x6b\
+\x71\xf3\xb1\xbf\x16\xa3\xa2\x4f\x12\xa8\x43\x80\x47\xec\x5a\x5c\
+\x11\xfc\xb1\x84\xa3\xf5\x95\xd4\xe4\x62\xec\x4d\x01\x50\x2e\x7e\
+\xff\x39\x15\xdd\xda\x77\x6c\xa8\x7d\x7e\xa4\x98\x5c\x73\x93\x80\
+\x04\x24\x70\x43\xe0\xd5\xe9\xff\x3f\x93\xec\xc1\x56\xf1\x04\x3e\
+\x55\xac\x7e\x8c\xaa\x15\x00\x65\xe3\xfc\x97\x52\xf1\x08\x81\xb4\
+\xab\xbe\xbd\x29\x79\xf0\xca\x64\x6e\x12\x90\x80\x04\xf6\x09\x7c\
+\xfe\xfe\x89\x8a\xaf\x99\xa8\xfc\x50\xc5\xfa\x87\xa9\x5a\x01\x50\
+\x36\xd4\xff\x37\x15\xff\xd2\x64\xb5\xb7\xdf\x4e\x0e\xb4\xe0\x47\
+\x72\xc3\x4d\x02\x12\x68\x90\xc0\x3f\x4b\x3e\x7d\x6e\xb2\xad\xad\
+\xca\xe1\xf7\xa5\x5a\x9d\xa8\x24\x08\x6b\x6c\x0a\x80\xf2\x94\x5f\
+\x9f\xaa\x78\x51\xb2\x9a\xdb\xa7\xa6\xca\x79\xf4\x2f\xed\xdc\x24\
+\x20\x01\x09\x1c\x24\xc0\x57\x96\x35\x9f\x0a\xe0\x9f\x51\xaf\x3d\
+\x56\x1e\x04\xd3\xeb\x49\x05\xc0\x3a\x91\xfd\x87\xa9\x9a\xcf\x48\
+\x56\x63\xfb\xb4\x54\xe9\x77\x25\x73\x93\x80\x04\x24\x70\x8e\xc0\
+\x67\xa6\x0b\xf8\x47\x82\x36\x69\xbf\xe6\xc6\x6f\x93\xfe\x44\xaa\
+\xf0\x7f\x26\x73\x5b\x89\x80\x02\x60\x25\xd0\xa9\x1a\x3e\x54\x1f\
+\x91\xf6\x6b\xfd\xb3\x96\xbf\x9a\xea\xfa\x84\x64\xff\x28\x99\x9b\
+\x04\x24\x20\x81\xb9\x04\x98\xac\xf0\x3d\xfc\xdc\xeb\xaf\xbd\x8e\
+\x65\xff\xe7\xa7\x42\xa2\xfd\x25\xd5\xe4\x72\xec\x4d\x01\xb0\x6e\
+\xfc\xfe\x75\xaa\xee\x43\x93\xfd\x70\xb2\x92\xdb\xf7\xa7\xc2\xff\
+\x68\x32\xbe\xd7\x4b\x3b\x37\x09\x48\x40\x02\x97\x10\xd8\xf0\x3d\
+\xfc\x9f\x4d\x77\xfc\x5a\xb2\x92\xdb\x63\xa9\xf0\x8f\x4b\xc6\xdf\
+\x26\x49\x3b\xb7\x35\x09\x28\x00\xd6\xa4\xfd\xa8\xae\xff\x94\x76\
+\xcf\x4b\xf6\x05\xc9\x7e\x23\x59\xce\x8d\x0f\xd1\xe7\xa4\x02\x59\
+\x4a\xfb\x2f\x69\xef\x26\x01\x09\x48\x60\x29\x81\x6f\x4b\x37\xbe\
+\x7f\x32\x56\x2f\xd3\x2e\xeb\xc6\x3f\xf1\xcb\x38\xf8\xa5\x59\x4b\
+\xb5\xb0\x8b\x08\x28\x00\x2e\xc2\x95\xf5\x62\xfe\x14\xef\x53\x53\
+\x89\x5f\x94\xec\x97\x92\x5d\xb3\xfd\x42\xba\xf9\x2f\x26\x7b\x5a\
+\xb2\xbf\x9b\xcc\x4d\x02\x12\x90\xc0\x62\x02\x5b\x37\xbe\x35\x1d\
+\xf3\x95\xc0\xfb\xa5\xfd\xb7\x26\xbb\x76\xe3\x1f\xf7\xf9\x94\x54\
+\xc8\x9f\x4a\x56\x7a\x25\x34\x55\xe1\x76\x8a\x80\x02\xe0\x14\x9d\
+\xf2\xef\xf1\xd7\xf8\xfe\x46\xaa\xe6\xc9\xc9\xf8\x7d\xc0\x37\xa7\
+\x3d\xc9\x3c\xed\xce\x6e\xfc\x95\x2c\xfe\xa9\xcc\x4f\x4c\x57\x92\
+\xf8\xf9\x17\xfe\xd6\xfa\x7d\x41\xaa\xd2\x4d\x02\x12\x18\x88\xc0\
+\x4f\xa7\xb6\xbe\x38\xd9\x7b\x24\x63\x95\xf1\x1b\xd3\x7e\xee\x78\
+\xf3\xef\xd2\xb5\x5f\x9e\xec\x83\x92\x91\xfc\x11\x01\xe9\xd0\xad\
+\x36\x01\x05\x40\xed\x08\xdc\xd7\xcf\xef\x03\x3e\x3d\xbd\x24\x99\
+\xbf\x57\xda\xb3\x8c\xff\x92\xb4\xff\xc2\x64\x5f\x92\x8c\x7f\x54\
+\x88\x0f\xcf\x1f\x4f\xc7\xef\x99\xec\xc3\x93\x7d\x76\xb2\xef\x4d\
+\xe6\x26\x01\x09\x48\x20\x13\x81\x93\xc5\xf0\x43\x3d\x56\x19\xff\
+\x42\xba\xea\x5d\x92\x7d\x40\x32\x26\x21\x2f\x4c\xfb\x2f\x4e\xf6\
+\x57\x92\x7d\x5e\x32\x9e\x3e\x62\x8c\x7a\x42\x3a\xe6\xf7\x48\xfc\
+\xd3\xe8\x3f\x99\x8e\xdd\x1a\x22\xa0\x00\x68\x28\x18\x5b\xae\xfc\
+\x7c\x3a\xe6\x87\x7c\x7f\x3f\xed\xff\x66\xb2\xbf\x96\xec\x6f\x25\
+\x43\x39\xbf\x2e\xed\xff\x5b\x32\x37\x09\x48\x40\x02\xb5\x09\xfc\
+\xc7\xe4\x00\x93\x90\xef\x48\xfb\xaf\x4c\xf6\x15\xc9\xfe\x4e\x32\
+\x9e\x3e\x62\x95\xf2\x37\xd3\xb1\x5b\xa3\x04\x14\x00\x8d\x06\x46\
+\xb7\x24\x20\x01\x09\xd4\x20\x60\x9d\xe3\x10\x50\x00\x8c\x13\x6b\
+\x5b\x2a\x01\x09\x48\x40\x02\x12\xb8\x23\xa0\x00\xb8\x43\xe1\x81\
+\x04\x24\x20\x81\xd1\x09\xd8\xfe\x91\x08\x28\x00\x46\x8a\xb6\x6d\
+\x95\x80\x04\x24\x20\x01\x09\xdc\x12\x50\x00\xdc\x82\x70\x27\x01\
+\x09\x48\x60\x74\x02\xb6\x7f\x2c\x02\x0a\x80\xb1\xe2\x6d\x6b\x25\
+\x20\x01\x09\x48\x40\x02\x37\x04\x14\x00\x37\x18\xfc\x9f\x04\x24\
+\x20\x81\xd1\x09\xd8\xfe\xd1\x08\x28\x00\x46\x8b\xb8\xed\x95\x80\
+\x04\x24\x20\x01\x09\x24\x02\x0a\x80\x04\xc1\x4d\x02\x12\x90\xc0\
+\xe8\x04\x6c\xff\x78\x04\x14\x00\xe3\xc5\xdc\x16\x4b\x40\x02\x12\
+\x90\x80\x04\x36\x0a\x00\x3b\x81\x04\x24\x20\x81\xe1\x09\x08\x60\
+\x44\x02\x0a\x80\x11\xa3\x6e\x9b\x25\x20\x01\x09\x48\x60\x78\x02\
+\x0a\x80\xe1\xbb\x80\x00\x24\x20\x81\xd1\x09\xd8\xfe\x31\x09\x28\
+\x00\xc6\x8c\xbb\xad\x96\x80\x04\x24\x20\x81\xc1\x09\x28\x00\x06\
+\xef\x00\x36\x5f\x02\x12\x18\x9d\x80\xed\x1f\x95\x80\x02\x60\xd4\
+\xc8\xdb\x6e\x09\x48\x40\x02\x12\x18\x9a\x80\x02\x60\xe8\xf0\xdb\
+\x78\x09\x48\x60\x74\x02\xb6\x7f\x5c\x02\x0a\x80\x71\x63\x6f\xcb\
+\x25\x20\x01\x09\x48\x60\x60\x02\x0a\x80\x81\x83\x6f\xd3\x25\x20\
+\x81\xd1\x09\xd8\xfe\x91\x09\x28\x00\x46\x8e\xbe\x6d\x97\x80\x04\
+\x24\x20\x81\x61\x09\x28\x00\x86\x0d\xbd\x0d\x97\x80\x04\x46\x27\
+\x60\xfb\xc7\x26\xf0\xff\x01\x00\x00\xff\xff\x8b\x0b\x1f\x39\x00\
+\x00\x00\x06\x49\x44\x41\x54\x03\x00\x42\x35\x46\x0f\x93\x43\x29\
+\xb1\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0d\
+\x00\x6a\x9e\x87\
+\x00\x46\
+\x00\x69\x00\x62\x00\x6f\x00\x6e\x00\x61\x00\x63\x00\x63\x00\x69\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x02\x59\x26\x67\
+\x00\x42\
+\x00\x75\x00\x62\x00\x62\x00\x6c\x00\x65\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x07\x74\x57\xe7\
+\x00\x52\
+\x00\x53\x00\x41\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x07\x8a\x3b\x67\
+\x00\x46\
+\x00\x61\x00\x63\x00\x74\x00\x6f\x00\x72\x00\x69\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x07\x98\x57\x87\
+\x00\x61\
+\x00\x63\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x08\x41\x05\x47\
+\x00\x62\
+\x00\x69\x00\x6e\x00\x6f\x00\x63\x00\x75\x00\x6c\x00\x61\x00\x72\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x08\xd8\xf0\xc7\
+\x00\x4d\
+\x00\x65\x00\x72\x00\x67\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0a\xb4\x54\xa7\
+\x00\x53\
+\x00\x74\x00\x61\x00\x74\x00\x69\x00\x73\x00\x74\x00\x69\x00\x63\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x0f\xe4\x23\x67\
+\x00\x53\
+\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x3f\xa6\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xa5\xf8\
+\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x26\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x01\x40\x93\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x01\x8c\x9d\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x02\x5a\x14\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x02\xa2\xd4\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x02\xd5\xc3\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x3f\xa6\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xa5\xf8\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x26\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x01\x40\x93\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x01\x8c\x9d\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x02\x5a\x14\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x02\xa2\xd4\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x02\xd5\xc3\
+\x00\x00\x01\x9b\xd1\xff\xfc\x08\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -14,12 +14,12 @@ This class acts as the *coordinator* between:
 
 # GUI/main_window.py
 import sys
-from time import perf_counter
+from time import perf_counter_ns
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QTimer, pyqtSlot
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget,
-    QHBoxLayout, QLabel, QStackedWidget
+    QHBoxLayout, QStackedWidget
 )
 
 # Backend / Facade that executes algorithms
@@ -29,6 +29,8 @@ from PyQt5.QtWidgets import (
 from design_patterns import AlgorithmManager
 from GUI.UI.side_panel import SidePanel
 from GUI.UI.right_panel import PerformancePanel
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
 
 # Middle panels (algorithm-specific UIs)
 from GUI.UI.Bubble import BubbleSortMiddlePanel
@@ -40,6 +42,38 @@ from GUI.UI.middle_ui_sta import StatisticsMiddlePanel
 from GUI.UI.middle_ui_RSA import RSAMiddlePanel
 
 
+# ALGORITHM INFO (RIGHT PANEL)
+
+# Big-O text shown on the right panel for each algorithm
+_ALGO_BIG_O = {
+    "RSA": "Varies (key-size dependent)",
+    "Fibonacci": "O(log n)",
+    "Factorial": "O(n)",
+    "BubbleSort": "O(n²)",
+    "SelectionSort": "O(n²)",
+    "MergeSort": "O(n log n)",
+    "ShuffleDeck": "O(n)",
+    "SearchStats": "O(n log n)",
+    "PalindromeDP": "O(n) to count; output-bound to list",
+}
+
+# Description shown under the Big-O text
+_ALGO_DESC = {
+    "RSA": "Public-key encryption/decryption..It uses two keys: one to encrypt data and another to decrypt it, making secure communication possible.",
+    "Fibonacci": "The Fibonacci algorithm builds a sequence where each number is the sum of the two before it.eg..0, 1, 1, 2, 3, 5, 8, ....",
+    "Factorial": "Multiplies a number by all positive integers below it..eg..5! = 5 × 4 × 3 × 2 × 1 = 120",
+    "BubbleSort": (
+        "Bubble Sort repeatedly compares neighboring values and swaps them if they are in the wrong order."
+        "Larger values slowly “bubble” to the end of the list."
+    ),
+    "SelectionSort": "Selection Sort repeatedly selects the smallest value from the unsorted part of the list and moves it to the front..",
+    "MergeSort": "Merge Sort divides the list into smaller parts, sorts them, and then merges them back together.",
+    "ShuffleDeck": "This algorithm randomly rearranges a deck of cards so that every order is equally likely.",
+    "SearchStats": "This algorithm calculates basic statistical values such as minimum, maximum median, and averages from a dataset.",
+    "PalindromeDP": "This algorithm finds all substrings that read the same forwards and backwards..eg..level.",
+}
+
+
 class MainUI(QMainWindow):
     """
     Main application window.
@@ -59,8 +93,13 @@ class MainUI(QMainWindow):
         self.setWindowTitle("AlgoLab")
         self.resize(1100, 650)
 
+        # One stylesheet for every panel, parsed once
+        install_global_styles(QApplication.instance())
+
         # Facade: central backend controller for algorithms
-        self.manager = AlgorithmManager()
+        # (created on first use, see the manager property)
+        self._manager = None
+        self._algo_key = None
 
         # ROOT LAYOUT
 
@@ -92,122 +131,87 @@ class MainUI(QMainWindow):
         self.right_panel = PerformancePanel()
         root_layout.addWidget(self.right_panel)
 
-        # CREATE ALGORITHM PAGES
-
-        self.page_factorial = FactorialMiddlePanel()
-        self.page_fibonacci = FibonacciMiddlePanel()
-        self.page_rsa = RSAMiddlePanel()
-        self.page_shuffle = ShuffleCardsMiddlePanel()
-        self.page_stats = StatisticsMiddlePanel()
-        self.page_palindrome = PalindromeSubstringMiddlePanel()
-        self.page_sorting = BubbleSortMiddlePanel()
-
-        # Add all pages to the stacked widget
-        for page in (
-            self.page_factorial,
-            self.page_fibonacci,
-            self.page_rsa,
-            self.page_shuffle,
-            self.page_stats,
-            self.page_palindrome,
-            self.page_sorting,
-        ):
-            self.stack.addWidget(page)
-
-        # ALGORITHM → PAGE MAP
-
-        # Maps algorithm names to the UI page that should be shown
-        self.pages = {
-            "Factorial": self.page_factorial,
-            "Fibonacci": self.page_fibonacci,
-            "RSA": self.page_rsa,
-            "ShuffleDeck": self.page_shuffle,
-            "SearchStats": self.page_stats,
-            "PalindromeDP": self.page_palindrome,
+        # ALGORITHM → PAGE FACTORY
+
+        # Maps algorithm names to the panel class that shows them.
+        # Pages are only created the first time they are selected.
+        self._page_factories = {
+            "Factorial": FactorialMiddlePanel,
+            "Fibonacci": FibonacciMiddlePanel,
+            "RSA": RSAMiddlePanel,
+            "ShuffleDeck": ShuffleCardsMiddlePanel,
+            "SearchStats": StatisticsMiddlePanel,
+            "PalindromeDP": PalindromeSubstringMiddlePanel,
 
             # All sorting algorithms share the same UI
-            "BubbleSort": self.page_sorting,
-            "SelectionSort": self.page_sorting,
-            "MergeSort": self.page_sorting,
+            "BubbleSort": BubbleSortMiddlePanel,
+            "SelectionSort": BubbleSortMiddlePanel,
+            "MergeSort": BubbleSortMiddlePanel,
         }
 
-        # ALGORITHM INFO (RIGHT PANEL)
-        # Text shown when an algorithm is selected
-        self.algo_info = {
-            "RSA": (
-                "Varies (key-size dependent)",
-                "Public-key encryption/decryption..It uses two keys: one to encrypt data and another to decrypt it, making secure communication possible.",
-
-
-            ),
-            "Fibonacci": (
-                "O(n)",
-                "The Fibonacci algorithm builds a sequence where each number is the sum of the two before it.eg..0, 1, 1, 2, 3, 5, 8, ....",
-
-
-            ),
-            "Factorial": (
-                "O(n)",
-                "Multiplies a number by all positive integers below it..eg..5! = 5 × 4 × 3 × 2 × 1 = 120",
-
-            ),
-            "BubbleSort": (
-                "O(n²)",
-                "Bubble Sort repeatedly compares neighboring values and swaps them if they are in the wrong order."
-                "Larger values slowly “bubble” to the end of the list.",
-
-
-            ),
-            "SelectionSort": (
-                "O(n²)",
-                "Selection Sort repeatedly selects the smallest value from the unsorted part of the list and moves it to the front..",
-
-            ),
-            "MergeSort": (
-                "O(n log n)",
-                "Merge Sort divides the list into smaller parts, sorts them, and then merges them back together.",
-
-            ),
-            "ShuffleDeck": (
-                "O(n)",
-                "This algorithm randomly rearranges a deck of cards so that every order is equally likely.",
-
-            ),
-            "SearchStats": (
-                "O(n log n)",
-                "This algorithm calculates basic statistical values such as minimum, maximum median, and averages from a dataset.",
-
-            ),
-            "PalindromeDP": (
-                "O(n²)",
-                "This algorithm finds all substrings that read the same forwards and backwards..eg..level.",
-
-            ),
-        }
+        # Pages created so far, keyed by panel class
+        # (so the three sorting algorithms share one page)
+        self._page_instances = {}
 
         # Listen for user selecting an algorithm
         self.side_panel.algorithmSelected.connect(self.on_algorithm_selected)
         self.on_algorithm_selected("RSA")
 
+    @property
+    def manager(self):
+        """
+        The AlgorithmManager facade.
+
+        It is only built the first time it is needed (the first RUN click),
+        and is then told which algorithm is currently selected.
+        """
+        if self._manager is None:
+            self._manager = AlgorithmManager()
+            if self._algo_key is not None:
+                self._manager.setAlgorithm(self._algo_key)
+        return self._manager
+
     # HELPER METHODS
 
+    def _get_panel(self, algo_key):
+        """
+        Returns the middle page for an algorithm, or None if the key is unknown.
+
+        Pages are built the first time they are asked for, added to the
+        stack and cached by panel class (so the three sorting algorithms
+        share one page).
+        """
+        factory = self._page_factories.get(algo_key)
+        if factory is None:
+            return None
+
+        page = self._page_instances.get(factory)
+        if page is None:
+            # Hold off repaints while the new page is built and added,
+            # so the stack lays out once instead of per child widget
+            self.stack.setUpdatesEnabled(False)
+            try:
+                page = self._page_instances[factory] = factory()
+                # Connect the run button once, when the page is created
+                page.runClicked.connect(self.on_run_clicked)
+                self.stack.addWidget(page)
+            finally:
+                self.stack.setUpdatesEnabled(True)
+        return page
 
     def _clear_current_page(self):
         """Clears input and output fields on the current page."""
         page = self.stack.currentWidget()
 
-        # Clear input widgets
-        for attr in ("input_list", "message_in", "input_text"):
-            if hasattr(page, attr):
-                getattr(page, attr).clear()
+        # Each panel lists the widgets it wants cleared
+        for attr in getattr(page, "CLEARABLE", ()):
+            getattr(page, attr).clear()
 
-        # Clear output widgets
-        for attr in (
-            "output", "output_box", "result_output",
-            "total_output", "found_output"
-        ):
-            if hasattr(page, attr):
-                getattr(page, attr).clear()
+        # A panel with state of its own (e.g. a pending timer) can also
+        # define clear() to reset it
+        clear = getattr(page, "clear", None)
+        if clear is not None:
+            clear()
 
     def _reset_performance_panel(self):
         """Resets the right performance panel."""
@@ -218,88 +222,81 @@ class MainUI(QMainWindow):
 
     # EVENT HANDLERS
 
+    @pyqtSlot(str)
     def on_algorithm_selected(self, algo_key):
         """
         Called when the user selects an algorithm
         from the side panel.
         """
 
+        # Keys arrive as new str objects from the Qt signal. The dict keys
+        # below are literals (already interned), so interning here lets the
+        # lookups that follow match by identity.
+        algo_key = sys.intern(algo_key)
+
         # Tell backend which algorithm is selected
-        self.manager.setAlgorithm(algo_key)
+        # (if it exists yet; otherwise the manager property does it)
+        self._algo_key = algo_key
+        if self._manager is not None:
+            self._manager.setAlgorithm(algo_key)
 
-        # Switch to correct middle page
-        page = self.pages.get(algo_key)
+        # Switch to correct middle page, creating it on first use
+        page = self._get_panel(algo_key)
         if page:
             self.stack.setCurrentWidget(page)
 
+        # Cache the page's accessors so RUN clicks don't look them up again
+        self._current_get_input = getattr(page, "get_input", None)
+        self._current_get_options = getattr(page, "get_options", None)
+        self._current_display_result = getattr(page, "display_result", None)
+
         # Clear previous data
         self._clear_current_page()
         self._reset_performance_panel()
 
-        # Connect run button once (shared pages supported)
-        for page in set(self.pages.values()):
-            if hasattr(page, "runClicked"):
-                page.runClicked.connect(self.on_run_clicked)
+        # Let the algorithm prepare for its first run (RSA fills its prime
+        # pool) once the event loop is free, so the page switch is not held up
+        QTimer.singleShot(0, lambda: AlgorithmManager.prewarm(algo_key))
 
         # Special handling for sorting modes
         if algo_key in ("BubbleSort", "SelectionSort", "MergeSort"):
-            page = self.pages.get(algo_key)
             if page and hasattr(page, "set_sort_mode"):
                 page.set_sort_mode(algo_key)
 
         # Update right panel info
-        info = self.algo_info.get(algo_key)
-        if info:
-            name, desc,  = info
-            self.right_panel.set_algorithm(name, desc)
-        else:
-            self.right_panel.set_algorithm(algo_key, "")
+        # (unknown keys just show their own name)
+        big_o = _ALGO_BIG_O.get(algo_key, algo_key)
+        desc = _ALGO_DESC.get(algo_key, "")
+        self.right_panel.set_algorithm(big_o, desc)
 
+    @pyqtSlot()
     def on_run_clicked(self):
         """
         Executes the selected algorithm when
         the user clicks the Run button.
         """
-        page = self.stack.currentWidget()
-
-        raw_input = page.get_input() if hasattr(page, "get_input") else ""
-        options = page.get_options() if hasattr(page, "get_options") else {}
-
-        output, result = self.manager.execute(raw_input, options)
-
-        # START TIMER
-        start = perf_counter()
-        # Run the algorithm (backend)
-        output, result = self.manager.execute(raw_input, options)
-
-        # ---- END TIMER ----
-        end = perf_counter()
-        elapsed_seconds = end - start
-
-        # Show timing on the right panel (format nicely)
-
-        if elapsed_seconds < 1:
-            self.right_panel.time_lbl.setText(f"Time: {elapsed_seconds * 1000:.3f} ms")
-        else:
-            self.right_panel.time_lbl.setText(f"Time: {elapsed_seconds:.4f} s")
+        # Accessors cached by on_algorithm_selected
+        get_input = self._current_get_input
+        get_options = self._current_get_options
+        display_result = self._current_display_result
 
-        # Handle different result types
+        raw_input = get_input() if get_input else ""
+        options = get_options() if get_options else {}
 
-        # Palindrome DP
-        if isinstance(output, dict) and "found" in output:
-            if hasattr(page, "set_results"):
-                page.set_results(output["found"], output["count"])
+        # Make sure the facade exists before the timer starts
+        manager = self.manager
 
-        # Statistics
-        elif isinstance(output, dict):
-            if hasattr(page, "set_results"):
-                page.set_results(output)
+        # Time only the backend call, in integer nanoseconds
+        start_ns = perf_counter_ns()
+        output, result = manager.execute(raw_input, options)
+        elapsed_ns = perf_counter_ns() - start_ns
 
-        # Simple output
-        else:
-            if hasattr(page, "set_output"):
-                page.set_output(str(output))
+        # Show timing on the right panel, always in milliseconds
+        self.right_panel.time_lbl.setText(f"Time: {elapsed_ns / 1e6:.3f} ms")
 
+        # Each page knows how to show its own result type
+        if display_result:
+            display_result(output)
 
 
 # APPLICATION ENTRY POINT
@@ -310,8 +307,7 @@ if __name__ == "__main__":
     Sets up high-DPI support and starts the event loop.
     """
 
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
     window = MainUI()
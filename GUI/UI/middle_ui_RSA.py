@@ -15,9 +15,12 @@ Responsibilities of this panel:
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-    QTextEdit, QLineEdit, QPushButton, QRadioButton, QButtonGroup
+    QTextEdit, QLineEdit, QPushButton, QCheckBox
 )
-from PyQt5.QtCore import Qt,pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
 
 class RSAMiddlePanel(QWidget):
     """
@@ -30,6 +33,9 @@ class RSAMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    CLEARABLE = ("message_in", "output")
+
     def __init__(self):
         """
         Initializes the RSA panel UI.
@@ -43,8 +49,9 @@ class RSAMiddlePanel(QWidget):
         """
         super().__init__()
 
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
+        # Shared styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("middlePanel")
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -70,7 +77,7 @@ class RSAMiddlePanel(QWidget):
         self.message_in.setFixedHeight(120)
         card_layout.addWidget(self.message_in)
 
-        # Mode selection (Encrypt / Decrypt)
+        # Mode selection: a single checkbox (unchecked = Encrypt)
         mode_row = QHBoxLayout()
         mode_row.setSpacing(12)
 
@@ -78,44 +85,16 @@ class RSAMiddlePanel(QWidget):
         mode_lbl.setFixedWidth(60)
         mode_row.addWidget(mode_lbl)
 
-        self.rb_encrypt = QRadioButton("Encrypt")
-        self.rb_decrypt = QRadioButton("Decrypt")
-
         # Default action: Encrypt
-        self.rb_encrypt.setChecked(True)
-
-        # Group ensures only one radio button can be selected
-        self.mode_group = QButtonGroup(self)
-        self.mode_group.addButton(self.rb_encrypt)
-        self.mode_group.addButton(self.rb_decrypt)
-
-        mode_row.addWidget(self.rb_encrypt)
-        mode_row.addWidget(self.rb_decrypt)
+        self.cb_decrypt = QCheckBox("Decrypt (unchecked = Encrypt)")
+        mode_row.addWidget(self.cb_decrypt)
         mode_row.addStretch(1)
         card_layout.addLayout(mode_row)
 
-        # Key usage selection (Use your own keys?)
-        keys_row = QHBoxLayout()
-        keys_row.setSpacing(12)
-
-        keys_lbl = QLabel("Use Your Own Keys?")
-        keys_lbl.setFixedWidth(160)
-        keys_row.addWidget(keys_lbl)
-
-        self.rb_keys_yes = QRadioButton("Yes")
-        self.rb_keys_no = QRadioButton("No")
-
+        # Key usage selection
         # Default: use generated keys (user does not provide keys)
-        self.rb_keys_no.setChecked(True)
-
-        self.keys_group = QButtonGroup(self)
-        self.keys_group.addButton(self.rb_keys_yes)
-        self.keys_group.addButton(self.rb_keys_no)
-
-        keys_row.addWidget(self.rb_keys_yes)
-        keys_row.addWidget(self.rb_keys_no)
-        keys_row.addStretch(1)
-        card_layout.addLayout(keys_row)
+        self.cb_user_keys = QCheckBox("Use your own keys")
+        card_layout.addWidget(self.cb_user_keys)
 
         # Key input fields (disabled by default)
         # Public key input is used for encryption: expects "e,n"
@@ -134,7 +113,7 @@ class RSAMiddlePanel(QWidget):
         self.private_key.setObjectName("lineEdit")
         card_layout.addWidget(self.private_key)
 
-        # Disable key fields unless the user selects "Yes"
+        # Disable key fields unless the user ticks "Use your own keys"
         self.public_key.setEnabled(False)
         self.private_key.setEnabled(False)
 
@@ -143,7 +122,7 @@ class RSAMiddlePanel(QWidget):
 
         self.run_btn = QPushButton("RUN")
         self.run_btn.setObjectName("runButton")
-        self.run_btn.clicked.connect(self.runClicked.emit)
+        self.run_btn.clicked.connect(self._on_run)
         self.run_btn.setCursor(Qt.PointingHandCursor)
         self.run_btn.setFixedWidth(90)
         run_row.addWidget(self.run_btn, alignment=Qt.AlignLeft)
@@ -160,20 +139,62 @@ class RSAMiddlePanel(QWidget):
         # Add the card to the root layout
         root.addWidget(card)
 
-        # Enable / disable key inputs when the user toggles "Yes"
-        self.rb_keys_yes.toggled.connect(self._toggle_keys_enabled)
+        # Enable / disable key inputs when the user toggles the checkbox
+        self.cb_user_keys.toggled.connect(self._toggle_keys_enabled)
+
+        # Parsed key tuples, reset whenever the matching field is edited
+        # (None = not parsed yet, () = text is not a valid "x,n" pair)
+        self._cached_pub = None
+        self._cached_priv = None
+        self.public_key.textChanged.connect(self._invalidate_pub_cache)
+        self.private_key.textChanged.connect(self._invalidate_priv_cache)
 
     # UI BEHAVIOUR(INTERNAL HELPERS)
+    @pyqtSlot(bool)
     def _toggle_keys_enabled(self, checked: bool):
         """
         Enables or disables the key input fields based on user choice.
 
         Parameters:
-        - checked (bool): True when "Use Your Own Keys? = Yes" is selected
+        - checked (bool): True when "Use your own keys" is ticked
         """
         self.public_key.setEnabled(checked)
         self.private_key.setEnabled(checked)
 
+    @pyqtSlot(str)
+    def _invalidate_pub_cache(self, _text):
+        """Forgets the parsed public key after the field is edited."""
+        self._cached_pub = None
+
+    @pyqtSlot(str)
+    def _invalidate_priv_cache(self, _text):
+        """Forgets the parsed private key after the field is edited."""
+        self._cached_priv = None
+
+    @staticmethod
+    def _parse_key(text):
+        """
+        Parses key text in the form "x,n" into an (x, n) tuple of ints.
+
+        Returns an empty tuple when the text is not a valid pair.
+        """
+        head, sep, tail = text.partition(",")
+        if not sep:
+            return ()
+        try:
+            # int() ignores surrounding whitespace; a second comma
+            # leaves tail unparsable, so "1,2,3" is still rejected
+            return (int(head), int(tail))
+        except ValueError:
+            return ()
+
+    @pyqtSlot()
+    def _on_run(self):
+        """
+        Slot for the button's clicked signal; forwards it as runClicked.
+        """
+        self.runClicked.emit()
+
     def get_input(self):
         """
         Returns the message entered by the user.
@@ -202,10 +223,10 @@ class RSAMiddlePanel(QWidget):
         """
 
         # Determine selected action
-        action = "encrypt" if self.rb_encrypt.isChecked() else "decrypt"
+        action = "decrypt" if self.cb_decrypt.isChecked() else "encrypt"
 
         # Check whether user wants to provide their own keys
-        use_user_keys = self.rb_keys_yes.isChecked()
+        use_user_keys = self.cb_user_keys.isChecked()
 
         # Base options dictionary
         options = {
@@ -215,28 +236,21 @@ class RSAMiddlePanel(QWidget):
         }
 
         # If user chooses to supply their own keys
+        # (parsed once per edit, not on every RUN click)
         if use_user_keys:
-            try:
-                if action == "encrypt":
-                    # Expect public key input in the form: "e,n"
-                    parts = [p.strip() for p in self.public_key.text().split(",")]
-
-                    if len(parts) == 2:
-                        e = int(parts[0])
-                        n = int(parts[1])
-                        options["public_key"] = (e, n)
-
-                else:
-                    # Expect private key input in the form: "d,n"
-                    parts = [p.strip() for p in self.private_key.text().split(",")]
-
-                    if len(parts) == 2:
-                        d = int(parts[0])
-                        n = int(parts[1])
-                        options["private_key"] = (d, n)
-
-            except Exception:
-                pass
+            if action == "encrypt":
+                # Expect public key input in the form: "e,n"
+                if self._cached_pub is None:
+                    self._cached_pub = self._parse_key(self.public_key.text())
+                if self._cached_pub:
+                    options["public_key"] = self._cached_pub
+
+            else:
+                # Expect private key input in the form: "d,n"
+                if self._cached_priv is None:
+                    self._cached_priv = self._parse_key(self.private_key.text())
+                if self._cached_priv:
+                    options["private_key"] = self._cached_priv
 
         return options
 
@@ -256,119 +270,23 @@ class RSAMiddlePanel(QWidget):
         self.output.setPlainText(str(text))
 
 
-    # UI behaviour
-
-
-    def _refresh_key_fields(self, *_):
-        """
-        Enables or disables RSA key input fields based on user selection.
-
-        This method:
-        - Checks whether the user selected Encrypt or Decrypt
-        - Checks whether the user wants to use their own keys
-        - Enables only the relevant key input fields
-        - Disables all others to prevent incorrect input
 
-        The `*_` parameter allows this method to safely receive
-        extra arguments from Qt signals.
+    def display_result(self, output):
         """
+        Shows the value returned by the algorithm.
 
-        # Determine current action
-        action = "encrypt" if self.rb_encrypt.isChecked() else "decrypt"
-
-        # Check whether user enabled custom keys
-        use = self.cb_user_keys.isChecked()
-
-        # Disable all key-related input fields by default
-        for w in (self.e_input, self.n_public_input, self.d_input, self.n_private_input):
-            w.setEnabled(False)
-
-        # If user does not want to use custom keys, stop here
-        if not use:
-            return
-
-        # Enable only the fields required for the selected action
-        if action == "encrypt":
-            # Encryption needs public key (e, n)
-            self.e_input.setEnabled(True)
-            self.n_public_input.setEnabled(True)
-        else:
-            # Decryption needs private key (d, n)
-            self.d_input.setEnabled(True)
-            self.n_private_input.setEnabled(True)
-
-    def styles(self):
+        MainUI calls this after every run, so each panel decides
+        how its own results are displayed.
         """
-        Returns the Qt Style Sheet (QSS) used to style the RSA panel.
-
-        QSS is used to keep UI styling separate from UI logic.
-        """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-
-        QLabel#hint {
-            font-weight: bold;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        /* Inputs */
-        QLineEdit#lineEdit, QTextEdit#textBox {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
-
-        QLineEdit#lineEdit:disabled {
-            background: #eeeeee;
-            color: #777777;
-        }
+        self.set_output(str(output))
 
-        /* Primary action button */
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-
-        QPushButton#runButton:hover {
-            background: #255dd0;
-            border-radius: 6px;
-        }
-
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
-        """
 
 if __name__ == "__main__":
 
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = RSAMiddlePanel()
     w.setWindowTitle("Middle Panel - RSA (UI Only)")
     w.resize(650, 520)
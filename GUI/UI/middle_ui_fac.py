@@ -11,12 +11,17 @@ application logic or algorithm module.
 """
 import sys
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QIntValidator
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QLineEdit, QPushButton
 )
 
+from design_patterns import FACTORIAL_MAX_N
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
 class FactorialMiddlePanel(QWidget):
     """
     FactorialMiddlePanel is a custom QWidget that represents the central
@@ -32,6 +37,9 @@ class FactorialMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    CLEARABLE = ("input_n", "output")
+
     def __init__(self):
         """
         Initializes the factorial calculator panel.
@@ -44,8 +52,9 @@ class FactorialMiddlePanel(QWidget):
         """
         super().__init__()
 
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
+        # Shared styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("middlePanel")
 
 
         # Root layout for the panel
@@ -68,6 +77,9 @@ class FactorialMiddlePanel(QWidget):
         # Input field
         self.input_n = QLineEdit()
         self.input_n.setObjectName("lineEdit")
+        # Only whole numbers up to the largest n the backend can display
+        # can be typed (negatives have no factorial)
+        self.input_n.setValidator(QIntValidator(0, FACTORIAL_MAX_N, self))
         self.input_n.setFixedWidth(120)
         card_layout.addWidget(self.input_n, alignment=Qt.AlignLeft)
 
@@ -75,7 +87,7 @@ class FactorialMiddlePanel(QWidget):
         run_row = QHBoxLayout()
         self.run_btn = QPushButton("CALCULATE")
         self.run_btn.setObjectName("runButton")
-        self.run_btn.clicked.connect(self.runClicked.emit)
+        self.run_btn.clicked.connect(self._on_run)
         self.run_btn.setCursor(Qt.PointingHandCursor)
         self.run_btn.setFixedWidth(120)
 
@@ -99,19 +111,40 @@ class FactorialMiddlePanel(QWidget):
         root.addWidget(card)
         root.addStretch(1)
 
+        # Parsed value of input_n, reset whenever the field is edited
+        self._cached_n = None
+        self.input_n.textChanged.connect(self._invalidate_n_cache)
+
+    @pyqtSlot(str)
+    def _invalidate_n_cache(self, _text):
+        """Forgets the parsed number after the field is edited."""
+        self._cached_n = None
+
+    @pyqtSlot()
+    def _on_run(self):
+        """
+        Slot for the button's clicked signal; forwards it as runClicked.
+        """
+        self.runClicked.emit()
+
     def get_input(self):
         """
         Returns the user input for the factorial calculation.
 
         This method:
         - Reads the number entered by the user
-        - Returns it as a string for processing by the factorial logic
-
+        - Returns it as an int (parsed once per edit, not per click)
 
+        If the field is empty, the raw text is returned instead so the
+        algorithm layer can report the error.
         """
-
-        # Get and return the input value
-        return self.input_n.text()  # or .toPlainText() depending on widget type
+        if self._cached_n is None:
+            text = self.input_n.text()
+            try:
+                self._cached_n = int(text)
+            except ValueError:
+                self._cached_n = text
+        return self._cached_n
 
     def get_options(self):
         """
@@ -141,69 +174,15 @@ class FactorialMiddlePanel(QWidget):
         # Display the factorial result
         self.output.setText(text)
 
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
 
-        Styling is kept separate from logic to improve maintainability
-        and readability.
+    def display_result(self, output):
         """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-
-        QLabel#hint {
-            font-weight: bold;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        QLineEdit#lineEdit {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
-
-        QLineEdit#lineEdit:disabled {
-            background: #eeeeee;
-            color: #777777;
-        }
-
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-
-        QPushButton#runButton:hover {
-            background: #255dd0;
-        }
-
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
+        Shows the value returned by the algorithm.
+
+        MainUI calls this after every run, so each panel decides
+        how its own results are displayed.
         """
+        self.set_output(str(output))
 
 
 if __name__ == "__main__":
@@ -211,10 +190,10 @@ if __name__ == "__main__":
     Standalone execution block for testing the factorial panel UI
     independently from the rest of the application.
     """
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = FactorialMiddlePanel()
     w.setWindowTitle("Middle Panel - Factorial (UI Only)")
     w.resize(600, 500)
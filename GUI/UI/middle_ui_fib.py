@@ -21,7 +21,10 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QLineEdit, QPushButton
 )
-from PyQt5.QtCore import Qt,pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
 
 class FibonacciMiddlePanel(QWidget):
     """
@@ -38,6 +41,9 @@ class FibonacciMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    CLEARABLE = ("input_n", "output")
+
     def __init__(self):
         """
         Initializes the Fibonacci calculator panel.
@@ -49,8 +55,9 @@ class FibonacciMiddlePanel(QWidget):
         - consistent UI styling using Qt Style Sheets (QSS)
         """
         super().__init__()
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
+        # Shared styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("middlePanel")
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -79,7 +86,7 @@ class FibonacciMiddlePanel(QWidget):
 
         self.run_btn = QPushButton("CALCULATE")
         self.run_btn.setObjectName("runButton")
-        self.run_btn.clicked.connect(self.runClicked.emit)
+        self.run_btn.clicked.connect(self._on_run)
         self.run_btn.setCursor(Qt.PointingHandCursor)
         self.run_btn.setFixedWidth(120)
         run_row.addWidget(self.run_btn, alignment=Qt.AlignLeft)
@@ -102,6 +109,13 @@ class FibonacciMiddlePanel(QWidget):
         root.addWidget(card)
         root.addStretch(1)
 
+    @pyqtSlot()
+    def _on_run(self):
+        """
+        Slot for the button's clicked signal; forwards it as runClicked.
+        """
+        self.runClicked.emit()
+
     def get_input(self):
         """
         Returns the user input for the Fibonacci calculation.
@@ -145,69 +159,15 @@ class FibonacciMiddlePanel(QWidget):
         # Display the Fibonacci result
         self.output.setText(text)
 
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
 
-        Styling is kept separate from logic to improve maintainability
-        and readability.
+    def display_result(self, output):
         """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-    
-        QLabel#hint {
-            font-weight: bold;
-        }
-    
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
-    
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-    
-        QLineEdit#lineEdit {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
-    
-        QLineEdit#lineEdit:disabled {
-            background: #eeeeee;
-            color: #777777;
-        }
-    
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-    
-        QPushButton#runButton:hover {
-            background: #255dd0;
-        }
-    
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
+        Shows the value returned by the algorithm.
+
+        MainUI calls this after every run, so each panel decides
+        how its own results are displayed.
         """
+        self.set_output(str(output))
 
 
 if __name__ == "__main__":
@@ -215,10 +175,10 @@ if __name__ == "__main__":
     Standalone execution block for testing the Fibonacci panel UI
     independently from the rest of the application.
     """
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = FibonacciMiddlePanel()
     w.setWindowTitle("Middle Panel - Fibonacci (UI Only)")
     w.resize(600, 500)
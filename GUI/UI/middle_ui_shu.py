@@ -14,9 +14,17 @@ The panel allows the user to:
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QGroupBox, QPushButton, QComboBox, QTextEdit
+    QGroupBox, QPushButton, QComboBox, QPlainTextEdit
 )
-from PyQt5.QtCore import Qt,pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
+# Deck types offered in the combo box (shuffle_deck only builds the
+# standard deck for now)
+_DECK_ITEMS = ("standard 52 cards",)
+
 
 class ShuffleCardsMiddlePanel(QWidget):
     """
@@ -29,6 +37,10 @@ class ShuffleCardsMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    # (the output is cleared by clear(), which also drops a pending update)
+    CLEARABLE = ()
+
     def __init__(self):
         """
         Initializes the Shuffle Cards panel.
@@ -42,8 +54,13 @@ class ShuffleCardsMiddlePanel(QWidget):
         """
         super().__init__()
 
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
+        # Shared styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("middlePanel")
+
+        # Repaints are held off while the children are added, so the
+        # panel is laid out once instead of after every addWidget
+        self.setUpdatesEnabled(False)
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -69,11 +86,8 @@ class ShuffleCardsMiddlePanel(QWidget):
         self.deck_combo.setObjectName("comboBox")
         self.deck_combo.setFixedWidth(220)
 
-        # Example deck options
-        self.deck_combo.addItems([
-            "standard 52 cards",
-
-        ])
+        # Deck options
+        self.deck_combo.addItems(_DECK_ITEMS)
 
         combo_row.addWidget(self.deck_combo, alignment=Qt.AlignLeft)
         combo_row.addStretch(1)
@@ -86,7 +100,7 @@ class ShuffleCardsMiddlePanel(QWidget):
 
         self.shuffle_btn = QPushButton("SHUFFLE CARDS")
         self.shuffle_btn.setObjectName("runButton")
-        self.shuffle_btn.clicked.connect(self.runClicked.emit)
+        self.shuffle_btn.clicked.connect(self._on_run)
         self.shuffle_btn.setCursor(Qt.PointingHandCursor)
         self.shuffle_btn.setFixedWidth(160)
 
@@ -102,9 +116,12 @@ class ShuffleCardsMiddlePanel(QWidget):
         card_layout.addWidget(out_lbl)
 
         # Read-only text area for displaying shuffled cards
-        self.output = QTextEdit()
+        # Plain text only, so QPlainTextEdit skips the rich-text layout work
+        self.output = QPlainTextEdit()
         self.output.setObjectName("textBox")
         self.output.setReadOnly(True)
+        # Caps the line count so an accidental large dump stays cheap to lay out
+        self.output.setMaximumBlockCount(200)
         self.output.setFixedHeight(180)
         self.output.setPlaceholderText("[♠10, ♣3, ♥8, ♦2, ...]")
         card_layout.addWidget(self.output)
@@ -113,6 +130,23 @@ class ShuffleCardsMiddlePanel(QWidget):
         root.addWidget(card)
         root.addStretch(1)
 
+        # Output updates are coalesced: a burst of set_output calls within
+        # 50 ms is shown with a single text update/repaint
+        self._pending_output = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_output)
+
+        self.setUpdatesEnabled(True)
+
+    @pyqtSlot()
+    def _on_run(self):
+        """
+        Slot for the button's clicked signal; forwards it as runClicked.
+        """
+        self.runClicked.emit()
+
     def get_input(self):
         """
         Returns user input for the Shuffle Deck algorithm.
@@ -148,88 +182,55 @@ class ShuffleCardsMiddlePanel(QWidget):
         - text (str): A string representing the shuffled card order
 
         This method:
-        - Updates the output display area
-        - Supports QTextEdit or QLineEdit depending on the UI design
-        """
-
-        # Display the shuffled deck in the output area
-        self.output.setPlainText(text)  # Use setText() if QLineEdit is used
-
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
-
-        Styling is kept separate from application logic to improve
-        readability and maintainability.
-        """
-        return """
-        QWidget {
-            background: #ffffff;
-            font-family: Segoe UI;
-            font-size: 14px;
-        }
-
-        QLabel#hint {
-            font-weight: bold;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        QLineEdit#lineEdit, QTextEdit#textBox {
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-        }
-
-        QComboBox#comboBox {
-            background: #ffffff;
-            border: 1px solid #f7f7f7;
-            border-radius: 6px;
-            padding: 6px 10px;
-        }
-
-        QComboBox#comboBox::drop-down {
-            border: none;
-            width: 26px;
-        }
-
-        QPushButton#runButton {
-            text-align: center;
-            padding: 6px 12px;
-            border: none;
-            border-radius: 6px;
-            background: #2f6fed;
-            color: white;
-            font-weight: bold;
-        }
-
-        QPushButton#runButton:hover {
-            background: #255dd0;
-        }
-
-        QPushButton#runButton:pressed {
-            background: #1f4fb3;
-        }
+        - Stores the latest text
+        - Schedules the output area to be updated (at most every 50 ms)
+        """
+
+        # Only the newest text is kept; the timer shows it
+        self._pending_output = text
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_output(self):
+        """
+        Displays the most recent text passed to set_output.
+
+        The existing document is cleared and refilled instead of being
+        replaced, so its block pool and layout are reused between shuffles.
+        """
+        if self._pending_output is None:
+            return
+        self.output.clear()
+        self.output.appendPlainText(self._pending_output)
+        self._pending_output = None
+
+    def clear(self):
+        """
+        Empties the output and cancels any update still waiting on the
+        timer, so a shuffle just before a clear is not written back.
+
+        MainUI calls this when the page is selected.
         """
+        self._flush_timer.stop()
+        self._pending_output = None
+        self.output.clear()
+
+    def display_result(self, output):
+        """
+        Shows the value returned by the algorithm.
+
+        MainUI calls this after every run, so each panel decides
+        how its own results are displayed.
+        """
+        self.set_output(str(output))
+
+
 if __name__ == "__main__":
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = ShuffleCardsMiddlePanel()
     w.setWindowTitle("Middle Panel - Shuffle Cards (UI Only)")
     w.resize(700, 520)
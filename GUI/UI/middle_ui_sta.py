@@ -19,7 +19,10 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QGroupBox, QLineEdit, QPushButton, QRadioButton, QButtonGroup
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
 
 
 class StatisticsMiddlePanel(QWidget):
@@ -35,6 +38,19 @@ class StatisticsMiddlePanel(QWidget):
     """
     runClicked = pyqtSignal()
 
+    # Input/output widgets MainUI clears when this page is selected
+    CLEARABLE = ("input_list", "result_output")
+
+    # (attribute name, label) for each operation radio button, in display order
+    _OPERATIONS = (
+        ("rb_max", "Largest"),
+        ("rb_min", "Smallest"),
+        ("rb_mean", "Mode"),
+        ("rb_median", "Median"),
+        ("rb_mode", "1st Quartile"),
+        ("rb_mode2", "3rd Quartile"),
+    )
+
     def __init__(self):
         """
         Initializes the statistics panel UI.
@@ -48,8 +64,13 @@ class StatisticsMiddlePanel(QWidget):
         """
         super().__init__()
 
-        # Apply QSS styling to the widget
-        self.setStyleSheet(self.styles())
+        # Shared styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("middlePanel")
+
+        # Repaints are held off while the children are added, so the
+        # panel is laid out once instead of after every addWidget
+        self.setUpdatesEnabled(False)
 
         # Root layout for the panel
         root = QVBoxLayout(self)
@@ -79,22 +100,17 @@ class StatisticsMiddlePanel(QWidget):
         card_layout.addWidget(op_lbl)
 
         # Create radio buttons for statistics operations
-        self.rb_max = QRadioButton("Largest")
-        self.rb_min = QRadioButton("Smallest")
-        self.rb_mean = QRadioButton("Mode")
-        self.rb_median = QRadioButton("Median")
-        self.rb_mode = QRadioButton("1st Quartile")
-        self.rb_mode2 = QRadioButton("3nd Quartile")
-
-        # Default selected option
-        self.rb_max.setChecked(True)
-
         # ButtonGroup ensures only one radio button is selected at a time
         self.op_group = QButtonGroup(self)
-        for rb in (self.rb_max, self.rb_min, self.rb_mean, self.rb_median, self.rb_mode, self.rb_mode2):
+        for attr, label in self._OPERATIONS:
+            rb = QRadioButton(label)
+            setattr(self, attr, rb)
             self.op_group.addButton(rb)
             card_layout.addWidget(rb)
 
+        # Default selected option
+        self.rb_max.setChecked(True)
+
         card_layout.addSpacing(12)
 
         # RUN button
@@ -102,7 +118,7 @@ class StatisticsMiddlePanel(QWidget):
 
         self.run_btn = QPushButton("RUN")
         self.run_btn.setObjectName("runButton")
-        self.run_btn.clicked.connect(self.runClicked.emit)
+        self.run_btn.clicked.connect(self._on_run)
         self.run_btn.setCursor(Qt.PointingHandCursor)
         self.run_btn.setFixedWidth(90)
         run_row.addWidget(self.run_btn, alignment=Qt.AlignLeft)
@@ -131,6 +147,8 @@ class StatisticsMiddlePanel(QWidget):
         root.addWidget(card)
         root.addStretch(1)
 
+        self.setUpdatesEnabled(True)
+
     def _format_number(self, value):
         """
         Formats a numeric value before displaying it in the UI.
@@ -151,6 +169,13 @@ class StatisticsMiddlePanel(QWidget):
         # Otherwise, return value as string
         return str(value)
 
+    @pyqtSlot()
+    def _on_run(self):
+        """
+        Slot for the button's clicked signal; forwards it as runClicked.
+        """
+        self.runClicked.emit()
+
     def get_input(self):
         """
         Returns the user input containing the list of numbers.
@@ -204,7 +229,7 @@ class StatisticsMiddlePanel(QWidget):
         elif self.rb_mean.isChecked():
             # Mode may return multiple values or None
             mode = stats["mode"]
-            value = "No mode" if mode is None else ", ".join(str(x) for x in mode)
+            value = "No mode" if mode is None else ", ".join(map(str, mode))
 
         elif self.rb_median.isChecked():
             value = stats["median"]
@@ -223,6 +248,18 @@ class StatisticsMiddlePanel(QWidget):
         # Display formatted result in the output field
         self.result_output.setText(self._format_number(value))
 
+    def display_result(self, output):
+        """
+        Shows the value returned by the statistics algorithm.
+
+        A dict is shown through set_results. Anything else is an
+        error message and is shown as-is in the result field.
+        """
+        if isinstance(output, dict):
+            self.set_results(output)
+        else:
+            self.result_output.setText(str(output))
+
     def _update_result_label(self, *_):
         """
         Updates the result label based on the currently selected radio button.
@@ -245,91 +282,11 @@ class StatisticsMiddlePanel(QWidget):
             self.result_label.setText(btn.text())
 
 
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the panel.
-
-        Styling is kept separate from logic to improve maintainability
-        and readability.
-        """
-        return """
-         QWidget {
-             background: #ffffff;
-             font-family: Segoe UI;
-             font-size: 14px;
-         }
-
-         QLabel#hint {
-             font-weight: bold;
-         }
-
-         QLabel#opTitle {
-             font-weight: bold;
-             font-size: 18px;
-             margin-top: 8px;
-         }
-
-         QGroupBox {
-             font-weight: bold;
-             margin-top: 10px;
-             padding: 10px;
-             border: 1px solid #d0d0d0;
-             border-radius: 6px;
-             background: #ffffff;
-         }
-
-         QGroupBox::title {
-             subcontrol-origin: margin;
-             left: 10px;
-             padding: 0 3px;
-         }
-
-         QLineEdit#lineEdit {
-             background: #ffffff;
-             border: 1px solid #d0d0d0;
-             border-radius: 6px;
-             padding: 8px;
-         }
-
-         QLineEdit#lineEdit:disabled {
-             background: #eeeeee;
-             color: #777777;
-         }
-
-         QRadioButton {
-             spacing: 8px;
-         }
-
-         QRadioButton::indicator {
-             width: 14px;
-             height: 14px;
-         }
-
-         QPushButton#runButton {
-             text-align: center;
-             padding: 6px 12px;
-             border: none;
-             border-radius: 6px;
-             background: #2f6fed;
-             color: white;
-             font-weight: bold;
-         }
-
-         QPushButton#runButton:hover {
-             background: #255dd0;
-         }
-
-         QPushButton#runButton:pressed {
-             background: #1f4fb3;
-         }
-         """
-
-
 if __name__ == "__main__":
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = StatisticsMiddlePanel()
     w.setWindowTitle("Middle Panel - Statistics (UI Only)")
     w.resize(720, 560)
@@ -16,11 +16,52 @@ import sys
 import os
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QGroupBox, QFrame, QApplication
+    QWidget, QVBoxLayout,
+    QLabel, QGroupBox, QFrame, QApplication, QSizePolicy
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtSvg import QSvgWidget
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
+# Directory of this file and its 'icons' folder, worked out once at import
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_ICONS_DIR = os.path.join(_BASE_DIR, "icons")
+
+# Size of the centre illustration
+_IMAGE_SIZE = QSize(170, 400)
+
+# Rendered illustrations, keyed by SVG path (shared by every panel)
+_PIXMAP_CACHE = {}
+
+
+def _svg_pixmap(path, size):
+    """
+    Renders an SVG file into a QPixmap of the given size.
+
+    The image never changes, so it is rasterised once per path instead
+    of on every paint. It is drawn at the screen's pixel ratio so it
+    stays sharp on high-DPI displays. A missing or invalid file gives
+    a transparent pixmap.
+    """
+    pm = _PIXMAP_CACHE.get(path)
+    if pm is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pm = QPixmap(size * ratio)
+        pm.setDevicePixelRatio(ratio)
+        pm.fill(Qt.transparent)
+
+        renderer = QSvgRenderer(path)
+        if renderer.isValid():
+            painter = QPainter(pm)
+            renderer.render(painter)
+            painter.end()
+
+        _PIXMAP_CACHE[path] = pm
+    return pm
+
 
 class PerformancePanel(QWidget):
     """
@@ -44,10 +85,17 @@ class PerformancePanel(QWidget):
         - custom styling using Qt Style Sheets (QSS)
         """
         super().__init__()
-        self.setFixedWidth(220)
 
-        # Apply custom QSS styling
-        self.setStyleSheet(self.styles())
+        # Styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("performancePanel")
+
+        # Repaints are held off while the children are added, and the
+        # fixed width is set once up front (before any child exists), so
+        # the panel is laid out once instead of after every addWidget
+        self.setUpdatesEnabled(False)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
+        self.setFixedWidth(220)
 
         # Root vertical layout for the panel
         root = QVBoxLayout(self)
@@ -78,17 +126,15 @@ class PerformancePanel(QWidget):
         box.addWidget(divider)
 
         # SVG illustration
-        # Determine directory of this file
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-
         # Use provided icon directory or default to local 'icons' folder
-        icons_dir = icons_dir or os.path.join(base_dir, "icons")
+        icons_dir = icons_dir or _ICONS_DIR
 
         # Load SVG image used as a visual placeholder
         svg_path = os.path.join(icons_dir, "apps3.svg")
 
-        self.center_image = QSvgWidget(svg_path)
-        self.center_image.setFixedSize(170, 400)
+        self.center_image = QLabel()
+        self.center_image.setPixmap(_svg_pixmap(svg_path, _IMAGE_SIZE))
+        self.center_image.setFixedSize(_IMAGE_SIZE)
         box.addWidget(self.center_image, alignment=Qt.AlignLeft)
 
         # Description section
@@ -106,80 +152,24 @@ class PerformancePanel(QWidget):
         # Add the card to the root layout
         root.addWidget(card)
 
+        self.setUpdatesEnabled(True)
+
     def set_algorithm(self, name, description):
-        self.algorithm_lbl.setText(f"Big O: {name}")
-        self.desc_lbl.setText(description)
-        self.time_lbl.setText("Time: —")
-
-    def styles(self):
-        return """
-        QWidget {
-
-            font-family: Segoe UI;
-            font-size: 14px;
-            color: #111;
-        }
-
-        QGroupBox#perfCard {
-            background: #FFFDE1;
-            border: 1px solid #dcdcdc;
-            border-radius: 8px;
-            font-weight: 700;
-        }
-
-        QGroupBox#perfCard::title {
-            subcontrol-origin: margin;
-            left: 12px;
-            top: 8px;
-            padding: 0 6px;
-            font-size: 12px;
-            letter-spacing: 2px;
-            color: white;
-        }
-
-        QLabel#perfMeta {
-            font-size: 13px;
-            font-weight: 600;
-        }
-
-        QFrame#divider {
-
-            color: #e1e3e8;
-            max-height: 1px;
-        }
-
-        QLabel#chip {
-            font-size: 12px;
-            font-weight: 600;
-            background: #f5f6f8;
-            border: 1px solid #e1e3e8;
-            border-radius: 999px;
-            padding: 4px 10px;
-        }
-
-        QLabel#descHeader {
-            font-size: 13px;
-            font-weight: 800;
-            margin-top: 6px;
-        }
-
-        QLabel#descBody {
-            font-size: 13px;
-            font-weight: 400;
-            color: #333;
-            line-height: 1.25;
-        }
-         QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            background: #ffffff;
-        }
         """
+        Shows the Big-O text and description of the selected algorithm
+        and resets the time label.
 
-
+        The three labels are updated with painting paused on their card,
+        so they are repainted together once.
+        """
+        card = self.algorithm_lbl.parentWidget()
+        card.setUpdatesEnabled(False)
+        try:
+            self.algorithm_lbl.setText(f"Big O: {name}")
+            self.desc_lbl.setText(description)
+            self.time_lbl.setText("Time: —")
+        finally:
+            card.setUpdatesEnabled(True)
 
 
 if __name__ == "__main__":
@@ -187,10 +177,10 @@ if __name__ == "__main__":
     Standalone execution block for testing the PerformancePanel widget
     independently from the rest of the application.
     """
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     panel = PerformancePanel()
     panel.show()
     sys.exit(app.exec_())
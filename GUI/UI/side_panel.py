@@ -6,12 +6,77 @@ different algorithm demonstrations (e.g., sorting, recursion, encryption).
 """
 import os
 import sys
-from PyQt5.QtGui import QIcon, QFont, QFontDatabase
+from PyQt5.QtGui import QIcon, QFont, QFontDatabase, QCursor, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QScrollArea, QGroupBox,
-    QPushButton, QApplication
+    QWidget, QVBoxLayout, QLabel, QScrollArea,
+    QPushButton, QApplication, QFrame, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QSize, pyqtSignal
+from PyQt5.QtCore import Qt, QSize, QMargins, QTimer, pyqtSignal
+
+from GUI.UI._common import _enable_hidpi
+from GUI.UI._styles import install_global_styles
+
+# Registers the compiled icons under ":/icons/..." (built from icons.qrc
+# with: pyrcc5 icons.qrc -o icons_rc.py)
+from GUI.UI import icons_rc  # noqa: F401
+
+# Directory of this file, worked out once at import (used for the title font)
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# QIcons already built, keyed by icon file name (shared by every SidePanel)
+_ICON_CACHE = {}
+
+# Size of every menu icon and margins of every section, built once
+# (a QCursor or QFont cannot be made here: Qt needs the QApplication first)
+_ICON_SIZE = QSize(18, 18)
+_SECTION_MARGINS = QMargins(10, 0, 0, 0)
+
+# Title font, loaded from the fonts folder the first time it is needed
+_TITLE_FONT = None
+
+
+def _title_font():
+    """
+    Returns the QFont used for the "AlgoLab" title.
+
+    The font file is registered with Qt only once; every SidePanel then
+    shares the same QFont. If the file cannot be loaded the default
+    font is used.
+    """
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        font_path = os.path.join(_BASE_DIR, "fonts", "Pokemon Hollow.ttf")
+        font_id = QFontDatabase.addApplicationFont(font_path)
+        if font_id != -1:
+            family = QFontDatabase.applicationFontFamilies(font_id)[0]
+            _TITLE_FONT = QFont(family)
+        else:
+            _TITLE_FONT = QFont()  # fallback
+    return _TITLE_FONT
+
+
+def _menu_icon(icon):
+    """
+    Returns the QIcon for a menu icon file, building it on first use.
+
+    The PNGs are large (512 px), so each one is decoded once, scaled
+    down to the menu icon size (at the screen's pixel ratio) and kept in
+    QPixmapCache; the QIcon made from it is kept in _ICON_CACHE.
+    """
+    ic = _ICON_CACHE.get(icon)
+    if ic is None:
+        path = f":/icons/{icon}"
+        pm = QPixmapCache.find(path)
+        if pm is None:
+            ratio = QApplication.instance().devicePixelRatio()
+            pm = QPixmap(path).scaled(
+                _ICON_SIZE * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            pm.setDevicePixelRatio(ratio)
+            QPixmapCache.insert(path, pm)
+        ic = _ICON_CACHE[icon] = QIcon(pm)
+    return ic
+
 
 class SidePanel(QWidget):
     """
@@ -35,14 +100,17 @@ class SidePanel(QWidget):
         - algorithm sections and buttons
         """
         super().__init__()
-        self.setFixedWidth(200)
-        # Apply custom styles (QSS)
-        self.setStyleSheet(self.styles())
 
-        # Determine the directory containing this file
-        # Used to load icon resources
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.icons_dir = os.path.join(base_dir, "icons")
+        # Styling comes from the app-level stylesheet
+        # (see _styles.py), scoped by this object name
+        self.setObjectName("sidePanel")
+
+        # Repaints are held off while the children are added, and the
+        # fixed width is set once up front (before any child exists), so
+        # the panel is laid out once instead of after every addWidget
+        self.setUpdatesEnabled(False)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
+        self.setFixedWidth(200)
 
         # Main layout for the side panel
         main_layout = QVBoxLayout(self)
@@ -53,23 +121,16 @@ class SidePanel(QWidget):
         container_layout = QVBoxLayout(container)
         container_layout.setAlignment(Qt.AlignTop)
 
-         # load font
-        font_path = os.path.join(base_dir, "fonts", "Pokemon Hollow.ttf")
-        print("FONT PATH:", font_path, "Exists?", os.path.exists(font_path))
+        # One hand cursor shared by all menu buttons
+        self._hand = QCursor(Qt.PointingHandCursor)
 
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            title_font = QFont(family)
-        else:
-            print("Failed to load font, using default.")
-            title_font = QFont()  # fallback
+        # (button, icon file) pairs whose icons are set after the first show
+        self._pending_icons = []
 
         # Application title
         title = QLabel("AlgoLab")
         title.setObjectName("title")
-        title.setFont(QFont(family))
-        print("Loaded font family:", family)
+        title.setFont(_title_font())
 
         # title.setStyleSheet("font-family: Pokemon Solid, Segoe UI;")
         container_layout.addWidget(title)
@@ -108,8 +169,38 @@ class SidePanel(QWidget):
         # close.setObjectName("algoButton1")
         # container_layout.addWidget(close)
 
-        # Add the container widget to the main layout
-        main_layout.addWidget(container)
+        # Put the container in a scroll area so the menu can grow past
+        # the window height; only the visible part is painted
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.NoFrame)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setWidget(container)
+        main_layout.addWidget(scroll)
+
+        self.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        """
+        Schedules the menu icons to be loaded once the panel is on screen.
+
+        The text-only menu paints first; the icons are decoded on the
+        next pass of the event loop.
+        """
+        super().showEvent(event)
+        if self._pending_icons:
+            QTimer.singleShot(0, self._load_icons)
+
+    def _load_icons(self):
+        """
+        Sets the icons of the buttons built by section().
+
+        Icons are compiled into icons_rc, so no disk lookup is needed;
+        each one is only decoded and turned into a QIcon once.
+        """
+        pending, self._pending_icons = self._pending_icons, []
+        for btn, icon in pending:
+            btn.setIcon(_menu_icon(icon))
 
     def _on_algo_clicked(self):
         """
@@ -127,9 +218,9 @@ class SidePanel(QWidget):
         # Get the button that triggered this function
         btn = self.sender()
 
-        # Retrieve the custom property stored in the button
-        # (e.g. "rsa", "fibonacci", "bubble_sort")
-        algo_key = btn.property("algo_key")
+        # Retrieve the algorithm key stored on the button
+        # (e.g. "RSA", "Fibonacci", "BubbleSort")
+        algo_key = getattr(btn, "algo_key", None)
 
         # If a valid algorithm key exists
         if algo_key:
@@ -146,101 +237,42 @@ class SidePanel(QWidget):
           (display_text, algorithm_key, icon_filename).
 
         Returns:
-        - QGroupBox: A group box containing styled algorithm buttons.
+        - QWidget: A plain widget with a bold header label followed by
+          the styled algorithm buttons.
         """
 
-        box = QGroupBox(title)
-        layout = QVBoxLayout()
+        # A plain QWidget with a header label looks the same in this flat
+        # menu as a QGroupBox, without the group box title/frame subcontrols
+        box = QWidget()
+        layout = QVBoxLayout(box)
 
         # Reduce spacing for a compact vertical menu
         layout.setSpacing(0)
-        layout.setContentsMargins(10, 0, 0, 0)
+        layout.setContentsMargins(_SECTION_MARGINS)
+
+        hdr = QLabel(title)
+        hdr.setObjectName("sectionHdr")
+        layout.addWidget(hdr)
 
         for text, algo_key, icon in items:
             btn = QPushButton(text)
             btn.setObjectName("algoButton")
-            btn.setCursor(Qt.PointingHandCursor)
+            btn.setCursor(self._hand)
 
-            # Store algorithm identifier in button properties
-            btn.setProperty("algo_key", algo_key)
+            # Store algorithm identifier as a plain attribute
+            # (a Qt property would go through QVariant and QSS re-polish)
+            btn.algo_key = algo_key
             btn.clicked.connect(self._on_algo_clicked)
 
-            # Load icon if it exists
-            icon_path = os.path.join(self.icons_dir, icon)
-            # print("ICON CHECK:", icon, "=>", icon_path, "exists?", os.path.exists(icon_path))
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
-                btn.setIconSize(QSize(18, 18))
+            # The icon itself is set after the panel is first shown
+            # (see showEvent); the size is reserved now so the layout
+            # does not change when it arrives
+            btn.setIconSize(_ICON_SIZE)
+            self._pending_icons.append((btn, icon))
             layout.addWidget(btn)
 
-        box.setLayout(layout)
         return box
 
-    def styles(self):
-        """
-        Returns the Qt Style Sheet (QSS) used to style the SidePanel.
-
-        QSS allows separation of logic and appearance, similar to CSS
-        in web development.
-        """
-        return """
-        QWidget {
-            background: #ffffff;
-            
-            font-size: 14px;
-        }
-
-        #title {
-            color: blue;
-            font-size: 40px;
-            font-weight: bold;
-            padding: 5px 10px;
-           
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            margin-top: 10px;
-            padding: 10px;
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 3px;
-        }
-
-        QPushButton#algoButton {
-            text-align: left;
-            padding: 2px 5px;
-            border: none;
-            background: transparent;
-        }
-
-        QPushButton#algoButton:hover {
-            background: #e0e0e0;
-            border-radius: 4px;
-        }
-
-        QPushButton#algoButton:pressed {
-            background: #c8c8c8;
-        }
-
-        QPushButton#algoButton1 {
-            text-align: left;
-            padding: 2px 5px;
-            border: 1px;
-            color: blue;
-        }
-
-        QPushButton#algoButton1:pressed {
-            color: white;
-        }
-        """
-
-
 
 if __name__ == "__main__":
     """
@@ -248,12 +280,12 @@ if __name__ == "__main__":
     independently from the rest of the application.
     """
     # Enable high DPI scaling for modern displays
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
 
 
     app = QApplication(sys.argv)
+    install_global_styles(app)
     w = SidePanel()
     w.show()
     sys.exit(app.exec_())
@@ -17,33 +17,29 @@ def bubble_sort(values, descending=False):
     """
     # Create a copy of the input so the original list is not modified
     arr = list(values)
-    length = len(arr)
-
-    for i in range(length):
-        swapped = False
-        # Inner loop compares adjacent elements
-        # The last i elements are already in correct position
-        # Compare each pair of adjacent elements
-        for j in range(length - 1):
-
-            # Ascending order
-            if descending == False:
-                if arr[j] > arr[j + 1]:
-                    temp = arr[j]
-                    arr[j] = arr[j + 1]
-                    arr[j + 1] = temp
-                    swapped = True
-
-            # Descending order
-            else:
-                if arr[j] < arr[j + 1]:
-                    temp = arr[j]
-                    arr[j] = arr[j + 1]
-                    arr[j + 1] = temp
-                    swapped = True
-
-        # If no swaps happened, the list is already sorted
-        if swapped == False:
-            break
-
-    return arr
\ No newline at end of file
+
+    # Everything after the last swap of a pass is already in its final
+    # position, so the next pass only needs to go up to that point.
+    # A pass with no swaps sets the bound to 0 and ends the sort.
+    bound = len(arr)
+
+    while bound > 1:
+        last_swap = 0
+
+        # The order check is done once per pass rather than per comparison
+        if descending:
+            for j in range(1, bound):
+                # Swap if the left element is smaller than the right one
+                if arr[j - 1] < arr[j]:
+                    arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                    last_swap = j
+        else:
+            for j in range(1, bound):
+                # Swap if the left element is larger than the right one
+                if arr[j - 1] > arr[j]:
+                    arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                    last_swap = j
+
+        bound = last_swap
+
+    return arr
@@ -1,10 +1,33 @@
+def _range_product(lo, hi):
+    """
+    Returns the product lo * (lo + 1) * ... * hi using binary splitting.
+
+    The range is split in half and each half is multiplied recursively,
+    so the big multiplications are done between numbers of similar size
+    (which is much cheaper than multiplying a huge number by a small one
+    n times). The recursion depth is only about log2(n).
+    """
+    if hi - lo < 8:
+        # Small ranges are multiplied directly
+        result = lo
+        for k in range(lo + 1, hi + 1):
+            result *= k
+        return result
+
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid + 1, hi)
+
+
 def factorial(n):
     """
     Computes the factorial of a non-negative integer using recursion.
 
+    Instead of n nested calls (n * factorial(n - 1)), the product
+    1 * 2 * ... * n is split recursively in halves, so large n does not
+    hit Python's recursion limit and runs much faster.
     """
     if n < 0:
         raise ValueError("number must be positive")
     if n == 0 or n == 1:
         return 1
-    return n * factorial(n - 1)
\ No newline at end of file
+    return _range_product(2, n)
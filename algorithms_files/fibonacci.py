@@ -1,17 +1,20 @@
-
 def fibonacci(n):
-   # Computes the nth Fibonacci number using an iterative approach.
+   # Computes the nth Fibonacci number using the fast-doubling identities:
+   #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+   #   F(2k+1) = F(k)^2 + F(k+1)^2
+   # Walking the bits of n from the top, each step doubles k (and adds 1
+   # when the bit is set), so only O(log n) big multiplications are needed
+   # instead of n big additions.
    if n < 0:
        raise ValueError("n must be >= 0")
 
-   if n == 0:
-       return 0
-   if n == 1:
-       return 1
-
-   prev, curr = 0, 1
-   for _ in range(2, n + 1):
-       prev, curr = curr, prev + curr
-
-   return curr
+   a, b = 0, 1  # F(k), F(k+1), starting at k = 0
+   for bit in bin(n)[2:]:
+       c = a * ((b << 1) - a)  # F(2k)
+       d = a * a + b * b       # F(2k+1)
+       if bit == "1":
+           a, b = d, c + d     # k -> 2k + 1
+       else:
+           a, b = c, d         # k -> 2k
 
+   return a
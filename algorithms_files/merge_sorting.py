@@ -1,66 +1,86 @@
 def merge_sort(values, descending=False):
     """
-    Merge Sort (Divide & Conquer)
+    Merge Sort (Divide & Conquer), bottom-up
 
     - values: list of numbers
     - descending: if True, sort high -> low
     Returns a NEW sorted list (does not mutate original).
+
+    Instead of recursively slicing the list into halves, runs of width
+    1, 2, 4, ... are merged pairwise. Each pass merges from one list
+    into a second list of the same size and the two then swap roles, so
+    only these two lists are ever allocated.
     """
     if values is None:
         raise ValueError("values cannot be None")
 
-        # Base case: if the list has 0 or 1 element, it is already sorted
-    if len(values) <= 1:
-        return list(values)  # return a copy
+    src = list(values)  # copy, so the original is not modified
+    n = len(src)
+
+    # Base case: if the list has 0 or 1 element, it is already sorted
+    if n <= 1:
+        return src
 
-        # Split the list into two halves
-    middle = len(values) // 2
-    left_half = values[:middle]
-    right_half = values[middle:]
+    # Scratch list each pass writes into
+    dst = [None] * n
 
-    # Recursively sort both halves
-    sorted_left = merge_sort(left_half, descending)
-    sorted_right = merge_sort(right_half, descending)
+    width = 1
+    while width < n:
+        # Merge each pair of neighbouring runs src[lo:mid] and src[mid:hi]
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_into(src, lo, mid, hi, dst, descending)
 
-    # Merge the two sorted halves
-    return merge(sorted_left, sorted_right, descending)
+        # The merged pass becomes the source of the next one
+        src, dst = dst, src
+        width *= 2
 
+    return src
 
-def merge(left, right, descending):
-    merged = []  # this will hold the final sorted list
 
-    left_index = 0
-    right_index = 0
+def merge_into(src, lo, mid, hi, dst, descending):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+
+    Only index variables are used, so no new lists are created.
+    Equal elements keep their order (left run first), so the sort is stable.
+    """
+    # The runs are already in order (or the right run is empty):
+    # copy them across unchanged
+    if mid >= hi or (
+        src[mid - 1] >= src[mid] if descending else src[mid - 1] <= src[mid]
+    ):
+        dst[lo:hi] = src[lo:hi]
+        return
 
-    # Compare elements from both lists
-    while left_index < len(left) and right_index < len(right):
+    left_index = lo
+    right_index = mid
+    out = lo
 
-        # Ascending order
-        if descending == False:
-            if left[left_index] <= right[right_index]:
-                merged.append(left[left_index])
+    # Compare elements from both runs
+    # (the order check is made once, not once per comparison)
+    if descending:
+        while left_index < mid and right_index < hi:
+            if src[left_index] >= src[right_index]:
+                dst[out] = src[left_index]
                 left_index += 1
             else:
-                merged.append(right[right_index])
+                dst[out] = src[right_index]
                 right_index += 1
-
-        # Descending order
-        else:
-            if left[left_index] >= right[right_index]:
-                merged.append(left[left_index])
+            out += 1
+    else:
+        while left_index < mid and right_index < hi:
+            if src[left_index] <= src[right_index]:
+                dst[out] = src[left_index]
                 left_index += 1
             else:
-                merged.append(right[right_index])
+                dst[out] = src[right_index]
                 right_index += 1
+            out += 1
 
-    # Add remaining elements from left list (if any)
-    while left_index < len(left):
-        merged.append(left[left_index])
-        left_index += 1
-
-    # Add remaining elements from right list (if any)
-    while right_index < len(right):
-        merged.append(right[right_index])
-        right_index += 1
-
-    return merged
+    # Copy whatever is left of either run (only one of these is non-empty)
+    if left_index < mid:
+        dst[out:hi] = src[left_index:mid]
+    else:
+        dst[out:hi] = src[right_index:hi]
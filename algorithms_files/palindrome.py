@@ -1,7 +1,54 @@
+def _manacher(s):
+    """
+    Runs Manacher's algorithm on s in O(n) time.
+
+    Returns two lists of length n:
+    - odd[i]:  number of odd-length palindromes centred on s[i]
+               (the longest one is s[i-odd[i]+1 : i+odd[i]])
+    - even[i]: number of even-length palindromes centred between
+               s[i-1] and s[i] (the longest one is s[i-even[i] : i+even[i]])
+
+    Every palindrome inside the right-most palindrome found so far
+    ([left, right]) is mirrored on the other side of its centre, so each
+    centre starts from its mirror's answer instead of from zero.
+
+    ASCII text is compared as bytes: indexing bytes gives small ints,
+    which compare faster than one-character strings. (Other text is
+    left as str, since its UTF-8 bytes would not line up with the
+    character positions.)
+    """
+    if s.isascii():
+        s = s.encode("ascii")
+    n = len(s)
+
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
+
+
 def count_palindromic_substrings(s):
     """
     Counts how many substrings of s are palindromes.
-    Uses dynamic programming (DP).
+    Uses Manacher's algorithm: O(n) time and memory, instead of an
+    n x n DP table.
 
     Example:
     s = "aaa"
@@ -11,42 +58,79 @@ def count_palindromic_substrings(s):
         raise ValueError("Input text cannot be None")
 
     s = str(s)
-    n = len(s)
-    if n == 0:
+    if s == "":
         return 0
 
-    # dp[i][j] = True if s[i:j+1] is palindrome
-    dp = []
-    for i in range(n):
-        row = []
-        for j in range(n):
-            row.append(False)
-        dp.append(row)
+    # Each centre contributes one palindrome per radius
+    odd, even = _manacher(s)
+    return sum(odd) + sum(even)
 
-    count = 0
+def palindromic_spans(s):
+    """
+    Lists every palindromic substring of s as a (start, length) pair.
+
+    The palindromes are listed shortest first and, for the same length,
+    from left to right (the same order the DP table version produced).
+    Manacher's algorithm gives the palindromes around each centre, so the
+    work is O(n) plus the size of the output. No substrings are copied;
+    use materialize() to turn (some of) the pairs into strings.
+    """
+    if s is None:
+        raise ValueError("Input cannot be None")
 
-    # length 1
+    s = str(s)
+    n = len(s)
+    if n == 0:
+        return []
+
+    odd, even = _manacher(s)
+
+    # starts[length] = start indices of the palindromes of that length.
+    # Centres are visited left to right, so each list is already in order.
+    starts = [[] for _ in range(n + 1)]
     for i in range(n):
-        dp[i][i] = True
-        count += 1
+        for r in range(odd[i]):
+            starts[2 * r + 1].append(i - r)
+        for r in range(1, even[i] + 1):
+            starts[2 * r].append(i - r)
 
-    # length 2..n
-    for length in range(2, n + 1):
-        for i in range(0, n - length + 1):
-            j = i + length - 1
+    spans = []
+    for length in range(1, n + 1):
+        for i in starts[length]:
+            spans.append((i, length))
 
-            if s[i] == s[j]:
-                if length == 2:
-                    dp[i][j] = True
-                else:
-                    dp[i][j] = dp[i + 1][j - 1]
+    return spans
 
-            if dp[i][j]:
-                count += 1
 
-    return count
+def materialize(s, spans):
+    """
+    Turns (start, length) pairs from palindromic_spans() into substrings.
+    """
+    s = str(s)
+    return [s[start:start + length] for start, length in spans]
+
 
 def palindromic_substrings(s):
+    """
+    Lists every palindromic substring of s and how many there are.
+
+    Same order as palindromic_spans(); every substring is copied out,
+    so for long inputs prefer palindromic_spans() and materialize()
+    only the part that is needed.
+    """
+    spans = palindromic_spans(s)
+    return materialize(s, spans), len(spans)
+
+
+def palindromic_substrings_preview(s, k=10):
+    """
+    Returns the first k palindromic substrings of s and the total count.
+
+    The order is the same as palindromic_substrings() (shortest first,
+    then left to right), but only the k shown substrings are built: the
+    total comes from the Manacher radii, and the preview only scans as
+    many lengths as it needs.
+    """
     if s is None:
         raise ValueError("Input cannot be None")
 
@@ -55,21 +139,22 @@ def palindromic_substrings(s):
     if n == 0:
         return [], 0
 
-    dp = [[False] * n for _ in range(n)]
-    found = []
+    odd, even = _manacher(s)
+    total = sum(odd) + sum(even)
 
-    # length 1
-    for i in range(n):
-        dp[i][i] = True
-        found.append(s[i])
-
-    # length 2..n
-    for length in range(2, n + 1):
-        for i in range(0, n - length + 1):
-            j = i + length - 1
-            if s[i] == s[j]:
-                if length == 2 or dp[i + 1][j - 1]:
-                    dp[i][j] = True
-                    found.append(s[i:j+1])
-
-    return found, len(found)
\ No newline at end of file
+    preview = []
+    length = 1
+    while len(preview) < k and length <= n:
+        r = length // 2
+        if length % 2 == 1:
+            # Odd palindromes of this length are centred on s[i]
+            starts = [i - r for i in range(n) if odd[i] > r]
+        else:
+            # Even palindromes of this length are centred before s[i]
+            starts = [i - r for i in range(n) if even[i] >= r]
+
+        for i in starts[:k - len(preview)]:
+            preview.append(s[i:i + length])
+        length += 1
+
+    return preview, total
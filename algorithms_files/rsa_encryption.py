@@ -6,14 +6,22 @@ def extended_gcd(a, b):
     Extended Euclidean Algorithm.
     Finds gcd(a, b) and the coefficients x, y such that:
         ax + by = gcd(a, b)
+
+    Written as a loop (no recursion), keeping the last two remainders
+    and their coefficients; divmod gives the quotient and remainder from
+    a single division.
     """
-    if b == 0:
-        return a, 1, 0
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+
+    while r != 0:
+        q, rem = divmod(old_r, r)
+        old_r, r = r, rem
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
 
-    gcd, x1, y1 = extended_gcd(b, a % b)
-    x = y1
-    y = x1 - (a // b) * y1
-    return gcd, x, y
+    return old_r, old_x, old_y
 
 
 def modular_inverse(a, m):
@@ -28,9 +36,24 @@ def modular_inverse(a, m):
 
 # PRIME NUMBER GENERATION (MILLER–RABIN)
 
+# Miller–Rabin bases that make the test exact (no false "prime")
+# for every number below the given limit
+_DETERMINISTIC_WITNESSES = (
+    (1_373_653, (2, 3)),
+    (3_215_031_751, (2, 3, 5, 7)),
+    (3_317_044_064_679_887_385_961_981,
+     (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+)
+
+
 def is_probable_prime(number, rounds=8):
     """
     Checks if a number is probably prime
+
+    For numbers below about 3.3e24 (which covers every key size the GUI
+    uses) a fixed set of bases is used, so the answer is exact and only
+    the bases needed for that size are tried. Larger numbers use
+    `rounds` random bases.
     """
     if number < 2:
         return False
@@ -50,9 +73,21 @@ def is_probable_prime(number, rounds=8):
         d //= 2
         r += 1
 
+    # Pick the bases: the smallest fixed set that is exact for this size,
+    # otherwise random ones
+    for limit, bases in _DETERMINISTIC_WITNESSES:
+        if number < limit:
+            witnesses = bases
+            break
+    else:
+        witnesses = [random.randrange(2, number - 1) for _ in range(rounds)]
+
     # Perform Miller–Rabin rounds
-    for _ in range(rounds):
-        a = random.randrange(2, number - 1)
+    for a in witnesses:
+        # A base equal to the number itself (31 or 37) says nothing
+        if a % number == 0:
+            continue
+
         x = pow(a, d, number)
 
         if x == 1 or x == number - 1:
@@ -68,28 +103,83 @@ def is_probable_prime(number, rounds=8):
     return True
 
 
+# Primes found ahead of time, keyed by bit size: {bits: [prime, ...]}
+# Each prime is handed out once (popped), so keys never share a factor.
+_PRIME_POOL = {}
+
+# Most primes kept in the pool for one bit size
+_POOL_MAX = 32
+
+
+def _search_prime(bits):
+    """
+    Searches random odd numbers of the given size until one passes
+    the Miller–Rabin test.
+    """
+    while True:
+        candidate = random.getrandbits(bits)
+        candidate |= (1 << (bits - 1)) | 1  # ensure correct size and odd
+        if is_probable_prime(candidate):
+            return candidate
+
+
+def fill_prime_pool(bits=16, count=_POOL_MAX):
+    """
+    Tops up the prime pool for the given bit size to `count` primes.
+
+    Meant to be called ahead of time (e.g. when the RSA page is opened),
+    so later key generation can take primes straight from the pool.
+    """
+    if bits < 8:
+        raise ValueError("Bit size must be at least 8.")
+
+    pool = _PRIME_POOL.setdefault(bits, [])
+    while len(pool) < count:
+        pool.append(_search_prime(bits))
+
+
 def generate_random_prime(bits=16):
     """
     Generates a random prime number with the given number of bits.
 
+    A prime is taken from the pool when one is available; otherwise a
+    new one is searched for.
     """
     if bits < 8:
         raise ValueError("Bit size must be at least 8.")
 
-    while True:
-        candidate = random.getrandbits(bits)
-        candidate |= (1 << (bits - 1)) | 1  # ensure correct size and odd
-        if is_probable_prime(candidate):
-            return candidate
+    pool = _PRIME_POOL.get(bits)
+    if pool:
+        return pool.pop()
+    return _search_prime(bits)
 
 
 # RSA KEY GENERATION
 
 
+class _CRTPrivateKey(tuple):
+    """
+    A (d, n) private key that also remembers the values needed to
+    decrypt with the Chinese Remainder Theorem (CRT).
+
+    It is still a 2-tuple, so it unpacks, prints and validates exactly
+    like a plain (d, n) key; rsa_decrypt_message simply checks for the
+    extra `crt` attribute.
+    """
+
+    def __new__(cls, d, n, p, q):
+        key = super().__new__(cls, (d, n))
+        # (p, q, d mod (p-1), d mod (q-1), q^-1 mod p)
+        key.crt = (p, q, d % (p - 1), d % (q - 1), modular_inverse(q, p))
+        return key
+
+
 def generate_rsa_keys(bits=16):
     """
     Generates RSA public and private keys.
 
+    The private key keeps p and q as well, so decryption can use the
+    faster CRT method.
     """
     p = generate_random_prime(bits)
     q = generate_random_prime(bits)
@@ -109,7 +199,7 @@ def generate_rsa_keys(bits=16):
 
     d = modular_inverse(e, phi)
 
-    return (e, n), (d, n)
+    return (e, n), _CRTPrivateKey(d, n, p, q)
 
 
 
@@ -145,6 +235,10 @@ def rsa_encrypt_message(message, public_key):
     """
     Encrypts a text message using RSA and a public key.
     Each character is encrypted individually for simplicity.
+
+    Since every byte is encrypted on its own, a message has at most 256
+    different values to encrypt: each distinct byte is put through pow()
+    once and repeated bytes reuse that result.
     """
     validate_public_key(public_key)
     e, n = public_key
@@ -153,7 +247,8 @@ def rsa_encrypt_message(message, public_key):
         raise ValueError("Message cannot be None.")
 
     byte_data = message.encode("utf-8")
-    encrypted = [pow(byte, e, n) for byte in byte_data]
+    table = {byte: pow(byte, e, n) for byte in set(byte_data)}
+    encrypted = [table[byte] for byte in byte_data]
     return encrypted
 
 
@@ -161,6 +256,11 @@ def rsa_decrypt_message(cipher_list, private_key):
     """
     Decrypts a list of encrypted numbers back into the original text
     using the RSA private key.
+
+    Keys made by generate_rsa_keys carry p and q, so each number is
+    decrypted with the Chinese Remainder Theorem: two exponentiations
+    modulo p and q (half the size of n) instead of one modulo n.
+    Keys typed in by the user are plain (d, n) tuples and use pow(c, d, n).
     """
     validate_private_key(private_key)
     d, n = private_key
@@ -168,5 +268,17 @@ def rsa_decrypt_message(cipher_list, private_key):
     if cipher_list is None:
         raise ValueError("Cipher data cannot be None.")
 
-    decrypted_bytes = bytes([pow(int(c), d, n) for c in cipher_list])
+    crt = getattr(private_key, "crt", None)
+    if crt is None:
+        decrypted_bytes = bytes([pow(int(c), d, n) for c in cipher_list])
+    else:
+        p, q, dp, dq, q_inv = crt
+        plain = []
+        for c in cipher_list:
+            c = int(c)
+            m1 = pow(c, dp, p)
+            m2 = pow(c, dq, q)
+            # Combine the two halves: m = m2 + q * (q^-1 * (m1 - m2) mod p)
+            plain.append(m2 + q * (q_inv * (m1 - m2) % p))
+        decrypted_bytes = bytes(plain)
     return decrypted_bytes.decode("utf-8")
\ No newline at end of file
@@ -7,6 +7,8 @@ def compute_statistics(numbers):
     - Median
     - 1st Quartile (Q1)
     - 3rd Quartile (Q3)
+
+    A single value is its own median, Q1 and Q3.
     """
 
     # Check that input is valid
@@ -21,50 +23,46 @@ def compute_statistics(numbers):
     smallest = nums[0]
     largest = nums[length - 1]
 
-    # Step 3: Function to calculate median
-    def find_median(values):
-        size = len(values)
-        middle = size // 2
+    # Step 3: Function to calculate the median of nums[start:stop]
+    # (works on index ranges, so the halves are never copied)
+    def find_median(start, stop):
+        size = stop - start
+        middle = start + size // 2
 
+        if size == 0:
+            # Only happens for a single value: both halves are empty
+            return nums[0]
         if size % 2 == 1:
-            return values[middle]
+            return nums[middle]
         else:
-            return (values[middle - 1] + values[middle]) / 2
-
-    median_value = find_median(nums)
+            return (nums[middle - 1] + nums[middle]) / 2
 
-    # Step 4: Split list for quartiles
-    if length % 2 == 1:
-        lower_half = nums[:length // 2]
-        upper_half = nums[length // 2 + 1:]
-    else:
-        lower_half = nums[:length // 2]
-        upper_half = nums[length // 2:]
+    median_value = find_median(0, length)
 
-    q1 = find_median(lower_half)
-    q3 = find_median(upper_half)
+    # Step 4: Quartiles are the medians of the lower and upper halves
+    # (the middle value is left out of both when the length is odd)
+    half = length // 2
+    q1 = find_median(0, half)
+    q3 = find_median(half + length % 2, length)
 
     # Step 5: Find the mode
-    frequency = {}
-
-    for number in nums:
-        if number in frequency:
-            frequency[number] += 1
-        else:
-            frequency[number] = 1
-
+    # nums is sorted, so equal values sit next to each other: one pass
+    # over the runs finds the highest frequency and the values that have it
     highest_frequency = 0
-    for count in frequency.values():
-        if count > highest_frequency:
-            highest_frequency = count
+    mode = []
+    run_start = 0
+    for i in range(1, length + 1):
+        if i == length or nums[i] != nums[run_start]:
+            count = i - run_start
+            if count > highest_frequency:
+                highest_frequency = count
+                mode = [nums[run_start]]
+            elif count == highest_frequency:
+                mode.append(nums[run_start])
+            run_start = i
 
     if highest_frequency == 1:
         mode = None
-    else:
-        mode = []
-        for number in frequency:
-            if frequency[number] == highest_frequency:
-                mode.append(number)
 
     # Step 6: Return results
     return {
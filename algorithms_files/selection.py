@@ -19,27 +19,21 @@ def selection_sort(values, descending=False):
     arr = list(values)
     length = len(arr)
 
-    # Move through the list one position at a time
-    for i in range(length):
-
-        best_index = i  # Assume the current position is the best
+    # The inner search is done by min()/max() over the remaining indexes,
+    # so the comparisons run in C instead of a Python loop.
+    # Both return the first index on ties, like a strict < / > scan.
+    pick = max if descending else min
+    key = arr.__getitem__
 
-        # Look for a better value in the rest of the list
-        for j in range(i + 1, length):
-
-            # Ascending order
-            if descending == False:
-                if arr[j] < arr[best_index]:
-                    best_index = j
+    # Move through the list one position at a time
+    # (the last element is already in place once the rest are)
+    for i in range(length - 1):
 
-            # Descending order
-            else:
-                if arr[j] > arr[best_index]:
-                    best_index = j
+        # Find the best value in the rest of the list
+        best_index = pick(range(i, length), key=key)
 
         # Swap the found best value with the current position
-        temp = arr[i]
-        arr[i] = arr[best_index]
-        arr[best_index] = temp
+        if best_index != i:
+            arr[i], arr[best_index] = arr[best_index], arr[i]
 
-    return arr
\ No newline at end of file
+    return arr
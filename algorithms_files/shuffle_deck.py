@@ -1,22 +1,24 @@
 import random
-def shuffle_deck():
 
+_SUITS = {
+    "Hearts": "♥",
+    "Diamonds": "♦",
+    "Clubs": "♣",
+    "Spades": "♠"
+}
 
-    suits = {
-        "Hearts": "♥",
-        "Diamonds": "♦",
-        "Clubs": "♣",
-        "Spades": "♠"
-    }
+_RANKS = ["2","3","4","5","6","7","8","9","10","J","Q","K","A"]
 
-    ranks = ["2","3","4","5","6","7","8","9","10","J","Q","K","A"]
+# The ordered 52-card deck, built once at import
+_DECK = tuple(rank + symbol for symbol in _SUITS.values() for rank in _RANKS)
 
-    deck = []
 
-    for suit in suits:
-        for rank in ranks:
-            card = rank + suits[suit]
-            deck.append(card)
+def shuffle_deck():
+    """
+    Returns a new, shuffled list of the 52 cards (e.g. "A♥", "10♠").
 
+    Each call copies the prebuilt ordered deck and shuffles the copy.
+    """
+    deck = list(_DECK)
     random.shuffle(deck)
     return deck
@@ -1,5 +1,8 @@
-from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import ge, le
 import time
 from algorithms_files.factorial import factorial
 from algorithms_files.fibonacci import fibonacci
@@ -7,15 +10,122 @@ from algorithms_files.merge_sorting import merge_sort
 from algorithms_files.bubble import bubble_sort
 from algorithms_files.selection import selection_sort
 from algorithms_files.shuffle_deck import shuffle_deck
-from algorithms_files.palindrome import palindromic_substrings
+from algorithms_files.palindrome import palindromic_substrings_preview
 from algorithms_files.searching import compute_statistics
-from algorithms_files.rsa_encryption import generate_rsa_keys,rsa_encrypt_message,rsa_decrypt_message
+from algorithms_files.rsa_encryption import generate_rsa_keys,rsa_encrypt_message,rsa_decrypt_message,fill_prime_pool
+
+
+
+# Input parsing shared by the strategies
+
+# Error messages used by the sort strategies
+_SORT_EMPTY_ERROR = "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
+_SORT_INVALID_ERROR = "Error: input must be a comma-separated list of integers."
+
+
+def _parse_int_csv(raw, empty_error, invalid_error=_SORT_INVALID_ERROR):
+    """
+    Turns comma-separated text like "5, 2, 9, 1" into a list of integers.
+
+    Empty entries (e.g. a trailing comma) are skipped; int() accepts the
+    spaces around each number, so no per-item strip() is needed.
+    filter() and map() do the looping in C.
+
+    Returns:
+    - (nums, None) on success
+    - (None, empty_error) if the text is blank
+    - (None, invalid_error) if an entry is not an integer
+    """
+    raw = raw.strip()
+    if raw == "":
+        return None, empty_error
+
+    try:
+        return list(map(int, filter(str.strip, raw.split(",")))), None
+    except ValueError:
+        return None, invalid_error
+
+
+@lru_cache(maxsize=1)
+def _parse_sort_input(raw):
+    """
+    Parses the text given to the sort strategies.
+
+    The result for the latest text is kept, so clicking RUN again (or
+    switching between the three sorts) with the same input does not
+    parse it again. The numbers come back as a tuple, so callers cannot
+    change the cached value.
+    """
+    nums, err = _parse_int_csv(raw, _SORT_EMPTY_ERROR)
+    if err:
+        return None, err
+    return tuple(nums), None
+
+
+# Sort order option value (compared in lower case)
+_ORDER_DESC = "descending"
+
+
+def _is_descending(options):
+    """
+    Reads the "order" option of the sort strategies.
+
+    Case-insensitive, so "Descending" and "descending" both count;
+    anything else (or no option) means ascending.
+    """
+    return options.get("order", "Ascending").lower() == _ORDER_DESC
+
+
+def _presorted(nums, descending):
+    """
+    Checks whether nums is already in ascending or descending order.
+
+    Returns the list in the requested order if it is (reversing it when
+    it is sorted the other way), otherwise None so the caller runs the
+    real sort. The check is at most two O(n) passes (one per direction,
+    each stopping at the first out-of-order pair), done by map() in C,
+    so a re-submitted or flipped list never goes through an O(n²) sort.
+    """
+    rest = islice(nums, 1, None)
+    if all(map(ge if descending else le, nums, rest)):
+        return list(nums)
+
+    rest = islice(nums, 1, None)
+    if all(map(le if descending else ge, nums, rest)):
+        return nums[::-1]
+
+    return None
+
+
+# Largest n whose factorial can be shown: Python refuses to turn ints of
+# more than 4300 digits into text (sys.get_int_max_str_digits()), and
+# 1559! is the first factorial past that. The factorial page's input
+# validator uses the same limit.
+FACTORIAL_MAX_N = 1558
+
+# Same limit for Fibonacci: F(20578) is the first past 4300 digits
+FIBONACCI_MAX_N = 20577
+
+
+# Results of the recursion strategies, kept so that running the same n
+# again is a lookup. The values can be very large integers, so only the
+# most recent few are kept. (Errors such as negative n raise and are
+# never cached.)
+
+@lru_cache(maxsize=64)
+def _fib_cached(n):
+    return fibonacci(n)
+
+
+@lru_cache(maxsize=64)
+def _fact_cached(n):
+    return factorial(n)
 
 
 
 # Data holder for performance + output
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """
     Stores the result of running an algorithm.
@@ -29,7 +139,11 @@ class RunResult:
     - algorithm_name: name of the algorithm that ran
     - output: the result (string or dict depending on algorithm)
     - time_taken: how long the algorithm took (seconds)
-    - size: input size (here we store length of input text)
+    - size: input size (length of input text, or number of digits
+      when the UI passes an already parsed int)
+
+    slots=True gives each instance fixed attribute slots instead of a
+    __dict__, so the entries kept in the history are smaller.
     """
     algorithm_name: str = ""
     output: str = ""
@@ -40,7 +154,7 @@ class RunResult:
 
 # Strategy base class
 
-class BaseAlgorithm(ABC):
+class BaseAlgorithm:
     """
     Base class for all algorithms (Strategy Pattern).
 
@@ -49,9 +163,15 @@ class BaseAlgorithm(ABC):
     - declare whether it needs to input (requires_input)
     - implement the run() method
 
-
+    This is a plain class rather than an ABC (creating objects through
+    ABCMeta is slower); a subclass that forgets run() raises
+    NotImplementedError when it is called instead of when it is created.
     """
 
+    # Fixed attribute slots instead of a per-instance __dict__
+    # (every subclass declares its own, empty if it has no state)
+    __slots__ = ("name", "requires_input")
+
     def __init__(self, name, requires_input=True):
         """
         Parameters:
@@ -62,7 +182,6 @@ class BaseAlgorithm(ABC):
         self.name = name
         self.requires_input = requires_input
 
-    @abstractmethod
     def run(self, raw_input, options):
         """
         Runs the algorithm.
@@ -74,7 +193,7 @@ class BaseAlgorithm(ABC):
         Returns:
         - result (str or dict): output from the algorithm
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement run()")
 
 
 
@@ -95,6 +214,8 @@ class RSA(BaseAlgorithm):
       generate_rsa_keys(), rsa_encrypt_message(), rsa_decrypt_message()
     """
 
+    __slots__ = ("public_key", "private_key")
+
     def __init__(self):
         super().__init__("RSA")
         self.public_key = None
@@ -111,9 +232,13 @@ class RSA(BaseAlgorithm):
         - public_key: (e, n) tuple for encryption (if user provides)
         - private_key: (d, n) tuple for decryption (if user provides)
         """
-        action = options.get("action", "encrypt")  # "encrypt" or "decrypt"
-        use_user_keys = options.get("use_user_keys", False)
-        bits = options.get("bits", 16)
+        # Read every option once, up front
+        get = options.get
+        action = get("action", "encrypt")  # "encrypt" or "decrypt"
+        use_user_keys = get("use_user_keys", False)
+        bits = get("bits", 16)
+        pub = get("public_key")
+        priv = get("private_key")
 
 
         # Key handling
@@ -122,14 +247,12 @@ class RSA(BaseAlgorithm):
             # User wants to supply their own keys
             if action == "encrypt":
                 # Encryption needs the PUBLIC key (e, n)
-                pub = options.get("public_key")
                 if not pub:
                     return "Error: enter your PUBLIC key as e,n (example: 65537,123456789)."
                 self.public_key = pub
 
             else:  # decrypt
                 # Decryption needs the PRIVATE key (d, n)
-                priv = options.get("private_key")
                 if not priv:
                     return "Error: enter your PRIVATE key as d,n (example: 12345,123456789)."
                 self.private_key = priv
@@ -151,37 +274,42 @@ class RSA(BaseAlgorithm):
             cipher = rsa_encrypt_message(message, self.public_key)
 
             # Return a readable output string for UI
+            # (one f-string, so the whole text is built in a single step)
+            cipher_text = ", ".join(map(str, cipher))
             return (
                 "RSA ENCRYPTION\n"
                 f"Generated/Used Public Key (e,n): {self.public_key}\n"
                 f"Generated/Used Private Key (d,n): {self.private_key}\n\n"
                 "Cipher (copy this for decrypt):\n"
-                + ", ".join(str(x) for x in cipher)
+                f"{cipher_text}"
             )
 
 
         # Decrypt
 
         if action == "decrypt":
-            raw = raw_input.strip()
-            if raw == "":
-                return "Error: paste cipher numbers separated by commas."
-
             # Convert comma-separated cipher text into a list of integers
-            try:
-                parts = [p.strip() for p in raw.split(",")]
-                cipher_list = [int(p) for p in parts if p != ""]
-            except:
-                return "Error: cipher must be comma-separated integers."
+            cipher_list, err = _parse_int_csv(
+                raw_input,
+                "Error: paste cipher numbers separated by commas.",
+                "Error: cipher must be comma-separated integers.",
+            )
+            if err:
+                return err
 
             # Decrypt cipher numbers back into plain text using private key
-            plain = rsa_decrypt_message(cipher_list, self.private_key)
+            # (numbers that were not made with this key decrypt to values
+            # that are not valid UTF-8 bytes, which raises ValueError)
+            try:
+                plain = rsa_decrypt_message(cipher_list, self.private_key)
+            except ValueError as e:
+                return "Error: " + str(e)
 
             return (
                 "RSA DECRYPTION\n"
                 f"Generated/Used Private Key (d,n): {self.private_key}\n\n"
                 "Plain Text:\n"
-                + plain
+                f"{plain}"
             )
 
         # If action is not encrypt/decrypt
@@ -199,6 +327,8 @@ class Fibonacci(BaseAlgorithm):
     - Fibonacci(n)
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Fibonacci")
 
@@ -215,17 +345,25 @@ class Fibonacci(BaseAlgorithm):
         # Convert input into an integer
         try:
             n = int(raw)
-        except:
+        except ValueError:
             return "Error: input must be an integer."
 
-        # Call fibonacci() function (implemented elsewhere)
+        if n > FIBONACCI_MAX_N:
+            return (
+                f"Error: n must be at most {FIBONACCI_MAX_N} "
+                "(larger Fibonacci numbers have too many digits to display)."
+            )
+
+        # Call fibonacci() (implemented elsewhere) through the result cache
+        # (deliberately broad: any error from the algorithm, or from
+        # turning a huge result into text, is shown in the UI as a
+        # message instead of closing the app)
         try:
-            value = fibonacci(n)
+            value = _fib_cached(n)
+            return f"Fibonacci({n}) = {value}"
         except Exception as e:
             return "Error: " + str(e)
 
-        return f"Fibonacci({n}) = {value}"
-
 
 class BubbleSort(BaseAlgorithm):
     """
@@ -238,6 +376,8 @@ class BubbleSort(BaseAlgorithm):
     - order: "Ascending" or "Descending"
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("BubbleSort")
 
@@ -245,25 +385,21 @@ class BubbleSort(BaseAlgorithm):
         """
         Runs bubble sort based on the chosen order.
         """
-        raw = raw_input.strip()
-        if raw == "":
-            return "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
-
         # Parse comma-separated list into integers
-        try:
-            parts = [p.strip() for p in raw.split(",")]
-            nums = [int(p) for p in parts if p != ""]
-        except:
-            return "Error: input must be a comma-separated list of integers."
+        nums, err = _parse_sort_input(raw_input)
+        if err:
+            return err
 
         # Determine sort direction
-        order = options.get("order", "Ascending")
-        descending = (order == "Descending")
+        descending = _is_descending(options)
 
         # Call the actual bubble_sort() function (implemented elsewhere)
-        sorted_nums = bubble_sort(nums, descending=descending)
+        # Input that is already sorted (either way) skips the sort
+        sorted_nums = _presorted(nums, descending)
+        if sorted_nums is None:
+            sorted_nums = bubble_sort(nums, descending=descending)
 
-        return "Sorted: " + ", ".join(str(n) for n in sorted_nums)
+        return "Sorted: " + ", ".join(map(str, sorted_nums))
 
 
 class SelectionSort(BaseAlgorithm):
@@ -272,25 +408,23 @@ class SelectionSort(BaseAlgorithm):
     Works like BubbleSort, but calls selection_sort().
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("SelectionSort")
 
     def run(self, raw_input, options):
-        raw = raw_input.strip()
-        if raw == "":
-            return "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
-
-        try:
-            parts = [p.strip() for p in raw.split(",")]
-            nums = [int(p) for p in parts if p != ""]
-        except:
-            return "Error: input must be a comma-separated list of integers."
+        nums, err = _parse_sort_input(raw_input)
+        if err:
+            return err
 
-        order = options.get("order", "Ascending")
-        descending = (order == "Descending")
+        descending = _is_descending(options)
 
-        sorted_nums = selection_sort(nums, descending=descending)
-        return "Sorted: " + ", ".join(str(n) for n in sorted_nums)
+        # Input that is already sorted (either way) skips the sort
+        sorted_nums = _presorted(nums, descending)
+        if sorted_nums is None:
+            sorted_nums = selection_sort(nums, descending=descending)
+        return "Sorted: " + ", ".join(map(str, sorted_nums))
 
 
 class MergeSort(BaseAlgorithm):
@@ -299,28 +433,24 @@ class MergeSort(BaseAlgorithm):
     Calls merge_sort() with ascending/descending option.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("MergeSort")
 
     def run(self, raw_input, options):
-        raw = raw_input.strip()
-        if raw == "":
-            return "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
-
         # Parse comma-separated list of ints
-        try:
-            parts = [p.strip() for p in raw.split(",")]
-            nums = [int(p) for p in parts if p != ""]
-        except:
-            return "Error: input must be a comma-separated list of integers."
-
-        order = options.get("order", "Ascending")
+        nums, err = _parse_sort_input(raw_input)
+        if err:
+            return err
 
-        # Make it case-insensitive just in case ("descending" vs "Descending")
-        descending = (order.lower() == "descending")
+        descending = _is_descending(options)
 
-        sorted_nums = merge_sort(nums, descending=descending)
-        return "Sorted: " + ", ".join(str(n) for n in sorted_nums)
+        # Input that is already sorted (either way) skips the sort
+        sorted_nums = _presorted(nums, descending)
+        if sorted_nums is None:
+            sorted_nums = merge_sort(nums, descending=descending)
+        return "Sorted: " + ", ".join(map(str, sorted_nums))
 
 
 class ShuffleDeck(BaseAlgorithm):
@@ -331,6 +461,8 @@ class ShuffleDeck(BaseAlgorithm):
     It simply generates and shuffles a deck of cards.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("ShuffleDeck", requires_input=False)
 
@@ -353,28 +485,45 @@ class Factorial(BaseAlgorithm):
     - Factorial(n)
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Factorial")
 
     def run(self, raw_input, options):
-        raw = raw_input.strip()
-        if raw == "":
-            return "Error: enter an integer (e.g. 5)."
+        """
+        raw_input is either the number as text or an int the UI has
+        already parsed.
+        """
+        if isinstance(raw_input, int):
+            n = raw_input
+        else:
+            raw = raw_input.strip()
+            if raw == "":
+                return "Error: enter an integer (e.g. 5)."
 
-        # Convert input to integer
-        try:
-            n = int(raw)
-        except:
-            return "Error: input must be an integer."
+            # Convert input to integer
+            try:
+                n = int(raw)
+            except ValueError:
+                return "Error: input must be an integer."
 
-        # Call factorial() function (implemented elsewhere)
+        if n > FACTORIAL_MAX_N:
+            return (
+                f"Error: n must be at most {FACTORIAL_MAX_N} "
+                "(larger factorials have too many digits to display)."
+            )
+
+        # Call factorial() (implemented elsewhere) through the result cache
+        # (deliberately broad: any error from the algorithm, or from
+        # turning a huge result into text, is shown in the UI as a
+        # message instead of closing the app)
         try:
-            ans = factorial(n)
+            ans = _fact_cached(n)
+            return f"Factorial({n}) = {ans}"
         except Exception as e:
             return "Error: " + str(e)
 
-        return f"Factorial({n}) = {ans}"
-
 
 class SearchStats(BaseAlgorithm):
     """
@@ -388,22 +537,24 @@ class SearchStats(BaseAlgorithm):
       (e.g. largest, smallest, median, mode, quartiles)
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("SearchStats")
 
     def run(self, raw_input, options):
-        raw = raw_input.strip()
-        if raw == "":
-            return "Error: enter numbers separated by commas (e.g. 5, 2, 9, 1)."
-
         # Convert comma-separated string into list of integers
-        try:
-            parts = [p.strip() for p in raw.split(",")]
-            nums = [int(p) for p in parts if p != ""]
-        except:
-            return "Error: input must be a comma-separated list of numbers."
+        nums, err = _parse_int_csv(
+            raw_input,
+            "Error: enter numbers separated by commas (e.g. 5, 2, 9, 1).",
+            "Error: input must be a comma-separated list of numbers.",
+        )
+        if err:
+            return err
 
         # Compute statistics using helper function
+        # (deliberately broad: any error from the algorithm is shown
+        # in the UI as a message instead of closing the app)
         try:
             stats = compute_statistics(nums)
         except Exception as e:
@@ -415,7 +566,8 @@ class SearchStats(BaseAlgorithm):
 
 class PalindromeDP(BaseAlgorithm):
     """
-    Palindromic Substring Counter algorithm strategy (DP approach).
+    Palindromic Substring Counter algorithm strategy (Manacher's algorithm;
+    the "PalindromeDP" name is kept as the key the UI uses).
 
     Input:
     - text string
@@ -428,6 +580,8 @@ class PalindromeDP(BaseAlgorithm):
         }
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("PalindromeDP")
 
@@ -438,15 +592,13 @@ class PalindromeDP(BaseAlgorithm):
         if text == "":
             return {"found": "", "count": 0}
 
-        # palindromic_substrings() should return:
-        # - found: list of palindrome substrings
-        # - count: total number found
-        found, count = palindromic_substrings(text)
+        # Only the 10 substrings shown are built; the rest are just counted
+        found, count = palindromic_substrings_preview(text, 10)
 
         # Keep output short so it fits nicely in the UI
-        preview = ", ".join(found[:10])
-        if len(found) > 10:
-            preview += f" ... (+{len(found)-10} more)"
+        preview = ", ".join(found)
+        if count > 10:
+            preview += f" ... (+{count-10} more)"
 
         return {"found": preview, "count": count}
 
@@ -463,39 +615,63 @@ class AlgorithmCreator:
     - It returns the correct algorithm object (e.g. RSA())
     """
 
+    # Algorithm class for each name the UI uses
+    _REGISTRY = {
+        "RSA": RSA,
+        "Fibonacci": Fibonacci,
+        "BubbleSort": BubbleSort,
+        "SelectionSort": SelectionSort,
+        "MergeSort": MergeSort,
+        "ShuffleDeck": ShuffleDeck,
+        "Factorial": Factorial,
+        "SearchStats": SearchStats,
+        "PalindromeDP": PalindromeDP,
+    }
+
+    # Algorithms that keep state between runs (RSA remembers its keys),
+    # so each create() gives a fresh object
+    _STATEFUL = frozenset({"RSA"})
+
+    def __init__(self):
+        """
+        Sets up the cache of algorithm objects already created
+        (the stateless ones are shared between create() calls).
+        """
+        self._instances = {}
+
     def create(self, name):
         """
         Creates and returns an algorithm instance based on name.
 
+        Stateless algorithms are created once and the same object is
+        returned afterwards.
+
         Raises:
         - ValueError if the algorithm name is unknown.
         """
         name = name.strip()
 
-        if name == "RSA":
-            return RSA()
-        if name == "Fibonacci":
-            return Fibonacci()
-        if name == "BubbleSort":
-            return BubbleSort()
-        if name == "SelectionSort":
-            return SelectionSort()
-        if name == "MergeSort":
-            return MergeSort()
-        if name == "ShuffleDeck":
-            return ShuffleDeck()
-        if name == "Factorial":
-            return Factorial()
-        if name == "SearchStats":
-            return SearchStats()
-        if name == "PalindromeDP":
-            return PalindromeDP()
-
-        raise ValueError("Unknown algorithm name: " + name)
+        cls = self._REGISTRY.get(name)
+        if cls is None:
+            raise ValueError("Unknown algorithm name: " + name)
+
+        if name in self._STATEFUL:
+            return cls()
+
+        algorithm = self._instances.get(name)
+        if algorithm is None:
+            algorithm = self._instances[name] = cls()
+        return algorithm
 
 
 # Facade (Facade pattern)
 
+# Most runs kept in AlgorithmManager.history (older ones are dropped)
+_HISTORY_MAX = 256
+
+# Longest output text stored with a run in the history
+_HISTORY_OUTPUT_MAX = 64 * 1024
+
 class AlgorithmManager:
     """
     Facade class that the UI talks to.
@@ -514,11 +690,36 @@ class AlgorithmManager:
         Sets up:
         - creator: factory used to build algorithm objects
         - current_algorithm: the selected algorithm object
-        - history: list of RunResult objects for performance tracking
+        - history: the most recent RunResult objects for performance
+          tracking (a deque that keeps the last _HISTORY_MAX runs)
         """
         self.creator = AlgorithmCreator()
         self.current_algorithm = None
-        self.history = []
+        self.history = deque(maxlen=_HISTORY_MAX)
+
+    def clear_caches(self):
+        """
+        Forgets the cached Fibonacci/Factorial results and the last parsed
+        sort input, so the next run computes them again (e.g. to time a
+        cold run).
+        """
+        _fib_cached.cache_clear()
+        _fact_cached.cache_clear()
+        _parse_sort_input.cache_clear()
+
+    @staticmethod
+    def prewarm(name):
+        """
+        Does an algorithm's setup work ahead of its first run.
+
+        Only RSA has any: the prime pool for the default key size is
+        topped up, so key generation during a run can take primes from
+        it. Already-full pools make this a no-op, so the UI can call it
+        every time the page is selected (the primes a run used are
+        replaced then).
+        """
+        if name == "RSA":
+            fill_prime_pool(16)
 
     def setAlgorithm(self, name):
         """
@@ -531,7 +732,7 @@ class AlgorithmManager:
         Runs the currently selected algorithm and records performance.
 
         Parameters:
-        - raw_input (str): input from UI
+        - raw_input (str or int): input from UI
         - options (dict): extra settings, like sort order or RSA mode
 
         Returns:
@@ -550,21 +751,30 @@ class AlgorithmManager:
         if not self.current_algorithm.requires_input:
             raw_input = ""
 
-        # Start timing
-        start = time.perf_counter()
+        # Start timing (integer nanoseconds, converted to seconds once below)
+        start = time.perf_counter_ns()
 
         # Run the algorithm
         output = self.current_algorithm.run(raw_input, options)
 
         # End timing
-        end = time.perf_counter()
+        end = time.perf_counter_ns()
 
         # Store results in RunResult dataclass
         result = RunResult()
         result.algorithm_name = self.current_algorithm.name
-        result.output = output
-        result.time_taken = end - start
-        result.size = len(raw_input)
+        # (very long text, e.g. a big RSA cipher, is cut short in the
+        # history; the caller still gets the full output)
+        if isinstance(output, str) and len(output) > _HISTORY_OUTPUT_MAX:
+            result.output = output[:_HISTORY_OUTPUT_MAX] + "…"
+        else:
+            result.output = output
+        result.time_taken = (end - start) * 1e-9
+        # (an int input counts its digits, like the text it came from)
+        if isinstance(raw_input, int):
+            result.size = len(str(raw_input))
+        else:
+            result.size = len(raw_input)
 
         # Save to history so we can view performance later
         self.history.append(result)
@@ -1,14 +1,16 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-
-from GUI.UI.main_window import MainUI
 
 
 def main():
+    # The GUI modules (and PyQt5 with them) are imported here rather than
+    # at the top, so importing this module does not load Qt
+    from PyQt5.QtWidgets import QApplication
+
+    from GUI.UI._common import _enable_hidpi
+    from GUI.UI.main_window import MainUI
+
     # Enable HiDPI scaling (important on macOS / Retina)
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    _enable_hidpi()
 
     app = QApplication(sys.argv)
 
@@ -10,4 +10,9 @@ def test_bubble_sort_descending():
     assert bubble_sort([10, 15, 20, 5], descending=True) == [20, 15,10, 5]
     assert bubble_sort([], descending=True) == []
 
-
+def test_bubble_sort_sorted_and_reversed_input():
+    data = list(range(50))
+    assert bubble_sort(data) == data
+    assert bubble_sort(data[::-1]) == data
+    assert bubble_sort(data, descending=True) == data[::-1]
+    assert bubble_sort([3, -1, 3, 0, -7, 8, 0]) == [-7, -1, 0, 0, 3, 3, 8]
@@ -0,0 +1,163 @@
+import pytest
+
+from design_patterns import (
+    AlgorithmCreator, AlgorithmManager, BubbleSort, SelectionSort, MergeSort, RSA,
+    SearchStats, Factorial, FACTORIAL_MAX_N, Fibonacci, FIBONACCI_MAX_N,
+    _HISTORY_MAX, _HISTORY_OUTPUT_MAX,
+)
+
+
+SORT_STRATEGIES = (BubbleSort, SelectionSort, MergeSort)
+
+
+def test_sort_strategies_ascending_input():
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("1, 2, 3, 4", {"order": "Ascending"}) == "Sorted: 1, 2, 3, 4"
+        assert algo.run("1, 2, 3, 4", {"order": "Descending"}) == "Sorted: 4, 3, 2, 1"
+
+
+def test_sort_strategies_descending_input():
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("9, 5, 2, 1", {"order": "Descending"}) == "Sorted: 9, 5, 2, 1"
+        # sorted the other way round: reversed instead of re-sorted
+        assert algo.run("9, 5, 2, 1", {"order": "Ascending"}) == "Sorted: 1, 2, 5, 9"
+        # no order option means ascending
+        assert algo.run("9, 5, 2, 1", {}) == "Sorted: 1, 2, 5, 9"
+
+
+def test_sort_strategies_order_is_case_insensitive():
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("3, 1, 2", {"order": "descending"}) == "Sorted: 3, 2, 1"
+        assert algo.run("3, 1, 2", {"order": "DESCENDING"}) == "Sorted: 3, 2, 1"
+
+
+def test_sort_strategies_unsorted_and_all_equal_input():
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("5, 2, 9, 1, 2", {"order": "Ascending"}) == "Sorted: 1, 2, 2, 5, 9"
+        assert algo.run("5, 2, 9, 1, 2", {"order": "Descending"}) == "Sorted: 9, 5, 2, 2, 1"
+        assert algo.run("7, 7, 7", {"order": "Ascending"}) == "Sorted: 7, 7, 7"
+        assert algo.run("7, 7, 7", {"order": "Descending"}) == "Sorted: 7, 7, 7"
+        assert algo.run("4", {}) == "Sorted: 4"
+
+
+def test_sort_strategies_repeat_runs_on_same_text():
+    # the parsed input is cached; reusing it must not change the result
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("3, 2, 1", {"order": "Ascending"}) == "Sorted: 1, 2, 3"
+        assert algo.run("3, 2, 1", {"order": "Descending"}) == "Sorted: 3, 2, 1"
+        assert algo.run("3, 2, 1", {"order": "Ascending"}) == "Sorted: 1, 2, 3"
+
+
+def test_creator_shares_stateless_algorithms():
+    creator = AlgorithmCreator()
+    first = creator.create("BubbleSort")
+    assert isinstance(first, BubbleSort)
+    assert creator.create("BubbleSort") is first
+    assert creator.create(" BubbleSort ") is first
+    assert creator.create("MergeSort") is not first
+
+
+def test_creator_gives_fresh_rsa_each_time():
+    creator = AlgorithmCreator()
+    first = creator.create("RSA")
+    second = creator.create("RSA")
+    assert isinstance(first, RSA) and isinstance(second, RSA)
+    assert first is not second
+
+
+def test_creator_unknown_name_raises():
+    creator = AlgorithmCreator()
+    with pytest.raises(ValueError):
+        creator.create("QuickSort")
+
+
+def test_history_keeps_only_latest_runs():
+    manager = AlgorithmManager()
+    manager.setAlgorithm("Fibonacci")
+    for n in range(_HISTORY_MAX + 10):
+        manager.execute(str(n % 20))
+
+    assert len(manager.history) == _HISTORY_MAX
+    # the oldest 10 runs were dropped
+    assert manager.history[0].output == f"Fibonacci({10 % 20}) = 55"
+    assert manager.history[-1].output.startswith(f"Fibonacci({(_HISTORY_MAX + 9) % 20})")
+
+
+def test_history_truncates_oversized_output():
+    manager = AlgorithmManager()
+    manager.setAlgorithm("BubbleSort")
+    raw = ", ".join(["1"] * _HISTORY_OUTPUT_MAX)
+
+    output, result = manager.execute(raw, {"order": "Ascending"})
+
+    # the caller gets the full text, the history a shortened copy
+    assert len(output) > _HISTORY_OUTPUT_MAX
+    assert result.output == output[:_HISTORY_OUTPUT_MAX] + "…"
+    assert manager.history[-1] is result
+
+
+def test_sort_strategies_input_errors():
+    for cls in SORT_STRATEGIES:
+        algo = cls()
+        assert algo.run("", {}) == "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
+        assert algo.run("   ", {}) == "Error: enter numbers separated by commas (e.g. 5,2,9,1)."
+        assert algo.run("5, x, 2", {}) == "Error: input must be a comma-separated list of integers."
+        assert algo.run("1.5, 2", {}) == "Error: input must be a comma-separated list of integers."
+        # blank and whitespace-only entries are skipped
+        assert algo.run(" 5, ,2,\t, ", {}) == "Sorted: 2, 5"
+
+
+def test_search_stats_input_errors():
+    algo = SearchStats()
+    assert algo.run("", {}) == "Error: enter numbers separated by commas (e.g. 5, 2, 9, 1)."
+    assert algo.run("  ", {}) == "Error: enter numbers separated by commas (e.g. 5, 2, 9, 1)."
+    assert algo.run("1, two, 3", {}) == "Error: input must be a comma-separated list of numbers."
+    assert algo.run("3, , 1, 2,", {})["median"] == 2
+
+
+def test_rsa_decrypt_input_errors():
+    algo = RSA()
+    options = {"action": "decrypt"}
+    assert algo.run("", options) == "Error: paste cipher numbers separated by commas."
+    assert algo.run("12, abc", options) == "Error: cipher must be comma-separated integers."
+
+
+def test_search_stats_single_value():
+    stats = SearchStats().run("-4", {})
+    assert stats["median"] == stats["q1"] == stats["q3"] == -4
+    assert stats["mode"] is None
+
+
+def test_factorial_strategy_digit_limit():
+    algo = Factorial()
+    assert algo.run("5", {}) == "Factorial(5) = 120"
+    assert algo.run(FACTORIAL_MAX_N, {}).startswith(f"Factorial({FACTORIAL_MAX_N}) = ")
+    for n in (FACTORIAL_MAX_N + 1, 2000, 5000):
+        assert algo.run(n, {}) == (
+            f"Error: n must be at most {FACTORIAL_MAX_N} "
+            "(larger factorials have too many digits to display)."
+        )
+    assert algo.run("2000", {}).startswith("Error: n must be at most")
+
+
+def test_manager_factorial_above_limit_does_not_raise():
+    manager = AlgorithmManager()
+    manager.setAlgorithm("Factorial")
+    output, result = manager.execute(5000)
+    assert output.startswith("Error:")
+    assert result.size == 4
+
+
+def test_fibonacci_strategy_digit_limit():
+    algo = Fibonacci()
+    assert algo.run("7", {}) == "Fibonacci(7) = 13"
+    assert algo.run(str(FIBONACCI_MAX_N), {}).startswith(f"Fibonacci({FIBONACCI_MAX_N}) = ")
+    assert algo.run(str(FIBONACCI_MAX_N + 1), {}) == (
+        f"Error: n must be at most {FIBONACCI_MAX_N} "
+        "(larger Fibonacci numbers have too many digits to display)."
+    )
@@ -8,4 +8,12 @@ def test_factorial_basic():
 
 def test_factorial_negative():
     with pytest.raises(ValueError):
-        factorial(-1)
\ No newline at end of file
+        factorial(-1)
+
+def test_factorial_large():
+    # Compare with a plain loop; n is well past the old recursion limit
+    expected = 1
+    for k in range(2, 3001):
+        expected *= k
+    assert factorial(3000) == expected
+    assert factorial(10) == 3628800
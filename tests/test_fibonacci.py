@@ -13,3 +13,9 @@ def test_fibonacci_large():
 def test_fibonacci_negative():
     with pytest.raises(ValueError):
         fibonacci(-1)
+
+def test_fibonacci_matches_iteration():
+    prev, curr = 0, 1
+    for n in range(300):
+        assert fibonacci(n) == prev
+        prev, curr = curr, prev + curr
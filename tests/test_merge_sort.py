@@ -14,3 +14,15 @@ def test_merge_sort_descending():
 def test_merge_sort_none():
     with pytest.raises(ValueError):
         merge_sort(None)
+
+def test_merge_sort_odd_lengths_and_sorted_runs():
+    data = [7, -3, 7, 0, 12, 5, -3, 9, 1, 0, 4]
+    assert merge_sort(data) == sorted(data)
+    assert merge_sort(data, descending=True) == sorted(data, reverse=True)
+    assert merge_sort(list(range(33))) == list(range(33))
+    assert merge_sort(list(range(33))[::-1]) == list(range(33))
+
+def test_merge_sort_does_not_modify_input():
+    data = [3, 1, 2]
+    merge_sort(data)
+    assert data == [3, 1, 2]
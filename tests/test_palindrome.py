@@ -1,5 +1,8 @@
 import pytest
-from algorithms_files.palindrome import count_palindromic_substrings
+from algorithms_files.palindrome import (
+    count_palindromic_substrings, palindromic_substrings,
+    palindromic_spans, materialize, palindromic_substrings_preview
+)
 
 def test_empty():
     assert count_palindromic_substrings("") == 0
@@ -22,3 +25,27 @@ def test_abba():
 def test_none():
     with pytest.raises(ValueError):
         count_palindromic_substrings(None)
+
+def test_long_run():
+    # n * (n + 1) / 2 substrings of a run of one character
+    assert count_palindromic_substrings("a" * 500) == 125250
+
+def test_substrings_order():
+    # shortest first, left to right within the same length
+    found, count = palindromic_substrings("abba")
+    assert found == ["a", "b", "b", "a", "bb", "abba"]
+    assert count == 6
+    found, count = palindromic_substrings("aba")
+    assert found == ["a", "b", "a", "aba"]
+
+def test_spans_match_substrings():
+    spans = palindromic_spans("abba")
+    assert spans == [(0, 1), (1, 1), (2, 1), (3, 1), (1, 2), (0, 4)]
+    assert materialize("abba", spans) == palindromic_substrings("abba")[0]
+    assert palindromic_spans("") == []
+
+def test_preview_matches_full_list():
+    found, count = palindromic_substrings("abbaab")
+    assert palindromic_substrings_preview("abbaab", 3) == (found[:3], count)
+    assert palindromic_substrings_preview("abbaab", 100) == (found, count)
+    assert palindromic_substrings_preview("") == ([], 0)
@@ -1,14 +1,26 @@
 import pytest
 
+from algorithms_files import rsa_encryption
 from algorithms_files.rsa_encryption import (
     generate_rsa_keys,
     rsa_encrypt_message,
     rsa_decrypt_message,
     validate_public_key,
     validate_private_key,
+    generate_random_prime,
+    is_probable_prime,
+    fill_prime_pool,
 )
 
 
+@pytest.fixture
+def empty_prime_pool(monkeypatch):
+    # A private, empty pool for the test; the shared one is put back after
+    pool = {}
+    monkeypatch.setattr(rsa_encryption, "_PRIME_POOL", pool)
+    return pool
+
+
 def test_key_generation_returns_two_keys():
     public_key, private_key = generate_rsa_keys(bits=16)
 
@@ -95,4 +107,37 @@ def test_user_provided_keys_work():
     cipher = rsa_encrypt_message(message, public_key)
     plain = rsa_decrypt_message(cipher, private_key)
 
-    assert plain == message
\ No newline at end of file
+    assert plain == message
+
+
+def test_random_primes_come_from_pool(empty_prime_pool):
+    fill_prime_pool(bits=16, count=4)
+    pooled = list(empty_prime_pool[16])
+    assert len(pooled) == 4
+
+    p = generate_random_prime(16)
+
+    assert p == pooled[-1]
+    assert empty_prime_pool[16] == pooled[:-1]
+    assert p.bit_length() == 16
+
+
+def test_primality_check_is_exact_for_small_numbers():
+    assert is_probable_prime(65521)
+    assert is_probable_prime(2**61 - 1)
+    # strong pseudoprimes to the first few bases
+    assert not is_probable_prime(1373653)
+    assert not is_probable_prime(3215031751)
+    assert not is_probable_prime(3825123056546413051)
+
+
+def test_crt_decryption_matches_plain_key():
+    public_key, private_key = generate_rsa_keys(bits=16)
+    d, n = private_key
+
+    cipher = rsa_encrypt_message("crt check", public_key)
+
+    # a plain (d, n) tuple (as typed by the user) decrypts the same way
+    assert rsa_decrypt_message(cipher, private_key) == "crt check"
+    assert rsa_decrypt_message(cipher, (d, n)) == "crt check"
+    assert str(private_key) == str((d, n))
@@ -67,3 +67,13 @@ def test_empty_raises():
 def test_none_raises():
     with pytest.raises(ValueError):
         compute_statistics(None)
+
+
+def test_single_value():
+    stats = compute_statistics([5])
+    assert stats["smallest"] == 5
+    assert stats["largest"] == 5
+    assert stats["median"] == 5
+    assert stats["q1"] == 5
+    assert stats["q3"] == 5
+    assert stats["mode"] is None
@@ -8,4 +8,11 @@ def test_selection_sort_ascending():
 
 def test_selection_sort_descending():
     assert selection_sort([5, 2, 9, 1], descending=True) == [9, 5, 2, 1]
-    assert selection_sort([10, 5, 2], descending=True) == [10, 5, 2]
\ No newline at end of file
+    assert selection_sort([10, 5, 2], descending=True) == [10, 5, 2]
+
+
+def test_selection_sort_larger_input():
+    data = [7, -3, 7, 0, 12, 5, -3, 9, 1, 0, 4]
+    assert selection_sort(data) == [-3, -3, 0, 0, 1, 4, 5, 7, 7, 9, 12]
+    assert selection_sort(data, descending=True) == [12, 9, 7, 7, 5, 4, 1, 0, 0, -3, -3]
+    assert selection_sort([3]) == [3]